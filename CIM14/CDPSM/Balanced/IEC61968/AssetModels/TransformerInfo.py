@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerInfo(IdentifiedObject):
     """Set of transformer data, from an equipment library.
@@ -30,10 +31,10 @@ class TransformerInfo(IdentifiedObject):
         @param Transformers: All transformers that can be described with this transformer data.
         @param WindingInfos: Data for all the windings described by this transformer data.
         """
-        self._Transformers = []
+        self._Transformers = RefList()
         self.Transformers = [] if Transformers is None else Transformers
 
-        self._WindingInfos = []
+        self._WindingInfos = RefList()
         self.WindingInfos = [] if WindingInfos is None else WindingInfos
 
         super(TransformerInfo, self).__init__(*args, **kw_args)
@@ -52,20 +53,32 @@ class TransformerInfo(IdentifiedObject):
 
     def setTransformers(self, value):
         for x in self._Transformers:
-            x.TransformerInfo = None
-        for y in value:
-            y._TransformerInfo = self
-        self._Transformers = value
+            x._TransformerInfo = None
+        self._Transformers = RefList()
+        self.addTransformers(value)
 
     Transformers = property(getTransformers, setTransformers)
 
     def addTransformers(self, *Transformers):
-        for obj in Transformers:
-            obj.TransformerInfo = self
+        collection = self._Transformers
+        for obj in members(Transformers):
+            old = obj._TransformerInfo
+            if old is not None and old is not self:
+                old._Transformers.discard(obj)
+            obj._TransformerInfo = self
+            collection.append(obj)
 
     def removeTransformers(self, *Transformers):
-        for obj in Transformers:
-            obj.TransformerInfo = None
+        collection = self._Transformers
+        for obj in members(Transformers):
+            if obj._TransformerInfo is self:
+                obj._TransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformers(self):
+        for obj in self._Transformers:
+            obj._TransformerInfo = None
+        self._Transformers = RefList()
 
     def getWindingInfos(self):
         """Data for all the windings described by this transformer data.
@@ -74,18 +87,30 @@ class TransformerInfo(IdentifiedObject):
 
     def setWindingInfos(self, value):
         for x in self._WindingInfos:
-            x.TransformerInfo = None
-        for y in value:
-            y._TransformerInfo = self
-        self._WindingInfos = value
+            x._TransformerInfo = None
+        self._WindingInfos = RefList()
+        self.addWindingInfos(value)
 
     WindingInfos = property(getWindingInfos, setWindingInfos)
 
     def addWindingInfos(self, *WindingInfos):
-        for obj in WindingInfos:
-            obj.TransformerInfo = self
+        collection = self._WindingInfos
+        for obj in members(WindingInfos):
+            old = obj._TransformerInfo
+            if old is not None and old is not self:
+                old._WindingInfos.discard(obj)
+            obj._TransformerInfo = self
+            collection.append(obj)
 
     def removeWindingInfos(self, *WindingInfos):
-        for obj in WindingInfos:
-            obj.TransformerInfo = None
+        collection = self._WindingInfos
+        for obj in members(WindingInfos):
+            if obj._TransformerInfo is self:
+                obj._TransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllWindingInfos(self):
+        for obj in self._WindingInfos:
+            obj._TransformerInfo = None
+        self._WindingInfos = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class TransformerBank(Equipment):
     """An assembly of transformers that are connected together. For three-phase transformers, there would be one transformer per bank. For banks of single-phase transformers, there will be more than one transformer per bank, and they need not be identical.
@@ -33,7 +34,7 @@ class TransformerBank(Equipment):
         #: Vector group of the bank for protective relaying, e.g., Dyn1. For unbalanced transformers, this may not be simply determined from the constituent winding connections.
         self.vectorGroup = vectorGroup
 
-        self._Transformers = []
+        self._Transformers = RefList()
         self.Transformers = [] if Transformers is None else Transformers
 
         super(TransformerBank, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class TransformerBank(Equipment):
 
     def setTransformers(self, value):
         for x in self._Transformers:
-            x.TransformerBank = None
-        for y in value:
-            y._TransformerBank = self
-        self._Transformers = value
+            x._TransformerBank = None
+        self._Transformers = RefList()
+        self.addTransformers(value)
 
     Transformers = property(getTransformers, setTransformers)
 
     def addTransformers(self, *Transformers):
-        for obj in Transformers:
-            obj.TransformerBank = self
+        collection = self._Transformers
+        for obj in members(Transformers):
+            old = obj._TransformerBank
+            if old is not None and old is not self:
+                old._Transformers.discard(obj)
+            obj._TransformerBank = self
+            collection.append(obj)
 
     def removeTransformers(self, *Transformers):
-        for obj in Transformers:
-            obj.TransformerBank = None
+        collection = self._Transformers
+        for obj in members(Transformers):
+            if obj._TransformerBank is self:
+                obj._TransformerBank = None
+                collection.discard(obj)
+
+    def removeAllTransformers(self):
+        for obj in self._Transformers:
+            obj._TransformerBank = None
+        self._Transformers = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PSRType(IdentifiedObject):
     """Classifying instances of the same class, e.g. overhead and underground ACLineSegments. This classification mechanism is intended to provide flexibility outside the scope of this standard, i.e. provide customisation that is non standard.
@@ -29,7 +30,7 @@ class PSRType(IdentifiedObject):
 
         @param PowerSystemResources: Power system resources classified with this PSRType.
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(PSRType, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class PSRType(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.PSRType = None
-        for y in value:
-            y._PSRType = self
-        self._PowerSystemResources = value
+            x._PSRType = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.PSRType = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._PSRType
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._PSRType = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.PSRType = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._PSRType is self:
+                obj._PSRType = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._PSRType = None
+        self._PowerSystemResources = RefList()
 
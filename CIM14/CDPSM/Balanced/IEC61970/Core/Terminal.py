@@ -60,8 +60,7 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
@@ -77,8 +76,7 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
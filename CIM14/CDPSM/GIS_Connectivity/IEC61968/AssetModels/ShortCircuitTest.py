@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
+from PyCIM.RefList import RefList, members
 
 class ShortCircuitTest(DistributionWindingTest):
     """Short-circuit test results include load losses and leakage impedances. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one short-circuited ('to') winding.
@@ -45,7 +46,7 @@ class ShortCircuitTest(DistributionWindingTest):
         #: Load losses from a positive-sequence or single-phase short-circuit test.
         self.loadLoss = loadLoss
 
-        self._ShortedWindingSpecs = []
+        self._ShortedWindingSpecs = RefList()
         self.ShortedWindingSpecs = [] if ShortedWindingSpecs is None else ShortedWindingSpecs
 
         super(ShortCircuitTest, self).__init__(*args, **kw_args)
@@ -64,24 +65,26 @@ class ShortCircuitTest(DistributionWindingTest):
 
     def setShortedWindingSpecs(self, value):
         for p in self._ShortedWindingSpecs:
-            filtered = [q for q in p.ShortCircuitTests if q != self]
-            self._ShortedWindingSpecs._ShortCircuitTests = filtered
-        for r in value:
-            if self not in r._ShortCircuitTests:
-                r._ShortCircuitTests.append(self)
-        self._ShortedWindingSpecs = value
+            p._ShortCircuitTests.discard(self)
+        self._ShortedWindingSpecs = RefList()
+        self.addShortedWindingSpecs(value)
 
     ShortedWindingSpecs = property(getShortedWindingSpecs, setShortedWindingSpecs)
 
     def addShortedWindingSpecs(self, *ShortedWindingSpecs):
-        for obj in ShortedWindingSpecs:
-            if self not in obj._ShortCircuitTests:
-                obj._ShortCircuitTests.append(self)
-            self._ShortedWindingSpecs.append(obj)
+        collection = self._ShortedWindingSpecs
+        for obj in members(ShortedWindingSpecs):
+            obj._ShortCircuitTests.append(self)
+            collection.append(obj)
 
     def removeShortedWindingSpecs(self, *ShortedWindingSpecs):
-        for obj in ShortedWindingSpecs:
-            if self in obj._ShortCircuitTests:
-                obj._ShortCircuitTests.remove(self)
-            self._ShortedWindingSpecs.remove(obj)
+        collection = self._ShortedWindingSpecs
+        for obj in members(ShortedWindingSpecs):
+            obj._ShortCircuitTests.discard(self)
+            collection.discard(obj)
+
+    def removeAllShortedWindingSpecs(self):
+        for obj in self._ShortedWindingSpecs:
+            obj._ShortCircuitTests.discard(self)
+        self._ShortedWindingSpecs = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerInfo(IdentifiedObject):
     """Set of transformer data, from an equipment library.
@@ -29,7 +30,7 @@ class TransformerInfo(IdentifiedObject):
 
         @param Transformers: All transformers that can be described with this transformer data.
         """
-        self._Transformers = []
+        self._Transformers = RefList()
         self.Transformers = [] if Transformers is None else Transformers
 
         super(TransformerInfo, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class TransformerInfo(IdentifiedObject):
 
     def setTransformers(self, value):
         for x in self._Transformers:
-            x.TransformerInfo = None
-        for y in value:
-            y._TransformerInfo = self
-        self._Transformers = value
+            x._TransformerInfo = None
+        self._Transformers = RefList()
+        self.addTransformers(value)
 
     Transformers = property(getTransformers, setTransformers)
 
     def addTransformers(self, *Transformers):
-        for obj in Transformers:
-            obj.TransformerInfo = self
+        collection = self._Transformers
+        for obj in members(Transformers):
+            old = obj._TransformerInfo
+            if old is not None and old is not self:
+                old._Transformers.discard(obj)
+            obj._TransformerInfo = self
+            collection.append(obj)
 
     def removeTransformers(self, *Transformers):
-        for obj in Transformers:
-            obj.TransformerInfo = None
+        collection = self._Transformers
+        for obj in members(Transformers):
+            if obj._TransformerInfo is self:
+                obj._TransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformers(self):
+        for obj in self._Transformers:
+            obj._TransformerInfo = None
+        self._Transformers = RefList()
 
@@ -21,7 +21,13 @@
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Wires.ACLineSegment import ACLineSegment
 
 class DistributionLineSegment(ACLineSegment):
-    """Extends ACLineSegment with references to a library of standard types from which electrical parameters can be calculated, as follows: - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model. - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model. - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model. For symmetrical, transposed 3ph lines, it is sufficient to use inherited ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment.  Known issue: Attributes expressing impedances and admittances in PerLengthSequenceImpedance and PhaseImpedanceData use Resistance, etc., which describe pre-calculated, full length of segment, while we should have a longitudinal unit, per length. Taking 'r' as example, its 'unit'=Ohm, but the value is effectively in Ohm/m, so the value needs to be multiplied by Conductor.length. This is against the whole idea of unit data types and is semantically wrong, but base CIM does not have the required data types at this moment. Until the revision of unit modelling in CIM, applications need to deduce and locally handle appending '/m' for units and ensure they multiply the values by Conductor.length.For DistributionLineSegment, provide one of the 3 associations along with Conductor.length, or ACLineSegment.x.  
+    """Extends ACLineSegment with references to a library of standard types from which electrical parameters can be calculated, as follows:
+ - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model.
+ - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model.
+ - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model.
+ For symmetrical, transposed 3ph lines, it is sufficient to use inherited ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment.
+ 
+ Known issue: Attributes expressing impedances and admittances in PerLengthSequenceImpedance and PhaseImpedanceData use Resistance, etc., which describe pre-calculated, full length of segment, while we should have a longitudinal unit, per length. Taking 'r' as example, its 'unit'=Ohm, but the value is effectively in Ohm/m, so the value needs to be multiplied by Conductor.length. This is against the whole idea of unit data types and is semantically wrong, but base CIM does not have the required data types at this moment. Until the revision of unit modelling in CIM, applications need to deduce and locally handle appending '/m' for units and ensure they multiply the values by Conductor.length.For DistributionLineSegment, provide one of the 3 associations along with Conductor.length, or ACLineSegment.x.  
     """
 
     def __init__(self, ConductorInfo=None, SequenceImpedance=None, PhaseImpedance=None, *args, **kw_args):
@@ -56,8 +62,7 @@ class DistributionLineSegment(ACLineSegment):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.ConductorSegments if x != self]
-            self._ConductorInfo._ConductorSegments = filtered
+            self._ConductorInfo._ConductorSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
@@ -73,8 +78,7 @@ class DistributionLineSegment(ACLineSegment):
 
     def setSequenceImpedance(self, value):
         if self._SequenceImpedance is not None:
-            filtered = [x for x in self.SequenceImpedance.ConductorSegments if x != self]
-            self._SequenceImpedance._ConductorSegments = filtered
+            self._SequenceImpedance._ConductorSegments.discard(self)
 
         self._SequenceImpedance = value
         if self._SequenceImpedance is not None:
@@ -90,8 +94,7 @@ class DistributionLineSegment(ACLineSegment):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.ConductorSegments if x != self]
-            self._PhaseImpedance._ConductorSegments = filtered
+            self._PhaseImpedance._ConductorSegments.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
@@ -19,9 +19,13 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class DistributionTransformer(Equipment):
-    """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections. This class differs from Wires::PowerTransformer as follows: - it is part of a TransformerBank - it draws parameters exclusively from TransformerInfo and its associated classes.
+    """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections.
+ This class differs from Wires::PowerTransformer as follows:
+ - it is part of a TransformerBank
+ - it draws parameters exclusively from TransformerInfo and its associated classes.
     """
 
     def __init__(self, TransformerInfo=None, Windings=None, TransformerBank=None, *args, **kw_args):
@@ -34,7 +38,7 @@ class DistributionTransformer(Equipment):
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._Windings = []
+        self._Windings = RefList()
         self.Windings = [] if Windings is None else Windings
 
         self._TransformerBank = None
@@ -56,8 +60,7 @@ class DistributionTransformer(Equipment):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.Transformers if x != self]
-            self._TransformerInfo._Transformers = filtered
+            self._TransformerInfo._Transformers.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
@@ -73,20 +76,32 @@ class DistributionTransformer(Equipment):
 
     def setWindings(self, value):
         for x in self._Windings:
-            x.Transformer = None
-        for y in value:
-            y._Transformer = self
-        self._Windings = value
+            x._Transformer = None
+        self._Windings = RefList()
+        self.addWindings(value)
 
     Windings = property(getWindings, setWindings)
 
     def addWindings(self, *Windings):
-        for obj in Windings:
-            obj.Transformer = self
+        collection = self._Windings
+        for obj in members(Windings):
+            old = obj._Transformer
+            if old is not None and old is not self:
+                old._Windings.discard(obj)
+            obj._Transformer = self
+            collection.append(obj)
 
     def removeWindings(self, *Windings):
-        for obj in Windings:
-            obj.Transformer = None
+        collection = self._Windings
+        for obj in members(Windings):
+            if obj._Transformer is self:
+                obj._Transformer = None
+                collection.discard(obj)
+
+    def removeAllWindings(self):
+        for obj in self._Windings:
+            obj._Transformer = None
+        self._Windings = RefList()
 
     def getTransformerBank(self):
         """Bank this transformer belongs to.
@@ -95,8 +110,7 @@ class DistributionTransformer(Equipment):
 
     def setTransformerBank(self, value):
         if self._TransformerBank is not None:
-            filtered = [x for x in self.TransformerBank.Transformers if x != self]
-            self._TransformerBank._Transformers = filtered
+            self._TransformerBank._Transformers.discard(self)
 
         self._TransformerBank = value
         if self._TransformerBank is not None:
@@ -21,7 +21,12 @@
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.ConductingEquipment import ConductingEquipment
 
 class DistributionTransformerWinding(ConductingEquipment):
-    """Conducting connection point of a distribution / unbalanced transformer winding instance. This class differs from Wires::TransformerWinding as follows: - the eight Pi model attributes are moved into separate class, that can be optionally referred to from several winding instances. - the three grounding attributes can differ per winding instance, even for windings that use the same TransformerInfo, so they are kept on DistributionTransformerWinding. - 'windingType' attribute is replaced by 'sequenceNumber' attribute on WindingInfo class. - all the other attributes come from the WindingInfo (and its relationships). TransformerInfo is associated to the DistributionTransformer as referenceable data, so it can be defined once and referred to from instances, instead of being specified with each instance.
+    """Conducting connection point of a distribution / unbalanced transformer winding instance.
+ This class differs from Wires::TransformerWinding as follows:
+ - the eight Pi model attributes are moved into separate class, that can be optionally referred to from several winding instances.
+ - the three grounding attributes can differ per winding instance, even for windings that use the same TransformerInfo, so they are kept on DistributionTransformerWinding.
+ - 'windingType' attribute is replaced by 'sequenceNumber' attribute on WindingInfo class.
+ - all the other attributes come from the WindingInfo (and its relationships). TransformerInfo is associated to the DistributionTransformer as referenceable data, so it can be defined once and referred to from instances, instead of being specified with each instance.
     """
 
     def __init__(self, WindingInfo=None, Transformer=None, RatioTapChanger=None, *args, **kw_args):
@@ -56,8 +61,7 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setWindingInfo(self, value):
         if self._WindingInfo is not None:
-            filtered = [x for x in self.WindingInfo.Windings if x != self]
-            self._WindingInfo._Windings = filtered
+            self._WindingInfo._Windings.discard(self)
 
         self._WindingInfo = value
         if self._WindingInfo is not None:
@@ -73,8 +77,7 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.Windings if x != self]
-            self._Transformer._Windings = filtered
+            self._Transformer._Windings.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -34,10 +35,10 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         #: Number of phase, neutral, and other wires retained. Constrains the number of matrix elements and the phase codes that can be used with this matrix.
         self.conductorCount = conductorCount
 
-        self._PhaseImpedanceData = []
+        self._PhaseImpedanceData = RefList()
         self.PhaseImpedanceData = [] if PhaseImpedanceData is None else PhaseImpedanceData
 
-        self._ConductorSegments = []
+        self._ConductorSegments = RefList()
         self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
     def setPhaseImpedanceData(self, value):
         for x in self._PhaseImpedanceData:
-            x.PhaseImpedance = None
-        for y in value:
-            y._PhaseImpedance = self
-        self._PhaseImpedanceData = value
+            x._PhaseImpedance = None
+        self._PhaseImpedanceData = RefList()
+        self.addPhaseImpedanceData(value)
 
     PhaseImpedanceData = property(getPhaseImpedanceData, setPhaseImpedanceData)
 
     def addPhaseImpedanceData(self, *PhaseImpedanceData):
-        for obj in PhaseImpedanceData:
-            obj.PhaseImpedance = self
+        collection = self._PhaseImpedanceData
+        for obj in members(PhaseImpedanceData):
+            old = obj._PhaseImpedance
+            if old is not None and old is not self:
+                old._PhaseImpedanceData.discard(obj)
+            obj._PhaseImpedance = self
+            collection.append(obj)
 
     def removePhaseImpedanceData(self, *PhaseImpedanceData):
-        for obj in PhaseImpedanceData:
-            obj.PhaseImpedance = None
+        collection = self._PhaseImpedanceData
+        for obj in members(PhaseImpedanceData):
+            if obj._PhaseImpedance is self:
+                obj._PhaseImpedance = None
+                collection.discard(obj)
+
+    def removeAllPhaseImpedanceData(self):
+        for obj in self._PhaseImpedanceData:
+            obj._PhaseImpedance = None
+        self._PhaseImpedanceData = RefList()
 
     def getConductorSegments(self):
         """All conductor segments described by this phase impedance.
@@ -78,18 +91,30 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
     def setConductorSegments(self, value):
         for x in self._ConductorSegments:
-            x.PhaseImpedance = None
-        for y in value:
-            y._PhaseImpedance = self
-        self._ConductorSegments = value
+            x._PhaseImpedance = None
+        self._ConductorSegments = RefList()
+        self.addConductorSegments(value)
 
     ConductorSegments = property(getConductorSegments, setConductorSegments)
 
     def addConductorSegments(self, *ConductorSegments):
-        for obj in ConductorSegments:
-            obj.PhaseImpedance = self
+        collection = self._ConductorSegments
+        for obj in members(ConductorSegments):
+            old = obj._PhaseImpedance
+            if old is not None and old is not self:
+                old._ConductorSegments.discard(obj)
+            obj._PhaseImpedance = self
+            collection.append(obj)
 
     def removeConductorSegments(self, *ConductorSegments):
-        for obj in ConductorSegments:
-            obj.PhaseImpedance = None
+        collection = self._ConductorSegments
+        for obj in members(ConductorSegments):
+            if obj._PhaseImpedance is self:
+                obj._PhaseImpedance = None
+                collection.discard(obj)
+
+    def removeAllConductorSegments(self):
+        for obj in self._ConductorSegments:
+            obj._PhaseImpedance = None
+        self._ConductorSegments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PerLengthSequenceImpedance(IdentifiedObject):
     """Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.
@@ -53,7 +54,7 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         #: Positive sequence shunt (charging) susceptance, per unit of length.
         self.bch = bch
 
-        self._ConductorSegments = []
+        self._ConductorSegments = RefList()
         self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
 
         super(PerLengthSequenceImpedance, self).__init__(*args, **kw_args)
@@ -72,18 +73,30 @@ class PerLengthSequenceImpedance(IdentifiedObject):
 
     def setConductorSegments(self, value):
         for x in self._ConductorSegments:
-            x.SequenceImpedance = None
-        for y in value:
-            y._SequenceImpedance = self
-        self._ConductorSegments = value
+            x._SequenceImpedance = None
+        self._ConductorSegments = RefList()
+        self.addConductorSegments(value)
 
     ConductorSegments = property(getConductorSegments, setConductorSegments)
 
     def addConductorSegments(self, *ConductorSegments):
-        for obj in ConductorSegments:
-            obj.SequenceImpedance = self
+        collection = self._ConductorSegments
+        for obj in members(ConductorSegments):
+            old = obj._SequenceImpedance
+            if old is not None and old is not self:
+                old._ConductorSegments.discard(obj)
+            obj._SequenceImpedance = self
+            collection.append(obj)
 
     def removeConductorSegments(self, *ConductorSegments):
-        for obj in ConductorSegments:
-            obj.SequenceImpedance = None
+        collection = self._ConductorSegments
+        for obj in members(ConductorSegments):
+            if obj._SequenceImpedance is self:
+                obj._SequenceImpedance = None
+                collection.discard(obj)
+
+    def removeAllConductorSegments(self):
+        for obj in self._ConductorSegments:
+            obj._SequenceImpedance = None
+        self._ConductorSegments = RefList()
 
@@ -64,8 +64,7 @@ class PhaseImpedanceData(Element):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.PhaseImpedanceData if x != self]
-            self._PhaseImpedance._PhaseImpedanceData = filtered
+            self._PhaseImpedance._PhaseImpedanceData.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GeographicalRegion(IdentifiedObject):
     """A geographical region of a power system network model.
@@ -29,7 +30,7 @@ class GeographicalRegion(IdentifiedObject):
 
         @param Regions: The association is used in the naming hierarchy.
         """
-        self._Regions = []
+        self._Regions = RefList()
         self.Regions = [] if Regions is None else Regions
 
         super(GeographicalRegion, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class GeographicalRegion(IdentifiedObject):
 
     def setRegions(self, value):
         for x in self._Regions:
-            x.Region = None
-        for y in value:
-            y._Region = self
-        self._Regions = value
+            x._Region = None
+        self._Regions = RefList()
+        self.addRegions(value)
 
     Regions = property(getRegions, setRegions)
 
     def addRegions(self, *Regions):
-        for obj in Regions:
-            obj.Region = self
+        collection = self._Regions
+        for obj in members(Regions):
+            old = obj._Region
+            if old is not None and old is not self:
+                old._Regions.discard(obj)
+            obj._Region = self
+            collection.append(obj)
 
     def removeRegions(self, *Regions):
-        for obj in Regions:
-            obj.Region = None
+        collection = self._Regions
+        for obj in members(Regions):
+            if obj._Region is self:
+                obj._Region = None
+                collection.discard(obj)
+
+    def removeAllRegions(self):
+        for obj in self._Regions:
+            obj._Region = None
+        self._Regions = RefList()
 
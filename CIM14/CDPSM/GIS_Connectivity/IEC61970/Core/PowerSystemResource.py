@@ -21,7 +21,8 @@
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
 
 class PowerSystemResource(IdentifiedObject):
-    """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
+    """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a 
+ Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
     """
 
     def __init__(self, GeoLocation=None, PSRType=None, *args, **kw_args):
@@ -52,8 +53,7 @@ class PowerSystemResource(IdentifiedObject):
 
     def setGeoLocation(self, value):
         if self._GeoLocation is not None:
-            filtered = [x for x in self.GeoLocation.PowerSystemResources if x != self]
-            self._GeoLocation._PowerSystemResources = filtered
+            self._GeoLocation._PowerSystemResources.discard(self)
 
         self._GeoLocation = value
         if self._GeoLocation is not None:
@@ -69,8 +69,7 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from PyCIM.RefList import RefList, members
 
 class VoltageLevel(EquipmentContainer):
     """A collection of equipment at one common system voltage forming a switchgear. The equipment typically consist of breakers, busbars, instrumentation, control, regulation and protection devices as well as assemblies of all these.
@@ -42,7 +43,7 @@ class VoltageLevel(EquipmentContainer):
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Bays = []
+        self._Bays = RefList()
         self.Bays = [] if Bays is None else Bays
 
         self._Substation = None
@@ -64,8 +65,7 @@ class VoltageLevel(EquipmentContainer):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.VoltageLevel if x != self]
-            self._BaseVoltage._VoltageLevel = filtered
+            self._BaseVoltage._VoltageLevel.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -81,20 +81,32 @@ class VoltageLevel(EquipmentContainer):
 
     def setBays(self, value):
         for x in self._Bays:
-            x.VoltageLevel = None
-        for y in value:
-            y._VoltageLevel = self
-        self._Bays = value
+            x._VoltageLevel = None
+        self._Bays = RefList()
+        self.addBays(value)
 
     Bays = property(getBays, setBays)
 
     def addBays(self, *Bays):
-        for obj in Bays:
-            obj.VoltageLevel = self
+        collection = self._Bays
+        for obj in members(Bays):
+            old = obj._VoltageLevel
+            if old is not None and old is not self:
+                old._Bays.discard(obj)
+            obj._VoltageLevel = self
+            collection.append(obj)
 
     def removeBays(self, *Bays):
-        for obj in Bays:
-            obj.VoltageLevel = None
+        collection = self._Bays
+        for obj in members(Bays):
+            if obj._VoltageLevel is self:
+                obj._VoltageLevel = None
+                collection.discard(obj)
+
+    def removeAllBays(self):
+        for obj in self._Bays:
+            obj._VoltageLevel = None
+        self._Bays = RefList()
 
     def getSubstation(self):
         """The association is used in the naming hierarchy.
@@ -103,8 +115,7 @@ class VoltageLevel(EquipmentContainer):
 
     def setSubstation(self, value):
         if self._Substation is not None:
-            filtered = [x for x in self.Substation.VoltageLevels if x != self]
-            self._Substation._VoltageLevels = filtered
+            self._Substation._VoltageLevels.discard(self)
 
         self._Substation = value
         if self._Substation is not None:
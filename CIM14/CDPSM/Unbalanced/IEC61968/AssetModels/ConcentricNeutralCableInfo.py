@@ -56,8 +56,7 @@ class ConcentricNeutralCableInfo(CableInfo):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.ConcentricNeutralCableInfos if x != self]
-            self._WireType._ConcentricNeutralCableInfos = filtered
+            self._WireType._ConcentricNeutralCableInfos.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ConductorInfo(IdentifiedObject):
     """Conductor data.
@@ -50,10 +51,10 @@ class ConductorInfo(IdentifiedObject):
         #: Usage of this conductor. Values are: "secondary", "other", "distribution", "transmission"
         self.usage = usage
 
-        self._WireArrangements = []
+        self._WireArrangements = RefList()
         self.WireArrangements = [] if WireArrangements is None else WireArrangements
 
-        self._ConductorSegments = []
+        self._ConductorSegments = RefList()
         self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
@@ -72,20 +73,32 @@ class ConductorInfo(IdentifiedObject):
 
     def setWireArrangements(self, value):
         for x in self._WireArrangements:
-            x.ConductorInfo = None
-        for y in value:
-            y._ConductorInfo = self
-        self._WireArrangements = value
+            x._ConductorInfo = None
+        self._WireArrangements = RefList()
+        self.addWireArrangements(value)
 
     WireArrangements = property(getWireArrangements, setWireArrangements)
 
     def addWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.ConductorInfo = self
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            old = obj._ConductorInfo
+            if old is not None and old is not self:
+                old._WireArrangements.discard(obj)
+            obj._ConductorInfo = self
+            collection.append(obj)
 
     def removeWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.ConductorInfo = None
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            if obj._ConductorInfo is self:
+                obj._ConductorInfo = None
+                collection.discard(obj)
+
+    def removeAllWireArrangements(self):
+        for obj in self._WireArrangements:
+            obj._ConductorInfo = None
+        self._WireArrangements = RefList()
 
     def getConductorSegments(self):
         """All conductor segments described by this conductor data.
@@ -94,18 +107,30 @@ class ConductorInfo(IdentifiedObject):
 
     def setConductorSegments(self, value):
         for x in self._ConductorSegments:
-            x.ConductorInfo = None
-        for y in value:
-            y._ConductorInfo = self
-        self._ConductorSegments = value
+            x._ConductorInfo = None
+        self._ConductorSegments = RefList()
+        self.addConductorSegments(value)
 
     ConductorSegments = property(getConductorSegments, setConductorSegments)
 
     def addConductorSegments(self, *ConductorSegments):
-        for obj in ConductorSegments:
-            obj.ConductorInfo = self
+        collection = self._ConductorSegments
+        for obj in members(ConductorSegments):
+            old = obj._ConductorInfo
+            if old is not None and old is not self:
+                old._ConductorSegments.discard(obj)
+            obj._ConductorInfo = self
+            collection.append(obj)
 
     def removeConductorSegments(self, *ConductorSegments):
-        for obj in ConductorSegments:
-            obj.ConductorInfo = None
+        collection = self._ConductorSegments
+        for obj in members(ConductorSegments):
+            if obj._ConductorInfo is self:
+                obj._ConductorInfo = None
+                collection.discard(obj)
+
+    def removeAllConductorSegments(self):
+        for obj in self._ConductorSegments:
+            obj._ConductorInfo = None
+        self._ConductorSegments = RefList()
 
@@ -19,9 +19,11 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ToWindingSpec(IdentifiedObject):
-    """For short-circuit tests, specifies the winding and tap for all short-circuited windings.  For open-circuit tests, specifies the winding, tap, induced voltage, and induced angle for any non-excited windings that were measured during the test. This won't apply if only the exciting current and no-load losses were measured.
+    """For short-circuit tests, specifies the winding and tap for all short-circuited windings. 
+ For open-circuit tests, specifies the winding, tap, induced voltage, and induced angle for any non-excited windings that were measured during the test. This won't apply if only the exciting current and no-load losses were measured.
     """
 
     def __init__(self, toTapStep=0, voltage=0.0, phaseShift=0.0, OpenCircuitTests=None, ShortCircuitTests=None, ToWinding=None, *args, **kw_args):
@@ -43,10 +45,10 @@ class ToWindingSpec(IdentifiedObject):
         #: (if open-circuit test) Phase shift measured at the open-circuited 'to' winding, with the 'from' winding set to the 'from' winding's rated voltage and all other windings open-circuited.
         self.phaseShift = phaseShift
 
-        self._OpenCircuitTests = []
+        self._OpenCircuitTests = RefList()
         self.OpenCircuitTests = [] if OpenCircuitTests is None else OpenCircuitTests
 
-        self._ShortCircuitTests = []
+        self._ShortCircuitTests = RefList()
         self.ShortCircuitTests = [] if ShortCircuitTests is None else ShortCircuitTests
 
         self._ToWinding = None
@@ -68,26 +70,28 @@ class ToWindingSpec(IdentifiedObject):
 
     def setOpenCircuitTests(self, value):
         for p in self._OpenCircuitTests:
-            filtered = [q for q in p.MeasuredWindingSpecs if q != self]
-            self._OpenCircuitTests._MeasuredWindingSpecs = filtered
-        for r in value:
-            if self not in r._MeasuredWindingSpecs:
-                r._MeasuredWindingSpecs.append(self)
-        self._OpenCircuitTests = value
+            p._MeasuredWindingSpecs.discard(self)
+        self._OpenCircuitTests = RefList()
+        self.addOpenCircuitTests(value)
 
     OpenCircuitTests = property(getOpenCircuitTests, setOpenCircuitTests)
 
     def addOpenCircuitTests(self, *OpenCircuitTests):
-        for obj in OpenCircuitTests:
-            if self not in obj._MeasuredWindingSpecs:
-                obj._MeasuredWindingSpecs.append(self)
-            self._OpenCircuitTests.append(obj)
+        collection = self._OpenCircuitTests
+        for obj in members(OpenCircuitTests):
+            obj._MeasuredWindingSpecs.append(self)
+            collection.append(obj)
 
     def removeOpenCircuitTests(self, *OpenCircuitTests):
-        for obj in OpenCircuitTests:
-            if self in obj._MeasuredWindingSpecs:
-                obj._MeasuredWindingSpecs.remove(self)
-            self._OpenCircuitTests.remove(obj)
+        collection = self._OpenCircuitTests
+        for obj in members(OpenCircuitTests):
+            obj._MeasuredWindingSpecs.discard(self)
+            collection.discard(obj)
+
+    def removeAllOpenCircuitTests(self):
+        for obj in self._OpenCircuitTests:
+            obj._MeasuredWindingSpecs.discard(self)
+        self._OpenCircuitTests = RefList()
 
     def getShortCircuitTests(self):
         """All short-circuit tests in which this winding was short-circuited.
@@ -96,26 +100,28 @@ class ToWindingSpec(IdentifiedObject):
 
     def setShortCircuitTests(self, value):
         for p in self._ShortCircuitTests:
-            filtered = [q for q in p.ShortedWindingSpecs if q != self]
-            self._ShortCircuitTests._ShortedWindingSpecs = filtered
-        for r in value:
-            if self not in r._ShortedWindingSpecs:
-                r._ShortedWindingSpecs.append(self)
-        self._ShortCircuitTests = value
+            p._ShortedWindingSpecs.discard(self)
+        self._ShortCircuitTests = RefList()
+        self.addShortCircuitTests(value)
 
     ShortCircuitTests = property(getShortCircuitTests, setShortCircuitTests)
 
     def addShortCircuitTests(self, *ShortCircuitTests):
-        for obj in ShortCircuitTests:
-            if self not in obj._ShortedWindingSpecs:
-                obj._ShortedWindingSpecs.append(self)
-            self._ShortCircuitTests.append(obj)
+        collection = self._ShortCircuitTests
+        for obj in members(ShortCircuitTests):
+            obj._ShortedWindingSpecs.append(self)
+            collection.append(obj)
 
     def removeShortCircuitTests(self, *ShortCircuitTests):
-        for obj in ShortCircuitTests:
-            if self in obj._ShortedWindingSpecs:
-                obj._ShortedWindingSpecs.remove(self)
-            self._ShortCircuitTests.remove(obj)
+        collection = self._ShortCircuitTests
+        for obj in members(ShortCircuitTests):
+            obj._ShortedWindingSpecs.discard(self)
+            collection.discard(obj)
+
+    def removeAllShortCircuitTests(self):
+        for obj in self._ShortCircuitTests:
+            obj._ShortedWindingSpecs.discard(self)
+        self._ShortCircuitTests = RefList()
 
     def getToWinding(self):
         """Winding short-circuited in a short-circuit test, or measured for induced voltage and angle in an open-circuit test.
@@ -124,8 +130,7 @@ class ToWindingSpec(IdentifiedObject):
 
     def setToWinding(self, value):
         if self._ToWinding is not None:
-            filtered = [x for x in self.ToWinding.ToWindingSpecs if x != self]
-            self._ToWinding._ToWindingSpecs = filtered
+            self._ToWinding._ToWindingSpecs.discard(self)
 
         self._ToWinding = value
         if self._ToWinding is not None:
@@ -64,8 +64,7 @@ class WireArrangement(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.WireArrangements if x != self]
-            self._ConductorInfo._WireArrangements = filtered
+            self._ConductorInfo._WireArrangements.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
@@ -81,8 +80,7 @@ class WireArrangement(IdentifiedObject):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.WireArrangements if x != self]
-            self._WireType._WireArrangements = filtered
+            self._WireType._WireArrangements.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
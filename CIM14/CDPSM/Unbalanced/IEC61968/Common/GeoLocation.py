@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61968.Common.Location import Location
+from PyCIM.RefList import RefList, members
 
 class GeoLocation(Location):
     """Geographical location.
@@ -29,7 +30,7 @@ class GeoLocation(Location):
 
         @param PowerSystemResources: All power system resources at this geographical location.
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(GeoLocation, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class GeoLocation(Location):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.GeoLocation = None
-        for y in value:
-            y._GeoLocation = self
-        self._PowerSystemResources = value
+            x._GeoLocation = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.GeoLocation = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._GeoLocation
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._GeoLocation = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.GeoLocation = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._GeoLocation is self:
+                obj._GeoLocation = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._GeoLocation = None
+        self._PowerSystemResources = RefList()
 
@@ -19,9 +19,12 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Location(IdentifiedObject):
-    """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It may be: - Spatial location of an actual or planned structure, or a set of point-oriented structures (as a substation, structure, building, town, etc.) or diagram objects, which may be defined as a point or polygon, or, - Path of an underground or overhead conductor, or a linear diagram object.
+    """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It may be:
+ - Spatial location of an actual or planned structure, or a set of point-oriented structures (as a substation, structure, building, town, etc.) or diagram objects, which may be defined as a point or polygon, or,
+ - Path of an underground or overhead conductor, or a linear diagram object.
     """
 
     def __init__(self, PositionPoints=None, *args, **kw_args):
@@ -29,7 +32,7 @@ class Location(IdentifiedObject):
 
         @param PositionPoints: Sequence of position points describing this location.
         """
-        self._PositionPoints = []
+        self._PositionPoints = RefList()
         self.PositionPoints = [] if PositionPoints is None else PositionPoints
 
         super(Location, self).__init__(*args, **kw_args)
@@ -48,18 +51,30 @@ class Location(IdentifiedObject):
 
     def setPositionPoints(self, value):
         for x in self._PositionPoints:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PositionPoints = value
+            x._Location = None
+        self._PositionPoints = RefList()
+        self.addPositionPoints(value)
 
     PositionPoints = property(getPositionPoints, setPositionPoints)
 
     def addPositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = self
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PositionPoints.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = None
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPositionPoints(self):
+        for obj in self._PositionPoints:
+            obj._Location = None
+        self._PositionPoints = RefList()
 
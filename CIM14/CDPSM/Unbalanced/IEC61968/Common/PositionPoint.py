@@ -21,7 +21,9 @@
 from CIM14.CDPSM.Unbalanced.Element import Element
 
 class PositionPoint(Element):
-    """Set of spatial coordinates that determine a point. A sequence of PositionPoints can be used to describe: - physical location of non-point oriented objects like cables or lines, or - area of an object like a substation, a geographical zone or a diagram object.
+    """Set of spatial coordinates that determine a point. A sequence of PositionPoints can be used to describe:
+ - physical location of non-point oriented objects like cables or lines, or
+ - area of an object like a substation, a geographical zone or a diagram object.
     """
 
     def __init__(self, sequenceNumber=0, xPosition='', yPosition='', Location=None, *args, **kw_args):
@@ -60,8 +62,7 @@ class PositionPoint(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PositionPoints if x != self]
-            self._Location._PositionPoints = filtered
+            self._Location._PositionPoints.discard(self)
 
         self._Location = value
         if self._Location is not None:
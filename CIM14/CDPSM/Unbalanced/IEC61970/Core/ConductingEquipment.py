@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -34,7 +35,7 @@ class ConductingEquipment(Equipment):
         #: Describes the phases carried by a conducting equipment. Values are: "ABC", "splitSecondary2N", "ABN", "CN", "ACN", "BC", "AN", "BN", "AB", "splitSecondary1N", "N", "C", "AC", "ABCN", "splitSecondary12N", "A", "B", "BCN"
         self.phases = phases
 
-        self._Terminals = []
+        self._Terminals = RefList()
         self.Terminals = [] if Terminals is None else Terminals
 
         self._BaseVoltage = None
@@ -56,20 +57,32 @@ class ConductingEquipment(Equipment):
 
     def setTerminals(self, value):
         for x in self._Terminals:
-            x.ConductingEquipment = None
-        for y in value:
-            y._ConductingEquipment = self
-        self._Terminals = value
+            x._ConductingEquipment = None
+        self._Terminals = RefList()
+        self.addTerminals(value)
 
     Terminals = property(getTerminals, setTerminals)
 
     def addTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConductingEquipment = self
+        collection = self._Terminals
+        for obj in members(Terminals):
+            old = obj._ConductingEquipment
+            if old is not None and old is not self:
+                old._Terminals.discard(obj)
+            obj._ConductingEquipment = self
+            collection.append(obj)
 
     def removeTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConductingEquipment = None
+        collection = self._Terminals
+        for obj in members(Terminals):
+            if obj._ConductingEquipment is self:
+                obj._ConductingEquipment = None
+                collection.discard(obj)
+
+    def removeAllTerminals(self):
+        for obj in self._Terminals:
+            obj._ConductingEquipment = None
+        self._Terminals = RefList()
 
     def getBaseVoltage(self):
         """Use association to ConductingEquipment only when there is no VoltageLevel container used.
@@ -78,8 +91,7 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
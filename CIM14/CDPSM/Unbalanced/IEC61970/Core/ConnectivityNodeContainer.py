@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class ConnectivityNodeContainer(PowerSystemResource):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -29,7 +30,7 @@ class ConnectivityNodeContainer(PowerSystemResource):
 
         @param ConnectivityNodes: Connectivity nodes contained by this container.
         """
-        self._ConnectivityNodes = []
+        self._ConnectivityNodes = RefList()
         self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ConnectivityNodeContainer(PowerSystemResource):
 
     def setConnectivityNodes(self, value):
         for x in self._ConnectivityNodes:
-            x.ConnectivityNodeContainer = None
-        for y in value:
-            y._ConnectivityNodeContainer = self
-        self._ConnectivityNodes = value
+            x._ConnectivityNodeContainer = None
+        self._ConnectivityNodes = RefList()
+        self.addConnectivityNodes(value)
 
     ConnectivityNodes = property(getConnectivityNodes, setConnectivityNodes)
 
     def addConnectivityNodes(self, *ConnectivityNodes):
-        for obj in ConnectivityNodes:
-            obj.ConnectivityNodeContainer = self
+        collection = self._ConnectivityNodes
+        for obj in members(ConnectivityNodes):
+            old = obj._ConnectivityNodeContainer
+            if old is not None and old is not self:
+                old._ConnectivityNodes.discard(obj)
+            obj._ConnectivityNodeContainer = self
+            collection.append(obj)
 
     def removeConnectivityNodes(self, *ConnectivityNodes):
-        for obj in ConnectivityNodes:
-            obj.ConnectivityNodeContainer = None
+        collection = self._ConnectivityNodes
+        for obj in members(ConnectivityNodes):
+            if obj._ConnectivityNodeContainer is self:
+                obj._ConnectivityNodeContainer = None
+                collection.discard(obj)
+
+    def removeAllConnectivityNodes(self):
+        for obj in self._ConnectivityNodes:
+            obj._ConnectivityNodeContainer = None
+        self._ConnectivityNodes = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.
@@ -41,7 +42,7 @@ class GeneratingUnit(Equipment):
         #: Default Initial active power  which is used to store a powerflow result for the initial active power for this unit in this network configuration
         self.initialP = initialP
 
-        self._SynchronousMachines = []
+        self._SynchronousMachines = RefList()
         self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
@@ -60,18 +61,30 @@ class GeneratingUnit(Equipment):
 
     def setSynchronousMachines(self, value):
         for x in self._SynchronousMachines:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._SynchronousMachines = value
+            x._GeneratingUnit = None
+        self._SynchronousMachines = RefList()
+        self.addSynchronousMachines(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            obj.GeneratingUnit = self
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._SynchronousMachines.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            obj.GeneratingUnit = None
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllSynchronousMachines(self):
+        for obj in self._SynchronousMachines:
+            obj._GeneratingUnit = None
+        self._SynchronousMachines = RefList()
 
@@ -19,9 +19,18 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class LoadResponseCharacteristic(IdentifiedObject):
-    """Models the characteristic response of the load demand due to to changes in system conditions such as voltage and frequency. This is not related to demand response.  If LoadResponseCharacteristic.exponentModel is True, the voltage exponents are specified and used as to calculate:  Active power component = Pnominal * (Voltage/cim:BaseVoltage.nominalVoltage) ** cim:LoadResponseCharacteristic.pVoltageExponent  Reactive power component = Qnominal * (Voltage/cim:BaseVoltage.nominalVoltage)** cim:LoadResponseCharacteristic.qVoltageExponent  Where  * means 'multiply' and ** is 'raised to power of'.
+    """Models the characteristic response of the load demand due to to changes in system conditions such as voltage and frequency. This is not related to demand response.
+ 
+ If LoadResponseCharacteristic.exponentModel is True, the voltage exponents are specified and used as to calculate:
+ 
+ Active power component = Pnominal * (Voltage/cim:BaseVoltage.nominalVoltage) ** cim:LoadResponseCharacteristic.pVoltageExponent
+ 
+ Reactive power component = Qnominal * (Voltage/cim:BaseVoltage.nominalVoltage)** cim:LoadResponseCharacteristic.qVoltageExponent
+ 
+ Where  * means 'multiply' and ** is 'raised to power of'.
     """
 
     def __init__(self, pVoltageExponent=0.0, qConstantCurrent=0.0, pFrequencyExponent=0.0, exponentModel=False, qConstantImpedance=0.0, pConstantCurrent=0.0, qFrequencyExponent=0.0, pConstantPower=0.0, qVoltageExponent=0.0, qConstantPower=0.0, pConstantImpedance=0.0, EnergyConsumer=None, *args, **kw_args):
@@ -73,7 +82,7 @@ class LoadResponseCharacteristic(IdentifiedObject):
         #: Portion of active power load modeled as constant impedance.  Used only if the useExponentModel is false.    This value is noralized against the sum of pZ, pI, and pP.
         self.pConstantImpedance = pConstantImpedance
 
-        self._EnergyConsumer = []
+        self._EnergyConsumer = RefList()
         self.EnergyConsumer = [] if EnergyConsumer is None else EnergyConsumer
 
         super(LoadResponseCharacteristic, self).__init__(*args, **kw_args)
@@ -92,18 +101,30 @@ class LoadResponseCharacteristic(IdentifiedObject):
 
     def setEnergyConsumer(self, value):
         for x in self._EnergyConsumer:
-            x.LoadResponse = None
-        for y in value:
-            y._LoadResponse = self
-        self._EnergyConsumer = value
+            x._LoadResponse = None
+        self._EnergyConsumer = RefList()
+        self.addEnergyConsumer(value)
 
     EnergyConsumer = property(getEnergyConsumer, setEnergyConsumer)
 
     def addEnergyConsumer(self, *EnergyConsumer):
-        for obj in EnergyConsumer:
-            obj.LoadResponse = self
+        collection = self._EnergyConsumer
+        for obj in members(EnergyConsumer):
+            old = obj._LoadResponse
+            if old is not None and old is not self:
+                old._EnergyConsumer.discard(obj)
+            obj._LoadResponse = self
+            collection.append(obj)
 
     def removeEnergyConsumer(self, *EnergyConsumer):
-        for obj in EnergyConsumer:
-            obj.LoadResponse = None
+        collection = self._EnergyConsumer
+        for obj in members(EnergyConsumer):
+            if obj._LoadResponse is self:
+                obj._LoadResponse = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumer(self):
+        for obj in self._EnergyConsumer:
+            obj._LoadResponse = None
+        self._EnergyConsumer = RefList()
 
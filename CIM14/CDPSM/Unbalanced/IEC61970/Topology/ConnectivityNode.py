@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ConnectivityNode(IdentifiedObject):
     """Connectivity nodes are points where terminals of conducting equipment are connected together with zero impedance.
@@ -30,7 +31,7 @@ class ConnectivityNode(IdentifiedObject):
         @param Terminals: Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
         @param ConnectivityNodeContainer: Container of this connectivity node.
         """
-        self._Terminals = []
+        self._Terminals = RefList()
         self.Terminals = [] if Terminals is None else Terminals
 
         self._ConnectivityNodeContainer = None
@@ -52,20 +53,32 @@ class ConnectivityNode(IdentifiedObject):
 
     def setTerminals(self, value):
         for x in self._Terminals:
-            x.ConnectivityNode = None
-        for y in value:
-            y._ConnectivityNode = self
-        self._Terminals = value
+            x._ConnectivityNode = None
+        self._Terminals = RefList()
+        self.addTerminals(value)
 
     Terminals = property(getTerminals, setTerminals)
 
     def addTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConnectivityNode = self
+        collection = self._Terminals
+        for obj in members(Terminals):
+            old = obj._ConnectivityNode
+            if old is not None and old is not self:
+                old._Terminals.discard(obj)
+            obj._ConnectivityNode = self
+            collection.append(obj)
 
     def removeTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConnectivityNode = None
+        collection = self._Terminals
+        for obj in members(Terminals):
+            if obj._ConnectivityNode is self:
+                obj._ConnectivityNode = None
+                collection.discard(obj)
+
+    def removeAllTerminals(self):
+        for obj in self._Terminals:
+            obj._ConnectivityNode = None
+        self._Terminals = RefList()
 
     def getConnectivityNodeContainer(self):
         """Container of this connectivity node.
@@ -74,8 +87,7 @@ class ConnectivityNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.ConnectivityNodes if x != self]
-            self._ConnectivityNodeContainer._ConnectivityNodes = filtered
+            self._ConnectivityNodeContainer._ConnectivityNodes.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
@@ -68,8 +68,7 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
@@ -68,8 +68,7 @@ class SynchronousMachine(ConductingEquipment):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
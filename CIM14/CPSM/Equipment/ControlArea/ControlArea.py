@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class ControlArea(PowerSystemResource):
     """A <b>control area </b>is a grouping of <b>generating units</b> and/or loads and a cutset of tie lines (as <b>terminals</b>) which may be used for a variety of purposes including automatic generation control, powerflow solution area interchange control specification, and input to load forecasting.   Note that any number of overlapping control area specifications can be superimposed on the physical model.
@@ -43,13 +44,13 @@ class ControlArea(PowerSystemResource):
         #: Active power net interchange tolerance
         self.pTolerance = pTolerance
 
-        self._ControlAreaGeneratingUnit = []
+        self._ControlAreaGeneratingUnit = RefList()
         self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
 
         self._EnergyArea = None
         self.EnergyArea = EnergyArea
 
-        self._TieFlow = []
+        self._TieFlow = RefList()
         self.TieFlow = [] if TieFlow is None else TieFlow
 
         super(ControlArea, self).__init__(*args, **kw_args)
@@ -68,20 +69,32 @@ class ControlArea(PowerSystemResource):
 
     def setControlAreaGeneratingUnit(self, value):
         for x in self._ControlAreaGeneratingUnit:
-            x.ControlArea = None
-        for y in value:
-            y._ControlArea = self
-        self._ControlAreaGeneratingUnit = value
+            x._ControlArea = None
+        self._ControlAreaGeneratingUnit = RefList()
+        self.addControlAreaGeneratingUnit(value)
 
     ControlAreaGeneratingUnit = property(getControlAreaGeneratingUnit, setControlAreaGeneratingUnit)
 
     def addControlAreaGeneratingUnit(self, *ControlAreaGeneratingUnit):
-        for obj in ControlAreaGeneratingUnit:
-            obj.ControlArea = self
+        collection = self._ControlAreaGeneratingUnit
+        for obj in members(ControlAreaGeneratingUnit):
+            old = obj._ControlArea
+            if old is not None and old is not self:
+                old._ControlAreaGeneratingUnit.discard(obj)
+            obj._ControlArea = self
+            collection.append(obj)
 
     def removeControlAreaGeneratingUnit(self, *ControlAreaGeneratingUnit):
-        for obj in ControlAreaGeneratingUnit:
-            obj.ControlArea = None
+        collection = self._ControlAreaGeneratingUnit
+        for obj in members(ControlAreaGeneratingUnit):
+            if obj._ControlArea is self:
+                obj._ControlArea = None
+                collection.discard(obj)
+
+    def removeAllControlAreaGeneratingUnit(self):
+        for obj in self._ControlAreaGeneratingUnit:
+            obj._ControlArea = None
+        self._ControlAreaGeneratingUnit = RefList()
 
     def getEnergyArea(self):
         """The energy area that is forecast from this control area specification.
@@ -106,18 +119,30 @@ class ControlArea(PowerSystemResource):
 
     def setTieFlow(self, value):
         for x in self._TieFlow:
-            x.ControlArea = None
-        for y in value:
-            y._ControlArea = self
-        self._TieFlow = value
+            x._ControlArea = None
+        self._TieFlow = RefList()
+        self.addTieFlow(value)
 
     TieFlow = property(getTieFlow, setTieFlow)
 
     def addTieFlow(self, *TieFlow):
-        for obj in TieFlow:
-            obj.ControlArea = self
+        collection = self._TieFlow
+        for obj in members(TieFlow):
+            old = obj._ControlArea
+            if old is not None and old is not self:
+                old._TieFlow.discard(obj)
+            obj._ControlArea = self
+            collection.append(obj)
 
     def removeTieFlow(self, *TieFlow):
-        for obj in TieFlow:
-            obj.ControlArea = None
+        collection = self._TieFlow
+        for obj in members(TieFlow):
+            if obj._ControlArea is self:
+                obj._ControlArea = None
+                collection.discard(obj)
+
+    def removeAllTieFlow(self):
+        for obj in self._TieFlow:
+            obj._ControlArea = None
+        self._TieFlow = RefList()
 
@@ -52,8 +52,7 @@ class ControlAreaGeneratingUnit(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.ControlAreaGeneratingUnit if x != self]
-            self._ControlArea._ControlAreaGeneratingUnit = filtered
+            self._ControlArea._ControlAreaGeneratingUnit.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
@@ -69,8 +68,7 @@ class ControlAreaGeneratingUnit(Element):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.ControlAreaGeneratingUnit if x != self]
-            self._GeneratingUnit._ControlAreaGeneratingUnit = filtered
+            self._GeneratingUnit._ControlAreaGeneratingUnit.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
@@ -48,8 +48,7 @@ class Bay(EquipmentContainer):
 
     def setVoltageLevel(self, value):
         if self._VoltageLevel is not None:
-            filtered = [x for x in self.VoltageLevel.Bays if x != self]
-            self._VoltageLevel._Bays = filtered
+            self._VoltageLevel._Bays.discard(self)
 
         self._VoltageLevel = value
         if self._VoltageLevel is not None:
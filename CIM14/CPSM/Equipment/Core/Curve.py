@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -49,7 +50,7 @@ class Curve(IdentifiedObject):
         #: The X-axis units of measure. Values are: "A", "rad", "none", "g", "W/Hz", "V", "m2", "VA", "VArh", "N", "Pa", "VAh", "F", "H", "Hz-1", "W/s", "J", "m", "S", "min", "deg", "J/s", "s", "Wh", "m3", "oC", "V/VAr", "s-1", "h", "W", "ohm", "Hz", "VAr", "kg/J"
         self.xUnit = xUnit
 
-        self._CurveDatas = []
+        self._CurveDatas = RefList()
         self.CurveDatas = [] if CurveDatas is None else CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
@@ -68,18 +69,30 @@ class Curve(IdentifiedObject):
 
     def setCurveDatas(self, value):
         for x in self._CurveDatas:
-            x.Curve = None
-        for y in value:
-            y._Curve = self
-        self._CurveDatas = value
+            x._Curve = None
+        self._CurveDatas = RefList()
+        self.addCurveDatas(value)
 
     CurveDatas = property(getCurveDatas, setCurveDatas)
 
     def addCurveDatas(self, *CurveDatas):
-        for obj in CurveDatas:
-            obj.Curve = self
+        collection = self._CurveDatas
+        for obj in members(CurveDatas):
+            old = obj._Curve
+            if old is not None and old is not self:
+                old._CurveDatas.discard(obj)
+            obj._Curve = self
+            collection.append(obj)
 
     def removeCurveDatas(self, *CurveDatas):
-        for obj in CurveDatas:
-            obj.Curve = None
+        collection = self._CurveDatas
+        for obj in members(CurveDatas):
+            if obj._Curve is self:
+                obj._Curve = None
+                collection.discard(obj)
+
+    def removeAllCurveDatas(self):
+        for obj in self._CurveDatas:
+            obj._Curve = None
+        self._CurveDatas = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
+from PyCIM.RefList import RefList, members
 
 class EquipmentContainer(ConnectivityNodeContainer):
     """A modeling construct to provide a root class for containing equipment.
@@ -29,7 +30,7 @@ class EquipmentContainer(ConnectivityNodeContainer):
 
         @param Equipments: The association is used in the naming hierarchy.
         """
-        self._Equipments = []
+        self._Equipments = RefList()
         self.Equipments = [] if Equipments is None else Equipments
 
         super(EquipmentContainer, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class EquipmentContainer(ConnectivityNodeContainer):
 
     def setEquipments(self, value):
         for x in self._Equipments:
-            x.EquipmentContainer = None
-        for y in value:
-            y._EquipmentContainer = self
-        self._Equipments = value
+            x._EquipmentContainer = None
+        self._Equipments = RefList()
+        self.addEquipments(value)
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
-        for obj in Equipments:
-            obj.EquipmentContainer = self
+        collection = self._Equipments
+        for obj in members(Equipments):
+            old = obj._EquipmentContainer
+            if old is not None and old is not self:
+                old._Equipments.discard(obj)
+            obj._EquipmentContainer = self
+            collection.append(obj)
 
     def removeEquipments(self, *Equipments):
-        for obj in Equipments:
-            obj.EquipmentContainer = None
+        collection = self._Equipments
+        for obj in members(Equipments):
+            if obj._EquipmentContainer is self:
+                obj._EquipmentContainer = None
+                collection.discard(obj)
+
+    def removeAllEquipments(self):
+        for obj in self._Equipments:
+            obj._EquipmentContainer = None
+        self._Equipments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class SubGeographicalRegion(IdentifiedObject):
     """A subset of a geographical region of a power system network model.
@@ -34,10 +35,10 @@ class SubGeographicalRegion(IdentifiedObject):
         self._Region = None
         self.Region = Region
 
-        self._Lines = []
+        self._Lines = RefList()
         self.Lines = [] if Lines is None else Lines
 
-        self._Substations = []
+        self._Substations = RefList()
         self.Substations = [] if Substations is None else Substations
 
         super(SubGeographicalRegion, self).__init__(*args, **kw_args)
@@ -56,8 +57,7 @@ class SubGeographicalRegion(IdentifiedObject):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Regions if x != self]
-            self._Region._Regions = filtered
+            self._Region._Regions.discard(self)
 
         self._Region = value
         if self._Region is not None:
@@ -73,20 +73,32 @@ class SubGeographicalRegion(IdentifiedObject):
 
     def setLines(self, value):
         for x in self._Lines:
-            x.Region = None
-        for y in value:
-            y._Region = self
-        self._Lines = value
+            x._Region = None
+        self._Lines = RefList()
+        self.addLines(value)
 
     Lines = property(getLines, setLines)
 
     def addLines(self, *Lines):
-        for obj in Lines:
-            obj.Region = self
+        collection = self._Lines
+        for obj in members(Lines):
+            old = obj._Region
+            if old is not None and old is not self:
+                old._Lines.discard(obj)
+            obj._Region = self
+            collection.append(obj)
 
     def removeLines(self, *Lines):
-        for obj in Lines:
-            obj.Region = None
+        collection = self._Lines
+        for obj in members(Lines):
+            if obj._Region is self:
+                obj._Region = None
+                collection.discard(obj)
+
+    def removeAllLines(self):
+        for obj in self._Lines:
+            obj._Region = None
+        self._Lines = RefList()
 
     def getSubstations(self):
         """The association is used in the naming hierarchy.
@@ -95,18 +107,30 @@ class SubGeographicalRegion(IdentifiedObject):
 
     def setSubstations(self, value):
         for x in self._Substations:
-            x.Region = None
-        for y in value:
-            y._Region = self
-        self._Substations = value
+            x._Region = None
+        self._Substations = RefList()
+        self.addSubstations(value)
 
     Substations = property(getSubstations, setSubstations)
 
     def addSubstations(self, *Substations):
-        for obj in Substations:
-            obj.Region = self
+        collection = self._Substations
+        for obj in members(Substations):
+            old = obj._Region
+            if old is not None and old is not self:
+                old._Substations.discard(obj)
+            obj._Region = self
+            collection.append(obj)
 
     def removeSubstations(self, *Substations):
-        for obj in Substations:
-            obj.Region = None
+        collection = self._Substations
+        for obj in members(Substations):
+            if obj._Region is self:
+                obj._Region = None
+                collection.discard(obj)
+
+    def removeAllSubstations(self):
+        for obj in self._Substations:
+            obj._Region = None
+        self._Substations = RefList()
 
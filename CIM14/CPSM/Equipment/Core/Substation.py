@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.EquipmentContainer import EquipmentContainer
+from PyCIM.RefList import RefList, members
 
 class Substation(EquipmentContainer):
     """A collection of equipment for purposes other than generation or utilization, through which electric energy in bulk is passed for the purposes of switching or modifying its characteristics.
@@ -33,7 +34,7 @@ class Substation(EquipmentContainer):
         self._Region = None
         self.Region = Region
 
-        self._VoltageLevels = []
+        self._VoltageLevels = RefList()
         self.VoltageLevels = [] if VoltageLevels is None else VoltageLevels
 
         super(Substation, self).__init__(*args, **kw_args)
@@ -52,8 +53,7 @@ class Substation(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Substations if x != self]
-            self._Region._Substations = filtered
+            self._Region._Substations.discard(self)
 
         self._Region = value
         if self._Region is not None:
@@ -69,18 +69,30 @@ class Substation(EquipmentContainer):
 
     def setVoltageLevels(self, value):
         for x in self._VoltageLevels:
-            x.Substation = None
-        for y in value:
-            y._Substation = self
-        self._VoltageLevels = value
+            x._Substation = None
+        self._VoltageLevels = RefList()
+        self.addVoltageLevels(value)
 
     VoltageLevels = property(getVoltageLevels, setVoltageLevels)
 
     def addVoltageLevels(self, *VoltageLevels):
-        for obj in VoltageLevels:
-            obj.Substation = self
+        collection = self._VoltageLevels
+        for obj in members(VoltageLevels):
+            old = obj._Substation
+            if old is not None and old is not self:
+                old._VoltageLevels.discard(obj)
+            obj._Substation = self
+            collection.append(obj)
 
     def removeVoltageLevels(self, *VoltageLevels):
-        for obj in VoltageLevels:
-            obj.Substation = None
+        collection = self._VoltageLevels
+        for obj in members(VoltageLevels):
+            if obj._Substation is self:
+                obj._Substation = None
+                collection.discard(obj)
+
+    def removeAllVoltageLevels(self):
+        for obj in self._VoltageLevels:
+            obj._Substation = None
+        self._VoltageLevels = RefList()
 
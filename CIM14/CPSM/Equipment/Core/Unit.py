@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Unit(IdentifiedObject):
     """Quantity being measured. The Unit.name shall be unique among all specified quantities and describe the quantity. The Unit.aliasName is meant to be used for localization.-  The Unit class is used to define the unit of measure (MW, kV, MVA, etc.) of a Measurement.  A Measurement must be associated with one and only one Unit.  The valid values for Unit.name are defined in Normative String Tables. 
@@ -29,7 +30,7 @@ class Unit(IdentifiedObject):
 
         @param Measurements: The Measurements having the Unit
         """
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         super(Unit, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class Unit(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.Unit = None
-        for y in value:
-            y._Unit = self
-        self._Measurements = value
+            x._Unit = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Unit = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._Unit
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._Unit = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Unit = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._Unit is self:
+                obj._Unit = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Unit = None
+        self._Measurements = RefList()
 
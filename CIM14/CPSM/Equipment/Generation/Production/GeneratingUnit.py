@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.-  To define a GeneratingUnit requires defining the initial real power injection, net real power limits, and the status of the unit.  The initial injection is defined using  the attribute “initialP”. -  The net real power limits can be defined in three ways; 1) with the attributes “maxOperatingP” and “minOperatingP”, or 2) with the attribute  “ratedNetMaxP” or 3) with the attributes “ratedGrossMinP” and “ratedGrossMaxP” used in conjunction with an associated GrossToNetActivePowerCurve. -  The control status of the unit is defined with the attribute “genControlSource”, but it is not required.  The participation factor attributes “longPF”, “normalPF”, and “shortPF” are not required. -  The GeneratingUnit class should only be used in cases where the more specific classes, HydroGeneratingUnit and ThermalGeneratingUnit, do not apply. -  The attributes governorSCD, maximumAllowableSpinningReserve, nominalP, startupCost, and variableCost are not required. 
@@ -91,13 +92,13 @@ class GeneratingUnit(Equipment):
         #: Generating unit economic participation factor
         self.normalPF = normalPF
 
-        self._SynchronousMachines = []
+        self._SynchronousMachines = RefList()
         self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
 
-        self._ControlAreaGeneratingUnit = []
+        self._ControlAreaGeneratingUnit = RefList()
         self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
 
-        self._GrossToNetActivePowerCurves = []
+        self._GrossToNetActivePowerCurves = RefList()
         self.GrossToNetActivePowerCurves = [] if GrossToNetActivePowerCurves is None else GrossToNetActivePowerCurves
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
@@ -116,20 +117,32 @@ class GeneratingUnit(Equipment):
 
     def setSynchronousMachines(self, value):
         for x in self._SynchronousMachines:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._SynchronousMachines = value
+            x._GeneratingUnit = None
+        self._SynchronousMachines = RefList()
+        self.addSynchronousMachines(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            obj.GeneratingUnit = self
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._SynchronousMachines.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            obj.GeneratingUnit = None
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllSynchronousMachines(self):
+        for obj in self._SynchronousMachines:
+            obj._GeneratingUnit = None
+        self._SynchronousMachines = RefList()
 
     def getControlAreaGeneratingUnit(self):
         """ControlArea specifications for this generating unit.
@@ -138,20 +151,32 @@ class GeneratingUnit(Equipment):
 
     def setControlAreaGeneratingUnit(self, value):
         for x in self._ControlAreaGeneratingUnit:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._ControlAreaGeneratingUnit = value
+            x._GeneratingUnit = None
+        self._ControlAreaGeneratingUnit = RefList()
+        self.addControlAreaGeneratingUnit(value)
 
     ControlAreaGeneratingUnit = property(getControlAreaGeneratingUnit, setControlAreaGeneratingUnit)
 
     def addControlAreaGeneratingUnit(self, *ControlAreaGeneratingUnit):
-        for obj in ControlAreaGeneratingUnit:
-            obj.GeneratingUnit = self
+        collection = self._ControlAreaGeneratingUnit
+        for obj in members(ControlAreaGeneratingUnit):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._ControlAreaGeneratingUnit.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeControlAreaGeneratingUnit(self, *ControlAreaGeneratingUnit):
-        for obj in ControlAreaGeneratingUnit:
-            obj.GeneratingUnit = None
+        collection = self._ControlAreaGeneratingUnit
+        for obj in members(ControlAreaGeneratingUnit):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllControlAreaGeneratingUnit(self):
+        for obj in self._ControlAreaGeneratingUnit:
+            obj._GeneratingUnit = None
+        self._ControlAreaGeneratingUnit = RefList()
 
     def getGrossToNetActivePowerCurves(self):
         """A generating unit may have a gross active power to net active power curve, describing the losses and auxiliary power requirements of the unit
@@ -160,18 +185,30 @@ class GeneratingUnit(Equipment):
 
     def setGrossToNetActivePowerCurves(self, value):
         for x in self._GrossToNetActivePowerCurves:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._GrossToNetActivePowerCurves = value
+            x._GeneratingUnit = None
+        self._GrossToNetActivePowerCurves = RefList()
+        self.addGrossToNetActivePowerCurves(value)
 
     GrossToNetActivePowerCurves = property(getGrossToNetActivePowerCurves, setGrossToNetActivePowerCurves)
 
     def addGrossToNetActivePowerCurves(self, *GrossToNetActivePowerCurves):
-        for obj in GrossToNetActivePowerCurves:
-            obj.GeneratingUnit = self
+        collection = self._GrossToNetActivePowerCurves
+        for obj in members(GrossToNetActivePowerCurves):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._GrossToNetActivePowerCurves.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeGrossToNetActivePowerCurves(self, *GrossToNetActivePowerCurves):
-        for obj in GrossToNetActivePowerCurves:
-            obj.GeneratingUnit = None
+        collection = self._GrossToNetActivePowerCurves
+        for obj in members(GrossToNetActivePowerCurves):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllGrossToNetActivePowerCurves(self):
+        for obj in self._GrossToNetActivePowerCurves:
+            obj._GeneratingUnit = None
+        self._GrossToNetActivePowerCurves = RefList()
 
@@ -48,8 +48,7 @@ class ConformLoad(EnergyConsumer):
 
     def setLoadGroup(self, value):
         if self._LoadGroup is not None:
-            filtered = [x for x in self.LoadGroup.EnergyConsumers if x != self]
-            self._LoadGroup._EnergyConsumers = filtered
+            self._LoadGroup._EnergyConsumers.discard(self)
 
         self._LoadGroup = value
         if self._LoadGroup is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.LoadModel.LoadGroup import LoadGroup
+from PyCIM.RefList import RefList, members
 
 class ConformLoadGroup(LoadGroup):
     """A group of loads conforming to an allocation pattern.
@@ -30,10 +31,10 @@ class ConformLoadGroup(LoadGroup):
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         @param ConformLoadSchedules: The ConformLoadSchedules in the ConformLoadGroup.
         """
-        self._EnergyConsumers = []
+        self._EnergyConsumers = RefList()
         self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
 
-        self._ConformLoadSchedules = []
+        self._ConformLoadSchedules = RefList()
         self.ConformLoadSchedules = [] if ConformLoadSchedules is None else ConformLoadSchedules
 
         super(ConformLoadGroup, self).__init__(*args, **kw_args)
@@ -52,20 +53,32 @@ class ConformLoadGroup(LoadGroup):
 
     def setEnergyConsumers(self, value):
         for x in self._EnergyConsumers:
-            x.LoadGroup = None
-        for y in value:
-            y._LoadGroup = self
-        self._EnergyConsumers = value
+            x._LoadGroup = None
+        self._EnergyConsumers = RefList()
+        self.addEnergyConsumers(value)
 
     EnergyConsumers = property(getEnergyConsumers, setEnergyConsumers)
 
     def addEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.LoadGroup = self
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            old = obj._LoadGroup
+            if old is not None and old is not self:
+                old._EnergyConsumers.discard(obj)
+            obj._LoadGroup = self
+            collection.append(obj)
 
     def removeEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.LoadGroup = None
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            if obj._LoadGroup is self:
+                obj._LoadGroup = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumers(self):
+        for obj in self._EnergyConsumers:
+            obj._LoadGroup = None
+        self._EnergyConsumers = RefList()
 
     def getConformLoadSchedules(self):
         """The ConformLoadSchedules in the ConformLoadGroup.
@@ -74,18 +87,30 @@ class ConformLoadGroup(LoadGroup):
 
     def setConformLoadSchedules(self, value):
         for x in self._ConformLoadSchedules:
-            x.ConformLoadGroup = None
-        for y in value:
-            y._ConformLoadGroup = self
-        self._ConformLoadSchedules = value
+            x._ConformLoadGroup = None
+        self._ConformLoadSchedules = RefList()
+        self.addConformLoadSchedules(value)
 
     ConformLoadSchedules = property(getConformLoadSchedules, setConformLoadSchedules)
 
     def addConformLoadSchedules(self, *ConformLoadSchedules):
-        for obj in ConformLoadSchedules:
-            obj.ConformLoadGroup = self
+        collection = self._ConformLoadSchedules
+        for obj in members(ConformLoadSchedules):
+            old = obj._ConformLoadGroup
+            if old is not None and old is not self:
+                old._ConformLoadSchedules.discard(obj)
+            obj._ConformLoadGroup = self
+            collection.append(obj)
 
     def removeConformLoadSchedules(self, *ConformLoadSchedules):
-        for obj in ConformLoadSchedules:
-            obj.ConformLoadGroup = None
+        collection = self._ConformLoadSchedules
+        for obj in members(ConformLoadSchedules):
+            if obj._ConformLoadGroup is self:
+                obj._ConformLoadGroup = None
+                collection.discard(obj)
+
+    def removeAllConformLoadSchedules(self):
+        for obj in self._ConformLoadSchedules:
+            obj._ConformLoadGroup = None
+        self._ConformLoadSchedules = RefList()
 
@@ -48,8 +48,7 @@ class ConformLoadSchedule(SeasonDayTypeSchedule):
 
     def setConformLoadGroup(self, value):
         if self._ConformLoadGroup is not None:
-            filtered = [x for x in self.ConformLoadGroup.ConformLoadSchedules if x != self]
-            self._ConformLoadGroup._ConformLoadSchedules = filtered
+            self._ConformLoadGroup._ConformLoadSchedules.discard(self)
 
         self._ConformLoadGroup = value
         if self._ConformLoadGroup is not None:
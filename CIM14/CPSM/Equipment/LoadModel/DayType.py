@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DayType(IdentifiedObject):
     """Group of similar days, e.g., Mon/Tue/Wed, Thu/Fri, Sat/Sun, Holiday1, Holiday2-  The name attribute indicates the days of the week that a given DayType represents. -  If the name attribute is “All”, it represents all seven days of the week. -  If the name attribute is “Weekday”, it represents Monday through Friday. -  If the name attribute is “Weekend”, it represents Saturday and Sunday. 
@@ -29,7 +30,7 @@ class DayType(IdentifiedObject):
 
         @param SeasonDayTypeSchedules: Schedules that use this DayType.
         """
-        self._SeasonDayTypeSchedules = []
+        self._SeasonDayTypeSchedules = RefList()
         self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
 
         super(DayType, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class DayType(IdentifiedObject):
 
     def setSeasonDayTypeSchedules(self, value):
         for x in self._SeasonDayTypeSchedules:
-            x.DayType = None
-        for y in value:
-            y._DayType = self
-        self._SeasonDayTypeSchedules = value
+            x._DayType = None
+        self._SeasonDayTypeSchedules = RefList()
+        self.addSeasonDayTypeSchedules(value)
 
     SeasonDayTypeSchedules = property(getSeasonDayTypeSchedules, setSeasonDayTypeSchedules)
 
     def addSeasonDayTypeSchedules(self, *SeasonDayTypeSchedules):
-        for obj in SeasonDayTypeSchedules:
-            obj.DayType = self
+        collection = self._SeasonDayTypeSchedules
+        for obj in members(SeasonDayTypeSchedules):
+            old = obj._DayType
+            if old is not None and old is not self:
+                old._SeasonDayTypeSchedules.discard(obj)
+            obj._DayType = self
+            collection.append(obj)
 
     def removeSeasonDayTypeSchedules(self, *SeasonDayTypeSchedules):
-        for obj in SeasonDayTypeSchedules:
-            obj.DayType = None
+        collection = self._SeasonDayTypeSchedules
+        for obj in members(SeasonDayTypeSchedules):
+            if obj._DayType is self:
+                obj._DayType = None
+                collection.discard(obj)
+
+    def removeAllSeasonDayTypeSchedules(self):
+        for obj in self._SeasonDayTypeSchedules:
+            obj._DayType = None
+        self._SeasonDayTypeSchedules = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class LoadResponseCharacteristic(IdentifiedObject):
     """Models the characteristic response of the load demand due to to changes in system conditions such as voltage and frequency. This is not related to demand response.  If LoadResponseCharacteristic.exponentModel is True, the voltage exponents are specified and used as to calculate:  Active power component = Pnominal * (Voltage/cim:BaseVoltage.nominalVoltage) ** cim:LoadResponseCharacteristic.pVoltageExponent  Reactive power component = Qnominal * (Voltage/cim:BaseVoltage.nominalVoltage)** cim:LoadResponseCharacteristic.qVoltageExponent  Where  * means 'multiply' and ** is 'raised to power of'.
@@ -73,7 +74,7 @@ class LoadResponseCharacteristic(IdentifiedObject):
         #: Portion of active power load modeled as constant impedance.  Used only if the useExponentModel is false.    This value is noralized against the sum of pZ, pI, and pP.
         self.pConstantImpedance = pConstantImpedance
 
-        self._EnergyConsumer = []
+        self._EnergyConsumer = RefList()
         self.EnergyConsumer = [] if EnergyConsumer is None else EnergyConsumer
 
         super(LoadResponseCharacteristic, self).__init__(*args, **kw_args)
@@ -92,18 +93,30 @@ class LoadResponseCharacteristic(IdentifiedObject):
 
     def setEnergyConsumer(self, value):
         for x in self._EnergyConsumer:
-            x.LoadResponse = None
-        for y in value:
-            y._LoadResponse = self
-        self._EnergyConsumer = value
+            x._LoadResponse = None
+        self._EnergyConsumer = RefList()
+        self.addEnergyConsumer(value)
 
     EnergyConsumer = property(getEnergyConsumer, setEnergyConsumer)
 
     def addEnergyConsumer(self, *EnergyConsumer):
-        for obj in EnergyConsumer:
-            obj.LoadResponse = self
+        collection = self._EnergyConsumer
+        for obj in members(EnergyConsumer):
+            old = obj._LoadResponse
+            if old is not None and old is not self:
+                old._EnergyConsumer.discard(obj)
+            obj._LoadResponse = self
+            collection.append(obj)
 
     def removeEnergyConsumer(self, *EnergyConsumer):
-        for obj in EnergyConsumer:
-            obj.LoadResponse = None
+        collection = self._EnergyConsumer
+        for obj in members(EnergyConsumer):
+            if obj._LoadResponse is self:
+                obj._LoadResponse = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumer(self):
+        for obj in self._EnergyConsumer:
+            obj._LoadResponse = None
+        self._EnergyConsumer = RefList()
 
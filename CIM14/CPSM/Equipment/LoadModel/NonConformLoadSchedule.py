@@ -48,8 +48,7 @@ class NonConformLoadSchedule(SeasonDayTypeSchedule):
 
     def setNonConformLoadGroup(self, value):
         if self._NonConformLoadGroup is not None:
-            filtered = [x for x in self.NonConformLoadGroup.NonConformLoadSchedules if x != self]
-            self._NonConformLoadGroup._NonConformLoadSchedules = filtered
+            self._NonConformLoadGroup._NonConformLoadSchedules.discard(self)
 
         self._NonConformLoadGroup = value
         if self._NonConformLoadGroup is not None:
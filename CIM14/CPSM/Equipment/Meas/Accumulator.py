@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class Accumulator(Measurement):
     """Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.-  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for MeasurementType.name are defined in Normative String Tables. 
@@ -29,7 +30,7 @@ class Accumulator(Measurement):
 
         @param AccumulatorValues: The values connected to this measurement.
         """
-        self._AccumulatorValues = []
+        self._AccumulatorValues = RefList()
         self.AccumulatorValues = [] if AccumulatorValues is None else AccumulatorValues
 
         super(Accumulator, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class Accumulator(Measurement):
 
     def setAccumulatorValues(self, value):
         for x in self._AccumulatorValues:
-            x.Accumulator = None
-        for y in value:
-            y._Accumulator = self
-        self._AccumulatorValues = value
+            x._Accumulator = None
+        self._AccumulatorValues = RefList()
+        self.addAccumulatorValues(value)
 
     AccumulatorValues = property(getAccumulatorValues, setAccumulatorValues)
 
     def addAccumulatorValues(self, *AccumulatorValues):
-        for obj in AccumulatorValues:
-            obj.Accumulator = self
+        collection = self._AccumulatorValues
+        for obj in members(AccumulatorValues):
+            old = obj._Accumulator
+            if old is not None and old is not self:
+                old._AccumulatorValues.discard(obj)
+            obj._Accumulator = self
+            collection.append(obj)
 
     def removeAccumulatorValues(self, *AccumulatorValues):
-        for obj in AccumulatorValues:
-            obj.Accumulator = None
+        collection = self._AccumulatorValues
+        for obj in members(AccumulatorValues):
+            if obj._Accumulator is self:
+                obj._Accumulator = None
+                collection.discard(obj)
+
+    def removeAllAccumulatorValues(self):
+        for obj in self._AccumulatorValues:
+            obj._Accumulator = None
+        self._AccumulatorValues = RefList()
 
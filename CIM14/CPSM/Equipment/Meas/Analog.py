@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class Analog(Measurement):
     """Analog represents an analog Measurement.-  The positiveFlowIn attribute is only required if the Measurement measures a directional flow of power. -  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for MeasurementType.name are defined in Normative String Tables. 
@@ -33,7 +34,7 @@ class Analog(Measurement):
         #: If true then this measurement is an active power, reactive power or current with the convention that a positive value measured at the Terminal means power is flowing into the related PowerSystemResource.
         self.positiveFlowIn = positiveFlowIn
 
-        self._AnalogValues = []
+        self._AnalogValues = RefList()
         self.AnalogValues = [] if AnalogValues is None else AnalogValues
 
         super(Analog, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class Analog(Measurement):
 
     def setAnalogValues(self, value):
         for x in self._AnalogValues:
-            x.Analog = None
-        for y in value:
-            y._Analog = self
-        self._AnalogValues = value
+            x._Analog = None
+        self._AnalogValues = RefList()
+        self.addAnalogValues(value)
 
     AnalogValues = property(getAnalogValues, setAnalogValues)
 
     def addAnalogValues(self, *AnalogValues):
-        for obj in AnalogValues:
-            obj.Analog = self
+        collection = self._AnalogValues
+        for obj in members(AnalogValues):
+            old = obj._Analog
+            if old is not None and old is not self:
+                old._AnalogValues.discard(obj)
+            obj._Analog = self
+            collection.append(obj)
 
     def removeAnalogValues(self, *AnalogValues):
-        for obj in AnalogValues:
-            obj.Analog = None
+        collection = self._AnalogValues
+        for obj in members(AnalogValues):
+            if obj._Analog is self:
+                obj._Analog = None
+                collection.discard(obj)
+
+    def removeAllAnalogValues(self):
+        for obj in self._AnalogValues:
+            obj._Analog = None
+        self._AnalogValues = RefList()
 
@@ -48,8 +48,7 @@ class AnalogValue(MeasurementValue):
 
     def setAnalog(self, value):
         if self._Analog is not None:
-            filtered = [x for x in self.Analog.AnalogValues if x != self]
-            self._Analog._AnalogValues = filtered
+            self._Analog._AnalogValues.discard(self)
 
         self._Analog = value
         if self._Analog is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class Discrete(Measurement):
     """Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.-  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for the MeasurementType name are defined in Normative String Tables. 
@@ -29,7 +30,7 @@ class Discrete(Measurement):
 
         @param DiscreteValues: The values connected to this measurement.
         """
-        self._DiscreteValues = []
+        self._DiscreteValues = RefList()
         self.DiscreteValues = [] if DiscreteValues is None else DiscreteValues
 
         super(Discrete, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class Discrete(Measurement):
 
     def setDiscreteValues(self, value):
         for x in self._DiscreteValues:
-            x.Discrete = None
-        for y in value:
-            y._Discrete = self
-        self._DiscreteValues = value
+            x._Discrete = None
+        self._DiscreteValues = RefList()
+        self.addDiscreteValues(value)
 
     DiscreteValues = property(getDiscreteValues, setDiscreteValues)
 
     def addDiscreteValues(self, *DiscreteValues):
-        for obj in DiscreteValues:
-            obj.Discrete = self
+        collection = self._DiscreteValues
+        for obj in members(DiscreteValues):
+            old = obj._Discrete
+            if old is not None and old is not self:
+                old._DiscreteValues.discard(obj)
+            obj._Discrete = self
+            collection.append(obj)
 
     def removeDiscreteValues(self, *DiscreteValues):
-        for obj in DiscreteValues:
-            obj.Discrete = None
+        collection = self._DiscreteValues
+        for obj in members(DiscreteValues):
+            if obj._Discrete is self:
+                obj._Discrete = None
+                collection.discard(obj)
+
+    def removeAllDiscreteValues(self):
+        for obj in self._DiscreteValues:
+            obj._Discrete = None
+        self._DiscreteValues = RefList()
 
@@ -52,8 +52,7 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         if self._OperationalLimitSet is not None:
-            filtered = [x for x in self.OperationalLimitSet.OperationalLimitValue if x != self]
-            self._OperationalLimitSet._OperationalLimitValue = filtered
+            self._OperationalLimitSet._OperationalLimitValue.discard(self)
 
         self._OperationalLimitSet = value
         if self._OperationalLimitSet is not None:
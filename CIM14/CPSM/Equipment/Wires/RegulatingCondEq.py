@@ -48,8 +48,7 @@ class RegulatingCondEq(ConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
@@ -48,8 +48,7 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulationSchedule if x != self]
-            self._RegulatingControl._RegulationSchedule = filtered
+            self._RegulatingControl._RegulationSchedule.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.-  [R6.2] and [R6.3] are satisfied by navigation to ConnectivityNode and Substation -  [R6.4] is satisfied by the class name. 
@@ -33,7 +34,7 @@ class Switch(ConductingEquipment):
         #: The attribute is used in cases when no Measurement for the status value is present. If the Switch has a status measurment the Discrete.normalValue is expected to match with the Switch.normalOpen.
         self.normalOpen = normalOpen
 
-        self._SwitchSchedules = []
+        self._SwitchSchedules = RefList()
         self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
 
         super(Switch, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class Switch(ConductingEquipment):
 
     def setSwitchSchedules(self, value):
         for x in self._SwitchSchedules:
-            x.Switch = None
-        for y in value:
-            y._Switch = self
-        self._SwitchSchedules = value
+            x._Switch = None
+        self._SwitchSchedules = RefList()
+        self.addSwitchSchedules(value)
 
     SwitchSchedules = property(getSwitchSchedules, setSwitchSchedules)
 
     def addSwitchSchedules(self, *SwitchSchedules):
-        for obj in SwitchSchedules:
-            obj.Switch = self
+        collection = self._SwitchSchedules
+        for obj in members(SwitchSchedules):
+            old = obj._Switch
+            if old is not None and old is not self:
+                old._SwitchSchedules.discard(obj)
+            obj._Switch = self
+            collection.append(obj)
 
     def removeSwitchSchedules(self, *SwitchSchedules):
-        for obj in SwitchSchedules:
-            obj.Switch = None
+        collection = self._SwitchSchedules
+        for obj in members(SwitchSchedules):
+            if obj._Switch is self:
+                obj._Switch = None
+                collection.discard(obj)
+
+    def removeAllSwitchSchedules(self):
+        for obj in self._SwitchSchedules:
+            obj._Switch = None
+        self._SwitchSchedules = RefList()
 
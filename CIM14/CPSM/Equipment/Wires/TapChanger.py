@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.
@@ -63,7 +64,7 @@ class TapChanger(PowerSystemResource):
         #: Highest possible tap step position, advance from neutral
         self.highStep = highStep
 
-        self._TapSchedules = []
+        self._TapSchedules = RefList()
         self.TapSchedules = [] if TapSchedules is None else TapSchedules
 
         self._ImpedanceVariationCurve = None
@@ -88,20 +89,32 @@ class TapChanger(PowerSystemResource):
 
     def setTapSchedules(self, value):
         for x in self._TapSchedules:
-            x.TapChanger = None
-        for y in value:
-            y._TapChanger = self
-        self._TapSchedules = value
+            x._TapChanger = None
+        self._TapSchedules = RefList()
+        self.addTapSchedules(value)
 
     TapSchedules = property(getTapSchedules, setTapSchedules)
 
     def addTapSchedules(self, *TapSchedules):
-        for obj in TapSchedules:
-            obj.TapChanger = self
+        collection = self._TapSchedules
+        for obj in members(TapSchedules):
+            old = obj._TapChanger
+            if old is not None and old is not self:
+                old._TapSchedules.discard(obj)
+            obj._TapChanger = self
+            collection.append(obj)
 
     def removeTapSchedules(self, *TapSchedules):
-        for obj in TapSchedules:
-            obj.TapChanger = None
+        collection = self._TapSchedules
+        for obj in members(TapSchedules):
+            if obj._TapChanger is self:
+                obj._TapChanger = None
+                collection.discard(obj)
+
+    def removeAllTapSchedules(self):
+        for obj in self._TapSchedules:
+            obj._TapChanger = None
+        self._TapSchedules = RefList()
 
     def getImpedanceVariationCurve(self):
         """A TapChanger can have an associated ImpedanceVariationCurve to define impedance variations with tap step changes.
@@ -125,8 +138,7 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.StateVariables.Element import Element
+from PyCIM.RefList import RefList, members
 
 class TopologicalIsland(Element):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes (i.e. switch or Terminal.connected status changes).
@@ -33,7 +34,7 @@ class TopologicalIsland(Element):
         self._AngleRef_TopologicalNode = None
         self.AngleRef_TopologicalNode = AngleRef_TopologicalNode
 
-        self._TopologicalNodes = []
+        self._TopologicalNodes = RefList()
         self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
 
         super(TopologicalIsland, self).__init__(*args, **kw_args)
@@ -68,18 +69,30 @@ class TopologicalIsland(Element):
 
     def setTopologicalNodes(self, value):
         for x in self._TopologicalNodes:
-            x.TopologicalIsland = None
-        for y in value:
-            y._TopologicalIsland = self
-        self._TopologicalNodes = value
+            x._TopologicalIsland = None
+        self._TopologicalNodes = RefList()
+        self.addTopologicalNodes(value)
 
     TopologicalNodes = property(getTopologicalNodes, setTopologicalNodes)
 
     def addTopologicalNodes(self, *TopologicalNodes):
-        for obj in TopologicalNodes:
-            obj.TopologicalIsland = self
+        collection = self._TopologicalNodes
+        for obj in members(TopologicalNodes):
+            old = obj._TopologicalIsland
+            if old is not None and old is not self:
+                old._TopologicalNodes.discard(obj)
+            obj._TopologicalIsland = self
+            collection.append(obj)
 
     def removeTopologicalNodes(self, *TopologicalNodes):
-        for obj in TopologicalNodes:
-            obj.TopologicalIsland = None
+        collection = self._TopologicalNodes
+        for obj in members(TopologicalNodes):
+            if obj._TopologicalIsland is self:
+                obj._TopologicalIsland = None
+                collection.discard(obj)
+
+    def removeAllTopologicalNodes(self):
+        for obj in self._TopologicalNodes:
+            obj._TopologicalIsland = None
+        self._TopologicalNodes = RefList()
 
@@ -64,8 +64,7 @@ class TopologicalNode(Element):
 
     def setTopologicalIsland(self, value):
         if self._TopologicalIsland is not None:
-            filtered = [x for x in self.TopologicalIsland.TopologicalNodes if x != self]
-            self._TopologicalIsland._TopologicalNodes = filtered
+            self._TopologicalIsland._TopologicalNodes.discard(self)
 
         self._TopologicalIsland = value
         if self._TopologicalIsland is not None:
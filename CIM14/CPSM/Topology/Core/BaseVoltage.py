@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Topology.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BaseVoltage(IdentifiedObject):
     """Defines a nominal base voltage which is referenced in the system.
@@ -29,7 +30,7 @@ class BaseVoltage(IdentifiedObject):
 
         @param TopologicalNode: The topological nodes at the base voltage.
         """
-        self._TopologicalNode = []
+        self._TopologicalNode = RefList()
         self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
 
         super(BaseVoltage, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class BaseVoltage(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         for x in self._TopologicalNode:
-            x.BaseVoltage = None
-        for y in value:
-            y._BaseVoltage = self
-        self._TopologicalNode = value
+            x._BaseVoltage = None
+        self._TopologicalNode = RefList()
+        self.addTopologicalNode(value)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
     def addTopologicalNode(self, *TopologicalNode):
-        for obj in TopologicalNode:
-            obj.BaseVoltage = self
+        collection = self._TopologicalNode
+        for obj in members(TopologicalNode):
+            old = obj._BaseVoltage
+            if old is not None and old is not self:
+                old._TopologicalNode.discard(obj)
+            obj._BaseVoltage = self
+            collection.append(obj)
 
     def removeTopologicalNode(self, *TopologicalNode):
-        for obj in TopologicalNode:
-            obj.BaseVoltage = None
+        collection = self._TopologicalNode
+        for obj in members(TopologicalNode):
+            if obj._BaseVoltage is self:
+                obj._BaseVoltage = None
+                collection.discard(obj)
+
+    def removeAllTopologicalNode(self):
+        for obj in self._TopologicalNode:
+            obj._BaseVoltage = None
+        self._TopologicalNode = RefList()
 
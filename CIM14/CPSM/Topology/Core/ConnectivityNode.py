@@ -48,8 +48,7 @@ class ConnectivityNode(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.ConnectivityNodes if x != self]
-            self._TopologicalNode._ConnectivityNodes = filtered
+            self._TopologicalNode._ConnectivityNodes.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
@@ -52,8 +52,7 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Topology.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -31,13 +32,13 @@ class TopologicalNode(IdentifiedObject):
         @param BaseVoltage: The base voltage of the topologocial node.
         @param Terminal: The terminals associated with the topological node.   This can be used as an alternative to the connectivity node path to terminal, thus making it unneccesary to model connedtivity nodes in some cases.   Note that the if connectivity nodes are in the model, this association would proably not be used.
         """
-        self._ConnectivityNodes = []
+        self._ConnectivityNodes = RefList()
         self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Terminal = []
+        self._Terminal = RefList()
         self.Terminal = [] if Terminal is None else Terminal
 
         super(TopologicalNode, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodes(self, value):
         for x in self._ConnectivityNodes:
-            x.TopologicalNode = None
-        for y in value:
-            y._TopologicalNode = self
-        self._ConnectivityNodes = value
+            x._TopologicalNode = None
+        self._ConnectivityNodes = RefList()
+        self.addConnectivityNodes(value)
 
     ConnectivityNodes = property(getConnectivityNodes, setConnectivityNodes)
 
     def addConnectivityNodes(self, *ConnectivityNodes):
-        for obj in ConnectivityNodes:
-            obj.TopologicalNode = self
+        collection = self._ConnectivityNodes
+        for obj in members(ConnectivityNodes):
+            old = obj._TopologicalNode
+            if old is not None and old is not self:
+                old._ConnectivityNodes.discard(obj)
+            obj._TopologicalNode = self
+            collection.append(obj)
 
     def removeConnectivityNodes(self, *ConnectivityNodes):
-        for obj in ConnectivityNodes:
-            obj.TopologicalNode = None
+        collection = self._ConnectivityNodes
+        for obj in members(ConnectivityNodes):
+            if obj._TopologicalNode is self:
+                obj._TopologicalNode = None
+                collection.discard(obj)
+
+    def removeAllConnectivityNodes(self):
+        for obj in self._ConnectivityNodes:
+            obj._TopologicalNode = None
+        self._ConnectivityNodes = RefList()
 
     def getBaseVoltage(self):
         """The base voltage of the topologocial node.
@@ -78,8 +91,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -95,18 +107,30 @@ class TopologicalNode(IdentifiedObject):
 
     def setTerminal(self, value):
         for x in self._Terminal:
-            x.TopologicalNode = None
-        for y in value:
-            y._TopologicalNode = self
-        self._Terminal = value
+            x._TopologicalNode = None
+        self._Terminal = RefList()
+        self.addTerminal(value)
 
     Terminal = property(getTerminal, setTerminal)
 
     def addTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.TopologicalNode = self
+        collection = self._Terminal
+        for obj in members(Terminal):
+            old = obj._TopologicalNode
+            if old is not None and old is not self:
+                old._Terminal.discard(obj)
+            obj._TopologicalNode = self
+            collection.append(obj)
 
     def removeTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.TopologicalNode = None
+        collection = self._Terminal
+        for obj in members(Terminal):
+            if obj._TopologicalNode is self:
+                obj._TopologicalNode = None
+                collection.discard(obj)
+
+    def removeAllTerminal(self):
+        for obj in self._Terminal:
+            obj._TopologicalNode = None
+        self._Terminal = RefList()
 
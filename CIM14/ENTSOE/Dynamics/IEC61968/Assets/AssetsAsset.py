@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class AssetsAsset(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class AssetsAsset(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(AssetsAsset, self).__init__(*args, **kw_args)
@@ -46,24 +47,26 @@ class AssetsAsset(CoreIdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._PowerSystemResources = value
+            p._Assets.discard(self)
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._PowerSystemResources.remove(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Assets.discard(self)
+        self._PowerSystemResources = RefList()
 
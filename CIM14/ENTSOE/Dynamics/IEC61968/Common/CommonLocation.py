@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CommonLocation(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class CommonLocation(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(CommonLocation, self).__init__(*args, **kw_args)
@@ -46,18 +47,30 @@ class CommonLocation(CoreIdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PowerSystemResources = value
+            x._Location = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Location = None
+        self._PowerSystemResources = RefList()
 
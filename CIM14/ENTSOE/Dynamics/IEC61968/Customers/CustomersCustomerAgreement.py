@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CustomersCustomerAgreement(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
 
         @param Equipments: 
         """
-        self._Equipments = []
+        self._Equipments = RefList()
         self.Equipments = [] if Equipments is None else Equipments
 
         super(CustomersCustomerAgreement, self).__init__(*args, **kw_args)
@@ -46,24 +47,26 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
 
     def setEquipments(self, value):
         for p in self._Equipments:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._Equipments._CustomerAgreements = filtered
-        for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._Equipments = value
+            p._CustomerAgreements.discard(self)
+        self._Equipments = RefList()
+        self.addEquipments(value)
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
-        for obj in Equipments:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._Equipments.append(obj)
+        collection = self._Equipments
+        for obj in members(Equipments):
+            obj._CustomerAgreements.append(self)
+            collection.append(obj)
 
     def removeEquipments(self, *Equipments):
-        for obj in Equipments:
-            if self in obj._CustomerAgreements:
-                obj._CustomerAgreements.remove(self)
-            self._Equipments.remove(obj)
+        collection = self._Equipments
+        for obj in members(Equipments):
+            obj._CustomerAgreements.discard(self)
+            collection.discard(obj)
+
+    def removeAllEquipments(self):
+        for obj in self._Equipments:
+            obj._CustomerAgreements.discard(self)
+        self._Equipments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CoreBaseVoltage(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class CoreBaseVoltage(CoreIdentifiedObject):
 
         @param ConductingEquipment: 
         """
-        self._ConductingEquipment = []
+        self._ConductingEquipment = RefList()
         self.ConductingEquipment = [] if ConductingEquipment is None else ConductingEquipment
 
         super(CoreBaseVoltage, self).__init__(*args, **kw_args)
@@ -46,18 +47,30 @@ class CoreBaseVoltage(CoreIdentifiedObject):
 
     def setConductingEquipment(self, value):
         for x in self._ConductingEquipment:
-            x.BaseVoltage = None
-        for y in value:
-            y._BaseVoltage = self
-        self._ConductingEquipment = value
+            x._BaseVoltage = None
+        self._ConductingEquipment = RefList()
+        self.addConductingEquipment(value)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
     def addConductingEquipment(self, *ConductingEquipment):
-        for obj in ConductingEquipment:
-            obj.BaseVoltage = self
+        collection = self._ConductingEquipment
+        for obj in members(ConductingEquipment):
+            old = obj._BaseVoltage
+            if old is not None and old is not self:
+                old._ConductingEquipment.discard(obj)
+            obj._BaseVoltage = self
+            collection.append(obj)
 
     def removeConductingEquipment(self, *ConductingEquipment):
-        for obj in ConductingEquipment:
-            obj.BaseVoltage = None
+        collection = self._ConductingEquipment
+        for obj in members(ConductingEquipment):
+            if obj._BaseVoltage is self:
+                obj._BaseVoltage = None
+                collection.discard(obj)
+
+    def removeAllConductingEquipment(self):
+        for obj in self._ConductingEquipment:
+            obj._BaseVoltage = None
+        self._ConductingEquipment = RefList()
 
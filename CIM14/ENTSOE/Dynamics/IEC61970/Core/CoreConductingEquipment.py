@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
+from PyCIM.RefList import RefList, members
 
 class CoreConductingEquipment(CoreEquipment):
 
@@ -38,13 +39,13 @@ class CoreConductingEquipment(CoreEquipment):
         self._SvStatus = None
         self.SvStatus = SvStatus
 
-        self._ClearanceTags = []
+        self._ClearanceTags = RefList()
         self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
 
-        self._Terminals = []
+        self._Terminals = RefList()
         self.Terminals = [] if Terminals is None else Terminals
 
-        self._ProtectionEquipments = []
+        self._ProtectionEquipments = RefList()
         self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
 
         self._BaseVoltage = None
@@ -80,20 +81,32 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setClearanceTags(self, value):
         for x in self._ClearanceTags:
-            x.ConductingEquipment = None
-        for y in value:
-            y._ConductingEquipment = self
-        self._ClearanceTags = value
+            x._ConductingEquipment = None
+        self._ClearanceTags = RefList()
+        self.addClearanceTags(value)
 
     ClearanceTags = property(getClearanceTags, setClearanceTags)
 
     def addClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.ConductingEquipment = self
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            old = obj._ConductingEquipment
+            if old is not None and old is not self:
+                old._ClearanceTags.discard(obj)
+            obj._ConductingEquipment = self
+            collection.append(obj)
 
     def removeClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.ConductingEquipment = None
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            if obj._ConductingEquipment is self:
+                obj._ConductingEquipment = None
+                collection.discard(obj)
+
+    def removeAllClearanceTags(self):
+        for obj in self._ClearanceTags:
+            obj._ConductingEquipment = None
+        self._ClearanceTags = RefList()
 
     def getTerminals(self):
         
@@ -101,20 +114,32 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setTerminals(self, value):
         for x in self._Terminals:
-            x.ConductingEquipment = None
-        for y in value:
-            y._ConductingEquipment = self
-        self._Terminals = value
+            x._ConductingEquipment = None
+        self._Terminals = RefList()
+        self.addTerminals(value)
 
     Terminals = property(getTerminals, setTerminals)
 
     def addTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConductingEquipment = self
+        collection = self._Terminals
+        for obj in members(Terminals):
+            old = obj._ConductingEquipment
+            if old is not None and old is not self:
+                old._Terminals.discard(obj)
+            obj._ConductingEquipment = self
+            collection.append(obj)
 
     def removeTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConductingEquipment = None
+        collection = self._Terminals
+        for obj in members(Terminals):
+            if obj._ConductingEquipment is self:
+                obj._ConductingEquipment = None
+                collection.discard(obj)
+
+    def removeAllTerminals(self):
+        for obj in self._Terminals:
+            obj._ConductingEquipment = None
+        self._Terminals = RefList()
 
     def getProtectionEquipments(self):
         
@@ -122,26 +147,28 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
-        for r in value:
-            if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
-        self._ProtectionEquipments = value
+            p._ConductingEquipments.discard(self)
+        self._ProtectionEquipments = RefList()
+        self.addProtectionEquipments(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            obj._ConductingEquipments.append(self)
+            collection.append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            if self in obj._ConductingEquipments:
-                obj._ConductingEquipments.remove(self)
-            self._ProtectionEquipments.remove(obj)
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            obj._ConductingEquipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllProtectionEquipments(self):
+        for obj in self._ProtectionEquipments:
+            obj._ConductingEquipments.discard(self)
+        self._ProtectionEquipments = RefList()
 
     def getBaseVoltage(self):
         
@@ -149,8 +176,7 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -69,8 +69,7 @@ class CoreIdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
@@ -46,8 +46,7 @@ class CoreOperatingShare(Element):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.OperatingShare if x != self]
-            self._PowerSystemResource._OperatingShare = filtered
+            self._PowerSystemResource._OperatingShare.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CorePSRType(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class CorePSRType(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(CorePSRType, self).__init__(*args, **kw_args)
@@ -46,18 +47,30 @@ class CorePSRType(CoreIdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.PSRType = None
-        for y in value:
-            y._PSRType = self
-        self._PowerSystemResources = value
+            x._PSRType = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.PSRType = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._PSRType
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._PSRType = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.PSRType = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._PSRType is self:
+                obj._PSRType = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._PSRType = None
+        self._PowerSystemResources = RefList()
 
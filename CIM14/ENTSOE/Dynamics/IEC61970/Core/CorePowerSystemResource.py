@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CorePowerSystemResource(CoreIdentifiedObject):
 
@@ -35,28 +36,28 @@ class CorePowerSystemResource(CoreIdentifiedObject):
         @param Assets:
         @param PSRType:
         """
-        self._Block = []
+        self._Block = RefList()
         self.Block = [] if Block is None else Block
 
         self._Location = None
         self.Location = Location
 
-        self._ReportingGroup = []
+        self._ReportingGroup = RefList()
         self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
 
-        self._PsrLists = []
+        self._PsrLists = RefList()
         self.PsrLists = [] if PsrLists is None else PsrLists
 
-        self._OperatingShare = []
+        self._OperatingShare = RefList()
         self.OperatingShare = [] if OperatingShare is None else OperatingShare
 
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         self._PSRType = None
@@ -77,20 +78,32 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setBlock(self, value):
         for x in self._Block:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._Block = value
+            x._PowerSystemResource = None
+        self._Block = RefList()
+        self.addBlock(value)
 
     Block = property(getBlock, setBlock)
 
     def addBlock(self, *Block):
-        for obj in Block:
-            obj.PowerSystemResource = self
+        collection = self._Block
+        for obj in members(Block):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._Block.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeBlock(self, *Block):
-        for obj in Block:
-            obj.PowerSystemResource = None
+        collection = self._Block
+        for obj in members(Block):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllBlock(self):
+        for obj in self._Block:
+            obj._PowerSystemResource = None
+        self._Block = RefList()
 
     def getLocation(self):
         
@@ -98,8 +111,7 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -114,26 +126,28 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setReportingGroup(self, value):
         for p in self._ReportingGroup:
-            filtered = [q for q in p.PowerSystemResource if q != self]
-            self._ReportingGroup._PowerSystemResource = filtered
-        for r in value:
-            if self not in r._PowerSystemResource:
-                r._PowerSystemResource.append(self)
-        self._ReportingGroup = value
+            p._PowerSystemResource.discard(self)
+        self._ReportingGroup = RefList()
+        self.addReportingGroup(value)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
-        for obj in ReportingGroup:
-            if self not in obj._PowerSystemResource:
-                obj._PowerSystemResource.append(self)
-            self._ReportingGroup.append(obj)
+        collection = self._ReportingGroup
+        for obj in members(ReportingGroup):
+            obj._PowerSystemResource.append(self)
+            collection.append(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
-        for obj in ReportingGroup:
-            if self in obj._PowerSystemResource:
-                obj._PowerSystemResource.remove(self)
-            self._ReportingGroup.remove(obj)
+        collection = self._ReportingGroup
+        for obj in members(ReportingGroup):
+            obj._PowerSystemResource.discard(self)
+            collection.discard(obj)
+
+    def removeAllReportingGroup(self):
+        for obj in self._ReportingGroup:
+            obj._PowerSystemResource.discard(self)
+        self._ReportingGroup = RefList()
 
     def getPsrLists(self):
         
@@ -141,26 +155,28 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setPsrLists(self, value):
         for p in self._PsrLists:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._PsrLists._PowerSystemResources = filtered
-        for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._PsrLists = value
+            p._PowerSystemResources.discard(self)
+        self._PsrLists = RefList()
+        self.addPsrLists(value)
 
     PsrLists = property(getPsrLists, setPsrLists)
 
     def addPsrLists(self, *PsrLists):
-        for obj in PsrLists:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._PsrLists.append(obj)
+        collection = self._PsrLists
+        for obj in members(PsrLists):
+            obj._PowerSystemResources.append(self)
+            collection.append(obj)
 
     def removePsrLists(self, *PsrLists):
-        for obj in PsrLists:
-            if self in obj._PowerSystemResources:
-                obj._PowerSystemResources.remove(self)
-            self._PsrLists.remove(obj)
+        collection = self._PsrLists
+        for obj in members(PsrLists):
+            obj._PowerSystemResources.discard(self)
+            collection.discard(obj)
+
+    def removeAllPsrLists(self):
+        for obj in self._PsrLists:
+            obj._PowerSystemResources.discard(self)
+        self._PsrLists = RefList()
 
     def getOperatingShare(self):
         
@@ -168,20 +184,32 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setOperatingShare(self, value):
         for x in self._OperatingShare:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._OperatingShare = value
+            x._PowerSystemResource = None
+        self._OperatingShare = RefList()
+        self.addOperatingShare(value)
 
     OperatingShare = property(getOperatingShare, setOperatingShare)
 
     def addOperatingShare(self, *OperatingShare):
-        for obj in OperatingShare:
-            obj.PowerSystemResource = self
+        collection = self._OperatingShare
+        for obj in members(OperatingShare):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._OperatingShare.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeOperatingShare(self, *OperatingShare):
-        for obj in OperatingShare:
-            obj.PowerSystemResource = None
+        collection = self._OperatingShare
+        for obj in members(OperatingShare):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllOperatingShare(self):
+        for obj in self._OperatingShare:
+            obj._PowerSystemResource = None
+        self._OperatingShare = RefList()
 
     def getOutageSchedule(self):
         
@@ -204,20 +232,32 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._Measurements = value
+            x._PowerSystemResource = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.PowerSystemResource = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.PowerSystemResource = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._PowerSystemResource = None
+        self._Measurements = RefList()
 
     def getAssets(self):
         
@@ -225,26 +265,28 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._Assets._PowerSystemResources = filtered
-        for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._Assets = value
+            p._PowerSystemResources.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._PowerSystemResources.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._PowerSystemResources:
-                obj._PowerSystemResources.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._PowerSystemResources.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._PowerSystemResources.discard(self)
+        self._Assets = RefList()
 
     def getPSRType(self):
         
@@ -252,8 +294,7 @@ class CorePowerSystemResource(CoreIdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CorePsrList(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class CorePsrList(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(CorePsrList, self).__init__(*args, **kw_args)
@@ -46,24 +47,26 @@ class CorePsrList(CoreIdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.PsrLists if q != self]
-            self._PowerSystemResources._PsrLists = filtered
-        for r in value:
-            if self not in r._PsrLists:
-                r._PsrLists.append(self)
-        self._PowerSystemResources = value
+            p._PsrLists.discard(self)
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self not in obj._PsrLists:
-                obj._PsrLists.append(self)
-            self._PowerSystemResources.append(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._PsrLists.append(self)
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self in obj._PsrLists:
-                obj._PsrLists.remove(self)
-            self._PowerSystemResources.remove(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._PsrLists.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._PsrLists.discard(self)
+        self._PowerSystemResources = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CoreReportingGroup(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class CoreReportingGroup(CoreIdentifiedObject):
 
         @param PowerSystemResource: 
         """
-        self._PowerSystemResource = []
+        self._PowerSystemResource = RefList()
         self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
 
         super(CoreReportingGroup, self).__init__(*args, **kw_args)
@@ -46,24 +47,26 @@ class CoreReportingGroup(CoreIdentifiedObject):
 
     def setPowerSystemResource(self, value):
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
-        for r in value:
-            if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
-        self._PowerSystemResource = value
+            p._ReportingGroup.discard(self)
+        self._PowerSystemResource = RefList()
+        self.addPowerSystemResource(value)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
-        for obj in PowerSystemResource:
-            if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+        collection = self._PowerSystemResource
+        for obj in members(PowerSystemResource):
+            obj._ReportingGroup.append(self)
+            collection.append(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
-        for obj in PowerSystemResource:
-            if self in obj._ReportingGroup:
-                obj._ReportingGroup.remove(self)
-            self._PowerSystemResource.remove(obj)
+        collection = self._PowerSystemResource
+        for obj in members(PowerSystemResource):
+            obj._ReportingGroup.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResource(self):
+        for obj in self._PowerSystemResource:
+            obj._ReportingGroup.discard(self)
+        self._PowerSystemResource = RefList()
 
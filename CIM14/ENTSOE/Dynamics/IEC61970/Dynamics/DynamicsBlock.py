@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class DynamicsBlock(CorePowerSystemResource):
 
@@ -39,13 +40,13 @@ class DynamicsBlock(CorePowerSystemResource):
 
         self.positiveFlowIn = positiveFlowIn
 
-        self._BlockParameter = []
+        self._BlockParameter = RefList()
         self.BlockParameter = [] if BlockParameter is None else BlockParameter
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
 
-        self._BlockConnection = []
+        self._BlockConnection = RefList()
         self.BlockConnection = [] if BlockConnection is None else BlockConnection
 
         self._MemberOf_BlockConnectivity = None
@@ -70,20 +71,32 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setBlockParameter(self, value):
         for x in self._BlockParameter:
-            x.MemberOf_Block = None
-        for y in value:
-            y._MemberOf_Block = self
-        self._BlockParameter = value
+            x._MemberOf_Block = None
+        self._BlockParameter = RefList()
+        self.addBlockParameter(value)
 
     BlockParameter = property(getBlockParameter, setBlockParameter)
 
     def addBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_Block = self
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            old = obj._MemberOf_Block
+            if old is not None and old is not self:
+                old._BlockParameter.discard(obj)
+            obj._MemberOf_Block = self
+            collection.append(obj)
 
     def removeBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_Block = None
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            if obj._MemberOf_Block is self:
+                obj._MemberOf_Block = None
+                collection.discard(obj)
+
+    def removeAllBlockParameter(self):
+        for obj in self._BlockParameter:
+            obj._MemberOf_Block = None
+        self._BlockParameter = RefList()
 
     def getPowerSystemResource(self):
         
@@ -91,8 +104,7 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Block if x != self]
-            self._PowerSystemResource._Block = filtered
+            self._PowerSystemResource._Block.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -108,20 +120,32 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setBlockConnection(self, value):
         for x in self._BlockConnection:
-            x.Block = None
-        for y in value:
-            y._Block = self
-        self._BlockConnection = value
+            x._Block = None
+        self._BlockConnection = RefList()
+        self.addBlockConnection(value)
 
     BlockConnection = property(getBlockConnection, setBlockConnection)
 
     def addBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.Block = self
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            old = obj._Block
+            if old is not None and old is not self:
+                old._BlockConnection.discard(obj)
+            obj._Block = self
+            collection.append(obj)
 
     def removeBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.Block = None
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            if obj._Block is self:
+                obj._Block = None
+                collection.discard(obj)
+
+    def removeAllBlockConnection(self):
+        for obj in self._BlockConnection:
+            obj._Block = None
+        self._BlockConnection = RefList()
 
     def getMemberOf_BlockConnectivity(self):
         
@@ -129,8 +153,7 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.Block if x != self]
-            self._MemberOf_BlockConnectivity._Block = filtered
+            self._MemberOf_BlockConnectivity._Block.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
@@ -145,8 +168,7 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setMetaBlock(self, value):
         if self._MetaBlock is not None:
-            filtered = [x for x in self.MetaBlock.Block if x != self]
-            self._MetaBlock._Block = filtered
+            self._MetaBlock._Block.discard(self)
 
         self._MetaBlock = value
         if self._MetaBlock is not None:
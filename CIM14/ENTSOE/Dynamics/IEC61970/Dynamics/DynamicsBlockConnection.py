@@ -53,8 +53,7 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.BlockConnection if x != self]
-            self._MemberOf_BlockConnectivity._BlockConnection = filtered
+            self._MemberOf_BlockConnectivity._BlockConnection.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
@@ -69,8 +68,7 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         if self._MetaBlockConnection is not None:
-            filtered = [x for x in self.MetaBlockConnection.BlockConnection if x != self]
-            self._MetaBlockConnection._BlockConnection = filtered
+            self._MetaBlockConnection._BlockConnection.discard(self)
 
         self._MetaBlockConnection = value
         if self._MetaBlockConnection is not None:
@@ -85,8 +83,7 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
 
     def setBlock(self, value):
         if self._Block is not None:
-            filtered = [x for x in self.Block.BlockConnection if x != self]
-            self._Block._BlockConnection = filtered
+            self._Block._BlockConnection.discard(self)
 
         self._Block = value
         if self._Block is not None:
@@ -57,8 +57,7 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         if self._MetaBlockParameter is not None:
-            filtered = [x for x in self.MetaBlockParameter.BlockParameter if x != self]
-            self._MetaBlockParameter._BlockParameter = filtered
+            self._MetaBlockParameter._BlockParameter.discard(self)
 
         self._MetaBlockParameter = value
         if self._MetaBlockParameter is not None:
@@ -73,8 +72,7 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.BlockParameter if x != self]
-            self._MemberOf_MetaBlockReference._BlockParameter = filtered
+            self._MemberOf_MetaBlockReference._BlockParameter.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
@@ -89,8 +87,7 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMemberOf_Block(self, value):
         if self._MemberOf_Block is not None:
-            filtered = [x for x in self.MemberOf_Block.BlockParameter if x != self]
-            self._MemberOf_Block._BlockParameter = filtered
+            self._MemberOf_Block._BlockParameter.discard(self)
 
         self._MemberOf_Block = value
         if self._MemberOf_Block is not None:
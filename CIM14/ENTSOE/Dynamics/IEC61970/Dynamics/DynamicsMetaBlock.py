@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlock(CoreIdentifiedObject):
 
@@ -41,25 +42,25 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
         self.proprietary = proprietary
 
-        self._Block = []
+        self._Block = RefList()
         self.Block = [] if Block is None else Block
 
-        self._MetaBlockSignal = []
+        self._MetaBlockSignal = RefList()
         self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
 
-        self._MetaBlockReference = []
+        self._MetaBlockReference = RefList()
         self.MetaBlockReference = [] if MetaBlockReference is None else MetaBlockReference
 
-        self._MetaBlockParameter = []
+        self._MetaBlockParameter = RefList()
         self.MetaBlockParameter = [] if MetaBlockParameter is None else MetaBlockParameter
 
-        self._MetaBlockOutput = []
+        self._MetaBlockOutput = RefList()
         self.MetaBlockOutput = [] if MetaBlockOutput is None else MetaBlockOutput
 
-        self._MetaBlockInput = []
+        self._MetaBlockInput = RefList()
         self.MetaBlockInput = [] if MetaBlockInput is None else MetaBlockInput
 
-        self._MetaBlockState = []
+        self._MetaBlockState = RefList()
         self.MetaBlockState = [] if MetaBlockState is None else MetaBlockState
 
         super(DynamicsMetaBlock, self).__init__(*args, **kw_args)
@@ -78,20 +79,32 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setBlock(self, value):
         for x in self._Block:
-            x.MetaBlock = None
-        for y in value:
-            y._MetaBlock = self
-        self._Block = value
+            x._MetaBlock = None
+        self._Block = RefList()
+        self.addBlock(value)
 
     Block = property(getBlock, setBlock)
 
     def addBlock(self, *Block):
-        for obj in Block:
-            obj.MetaBlock = self
+        collection = self._Block
+        for obj in members(Block):
+            old = obj._MetaBlock
+            if old is not None and old is not self:
+                old._Block.discard(obj)
+            obj._MetaBlock = self
+            collection.append(obj)
 
     def removeBlock(self, *Block):
-        for obj in Block:
-            obj.MetaBlock = None
+        collection = self._Block
+        for obj in members(Block):
+            if obj._MetaBlock is self:
+                obj._MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllBlock(self):
+        for obj in self._Block:
+            obj._MetaBlock = None
+        self._Block = RefList()
 
     def getMetaBlockSignal(self):
         """
@@ -100,20 +113,32 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setMetaBlockSignal(self, value):
         for x in self._MetaBlockSignal:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockSignal = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockSignal = RefList()
+        self.addMetaBlockSignal(value)
 
     MetaBlockSignal = property(getMetaBlockSignal, setMetaBlockSignal)
 
     def addMetaBlockSignal(self, *MetaBlockSignal):
-        for obj in MetaBlockSignal:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockSignal
+        for obj in members(MetaBlockSignal):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockSignal.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockSignal(self, *MetaBlockSignal):
-        for obj in MetaBlockSignal:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockSignal
+        for obj in members(MetaBlockSignal):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockSignal(self):
+        for obj in self._MetaBlockSignal:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockSignal = RefList()
 
     def getMetaBlockReference(self):
         """
@@ -122,20 +147,32 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setMetaBlockReference(self, value):
         for x in self._MetaBlockReference:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockReference = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockReference = RefList()
+        self.addMetaBlockReference(value)
 
     MetaBlockReference = property(getMetaBlockReference, setMetaBlockReference)
 
     def addMetaBlockReference(self, *MetaBlockReference):
-        for obj in MetaBlockReference:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockReference
+        for obj in members(MetaBlockReference):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockReference.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockReference(self, *MetaBlockReference):
-        for obj in MetaBlockReference:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockReference
+        for obj in members(MetaBlockReference):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockReference(self):
+        for obj in self._MetaBlockReference:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockReference = RefList()
 
     def getMetaBlockParameter(self):
         """
@@ -144,20 +181,32 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         for x in self._MetaBlockParameter:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockParameter = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockParameter = RefList()
+        self.addMetaBlockParameter(value)
 
     MetaBlockParameter = property(getMetaBlockParameter, setMetaBlockParameter)
 
     def addMetaBlockParameter(self, *MetaBlockParameter):
-        for obj in MetaBlockParameter:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockParameter
+        for obj in members(MetaBlockParameter):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockParameter.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockParameter(self, *MetaBlockParameter):
-        for obj in MetaBlockParameter:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockParameter
+        for obj in members(MetaBlockParameter):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockParameter(self):
+        for obj in self._MetaBlockParameter:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockParameter = RefList()
 
     def getMetaBlockOutput(self):
         """
@@ -166,20 +215,32 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setMetaBlockOutput(self, value):
         for x in self._MetaBlockOutput:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockOutput = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockOutput = RefList()
+        self.addMetaBlockOutput(value)
 
     MetaBlockOutput = property(getMetaBlockOutput, setMetaBlockOutput)
 
     def addMetaBlockOutput(self, *MetaBlockOutput):
-        for obj in MetaBlockOutput:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockOutput
+        for obj in members(MetaBlockOutput):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockOutput.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockOutput(self, *MetaBlockOutput):
-        for obj in MetaBlockOutput:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockOutput
+        for obj in members(MetaBlockOutput):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockOutput(self):
+        for obj in self._MetaBlockOutput:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockOutput = RefList()
 
     def getMetaBlockInput(self):
         """
@@ -188,20 +249,32 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setMetaBlockInput(self, value):
         for x in self._MetaBlockInput:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockInput = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockInput = RefList()
+        self.addMetaBlockInput(value)
 
     MetaBlockInput = property(getMetaBlockInput, setMetaBlockInput)
 
     def addMetaBlockInput(self, *MetaBlockInput):
-        for obj in MetaBlockInput:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockInput
+        for obj in members(MetaBlockInput):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockInput.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockInput(self, *MetaBlockInput):
-        for obj in MetaBlockInput:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockInput
+        for obj in members(MetaBlockInput):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockInput(self):
+        for obj in self._MetaBlockInput:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockInput = RefList()
 
     def getMetaBlockState(self):
         """
@@ -210,18 +283,30 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
     def setMetaBlockState(self, value):
         for x in self._MetaBlockState:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockState = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockState = RefList()
+        self.addMetaBlockState(value)
 
     MetaBlockState = property(getMetaBlockState, setMetaBlockState)
 
     def addMetaBlockState(self, *MetaBlockState):
-        for obj in MetaBlockState:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockState
+        for obj in members(MetaBlockState):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockState.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockState(self, *MetaBlockState):
-        for obj in MetaBlockState:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockState
+        for obj in members(MetaBlockState):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockState(self):
+        for obj in self._MetaBlockState:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockState = RefList()
 
@@ -65,8 +65,7 @@ class DynamicsMetaBlockConInput(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConInput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConInput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConInput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
 
@@ -31,7 +32,7 @@ class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
         self._MemberOf_MetaBlockConnection = None
         self.MemberOf_MetaBlockConnection = MemberOf_MetaBlockConnection
 
-        self._MetaBlockConSignal = []
+        self._MetaBlockConSignal = RefList()
         self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
 
         super(DynamicsMetaBlockConOutput, self).__init__(*args, **kw_args)
@@ -49,8 +50,7 @@ class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConOutput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConOutput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConOutput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
@@ -66,18 +66,30 @@ class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
 
     def setMetaBlockConSignal(self, value):
         for x in self._MetaBlockConSignal:
-            x.MetaBlockConOutput = None
-        for y in value:
-            y._MetaBlockConOutput = self
-        self._MetaBlockConSignal = value
+            x._MetaBlockConOutput = None
+        self._MetaBlockConSignal = RefList()
+        self.addMetaBlockConSignal(value)
 
     MetaBlockConSignal = property(getMetaBlockConSignal, setMetaBlockConSignal)
 
     def addMetaBlockConSignal(self, *MetaBlockConSignal):
-        for obj in MetaBlockConSignal:
-            obj.MetaBlockConOutput = self
+        collection = self._MetaBlockConSignal
+        for obj in members(MetaBlockConSignal):
+            old = obj._MetaBlockConOutput
+            if old is not None and old is not self:
+                old._MetaBlockConSignal.discard(obj)
+            obj._MetaBlockConOutput = self
+            collection.append(obj)
 
     def removeMetaBlockConSignal(self, *MetaBlockConSignal):
-        for obj in MetaBlockConSignal:
-            obj.MetaBlockConOutput = None
+        collection = self._MetaBlockConSignal
+        for obj in members(MetaBlockConSignal):
+            if obj._MetaBlockConOutput is self:
+                obj._MetaBlockConOutput = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConSignal(self):
+        for obj in self._MetaBlockConSignal:
+            obj._MetaBlockConOutput = None
+        self._MetaBlockConSignal = RefList()
 
@@ -64,8 +64,7 @@ class DynamicsMetaBlockConSignal(CoreIdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         if self._MetaBlockConOutput is not None:
-            filtered = [x for x in self.MetaBlockConOutput.MetaBlockConSignal if x != self]
-            self._MetaBlockConOutput._MetaBlockConSignal = filtered
+            self._MetaBlockConOutput._MetaBlockConSignal.discard(self)
 
         self._MetaBlockConOutput = value
         if self._MetaBlockConOutput is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
@@ -34,28 +35,28 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         @param StandardControlBlock_MetaBlockOutputReference: 
         @param MetaBlockOutputReference: 
         """
-        self._MetaBlockParameterReference = []
+        self._MetaBlockParameterReference = RefList()
         self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockInputReference = []
+        self._StandardControlBlock_MetaBlockInputReference = RefList()
         self.StandardControlBlock_MetaBlockInputReference = [] if StandardControlBlock_MetaBlockInputReference is None else StandardControlBlock_MetaBlockInputReference
 
-        self._MetaBlockStateReference = []
+        self._MetaBlockStateReference = RefList()
         self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
 
-        self._StandardControlBlock_MetaBlockStateReference = []
+        self._StandardControlBlock_MetaBlockStateReference = RefList()
         self.StandardControlBlock_MetaBlockStateReference = [] if StandardControlBlock_MetaBlockStateReference is None else StandardControlBlock_MetaBlockStateReference
 
-        self._MetaBlockInputReference = []
+        self._MetaBlockInputReference = RefList()
         self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
 
-        self._StandardControlBlock_MetaBlockParameterReference = []
+        self._StandardControlBlock_MetaBlockParameterReference = RefList()
         self.StandardControlBlock_MetaBlockParameterReference = [] if StandardControlBlock_MetaBlockParameterReference is None else StandardControlBlock_MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockOutputReference = []
+        self._StandardControlBlock_MetaBlockOutputReference = RefList()
         self.StandardControlBlock_MetaBlockOutputReference = [] if StandardControlBlock_MetaBlockOutputReference is None else StandardControlBlock_MetaBlockOutputReference
 
-        self._MetaBlockOutputReference = []
+        self._MetaBlockOutputReference = RefList()
         self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
 
         super(DynamicsMetaBlockConnectable, self).__init__(*args, **kw_args)
@@ -74,20 +75,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setMetaBlockParameterReference(self, value):
         for x in self._MetaBlockParameterReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockParameterReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockParameterReference = RefList()
+        self.addMetaBlockParameterReference(value)
 
     MetaBlockParameterReference = property(getMetaBlockParameterReference, setMetaBlockParameterReference)
 
     def addMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockParameterReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockParameterReference(self):
+        for obj in self._MetaBlockParameterReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockParameterReference = RefList()
 
     def getStandardControlBlock_MetaBlockInputReference(self):
         """
@@ -96,20 +109,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockInputReference(self, value):
         for x in self._StandardControlBlock_MetaBlockInputReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockInputReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockInputReference = RefList()
+        self.addStandardControlBlock_MetaBlockInputReference(value)
 
     StandardControlBlock_MetaBlockInputReference = property(getStandardControlBlock_MetaBlockInputReference, setStandardControlBlock_MetaBlockInputReference)
 
     def addStandardControlBlock_MetaBlockInputReference(self, *StandardControlBlock_MetaBlockInputReference):
-        for obj in StandardControlBlock_MetaBlockInputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockInputReference
+        for obj in members(StandardControlBlock_MetaBlockInputReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockInputReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockInputReference(self, *StandardControlBlock_MetaBlockInputReference):
-        for obj in StandardControlBlock_MetaBlockInputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockInputReference
+        for obj in members(StandardControlBlock_MetaBlockInputReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockInputReference(self):
+        for obj in self._StandardControlBlock_MetaBlockInputReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockInputReference = RefList()
 
     def getMetaBlockStateReference(self):
         """
@@ -118,20 +143,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setMetaBlockStateReference(self, value):
         for x in self._MetaBlockStateReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockStateReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockStateReference = RefList()
+        self.addMetaBlockStateReference(value)
 
     MetaBlockStateReference = property(getMetaBlockStateReference, setMetaBlockStateReference)
 
     def addMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockStateReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockStateReference(self):
+        for obj in self._MetaBlockStateReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockStateReference = RefList()
 
     def getStandardControlBlock_MetaBlockStateReference(self):
         """
@@ -140,20 +177,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockStateReference(self, value):
         for x in self._StandardControlBlock_MetaBlockStateReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockStateReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockStateReference = RefList()
+        self.addStandardControlBlock_MetaBlockStateReference(value)
 
     StandardControlBlock_MetaBlockStateReference = property(getStandardControlBlock_MetaBlockStateReference, setStandardControlBlock_MetaBlockStateReference)
 
     def addStandardControlBlock_MetaBlockStateReference(self, *StandardControlBlock_MetaBlockStateReference):
-        for obj in StandardControlBlock_MetaBlockStateReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockStateReference
+        for obj in members(StandardControlBlock_MetaBlockStateReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockStateReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockStateReference(self, *StandardControlBlock_MetaBlockStateReference):
-        for obj in StandardControlBlock_MetaBlockStateReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockStateReference
+        for obj in members(StandardControlBlock_MetaBlockStateReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockStateReference(self):
+        for obj in self._StandardControlBlock_MetaBlockStateReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockStateReference = RefList()
 
     def getMetaBlockInputReference(self):
         """
@@ -162,20 +211,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setMetaBlockInputReference(self, value):
         for x in self._MetaBlockInputReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockInputReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockInputReference = RefList()
+        self.addMetaBlockInputReference(value)
 
     MetaBlockInputReference = property(getMetaBlockInputReference, setMetaBlockInputReference)
 
     def addMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockInputReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockInputReference(self):
+        for obj in self._MetaBlockInputReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockInputReference = RefList()
 
     def getStandardControlBlock_MetaBlockParameterReference(self):
         """
@@ -184,20 +245,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockParameterReference(self, value):
         for x in self._StandardControlBlock_MetaBlockParameterReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockParameterReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockParameterReference = RefList()
+        self.addStandardControlBlock_MetaBlockParameterReference(value)
 
     StandardControlBlock_MetaBlockParameterReference = property(getStandardControlBlock_MetaBlockParameterReference, setStandardControlBlock_MetaBlockParameterReference)
 
     def addStandardControlBlock_MetaBlockParameterReference(self, *StandardControlBlock_MetaBlockParameterReference):
-        for obj in StandardControlBlock_MetaBlockParameterReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockParameterReference
+        for obj in members(StandardControlBlock_MetaBlockParameterReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockParameterReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockParameterReference(self, *StandardControlBlock_MetaBlockParameterReference):
-        for obj in StandardControlBlock_MetaBlockParameterReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockParameterReference
+        for obj in members(StandardControlBlock_MetaBlockParameterReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockParameterReference(self):
+        for obj in self._StandardControlBlock_MetaBlockParameterReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockParameterReference = RefList()
 
     def getStandardControlBlock_MetaBlockOutputReference(self):
         """
@@ -206,20 +279,32 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockOutputReference(self, value):
         for x in self._StandardControlBlock_MetaBlockOutputReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockOutputReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockOutputReference = RefList()
+        self.addStandardControlBlock_MetaBlockOutputReference(value)
 
     StandardControlBlock_MetaBlockOutputReference = property(getStandardControlBlock_MetaBlockOutputReference, setStandardControlBlock_MetaBlockOutputReference)
 
     def addStandardControlBlock_MetaBlockOutputReference(self, *StandardControlBlock_MetaBlockOutputReference):
-        for obj in StandardControlBlock_MetaBlockOutputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockOutputReference
+        for obj in members(StandardControlBlock_MetaBlockOutputReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockOutputReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockOutputReference(self, *StandardControlBlock_MetaBlockOutputReference):
-        for obj in StandardControlBlock_MetaBlockOutputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockOutputReference
+        for obj in members(StandardControlBlock_MetaBlockOutputReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockOutputReference(self):
+        for obj in self._StandardControlBlock_MetaBlockOutputReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockOutputReference = RefList()
 
     def getMetaBlockOutputReference(self):
         """
@@ -228,18 +313,30 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
     def setMetaBlockOutputReference(self, value):
         for x in self._MetaBlockOutputReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockOutputReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockOutputReference = RefList()
+        self.addMetaBlockOutputReference(value)
 
     MetaBlockOutputReference = property(getMetaBlockOutputReference, setMetaBlockOutputReference)
 
     def addMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockOutputReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockOutputReference(self):
+        for obj in self._MetaBlockOutputReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockOutputReference = RefList()
 
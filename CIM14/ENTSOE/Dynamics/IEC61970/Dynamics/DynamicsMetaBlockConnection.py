@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
@@ -30,16 +31,16 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         @param BlockConnection: 
         @param MetaBlockConInput: 
         """
-        self._MetaBlockConOutput = []
+        self._MetaBlockConOutput = RefList()
         self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
 
         self._MemberOf_MetaBlockConnectivity = None
         self.MemberOf_MetaBlockConnectivity = MemberOf_MetaBlockConnectivity
 
-        self._BlockConnection = []
+        self._BlockConnection = RefList()
         self.BlockConnection = [] if BlockConnection is None else BlockConnection
 
-        self._MetaBlockConInput = []
+        self._MetaBlockConInput = RefList()
         self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
 
         super(DynamicsMetaBlockConnection, self).__init__(*args, **kw_args)
@@ -58,20 +59,32 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         for x in self._MetaBlockConOutput:
-            x.MemberOf_MetaBlockConnection = None
-        for y in value:
-            y._MemberOf_MetaBlockConnection = self
-        self._MetaBlockConOutput = value
+            x._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConOutput = RefList()
+        self.addMetaBlockConOutput(value)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
     def addMetaBlockConOutput(self, *MetaBlockConOutput):
-        for obj in MetaBlockConOutput:
-            obj.MemberOf_MetaBlockConnection = self
+        collection = self._MetaBlockConOutput
+        for obj in members(MetaBlockConOutput):
+            old = obj._MemberOf_MetaBlockConnection
+            if old is not None and old is not self:
+                old._MetaBlockConOutput.discard(obj)
+            obj._MemberOf_MetaBlockConnection = self
+            collection.append(obj)
 
     def removeMetaBlockConOutput(self, *MetaBlockConOutput):
-        for obj in MetaBlockConOutput:
-            obj.MemberOf_MetaBlockConnection = None
+        collection = self._MetaBlockConOutput
+        for obj in members(MetaBlockConOutput):
+            if obj._MemberOf_MetaBlockConnection is self:
+                obj._MemberOf_MetaBlockConnection = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConOutput(self):
+        for obj in self._MetaBlockConOutput:
+            obj._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConOutput = RefList()
 
     def getMemberOf_MetaBlockConnectivity(self):
         
@@ -79,8 +92,7 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConnection if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
@@ -96,20 +108,32 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
     def setBlockConnection(self, value):
         for x in self._BlockConnection:
-            x.MetaBlockConnection = None
-        for y in value:
-            y._MetaBlockConnection = self
-        self._BlockConnection = value
+            x._MetaBlockConnection = None
+        self._BlockConnection = RefList()
+        self.addBlockConnection(value)
 
     BlockConnection = property(getBlockConnection, setBlockConnection)
 
     def addBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.MetaBlockConnection = self
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            old = obj._MetaBlockConnection
+            if old is not None and old is not self:
+                old._BlockConnection.discard(obj)
+            obj._MetaBlockConnection = self
+            collection.append(obj)
 
     def removeBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.MetaBlockConnection = None
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            if obj._MetaBlockConnection is self:
+                obj._MetaBlockConnection = None
+                collection.discard(obj)
+
+    def removeAllBlockConnection(self):
+        for obj in self._BlockConnection:
+            obj._MetaBlockConnection = None
+        self._BlockConnection = RefList()
 
     def getMetaBlockConInput(self):
         """
@@ -118,18 +142,30 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
     def setMetaBlockConInput(self, value):
         for x in self._MetaBlockConInput:
-            x.MemberOf_MetaBlockConnection = None
-        for y in value:
-            y._MemberOf_MetaBlockConnection = self
-        self._MetaBlockConInput = value
+            x._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConInput = RefList()
+        self.addMetaBlockConInput(value)
 
     MetaBlockConInput = property(getMetaBlockConInput, setMetaBlockConInput)
 
     def addMetaBlockConInput(self, *MetaBlockConInput):
-        for obj in MetaBlockConInput:
-            obj.MemberOf_MetaBlockConnection = self
+        collection = self._MetaBlockConInput
+        for obj in members(MetaBlockConInput):
+            old = obj._MemberOf_MetaBlockConnection
+            if old is not None and old is not self:
+                old._MetaBlockConInput.discard(obj)
+            obj._MemberOf_MetaBlockConnection = self
+            collection.append(obj)
 
     def removeMetaBlockConInput(self, *MetaBlockConInput):
-        for obj in MetaBlockConInput:
-            obj.MemberOf_MetaBlockConnection = None
+        collection = self._MetaBlockConInput
+        for obj in members(MetaBlockConInput):
+            if obj._MemberOf_MetaBlockConnection is self:
+                obj._MemberOf_MetaBlockConnection = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConInput(self):
+        for obj in self._MetaBlockConInput:
+            obj._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConInput = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
 
@@ -28,10 +29,10 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         @param BlockConnectivity: 
         @param MetaBlockConnection: 
         """
-        self._BlockConnectivity = []
+        self._BlockConnectivity = RefList()
         self.BlockConnectivity = [] if BlockConnectivity is None else BlockConnectivity
 
-        self._MetaBlockConnection = []
+        self._MetaBlockConnection = RefList()
         self.MetaBlockConnection = [] if MetaBlockConnection is None else MetaBlockConnection
 
         super(DynamicsMetaBlockConnectivity, self).__init__(*args, **kw_args)
@@ -50,20 +51,32 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
 
     def setBlockConnectivity(self, value):
         for x in self._BlockConnectivity:
-            x.MetaBlockConnectivity = None
-        for y in value:
-            y._MetaBlockConnectivity = self
-        self._BlockConnectivity = value
+            x._MetaBlockConnectivity = None
+        self._BlockConnectivity = RefList()
+        self.addBlockConnectivity(value)
 
     BlockConnectivity = property(getBlockConnectivity, setBlockConnectivity)
 
     def addBlockConnectivity(self, *BlockConnectivity):
-        for obj in BlockConnectivity:
-            obj.MetaBlockConnectivity = self
+        collection = self._BlockConnectivity
+        for obj in members(BlockConnectivity):
+            old = obj._MetaBlockConnectivity
+            if old is not None and old is not self:
+                old._BlockConnectivity.discard(obj)
+            obj._MetaBlockConnectivity = self
+            collection.append(obj)
 
     def removeBlockConnectivity(self, *BlockConnectivity):
-        for obj in BlockConnectivity:
-            obj.MetaBlockConnectivity = None
+        collection = self._BlockConnectivity
+        for obj in members(BlockConnectivity):
+            if obj._MetaBlockConnectivity is self:
+                obj._MetaBlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllBlockConnectivity(self):
+        for obj in self._BlockConnectivity:
+            obj._MetaBlockConnectivity = None
+        self._BlockConnectivity = RefList()
 
     def getMetaBlockConnection(self):
         """
@@ -72,18 +85,30 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         for x in self._MetaBlockConnection:
-            x.MemberOf_MetaBlockConnectivity = None
-        for y in value:
-            y._MemberOf_MetaBlockConnectivity = self
-        self._MetaBlockConnection = value
+            x._MemberOf_MetaBlockConnectivity = None
+        self._MetaBlockConnection = RefList()
+        self.addMetaBlockConnection(value)
 
     MetaBlockConnection = property(getMetaBlockConnection, setMetaBlockConnection)
 
     def addMetaBlockConnection(self, *MetaBlockConnection):
-        for obj in MetaBlockConnection:
-            obj.MemberOf_MetaBlockConnectivity = self
+        collection = self._MetaBlockConnection
+        for obj in members(MetaBlockConnection):
+            old = obj._MemberOf_MetaBlockConnectivity
+            if old is not None and old is not self:
+                old._MetaBlockConnection.discard(obj)
+            obj._MemberOf_MetaBlockConnectivity = self
+            collection.append(obj)
 
     def removeMetaBlockConnection(self, *MetaBlockConnection):
-        for obj in MetaBlockConnection:
-            obj.MemberOf_MetaBlockConnectivity = None
+        collection = self._MetaBlockConnection
+        for obj in members(MetaBlockConnection):
+            if obj._MemberOf_MetaBlockConnectivity is self:
+                obj._MemberOf_MetaBlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConnection(self):
+        for obj in self._MetaBlockConnection:
+            obj._MemberOf_MetaBlockConnectivity = None
+        self._MetaBlockConnection = RefList()
 
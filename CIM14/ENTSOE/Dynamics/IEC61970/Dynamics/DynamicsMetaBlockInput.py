@@ -45,8 +45,7 @@ class DynamicsMetaBlockInput(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockInput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockInput = filtered
+            self._MemberOf_MetaBlock._MetaBlockInput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -57,8 +57,7 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockInputReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockInputReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockInputReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
@@ -89,8 +88,7 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockInputReference if x != self]
-            self._MetaBlockConnectable._MetaBlockInputReference = filtered
+            self._MetaBlockConnectable._MetaBlockInputReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
@@ -105,8 +103,7 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockInputReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
@@ -45,8 +45,7 @@ class DynamicsMetaBlockOutput(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockOutput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockOutput = filtered
+            self._MemberOf_MetaBlock._MetaBlockOutput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
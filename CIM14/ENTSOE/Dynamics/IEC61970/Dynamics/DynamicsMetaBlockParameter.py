@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectable import DynamicsMetaBlockConnectable
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
@@ -31,7 +32,7 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._BlockParameter = []
+        self._BlockParameter = RefList()
         self.BlockParameter = [] if BlockParameter is None else BlockParameter
 
         super(DynamicsMetaBlockParameter, self).__init__(*args, **kw_args)
@@ -49,8 +50,7 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockParameter if x != self]
-            self._MemberOf_MetaBlock._MetaBlockParameter = filtered
+            self._MemberOf_MetaBlock._MetaBlockParameter.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -66,18 +66,30 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
     def setBlockParameter(self, value):
         for x in self._BlockParameter:
-            x.MetaBlockParameter = None
-        for y in value:
-            y._MetaBlockParameter = self
-        self._BlockParameter = value
+            x._MetaBlockParameter = None
+        self._BlockParameter = RefList()
+        self.addBlockParameter(value)
 
     BlockParameter = property(getBlockParameter, setBlockParameter)
 
     def addBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MetaBlockParameter = self
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            old = obj._MetaBlockParameter
+            if old is not None and old is not self:
+                old._BlockParameter.discard(obj)
+            obj._MetaBlockParameter = self
+            collection.append(obj)
 
     def removeBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MetaBlockParameter = None
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            if obj._MetaBlockParameter is self:
+                obj._MetaBlockParameter = None
+                collection.discard(obj)
+
+    def removeAllBlockParameter(self):
+        for obj in self._BlockParameter:
+            obj._MetaBlockParameter = None
+        self._BlockParameter = RefList()
 
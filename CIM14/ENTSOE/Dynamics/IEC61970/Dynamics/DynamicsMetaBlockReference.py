@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
@@ -37,24 +38,24 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
         self.equationType = equationType
 
-        self._MetaBlockStateReference = []
+        self._MetaBlockStateReference = RefList()
         self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._MetaBlockInputReference = []
+        self._MetaBlockInputReference = RefList()
         self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
 
-        self._BlockParameter = []
+        self._BlockParameter = RefList()
         self.BlockParameter = [] if BlockParameter is None else BlockParameter
 
         self.MetaBlock = [] if MetaBlock is None else MetaBlock
 
-        self._MetaBlockOutputReference = []
+        self._MetaBlockOutputReference = RefList()
         self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
 
-        self._MetaBlockParameterReference = []
+        self._MetaBlockParameterReference = RefList()
         self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
 
         super(DynamicsMetaBlockReference, self).__init__(*args, **kw_args)
@@ -73,20 +74,32 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMetaBlockStateReference(self, value):
         for x in self._MetaBlockStateReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockStateReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockStateReference = RefList()
+        self.addMetaBlockStateReference(value)
 
     MetaBlockStateReference = property(getMetaBlockStateReference, setMetaBlockStateReference)
 
     def addMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockStateReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockStateReference(self):
+        for obj in self._MetaBlockStateReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockStateReference = RefList()
 
     def getMemberOf_MetaBlock(self):
         
@@ -94,8 +107,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockReference if x != self]
-            self._MemberOf_MetaBlock._MetaBlockReference = filtered
+            self._MemberOf_MetaBlock._MetaBlockReference.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -111,20 +123,32 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMetaBlockInputReference(self, value):
         for x in self._MetaBlockInputReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockInputReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockInputReference = RefList()
+        self.addMetaBlockInputReference(value)
 
     MetaBlockInputReference = property(getMetaBlockInputReference, setMetaBlockInputReference)
 
     def addMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockInputReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockInputReference(self):
+        for obj in self._MetaBlockInputReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockInputReference = RefList()
 
     def getBlockParameter(self):
         """
@@ -133,20 +157,32 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setBlockParameter(self, value):
         for x in self._BlockParameter:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._BlockParameter = value
+            x._MemberOf_MetaBlockReference = None
+        self._BlockParameter = RefList()
+        self.addBlockParameter(value)
 
     BlockParameter = property(getBlockParameter, setBlockParameter)
 
     def addBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._BlockParameter.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllBlockParameter(self):
+        for obj in self._BlockParameter:
+            obj._MemberOf_MetaBlockReference = None
+        self._BlockParameter = RefList()
 
     def add_MetaBlock(self, *MetaBlock):
         for obj in MetaBlock:
@@ -163,20 +199,32 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMetaBlockOutputReference(self, value):
         for x in self._MetaBlockOutputReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockOutputReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockOutputReference = RefList()
+        self.addMetaBlockOutputReference(value)
 
     MetaBlockOutputReference = property(getMetaBlockOutputReference, setMetaBlockOutputReference)
 
     def addMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockOutputReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockOutputReference(self):
+        for obj in self._MetaBlockOutputReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockOutputReference = RefList()
 
     def getMetaBlockParameterReference(self):
         """
@@ -185,18 +233,30 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMetaBlockParameterReference(self, value):
         for x in self._MetaBlockParameterReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockParameterReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockParameterReference = RefList()
+        self.addMetaBlockParameterReference(value)
 
     MetaBlockParameterReference = property(getMetaBlockParameterReference, setMetaBlockParameterReference)
 
     def addMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockParameterReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockParameterReference(self):
+        for obj in self._MetaBlockParameterReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockParameterReference = RefList()
 
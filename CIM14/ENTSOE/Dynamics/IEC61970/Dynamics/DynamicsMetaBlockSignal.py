@@ -53,8 +53,7 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
     def setTo(self, value):
         if self._To is not None:
-            filtered = [x for x in self.To.MetaBlockSignal if x != self]
-            self._To._MetaBlockSignal = filtered
+            self._To._MetaBlockSignal.discard(self)
 
         self._To = value
         if self._To is not None:
@@ -84,8 +83,7 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockSignal if x != self]
-            self._MemberOf_MetaBlock._MetaBlockSignal = filtered
+            self._MemberOf_MetaBlock._MetaBlockSignal.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
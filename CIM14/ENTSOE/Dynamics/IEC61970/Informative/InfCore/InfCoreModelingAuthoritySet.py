@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
@@ -27,7 +28,7 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
         @param IdentifiedObjects: 
         """
-        self._IdentifiedObjects = []
+        self._IdentifiedObjects = RefList()
         self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
 
         super(InfCoreModelingAuthoritySet, self).__init__(*args, **kw_args)
@@ -46,18 +47,30 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
     def setIdentifiedObjects(self, value):
         for x in self._IdentifiedObjects:
-            x.ModelingAuthoritySet = None
-        for y in value:
-            y._ModelingAuthoritySet = self
-        self._IdentifiedObjects = value
+            x._ModelingAuthoritySet = None
+        self._IdentifiedObjects = RefList()
+        self.addIdentifiedObjects(value)
 
     IdentifiedObjects = property(getIdentifiedObjects, setIdentifiedObjects)
 
     def addIdentifiedObjects(self, *IdentifiedObjects):
-        for obj in IdentifiedObjects:
-            obj.ModelingAuthoritySet = self
+        collection = self._IdentifiedObjects
+        for obj in members(IdentifiedObjects):
+            old = obj._ModelingAuthoritySet
+            if old is not None and old is not self:
+                old._IdentifiedObjects.discard(obj)
+            obj._ModelingAuthoritySet = self
+            collection.append(obj)
 
     def removeIdentifiedObjects(self, *IdentifiedObjects):
-        for obj in IdentifiedObjects:
-            obj.ModelingAuthoritySet = None
+        collection = self._IdentifiedObjects
+        for obj in members(IdentifiedObjects):
+            if obj._ModelingAuthoritySet is self:
+                obj._ModelingAuthoritySet = None
+                collection.discard(obj)
+
+    def removeAllIdentifiedObjects(self):
+        for obj in self._IdentifiedObjects:
+            obj._ModelingAuthoritySet = None
+        self._IdentifiedObjects = RefList()
 
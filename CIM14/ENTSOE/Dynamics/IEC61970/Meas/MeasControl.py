@@ -46,8 +46,7 @@ class MeasControl(CoreIdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
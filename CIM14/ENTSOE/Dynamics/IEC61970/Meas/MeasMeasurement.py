@@ -46,8 +46,7 @@ class MeasMeasurement(CoreIdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
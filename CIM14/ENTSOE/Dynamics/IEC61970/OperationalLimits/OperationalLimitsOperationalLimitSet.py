@@ -46,8 +46,7 @@ class OperationalLimitsOperationalLimitSet(CoreIdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.OperationalLimitSet if x != self]
-            self._Equipment._OperationalLimitSet = filtered
+            self._Equipment._OperationalLimitSet.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
@@ -46,8 +46,7 @@ class OutageClearanceTag(CoreIdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
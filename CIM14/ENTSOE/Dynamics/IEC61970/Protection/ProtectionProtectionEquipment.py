@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
+from PyCIM.RefList import RefList, members
 
 class ProtectionProtectionEquipment(CoreEquipment):
 
@@ -27,7 +28,7 @@ class ProtectionProtectionEquipment(CoreEquipment):
 
         @param ConductingEquipments: 
         """
-        self._ConductingEquipments = []
+        self._ConductingEquipments = RefList()
         self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
 
         super(ProtectionProtectionEquipment, self).__init__(*args, **kw_args)
@@ -46,24 +47,26 @@ class ProtectionProtectionEquipment(CoreEquipment):
 
     def setConductingEquipments(self, value):
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
-        for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ConductingEquipments = value
+            p._ProtectionEquipments.discard(self)
+        self._ConductingEquipments = RefList()
+        self.addConductingEquipments(value)
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
-        for obj in ConductingEquipments:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+        collection = self._ConductingEquipments
+        for obj in members(ConductingEquipments):
+            obj._ProtectionEquipments.append(self)
+            collection.append(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
-        for obj in ConductingEquipments:
-            if self in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.remove(self)
-            self._ConductingEquipments.remove(obj)
+        collection = self._ConductingEquipments
+        for obj in members(ConductingEquipments):
+            obj._ProtectionEquipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllConductingEquipments(self):
+        for obj in self._ConductingEquipments:
+            obj._ProtectionEquipments.discard(self)
+        self._ConductingEquipments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreConductingEquipment import CoreConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class WiresRegulatingCondEq(CoreConductingEquipment):
 
@@ -28,7 +29,7 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
         @param Controls:
         @param RegulatingControl:
         """
-        self._Controls = []
+        self._Controls = RefList()
         self.Controls = [] if Controls is None else Controls
 
         self._RegulatingControl = None
@@ -49,20 +50,32 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
 
     def setControls(self, value):
         for x in self._Controls:
-            x.RegulatingCondEq = None
-        for y in value:
-            y._RegulatingCondEq = self
-        self._Controls = value
+            x._RegulatingCondEq = None
+        self._Controls = RefList()
+        self.addControls(value)
 
     Controls = property(getControls, setControls)
 
     def addControls(self, *Controls):
-        for obj in Controls:
-            obj.RegulatingCondEq = self
+        collection = self._Controls
+        for obj in members(Controls):
+            old = obj._RegulatingCondEq
+            if old is not None and old is not self:
+                old._Controls.discard(obj)
+            obj._RegulatingCondEq = self
+            collection.append(obj)
 
     def removeControls(self, *Controls):
-        for obj in Controls:
-            obj.RegulatingCondEq = None
+        collection = self._Controls
+        for obj in members(Controls):
+            if obj._RegulatingCondEq is self:
+                obj._RegulatingCondEq = None
+                collection.discard(obj)
+
+    def removeAllControls(self):
+        for obj in self._Controls:
+            obj._RegulatingCondEq = None
+        self._Controls = RefList()
 
     def getRegulatingControl(self):
         
@@ -70,8 +83,7 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
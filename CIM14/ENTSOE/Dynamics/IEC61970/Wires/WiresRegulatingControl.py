@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class WiresRegulatingControl(CorePowerSystemResource):
 
@@ -27,7 +28,7 @@ class WiresRegulatingControl(CorePowerSystemResource):
 
         @param RegulatingCondEq: 
         """
-        self._RegulatingCondEq = []
+        self._RegulatingCondEq = RefList()
         self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
 
         super(WiresRegulatingControl, self).__init__(*args, **kw_args)
@@ -46,18 +47,30 @@ class WiresRegulatingControl(CorePowerSystemResource):
 
     def setRegulatingCondEq(self, value):
         for x in self._RegulatingCondEq:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._RegulatingCondEq = value
+            x._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
+        self.addRegulatingCondEq(value)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
     def addRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = self
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._RegulatingCondEq.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = None
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllRegulatingCondEq(self):
+        for obj in self._RegulatingCondEq:
+            obj._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
 
@@ -56,8 +56,7 @@ class TieFlow(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.TieFlow if x != self]
-            self._ControlArea._TieFlow = filtered
+            self._ControlArea._TieFlow.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
@@ -73,8 +72,7 @@ class TieFlow(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TieFlow if x != self]
-            self._Terminal._TieFlow = filtered
+            self._Terminal._TieFlow.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
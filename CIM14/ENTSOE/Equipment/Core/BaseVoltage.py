@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BaseVoltage(IdentifiedObject):
     """Defines a nominal base voltage which is referenced in the system.For the 2010 ENTSOE IOP, the BaseVoltage association for SeriesCompensator and TransformerWinding is required.
@@ -34,10 +35,10 @@ class BaseVoltage(IdentifiedObject):
         #: The PowerSystemResource's base voltage.Should be a positive value - not zero.
         self.nominalVoltage = nominalVoltage
 
-        self._ConductingEquipment = []
+        self._ConductingEquipment = RefList()
         self.ConductingEquipment = [] if ConductingEquipment is None else ConductingEquipment
 
-        self._VoltageLevel = []
+        self._VoltageLevel = RefList()
         self.VoltageLevel = [] if VoltageLevel is None else VoltageLevel
 
         super(BaseVoltage, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class BaseVoltage(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         for x in self._ConductingEquipment:
-            x.BaseVoltage = None
-        for y in value:
-            y._BaseVoltage = self
-        self._ConductingEquipment = value
+            x._BaseVoltage = None
+        self._ConductingEquipment = RefList()
+        self.addConductingEquipment(value)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
     def addConductingEquipment(self, *ConductingEquipment):
-        for obj in ConductingEquipment:
-            obj.BaseVoltage = self
+        collection = self._ConductingEquipment
+        for obj in members(ConductingEquipment):
+            old = obj._BaseVoltage
+            if old is not None and old is not self:
+                old._ConductingEquipment.discard(obj)
+            obj._BaseVoltage = self
+            collection.append(obj)
 
     def removeConductingEquipment(self, *ConductingEquipment):
-        for obj in ConductingEquipment:
-            obj.BaseVoltage = None
+        collection = self._ConductingEquipment
+        for obj in members(ConductingEquipment):
+            if obj._BaseVoltage is self:
+                obj._BaseVoltage = None
+                collection.discard(obj)
+
+    def removeAllConductingEquipment(self):
+        for obj in self._ConductingEquipment:
+            obj._BaseVoltage = None
+        self._ConductingEquipment = RefList()
 
     def getVoltageLevel(self):
         """The VoltageLevels having this BaseVoltage.
@@ -78,18 +91,30 @@ class BaseVoltage(IdentifiedObject):
 
     def setVoltageLevel(self, value):
         for x in self._VoltageLevel:
-            x.BaseVoltage = None
-        for y in value:
-            y._BaseVoltage = self
-        self._VoltageLevel = value
+            x._BaseVoltage = None
+        self._VoltageLevel = RefList()
+        self.addVoltageLevel(value)
 
     VoltageLevel = property(getVoltageLevel, setVoltageLevel)
 
     def addVoltageLevel(self, *VoltageLevel):
-        for obj in VoltageLevel:
-            obj.BaseVoltage = self
+        collection = self._VoltageLevel
+        for obj in members(VoltageLevel):
+            old = obj._BaseVoltage
+            if old is not None and old is not self:
+                old._VoltageLevel.discard(obj)
+            obj._BaseVoltage = self
+            collection.append(obj)
 
     def removeVoltageLevel(self, *VoltageLevel):
-        for obj in VoltageLevel:
-            obj.BaseVoltage = None
+        collection = self._VoltageLevel
+        for obj in members(VoltageLevel):
+            if obj._BaseVoltage is self:
+                obj._BaseVoltage = None
+                collection.discard(obj)
+
+    def removeAllVoltageLevel(self):
+        for obj in self._VoltageLevel:
+            obj._BaseVoltage = None
+        self._VoltageLevel = RefList()
 
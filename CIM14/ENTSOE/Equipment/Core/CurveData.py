@@ -60,8 +60,7 @@ class CurveData(Element):
 
     def setCurve(self, value):
         if self._Curve is not None:
-            filtered = [x for x in self.Curve.CurveDatas if x != self]
-            self._Curve._CurveDatas = filtered
+            self._Curve._CurveDatas.discard(self)
 
         self._Curve = value
         if self._Curve is not None:
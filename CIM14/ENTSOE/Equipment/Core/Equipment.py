@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class Equipment(PowerSystemResource):
     """The parts of a power system that are physical devices, electronic or mechanical
@@ -34,7 +35,7 @@ class Equipment(PowerSystemResource):
         #: The single instance of equipment represents multiple pieces of equipment that have been modeled together as an aggregate.  Examples would be PowerTransformers or SychronousMachines operating in parallel modeled as a single aggregate PowerTransformer or aggregate SynchronousMachine.  This is not to be used to indicate equipment that is part of a group of interdependent equipment produced by a network production program.For ENTSO-E, the TSOs will use this flag for equivalent equipment. This Boolean flag indicates that this equipment (element) of the power system model is obtained by a network reduction procedure.  If the flag is set to 'true', the equipment is treated as an equivalent.  This flag provides an alternative way of representing an aggregated (equivalent) element by allowing usage of all available attributes for a given class instead of usage of dedicated classes for equivalent equipment that have a limited number of attributes.  Do not use this attribute for TransformerWinding, BusBarSection, EquivalentBranch, EquivalentShunt and EquivalentInjection.
         self.aggregate = aggregate
 
-        self._OperationalLimitSet = []
+        self._OperationalLimitSet = RefList()
         self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
 
         self._EquipmentContainer = None
@@ -56,20 +57,32 @@ class Equipment(PowerSystemResource):
 
     def setOperationalLimitSet(self, value):
         for x in self._OperationalLimitSet:
-            x.Equipment = None
-        for y in value:
-            y._Equipment = self
-        self._OperationalLimitSet = value
+            x._Equipment = None
+        self._OperationalLimitSet = RefList()
+        self.addOperationalLimitSet(value)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
     def addOperationalLimitSet(self, *OperationalLimitSet):
-        for obj in OperationalLimitSet:
-            obj.Equipment = self
+        collection = self._OperationalLimitSet
+        for obj in members(OperationalLimitSet):
+            old = obj._Equipment
+            if old is not None and old is not self:
+                old._OperationalLimitSet.discard(obj)
+            obj._Equipment = self
+            collection.append(obj)
 
     def removeOperationalLimitSet(self, *OperationalLimitSet):
-        for obj in OperationalLimitSet:
-            obj.Equipment = None
+        collection = self._OperationalLimitSet
+        for obj in members(OperationalLimitSet):
+            if obj._Equipment is self:
+                obj._Equipment = None
+                collection.discard(obj)
+
+    def removeAllOperationalLimitSet(self):
+        for obj in self._OperationalLimitSet:
+            obj._Equipment = None
+        self._OperationalLimitSet = RefList()
 
     def getEquipmentContainer(self):
         """The association is used in the naming hierarchy.
@@ -78,8 +91,7 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -29,7 +30,7 @@ class PowerSystemResource(IdentifiedObject):
 
         @param Measurements: The Measurements that are included in the naming hierarchy where the PSR is the containing object
         """
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         super(PowerSystemResource, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class PowerSystemResource(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._Measurements = value
+            x._PowerSystemResource = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.PowerSystemResource = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.PowerSystemResource = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._PowerSystemResource = None
+        self._Measurements = RefList()
 
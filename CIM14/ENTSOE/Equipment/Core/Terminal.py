@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.For UCTE profile, the terminal associated with the limit is always required, and thus there is no need to exchange the associated Equipment which can always be derived from the terminal.
@@ -40,28 +41,28 @@ class Terminal(IdentifiedObject):
         #: The orientation of the terminal connections for a multiple terminal conducting equipment.  The sequence numbering starts with 1 and additional terminals should follow in increasing order.   The first terminal is the 'starting point' for a two terminal branch.   In the case of class TransformerWinding only one terminal is used so its sequenceNumber must be 1.
         self.sequenceNumber = sequenceNumber
 
-        self._OperationalLimitSet = []
+        self._OperationalLimitSet = RefList()
         self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._HasFirst_MutualCoupling = []
+        self._HasFirst_MutualCoupling = RefList()
         self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._RegulatingControl = []
+        self._RegulatingControl = RefList()
         self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
 
-        self._TieFlow = []
+        self._TieFlow = RefList()
         self.TieFlow = [] if TieFlow is None else TieFlow
 
-        self._HasSecond_MutualCoupling = []
+        self._HasSecond_MutualCoupling = RefList()
         self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
 
         super(Terminal, self).__init__(*args, **kw_args)
@@ -80,20 +81,32 @@ class Terminal(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         for x in self._OperationalLimitSet:
-            x.Terminal = None
-        for y in value:
-            y._Terminal = self
-        self._OperationalLimitSet = value
+            x._Terminal = None
+        self._OperationalLimitSet = RefList()
+        self.addOperationalLimitSet(value)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
     def addOperationalLimitSet(self, *OperationalLimitSet):
-        for obj in OperationalLimitSet:
-            obj.Terminal = self
+        collection = self._OperationalLimitSet
+        for obj in members(OperationalLimitSet):
+            old = obj._Terminal
+            if old is not None and old is not self:
+                old._OperationalLimitSet.discard(obj)
+            obj._Terminal = self
+            collection.append(obj)
 
     def removeOperationalLimitSet(self, *OperationalLimitSet):
-        for obj in OperationalLimitSet:
-            obj.Terminal = None
+        collection = self._OperationalLimitSet
+        for obj in members(OperationalLimitSet):
+            if obj._Terminal is self:
+                obj._Terminal = None
+                collection.discard(obj)
+
+    def removeAllOperationalLimitSet(self):
+        for obj in self._OperationalLimitSet:
+            obj._Terminal = None
+        self._OperationalLimitSet = RefList()
 
     def getConductingEquipment(self):
         """ConductingEquipment has 1 or 2 terminals that may be connected to other ConductingEquipment terminals via ConnectivityNodes
@@ -102,8 +115,7 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
@@ -119,20 +131,32 @@ class Terminal(IdentifiedObject):
 
     def setHasFirst_MutualCoupling(self, value):
         for x in self._HasFirst_MutualCoupling:
-            x.First_Terminal = None
-        for y in value:
-            y._First_Terminal = self
-        self._HasFirst_MutualCoupling = value
+            x._First_Terminal = None
+        self._HasFirst_MutualCoupling = RefList()
+        self.addHasFirst_MutualCoupling(value)
 
     HasFirst_MutualCoupling = property(getHasFirst_MutualCoupling, setHasFirst_MutualCoupling)
 
     def addHasFirst_MutualCoupling(self, *HasFirst_MutualCoupling):
-        for obj in HasFirst_MutualCoupling:
-            obj.First_Terminal = self
+        collection = self._HasFirst_MutualCoupling
+        for obj in members(HasFirst_MutualCoupling):
+            old = obj._First_Terminal
+            if old is not None and old is not self:
+                old._HasFirst_MutualCoupling.discard(obj)
+            obj._First_Terminal = self
+            collection.append(obj)
 
     def removeHasFirst_MutualCoupling(self, *HasFirst_MutualCoupling):
-        for obj in HasFirst_MutualCoupling:
-            obj.First_Terminal = None
+        collection = self._HasFirst_MutualCoupling
+        for obj in members(HasFirst_MutualCoupling):
+            if obj._First_Terminal is self:
+                obj._First_Terminal = None
+                collection.discard(obj)
+
+    def removeAllHasFirst_MutualCoupling(self):
+        for obj in self._HasFirst_MutualCoupling:
+            obj._First_Terminal = None
+        self._HasFirst_MutualCoupling = RefList()
 
     def getMeasurements(self):
         """One or more measurements may be associated with a terminal in the network. Measurement-Terminal defines where the measurement is placed in the network topology. Some Measurements represent quantities related to a particular sensor position, e.g. a voltage transformer (PT) at a busbar or a current transformer (CT) at the bar between a breaker and an isolator. The sensing position is captured by the Measurement - Terminal association that makes it possible to place the sensing position at a  well defined place. The place is defined by the connection of the Terminal to ConductingEquipment.
@@ -141,20 +165,32 @@ class Terminal(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.Terminal = None
-        for y in value:
-            y._Terminal = self
-        self._Measurements = value
+            x._Terminal = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Terminal = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._Terminal
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._Terminal = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Terminal = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._Terminal is self:
+                obj._Terminal = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Terminal = None
+        self._Measurements = RefList()
 
     def getConnectivityNode(self):
         """Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
@@ -163,8 +199,7 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
@@ -180,20 +215,32 @@ class Terminal(IdentifiedObject):
 
     def setRegulatingControl(self, value):
         for x in self._RegulatingControl:
-            x.Terminal = None
-        for y in value:
-            y._Terminal = self
-        self._RegulatingControl = value
+            x._Terminal = None
+        self._RegulatingControl = RefList()
+        self.addRegulatingControl(value)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
     def addRegulatingControl(self, *RegulatingControl):
-        for obj in RegulatingControl:
-            obj.Terminal = self
+        collection = self._RegulatingControl
+        for obj in members(RegulatingControl):
+            old = obj._Terminal
+            if old is not None and old is not self:
+                old._RegulatingControl.discard(obj)
+            obj._Terminal = self
+            collection.append(obj)
 
     def removeRegulatingControl(self, *RegulatingControl):
-        for obj in RegulatingControl:
-            obj.Terminal = None
+        collection = self._RegulatingControl
+        for obj in members(RegulatingControl):
+            if obj._Terminal is self:
+                obj._Terminal = None
+                collection.discard(obj)
+
+    def removeAllRegulatingControl(self):
+        for obj in self._RegulatingControl:
+            obj._Terminal = None
+        self._RegulatingControl = RefList()
 
     def getTieFlow(self):
         """The control area tie flows to which this terminal associates.
@@ -202,20 +249,32 @@ class Terminal(IdentifiedObject):
 
     def setTieFlow(self, value):
         for x in self._TieFlow:
-            x.Terminal = None
-        for y in value:
-            y._Terminal = self
-        self._TieFlow = value
+            x._Terminal = None
+        self._TieFlow = RefList()
+        self.addTieFlow(value)
 
     TieFlow = property(getTieFlow, setTieFlow)
 
     def addTieFlow(self, *TieFlow):
-        for obj in TieFlow:
-            obj.Terminal = self
+        collection = self._TieFlow
+        for obj in members(TieFlow):
+            old = obj._Terminal
+            if old is not None and old is not self:
+                old._TieFlow.discard(obj)
+            obj._Terminal = self
+            collection.append(obj)
 
     def removeTieFlow(self, *TieFlow):
-        for obj in TieFlow:
-            obj.Terminal = None
+        collection = self._TieFlow
+        for obj in members(TieFlow):
+            if obj._Terminal is self:
+                obj._Terminal = None
+                collection.discard(obj)
+
+    def removeAllTieFlow(self):
+        for obj in self._TieFlow:
+            obj._Terminal = None
+        self._TieFlow = RefList()
 
     def getHasSecond_MutualCoupling(self):
         """Mutual couplings with the branch associated as the first branch.
@@ -224,18 +283,30 @@ class Terminal(IdentifiedObject):
 
     def setHasSecond_MutualCoupling(self, value):
         for x in self._HasSecond_MutualCoupling:
-            x.Second_Terminal = None
-        for y in value:
-            y._Second_Terminal = self
-        self._HasSecond_MutualCoupling = value
+            x._Second_Terminal = None
+        self._HasSecond_MutualCoupling = RefList()
+        self.addHasSecond_MutualCoupling(value)
 
     HasSecond_MutualCoupling = property(getHasSecond_MutualCoupling, setHasSecond_MutualCoupling)
 
     def addHasSecond_MutualCoupling(self, *HasSecond_MutualCoupling):
-        for obj in HasSecond_MutualCoupling:
-            obj.Second_Terminal = self
+        collection = self._HasSecond_MutualCoupling
+        for obj in members(HasSecond_MutualCoupling):
+            old = obj._Second_Terminal
+            if old is not None and old is not self:
+                old._HasSecond_MutualCoupling.discard(obj)
+            obj._Second_Terminal = self
+            collection.append(obj)
 
     def removeHasSecond_MutualCoupling(self, *HasSecond_MutualCoupling):
-        for obj in HasSecond_MutualCoupling:
-            obj.Second_Terminal = None
+        collection = self._HasSecond_MutualCoupling
+        for obj in members(HasSecond_MutualCoupling):
+            if obj._Second_Terminal is self:
+                obj._Second_Terminal = None
+                collection.discard(obj)
+
+    def removeAllHasSecond_MutualCoupling(self):
+        for obj in self._HasSecond_MutualCoupling:
+            obj._Second_Terminal = None
+        self._HasSecond_MutualCoupling = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
+from PyCIM.RefList import RefList, members
 
 class EquivalentNetwork(ConnectivityNodeContainer):
     """A class that represents an external meshed network that has been reduced to an electrically equivalent model. The ConnectivityNodes contained in the equivalent are intended to reflect internal nodes of the equivalent. The boundary Connectivity nodes where the equivalent connects outside itself are NOT contained by the equivalent.
@@ -29,7 +30,7 @@ class EquivalentNetwork(ConnectivityNodeContainer):
 
         @param EquivalentEquipments: The associated reduced equivalents.
         """
-        self._EquivalentEquipments = []
+        self._EquivalentEquipments = RefList()
         self.EquivalentEquipments = [] if EquivalentEquipments is None else EquivalentEquipments
 
         super(EquivalentNetwork, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class EquivalentNetwork(ConnectivityNodeContainer):
 
     def setEquivalentEquipments(self, value):
         for x in self._EquivalentEquipments:
-            x.EquivalentNetwork = None
-        for y in value:
-            y._EquivalentNetwork = self
-        self._EquivalentEquipments = value
+            x._EquivalentNetwork = None
+        self._EquivalentEquipments = RefList()
+        self.addEquivalentEquipments(value)
 
     EquivalentEquipments = property(getEquivalentEquipments, setEquivalentEquipments)
 
     def addEquivalentEquipments(self, *EquivalentEquipments):
-        for obj in EquivalentEquipments:
-            obj.EquivalentNetwork = self
+        collection = self._EquivalentEquipments
+        for obj in members(EquivalentEquipments):
+            old = obj._EquivalentNetwork
+            if old is not None and old is not self:
+                old._EquivalentEquipments.discard(obj)
+            obj._EquivalentNetwork = self
+            collection.append(obj)
 
     def removeEquivalentEquipments(self, *EquivalentEquipments):
-        for obj in EquivalentEquipments:
-            obj.EquivalentNetwork = None
+        collection = self._EquivalentEquipments
+        for obj in members(EquivalentEquipments):
+            if obj._EquivalentNetwork is self:
+                obj._EquivalentNetwork = None
+                collection.discard(obj)
+
+    def removeAllEquivalentEquipments(self):
+        for obj in self._EquivalentEquipments:
+            obj._EquivalentNetwork = None
+        self._EquivalentEquipments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.LoadGroup import LoadGroup
+from PyCIM.RefList import RefList, members
 
 class NonConformLoadGroup(LoadGroup):
     """Loads that do not follow a daily and seasonal load variation pattern.
@@ -29,7 +30,7 @@ class NonConformLoadGroup(LoadGroup):
 
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._EnergyConsumers = []
+        self._EnergyConsumers = RefList()
         self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
 
         super(NonConformLoadGroup, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class NonConformLoadGroup(LoadGroup):
 
     def setEnergyConsumers(self, value):
         for x in self._EnergyConsumers:
-            x.LoadGroup = None
-        for y in value:
-            y._LoadGroup = self
-        self._EnergyConsumers = value
+            x._LoadGroup = None
+        self._EnergyConsumers = RefList()
+        self.addEnergyConsumers(value)
 
     EnergyConsumers = property(getEnergyConsumers, setEnergyConsumers)
 
     def addEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.LoadGroup = self
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            old = obj._LoadGroup
+            if old is not None and old is not self:
+                old._EnergyConsumers.discard(obj)
+            obj._LoadGroup = self
+            collection.append(obj)
 
     def removeEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.LoadGroup = None
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            if obj._LoadGroup is self:
+                obj._LoadGroup = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumers(self):
+        for obj in self._EnergyConsumers:
+            obj._LoadGroup = None
+        self._EnergyConsumers = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Element import Element
+from PyCIM.RefList import RefList, members
 
 class Season(Element):
     """A specified time period of the year, e.g., Spring, Summer, Fall, Winter
@@ -29,7 +30,7 @@ class Season(Element):
 
         @param SeasonDayTypeSchedules: Schedules that use this Season.
         """
-        self._SeasonDayTypeSchedules = []
+        self._SeasonDayTypeSchedules = RefList()
         self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
 
         super(Season, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class Season(Element):
 
     def setSeasonDayTypeSchedules(self, value):
         for x in self._SeasonDayTypeSchedules:
-            x.Season = None
-        for y in value:
-            y._Season = self
-        self._SeasonDayTypeSchedules = value
+            x._Season = None
+        self._SeasonDayTypeSchedules = RefList()
+        self.addSeasonDayTypeSchedules(value)
 
     SeasonDayTypeSchedules = property(getSeasonDayTypeSchedules, setSeasonDayTypeSchedules)
 
     def addSeasonDayTypeSchedules(self, *SeasonDayTypeSchedules):
-        for obj in SeasonDayTypeSchedules:
-            obj.Season = self
+        collection = self._SeasonDayTypeSchedules
+        for obj in members(SeasonDayTypeSchedules):
+            old = obj._Season
+            if old is not None and old is not self:
+                old._SeasonDayTypeSchedules.discard(obj)
+            obj._Season = self
+            collection.append(obj)
 
     def removeSeasonDayTypeSchedules(self, *SeasonDayTypeSchedules):
-        for obj in SeasonDayTypeSchedules:
-            obj.Season = None
+        collection = self._SeasonDayTypeSchedules
+        for obj in members(SeasonDayTypeSchedules):
+            if obj._Season is self:
+                obj._Season = None
+                collection.discard(obj)
+
+    def removeAllSeasonDayTypeSchedules(self):
+        for obj in self._SeasonDayTypeSchedules:
+            obj._Season = None
+        self._SeasonDayTypeSchedules = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.EnergyArea import EnergyArea
+from PyCIM.RefList import RefList, members
 
 class SubLoadArea(EnergyArea):
     """The class is the second level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -29,7 +30,7 @@ class SubLoadArea(EnergyArea):
 
         @param LoadGroups: The Loadgroups in the SubLoadArea.
         """
-        self._LoadGroups = []
+        self._LoadGroups = RefList()
         self.LoadGroups = [] if LoadGroups is None else LoadGroups
 
         super(SubLoadArea, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class SubLoadArea(EnergyArea):
 
     def setLoadGroups(self, value):
         for x in self._LoadGroups:
-            x.SubLoadArea = None
-        for y in value:
-            y._SubLoadArea = self
-        self._LoadGroups = value
+            x._SubLoadArea = None
+        self._LoadGroups = RefList()
+        self.addLoadGroups(value)
 
     LoadGroups = property(getLoadGroups, setLoadGroups)
 
     def addLoadGroups(self, *LoadGroups):
-        for obj in LoadGroups:
-            obj.SubLoadArea = self
+        collection = self._LoadGroups
+        for obj in members(LoadGroups):
+            old = obj._SubLoadArea
+            if old is not None and old is not self:
+                old._LoadGroups.discard(obj)
+            obj._SubLoadArea = self
+            collection.append(obj)
 
     def removeLoadGroups(self, *LoadGroups):
-        for obj in LoadGroups:
-            obj.SubLoadArea = None
+        collection = self._LoadGroups
+        for obj in members(LoadGroups):
+            if obj._SubLoadArea is self:
+                obj._SubLoadArea = None
+                collection.discard(obj)
+
+    def removeAllLoadGroups(self):
+        for obj in self._LoadGroups:
+            obj._SubLoadArea = None
+        self._LoadGroups = RefList()
 
@@ -60,8 +60,7 @@ class Measurement(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Measurements if x != self]
-            self._Unit._Measurements = filtered
+            self._Unit._Measurements.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
@@ -77,8 +76,7 @@ class Measurement(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Measurements if x != self]
-            self._Terminal._Measurements = filtered
+            self._Terminal._Measurements.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -94,8 +92,7 @@ class Measurement(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -48,8 +48,7 @@ class MeasurementValue(IdentifiedObject):
 
     def setMeasurementValueSource(self, value):
         if self._MeasurementValueSource is not None:
-            filtered = [x for x in self.MeasurementValueSource.MeasurementValues if x != self]
-            self._MeasurementValueSource._MeasurementValues = filtered
+            self._MeasurementValueSource._MeasurementValues.discard(self)
 
         self._MeasurementValueSource = value
         if self._MeasurementValueSource is not None:
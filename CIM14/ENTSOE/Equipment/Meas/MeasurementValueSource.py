@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MeasurementValueSource(IdentifiedObject):
     """MeasurementValueSource describes the alternative sources updating a MeasurementValue. User conventions for how to use the MeasurementValueSource attributes are described in the introduction to IEC 61970-301.
@@ -29,7 +30,7 @@ class MeasurementValueSource(IdentifiedObject):
 
         @param MeasurementValues: The MeasurementValues updated by the source
         """
-        self._MeasurementValues = []
+        self._MeasurementValues = RefList()
         self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
 
         super(MeasurementValueSource, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class MeasurementValueSource(IdentifiedObject):
 
     def setMeasurementValues(self, value):
         for x in self._MeasurementValues:
-            x.MeasurementValueSource = None
-        for y in value:
-            y._MeasurementValueSource = self
-        self._MeasurementValues = value
+            x._MeasurementValueSource = None
+        self._MeasurementValues = RefList()
+        self.addMeasurementValues(value)
 
     MeasurementValues = property(getMeasurementValues, setMeasurementValues)
 
     def addMeasurementValues(self, *MeasurementValues):
-        for obj in MeasurementValues:
-            obj.MeasurementValueSource = self
+        collection = self._MeasurementValues
+        for obj in members(MeasurementValues):
+            old = obj._MeasurementValueSource
+            if old is not None and old is not self:
+                old._MeasurementValues.discard(obj)
+            obj._MeasurementValueSource = self
+            collection.append(obj)
 
     def removeMeasurementValues(self, *MeasurementValues):
-        for obj in MeasurementValues:
-            obj.MeasurementValueSource = None
+        collection = self._MeasurementValues
+        for obj in members(MeasurementValues):
+            if obj._MeasurementValueSource is self:
+                obj._MeasurementValueSource = None
+                collection.discard(obj)
+
+    def removeAllMeasurementValues(self):
+        for obj in self._MeasurementValues:
+            obj._MeasurementValueSource = None
+        self._MeasurementValues = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class OperationalLimitType(IdentifiedObject):
     """A type of limit.  The meaning of a specific limit is described in this class.
@@ -37,7 +38,7 @@ class OperationalLimitType(IdentifiedObject):
         #: The nominal acceptable duration of the limit.  Limits are commonly expressed in terms of the a time limit for which the limit is normally acceptable.   The actual acceptable duration of a specific limit may depend on other local factors such as temperature or wind speed.
         self.acceptableDuration = acceptableDuration
 
-        self._OperationalLimit = []
+        self._OperationalLimit = RefList()
         self.OperationalLimit = [] if OperationalLimit is None else OperationalLimit
 
         super(OperationalLimitType, self).__init__(*args, **kw_args)
@@ -56,18 +57,30 @@ class OperationalLimitType(IdentifiedObject):
 
     def setOperationalLimit(self, value):
         for x in self._OperationalLimit:
-            x.OperationalLimitType = None
-        for y in value:
-            y._OperationalLimitType = self
-        self._OperationalLimit = value
+            x._OperationalLimitType = None
+        self._OperationalLimit = RefList()
+        self.addOperationalLimit(value)
 
     OperationalLimit = property(getOperationalLimit, setOperationalLimit)
 
     def addOperationalLimit(self, *OperationalLimit):
-        for obj in OperationalLimit:
-            obj.OperationalLimitType = self
+        collection = self._OperationalLimit
+        for obj in members(OperationalLimit):
+            old = obj._OperationalLimitType
+            if old is not None and old is not self:
+                old._OperationalLimit.discard(obj)
+            obj._OperationalLimitType = self
+            collection.append(obj)
 
     def removeOperationalLimit(self, *OperationalLimit):
-        for obj in OperationalLimit:
-            obj.OperationalLimitType = None
+        collection = self._OperationalLimit
+        for obj in members(OperationalLimit):
+            if obj._OperationalLimitType is self:
+                obj._OperationalLimitType = None
+                collection.discard(obj)
+
+    def removeAllOperationalLimit(self):
+        for obj in self._OperationalLimit:
+            obj._OperationalLimitType = None
+        self._OperationalLimit = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class PowerTransformer(Equipment):
     """An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow).A PowerTransformer can be either two winding or three winding. -  A two winding transformer has two TransformerWindings -  A three winding transformer has three TransformerWindings 
@@ -29,7 +30,7 @@ class PowerTransformer(Equipment):
 
         @param TransformerWindings: A transformer has windings
         """
-        self._TransformerWindings = []
+        self._TransformerWindings = RefList()
         self.TransformerWindings = [] if TransformerWindings is None else TransformerWindings
 
         super(PowerTransformer, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class PowerTransformer(Equipment):
 
     def setTransformerWindings(self, value):
         for x in self._TransformerWindings:
-            x.PowerTransformer = None
-        for y in value:
-            y._PowerTransformer = self
-        self._TransformerWindings = value
+            x._PowerTransformer = None
+        self._TransformerWindings = RefList()
+        self.addTransformerWindings(value)
 
     TransformerWindings = property(getTransformerWindings, setTransformerWindings)
 
     def addTransformerWindings(self, *TransformerWindings):
-        for obj in TransformerWindings:
-            obj.PowerTransformer = self
+        collection = self._TransformerWindings
+        for obj in members(TransformerWindings):
+            old = obj._PowerTransformer
+            if old is not None and old is not self:
+                old._TransformerWindings.discard(obj)
+            obj._PowerTransformer = self
+            collection.append(obj)
 
     def removeTransformerWindings(self, *TransformerWindings):
-        for obj in TransformerWindings:
-            obj.PowerTransformer = None
+        collection = self._TransformerWindings
+        for obj in members(TransformerWindings):
+            if obj._PowerTransformer is self:
+                obj._PowerTransformer = None
+                collection.discard(obj)
+
+    def removeAllTransformerWindings(self):
+        for obj in self._TransformerWindings:
+            obj._PowerTransformer = None
+        self._TransformerWindings = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.Curve import Curve
+from PyCIM.RefList import RefList, members
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.-  ReactiveCapabilityCurves are not required if the reactive power limits of the SynchronousMachine do not vary with real power output. -  By convention, the Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum. -  Because the x value will always be specified in MW and the y values will always be specified in MVAr, the xMultiplier, y1Multiplier, and y2Multiplier attributes do not need to be supplied. 
@@ -33,7 +34,7 @@ class ReactiveCapabilityCurve(Curve):
         #: The Y2-axis units of measure. Values are: "A", "rad", "none", "g", "W/Hz", "V", "m2", "VA", "VArh", "N", "Pa", "VAh", "F", "H", "Hz-1", "W/s", "J", "m", "S", "min", "deg", "J/s", "s", "Wh", "m3", "oC", "V/VAr", "s-1", "h", "W", "ohm", "Hz", "VAr", "kg/J"
         self.y2Unit = y2Unit
 
-        self._InitiallyUsedBySynchronousMachines = []
+        self._InitiallyUsedBySynchronousMachines = RefList()
         self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class ReactiveCapabilityCurve(Curve):
 
     def setInitiallyUsedBySynchronousMachines(self, value):
         for x in self._InitiallyUsedBySynchronousMachines:
-            x.InitialReactiveCapabilityCurve = None
-        for y in value:
-            y._InitialReactiveCapabilityCurve = self
-        self._InitiallyUsedBySynchronousMachines = value
+            x._InitialReactiveCapabilityCurve = None
+        self._InitiallyUsedBySynchronousMachines = RefList()
+        self.addInitiallyUsedBySynchronousMachines(value)
 
     InitiallyUsedBySynchronousMachines = property(getInitiallyUsedBySynchronousMachines, setInitiallyUsedBySynchronousMachines)
 
     def addInitiallyUsedBySynchronousMachines(self, *InitiallyUsedBySynchronousMachines):
-        for obj in InitiallyUsedBySynchronousMachines:
-            obj.InitialReactiveCapabilityCurve = self
+        collection = self._InitiallyUsedBySynchronousMachines
+        for obj in members(InitiallyUsedBySynchronousMachines):
+            old = obj._InitialReactiveCapabilityCurve
+            if old is not None and old is not self:
+                old._InitiallyUsedBySynchronousMachines.discard(obj)
+            obj._InitialReactiveCapabilityCurve = self
+            collection.append(obj)
 
     def removeInitiallyUsedBySynchronousMachines(self, *InitiallyUsedBySynchronousMachines):
-        for obj in InitiallyUsedBySynchronousMachines:
-            obj.InitialReactiveCapabilityCurve = None
+        collection = self._InitiallyUsedBySynchronousMachines
+        for obj in members(InitiallyUsedBySynchronousMachines):
+            if obj._InitialReactiveCapabilityCurve is self:
+                obj._InitialReactiveCapabilityCurve = None
+                collection.discard(obj)
+
+    def removeAllInitiallyUsedBySynchronousMachines(self):
+        for obj in self._InitiallyUsedBySynchronousMachines:
+            obj._InitialReactiveCapabilityCurve = None
+        self._InitiallyUsedBySynchronousMachines = RefList()
 
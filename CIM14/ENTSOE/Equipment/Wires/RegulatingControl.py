@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -50,10 +51,10 @@ class RegulatingControl(PowerSystemResource):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._RegulatingCondEq = []
+        self._RegulatingCondEq = RefList()
         self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
 
-        self._TapChanger = []
+        self._TapChanger = RefList()
         self.TapChanger = [] if TapChanger is None else TapChanger
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
@@ -72,8 +73,7 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -89,20 +89,32 @@ class RegulatingControl(PowerSystemResource):
 
     def setRegulatingCondEq(self, value):
         for x in self._RegulatingCondEq:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._RegulatingCondEq = value
+            x._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
+        self.addRegulatingCondEq(value)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
     def addRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = self
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._RegulatingCondEq.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = None
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllRegulatingCondEq(self):
+        for obj in self._RegulatingCondEq:
+            obj._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
 
     def getTapChanger(self):
         """copy from reg conduting eq
@@ -111,18 +123,30 @@ class RegulatingControl(PowerSystemResource):
 
     def setTapChanger(self, value):
         for x in self._TapChanger:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._TapChanger = value
+            x._RegulatingControl = None
+        self._TapChanger = RefList()
+        self.addTapChanger(value)
 
     TapChanger = property(getTapChanger, setTapChanger)
 
     def addTapChanger(self, *TapChanger):
-        for obj in TapChanger:
-            obj.RegulatingControl = self
+        collection = self._TapChanger
+        for obj in members(TapChanger):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._TapChanger.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeTapChanger(self, *TapChanger):
-        for obj in TapChanger:
-            obj.RegulatingControl = None
+        collection = self._TapChanger
+        for obj in members(TapChanger):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllTapChanger(self):
+        for obj in self._TapChanger:
+            obj._RegulatingControl = None
+        self._TapChanger = RefList()
 
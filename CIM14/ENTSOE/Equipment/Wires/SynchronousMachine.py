@@ -108,8 +108,7 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
@@ -141,8 +140,7 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
@@ -79,8 +79,7 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
@@ -140,8 +140,7 @@ class TransformerWinding(ConductingEquipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerWindings if x != self]
-            self._PowerTransformer._TransformerWindings = filtered
+            self._PowerTransformer._TransformerWindings.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ConnectivityNodeContainer(IdentifiedObject):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -29,7 +30,7 @@ class ConnectivityNodeContainer(IdentifiedObject):
 
         @param TopologicalNode: The topological nodes which belong to this connectivity node container.
         """
-        self._TopologicalNode = []
+        self._TopologicalNode = RefList()
         self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ConnectivityNodeContainer(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         for x in self._TopologicalNode:
-            x.ConnectivityNodeContainer = None
-        for y in value:
-            y._ConnectivityNodeContainer = self
-        self._TopologicalNode = value
+            x._ConnectivityNodeContainer = None
+        self._TopologicalNode = RefList()
+        self.addTopologicalNode(value)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
     def addTopologicalNode(self, *TopologicalNode):
-        for obj in TopologicalNode:
-            obj.ConnectivityNodeContainer = self
+        collection = self._TopologicalNode
+        for obj in members(TopologicalNode):
+            old = obj._ConnectivityNodeContainer
+            if old is not None and old is not self:
+                old._TopologicalNode.discard(obj)
+            obj._ConnectivityNodeContainer = self
+            collection.append(obj)
 
     def removeTopologicalNode(self, *TopologicalNode):
-        for obj in TopologicalNode:
-            obj.ConnectivityNodeContainer = None
+        collection = self._TopologicalNode
+        for obj in members(TopologicalNode):
+            if obj._ConnectivityNodeContainer is self:
+                obj._ConnectivityNodeContainer = None
+                collection.discard(obj)
+
+    def removeAllTopologicalNode(self):
+        for obj in self._TopologicalNode:
+            obj._ConnectivityNodeContainer = None
+        self._TopologicalNode = RefList()
 
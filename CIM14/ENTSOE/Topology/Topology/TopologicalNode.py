@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -37,7 +38,7 @@ class TopologicalNode(IdentifiedObject):
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Terminal = []
+        self._Terminal = RefList()
         self.Terminal = [] if Terminal is None else Terminal
 
         super(TopologicalNode, self).__init__(*args, **kw_args)
@@ -56,8 +57,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.TopologicalNode if x != self]
-            self._ConnectivityNodeContainer._TopologicalNode = filtered
+            self._ConnectivityNodeContainer._TopologicalNode.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
@@ -73,8 +73,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -90,18 +89,30 @@ class TopologicalNode(IdentifiedObject):
 
     def setTerminal(self, value):
         for x in self._Terminal:
-            x.TopologicalNode = None
-        for y in value:
-            y._TopologicalNode = self
-        self._Terminal = value
+            x._TopologicalNode = None
+        self._Terminal = RefList()
+        self.addTerminal(value)
 
     Terminal = property(getTerminal, setTerminal)
 
     def addTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.TopologicalNode = self
+        collection = self._Terminal
+        for obj in members(Terminal):
+            old = obj._TopologicalNode
+            if old is not None and old is not self:
+                old._Terminal.discard(obj)
+            obj._TopologicalNode = self
+            collection.append(obj)
 
     def removeTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.TopologicalNode = None
+        collection = self._Terminal
+        for obj in members(Terminal):
+            if obj._TopologicalNode is self:
+                obj._TopologicalNode = None
+                collection.discard(obj)
+
+    def removeAllTerminal(self):
+        for obj in self._Terminal:
+            obj._TopologicalNode = None
+        self._Terminal = RefList()
 
@@ -52,8 +52,7 @@ class DistributionWindingTest(IdentifiedObject):
 
     def setFromWinding(self, value):
         if self._FromWinding is not None:
-            filtered = [x for x in self.FromWinding.WindingTests if x != self]
-            self._FromWinding._WindingTests = filtered
+            self._FromWinding._WindingTests.discard(self)
 
         self._FromWinding = value
         if self._FromWinding is not None:
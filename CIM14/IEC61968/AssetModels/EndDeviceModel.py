@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.AssetModels.AssetModel import AssetModel
+from PyCIM.RefList import RefList, members
 
 class EndDeviceModel(AssetModel):
     """Documentation for particular end device product model made by a manufacturer.
@@ -29,7 +30,7 @@ class EndDeviceModel(AssetModel):
 
         @param EndDeviceAssets: All end device assets being of this model.
         """
-        self._EndDeviceAssets = []
+        self._EndDeviceAssets = RefList()
         self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
 
         super(EndDeviceModel, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class EndDeviceModel(AssetModel):
 
     def setEndDeviceAssets(self, value):
         for x in self._EndDeviceAssets:
-            x.EndDeviceModel = None
-        for y in value:
-            y._EndDeviceModel = self
-        self._EndDeviceAssets = value
+            x._EndDeviceModel = None
+        self._EndDeviceAssets = RefList()
+        self.addEndDeviceAssets(value)
 
     EndDeviceAssets = property(getEndDeviceAssets, setEndDeviceAssets)
 
     def addEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.EndDeviceModel = self
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            old = obj._EndDeviceModel
+            if old is not None and old is not self:
+                old._EndDeviceAssets.discard(obj)
+            obj._EndDeviceModel = self
+            collection.append(obj)
 
     def removeEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.EndDeviceModel = None
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            if obj._EndDeviceModel is self:
+                obj._EndDeviceModel = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceAssets(self):
+        for obj in self._EndDeviceAssets:
+            obj._EndDeviceModel = None
+        self._EndDeviceAssets = RefList()
 
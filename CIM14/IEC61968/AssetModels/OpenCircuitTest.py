@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
+from PyCIM.RefList import RefList, members
 
 class OpenCircuitTest(DistributionWindingTest):
     """Open-circuit test results may include no-load losses, exciting current, phase shifts, and induced voltage. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. For induced voltage and phase shifts, use the associated ToWindingSpec class.
@@ -45,7 +46,7 @@ class OpenCircuitTest(DistributionWindingTest):
         #: Exciting current measured from a positive-sequence or single-phase open-circuit (excitation) test.
         self.excitingCurrent = excitingCurrent
 
-        self._MeasuredWindingSpecs = []
+        self._MeasuredWindingSpecs = RefList()
         self.MeasuredWindingSpecs = [] if MeasuredWindingSpecs is None else MeasuredWindingSpecs
 
         super(OpenCircuitTest, self).__init__(*args, **kw_args)
@@ -64,24 +65,26 @@ class OpenCircuitTest(DistributionWindingTest):
 
     def setMeasuredWindingSpecs(self, value):
         for p in self._MeasuredWindingSpecs:
-            filtered = [q for q in p.OpenCircuitTests if q != self]
-            self._MeasuredWindingSpecs._OpenCircuitTests = filtered
-        for r in value:
-            if self not in r._OpenCircuitTests:
-                r._OpenCircuitTests.append(self)
-        self._MeasuredWindingSpecs = value
+            p._OpenCircuitTests.discard(self)
+        self._MeasuredWindingSpecs = RefList()
+        self.addMeasuredWindingSpecs(value)
 
     MeasuredWindingSpecs = property(getMeasuredWindingSpecs, setMeasuredWindingSpecs)
 
     def addMeasuredWindingSpecs(self, *MeasuredWindingSpecs):
-        for obj in MeasuredWindingSpecs:
-            if self not in obj._OpenCircuitTests:
-                obj._OpenCircuitTests.append(self)
-            self._MeasuredWindingSpecs.append(obj)
+        collection = self._MeasuredWindingSpecs
+        for obj in members(MeasuredWindingSpecs):
+            obj._OpenCircuitTests.append(self)
+            collection.append(obj)
 
     def removeMeasuredWindingSpecs(self, *MeasuredWindingSpecs):
-        for obj in MeasuredWindingSpecs:
-            if self in obj._OpenCircuitTests:
-                obj._OpenCircuitTests.remove(self)
-            self._MeasuredWindingSpecs.remove(obj)
+        collection = self._MeasuredWindingSpecs
+        for obj in members(MeasuredWindingSpecs):
+            obj._OpenCircuitTests.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasuredWindingSpecs(self):
+        for obj in self._MeasuredWindingSpecs:
+            obj._OpenCircuitTests.discard(self)
+        self._MeasuredWindingSpecs = RefList()
 
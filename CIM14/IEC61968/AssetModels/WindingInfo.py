@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class WindingInfo(IdentifiedObject):
     """Winding data.
@@ -68,16 +69,16 @@ class WindingInfo(IdentifiedObject):
         #: Apparent power that this winding can carry for a short period of time.
         self.shortTermS = shortTermS
 
-        self._Windings = []
+        self._Windings = RefList()
         self.Windings = [] if Windings is None else Windings
 
-        self._WindingTests = []
+        self._WindingTests = RefList()
         self.WindingTests = [] if WindingTests is None else WindingTests
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._ToWindingSpecs = []
+        self._ToWindingSpecs = RefList()
         self.ToWindingSpecs = [] if ToWindingSpecs is None else ToWindingSpecs
 
         super(WindingInfo, self).__init__(*args, **kw_args)
@@ -96,20 +97,32 @@ class WindingInfo(IdentifiedObject):
 
     def setWindings(self, value):
         for x in self._Windings:
-            x.WindingInfo = None
-        for y in value:
-            y._WindingInfo = self
-        self._Windings = value
+            x._WindingInfo = None
+        self._Windings = RefList()
+        self.addWindings(value)
 
     Windings = property(getWindings, setWindings)
 
     def addWindings(self, *Windings):
-        for obj in Windings:
-            obj.WindingInfo = self
+        collection = self._Windings
+        for obj in members(Windings):
+            old = obj._WindingInfo
+            if old is not None and old is not self:
+                old._Windings.discard(obj)
+            obj._WindingInfo = self
+            collection.append(obj)
 
     def removeWindings(self, *Windings):
-        for obj in Windings:
-            obj.WindingInfo = None
+        collection = self._Windings
+        for obj in members(Windings):
+            if obj._WindingInfo is self:
+                obj._WindingInfo = None
+                collection.discard(obj)
+
+    def removeAllWindings(self):
+        for obj in self._Windings:
+            obj._WindingInfo = None
+        self._Windings = RefList()
 
     def getWindingTests(self):
         """All winding tests during which voltage or current was applied to this winding.
@@ -118,20 +131,32 @@ class WindingInfo(IdentifiedObject):
 
     def setWindingTests(self, value):
         for x in self._WindingTests:
-            x.FromWinding = None
-        for y in value:
-            y._FromWinding = self
-        self._WindingTests = value
+            x._FromWinding = None
+        self._WindingTests = RefList()
+        self.addWindingTests(value)
 
     WindingTests = property(getWindingTests, setWindingTests)
 
     def addWindingTests(self, *WindingTests):
-        for obj in WindingTests:
-            obj.FromWinding = self
+        collection = self._WindingTests
+        for obj in members(WindingTests):
+            old = obj._FromWinding
+            if old is not None and old is not self:
+                old._WindingTests.discard(obj)
+            obj._FromWinding = self
+            collection.append(obj)
 
     def removeWindingTests(self, *WindingTests):
-        for obj in WindingTests:
-            obj.FromWinding = None
+        collection = self._WindingTests
+        for obj in members(WindingTests):
+            if obj._FromWinding is self:
+                obj._FromWinding = None
+                collection.discard(obj)
+
+    def removeAllWindingTests(self):
+        for obj in self._WindingTests:
+            obj._FromWinding = None
+        self._WindingTests = RefList()
 
     def getTransformerInfo(self):
         """Transformer data that this winding description is part of.
@@ -140,8 +165,7 @@ class WindingInfo(IdentifiedObject):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.WindingInfos if x != self]
-            self._TransformerInfo._WindingInfos = filtered
+            self._TransformerInfo._WindingInfos.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
@@ -157,18 +181,30 @@ class WindingInfo(IdentifiedObject):
 
     def setToWindingSpecs(self, value):
         for x in self._ToWindingSpecs:
-            x.ToWinding = None
-        for y in value:
-            y._ToWinding = self
-        self._ToWindingSpecs = value
+            x._ToWinding = None
+        self._ToWindingSpecs = RefList()
+        self.addToWindingSpecs(value)
 
     ToWindingSpecs = property(getToWindingSpecs, setToWindingSpecs)
 
     def addToWindingSpecs(self, *ToWindingSpecs):
-        for obj in ToWindingSpecs:
-            obj.ToWinding = self
+        collection = self._ToWindingSpecs
+        for obj in members(ToWindingSpecs):
+            old = obj._ToWinding
+            if old is not None and old is not self:
+                old._ToWindingSpecs.discard(obj)
+            obj._ToWinding = self
+            collection.append(obj)
 
     def removeToWindingSpecs(self, *ToWindingSpecs):
-        for obj in ToWindingSpecs:
-            obj.ToWinding = None
+        collection = self._ToWindingSpecs
+        for obj in members(ToWindingSpecs):
+            if obj._ToWinding is self:
+                obj._ToWinding = None
+                collection.discard(obj)
+
+    def removeAllToWindingSpecs(self):
+        for obj in self._ToWindingSpecs:
+            obj._ToWinding = None
+        self._ToWindingSpecs = RefList()
 
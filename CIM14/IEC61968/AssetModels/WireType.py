@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class WireType(IdentifiedObject):
     """Wire conductor (per IEEE specs). A specific type of wire or combination of wires, not insulated from each other, suitable for carrying electrical current.
@@ -78,10 +79,10 @@ class WireType(IdentifiedObject):
         #: Number of strands in the wire.
         self.strandCount = strandCount
 
-        self._WireArrangements = []
+        self._WireArrangements = RefList()
         self.WireArrangements = [] if WireArrangements is None else WireArrangements
 
-        self._ConcentricNeutralCableInfos = []
+        self._ConcentricNeutralCableInfos = RefList()
         self.ConcentricNeutralCableInfos = [] if ConcentricNeutralCableInfos is None else ConcentricNeutralCableInfos
 
         super(WireType, self).__init__(*args, **kw_args)
@@ -100,20 +101,32 @@ class WireType(IdentifiedObject):
 
     def setWireArrangements(self, value):
         for x in self._WireArrangements:
-            x.WireType = None
-        for y in value:
-            y._WireType = self
-        self._WireArrangements = value
+            x._WireType = None
+        self._WireArrangements = RefList()
+        self.addWireArrangements(value)
 
     WireArrangements = property(getWireArrangements, setWireArrangements)
 
     def addWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.WireType = self
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            old = obj._WireType
+            if old is not None and old is not self:
+                old._WireArrangements.discard(obj)
+            obj._WireType = self
+            collection.append(obj)
 
     def removeWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.WireType = None
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            if obj._WireType is self:
+                obj._WireType = None
+                collection.discard(obj)
+
+    def removeAllWireArrangements(self):
+        for obj in self._WireArrangements:
+            obj._WireType = None
+        self._WireArrangements = RefList()
 
     def getConcentricNeutralCableInfos(self):
         """All concentric neutral cables using this wire type.
@@ -122,18 +135,30 @@ class WireType(IdentifiedObject):
 
     def setConcentricNeutralCableInfos(self, value):
         for x in self._ConcentricNeutralCableInfos:
-            x.WireType = None
-        for y in value:
-            y._WireType = self
-        self._ConcentricNeutralCableInfos = value
+            x._WireType = None
+        self._ConcentricNeutralCableInfos = RefList()
+        self.addConcentricNeutralCableInfos(value)
 
     ConcentricNeutralCableInfos = property(getConcentricNeutralCableInfos, setConcentricNeutralCableInfos)
 
     def addConcentricNeutralCableInfos(self, *ConcentricNeutralCableInfos):
-        for obj in ConcentricNeutralCableInfos:
-            obj.WireType = self
+        collection = self._ConcentricNeutralCableInfos
+        for obj in members(ConcentricNeutralCableInfos):
+            old = obj._WireType
+            if old is not None and old is not self:
+                old._ConcentricNeutralCableInfos.discard(obj)
+            obj._WireType = self
+            collection.append(obj)
 
     def removeConcentricNeutralCableInfos(self, *ConcentricNeutralCableInfos):
-        for obj in ConcentricNeutralCableInfos:
-            obj.WireType = None
+        collection = self._ConcentricNeutralCableInfos
+        for obj in members(ConcentricNeutralCableInfos):
+            if obj._WireType is self:
+                obj._WireType = None
+                collection.discard(obj)
+
+    def removeAllConcentricNeutralCableInfos(self):
+        for obj in self._ConcentricNeutralCableInfos:
+            obj._WireType = None
+        self._ConcentricNeutralCableInfos = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Asset(IdentifiedObject):
     """Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.
@@ -87,24 +88,24 @@ class Asset(IdentifiedObject):
         #: Condition of asset in inventory or at time of installation. Examples include new, rebuilt, overhaul required, other. Refer to inspection data for information on the most current condition of the asset.
         self.initialCondition = initialCondition
 
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
-        self._Properties = []
+        self._Properties = RefList()
         self.Properties = [] if Properties is None else Properties
 
         self.acceptanceTest = acceptanceTest
 
-        self._ActivityRecords = []
+        self._ActivityRecords = RefList()
         self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
 
         self._Location = None
         self.Location = Location
 
-        self._AssetFunctions = []
+        self._AssetFunctions = RefList()
         self.AssetFunctions = [] if AssetFunctions is None else AssetFunctions
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         self._AssetContainer = None
@@ -112,7 +113,7 @@ class Asset(IdentifiedObject):
 
         self.status = status
 
-        self._Ratings = []
+        self._Ratings = RefList()
         self.Ratings = [] if Ratings is None else Ratings
 
         self.electronicAddress = electronicAddress
@@ -133,26 +134,28 @@ class Asset(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._PowerSystemResources = value
+            p._Assets.discard(self)
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._PowerSystemResources.remove(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Assets.discard(self)
+        self._PowerSystemResources = RefList()
 
     def getProperties(self):
         """UserAttributes used to specify further properties of this asset. Use 'name' to specify what kind of property it is, and 'value.value' attribute for the actual value.
@@ -161,26 +164,28 @@ class Asset(IdentifiedObject):
 
     def setProperties(self, value):
         for p in self._Properties:
-            filtered = [q for q in p.PropertyAssets if q != self]
-            self._Properties._PropertyAssets = filtered
-        for r in value:
-            if self not in r._PropertyAssets:
-                r._PropertyAssets.append(self)
-        self._Properties = value
+            p._PropertyAssets.discard(self)
+        self._Properties = RefList()
+        self.addProperties(value)
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
-        for obj in Properties:
-            if self not in obj._PropertyAssets:
-                obj._PropertyAssets.append(self)
-            self._Properties.append(obj)
+        collection = self._Properties
+        for obj in members(Properties):
+            obj._PropertyAssets.append(self)
+            collection.append(obj)
 
     def removeProperties(self, *Properties):
-        for obj in Properties:
-            if self in obj._PropertyAssets:
-                obj._PropertyAssets.remove(self)
-            self._Properties.remove(obj)
+        collection = self._Properties
+        for obj in members(Properties):
+            obj._PropertyAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllProperties(self):
+        for obj in self._Properties:
+            obj._PropertyAssets.discard(self)
+        self._Properties = RefList()
 
     # Information on acceptance test.
     acceptanceTest = None
@@ -192,26 +197,28 @@ class Asset(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Assets if q != self]
-            self._ActivityRecords._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._ActivityRecords = value
+            p._Assets.discard(self)
+        self._ActivityRecords = RefList()
+        self.addActivityRecords(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ActivityRecords.append(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._ActivityRecords.remove(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllActivityRecords(self):
+        for obj in self._ActivityRecords:
+            obj._Assets.discard(self)
+        self._ActivityRecords = RefList()
 
     def getLocation(self):
         """Location of this asset.
@@ -220,8 +227,7 @@ class Asset(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Assets if x != self]
-            self._Location._Assets = filtered
+            self._Location._Assets.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -236,20 +242,32 @@ class Asset(IdentifiedObject):
 
     def setAssetFunctions(self, value):
         for x in self._AssetFunctions:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._AssetFunctions = value
+            x._Asset = None
+        self._AssetFunctions = RefList()
+        self.addAssetFunctions(value)
 
     AssetFunctions = property(getAssetFunctions, setAssetFunctions)
 
     def addAssetFunctions(self, *AssetFunctions):
-        for obj in AssetFunctions:
-            obj.Asset = self
+        collection = self._AssetFunctions
+        for obj in members(AssetFunctions):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._AssetFunctions.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeAssetFunctions(self, *AssetFunctions):
-        for obj in AssetFunctions:
-            obj.Asset = None
+        collection = self._AssetFunctions
+        for obj in members(AssetFunctions):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllAssetFunctions(self):
+        for obj in self._AssetFunctions:
+            obj._Asset = None
+        self._AssetFunctions = RefList()
 
     def getMeasurements(self):
         
@@ -257,20 +275,32 @@ class Asset(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._Measurements = value
+            x._Asset = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Asset = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Asset = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Asset = None
+        self._Measurements = RefList()
 
     def getAssetContainer(self):
         
@@ -278,8 +308,7 @@ class Asset(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Assets if x != self]
-            self._AssetContainer._Assets = filtered
+            self._AssetContainer._Assets.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
@@ -298,26 +327,28 @@ class Asset(IdentifiedObject):
 
     def setRatings(self, value):
         for p in self._Ratings:
-            filtered = [q for q in p.RatingAssets if q != self]
-            self._Ratings._RatingAssets = filtered
-        for r in value:
-            if self not in r._RatingAssets:
-                r._RatingAssets.append(self)
-        self._Ratings = value
+            p._RatingAssets.discard(self)
+        self._Ratings = RefList()
+        self.addRatings(value)
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
-        for obj in Ratings:
-            if self not in obj._RatingAssets:
-                obj._RatingAssets.append(self)
-            self._Ratings.append(obj)
+        collection = self._Ratings
+        for obj in members(Ratings):
+            obj._RatingAssets.append(self)
+            collection.append(obj)
 
     def removeRatings(self, *Ratings):
-        for obj in Ratings:
-            if self in obj._RatingAssets:
-                obj._RatingAssets.remove(self)
-            self._Ratings.remove(obj)
+        collection = self._Ratings
+        for obj in members(Ratings):
+            obj._RatingAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllRatings(self):
+        for obj in self._Ratings:
+            obj._RatingAssets.discard(self)
+        self._Ratings = RefList()
 
     # Electronic address.
     electronicAddress = None
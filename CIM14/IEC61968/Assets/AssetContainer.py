@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.Asset import Asset
+from PyCIM.RefList import RefList, members
 
 class AssetContainer(Asset):
     """Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.
@@ -30,10 +31,10 @@ class AssetContainer(Asset):
         @param Seals: All seals applied to this asset container.
         @param Assets:
         """
-        self._Seals = []
+        self._Seals = RefList()
         self.Seals = [] if Seals is None else Seals
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         super(AssetContainer, self).__init__(*args, **kw_args)
@@ -52,20 +53,32 @@ class AssetContainer(Asset):
 
     def setSeals(self, value):
         for x in self._Seals:
-            x.AssetContainer = None
-        for y in value:
-            y._AssetContainer = self
-        self._Seals = value
+            x._AssetContainer = None
+        self._Seals = RefList()
+        self.addSeals(value)
 
     Seals = property(getSeals, setSeals)
 
     def addSeals(self, *Seals):
-        for obj in Seals:
-            obj.AssetContainer = self
+        collection = self._Seals
+        for obj in members(Seals):
+            old = obj._AssetContainer
+            if old is not None and old is not self:
+                old._Seals.discard(obj)
+            obj._AssetContainer = self
+            collection.append(obj)
 
     def removeSeals(self, *Seals):
-        for obj in Seals:
-            obj.AssetContainer = None
+        collection = self._Seals
+        for obj in members(Seals):
+            if obj._AssetContainer is self:
+                obj._AssetContainer = None
+                collection.discard(obj)
+
+    def removeAllSeals(self):
+        for obj in self._Seals:
+            obj._AssetContainer = None
+        self._Seals = RefList()
 
     def getAssets(self):
         
@@ -73,18 +86,30 @@ class AssetContainer(Asset):
 
     def setAssets(self, value):
         for x in self._Assets:
-            x.AssetContainer = None
-        for y in value:
-            y._AssetContainer = self
-        self._Assets = value
+            x._AssetContainer = None
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            obj.AssetContainer = self
+        collection = self._Assets
+        for obj in members(Assets):
+            old = obj._AssetContainer
+            if old is not None and old is not self:
+                old._Assets.discard(obj)
+            obj._AssetContainer = self
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            obj.AssetContainer = None
+        collection = self._Assets
+        for obj in members(Assets):
+            if obj._AssetContainer is self:
+                obj._AssetContainer = None
+                collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._AssetContainer = None
+        self._Assets = RefList()
 
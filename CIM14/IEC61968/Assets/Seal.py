@@ -64,8 +64,7 @@ class Seal(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Seals if x != self]
-            self._AssetContainer._Seals = filtered
+            self._AssetContainer._Seals.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
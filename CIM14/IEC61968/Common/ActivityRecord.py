@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ActivityRecord(IdentifiedObject):
     """Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.
@@ -47,10 +48,10 @@ class ActivityRecord(IdentifiedObject):
         #: Category of event resulting in this activity record.
         self.category = category
 
-        self._Documents = []
+        self._Documents = RefList()
         self.Documents = [] if Documents is None else Documents
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         self.status = status
@@ -71,26 +72,28 @@ class ActivityRecord(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Documents._ActivityRecords = filtered
-        for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Documents = value
+            p._ActivityRecords.discard(self)
+        self._Documents = RefList()
+        self.addDocuments(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
-        for obj in Documents:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Documents.append(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ActivityRecords.append(self)
+            collection.append(obj)
 
     def removeDocuments(self, *Documents):
-        for obj in Documents:
-            if self in obj._ActivityRecords:
-                obj._ActivityRecords.remove(self)
-            self._Documents.remove(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ActivityRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllDocuments(self):
+        for obj in self._Documents:
+            obj._ActivityRecords.discard(self)
+        self._Documents = RefList()
 
     def getAssets(self):
         """All assets for which this activity record has been created.
@@ -99,26 +102,28 @@ class ActivityRecord(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Assets._ActivityRecords = filtered
-        for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Assets = value
+            p._ActivityRecords.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ActivityRecords.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._ActivityRecords:
-                obj._ActivityRecords.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ActivityRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._ActivityRecords.discard(self)
+        self._Assets = RefList()
 
     # Information on consequence of event resulting in this activity record.
     status = None
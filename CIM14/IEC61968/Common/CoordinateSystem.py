@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class CoordinateSystem(Element):
     """Coordinate reference system.
@@ -37,7 +38,7 @@ class CoordinateSystem(Element):
         self._Location = None
         self.Location = Location
 
-        self._PositionPoints = []
+        self._PositionPoints = RefList()
         self.PositionPoints = [] if PositionPoints is None else PositionPoints
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
@@ -56,8 +57,7 @@ class CoordinateSystem(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.CoordinateSystems if x != self]
-            self._Location._CoordinateSystems = filtered
+            self._Location._CoordinateSystems.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -73,18 +73,30 @@ class CoordinateSystem(Element):
 
     def setPositionPoints(self, value):
         for x in self._PositionPoints:
-            x.CoordinateSystem = None
-        for y in value:
-            y._CoordinateSystem = self
-        self._PositionPoints = value
+            x._CoordinateSystem = None
+        self._PositionPoints = RefList()
+        self.addPositionPoints(value)
 
     PositionPoints = property(getPositionPoints, setPositionPoints)
 
     def addPositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.CoordinateSystem = self
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            old = obj._CoordinateSystem
+            if old is not None and old is not self:
+                old._PositionPoints.discard(obj)
+            obj._CoordinateSystem = self
+            collection.append(obj)
 
     def removePositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.CoordinateSystem = None
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            if obj._CoordinateSystem is self:
+                obj._CoordinateSystem = None
+                collection.discard(obj)
+
+    def removeAllPositionPoints(self):
+        for obj in self._PositionPoints:
+            obj._CoordinateSystem = None
+        self._PositionPoints = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Document(IdentifiedObject):
     """Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.
@@ -61,12 +62,12 @@ class Document(IdentifiedObject):
 
         self.status = status
 
-        self._ActivityRecords = []
+        self._ActivityRecords = RefList()
         self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
 
         self.docStatus = docStatus
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         super(Document, self).__init__(*args, **kw_args)
@@ -91,26 +92,28 @@ class Document(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Documents if q != self]
-            self._ActivityRecords._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._ActivityRecords = value
+            p._Documents.discard(self)
+        self._ActivityRecords = RefList()
+        self.addActivityRecords(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ActivityRecords.append(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._ActivityRecords.remove(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllActivityRecords(self):
+        for obj in self._ActivityRecords:
+            obj._Documents.discard(self)
+        self._ActivityRecords = RefList()
 
     # Status of this document. For status of subject matter this document represents (e.g., Agreement, Work), use 'status' attribute. Example values for 'docStatus.status' are draft, approved, cancelled, etc.
     docStatus = None
@@ -122,24 +125,26 @@ class Document(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Documents if q != self]
-            self._Measurements._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._Measurements = value
+            p._Documents.discard(self)
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._Measurements.append(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._Measurements.remove(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Documents.discard(self)
+        self._Measurements = RefList()
 
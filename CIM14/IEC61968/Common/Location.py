@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It is defined with one or more postition points (coordinates) in a given coordinate system.
@@ -55,21 +56,21 @@ class Location(IdentifiedObject):
         #: Category by utility's corporate standards and practices, relative to the location itself (e.g., geographical, functional accounting, etc., not a given property that happens to exist at that location).
         self.category = category
 
-        self._PositionPoints = []
+        self._PositionPoints = RefList()
         self.PositionPoints = [] if PositionPoints is None else PositionPoints
 
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
-        self._CoordinateSystems = []
+        self._CoordinateSystems = RefList()
         self.CoordinateSystems = [] if CoordinateSystems is None else CoordinateSystems
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         self.secondaryAddress = secondaryAddress
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         self.phone2 = phone2
@@ -98,20 +99,32 @@ class Location(IdentifiedObject):
 
     def setPositionPoints(self, value):
         for x in self._PositionPoints:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PositionPoints = value
+            x._Location = None
+        self._PositionPoints = RefList()
+        self.addPositionPoints(value)
 
     PositionPoints = property(getPositionPoints, setPositionPoints)
 
     def addPositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = self
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PositionPoints.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = None
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPositionPoints(self):
+        for obj in self._PositionPoints:
+            obj._Location = None
+        self._PositionPoints = RefList()
 
     def getPowerSystemResources(self):
         """All power system resources at this location.
@@ -120,20 +133,32 @@ class Location(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PowerSystemResources = value
+            x._Location = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Location = None
+        self._PowerSystemResources = RefList()
 
     def getCoordinateSystems(self):
         """All coordinate systems used to describe position points of this location.
@@ -142,20 +167,32 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystems(self, value):
         for x in self._CoordinateSystems:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._CoordinateSystems = value
+            x._Location = None
+        self._CoordinateSystems = RefList()
+        self.addCoordinateSystems(value)
 
     CoordinateSystems = property(getCoordinateSystems, setCoordinateSystems)
 
     def addCoordinateSystems(self, *CoordinateSystems):
-        for obj in CoordinateSystems:
-            obj.Location = self
+        collection = self._CoordinateSystems
+        for obj in members(CoordinateSystems):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._CoordinateSystems.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removeCoordinateSystems(self, *CoordinateSystems):
-        for obj in CoordinateSystems:
-            obj.Location = None
+        collection = self._CoordinateSystems
+        for obj in members(CoordinateSystems):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllCoordinateSystems(self):
+        for obj in self._CoordinateSystems:
+            obj._Location = None
+        self._CoordinateSystems = RefList()
 
     def getMeasurements(self):
         
@@ -163,26 +200,28 @@ class Location(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Locations if q != self]
-            self._Measurements._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._Measurements = value
+            p._Locations.discard(self)
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Measurements.append(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._Measurements.remove(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Locations.discard(self)
+        self._Measurements = RefList()
 
     # Secondary address of the location. For example, PO Box address may have different ZIP code than that in the 'mainAddress'.
     secondaryAddress = None
@@ -194,20 +233,32 @@ class Location(IdentifiedObject):
 
     def setAssets(self, value):
         for x in self._Assets:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._Assets = value
+            x._Location = None
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            obj.Location = self
+        collection = self._Assets
+        for obj in members(Assets):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._Assets.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            obj.Location = None
+        collection = self._Assets
+        for obj in members(Assets):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._Location = None
+        self._Assets = RefList()
 
     # Additional phone number.
     phone2 = None
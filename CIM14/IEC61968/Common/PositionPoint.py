@@ -68,8 +68,7 @@ class PositionPoint(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PositionPoints if x != self]
-            self._Location._PositionPoints = filtered
+            self._Location._PositionPoints.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -85,8 +84,7 @@ class PositionPoint(Element):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.PositionPoints if x != self]
-            self._CoordinateSystem._PositionPoints = filtered
+            self._CoordinateSystem._PositionPoints.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
@@ -66,8 +66,7 @@ class TimePoint(IdentifiedObject):
 
     def setTimeSchedule(self, value):
         if self._TimeSchedule is not None:
-            filtered = [x for x in self.TimeSchedule.TimePoints if x != self]
-            self._TimeSchedule._TimePoints = filtered
+            self._TimeSchedule._TimePoints.discard(self)
 
         self._TimeSchedule = value
         if self._TimeSchedule is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class UserAttribute(Element):
     """Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.
@@ -43,13 +44,13 @@ class UserAttribute(Element):
         #: Name of an attribute.
         self.name = name
 
-        self._PropertyAssets = []
+        self._PropertyAssets = RefList()
         self.PropertyAssets = [] if PropertyAssets is None else PropertyAssets
 
         self._Transaction = None
         self.Transaction = Transaction
 
-        self._RatingAssets = []
+        self._RatingAssets = RefList()
         self.RatingAssets = [] if RatingAssets is None else RatingAssets
 
         super(UserAttribute, self).__init__(*args, **kw_args)
@@ -67,26 +68,28 @@ class UserAttribute(Element):
 
     def setPropertyAssets(self, value):
         for p in self._PropertyAssets:
-            filtered = [q for q in p.Properties if q != self]
-            self._PropertyAssets._Properties = filtered
-        for r in value:
-            if self not in r._Properties:
-                r._Properties.append(self)
-        self._PropertyAssets = value
+            p._Properties.discard(self)
+        self._PropertyAssets = RefList()
+        self.addPropertyAssets(value)
 
     PropertyAssets = property(getPropertyAssets, setPropertyAssets)
 
     def addPropertyAssets(self, *PropertyAssets):
-        for obj in PropertyAssets:
-            if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._PropertyAssets.append(obj)
+        collection = self._PropertyAssets
+        for obj in members(PropertyAssets):
+            obj._Properties.append(self)
+            collection.append(obj)
 
     def removePropertyAssets(self, *PropertyAssets):
-        for obj in PropertyAssets:
-            if self in obj._Properties:
-                obj._Properties.remove(self)
-            self._PropertyAssets.remove(obj)
+        collection = self._PropertyAssets
+        for obj in members(PropertyAssets):
+            obj._Properties.discard(self)
+            collection.discard(obj)
+
+    def removeAllPropertyAssets(self):
+        for obj in self._PropertyAssets:
+            obj._Properties.discard(self)
+        self._PropertyAssets = RefList()
 
     def getTransaction(self):
         """Transaction for which this snapshot has been recorded.
@@ -95,8 +98,7 @@ class UserAttribute(Element):
 
     def setTransaction(self, value):
         if self._Transaction is not None:
-            filtered = [x for x in self.Transaction.UserAttributes if x != self]
-            self._Transaction._UserAttributes = filtered
+            self._Transaction._UserAttributes.discard(self)
 
         self._Transaction = value
         if self._Transaction is not None:
@@ -111,24 +113,26 @@ class UserAttribute(Element):
 
     def setRatingAssets(self, value):
         for p in self._RatingAssets:
-            filtered = [q for q in p.Ratings if q != self]
-            self._RatingAssets._Ratings = filtered
-        for r in value:
-            if self not in r._Ratings:
-                r._Ratings.append(self)
-        self._RatingAssets = value
+            p._Ratings.discard(self)
+        self._RatingAssets = RefList()
+        self.addRatingAssets(value)
 
     RatingAssets = property(getRatingAssets, setRatingAssets)
 
     def addRatingAssets(self, *RatingAssets):
-        for obj in RatingAssets:
-            if self not in obj._Ratings:
-                obj._Ratings.append(self)
-            self._RatingAssets.append(obj)
+        collection = self._RatingAssets
+        for obj in members(RatingAssets):
+            obj._Ratings.append(self)
+            collection.append(obj)
 
     def removeRatingAssets(self, *RatingAssets):
-        for obj in RatingAssets:
-            if self in obj._Ratings:
-                obj._Ratings.remove(self)
-            self._RatingAssets.remove(obj)
+        collection = self._RatingAssets
+        for obj in members(RatingAssets):
+            obj._Ratings.discard(self)
+            collection.discard(obj)
+
+    def removeAllRatingAssets(self):
+        for obj in self._RatingAssets:
+            obj._Ratings.discard(self)
+        self._RatingAssets = RefList()
 
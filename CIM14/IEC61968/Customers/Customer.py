@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Organisation import Organisation
+from PyCIM.RefList import RefList, members
 
 class Customer(Organisation):
     """Organisation receiving services from ServiceSupplier.
@@ -50,13 +51,13 @@ class Customer(Organisation):
 
         self.status = status
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._EndDeviceAssets = []
+        self._EndDeviceAssets = RefList()
         self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
 
         super(Customer, self).__init__(*args, **kw_args)
@@ -78,26 +79,28 @@ class Customer(Organisation):
 
     def setWorks(self, value):
         for p in self._Works:
-            filtered = [q for q in p.Customers if q != self]
-            self._Works._Customers = filtered
-        for r in value:
-            if self not in r._Customers:
-                r._Customers.append(self)
-        self._Works = value
+            p._Customers.discard(self)
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            if self not in obj._Customers:
-                obj._Customers.append(self)
-            self._Works.append(obj)
+        collection = self._Works
+        for obj in members(Works):
+            obj._Customers.append(self)
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            if self in obj._Customers:
-                obj._Customers.remove(self)
-            self._Works.remove(obj)
+        collection = self._Works
+        for obj in members(Works):
+            obj._Customers.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._Customers.discard(self)
+        self._Works = RefList()
 
     def getCustomerAgreements(self):
         """All agreements of this customer.
@@ -106,20 +109,32 @@ class Customer(Organisation):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.Customer = None
-        for y in value:
-            y._Customer = self
-        self._CustomerAgreements = value
+            x._Customer = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.Customer = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._Customer
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._Customer = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.Customer = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._Customer is self:
+                obj._Customer = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._Customer = None
+        self._CustomerAgreements = RefList()
 
     def getEndDeviceAssets(self):
         """All end device assets of this customer.
@@ -128,18 +143,30 @@ class Customer(Organisation):
 
     def setEndDeviceAssets(self, value):
         for x in self._EndDeviceAssets:
-            x.Customer = None
-        for y in value:
-            y._Customer = self
-        self._EndDeviceAssets = value
+            x._Customer = None
+        self._EndDeviceAssets = RefList()
+        self.addEndDeviceAssets(value)
 
     EndDeviceAssets = property(getEndDeviceAssets, setEndDeviceAssets)
 
     def addEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.Customer = self
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            old = obj._Customer
+            if old is not None and old is not self:
+                old._EndDeviceAssets.discard(obj)
+            obj._Customer = self
+            collection.append(obj)
 
     def removeEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.Customer = None
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            if obj._Customer is self:
+                obj._Customer = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceAssets(self):
+        for obj in self._EndDeviceAssets:
+            obj._Customer = None
+        self._EndDeviceAssets = RefList()
 
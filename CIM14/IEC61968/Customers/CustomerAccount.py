@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class CustomerAccount(Document):
     """Assignment of a group of products and services purchased by the Customer through a CustomerAgreement, used as a mechanism for customer billing and payment. It contains common information from the various types of CustomerAgreements to create billings (invoices) for a Customer and receive payment.
@@ -30,10 +31,10 @@ class CustomerAccount(Document):
         @param PaymentTransactions: All payment transactions for this customer account.
         @param CustomerAgreements: All agreements for this customer account.
         """
-        self._PaymentTransactions = []
+        self._PaymentTransactions = RefList()
         self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
         super(CustomerAccount, self).__init__(*args, **kw_args)
@@ -52,20 +53,32 @@ class CustomerAccount(Document):
 
     def setPaymentTransactions(self, value):
         for x in self._PaymentTransactions:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._PaymentTransactions = value
+            x._CustomerAccount = None
+        self._PaymentTransactions = RefList()
+        self.addPaymentTransactions(value)
 
     PaymentTransactions = property(getPaymentTransactions, setPaymentTransactions)
 
     def addPaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.CustomerAccount = self
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._PaymentTransactions.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removePaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.CustomerAccount = None
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllPaymentTransactions(self):
+        for obj in self._PaymentTransactions:
+            obj._CustomerAccount = None
+        self._PaymentTransactions = RefList()
 
     def getCustomerAgreements(self):
         """All agreements for this customer account.
@@ -74,18 +87,30 @@ class CustomerAccount(Document):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._CustomerAgreements = value
+            x._CustomerAccount = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.CustomerAccount = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.CustomerAccount = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._CustomerAccount = None
+        self._CustomerAgreements = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Agreement import Agreement
+from PyCIM.RefList import RefList, members
 
 class CustomerAgreement(Agreement):
     """Agreement between the Customer and the ServiceSupplier to pay for service at a specific ServiceLocation. It records certain billing information about the type of service provided at the ServiceLocation and is used during charge creation to determine the type of service.
@@ -58,34 +59,34 @@ class CustomerAgreement(Agreement):
         self._ServiceSupplier = None
         self.ServiceSupplier = ServiceSupplier
 
-        self._PricingStructures = []
+        self._PricingStructures = RefList()
         self.PricingStructures = [] if PricingStructures is None else PricingStructures
 
-        self._ServiceLocations = []
+        self._ServiceLocations = RefList()
         self.ServiceLocations = [] if ServiceLocations is None else ServiceLocations
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._MeterReadings = []
+        self._MeterReadings = RefList()
         self.MeterReadings = [] if MeterReadings is None else MeterReadings
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
 
-        self._AuxiliaryAgreements = []
+        self._AuxiliaryAgreements = RefList()
         self.AuxiliaryAgreements = [] if AuxiliaryAgreements is None else AuxiliaryAgreements
 
-        self._EndDeviceControls = []
+        self._EndDeviceControls = RefList()
         self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
-        self._Equipments = []
+        self._Equipments = RefList()
         self.Equipments = [] if Equipments is None else Equipments
 
         super(CustomerAgreement, self).__init__(*args, **kw_args)
@@ -104,8 +105,7 @@ class CustomerAgreement(Agreement):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.CustomerAgreements if x != self]
-            self._DemandResponseProgram._CustomerAgreements = filtered
+            self._DemandResponseProgram._CustomerAgreements.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
@@ -121,8 +121,7 @@ class CustomerAgreement(Agreement):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.CustomerAgreements if x != self]
-            self._ServiceSupplier._CustomerAgreements = filtered
+            self._ServiceSupplier._CustomerAgreements.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
@@ -138,26 +137,28 @@ class CustomerAgreement(Agreement):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._PricingStructures._CustomerAgreements = filtered
-        for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._PricingStructures = value
+            p._CustomerAgreements.discard(self)
+        self._PricingStructures = RefList()
+        self.addPricingStructures(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._PricingStructures.append(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._CustomerAgreements.append(self)
+            collection.append(obj)
 
     def removePricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self in obj._CustomerAgreements:
-                obj._CustomerAgreements.remove(self)
-            self._PricingStructures.remove(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._CustomerAgreements.discard(self)
+            collection.discard(obj)
+
+    def removeAllPricingStructures(self):
+        for obj in self._PricingStructures:
+            obj._CustomerAgreements.discard(self)
+        self._PricingStructures = RefList()
 
     def getServiceLocations(self):
         """All service locations regulated by this customer agreement.
@@ -166,26 +167,28 @@ class CustomerAgreement(Agreement):
 
     def setServiceLocations(self, value):
         for p in self._ServiceLocations:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._ServiceLocations._CustomerAgreements = filtered
-        for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._ServiceLocations = value
+            p._CustomerAgreements.discard(self)
+        self._ServiceLocations = RefList()
+        self.addServiceLocations(value)
 
     ServiceLocations = property(getServiceLocations, setServiceLocations)
 
     def addServiceLocations(self, *ServiceLocations):
-        for obj in ServiceLocations:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._ServiceLocations.append(obj)
+        collection = self._ServiceLocations
+        for obj in members(ServiceLocations):
+            obj._CustomerAgreements.append(self)
+            collection.append(obj)
 
     def removeServiceLocations(self, *ServiceLocations):
-        for obj in ServiceLocations:
-            if self in obj._CustomerAgreements:
-                obj._CustomerAgreements.remove(self)
-            self._ServiceLocations.remove(obj)
+        collection = self._ServiceLocations
+        for obj in members(ServiceLocations):
+            obj._CustomerAgreements.discard(self)
+            collection.discard(obj)
+
+    def removeAllServiceLocations(self):
+        for obj in self._ServiceLocations:
+            obj._CustomerAgreements.discard(self)
+        self._ServiceLocations = RefList()
 
     def getServiceCategory(self):
         
@@ -193,8 +196,7 @@ class CustomerAgreement(Agreement):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.CustomerAgreements if x != self]
-            self._ServiceCategory._CustomerAgreements = filtered
+            self._ServiceCategory._CustomerAgreements.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
@@ -210,20 +212,32 @@ class CustomerAgreement(Agreement):
 
     def setMeterReadings(self, value):
         for x in self._MeterReadings:
-            x.CustomerAgreement = None
-        for y in value:
-            y._CustomerAgreement = self
-        self._MeterReadings = value
+            x._CustomerAgreement = None
+        self._MeterReadings = RefList()
+        self.addMeterReadings(value)
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.CustomerAgreement = self
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            old = obj._CustomerAgreement
+            if old is not None and old is not self:
+                old._MeterReadings.discard(obj)
+            obj._CustomerAgreement = self
+            collection.append(obj)
 
     def removeMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.CustomerAgreement = None
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            if obj._CustomerAgreement is self:
+                obj._CustomerAgreement = None
+                collection.discard(obj)
+
+    def removeAllMeterReadings(self):
+        for obj in self._MeterReadings:
+            obj._CustomerAgreement = None
+        self._MeterReadings = RefList()
 
     def getCustomerAccount(self):
         """Customer account owning this agreement.
@@ -232,8 +246,7 @@ class CustomerAgreement(Agreement):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.CustomerAgreements if x != self]
-            self._CustomerAccount._CustomerAgreements = filtered
+            self._CustomerAccount._CustomerAgreements.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
@@ -249,20 +262,32 @@ class CustomerAgreement(Agreement):
 
     def setAuxiliaryAgreements(self, value):
         for x in self._AuxiliaryAgreements:
-            x.CustomerAgreement = None
-        for y in value:
-            y._CustomerAgreement = self
-        self._AuxiliaryAgreements = value
+            x._CustomerAgreement = None
+        self._AuxiliaryAgreements = RefList()
+        self.addAuxiliaryAgreements(value)
 
     AuxiliaryAgreements = property(getAuxiliaryAgreements, setAuxiliaryAgreements)
 
     def addAuxiliaryAgreements(self, *AuxiliaryAgreements):
-        for obj in AuxiliaryAgreements:
-            obj.CustomerAgreement = self
+        collection = self._AuxiliaryAgreements
+        for obj in members(AuxiliaryAgreements):
+            old = obj._CustomerAgreement
+            if old is not None and old is not self:
+                old._AuxiliaryAgreements.discard(obj)
+            obj._CustomerAgreement = self
+            collection.append(obj)
 
     def removeAuxiliaryAgreements(self, *AuxiliaryAgreements):
-        for obj in AuxiliaryAgreements:
-            obj.CustomerAgreement = None
+        collection = self._AuxiliaryAgreements
+        for obj in members(AuxiliaryAgreements):
+            if obj._CustomerAgreement is self:
+                obj._CustomerAgreement = None
+                collection.discard(obj)
+
+    def removeAllAuxiliaryAgreements(self):
+        for obj in self._AuxiliaryAgreements:
+            obj._CustomerAgreement = None
+        self._AuxiliaryAgreements = RefList()
 
     def getEndDeviceControls(self):
         """Could be deprecated in the future.
@@ -271,20 +296,32 @@ class CustomerAgreement(Agreement):
 
     def setEndDeviceControls(self, value):
         for x in self._EndDeviceControls:
-            x.CustomerAgreement = None
-        for y in value:
-            y._CustomerAgreement = self
-        self._EndDeviceControls = value
+            x._CustomerAgreement = None
+        self._EndDeviceControls = RefList()
+        self.addEndDeviceControls(value)
 
     EndDeviceControls = property(getEndDeviceControls, setEndDeviceControls)
 
     def addEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.CustomerAgreement = self
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            old = obj._CustomerAgreement
+            if old is not None and old is not self:
+                old._EndDeviceControls.discard(obj)
+            obj._CustomerAgreement = self
+            collection.append(obj)
 
     def removeEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.CustomerAgreement = None
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            if obj._CustomerAgreement is self:
+                obj._CustomerAgreement = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceControls(self):
+        for obj in self._EndDeviceControls:
+            obj._CustomerAgreement = None
+        self._EndDeviceControls = RefList()
 
     def getCustomer(self):
         """Customer for this agreement.
@@ -293,8 +330,7 @@ class CustomerAgreement(Agreement):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.CustomerAgreements if x != self]
-            self._Customer._CustomerAgreements = filtered
+            self._Customer._CustomerAgreements.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
@@ -310,20 +346,32 @@ class CustomerAgreement(Agreement):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.CustomerAgreement = None
-        for y in value:
-            y._CustomerAgreement = self
-        self._ServiceDeliveryPoints = value
+            x._CustomerAgreement = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.CustomerAgreement = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._CustomerAgreement
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._CustomerAgreement = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.CustomerAgreement = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._CustomerAgreement is self:
+                obj._CustomerAgreement = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._CustomerAgreement = None
+        self._ServiceDeliveryPoints = RefList()
 
     def getEquipments(self):
         
@@ -331,24 +379,26 @@ class CustomerAgreement(Agreement):
 
     def setEquipments(self, value):
         for p in self._Equipments:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._Equipments._CustomerAgreements = filtered
-        for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._Equipments = value
+            p._CustomerAgreements.discard(self)
+        self._Equipments = RefList()
+        self.addEquipments(value)
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
-        for obj in Equipments:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._Equipments.append(obj)
+        collection = self._Equipments
+        for obj in members(Equipments):
+            obj._CustomerAgreements.append(self)
+            collection.append(obj)
 
     def removeEquipments(self, *Equipments):
-        for obj in Equipments:
-            if self in obj._CustomerAgreements:
-                obj._CustomerAgreements.remove(self)
-            self._Equipments.remove(obj)
+        collection = self._Equipments
+        for obj in members(Equipments):
+            obj._CustomerAgreements.discard(self)
+            collection.discard(obj)
+
+    def removeAllEquipments(self):
+        for obj in self._Equipments:
+            obj._CustomerAgreements.discard(self)
+        self._Equipments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class PricingStructure(Document):
     """Grouping of pricing components and prices used in the creation of customer charges and the eligibility criteria under which these terms may be offered to a customer. The reasons for grouping include state, customer classification, site characteristics, classification (i.e. fee price structure, deposit price structure, electric service price structure, etc.) and accounting requirements.
@@ -57,19 +58,19 @@ class PricingStructure(Document):
         #: Absolute maximum valid non-demand usage quantity used in validating a customer's billed non-demand usage.
         self.dailyCeilingUsage = dailyCeilingUsage
 
-        self._Transactions = []
+        self._Transactions = RefList()
         self.Transactions = [] if Transactions is None else Transactions
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._Tariffs = []
+        self._Tariffs = RefList()
         self.Tariffs = [] if Tariffs is None else Tariffs
 
         super(PricingStructure, self).__init__(*args, **kw_args)
@@ -88,20 +89,32 @@ class PricingStructure(Document):
 
     def setTransactions(self, value):
         for x in self._Transactions:
-            x.PricingStructure = None
-        for y in value:
-            y._PricingStructure = self
-        self._Transactions = value
+            x._PricingStructure = None
+        self._Transactions = RefList()
+        self.addTransactions(value)
 
     Transactions = property(getTransactions, setTransactions)
 
     def addTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.PricingStructure = self
+        collection = self._Transactions
+        for obj in members(Transactions):
+            old = obj._PricingStructure
+            if old is not None and old is not self:
+                old._Transactions.discard(obj)
+            obj._PricingStructure = self
+            collection.append(obj)
 
     def removeTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.PricingStructure = None
+        collection = self._Transactions
+        for obj in members(Transactions):
+            if obj._PricingStructure is self:
+                obj._PricingStructure = None
+                collection.discard(obj)
+
+    def removeAllTransactions(self):
+        for obj in self._Transactions:
+            obj._PricingStructure = None
+        self._Transactions = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points (with prepayment meter running as a stand-alone device, with no CustomerAgreement or Customer) to which this pricing structure applies.
@@ -110,26 +123,28 @@ class PricingStructure(Document):
 
     def setServiceDeliveryPoints(self, value):
         for p in self._ServiceDeliveryPoints:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._ServiceDeliveryPoints._PricingStructures = filtered
-        for r in value:
-            if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
-        self._ServiceDeliveryPoints = value
+            p._PricingStructures.discard(self)
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._ServiceDeliveryPoints.append(obj)
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            obj._PricingStructures.append(self)
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            if self in obj._PricingStructures:
-                obj._PricingStructures.remove(self)
-            self._ServiceDeliveryPoints.remove(obj)
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            obj._PricingStructures.discard(self)
+            collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._PricingStructures.discard(self)
+        self._ServiceDeliveryPoints = RefList()
 
     def getCustomerAgreements(self):
         """All customer agreements with this pricing structure.
@@ -138,26 +153,28 @@ class PricingStructure(Document):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._CustomerAgreements._PricingStructures = filtered
-        for r in value:
-            if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
-        self._CustomerAgreements = value
+            p._PricingStructures.discard(self)
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._CustomerAgreements.append(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._PricingStructures.append(self)
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self in obj._PricingStructures:
-                obj._PricingStructures.remove(self)
-            self._CustomerAgreements.remove(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._PricingStructures.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._PricingStructures.discard(self)
+        self._CustomerAgreements = RefList()
 
     def getServiceCategory(self):
         """Service category to which this pricing structure applies.
@@ -166,8 +183,7 @@ class PricingStructure(Document):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.PricingStructures if x != self]
-            self._ServiceCategory._PricingStructures = filtered
+            self._ServiceCategory._PricingStructures.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
@@ -183,24 +199,26 @@ class PricingStructure(Document):
 
     def setTariffs(self, value):
         for p in self._Tariffs:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._Tariffs._PricingStructures = filtered
-        for r in value:
-            if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
-        self._Tariffs = value
+            p._PricingStructures.discard(self)
+        self._Tariffs = RefList()
+        self.addTariffs(value)
 
     Tariffs = property(getTariffs, setTariffs)
 
     def addTariffs(self, *Tariffs):
-        for obj in Tariffs:
-            if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._Tariffs.append(obj)
+        collection = self._Tariffs
+        for obj in members(Tariffs):
+            obj._PricingStructures.append(self)
+            collection.append(obj)
 
     def removeTariffs(self, *Tariffs):
-        for obj in Tariffs:
-            if self in obj._PricingStructures:
-                obj._PricingStructures.remove(self)
-            self._Tariffs.remove(obj)
+        collection = self._Tariffs
+        for obj in members(Tariffs):
+            obj._PricingStructures.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffs(self):
+        for obj in self._Tariffs:
+            obj._PricingStructures.discard(self)
+        self._Tariffs = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ServiceCategory(IdentifiedObject):
     """Category of service provided to the customer.
@@ -35,13 +36,13 @@ class ServiceCategory(IdentifiedObject):
         #: Kind of service. Values are: "water", "time", "electricity", "heat", "rates", "gas", "internet", "refuse", "other", "tvLicence", "sewerage"
         self.kind = kind
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._PricingStructures = []
+        self._PricingStructures = RefList()
         self.PricingStructures = [] if PricingStructures is None else PricingStructures
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         super(ServiceCategory, self).__init__(*args, **kw_args)
@@ -59,20 +60,32 @@ class ServiceCategory(IdentifiedObject):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.ServiceCategory = None
-        for y in value:
-            y._ServiceCategory = self
-        self._CustomerAgreements = value
+            x._ServiceCategory = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.ServiceCategory = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._ServiceCategory
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._ServiceCategory = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.ServiceCategory = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._ServiceCategory is self:
+                obj._ServiceCategory = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._ServiceCategory = None
+        self._CustomerAgreements = RefList()
 
     def getPricingStructures(self):
         """All pricing structures applicable to this service category.
@@ -81,20 +94,32 @@ class ServiceCategory(IdentifiedObject):
 
     def setPricingStructures(self, value):
         for x in self._PricingStructures:
-            x.ServiceCategory = None
-        for y in value:
-            y._ServiceCategory = self
-        self._PricingStructures = value
+            x._ServiceCategory = None
+        self._PricingStructures = RefList()
+        self.addPricingStructures(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            obj.ServiceCategory = self
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            old = obj._ServiceCategory
+            if old is not None and old is not self:
+                old._PricingStructures.discard(obj)
+            obj._ServiceCategory = self
+            collection.append(obj)
 
     def removePricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            obj.ServiceCategory = None
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            if obj._ServiceCategory is self:
+                obj._ServiceCategory = None
+                collection.discard(obj)
+
+    def removeAllPricingStructures(self):
+        for obj in self._PricingStructures:
+            obj._ServiceCategory = None
+        self._PricingStructures = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points that deliver this category of service.
@@ -103,18 +128,30 @@ class ServiceCategory(IdentifiedObject):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.ServiceCategory = None
-        for y in value:
-            y._ServiceCategory = self
-        self._ServiceDeliveryPoints = value
+            x._ServiceCategory = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceCategory = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._ServiceCategory
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._ServiceCategory = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceCategory = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._ServiceCategory is self:
+                obj._ServiceCategory = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._ServiceCategory = None
+        self._ServiceDeliveryPoints = RefList()
 
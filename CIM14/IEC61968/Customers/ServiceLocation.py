@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Location import Location
+from PyCIM.RefList import RefList, members
 
 class ServiceLocation(Location):
     """A customer ServiceLocation has one or more ServiceDeliveryPoint(s), which in turn relate to Meters. The location may be a point or a polygon, depending on the specific circumstances. For distribution, the ServiceLocation is typically the location of the utility customer's premise. Because a customer's premise may have one or more meters, the ServiceDeliveryPoint is used to define the actual conducting equipment that the EndDeviceAsset attaches to at the utility customer's ServiceLocation. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party.
@@ -43,13 +44,13 @@ class ServiceLocation(Location):
         #: True if inspection is needed of facilities at this service location. This could be requested by a customer, due to suspected tampering, environmental concerns (e.g., a fire in the vicinity), or to correct incompatible data.
         self.needsInspection = needsInspection
 
-        self._EndDeviceAssets = []
+        self._EndDeviceAssets = RefList()
         self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         super(ServiceLocation, self).__init__(*args, **kw_args)
@@ -68,20 +69,32 @@ class ServiceLocation(Location):
 
     def setEndDeviceAssets(self, value):
         for x in self._EndDeviceAssets:
-            x.ServiceLocation = None
-        for y in value:
-            y._ServiceLocation = self
-        self._EndDeviceAssets = value
+            x._ServiceLocation = None
+        self._EndDeviceAssets = RefList()
+        self.addEndDeviceAssets(value)
 
     EndDeviceAssets = property(getEndDeviceAssets, setEndDeviceAssets)
 
     def addEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.ServiceLocation = self
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            old = obj._ServiceLocation
+            if old is not None and old is not self:
+                old._EndDeviceAssets.discard(obj)
+            obj._ServiceLocation = self
+            collection.append(obj)
 
     def removeEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.ServiceLocation = None
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            if obj._ServiceLocation is self:
+                obj._ServiceLocation = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceAssets(self):
+        for obj in self._EndDeviceAssets:
+            obj._ServiceLocation = None
+        self._EndDeviceAssets = RefList()
 
     def getCustomerAgreements(self):
         """All customer agreements regulating this service location.
@@ -90,26 +103,28 @@ class ServiceLocation(Location):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.ServiceLocations if q != self]
-            self._CustomerAgreements._ServiceLocations = filtered
-        for r in value:
-            if self not in r._ServiceLocations:
-                r._ServiceLocations.append(self)
-        self._CustomerAgreements = value
+            p._ServiceLocations.discard(self)
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self not in obj._ServiceLocations:
-                obj._ServiceLocations.append(self)
-            self._CustomerAgreements.append(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._ServiceLocations.append(self)
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self in obj._ServiceLocations:
-                obj._ServiceLocations.remove(self)
-            self._CustomerAgreements.remove(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._ServiceLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._ServiceLocations.discard(self)
+        self._CustomerAgreements = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points delivering service (of the same type) to this service location.
@@ -118,18 +133,30 @@ class ServiceLocation(Location):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.ServiceLocation = None
-        for y in value:
-            y._ServiceLocation = self
-        self._ServiceDeliveryPoints = value
+            x._ServiceLocation = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceLocation = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._ServiceLocation
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._ServiceLocation = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceLocation = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._ServiceLocation is self:
+                obj._ServiceLocation = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._ServiceLocation = None
+        self._ServiceDeliveryPoints = RefList()
 
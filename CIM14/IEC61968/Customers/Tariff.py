@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Tariff(Document):
     """Document, approved by the responsible regulatory agency, listing the terms and conditions, including a schedule of prices, under which utility services will be provided. It has a unique number within the state or province. For Rate Schedules it is frequently allocated by the affiliated Public Utilities Commission.
@@ -38,10 +39,10 @@ class Tariff(Document):
         #: (if tariff became inactive) Date tariff was terminated.
         self.endDate = endDate
 
-        self._TariffProfiles = []
+        self._TariffProfiles = RefList()
         self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
 
-        self._PricingStructures = []
+        self._PricingStructures = RefList()
         self.PricingStructures = [] if PricingStructures is None else PricingStructures
 
         super(Tariff, self).__init__(*args, **kw_args)
@@ -60,26 +61,28 @@ class Tariff(Document):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.Tariffs if q != self]
-            self._TariffProfiles._Tariffs = filtered
-        for r in value:
-            if self not in r._Tariffs:
-                r._Tariffs.append(self)
-        self._TariffProfiles = value
+            p._Tariffs.discard(self)
+        self._TariffProfiles = RefList()
+        self.addTariffProfiles(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self not in obj._Tariffs:
-                obj._Tariffs.append(self)
-            self._TariffProfiles.append(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._Tariffs.append(self)
+            collection.append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self in obj._Tariffs:
-                obj._Tariffs.remove(self)
-            self._TariffProfiles.remove(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._Tariffs.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffProfiles(self):
+        for obj in self._TariffProfiles:
+            obj._Tariffs.discard(self)
+        self._TariffProfiles = RefList()
 
     def getPricingStructures(self):
         """All pricing structures using this tariff.
@@ -88,24 +91,26 @@ class Tariff(Document):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.Tariffs if q != self]
-            self._PricingStructures._Tariffs = filtered
-        for r in value:
-            if self not in r._Tariffs:
-                r._Tariffs.append(self)
-        self._PricingStructures = value
+            p._Tariffs.discard(self)
+        self._PricingStructures = RefList()
+        self.addPricingStructures(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self not in obj._Tariffs:
-                obj._Tariffs.append(self)
-            self._PricingStructures.append(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._Tariffs.append(self)
+            collection.append(obj)
 
     def removePricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self in obj._Tariffs:
-                obj._Tariffs.remove(self)
-            self._PricingStructures.remove(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._Tariffs.discard(self)
+            collection.discard(obj)
+
+    def removeAllPricingStructures(self):
+        for obj in self._PricingStructures:
+            obj._Tariffs.discard(self)
+        self._PricingStructures = RefList()
 
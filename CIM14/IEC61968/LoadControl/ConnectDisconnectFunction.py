@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Metering.DeviceFunction import DeviceFunction
+from PyCIM.RefList import RefList, members
 
 class ConnectDisconnectFunction(DeviceFunction):
     """A function that will disconnect or reconnect the customer's load under defined conditions.
@@ -60,7 +61,7 @@ class ConnectDisconnectFunction(DeviceFunction):
 
         self.rcdInfo = rcdInfo
 
-        self._Switches = []
+        self._Switches = RefList()
         self.Switches = [] if Switches is None else Switches
 
         super(ConnectDisconnectFunction, self).__init__(*args, **kw_args)
@@ -81,24 +82,26 @@ class ConnectDisconnectFunction(DeviceFunction):
 
     def setSwitches(self, value):
         for p in self._Switches:
-            filtered = [q for q in p.ConnectDisconnectFunctions if q != self]
-            self._Switches._ConnectDisconnectFunctions = filtered
-        for r in value:
-            if self not in r._ConnectDisconnectFunctions:
-                r._ConnectDisconnectFunctions.append(self)
-        self._Switches = value
+            p._ConnectDisconnectFunctions.discard(self)
+        self._Switches = RefList()
+        self.addSwitches(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
-        for obj in Switches:
-            if self not in obj._ConnectDisconnectFunctions:
-                obj._ConnectDisconnectFunctions.append(self)
-            self._Switches.append(obj)
+        collection = self._Switches
+        for obj in members(Switches):
+            obj._ConnectDisconnectFunctions.append(self)
+            collection.append(obj)
 
     def removeSwitches(self, *Switches):
-        for obj in Switches:
-            if self in obj._ConnectDisconnectFunctions:
-                obj._ConnectDisconnectFunctions.remove(self)
-            self._Switches.remove(obj)
+        collection = self._Switches
+        for obj in members(Switches):
+            obj._ConnectDisconnectFunctions.discard(self)
+            collection.discard(obj)
+
+    def removeAllSwitches(self):
+        for obj in self._Switches:
+            obj._ConnectDisconnectFunctions.discard(self)
+        self._Switches = RefList()
 
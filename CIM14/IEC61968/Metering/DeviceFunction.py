@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.AssetFunction import AssetFunction
+from PyCIM.RefList import RefList, members
 
 class DeviceFunction(AssetFunction):
     """Function performed by a device such as a meter, communication equipment, controllers, etc.
@@ -38,10 +39,10 @@ class DeviceFunction(AssetFunction):
         self._EndDeviceAsset = None
         self.EndDeviceAsset = EndDeviceAsset
 
-        self._Registers = []
+        self._Registers = RefList()
         self.Registers = [] if Registers is None else Registers
 
-        self._EndDeviceEvents = []
+        self._EndDeviceEvents = RefList()
         self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
 
         super(DeviceFunction, self).__init__(*args, **kw_args)
@@ -60,8 +61,7 @@ class DeviceFunction(AssetFunction):
 
     def setEndDeviceAsset(self, value):
         if self._EndDeviceAsset is not None:
-            filtered = [x for x in self.EndDeviceAsset.DeviceFunctions if x != self]
-            self._EndDeviceAsset._DeviceFunctions = filtered
+            self._EndDeviceAsset._DeviceFunctions.discard(self)
 
         self._EndDeviceAsset = value
         if self._EndDeviceAsset is not None:
@@ -77,20 +77,32 @@ class DeviceFunction(AssetFunction):
 
     def setRegisters(self, value):
         for x in self._Registers:
-            x.DeviceFunction = None
-        for y in value:
-            y._DeviceFunction = self
-        self._Registers = value
+            x._DeviceFunction = None
+        self._Registers = RefList()
+        self.addRegisters(value)
 
     Registers = property(getRegisters, setRegisters)
 
     def addRegisters(self, *Registers):
-        for obj in Registers:
-            obj.DeviceFunction = self
+        collection = self._Registers
+        for obj in members(Registers):
+            old = obj._DeviceFunction
+            if old is not None and old is not self:
+                old._Registers.discard(obj)
+            obj._DeviceFunction = self
+            collection.append(obj)
 
     def removeRegisters(self, *Registers):
-        for obj in Registers:
-            obj.DeviceFunction = None
+        collection = self._Registers
+        for obj in members(Registers):
+            if obj._DeviceFunction is self:
+                obj._DeviceFunction = None
+                collection.discard(obj)
+
+    def removeAllRegisters(self):
+        for obj in self._Registers:
+            obj._DeviceFunction = None
+        self._Registers = RefList()
 
     def getEndDeviceEvents(self):
         """All events reported by this device function.
@@ -99,18 +111,30 @@ class DeviceFunction(AssetFunction):
 
     def setEndDeviceEvents(self, value):
         for x in self._EndDeviceEvents:
-            x.DeviceFunction = None
-        for y in value:
-            y._DeviceFunction = self
-        self._EndDeviceEvents = value
+            x._DeviceFunction = None
+        self._EndDeviceEvents = RefList()
+        self.addEndDeviceEvents(value)
 
     EndDeviceEvents = property(getEndDeviceEvents, setEndDeviceEvents)
 
     def addEndDeviceEvents(self, *EndDeviceEvents):
-        for obj in EndDeviceEvents:
-            obj.DeviceFunction = self
+        collection = self._EndDeviceEvents
+        for obj in members(EndDeviceEvents):
+            old = obj._DeviceFunction
+            if old is not None and old is not self:
+                old._EndDeviceEvents.discard(obj)
+            obj._DeviceFunction = self
+            collection.append(obj)
 
     def removeEndDeviceEvents(self, *EndDeviceEvents):
-        for obj in EndDeviceEvents:
-            obj.DeviceFunction = None
+        collection = self._EndDeviceEvents
+        for obj in members(EndDeviceEvents):
+            if obj._DeviceFunction is self:
+                obj._DeviceFunction = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceEvents(self):
+        for obj in self._EndDeviceEvents:
+            obj._DeviceFunction = None
+        self._EndDeviceEvents = RefList()
 
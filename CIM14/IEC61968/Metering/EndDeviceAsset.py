@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.AssetContainer import AssetContainer
+from PyCIM.RefList import RefList, members
 
 class EndDeviceAsset(AssetContainer):
     """AssetContainer that performs one or more end device functions. One type of EndDeviceAsset is a MeterAsset which can perform metering, load management, connect/disconnect, accounting functions, etc. Some EndDeviceAssets, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a MeterAsset. All EndDeviceAssets may have communication capability defined by the associated ComFunction(s). An EndDeviceAsset may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.
@@ -92,7 +93,7 @@ class EndDeviceAsset(AssetContainer):
         #: True if this end device asset is capable of supporting load control functions through either the meter or the AMR option. To determine whether this functionality is installed and enabled, check the 'DeviceFunction.disabled' attribute of the respective function contained by this end device asset.
         self.loadControl = loadControl
 
-        self._EndDeviceGroups = []
+        self._EndDeviceGroups = RefList()
         self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
 
         self._ServiceLocation = None
@@ -101,16 +102,16 @@ class EndDeviceAsset(AssetContainer):
         self._EndDeviceModel = None
         self.EndDeviceModel = EndDeviceModel
 
-        self._DeviceFunctions = []
+        self._DeviceFunctions = RefList()
         self.DeviceFunctions = [] if DeviceFunctions is None else DeviceFunctions
 
         self._ServiceDeliveryPoint = None
         self.ServiceDeliveryPoint = ServiceDeliveryPoint
 
-        self._Readings = []
+        self._Readings = RefList()
         self.Readings = [] if Readings is None else Readings
 
-        self._EndDeviceControls = []
+        self._EndDeviceControls = RefList()
         self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
 
         self._Customer = None
@@ -132,26 +133,28 @@ class EndDeviceAsset(AssetContainer):
 
     def setEndDeviceGroups(self, value):
         for p in self._EndDeviceGroups:
-            filtered = [q for q in p.EndDeviceAssets if q != self]
-            self._EndDeviceGroups._EndDeviceAssets = filtered
-        for r in value:
-            if self not in r._EndDeviceAssets:
-                r._EndDeviceAssets.append(self)
-        self._EndDeviceGroups = value
+            p._EndDeviceAssets.discard(self)
+        self._EndDeviceGroups = RefList()
+        self.addEndDeviceGroups(value)
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
-        for obj in EndDeviceGroups:
-            if self not in obj._EndDeviceAssets:
-                obj._EndDeviceAssets.append(self)
-            self._EndDeviceGroups.append(obj)
+        collection = self._EndDeviceGroups
+        for obj in members(EndDeviceGroups):
+            obj._EndDeviceAssets.append(self)
+            collection.append(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
-        for obj in EndDeviceGroups:
-            if self in obj._EndDeviceAssets:
-                obj._EndDeviceAssets.remove(self)
-            self._EndDeviceGroups.remove(obj)
+        collection = self._EndDeviceGroups
+        for obj in members(EndDeviceGroups):
+            obj._EndDeviceAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllEndDeviceGroups(self):
+        for obj in self._EndDeviceGroups:
+            obj._EndDeviceAssets.discard(self)
+        self._EndDeviceGroups = RefList()
 
     def getServiceLocation(self):
         """Service location whose service delivery is measured by this end device asset.
@@ -160,8 +163,7 @@ class EndDeviceAsset(AssetContainer):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.EndDeviceAssets if x != self]
-            self._ServiceLocation._EndDeviceAssets = filtered
+            self._ServiceLocation._EndDeviceAssets.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
@@ -177,8 +179,7 @@ class EndDeviceAsset(AssetContainer):
 
     def setEndDeviceModel(self, value):
         if self._EndDeviceModel is not None:
-            filtered = [x for x in self.EndDeviceModel.EndDeviceAssets if x != self]
-            self._EndDeviceModel._EndDeviceAssets = filtered
+            self._EndDeviceModel._EndDeviceAssets.discard(self)
 
         self._EndDeviceModel = value
         if self._EndDeviceModel is not None:
@@ -194,20 +195,32 @@ class EndDeviceAsset(AssetContainer):
 
     def setDeviceFunctions(self, value):
         for x in self._DeviceFunctions:
-            x.EndDeviceAsset = None
-        for y in value:
-            y._EndDeviceAsset = self
-        self._DeviceFunctions = value
+            x._EndDeviceAsset = None
+        self._DeviceFunctions = RefList()
+        self.addDeviceFunctions(value)
 
     DeviceFunctions = property(getDeviceFunctions, setDeviceFunctions)
 
     def addDeviceFunctions(self, *DeviceFunctions):
-        for obj in DeviceFunctions:
-            obj.EndDeviceAsset = self
+        collection = self._DeviceFunctions
+        for obj in members(DeviceFunctions):
+            old = obj._EndDeviceAsset
+            if old is not None and old is not self:
+                old._DeviceFunctions.discard(obj)
+            obj._EndDeviceAsset = self
+            collection.append(obj)
 
     def removeDeviceFunctions(self, *DeviceFunctions):
-        for obj in DeviceFunctions:
-            obj.EndDeviceAsset = None
+        collection = self._DeviceFunctions
+        for obj in members(DeviceFunctions):
+            if obj._EndDeviceAsset is self:
+                obj._EndDeviceAsset = None
+                collection.discard(obj)
+
+    def removeAllDeviceFunctions(self):
+        for obj in self._DeviceFunctions:
+            obj._EndDeviceAsset = None
+        self._DeviceFunctions = RefList()
 
     def getServiceDeliveryPoint(self):
         """Service delivery point to which this end device asset belongs.
@@ -216,8 +229,7 @@ class EndDeviceAsset(AssetContainer):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.EndDeviceAssets if x != self]
-            self._ServiceDeliveryPoint._EndDeviceAssets = filtered
+            self._ServiceDeliveryPoint._EndDeviceAssets.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
@@ -232,20 +244,32 @@ class EndDeviceAsset(AssetContainer):
 
     def setReadings(self, value):
         for x in self._Readings:
-            x.EndDeviceAsset = None
-        for y in value:
-            y._EndDeviceAsset = self
-        self._Readings = value
+            x._EndDeviceAsset = None
+        self._Readings = RefList()
+        self.addReadings(value)
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
-        for obj in Readings:
-            obj.EndDeviceAsset = self
+        collection = self._Readings
+        for obj in members(Readings):
+            old = obj._EndDeviceAsset
+            if old is not None and old is not self:
+                old._Readings.discard(obj)
+            obj._EndDeviceAsset = self
+            collection.append(obj)
 
     def removeReadings(self, *Readings):
-        for obj in Readings:
-            obj.EndDeviceAsset = None
+        collection = self._Readings
+        for obj in members(Readings):
+            if obj._EndDeviceAsset is self:
+                obj._EndDeviceAsset = None
+                collection.discard(obj)
+
+    def removeAllReadings(self):
+        for obj in self._Readings:
+            obj._EndDeviceAsset = None
+        self._Readings = RefList()
 
     def getEndDeviceControls(self):
         """All end device controls sending commands to this end device asset.
@@ -254,20 +278,32 @@ class EndDeviceAsset(AssetContainer):
 
     def setEndDeviceControls(self, value):
         for x in self._EndDeviceControls:
-            x.EndDeviceAsset = None
-        for y in value:
-            y._EndDeviceAsset = self
-        self._EndDeviceControls = value
+            x._EndDeviceAsset = None
+        self._EndDeviceControls = RefList()
+        self.addEndDeviceControls(value)
 
     EndDeviceControls = property(getEndDeviceControls, setEndDeviceControls)
 
     def addEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.EndDeviceAsset = self
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            old = obj._EndDeviceAsset
+            if old is not None and old is not self:
+                old._EndDeviceControls.discard(obj)
+            obj._EndDeviceAsset = self
+            collection.append(obj)
 
     def removeEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.EndDeviceAsset = None
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            if obj._EndDeviceAsset is self:
+                obj._EndDeviceAsset = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceControls(self):
+        for obj in self._EndDeviceControls:
+            obj._EndDeviceAsset = None
+        self._EndDeviceControls = RefList()
 
     def getCustomer(self):
         """Customer owning this end device asset.
@@ -276,8 +312,7 @@ class EndDeviceAsset(AssetContainer):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.EndDeviceAssets if x != self]
-            self._Customer._EndDeviceAssets = filtered
+            self._Customer._EndDeviceAssets.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
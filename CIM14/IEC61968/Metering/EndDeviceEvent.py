@@ -56,8 +56,7 @@ class EndDeviceEvent(ActivityRecord):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.EndDeviceEvents if x != self]
-            self._MeterReading._EndDeviceEvents = filtered
+            self._MeterReading._EndDeviceEvents.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
@@ -73,8 +72,7 @@ class EndDeviceEvent(ActivityRecord):
 
     def setDeviceFunction(self, value):
         if self._DeviceFunction is not None:
-            filtered = [x for x in self.DeviceFunction.EndDeviceEvents if x != self]
-            self._DeviceFunction._EndDeviceEvents = filtered
+            self._DeviceFunction._EndDeviceEvents.discard(self)
 
         self._DeviceFunction = value
         if self._DeviceFunction is not None:
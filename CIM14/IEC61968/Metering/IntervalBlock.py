@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class IntervalBlock(Element):
     """Time sequence of Readings of the same ReadingType. Contained IntervalReadings may need conversion through the application of an offset and a scalar defined in associated Pending.
@@ -41,7 +42,7 @@ class IntervalBlock(Element):
         self._ReadingType = None
         self.ReadingType = ReadingType
 
-        self._IntervalReadings = []
+        self._IntervalReadings = RefList()
         self.IntervalReadings = [] if IntervalReadings is None else IntervalReadings
 
         super(IntervalBlock, self).__init__(*args, **kw_args)
@@ -60,8 +61,7 @@ class IntervalBlock(Element):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.IntervalBlocks if x != self]
-            self._MeterReading._IntervalBlocks = filtered
+            self._MeterReading._IntervalBlocks.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
@@ -77,8 +77,7 @@ class IntervalBlock(Element):
 
     def setPending(self, value):
         if self._Pending is not None:
-            filtered = [x for x in self.Pending.IntervalBlocks if x != self]
-            self._Pending._IntervalBlocks = filtered
+            self._Pending._IntervalBlocks.discard(self)
 
         self._Pending = value
         if self._Pending is not None:
@@ -94,8 +93,7 @@ class IntervalBlock(Element):
 
     def setReadingType(self, value):
         if self._ReadingType is not None:
-            filtered = [x for x in self.ReadingType.IntervalBlocks if x != self]
-            self._ReadingType._IntervalBlocks = filtered
+            self._ReadingType._IntervalBlocks.discard(self)
 
         self._ReadingType = value
         if self._ReadingType is not None:
@@ -111,24 +109,26 @@ class IntervalBlock(Element):
 
     def setIntervalReadings(self, value):
         for p in self._IntervalReadings:
-            filtered = [q for q in p.IntervalBlocks if q != self]
-            self._IntervalReadings._IntervalBlocks = filtered
-        for r in value:
-            if self not in r._IntervalBlocks:
-                r._IntervalBlocks.append(self)
-        self._IntervalReadings = value
+            p._IntervalBlocks.discard(self)
+        self._IntervalReadings = RefList()
+        self.addIntervalReadings(value)
 
     IntervalReadings = property(getIntervalReadings, setIntervalReadings)
 
     def addIntervalReadings(self, *IntervalReadings):
-        for obj in IntervalReadings:
-            if self not in obj._IntervalBlocks:
-                obj._IntervalBlocks.append(self)
-            self._IntervalReadings.append(obj)
+        collection = self._IntervalReadings
+        for obj in members(IntervalReadings):
+            obj._IntervalBlocks.append(self)
+            collection.append(obj)
 
     def removeIntervalReadings(self, *IntervalReadings):
-        for obj in IntervalReadings:
-            if self in obj._IntervalBlocks:
-                obj._IntervalBlocks.remove(self)
-            self._IntervalReadings.remove(obj)
+        collection = self._IntervalReadings
+        for obj in members(IntervalReadings):
+            obj._IntervalBlocks.discard(self)
+            collection.discard(obj)
+
+    def removeAllIntervalReadings(self):
+        for obj in self._IntervalReadings:
+            obj._IntervalBlocks.discard(self)
+        self._IntervalReadings = RefList()
 
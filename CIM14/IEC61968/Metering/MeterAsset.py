@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Metering.EndDeviceAsset import EndDeviceAsset
+from PyCIM.RefList import RefList, members
 
 class MeterAsset(EndDeviceAsset):
     """Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.
@@ -44,16 +45,16 @@ class MeterAsset(EndDeviceAsset):
         #: Meter form designation per ANSI C12.10 or other applicable standard. An alphanumeric designation denoting the circuit arrangement for which the meter is applicable and its specific terminal arrangement.
         self.formNumber = formNumber
 
-        self._MeterReplacementWorks = []
+        self._MeterReplacementWorks = RefList()
         self.MeterReplacementWorks = [] if MeterReplacementWorks is None else MeterReplacementWorks
 
-        self._MeterServiceWorks = []
+        self._MeterServiceWorks = RefList()
         self.MeterServiceWorks = [] if MeterServiceWorks is None else MeterServiceWorks
 
-        self._MeterReadings = []
+        self._MeterReadings = RefList()
         self.MeterReadings = [] if MeterReadings is None else MeterReadings
 
-        self._VendingTransactions = []
+        self._VendingTransactions = RefList()
         self.VendingTransactions = [] if VendingTransactions is None else VendingTransactions
 
         super(MeterAsset, self).__init__(*args, **kw_args)
@@ -72,20 +73,32 @@ class MeterAsset(EndDeviceAsset):
 
     def setMeterReplacementWorks(self, value):
         for x in self._MeterReplacementWorks:
-            x.OldMeterAsset = None
-        for y in value:
-            y._OldMeterAsset = self
-        self._MeterReplacementWorks = value
+            x._OldMeterAsset = None
+        self._MeterReplacementWorks = RefList()
+        self.addMeterReplacementWorks(value)
 
     MeterReplacementWorks = property(getMeterReplacementWorks, setMeterReplacementWorks)
 
     def addMeterReplacementWorks(self, *MeterReplacementWorks):
-        for obj in MeterReplacementWorks:
-            obj.OldMeterAsset = self
+        collection = self._MeterReplacementWorks
+        for obj in members(MeterReplacementWorks):
+            old = obj._OldMeterAsset
+            if old is not None and old is not self:
+                old._MeterReplacementWorks.discard(obj)
+            obj._OldMeterAsset = self
+            collection.append(obj)
 
     def removeMeterReplacementWorks(self, *MeterReplacementWorks):
-        for obj in MeterReplacementWorks:
-            obj.OldMeterAsset = None
+        collection = self._MeterReplacementWorks
+        for obj in members(MeterReplacementWorks):
+            if obj._OldMeterAsset is self:
+                obj._OldMeterAsset = None
+                collection.discard(obj)
+
+    def removeAllMeterReplacementWorks(self):
+        for obj in self._MeterReplacementWorks:
+            obj._OldMeterAsset = None
+        self._MeterReplacementWorks = RefList()
 
     def getMeterServiceWorks(self):
         """All non-replacement works on this meter asset.
@@ -94,20 +107,32 @@ class MeterAsset(EndDeviceAsset):
 
     def setMeterServiceWorks(self, value):
         for x in self._MeterServiceWorks:
-            x.MeterAsset = None
-        for y in value:
-            y._MeterAsset = self
-        self._MeterServiceWorks = value
+            x._MeterAsset = None
+        self._MeterServiceWorks = RefList()
+        self.addMeterServiceWorks(value)
 
     MeterServiceWorks = property(getMeterServiceWorks, setMeterServiceWorks)
 
     def addMeterServiceWorks(self, *MeterServiceWorks):
-        for obj in MeterServiceWorks:
-            obj.MeterAsset = self
+        collection = self._MeterServiceWorks
+        for obj in members(MeterServiceWorks):
+            old = obj._MeterAsset
+            if old is not None and old is not self:
+                old._MeterServiceWorks.discard(obj)
+            obj._MeterAsset = self
+            collection.append(obj)
 
     def removeMeterServiceWorks(self, *MeterServiceWorks):
-        for obj in MeterServiceWorks:
-            obj.MeterAsset = None
+        collection = self._MeterServiceWorks
+        for obj in members(MeterServiceWorks):
+            if obj._MeterAsset is self:
+                obj._MeterAsset = None
+                collection.discard(obj)
+
+    def removeAllMeterServiceWorks(self):
+        for obj in self._MeterServiceWorks:
+            obj._MeterAsset = None
+        self._MeterServiceWorks = RefList()
 
     def getMeterReadings(self):
         """All meter readings provided by this meter asset.
@@ -116,20 +141,32 @@ class MeterAsset(EndDeviceAsset):
 
     def setMeterReadings(self, value):
         for x in self._MeterReadings:
-            x.MeterAsset = None
-        for y in value:
-            y._MeterAsset = self
-        self._MeterReadings = value
+            x._MeterAsset = None
+        self._MeterReadings = RefList()
+        self.addMeterReadings(value)
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.MeterAsset = self
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            old = obj._MeterAsset
+            if old is not None and old is not self:
+                old._MeterReadings.discard(obj)
+            obj._MeterAsset = self
+            collection.append(obj)
 
     def removeMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.MeterAsset = None
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            if obj._MeterAsset is self:
+                obj._MeterAsset = None
+                collection.discard(obj)
+
+    def removeAllMeterReadings(self):
+        for obj in self._MeterReadings:
+            obj._MeterAsset = None
+        self._MeterReadings = RefList()
 
     def getVendingTransactions(self):
         """All vending transactions on this meter asset.
@@ -138,18 +175,30 @@ class MeterAsset(EndDeviceAsset):
 
     def setVendingTransactions(self, value):
         for x in self._VendingTransactions:
-            x.MeterAsset = None
-        for y in value:
-            y._MeterAsset = self
-        self._VendingTransactions = value
+            x._MeterAsset = None
+        self._VendingTransactions = RefList()
+        self.addVendingTransactions(value)
 
     VendingTransactions = property(getVendingTransactions, setVendingTransactions)
 
     def addVendingTransactions(self, *VendingTransactions):
-        for obj in VendingTransactions:
-            obj.MeterAsset = self
+        collection = self._VendingTransactions
+        for obj in members(VendingTransactions):
+            old = obj._MeterAsset
+            if old is not None and old is not self:
+                old._VendingTransactions.discard(obj)
+            obj._MeterAsset = self
+            collection.append(obj)
 
     def removeVendingTransactions(self, *VendingTransactions):
-        for obj in VendingTransactions:
-            obj.MeterAsset = None
+        collection = self._VendingTransactions
+        for obj in members(VendingTransactions):
+            if obj._MeterAsset is self:
+                obj._MeterAsset = None
+                collection.discard(obj)
+
+    def removeAllVendingTransactions(self):
+        for obj in self._VendingTransactions:
+            obj._MeterAsset = None
+        self._VendingTransactions = RefList()
 
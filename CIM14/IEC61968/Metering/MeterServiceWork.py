@@ -52,8 +52,7 @@ class MeterServiceWork(Work):
 
     def setOldMeterAsset(self, value):
         if self._OldMeterAsset is not None:
-            filtered = [x for x in self.OldMeterAsset.MeterReplacementWorks if x != self]
-            self._OldMeterAsset._MeterReplacementWorks = filtered
+            self._OldMeterAsset._MeterReplacementWorks.discard(self)
 
         self._OldMeterAsset = value
         if self._OldMeterAsset is not None:
@@ -69,8 +68,7 @@ class MeterServiceWork(Work):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.MeterServiceWorks if x != self]
-            self._MeterAsset._MeterServiceWorks = filtered
+            self._MeterAsset._MeterServiceWorks.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
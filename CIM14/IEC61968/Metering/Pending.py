@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class Pending(Element):
     """When present, a scalar conversion that is associated with IntervalBlock and which needs to be applied to every contained IntervalReading value. This conversion results in a new associated ReadingType, reflecting the true dimensions of interval reading values after the conversion.
@@ -50,7 +51,7 @@ class Pending(Element):
         #: (if applicable) Offset to be added as well as multiplication using scalars.
         self.offset = offset
 
-        self._IntervalBlocks = []
+        self._IntervalBlocks = RefList()
         self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
 
         self._ReadingType = None
@@ -72,20 +73,32 @@ class Pending(Element):
 
     def setIntervalBlocks(self, value):
         for x in self._IntervalBlocks:
-            x.Pending = None
-        for y in value:
-            y._Pending = self
-        self._IntervalBlocks = value
+            x._Pending = None
+        self._IntervalBlocks = RefList()
+        self.addIntervalBlocks(value)
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.Pending = self
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            old = obj._Pending
+            if old is not None and old is not self:
+                old._IntervalBlocks.discard(obj)
+            obj._Pending = self
+            collection.append(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.Pending = None
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            if obj._Pending is self:
+                obj._Pending = None
+                collection.discard(obj)
+
+    def removeAllIntervalBlocks(self):
+        for obj in self._IntervalBlocks:
+            obj._Pending = None
+        self._IntervalBlocks = RefList()
 
     def getReadingType(self):
         """Reading type resulting from this pending conversion.
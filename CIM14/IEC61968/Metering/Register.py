@@ -76,8 +76,7 @@ class Register(IdentifiedObject):
 
     def setDeviceFunction(self, value):
         if self._DeviceFunction is not None:
-            filtered = [x for x in self.DeviceFunction.Registers if x != self]
-            self._DeviceFunction._Registers = filtered
+            self._DeviceFunction._Registers.discard(self)
 
         self._DeviceFunction = value
         if self._DeviceFunction is not None:
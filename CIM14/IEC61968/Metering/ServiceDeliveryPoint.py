@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ServiceDeliveryPoint(IdentifiedObject):
     """Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a ServiceLocation, delivering service in accordance with a CustomerAgreement. Used at the place where a meter may be installed.
@@ -78,16 +79,16 @@ class ServiceDeliveryPoint(IdentifiedObject):
         #: (optional for medium voltage connections) Reference to the low side terminal of a CT or PT that obtain readings from a medium or high voltage point.
         self.ctptReference = ctptReference
 
-        self._PricingStructures = []
+        self._PricingStructures = RefList()
         self.PricingStructures = [] if PricingStructures is None else PricingStructures
 
         self._Transformer = None
         self.Transformer = Transformer
 
-        self._SDPLocations = []
+        self._SDPLocations = RefList()
         self.SDPLocations = [] if SDPLocations is None else SDPLocations
 
-        self._EndDeviceAssets = []
+        self._EndDeviceAssets = RefList()
         self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
 
         self._EnergyConsumer = None
@@ -99,7 +100,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
         self._CustomerAgreement = None
         self.CustomerAgreement = CustomerAgreement
 
-        self._MeterReadings = []
+        self._MeterReadings = RefList()
         self.MeterReadings = [] if MeterReadings is None else MeterReadings
 
         self._ServiceSupplier = None
@@ -124,26 +125,28 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._PricingStructures._ServiceDeliveryPoints = filtered
-        for r in value:
-            if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
-        self._PricingStructures = value
+            p._ServiceDeliveryPoints.discard(self)
+        self._PricingStructures = RefList()
+        self.addPricingStructures(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._PricingStructures.append(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._ServiceDeliveryPoints.append(self)
+            collection.append(obj)
 
     def removePricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.remove(self)
-            self._PricingStructures.remove(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._ServiceDeliveryPoints.discard(self)
+            collection.discard(obj)
+
+    def removeAllPricingStructures(self):
+        for obj in self._PricingStructures:
+            obj._ServiceDeliveryPoints.discard(self)
+        self._PricingStructures = RefList()
 
     def getTransformer(self):
         """Transformer supplying this service delivery point.
@@ -152,8 +155,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.ServiceDeliveryPoints if x != self]
-            self._Transformer._ServiceDeliveryPoints = filtered
+            self._Transformer._ServiceDeliveryPoints.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
@@ -169,26 +171,28 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setSDPLocations(self, value):
         for p in self._SDPLocations:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._SDPLocations._ServiceDeliveryPoints = filtered
-        for r in value:
-            if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
-        self._SDPLocations = value
+            p._ServiceDeliveryPoints.discard(self)
+        self._SDPLocations = RefList()
+        self.addSDPLocations(value)
 
     SDPLocations = property(getSDPLocations, setSDPLocations)
 
     def addSDPLocations(self, *SDPLocations):
-        for obj in SDPLocations:
-            if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._SDPLocations.append(obj)
+        collection = self._SDPLocations
+        for obj in members(SDPLocations):
+            obj._ServiceDeliveryPoints.append(self)
+            collection.append(obj)
 
     def removeSDPLocations(self, *SDPLocations):
-        for obj in SDPLocations:
-            if self in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.remove(self)
-            self._SDPLocations.remove(obj)
+        collection = self._SDPLocations
+        for obj in members(SDPLocations):
+            obj._ServiceDeliveryPoints.discard(self)
+            collection.discard(obj)
+
+    def removeAllSDPLocations(self):
+        for obj in self._SDPLocations:
+            obj._ServiceDeliveryPoints.discard(self)
+        self._SDPLocations = RefList()
 
     def getEndDeviceAssets(self):
         """All end device assets at this service delivery point.
@@ -197,20 +201,32 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setEndDeviceAssets(self, value):
         for x in self._EndDeviceAssets:
-            x.ServiceDeliveryPoint = None
-        for y in value:
-            y._ServiceDeliveryPoint = self
-        self._EndDeviceAssets = value
+            x._ServiceDeliveryPoint = None
+        self._EndDeviceAssets = RefList()
+        self.addEndDeviceAssets(value)
 
     EndDeviceAssets = property(getEndDeviceAssets, setEndDeviceAssets)
 
     def addEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.ServiceDeliveryPoint = self
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            old = obj._ServiceDeliveryPoint
+            if old is not None and old is not self:
+                old._EndDeviceAssets.discard(obj)
+            obj._ServiceDeliveryPoint = self
+            collection.append(obj)
 
     def removeEndDeviceAssets(self, *EndDeviceAssets):
-        for obj in EndDeviceAssets:
-            obj.ServiceDeliveryPoint = None
+        collection = self._EndDeviceAssets
+        for obj in members(EndDeviceAssets):
+            if obj._ServiceDeliveryPoint is self:
+                obj._ServiceDeliveryPoint = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceAssets(self):
+        for obj in self._EndDeviceAssets:
+            obj._ServiceDeliveryPoint = None
+        self._EndDeviceAssets = RefList()
 
     def getEnergyConsumer(self):
         
@@ -218,8 +234,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.ServiceDeliveryPoints if x != self]
-            self._EnergyConsumer._ServiceDeliveryPoints = filtered
+            self._EnergyConsumer._ServiceDeliveryPoints.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
@@ -235,8 +250,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ServiceDeliveryPoints if x != self]
-            self._ServiceLocation._ServiceDeliveryPoints = filtered
+            self._ServiceLocation._ServiceDeliveryPoints.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
@@ -252,8 +266,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.ServiceDeliveryPoints if x != self]
-            self._CustomerAgreement._ServiceDeliveryPoints = filtered
+            self._CustomerAgreement._ServiceDeliveryPoints.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
@@ -269,20 +282,32 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setMeterReadings(self, value):
         for x in self._MeterReadings:
-            x.ServiceDeliveryPoint = None
-        for y in value:
-            y._ServiceDeliveryPoint = self
-        self._MeterReadings = value
+            x._ServiceDeliveryPoint = None
+        self._MeterReadings = RefList()
+        self.addMeterReadings(value)
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.ServiceDeliveryPoint = self
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            old = obj._ServiceDeliveryPoint
+            if old is not None and old is not self:
+                old._MeterReadings.discard(obj)
+            obj._ServiceDeliveryPoint = self
+            collection.append(obj)
 
     def removeMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.ServiceDeliveryPoint = None
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            if obj._ServiceDeliveryPoint is self:
+                obj._ServiceDeliveryPoint = None
+                collection.discard(obj)
+
+    def removeAllMeterReadings(self):
+        for obj in self._MeterReadings:
+            obj._ServiceDeliveryPoint = None
+        self._MeterReadings = RefList()
 
     def getServiceSupplier(self):
         """ServiceSupplier (Utility) utilising this service delivery point to deliver a service.
@@ -291,8 +316,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.ServiceDeliveryPoints if x != self]
-            self._ServiceSupplier._ServiceDeliveryPoints = filtered
+            self._ServiceSupplier._ServiceDeliveryPoints.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
@@ -308,8 +332,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.ServiceDeliveryPoints if x != self]
-            self._ServiceCategory._ServiceDeliveryPoints = filtered
+            self._ServiceCategory._ServiceDeliveryPoints.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class AuxiliaryAccount(Document):
     """Variable and dynamic part of AuxiliaryAgreement, generally representing the current state of the account related to the outstanding balance defined in AuxiliaryAgreement.
@@ -42,13 +43,13 @@ class AuxiliaryAccount(Document):
         #: The initial principle amount, with which this account was instantiated.
         self.principleAmount = principleAmount
 
-        self._Charges = []
+        self._Charges = RefList()
         self.Charges = [] if Charges is None else Charges
 
         self._AuxiliaryAgreement = None
         self.AuxiliaryAgreement = AuxiliaryAgreement
 
-        self._PaymentTransactions = []
+        self._PaymentTransactions = RefList()
         self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
 
         self.lastDebit = lastDebit
@@ -73,26 +74,28 @@ class AuxiliaryAccount(Document):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.AuxiliaryAccounts if q != self]
-            self._Charges._AuxiliaryAccounts = filtered
-        for r in value:
-            if self not in r._AuxiliaryAccounts:
-                r._AuxiliaryAccounts.append(self)
-        self._Charges = value
+            p._AuxiliaryAccounts.discard(self)
+        self._Charges = RefList()
+        self.addCharges(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
-        for obj in Charges:
-            if self not in obj._AuxiliaryAccounts:
-                obj._AuxiliaryAccounts.append(self)
-            self._Charges.append(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._AuxiliaryAccounts.append(self)
+            collection.append(obj)
 
     def removeCharges(self, *Charges):
-        for obj in Charges:
-            if self in obj._AuxiliaryAccounts:
-                obj._AuxiliaryAccounts.remove(self)
-            self._Charges.remove(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._AuxiliaryAccounts.discard(self)
+            collection.discard(obj)
+
+    def removeAllCharges(self):
+        for obj in self._Charges:
+            obj._AuxiliaryAccounts.discard(self)
+        self._Charges = RefList()
 
     def getAuxiliaryAgreement(self):
         """Auxiliary agreement regulating this account.
@@ -101,8 +104,7 @@ class AuxiliaryAccount(Document):
 
     def setAuxiliaryAgreement(self, value):
         if self._AuxiliaryAgreement is not None:
-            filtered = [x for x in self.AuxiliaryAgreement.AuxiliaryAccounts if x != self]
-            self._AuxiliaryAgreement._AuxiliaryAccounts = filtered
+            self._AuxiliaryAgreement._AuxiliaryAccounts.discard(self)
 
         self._AuxiliaryAgreement = value
         if self._AuxiliaryAgreement is not None:
@@ -118,20 +120,32 @@ class AuxiliaryAccount(Document):
 
     def setPaymentTransactions(self, value):
         for x in self._PaymentTransactions:
-            x.AuxiliaryAccount = None
-        for y in value:
-            y._AuxiliaryAccount = self
-        self._PaymentTransactions = value
+            x._AuxiliaryAccount = None
+        self._PaymentTransactions = RefList()
+        self.addPaymentTransactions(value)
 
     PaymentTransactions = property(getPaymentTransactions, setPaymentTransactions)
 
     def addPaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.AuxiliaryAccount = self
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            old = obj._AuxiliaryAccount
+            if old is not None and old is not self:
+                old._PaymentTransactions.discard(obj)
+            obj._AuxiliaryAccount = self
+            collection.append(obj)
 
     def removePaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.AuxiliaryAccount = None
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            if obj._AuxiliaryAccount is self:
+                obj._AuxiliaryAccount = None
+                collection.discard(obj)
+
+    def removeAllPaymentTransactions(self):
+        for obj in self._PaymentTransactions:
+            obj._AuxiliaryAccount = None
+        self._PaymentTransactions = RefList()
 
     # Details of the last debit transaction performed on this account.
     lastDebit = None
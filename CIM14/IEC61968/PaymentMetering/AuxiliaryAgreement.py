@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Agreement import Agreement
+from PyCIM.RefList import RefList, members
 
 class AuxiliaryAgreement(Agreement):
     """An ad-hoc auxiliary account agreement associated with a customer agreement, not part of the customer's account, but typically subject to formal agreement between customer and supplier (utility). Typically this is used to collect revenue owing by the customer for other services or arrears accrued with the utility for other services. It is typically linked to a prepaid token purchase transaction, thus forcing the customer to make a payment towards settlement of the auxiliary account balance whenever he needs to purchase a prepaid token for electricity. The present status of AuxiliaryAgreement can be defined in the context of the utility's business rules, for example: enabled, disabled, pending, over recovered, under recovered, written off, etc.
@@ -70,7 +71,7 @@ class AuxiliaryAgreement(Agreement):
         #: The fixed amount that must be collected from each vending transaction towards settlement of this AuxiliaryAgreement. Note that there may be multiple tokens vended per vending transaction, but this is not relevant.
         self.fixedAmount = fixedAmount
 
-        self._AuxiliaryAccounts = []
+        self._AuxiliaryAccounts = RefList()
         self.AuxiliaryAccounts = [] if AuxiliaryAccounts is None else AuxiliaryAccounts
 
         self._CustomerAgreement = None
@@ -92,20 +93,32 @@ class AuxiliaryAgreement(Agreement):
 
     def setAuxiliaryAccounts(self, value):
         for x in self._AuxiliaryAccounts:
-            x.AuxiliaryAgreement = None
-        for y in value:
-            y._AuxiliaryAgreement = self
-        self._AuxiliaryAccounts = value
+            x._AuxiliaryAgreement = None
+        self._AuxiliaryAccounts = RefList()
+        self.addAuxiliaryAccounts(value)
 
     AuxiliaryAccounts = property(getAuxiliaryAccounts, setAuxiliaryAccounts)
 
     def addAuxiliaryAccounts(self, *AuxiliaryAccounts):
-        for obj in AuxiliaryAccounts:
-            obj.AuxiliaryAgreement = self
+        collection = self._AuxiliaryAccounts
+        for obj in members(AuxiliaryAccounts):
+            old = obj._AuxiliaryAgreement
+            if old is not None and old is not self:
+                old._AuxiliaryAccounts.discard(obj)
+            obj._AuxiliaryAgreement = self
+            collection.append(obj)
 
     def removeAuxiliaryAccounts(self, *AuxiliaryAccounts):
-        for obj in AuxiliaryAccounts:
-            obj.AuxiliaryAgreement = None
+        collection = self._AuxiliaryAccounts
+        for obj in members(AuxiliaryAccounts):
+            if obj._AuxiliaryAgreement is self:
+                obj._AuxiliaryAgreement = None
+                collection.discard(obj)
+
+    def removeAllAuxiliaryAccounts(self):
+        for obj in self._AuxiliaryAccounts:
+            obj._AuxiliaryAgreement = None
+        self._AuxiliaryAccounts = RefList()
 
     def getCustomerAgreement(self):
         """Customer agreement this (non-service related) auxiliary agreement refers to.
@@ -114,8 +127,7 @@ class AuxiliaryAgreement(Agreement):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.AuxiliaryAgreements if x != self]
-            self._CustomerAgreement._AuxiliaryAgreements = filtered
+            self._CustomerAgreement._AuxiliaryAgreements.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
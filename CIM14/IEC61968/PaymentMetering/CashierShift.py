@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.PaymentMetering.Shift import Shift
+from PyCIM.RefList import RefList, members
 
 class CashierShift(Shift):
     """The operating shift for a cashier, during which he may transact against the CashierShift, subject to VendorShift being open.
@@ -36,10 +37,10 @@ class CashierShift(Shift):
         #: The amount of cash that the cashier brings with him to start his shift and that he will take away at the end of his shift; i.e. the cash float does not get banked.
         self.cashFloat = cashFloat
 
-        self._Receipts = []
+        self._Receipts = RefList()
         self.Receipts = [] if Receipts is None else Receipts
 
-        self._Transactions = []
+        self._Transactions = RefList()
         self.Transactions = [] if Transactions is None else Transactions
 
         self._Cashier = None
@@ -64,20 +65,32 @@ class CashierShift(Shift):
 
     def setReceipts(self, value):
         for x in self._Receipts:
-            x.CashierShift = None
-        for y in value:
-            y._CashierShift = self
-        self._Receipts = value
+            x._CashierShift = None
+        self._Receipts = RefList()
+        self.addReceipts(value)
 
     Receipts = property(getReceipts, setReceipts)
 
     def addReceipts(self, *Receipts):
-        for obj in Receipts:
-            obj.CashierShift = self
+        collection = self._Receipts
+        for obj in members(Receipts):
+            old = obj._CashierShift
+            if old is not None and old is not self:
+                old._Receipts.discard(obj)
+            obj._CashierShift = self
+            collection.append(obj)
 
     def removeReceipts(self, *Receipts):
-        for obj in Receipts:
-            obj.CashierShift = None
+        collection = self._Receipts
+        for obj in members(Receipts):
+            if obj._CashierShift is self:
+                obj._CashierShift = None
+                collection.discard(obj)
+
+    def removeAllReceipts(self):
+        for obj in self._Receipts:
+            obj._CashierShift = None
+        self._Receipts = RefList()
 
     def getTransactions(self):
         
@@ -85,20 +98,32 @@ class CashierShift(Shift):
 
     def setTransactions(self, value):
         for x in self._Transactions:
-            x.CashierShift = None
-        for y in value:
-            y._CashierShift = self
-        self._Transactions = value
+            x._CashierShift = None
+        self._Transactions = RefList()
+        self.addTransactions(value)
 
     Transactions = property(getTransactions, setTransactions)
 
     def addTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.CashierShift = self
+        collection = self._Transactions
+        for obj in members(Transactions):
+            old = obj._CashierShift
+            if old is not None and old is not self:
+                old._Transactions.discard(obj)
+            obj._CashierShift = self
+            collection.append(obj)
 
     def removeTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.CashierShift = None
+        collection = self._Transactions
+        for obj in members(Transactions):
+            if obj._CashierShift is self:
+                obj._CashierShift = None
+                collection.discard(obj)
+
+    def removeAllTransactions(self):
+        for obj in self._Transactions:
+            obj._CashierShift = None
+        self._Transactions = RefList()
 
     def getCashier(self):
         """Cashier operating this shift.
@@ -107,8 +132,7 @@ class CashierShift(Shift):
 
     def setCashier(self, value):
         if self._Cashier is not None:
-            filtered = [x for x in self.Cashier.CashierShifts if x != self]
-            self._Cashier._CashierShifts = filtered
+            self._Cashier._CashierShifts.discard(self)
 
         self._Cashier = value
         if self._Cashier is not None:
@@ -124,8 +148,7 @@ class CashierShift(Shift):
 
     def setPointOfSale(self, value):
         if self._PointOfSale is not None:
-            filtered = [x for x in self.PointOfSale.CashierShifts if x != self]
-            self._PointOfSale._CashierShifts = filtered
+            self._PointOfSale._CashierShifts.discard(self)
 
         self._PointOfSale = value
         if self._PointOfSale is not None:
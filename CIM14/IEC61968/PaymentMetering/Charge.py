@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Charge(IdentifiedObject):
     """A charge element associated with other entities such as tariff structures, auxiliary agreements or other charge elements. The total charge amount applicable to this instance of Charge is the sum of fixedPortion plus percentagePortion.
@@ -42,21 +43,21 @@ class Charge(IdentifiedObject):
         #: The variable portion of this charge element, calculated as a percentage of the total amount of a parent charge.
         self.variablePortion = variablePortion
 
-        self._AuxiliaryAccounts = []
+        self._AuxiliaryAccounts = RefList()
         self.AuxiliaryAccounts = [] if AuxiliaryAccounts is None else AuxiliaryAccounts
 
         self._ParentCharge = None
         self.ParentCharge = ParentCharge
 
-        self._ChildCharges = []
+        self._ChildCharges = RefList()
         self.ChildCharges = [] if ChildCharges is None else ChildCharges
 
         self.fixedPortion = fixedPortion
 
-        self._ConsumptionTariffIntervals = []
+        self._ConsumptionTariffIntervals = RefList()
         self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
 
-        self._TimeTariffIntervals = []
+        self._TimeTariffIntervals = RefList()
         self.TimeTariffIntervals = [] if TimeTariffIntervals is None else TimeTariffIntervals
 
         super(Charge, self).__init__(*args, **kw_args)
@@ -75,26 +76,28 @@ class Charge(IdentifiedObject):
 
     def setAuxiliaryAccounts(self, value):
         for p in self._AuxiliaryAccounts:
-            filtered = [q for q in p.Charges if q != self]
-            self._AuxiliaryAccounts._Charges = filtered
-        for r in value:
-            if self not in r._Charges:
-                r._Charges.append(self)
-        self._AuxiliaryAccounts = value
+            p._Charges.discard(self)
+        self._AuxiliaryAccounts = RefList()
+        self.addAuxiliaryAccounts(value)
 
     AuxiliaryAccounts = property(getAuxiliaryAccounts, setAuxiliaryAccounts)
 
     def addAuxiliaryAccounts(self, *AuxiliaryAccounts):
-        for obj in AuxiliaryAccounts:
-            if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._AuxiliaryAccounts.append(obj)
+        collection = self._AuxiliaryAccounts
+        for obj in members(AuxiliaryAccounts):
+            obj._Charges.append(self)
+            collection.append(obj)
 
     def removeAuxiliaryAccounts(self, *AuxiliaryAccounts):
-        for obj in AuxiliaryAccounts:
-            if self in obj._Charges:
-                obj._Charges.remove(self)
-            self._AuxiliaryAccounts.remove(obj)
+        collection = self._AuxiliaryAccounts
+        for obj in members(AuxiliaryAccounts):
+            obj._Charges.discard(self)
+            collection.discard(obj)
+
+    def removeAllAuxiliaryAccounts(self):
+        for obj in self._AuxiliaryAccounts:
+            obj._Charges.discard(self)
+        self._AuxiliaryAccounts = RefList()
 
     def getParentCharge(self):
         
@@ -102,8 +105,7 @@ class Charge(IdentifiedObject):
 
     def setParentCharge(self, value):
         if self._ParentCharge is not None:
-            filtered = [x for x in self.ParentCharge.ChildCharges if x != self]
-            self._ParentCharge._ChildCharges = filtered
+            self._ParentCharge._ChildCharges.discard(self)
 
         self._ParentCharge = value
         if self._ParentCharge is not None:
@@ -119,20 +121,32 @@ class Charge(IdentifiedObject):
 
     def setChildCharges(self, value):
         for x in self._ChildCharges:
-            x.ParentCharge = None
-        for y in value:
-            y._ParentCharge = self
-        self._ChildCharges = value
+            x._ParentCharge = None
+        self._ChildCharges = RefList()
+        self.addChildCharges(value)
 
     ChildCharges = property(getChildCharges, setChildCharges)
 
     def addChildCharges(self, *ChildCharges):
-        for obj in ChildCharges:
-            obj.ParentCharge = self
+        collection = self._ChildCharges
+        for obj in members(ChildCharges):
+            old = obj._ParentCharge
+            if old is not None and old is not self:
+                old._ChildCharges.discard(obj)
+            obj._ParentCharge = self
+            collection.append(obj)
 
     def removeChildCharges(self, *ChildCharges):
-        for obj in ChildCharges:
-            obj.ParentCharge = None
+        collection = self._ChildCharges
+        for obj in members(ChildCharges):
+            if obj._ParentCharge is self:
+                obj._ParentCharge = None
+                collection.discard(obj)
+
+    def removeAllChildCharges(self):
+        for obj in self._ChildCharges:
+            obj._ParentCharge = None
+        self._ChildCharges = RefList()
 
     # The fixed portion of this charge element.
     fixedPortion = None
@@ -144,26 +158,28 @@ class Charge(IdentifiedObject):
 
     def setConsumptionTariffIntervals(self, value):
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.Charges if q != self]
-            self._ConsumptionTariffIntervals._Charges = filtered
-        for r in value:
-            if self not in r._Charges:
-                r._Charges.append(self)
-        self._ConsumptionTariffIntervals = value
+            p._Charges.discard(self)
+        self._ConsumptionTariffIntervals = RefList()
+        self.addConsumptionTariffIntervals(value)
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
-        for obj in ConsumptionTariffIntervals:
-            if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+        collection = self._ConsumptionTariffIntervals
+        for obj in members(ConsumptionTariffIntervals):
+            obj._Charges.append(self)
+            collection.append(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
-        for obj in ConsumptionTariffIntervals:
-            if self in obj._Charges:
-                obj._Charges.remove(self)
-            self._ConsumptionTariffIntervals.remove(obj)
+        collection = self._ConsumptionTariffIntervals
+        for obj in members(ConsumptionTariffIntervals):
+            obj._Charges.discard(self)
+            collection.discard(obj)
+
+    def removeAllConsumptionTariffIntervals(self):
+        for obj in self._ConsumptionTariffIntervals:
+            obj._Charges.discard(self)
+        self._ConsumptionTariffIntervals = RefList()
 
     def getTimeTariffIntervals(self):
         """Tariff intervals to which this time-based charge must be levied.
@@ -172,24 +188,26 @@ class Charge(IdentifiedObject):
 
     def setTimeTariffIntervals(self, value):
         for p in self._TimeTariffIntervals:
-            filtered = [q for q in p.Charges if q != self]
-            self._TimeTariffIntervals._Charges = filtered
-        for r in value:
-            if self not in r._Charges:
-                r._Charges.append(self)
-        self._TimeTariffIntervals = value
+            p._Charges.discard(self)
+        self._TimeTariffIntervals = RefList()
+        self.addTimeTariffIntervals(value)
 
     TimeTariffIntervals = property(getTimeTariffIntervals, setTimeTariffIntervals)
 
     def addTimeTariffIntervals(self, *TimeTariffIntervals):
-        for obj in TimeTariffIntervals:
-            if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._TimeTariffIntervals.append(obj)
+        collection = self._TimeTariffIntervals
+        for obj in members(TimeTariffIntervals):
+            obj._Charges.append(self)
+            collection.append(obj)
 
     def removeTimeTariffIntervals(self, *TimeTariffIntervals):
-        for obj in TimeTariffIntervals:
-            if self in obj._Charges:
-                obj._Charges.remove(self)
-            self._TimeTariffIntervals.remove(obj)
+        collection = self._TimeTariffIntervals
+        for obj in members(TimeTariffIntervals):
+            obj._Charges.discard(self)
+            collection.discard(obj)
+
+    def removeAllTimeTariffIntervals(self):
+        for obj in self._TimeTariffIntervals:
+            obj._Charges.discard(self)
+        self._TimeTariffIntervals = RefList()
 
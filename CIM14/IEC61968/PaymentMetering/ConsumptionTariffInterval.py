@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class ConsumptionTariffInterval(Element):
     """One of a sequence of intervals defined in terms of consumption quantity of a service such as electricity, water, gas, etc. It is typically used in association with TariffProfile to define the steps or blocks in a step tariff structure, where startValue simultaneously defines the entry value of this step and the closing value of the previous step. Where consumption is &gt;= startValue it falls within this interval and where consumption is &lt; startValue it falls within the previous interval.
@@ -38,10 +39,10 @@ class ConsumptionTariffInterval(Element):
         #: The lowest level of consumption that defines the starting point of this interval. The interval extends to the start of the next interval or until it is reset to the start of the first interval by TariffProfile.tariffCycle.
         self.startValue = startValue
 
-        self._TariffProfiles = []
+        self._TariffProfiles = RefList()
         self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
 
-        self._Charges = []
+        self._Charges = RefList()
         self.Charges = [] if Charges is None else Charges
 
         super(ConsumptionTariffInterval, self).__init__(*args, **kw_args)
@@ -60,26 +61,28 @@ class ConsumptionTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._TariffProfiles._ConsumptionTariffIntervals = filtered
-        for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._TariffProfiles = value
+            p._ConsumptionTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
+        self.addTariffProfiles(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._ConsumptionTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.remove(self)
-            self._TariffProfiles.remove(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._ConsumptionTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffProfiles(self):
+        for obj in self._TariffProfiles:
+            obj._ConsumptionTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
 
     def getCharges(self):
         """All charges used to define this consumption tariff interval.
@@ -88,24 +91,26 @@ class ConsumptionTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._Charges._ConsumptionTariffIntervals = filtered
-        for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._Charges = value
+            p._ConsumptionTariffIntervals.discard(self)
+        self._Charges = RefList()
+        self.addCharges(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
-        for obj in Charges:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._Charges.append(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._ConsumptionTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeCharges(self, *Charges):
-        for obj in Charges:
-            if self in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.remove(self)
-            self._Charges.remove(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._ConsumptionTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllCharges(self):
+        for obj in self._Charges:
+            obj._ConsumptionTariffIntervals.discard(self)
+        self._Charges = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class MerchantAccount(Document):
     """The operating account controlled by MerchantAgreement, against which Vendor may vend tokens or receipt payments. Transactions via VendorShift debit the account and bank deposits via BankStatement credit the account.
@@ -40,16 +41,16 @@ class MerchantAccount(Document):
         #: The current operating balance of this account.
         self.currentBalance = currentBalance
 
-        self._VendorShifts = []
+        self._VendorShifts = RefList()
         self.VendorShifts = [] if VendorShifts is None else VendorShifts
 
         self._MerchantAgreement = None
         self.MerchantAgreement = MerchantAgreement
 
-        self._Vendors = []
+        self._Vendors = RefList()
         self.Vendors = [] if Vendors is None else Vendors
 
-        self._Transactors = []
+        self._Transactors = RefList()
         self.Transactors = [] if Transactors is None else Transactors
 
         super(MerchantAccount, self).__init__(*args, **kw_args)
@@ -68,20 +69,32 @@ class MerchantAccount(Document):
 
     def setVendorShifts(self, value):
         for x in self._VendorShifts:
-            x.MerchantAccount = None
-        for y in value:
-            y._MerchantAccount = self
-        self._VendorShifts = value
+            x._MerchantAccount = None
+        self._VendorShifts = RefList()
+        self.addVendorShifts(value)
 
     VendorShifts = property(getVendorShifts, setVendorShifts)
 
     def addVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.MerchantAccount = self
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            old = obj._MerchantAccount
+            if old is not None and old is not self:
+                old._VendorShifts.discard(obj)
+            obj._MerchantAccount = self
+            collection.append(obj)
 
     def removeVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.MerchantAccount = None
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            if obj._MerchantAccount is self:
+                obj._MerchantAccount = None
+                collection.discard(obj)
+
+    def removeAllVendorShifts(self):
+        for obj in self._VendorShifts:
+            obj._MerchantAccount = None
+        self._VendorShifts = RefList()
 
     def getMerchantAgreement(self):
         """Merchant agreement that instantiated this merchant account.
@@ -90,8 +103,7 @@ class MerchantAccount(Document):
 
     def setMerchantAgreement(self, value):
         if self._MerchantAgreement is not None:
-            filtered = [x for x in self.MerchantAgreement.MerchantAccounts if x != self]
-            self._MerchantAgreement._MerchantAccounts = filtered
+            self._MerchantAgreement._MerchantAccounts.discard(self)
 
         self._MerchantAgreement = value
         if self._MerchantAgreement is not None:
@@ -107,20 +119,32 @@ class MerchantAccount(Document):
 
     def setVendors(self, value):
         for x in self._Vendors:
-            x.MerchantAccount = None
-        for y in value:
-            y._MerchantAccount = self
-        self._Vendors = value
+            x._MerchantAccount = None
+        self._Vendors = RefList()
+        self.addVendors(value)
 
     Vendors = property(getVendors, setVendors)
 
     def addVendors(self, *Vendors):
-        for obj in Vendors:
-            obj.MerchantAccount = self
+        collection = self._Vendors
+        for obj in members(Vendors):
+            old = obj._MerchantAccount
+            if old is not None and old is not self:
+                old._Vendors.discard(obj)
+            obj._MerchantAccount = self
+            collection.append(obj)
 
     def removeVendors(self, *Vendors):
-        for obj in Vendors:
-            obj.MerchantAccount = None
+        collection = self._Vendors
+        for obj in members(Vendors):
+            if obj._MerchantAccount is self:
+                obj._MerchantAccount = None
+                collection.discard(obj)
+
+    def removeAllVendors(self):
+        for obj in self._Vendors:
+            obj._MerchantAccount = None
+        self._Vendors = RefList()
 
     def getTransactors(self):
         """All transactors this merchant account is registered with.
@@ -129,24 +153,26 @@ class MerchantAccount(Document):
 
     def setTransactors(self, value):
         for p in self._Transactors:
-            filtered = [q for q in p.MerchantAccounts if q != self]
-            self._Transactors._MerchantAccounts = filtered
-        for r in value:
-            if self not in r._MerchantAccounts:
-                r._MerchantAccounts.append(self)
-        self._Transactors = value
+            p._MerchantAccounts.discard(self)
+        self._Transactors = RefList()
+        self.addTransactors(value)
 
     Transactors = property(getTransactors, setTransactors)
 
     def addTransactors(self, *Transactors):
-        for obj in Transactors:
-            if self not in obj._MerchantAccounts:
-                obj._MerchantAccounts.append(self)
-            self._Transactors.append(obj)
+        collection = self._Transactors
+        for obj in members(Transactors):
+            obj._MerchantAccounts.append(self)
+            collection.append(obj)
 
     def removeTransactors(self, *Transactors):
-        for obj in Transactors:
-            if self in obj._MerchantAccounts:
-                obj._MerchantAccounts.remove(self)
-            self._Transactors.remove(obj)
+        collection = self._Transactors
+        for obj in members(Transactors):
+            obj._MerchantAccounts.discard(self)
+            collection.discard(obj)
+
+    def removeAllTransactors(self):
+        for obj in self._Transactors:
+            obj._MerchantAccounts.discard(self)
+        self._Transactors = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Agreement import Agreement
+from PyCIM.RefList import RefList, members
 
 class MerchantAgreement(Agreement):
     """A formal controlling contractual agreement between Supplier and Merchant, in terms of which Merchant is authorised to vend tokens and receipt payments on behalf of Supplier. Merchant is accountable to Supplier for revenue collected at PointOfSale.
@@ -29,7 +30,7 @@ class MerchantAgreement(Agreement):
 
         @param MerchantAccounts: All merchant accounts instantiated as a result of this merchant agreement.
         """
-        self._MerchantAccounts = []
+        self._MerchantAccounts = RefList()
         self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
 
         super(MerchantAgreement, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class MerchantAgreement(Agreement):
 
     def setMerchantAccounts(self, value):
         for x in self._MerchantAccounts:
-            x.MerchantAgreement = None
-        for y in value:
-            y._MerchantAgreement = self
-        self._MerchantAccounts = value
+            x._MerchantAgreement = None
+        self._MerchantAccounts = RefList()
+        self.addMerchantAccounts(value)
 
     MerchantAccounts = property(getMerchantAccounts, setMerchantAccounts)
 
     def addMerchantAccounts(self, *MerchantAccounts):
-        for obj in MerchantAccounts:
-            obj.MerchantAgreement = self
+        collection = self._MerchantAccounts
+        for obj in members(MerchantAccounts):
+            old = obj._MerchantAgreement
+            if old is not None and old is not self:
+                old._MerchantAccounts.discard(obj)
+            obj._MerchantAgreement = self
+            collection.append(obj)
 
     def removeMerchantAccounts(self, *MerchantAccounts):
-        for obj in MerchantAccounts:
-            obj.MerchantAgreement = None
+        collection = self._MerchantAccounts
+        for obj in members(MerchantAccounts):
+            if obj._MerchantAgreement is self:
+                obj._MerchantAgreement = None
+                collection.discard(obj)
+
+    def removeAllMerchantAccounts(self):
+        for obj in self._MerchantAccounts:
+            obj._MerchantAgreement = None
+        self._MerchantAccounts = RefList()
 
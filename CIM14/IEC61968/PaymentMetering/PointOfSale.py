@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PointOfSale(IdentifiedObject):
     """Logical point where transactions take place with operational interaction between Cashier and the payment system; in certain cases PointOfSale interacts directly with the end customer, in which case Cashier might not be a real person: for example a self-service kiosk or over the internet.
@@ -37,7 +38,7 @@ class PointOfSale(IdentifiedObject):
         self._Vendor = None
         self.Vendor = Vendor
 
-        self._CashierShifts = []
+        self._CashierShifts = RefList()
         self.CashierShifts = [] if CashierShifts is None else CashierShifts
 
         super(PointOfSale, self).__init__(*args, **kw_args)
@@ -56,8 +57,7 @@ class PointOfSale(IdentifiedObject):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.PointOfSales if x != self]
-            self._Vendor._PointOfSales = filtered
+            self._Vendor._PointOfSales.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
@@ -73,18 +73,30 @@ class PointOfSale(IdentifiedObject):
 
     def setCashierShifts(self, value):
         for x in self._CashierShifts:
-            x.PointOfSale = None
-        for y in value:
-            y._PointOfSale = self
-        self._CashierShifts = value
+            x._PointOfSale = None
+        self._CashierShifts = RefList()
+        self.addCashierShifts(value)
 
     CashierShifts = property(getCashierShifts, setCashierShifts)
 
     def addCashierShifts(self, *CashierShifts):
-        for obj in CashierShifts:
-            obj.PointOfSale = self
+        collection = self._CashierShifts
+        for obj in members(CashierShifts):
+            old = obj._PointOfSale
+            if old is not None and old is not self:
+                old._CashierShifts.discard(obj)
+            obj._PointOfSale = self
+            collection.append(obj)
 
     def removeCashierShifts(self, *CashierShifts):
-        for obj in CashierShifts:
-            obj.PointOfSale = None
+        collection = self._CashierShifts
+        for obj in members(CashierShifts):
+            if obj._PointOfSale is self:
+                obj._PointOfSale = None
+                collection.discard(obj)
+
+    def removeAllCashierShifts(self):
+        for obj in self._CashierShifts:
+            obj._PointOfSale = None
+        self._CashierShifts = RefList()
 
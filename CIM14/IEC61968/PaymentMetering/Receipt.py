@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Receipt(IdentifiedObject):
     """Record of total receipted payment from customer.
@@ -40,13 +41,13 @@ class Receipt(IdentifiedObject):
         self._CashierShift = None
         self.CashierShift = CashierShift
 
-        self._Tenders = []
+        self._Tenders = RefList()
         self.Tenders = [] if Tenders is None else Tenders
 
         self._VendorShift = None
         self.VendorShift = VendorShift
 
-        self._Transactions = []
+        self._Transactions = RefList()
         self.Transactions = [] if Transactions is None else Transactions
 
         self.line = line
@@ -67,8 +68,7 @@ class Receipt(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Receipts if x != self]
-            self._CashierShift._Receipts = filtered
+            self._CashierShift._Receipts.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
@@ -84,20 +84,32 @@ class Receipt(IdentifiedObject):
 
     def setTenders(self, value):
         for x in self._Tenders:
-            x.Receipt = None
-        for y in value:
-            y._Receipt = self
-        self._Tenders = value
+            x._Receipt = None
+        self._Tenders = RefList()
+        self.addTenders(value)
 
     Tenders = property(getTenders, setTenders)
 
     def addTenders(self, *Tenders):
-        for obj in Tenders:
-            obj.Receipt = self
+        collection = self._Tenders
+        for obj in members(Tenders):
+            old = obj._Receipt
+            if old is not None and old is not self:
+                old._Tenders.discard(obj)
+            obj._Receipt = self
+            collection.append(obj)
 
     def removeTenders(self, *Tenders):
-        for obj in Tenders:
-            obj.Receipt = None
+        collection = self._Tenders
+        for obj in members(Tenders):
+            if obj._Receipt is self:
+                obj._Receipt = None
+                collection.discard(obj)
+
+    def removeAllTenders(self):
+        for obj in self._Tenders:
+            obj._Receipt = None
+        self._Tenders = RefList()
 
     def getVendorShift(self):
         """Vendor shift during which this receipt was recorded.
@@ -106,8 +118,7 @@ class Receipt(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Receipts if x != self]
-            self._VendorShift._Receipts = filtered
+            self._VendorShift._Receipts.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
@@ -123,20 +134,32 @@ class Receipt(IdentifiedObject):
 
     def setTransactions(self, value):
         for x in self._Transactions:
-            x.Receipt = None
-        for y in value:
-            y._Receipt = self
-        self._Transactions = value
+            x._Receipt = None
+        self._Transactions = RefList()
+        self.addTransactions(value)
 
     Transactions = property(getTransactions, setTransactions)
 
     def addTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.Receipt = self
+        collection = self._Transactions
+        for obj in members(Transactions):
+            old = obj._Receipt
+            if old is not None and old is not self:
+                old._Transactions.discard(obj)
+            obj._Receipt = self
+            collection.append(obj)
 
     def removeTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.Receipt = None
+        collection = self._Transactions
+        for obj in members(Transactions):
+            if obj._Receipt is self:
+                obj._Receipt = None
+                collection.discard(obj)
+
+    def removeAllTransactions(self):
+        for obj in self._Transactions:
+            obj._Receipt = None
+        self._Transactions = RefList()
 
     # Receipted amount with rounding, date and note.
     line = None
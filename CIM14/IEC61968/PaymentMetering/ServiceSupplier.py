@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Organisation import Organisation
+from PyCIM.RefList import RefList, members
 
 class ServiceSupplier(Organisation):
     """Organisation that provides services to Customers.
@@ -38,10 +39,10 @@ class ServiceSupplier(Organisation):
         #: Unique transaction reference prefix number issued to an entity by the International Standards Organisation for the purpose of tagging onto electronic financial transactions, as defined in ISO/IEC 7812-1 and ISO/IEC 7812-2.
         self.issuerIdentificationNumber = issuerIdentificationNumber
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         super(ServiceSupplier, self).__init__(*args, **kw_args)
@@ -60,20 +61,32 @@ class ServiceSupplier(Organisation):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.ServiceSupplier = None
-        for y in value:
-            y._ServiceSupplier = self
-        self._CustomerAgreements = value
+            x._ServiceSupplier = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.ServiceSupplier = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._ServiceSupplier
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._ServiceSupplier = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.ServiceSupplier = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._ServiceSupplier is self:
+                obj._ServiceSupplier = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._ServiceSupplier = None
+        self._CustomerAgreements = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points this service supplier utilises to deliver a service.
@@ -82,18 +95,30 @@ class ServiceSupplier(Organisation):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.ServiceSupplier = None
-        for y in value:
-            y._ServiceSupplier = self
-        self._ServiceDeliveryPoints = value
+            x._ServiceSupplier = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceSupplier = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._ServiceSupplier
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._ServiceSupplier = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceSupplier = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._ServiceSupplier is self:
+                obj._ServiceSupplier = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._ServiceSupplier = None
+        self._ServiceDeliveryPoints = RefList()
 
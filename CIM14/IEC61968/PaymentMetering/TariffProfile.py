@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class TariffProfile(Document):
     """A schedule of charges; structure associated with Tariff that allows the definition of complex tarif structures such as step and time of use when used in conjunction with TimeTariffInterval and Charge. Inherited 'status.value' is defined in the context of the utility's business rules, for example: active, inactive, etc.
@@ -35,13 +36,13 @@ class TariffProfile(Document):
         #: The frequency at which the tariff charge schedule is repeated Examples are: once off on a specified date and time; hourly; daily; weekly; monthly; 3-monthly; 6-monthly; 12-monthly; etc. At the end of each cycle, the business rules are reset to start from the beginning again.
         self.tariffCycle = tariffCycle
 
-        self._ConsumptionTariffIntervals = []
+        self._ConsumptionTariffIntervals = RefList()
         self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
 
-        self._TimeTariffIntervals = []
+        self._TimeTariffIntervals = RefList()
         self.TimeTariffIntervals = [] if TimeTariffIntervals is None else TimeTariffIntervals
 
-        self._Tariffs = []
+        self._Tariffs = RefList()
         self.Tariffs = [] if Tariffs is None else Tariffs
 
         super(TariffProfile, self).__init__(*args, **kw_args)
@@ -60,26 +61,28 @@ class TariffProfile(Document):
 
     def setConsumptionTariffIntervals(self, value):
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._ConsumptionTariffIntervals._TariffProfiles = filtered
-        for r in value:
-            if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
-        self._ConsumptionTariffIntervals = value
+            p._TariffProfiles.discard(self)
+        self._ConsumptionTariffIntervals = RefList()
+        self.addConsumptionTariffIntervals(value)
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
-        for obj in ConsumptionTariffIntervals:
-            if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+        collection = self._ConsumptionTariffIntervals
+        for obj in members(ConsumptionTariffIntervals):
+            obj._TariffProfiles.append(self)
+            collection.append(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
-        for obj in ConsumptionTariffIntervals:
-            if self in obj._TariffProfiles:
-                obj._TariffProfiles.remove(self)
-            self._ConsumptionTariffIntervals.remove(obj)
+        collection = self._ConsumptionTariffIntervals
+        for obj in members(ConsumptionTariffIntervals):
+            obj._TariffProfiles.discard(self)
+            collection.discard(obj)
+
+    def removeAllConsumptionTariffIntervals(self):
+        for obj in self._ConsumptionTariffIntervals:
+            obj._TariffProfiles.discard(self)
+        self._ConsumptionTariffIntervals = RefList()
 
     def getTimeTariffIntervals(self):
         """All time tariff intervals used to define this tariff profile.
@@ -88,26 +91,28 @@ class TariffProfile(Document):
 
     def setTimeTariffIntervals(self, value):
         for p in self._TimeTariffIntervals:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._TimeTariffIntervals._TariffProfiles = filtered
-        for r in value:
-            if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
-        self._TimeTariffIntervals = value
+            p._TariffProfiles.discard(self)
+        self._TimeTariffIntervals = RefList()
+        self.addTimeTariffIntervals(value)
 
     TimeTariffIntervals = property(getTimeTariffIntervals, setTimeTariffIntervals)
 
     def addTimeTariffIntervals(self, *TimeTariffIntervals):
-        for obj in TimeTariffIntervals:
-            if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._TimeTariffIntervals.append(obj)
+        collection = self._TimeTariffIntervals
+        for obj in members(TimeTariffIntervals):
+            obj._TariffProfiles.append(self)
+            collection.append(obj)
 
     def removeTimeTariffIntervals(self, *TimeTariffIntervals):
-        for obj in TimeTariffIntervals:
-            if self in obj._TariffProfiles:
-                obj._TariffProfiles.remove(self)
-            self._TimeTariffIntervals.remove(obj)
+        collection = self._TimeTariffIntervals
+        for obj in members(TimeTariffIntervals):
+            obj._TariffProfiles.discard(self)
+            collection.discard(obj)
+
+    def removeAllTimeTariffIntervals(self):
+        for obj in self._TimeTariffIntervals:
+            obj._TariffProfiles.discard(self)
+        self._TimeTariffIntervals = RefList()
 
     def getTariffs(self):
         """All tariffs defined by this tariff profile.
@@ -116,24 +121,26 @@ class TariffProfile(Document):
 
     def setTariffs(self, value):
         for p in self._Tariffs:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._Tariffs._TariffProfiles = filtered
-        for r in value:
-            if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
-        self._Tariffs = value
+            p._TariffProfiles.discard(self)
+        self._Tariffs = RefList()
+        self.addTariffs(value)
 
     Tariffs = property(getTariffs, setTariffs)
 
     def addTariffs(self, *Tariffs):
-        for obj in Tariffs:
-            if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._Tariffs.append(obj)
+        collection = self._Tariffs
+        for obj in members(Tariffs):
+            obj._TariffProfiles.append(self)
+            collection.append(obj)
 
     def removeTariffs(self, *Tariffs):
-        for obj in Tariffs:
-            if self in obj._TariffProfiles:
-                obj._TariffProfiles.remove(self)
-            self._Tariffs.remove(obj)
+        collection = self._Tariffs
+        for obj in members(Tariffs):
+            obj._TariffProfiles.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffs(self):
+        for obj in self._Tariffs:
+            obj._TariffProfiles.discard(self)
+        self._Tariffs = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class TimeTariffInterval(Element):
     """One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.
@@ -38,10 +39,10 @@ class TimeTariffInterval(Element):
         #: A real time marker that defines the starting time (typically it is the time of day) for this interval. The interval extends to the start of the next interval or until it is reset to the start of the first interval by TariffProfile.tariffCycle.
         self.startDateTime = startDateTime
 
-        self._TariffProfiles = []
+        self._TariffProfiles = RefList()
         self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
 
-        self._Charges = []
+        self._Charges = RefList()
         self.Charges = [] if Charges is None else Charges
 
         super(TimeTariffInterval, self).__init__(*args, **kw_args)
@@ -60,26 +61,28 @@ class TimeTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._TariffProfiles._TimeTariffIntervals = filtered
-        for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._TariffProfiles = value
+            p._TimeTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
+        self.addTariffProfiles(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._TimeTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.remove(self)
-            self._TariffProfiles.remove(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._TimeTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffProfiles(self):
+        for obj in self._TariffProfiles:
+            obj._TimeTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
 
     def getCharges(self):
         """All charges used to define this time tariff interval.
@@ -88,24 +91,26 @@ class TimeTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._Charges._TimeTariffIntervals = filtered
-        for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._Charges = value
+            p._TimeTariffIntervals.discard(self)
+        self._Charges = RefList()
+        self.addCharges(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
-        for obj in Charges:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._Charges.append(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._TimeTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeCharges(self, *Charges):
-        for obj in Charges:
-            if self in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.remove(self)
-            self._Charges.remove(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._TimeTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllCharges(self):
+        for obj in self._Charges:
+            obj._TimeTariffIntervals.discard(self)
+        self._Charges = RefList()
 
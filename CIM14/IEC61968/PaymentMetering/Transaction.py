@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Transaction(IdentifiedObject):
     """The record of details of payment for service or token sale.
@@ -68,7 +69,7 @@ class Transaction(IdentifiedObject):
         self._PricingStructure = None
         self.PricingStructure = PricingStructure
 
-        self._UserAttributes = []
+        self._UserAttributes = RefList()
         self.UserAttributes = [] if UserAttributes is None else UserAttributes
 
         self._CustomerAccount = None
@@ -107,8 +108,7 @@ class Transaction(IdentifiedObject):
 
     def setPricingStructure(self, value):
         if self._PricingStructure is not None:
-            filtered = [x for x in self.PricingStructure.Transactions if x != self]
-            self._PricingStructure._Transactions = filtered
+            self._PricingStructure._Transactions.discard(self)
 
         self._PricingStructure = value
         if self._PricingStructure is not None:
@@ -124,20 +124,32 @@ class Transaction(IdentifiedObject):
 
     def setUserAttributes(self, value):
         for x in self._UserAttributes:
-            x.Transaction = None
-        for y in value:
-            y._Transaction = self
-        self._UserAttributes = value
+            x._Transaction = None
+        self._UserAttributes = RefList()
+        self.addUserAttributes(value)
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
-        for obj in UserAttributes:
-            obj.Transaction = self
+        collection = self._UserAttributes
+        for obj in members(UserAttributes):
+            old = obj._Transaction
+            if old is not None and old is not self:
+                old._UserAttributes.discard(obj)
+            obj._Transaction = self
+            collection.append(obj)
 
     def removeUserAttributes(self, *UserAttributes):
-        for obj in UserAttributes:
-            obj.Transaction = None
+        collection = self._UserAttributes
+        for obj in members(UserAttributes):
+            if obj._Transaction is self:
+                obj._Transaction = None
+                collection.discard(obj)
+
+    def removeAllUserAttributes(self):
+        for obj in self._UserAttributes:
+            obj._Transaction = None
+        self._UserAttributes = RefList()
 
     def getCustomerAccount(self):
         """Customer account for this payment transaction.
@@ -146,8 +158,7 @@ class Transaction(IdentifiedObject):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.PaymentTransactions if x != self]
-            self._CustomerAccount._PaymentTransactions = filtered
+            self._CustomerAccount._PaymentTransactions.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
@@ -163,8 +174,7 @@ class Transaction(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Transactions if x != self]
-            self._CashierShift._Transactions = filtered
+            self._CashierShift._Transactions.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
@@ -180,8 +190,7 @@ class Transaction(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Transactions if x != self]
-            self._VendorShift._Transactions = filtered
+            self._VendorShift._Transactions.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
@@ -197,8 +206,7 @@ class Transaction(IdentifiedObject):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.VendingTransactions if x != self]
-            self._MeterAsset._VendingTransactions = filtered
+            self._MeterAsset._VendingTransactions.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
@@ -214,8 +222,7 @@ class Transaction(IdentifiedObject):
 
     def setAuxiliaryAccount(self, value):
         if self._AuxiliaryAccount is not None:
-            filtered = [x for x in self.AuxiliaryAccount.PaymentTransactions if x != self]
-            self._AuxiliaryAccount._PaymentTransactions = filtered
+            self._AuxiliaryAccount._PaymentTransactions.discard(self)
 
         self._AuxiliaryAccount = value
         if self._AuxiliaryAccount is not None:
@@ -234,8 +241,7 @@ class Transaction(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Transactions if x != self]
-            self._Receipt._Transactions = filtered
+            self._Receipt._Transactions.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Transactor(IdentifiedObject):
     """The entity that ultimately executes the transaction and who is in control of the process; typically this is embodied in secure software running on a server that may employ secure hardware encryption devices for secure transaction processing.
@@ -29,7 +30,7 @@ class Transactor(IdentifiedObject):
 
         @param MerchantAccounts: All merchant accounts registered with this transactor.
         """
-        self._MerchantAccounts = []
+        self._MerchantAccounts = RefList()
         self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
 
         super(Transactor, self).__init__(*args, **kw_args)
@@ -48,24 +49,26 @@ class Transactor(IdentifiedObject):
 
     def setMerchantAccounts(self, value):
         for p in self._MerchantAccounts:
-            filtered = [q for q in p.Transactors if q != self]
-            self._MerchantAccounts._Transactors = filtered
-        for r in value:
-            if self not in r._Transactors:
-                r._Transactors.append(self)
-        self._MerchantAccounts = value
+            p._Transactors.discard(self)
+        self._MerchantAccounts = RefList()
+        self.addMerchantAccounts(value)
 
     MerchantAccounts = property(getMerchantAccounts, setMerchantAccounts)
 
     def addMerchantAccounts(self, *MerchantAccounts):
-        for obj in MerchantAccounts:
-            if self not in obj._Transactors:
-                obj._Transactors.append(self)
-            self._MerchantAccounts.append(obj)
+        collection = self._MerchantAccounts
+        for obj in members(MerchantAccounts):
+            obj._Transactors.append(self)
+            collection.append(obj)
 
     def removeMerchantAccounts(self, *MerchantAccounts):
-        for obj in MerchantAccounts:
-            if self in obj._Transactors:
-                obj._Transactors.remove(self)
-            self._MerchantAccounts.remove(obj)
+        collection = self._MerchantAccounts
+        for obj in members(MerchantAccounts):
+            obj._Transactors.discard(self)
+            collection.discard(obj)
+
+    def removeAllMerchantAccounts(self):
+        for obj in self._MerchantAccounts:
+            obj._Transactors.discard(self)
+        self._MerchantAccounts = RefList()
 
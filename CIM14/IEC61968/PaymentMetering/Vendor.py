@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Vendor(IdentifiedObject):
     """The entity that owns PointOfSale and contracts with Cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by Merchant who is a type of Organisation. Vendor is accountable to Merchant for revenue collected, who is in turn accountable to Supplier.
@@ -32,16 +33,16 @@ class Vendor(IdentifiedObject):
         @param Cashiers: All Cachiers managed by this Vendor.
         @param VendorShifts: All vendor shifts opened and owned by this vendor.
         """
-        self._PointOfSales = []
+        self._PointOfSales = RefList()
         self.PointOfSales = [] if PointOfSales is None else PointOfSales
 
         self._MerchantAccount = None
         self.MerchantAccount = MerchantAccount
 
-        self._Cashiers = []
+        self._Cashiers = RefList()
         self.Cashiers = [] if Cashiers is None else Cashiers
 
-        self._VendorShifts = []
+        self._VendorShifts = RefList()
         self.VendorShifts = [] if VendorShifts is None else VendorShifts
 
         super(Vendor, self).__init__(*args, **kw_args)
@@ -60,20 +61,32 @@ class Vendor(IdentifiedObject):
 
     def setPointOfSales(self, value):
         for x in self._PointOfSales:
-            x.Vendor = None
-        for y in value:
-            y._Vendor = self
-        self._PointOfSales = value
+            x._Vendor = None
+        self._PointOfSales = RefList()
+        self.addPointOfSales(value)
 
     PointOfSales = property(getPointOfSales, setPointOfSales)
 
     def addPointOfSales(self, *PointOfSales):
-        for obj in PointOfSales:
-            obj.Vendor = self
+        collection = self._PointOfSales
+        for obj in members(PointOfSales):
+            old = obj._Vendor
+            if old is not None and old is not self:
+                old._PointOfSales.discard(obj)
+            obj._Vendor = self
+            collection.append(obj)
 
     def removePointOfSales(self, *PointOfSales):
-        for obj in PointOfSales:
-            obj.Vendor = None
+        collection = self._PointOfSales
+        for obj in members(PointOfSales):
+            if obj._Vendor is self:
+                obj._Vendor = None
+                collection.discard(obj)
+
+    def removeAllPointOfSales(self):
+        for obj in self._PointOfSales:
+            obj._Vendor = None
+        self._PointOfSales = RefList()
 
     def getMerchantAccount(self):
         """Merchant account against which this vendor sells tokens or recept payments.
@@ -82,8 +95,7 @@ class Vendor(IdentifiedObject):
 
     def setMerchantAccount(self, value):
         if self._MerchantAccount is not None:
-            filtered = [x for x in self.MerchantAccount.Vendors if x != self]
-            self._MerchantAccount._Vendors = filtered
+            self._MerchantAccount._Vendors.discard(self)
 
         self._MerchantAccount = value
         if self._MerchantAccount is not None:
@@ -99,20 +111,32 @@ class Vendor(IdentifiedObject):
 
     def setCashiers(self, value):
         for x in self._Cashiers:
-            x.Vendor = None
-        for y in value:
-            y._Vendor = self
-        self._Cashiers = value
+            x._Vendor = None
+        self._Cashiers = RefList()
+        self.addCashiers(value)
 
     Cashiers = property(getCashiers, setCashiers)
 
     def addCashiers(self, *Cashiers):
-        for obj in Cashiers:
-            obj.Vendor = self
+        collection = self._Cashiers
+        for obj in members(Cashiers):
+            old = obj._Vendor
+            if old is not None and old is not self:
+                old._Cashiers.discard(obj)
+            obj._Vendor = self
+            collection.append(obj)
 
     def removeCashiers(self, *Cashiers):
-        for obj in Cashiers:
-            obj.Vendor = None
+        collection = self._Cashiers
+        for obj in members(Cashiers):
+            if obj._Vendor is self:
+                obj._Vendor = None
+                collection.discard(obj)
+
+    def removeAllCashiers(self):
+        for obj in self._Cashiers:
+            obj._Vendor = None
+        self._Cashiers = RefList()
 
     def getVendorShifts(self):
         """All vendor shifts opened and owned by this vendor.
@@ -121,18 +145,30 @@ class Vendor(IdentifiedObject):
 
     def setVendorShifts(self, value):
         for x in self._VendorShifts:
-            x.Vendor = None
-        for y in value:
-            y._Vendor = self
-        self._VendorShifts = value
+            x._Vendor = None
+        self._VendorShifts = RefList()
+        self.addVendorShifts(value)
 
     VendorShifts = property(getVendorShifts, setVendorShifts)
 
     def addVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.Vendor = self
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            old = obj._Vendor
+            if old is not None and old is not self:
+                old._VendorShifts.discard(obj)
+            obj._Vendor = self
+            collection.append(obj)
 
     def removeVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.Vendor = None
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            if obj._Vendor is self:
+                obj._Vendor = None
+                collection.discard(obj)
+
+    def removeAllVendorShifts(self):
+        for obj in self._VendorShifts:
+            obj._Vendor = None
+        self._VendorShifts = RefList()
 
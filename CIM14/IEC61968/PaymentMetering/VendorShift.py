@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.PaymentMetering.Shift import Shift
+from PyCIM.RefList import RefList, members
 
 class VendorShift(Shift):
     """The operating shift for a vendor during which he may transact against the merchant's account. It aggregates transactions and receipts during the shift and periodically debits a merchant account. The totals in VendorShift should always = sum of totals aggregated in all cashier shifts that were open under the particular vendor shift.
@@ -43,10 +44,10 @@ class VendorShift(Shift):
         self._MerchantAccount = None
         self.MerchantAccount = MerchantAccount
 
-        self._Transactions = []
+        self._Transactions = RefList()
         self.Transactions = [] if Transactions is None else Transactions
 
-        self._Receipts = []
+        self._Receipts = RefList()
         self.Receipts = [] if Receipts is None else Receipts
 
         self._Vendor = None
@@ -68,8 +69,7 @@ class VendorShift(Shift):
 
     def setMerchantAccount(self, value):
         if self._MerchantAccount is not None:
-            filtered = [x for x in self.MerchantAccount.VendorShifts if x != self]
-            self._MerchantAccount._VendorShifts = filtered
+            self._MerchantAccount._VendorShifts.discard(self)
 
         self._MerchantAccount = value
         if self._MerchantAccount is not None:
@@ -84,20 +84,32 @@ class VendorShift(Shift):
 
     def setTransactions(self, value):
         for x in self._Transactions:
-            x.VendorShift = None
-        for y in value:
-            y._VendorShift = self
-        self._Transactions = value
+            x._VendorShift = None
+        self._Transactions = RefList()
+        self.addTransactions(value)
 
     Transactions = property(getTransactions, setTransactions)
 
     def addTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.VendorShift = self
+        collection = self._Transactions
+        for obj in members(Transactions):
+            old = obj._VendorShift
+            if old is not None and old is not self:
+                old._Transactions.discard(obj)
+            obj._VendorShift = self
+            collection.append(obj)
 
     def removeTransactions(self, *Transactions):
-        for obj in Transactions:
-            obj.VendorShift = None
+        collection = self._Transactions
+        for obj in members(Transactions):
+            if obj._VendorShift is self:
+                obj._VendorShift = None
+                collection.discard(obj)
+
+    def removeAllTransactions(self):
+        for obj in self._Transactions:
+            obj._VendorShift = None
+        self._Transactions = RefList()
 
     def getReceipts(self):
         
@@ -105,20 +117,32 @@ class VendorShift(Shift):
 
     def setReceipts(self, value):
         for x in self._Receipts:
-            x.VendorShift = None
-        for y in value:
-            y._VendorShift = self
-        self._Receipts = value
+            x._VendorShift = None
+        self._Receipts = RefList()
+        self.addReceipts(value)
 
     Receipts = property(getReceipts, setReceipts)
 
     def addReceipts(self, *Receipts):
-        for obj in Receipts:
-            obj.VendorShift = self
+        collection = self._Receipts
+        for obj in members(Receipts):
+            old = obj._VendorShift
+            if old is not None and old is not self:
+                old._Receipts.discard(obj)
+            obj._VendorShift = self
+            collection.append(obj)
 
     def removeReceipts(self, *Receipts):
-        for obj in Receipts:
-            obj.VendorShift = None
+        collection = self._Receipts
+        for obj in members(Receipts):
+            if obj._VendorShift is self:
+                obj._VendorShift = None
+                collection.discard(obj)
+
+    def removeAllReceipts(self):
+        for obj in self._Receipts:
+            obj._VendorShift = None
+        self._Receipts = RefList()
 
     def getVendor(self):
         """Vendor that opens and owns this vendor shift.
@@ -127,8 +151,7 @@ class VendorShift(Shift):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.VendorShifts if x != self]
-            self._Vendor._VendorShifts = filtered
+            self._Vendor._VendorShifts.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
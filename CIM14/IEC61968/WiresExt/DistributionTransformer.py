@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class DistributionTransformer(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections. This class differs from Wires::PowerTransformer as follows: - it is part of a TransformerBank - it draws parameters exclusively from TransformerInfo and its associated classes.
@@ -32,10 +33,10 @@ class DistributionTransformer(Equipment):
         @param TransformerBank: Bank this transformer belongs to.
         @param TransformerInfo: Transformer data.
         """
-        self._Windings = []
+        self._Windings = RefList()
         self.Windings = [] if Windings is None else Windings
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         self._TransformerBank = None
@@ -60,20 +61,32 @@ class DistributionTransformer(Equipment):
 
     def setWindings(self, value):
         for x in self._Windings:
-            x.Transformer = None
-        for y in value:
-            y._Transformer = self
-        self._Windings = value
+            x._Transformer = None
+        self._Windings = RefList()
+        self.addWindings(value)
 
     Windings = property(getWindings, setWindings)
 
     def addWindings(self, *Windings):
-        for obj in Windings:
-            obj.Transformer = self
+        collection = self._Windings
+        for obj in members(Windings):
+            old = obj._Transformer
+            if old is not None and old is not self:
+                old._Windings.discard(obj)
+            obj._Transformer = self
+            collection.append(obj)
 
     def removeWindings(self, *Windings):
-        for obj in Windings:
-            obj.Transformer = None
+        collection = self._Windings
+        for obj in members(Windings):
+            if obj._Transformer is self:
+                obj._Transformer = None
+                collection.discard(obj)
+
+    def removeAllWindings(self):
+        for obj in self._Windings:
+            obj._Transformer = None
+        self._Windings = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points supplied by this transformer.
@@ -82,20 +95,32 @@ class DistributionTransformer(Equipment):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.Transformer = None
-        for y in value:
-            y._Transformer = self
-        self._ServiceDeliveryPoints = value
+            x._Transformer = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.Transformer = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._Transformer
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._Transformer = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.Transformer = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._Transformer is self:
+                obj._Transformer = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._Transformer = None
+        self._ServiceDeliveryPoints = RefList()
 
     def getTransformerBank(self):
         """Bank this transformer belongs to.
@@ -104,8 +129,7 @@ class DistributionTransformer(Equipment):
 
     def setTransformerBank(self, value):
         if self._TransformerBank is not None:
-            filtered = [x for x in self.TransformerBank.Transformers if x != self]
-            self._TransformerBank._Transformers = filtered
+            self._TransformerBank._Transformers.discard(self)
 
         self._TransformerBank = value
         if self._TransformerBank is not None:
@@ -121,8 +145,7 @@ class DistributionTransformer(Equipment):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.Transformers if x != self]
-            self._TransformerInfo._Transformers = filtered
+            self._TransformerInfo._Transformers.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
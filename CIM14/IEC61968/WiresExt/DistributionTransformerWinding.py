@@ -76,8 +76,7 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.Windings if x != self]
-            self._Transformer._Windings = filtered
+            self._Transformer._Windings.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
@@ -93,8 +92,7 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setWindingInfo(self, value):
         if self._WindingInfo is not None:
-            filtered = [x for x in self.WindingInfo.Windings if x != self]
-            self._WindingInfo._Windings = filtered
+            self._WindingInfo._Windings.discard(self)
 
         self._WindingInfo = value
         if self._WindingInfo is not None:
@@ -126,8 +124,7 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setPiImpedance(self, value):
         if self._PiImpedance is not None:
-            filtered = [x for x in self.PiImpedance.Windings if x != self]
-            self._PiImpedance._Windings = filtered
+            self._PiImpedance._Windings.discard(self)
 
         self._PiImpedance = value
         if self._PiImpedance is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class WindingPiImpedance(IdentifiedObject):
     """Transformer Pi-model impedance that accurately reflects impedance for transformers with 2 or 3 windings. For transformers with 4 or more windings, you must use TransformerInfo.
@@ -61,7 +62,7 @@ class WindingPiImpedance(IdentifiedObject):
         #: Zero sequence magnetizing branch conductance.
         self.g0 = g0
 
-        self._Windings = []
+        self._Windings = RefList()
         self.Windings = [] if Windings is None else Windings
 
         super(WindingPiImpedance, self).__init__(*args, **kw_args)
@@ -80,18 +81,30 @@ class WindingPiImpedance(IdentifiedObject):
 
     def setWindings(self, value):
         for x in self._Windings:
-            x.PiImpedance = None
-        for y in value:
-            y._PiImpedance = self
-        self._Windings = value
+            x._PiImpedance = None
+        self._Windings = RefList()
+        self.addWindings(value)
 
     Windings = property(getWindings, setWindings)
 
     def addWindings(self, *Windings):
-        for obj in Windings:
-            obj.PiImpedance = self
+        collection = self._Windings
+        for obj in members(Windings):
+            old = obj._PiImpedance
+            if old is not None and old is not self:
+                old._Windings.discard(obj)
+            obj._PiImpedance = self
+            collection.append(obj)
 
     def removeWindings(self, *Windings):
-        for obj in Windings:
-            obj.PiImpedance = None
+        collection = self._Windings
+        for obj in members(Windings):
+            if obj._PiImpedance is self:
+                obj._PiImpedance = None
+                collection.discard(obj)
+
+    def removeAllWindings(self):
+        for obj in self._Windings:
+            obj._PiImpedance = None
+        self._Windings = RefList()
 
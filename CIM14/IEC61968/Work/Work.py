@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Work(Document):
     """Document used to request, initiate, track and record work. This is synonymous with Work Breakdown Structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.
@@ -41,7 +42,7 @@ class Work(Document):
         #: Date and time work was requested.
         self.requestDateTime = requestDateTime
 
-        self._Customers = []
+        self._Customers = RefList()
         self.Customers = [] if Customers is None else Customers
 
         super(Work, self).__init__(*args, **kw_args)
@@ -60,24 +61,26 @@ class Work(Document):
 
     def setCustomers(self, value):
         for p in self._Customers:
-            filtered = [q for q in p.Works if q != self]
-            self._Customers._Works = filtered
-        for r in value:
-            if self not in r._Works:
-                r._Works.append(self)
-        self._Customers = value
+            p._Works.discard(self)
+        self._Customers = RefList()
+        self.addCustomers(value)
 
     Customers = property(getCustomers, setCustomers)
 
     def addCustomers(self, *Customers):
-        for obj in Customers:
-            if self not in obj._Works:
-                obj._Works.append(self)
-            self._Customers.append(obj)
+        collection = self._Customers
+        for obj in members(Customers):
+            obj._Works.append(self)
+            collection.append(obj)
 
     def removeCustomers(self, *Customers):
-        for obj in Customers:
-            if self in obj._Works:
-                obj._Works.remove(self)
-            self._Customers.remove(obj)
+        collection = self._Customers
+        for obj in members(Customers):
+            obj._Works.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomers(self):
+        for obj in self._Customers:
+            obj._Works.discard(self)
+        self._Customers = RefList()
 
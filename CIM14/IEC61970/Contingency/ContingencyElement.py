@@ -48,8 +48,7 @@ class ContingencyElement(IdentifiedObject):
 
     def setContingency(self, value):
         if self._Contingency is not None:
-            filtered = [x for x in self.Contingency.ContingencyElement if x != self]
-            self._Contingency._ContingencyElement = filtered
+            self._Contingency._ContingencyElement.discard(self)
 
         self._Contingency = value
         if self._Contingency is not None:
@@ -52,8 +52,7 @@ class ContingencyEquipment(ContingencyElement):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.ContingencyEquipment if x != self]
-            self._Equipment._ContingencyEquipment = filtered
+            self._Equipment._ContingencyEquipment.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
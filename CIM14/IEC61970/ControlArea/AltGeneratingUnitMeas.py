@@ -56,8 +56,7 @@ class AltGeneratingUnitMeas(Element):
 
     def setControlAreaGeneratingUnit(self, value):
         if self._ControlAreaGeneratingUnit is not None:
-            filtered = [x for x in self.ControlAreaGeneratingUnit.AltGeneratingUnitMeas if x != self]
-            self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas = filtered
+            self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas.discard(self)
 
         self._ControlAreaGeneratingUnit = value
         if self._ControlAreaGeneratingUnit is not None:
@@ -73,8 +72,7 @@ class AltGeneratingUnitMeas(Element):
 
     def setAnalogValue(self, value):
         if self._AnalogValue is not None:
-            filtered = [x for x in self.AnalogValue.AltGeneratingUnit if x != self]
-            self._AnalogValue._AltGeneratingUnit = filtered
+            self._AnalogValue._AltGeneratingUnit.discard(self)
 
         self._AnalogValue = value
         if self._AnalogValue is not None:
@@ -56,8 +56,7 @@ class AltTieMeas(Element):
 
     def setAnalogValue(self, value):
         if self._AnalogValue is not None:
-            filtered = [x for x in self.AnalogValue.AltTieMeas if x != self]
-            self._AnalogValue._AltTieMeas = filtered
+            self._AnalogValue._AltTieMeas.discard(self)
 
         self._AnalogValue = value
         if self._AnalogValue is not None:
@@ -73,8 +72,7 @@ class AltTieMeas(Element):
 
     def setTieFlow(self, value):
         if self._TieFlow is not None:
-            filtered = [x for x in self.TieFlow.AltTieMeas if x != self]
-            self._TieFlow._AltTieMeas = filtered
+            self._TieFlow._AltTieMeas.discard(self)
 
         self._TieFlow = value
         if self._TieFlow is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class TieFlow(Element):
     """A flow specification in terms of location and direction for a control area.
@@ -38,7 +39,7 @@ class TieFlow(Element):
         self._ControlArea = None
         self.ControlArea = ControlArea
 
-        self._AltTieMeas = []
+        self._AltTieMeas = RefList()
         self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
 
         self._Terminal = None
@@ -60,8 +61,7 @@ class TieFlow(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.TieFlow if x != self]
-            self._ControlArea._TieFlow = filtered
+            self._ControlArea._TieFlow.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
@@ -77,20 +77,32 @@ class TieFlow(Element):
 
     def setAltTieMeas(self, value):
         for x in self._AltTieMeas:
-            x.TieFlow = None
-        for y in value:
-            y._TieFlow = self
-        self._AltTieMeas = value
+            x._TieFlow = None
+        self._AltTieMeas = RefList()
+        self.addAltTieMeas(value)
 
     AltTieMeas = property(getAltTieMeas, setAltTieMeas)
 
     def addAltTieMeas(self, *AltTieMeas):
-        for obj in AltTieMeas:
-            obj.TieFlow = self
+        collection = self._AltTieMeas
+        for obj in members(AltTieMeas):
+            old = obj._TieFlow
+            if old is not None and old is not self:
+                old._AltTieMeas.discard(obj)
+            obj._TieFlow = self
+            collection.append(obj)
 
     def removeAltTieMeas(self, *AltTieMeas):
-        for obj in AltTieMeas:
-            obj.TieFlow = None
+        collection = self._AltTieMeas
+        for obj in members(AltTieMeas):
+            if obj._TieFlow is self:
+                obj._TieFlow = None
+                collection.discard(obj)
+
+    def removeAllAltTieMeas(self):
+        for obj in self._AltTieMeas:
+            obj._TieFlow = None
+        self._AltTieMeas = RefList()
 
     def getTerminal(self):
         """The terminal to which this tie flow belongs.
@@ -99,8 +111,7 @@ class TieFlow(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TieFlow if x != self]
-            self._Terminal._TieFlow = filtered
+            self._Terminal._TieFlow.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -68,8 +68,7 @@ class Bay(EquipmentContainer):
 
     def setSubstation(self, value):
         if self._Substation is not None:
-            filtered = [x for x in self.Substation.Bays if x != self]
-            self._Substation._Bays = filtered
+            self._Substation._Bays.discard(self)
 
         self._Substation = value
         if self._Substation is not None:
@@ -85,8 +84,7 @@ class Bay(EquipmentContainer):
 
     def setVoltageLevel(self, value):
         if self._VoltageLevel is not None:
-            filtered = [x for x in self.VoltageLevel.Bays if x != self]
-            self._VoltageLevel._Bays = filtered
+            self._VoltageLevel._Bays.discard(self)
 
         self._VoltageLevel = value
         if self._VoltageLevel is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -37,19 +38,19 @@ class ConductingEquipment(Equipment):
         #: Describes the phases carried by a conducting equipment. Values are: "A", "AC", "AN", "ABCN", "B", "C", "BN", "CN", "splitSecondary12N", "ABC", "splitSecondary2N", "N", "ABN", "BC", "BCN", "AB", "splitSecondary1N", "ACN"
         self.phases = phases
 
-        self._ClearanceTags = []
+        self._ClearanceTags = RefList()
         self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
 
         self._SvStatus = None
         self.SvStatus = SvStatus
 
-        self._Terminals = []
+        self._Terminals = RefList()
         self.Terminals = [] if Terminals is None else Terminals
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._ProtectionEquipments = []
+        self._ProtectionEquipments = RefList()
         self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
 
         super(ConductingEquipment, self).__init__(*args, **kw_args)
@@ -68,20 +69,32 @@ class ConductingEquipment(Equipment):
 
     def setClearanceTags(self, value):
         for x in self._ClearanceTags:
-            x.ConductingEquipment = None
-        for y in value:
-            y._ConductingEquipment = self
-        self._ClearanceTags = value
+            x._ConductingEquipment = None
+        self._ClearanceTags = RefList()
+        self.addClearanceTags(value)
 
     ClearanceTags = property(getClearanceTags, setClearanceTags)
 
     def addClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.ConductingEquipment = self
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            old = obj._ConductingEquipment
+            if old is not None and old is not self:
+                old._ClearanceTags.discard(obj)
+            obj._ConductingEquipment = self
+            collection.append(obj)
 
     def removeClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.ConductingEquipment = None
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            if obj._ConductingEquipment is self:
+                obj._ConductingEquipment = None
+                collection.discard(obj)
+
+    def removeAllClearanceTags(self):
+        for obj in self._ClearanceTags:
+            obj._ConductingEquipment = None
+        self._ClearanceTags = RefList()
 
     def getSvStatus(self):
         """The status state associated with the conducting equipment.
@@ -106,20 +119,32 @@ class ConductingEquipment(Equipment):
 
     def setTerminals(self, value):
         for x in self._Terminals:
-            x.ConductingEquipment = None
-        for y in value:
-            y._ConductingEquipment = self
-        self._Terminals = value
+            x._ConductingEquipment = None
+        self._Terminals = RefList()
+        self.addTerminals(value)
 
     Terminals = property(getTerminals, setTerminals)
 
     def addTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConductingEquipment = self
+        collection = self._Terminals
+        for obj in members(Terminals):
+            old = obj._ConductingEquipment
+            if old is not None and old is not self:
+                old._Terminals.discard(obj)
+            obj._ConductingEquipment = self
+            collection.append(obj)
 
     def removeTerminals(self, *Terminals):
-        for obj in Terminals:
-            obj.ConductingEquipment = None
+        collection = self._Terminals
+        for obj in members(Terminals):
+            if obj._ConductingEquipment is self:
+                obj._ConductingEquipment = None
+                collection.discard(obj)
+
+    def removeAllTerminals(self):
+        for obj in self._Terminals:
+            obj._ConductingEquipment = None
+        self._Terminals = RefList()
 
     def getBaseVoltage(self):
         """Use association to ConductingEquipment only when there is no VoltageLevel container used.
@@ -128,8 +153,7 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -145,24 +169,26 @@ class ConductingEquipment(Equipment):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
-        for r in value:
-            if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
-        self._ProtectionEquipments = value
+            p._ConductingEquipments.discard(self)
+        self._ProtectionEquipments = RefList()
+        self.addProtectionEquipments(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            obj._ConductingEquipments.append(self)
+            collection.append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            if self in obj._ConductingEquipments:
-                obj._ConductingEquipments.remove(self)
-            self._ProtectionEquipments.remove(obj)
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            obj._ConductingEquipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllProtectionEquipments(self):
+        for obj in self._ProtectionEquipments:
+            obj._ConductingEquipments.discard(self)
+        self._ProtectionEquipments = RefList()
 
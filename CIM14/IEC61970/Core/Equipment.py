@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class Equipment(PowerSystemResource):
     """The parts of a power system that are physical devices, electronic or mechanical
@@ -40,16 +41,16 @@ class Equipment(PowerSystemResource):
         #: The single instance of equipment represents multiple pieces of equipment that have been modeled together as an aggregate.  Examples would be PowerTransformers or SychronousMachines operating in parallel modeled as a single aggregate PowerTransformer or aggregate SynchronousMachine.  This is not to be used to indicate equipment that is part of a group of interdependent equipment produced by a network production program.
         self.aggregate = aggregate
 
-        self._OperationalLimitSet = []
+        self._OperationalLimitSet = RefList()
         self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
 
-        self._ContingencyEquipment = []
+        self._ContingencyEquipment = RefList()
         self.ContingencyEquipment = [] if ContingencyEquipment is None else ContingencyEquipment
 
         self._EquipmentContainer = None
         self.EquipmentContainer = EquipmentContainer
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
         super(Equipment, self).__init__(*args, **kw_args)
@@ -68,20 +69,32 @@ class Equipment(PowerSystemResource):
 
     def setOperationalLimitSet(self, value):
         for x in self._OperationalLimitSet:
-            x.Equipment = None
-        for y in value:
-            y._Equipment = self
-        self._OperationalLimitSet = value
+            x._Equipment = None
+        self._OperationalLimitSet = RefList()
+        self.addOperationalLimitSet(value)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
     def addOperationalLimitSet(self, *OperationalLimitSet):
-        for obj in OperationalLimitSet:
-            obj.Equipment = self
+        collection = self._OperationalLimitSet
+        for obj in members(OperationalLimitSet):
+            old = obj._Equipment
+            if old is not None and old is not self:
+                old._OperationalLimitSet.discard(obj)
+            obj._Equipment = self
+            collection.append(obj)
 
     def removeOperationalLimitSet(self, *OperationalLimitSet):
-        for obj in OperationalLimitSet:
-            obj.Equipment = None
+        collection = self._OperationalLimitSet
+        for obj in members(OperationalLimitSet):
+            if obj._Equipment is self:
+                obj._Equipment = None
+                collection.discard(obj)
+
+    def removeAllOperationalLimitSet(self):
+        for obj in self._OperationalLimitSet:
+            obj._Equipment = None
+        self._OperationalLimitSet = RefList()
 
     def getContingencyEquipment(self):
         """The contingency element associated with the equipment.
@@ -90,20 +103,32 @@ class Equipment(PowerSystemResource):
 
     def setContingencyEquipment(self, value):
         for x in self._ContingencyEquipment:
-            x.Equipment = None
-        for y in value:
-            y._Equipment = self
-        self._ContingencyEquipment = value
+            x._Equipment = None
+        self._ContingencyEquipment = RefList()
+        self.addContingencyEquipment(value)
 
     ContingencyEquipment = property(getContingencyEquipment, setContingencyEquipment)
 
     def addContingencyEquipment(self, *ContingencyEquipment):
-        for obj in ContingencyEquipment:
-            obj.Equipment = self
+        collection = self._ContingencyEquipment
+        for obj in members(ContingencyEquipment):
+            old = obj._Equipment
+            if old is not None and old is not self:
+                old._ContingencyEquipment.discard(obj)
+            obj._Equipment = self
+            collection.append(obj)
 
     def removeContingencyEquipment(self, *ContingencyEquipment):
-        for obj in ContingencyEquipment:
-            obj.Equipment = None
+        collection = self._ContingencyEquipment
+        for obj in members(ContingencyEquipment):
+            if obj._Equipment is self:
+                obj._Equipment = None
+                collection.discard(obj)
+
+    def removeAllContingencyEquipment(self):
+        for obj in self._ContingencyEquipment:
+            obj._Equipment = None
+        self._ContingencyEquipment = RefList()
 
     def getEquipmentContainer(self):
         """The association is used in the naming hierarchy.
@@ -112,8 +137,7 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
@@ -128,24 +152,26 @@ class Equipment(PowerSystemResource):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.Equipments if q != self]
-            self._CustomerAgreements._Equipments = filtered
-        for r in value:
-            if self not in r._Equipments:
-                r._Equipments.append(self)
-        self._CustomerAgreements = value
+            p._Equipments.discard(self)
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self not in obj._Equipments:
-                obj._Equipments.append(self)
-            self._CustomerAgreements.append(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._Equipments.append(self)
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self in obj._Equipments:
-                obj._Equipments.remove(self)
-            self._CustomerAgreements.remove(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._Equipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._Equipments.discard(self)
+        self._CustomerAgreements = RefList()
 
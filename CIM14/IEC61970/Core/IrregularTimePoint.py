@@ -60,8 +60,7 @@ class IrregularTimePoint(Element):
 
     def setIntervalSchedule(self, value):
         if self._IntervalSchedule is not None:
-            filtered = [x for x in self.IntervalSchedule.TimePoints if x != self]
-            self._IntervalSchedule._TimePoints = filtered
+            self._IntervalSchedule._TimePoints.discard(self)
 
         self._IntervalSchedule = value
         if self._IntervalSchedule is not None:
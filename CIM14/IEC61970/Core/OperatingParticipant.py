@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class OperatingParticipant(IdentifiedObject):
     """An operator of multiple PowerSystemResource objects. Note multple OperatingParticipants may operate the same PowerSystemResource object.   This can be used for modeling jointly owned units where each owner operates as a contractual share.
@@ -29,7 +30,7 @@ class OperatingParticipant(IdentifiedObject):
 
         @param OperatingShare: The operating shares of an operating participant.   An operating participant can be reused for any number of PSR's.
         """
-        self._OperatingShare = []
+        self._OperatingShare = RefList()
         self.OperatingShare = [] if OperatingShare is None else OperatingShare
 
         super(OperatingParticipant, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class OperatingParticipant(IdentifiedObject):
 
     def setOperatingShare(self, value):
         for x in self._OperatingShare:
-            x.OperatingParticipant = None
-        for y in value:
-            y._OperatingParticipant = self
-        self._OperatingShare = value
+            x._OperatingParticipant = None
+        self._OperatingShare = RefList()
+        self.addOperatingShare(value)
 
     OperatingShare = property(getOperatingShare, setOperatingShare)
 
     def addOperatingShare(self, *OperatingShare):
-        for obj in OperatingShare:
-            obj.OperatingParticipant = self
+        collection = self._OperatingShare
+        for obj in members(OperatingShare):
+            old = obj._OperatingParticipant
+            if old is not None and old is not self:
+                old._OperatingShare.discard(obj)
+            obj._OperatingParticipant = self
+            collection.append(obj)
 
     def removeOperatingShare(self, *OperatingShare):
-        for obj in OperatingShare:
-            obj.OperatingParticipant = None
+        collection = self._OperatingShare
+        for obj in members(OperatingShare):
+            if obj._OperatingParticipant is self:
+                obj._OperatingParticipant = None
+                collection.discard(obj)
+
+    def removeAllOperatingShare(self):
+        for obj in self._OperatingShare:
+            obj._OperatingParticipant = None
+        self._OperatingShare = RefList()
 
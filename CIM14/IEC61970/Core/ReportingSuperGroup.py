@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ReportingSuperGroup(IdentifiedObject):
     """A reporting super group, groups reporting groups for a higher level report.
@@ -29,7 +30,7 @@ class ReportingSuperGroup(IdentifiedObject):
 
         @param ReportingGroup: Reporting groups that are grouped under this group group.
         """
-        self._ReportingGroup = []
+        self._ReportingGroup = RefList()
         self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
 
         super(ReportingSuperGroup, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ReportingSuperGroup(IdentifiedObject):
 
     def setReportingGroup(self, value):
         for x in self._ReportingGroup:
-            x.ReportingSuperGroup = None
-        for y in value:
-            y._ReportingSuperGroup = self
-        self._ReportingGroup = value
+            x._ReportingSuperGroup = None
+        self._ReportingGroup = RefList()
+        self.addReportingGroup(value)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
-        for obj in ReportingGroup:
-            obj.ReportingSuperGroup = self
+        collection = self._ReportingGroup
+        for obj in members(ReportingGroup):
+            old = obj._ReportingSuperGroup
+            if old is not None and old is not self:
+                old._ReportingGroup.discard(obj)
+            obj._ReportingSuperGroup = self
+            collection.append(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
-        for obj in ReportingGroup:
-            obj.ReportingSuperGroup = None
+        collection = self._ReportingGroup
+        for obj in members(ReportingGroup):
+            if obj._ReportingSuperGroup is self:
+                obj._ReportingSuperGroup = None
+                collection.discard(obj)
+
+    def removeAllReportingGroup(self):
+        for obj in self._ReportingGroup:
+            obj._ReportingSuperGroup = None
+        self._ReportingGroup = RefList()
 
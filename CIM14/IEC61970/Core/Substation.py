@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from PyCIM.RefList import RefList, members
 
 class Substation(EquipmentContainer):
     """A collection of equipment for purposes other than generation or utilization, through which electric energy in bulk is passed for the purposes of switching or modifying its characteristics.
@@ -31,10 +32,10 @@ class Substation(EquipmentContainer):
         @param Bays: The association is used in the naming hierarchy.
         @param Region: The association is used in the naming hierarchy.
         """
-        self._VoltageLevels = []
+        self._VoltageLevels = RefList()
         self.VoltageLevels = [] if VoltageLevels is None else VoltageLevels
 
-        self._Bays = []
+        self._Bays = RefList()
         self.Bays = [] if Bays is None else Bays
 
         self._Region = None
@@ -56,20 +57,32 @@ class Substation(EquipmentContainer):
 
     def setVoltageLevels(self, value):
         for x in self._VoltageLevels:
-            x.Substation = None
-        for y in value:
-            y._Substation = self
-        self._VoltageLevels = value
+            x._Substation = None
+        self._VoltageLevels = RefList()
+        self.addVoltageLevels(value)
 
     VoltageLevels = property(getVoltageLevels, setVoltageLevels)
 
     def addVoltageLevels(self, *VoltageLevels):
-        for obj in VoltageLevels:
-            obj.Substation = self
+        collection = self._VoltageLevels
+        for obj in members(VoltageLevels):
+            old = obj._Substation
+            if old is not None and old is not self:
+                old._VoltageLevels.discard(obj)
+            obj._Substation = self
+            collection.append(obj)
 
     def removeVoltageLevels(self, *VoltageLevels):
-        for obj in VoltageLevels:
-            obj.Substation = None
+        collection = self._VoltageLevels
+        for obj in members(VoltageLevels):
+            if obj._Substation is self:
+                obj._Substation = None
+                collection.discard(obj)
+
+    def removeAllVoltageLevels(self):
+        for obj in self._VoltageLevels:
+            obj._Substation = None
+        self._VoltageLevels = RefList()
 
     def getBays(self):
         """The association is used in the naming hierarchy.
@@ -78,20 +91,32 @@ class Substation(EquipmentContainer):
 
     def setBays(self, value):
         for x in self._Bays:
-            x.Substation = None
-        for y in value:
-            y._Substation = self
-        self._Bays = value
+            x._Substation = None
+        self._Bays = RefList()
+        self.addBays(value)
 
     Bays = property(getBays, setBays)
 
     def addBays(self, *Bays):
-        for obj in Bays:
-            obj.Substation = self
+        collection = self._Bays
+        for obj in members(Bays):
+            old = obj._Substation
+            if old is not None and old is not self:
+                old._Bays.discard(obj)
+            obj._Substation = self
+            collection.append(obj)
 
     def removeBays(self, *Bays):
-        for obj in Bays:
-            obj.Substation = None
+        collection = self._Bays
+        for obj in members(Bays):
+            if obj._Substation is self:
+                obj._Substation = None
+                collection.discard(obj)
+
+    def removeAllBays(self):
+        for obj in self._Bays:
+            obj._Substation = None
+        self._Bays = RefList()
 
     def getRegion(self):
         """The association is used in the naming hierarchy.
@@ -100,8 +125,7 @@ class Substation(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Substations if x != self]
-            self._Region._Substations = filtered
+            self._Region._Substations.discard(self)
 
         self._Region = value
         if self._Region is not None:
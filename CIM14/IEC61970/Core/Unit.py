@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Unit(IdentifiedObject):
     """Quantity being measured. The Unit.name shall be unique among all specified quantities and describe the quantity. The Unit.aliasName is meant to be used for localization.
@@ -33,19 +34,19 @@ class Unit(IdentifiedObject):
         @param MetaBlockConInput:
         @param ProtectionEquipments: The Protection Equipments having the Unit.
         """
-        self._Controls = []
+        self._Controls = RefList()
         self.Controls = [] if Controls is None else Controls
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
-        self._MetaBlockConOutput = []
+        self._MetaBlockConOutput = RefList()
         self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
 
-        self._MetaBlockConInput = []
+        self._MetaBlockConInput = RefList()
         self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
 
-        self._ProtectionEquipments = []
+        self._ProtectionEquipments = RefList()
         self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
 
         super(Unit, self).__init__(*args, **kw_args)
@@ -64,20 +65,32 @@ class Unit(IdentifiedObject):
 
     def setControls(self, value):
         for x in self._Controls:
-            x.Unit = None
-        for y in value:
-            y._Unit = self
-        self._Controls = value
+            x._Unit = None
+        self._Controls = RefList()
+        self.addControls(value)
 
     Controls = property(getControls, setControls)
 
     def addControls(self, *Controls):
-        for obj in Controls:
-            obj.Unit = self
+        collection = self._Controls
+        for obj in members(Controls):
+            old = obj._Unit
+            if old is not None and old is not self:
+                old._Controls.discard(obj)
+            obj._Unit = self
+            collection.append(obj)
 
     def removeControls(self, *Controls):
-        for obj in Controls:
-            obj.Unit = None
+        collection = self._Controls
+        for obj in members(Controls):
+            if obj._Unit is self:
+                obj._Unit = None
+                collection.discard(obj)
+
+    def removeAllControls(self):
+        for obj in self._Controls:
+            obj._Unit = None
+        self._Controls = RefList()
 
     def getMeasurements(self):
         """The Measurements having the Unit
@@ -86,20 +99,32 @@ class Unit(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.Unit = None
-        for y in value:
-            y._Unit = self
-        self._Measurements = value
+            x._Unit = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Unit = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._Unit
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._Unit = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Unit = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._Unit is self:
+                obj._Unit = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Unit = None
+        self._Measurements = RefList()
 
     def getMetaBlockConOutput(self):
         
@@ -107,20 +132,32 @@ class Unit(IdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         for x in self._MetaBlockConOutput:
-            x.Unit = None
-        for y in value:
-            y._Unit = self
-        self._MetaBlockConOutput = value
+            x._Unit = None
+        self._MetaBlockConOutput = RefList()
+        self.addMetaBlockConOutput(value)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
     def addMetaBlockConOutput(self, *MetaBlockConOutput):
-        for obj in MetaBlockConOutput:
-            obj.Unit = self
+        collection = self._MetaBlockConOutput
+        for obj in members(MetaBlockConOutput):
+            old = obj._Unit
+            if old is not None and old is not self:
+                old._MetaBlockConOutput.discard(obj)
+            obj._Unit = self
+            collection.append(obj)
 
     def removeMetaBlockConOutput(self, *MetaBlockConOutput):
-        for obj in MetaBlockConOutput:
-            obj.Unit = None
+        collection = self._MetaBlockConOutput
+        for obj in members(MetaBlockConOutput):
+            if obj._Unit is self:
+                obj._Unit = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConOutput(self):
+        for obj in self._MetaBlockConOutput:
+            obj._Unit = None
+        self._MetaBlockConOutput = RefList()
 
     def getMetaBlockConInput(self):
         
@@ -128,20 +165,32 @@ class Unit(IdentifiedObject):
 
     def setMetaBlockConInput(self, value):
         for x in self._MetaBlockConInput:
-            x.Unit = None
-        for y in value:
-            y._Unit = self
-        self._MetaBlockConInput = value
+            x._Unit = None
+        self._MetaBlockConInput = RefList()
+        self.addMetaBlockConInput(value)
 
     MetaBlockConInput = property(getMetaBlockConInput, setMetaBlockConInput)
 
     def addMetaBlockConInput(self, *MetaBlockConInput):
-        for obj in MetaBlockConInput:
-            obj.Unit = self
+        collection = self._MetaBlockConInput
+        for obj in members(MetaBlockConInput):
+            old = obj._Unit
+            if old is not None and old is not self:
+                old._MetaBlockConInput.discard(obj)
+            obj._Unit = self
+            collection.append(obj)
 
     def removeMetaBlockConInput(self, *MetaBlockConInput):
-        for obj in MetaBlockConInput:
-            obj.Unit = None
+        collection = self._MetaBlockConInput
+        for obj in members(MetaBlockConInput):
+            if obj._Unit is self:
+                obj._Unit = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConInput(self):
+        for obj in self._MetaBlockConInput:
+            obj._Unit = None
+        self._MetaBlockConInput = RefList()
 
     def getProtectionEquipments(self):
         """The Protection Equipments having the Unit.
@@ -150,18 +199,30 @@ class Unit(IdentifiedObject):
 
     def setProtectionEquipments(self, value):
         for x in self._ProtectionEquipments:
-            x.Unit = None
-        for y in value:
-            y._Unit = self
-        self._ProtectionEquipments = value
+            x._Unit = None
+        self._ProtectionEquipments = RefList()
+        self.addProtectionEquipments(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            obj.Unit = self
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            old = obj._Unit
+            if old is not None and old is not self:
+                old._ProtectionEquipments.discard(obj)
+            obj._Unit = self
+            collection.append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            obj.Unit = None
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            if obj._Unit is self:
+                obj._Unit = None
+                collection.discard(obj)
+
+    def removeAllProtectionEquipments(self):
+        for obj in self._ProtectionEquipments:
+            obj._Unit = None
+        self._ProtectionEquipments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class Block(PowerSystemResource):
     """A specific usage of a dynamics block, supplied with parameters and any linkages to the power system static model that are required.     Sometimes a block is used to simply specify a location of input or output from dyanmics equations to the static model.
@@ -52,10 +53,10 @@ class Block(PowerSystemResource):
         self._MemberOf_BlockConnectivity = None
         self.MemberOf_BlockConnectivity = MemberOf_BlockConnectivity
 
-        self._blockUsageInputReference0 = []
+        self._blockUsageInputReference0 = RefList()
         self.blockUsageInputReference0 = [] if blockUsageInputReference0 is None else blockUsageInputReference0
 
-        self._BlockUsageOutputReference = []
+        self._BlockUsageOutputReference = RefList()
         self.BlockUsageOutputReference = [] if BlockUsageOutputReference is None else BlockUsageOutputReference
 
         self._PowerSystemResource = None
@@ -64,16 +65,16 @@ class Block(PowerSystemResource):
         self._slotReference0 = None
         self.slotReference0 = slotReference0
 
-        self._tieToMeasurement0 = []
+        self._tieToMeasurement0 = RefList()
         self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
 
         self._MetaBlock = None
         self.MetaBlock = MetaBlock
 
-        self._BlockConnection = []
+        self._BlockConnection = RefList()
         self.BlockConnection = [] if BlockConnection is None else BlockConnection
 
-        self._BlockParameter = []
+        self._BlockParameter = RefList()
         self.BlockParameter = [] if BlockParameter is None else BlockParameter
 
         super(Block, self).__init__(*args, **kw_args)
@@ -92,8 +93,7 @@ class Block(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Block if x != self]
-            self._Terminal._Block = filtered
+            self._Terminal._Block.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -108,8 +108,7 @@ class Block(PowerSystemResource):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.Block if x != self]
-            self._MemberOf_BlockConnectivity._Block = filtered
+            self._MemberOf_BlockConnectivity._Block.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
@@ -124,20 +123,32 @@ class Block(PowerSystemResource):
 
     def setblockUsageInputReference0(self, value):
         for x in self._blockUsageInputReference0:
-            x.block0 = None
-        for y in value:
-            y._block0 = self
-        self._blockUsageInputReference0 = value
+            x._block0 = None
+        self._blockUsageInputReference0 = RefList()
+        self.addblockUsageInputReference0(value)
 
     blockUsageInputReference0 = property(getblockUsageInputReference0, setblockUsageInputReference0)
 
     def addblockUsageInputReference0(self, *blockUsageInputReference0):
-        for obj in blockUsageInputReference0:
-            obj.block0 = self
+        collection = self._blockUsageInputReference0
+        for obj in members(blockUsageInputReference0):
+            old = obj._block0
+            if old is not None and old is not self:
+                old._blockUsageInputReference0.discard(obj)
+            obj._block0 = self
+            collection.append(obj)
 
     def removeblockUsageInputReference0(self, *blockUsageInputReference0):
-        for obj in blockUsageInputReference0:
-            obj.block0 = None
+        collection = self._blockUsageInputReference0
+        for obj in members(blockUsageInputReference0):
+            if obj._block0 is self:
+                obj._block0 = None
+                collection.discard(obj)
+
+    def removeAllblockUsageInputReference0(self):
+        for obj in self._blockUsageInputReference0:
+            obj._block0 = None
+        self._blockUsageInputReference0 = RefList()
 
     def getBlockUsageOutputReference(self):
         
@@ -145,20 +156,32 @@ class Block(PowerSystemResource):
 
     def setBlockUsageOutputReference(self, value):
         for x in self._BlockUsageOutputReference:
-            x.block0 = None
-        for y in value:
-            y._block0 = self
-        self._BlockUsageOutputReference = value
+            x._block0 = None
+        self._BlockUsageOutputReference = RefList()
+        self.addBlockUsageOutputReference(value)
 
     BlockUsageOutputReference = property(getBlockUsageOutputReference, setBlockUsageOutputReference)
 
     def addBlockUsageOutputReference(self, *BlockUsageOutputReference):
-        for obj in BlockUsageOutputReference:
-            obj.block0 = self
+        collection = self._BlockUsageOutputReference
+        for obj in members(BlockUsageOutputReference):
+            old = obj._block0
+            if old is not None and old is not self:
+                old._BlockUsageOutputReference.discard(obj)
+            obj._block0 = self
+            collection.append(obj)
 
     def removeBlockUsageOutputReference(self, *BlockUsageOutputReference):
-        for obj in BlockUsageOutputReference:
-            obj.block0 = None
+        collection = self._BlockUsageOutputReference
+        for obj in members(BlockUsageOutputReference):
+            if obj._block0 is self:
+                obj._block0 = None
+                collection.discard(obj)
+
+    def removeAllBlockUsageOutputReference(self):
+        for obj in self._BlockUsageOutputReference:
+            obj._block0 = None
+        self._BlockUsageOutputReference = RefList()
 
     def getPowerSystemResource(self):
         """The power system resource associated with the dyanmics block instance.   This is optional because sometimes no linkage is needed, yet parameters must be specified.  Also the linkage to Terminal can be used instead of the linkage to PowerSystemResource.
@@ -167,8 +190,7 @@ class Block(PowerSystemResource):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Block if x != self]
-            self._PowerSystemResource._Block = filtered
+            self._PowerSystemResource._Block.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -183,8 +205,7 @@ class Block(PowerSystemResource):
 
     def setslotReference0(self, value):
         if self._slotReference0 is not None:
-            filtered = [x for x in self.slotReference0.block0 if x != self]
-            self._slotReference0._block0 = filtered
+            self._slotReference0._block0.discard(self)
 
         self._slotReference0 = value
         if self._slotReference0 is not None:
@@ -199,20 +220,32 @@ class Block(PowerSystemResource):
 
     def settieToMeasurement0(self, value):
         for x in self._tieToMeasurement0:
-            x.block0 = None
-        for y in value:
-            y._block0 = self
-        self._tieToMeasurement0 = value
+            x._block0 = None
+        self._tieToMeasurement0 = RefList()
+        self.addtieToMeasurement0(value)
 
     tieToMeasurement0 = property(gettieToMeasurement0, settieToMeasurement0)
 
     def addtieToMeasurement0(self, *tieToMeasurement0):
-        for obj in tieToMeasurement0:
-            obj.block0 = self
+        collection = self._tieToMeasurement0
+        for obj in members(tieToMeasurement0):
+            old = obj._block0
+            if old is not None and old is not self:
+                old._tieToMeasurement0.discard(obj)
+            obj._block0 = self
+            collection.append(obj)
 
     def removetieToMeasurement0(self, *tieToMeasurement0):
-        for obj in tieToMeasurement0:
-            obj.block0 = None
+        collection = self._tieToMeasurement0
+        for obj in members(tieToMeasurement0):
+            if obj._block0 is self:
+                obj._block0 = None
+                collection.discard(obj)
+
+    def removeAlltieToMeasurement0(self):
+        for obj in self._tieToMeasurement0:
+            obj._block0 = None
+        self._tieToMeasurement0 = RefList()
 
     def getMetaBlock(self):
         
@@ -220,8 +253,7 @@ class Block(PowerSystemResource):
 
     def setMetaBlock(self, value):
         if self._MetaBlock is not None:
-            filtered = [x for x in self.MetaBlock.Block if x != self]
-            self._MetaBlock._Block = filtered
+            self._MetaBlock._Block.discard(self)
 
         self._MetaBlock = value
         if self._MetaBlock is not None:
@@ -236,20 +268,32 @@ class Block(PowerSystemResource):
 
     def setBlockConnection(self, value):
         for x in self._BlockConnection:
-            x.Block = None
-        for y in value:
-            y._Block = self
-        self._BlockConnection = value
+            x._Block = None
+        self._BlockConnection = RefList()
+        self.addBlockConnection(value)
 
     BlockConnection = property(getBlockConnection, setBlockConnection)
 
     def addBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.Block = self
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            old = obj._Block
+            if old is not None and old is not self:
+                old._BlockConnection.discard(obj)
+            obj._Block = self
+            collection.append(obj)
 
     def removeBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.Block = None
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            if obj._Block is self:
+                obj._Block = None
+                collection.discard(obj)
+
+    def removeAllBlockConnection(self):
+        for obj in self._BlockConnection:
+            obj._Block = None
+        self._BlockConnection = RefList()
 
     def getBlockParameter(self):
         
@@ -257,18 +301,30 @@ class Block(PowerSystemResource):
 
     def setBlockParameter(self, value):
         for x in self._BlockParameter:
-            x.MemberOf_Block = None
-        for y in value:
-            y._MemberOf_Block = self
-        self._BlockParameter = value
+            x._MemberOf_Block = None
+        self._BlockParameter = RefList()
+        self.addBlockParameter(value)
 
     BlockParameter = property(getBlockParameter, setBlockParameter)
 
     def addBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_Block = self
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            old = obj._MemberOf_Block
+            if old is not None and old is not self:
+                old._BlockParameter.discard(obj)
+            obj._MemberOf_Block = self
+            collection.append(obj)
 
     def removeBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_Block = None
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            if obj._MemberOf_Block is self:
+                obj._MemberOf_Block = None
+                collection.discard(obj)
+
+    def removeAllBlockParameter(self):
+        for obj in self._BlockParameter:
+            obj._MemberOf_Block = None
+        self._BlockParameter = RefList()
 
@@ -55,8 +55,7 @@ class BlockConnection(IdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         if self._MetaBlockConnection is not None:
-            filtered = [x for x in self.MetaBlockConnection.BlockConnection if x != self]
-            self._MetaBlockConnection._BlockConnection = filtered
+            self._MetaBlockConnection._BlockConnection.discard(self)
 
         self._MetaBlockConnection = value
         if self._MetaBlockConnection is not None:
@@ -71,8 +70,7 @@ class BlockConnection(IdentifiedObject):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.BlockConnection if x != self]
-            self._MemberOf_BlockConnectivity._BlockConnection = filtered
+            self._MemberOf_BlockConnectivity._BlockConnection.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
@@ -87,8 +85,7 @@ class BlockConnection(IdentifiedObject):
 
     def setBlock(self, value):
         if self._Block is not None:
-            filtered = [x for x in self.Block.BlockConnection if x != self]
-            self._Block._BlockConnection = filtered
+            self._Block._BlockConnection.discard(self)
 
         self._Block = value
         if self._Block is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BlockConnectivity(IdentifiedObject):
     """A instance definition of connectivity of BlockUsage objects as defined in a a BlockConnection within the dyanmics-meta-model.
@@ -34,10 +35,10 @@ class BlockConnectivity(IdentifiedObject):
         self._MetaBlockConnectivity = None
         self.MetaBlockConnectivity = MetaBlockConnectivity
 
-        self._Block = []
+        self._Block = RefList()
         self.Block = [] if Block is None else Block
 
-        self._BlockConnection = []
+        self._BlockConnection = RefList()
         self.BlockConnection = [] if BlockConnection is None else BlockConnection
 
         super(BlockConnectivity, self).__init__(*args, **kw_args)
@@ -55,8 +56,7 @@ class BlockConnectivity(IdentifiedObject):
 
     def setMetaBlockConnectivity(self, value):
         if self._MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MetaBlockConnectivity.BlockConnectivity if x != self]
-            self._MetaBlockConnectivity._BlockConnectivity = filtered
+            self._MetaBlockConnectivity._BlockConnectivity.discard(self)
 
         self._MetaBlockConnectivity = value
         if self._MetaBlockConnectivity is not None:
@@ -71,20 +71,32 @@ class BlockConnectivity(IdentifiedObject):
 
     def setBlock(self, value):
         for x in self._Block:
-            x.MemberOf_BlockConnectivity = None
-        for y in value:
-            y._MemberOf_BlockConnectivity = self
-        self._Block = value
+            x._MemberOf_BlockConnectivity = None
+        self._Block = RefList()
+        self.addBlock(value)
 
     Block = property(getBlock, setBlock)
 
     def addBlock(self, *Block):
-        for obj in Block:
-            obj.MemberOf_BlockConnectivity = self
+        collection = self._Block
+        for obj in members(Block):
+            old = obj._MemberOf_BlockConnectivity
+            if old is not None and old is not self:
+                old._Block.discard(obj)
+            obj._MemberOf_BlockConnectivity = self
+            collection.append(obj)
 
     def removeBlock(self, *Block):
-        for obj in Block:
-            obj.MemberOf_BlockConnectivity = None
+        collection = self._Block
+        for obj in members(Block):
+            if obj._MemberOf_BlockConnectivity is self:
+                obj._MemberOf_BlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllBlock(self):
+        for obj in self._Block:
+            obj._MemberOf_BlockConnectivity = None
+        self._Block = RefList()
 
     def getBlockConnection(self):
         
@@ -92,18 +104,30 @@ class BlockConnectivity(IdentifiedObject):
 
     def setBlockConnection(self, value):
         for x in self._BlockConnection:
-            x.MemberOf_BlockConnectivity = None
-        for y in value:
-            y._MemberOf_BlockConnectivity = self
-        self._BlockConnection = value
+            x._MemberOf_BlockConnectivity = None
+        self._BlockConnection = RefList()
+        self.addBlockConnection(value)
 
     BlockConnection = property(getBlockConnection, setBlockConnection)
 
     def addBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.MemberOf_BlockConnectivity = self
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            old = obj._MemberOf_BlockConnectivity
+            if old is not None and old is not self:
+                old._BlockConnection.discard(obj)
+            obj._MemberOf_BlockConnectivity = self
+            collection.append(obj)
 
     def removeBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.MemberOf_BlockConnectivity = None
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            if obj._MemberOf_BlockConnectivity is self:
+                obj._MemberOf_BlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllBlockConnection(self):
+        for obj in self._BlockConnection:
+            obj._MemberOf_BlockConnectivity = None
+        self._BlockConnection = RefList()
 
@@ -51,8 +51,7 @@ class BlockConstant(MetaBlockConnectable):
 
     def setmetaBlock0(self, value):
         if self._metaBlock0 is not None:
-            filtered = [x for x in self.metaBlock0.blockConstant0 if x != self]
-            self._metaBlock0._blockConstant0 = filtered
+            self._metaBlock0._blockConstant0.discard(self)
 
         self._metaBlock0 = value
         if self._metaBlock0 is not None:
@@ -55,8 +55,7 @@ class BlockInputReference(IdentifiedObject):
 
     def setmetaBlockReference0(self, value):
         if self._metaBlockReference0 is not None:
-            filtered = [x for x in self.metaBlockReference0.blockInputReference0 if x != self]
-            self._metaBlockReference0._blockInputReference0 = filtered
+            self._metaBlockReference0._blockInputReference0.discard(self)
 
         self._metaBlockReference0 = value
         if self._metaBlockReference0 is not None:
@@ -72,8 +71,7 @@ class BlockInputReference(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.blockInputReference0 if x != self]
-            self._metaBlockInput0._blockInputReference0 = filtered
+            self._metaBlockInput0._blockInputReference0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
@@ -89,8 +87,7 @@ class BlockInputReference(IdentifiedObject):
 
     def setBlockConnectable(self, value):
         if self._BlockConnectable is not None:
-            filtered = [x for x in self.BlockConnectable.BlockInputReference if x != self]
-            self._BlockConnectable._BlockInputReference = filtered
+            self._BlockConnectable._BlockInputReference.discard(self)
 
         self._BlockConnectable = value
         if self._BlockConnectable is not None:
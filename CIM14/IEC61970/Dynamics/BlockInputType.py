@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BlockInputType(IdentifiedObject):
 
@@ -28,10 +29,10 @@ class BlockInputType(IdentifiedObject):
         @param slotInput0:
         @param metaBlockInput0:
         """
-        self._slotInput0 = []
+        self._slotInput0 = RefList()
         self.slotInput0 = [] if slotInput0 is None else slotInput0
 
-        self._metaBlockInput0 = []
+        self._metaBlockInput0 = RefList()
         self.metaBlockInput0 = [] if metaBlockInput0 is None else metaBlockInput0
 
         super(BlockInputType, self).__init__(*args, **kw_args)
@@ -49,20 +50,32 @@ class BlockInputType(IdentifiedObject):
 
     def setslotInput0(self, value):
         for x in self._slotInput0:
-            x.blockInputType0 = None
-        for y in value:
-            y._blockInputType0 = self
-        self._slotInput0 = value
+            x._blockInputType0 = None
+        self._slotInput0 = RefList()
+        self.addslotInput0(value)
 
     slotInput0 = property(getslotInput0, setslotInput0)
 
     def addslotInput0(self, *slotInput0):
-        for obj in slotInput0:
-            obj.blockInputType0 = self
+        collection = self._slotInput0
+        for obj in members(slotInput0):
+            old = obj._blockInputType0
+            if old is not None and old is not self:
+                old._slotInput0.discard(obj)
+            obj._blockInputType0 = self
+            collection.append(obj)
 
     def removeslotInput0(self, *slotInput0):
-        for obj in slotInput0:
-            obj.blockInputType0 = None
+        collection = self._slotInput0
+        for obj in members(slotInput0):
+            if obj._blockInputType0 is self:
+                obj._blockInputType0 = None
+                collection.discard(obj)
+
+    def removeAllslotInput0(self):
+        for obj in self._slotInput0:
+            obj._blockInputType0 = None
+        self._slotInput0 = RefList()
 
     def getmetaBlockInput0(self):
         
@@ -70,18 +83,30 @@ class BlockInputType(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         for x in self._metaBlockInput0:
-            x.blockInputType0 = None
-        for y in value:
-            y._blockInputType0 = self
-        self._metaBlockInput0 = value
+            x._blockInputType0 = None
+        self._metaBlockInput0 = RefList()
+        self.addmetaBlockInput0(value)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
     def addmetaBlockInput0(self, *metaBlockInput0):
-        for obj in metaBlockInput0:
-            obj.blockInputType0 = self
+        collection = self._metaBlockInput0
+        for obj in members(metaBlockInput0):
+            old = obj._blockInputType0
+            if old is not None and old is not self:
+                old._metaBlockInput0.discard(obj)
+            obj._blockInputType0 = self
+            collection.append(obj)
 
     def removemetaBlockInput0(self, *metaBlockInput0):
-        for obj in metaBlockInput0:
-            obj.blockInputType0 = None
+        collection = self._metaBlockInput0
+        for obj in members(metaBlockInput0):
+            if obj._blockInputType0 is self:
+                obj._blockInputType0 = None
+                collection.discard(obj)
+
+    def removeAllmetaBlockInput0(self):
+        for obj in self._metaBlockInput0:
+            obj._blockInputType0 = None
+        self._metaBlockInput0 = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from PyCIM.RefList import RefList, members
 
 class BlockOutputReference(MetaBlockConnectable):
     """References output from another block at the meta dynamics level. The other block must be a BlockReference in containing block.
@@ -33,7 +34,7 @@ class BlockOutputReference(MetaBlockConnectable):
         self._metaBlockOutput0 = None
         self.metaBlockOutput0 = metaBlockOutput0
 
-        self._metaBlockReference0 = []
+        self._metaBlockReference0 = RefList()
         self.metaBlockReference0 = [] if metaBlockReference0 is None else metaBlockReference0
 
         super(BlockOutputReference, self).__init__(*args, **kw_args)
@@ -51,8 +52,7 @@ class BlockOutputReference(MetaBlockConnectable):
 
     def setmetaBlockOutput0(self, value):
         if self._metaBlockOutput0 is not None:
-            filtered = [x for x in self.metaBlockOutput0.BlockOutputReference if x != self]
-            self._metaBlockOutput0._BlockOutputReference = filtered
+            self._metaBlockOutput0._BlockOutputReference.discard(self)
 
         self._metaBlockOutput0 = value
         if self._metaBlockOutput0 is not None:
@@ -67,24 +67,26 @@ class BlockOutputReference(MetaBlockConnectable):
 
     def setmetaBlockReference0(self, value):
         for p in self._metaBlockReference0:
-            filtered = [q for q in p.blockOutputReference0 if q != self]
-            self._metaBlockReference0._blockOutputReference0 = filtered
-        for r in value:
-            if self not in r._blockOutputReference0:
-                r._blockOutputReference0.append(self)
-        self._metaBlockReference0 = value
+            p._blockOutputReference0.discard(self)
+        self._metaBlockReference0 = RefList()
+        self.addmetaBlockReference0(value)
 
     metaBlockReference0 = property(getmetaBlockReference0, setmetaBlockReference0)
 
     def addmetaBlockReference0(self, *metaBlockReference0):
-        for obj in metaBlockReference0:
-            if self not in obj._blockOutputReference0:
-                obj._blockOutputReference0.append(self)
-            self._metaBlockReference0.append(obj)
+        collection = self._metaBlockReference0
+        for obj in members(metaBlockReference0):
+            obj._blockOutputReference0.append(self)
+            collection.append(obj)
 
     def removemetaBlockReference0(self, *metaBlockReference0):
-        for obj in metaBlockReference0:
-            if self in obj._blockOutputReference0:
-                obj._blockOutputReference0.remove(self)
-            self._metaBlockReference0.remove(obj)
+        collection = self._metaBlockReference0
+        for obj in members(metaBlockReference0):
+            obj._blockOutputReference0.discard(self)
+            collection.discard(obj)
+
+    def removeAllmetaBlockReference0(self):
+        for obj in self._metaBlockReference0:
+            obj._blockOutputReference0.discard(self)
+        self._metaBlockReference0 = RefList()
 
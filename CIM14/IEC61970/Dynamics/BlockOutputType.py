@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BlockOutputType(IdentifiedObject):
 
@@ -28,10 +29,10 @@ class BlockOutputType(IdentifiedObject):
         @param metaBlockOutput0:
         @param slotOutput0:
         """
-        self._metaBlockOutput0 = []
+        self._metaBlockOutput0 = RefList()
         self.metaBlockOutput0 = [] if metaBlockOutput0 is None else metaBlockOutput0
 
-        self._slotOutput0 = []
+        self._slotOutput0 = RefList()
         self.slotOutput0 = [] if slotOutput0 is None else slotOutput0
 
         super(BlockOutputType, self).__init__(*args, **kw_args)
@@ -49,20 +50,32 @@ class BlockOutputType(IdentifiedObject):
 
     def setmetaBlockOutput0(self, value):
         for x in self._metaBlockOutput0:
-            x.blockOutputType0 = None
-        for y in value:
-            y._blockOutputType0 = self
-        self._metaBlockOutput0 = value
+            x._blockOutputType0 = None
+        self._metaBlockOutput0 = RefList()
+        self.addmetaBlockOutput0(value)
 
     metaBlockOutput0 = property(getmetaBlockOutput0, setmetaBlockOutput0)
 
     def addmetaBlockOutput0(self, *metaBlockOutput0):
-        for obj in metaBlockOutput0:
-            obj.blockOutputType0 = self
+        collection = self._metaBlockOutput0
+        for obj in members(metaBlockOutput0):
+            old = obj._blockOutputType0
+            if old is not None and old is not self:
+                old._metaBlockOutput0.discard(obj)
+            obj._blockOutputType0 = self
+            collection.append(obj)
 
     def removemetaBlockOutput0(self, *metaBlockOutput0):
-        for obj in metaBlockOutput0:
-            obj.blockOutputType0 = None
+        collection = self._metaBlockOutput0
+        for obj in members(metaBlockOutput0):
+            if obj._blockOutputType0 is self:
+                obj._blockOutputType0 = None
+                collection.discard(obj)
+
+    def removeAllmetaBlockOutput0(self):
+        for obj in self._metaBlockOutput0:
+            obj._blockOutputType0 = None
+        self._metaBlockOutput0 = RefList()
 
     def getslotOutput0(self):
         
@@ -70,18 +83,30 @@ class BlockOutputType(IdentifiedObject):
 
     def setslotOutput0(self, value):
         for x in self._slotOutput0:
-            x.blockOutputType0 = None
-        for y in value:
-            y._blockOutputType0 = self
-        self._slotOutput0 = value
+            x._blockOutputType0 = None
+        self._slotOutput0 = RefList()
+        self.addslotOutput0(value)
 
     slotOutput0 = property(getslotOutput0, setslotOutput0)
 
     def addslotOutput0(self, *slotOutput0):
-        for obj in slotOutput0:
-            obj.blockOutputType0 = self
+        collection = self._slotOutput0
+        for obj in members(slotOutput0):
+            old = obj._blockOutputType0
+            if old is not None and old is not self:
+                old._slotOutput0.discard(obj)
+            obj._blockOutputType0 = self
+            collection.append(obj)
 
     def removeslotOutput0(self, *slotOutput0):
-        for obj in slotOutput0:
-            obj.blockOutputType0 = None
+        collection = self._slotOutput0
+        for obj in members(slotOutput0):
+            if obj._blockOutputType0 is self:
+                obj._blockOutputType0 = None
+                collection.discard(obj)
+
+    def removeAllslotOutput0(self):
+        for obj in self._slotOutput0:
+            obj._blockOutputType0 = None
+        self._slotOutput0 = RefList()
 
@@ -63,8 +63,7 @@ class BlockParameter(IdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         if self._MetaBlockParameter is not None:
-            filtered = [x for x in self.MetaBlockParameter.BlockParameter if x != self]
-            self._MetaBlockParameter._BlockParameter = filtered
+            self._MetaBlockParameter._BlockParameter.discard(self)
 
         self._MetaBlockParameter = value
         if self._MetaBlockParameter is not None:
@@ -79,8 +78,7 @@ class BlockParameter(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.BlockParameter if x != self]
-            self._MemberOf_MetaBlockReference._BlockParameter = filtered
+            self._MemberOf_MetaBlockReference._BlockParameter.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
@@ -95,8 +93,7 @@ class BlockParameter(IdentifiedObject):
 
     def setUserBlockParameter(self, value):
         if self._UserBlockParameter is not None:
-            filtered = [x for x in self.UserBlockParameter.BlockUsageParameter if x != self]
-            self._UserBlockParameter._BlockUsageParameter = filtered
+            self._UserBlockParameter._BlockUsageParameter.discard(self)
 
         self._UserBlockParameter = value
         if self._UserBlockParameter is not None:
@@ -111,8 +108,7 @@ class BlockParameter(IdentifiedObject):
 
     def setMemberOf_Block(self, value):
         if self._MemberOf_Block is not None:
-            filtered = [x for x in self.MemberOf_Block.BlockParameter if x != self]
-            self._MemberOf_Block._BlockParameter = filtered
+            self._MemberOf_Block._BlockParameter.discard(self)
 
         self._MemberOf_Block = value
         if self._MemberOf_Block is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BlockType(IdentifiedObject):
     """This is the kind of a block used to specify what kind of blocks could fit into a particular slot.    For example, only blocks of type 'pss' would fit into a 'pss' type block.  Though a cross compound generator configuration would possibly have multple pss blocks playing specific roles such as pss1 and pss2..
@@ -30,10 +31,10 @@ class BlockType(IdentifiedObject):
         @param slot0:
         @param metaBlock0:
         """
-        self._slot0 = []
+        self._slot0 = RefList()
         self.slot0 = [] if slot0 is None else slot0
 
-        self._metaBlock0 = []
+        self._metaBlock0 = RefList()
         self.metaBlock0 = [] if metaBlock0 is None else metaBlock0
 
         super(BlockType, self).__init__(*args, **kw_args)
@@ -51,20 +52,32 @@ class BlockType(IdentifiedObject):
 
     def setslot0(self, value):
         for x in self._slot0:
-            x.blockType0 = None
-        for y in value:
-            y._blockType0 = self
-        self._slot0 = value
+            x._blockType0 = None
+        self._slot0 = RefList()
+        self.addslot0(value)
 
     slot0 = property(getslot0, setslot0)
 
     def addslot0(self, *slot0):
-        for obj in slot0:
-            obj.blockType0 = self
+        collection = self._slot0
+        for obj in members(slot0):
+            old = obj._blockType0
+            if old is not None and old is not self:
+                old._slot0.discard(obj)
+            obj._blockType0 = self
+            collection.append(obj)
 
     def removeslot0(self, *slot0):
-        for obj in slot0:
-            obj.blockType0 = None
+        collection = self._slot0
+        for obj in members(slot0):
+            if obj._blockType0 is self:
+                obj._blockType0 = None
+                collection.discard(obj)
+
+    def removeAllslot0(self):
+        for obj in self._slot0:
+            obj._blockType0 = None
+        self._slot0 = RefList()
 
     def getmetaBlock0(self):
         
@@ -72,18 +85,30 @@ class BlockType(IdentifiedObject):
 
     def setmetaBlock0(self, value):
         for x in self._metaBlock0:
-            x.blockType0 = None
-        for y in value:
-            y._blockType0 = self
-        self._metaBlock0 = value
+            x._blockType0 = None
+        self._metaBlock0 = RefList()
+        self.addmetaBlock0(value)
 
     metaBlock0 = property(getmetaBlock0, setmetaBlock0)
 
     def addmetaBlock0(self, *metaBlock0):
-        for obj in metaBlock0:
-            obj.blockType0 = self
+        collection = self._metaBlock0
+        for obj in members(metaBlock0):
+            old = obj._blockType0
+            if old is not None and old is not self:
+                old._metaBlock0.discard(obj)
+            obj._blockType0 = self
+            collection.append(obj)
 
     def removemetaBlock0(self, *metaBlock0):
-        for obj in metaBlock0:
-            obj.blockType0 = None
+        collection = self._metaBlock0
+        for obj in members(metaBlock0):
+            if obj._blockType0 is self:
+                obj._blockType0 = None
+                collection.discard(obj)
+
+    def removeAllmetaBlock0(self):
+        for obj in self._metaBlock0:
+            obj._blockType0 = None
+        self._metaBlock0 = RefList()
 
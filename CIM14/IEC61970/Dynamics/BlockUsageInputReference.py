@@ -55,8 +55,7 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.blockUsageInputReference0 if x != self]
-            self._block0._blockUsageInputReference0 = filtered
+            self._block0._blockUsageInputReference0.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
@@ -72,8 +71,7 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setBlockUsageOutputReference(self, value):
         if self._BlockUsageOutputReference is not None:
-            filtered = [x for x in self.BlockUsageOutputReference.BlockUsageInputReference if x != self]
-            self._BlockUsageOutputReference._BlockUsageInputReference = filtered
+            self._BlockUsageOutputReference._BlockUsageInputReference.discard(self)
 
         self._BlockUsageOutputReference = value
         if self._BlockUsageOutputReference is not None:
@@ -88,8 +86,7 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.blockUsageInputReference0 if x != self]
-            self._metaBlockInput0._blockUsageInputReference0 = filtered
+            self._metaBlockInput0._blockUsageInputReference0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
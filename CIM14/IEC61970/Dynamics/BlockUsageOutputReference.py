@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BlockUsageOutputReference(IdentifiedObject):
     """Used at instance level to tie the input of a referenced block to the output of another referenced block. Note that typically an input is only tied to an output of another block at the same PowerSystemResource, but there is no restriction to do so.   If the output is implicity tied to an input, then the an instance of this class is not required.  The sole purpose of this class is to explicitly tio the input of other blocks at the power system instance level.
@@ -34,7 +35,7 @@ class BlockUsageOutputReference(IdentifiedObject):
         self._block0 = None
         self.block0 = block0
 
-        self._BlockUsageInputReference = []
+        self._BlockUsageInputReference = RefList()
         self.BlockUsageInputReference = [] if BlockUsageInputReference is None else BlockUsageInputReference
 
         self._metaBlockOutput0 = None
@@ -55,8 +56,7 @@ class BlockUsageOutputReference(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.BlockUsageOutputReference if x != self]
-            self._block0._BlockUsageOutputReference = filtered
+            self._block0._BlockUsageOutputReference.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
@@ -72,20 +72,32 @@ class BlockUsageOutputReference(IdentifiedObject):
 
     def setBlockUsageInputReference(self, value):
         for x in self._BlockUsageInputReference:
-            x.BlockUsageOutputReference = None
-        for y in value:
-            y._BlockUsageOutputReference = self
-        self._BlockUsageInputReference = value
+            x._BlockUsageOutputReference = None
+        self._BlockUsageInputReference = RefList()
+        self.addBlockUsageInputReference(value)
 
     BlockUsageInputReference = property(getBlockUsageInputReference, setBlockUsageInputReference)
 
     def addBlockUsageInputReference(self, *BlockUsageInputReference):
-        for obj in BlockUsageInputReference:
-            obj.BlockUsageOutputReference = self
+        collection = self._BlockUsageInputReference
+        for obj in members(BlockUsageInputReference):
+            old = obj._BlockUsageOutputReference
+            if old is not None and old is not self:
+                old._BlockUsageInputReference.discard(obj)
+            obj._BlockUsageOutputReference = self
+            collection.append(obj)
 
     def removeBlockUsageInputReference(self, *BlockUsageInputReference):
-        for obj in BlockUsageInputReference:
-            obj.BlockUsageOutputReference = None
+        collection = self._BlockUsageInputReference
+        for obj in members(BlockUsageInputReference):
+            if obj._BlockUsageOutputReference is self:
+                obj._BlockUsageOutputReference = None
+                collection.discard(obj)
+
+    def removeAllBlockUsageInputReference(self):
+        for obj in self._BlockUsageInputReference:
+            obj._BlockUsageOutputReference = None
+        self._BlockUsageInputReference = RefList()
 
     def getmetaBlockOutput0(self):
         
@@ -93,8 +105,7 @@ class BlockUsageOutputReference(IdentifiedObject):
 
     def setmetaBlockOutput0(self, value):
         if self._metaBlockOutput0 is not None:
-            filtered = [x for x in self.metaBlockOutput0.blockUsageOutputReference0 if x != self]
-            self._metaBlockOutput0._blockUsageOutputReference0 = filtered
+            self._metaBlockOutput0._blockUsageOutputReference0.discard(self)
 
         self._metaBlockOutput0 = value
         if self._metaBlockOutput0 is not None:
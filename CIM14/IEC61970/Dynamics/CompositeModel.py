@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.Element import Element
+from PyCIM.RefList import RefList, members
 
 class CompositeModel(Element):
 
@@ -27,7 +28,7 @@ class CompositeModel(Element):
 
         @param slotReference0:
         """
-        self._slotReference0 = []
+        self._slotReference0 = RefList()
         self.slotReference0 = [] if slotReference0 is None else slotReference0
 
         super(CompositeModel, self).__init__(*args, **kw_args)
@@ -45,24 +46,26 @@ class CompositeModel(Element):
 
     def setslotReference0(self, value):
         for p in self._slotReference0:
-            filtered = [q for q in p.compositeModel0 if q != self]
-            self._slotReference0._compositeModel0 = filtered
-        for r in value:
-            if self not in r._compositeModel0:
-                r._compositeModel0.append(self)
-        self._slotReference0 = value
+            p._compositeModel0.discard(self)
+        self._slotReference0 = RefList()
+        self.addslotReference0(value)
 
     slotReference0 = property(getslotReference0, setslotReference0)
 
     def addslotReference0(self, *slotReference0):
-        for obj in slotReference0:
-            if self not in obj._compositeModel0:
-                obj._compositeModel0.append(self)
-            self._slotReference0.append(obj)
+        collection = self._slotReference0
+        for obj in members(slotReference0):
+            obj._compositeModel0.append(self)
+            collection.append(obj)
 
     def removeslotReference0(self, *slotReference0):
-        for obj in slotReference0:
-            if self in obj._compositeModel0:
-                obj._compositeModel0.remove(self)
-            self._slotReference0.remove(obj)
+        collection = self._slotReference0
+        for obj in members(slotReference0):
+            obj._compositeModel0.discard(self)
+            collection.discard(obj)
+
+    def removeAllslotReference0(self):
+        for obj in self._slotReference0:
+            obj._compositeModel0.discard(self)
+        self._slotReference0 = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ConnectionFrame(IdentifiedObject):
 
@@ -28,10 +29,10 @@ class ConnectionFrame(IdentifiedObject):
         @param slotConnection0:
         @param slot0:
         """
-        self._slotConnection0 = []
+        self._slotConnection0 = RefList()
         self.slotConnection0 = [] if slotConnection0 is None else slotConnection0
 
-        self._slot0 = []
+        self._slot0 = RefList()
         self.slot0 = [] if slot0 is None else slot0
 
         super(ConnectionFrame, self).__init__(*args, **kw_args)
@@ -49,20 +50,32 @@ class ConnectionFrame(IdentifiedObject):
 
     def setslotConnection0(self, value):
         for x in self._slotConnection0:
-            x.connectionFrame0 = None
-        for y in value:
-            y._connectionFrame0 = self
-        self._slotConnection0 = value
+            x._connectionFrame0 = None
+        self._slotConnection0 = RefList()
+        self.addslotConnection0(value)
 
     slotConnection0 = property(getslotConnection0, setslotConnection0)
 
     def addslotConnection0(self, *slotConnection0):
-        for obj in slotConnection0:
-            obj.connectionFrame0 = self
+        collection = self._slotConnection0
+        for obj in members(slotConnection0):
+            old = obj._connectionFrame0
+            if old is not None and old is not self:
+                old._slotConnection0.discard(obj)
+            obj._connectionFrame0 = self
+            collection.append(obj)
 
     def removeslotConnection0(self, *slotConnection0):
-        for obj in slotConnection0:
-            obj.connectionFrame0 = None
+        collection = self._slotConnection0
+        for obj in members(slotConnection0):
+            if obj._connectionFrame0 is self:
+                obj._connectionFrame0 = None
+                collection.discard(obj)
+
+    def removeAllslotConnection0(self):
+        for obj in self._slotConnection0:
+            obj._connectionFrame0 = None
+        self._slotConnection0 = RefList()
 
     def getslot0(self):
         
@@ -70,18 +83,30 @@ class ConnectionFrame(IdentifiedObject):
 
     def setslot0(self, value):
         for x in self._slot0:
-            x.connectionFrame0 = None
-        for y in value:
-            y._connectionFrame0 = self
-        self._slot0 = value
+            x._connectionFrame0 = None
+        self._slot0 = RefList()
+        self.addslot0(value)
 
     slot0 = property(getslot0, setslot0)
 
     def addslot0(self, *slot0):
-        for obj in slot0:
-            obj.connectionFrame0 = self
+        collection = self._slot0
+        for obj in members(slot0):
+            old = obj._connectionFrame0
+            if old is not None and old is not self:
+                old._slot0.discard(obj)
+            obj._connectionFrame0 = self
+            collection.append(obj)
 
     def removeslot0(self, *slot0):
-        for obj in slot0:
-            obj.connectionFrame0 = None
+        collection = self._slot0
+        for obj in members(slot0):
+            if obj._connectionFrame0 is self:
+                obj._connectionFrame0 = None
+                collection.discard(obj)
+
+    def removeAllslot0(self):
+        for obj in self._slot0:
+            obj._connectionFrame0 = None
+        self._slot0 = RefList()
 
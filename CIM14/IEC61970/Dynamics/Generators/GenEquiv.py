@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.RotatingMachine import RotatingMachine
+from PyCIM.RefList import RefList, members
 
 class GenEquiv(RotatingMachine):
     """An equivalent representation of a synchronous generator as a constant internal voltage behind an impedance Ra plus Xp.
@@ -33,7 +34,7 @@ class GenEquiv(RotatingMachine):
         #: Equivalent reactance, also known as Xp.
         self.xp = xp
 
-        self._synchronousMachine0 = []
+        self._synchronousMachine0 = RefList()
         self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
 
         super(GenEquiv, self).__init__(*args, **kw_args)
@@ -51,24 +52,26 @@ class GenEquiv(RotatingMachine):
 
     def setsynchronousMachine0(self, value):
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.genEquiv0 if q != self]
-            self._synchronousMachine0._genEquiv0 = filtered
-        for r in value:
-            if self not in r._genEquiv0:
-                r._genEquiv0.append(self)
-        self._synchronousMachine0 = value
+            p._genEquiv0.discard(self)
+        self._synchronousMachine0 = RefList()
+        self.addsynchronousMachine0(value)
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
-        for obj in synchronousMachine0:
-            if self not in obj._genEquiv0:
-                obj._genEquiv0.append(self)
-            self._synchronousMachine0.append(obj)
+        collection = self._synchronousMachine0
+        for obj in members(synchronousMachine0):
+            obj._genEquiv0.append(self)
+            collection.append(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
-        for obj in synchronousMachine0:
-            if self in obj._genEquiv0:
-                obj._genEquiv0.remove(self)
-            self._synchronousMachine0.remove(obj)
+        collection = self._synchronousMachine0
+        for obj in members(synchronousMachine0):
+            obj._genEquiv0.discard(self)
+            collection.discard(obj)
+
+    def removeAllsynchronousMachine0(self):
+        for obj in self._synchronousMachine0:
+            obj._genEquiv0.discard(self)
+        self._synchronousMachine0 = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from PyCIM.RefList import RefList, members
 
 class GenLoad(RegulatingCondEq):
     """Representation of a small generator as a negative load rather than a dynamic generator model. This practice is also referred to as 'netting' the generation with the load, i.e. taking the net value of load minus generation as the new load value.  For dynamic modeling purposes, each generator that does not have a dynamic load model must have a genLoad record.
@@ -29,7 +30,7 @@ class GenLoad(RegulatingCondEq):
 
         @param synchronousMachine0:
         """
-        self._synchronousMachine0 = []
+        self._synchronousMachine0 = RefList()
         self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
 
         super(GenLoad, self).__init__(*args, **kw_args)
@@ -47,24 +48,26 @@ class GenLoad(RegulatingCondEq):
 
     def setsynchronousMachine0(self, value):
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.genLoad0 if q != self]
-            self._synchronousMachine0._genLoad0 = filtered
-        for r in value:
-            if self not in r._genLoad0:
-                r._genLoad0.append(self)
-        self._synchronousMachine0 = value
+            p._genLoad0.discard(self)
+        self._synchronousMachine0 = RefList()
+        self.addsynchronousMachine0(value)
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
-        for obj in synchronousMachine0:
-            if self not in obj._genLoad0:
-                obj._genLoad0.append(self)
-            self._synchronousMachine0.append(obj)
+        collection = self._synchronousMachine0
+        for obj in members(synchronousMachine0):
+            obj._genLoad0.append(self)
+            collection.append(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
-        for obj in synchronousMachine0:
-            if self in obj._genLoad0:
-                obj._genLoad0.remove(self)
-            self._synchronousMachine0.remove(obj)
+        collection = self._synchronousMachine0
+        for obj in members(synchronousMachine0):
+            obj._genLoad0.discard(self)
+            collection.discard(obj)
+
+    def removeAllsynchronousMachine0(self):
+        for obj in self._synchronousMachine0:
+            obj._genLoad0.discard(self)
+        self._synchronousMachine0 = RefList()
 
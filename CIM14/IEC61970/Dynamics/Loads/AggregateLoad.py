@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class AggregateLoad(PowerSystemResource):
     """Aggregate loads are used to represent all or part of the real and reactive load from a load in the static (power flow) data. This load is usually the aggregation of many individual load devices. The load models are approximate representation of the aggregate response of the load devices to system disturbances.   Models of loads for dynamic analysis may themselves be either static or dynamic. A static load model represents the sensitivity of the real and reactive power consumed by the load to the amplitude and frequency of the bus voltage. A dynamic load model can used to represent the aggregate response of the motor components of the load.   Large industrial motors or groups of similar motors may be represented by individual motor models (synchronous or asynchronous) which are usually represented as generators with negative Pgen in the static (power flow) data.
@@ -29,7 +30,7 @@ class AggregateLoad(PowerSystemResource):
 
         @param energyConsumer0:
         """
-        self._energyConsumer0 = []
+        self._energyConsumer0 = RefList()
         self.energyConsumer0 = [] if energyConsumer0 is None else energyConsumer0
 
         super(AggregateLoad, self).__init__(*args, **kw_args)
@@ -47,24 +48,26 @@ class AggregateLoad(PowerSystemResource):
 
     def setenergyConsumer0(self, value):
         for p in self._energyConsumer0:
-            filtered = [q for q in p.aggregateLoad0 if q != self]
-            self._energyConsumer0._aggregateLoad0 = filtered
-        for r in value:
-            if self not in r._aggregateLoad0:
-                r._aggregateLoad0.append(self)
-        self._energyConsumer0 = value
+            p._aggregateLoad0.discard(self)
+        self._energyConsumer0 = RefList()
+        self.addenergyConsumer0(value)
 
     energyConsumer0 = property(getenergyConsumer0, setenergyConsumer0)
 
     def addenergyConsumer0(self, *energyConsumer0):
-        for obj in energyConsumer0:
-            if self not in obj._aggregateLoad0:
-                obj._aggregateLoad0.append(self)
-            self._energyConsumer0.append(obj)
+        collection = self._energyConsumer0
+        for obj in members(energyConsumer0):
+            obj._aggregateLoad0.append(self)
+            collection.append(obj)
 
     def removeenergyConsumer0(self, *energyConsumer0):
-        for obj in energyConsumer0:
-            if self in obj._aggregateLoad0:
-                obj._aggregateLoad0.remove(self)
-            self._energyConsumer0.remove(obj)
+        collection = self._energyConsumer0
+        for obj in members(energyConsumer0):
+            obj._aggregateLoad0.discard(self)
+            collection.discard(obj)
+
+    def removeAllenergyConsumer0(self):
+        for obj in self._energyConsumer0:
+            obj._aggregateLoad0.discard(self)
+        self._energyConsumer0 = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlock(IdentifiedObject):
     """A block is a meta-data representation of a control block.   It has an external interface and an optinal internal interface. Blocks internals can be ommitted if the block is well understood by both exchange parties.    When well understood by both partice the block can be treated as a primitive block.   All dynamic models must be defined to the level of primtive blocks in order for the model to be consumed and used for dynamic simulation. Examples of primitive blocks include a well known IEEE exciter model, a summation block, or an integrator block.
@@ -53,31 +54,31 @@ class MetaBlock(IdentifiedObject):
         #: Iindicates this type is treated as a primitive type and therefore the internal block model can be ignored and is not typically defined in the model. Primitive blocks include such basic things as summation and standard IEEEexciter models. The exchange parties must agree on the meaning of primitive blocks according to their identification.
         self.primitive = primitive
 
-        self._MetaBlockReference = []
+        self._MetaBlockReference = RefList()
         self.MetaBlockReference = [] if MetaBlockReference is None else MetaBlockReference
 
-        self._MetaBlockOutput = []
+        self._MetaBlockOutput = RefList()
         self.MetaBlockOutput = [] if MetaBlockOutput is None else MetaBlockOutput
 
-        self._MetaBlockState = []
+        self._MetaBlockState = RefList()
         self.MetaBlockState = [] if MetaBlockState is None else MetaBlockState
 
-        self._MetaBlockSignal = []
+        self._MetaBlockSignal = RefList()
         self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
 
         self._blockType0 = None
         self.blockType0 = blockType0
 
-        self._MetaBlockInput = []
+        self._MetaBlockInput = RefList()
         self.MetaBlockInput = [] if MetaBlockInput is None else MetaBlockInput
 
-        self._blockConstant0 = []
+        self._blockConstant0 = RefList()
         self.blockConstant0 = [] if blockConstant0 is None else blockConstant0
 
-        self._Block = []
+        self._Block = RefList()
         self.Block = [] if Block is None else Block
 
-        self._MetaBlockParameter = []
+        self._MetaBlockParameter = RefList()
         self.MetaBlockParameter = [] if MetaBlockParameter is None else MetaBlockParameter
 
         super(MetaBlock, self).__init__(*args, **kw_args)
@@ -95,20 +96,32 @@ class MetaBlock(IdentifiedObject):
 
     def setMetaBlockReference(self, value):
         for x in self._MetaBlockReference:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockReference = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockReference = RefList()
+        self.addMetaBlockReference(value)
 
     MetaBlockReference = property(getMetaBlockReference, setMetaBlockReference)
 
     def addMetaBlockReference(self, *MetaBlockReference):
-        for obj in MetaBlockReference:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockReference
+        for obj in members(MetaBlockReference):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockReference.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockReference(self, *MetaBlockReference):
-        for obj in MetaBlockReference:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockReference
+        for obj in members(MetaBlockReference):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockReference(self):
+        for obj in self._MetaBlockReference:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockReference = RefList()
 
     def getMetaBlockOutput(self):
         """Outputs that belong to the block.
@@ -117,20 +130,32 @@ class MetaBlock(IdentifiedObject):
 
     def setMetaBlockOutput(self, value):
         for x in self._MetaBlockOutput:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockOutput = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockOutput = RefList()
+        self.addMetaBlockOutput(value)
 
     MetaBlockOutput = property(getMetaBlockOutput, setMetaBlockOutput)
 
     def addMetaBlockOutput(self, *MetaBlockOutput):
-        for obj in MetaBlockOutput:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockOutput
+        for obj in members(MetaBlockOutput):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockOutput.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockOutput(self, *MetaBlockOutput):
-        for obj in MetaBlockOutput:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockOutput
+        for obj in members(MetaBlockOutput):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockOutput(self):
+        for obj in self._MetaBlockOutput:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockOutput = RefList()
 
     def getMetaBlockState(self):
         
@@ -138,20 +163,32 @@ class MetaBlock(IdentifiedObject):
 
     def setMetaBlockState(self, value):
         for x in self._MetaBlockState:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockState = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockState = RefList()
+        self.addMetaBlockState(value)
 
     MetaBlockState = property(getMetaBlockState, setMetaBlockState)
 
     def addMetaBlockState(self, *MetaBlockState):
-        for obj in MetaBlockState:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockState
+        for obj in members(MetaBlockState):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockState.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockState(self, *MetaBlockState):
-        for obj in MetaBlockState:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockState
+        for obj in members(MetaBlockState):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockState(self):
+        for obj in self._MetaBlockState:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockState = RefList()
 
     def getMetaBlockSignal(self):
         
@@ -159,20 +196,32 @@ class MetaBlock(IdentifiedObject):
 
     def setMetaBlockSignal(self, value):
         for x in self._MetaBlockSignal:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockSignal = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockSignal = RefList()
+        self.addMetaBlockSignal(value)
 
     MetaBlockSignal = property(getMetaBlockSignal, setMetaBlockSignal)
 
     def addMetaBlockSignal(self, *MetaBlockSignal):
-        for obj in MetaBlockSignal:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockSignal
+        for obj in members(MetaBlockSignal):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockSignal.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockSignal(self, *MetaBlockSignal):
-        for obj in MetaBlockSignal:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockSignal
+        for obj in members(MetaBlockSignal):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockSignal(self):
+        for obj in self._MetaBlockSignal:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockSignal = RefList()
 
     def getblockType0(self):
         
@@ -180,8 +229,7 @@ class MetaBlock(IdentifiedObject):
 
     def setblockType0(self, value):
         if self._blockType0 is not None:
-            filtered = [x for x in self.blockType0.metaBlock0 if x != self]
-            self._blockType0._metaBlock0 = filtered
+            self._blockType0._metaBlock0.discard(self)
 
         self._blockType0 = value
         if self._blockType0 is not None:
@@ -197,20 +245,32 @@ class MetaBlock(IdentifiedObject):
 
     def setMetaBlockInput(self, value):
         for x in self._MetaBlockInput:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockInput = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockInput = RefList()
+        self.addMetaBlockInput(value)
 
     MetaBlockInput = property(getMetaBlockInput, setMetaBlockInput)
 
     def addMetaBlockInput(self, *MetaBlockInput):
-        for obj in MetaBlockInput:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockInput
+        for obj in members(MetaBlockInput):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockInput.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockInput(self, *MetaBlockInput):
-        for obj in MetaBlockInput:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockInput
+        for obj in members(MetaBlockInput):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockInput(self):
+        for obj in self._MetaBlockInput:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockInput = RefList()
 
     def getblockConstant0(self):
         
@@ -218,20 +278,32 @@ class MetaBlock(IdentifiedObject):
 
     def setblockConstant0(self, value):
         for x in self._blockConstant0:
-            x.metaBlock0 = None
-        for y in value:
-            y._metaBlock0 = self
-        self._blockConstant0 = value
+            x._metaBlock0 = None
+        self._blockConstant0 = RefList()
+        self.addblockConstant0(value)
 
     blockConstant0 = property(getblockConstant0, setblockConstant0)
 
     def addblockConstant0(self, *blockConstant0):
-        for obj in blockConstant0:
-            obj.metaBlock0 = self
+        collection = self._blockConstant0
+        for obj in members(blockConstant0):
+            old = obj._metaBlock0
+            if old is not None and old is not self:
+                old._blockConstant0.discard(obj)
+            obj._metaBlock0 = self
+            collection.append(obj)
 
     def removeblockConstant0(self, *blockConstant0):
-        for obj in blockConstant0:
-            obj.metaBlock0 = None
+        collection = self._blockConstant0
+        for obj in members(blockConstant0):
+            if obj._metaBlock0 is self:
+                obj._metaBlock0 = None
+                collection.discard(obj)
+
+    def removeAllblockConstant0(self):
+        for obj in self._blockConstant0:
+            obj._metaBlock0 = None
+        self._blockConstant0 = RefList()
 
     def getBlock(self):
         
@@ -239,20 +311,32 @@ class MetaBlock(IdentifiedObject):
 
     def setBlock(self, value):
         for x in self._Block:
-            x.MetaBlock = None
-        for y in value:
-            y._MetaBlock = self
-        self._Block = value
+            x._MetaBlock = None
+        self._Block = RefList()
+        self.addBlock(value)
 
     Block = property(getBlock, setBlock)
 
     def addBlock(self, *Block):
-        for obj in Block:
-            obj.MetaBlock = self
+        collection = self._Block
+        for obj in members(Block):
+            old = obj._MetaBlock
+            if old is not None and old is not self:
+                old._Block.discard(obj)
+            obj._MetaBlock = self
+            collection.append(obj)
 
     def removeBlock(self, *Block):
-        for obj in Block:
-            obj.MetaBlock = None
+        collection = self._Block
+        for obj in members(Block):
+            if obj._MetaBlock is self:
+                obj._MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllBlock(self):
+        for obj in self._Block:
+            obj._MetaBlock = None
+        self._Block = RefList()
 
     def getMetaBlockParameter(self):
         """Paramters belong to a block.
@@ -261,18 +345,30 @@ class MetaBlock(IdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         for x in self._MetaBlockParameter:
-            x.MemberOf_MetaBlock = None
-        for y in value:
-            y._MemberOf_MetaBlock = self
-        self._MetaBlockParameter = value
+            x._MemberOf_MetaBlock = None
+        self._MetaBlockParameter = RefList()
+        self.addMetaBlockParameter(value)
 
     MetaBlockParameter = property(getMetaBlockParameter, setMetaBlockParameter)
 
     def addMetaBlockParameter(self, *MetaBlockParameter):
-        for obj in MetaBlockParameter:
-            obj.MemberOf_MetaBlock = self
+        collection = self._MetaBlockParameter
+        for obj in members(MetaBlockParameter):
+            old = obj._MemberOf_MetaBlock
+            if old is not None and old is not self:
+                old._MetaBlockParameter.discard(obj)
+            obj._MemberOf_MetaBlock = self
+            collection.append(obj)
 
     def removeMetaBlockParameter(self, *MetaBlockParameter):
-        for obj in MetaBlockParameter:
-            obj.MemberOf_MetaBlock = None
+        collection = self._MetaBlockParameter
+        for obj in members(MetaBlockParameter):
+            if obj._MemberOf_MetaBlock is self:
+                obj._MemberOf_MetaBlock = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockParameter(self):
+        for obj in self._MetaBlockParameter:
+            obj._MemberOf_MetaBlock = None
+        self._MetaBlockParameter = RefList()
 
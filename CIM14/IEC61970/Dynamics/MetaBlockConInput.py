@@ -70,8 +70,7 @@ class MetaBlockConInput(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConInput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConInput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConInput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
@@ -86,8 +85,7 @@ class MetaBlockConInput(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.MetaBlockConInput if x != self]
-            self._Unit._MetaBlockConInput = filtered
+            self._Unit._MetaBlockConInput.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockConOutput(IdentifiedObject):
     """If model uses MeasurementType association, it means the output is pushed back to the steady state model (if reasonable).
@@ -31,7 +32,7 @@ class MetaBlockConOutput(IdentifiedObject):
         @param MemberOf_MetaBlockConnection:
         @param Unit:
         """
-        self._MetaBlockConSignal = []
+        self._MetaBlockConSignal = RefList()
         self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
 
         self._MemberOf_MetaBlockConnection = None
@@ -55,20 +56,32 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setMetaBlockConSignal(self, value):
         for x in self._MetaBlockConSignal:
-            x.MetaBlockConOutput = None
-        for y in value:
-            y._MetaBlockConOutput = self
-        self._MetaBlockConSignal = value
+            x._MetaBlockConOutput = None
+        self._MetaBlockConSignal = RefList()
+        self.addMetaBlockConSignal(value)
 
     MetaBlockConSignal = property(getMetaBlockConSignal, setMetaBlockConSignal)
 
     def addMetaBlockConSignal(self, *MetaBlockConSignal):
-        for obj in MetaBlockConSignal:
-            obj.MetaBlockConOutput = self
+        collection = self._MetaBlockConSignal
+        for obj in members(MetaBlockConSignal):
+            old = obj._MetaBlockConOutput
+            if old is not None and old is not self:
+                old._MetaBlockConSignal.discard(obj)
+            obj._MetaBlockConOutput = self
+            collection.append(obj)
 
     def removeMetaBlockConSignal(self, *MetaBlockConSignal):
-        for obj in MetaBlockConSignal:
-            obj.MetaBlockConOutput = None
+        collection = self._MetaBlockConSignal
+        for obj in members(MetaBlockConSignal):
+            if obj._MetaBlockConOutput is self:
+                obj._MetaBlockConOutput = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConSignal(self):
+        for obj in self._MetaBlockConSignal:
+            obj._MetaBlockConOutput = None
+        self._MetaBlockConSignal = RefList()
 
     def getMemberOf_MetaBlockConnection(self):
         
@@ -76,8 +89,7 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConOutput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConOutput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConOutput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
@@ -92,8 +104,7 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.MetaBlockConOutput if x != self]
-            self._Unit._MetaBlockConOutput = filtered
+            self._Unit._MetaBlockConOutput.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
@@ -72,8 +72,7 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConSignal if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
@@ -88,8 +87,7 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         if self._MetaBlockConOutput is not None:
-            filtered = [x for x in self.MetaBlockConOutput.MetaBlockConSignal if x != self]
-            self._MetaBlockConOutput._MetaBlockConSignal = filtered
+            self._MetaBlockConOutput._MetaBlockConSignal.discard(self)
 
         self._MetaBlockConOutput = value
         if self._MetaBlockConOutput is not None:
@@ -104,8 +102,7 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setmetaBlockConnectivity0(self, value):
         if self._metaBlockConnectivity0 is not None:
-            filtered = [x for x in self.metaBlockConnectivity0.metaBlockConSignal0 if x != self]
-            self._metaBlockConnectivity0._metaBlockConSignal0 = filtered
+            self._metaBlockConnectivity0._metaBlockConSignal0.discard(self)
 
         self._metaBlockConnectivity0 = value
         if self._metaBlockConnectivity0 is not None:
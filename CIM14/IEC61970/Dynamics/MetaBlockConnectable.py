@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockConnectable(IdentifiedObject):
     """This is a source connection for a block input at the dynamics meta-data level.   The subtypes represent different ways to obtain the numbers.  Note that a block output is NOT derived from this class since block outputs can only be computed from references to other blocks via the BlockOutputReference class.
@@ -37,31 +38,31 @@ class MetaBlockConnectable(IdentifiedObject):
         @param StandardControlBlock_MetaBlockOutputReference:
         @param MetaBlockInputReference:
         """
-        self._StandardControlBlock_MetaBlockStateReference = []
+        self._StandardControlBlock_MetaBlockStateReference = RefList()
         self.StandardControlBlock_MetaBlockStateReference = [] if StandardControlBlock_MetaBlockStateReference is None else StandardControlBlock_MetaBlockStateReference
 
-        self._MetaBlockOutputReference = []
+        self._MetaBlockOutputReference = RefList()
         self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
 
-        self._MetaBlockStateReference = []
+        self._MetaBlockStateReference = RefList()
         self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
 
-        self._BlockInputReference = []
+        self._BlockInputReference = RefList()
         self.BlockInputReference = [] if BlockInputReference is None else BlockInputReference
 
-        self._StandardControlBlock_MetaBlockInputReference = []
+        self._StandardControlBlock_MetaBlockInputReference = RefList()
         self.StandardControlBlock_MetaBlockInputReference = [] if StandardControlBlock_MetaBlockInputReference is None else StandardControlBlock_MetaBlockInputReference
 
-        self._StandardControlBlock_MetaBlockParameterReference = []
+        self._StandardControlBlock_MetaBlockParameterReference = RefList()
         self.StandardControlBlock_MetaBlockParameterReference = [] if StandardControlBlock_MetaBlockParameterReference is None else StandardControlBlock_MetaBlockParameterReference
 
-        self._MetaBlockParameterReference = []
+        self._MetaBlockParameterReference = RefList()
         self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockOutputReference = []
+        self._StandardControlBlock_MetaBlockOutputReference = RefList()
         self.StandardControlBlock_MetaBlockOutputReference = [] if StandardControlBlock_MetaBlockOutputReference is None else StandardControlBlock_MetaBlockOutputReference
 
-        self._MetaBlockInputReference = []
+        self._MetaBlockInputReference = RefList()
         self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
 
         super(MetaBlockConnectable, self).__init__(*args, **kw_args)
@@ -79,20 +80,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockStateReference(self, value):
         for x in self._StandardControlBlock_MetaBlockStateReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockStateReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockStateReference = RefList()
+        self.addStandardControlBlock_MetaBlockStateReference(value)
 
     StandardControlBlock_MetaBlockStateReference = property(getStandardControlBlock_MetaBlockStateReference, setStandardControlBlock_MetaBlockStateReference)
 
     def addStandardControlBlock_MetaBlockStateReference(self, *StandardControlBlock_MetaBlockStateReference):
-        for obj in StandardControlBlock_MetaBlockStateReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockStateReference
+        for obj in members(StandardControlBlock_MetaBlockStateReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockStateReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockStateReference(self, *StandardControlBlock_MetaBlockStateReference):
-        for obj in StandardControlBlock_MetaBlockStateReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockStateReference
+        for obj in members(StandardControlBlock_MetaBlockStateReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockStateReference(self):
+        for obj in self._StandardControlBlock_MetaBlockStateReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockStateReference = RefList()
 
     def getMetaBlockOutputReference(self):
         
@@ -100,20 +113,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setMetaBlockOutputReference(self, value):
         for x in self._MetaBlockOutputReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockOutputReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockOutputReference = RefList()
+        self.addMetaBlockOutputReference(value)
 
     MetaBlockOutputReference = property(getMetaBlockOutputReference, setMetaBlockOutputReference)
 
     def addMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockOutputReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockOutputReference(self):
+        for obj in self._MetaBlockOutputReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockOutputReference = RefList()
 
     def getMetaBlockStateReference(self):
         
@@ -121,20 +146,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setMetaBlockStateReference(self, value):
         for x in self._MetaBlockStateReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockStateReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockStateReference = RefList()
+        self.addMetaBlockStateReference(value)
 
     MetaBlockStateReference = property(getMetaBlockStateReference, setMetaBlockStateReference)
 
     def addMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockStateReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockStateReference(self):
+        for obj in self._MetaBlockStateReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockStateReference = RefList()
 
     def getBlockInputReference(self):
         """Each block reference input is usually tied to one (sometimes zero for optional inputs) external block inputs or internal block reference outputs.
@@ -143,20 +180,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setBlockInputReference(self, value):
         for x in self._BlockInputReference:
-            x.BlockConnectable = None
-        for y in value:
-            y._BlockConnectable = self
-        self._BlockInputReference = value
+            x._BlockConnectable = None
+        self._BlockInputReference = RefList()
+        self.addBlockInputReference(value)
 
     BlockInputReference = property(getBlockInputReference, setBlockInputReference)
 
     def addBlockInputReference(self, *BlockInputReference):
-        for obj in BlockInputReference:
-            obj.BlockConnectable = self
+        collection = self._BlockInputReference
+        for obj in members(BlockInputReference):
+            old = obj._BlockConnectable
+            if old is not None and old is not self:
+                old._BlockInputReference.discard(obj)
+            obj._BlockConnectable = self
+            collection.append(obj)
 
     def removeBlockInputReference(self, *BlockInputReference):
-        for obj in BlockInputReference:
-            obj.BlockConnectable = None
+        collection = self._BlockInputReference
+        for obj in members(BlockInputReference):
+            if obj._BlockConnectable is self:
+                obj._BlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllBlockInputReference(self):
+        for obj in self._BlockInputReference:
+            obj._BlockConnectable = None
+        self._BlockInputReference = RefList()
 
     def getStandardControlBlock_MetaBlockInputReference(self):
         
@@ -164,20 +213,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockInputReference(self, value):
         for x in self._StandardControlBlock_MetaBlockInputReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockInputReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockInputReference = RefList()
+        self.addStandardControlBlock_MetaBlockInputReference(value)
 
     StandardControlBlock_MetaBlockInputReference = property(getStandardControlBlock_MetaBlockInputReference, setStandardControlBlock_MetaBlockInputReference)
 
     def addStandardControlBlock_MetaBlockInputReference(self, *StandardControlBlock_MetaBlockInputReference):
-        for obj in StandardControlBlock_MetaBlockInputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockInputReference
+        for obj in members(StandardControlBlock_MetaBlockInputReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockInputReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockInputReference(self, *StandardControlBlock_MetaBlockInputReference):
-        for obj in StandardControlBlock_MetaBlockInputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockInputReference
+        for obj in members(StandardControlBlock_MetaBlockInputReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockInputReference(self):
+        for obj in self._StandardControlBlock_MetaBlockInputReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockInputReference = RefList()
 
     def getStandardControlBlock_MetaBlockParameterReference(self):
         
@@ -185,20 +246,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockParameterReference(self, value):
         for x in self._StandardControlBlock_MetaBlockParameterReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockParameterReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockParameterReference = RefList()
+        self.addStandardControlBlock_MetaBlockParameterReference(value)
 
     StandardControlBlock_MetaBlockParameterReference = property(getStandardControlBlock_MetaBlockParameterReference, setStandardControlBlock_MetaBlockParameterReference)
 
     def addStandardControlBlock_MetaBlockParameterReference(self, *StandardControlBlock_MetaBlockParameterReference):
-        for obj in StandardControlBlock_MetaBlockParameterReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockParameterReference
+        for obj in members(StandardControlBlock_MetaBlockParameterReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockParameterReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockParameterReference(self, *StandardControlBlock_MetaBlockParameterReference):
-        for obj in StandardControlBlock_MetaBlockParameterReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockParameterReference
+        for obj in members(StandardControlBlock_MetaBlockParameterReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockParameterReference(self):
+        for obj in self._StandardControlBlock_MetaBlockParameterReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockParameterReference = RefList()
 
     def getMetaBlockParameterReference(self):
         
@@ -206,20 +279,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setMetaBlockParameterReference(self, value):
         for x in self._MetaBlockParameterReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockParameterReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockParameterReference = RefList()
+        self.addMetaBlockParameterReference(value)
 
     MetaBlockParameterReference = property(getMetaBlockParameterReference, setMetaBlockParameterReference)
 
     def addMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockParameterReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockParameterReference(self):
+        for obj in self._MetaBlockParameterReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockParameterReference = RefList()
 
     def getStandardControlBlock_MetaBlockOutputReference(self):
         
@@ -227,20 +312,32 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockOutputReference(self, value):
         for x in self._StandardControlBlock_MetaBlockOutputReference:
-            x.StandardControlBlock_MetaBlockConnectable = None
-        for y in value:
-            y._StandardControlBlock_MetaBlockConnectable = self
-        self._StandardControlBlock_MetaBlockOutputReference = value
+            x._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockOutputReference = RefList()
+        self.addStandardControlBlock_MetaBlockOutputReference(value)
 
     StandardControlBlock_MetaBlockOutputReference = property(getStandardControlBlock_MetaBlockOutputReference, setStandardControlBlock_MetaBlockOutputReference)
 
     def addStandardControlBlock_MetaBlockOutputReference(self, *StandardControlBlock_MetaBlockOutputReference):
-        for obj in StandardControlBlock_MetaBlockOutputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = self
+        collection = self._StandardControlBlock_MetaBlockOutputReference
+        for obj in members(StandardControlBlock_MetaBlockOutputReference):
+            old = obj._StandardControlBlock_MetaBlockConnectable
+            if old is not None and old is not self:
+                old._StandardControlBlock_MetaBlockOutputReference.discard(obj)
+            obj._StandardControlBlock_MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeStandardControlBlock_MetaBlockOutputReference(self, *StandardControlBlock_MetaBlockOutputReference):
-        for obj in StandardControlBlock_MetaBlockOutputReference:
-            obj.StandardControlBlock_MetaBlockConnectable = None
+        collection = self._StandardControlBlock_MetaBlockOutputReference
+        for obj in members(StandardControlBlock_MetaBlockOutputReference):
+            if obj._StandardControlBlock_MetaBlockConnectable is self:
+                obj._StandardControlBlock_MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllStandardControlBlock_MetaBlockOutputReference(self):
+        for obj in self._StandardControlBlock_MetaBlockOutputReference:
+            obj._StandardControlBlock_MetaBlockConnectable = None
+        self._StandardControlBlock_MetaBlockOutputReference = RefList()
 
     def getMetaBlockInputReference(self):
         
@@ -248,18 +345,30 @@ class MetaBlockConnectable(IdentifiedObject):
 
     def setMetaBlockInputReference(self, value):
         for x in self._MetaBlockInputReference:
-            x.MetaBlockConnectable = None
-        for y in value:
-            y._MetaBlockConnectable = self
-        self._MetaBlockInputReference = value
+            x._MetaBlockConnectable = None
+        self._MetaBlockInputReference = RefList()
+        self.addMetaBlockInputReference(value)
 
     MetaBlockInputReference = property(getMetaBlockInputReference, setMetaBlockInputReference)
 
     def addMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MetaBlockConnectable = self
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            old = obj._MetaBlockConnectable
+            if old is not None and old is not self:
+                old._MetaBlockInputReference.discard(obj)
+            obj._MetaBlockConnectable = self
+            collection.append(obj)
 
     def removeMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MetaBlockConnectable = None
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            if obj._MetaBlockConnectable is self:
+                obj._MetaBlockConnectable = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockInputReference(self):
+        for obj in self._MetaBlockInputReference:
+            obj._MetaBlockConnectable = None
+        self._MetaBlockInputReference = RefList()
 
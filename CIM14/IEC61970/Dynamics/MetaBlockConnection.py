@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockConnection(IdentifiedObject):
 
@@ -35,16 +36,16 @@ class MetaBlockConnection(IdentifiedObject):
         #: Used for standard connection situations where multiple blocks of same class or same MetaBlock::blockkind have to be connected. The slotnames used are defined in the Reference Manual for Exchanging Standard Power System Dynamic Models. Application: Cross-compound or Combined Cycle connections.
         self.slotname = slotname
 
-        self._MetaBlockConOutput = []
+        self._MetaBlockConOutput = RefList()
         self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
 
-        self._MetaBlockConInput = []
+        self._MetaBlockConInput = RefList()
         self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
 
         self._metaBlockConnectivity0 = None
         self.metaBlockConnectivity0 = metaBlockConnectivity0
 
-        self._BlockConnection = []
+        self._BlockConnection = RefList()
         self.BlockConnection = [] if BlockConnection is None else BlockConnection
 
         self._MemberOf_MetaBlockConnectivity = None
@@ -65,20 +66,32 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         for x in self._MetaBlockConOutput:
-            x.MemberOf_MetaBlockConnection = None
-        for y in value:
-            y._MemberOf_MetaBlockConnection = self
-        self._MetaBlockConOutput = value
+            x._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConOutput = RefList()
+        self.addMetaBlockConOutput(value)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
     def addMetaBlockConOutput(self, *MetaBlockConOutput):
-        for obj in MetaBlockConOutput:
-            obj.MemberOf_MetaBlockConnection = self
+        collection = self._MetaBlockConOutput
+        for obj in members(MetaBlockConOutput):
+            old = obj._MemberOf_MetaBlockConnection
+            if old is not None and old is not self:
+                old._MetaBlockConOutput.discard(obj)
+            obj._MemberOf_MetaBlockConnection = self
+            collection.append(obj)
 
     def removeMetaBlockConOutput(self, *MetaBlockConOutput):
-        for obj in MetaBlockConOutput:
-            obj.MemberOf_MetaBlockConnection = None
+        collection = self._MetaBlockConOutput
+        for obj in members(MetaBlockConOutput):
+            if obj._MemberOf_MetaBlockConnection is self:
+                obj._MemberOf_MetaBlockConnection = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConOutput(self):
+        for obj in self._MetaBlockConOutput:
+            obj._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConOutput = RefList()
 
     def getMetaBlockConInput(self):
         
@@ -86,20 +99,32 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setMetaBlockConInput(self, value):
         for x in self._MetaBlockConInput:
-            x.MemberOf_MetaBlockConnection = None
-        for y in value:
-            y._MemberOf_MetaBlockConnection = self
-        self._MetaBlockConInput = value
+            x._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConInput = RefList()
+        self.addMetaBlockConInput(value)
 
     MetaBlockConInput = property(getMetaBlockConInput, setMetaBlockConInput)
 
     def addMetaBlockConInput(self, *MetaBlockConInput):
-        for obj in MetaBlockConInput:
-            obj.MemberOf_MetaBlockConnection = self
+        collection = self._MetaBlockConInput
+        for obj in members(MetaBlockConInput):
+            old = obj._MemberOf_MetaBlockConnection
+            if old is not None and old is not self:
+                old._MetaBlockConInput.discard(obj)
+            obj._MemberOf_MetaBlockConnection = self
+            collection.append(obj)
 
     def removeMetaBlockConInput(self, *MetaBlockConInput):
-        for obj in MetaBlockConInput:
-            obj.MemberOf_MetaBlockConnection = None
+        collection = self._MetaBlockConInput
+        for obj in members(MetaBlockConInput):
+            if obj._MemberOf_MetaBlockConnection is self:
+                obj._MemberOf_MetaBlockConnection = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConInput(self):
+        for obj in self._MetaBlockConInput:
+            obj._MemberOf_MetaBlockConnection = None
+        self._MetaBlockConInput = RefList()
 
     def getmetaBlockConnectivity0(self):
         
@@ -107,8 +132,7 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setmetaBlockConnectivity0(self, value):
         if self._metaBlockConnectivity0 is not None:
-            filtered = [x for x in self.metaBlockConnectivity0.metaBlockConnection0 if x != self]
-            self._metaBlockConnectivity0._metaBlockConnection0 = filtered
+            self._metaBlockConnectivity0._metaBlockConnection0.discard(self)
 
         self._metaBlockConnectivity0 = value
         if self._metaBlockConnectivity0 is not None:
@@ -123,20 +147,32 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setBlockConnection(self, value):
         for x in self._BlockConnection:
-            x.MetaBlockConnection = None
-        for y in value:
-            y._MetaBlockConnection = self
-        self._BlockConnection = value
+            x._MetaBlockConnection = None
+        self._BlockConnection = RefList()
+        self.addBlockConnection(value)
 
     BlockConnection = property(getBlockConnection, setBlockConnection)
 
     def addBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.MetaBlockConnection = self
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            old = obj._MetaBlockConnection
+            if old is not None and old is not self:
+                old._BlockConnection.discard(obj)
+            obj._MetaBlockConnection = self
+            collection.append(obj)
 
     def removeBlockConnection(self, *BlockConnection):
-        for obj in BlockConnection:
-            obj.MetaBlockConnection = None
+        collection = self._BlockConnection
+        for obj in members(BlockConnection):
+            if obj._MetaBlockConnection is self:
+                obj._MetaBlockConnection = None
+                collection.discard(obj)
+
+    def removeAllBlockConnection(self):
+        for obj in self._BlockConnection:
+            obj._MetaBlockConnection = None
+        self._BlockConnection = RefList()
 
     def getMemberOf_MetaBlockConnectivity(self):
         
@@ -144,8 +180,7 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConnection if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockConnectivity(IdentifiedObject):
 
@@ -31,19 +32,19 @@ class MetaBlockConnectivity(IdentifiedObject):
         @param metaBlockConSignal0:
         @param MetaBlockConnection:
         """
-        self._BlockConnectivity = []
+        self._BlockConnectivity = RefList()
         self.BlockConnectivity = [] if BlockConnectivity is None else BlockConnectivity
 
-        self._MetaBlockConSignal = []
+        self._MetaBlockConSignal = RefList()
         self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
 
-        self._metaBlockConnection0 = []
+        self._metaBlockConnection0 = RefList()
         self.metaBlockConnection0 = [] if metaBlockConnection0 is None else metaBlockConnection0
 
-        self._metaBlockConSignal0 = []
+        self._metaBlockConSignal0 = RefList()
         self.metaBlockConSignal0 = [] if metaBlockConSignal0 is None else metaBlockConSignal0
 
-        self._MetaBlockConnection = []
+        self._MetaBlockConnection = RefList()
         self.MetaBlockConnection = [] if MetaBlockConnection is None else MetaBlockConnection
 
         super(MetaBlockConnectivity, self).__init__(*args, **kw_args)
@@ -61,20 +62,32 @@ class MetaBlockConnectivity(IdentifiedObject):
 
     def setBlockConnectivity(self, value):
         for x in self._BlockConnectivity:
-            x.MetaBlockConnectivity = None
-        for y in value:
-            y._MetaBlockConnectivity = self
-        self._BlockConnectivity = value
+            x._MetaBlockConnectivity = None
+        self._BlockConnectivity = RefList()
+        self.addBlockConnectivity(value)
 
     BlockConnectivity = property(getBlockConnectivity, setBlockConnectivity)
 
     def addBlockConnectivity(self, *BlockConnectivity):
-        for obj in BlockConnectivity:
-            obj.MetaBlockConnectivity = self
+        collection = self._BlockConnectivity
+        for obj in members(BlockConnectivity):
+            old = obj._MetaBlockConnectivity
+            if old is not None and old is not self:
+                old._BlockConnectivity.discard(obj)
+            obj._MetaBlockConnectivity = self
+            collection.append(obj)
 
     def removeBlockConnectivity(self, *BlockConnectivity):
-        for obj in BlockConnectivity:
-            obj.MetaBlockConnectivity = None
+        collection = self._BlockConnectivity
+        for obj in members(BlockConnectivity):
+            if obj._MetaBlockConnectivity is self:
+                obj._MetaBlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllBlockConnectivity(self):
+        for obj in self._BlockConnectivity:
+            obj._MetaBlockConnectivity = None
+        self._BlockConnectivity = RefList()
 
     def getMetaBlockConSignal(self):
         
@@ -82,20 +95,32 @@ class MetaBlockConnectivity(IdentifiedObject):
 
     def setMetaBlockConSignal(self, value):
         for x in self._MetaBlockConSignal:
-            x.MemberOf_MetaBlockConnectivity = None
-        for y in value:
-            y._MemberOf_MetaBlockConnectivity = self
-        self._MetaBlockConSignal = value
+            x._MemberOf_MetaBlockConnectivity = None
+        self._MetaBlockConSignal = RefList()
+        self.addMetaBlockConSignal(value)
 
     MetaBlockConSignal = property(getMetaBlockConSignal, setMetaBlockConSignal)
 
     def addMetaBlockConSignal(self, *MetaBlockConSignal):
-        for obj in MetaBlockConSignal:
-            obj.MemberOf_MetaBlockConnectivity = self
+        collection = self._MetaBlockConSignal
+        for obj in members(MetaBlockConSignal):
+            old = obj._MemberOf_MetaBlockConnectivity
+            if old is not None and old is not self:
+                old._MetaBlockConSignal.discard(obj)
+            obj._MemberOf_MetaBlockConnectivity = self
+            collection.append(obj)
 
     def removeMetaBlockConSignal(self, *MetaBlockConSignal):
-        for obj in MetaBlockConSignal:
-            obj.MemberOf_MetaBlockConnectivity = None
+        collection = self._MetaBlockConSignal
+        for obj in members(MetaBlockConSignal):
+            if obj._MemberOf_MetaBlockConnectivity is self:
+                obj._MemberOf_MetaBlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConSignal(self):
+        for obj in self._MetaBlockConSignal:
+            obj._MemberOf_MetaBlockConnectivity = None
+        self._MetaBlockConSignal = RefList()
 
     def getmetaBlockConnection0(self):
         
@@ -103,20 +128,32 @@ class MetaBlockConnectivity(IdentifiedObject):
 
     def setmetaBlockConnection0(self, value):
         for x in self._metaBlockConnection0:
-            x.metaBlockConnectivity0 = None
-        for y in value:
-            y._metaBlockConnectivity0 = self
-        self._metaBlockConnection0 = value
+            x._metaBlockConnectivity0 = None
+        self._metaBlockConnection0 = RefList()
+        self.addmetaBlockConnection0(value)
 
     metaBlockConnection0 = property(getmetaBlockConnection0, setmetaBlockConnection0)
 
     def addmetaBlockConnection0(self, *metaBlockConnection0):
-        for obj in metaBlockConnection0:
-            obj.metaBlockConnectivity0 = self
+        collection = self._metaBlockConnection0
+        for obj in members(metaBlockConnection0):
+            old = obj._metaBlockConnectivity0
+            if old is not None and old is not self:
+                old._metaBlockConnection0.discard(obj)
+            obj._metaBlockConnectivity0 = self
+            collection.append(obj)
 
     def removemetaBlockConnection0(self, *metaBlockConnection0):
-        for obj in metaBlockConnection0:
-            obj.metaBlockConnectivity0 = None
+        collection = self._metaBlockConnection0
+        for obj in members(metaBlockConnection0):
+            if obj._metaBlockConnectivity0 is self:
+                obj._metaBlockConnectivity0 = None
+                collection.discard(obj)
+
+    def removeAllmetaBlockConnection0(self):
+        for obj in self._metaBlockConnection0:
+            obj._metaBlockConnectivity0 = None
+        self._metaBlockConnection0 = RefList()
 
     def getmetaBlockConSignal0(self):
         
@@ -124,20 +161,32 @@ class MetaBlockConnectivity(IdentifiedObject):
 
     def setmetaBlockConSignal0(self, value):
         for x in self._metaBlockConSignal0:
-            x.metaBlockConnectivity0 = None
-        for y in value:
-            y._metaBlockConnectivity0 = self
-        self._metaBlockConSignal0 = value
+            x._metaBlockConnectivity0 = None
+        self._metaBlockConSignal0 = RefList()
+        self.addmetaBlockConSignal0(value)
 
     metaBlockConSignal0 = property(getmetaBlockConSignal0, setmetaBlockConSignal0)
 
     def addmetaBlockConSignal0(self, *metaBlockConSignal0):
-        for obj in metaBlockConSignal0:
-            obj.metaBlockConnectivity0 = self
+        collection = self._metaBlockConSignal0
+        for obj in members(metaBlockConSignal0):
+            old = obj._metaBlockConnectivity0
+            if old is not None and old is not self:
+                old._metaBlockConSignal0.discard(obj)
+            obj._metaBlockConnectivity0 = self
+            collection.append(obj)
 
     def removemetaBlockConSignal0(self, *metaBlockConSignal0):
-        for obj in metaBlockConSignal0:
-            obj.metaBlockConnectivity0 = None
+        collection = self._metaBlockConSignal0
+        for obj in members(metaBlockConSignal0):
+            if obj._metaBlockConnectivity0 is self:
+                obj._metaBlockConnectivity0 = None
+                collection.discard(obj)
+
+    def removeAllmetaBlockConSignal0(self):
+        for obj in self._metaBlockConSignal0:
+            obj._metaBlockConnectivity0 = None
+        self._metaBlockConSignal0 = RefList()
 
     def getMetaBlockConnection(self):
         
@@ -145,18 +194,30 @@ class MetaBlockConnectivity(IdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         for x in self._MetaBlockConnection:
-            x.MemberOf_MetaBlockConnectivity = None
-        for y in value:
-            y._MemberOf_MetaBlockConnectivity = self
-        self._MetaBlockConnection = value
+            x._MemberOf_MetaBlockConnectivity = None
+        self._MetaBlockConnection = RefList()
+        self.addMetaBlockConnection(value)
 
     MetaBlockConnection = property(getMetaBlockConnection, setMetaBlockConnection)
 
     def addMetaBlockConnection(self, *MetaBlockConnection):
-        for obj in MetaBlockConnection:
-            obj.MemberOf_MetaBlockConnectivity = self
+        collection = self._MetaBlockConnection
+        for obj in members(MetaBlockConnection):
+            old = obj._MemberOf_MetaBlockConnectivity
+            if old is not None and old is not self:
+                old._MetaBlockConnection.discard(obj)
+            obj._MemberOf_MetaBlockConnectivity = self
+            collection.append(obj)
 
     def removeMetaBlockConnection(self, *MetaBlockConnection):
-        for obj in MetaBlockConnection:
-            obj.MemberOf_MetaBlockConnectivity = None
+        collection = self._MetaBlockConnection
+        for obj in members(MetaBlockConnection):
+            if obj._MemberOf_MetaBlockConnectivity is self:
+                obj._MemberOf_MetaBlockConnectivity = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockConnection(self):
+        for obj in self._MetaBlockConnection:
+            obj._MemberOf_MetaBlockConnectivity = None
+        self._MetaBlockConnection = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from PyCIM.RefList import RefList, members
 
 class MetaBlockInput(MetaBlockConnectable):
     """Linkage at the dynanics meta model level.    The output of a block could link to this. This is a public interface external to the block.
@@ -33,19 +34,19 @@ class MetaBlockInput(MetaBlockConnectable):
         @param blockInputType0:
         @param tieToMeasurement0: The identified block input to which this measurement applies.   Note this applies only to the external interface of blocks.
         """
-        self._blockInputReference0 = []
+        self._blockInputReference0 = RefList()
         self.blockInputReference0 = [] if blockInputReference0 is None else blockInputReference0
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._blockUsageInputReference0 = []
+        self._blockUsageInputReference0 = RefList()
         self.blockUsageInputReference0 = [] if blockUsageInputReference0 is None else blockUsageInputReference0
 
         self._blockInputType0 = None
         self.blockInputType0 = blockInputType0
 
-        self._tieToMeasurement0 = []
+        self._tieToMeasurement0 = RefList()
         self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
 
         super(MetaBlockInput, self).__init__(*args, **kw_args)
@@ -64,20 +65,32 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def setblockInputReference0(self, value):
         for x in self._blockInputReference0:
-            x.metaBlockInput0 = None
-        for y in value:
-            y._metaBlockInput0 = self
-        self._blockInputReference0 = value
+            x._metaBlockInput0 = None
+        self._blockInputReference0 = RefList()
+        self.addblockInputReference0(value)
 
     blockInputReference0 = property(getblockInputReference0, setblockInputReference0)
 
     def addblockInputReference0(self, *blockInputReference0):
-        for obj in blockInputReference0:
-            obj.metaBlockInput0 = self
+        collection = self._blockInputReference0
+        for obj in members(blockInputReference0):
+            old = obj._metaBlockInput0
+            if old is not None and old is not self:
+                old._blockInputReference0.discard(obj)
+            obj._metaBlockInput0 = self
+            collection.append(obj)
 
     def removeblockInputReference0(self, *blockInputReference0):
-        for obj in blockInputReference0:
-            obj.metaBlockInput0 = None
+        collection = self._blockInputReference0
+        for obj in members(blockInputReference0):
+            if obj._metaBlockInput0 is self:
+                obj._metaBlockInput0 = None
+                collection.discard(obj)
+
+    def removeAllblockInputReference0(self):
+        for obj in self._blockInputReference0:
+            obj._metaBlockInput0 = None
+        self._blockInputReference0 = RefList()
 
     def getMemberOf_MetaBlock(self):
         """Inputs belong to a block.
@@ -86,8 +99,7 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockInput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockInput = filtered
+            self._MemberOf_MetaBlock._MetaBlockInput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -102,20 +114,32 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def setblockUsageInputReference0(self, value):
         for x in self._blockUsageInputReference0:
-            x.metaBlockInput0 = None
-        for y in value:
-            y._metaBlockInput0 = self
-        self._blockUsageInputReference0 = value
+            x._metaBlockInput0 = None
+        self._blockUsageInputReference0 = RefList()
+        self.addblockUsageInputReference0(value)
 
     blockUsageInputReference0 = property(getblockUsageInputReference0, setblockUsageInputReference0)
 
     def addblockUsageInputReference0(self, *blockUsageInputReference0):
-        for obj in blockUsageInputReference0:
-            obj.metaBlockInput0 = self
+        collection = self._blockUsageInputReference0
+        for obj in members(blockUsageInputReference0):
+            old = obj._metaBlockInput0
+            if old is not None and old is not self:
+                old._blockUsageInputReference0.discard(obj)
+            obj._metaBlockInput0 = self
+            collection.append(obj)
 
     def removeblockUsageInputReference0(self, *blockUsageInputReference0):
-        for obj in blockUsageInputReference0:
-            obj.metaBlockInput0 = None
+        collection = self._blockUsageInputReference0
+        for obj in members(blockUsageInputReference0):
+            if obj._metaBlockInput0 is self:
+                obj._metaBlockInput0 = None
+                collection.discard(obj)
+
+    def removeAllblockUsageInputReference0(self):
+        for obj in self._blockUsageInputReference0:
+            obj._metaBlockInput0 = None
+        self._blockUsageInputReference0 = RefList()
 
     def getblockInputType0(self):
         
@@ -123,8 +147,7 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def setblockInputType0(self, value):
         if self._blockInputType0 is not None:
-            filtered = [x for x in self.blockInputType0.metaBlockInput0 if x != self]
-            self._blockInputType0._metaBlockInput0 = filtered
+            self._blockInputType0._metaBlockInput0.discard(self)
 
         self._blockInputType0 = value
         if self._blockInputType0 is not None:
@@ -140,18 +163,30 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def settieToMeasurement0(self, value):
         for x in self._tieToMeasurement0:
-            x.metaBlockInput0 = None
-        for y in value:
-            y._metaBlockInput0 = self
-        self._tieToMeasurement0 = value
+            x._metaBlockInput0 = None
+        self._tieToMeasurement0 = RefList()
+        self.addtieToMeasurement0(value)
 
     tieToMeasurement0 = property(gettieToMeasurement0, settieToMeasurement0)
 
     def addtieToMeasurement0(self, *tieToMeasurement0):
-        for obj in tieToMeasurement0:
-            obj.metaBlockInput0 = self
+        collection = self._tieToMeasurement0
+        for obj in members(tieToMeasurement0):
+            old = obj._metaBlockInput0
+            if old is not None and old is not self:
+                old._tieToMeasurement0.discard(obj)
+            obj._metaBlockInput0 = self
+            collection.append(obj)
 
     def removetieToMeasurement0(self, *tieToMeasurement0):
-        for obj in tieToMeasurement0:
-            obj.metaBlockInput0 = None
+        collection = self._tieToMeasurement0
+        for obj in members(tieToMeasurement0):
+            if obj._metaBlockInput0 is self:
+                obj._metaBlockInput0 = None
+                collection.discard(obj)
+
+    def removeAlltieToMeasurement0(self):
+        for obj in self._tieToMeasurement0:
+            obj._metaBlockInput0 = None
+        self._tieToMeasurement0 = RefList()
 
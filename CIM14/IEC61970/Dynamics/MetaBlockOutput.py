@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from PyCIM.RefList import RefList, members
 
 class MetaBlockOutput(MetaBlockConnectable):
     """Output state of a block.   This is a public interface external to the block.    One or more block outputs should be specified in order to link blocks together.    Certain block kinds might require a specific output. For example, an exciter block might require an output called 'Ea'.
@@ -32,13 +33,13 @@ class MetaBlockOutput(MetaBlockConnectable):
         @param blockUsageOutputReference0:
         @param blockOutputType0:
         """
-        self._BlockOutputReference = []
+        self._BlockOutputReference = RefList()
         self.BlockOutputReference = [] if BlockOutputReference is None else BlockOutputReference
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._blockUsageOutputReference0 = []
+        self._blockUsageOutputReference0 = RefList()
         self.blockUsageOutputReference0 = [] if blockUsageOutputReference0 is None else blockUsageOutputReference0
 
         self._blockOutputType0 = None
@@ -60,20 +61,32 @@ class MetaBlockOutput(MetaBlockConnectable):
 
     def setBlockOutputReference(self, value):
         for x in self._BlockOutputReference:
-            x.metaBlockOutput0 = None
-        for y in value:
-            y._metaBlockOutput0 = self
-        self._BlockOutputReference = value
+            x._metaBlockOutput0 = None
+        self._BlockOutputReference = RefList()
+        self.addBlockOutputReference(value)
 
     BlockOutputReference = property(getBlockOutputReference, setBlockOutputReference)
 
     def addBlockOutputReference(self, *BlockOutputReference):
-        for obj in BlockOutputReference:
-            obj.metaBlockOutput0 = self
+        collection = self._BlockOutputReference
+        for obj in members(BlockOutputReference):
+            old = obj._metaBlockOutput0
+            if old is not None and old is not self:
+                old._BlockOutputReference.discard(obj)
+            obj._metaBlockOutput0 = self
+            collection.append(obj)
 
     def removeBlockOutputReference(self, *BlockOutputReference):
-        for obj in BlockOutputReference:
-            obj.metaBlockOutput0 = None
+        collection = self._BlockOutputReference
+        for obj in members(BlockOutputReference):
+            if obj._metaBlockOutput0 is self:
+                obj._metaBlockOutput0 = None
+                collection.discard(obj)
+
+    def removeAllBlockOutputReference(self):
+        for obj in self._BlockOutputReference:
+            obj._metaBlockOutput0 = None
+        self._BlockOutputReference = RefList()
 
     def getMemberOf_MetaBlock(self):
         """The block that contains the output.
@@ -82,8 +95,7 @@ class MetaBlockOutput(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockOutput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockOutput = filtered
+            self._MemberOf_MetaBlock._MetaBlockOutput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -98,20 +110,32 @@ class MetaBlockOutput(MetaBlockConnectable):
 
     def setblockUsageOutputReference0(self, value):
         for x in self._blockUsageOutputReference0:
-            x.metaBlockOutput0 = None
-        for y in value:
-            y._metaBlockOutput0 = self
-        self._blockUsageOutputReference0 = value
+            x._metaBlockOutput0 = None
+        self._blockUsageOutputReference0 = RefList()
+        self.addblockUsageOutputReference0(value)
 
     blockUsageOutputReference0 = property(getblockUsageOutputReference0, setblockUsageOutputReference0)
 
     def addblockUsageOutputReference0(self, *blockUsageOutputReference0):
-        for obj in blockUsageOutputReference0:
-            obj.metaBlockOutput0 = self
+        collection = self._blockUsageOutputReference0
+        for obj in members(blockUsageOutputReference0):
+            old = obj._metaBlockOutput0
+            if old is not None and old is not self:
+                old._blockUsageOutputReference0.discard(obj)
+            obj._metaBlockOutput0 = self
+            collection.append(obj)
 
     def removeblockUsageOutputReference0(self, *blockUsageOutputReference0):
-        for obj in blockUsageOutputReference0:
-            obj.metaBlockOutput0 = None
+        collection = self._blockUsageOutputReference0
+        for obj in members(blockUsageOutputReference0):
+            if obj._metaBlockOutput0 is self:
+                obj._metaBlockOutput0 = None
+                collection.discard(obj)
+
+    def removeAllblockUsageOutputReference0(self):
+        for obj in self._blockUsageOutputReference0:
+            obj._metaBlockOutput0 = None
+        self._blockUsageOutputReference0 = RefList()
 
     def getblockOutputType0(self):
         
@@ -119,8 +143,7 @@ class MetaBlockOutput(MetaBlockConnectable):
 
     def setblockOutputType0(self, value):
         if self._blockOutputType0 is not None:
-            filtered = [x for x in self.blockOutputType0.metaBlockOutput0 if x != self]
-            self._blockOutputType0._metaBlockOutput0 = filtered
+            self._blockOutputType0._metaBlockOutput0.discard(self)
 
         self._blockOutputType0 = value
         if self._blockOutputType0 is not None:
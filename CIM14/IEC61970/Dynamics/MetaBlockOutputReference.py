@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockOutputReference(IdentifiedObject):
 
@@ -36,7 +37,7 @@ class MetaBlockOutputReference(IdentifiedObject):
         self._MemberOf_MetaBlockReference = None
         self.MemberOf_MetaBlockReference = MemberOf_MetaBlockReference
 
-        self._MetaBlockSignal = []
+        self._MetaBlockSignal = RefList()
         self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
 
         self._StandardControlBlock_MetaBlockConnectable = None
@@ -57,8 +58,7 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockOutputReference if x != self]
-            self._MetaBlockConnectable._MetaBlockOutputReference = filtered
+            self._MetaBlockConnectable._MetaBlockOutputReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
@@ -73,8 +73,7 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockOutputReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockOutputReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockOutputReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
@@ -89,20 +88,32 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMetaBlockSignal(self, value):
         for x in self._MetaBlockSignal:
-            x.To = None
-        for y in value:
-            y._To = self
-        self._MetaBlockSignal = value
+            x._To = None
+        self._MetaBlockSignal = RefList()
+        self.addMetaBlockSignal(value)
 
     MetaBlockSignal = property(getMetaBlockSignal, setMetaBlockSignal)
 
     def addMetaBlockSignal(self, *MetaBlockSignal):
-        for obj in MetaBlockSignal:
-            obj.To = self
+        collection = self._MetaBlockSignal
+        for obj in members(MetaBlockSignal):
+            old = obj._To
+            if old is not None and old is not self:
+                old._MetaBlockSignal.discard(obj)
+            obj._To = self
+            collection.append(obj)
 
     def removeMetaBlockSignal(self, *MetaBlockSignal):
-        for obj in MetaBlockSignal:
-            obj.To = None
+        collection = self._MetaBlockSignal
+        for obj in members(MetaBlockSignal):
+            if obj._To is self:
+                obj._To = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockSignal(self):
+        for obj in self._MetaBlockSignal:
+            obj._To = None
+        self._MetaBlockSignal = RefList()
 
     def getStandardControlBlock_MetaBlockConnectable(self):
         
@@ -110,8 +121,7 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockOutputReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from PyCIM.RefList import RefList, members
 
 class MetaBlockParameter(MetaBlockConnectable):
     """An identified parameter of a block.   This is meta dynamics model and does not contain specific parameter values. When using a block one would need to supply specific parameter values. These are typically time constants, but are not restricted to this.  Sometimes, for standard blocks, the block paramter may come directly from the attributes of an associated PowerSystemResource object, but such parameters may be specified to enable user defined models to alter the behavior of a standard block.
@@ -30,7 +31,7 @@ class MetaBlockParameter(MetaBlockConnectable):
         @param BlockParameter:
         @param MemberOf_MetaBlock: Paramters belong to a block.
         """
-        self._BlockParameter = []
+        self._BlockParameter = RefList()
         self.BlockParameter = [] if BlockParameter is None else BlockParameter
 
         self._MemberOf_MetaBlock = None
@@ -51,20 +52,32 @@ class MetaBlockParameter(MetaBlockConnectable):
 
     def setBlockParameter(self, value):
         for x in self._BlockParameter:
-            x.MetaBlockParameter = None
-        for y in value:
-            y._MetaBlockParameter = self
-        self._BlockParameter = value
+            x._MetaBlockParameter = None
+        self._BlockParameter = RefList()
+        self.addBlockParameter(value)
 
     BlockParameter = property(getBlockParameter, setBlockParameter)
 
     def addBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MetaBlockParameter = self
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            old = obj._MetaBlockParameter
+            if old is not None and old is not self:
+                old._BlockParameter.discard(obj)
+            obj._MetaBlockParameter = self
+            collection.append(obj)
 
     def removeBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MetaBlockParameter = None
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            if obj._MetaBlockParameter is self:
+                obj._MetaBlockParameter = None
+                collection.discard(obj)
+
+    def removeAllBlockParameter(self):
+        for obj in self._BlockParameter:
+            obj._MetaBlockParameter = None
+        self._BlockParameter = RefList()
 
     def getMemberOf_MetaBlock(self):
         """Paramters belong to a block.
@@ -73,8 +86,7 @@ class MetaBlockParameter(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockParameter if x != self]
-            self._MemberOf_MetaBlock._MetaBlockParameter = filtered
+            self._MemberOf_MetaBlock._MetaBlockParameter.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
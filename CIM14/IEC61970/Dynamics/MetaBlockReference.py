@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockReference(IdentifiedObject):
     """References a control block at the internal meta dynamics model level.    These references are contained in other blocks and reference the single instance of the meta model that defines a particular block definition. One would not expect to see bock references contained within a primitive block.
@@ -41,7 +42,7 @@ class MetaBlockReference(IdentifiedObject):
         #: should be enum, initial conditions vs. simulation equations
         self.equationType = equationType
 
-        self._blockInputReference0 = []
+        self._blockInputReference0 = RefList()
         self.blockInputReference0 = [] if blockInputReference0 is None else blockInputReference0
 
         self._MemberOf_MetaBlock = None
@@ -49,22 +50,22 @@ class MetaBlockReference(IdentifiedObject):
 
         self.MetaBlock = MetaBlock
 
-        self._blockOutputReference0 = []
+        self._blockOutputReference0 = RefList()
         self.blockOutputReference0 = [] if blockOutputReference0 is None else blockOutputReference0
 
-        self._MetaBlockStateReference = []
+        self._MetaBlockStateReference = RefList()
         self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
 
-        self._MetaBlockInputReference = []
+        self._MetaBlockInputReference = RefList()
         self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
 
-        self._MetaBlockOutputReference = []
+        self._MetaBlockOutputReference = RefList()
         self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
 
-        self._BlockParameter = []
+        self._BlockParameter = RefList()
         self.BlockParameter = [] if BlockParameter is None else BlockParameter
 
-        self._MetaBlockParameterReference = []
+        self._MetaBlockParameterReference = RefList()
         self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
 
         super(MetaBlockReference, self).__init__(*args, **kw_args)
@@ -82,20 +83,32 @@ class MetaBlockReference(IdentifiedObject):
 
     def setblockInputReference0(self, value):
         for x in self._blockInputReference0:
-            x.metaBlockReference0 = None
-        for y in value:
-            y._metaBlockReference0 = self
-        self._blockInputReference0 = value
+            x._metaBlockReference0 = None
+        self._blockInputReference0 = RefList()
+        self.addblockInputReference0(value)
 
     blockInputReference0 = property(getblockInputReference0, setblockInputReference0)
 
     def addblockInputReference0(self, *blockInputReference0):
-        for obj in blockInputReference0:
-            obj.metaBlockReference0 = self
+        collection = self._blockInputReference0
+        for obj in members(blockInputReference0):
+            old = obj._metaBlockReference0
+            if old is not None and old is not self:
+                old._blockInputReference0.discard(obj)
+            obj._metaBlockReference0 = self
+            collection.append(obj)
 
     def removeblockInputReference0(self, *blockInputReference0):
-        for obj in blockInputReference0:
-            obj.metaBlockReference0 = None
+        collection = self._blockInputReference0
+        for obj in members(blockInputReference0):
+            if obj._metaBlockReference0 is self:
+                obj._metaBlockReference0 = None
+                collection.discard(obj)
+
+    def removeAllblockInputReference0(self):
+        for obj in self._blockInputReference0:
+            obj._metaBlockReference0 = None
+        self._blockInputReference0 = RefList()
 
     def getMemberOf_MetaBlock(self):
         
@@ -103,8 +116,7 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockReference if x != self]
-            self._MemberOf_MetaBlock._MetaBlockReference = filtered
+            self._MemberOf_MetaBlock._MetaBlockReference.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -121,26 +133,28 @@ class MetaBlockReference(IdentifiedObject):
 
     def setblockOutputReference0(self, value):
         for p in self._blockOutputReference0:
-            filtered = [q for q in p.metaBlockReference0 if q != self]
-            self._blockOutputReference0._metaBlockReference0 = filtered
-        for r in value:
-            if self not in r._metaBlockReference0:
-                r._metaBlockReference0.append(self)
-        self._blockOutputReference0 = value
+            p._metaBlockReference0.discard(self)
+        self._blockOutputReference0 = RefList()
+        self.addblockOutputReference0(value)
 
     blockOutputReference0 = property(getblockOutputReference0, setblockOutputReference0)
 
     def addblockOutputReference0(self, *blockOutputReference0):
-        for obj in blockOutputReference0:
-            if self not in obj._metaBlockReference0:
-                obj._metaBlockReference0.append(self)
-            self._blockOutputReference0.append(obj)
+        collection = self._blockOutputReference0
+        for obj in members(blockOutputReference0):
+            obj._metaBlockReference0.append(self)
+            collection.append(obj)
 
     def removeblockOutputReference0(self, *blockOutputReference0):
-        for obj in blockOutputReference0:
-            if self in obj._metaBlockReference0:
-                obj._metaBlockReference0.remove(self)
-            self._blockOutputReference0.remove(obj)
+        collection = self._blockOutputReference0
+        for obj in members(blockOutputReference0):
+            obj._metaBlockReference0.discard(self)
+            collection.discard(obj)
+
+    def removeAllblockOutputReference0(self):
+        for obj in self._blockOutputReference0:
+            obj._metaBlockReference0.discard(self)
+        self._blockOutputReference0 = RefList()
 
     def getMetaBlockStateReference(self):
         
@@ -148,20 +162,32 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMetaBlockStateReference(self, value):
         for x in self._MetaBlockStateReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockStateReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockStateReference = RefList()
+        self.addMetaBlockStateReference(value)
 
     MetaBlockStateReference = property(getMetaBlockStateReference, setMetaBlockStateReference)
 
     def addMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockStateReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockStateReference(self, *MetaBlockStateReference):
-        for obj in MetaBlockStateReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockStateReference
+        for obj in members(MetaBlockStateReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockStateReference(self):
+        for obj in self._MetaBlockStateReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockStateReference = RefList()
 
     def getMetaBlockInputReference(self):
         
@@ -169,20 +195,32 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMetaBlockInputReference(self, value):
         for x in self._MetaBlockInputReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockInputReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockInputReference = RefList()
+        self.addMetaBlockInputReference(value)
 
     MetaBlockInputReference = property(getMetaBlockInputReference, setMetaBlockInputReference)
 
     def addMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockInputReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockInputReference(self, *MetaBlockInputReference):
-        for obj in MetaBlockInputReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockInputReference
+        for obj in members(MetaBlockInputReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockInputReference(self):
+        for obj in self._MetaBlockInputReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockInputReference = RefList()
 
     def getMetaBlockOutputReference(self):
         
@@ -190,20 +228,32 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMetaBlockOutputReference(self, value):
         for x in self._MetaBlockOutputReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockOutputReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockOutputReference = RefList()
+        self.addMetaBlockOutputReference(value)
 
     MetaBlockOutputReference = property(getMetaBlockOutputReference, setMetaBlockOutputReference)
 
     def addMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockOutputReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockOutputReference(self, *MetaBlockOutputReference):
-        for obj in MetaBlockOutputReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockOutputReference
+        for obj in members(MetaBlockOutputReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockOutputReference(self):
+        for obj in self._MetaBlockOutputReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockOutputReference = RefList()
 
     def getBlockParameter(self):
         
@@ -211,20 +261,32 @@ class MetaBlockReference(IdentifiedObject):
 
     def setBlockParameter(self, value):
         for x in self._BlockParameter:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._BlockParameter = value
+            x._MemberOf_MetaBlockReference = None
+        self._BlockParameter = RefList()
+        self.addBlockParameter(value)
 
     BlockParameter = property(getBlockParameter, setBlockParameter)
 
     def addBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._BlockParameter.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeBlockParameter(self, *BlockParameter):
-        for obj in BlockParameter:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._BlockParameter
+        for obj in members(BlockParameter):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllBlockParameter(self):
+        for obj in self._BlockParameter:
+            obj._MemberOf_MetaBlockReference = None
+        self._BlockParameter = RefList()
 
     def getMetaBlockParameterReference(self):
         
@@ -232,18 +294,30 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMetaBlockParameterReference(self, value):
         for x in self._MetaBlockParameterReference:
-            x.MemberOf_MetaBlockReference = None
-        for y in value:
-            y._MemberOf_MetaBlockReference = self
-        self._MetaBlockParameterReference = value
+            x._MemberOf_MetaBlockReference = None
+        self._MetaBlockParameterReference = RefList()
+        self.addMetaBlockParameterReference(value)
 
     MetaBlockParameterReference = property(getMetaBlockParameterReference, setMetaBlockParameterReference)
 
     def addMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MemberOf_MetaBlockReference = self
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            old = obj._MemberOf_MetaBlockReference
+            if old is not None and old is not self:
+                old._MetaBlockParameterReference.discard(obj)
+            obj._MemberOf_MetaBlockReference = self
+            collection.append(obj)
 
     def removeMetaBlockParameterReference(self, *MetaBlockParameterReference):
-        for obj in MetaBlockParameterReference:
-            obj.MemberOf_MetaBlockReference = None
+        collection = self._MetaBlockParameterReference
+        for obj in members(MetaBlockParameterReference):
+            if obj._MemberOf_MetaBlockReference is self:
+                obj._MemberOf_MetaBlockReference = None
+                collection.discard(obj)
+
+    def removeAllMetaBlockParameterReference(self):
+        for obj in self._MetaBlockParameterReference:
+            obj._MemberOf_MetaBlockReference = None
+        self._MetaBlockParameterReference = RefList()
 
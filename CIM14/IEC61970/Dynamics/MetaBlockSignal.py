@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MetaBlockSignal(IdentifiedObject):
 
@@ -31,10 +32,10 @@ class MetaBlockSignal(IdentifiedObject):
         @param From:
         @param To:
         """
-        self._metaBlockSignal1 = []
+        self._metaBlockSignal1 = RefList()
         self.metaBlockSignal1 = [] if metaBlockSignal1 is None else metaBlockSignal1
 
-        self._metaBlockSignal = []
+        self._metaBlockSignal = RefList()
         self.metaBlockSignal = [] if metaBlockSignal is None else metaBlockSignal
 
         self._MemberOf_MetaBlock = None
@@ -61,26 +62,28 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setmetaBlockSignal1(self, value):
         for p in self._metaBlockSignal1:
-            filtered = [q for q in p.metaBlockSignal if q != self]
-            self._metaBlockSignal1._metaBlockSignal = filtered
-        for r in value:
-            if self not in r._metaBlockSignal:
-                r._metaBlockSignal.append(self)
-        self._metaBlockSignal1 = value
+            p._metaBlockSignal.discard(self)
+        self._metaBlockSignal1 = RefList()
+        self.addmetaBlockSignal1(value)
 
     metaBlockSignal1 = property(getmetaBlockSignal1, setmetaBlockSignal1)
 
     def addmetaBlockSignal1(self, *metaBlockSignal1):
-        for obj in metaBlockSignal1:
-            if self not in obj._metaBlockSignal:
-                obj._metaBlockSignal.append(self)
-            self._metaBlockSignal1.append(obj)
+        collection = self._metaBlockSignal1
+        for obj in members(metaBlockSignal1):
+            obj._metaBlockSignal.append(self)
+            collection.append(obj)
 
     def removemetaBlockSignal1(self, *metaBlockSignal1):
-        for obj in metaBlockSignal1:
-            if self in obj._metaBlockSignal:
-                obj._metaBlockSignal.remove(self)
-            self._metaBlockSignal1.remove(obj)
+        collection = self._metaBlockSignal1
+        for obj in members(metaBlockSignal1):
+            obj._metaBlockSignal.discard(self)
+            collection.discard(obj)
+
+    def removeAllmetaBlockSignal1(self):
+        for obj in self._metaBlockSignal1:
+            obj._metaBlockSignal.discard(self)
+        self._metaBlockSignal1 = RefList()
 
     def getmetaBlockSignal(self):
         
@@ -88,26 +91,28 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setmetaBlockSignal(self, value):
         for p in self._metaBlockSignal:
-            filtered = [q for q in p.metaBlockSignal1 if q != self]
-            self._metaBlockSignal._metaBlockSignal1 = filtered
-        for r in value:
-            if self not in r._metaBlockSignal1:
-                r._metaBlockSignal1.append(self)
-        self._metaBlockSignal = value
+            p._metaBlockSignal1.discard(self)
+        self._metaBlockSignal = RefList()
+        self.addmetaBlockSignal(value)
 
     metaBlockSignal = property(getmetaBlockSignal, setmetaBlockSignal)
 
     def addmetaBlockSignal(self, *metaBlockSignal):
-        for obj in metaBlockSignal:
-            if self not in obj._metaBlockSignal1:
-                obj._metaBlockSignal1.append(self)
-            self._metaBlockSignal.append(obj)
+        collection = self._metaBlockSignal
+        for obj in members(metaBlockSignal):
+            obj._metaBlockSignal1.append(self)
+            collection.append(obj)
 
     def removemetaBlockSignal(self, *metaBlockSignal):
-        for obj in metaBlockSignal:
-            if self in obj._metaBlockSignal1:
-                obj._metaBlockSignal1.remove(self)
-            self._metaBlockSignal.remove(obj)
+        collection = self._metaBlockSignal
+        for obj in members(metaBlockSignal):
+            obj._metaBlockSignal1.discard(self)
+            collection.discard(obj)
+
+    def removeAllmetaBlockSignal(self):
+        for obj in self._metaBlockSignal:
+            obj._metaBlockSignal1.discard(self)
+        self._metaBlockSignal = RefList()
 
     def getMemberOf_MetaBlock(self):
         
@@ -115,8 +120,7 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockSignal if x != self]
-            self._MemberOf_MetaBlock._MetaBlockSignal = filtered
+            self._MemberOf_MetaBlock._MetaBlockSignal.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -146,8 +150,7 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setTo(self, value):
         if self._To is not None:
-            filtered = [x for x in self.To.MetaBlockSignal if x != self]
-            self._To._MetaBlockSignal = filtered
+            self._To._MetaBlockSignal.discard(self)
 
         self._To = value
         if self._To is not None:
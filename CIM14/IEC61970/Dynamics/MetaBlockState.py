@@ -45,8 +45,7 @@ class MetaBlockState(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockState if x != self]
-            self._MemberOf_MetaBlock._MetaBlockState = filtered
+            self._MemberOf_MetaBlock._MetaBlockState.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class MechanicalLoad(PowerSystemResource):
     """A mechanical load represents the variation in a motor's shaft torque or power as a function of shaft speed.
@@ -29,7 +30,7 @@ class MechanicalLoad(PowerSystemResource):
 
         @param rotatingMachine0:
         """
-        self._rotatingMachine0 = []
+        self._rotatingMachine0 = RefList()
         self.rotatingMachine0 = [] if rotatingMachine0 is None else rotatingMachine0
 
         super(MechanicalLoad, self).__init__(*args, **kw_args)
@@ -47,24 +48,26 @@ class MechanicalLoad(PowerSystemResource):
 
     def setrotatingMachine0(self, value):
         for p in self._rotatingMachine0:
-            filtered = [q for q in p.mechanicalLoad0 if q != self]
-            self._rotatingMachine0._mechanicalLoad0 = filtered
-        for r in value:
-            if self not in r._mechanicalLoad0:
-                r._mechanicalLoad0.append(self)
-        self._rotatingMachine0 = value
+            p._mechanicalLoad0.discard(self)
+        self._rotatingMachine0 = RefList()
+        self.addrotatingMachine0(value)
 
     rotatingMachine0 = property(getrotatingMachine0, setrotatingMachine0)
 
     def addrotatingMachine0(self, *rotatingMachine0):
-        for obj in rotatingMachine0:
-            if self not in obj._mechanicalLoad0:
-                obj._mechanicalLoad0.append(self)
-            self._rotatingMachine0.append(obj)
+        collection = self._rotatingMachine0
+        for obj in members(rotatingMachine0):
+            obj._mechanicalLoad0.append(self)
+            collection.append(obj)
 
     def removerotatingMachine0(self, *rotatingMachine0):
-        for obj in rotatingMachine0:
-            if self in obj._mechanicalLoad0:
-                obj._mechanicalLoad0.remove(self)
-            self._rotatingMachine0.remove(obj)
+        collection = self._rotatingMachine0
+        for obj in members(rotatingMachine0):
+            obj._mechanicalLoad0.discard(self)
+            collection.discard(obj)
+
+    def removeAllrotatingMachine0(self):
+        for obj in self._rotatingMachine0:
+            obj._mechanicalLoad0.discard(self)
+        self._rotatingMachine0 = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from PyCIM.RefList import RefList, members
 
 class RotatingMachine(RegulatingCondEq):
     """A rotating machine which may be used as a generator or motor.
@@ -61,7 +62,7 @@ class RotatingMachine(RegulatingCondEq):
         #: Stator leakage reactance (&gt; 0.)
         self.xls = xls
 
-        self._mechanicalLoad0 = []
+        self._mechanicalLoad0 = RefList()
         self.mechanicalLoad0 = [] if mechanicalLoad0 is None else mechanicalLoad0
 
         super(RotatingMachine, self).__init__(*args, **kw_args)
@@ -79,24 +80,26 @@ class RotatingMachine(RegulatingCondEq):
 
     def setmechanicalLoad0(self, value):
         for p in self._mechanicalLoad0:
-            filtered = [q for q in p.rotatingMachine0 if q != self]
-            self._mechanicalLoad0._rotatingMachine0 = filtered
-        for r in value:
-            if self not in r._rotatingMachine0:
-                r._rotatingMachine0.append(self)
-        self._mechanicalLoad0 = value
+            p._rotatingMachine0.discard(self)
+        self._mechanicalLoad0 = RefList()
+        self.addmechanicalLoad0(value)
 
     mechanicalLoad0 = property(getmechanicalLoad0, setmechanicalLoad0)
 
     def addmechanicalLoad0(self, *mechanicalLoad0):
-        for obj in mechanicalLoad0:
-            if self not in obj._rotatingMachine0:
-                obj._rotatingMachine0.append(self)
-            self._mechanicalLoad0.append(obj)
+        collection = self._mechanicalLoad0
+        for obj in members(mechanicalLoad0):
+            obj._rotatingMachine0.append(self)
+            collection.append(obj)
 
     def removemechanicalLoad0(self, *mechanicalLoad0):
-        for obj in mechanicalLoad0:
-            if self in obj._rotatingMachine0:
-                obj._rotatingMachine0.remove(self)
-            self._mechanicalLoad0.remove(obj)
+        collection = self._mechanicalLoad0
+        for obj in members(mechanicalLoad0):
+            obj._rotatingMachine0.discard(self)
+            collection.discard(obj)
+
+    def removeAllmechanicalLoad0(self):
+        for obj in self._mechanicalLoad0:
+            obj._rotatingMachine0.discard(self)
+        self._mechanicalLoad0 = RefList()
 
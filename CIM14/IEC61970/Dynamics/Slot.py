@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Slot(IdentifiedObject):
 
@@ -34,16 +35,16 @@ class Slot(IdentifiedObject):
         self._blockType0 = None
         self.blockType0 = blockType0
 
-        self._slotReference0 = []
+        self._slotReference0 = RefList()
         self.slotReference0 = [] if slotReference0 is None else slotReference0
 
-        self._slotOutput0 = []
+        self._slotOutput0 = RefList()
         self.slotOutput0 = [] if slotOutput0 is None else slotOutput0
 
         self._connectionFrame0 = None
         self.connectionFrame0 = connectionFrame0
 
-        self._slotInput0 = []
+        self._slotInput0 = RefList()
         self.slotInput0 = [] if slotInput0 is None else slotInput0
 
         super(Slot, self).__init__(*args, **kw_args)
@@ -61,8 +62,7 @@ class Slot(IdentifiedObject):
 
     def setblockType0(self, value):
         if self._blockType0 is not None:
-            filtered = [x for x in self.blockType0.slot0 if x != self]
-            self._blockType0._slot0 = filtered
+            self._blockType0._slot0.discard(self)
 
         self._blockType0 = value
         if self._blockType0 is not None:
@@ -77,20 +77,32 @@ class Slot(IdentifiedObject):
 
     def setslotReference0(self, value):
         for x in self._slotReference0:
-            x.slot0 = None
-        for y in value:
-            y._slot0 = self
-        self._slotReference0 = value
+            x._slot0 = None
+        self._slotReference0 = RefList()
+        self.addslotReference0(value)
 
     slotReference0 = property(getslotReference0, setslotReference0)
 
     def addslotReference0(self, *slotReference0):
-        for obj in slotReference0:
-            obj.slot0 = self
+        collection = self._slotReference0
+        for obj in members(slotReference0):
+            old = obj._slot0
+            if old is not None and old is not self:
+                old._slotReference0.discard(obj)
+            obj._slot0 = self
+            collection.append(obj)
 
     def removeslotReference0(self, *slotReference0):
-        for obj in slotReference0:
-            obj.slot0 = None
+        collection = self._slotReference0
+        for obj in members(slotReference0):
+            if obj._slot0 is self:
+                obj._slot0 = None
+                collection.discard(obj)
+
+    def removeAllslotReference0(self):
+        for obj in self._slotReference0:
+            obj._slot0 = None
+        self._slotReference0 = RefList()
 
     def getslotOutput0(self):
         
@@ -98,20 +110,32 @@ class Slot(IdentifiedObject):
 
     def setslotOutput0(self, value):
         for x in self._slotOutput0:
-            x.slot0 = None
-        for y in value:
-            y._slot0 = self
-        self._slotOutput0 = value
+            x._slot0 = None
+        self._slotOutput0 = RefList()
+        self.addslotOutput0(value)
 
     slotOutput0 = property(getslotOutput0, setslotOutput0)
 
     def addslotOutput0(self, *slotOutput0):
-        for obj in slotOutput0:
-            obj.slot0 = self
+        collection = self._slotOutput0
+        for obj in members(slotOutput0):
+            old = obj._slot0
+            if old is not None and old is not self:
+                old._slotOutput0.discard(obj)
+            obj._slot0 = self
+            collection.append(obj)
 
     def removeslotOutput0(self, *slotOutput0):
-        for obj in slotOutput0:
-            obj.slot0 = None
+        collection = self._slotOutput0
+        for obj in members(slotOutput0):
+            if obj._slot0 is self:
+                obj._slot0 = None
+                collection.discard(obj)
+
+    def removeAllslotOutput0(self):
+        for obj in self._slotOutput0:
+            obj._slot0 = None
+        self._slotOutput0 = RefList()
 
     def getconnectionFrame0(self):
         
@@ -119,8 +143,7 @@ class Slot(IdentifiedObject):
 
     def setconnectionFrame0(self, value):
         if self._connectionFrame0 is not None:
-            filtered = [x for x in self.connectionFrame0.slot0 if x != self]
-            self._connectionFrame0._slot0 = filtered
+            self._connectionFrame0._slot0.discard(self)
 
         self._connectionFrame0 = value
         if self._connectionFrame0 is not None:
@@ -135,18 +158,30 @@ class Slot(IdentifiedObject):
 
     def setslotInput0(self, value):
         for x in self._slotInput0:
-            x.slot0 = None
-        for y in value:
-            y._slot0 = self
-        self._slotInput0 = value
+            x._slot0 = None
+        self._slotInput0 = RefList()
+        self.addslotInput0(value)
 
     slotInput0 = property(getslotInput0, setslotInput0)
 
     def addslotInput0(self, *slotInput0):
-        for obj in slotInput0:
-            obj.slot0 = self
+        collection = self._slotInput0
+        for obj in members(slotInput0):
+            old = obj._slot0
+            if old is not None and old is not self:
+                old._slotInput0.discard(obj)
+            obj._slot0 = self
+            collection.append(obj)
 
     def removeslotInput0(self, *slotInput0):
-        for obj in slotInput0:
-            obj.slot0 = None
+        collection = self._slotInput0
+        for obj in members(slotInput0):
+            if obj._slot0 is self:
+                obj._slot0 = None
+                collection.discard(obj)
+
+    def removeAllslotInput0(self):
+        for obj in self._slotInput0:
+            obj._slot0 = None
+        self._slotInput0 = RefList()
 
@@ -55,8 +55,7 @@ class SlotConnection(IdentifiedObject):
 
     def setconnectionFrame0(self, value):
         if self._connectionFrame0 is not None:
-            filtered = [x for x in self.connectionFrame0.slotConnection0 if x != self]
-            self._connectionFrame0._slotConnection0 = filtered
+            self._connectionFrame0._slotConnection0.discard(self)
 
         self._connectionFrame0 = value
         if self._connectionFrame0 is not None:
@@ -86,8 +85,7 @@ class SlotConnection(IdentifiedObject):
 
     def setslotOutput0(self, value):
         if self._slotOutput0 is not None:
-            filtered = [x for x in self.slotOutput0.slotConnection0 if x != self]
-            self._slotOutput0._slotConnection0 = filtered
+            self._slotOutput0._slotConnection0.discard(self)
 
         self._slotOutput0 = value
         if self._slotOutput0 is not None:
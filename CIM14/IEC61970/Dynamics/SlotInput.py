@@ -53,8 +53,7 @@ class SlotInput(IdentifiedObject):
 
     def setblockInputType0(self, value):
         if self._blockInputType0 is not None:
-            filtered = [x for x in self.blockInputType0.slotInput0 if x != self]
-            self._blockInputType0._slotInput0 = filtered
+            self._blockInputType0._slotInput0.discard(self)
 
         self._blockInputType0 = value
         if self._blockInputType0 is not None:
@@ -84,8 +83,7 @@ class SlotInput(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotInput0 if x != self]
-            self._slot0._slotInput0 = filtered
+            self._slot0._slotInput0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
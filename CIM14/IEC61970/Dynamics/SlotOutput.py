@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class SlotOutput(IdentifiedObject):
 
@@ -32,7 +33,7 @@ class SlotOutput(IdentifiedObject):
         self._slot0 = None
         self.slot0 = slot0
 
-        self._slotConnection0 = []
+        self._slotConnection0 = RefList()
         self.slotConnection0 = [] if slotConnection0 is None else slotConnection0
 
         self._blockOutputType0 = None
@@ -53,8 +54,7 @@ class SlotOutput(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotOutput0 if x != self]
-            self._slot0._slotOutput0 = filtered
+            self._slot0._slotOutput0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
@@ -69,20 +69,32 @@ class SlotOutput(IdentifiedObject):
 
     def setslotConnection0(self, value):
         for x in self._slotConnection0:
-            x.slotOutput0 = None
-        for y in value:
-            y._slotOutput0 = self
-        self._slotConnection0 = value
+            x._slotOutput0 = None
+        self._slotConnection0 = RefList()
+        self.addslotConnection0(value)
 
     slotConnection0 = property(getslotConnection0, setslotConnection0)
 
     def addslotConnection0(self, *slotConnection0):
-        for obj in slotConnection0:
-            obj.slotOutput0 = self
+        collection = self._slotConnection0
+        for obj in members(slotConnection0):
+            old = obj._slotOutput0
+            if old is not None and old is not self:
+                old._slotConnection0.discard(obj)
+            obj._slotOutput0 = self
+            collection.append(obj)
 
     def removeslotConnection0(self, *slotConnection0):
-        for obj in slotConnection0:
-            obj.slotOutput0 = None
+        collection = self._slotConnection0
+        for obj in members(slotConnection0):
+            if obj._slotOutput0 is self:
+                obj._slotOutput0 = None
+                collection.discard(obj)
+
+    def removeAllslotConnection0(self):
+        for obj in self._slotConnection0:
+            obj._slotOutput0 = None
+        self._slotConnection0 = RefList()
 
     def getblockOutputType0(self):
         
@@ -90,8 +102,7 @@ class SlotOutput(IdentifiedObject):
 
     def setblockOutputType0(self, value):
         if self._blockOutputType0 is not None:
-            filtered = [x for x in self.blockOutputType0.slotOutput0 if x != self]
-            self._blockOutputType0._slotOutput0 = filtered
+            self._blockOutputType0._slotOutput0.discard(self)
 
         self._blockOutputType0 = value
         if self._blockOutputType0 is not None:
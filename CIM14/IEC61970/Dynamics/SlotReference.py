@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class SlotReference(IdentifiedObject):
     """The specific role the block usage is playing in a connection frame. This allows connections to be established at the meta dynamics level and not at the instance level.
@@ -34,10 +35,10 @@ class SlotReference(IdentifiedObject):
         self._slot0 = None
         self.slot0 = slot0
 
-        self._block0 = []
+        self._block0 = RefList()
         self.block0 = [] if block0 is None else block0
 
-        self._compositeModel0 = []
+        self._compositeModel0 = RefList()
         self.compositeModel0 = [] if compositeModel0 is None else compositeModel0
 
         super(SlotReference, self).__init__(*args, **kw_args)
@@ -55,8 +56,7 @@ class SlotReference(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotReference0 if x != self]
-            self._slot0._slotReference0 = filtered
+            self._slot0._slotReference0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
@@ -71,20 +71,32 @@ class SlotReference(IdentifiedObject):
 
     def setblock0(self, value):
         for x in self._block0:
-            x.slotReference0 = None
-        for y in value:
-            y._slotReference0 = self
-        self._block0 = value
+            x._slotReference0 = None
+        self._block0 = RefList()
+        self.addblock0(value)
 
     block0 = property(getblock0, setblock0)
 
     def addblock0(self, *block0):
-        for obj in block0:
-            obj.slotReference0 = self
+        collection = self._block0
+        for obj in members(block0):
+            old = obj._slotReference0
+            if old is not None and old is not self:
+                old._block0.discard(obj)
+            obj._slotReference0 = self
+            collection.append(obj)
 
     def removeblock0(self, *block0):
-        for obj in block0:
-            obj.slotReference0 = None
+        collection = self._block0
+        for obj in members(block0):
+            if obj._slotReference0 is self:
+                obj._slotReference0 = None
+                collection.discard(obj)
+
+    def removeAllblock0(self):
+        for obj in self._block0:
+            obj._slotReference0 = None
+        self._block0 = RefList()
 
     def getcompositeModel0(self):
         
@@ -92,24 +104,26 @@ class SlotReference(IdentifiedObject):
 
     def setcompositeModel0(self, value):
         for p in self._compositeModel0:
-            filtered = [q for q in p.slotReference0 if q != self]
-            self._compositeModel0._slotReference0 = filtered
-        for r in value:
-            if self not in r._slotReference0:
-                r._slotReference0.append(self)
-        self._compositeModel0 = value
+            p._slotReference0.discard(self)
+        self._compositeModel0 = RefList()
+        self.addcompositeModel0(value)
 
     compositeModel0 = property(getcompositeModel0, setcompositeModel0)
 
     def addcompositeModel0(self, *compositeModel0):
-        for obj in compositeModel0:
-            if self not in obj._slotReference0:
-                obj._slotReference0.append(self)
-            self._compositeModel0.append(obj)
+        collection = self._compositeModel0
+        for obj in members(compositeModel0):
+            obj._slotReference0.append(self)
+            collection.append(obj)
 
     def removecompositeModel0(self, *compositeModel0):
-        for obj in compositeModel0:
-            if self in obj._slotReference0:
-                obj._slotReference0.remove(self)
-            self._compositeModel0.remove(obj)
+        collection = self._compositeModel0
+        for obj in members(compositeModel0):
+            obj._slotReference0.discard(self)
+            collection.discard(obj)
+
+    def removeAllcompositeModel0(self):
+        for obj in self._compositeModel0:
+            obj._slotReference0.discard(self)
+        self._compositeModel0 = RefList()
 
@@ -55,8 +55,7 @@ class TieToMeasurement(IdentifiedObject):
 
     def setmeasurement0(self, value):
         if self._measurement0 is not None:
-            filtered = [x for x in self.measurement0.tieToMeasurement0 if x != self]
-            self._measurement0._tieToMeasurement0 = filtered
+            self._measurement0._tieToMeasurement0.discard(self)
 
         self._measurement0 = value
         if self._measurement0 is not None:
@@ -71,8 +70,7 @@ class TieToMeasurement(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.tieToMeasurement0 if x != self]
-            self._block0._tieToMeasurement0 = filtered
+            self._block0._tieToMeasurement0.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
@@ -88,8 +86,7 @@ class TieToMeasurement(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.tieToMeasurement0 if x != self]
-            self._metaBlockInput0._tieToMeasurement0 = filtered
+            self._metaBlockInput0._tieToMeasurement0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
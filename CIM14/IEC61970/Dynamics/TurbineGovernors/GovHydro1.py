@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.TurbineGovernors.TurbineGovernor import TurbineGovernor
+from PyCIM.RefList import RefList, members
 
 class GovHydro1(TurbineGovernor):
     """Hydro turbine-governor model.
@@ -85,7 +86,7 @@ class GovHydro1(TurbineGovernor):
         self._HydroTurbine = None
         self.HydroTurbine = HydroTurbine
 
-        self._synchronousMachine0 = []
+        self._synchronousMachine0 = RefList()
         self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
 
         super(GovHydro1, self).__init__(*args, **kw_args)
@@ -118,24 +119,26 @@ class GovHydro1(TurbineGovernor):
 
     def setsynchronousMachine0(self, value):
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.govHydro10 if q != self]
-            self._synchronousMachine0._govHydro10 = filtered
-        for r in value:
-            if self not in r._govHydro10:
-                r._govHydro10.append(self)
-        self._synchronousMachine0 = value
+            p._govHydro10.discard(self)
+        self._synchronousMachine0 = RefList()
+        self.addsynchronousMachine0(value)
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
-        for obj in synchronousMachine0:
-            if self not in obj._govHydro10:
-                obj._govHydro10.append(self)
-            self._synchronousMachine0.append(obj)
+        collection = self._synchronousMachine0
+        for obj in members(synchronousMachine0):
+            obj._govHydro10.append(self)
+            collection.append(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
-        for obj in synchronousMachine0:
-            if self in obj._govHydro10:
-                obj._govHydro10.remove(self)
-            self._synchronousMachine0.remove(obj)
+        collection = self._synchronousMachine0
+        for obj in members(synchronousMachine0):
+            obj._govHydro10.discard(self)
+            collection.discard(obj)
+
+    def removeAllsynchronousMachine0(self):
+        for obj in self._synchronousMachine0:
+            obj._govHydro10.discard(self)
+        self._synchronousMachine0 = RefList()
 
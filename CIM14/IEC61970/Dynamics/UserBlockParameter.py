@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockParameter import MetaBlockParameter
+from PyCIM.RefList import RefList, members
 
 class UserBlockParameter(MetaBlockParameter):
     """Concrete class intended to obtain a parameter value from a user of the block  in the parameter list at the instance level.
@@ -29,7 +30,7 @@ class UserBlockParameter(MetaBlockParameter):
 
         @param BlockUsageParameter:
         """
-        self._BlockUsageParameter = []
+        self._BlockUsageParameter = RefList()
         self.BlockUsageParameter = [] if BlockUsageParameter is None else BlockUsageParameter
 
         super(UserBlockParameter, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class UserBlockParameter(MetaBlockParameter):
 
     def setBlockUsageParameter(self, value):
         for x in self._BlockUsageParameter:
-            x.UserBlockParameter = None
-        for y in value:
-            y._UserBlockParameter = self
-        self._BlockUsageParameter = value
+            x._UserBlockParameter = None
+        self._BlockUsageParameter = RefList()
+        self.addBlockUsageParameter(value)
 
     BlockUsageParameter = property(getBlockUsageParameter, setBlockUsageParameter)
 
     def addBlockUsageParameter(self, *BlockUsageParameter):
-        for obj in BlockUsageParameter:
-            obj.UserBlockParameter = self
+        collection = self._BlockUsageParameter
+        for obj in members(BlockUsageParameter):
+            old = obj._UserBlockParameter
+            if old is not None and old is not self:
+                old._BlockUsageParameter.discard(obj)
+            obj._UserBlockParameter = self
+            collection.append(obj)
 
     def removeBlockUsageParameter(self, *BlockUsageParameter):
-        for obj in BlockUsageParameter:
-            obj.UserBlockParameter = None
+        collection = self._BlockUsageParameter
+        for obj in members(BlockUsageParameter):
+            if obj._UserBlockParameter is self:
+                obj._UserBlockParameter = None
+                collection.discard(obj)
+
+    def removeAllBlockUsageParameter(self):
+        for obj in self._BlockUsageParameter:
+            obj._UserBlockParameter = None
+        self._BlockUsageParameter = RefList()
 
@@ -48,8 +48,7 @@ class EquivalentEquipment(ConductingEquipment):
 
     def setEquivalentNetwork(self, value):
         if self._EquivalentNetwork is not None:
-            filtered = [x for x in self.EquivalentNetwork.EquivalentEquipments if x != self]
-            self._EquivalentNetwork._EquivalentEquipments = filtered
+            self._EquivalentNetwork._EquivalentEquipments.discard(self)
 
         self._EquivalentNetwork = value
         if self._EquivalentNetwork is not None:
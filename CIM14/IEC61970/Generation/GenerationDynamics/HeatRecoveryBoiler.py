@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.GenerationDynamics.FossilSteamSupply import FossilSteamSupply
+from PyCIM.RefList import RefList, members
 
 class HeatRecoveryBoiler(FossilSteamSupply):
     """The heat recovery system associated with combustion turbines in order to produce steam for combined cycle plants
@@ -33,7 +34,7 @@ class HeatRecoveryBoiler(FossilSteamSupply):
         #: The steam supply rating in kilopounds per hour, if dual pressure boiler
         self.steamSupplyRating2 = steamSupplyRating2
 
-        self._CombustionTurbines = []
+        self._CombustionTurbines = RefList()
         self.CombustionTurbines = [] if CombustionTurbines is None else CombustionTurbines
 
         super(HeatRecoveryBoiler, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class HeatRecoveryBoiler(FossilSteamSupply):
 
     def setCombustionTurbines(self, value):
         for x in self._CombustionTurbines:
-            x.HeatRecoveryBoiler = None
-        for y in value:
-            y._HeatRecoveryBoiler = self
-        self._CombustionTurbines = value
+            x._HeatRecoveryBoiler = None
+        self._CombustionTurbines = RefList()
+        self.addCombustionTurbines(value)
 
     CombustionTurbines = property(getCombustionTurbines, setCombustionTurbines)
 
     def addCombustionTurbines(self, *CombustionTurbines):
-        for obj in CombustionTurbines:
-            obj.HeatRecoveryBoiler = self
+        collection = self._CombustionTurbines
+        for obj in members(CombustionTurbines):
+            old = obj._HeatRecoveryBoiler
+            if old is not None and old is not self:
+                old._CombustionTurbines.discard(obj)
+            obj._HeatRecoveryBoiler = self
+            collection.append(obj)
 
     def removeCombustionTurbines(self, *CombustionTurbines):
-        for obj in CombustionTurbines:
-            obj.HeatRecoveryBoiler = None
+        collection = self._CombustionTurbines
+        for obj in members(CombustionTurbines):
+            if obj._HeatRecoveryBoiler is self:
+                obj._HeatRecoveryBoiler = None
+                collection.discard(obj)
+
+    def removeAllCombustionTurbines(self):
+        for obj in self._CombustionTurbines:
+            obj._HeatRecoveryBoiler = None
+        self._CombustionTurbines = RefList()
 
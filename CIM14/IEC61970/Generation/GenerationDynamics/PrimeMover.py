@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class PrimeMover(PowerSystemResource):
     """The machine used to develop mechanical energy used to drive a generator.
@@ -33,7 +34,7 @@ class PrimeMover(PowerSystemResource):
         #: Rating of prime mover
         self.primeMoverRating = primeMoverRating
 
-        self._SynchronousMachines = []
+        self._SynchronousMachines = RefList()
         self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
 
         super(PrimeMover, self).__init__(*args, **kw_args)
@@ -52,24 +53,26 @@ class PrimeMover(PowerSystemResource):
 
     def setSynchronousMachines(self, value):
         for p in self._SynchronousMachines:
-            filtered = [q for q in p.PrimeMovers if q != self]
-            self._SynchronousMachines._PrimeMovers = filtered
-        for r in value:
-            if self not in r._PrimeMovers:
-                r._PrimeMovers.append(self)
-        self._SynchronousMachines = value
+            p._PrimeMovers.discard(self)
+        self._SynchronousMachines = RefList()
+        self.addSynchronousMachines(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            if self not in obj._PrimeMovers:
-                obj._PrimeMovers.append(self)
-            self._SynchronousMachines.append(obj)
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            obj._PrimeMovers.append(self)
+            collection.append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            if self in obj._PrimeMovers:
-                obj._PrimeMovers.remove(self)
-            self._SynchronousMachines.remove(obj)
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            obj._PrimeMovers.discard(self)
+            collection.discard(obj)
+
+    def removeAllSynchronousMachines(self):
+        for obj in self._SynchronousMachines:
+            obj._PrimeMovers.discard(self)
+        self._SynchronousMachines = RefList()
 
@@ -56,8 +56,7 @@ class EmissionAccount(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.EmmissionAccounts if x != self]
-            self._ThermalGeneratingUnit._EmmissionAccounts = filtered
+            self._ThermalGeneratingUnit._EmmissionAccounts.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
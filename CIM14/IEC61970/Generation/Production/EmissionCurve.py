@@ -60,8 +60,7 @@ class EmissionCurve(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.EmissionCurves if x != self]
-            self._ThermalGeneratingUnit._EmissionCurves = filtered
+            self._ThermalGeneratingUnit._EmissionCurves.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class FossilFuel(IdentifiedObject):
     """The fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gas
@@ -70,7 +71,7 @@ class FossilFuel(IdentifiedObject):
         #: The active power output level of the unit at which the given type of fuel is switched on. This fuel (e.g., oil) is sometimes used to supplement the base fuel (e.g., coal) at high active power output levels.
         self.highBreakpointP = highBreakpointP
 
-        self._FuelAllocationSchedules = []
+        self._FuelAllocationSchedules = RefList()
         self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
 
         self._ThermalGeneratingUnit = None
@@ -92,20 +93,32 @@ class FossilFuel(IdentifiedObject):
 
     def setFuelAllocationSchedules(self, value):
         for x in self._FuelAllocationSchedules:
-            x.FossilFuel = None
-        for y in value:
-            y._FossilFuel = self
-        self._FuelAllocationSchedules = value
+            x._FossilFuel = None
+        self._FuelAllocationSchedules = RefList()
+        self.addFuelAllocationSchedules(value)
 
     FuelAllocationSchedules = property(getFuelAllocationSchedules, setFuelAllocationSchedules)
 
     def addFuelAllocationSchedules(self, *FuelAllocationSchedules):
-        for obj in FuelAllocationSchedules:
-            obj.FossilFuel = self
+        collection = self._FuelAllocationSchedules
+        for obj in members(FuelAllocationSchedules):
+            old = obj._FossilFuel
+            if old is not None and old is not self:
+                old._FuelAllocationSchedules.discard(obj)
+            obj._FossilFuel = self
+            collection.append(obj)
 
     def removeFuelAllocationSchedules(self, *FuelAllocationSchedules):
-        for obj in FuelAllocationSchedules:
-            obj.FossilFuel = None
+        collection = self._FuelAllocationSchedules
+        for obj in members(FuelAllocationSchedules):
+            if obj._FossilFuel is self:
+                obj._FossilFuel = None
+                collection.discard(obj)
+
+    def removeAllFuelAllocationSchedules(self):
+        for obj in self._FuelAllocationSchedules:
+            obj._FossilFuel = None
+        self._FuelAllocationSchedules = RefList()
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have one or more fossil fuels
@@ -114,8 +127,7 @@ class FossilFuel(IdentifiedObject):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FossilFuels if x != self]
-            self._ThermalGeneratingUnit._FossilFuels = filtered
+            self._ThermalGeneratingUnit._FossilFuels.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
@@ -72,8 +72,7 @@ class FuelAllocationSchedule(Curve):
 
     def setFossilFuel(self, value):
         if self._FossilFuel is not None:
-            filtered = [x for x in self.FossilFuel.FuelAllocationSchedules if x != self]
-            self._FossilFuel._FuelAllocationSchedules = filtered
+            self._FossilFuel._FuelAllocationSchedules.discard(self)
 
         self._FossilFuel = value
         if self._FossilFuel is not None:
@@ -89,8 +88,7 @@ class FuelAllocationSchedule(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FuelAllocationSchedules if x != self]
-            self._ThermalGeneratingUnit._FuelAllocationSchedules = filtered
+            self._ThermalGeneratingUnit._FuelAllocationSchedules.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
@@ -48,8 +48,7 @@ class GrossToNetActivePowerCurve(Curve):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.GrossToNetActivePowerCurves if x != self]
-            self._GeneratingUnit._GrossToNetActivePowerCurves = filtered
+            self._GeneratingUnit._GrossToNetActivePowerCurves.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
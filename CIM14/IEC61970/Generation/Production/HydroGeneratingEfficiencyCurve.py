@@ -48,8 +48,7 @@ class HydroGeneratingEfficiencyCurve(Curve):
 
     def setHydroGeneratingUnit(self, value):
         if self._HydroGeneratingUnit is not None:
-            filtered = [x for x in self.HydroGeneratingUnit.HydroGeneratingEfficiencyCurves if x != self]
-            self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves = filtered
+            self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves.discard(self)
 
         self._HydroGeneratingUnit = value
         if self._HydroGeneratingUnit is not None:
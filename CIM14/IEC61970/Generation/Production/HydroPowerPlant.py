@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class HydroPowerPlant(PowerSystemResource):
     """A hydro power station which can generate or pump. When generating, the generator turbines receive there water from an upper reservoir. When pumping, the pumps receive their water from a lower reservoir.
@@ -68,10 +69,10 @@ class HydroPowerPlant(PowerSystemResource):
         #: The hydro plant's generating rating active power for rated head conditions
         self.genRatedP = genRatedP
 
-        self._HydroGeneratingUnits = []
+        self._HydroGeneratingUnits = RefList()
         self.HydroGeneratingUnits = [] if HydroGeneratingUnits is None else HydroGeneratingUnits
 
-        self._HydroPumps = []
+        self._HydroPumps = RefList()
         self.HydroPumps = [] if HydroPumps is None else HydroPumps
 
         self._Reservoir = None
@@ -96,20 +97,32 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setHydroGeneratingUnits(self, value):
         for x in self._HydroGeneratingUnits:
-            x.HydroPowerPlant = None
-        for y in value:
-            y._HydroPowerPlant = self
-        self._HydroGeneratingUnits = value
+            x._HydroPowerPlant = None
+        self._HydroGeneratingUnits = RefList()
+        self.addHydroGeneratingUnits(value)
 
     HydroGeneratingUnits = property(getHydroGeneratingUnits, setHydroGeneratingUnits)
 
     def addHydroGeneratingUnits(self, *HydroGeneratingUnits):
-        for obj in HydroGeneratingUnits:
-            obj.HydroPowerPlant = self
+        collection = self._HydroGeneratingUnits
+        for obj in members(HydroGeneratingUnits):
+            old = obj._HydroPowerPlant
+            if old is not None and old is not self:
+                old._HydroGeneratingUnits.discard(obj)
+            obj._HydroPowerPlant = self
+            collection.append(obj)
 
     def removeHydroGeneratingUnits(self, *HydroGeneratingUnits):
-        for obj in HydroGeneratingUnits:
-            obj.HydroPowerPlant = None
+        collection = self._HydroGeneratingUnits
+        for obj in members(HydroGeneratingUnits):
+            if obj._HydroPowerPlant is self:
+                obj._HydroPowerPlant = None
+                collection.discard(obj)
+
+    def removeAllHydroGeneratingUnits(self):
+        for obj in self._HydroGeneratingUnits:
+            obj._HydroPowerPlant = None
+        self._HydroGeneratingUnits = RefList()
 
     def getHydroPumps(self):
         """The hydro pump may be a member of a pumped storage plant or a pump for distributing water
@@ -118,20 +131,32 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setHydroPumps(self, value):
         for x in self._HydroPumps:
-            x.HydroPowerPlant = None
-        for y in value:
-            y._HydroPowerPlant = self
-        self._HydroPumps = value
+            x._HydroPowerPlant = None
+        self._HydroPumps = RefList()
+        self.addHydroPumps(value)
 
     HydroPumps = property(getHydroPumps, setHydroPumps)
 
     def addHydroPumps(self, *HydroPumps):
-        for obj in HydroPumps:
-            obj.HydroPowerPlant = self
+        collection = self._HydroPumps
+        for obj in members(HydroPumps):
+            old = obj._HydroPowerPlant
+            if old is not None and old is not self:
+                old._HydroPumps.discard(obj)
+            obj._HydroPowerPlant = self
+            collection.append(obj)
 
     def removeHydroPumps(self, *HydroPumps):
-        for obj in HydroPumps:
-            obj.HydroPowerPlant = None
+        collection = self._HydroPumps
+        for obj in members(HydroPumps):
+            if obj._HydroPowerPlant is self:
+                obj._HydroPowerPlant = None
+                collection.discard(obj)
+
+    def removeAllHydroPumps(self):
+        for obj in self._HydroPumps:
+            obj._HydroPowerPlant = None
+        self._HydroPumps = RefList()
 
     def getReservoir(self):
         """Generators discharge water to or pumps are supplied water from a downstream reservoir
@@ -140,8 +165,7 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.HydroPowerPlants if x != self]
-            self._Reservoir._HydroPowerPlants = filtered
+            self._Reservoir._HydroPowerPlants.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
@@ -157,8 +181,7 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setGenSourcePumpDischargeReservoir(self, value):
         if self._GenSourcePumpDischargeReservoir is not None:
-            filtered = [x for x in self.GenSourcePumpDischargeReservoir.UpstreamFromHydroPowerPlants if x != self]
-            self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants = filtered
+            self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants.discard(self)
 
         self._GenSourcePumpDischargeReservoir = value
         if self._GenSourcePumpDischargeReservoir is not None:
@@ -48,8 +48,7 @@ class LevelVsVolumeCurve(Curve):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.LevelVsVolumeCurves if x != self]
-            self._Reservoir._LevelVsVolumeCurves = filtered
+            self._Reservoir._LevelVsVolumeCurves.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
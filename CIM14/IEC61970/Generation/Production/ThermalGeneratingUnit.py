@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from PyCIM.RefList import RefList, members
 
 class ThermalGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.
@@ -47,7 +48,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._StartupModel = None
         self.StartupModel = StartupModel
 
-        self._EmmissionAccounts = []
+        self._EmmissionAccounts = RefList()
         self.EmmissionAccounts = [] if EmmissionAccounts is None else EmmissionAccounts
 
         self._CombinedCyclePlant = None
@@ -56,7 +57,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._CogenerationPlant = None
         self.CogenerationPlant = CogenerationPlant
 
-        self._EmissionCurves = []
+        self._EmissionCurves = RefList()
         self.EmissionCurves = [] if EmissionCurves is None else EmissionCurves
 
         self._HeatRateCurve = None
@@ -68,10 +69,10 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._IncrementalHeatRateCurve = None
         self.IncrementalHeatRateCurve = IncrementalHeatRateCurve
 
-        self._FuelAllocationSchedules = []
+        self._FuelAllocationSchedules = RefList()
         self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
 
-        self._FossilFuels = []
+        self._FossilFuels = RefList()
         self.FossilFuels = [] if FossilFuels is None else FossilFuels
 
         self._HeatInputCurve = None
@@ -112,20 +113,32 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setEmmissionAccounts(self, value):
         for x in self._EmmissionAccounts:
-            x.ThermalGeneratingUnit = None
-        for y in value:
-            y._ThermalGeneratingUnit = self
-        self._EmmissionAccounts = value
+            x._ThermalGeneratingUnit = None
+        self._EmmissionAccounts = RefList()
+        self.addEmmissionAccounts(value)
 
     EmmissionAccounts = property(getEmmissionAccounts, setEmmissionAccounts)
 
     def addEmmissionAccounts(self, *EmmissionAccounts):
-        for obj in EmmissionAccounts:
-            obj.ThermalGeneratingUnit = self
+        collection = self._EmmissionAccounts
+        for obj in members(EmmissionAccounts):
+            old = obj._ThermalGeneratingUnit
+            if old is not None and old is not self:
+                old._EmmissionAccounts.discard(obj)
+            obj._ThermalGeneratingUnit = self
+            collection.append(obj)
 
     def removeEmmissionAccounts(self, *EmmissionAccounts):
-        for obj in EmmissionAccounts:
-            obj.ThermalGeneratingUnit = None
+        collection = self._EmmissionAccounts
+        for obj in members(EmmissionAccounts):
+            if obj._ThermalGeneratingUnit is self:
+                obj._ThermalGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllEmmissionAccounts(self):
+        for obj in self._EmmissionAccounts:
+            obj._ThermalGeneratingUnit = None
+        self._EmmissionAccounts = RefList()
 
     def getCombinedCyclePlant(self):
         """A thermal generating unit may be a member of a combined cycle plant
@@ -134,8 +147,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCombinedCyclePlant(self, value):
         if self._CombinedCyclePlant is not None:
-            filtered = [x for x in self.CombinedCyclePlant.ThermalGeneratingUnits if x != self]
-            self._CombinedCyclePlant._ThermalGeneratingUnits = filtered
+            self._CombinedCyclePlant._ThermalGeneratingUnits.discard(self)
 
         self._CombinedCyclePlant = value
         if self._CombinedCyclePlant is not None:
@@ -151,8 +163,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCogenerationPlant(self, value):
         if self._CogenerationPlant is not None:
-            filtered = [x for x in self.CogenerationPlant.ThermalGeneratingUnits if x != self]
-            self._CogenerationPlant._ThermalGeneratingUnits = filtered
+            self._CogenerationPlant._ThermalGeneratingUnits.discard(self)
 
         self._CogenerationPlant = value
         if self._CogenerationPlant is not None:
@@ -168,20 +179,32 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setEmissionCurves(self, value):
         for x in self._EmissionCurves:
-            x.ThermalGeneratingUnit = None
-        for y in value:
-            y._ThermalGeneratingUnit = self
-        self._EmissionCurves = value
+            x._ThermalGeneratingUnit = None
+        self._EmissionCurves = RefList()
+        self.addEmissionCurves(value)
 
     EmissionCurves = property(getEmissionCurves, setEmissionCurves)
 
     def addEmissionCurves(self, *EmissionCurves):
-        for obj in EmissionCurves:
-            obj.ThermalGeneratingUnit = self
+        collection = self._EmissionCurves
+        for obj in members(EmissionCurves):
+            old = obj._ThermalGeneratingUnit
+            if old is not None and old is not self:
+                old._EmissionCurves.discard(obj)
+            obj._ThermalGeneratingUnit = self
+            collection.append(obj)
 
     def removeEmissionCurves(self, *EmissionCurves):
-        for obj in EmissionCurves:
-            obj.ThermalGeneratingUnit = None
+        collection = self._EmissionCurves
+        for obj in members(EmissionCurves):
+            if obj._ThermalGeneratingUnit is self:
+                obj._ThermalGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllEmissionCurves(self):
+        for obj in self._EmissionCurves:
+            obj._ThermalGeneratingUnit = None
+        self._EmissionCurves = RefList()
 
     def getHeatRateCurve(self):
         """A thermal generating unit may have a heat rate curve
@@ -238,20 +261,32 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setFuelAllocationSchedules(self, value):
         for x in self._FuelAllocationSchedules:
-            x.ThermalGeneratingUnit = None
-        for y in value:
-            y._ThermalGeneratingUnit = self
-        self._FuelAllocationSchedules = value
+            x._ThermalGeneratingUnit = None
+        self._FuelAllocationSchedules = RefList()
+        self.addFuelAllocationSchedules(value)
 
     FuelAllocationSchedules = property(getFuelAllocationSchedules, setFuelAllocationSchedules)
 
     def addFuelAllocationSchedules(self, *FuelAllocationSchedules):
-        for obj in FuelAllocationSchedules:
-            obj.ThermalGeneratingUnit = self
+        collection = self._FuelAllocationSchedules
+        for obj in members(FuelAllocationSchedules):
+            old = obj._ThermalGeneratingUnit
+            if old is not None and old is not self:
+                old._FuelAllocationSchedules.discard(obj)
+            obj._ThermalGeneratingUnit = self
+            collection.append(obj)
 
     def removeFuelAllocationSchedules(self, *FuelAllocationSchedules):
-        for obj in FuelAllocationSchedules:
-            obj.ThermalGeneratingUnit = None
+        collection = self._FuelAllocationSchedules
+        for obj in members(FuelAllocationSchedules):
+            if obj._ThermalGeneratingUnit is self:
+                obj._ThermalGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllFuelAllocationSchedules(self):
+        for obj in self._FuelAllocationSchedules:
+            obj._ThermalGeneratingUnit = None
+        self._FuelAllocationSchedules = RefList()
 
     def getFossilFuels(self):
         """A thermal generating unit may have one or more fossil fuels
@@ -260,20 +295,32 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setFossilFuels(self, value):
         for x in self._FossilFuels:
-            x.ThermalGeneratingUnit = None
-        for y in value:
-            y._ThermalGeneratingUnit = self
-        self._FossilFuels = value
+            x._ThermalGeneratingUnit = None
+        self._FossilFuels = RefList()
+        self.addFossilFuels(value)
 
     FossilFuels = property(getFossilFuels, setFossilFuels)
 
     def addFossilFuels(self, *FossilFuels):
-        for obj in FossilFuels:
-            obj.ThermalGeneratingUnit = self
+        collection = self._FossilFuels
+        for obj in members(FossilFuels):
+            old = obj._ThermalGeneratingUnit
+            if old is not None and old is not self:
+                old._FossilFuels.discard(obj)
+            obj._ThermalGeneratingUnit = self
+            collection.append(obj)
 
     def removeFossilFuels(self, *FossilFuels):
-        for obj in FossilFuels:
-            obj.ThermalGeneratingUnit = None
+        collection = self._FossilFuels
+        for obj in members(FossilFuels):
+            if obj._ThermalGeneratingUnit is self:
+                obj._ThermalGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllFossilFuels(self):
+        for obj in self._FossilFuels:
+            obj._ThermalGeneratingUnit = None
+        self._FossilFuels = RefList()
 
     def getHeatInputCurve(self):
         """A thermal generating unit may have a heat input curve
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ModelingAuthority(IdentifiedObject):
     """A Modeling Authority is an entity responsible for supplying and maintaining the data defining a specific set of objects in a network model.
@@ -29,7 +30,7 @@ class ModelingAuthority(IdentifiedObject):
 
         @param ModelingAuthoritySets: A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
         """
-        self._ModelingAuthoritySets = []
+        self._ModelingAuthoritySets = RefList()
         self.ModelingAuthoritySets = [] if ModelingAuthoritySets is None else ModelingAuthoritySets
 
         super(ModelingAuthority, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ModelingAuthority(IdentifiedObject):
 
     def setModelingAuthoritySets(self, value):
         for x in self._ModelingAuthoritySets:
-            x.ModelingAuthority = None
-        for y in value:
-            y._ModelingAuthority = self
-        self._ModelingAuthoritySets = value
+            x._ModelingAuthority = None
+        self._ModelingAuthoritySets = RefList()
+        self.addModelingAuthoritySets(value)
 
     ModelingAuthoritySets = property(getModelingAuthoritySets, setModelingAuthoritySets)
 
     def addModelingAuthoritySets(self, *ModelingAuthoritySets):
-        for obj in ModelingAuthoritySets:
-            obj.ModelingAuthority = self
+        collection = self._ModelingAuthoritySets
+        for obj in members(ModelingAuthoritySets):
+            old = obj._ModelingAuthority
+            if old is not None and old is not self:
+                old._ModelingAuthoritySets.discard(obj)
+            obj._ModelingAuthority = self
+            collection.append(obj)
 
     def removeModelingAuthoritySets(self, *ModelingAuthoritySets):
-        for obj in ModelingAuthoritySets:
-            obj.ModelingAuthority = None
+        collection = self._ModelingAuthoritySets
+        for obj in members(ModelingAuthoritySets):
+            if obj._ModelingAuthority is self:
+                obj._ModelingAuthority = None
+                collection.discard(obj)
+
+    def removeAllModelingAuthoritySets(self):
+        for obj in self._ModelingAuthoritySets:
+            obj._ModelingAuthority = None
+        self._ModelingAuthoritySets = RefList()
 
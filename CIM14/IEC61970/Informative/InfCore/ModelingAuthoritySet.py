@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ModelingAuthoritySet(IdentifiedObject):
     """A Modeling Authority Set is a group of objects in a network model where the data is supplied and maintained by the same Modeling Authority.
@@ -33,7 +34,7 @@ class ModelingAuthoritySet(IdentifiedObject):
         self._ModelingAuthority = None
         self.ModelingAuthority = ModelingAuthority
 
-        self._IdentifiedObjects = []
+        self._IdentifiedObjects = RefList()
         self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
 
         super(ModelingAuthoritySet, self).__init__(*args, **kw_args)
@@ -52,8 +53,7 @@ class ModelingAuthoritySet(IdentifiedObject):
 
     def setModelingAuthority(self, value):
         if self._ModelingAuthority is not None:
-            filtered = [x for x in self.ModelingAuthority.ModelingAuthoritySets if x != self]
-            self._ModelingAuthority._ModelingAuthoritySets = filtered
+            self._ModelingAuthority._ModelingAuthoritySets.discard(self)
 
         self._ModelingAuthority = value
         if self._ModelingAuthority is not None:
@@ -69,18 +69,30 @@ class ModelingAuthoritySet(IdentifiedObject):
 
     def setIdentifiedObjects(self, value):
         for x in self._IdentifiedObjects:
-            x.ModelingAuthoritySet = None
-        for y in value:
-            y._ModelingAuthoritySet = self
-        self._IdentifiedObjects = value
+            x._ModelingAuthoritySet = None
+        self._IdentifiedObjects = RefList()
+        self.addIdentifiedObjects(value)
 
     IdentifiedObjects = property(getIdentifiedObjects, setIdentifiedObjects)
 
     def addIdentifiedObjects(self, *IdentifiedObjects):
-        for obj in IdentifiedObjects:
-            obj.ModelingAuthoritySet = self
+        collection = self._IdentifiedObjects
+        for obj in members(IdentifiedObjects):
+            old = obj._ModelingAuthoritySet
+            if old is not None and old is not self:
+                old._IdentifiedObjects.discard(obj)
+            obj._ModelingAuthoritySet = self
+            collection.append(obj)
 
     def removeIdentifiedObjects(self, *IdentifiedObjects):
-        for obj in IdentifiedObjects:
-            obj.ModelingAuthoritySet = None
+        collection = self._IdentifiedObjects
+        for obj in members(IdentifiedObjects):
+            if obj._ModelingAuthoritySet is self:
+                obj._ModelingAuthoritySet = None
+                collection.discard(obj)
+
+    def removeAllIdentifiedObjects(self):
+        for obj in self._IdentifiedObjects:
+            obj._ModelingAuthoritySet = None
+        self._IdentifiedObjects = RefList()
 
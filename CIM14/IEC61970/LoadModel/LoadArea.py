@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.EnergyArea import EnergyArea
+from PyCIM.RefList import RefList, members
 
 class LoadArea(EnergyArea):
     """The class is the root or first level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -29,7 +30,7 @@ class LoadArea(EnergyArea):
 
         @param SubLoadAreas: The SubLoadAreas in the LoadArea.
         """
-        self._SubLoadAreas = []
+        self._SubLoadAreas = RefList()
         self.SubLoadAreas = [] if SubLoadAreas is None else SubLoadAreas
 
         super(LoadArea, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class LoadArea(EnergyArea):
 
     def setSubLoadAreas(self, value):
         for x in self._SubLoadAreas:
-            x.LoadArea = None
-        for y in value:
-            y._LoadArea = self
-        self._SubLoadAreas = value
+            x._LoadArea = None
+        self._SubLoadAreas = RefList()
+        self.addSubLoadAreas(value)
 
     SubLoadAreas = property(getSubLoadAreas, setSubLoadAreas)
 
     def addSubLoadAreas(self, *SubLoadAreas):
-        for obj in SubLoadAreas:
-            obj.LoadArea = self
+        collection = self._SubLoadAreas
+        for obj in members(SubLoadAreas):
+            old = obj._LoadArea
+            if old is not None and old is not self:
+                old._SubLoadAreas.discard(obj)
+            obj._LoadArea = self
+            collection.append(obj)
 
     def removeSubLoadAreas(self, *SubLoadAreas):
-        for obj in SubLoadAreas:
-            obj.LoadArea = None
+        collection = self._SubLoadAreas
+        for obj in members(SubLoadAreas):
+            if obj._LoadArea is self:
+                obj._LoadArea = None
+                collection.discard(obj)
+
+    def removeAllSubLoadAreas(self):
+        for obj in self._SubLoadAreas:
+            obj._LoadArea = None
+        self._SubLoadAreas = RefList()
 
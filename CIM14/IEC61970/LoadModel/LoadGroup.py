@@ -48,8 +48,7 @@ class LoadGroup(IdentifiedObject):
 
     def setSubLoadArea(self, value):
         if self._SubLoadArea is not None:
-            filtered = [x for x in self.SubLoadArea.LoadGroups if x != self]
-            self._SubLoadArea._LoadGroups = filtered
+            self._SubLoadArea._LoadGroups.discard(self)
 
         self._SubLoadArea = value
         if self._SubLoadArea is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.LoadGroup import LoadGroup
+from PyCIM.RefList import RefList, members
 
 class NonConformLoadGroup(LoadGroup):
     """Loads that do not follow a daily and seasonal load variation pattern.
@@ -30,10 +31,10 @@ class NonConformLoadGroup(LoadGroup):
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         @param NonConformLoadSchedules: The NonConformLoadSchedules in the NonConformLoadGroup.
         """
-        self._EnergyConsumers = []
+        self._EnergyConsumers = RefList()
         self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
 
-        self._NonConformLoadSchedules = []
+        self._NonConformLoadSchedules = RefList()
         self.NonConformLoadSchedules = [] if NonConformLoadSchedules is None else NonConformLoadSchedules
 
         super(NonConformLoadGroup, self).__init__(*args, **kw_args)
@@ -52,20 +53,32 @@ class NonConformLoadGroup(LoadGroup):
 
     def setEnergyConsumers(self, value):
         for x in self._EnergyConsumers:
-            x.LoadGroup = None
-        for y in value:
-            y._LoadGroup = self
-        self._EnergyConsumers = value
+            x._LoadGroup = None
+        self._EnergyConsumers = RefList()
+        self.addEnergyConsumers(value)
 
     EnergyConsumers = property(getEnergyConsumers, setEnergyConsumers)
 
     def addEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.LoadGroup = self
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            old = obj._LoadGroup
+            if old is not None and old is not self:
+                old._EnergyConsumers.discard(obj)
+            obj._LoadGroup = self
+            collection.append(obj)
 
     def removeEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.LoadGroup = None
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            if obj._LoadGroup is self:
+                obj._LoadGroup = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumers(self):
+        for obj in self._EnergyConsumers:
+            obj._LoadGroup = None
+        self._EnergyConsumers = RefList()
 
     def getNonConformLoadSchedules(self):
         """The NonConformLoadSchedules in the NonConformLoadGroup.
@@ -74,18 +87,30 @@ class NonConformLoadGroup(LoadGroup):
 
     def setNonConformLoadSchedules(self, value):
         for x in self._NonConformLoadSchedules:
-            x.NonConformLoadGroup = None
-        for y in value:
-            y._NonConformLoadGroup = self
-        self._NonConformLoadSchedules = value
+            x._NonConformLoadGroup = None
+        self._NonConformLoadSchedules = RefList()
+        self.addNonConformLoadSchedules(value)
 
     NonConformLoadSchedules = property(getNonConformLoadSchedules, setNonConformLoadSchedules)
 
     def addNonConformLoadSchedules(self, *NonConformLoadSchedules):
-        for obj in NonConformLoadSchedules:
-            obj.NonConformLoadGroup = self
+        collection = self._NonConformLoadSchedules
+        for obj in members(NonConformLoadSchedules):
+            old = obj._NonConformLoadGroup
+            if old is not None and old is not self:
+                old._NonConformLoadSchedules.discard(obj)
+            obj._NonConformLoadGroup = self
+            collection.append(obj)
 
     def removeNonConformLoadSchedules(self, *NonConformLoadSchedules):
-        for obj in NonConformLoadSchedules:
-            obj.NonConformLoadGroup = None
+        collection = self._NonConformLoadSchedules
+        for obj in members(NonConformLoadSchedules):
+            if obj._NonConformLoadGroup is self:
+                obj._NonConformLoadGroup = None
+                collection.discard(obj)
+
+    def removeAllNonConformLoadSchedules(self):
+        for obj in self._NonConformLoadSchedules:
+            obj._NonConformLoadGroup = None
+        self._NonConformLoadSchedules = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.LimitSet import LimitSet
+from PyCIM.RefList import RefList, members
 
 class AccumulatorLimitSet(LimitSet):
     """An AccumulatorLimitSet specifies a set of Limits that are associated with an Accumulator measurement.
@@ -30,10 +31,10 @@ class AccumulatorLimitSet(LimitSet):
         @param Measurements: The Measurements using the LimitSet.
         @param Limits: The limit values used for supervision of Measurements.
         """
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
-        self._Limits = []
+        self._Limits = RefList()
         self.Limits = [] if Limits is None else Limits
 
         super(AccumulatorLimitSet, self).__init__(*args, **kw_args)
@@ -52,26 +53,28 @@ class AccumulatorLimitSet(LimitSet):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.LimitSets if q != self]
-            self._Measurements._LimitSets = filtered
-        for r in value:
-            if self not in r._LimitSets:
-                r._LimitSets.append(self)
-        self._Measurements = value
+            p._LimitSets.discard(self)
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self not in obj._LimitSets:
-                obj._LimitSets.append(self)
-            self._Measurements.append(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._LimitSets.append(self)
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self in obj._LimitSets:
-                obj._LimitSets.remove(self)
-            self._Measurements.remove(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._LimitSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._LimitSets.discard(self)
+        self._Measurements = RefList()
 
     def getLimits(self):
         """The limit values used for supervision of Measurements.
@@ -80,18 +83,30 @@ class AccumulatorLimitSet(LimitSet):
 
     def setLimits(self, value):
         for x in self._Limits:
-            x.LimitSet = None
-        for y in value:
-            y._LimitSet = self
-        self._Limits = value
+            x._LimitSet = None
+        self._Limits = RefList()
+        self.addLimits(value)
 
     Limits = property(getLimits, setLimits)
 
     def addLimits(self, *Limits):
-        for obj in Limits:
-            obj.LimitSet = self
+        collection = self._Limits
+        for obj in members(Limits):
+            old = obj._LimitSet
+            if old is not None and old is not self:
+                old._Limits.discard(obj)
+            obj._LimitSet = self
+            collection.append(obj)
 
     def removeLimits(self, *Limits):
-        for obj in Limits:
-            obj.LimitSet = None
+        collection = self._Limits
+        for obj in members(Limits):
+            if obj._LimitSet is self:
+                obj._LimitSet = None
+                collection.discard(obj)
+
+    def removeAllLimits(self):
+        for obj in self._Limits:
+            obj._LimitSet = None
+        self._Limits = RefList()
 
@@ -52,8 +52,7 @@ class AccumulatorValue(MeasurementValue):
 
     def setAccumulator(self, value):
         if self._Accumulator is not None:
-            filtered = [x for x in self.Accumulator.AccumulatorValues if x != self]
-            self._Accumulator._AccumulatorValues = filtered
+            self._Accumulator._AccumulatorValues.discard(self)
 
         self._Accumulator = value
         if self._Accumulator is not None:
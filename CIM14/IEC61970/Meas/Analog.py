@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class Analog(Measurement):
     """Analog represents an analog Measurement.
@@ -47,13 +48,13 @@ class Analog(Measurement):
         #: Normal measurement value, e.g., used for percentage calculations.
         self.normalValue = normalValue
 
-        self._LimitSets = []
+        self._LimitSets = RefList()
         self.LimitSets = [] if LimitSets is None else LimitSets
 
         self._SetPoint = None
         self.SetPoint = SetPoint
 
-        self._AnalogValues = []
+        self._AnalogValues = RefList()
         self.AnalogValues = [] if AnalogValues is None else AnalogValues
 
         super(Analog, self).__init__(*args, **kw_args)
@@ -72,26 +73,28 @@ class Analog(Measurement):
 
     def setLimitSets(self, value):
         for p in self._LimitSets:
-            filtered = [q for q in p.Measurements if q != self]
-            self._LimitSets._Measurements = filtered
-        for r in value:
-            if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._LimitSets = value
+            p._Measurements.discard(self)
+        self._LimitSets = RefList()
+        self.addLimitSets(value)
 
     LimitSets = property(getLimitSets, setLimitSets)
 
     def addLimitSets(self, *LimitSets):
-        for obj in LimitSets:
-            if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._LimitSets.append(obj)
+        collection = self._LimitSets
+        for obj in members(LimitSets):
+            obj._Measurements.append(self)
+            collection.append(obj)
 
     def removeLimitSets(self, *LimitSets):
-        for obj in LimitSets:
-            if self in obj._Measurements:
-                obj._Measurements.remove(self)
-            self._LimitSets.remove(obj)
+        collection = self._LimitSets
+        for obj in members(LimitSets):
+            obj._Measurements.discard(self)
+            collection.discard(obj)
+
+    def removeAllLimitSets(self):
+        for obj in self._LimitSets:
+            obj._Measurements.discard(self)
+        self._LimitSets = RefList()
 
     def getSetPoint(self):
         """The Control variable associated with the Measurement
@@ -116,18 +119,30 @@ class Analog(Measurement):
 
     def setAnalogValues(self, value):
         for x in self._AnalogValues:
-            x.Analog = None
-        for y in value:
-            y._Analog = self
-        self._AnalogValues = value
+            x._Analog = None
+        self._AnalogValues = RefList()
+        self.addAnalogValues(value)
 
     AnalogValues = property(getAnalogValues, setAnalogValues)
 
     def addAnalogValues(self, *AnalogValues):
-        for obj in AnalogValues:
-            obj.Analog = self
+        collection = self._AnalogValues
+        for obj in members(AnalogValues):
+            old = obj._Analog
+            if old is not None and old is not self:
+                old._AnalogValues.discard(obj)
+            obj._Analog = self
+            collection.append(obj)
 
     def removeAnalogValues(self, *AnalogValues):
-        for obj in AnalogValues:
-            obj.Analog = None
+        collection = self._AnalogValues
+        for obj in members(AnalogValues):
+            if obj._Analog is self:
+                obj._Analog = None
+                collection.discard(obj)
+
+    def removeAllAnalogValues(self):
+        for obj in self._AnalogValues:
+            obj._Analog = None
+        self._AnalogValues = RefList()
 
@@ -68,8 +68,7 @@ class Control(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Controls if x != self]
-            self._Unit._Controls = filtered
+            self._Unit._Controls.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
@@ -85,8 +84,7 @@ class Control(IdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
@@ -102,8 +100,7 @@ class Control(IdentifiedObject):
 
     def setControlType(self, value):
         if self._ControlType is not None:
-            filtered = [x for x in self.ControlType.Controls if x != self]
-            self._ControlType._Controls = filtered
+            self._ControlType._Controls.discard(self)
 
         self._ControlType = value
         if self._ControlType is not None:
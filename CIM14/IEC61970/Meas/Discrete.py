@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class Discrete(Measurement):
     """Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.
@@ -46,7 +47,7 @@ class Discrete(Measurement):
         self._Command = None
         self.Command = Command
 
-        self._DiscreteValues = []
+        self._DiscreteValues = RefList()
         self.DiscreteValues = [] if DiscreteValues is None else DiscreteValues
 
         self._ValueAliasSet = None
@@ -84,20 +85,32 @@ class Discrete(Measurement):
 
     def setDiscreteValues(self, value):
         for x in self._DiscreteValues:
-            x.Discrete = None
-        for y in value:
-            y._Discrete = self
-        self._DiscreteValues = value
+            x._Discrete = None
+        self._DiscreteValues = RefList()
+        self.addDiscreteValues(value)
 
     DiscreteValues = property(getDiscreteValues, setDiscreteValues)
 
     def addDiscreteValues(self, *DiscreteValues):
-        for obj in DiscreteValues:
-            obj.Discrete = self
+        collection = self._DiscreteValues
+        for obj in members(DiscreteValues):
+            old = obj._Discrete
+            if old is not None and old is not self:
+                old._DiscreteValues.discard(obj)
+            obj._Discrete = self
+            collection.append(obj)
 
     def removeDiscreteValues(self, *DiscreteValues):
-        for obj in DiscreteValues:
-            obj.Discrete = None
+        collection = self._DiscreteValues
+        for obj in members(DiscreteValues):
+            if obj._Discrete is self:
+                obj._Discrete = None
+                collection.discard(obj)
+
+    def removeAllDiscreteValues(self):
+        for obj in self._DiscreteValues:
+            obj._Discrete = None
+        self._DiscreteValues = RefList()
 
     def getValueAliasSet(self):
         """The ValueAliasSet used for translation of a MeasurementValue.value to a name
@@ -106,8 +119,7 @@ class Discrete(Measurement):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Discretes if x != self]
-            self._ValueAliasSet._Discretes = filtered
+            self._ValueAliasSet._Discretes.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
@@ -52,8 +52,7 @@ class DiscreteValue(MeasurementValue):
 
     def setDiscrete(self, value):
         if self._Discrete is not None:
-            filtered = [x for x in self.Discrete.DiscreteValues if x != self]
-            self._Discrete._DiscreteValues = filtered
+            self._Discrete._DiscreteValues.discard(self)
 
         self._Discrete = value
         if self._Discrete is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Measurement(IdentifiedObject):
     """A Measurement represents any measured, calculated or non-measured non-calculated quantity. Any piece of equipment may contain Measurements, e.g. a substation may have temperature measurements and door open indications, a transformer may have oil temperature and tank pressure measurements, a bay may contain a number of power flow measurements and a Breaker may contain a switch status measurement.  The PSR - Measurement association is intended to capture this use of Measurement and is included in the naming hierarchy based on EquipmentContainer. The naming hierarchy typically has Measurements as leafs, e.g. Substation-VoltageLevel-Bay-Switch-Measurement. Some Measurements represent quantities related to a particular sensor location in the network, e.g. a voltage transformer (PT) at a busbar or a current transformer (CT) at the bar between a breaker and an isolator. The sensing position is not captured in the PSR - Measurement association. Instead it is captured by the Measurement - Terminal association that is used to define the sensing location in the network topology. The location is defined by the connection of the Terminal to ConductingEquipment.  Two possible paths exist: 1) Measurement-Terminal- ConnectivityNode-Terminal-ConductingEquipment 2) Measurement-Terminal-ConductingEquipment Alternative 2 is the only allowed use.  When the sensor location is needed both Measurement-PSR and Measurement-Terminal are used. The Measurement-Terminal association is never used alone.
@@ -42,7 +43,7 @@ class Measurement(IdentifiedObject):
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
         self._Terminal = None
@@ -51,13 +52,13 @@ class Measurement(IdentifiedObject):
         self._Unit = None
         self.Unit = Unit
 
-        self._tieToMeasurement0 = []
+        self._tieToMeasurement0 = RefList()
         self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
 
         self._Asset = None
         self.Asset = Asset
 
-        self._Documents = []
+        self._Documents = RefList()
         self.Documents = [] if Documents is None else Documents
 
         super(Measurement, self).__init__(*args, **kw_args)
@@ -76,8 +77,7 @@ class Measurement(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -92,26 +92,28 @@ class Measurement(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Measurements if q != self]
-            self._Locations._Measurements = filtered
-        for r in value:
-            if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._Locations = value
+            p._Measurements.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Measurements.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._Measurements:
-                obj._Measurements.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Measurements.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._Measurements.discard(self)
+        self._Locations = RefList()
 
     def getTerminal(self):
         """One or more measurements may be associated with a terminal in the network
@@ -120,8 +122,7 @@ class Measurement(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Measurements if x != self]
-            self._Terminal._Measurements = filtered
+            self._Terminal._Measurements.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -137,8 +138,7 @@ class Measurement(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Measurements if x != self]
-            self._Unit._Measurements = filtered
+            self._Unit._Measurements.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
@@ -153,20 +153,32 @@ class Measurement(IdentifiedObject):
 
     def settieToMeasurement0(self, value):
         for x in self._tieToMeasurement0:
-            x.measurement0 = None
-        for y in value:
-            y._measurement0 = self
-        self._tieToMeasurement0 = value
+            x._measurement0 = None
+        self._tieToMeasurement0 = RefList()
+        self.addtieToMeasurement0(value)
 
     tieToMeasurement0 = property(gettieToMeasurement0, settieToMeasurement0)
 
     def addtieToMeasurement0(self, *tieToMeasurement0):
-        for obj in tieToMeasurement0:
-            obj.measurement0 = self
+        collection = self._tieToMeasurement0
+        for obj in members(tieToMeasurement0):
+            old = obj._measurement0
+            if old is not None and old is not self:
+                old._tieToMeasurement0.discard(obj)
+            obj._measurement0 = self
+            collection.append(obj)
 
     def removetieToMeasurement0(self, *tieToMeasurement0):
-        for obj in tieToMeasurement0:
-            obj.measurement0 = None
+        collection = self._tieToMeasurement0
+        for obj in members(tieToMeasurement0):
+            if obj._measurement0 is self:
+                obj._measurement0 = None
+                collection.discard(obj)
+
+    def removeAlltieToMeasurement0(self):
+        for obj in self._tieToMeasurement0:
+            obj._measurement0 = None
+        self._tieToMeasurement0 = RefList()
 
     def getAsset(self):
         
@@ -174,8 +186,7 @@ class Measurement(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.Measurements if x != self]
-            self._Asset._Measurements = filtered
+            self._Asset._Measurements.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
@@ -191,24 +202,26 @@ class Measurement(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.Measurements if q != self]
-            self._Documents._Measurements = filtered
-        for r in value:
-            if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._Documents = value
+            p._Measurements.discard(self)
+        self._Documents = RefList()
+        self.addDocuments(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
-        for obj in Documents:
-            if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._Documents.append(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._Measurements.append(self)
+            collection.append(obj)
 
     def removeDocuments(self, *Documents):
-        for obj in Documents:
-            if self in obj._Measurements:
-                obj._Measurements.remove(self)
-            self._Documents.remove(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._Measurements.discard(self)
+            collection.discard(obj)
+
+    def removeAllDocuments(self):
+        for obj in self._Documents:
+            obj._Measurements.discard(self)
+        self._Documents = RefList()
 
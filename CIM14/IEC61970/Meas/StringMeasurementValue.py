@@ -52,8 +52,7 @@ class StringMeasurementValue(MeasurementValue):
 
     def setStringMeasurement(self, value):
         if self._StringMeasurement is not None:
-            filtered = [x for x in self.StringMeasurement.StringMeasurementValues if x != self]
-            self._StringMeasurement._StringMeasurementValues = filtered
+            self._StringMeasurement._StringMeasurementValues.discard(self)
 
         self._StringMeasurement = value
         if self._StringMeasurement is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BranchGroup(IdentifiedObject):
     """A group of branch terminals whose directed flow summation is to be monitored. Abranch group need not form a cutset of the network.
@@ -53,7 +54,7 @@ class BranchGroup(IdentifiedObject):
         #: Monitor the reactive power flow.
         self.monitorReactivePower = monitorReactivePower
 
-        self._BranchGroupTerminal = []
+        self._BranchGroupTerminal = RefList()
         self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
 
         super(BranchGroup, self).__init__(*args, **kw_args)
@@ -72,18 +73,30 @@ class BranchGroup(IdentifiedObject):
 
     def setBranchGroupTerminal(self, value):
         for x in self._BranchGroupTerminal:
-            x.BranchGroup = None
-        for y in value:
-            y._BranchGroup = self
-        self._BranchGroupTerminal = value
+            x._BranchGroup = None
+        self._BranchGroupTerminal = RefList()
+        self.addBranchGroupTerminal(value)
 
     BranchGroupTerminal = property(getBranchGroupTerminal, setBranchGroupTerminal)
 
     def addBranchGroupTerminal(self, *BranchGroupTerminal):
-        for obj in BranchGroupTerminal:
-            obj.BranchGroup = self
+        collection = self._BranchGroupTerminal
+        for obj in members(BranchGroupTerminal):
+            old = obj._BranchGroup
+            if old is not None and old is not self:
+                old._BranchGroupTerminal.discard(obj)
+            obj._BranchGroup = self
+            collection.append(obj)
 
     def removeBranchGroupTerminal(self, *BranchGroupTerminal):
-        for obj in BranchGroupTerminal:
-            obj.BranchGroup = None
+        collection = self._BranchGroupTerminal
+        for obj in members(BranchGroupTerminal):
+            if obj._BranchGroup is self:
+                obj._BranchGroup = None
+                collection.discard(obj)
+
+    def removeAllBranchGroupTerminal(self):
+        for obj in self._BranchGroupTerminal:
+            obj._BranchGroup = None
+        self._BranchGroupTerminal = RefList()
 
@@ -56,8 +56,7 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitType(self, value):
         if self._OperationalLimitType is not None:
-            filtered = [x for x in self.OperationalLimitType.OperationalLimit if x != self]
-            self._OperationalLimitType._OperationalLimit = filtered
+            self._OperationalLimitType._OperationalLimit.discard(self)
 
         self._OperationalLimitType = value
         if self._OperationalLimitType is not None:
@@ -73,8 +72,7 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         if self._OperationalLimitSet is not None:
-            filtered = [x for x in self.OperationalLimitSet.OperationalLimitValue if x != self]
-            self._OperationalLimitSet._OperationalLimitValue = filtered
+            self._OperationalLimitSet._OperationalLimitValue.discard(self)
 
         self._OperationalLimitSet = value
         if self._OperationalLimitSet is not None:
@@ -84,8 +84,7 @@ class ClearanceTag(IdentifiedObject):
 
     def setClearanceTagType(self, value):
         if self._ClearanceTagType is not None:
-            filtered = [x for x in self.ClearanceTagType.ClearanceTags if x != self]
-            self._ClearanceTagType._ClearanceTags = filtered
+            self._ClearanceTagType._ClearanceTags.discard(self)
 
         self._ClearanceTagType = value
         if self._ClearanceTagType is not None:
@@ -101,8 +100,7 @@ class ClearanceTag(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
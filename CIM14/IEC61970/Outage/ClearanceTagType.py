@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ClearanceTagType(IdentifiedObject):
     """Type of ClearanceTag. Could indicate the type of work to be performed and/or the type of supervisory control.
@@ -29,7 +30,7 @@ class ClearanceTagType(IdentifiedObject):
 
         @param ClearanceTags: The ClearanceTags currently being defined for this type.
         """
-        self._ClearanceTags = []
+        self._ClearanceTags = RefList()
         self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
 
         super(ClearanceTagType, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ClearanceTagType(IdentifiedObject):
 
     def setClearanceTags(self, value):
         for x in self._ClearanceTags:
-            x.ClearanceTagType = None
-        for y in value:
-            y._ClearanceTagType = self
-        self._ClearanceTags = value
+            x._ClearanceTagType = None
+        self._ClearanceTags = RefList()
+        self.addClearanceTags(value)
 
     ClearanceTags = property(getClearanceTags, setClearanceTags)
 
     def addClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.ClearanceTagType = self
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            old = obj._ClearanceTagType
+            if old is not None and old is not self:
+                old._ClearanceTags.discard(obj)
+            obj._ClearanceTagType = self
+            collection.append(obj)
 
     def removeClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.ClearanceTagType = None
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            if obj._ClearanceTagType is self:
+                obj._ClearanceTagType = None
+                collection.discard(obj)
+
+    def removeAllClearanceTags(self):
+        for obj in self._ClearanceTags:
+            obj._ClearanceTagType = None
+        self._ClearanceTags = RefList()
 
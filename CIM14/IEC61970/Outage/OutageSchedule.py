@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IrregularIntervalSchedule import IrregularIntervalSchedule
+from PyCIM.RefList import RefList, members
 
 class OutageSchedule(IrregularIntervalSchedule):
     """The period of time that a piece of equipment is out of service, for example, for maintenance or testing; including the equipment's active power rating while under maintenance. The X-axis represents absolute time and the Y-axis represents the equipment's available rating while out of service.
@@ -30,7 +31,7 @@ class OutageSchedule(IrregularIntervalSchedule):
         @param SwitchingOperations: An OutageSchedule may operate many switches.
         @param PowerSystemResource: A power system resource may have an outage schedule
         """
-        self._SwitchingOperations = []
+        self._SwitchingOperations = RefList()
         self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
 
         self._PowerSystemResource = None
@@ -52,20 +53,32 @@ class OutageSchedule(IrregularIntervalSchedule):
 
     def setSwitchingOperations(self, value):
         for x in self._SwitchingOperations:
-            x.OutageSchedule = None
-        for y in value:
-            y._OutageSchedule = self
-        self._SwitchingOperations = value
+            x._OutageSchedule = None
+        self._SwitchingOperations = RefList()
+        self.addSwitchingOperations(value)
 
     SwitchingOperations = property(getSwitchingOperations, setSwitchingOperations)
 
     def addSwitchingOperations(self, *SwitchingOperations):
-        for obj in SwitchingOperations:
-            obj.OutageSchedule = self
+        collection = self._SwitchingOperations
+        for obj in members(SwitchingOperations):
+            old = obj._OutageSchedule
+            if old is not None and old is not self:
+                old._SwitchingOperations.discard(obj)
+            obj._OutageSchedule = self
+            collection.append(obj)
 
     def removeSwitchingOperations(self, *SwitchingOperations):
-        for obj in SwitchingOperations:
-            obj.OutageSchedule = None
+        collection = self._SwitchingOperations
+        for obj in members(SwitchingOperations):
+            if obj._OutageSchedule is self:
+                obj._OutageSchedule = None
+                collection.discard(obj)
+
+    def removeAllSwitchingOperations(self):
+        for obj in self._SwitchingOperations:
+            obj._OutageSchedule = None
+        self._SwitchingOperations = RefList()
 
     def getPowerSystemResource(self):
         """A power system resource may have an outage schedule
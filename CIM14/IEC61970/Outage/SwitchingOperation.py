@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class SwitchingOperation(IdentifiedObject):
     """A SwitchingOperation is used to define individual switch operations for an OutageSchedule. This OutageSchedule may be associated with another item of Substation such as a Transformer, Line, or Generator; or with the Switch itself as a PowerSystemResource. A Switch may be referenced by many OutageSchedules.
@@ -38,7 +39,7 @@ class SwitchingOperation(IdentifiedObject):
         #: Time of operation in same units as OutageSchedule.xAxixUnits.
         self.operationTime = operationTime
 
-        self._Switches = []
+        self._Switches = RefList()
         self.Switches = [] if Switches is None else Switches
 
         self._OutageSchedule = None
@@ -60,26 +61,28 @@ class SwitchingOperation(IdentifiedObject):
 
     def setSwitches(self, value):
         for p in self._Switches:
-            filtered = [q for q in p.SwitchingOperations if q != self]
-            self._Switches._SwitchingOperations = filtered
-        for r in value:
-            if self not in r._SwitchingOperations:
-                r._SwitchingOperations.append(self)
-        self._Switches = value
+            p._SwitchingOperations.discard(self)
+        self._Switches = RefList()
+        self.addSwitches(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
-        for obj in Switches:
-            if self not in obj._SwitchingOperations:
-                obj._SwitchingOperations.append(self)
-            self._Switches.append(obj)
+        collection = self._Switches
+        for obj in members(Switches):
+            obj._SwitchingOperations.append(self)
+            collection.append(obj)
 
     def removeSwitches(self, *Switches):
-        for obj in Switches:
-            if self in obj._SwitchingOperations:
-                obj._SwitchingOperations.remove(self)
-            self._Switches.remove(obj)
+        collection = self._Switches
+        for obj in members(Switches):
+            obj._SwitchingOperations.discard(self)
+            collection.discard(obj)
+
+    def removeAllSwitches(self):
+        for obj in self._Switches:
+            obj._SwitchingOperations.discard(self)
+        self._Switches = RefList()
 
     def getOutageSchedule(self):
         """An OutageSchedule may operate many switches.
@@ -88,8 +91,7 @@ class SwitchingOperation(IdentifiedObject):
 
     def setOutageSchedule(self, value):
         if self._OutageSchedule is not None:
-            filtered = [x for x in self.OutageSchedule.SwitchingOperations if x != self]
-            self._OutageSchedule._SwitchingOperations = filtered
+            self._OutageSchedule._SwitchingOperations.discard(self)
 
         self._OutageSchedule = value
         if self._OutageSchedule is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class ProtectionEquipment(Equipment):
     """An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.
@@ -52,7 +53,7 @@ class ProtectionEquipment(Equipment):
         self._Unit = None
         self.Unit = Unit
 
-        self._ConductingEquipments = []
+        self._ConductingEquipments = RefList()
         self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
 
         super(ProtectionEquipment, self).__init__(*args, **kw_args)
@@ -79,8 +80,7 @@ class ProtectionEquipment(Equipment):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.ProtectionEquipments if x != self]
-            self._Unit._ProtectionEquipments = filtered
+            self._Unit._ProtectionEquipments.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
@@ -96,24 +96,26 @@ class ProtectionEquipment(Equipment):
 
     def setConductingEquipments(self, value):
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
-        for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ConductingEquipments = value
+            p._ProtectionEquipments.discard(self)
+        self._ConductingEquipments = RefList()
+        self.addConductingEquipments(value)
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
-        for obj in ConductingEquipments:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+        collection = self._ConductingEquipments
+        for obj in members(ConductingEquipments):
+            obj._ProtectionEquipments.append(self)
+            collection.append(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
-        for obj in ConductingEquipments:
-            if self in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.remove(self)
-            self._ConductingEquipments.remove(obj)
+        collection = self._ConductingEquipments
+        for obj in members(ConductingEquipments):
+            obj._ProtectionEquipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllConductingEquipments(self):
+        for obj in self._ConductingEquipments:
+            obj._ProtectionEquipments.discard(self)
+        self._ConductingEquipments = RefList()
 
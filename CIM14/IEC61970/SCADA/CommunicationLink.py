@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class CommunicationLink(PowerSystemResource):
     """The connection to remote units is through one or more communication links. Reduntant links may exist. The CommunicationLink class inherit PowerSystemResource. The intention is to allow CommunicationLinks to have Measurements. These Measurements can be used to model link status as operational, out of service, unit failure etc.
@@ -29,7 +30,7 @@ class CommunicationLink(PowerSystemResource):
 
         @param RemoteUnits: RTUs may be attached to communication links.
         """
-        self._RemoteUnits = []
+        self._RemoteUnits = RefList()
         self.RemoteUnits = [] if RemoteUnits is None else RemoteUnits
 
         super(CommunicationLink, self).__init__(*args, **kw_args)
@@ -48,24 +49,26 @@ class CommunicationLink(PowerSystemResource):
 
     def setRemoteUnits(self, value):
         for p in self._RemoteUnits:
-            filtered = [q for q in p.CommunicationLinks if q != self]
-            self._RemoteUnits._CommunicationLinks = filtered
-        for r in value:
-            if self not in r._CommunicationLinks:
-                r._CommunicationLinks.append(self)
-        self._RemoteUnits = value
+            p._CommunicationLinks.discard(self)
+        self._RemoteUnits = RefList()
+        self.addRemoteUnits(value)
 
     RemoteUnits = property(getRemoteUnits, setRemoteUnits)
 
     def addRemoteUnits(self, *RemoteUnits):
-        for obj in RemoteUnits:
-            if self not in obj._CommunicationLinks:
-                obj._CommunicationLinks.append(self)
-            self._RemoteUnits.append(obj)
+        collection = self._RemoteUnits
+        for obj in members(RemoteUnits):
+            obj._CommunicationLinks.append(self)
+            collection.append(obj)
 
     def removeRemoteUnits(self, *RemoteUnits):
-        for obj in RemoteUnits:
-            if self in obj._CommunicationLinks:
-                obj._CommunicationLinks.remove(self)
-            self._RemoteUnits.remove(obj)
+        collection = self._RemoteUnits
+        for obj in members(RemoteUnits):
+            obj._CommunicationLinks.discard(self)
+            collection.discard(obj)
+
+    def removeAllRemoteUnits(self):
+        for obj in self._RemoteUnits:
+            obj._CommunicationLinks.discard(self)
+        self._RemoteUnits = RefList()
 
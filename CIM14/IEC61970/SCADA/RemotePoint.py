@@ -48,8 +48,7 @@ class RemotePoint(IdentifiedObject):
 
     def setRemoteUnit(self, value):
         if self._RemoteUnit is not None:
-            filtered = [x for x in self.RemoteUnit.RemotePoints if x != self]
-            self._RemoteUnit._RemotePoints = filtered
+            self._RemoteUnit._RemotePoints.discard(self)
 
         self._RemoteUnit = value
         if self._RemoteUnit is not None:
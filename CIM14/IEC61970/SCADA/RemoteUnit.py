@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class RemoteUnit(PowerSystemResource):
     """A remote unit can be a RTU, IED, substation control system, control center etc. The communication with the remote unit can be through various standard protocols (e.g. IEC 61870, IEC 61850) or non standard protocols (e.g. DNP, RP570 etc.). A remote unit contain remote data points that might be telemetered, collected or calculated. The RemoteUnit class inherit PowerSystemResource. The intention is to allow RemotUnits to have Measurements. These Measurements can be used to model unit status as operational, out of service, unit failure etc.
@@ -34,10 +35,10 @@ class RemoteUnit(PowerSystemResource):
         #: Type of remote unit. Values are: "IED", "ControlCenter", "RTU", "SubstationControlSystem"
         self.remoteUnitType = remoteUnitType
 
-        self._CommunicationLinks = []
+        self._CommunicationLinks = RefList()
         self.CommunicationLinks = [] if CommunicationLinks is None else CommunicationLinks
 
-        self._RemotePoints = []
+        self._RemotePoints = RefList()
         self.RemotePoints = [] if RemotePoints is None else RemotePoints
 
         super(RemoteUnit, self).__init__(*args, **kw_args)
@@ -56,26 +57,28 @@ class RemoteUnit(PowerSystemResource):
 
     def setCommunicationLinks(self, value):
         for p in self._CommunicationLinks:
-            filtered = [q for q in p.RemoteUnits if q != self]
-            self._CommunicationLinks._RemoteUnits = filtered
-        for r in value:
-            if self not in r._RemoteUnits:
-                r._RemoteUnits.append(self)
-        self._CommunicationLinks = value
+            p._RemoteUnits.discard(self)
+        self._CommunicationLinks = RefList()
+        self.addCommunicationLinks(value)
 
     CommunicationLinks = property(getCommunicationLinks, setCommunicationLinks)
 
     def addCommunicationLinks(self, *CommunicationLinks):
-        for obj in CommunicationLinks:
-            if self not in obj._RemoteUnits:
-                obj._RemoteUnits.append(self)
-            self._CommunicationLinks.append(obj)
+        collection = self._CommunicationLinks
+        for obj in members(CommunicationLinks):
+            obj._RemoteUnits.append(self)
+            collection.append(obj)
 
     def removeCommunicationLinks(self, *CommunicationLinks):
-        for obj in CommunicationLinks:
-            if self in obj._RemoteUnits:
-                obj._RemoteUnits.remove(self)
-            self._CommunicationLinks.remove(obj)
+        collection = self._CommunicationLinks
+        for obj in members(CommunicationLinks):
+            obj._RemoteUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCommunicationLinks(self):
+        for obj in self._CommunicationLinks:
+            obj._RemoteUnits.discard(self)
+        self._CommunicationLinks = RefList()
 
     def getRemotePoints(self):
         """Remote points this Remote unit contains.
@@ -84,18 +87,30 @@ class RemoteUnit(PowerSystemResource):
 
     def setRemotePoints(self, value):
         for x in self._RemotePoints:
-            x.RemoteUnit = None
-        for y in value:
-            y._RemoteUnit = self
-        self._RemotePoints = value
+            x._RemoteUnit = None
+        self._RemotePoints = RefList()
+        self.addRemotePoints(value)
 
     RemotePoints = property(getRemotePoints, setRemotePoints)
 
     def addRemotePoints(self, *RemotePoints):
-        for obj in RemotePoints:
-            obj.RemoteUnit = self
+        collection = self._RemotePoints
+        for obj in members(RemotePoints):
+            old = obj._RemoteUnit
+            if old is not None and old is not self:
+                old._RemotePoints.discard(obj)
+            obj._RemoteUnit = self
+            collection.append(obj)
 
     def removeRemotePoints(self, *RemotePoints):
-        for obj in RemotePoints:
-            obj.RemoteUnit = None
+        collection = self._RemotePoints
+        for obj in members(RemotePoints):
+            if obj._RemoteUnit is self:
+                obj._RemoteUnit = None
+                collection.discard(obj)
+
+    def removeAllRemotePoints(self):
+        for obj in self._RemotePoints:
+            obj._RemoteUnit = None
+        self._RemotePoints = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TopologicalIsland(IdentifiedObject):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes (i.e. switch or Terminal.connected status changes).
@@ -30,7 +31,7 @@ class TopologicalIsland(IdentifiedObject):
         @param TopologicalNodes: A topological node belongs to a topological island
         @param AngleRef_TopologicalNode: The angle reference for the island.   Normally there is one TopologicalNode that is selected as the angle reference for each island.   Other reference schemes exist, so the association is optional.
         """
-        self._TopologicalNodes = []
+        self._TopologicalNodes = RefList()
         self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
 
         self._AngleRef_TopologicalNode = None
@@ -52,20 +53,32 @@ class TopologicalIsland(IdentifiedObject):
 
     def setTopologicalNodes(self, value):
         for x in self._TopologicalNodes:
-            x.TopologicalIsland = None
-        for y in value:
-            y._TopologicalIsland = self
-        self._TopologicalNodes = value
+            x._TopologicalIsland = None
+        self._TopologicalNodes = RefList()
+        self.addTopologicalNodes(value)
 
     TopologicalNodes = property(getTopologicalNodes, setTopologicalNodes)
 
     def addTopologicalNodes(self, *TopologicalNodes):
-        for obj in TopologicalNodes:
-            obj.TopologicalIsland = self
+        collection = self._TopologicalNodes
+        for obj in members(TopologicalNodes):
+            old = obj._TopologicalIsland
+            if old is not None and old is not self:
+                old._TopologicalNodes.discard(obj)
+            obj._TopologicalIsland = self
+            collection.append(obj)
 
     def removeTopologicalNodes(self, *TopologicalNodes):
-        for obj in TopologicalNodes:
-            obj.TopologicalIsland = None
+        collection = self._TopologicalNodes
+        for obj in members(TopologicalNodes):
+            if obj._TopologicalIsland is self:
+                obj._TopologicalIsland = None
+                collection.discard(obj)
+
+    def removeAllTopologicalNodes(self):
+        for obj in self._TopologicalNodes:
+            obj._TopologicalIsland = None
+        self._TopologicalNodes = RefList()
 
     def getAngleRef_TopologicalNode(self):
         """The angle reference for the island.   Normally there is one TopologicalNode that is selected as the angle reference for each island.   Other reference schemes exist, so the association is optional.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BusNameMarker(IdentifiedObject):
     """Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.
@@ -33,7 +34,7 @@ class BusNameMarker(IdentifiedObject):
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
 
-        self._ConnectivityNode = []
+        self._ConnectivityNode = RefList()
         self.ConnectivityNode = [] if ConnectivityNode is None else ConnectivityNode
 
         super(BusNameMarker, self).__init__(*args, **kw_args)
@@ -52,8 +53,7 @@ class BusNameMarker(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.BusNameMarker if x != self]
-            self._ReportingGroup._BusNameMarker = filtered
+            self._ReportingGroup._BusNameMarker.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
@@ -69,18 +69,30 @@ class BusNameMarker(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         for x in self._ConnectivityNode:
-            x.BusNameMarker = None
-        for y in value:
-            y._BusNameMarker = self
-        self._ConnectivityNode = value
+            x._BusNameMarker = None
+        self._ConnectivityNode = RefList()
+        self.addConnectivityNode(value)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
     def addConnectivityNode(self, *ConnectivityNode):
-        for obj in ConnectivityNode:
-            obj.BusNameMarker = self
+        collection = self._ConnectivityNode
+        for obj in members(ConnectivityNode):
+            old = obj._BusNameMarker
+            if old is not None and old is not self:
+                old._ConnectivityNode.discard(obj)
+            obj._BusNameMarker = self
+            collection.append(obj)
 
     def removeConnectivityNode(self, *ConnectivityNode):
-        for obj in ConnectivityNode:
-            obj.BusNameMarker = None
+        collection = self._ConnectivityNode
+        for obj in members(ConnectivityNode):
+            if obj._BusNameMarker is self:
+                obj._BusNameMarker = None
+                collection.discard(obj)
+
+    def removeAllConnectivityNode(self):
+        for obj in self._ConnectivityNode:
+            obj._BusNameMarker = None
+        self._ConnectivityNode = RefList()
 
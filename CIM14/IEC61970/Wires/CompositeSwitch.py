@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class CompositeSwitch(Equipment):
     """A model of a set of individual Switches normally enclosed within the same cabinet and possibly with interlocks that restrict the combination of switch positions. These are typically found in medium voltage distribution networks.  A CompositeSwitch could represent a Ring-Main-Unit (RMU), or pad-mounted switchgear, with primitive internal devices such as an internal bus-bar plus 3 or 4 internal switches each of which may individually be open or closed. A CompositeSwitch and a set of contained Switches can also be used to represent a multi-position switch e.g. a switch that can connect a circuit to Ground, Open or Busbar.
@@ -33,7 +34,7 @@ class CompositeSwitch(Equipment):
         #: An alphanumeric code that can be used as a reference to extar information such as the description of the interlocking scheme if any
         self.compositeSwitchType = compositeSwitchType
 
-        self._Switches = []
+        self._Switches = RefList()
         self.Switches = [] if Switches is None else Switches
 
         super(CompositeSwitch, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class CompositeSwitch(Equipment):
 
     def setSwitches(self, value):
         for x in self._Switches:
-            x.CompositeSwitch = None
-        for y in value:
-            y._CompositeSwitch = self
-        self._Switches = value
+            x._CompositeSwitch = None
+        self._Switches = RefList()
+        self.addSwitches(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
-        for obj in Switches:
-            obj.CompositeSwitch = self
+        collection = self._Switches
+        for obj in members(Switches):
+            old = obj._CompositeSwitch
+            if old is not None and old is not self:
+                old._Switches.discard(obj)
+            obj._CompositeSwitch = self
+            collection.append(obj)
 
     def removeSwitches(self, *Switches):
-        for obj in Switches:
-            obj.CompositeSwitch = None
+        collection = self._Switches
+        for obj in members(Switches):
+            if obj._CompositeSwitch is self:
+                obj._CompositeSwitch = None
+                collection.discard(obj)
+
+    def removeAllSwitches(self):
+        for obj in self._Switches:
+            obj._CompositeSwitch = None
+        self._Switches = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system model
@@ -52,13 +53,13 @@ class EnergyConsumer(ConductingEquipment):
         #: Reactive power of the load that is a fixed quantity.
         self.qfixed = qfixed
 
-        self._aggregateLoad0 = []
+        self._aggregateLoad0 = RefList()
         self.aggregateLoad0 = [] if aggregateLoad0 is None else aggregateLoad0
 
         self._PowerCutZone = None
         self.PowerCutZone = PowerCutZone
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         self._LoadResponse = None
@@ -79,26 +80,28 @@ class EnergyConsumer(ConductingEquipment):
 
     def setaggregateLoad0(self, value):
         for p in self._aggregateLoad0:
-            filtered = [q for q in p.energyConsumer0 if q != self]
-            self._aggregateLoad0._energyConsumer0 = filtered
-        for r in value:
-            if self not in r._energyConsumer0:
-                r._energyConsumer0.append(self)
-        self._aggregateLoad0 = value
+            p._energyConsumer0.discard(self)
+        self._aggregateLoad0 = RefList()
+        self.addaggregateLoad0(value)
 
     aggregateLoad0 = property(getaggregateLoad0, setaggregateLoad0)
 
     def addaggregateLoad0(self, *aggregateLoad0):
-        for obj in aggregateLoad0:
-            if self not in obj._energyConsumer0:
-                obj._energyConsumer0.append(self)
-            self._aggregateLoad0.append(obj)
+        collection = self._aggregateLoad0
+        for obj in members(aggregateLoad0):
+            obj._energyConsumer0.append(self)
+            collection.append(obj)
 
     def removeaggregateLoad0(self, *aggregateLoad0):
-        for obj in aggregateLoad0:
-            if self in obj._energyConsumer0:
-                obj._energyConsumer0.remove(self)
-            self._aggregateLoad0.remove(obj)
+        collection = self._aggregateLoad0
+        for obj in members(aggregateLoad0):
+            obj._energyConsumer0.discard(self)
+            collection.discard(obj)
+
+    def removeAllaggregateLoad0(self):
+        for obj in self._aggregateLoad0:
+            obj._energyConsumer0.discard(self)
+        self._aggregateLoad0 = RefList()
 
     def getPowerCutZone(self):
         """An energy consumer is assigned to a power cut zone
@@ -107,8 +110,7 @@ class EnergyConsumer(ConductingEquipment):
 
     def setPowerCutZone(self, value):
         if self._PowerCutZone is not None:
-            filtered = [x for x in self.PowerCutZone.EnergyConsumers if x != self]
-            self._PowerCutZone._EnergyConsumers = filtered
+            self._PowerCutZone._EnergyConsumers.discard(self)
 
         self._PowerCutZone = value
         if self._PowerCutZone is not None:
@@ -123,20 +125,32 @@ class EnergyConsumer(ConductingEquipment):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.EnergyConsumer = None
-        for y in value:
-            y._EnergyConsumer = self
-        self._ServiceDeliveryPoints = value
+            x._EnergyConsumer = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.EnergyConsumer = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._EnergyConsumer
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._EnergyConsumer = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.EnergyConsumer = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._EnergyConsumer is self:
+                obj._EnergyConsumer = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._EnergyConsumer = None
+        self._ServiceDeliveryPoints = RefList()
 
     def getLoadResponse(self):
         """The load response characteristic of this load.
@@ -145,8 +159,7 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
@@ -48,8 +48,7 @@ class Line(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Lines if x != self]
-            self._Region._Lines = filtered
+            self._Region._Lines.discard(self)
 
         self._Region = value
         if self._Region is not None:
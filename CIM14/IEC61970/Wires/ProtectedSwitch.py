@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.Switch import Switch
+from PyCIM.RefList import RefList, members
 
 class ProtectedSwitch(Switch):
     """A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.
@@ -29,7 +30,7 @@ class ProtectedSwitch(Switch):
 
         @param RecloseSequences: A breaker may have zero or more automatic reclosures after a trip occurs.
         """
-        self._RecloseSequences = []
+        self._RecloseSequences = RefList()
         self.RecloseSequences = [] if RecloseSequences is None else RecloseSequences
 
         super(ProtectedSwitch, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ProtectedSwitch(Switch):
 
     def setRecloseSequences(self, value):
         for x in self._RecloseSequences:
-            x.ProtectedSwitch = None
-        for y in value:
-            y._ProtectedSwitch = self
-        self._RecloseSequences = value
+            x._ProtectedSwitch = None
+        self._RecloseSequences = RefList()
+        self.addRecloseSequences(value)
 
     RecloseSequences = property(getRecloseSequences, setRecloseSequences)
 
     def addRecloseSequences(self, *RecloseSequences):
-        for obj in RecloseSequences:
-            obj.ProtectedSwitch = self
+        collection = self._RecloseSequences
+        for obj in members(RecloseSequences):
+            old = obj._ProtectedSwitch
+            if old is not None and old is not self:
+                old._RecloseSequences.discard(obj)
+            obj._ProtectedSwitch = self
+            collection.append(obj)
 
     def removeRecloseSequences(self, *RecloseSequences):
-        for obj in RecloseSequences:
-            obj.ProtectedSwitch = None
+        collection = self._RecloseSequences
+        for obj in members(RecloseSequences):
+            if obj._ProtectedSwitch is self:
+                obj._ProtectedSwitch = None
+                collection.discard(obj)
+
+    def removeAllRecloseSequences(self):
+        for obj in self._RecloseSequences:
+            obj._ProtectedSwitch = None
+        self._RecloseSequences = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Curve import Curve
+from PyCIM.RefList import RefList, members
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.
@@ -38,10 +39,10 @@ class ReactiveCapabilityCurve(Curve):
         #: The hydrogen coolant pressure
         self.hydrogenPressure = hydrogenPressure
 
-        self._InitiallyUsedBySynchronousMachines = []
+        self._InitiallyUsedBySynchronousMachines = RefList()
         self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
 
-        self._SynchronousMachines = []
+        self._SynchronousMachines = RefList()
         self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
@@ -60,20 +61,32 @@ class ReactiveCapabilityCurve(Curve):
 
     def setInitiallyUsedBySynchronousMachines(self, value):
         for x in self._InitiallyUsedBySynchronousMachines:
-            x.InitialReactiveCapabilityCurve = None
-        for y in value:
-            y._InitialReactiveCapabilityCurve = self
-        self._InitiallyUsedBySynchronousMachines = value
+            x._InitialReactiveCapabilityCurve = None
+        self._InitiallyUsedBySynchronousMachines = RefList()
+        self.addInitiallyUsedBySynchronousMachines(value)
 
     InitiallyUsedBySynchronousMachines = property(getInitiallyUsedBySynchronousMachines, setInitiallyUsedBySynchronousMachines)
 
     def addInitiallyUsedBySynchronousMachines(self, *InitiallyUsedBySynchronousMachines):
-        for obj in InitiallyUsedBySynchronousMachines:
-            obj.InitialReactiveCapabilityCurve = self
+        collection = self._InitiallyUsedBySynchronousMachines
+        for obj in members(InitiallyUsedBySynchronousMachines):
+            old = obj._InitialReactiveCapabilityCurve
+            if old is not None and old is not self:
+                old._InitiallyUsedBySynchronousMachines.discard(obj)
+            obj._InitialReactiveCapabilityCurve = self
+            collection.append(obj)
 
     def removeInitiallyUsedBySynchronousMachines(self, *InitiallyUsedBySynchronousMachines):
-        for obj in InitiallyUsedBySynchronousMachines:
-            obj.InitialReactiveCapabilityCurve = None
+        collection = self._InitiallyUsedBySynchronousMachines
+        for obj in members(InitiallyUsedBySynchronousMachines):
+            if obj._InitialReactiveCapabilityCurve is self:
+                obj._InitialReactiveCapabilityCurve = None
+                collection.discard(obj)
+
+    def removeAllInitiallyUsedBySynchronousMachines(self):
+        for obj in self._InitiallyUsedBySynchronousMachines:
+            obj._InitialReactiveCapabilityCurve = None
+        self._InitiallyUsedBySynchronousMachines = RefList()
 
     def getSynchronousMachines(self):
         """Synchronous machines using this curve.
@@ -82,24 +95,26 @@ class ReactiveCapabilityCurve(Curve):
 
     def setSynchronousMachines(self, value):
         for p in self._SynchronousMachines:
-            filtered = [q for q in p.ReactiveCapabilityCurves if q != self]
-            self._SynchronousMachines._ReactiveCapabilityCurves = filtered
-        for r in value:
-            if self not in r._ReactiveCapabilityCurves:
-                r._ReactiveCapabilityCurves.append(self)
-        self._SynchronousMachines = value
+            p._ReactiveCapabilityCurves.discard(self)
+        self._SynchronousMachines = RefList()
+        self.addSynchronousMachines(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            if self not in obj._ReactiveCapabilityCurves:
-                obj._ReactiveCapabilityCurves.append(self)
-            self._SynchronousMachines.append(obj)
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            obj._ReactiveCapabilityCurves.append(self)
+            collection.append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            if self in obj._ReactiveCapabilityCurves:
-                obj._ReactiveCapabilityCurves.remove(self)
-            self._SynchronousMachines.remove(obj)
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            obj._ReactiveCapabilityCurves.discard(self)
+            collection.discard(obj)
+
+    def removeAllSynchronousMachines(self):
+        for obj in self._SynchronousMachines:
+            obj._ReactiveCapabilityCurves.discard(self)
+        self._SynchronousMachines = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -48,16 +49,16 @@ class RegulatingControl(PowerSystemResource):
         #: The target value specified for case input.   This value can be used for the target value wihout the use of schedules. The value has the units appropriate to the mode attribute.
         self.targetValue = targetValue
 
-        self._RegulationSchedule = []
+        self._RegulationSchedule = RefList()
         self.RegulationSchedule = [] if RegulationSchedule is None else RegulationSchedule
 
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._TapChanger = []
+        self._TapChanger = RefList()
         self.TapChanger = [] if TapChanger is None else TapChanger
 
-        self._RegulatingCondEq = []
+        self._RegulatingCondEq = RefList()
         self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
@@ -76,20 +77,32 @@ class RegulatingControl(PowerSystemResource):
 
     def setRegulationSchedule(self, value):
         for x in self._RegulationSchedule:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._RegulationSchedule = value
+            x._RegulatingControl = None
+        self._RegulationSchedule = RefList()
+        self.addRegulationSchedule(value)
 
     RegulationSchedule = property(getRegulationSchedule, setRegulationSchedule)
 
     def addRegulationSchedule(self, *RegulationSchedule):
-        for obj in RegulationSchedule:
-            obj.RegulatingControl = self
+        collection = self._RegulationSchedule
+        for obj in members(RegulationSchedule):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._RegulationSchedule.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeRegulationSchedule(self, *RegulationSchedule):
-        for obj in RegulationSchedule:
-            obj.RegulatingControl = None
+        collection = self._RegulationSchedule
+        for obj in members(RegulationSchedule):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllRegulationSchedule(self):
+        for obj in self._RegulationSchedule:
+            obj._RegulatingControl = None
+        self._RegulationSchedule = RefList()
 
     def getTerminal(self):
         """The terminal associated with this regulating control.
@@ -98,8 +111,7 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -115,20 +127,32 @@ class RegulatingControl(PowerSystemResource):
 
     def setTapChanger(self, value):
         for x in self._TapChanger:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._TapChanger = value
+            x._RegulatingControl = None
+        self._TapChanger = RefList()
+        self.addTapChanger(value)
 
     TapChanger = property(getTapChanger, setTapChanger)
 
     def addTapChanger(self, *TapChanger):
-        for obj in TapChanger:
-            obj.RegulatingControl = self
+        collection = self._TapChanger
+        for obj in members(TapChanger):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._TapChanger.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeTapChanger(self, *TapChanger):
-        for obj in TapChanger:
-            obj.RegulatingControl = None
+        collection = self._TapChanger
+        for obj in members(TapChanger):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllTapChanger(self):
+        for obj in self._TapChanger:
+            obj._RegulatingControl = None
+        self._TapChanger = RefList()
 
     def getRegulatingCondEq(self):
         """The equipment that participates in this regulating control scheme.
@@ -137,18 +161,30 @@ class RegulatingControl(PowerSystemResource):
 
     def setRegulatingCondEq(self, value):
         for x in self._RegulatingCondEq:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._RegulatingCondEq = value
+            x._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
+        self.addRegulatingCondEq(value)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
     def addRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = self
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._RegulatingCondEq.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = None
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllRegulatingCondEq(self):
+        for obj in self._RegulatingCondEq:
+            obj._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.
@@ -48,16 +49,16 @@ class Switch(ConductingEquipment):
         #: The attribute is used in cases when no Measurement for the status value is present. If the Switch has a status measurment the Discrete.normalValue is expected to match with the Switch.normalOpen.
         self.normalOpen = normalOpen
 
-        self._SwitchingOperations = []
+        self._SwitchingOperations = RefList()
         self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
 
         self._CompositeSwitch = None
         self.CompositeSwitch = CompositeSwitch
 
-        self._ConnectDisconnectFunctions = []
+        self._ConnectDisconnectFunctions = RefList()
         self.ConnectDisconnectFunctions = [] if ConnectDisconnectFunctions is None else ConnectDisconnectFunctions
 
-        self._SwitchSchedules = []
+        self._SwitchSchedules = RefList()
         self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
 
         super(Switch, self).__init__(*args, **kw_args)
@@ -76,26 +77,28 @@ class Switch(ConductingEquipment):
 
     def setSwitchingOperations(self, value):
         for p in self._SwitchingOperations:
-            filtered = [q for q in p.Switches if q != self]
-            self._SwitchingOperations._Switches = filtered
-        for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
-        self._SwitchingOperations = value
+            p._Switches.discard(self)
+        self._SwitchingOperations = RefList()
+        self.addSwitchingOperations(value)
 
     SwitchingOperations = property(getSwitchingOperations, setSwitchingOperations)
 
     def addSwitchingOperations(self, *SwitchingOperations):
-        for obj in SwitchingOperations:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._SwitchingOperations.append(obj)
+        collection = self._SwitchingOperations
+        for obj in members(SwitchingOperations):
+            obj._Switches.append(self)
+            collection.append(obj)
 
     def removeSwitchingOperations(self, *SwitchingOperations):
-        for obj in SwitchingOperations:
-            if self in obj._Switches:
-                obj._Switches.remove(self)
-            self._SwitchingOperations.remove(obj)
+        collection = self._SwitchingOperations
+        for obj in members(SwitchingOperations):
+            obj._Switches.discard(self)
+            collection.discard(obj)
+
+    def removeAllSwitchingOperations(self):
+        for obj in self._SwitchingOperations:
+            obj._Switches.discard(self)
+        self._SwitchingOperations = RefList()
 
     def getCompositeSwitch(self):
         """Composite switch this Switch belongs to
@@ -104,8 +107,7 @@ class Switch(ConductingEquipment):
 
     def setCompositeSwitch(self, value):
         if self._CompositeSwitch is not None:
-            filtered = [x for x in self.CompositeSwitch.Switches if x != self]
-            self._CompositeSwitch._Switches = filtered
+            self._CompositeSwitch._Switches.discard(self)
 
         self._CompositeSwitch = value
         if self._CompositeSwitch is not None:
@@ -120,26 +122,28 @@ class Switch(ConductingEquipment):
 
     def setConnectDisconnectFunctions(self, value):
         for p in self._ConnectDisconnectFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._ConnectDisconnectFunctions._Switches = filtered
-        for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
-        self._ConnectDisconnectFunctions = value
+            p._Switches.discard(self)
+        self._ConnectDisconnectFunctions = RefList()
+        self.addConnectDisconnectFunctions(value)
 
     ConnectDisconnectFunctions = property(getConnectDisconnectFunctions, setConnectDisconnectFunctions)
 
     def addConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
-        for obj in ConnectDisconnectFunctions:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._ConnectDisconnectFunctions.append(obj)
+        collection = self._ConnectDisconnectFunctions
+        for obj in members(ConnectDisconnectFunctions):
+            obj._Switches.append(self)
+            collection.append(obj)
 
     def removeConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
-        for obj in ConnectDisconnectFunctions:
-            if self in obj._Switches:
-                obj._Switches.remove(self)
-            self._ConnectDisconnectFunctions.remove(obj)
+        collection = self._ConnectDisconnectFunctions
+        for obj in members(ConnectDisconnectFunctions):
+            obj._Switches.discard(self)
+            collection.discard(obj)
+
+    def removeAllConnectDisconnectFunctions(self):
+        for obj in self._ConnectDisconnectFunctions:
+            obj._Switches.discard(self)
+        self._ConnectDisconnectFunctions = RefList()
 
     def getSwitchSchedules(self):
         """A Switch can be associated with SwitchSchedules.
@@ -148,18 +152,30 @@ class Switch(ConductingEquipment):
 
     def setSwitchSchedules(self, value):
         for x in self._SwitchSchedules:
-            x.Switch = None
-        for y in value:
-            y._Switch = self
-        self._SwitchSchedules = value
+            x._Switch = None
+        self._SwitchSchedules = RefList()
+        self.addSwitchSchedules(value)
 
     SwitchSchedules = property(getSwitchSchedules, setSwitchSchedules)
 
     def addSwitchSchedules(self, *SwitchSchedules):
-        for obj in SwitchSchedules:
-            obj.Switch = self
+        collection = self._SwitchSchedules
+        for obj in members(SwitchSchedules):
+            old = obj._Switch
+            if old is not None and old is not self:
+                old._SwitchSchedules.discard(obj)
+            obj._Switch = self
+            collection.append(obj)
 
     def removeSwitchSchedules(self, *SwitchSchedules):
-        for obj in SwitchSchedules:
-            obj.Switch = None
+        collection = self._SwitchSchedules
+        for obj in members(SwitchSchedules):
+            if obj._Switch is self:
+                obj._Switch = None
+                collection.discard(obj)
+
+    def removeAllSwitchSchedules(self):
+        for obj in self._SwitchSchedules:
+            obj._Switch = None
+        self._SwitchSchedules = RefList()
 
@@ -48,8 +48,7 @@ class SwitchSchedule(SeasonDayTypeSchedule):
 
     def setSwitch(self, value):
         if self._Switch is not None:
-            filtered = [x for x in self.Switch.SwitchSchedules if x != self]
-            self._Switch._SwitchSchedules = filtered
+            self._Switch._SwitchSchedules.discard(self)
 
         self._Switch = value
         if self._Switch is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.RotatingMachine import RotatingMachine
+from PyCIM.RefList import RefList, members
 
 class SynchronousMachine(RotatingMachine):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -152,7 +153,7 @@ class SynchronousMachine(RotatingMachine):
         #: Direct-axis subtransient reactance, also known as X'd.
         self.xDirectSubtrans = xDirectSubtrans
 
-        self._genLoad0 = []
+        self._genLoad0 = RefList()
         self.genLoad0 = [] if genLoad0 is None else genLoad0
 
         self._HydroPump = None
@@ -161,19 +162,19 @@ class SynchronousMachine(RotatingMachine):
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
 
-        self._govHydro10 = []
+        self._govHydro10 = RefList()
         self.govHydro10 = [] if govHydro10 is None else govHydro10
 
-        self._PrimeMovers = []
+        self._PrimeMovers = RefList()
         self.PrimeMovers = [] if PrimeMovers is None else PrimeMovers
 
         self._InitialReactiveCapabilityCurve = None
         self.InitialReactiveCapabilityCurve = InitialReactiveCapabilityCurve
 
-        self._genEquiv0 = []
+        self._genEquiv0 = RefList()
         self.genEquiv0 = [] if genEquiv0 is None else genEquiv0
 
-        self._ReactiveCapabilityCurves = []
+        self._ReactiveCapabilityCurves = RefList()
         self.ReactiveCapabilityCurves = [] if ReactiveCapabilityCurves is None else ReactiveCapabilityCurves
 
         super(SynchronousMachine, self).__init__(*args, **kw_args)
@@ -191,26 +192,28 @@ class SynchronousMachine(RotatingMachine):
 
     def setgenLoad0(self, value):
         for p in self._genLoad0:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._genLoad0._synchronousMachine0 = filtered
-        for r in value:
-            if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
-        self._genLoad0 = value
+            p._synchronousMachine0.discard(self)
+        self._genLoad0 = RefList()
+        self.addgenLoad0(value)
 
     genLoad0 = property(getgenLoad0, setgenLoad0)
 
     def addgenLoad0(self, *genLoad0):
-        for obj in genLoad0:
-            if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._genLoad0.append(obj)
+        collection = self._genLoad0
+        for obj in members(genLoad0):
+            obj._synchronousMachine0.append(self)
+            collection.append(obj)
 
     def removegenLoad0(self, *genLoad0):
-        for obj in genLoad0:
-            if self in obj._synchronousMachine0:
-                obj._synchronousMachine0.remove(self)
-            self._genLoad0.remove(obj)
+        collection = self._genLoad0
+        for obj in members(genLoad0):
+            obj._synchronousMachine0.discard(self)
+            collection.discard(obj)
+
+    def removeAllgenLoad0(self):
+        for obj in self._genLoad0:
+            obj._synchronousMachine0.discard(self)
+        self._genLoad0 = RefList()
 
     def getHydroPump(self):
         """The synchronous machine drives the turbine which moves the water from a low elevation to a higher elevation. The direction of machine rotation for pumping may or may not be the same as for generating.
@@ -235,8 +238,7 @@ class SynchronousMachine(RotatingMachine):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
@@ -251,26 +253,28 @@ class SynchronousMachine(RotatingMachine):
 
     def setgovHydro10(self, value):
         for p in self._govHydro10:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._govHydro10._synchronousMachine0 = filtered
-        for r in value:
-            if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
-        self._govHydro10 = value
+            p._synchronousMachine0.discard(self)
+        self._govHydro10 = RefList()
+        self.addgovHydro10(value)
 
     govHydro10 = property(getgovHydro10, setgovHydro10)
 
     def addgovHydro10(self, *govHydro10):
-        for obj in govHydro10:
-            if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._govHydro10.append(obj)
+        collection = self._govHydro10
+        for obj in members(govHydro10):
+            obj._synchronousMachine0.append(self)
+            collection.append(obj)
 
     def removegovHydro10(self, *govHydro10):
-        for obj in govHydro10:
-            if self in obj._synchronousMachine0:
-                obj._synchronousMachine0.remove(self)
-            self._govHydro10.remove(obj)
+        collection = self._govHydro10
+        for obj in members(govHydro10):
+            obj._synchronousMachine0.discard(self)
+            collection.discard(obj)
+
+    def removeAllgovHydro10(self):
+        for obj in self._govHydro10:
+            obj._synchronousMachine0.discard(self)
+        self._govHydro10 = RefList()
 
     def getPrimeMovers(self):
         """Prime movers that drive this SynchronousMachine.
@@ -279,26 +283,28 @@ class SynchronousMachine(RotatingMachine):
 
     def setPrimeMovers(self, value):
         for p in self._PrimeMovers:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._PrimeMovers._SynchronousMachines = filtered
-        for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._PrimeMovers = value
+            p._SynchronousMachines.discard(self)
+        self._PrimeMovers = RefList()
+        self.addPrimeMovers(value)
 
     PrimeMovers = property(getPrimeMovers, setPrimeMovers)
 
     def addPrimeMovers(self, *PrimeMovers):
-        for obj in PrimeMovers:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._PrimeMovers.append(obj)
+        collection = self._PrimeMovers
+        for obj in members(PrimeMovers):
+            obj._SynchronousMachines.append(self)
+            collection.append(obj)
 
     def removePrimeMovers(self, *PrimeMovers):
-        for obj in PrimeMovers:
-            if self in obj._SynchronousMachines:
-                obj._SynchronousMachines.remove(self)
-            self._PrimeMovers.remove(obj)
+        collection = self._PrimeMovers
+        for obj in members(PrimeMovers):
+            obj._SynchronousMachines.discard(self)
+            collection.discard(obj)
+
+    def removeAllPrimeMovers(self):
+        for obj in self._PrimeMovers:
+            obj._SynchronousMachines.discard(self)
+        self._PrimeMovers = RefList()
 
     def getInitialReactiveCapabilityCurve(self):
         """The default ReactiveCapabilityCurve for use by a SynchronousMachine
@@ -307,8 +313,7 @@ class SynchronousMachine(RotatingMachine):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
@@ -323,26 +328,28 @@ class SynchronousMachine(RotatingMachine):
 
     def setgenEquiv0(self, value):
         for p in self._genEquiv0:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._genEquiv0._synchronousMachine0 = filtered
-        for r in value:
-            if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
-        self._genEquiv0 = value
+            p._synchronousMachine0.discard(self)
+        self._genEquiv0 = RefList()
+        self.addgenEquiv0(value)
 
     genEquiv0 = property(getgenEquiv0, setgenEquiv0)
 
     def addgenEquiv0(self, *genEquiv0):
-        for obj in genEquiv0:
-            if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._genEquiv0.append(obj)
+        collection = self._genEquiv0
+        for obj in members(genEquiv0):
+            obj._synchronousMachine0.append(self)
+            collection.append(obj)
 
     def removegenEquiv0(self, *genEquiv0):
-        for obj in genEquiv0:
-            if self in obj._synchronousMachine0:
-                obj._synchronousMachine0.remove(self)
-            self._genEquiv0.remove(obj)
+        collection = self._genEquiv0
+        for obj in members(genEquiv0):
+            obj._synchronousMachine0.discard(self)
+            collection.discard(obj)
+
+    def removeAllgenEquiv0(self):
+        for obj in self._genEquiv0:
+            obj._synchronousMachine0.discard(self)
+        self._genEquiv0 = RefList()
 
     def getReactiveCapabilityCurves(self):
         """All available Reactive capability curves for this SynchronousMachine.
@@ -351,24 +358,26 @@ class SynchronousMachine(RotatingMachine):
 
     def setReactiveCapabilityCurves(self, value):
         for p in self._ReactiveCapabilityCurves:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._ReactiveCapabilityCurves._SynchronousMachines = filtered
-        for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._ReactiveCapabilityCurves = value
+            p._SynchronousMachines.discard(self)
+        self._ReactiveCapabilityCurves = RefList()
+        self.addReactiveCapabilityCurves(value)
 
     ReactiveCapabilityCurves = property(getReactiveCapabilityCurves, setReactiveCapabilityCurves)
 
     def addReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
-        for obj in ReactiveCapabilityCurves:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._ReactiveCapabilityCurves.append(obj)
+        collection = self._ReactiveCapabilityCurves
+        for obj in members(ReactiveCapabilityCurves):
+            obj._SynchronousMachines.append(self)
+            collection.append(obj)
 
     def removeReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
-        for obj in ReactiveCapabilityCurves:
-            if self in obj._SynchronousMachines:
-                obj._SynchronousMachines.remove(self)
-            self._ReactiveCapabilityCurves.remove(obj)
+        collection = self._ReactiveCapabilityCurves
+        for obj in members(ReactiveCapabilityCurves):
+            obj._SynchronousMachines.discard(self)
+            collection.discard(obj)
+
+    def removeAllReactiveCapabilityCurves(self):
+        for obj in self._ReactiveCapabilityCurves:
+            obj._SynchronousMachines.discard(self)
+        self._ReactiveCapabilityCurves = RefList()
 
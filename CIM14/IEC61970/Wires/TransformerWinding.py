@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class TransformerWinding(ConductingEquipment):
     """A winding is associated with each defined terminal of a transformer (or phase shifter).
@@ -105,10 +106,10 @@ class TransformerWinding(ConductingEquipment):
         #: Ground reactance path through connected grounding transformer.
         self.xground = xground
 
-        self._From_WindingTest = []
+        self._From_WindingTest = RefList()
         self.From_WindingTest = [] if From_WindingTest is None else From_WindingTest
 
-        self._To_WindingTest = []
+        self._To_WindingTest = RefList()
         self.To_WindingTest = [] if To_WindingTest is None else To_WindingTest
 
         self._RatioTapChanger = None
@@ -136,20 +137,32 @@ class TransformerWinding(ConductingEquipment):
 
     def setFrom_WindingTest(self, value):
         for x in self._From_WindingTest:
-            x.From_TransformerWinding = None
-        for y in value:
-            y._From_TransformerWinding = self
-        self._From_WindingTest = value
+            x._From_TransformerWinding = None
+        self._From_WindingTest = RefList()
+        self.addFrom_WindingTest(value)
 
     From_WindingTest = property(getFrom_WindingTest, setFrom_WindingTest)
 
     def addFrom_WindingTest(self, *From_WindingTest):
-        for obj in From_WindingTest:
-            obj.From_TransformerWinding = self
+        collection = self._From_WindingTest
+        for obj in members(From_WindingTest):
+            old = obj._From_TransformerWinding
+            if old is not None and old is not self:
+                old._From_WindingTest.discard(obj)
+            obj._From_TransformerWinding = self
+            collection.append(obj)
 
     def removeFrom_WindingTest(self, *From_WindingTest):
-        for obj in From_WindingTest:
-            obj.From_TransformerWinding = None
+        collection = self._From_WindingTest
+        for obj in members(From_WindingTest):
+            if obj._From_TransformerWinding is self:
+                obj._From_TransformerWinding = None
+                collection.discard(obj)
+
+    def removeAllFrom_WindingTest(self):
+        for obj in self._From_WindingTest:
+            obj._From_TransformerWinding = None
+        self._From_WindingTest = RefList()
 
     def getTo_WindingTest(self):
         """The winding winding tests for which the transformer winding (terminal) participates as the 'to' end of the test.
@@ -158,20 +171,32 @@ class TransformerWinding(ConductingEquipment):
 
     def setTo_WindingTest(self, value):
         for x in self._To_WindingTest:
-            x.To_TransformerWinding = None
-        for y in value:
-            y._To_TransformerWinding = self
-        self._To_WindingTest = value
+            x._To_TransformerWinding = None
+        self._To_WindingTest = RefList()
+        self.addTo_WindingTest(value)
 
     To_WindingTest = property(getTo_WindingTest, setTo_WindingTest)
 
     def addTo_WindingTest(self, *To_WindingTest):
-        for obj in To_WindingTest:
-            obj.To_TransformerWinding = self
+        collection = self._To_WindingTest
+        for obj in members(To_WindingTest):
+            old = obj._To_TransformerWinding
+            if old is not None and old is not self:
+                old._To_WindingTest.discard(obj)
+            obj._To_TransformerWinding = self
+            collection.append(obj)
 
     def removeTo_WindingTest(self, *To_WindingTest):
-        for obj in To_WindingTest:
-            obj.To_TransformerWinding = None
+        collection = self._To_WindingTest
+        for obj in members(To_WindingTest):
+            if obj._To_TransformerWinding is self:
+                obj._To_TransformerWinding = None
+                collection.discard(obj)
+
+    def removeAllTo_WindingTest(self):
+        for obj in self._To_WindingTest:
+            obj._To_TransformerWinding = None
+        self._To_WindingTest = RefList()
 
     def getRatioTapChanger(self):
         """The ratio tap changer associated with the transformer winding.
@@ -196,8 +221,7 @@ class TransformerWinding(ConductingEquipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerWindings if x != self]
-            self._PowerTransformer._TransformerWindings = filtered
+            self._PowerTransformer._TransformerWindings.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
@@ -52,8 +52,7 @@ class VoltageControlZone(PowerSystemResource):
 
     def setRegulationSchedule(self, value):
         if self._RegulationSchedule is not None:
-            filtered = [x for x in self.RegulationSchedule.VoltageControlZones if x != self]
-            self._RegulationSchedule._VoltageControlZones = filtered
+            self._RegulationSchedule._VoltageControlZones.discard(self)
 
         self._RegulationSchedule = value
         if self._RegulationSchedule is not None:
@@ -84,8 +84,7 @@ class WindingTest(IdentifiedObject):
 
     def setFrom_TransformerWinding(self, value):
         if self._From_TransformerWinding is not None:
-            filtered = [x for x in self.From_TransformerWinding.From_WindingTest if x != self]
-            self._From_TransformerWinding._From_WindingTest = filtered
+            self._From_TransformerWinding._From_WindingTest.discard(self)
 
         self._From_TransformerWinding = value
         if self._From_TransformerWinding is not None:
@@ -101,8 +100,7 @@ class WindingTest(IdentifiedObject):
 
     def setTo_TransformerWinding(self, value):
         if self._To_TransformerWinding is not None:
-            filtered = [x for x in self.To_TransformerWinding.To_WindingTest if x != self]
-            self._To_TransformerWinding._To_WindingTest = filtered
+            self._To_TransformerWinding._To_WindingTest.discard(self)
 
         self._To_TransformerWinding = value
         if self._To_TransformerWinding is not None:
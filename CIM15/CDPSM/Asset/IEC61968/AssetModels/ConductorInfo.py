@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class ConductorInfo(AssetInfo):
     """Conductor data.
@@ -50,10 +51,10 @@ class ConductorInfo(AssetInfo):
         #: Number of phases (including neutral) to be retained. Any wires beyond this number should be reduced into the earth return.
         self.phaseCount = phaseCount
 
-        self._WireArrangements = []
+        self._WireArrangements = RefList()
         self.WireArrangements = [] if WireArrangements is None else WireArrangements
 
-        self._LineSegments = []
+        self._LineSegments = RefList()
         self.LineSegments = [] if LineSegments is None else LineSegments
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
@@ -72,20 +73,32 @@ class ConductorInfo(AssetInfo):
 
     def setWireArrangements(self, value):
         for x in self._WireArrangements:
-            x.ConductorInfo = None
-        for y in value:
-            y._ConductorInfo = self
-        self._WireArrangements = value
+            x._ConductorInfo = None
+        self._WireArrangements = RefList()
+        self.addWireArrangements(value)
 
     WireArrangements = property(getWireArrangements, setWireArrangements)
 
     def addWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.ConductorInfo = self
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            old = obj._ConductorInfo
+            if old is not None and old is not self:
+                old._WireArrangements.discard(obj)
+            obj._ConductorInfo = self
+            collection.append(obj)
 
     def removeWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.ConductorInfo = None
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            if obj._ConductorInfo is self:
+                obj._ConductorInfo = None
+                collection.discard(obj)
+
+    def removeAllWireArrangements(self):
+        for obj in self._WireArrangements:
+            obj._ConductorInfo = None
+        self._WireArrangements = RefList()
 
     def getLineSegments(self):
         """All line segments described by this conductor data.
@@ -94,18 +107,30 @@ class ConductorInfo(AssetInfo):
 
     def setLineSegments(self, value):
         for x in self._LineSegments:
-            x.ConductorInfo = None
-        for y in value:
-            y._ConductorInfo = self
-        self._LineSegments = value
+            x._ConductorInfo = None
+        self._LineSegments = RefList()
+        self.addLineSegments(value)
 
     LineSegments = property(getLineSegments, setLineSegments)
 
     def addLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.ConductorInfo = self
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            old = obj._ConductorInfo
+            if old is not None and old is not self:
+                old._LineSegments.discard(obj)
+            obj._ConductorInfo = self
+            collection.append(obj)
 
     def removeLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.ConductorInfo = None
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            if obj._ConductorInfo is self:
+                obj._ConductorInfo = None
+                collection.discard(obj)
+
+    def removeAllLineSegments(self):
+        for obj in self._LineSegments:
+            obj._ConductorInfo = None
+        self._LineSegments = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class PowerTransformerInfo(AssetInfo):
     """Set of power transformer data, from an equipment library.
@@ -29,7 +30,7 @@ class PowerTransformerInfo(AssetInfo):
 
         @param TransformerTankInfo: Data for all the tanks described by this power transformer data.
         """
-        self._TransformerTankInfo = []
+        self._TransformerTankInfo = RefList()
         self.TransformerTankInfo = [] if TransformerTankInfo is None else TransformerTankInfo
 
         super(PowerTransformerInfo, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class PowerTransformerInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         for x in self._TransformerTankInfo:
-            x.PowerTransformerInfo = None
-        for y in value:
-            y._PowerTransformerInfo = self
-        self._TransformerTankInfo = value
+            x._PowerTransformerInfo = None
+        self._TransformerTankInfo = RefList()
+        self.addTransformerTankInfo(value)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
     def addTransformerTankInfo(self, *TransformerTankInfo):
-        for obj in TransformerTankInfo:
-            obj.PowerTransformerInfo = self
+        collection = self._TransformerTankInfo
+        for obj in members(TransformerTankInfo):
+            old = obj._PowerTransformerInfo
+            if old is not None and old is not self:
+                old._TransformerTankInfo.discard(obj)
+            obj._PowerTransformerInfo = self
+            collection.append(obj)
 
     def removeTransformerTankInfo(self, *TransformerTankInfo):
-        for obj in TransformerTankInfo:
-            obj.PowerTransformerInfo = None
+        collection = self._TransformerTankInfo
+        for obj in members(TransformerTankInfo):
+            if obj._PowerTransformerInfo is self:
+                obj._PowerTransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerTankInfo(self):
+        for obj in self._TransformerTankInfo:
+            obj._PowerTransformerInfo = None
+        self._TransformerTankInfo = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class TransformerEndInfo(AssetInfo):
     """Transformer end data.
@@ -69,7 +70,7 @@ class TransformerEndInfo(AssetInfo):
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._TransformerEnd = []
+        self._TransformerEnd = RefList()
         self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
 
         super(TransformerEndInfo, self).__init__(*args, **kw_args)
@@ -88,8 +89,7 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerEndInfos if x != self]
-            self._TransformerTankInfo._TransformerEndInfos = filtered
+            self._TransformerTankInfo._TransformerEndInfos.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
@@ -105,18 +105,30 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerEnd(self, value):
         for x in self._TransformerEnd:
-            x.TransformerEndInfo = None
-        for y in value:
-            y._TransformerEndInfo = self
-        self._TransformerEnd = value
+            x._TransformerEndInfo = None
+        self._TransformerEnd = RefList()
+        self.addTransformerEnd(value)
 
     TransformerEnd = property(getTransformerEnd, setTransformerEnd)
 
     def addTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.TransformerEndInfo = self
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            old = obj._TransformerEndInfo
+            if old is not None and old is not self:
+                old._TransformerEnd.discard(obj)
+            obj._TransformerEndInfo = self
+            collection.append(obj)
 
     def removeTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.TransformerEndInfo = None
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            if obj._TransformerEndInfo is self:
+                obj._TransformerEndInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerEnd(self):
+        for obj in self._TransformerEnd:
+            obj._TransformerEndInfo = None
+        self._TransformerEnd = RefList()
 
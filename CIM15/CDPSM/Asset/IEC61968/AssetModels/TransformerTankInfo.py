@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class TransformerTankInfo(AssetInfo):
     """Set of transformer tank data, from an equipment library.
@@ -34,10 +35,10 @@ class TransformerTankInfo(AssetInfo):
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._TransformerEndInfos = []
+        self._TransformerEndInfos = RefList()
         self.TransformerEndInfos = [] if TransformerEndInfos is None else TransformerEndInfos
 
-        self._TransformerTanks = []
+        self._TransformerTanks = RefList()
         self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
 
         super(TransformerTankInfo, self).__init__(*args, **kw_args)
@@ -56,8 +57,7 @@ class TransformerTankInfo(AssetInfo):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.TransformerTankInfo if x != self]
-            self._PowerTransformerInfo._TransformerTankInfo = filtered
+            self._PowerTransformerInfo._TransformerTankInfo.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
@@ -73,20 +73,32 @@ class TransformerTankInfo(AssetInfo):
 
     def setTransformerEndInfos(self, value):
         for x in self._TransformerEndInfos:
-            x.TransformerTankInfo = None
-        for y in value:
-            y._TransformerTankInfo = self
-        self._TransformerEndInfos = value
+            x._TransformerTankInfo = None
+        self._TransformerEndInfos = RefList()
+        self.addTransformerEndInfos(value)
 
     TransformerEndInfos = property(getTransformerEndInfos, setTransformerEndInfos)
 
     def addTransformerEndInfos(self, *TransformerEndInfos):
-        for obj in TransformerEndInfos:
-            obj.TransformerTankInfo = self
+        collection = self._TransformerEndInfos
+        for obj in members(TransformerEndInfos):
+            old = obj._TransformerTankInfo
+            if old is not None and old is not self:
+                old._TransformerEndInfos.discard(obj)
+            obj._TransformerTankInfo = self
+            collection.append(obj)
 
     def removeTransformerEndInfos(self, *TransformerEndInfos):
-        for obj in TransformerEndInfos:
-            obj.TransformerTankInfo = None
+        collection = self._TransformerEndInfos
+        for obj in members(TransformerEndInfos):
+            if obj._TransformerTankInfo is self:
+                obj._TransformerTankInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerEndInfos(self):
+        for obj in self._TransformerEndInfos:
+            obj._TransformerTankInfo = None
+        self._TransformerEndInfos = RefList()
 
     def getTransformerTanks(self):
         """All transformer tanks that can be described with this transformer tank data.
@@ -95,18 +107,30 @@ class TransformerTankInfo(AssetInfo):
 
     def setTransformerTanks(self, value):
         for x in self._TransformerTanks:
-            x.TransformerTankInfo = None
-        for y in value:
-            y._TransformerTankInfo = self
-        self._TransformerTanks = value
+            x._TransformerTankInfo = None
+        self._TransformerTanks = RefList()
+        self.addTransformerTanks(value)
 
     TransformerTanks = property(getTransformerTanks, setTransformerTanks)
 
     def addTransformerTanks(self, *TransformerTanks):
-        for obj in TransformerTanks:
-            obj.TransformerTankInfo = self
+        collection = self._TransformerTanks
+        for obj in members(TransformerTanks):
+            old = obj._TransformerTankInfo
+            if old is not None and old is not self:
+                old._TransformerTanks.discard(obj)
+            obj._TransformerTankInfo = self
+            collection.append(obj)
 
     def removeTransformerTanks(self, *TransformerTanks):
-        for obj in TransformerTanks:
-            obj.TransformerTankInfo = None
+        collection = self._TransformerTanks
+        for obj in members(TransformerTanks):
+            if obj._TransformerTankInfo is self:
+                obj._TransformerTankInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerTanks(self):
+        for obj in self._TransformerTanks:
+            obj._TransformerTankInfo = None
+        self._TransformerTanks = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class WireType(IdentifiedObject):
     """Wire conductor (per IEEE specs). A specific type of wire or combination of wires, not insulated from each other, suitable for carrying electrical current.
@@ -77,7 +78,7 @@ class WireType(IdentifiedObject):
         #: Describes the wire guage or cross section (e.g., 4/0, #2, 336.5).
         self.sizeDescription = sizeDescription
 
-        self._WireArrangements = []
+        self._WireArrangements = RefList()
         self.WireArrangements = [] if WireArrangements is None else WireArrangements
 
         super(WireType, self).__init__(*args, **kw_args)
@@ -96,18 +97,30 @@ class WireType(IdentifiedObject):
 
     def setWireArrangements(self, value):
         for x in self._WireArrangements:
-            x.WireType = None
-        for y in value:
-            y._WireType = self
-        self._WireArrangements = value
+            x._WireType = None
+        self._WireArrangements = RefList()
+        self.addWireArrangements(value)
 
     WireArrangements = property(getWireArrangements, setWireArrangements)
 
     def addWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.WireType = self
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            old = obj._WireType
+            if old is not None and old is not self:
+                old._WireArrangements.discard(obj)
+            obj._WireType = self
+            collection.append(obj)
 
     def removeWireArrangements(self, *WireArrangements):
-        for obj in WireArrangements:
-            obj.WireType = None
+        collection = self._WireArrangements
+        for obj in members(WireArrangements):
+            if obj._WireType is self:
+                obj._WireType = None
+                collection.discard(obj)
+
+    def removeAllWireArrangements(self):
+        for obj in self._WireArrangements:
+            obj._WireType = None
+        self._WireArrangements = RefList()
 
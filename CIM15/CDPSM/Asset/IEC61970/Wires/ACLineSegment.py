@@ -56,8 +56,7 @@ class ACLineSegment(IdentifiedObject):
 
     def setSequenceImpedance(self, value):
         if self._SequenceImpedance is not None:
-            filtered = [x for x in self.SequenceImpedance.LineSegments if x != self]
-            self._SequenceImpedance._LineSegments = filtered
+            self._SequenceImpedance._LineSegments.discard(self)
 
         self._SequenceImpedance = value
         if self._SequenceImpedance is not None:
@@ -73,8 +72,7 @@ class ACLineSegment(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.LineSegments if x != self]
-            self._ConductorInfo._LineSegments = filtered
+            self._ConductorInfo._LineSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
@@ -90,8 +88,7 @@ class ACLineSegment(IdentifiedObject):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.LineSegments if x != self]
-            self._PhaseImpedance._LineSegments = filtered
+            self._PhaseImpedance._LineSegments.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
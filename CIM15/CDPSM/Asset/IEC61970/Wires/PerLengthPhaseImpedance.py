@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -29,7 +30,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
         @param LineSegments: All line segments described by this phase impedance.
         """
-        self._LineSegments = []
+        self._LineSegments = RefList()
         self.LineSegments = [] if LineSegments is None else LineSegments
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
     def setLineSegments(self, value):
         for x in self._LineSegments:
-            x.PhaseImpedance = None
-        for y in value:
-            y._PhaseImpedance = self
-        self._LineSegments = value
+            x._PhaseImpedance = None
+        self._LineSegments = RefList()
+        self.addLineSegments(value)
 
     LineSegments = property(getLineSegments, setLineSegments)
 
     def addLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.PhaseImpedance = self
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            old = obj._PhaseImpedance
+            if old is not None and old is not self:
+                old._LineSegments.discard(obj)
+            obj._PhaseImpedance = self
+            collection.append(obj)
 
     def removeLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.PhaseImpedance = None
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            if obj._PhaseImpedance is self:
+                obj._PhaseImpedance = None
+                collection.discard(obj)
+
+    def removeAllLineSegments(self):
+        for obj in self._LineSegments:
+            obj._PhaseImpedance = None
+        self._LineSegments = RefList()
 
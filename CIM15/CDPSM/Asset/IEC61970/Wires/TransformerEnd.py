@@ -56,8 +56,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
@@ -73,8 +72,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setTransformerEndInfo(self, value):
         if self._TransformerEndInfo is not None:
-            filtered = [x for x in self.TransformerEndInfo.TransformerEnd if x != self]
-            self._TransformerEndInfo._TransformerEnd = filtered
+            self._TransformerEndInfo._TransformerEnd.discard(self)
 
         self._TransformerEndInfo = value
         if self._TransformerEndInfo is not None:
@@ -90,8 +88,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerStarImpedance(IdentifiedObject):
     """Transformer star impedance (Pi-model) that accurately reflects impedance for transformers with 2 or 3 windings. For transformers with 4 or more windings, you must use TransformerTank model and related classes. For transmission networks use PowerTransformerEnd impedances (r, r0, x, x0, b, b0, g and g0).
@@ -29,7 +30,7 @@ class TransformerStarImpedance(IdentifiedObject):
 
         @param TransformerEnd: All transformer ends having this star impedance.
         """
-        self._TransformerEnd = []
+        self._TransformerEnd = RefList()
         self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
 
         super(TransformerStarImpedance, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class TransformerStarImpedance(IdentifiedObject):
 
     def setTransformerEnd(self, value):
         for x in self._TransformerEnd:
-            x.StarImpedance = None
-        for y in value:
-            y._StarImpedance = self
-        self._TransformerEnd = value
+            x._StarImpedance = None
+        self._TransformerEnd = RefList()
+        self.addTransformerEnd(value)
 
     TransformerEnd = property(getTransformerEnd, setTransformerEnd)
 
     def addTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.StarImpedance = self
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            old = obj._StarImpedance
+            if old is not None and old is not self:
+                old._TransformerEnd.discard(obj)
+            obj._StarImpedance = self
+            collection.append(obj)
 
     def removeTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.StarImpedance = None
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            if obj._StarImpedance is self:
+                obj._StarImpedance = None
+                collection.discard(obj)
+
+    def removeAllTransformerEnd(self):
+        for obj in self._TransformerEnd:
+            obj._StarImpedance = None
+        self._TransformerEnd = RefList()
 
@@ -48,8 +48,7 @@ class TransformerTank(IdentifiedObject):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerTanks if x != self]
-            self._TransformerTankInfo._TransformerTanks = filtered
+            self._TransformerTankInfo._TransformerTanks.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.Element import Element
+from PyCIM.RefList import RefList, members
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributes
@@ -37,7 +38,7 @@ class IdentifiedObject(Element):
         #: The aliasName is free text human readable name of the object alternative to IdentifiedObject.name. It may be non unique and may not correlate to a naming hierarchy. The attribute aliasName is put back because of backwards compatibility between CIM relases. It is however recommended to replace aliasName with the Name class as aliasName is planned for retirement at a future time. This was decided at a joint WG13/14 meeting in Minneapolis 2010-10-06.
         self.aliasName = aliasName
 
-        self._Names = []
+        self._Names = RefList()
         self.Names = [] if Names is None else Names
 
         super(IdentifiedObject, self).__init__(*args, **kw_args)
@@ -56,18 +57,30 @@ class IdentifiedObject(Element):
 
     def setNames(self, value):
         for x in self._Names:
-            x.IdentifiedObject = None
-        for y in value:
-            y._IdentifiedObject = self
-        self._Names = value
+            x._IdentifiedObject = None
+        self._Names = RefList()
+        self.addNames(value)
 
     Names = property(getNames, setNames)
 
     def addNames(self, *Names):
-        for obj in Names:
-            obj.IdentifiedObject = self
+        collection = self._Names
+        for obj in members(Names):
+            old = obj._IdentifiedObject
+            if old is not None and old is not self:
+                old._Names.discard(obj)
+            obj._IdentifiedObject = self
+            collection.append(obj)
 
     def removeNames(self, *Names):
-        for obj in Names:
-            obj.IdentifiedObject = None
+        collection = self._Names
+        for obj in members(Names):
+            if obj._IdentifiedObject is self:
+                obj._IdentifiedObject = None
+                collection.discard(obj)
+
+    def removeAllNames(self):
+        for obj in self._Names:
+            obj._IdentifiedObject = None
+        self._Names = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.Element import Element
+from PyCIM.RefList import RefList, members
 
 class NameType(Element):
     """Type of name. Possible values for attribute 'name' are implementation dependent but standard profiles may specify types. An enterprise may have multiple IT systems each having its own local name for the same object, e.g. a planning system may have different names from an EMS. An object may also have different names within the same IT system, e.g. localName and aliasName as defined in CIM version 14. Their definitions from CIM14 are The localName is a human readable name of the object. It is only used with objects organized in a naming hierarchy. localName: A free text name local to a node in a naming hierarchy similar to a file directory structure. A power system related naming hierarchy may be: Substation, VoltageLevel, Equipment etc. Children of the same parent in such a hierarchy have names that typically are unique among them. aliasName: A free text alternate name typically used in tabular reports where the column width is limited.
@@ -29,7 +30,7 @@ class NameType(Element):
 
         @param Names: All names of this type.
         """
-        self._Names = []
+        self._Names = RefList()
         self.Names = [] if Names is None else Names
 
         super(NameType, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class NameType(Element):
 
     def setNames(self, value):
         for x in self._Names:
-            x.NameType = None
-        for y in value:
-            y._NameType = self
-        self._Names = value
+            x._NameType = None
+        self._Names = RefList()
+        self.addNames(value)
 
     Names = property(getNames, setNames)
 
     def addNames(self, *Names):
-        for obj in Names:
-            obj.NameType = self
+        collection = self._Names
+        for obj in members(Names):
+            old = obj._NameType
+            if old is not None and old is not self:
+                old._Names.discard(obj)
+            obj._NameType = self
+            collection.append(obj)
 
     def removeNames(self, *Names):
-        for obj in Names:
-            obj.NameType = None
+        collection = self._Names
+        for obj in members(Names):
+            if obj._NameType is self:
+                obj._NameType = None
+                collection.discard(obj)
+
+    def removeAllNames(self):
+        for obj in self._Names:
+            obj._NameType = None
+        self._Names = RefList()
 
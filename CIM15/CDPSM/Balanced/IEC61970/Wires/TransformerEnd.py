@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -32,10 +33,10 @@ class TransformerEnd(IdentifiedObject):
         @param CoreAdmittance: Core admittance of this transformer end, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end only.
         @param StarImpedance: (accurate for 2- or 3-winding transformers only) Pi-model impedances of this transformer end. By convention, for a two winding transformer, the full values of the transformer should be entered on the high voltage end (endNumber=1).
         """
-        self._FromMeshImpedance = []
+        self._FromMeshImpedance = RefList()
         self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
 
-        self._ToMeshImpedance = []
+        self._ToMeshImpedance = RefList()
         self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
 
         self._CoreAdmittance = None
@@ -60,20 +61,32 @@ class TransformerEnd(IdentifiedObject):
 
     def setFromMeshImpedance(self, value):
         for x in self._FromMeshImpedance:
-            x.FromTransformerEnd = None
-        for y in value:
-            y._FromTransformerEnd = self
-        self._FromMeshImpedance = value
+            x._FromTransformerEnd = None
+        self._FromMeshImpedance = RefList()
+        self.addFromMeshImpedance(value)
 
     FromMeshImpedance = property(getFromMeshImpedance, setFromMeshImpedance)
 
     def addFromMeshImpedance(self, *FromMeshImpedance):
-        for obj in FromMeshImpedance:
-            obj.FromTransformerEnd = self
+        collection = self._FromMeshImpedance
+        for obj in members(FromMeshImpedance):
+            old = obj._FromTransformerEnd
+            if old is not None and old is not self:
+                old._FromMeshImpedance.discard(obj)
+            obj._FromTransformerEnd = self
+            collection.append(obj)
 
     def removeFromMeshImpedance(self, *FromMeshImpedance):
-        for obj in FromMeshImpedance:
-            obj.FromTransformerEnd = None
+        collection = self._FromMeshImpedance
+        for obj in members(FromMeshImpedance):
+            if obj._FromTransformerEnd is self:
+                obj._FromTransformerEnd = None
+                collection.discard(obj)
+
+    def removeAllFromMeshImpedance(self):
+        for obj in self._FromMeshImpedance:
+            obj._FromTransformerEnd = None
+        self._FromMeshImpedance = RefList()
 
     def getToMeshImpedance(self):
         """All mesh impedances between this 'from' and other 'to' transformer ends.
@@ -82,26 +95,28 @@ class TransformerEnd(IdentifiedObject):
 
     def setToMeshImpedance(self, value):
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEnd if q != self]
-            self._ToMeshImpedance._ToTransformerEnd = filtered
-        for r in value:
-            if self not in r._ToTransformerEnd:
-                r._ToTransformerEnd.append(self)
-        self._ToMeshImpedance = value
+            p._ToTransformerEnd.discard(self)
+        self._ToMeshImpedance = RefList()
+        self.addToMeshImpedance(value)
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
-        for obj in ToMeshImpedance:
-            if self not in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.append(self)
-            self._ToMeshImpedance.append(obj)
+        collection = self._ToMeshImpedance
+        for obj in members(ToMeshImpedance):
+            obj._ToTransformerEnd.append(self)
+            collection.append(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
-        for obj in ToMeshImpedance:
-            if self in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.remove(self)
-            self._ToMeshImpedance.remove(obj)
+        collection = self._ToMeshImpedance
+        for obj in members(ToMeshImpedance):
+            obj._ToTransformerEnd.discard(self)
+            collection.discard(obj)
+
+    def removeAllToMeshImpedance(self):
+        for obj in self._ToMeshImpedance:
+            obj._ToTransformerEnd.discard(self)
+        self._ToMeshImpedance = RefList()
 
     def getCoreAdmittance(self):
         """Core admittance of this transformer end, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end only.
@@ -110,8 +125,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
@@ -127,8 +141,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerMeshImpedance(IdentifiedObject):
     """Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.
@@ -49,7 +50,7 @@ class TransformerMeshImpedance(IdentifiedObject):
         self._FromTransformerEnd = None
         self.FromTransformerEnd = FromTransformerEnd
 
-        self._ToTransformerEnd = []
+        self._ToTransformerEnd = RefList()
         self.ToTransformerEnd = [] if ToTransformerEnd is None else ToTransformerEnd
 
         super(TransformerMeshImpedance, self).__init__(*args, **kw_args)
@@ -68,8 +69,7 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEnd(self, value):
         if self._FromTransformerEnd is not None:
-            filtered = [x for x in self.FromTransformerEnd.FromMeshImpedance if x != self]
-            self._FromTransformerEnd._FromMeshImpedance = filtered
+            self._FromTransformerEnd._FromMeshImpedance.discard(self)
 
         self._FromTransformerEnd = value
         if self._FromTransformerEnd is not None:
@@ -85,24 +85,26 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setToTransformerEnd(self, value):
         for p in self._ToTransformerEnd:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEnd._ToMeshImpedance = filtered
-        for r in value:
-            if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
-        self._ToTransformerEnd = value
+            p._ToMeshImpedance.discard(self)
+        self._ToTransformerEnd = RefList()
+        self.addToTransformerEnd(value)
 
     ToTransformerEnd = property(getToTransformerEnd, setToTransformerEnd)
 
     def addToTransformerEnd(self, *ToTransformerEnd):
-        for obj in ToTransformerEnd:
-            if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEnd.append(obj)
+        collection = self._ToTransformerEnd
+        for obj in members(ToTransformerEnd):
+            obj._ToMeshImpedance.append(self)
+            collection.append(obj)
 
     def removeToTransformerEnd(self, *ToTransformerEnd):
-        for obj in ToTransformerEnd:
-            if self in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.remove(self)
-            self._ToTransformerEnd.remove(obj)
+        collection = self._ToTransformerEnd
+        for obj in members(ToTransformerEnd):
+            obj._ToMeshImpedance.discard(self)
+            collection.discard(obj)
+
+    def removeAllToTransformerEnd(self):
+        for obj in self._ToTransformerEnd:
+            obj._ToMeshImpedance.discard(self)
+        self._ToTransformerEnd = RefList()
 
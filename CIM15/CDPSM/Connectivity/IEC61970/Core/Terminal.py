@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -38,7 +39,7 @@ class Terminal(IdentifiedObject):
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._TransformerEnd = []
+        self._TransformerEnd = RefList()
         self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
 
         self._ConductingEquipment = None
@@ -60,8 +61,7 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
@@ -77,20 +77,32 @@ class Terminal(IdentifiedObject):
 
     def setTransformerEnd(self, value):
         for x in self._TransformerEnd:
-            x.Terminal = None
-        for y in value:
-            y._Terminal = self
-        self._TransformerEnd = value
+            x._Terminal = None
+        self._TransformerEnd = RefList()
+        self.addTransformerEnd(value)
 
     TransformerEnd = property(getTransformerEnd, setTransformerEnd)
 
     def addTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.Terminal = self
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            old = obj._Terminal
+            if old is not None and old is not self:
+                old._TransformerEnd.discard(obj)
+            obj._Terminal = self
+            collection.append(obj)
 
     def removeTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.Terminal = None
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            if obj._Terminal is self:
+                obj._Terminal = None
+                collection.discard(obj)
+
+    def removeAllTransformerEnd(self):
+        for obj in self._TransformerEnd:
+            obj._Terminal = None
+        self._TransformerEnd = RefList()
 
     def getConductingEquipment(self):
         """ConductingEquipment has 1 or 2 terminals that may be connected to other ConductingEquipment terminals via ConnectivityNodes
@@ -99,8 +111,7 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
@@ -47,8 +47,7 @@ class PowerTransformerEnd(TransformerEnd):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.PowerTransformerEnd if x != self]
-            self._PowerTransformer._PowerTransformerEnd = filtered
+            self._PowerTransformer._PowerTransformerEnd.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
@@ -48,8 +48,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TransformerEnd if x != self]
-            self._Terminal._TransformerEnd = filtered
+            self._Terminal._TransformerEnd.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class TransformerTank(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -33,7 +34,7 @@ class TransformerTank(Equipment):
         self._PowerTransformer = None
         self.PowerTransformer = PowerTransformer
 
-        self._TransformerTankEnds = []
+        self._TransformerTankEnds = RefList()
         self.TransformerTankEnds = [] if TransformerTankEnds is None else TransformerTankEnds
 
         super(TransformerTank, self).__init__(*args, **kw_args)
@@ -52,8 +53,7 @@ class TransformerTank(Equipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerTanks if x != self]
-            self._PowerTransformer._TransformerTanks = filtered
+            self._PowerTransformer._TransformerTanks.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
@@ -69,18 +69,30 @@ class TransformerTank(Equipment):
 
     def setTransformerTankEnds(self, value):
         for x in self._TransformerTankEnds:
-            x.TransformerTank = None
-        for y in value:
-            y._TransformerTank = self
-        self._TransformerTankEnds = value
+            x._TransformerTank = None
+        self._TransformerTankEnds = RefList()
+        self.addTransformerTankEnds(value)
 
     TransformerTankEnds = property(getTransformerTankEnds, setTransformerTankEnds)
 
     def addTransformerTankEnds(self, *TransformerTankEnds):
-        for obj in TransformerTankEnds:
-            obj.TransformerTank = self
+        collection = self._TransformerTankEnds
+        for obj in members(TransformerTankEnds):
+            old = obj._TransformerTank
+            if old is not None and old is not self:
+                old._TransformerTankEnds.discard(obj)
+            obj._TransformerTank = self
+            collection.append(obj)
 
     def removeTransformerTankEnds(self, *TransformerTankEnds):
-        for obj in TransformerTankEnds:
-            obj.TransformerTank = None
+        collection = self._TransformerTankEnds
+        for obj in members(TransformerTankEnds):
+            if obj._TransformerTank is self:
+                obj._TransformerTank = None
+                collection.discard(obj)
+
+    def removeAllTransformerTankEnds(self):
+        for obj in self._TransformerTankEnds:
+            obj._TransformerTank = None
+        self._TransformerTankEnds = RefList()
 
@@ -52,8 +52,7 @@ class TransformerTankEnd(TransformerEnd):
 
     def setTransformerTank(self, value):
         if self._TransformerTank is not None:
-            filtered = [x for x in self.TransformerTank.TransformerTankEnds if x != self]
-            self._TransformerTank._TransformerTankEnds = filtered
+            self._TransformerTank._TransformerTankEnds.discard(self)
 
         self._TransformerTank = value
         if self._TransformerTank is not None:
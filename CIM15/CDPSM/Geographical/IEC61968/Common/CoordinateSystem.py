@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CoordinateSystem(IdentifiedObject):
     """Coordinate reference system.
@@ -33,7 +34,7 @@ class CoordinateSystem(IdentifiedObject):
         #: A Uniform Resource Name (URN) for the coordinate reference system (crs) used to define 'Location.PositionPoints'. An example would be the European Petroleum Survey Group (EPSG) code for a coordinate reference system, defined in URN under the Open Geospatial Consortium (OGC) namespace as: urn:ogc :def:uom:EPSG::XXXX, where XXXX is an EPSG code (a full list of codes can be found at the EPSG Registry website http://www.epsg-registry.org/). To define the coordinate system as being WGS84 (latitude, longitude) using an EPSG OGC, this attribute would be urn:ogc:def:uom:EPSG::4236. A profile should limit this code to a set of allowed URNs agreed to by all sending and receiving parties.
         self.crsUrn = crsUrn
 
-        self._Location = []
+        self._Location = RefList()
         self.Location = [] if Location is None else Location
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class CoordinateSystem(IdentifiedObject):
 
     def setLocation(self, value):
         for x in self._Location:
-            x.CoordinateSystem = None
-        for y in value:
-            y._CoordinateSystem = self
-        self._Location = value
+            x._CoordinateSystem = None
+        self._Location = RefList()
+        self.addLocation(value)
 
     Location = property(getLocation, setLocation)
 
     def addLocation(self, *Location):
-        for obj in Location:
-            obj.CoordinateSystem = self
+        collection = self._Location
+        for obj in members(Location):
+            old = obj._CoordinateSystem
+            if old is not None and old is not self:
+                old._Location.discard(obj)
+            obj._CoordinateSystem = self
+            collection.append(obj)
 
     def removeLocation(self, *Location):
-        for obj in Location:
-            obj.CoordinateSystem = None
+        collection = self._Location
+        for obj in members(Location):
+            if obj._CoordinateSystem is self:
+                obj._CoordinateSystem = None
+                collection.discard(obj)
+
+    def removeAllLocation(self):
+        for obj in self._Location:
+            obj._CoordinateSystem = None
+        self._Location = RefList()
 
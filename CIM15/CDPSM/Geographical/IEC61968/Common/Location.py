@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.
@@ -31,10 +32,10 @@ class Location(IdentifiedObject):
         @param PositionPoints: Sequence of position points describing this location, expressed in coordinate system 'Location.CoordinateSystem'.
         @param CoordinateSystem: Coordinate system used to describe position points of this location.
         """
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
-        self._PositionPoints = []
+        self._PositionPoints = RefList()
         self.PositionPoints = [] if PositionPoints is None else PositionPoints
 
         self._CoordinateSystem = None
@@ -56,20 +57,32 @@ class Location(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PowerSystemResources = value
+            x._Location = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Location = None
+        self._PowerSystemResources = RefList()
 
     def getPositionPoints(self):
         """Sequence of position points describing this location, expressed in coordinate system 'Location.CoordinateSystem'.
@@ -78,20 +91,32 @@ class Location(IdentifiedObject):
 
     def setPositionPoints(self, value):
         for x in self._PositionPoints:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PositionPoints = value
+            x._Location = None
+        self._PositionPoints = RefList()
+        self.addPositionPoints(value)
 
     PositionPoints = property(getPositionPoints, setPositionPoints)
 
     def addPositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = self
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PositionPoints.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = None
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPositionPoints(self):
+        for obj in self._PositionPoints:
+            obj._Location = None
+        self._PositionPoints = RefList()
 
     def getCoordinateSystem(self):
         """Coordinate system used to describe position points of this location.
@@ -100,8 +125,7 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Location if x != self]
-            self._CoordinateSystem._Location = filtered
+            self._CoordinateSystem._Location.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
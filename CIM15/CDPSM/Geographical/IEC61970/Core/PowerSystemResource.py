@@ -48,8 +48,7 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
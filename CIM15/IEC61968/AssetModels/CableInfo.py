@@ -87,8 +87,7 @@ class CableInfo(ConductorInfo):
 
     def setDuctBankInfo(self, value):
         if self._DuctBankInfo is not None:
-            filtered = [x for x in self.DuctBankInfo.CableInfos if x != self]
-            self._DuctBankInfo._CableInfos = filtered
+            self._DuctBankInfo._CableInfos.discard(self)
 
         self._DuctBankInfo = value
         if self._DuctBankInfo is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class EndDeviceInfo(AssetInfo):
     """End device data.End device data.
@@ -41,7 +42,7 @@ class EndDeviceInfo(AssetInfo):
         #: Rated voltage.
         self.ratedVoltage = ratedVoltage
 
-        self._EndDevices = []
+        self._EndDevices = RefList()
         self.EndDevices = [] if EndDevices is None else EndDevices
 
         super(EndDeviceInfo, self).__init__(*args, **kw_args)
@@ -60,18 +61,30 @@ class EndDeviceInfo(AssetInfo):
 
     def setEndDevices(self, value):
         for x in self._EndDevices:
-            x.EndDeviceInfo = None
-        for y in value:
-            y._EndDeviceInfo = self
-        self._EndDevices = value
+            x._EndDeviceInfo = None
+        self._EndDevices = RefList()
+        self.addEndDevices(value)
 
     EndDevices = property(getEndDevices, setEndDevices)
 
     def addEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.EndDeviceInfo = self
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            old = obj._EndDeviceInfo
+            if old is not None and old is not self:
+                old._EndDevices.discard(obj)
+            obj._EndDeviceInfo = self
+            collection.append(obj)
 
     def removeEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.EndDeviceInfo = None
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            if obj._EndDeviceInfo is self:
+                obj._EndDeviceInfo = None
+                collection.discard(obj)
+
+    def removeAllEndDevices(self):
+        for obj in self._EndDevices:
+            obj._EndDeviceInfo = None
+        self._EndDevices = RefList()
 
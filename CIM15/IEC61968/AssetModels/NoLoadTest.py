@@ -68,8 +68,7 @@ class NoLoadTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndNoLoadTest if x != self]
-            self._EnergisedEnd._EnergisedEndNoLoadTest = filtered
+            self._EnergisedEnd._EnergisedEndNoLoadTest.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
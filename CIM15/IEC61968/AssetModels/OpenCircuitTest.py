@@ -72,8 +72,7 @@ class OpenCircuitTest(TransformerTest):
 
     def setOpenEnd(self, value):
         if self._OpenEnd is not None:
-            filtered = [x for x in self.OpenEnd.OpenEndOpenCircuitTests if x != self]
-            self._OpenEnd._OpenEndOpenCircuitTests = filtered
+            self._OpenEnd._OpenEndOpenCircuitTests.discard(self)
 
         self._OpenEnd = value
         if self._OpenEnd is not None:
@@ -89,8 +88,7 @@ class OpenCircuitTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndOpenCircuitTests if x != self]
-            self._EnergisedEnd._EnergisedEndOpenCircuitTests = filtered
+            self._EnergisedEnd._EnergisedEndOpenCircuitTests.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
@@ -59,8 +59,7 @@ class OverheadConductorInfo(ConductorInfo):
 
     def setMountingPoint(self, value):
         if self._MountingPoint is not None:
-            filtered = [x for x in self.MountingPoint.OverheadConductors if x != self]
-            self._MountingPoint._OverheadConductors = filtered
+            self._MountingPoint._OverheadConductors.discard(self)
 
         self._MountingPoint = value
         if self._MountingPoint is not None:
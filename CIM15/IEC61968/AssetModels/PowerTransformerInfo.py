@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class PowerTransformerInfo(AssetInfo):
     """Set of power transformer data, from an equipment library.Set of power transformer data, from an equipment library.
@@ -30,10 +31,10 @@ class PowerTransformerInfo(AssetInfo):
         @param TransformerTankInfo: Data for all the tanks described by this power transformer data.
         @param PowerTransformers: All power transformers that can be described with this power transformer data.
         """
-        self._TransformerTankInfo = []
+        self._TransformerTankInfo = RefList()
         self.TransformerTankInfo = [] if TransformerTankInfo is None else TransformerTankInfo
 
-        self._PowerTransformers = []
+        self._PowerTransformers = RefList()
         self.PowerTransformers = [] if PowerTransformers is None else PowerTransformers
 
         super(PowerTransformerInfo, self).__init__(*args, **kw_args)
@@ -52,20 +53,32 @@ class PowerTransformerInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         for x in self._TransformerTankInfo:
-            x.PowerTransformerInfo = None
-        for y in value:
-            y._PowerTransformerInfo = self
-        self._TransformerTankInfo = value
+            x._PowerTransformerInfo = None
+        self._TransformerTankInfo = RefList()
+        self.addTransformerTankInfo(value)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
     def addTransformerTankInfo(self, *TransformerTankInfo):
-        for obj in TransformerTankInfo:
-            obj.PowerTransformerInfo = self
+        collection = self._TransformerTankInfo
+        for obj in members(TransformerTankInfo):
+            old = obj._PowerTransformerInfo
+            if old is not None and old is not self:
+                old._TransformerTankInfo.discard(obj)
+            obj._PowerTransformerInfo = self
+            collection.append(obj)
 
     def removeTransformerTankInfo(self, *TransformerTankInfo):
-        for obj in TransformerTankInfo:
-            obj.PowerTransformerInfo = None
+        collection = self._TransformerTankInfo
+        for obj in members(TransformerTankInfo):
+            if obj._PowerTransformerInfo is self:
+                obj._PowerTransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerTankInfo(self):
+        for obj in self._TransformerTankInfo:
+            obj._PowerTransformerInfo = None
+        self._TransformerTankInfo = RefList()
 
     def getPowerTransformers(self):
         """All power transformers that can be described with this power transformer data.
@@ -74,18 +87,30 @@ class PowerTransformerInfo(AssetInfo):
 
     def setPowerTransformers(self, value):
         for x in self._PowerTransformers:
-            x.PowerTransformerInfo = None
-        for y in value:
-            y._PowerTransformerInfo = self
-        self._PowerTransformers = value
+            x._PowerTransformerInfo = None
+        self._PowerTransformers = RefList()
+        self.addPowerTransformers(value)
 
     PowerTransformers = property(getPowerTransformers, setPowerTransformers)
 
     def addPowerTransformers(self, *PowerTransformers):
-        for obj in PowerTransformers:
-            obj.PowerTransformerInfo = self
+        collection = self._PowerTransformers
+        for obj in members(PowerTransformers):
+            old = obj._PowerTransformerInfo
+            if old is not None and old is not self:
+                old._PowerTransformers.discard(obj)
+            obj._PowerTransformerInfo = self
+            collection.append(obj)
 
     def removePowerTransformers(self, *PowerTransformers):
-        for obj in PowerTransformers:
-            obj.PowerTransformerInfo = None
+        collection = self._PowerTransformers
+        for obj in members(PowerTransformers):
+            if obj._PowerTransformerInfo is self:
+                obj._PowerTransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllPowerTransformers(self):
+        for obj in self._PowerTransformers:
+            obj._PowerTransformerInfo = None
+        self._PowerTransformers = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.TransformerTest import TransformerTest
+from PyCIM.RefList import RefList, members
 
 class ShortCircuitTest(TransformerTest):
     """Short-circuit test results determine mesh impedance parameters. They include load losses and leakage impedances.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one grounded winding.Short-circuit test results determine mesh impedance parameters. They include load losses and leakage impedances.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one grounded winding.
@@ -54,7 +55,7 @@ class ShortCircuitTest(TransformerTest):
         #: Tap step number for the energised end of the test pair.
         self.energisedEndStep = energisedEndStep
 
-        self._GroundedEnds = []
+        self._GroundedEnds = RefList()
         self.GroundedEnds = [] if GroundedEnds is None else GroundedEnds
 
         self._EnergisedEnd = None
@@ -76,26 +77,28 @@ class ShortCircuitTest(TransformerTest):
 
     def setGroundedEnds(self, value):
         for p in self._GroundedEnds:
-            filtered = [q for q in p.GroundedEndShortCircuitTests if q != self]
-            self._GroundedEnds._GroundedEndShortCircuitTests = filtered
-        for r in value:
-            if self not in r._GroundedEndShortCircuitTests:
-                r._GroundedEndShortCircuitTests.append(self)
-        self._GroundedEnds = value
+            p._GroundedEndShortCircuitTests.discard(self)
+        self._GroundedEnds = RefList()
+        self.addGroundedEnds(value)
 
     GroundedEnds = property(getGroundedEnds, setGroundedEnds)
 
     def addGroundedEnds(self, *GroundedEnds):
-        for obj in GroundedEnds:
-            if self not in obj._GroundedEndShortCircuitTests:
-                obj._GroundedEndShortCircuitTests.append(self)
-            self._GroundedEnds.append(obj)
+        collection = self._GroundedEnds
+        for obj in members(GroundedEnds):
+            obj._GroundedEndShortCircuitTests.append(self)
+            collection.append(obj)
 
     def removeGroundedEnds(self, *GroundedEnds):
-        for obj in GroundedEnds:
-            if self in obj._GroundedEndShortCircuitTests:
-                obj._GroundedEndShortCircuitTests.remove(self)
-            self._GroundedEnds.remove(obj)
+        collection = self._GroundedEnds
+        for obj in members(GroundedEnds):
+            obj._GroundedEndShortCircuitTests.discard(self)
+            collection.discard(obj)
+
+    def removeAllGroundedEnds(self):
+        for obj in self._GroundedEnds:
+            obj._GroundedEndShortCircuitTests.discard(self)
+        self._GroundedEnds = RefList()
 
     def getEnergisedEnd(self):
         """Transformer end that voltage is applied to in this short-circuit test. The test voltage is chosen to induce rated current in the energised end.
@@ -104,8 +107,7 @@ class ShortCircuitTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndShortCircuitTests if x != self]
-            self._EnergisedEnd._EnergisedEndShortCircuitTests = filtered
+            self._EnergisedEnd._EnergisedEndShortCircuitTests.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
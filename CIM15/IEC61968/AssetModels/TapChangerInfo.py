@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class TapChangerInfo(AssetInfo):
     """Tap changer data.Tap changer data.
@@ -89,7 +90,7 @@ class TapChangerInfo(AssetInfo):
         #: Basic Insulation Level (BIL) expressed as the impulse crest voltage of a nominal wave, typically 1.2 X 50 microsecond. This is a measure of the ability of the insulation to withstand very high voltage surges.
         self.bil = bil
 
-        self._TapChangers = []
+        self._TapChangers = RefList()
         self.TapChangers = [] if TapChangers is None else TapChangers
 
         super(TapChangerInfo, self).__init__(*args, **kw_args)
@@ -108,18 +109,30 @@ class TapChangerInfo(AssetInfo):
 
     def setTapChangers(self, value):
         for x in self._TapChangers:
-            x.TapChangerInfo = None
-        for y in value:
-            y._TapChangerInfo = self
-        self._TapChangers = value
+            x._TapChangerInfo = None
+        self._TapChangers = RefList()
+        self.addTapChangers(value)
 
     TapChangers = property(getTapChangers, setTapChangers)
 
     def addTapChangers(self, *TapChangers):
-        for obj in TapChangers:
-            obj.TapChangerInfo = self
+        collection = self._TapChangers
+        for obj in members(TapChangers):
+            old = obj._TapChangerInfo
+            if old is not None and old is not self:
+                old._TapChangers.discard(obj)
+            obj._TapChangerInfo = self
+            collection.append(obj)
 
     def removeTapChangers(self, *TapChangers):
-        for obj in TapChangers:
-            obj.TapChangerInfo = None
+        collection = self._TapChangers
+        for obj in members(TapChangers):
+            if obj._TapChangerInfo is self:
+                obj._TapChangerInfo = None
+                collection.discard(obj)
+
+    def removeAllTapChangers(self):
+        for obj in self._TapChangers:
+            obj._TapChangerInfo = None
+        self._TapChangers = RefList()
 
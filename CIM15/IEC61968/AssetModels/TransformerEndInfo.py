@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class TransformerEndInfo(AssetInfo):
     """Transformer end data.Transformer end data.
@@ -74,31 +75,31 @@ class TransformerEndInfo(AssetInfo):
         #: Winding phase angle where 360 degrees are represented with clock hours, so the valid values are {0, ..., 11}. For example, to express winding code 'Dyn11', set attributes as follows: 'connectionKind' = Yn and 'phaseAngleClock' = 11.
         self.phaseAngleClock = phaseAngleClock
 
-        self._FromMeshImpedance = []
+        self._FromMeshImpedance = RefList()
         self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
 
-        self._EnergisedEndNoLoadTest = []
+        self._EnergisedEndNoLoadTest = RefList()
         self.EnergisedEndNoLoadTest = [] if EnergisedEndNoLoadTest is None else EnergisedEndNoLoadTest
 
-        self._OpenEndOpenCircuitTests = []
+        self._OpenEndOpenCircuitTests = RefList()
         self.OpenEndOpenCircuitTests = [] if OpenEndOpenCircuitTests is None else OpenEndOpenCircuitTests
 
-        self._ToMeshImpedance = []
+        self._ToMeshImpedance = RefList()
         self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
 
-        self._TransformerEnd = []
+        self._TransformerEnd = RefList()
         self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
 
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._EnergisedEndOpenCircuitTests = []
+        self._EnergisedEndOpenCircuitTests = RefList()
         self.EnergisedEndOpenCircuitTests = [] if EnergisedEndOpenCircuitTests is None else EnergisedEndOpenCircuitTests
 
-        self._GroundedEndShortCircuitTests = []
+        self._GroundedEndShortCircuitTests = RefList()
         self.GroundedEndShortCircuitTests = [] if GroundedEndShortCircuitTests is None else GroundedEndShortCircuitTests
 
-        self._EnergisedEndShortCircuitTests = []
+        self._EnergisedEndShortCircuitTests = RefList()
         self.EnergisedEndShortCircuitTests = [] if EnergisedEndShortCircuitTests is None else EnergisedEndShortCircuitTests
 
         self._CoreAdmittance = None
@@ -120,20 +121,32 @@ class TransformerEndInfo(AssetInfo):
 
     def setFromMeshImpedance(self, value):
         for x in self._FromMeshImpedance:
-            x.FromTransformerEndInfo = None
-        for y in value:
-            y._FromTransformerEndInfo = self
-        self._FromMeshImpedance = value
+            x._FromTransformerEndInfo = None
+        self._FromMeshImpedance = RefList()
+        self.addFromMeshImpedance(value)
 
     FromMeshImpedance = property(getFromMeshImpedance, setFromMeshImpedance)
 
     def addFromMeshImpedance(self, *FromMeshImpedance):
-        for obj in FromMeshImpedance:
-            obj.FromTransformerEndInfo = self
+        collection = self._FromMeshImpedance
+        for obj in members(FromMeshImpedance):
+            old = obj._FromTransformerEndInfo
+            if old is not None and old is not self:
+                old._FromMeshImpedance.discard(obj)
+            obj._FromTransformerEndInfo = self
+            collection.append(obj)
 
     def removeFromMeshImpedance(self, *FromMeshImpedance):
-        for obj in FromMeshImpedance:
-            obj.FromTransformerEndInfo = None
+        collection = self._FromMeshImpedance
+        for obj in members(FromMeshImpedance):
+            if obj._FromTransformerEndInfo is self:
+                obj._FromTransformerEndInfo = None
+                collection.discard(obj)
+
+    def removeAllFromMeshImpedance(self):
+        for obj in self._FromMeshImpedance:
+            obj._FromTransformerEndInfo = None
+        self._FromMeshImpedance = RefList()
 
     def getEnergisedEndNoLoadTest(self):
         """All no-load test measurements in which this transformer end was energised.
@@ -142,20 +155,32 @@ class TransformerEndInfo(AssetInfo):
 
     def setEnergisedEndNoLoadTest(self, value):
         for x in self._EnergisedEndNoLoadTest:
-            x.EnergisedEnd = None
-        for y in value:
-            y._EnergisedEnd = self
-        self._EnergisedEndNoLoadTest = value
+            x._EnergisedEnd = None
+        self._EnergisedEndNoLoadTest = RefList()
+        self.addEnergisedEndNoLoadTest(value)
 
     EnergisedEndNoLoadTest = property(getEnergisedEndNoLoadTest, setEnergisedEndNoLoadTest)
 
     def addEnergisedEndNoLoadTest(self, *EnergisedEndNoLoadTest):
-        for obj in EnergisedEndNoLoadTest:
-            obj.EnergisedEnd = self
+        collection = self._EnergisedEndNoLoadTest
+        for obj in members(EnergisedEndNoLoadTest):
+            old = obj._EnergisedEnd
+            if old is not None and old is not self:
+                old._EnergisedEndNoLoadTest.discard(obj)
+            obj._EnergisedEnd = self
+            collection.append(obj)
 
     def removeEnergisedEndNoLoadTest(self, *EnergisedEndNoLoadTest):
-        for obj in EnergisedEndNoLoadTest:
-            obj.EnergisedEnd = None
+        collection = self._EnergisedEndNoLoadTest
+        for obj in members(EnergisedEndNoLoadTest):
+            if obj._EnergisedEnd is self:
+                obj._EnergisedEnd = None
+                collection.discard(obj)
+
+    def removeAllEnergisedEndNoLoadTest(self):
+        for obj in self._EnergisedEndNoLoadTest:
+            obj._EnergisedEnd = None
+        self._EnergisedEndNoLoadTest = RefList()
 
     def getOpenEndOpenCircuitTests(self):
         """All open-circuit test measurements in which this transformer end was not excited.
@@ -164,20 +189,32 @@ class TransformerEndInfo(AssetInfo):
 
     def setOpenEndOpenCircuitTests(self, value):
         for x in self._OpenEndOpenCircuitTests:
-            x.OpenEnd = None
-        for y in value:
-            y._OpenEnd = self
-        self._OpenEndOpenCircuitTests = value
+            x._OpenEnd = None
+        self._OpenEndOpenCircuitTests = RefList()
+        self.addOpenEndOpenCircuitTests(value)
 
     OpenEndOpenCircuitTests = property(getOpenEndOpenCircuitTests, setOpenEndOpenCircuitTests)
 
     def addOpenEndOpenCircuitTests(self, *OpenEndOpenCircuitTests):
-        for obj in OpenEndOpenCircuitTests:
-            obj.OpenEnd = self
+        collection = self._OpenEndOpenCircuitTests
+        for obj in members(OpenEndOpenCircuitTests):
+            old = obj._OpenEnd
+            if old is not None and old is not self:
+                old._OpenEndOpenCircuitTests.discard(obj)
+            obj._OpenEnd = self
+            collection.append(obj)
 
     def removeOpenEndOpenCircuitTests(self, *OpenEndOpenCircuitTests):
-        for obj in OpenEndOpenCircuitTests:
-            obj.OpenEnd = None
+        collection = self._OpenEndOpenCircuitTests
+        for obj in members(OpenEndOpenCircuitTests):
+            if obj._OpenEnd is self:
+                obj._OpenEnd = None
+                collection.discard(obj)
+
+    def removeAllOpenEndOpenCircuitTests(self):
+        for obj in self._OpenEndOpenCircuitTests:
+            obj._OpenEnd = None
+        self._OpenEndOpenCircuitTests = RefList()
 
     def getToMeshImpedance(self):
         """All mesh impedances between this 'from' and other 'to' transformer ends.
@@ -186,26 +223,28 @@ class TransformerEndInfo(AssetInfo):
 
     def setToMeshImpedance(self, value):
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEndInfo if q != self]
-            self._ToMeshImpedance._ToTransformerEndInfo = filtered
-        for r in value:
-            if self not in r._ToTransformerEndInfo:
-                r._ToTransformerEndInfo.append(self)
-        self._ToMeshImpedance = value
+            p._ToTransformerEndInfo.discard(self)
+        self._ToMeshImpedance = RefList()
+        self.addToMeshImpedance(value)
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
-        for obj in ToMeshImpedance:
-            if self not in obj._ToTransformerEndInfo:
-                obj._ToTransformerEndInfo.append(self)
-            self._ToMeshImpedance.append(obj)
+        collection = self._ToMeshImpedance
+        for obj in members(ToMeshImpedance):
+            obj._ToTransformerEndInfo.append(self)
+            collection.append(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
-        for obj in ToMeshImpedance:
-            if self in obj._ToTransformerEndInfo:
-                obj._ToTransformerEndInfo.remove(self)
-            self._ToMeshImpedance.remove(obj)
+        collection = self._ToMeshImpedance
+        for obj in members(ToMeshImpedance):
+            obj._ToTransformerEndInfo.discard(self)
+            collection.discard(obj)
+
+    def removeAllToMeshImpedance(self):
+        for obj in self._ToMeshImpedance:
+            obj._ToTransformerEndInfo.discard(self)
+        self._ToMeshImpedance = RefList()
 
     def getTransformerEnd(self):
         """All transformer ends described by this end data.
@@ -214,20 +253,32 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerEnd(self, value):
         for x in self._TransformerEnd:
-            x.TransformerEndInfo = None
-        for y in value:
-            y._TransformerEndInfo = self
-        self._TransformerEnd = value
+            x._TransformerEndInfo = None
+        self._TransformerEnd = RefList()
+        self.addTransformerEnd(value)
 
     TransformerEnd = property(getTransformerEnd, setTransformerEnd)
 
     def addTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.TransformerEndInfo = self
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            old = obj._TransformerEndInfo
+            if old is not None and old is not self:
+                old._TransformerEnd.discard(obj)
+            obj._TransformerEndInfo = self
+            collection.append(obj)
 
     def removeTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.TransformerEndInfo = None
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            if obj._TransformerEndInfo is self:
+                obj._TransformerEndInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerEnd(self):
+        for obj in self._TransformerEnd:
+            obj._TransformerEndInfo = None
+        self._TransformerEnd = RefList()
 
     def getTransformerTankInfo(self):
         """Transformer tank data that this end description is part of.
@@ -236,8 +287,7 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerEndInfos if x != self]
-            self._TransformerTankInfo._TransformerEndInfos = filtered
+            self._TransformerTankInfo._TransformerEndInfos.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
@@ -253,20 +303,32 @@ class TransformerEndInfo(AssetInfo):
 
     def setEnergisedEndOpenCircuitTests(self, value):
         for x in self._EnergisedEndOpenCircuitTests:
-            x.EnergisedEnd = None
-        for y in value:
-            y._EnergisedEnd = self
-        self._EnergisedEndOpenCircuitTests = value
+            x._EnergisedEnd = None
+        self._EnergisedEndOpenCircuitTests = RefList()
+        self.addEnergisedEndOpenCircuitTests(value)
 
     EnergisedEndOpenCircuitTests = property(getEnergisedEndOpenCircuitTests, setEnergisedEndOpenCircuitTests)
 
     def addEnergisedEndOpenCircuitTests(self, *EnergisedEndOpenCircuitTests):
-        for obj in EnergisedEndOpenCircuitTests:
-            obj.EnergisedEnd = self
+        collection = self._EnergisedEndOpenCircuitTests
+        for obj in members(EnergisedEndOpenCircuitTests):
+            old = obj._EnergisedEnd
+            if old is not None and old is not self:
+                old._EnergisedEndOpenCircuitTests.discard(obj)
+            obj._EnergisedEnd = self
+            collection.append(obj)
 
     def removeEnergisedEndOpenCircuitTests(self, *EnergisedEndOpenCircuitTests):
-        for obj in EnergisedEndOpenCircuitTests:
-            obj.EnergisedEnd = None
+        collection = self._EnergisedEndOpenCircuitTests
+        for obj in members(EnergisedEndOpenCircuitTests):
+            if obj._EnergisedEnd is self:
+                obj._EnergisedEnd = None
+                collection.discard(obj)
+
+    def removeAllEnergisedEndOpenCircuitTests(self):
+        for obj in self._EnergisedEndOpenCircuitTests:
+            obj._EnergisedEnd = None
+        self._EnergisedEndOpenCircuitTests = RefList()
 
     def getGroundedEndShortCircuitTests(self):
         """All short-circuit test measurements in which this transformer end was short-circuited.
@@ -275,26 +337,28 @@ class TransformerEndInfo(AssetInfo):
 
     def setGroundedEndShortCircuitTests(self, value):
         for p in self._GroundedEndShortCircuitTests:
-            filtered = [q for q in p.GroundedEnds if q != self]
-            self._GroundedEndShortCircuitTests._GroundedEnds = filtered
-        for r in value:
-            if self not in r._GroundedEnds:
-                r._GroundedEnds.append(self)
-        self._GroundedEndShortCircuitTests = value
+            p._GroundedEnds.discard(self)
+        self._GroundedEndShortCircuitTests = RefList()
+        self.addGroundedEndShortCircuitTests(value)
 
     GroundedEndShortCircuitTests = property(getGroundedEndShortCircuitTests, setGroundedEndShortCircuitTests)
 
     def addGroundedEndShortCircuitTests(self, *GroundedEndShortCircuitTests):
-        for obj in GroundedEndShortCircuitTests:
-            if self not in obj._GroundedEnds:
-                obj._GroundedEnds.append(self)
-            self._GroundedEndShortCircuitTests.append(obj)
+        collection = self._GroundedEndShortCircuitTests
+        for obj in members(GroundedEndShortCircuitTests):
+            obj._GroundedEnds.append(self)
+            collection.append(obj)
 
     def removeGroundedEndShortCircuitTests(self, *GroundedEndShortCircuitTests):
-        for obj in GroundedEndShortCircuitTests:
-            if self in obj._GroundedEnds:
-                obj._GroundedEnds.remove(self)
-            self._GroundedEndShortCircuitTests.remove(obj)
+        collection = self._GroundedEndShortCircuitTests
+        for obj in members(GroundedEndShortCircuitTests):
+            obj._GroundedEnds.discard(self)
+            collection.discard(obj)
+
+    def removeAllGroundedEndShortCircuitTests(self):
+        for obj in self._GroundedEndShortCircuitTests:
+            obj._GroundedEnds.discard(self)
+        self._GroundedEndShortCircuitTests = RefList()
 
     def getEnergisedEndShortCircuitTests(self):
         """All short-circuit test measurements in which this transformer end was energised.
@@ -303,20 +367,32 @@ class TransformerEndInfo(AssetInfo):
 
     def setEnergisedEndShortCircuitTests(self, value):
         for x in self._EnergisedEndShortCircuitTests:
-            x.EnergisedEnd = None
-        for y in value:
-            y._EnergisedEnd = self
-        self._EnergisedEndShortCircuitTests = value
+            x._EnergisedEnd = None
+        self._EnergisedEndShortCircuitTests = RefList()
+        self.addEnergisedEndShortCircuitTests(value)
 
     EnergisedEndShortCircuitTests = property(getEnergisedEndShortCircuitTests, setEnergisedEndShortCircuitTests)
 
     def addEnergisedEndShortCircuitTests(self, *EnergisedEndShortCircuitTests):
-        for obj in EnergisedEndShortCircuitTests:
-            obj.EnergisedEnd = self
+        collection = self._EnergisedEndShortCircuitTests
+        for obj in members(EnergisedEndShortCircuitTests):
+            old = obj._EnergisedEnd
+            if old is not None and old is not self:
+                old._EnergisedEndShortCircuitTests.discard(obj)
+            obj._EnergisedEnd = self
+            collection.append(obj)
 
     def removeEnergisedEndShortCircuitTests(self, *EnergisedEndShortCircuitTests):
-        for obj in EnergisedEndShortCircuitTests:
-            obj.EnergisedEnd = None
+        collection = self._EnergisedEndShortCircuitTests
+        for obj in members(EnergisedEndShortCircuitTests):
+            if obj._EnergisedEnd is self:
+                obj._EnergisedEnd = None
+                collection.discard(obj)
+
+    def removeAllEnergisedEndShortCircuitTests(self):
+        for obj in self._EnergisedEndShortCircuitTests:
+            obj._EnergisedEnd = None
+        self._EnergisedEndShortCircuitTests = RefList()
 
     def getCoreAdmittance(self):
         """Core admittance of this transformer end info, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end info only.
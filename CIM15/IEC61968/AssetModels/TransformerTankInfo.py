@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class TransformerTankInfo(AssetInfo):
     """Set of transformer tank data, from an equipment library.Set of transformer tank data, from an equipment library.
@@ -33,19 +34,19 @@ class TransformerTankInfo(AssetInfo):
         @param TransformerAssetModels:
         @param TransformerTanks: All transformer tanks that can be described with this transformer tank data.
         """
-        self._TransformerAssets = []
+        self._TransformerAssets = RefList()
         self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
 
-        self._TransformerEndInfos = []
+        self._TransformerEndInfos = RefList()
         self.TransformerEndInfos = [] if TransformerEndInfos is None else TransformerEndInfos
 
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._TransformerAssetModels = []
+        self._TransformerAssetModels = RefList()
         self.TransformerAssetModels = [] if TransformerAssetModels is None else TransformerAssetModels
 
-        self._TransformerTanks = []
+        self._TransformerTanks = RefList()
         self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
 
         super(TransformerTankInfo, self).__init__(*args, **kw_args)
@@ -63,20 +64,32 @@ class TransformerTankInfo(AssetInfo):
 
     def setTransformerAssets(self, value):
         for x in self._TransformerAssets:
-            x.TransformerInfo = None
-        for y in value:
-            y._TransformerInfo = self
-        self._TransformerAssets = value
+            x._TransformerInfo = None
+        self._TransformerAssets = RefList()
+        self.addTransformerAssets(value)
 
     TransformerAssets = property(getTransformerAssets, setTransformerAssets)
 
     def addTransformerAssets(self, *TransformerAssets):
-        for obj in TransformerAssets:
-            obj.TransformerInfo = self
+        collection = self._TransformerAssets
+        for obj in members(TransformerAssets):
+            old = obj._TransformerInfo
+            if old is not None and old is not self:
+                old._TransformerAssets.discard(obj)
+            obj._TransformerInfo = self
+            collection.append(obj)
 
     def removeTransformerAssets(self, *TransformerAssets):
-        for obj in TransformerAssets:
-            obj.TransformerInfo = None
+        collection = self._TransformerAssets
+        for obj in members(TransformerAssets):
+            if obj._TransformerInfo is self:
+                obj._TransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerAssets(self):
+        for obj in self._TransformerAssets:
+            obj._TransformerInfo = None
+        self._TransformerAssets = RefList()
 
     def getTransformerEndInfos(self):
         """Data for all the ends described by this transformer tank data.
@@ -85,20 +98,32 @@ class TransformerTankInfo(AssetInfo):
 
     def setTransformerEndInfos(self, value):
         for x in self._TransformerEndInfos:
-            x.TransformerTankInfo = None
-        for y in value:
-            y._TransformerTankInfo = self
-        self._TransformerEndInfos = value
+            x._TransformerTankInfo = None
+        self._TransformerEndInfos = RefList()
+        self.addTransformerEndInfos(value)
 
     TransformerEndInfos = property(getTransformerEndInfos, setTransformerEndInfos)
 
     def addTransformerEndInfos(self, *TransformerEndInfos):
-        for obj in TransformerEndInfos:
-            obj.TransformerTankInfo = self
+        collection = self._TransformerEndInfos
+        for obj in members(TransformerEndInfos):
+            old = obj._TransformerTankInfo
+            if old is not None and old is not self:
+                old._TransformerEndInfos.discard(obj)
+            obj._TransformerTankInfo = self
+            collection.append(obj)
 
     def removeTransformerEndInfos(self, *TransformerEndInfos):
-        for obj in TransformerEndInfos:
-            obj.TransformerTankInfo = None
+        collection = self._TransformerEndInfos
+        for obj in members(TransformerEndInfos):
+            if obj._TransformerTankInfo is self:
+                obj._TransformerTankInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerEndInfos(self):
+        for obj in self._TransformerEndInfos:
+            obj._TransformerTankInfo = None
+        self._TransformerEndInfos = RefList()
 
     def getPowerTransformerInfo(self):
         """Power transformer data that this tank description is part of.
@@ -107,8 +132,7 @@ class TransformerTankInfo(AssetInfo):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.TransformerTankInfo if x != self]
-            self._PowerTransformerInfo._TransformerTankInfo = filtered
+            self._PowerTransformerInfo._TransformerTankInfo.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
@@ -123,20 +147,32 @@ class TransformerTankInfo(AssetInfo):
 
     def setTransformerAssetModels(self, value):
         for x in self._TransformerAssetModels:
-            x.TransformerInfo = None
-        for y in value:
-            y._TransformerInfo = self
-        self._TransformerAssetModels = value
+            x._TransformerInfo = None
+        self._TransformerAssetModels = RefList()
+        self.addTransformerAssetModels(value)
 
     TransformerAssetModels = property(getTransformerAssetModels, setTransformerAssetModels)
 
     def addTransformerAssetModels(self, *TransformerAssetModels):
-        for obj in TransformerAssetModels:
-            obj.TransformerInfo = self
+        collection = self._TransformerAssetModels
+        for obj in members(TransformerAssetModels):
+            old = obj._TransformerInfo
+            if old is not None and old is not self:
+                old._TransformerAssetModels.discard(obj)
+            obj._TransformerInfo = self
+            collection.append(obj)
 
     def removeTransformerAssetModels(self, *TransformerAssetModels):
-        for obj in TransformerAssetModels:
-            obj.TransformerInfo = None
+        collection = self._TransformerAssetModels
+        for obj in members(TransformerAssetModels):
+            if obj._TransformerInfo is self:
+                obj._TransformerInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerAssetModels(self):
+        for obj in self._TransformerAssetModels:
+            obj._TransformerInfo = None
+        self._TransformerAssetModels = RefList()
 
     def getTransformerTanks(self):
         """All transformer tanks that can be described with this transformer tank data.
@@ -145,18 +181,30 @@ class TransformerTankInfo(AssetInfo):
 
     def setTransformerTanks(self, value):
         for x in self._TransformerTanks:
-            x.TransformerTankInfo = None
-        for y in value:
-            y._TransformerTankInfo = self
-        self._TransformerTanks = value
+            x._TransformerTankInfo = None
+        self._TransformerTanks = RefList()
+        self.addTransformerTanks(value)
 
     TransformerTanks = property(getTransformerTanks, setTransformerTanks)
 
     def addTransformerTanks(self, *TransformerTanks):
-        for obj in TransformerTanks:
-            obj.TransformerTankInfo = self
+        collection = self._TransformerTanks
+        for obj in members(TransformerTanks):
+            old = obj._TransformerTankInfo
+            if old is not None and old is not self:
+                old._TransformerTanks.discard(obj)
+            obj._TransformerTankInfo = self
+            collection.append(obj)
 
     def removeTransformerTanks(self, *TransformerTanks):
-        for obj in TransformerTanks:
-            obj.TransformerTankInfo = None
+        collection = self._TransformerTanks
+        for obj in members(TransformerTanks):
+            if obj._TransformerTankInfo is self:
+                obj._TransformerTankInfo = None
+                collection.discard(obj)
+
+    def removeAllTransformerTanks(self):
+        for obj in self._TransformerTanks:
+            obj._TransformerTankInfo = None
+        self._TransformerTanks = RefList()
 
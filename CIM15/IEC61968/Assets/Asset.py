@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Asset(IdentifiedObject):
     """Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.
@@ -102,27 +103,27 @@ class Asset(IdentifiedObject):
         #: Lot number for this asset. Even for the same model and version number, many assets are manufactured in lots.
         self.lotNumber = lotNumber
 
-        self._DocumentRoles = []
+        self._DocumentRoles = RefList()
         self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
 
-        self._Mediums = []
+        self._Mediums = RefList()
         self.Mediums = [] if Mediums is None else Mediums
 
-        self._ErpRecDeliveryItems = []
+        self._ErpRecDeliveryItems = RefList()
         self.ErpRecDeliveryItems = [] if ErpRecDeliveryItems is None else ErpRecDeliveryItems
 
-        self._Ratings = []
+        self._Ratings = RefList()
         self.Ratings = [] if Ratings is None else Ratings
 
-        self._ToAssetRoles = []
+        self._ToAssetRoles = RefList()
         self.ToAssetRoles = [] if ToAssetRoles is None else ToAssetRoles
 
         self.electronicAddress = electronicAddress
 
-        self._FromAssetRoles = []
+        self._FromAssetRoles = RefList()
         self.FromAssetRoles = [] if FromAssetRoles is None else FromAssetRoles
 
-        self._AssetFunctions = []
+        self._AssetFunctions = RefList()
         self.AssetFunctions = [] if AssetFunctions is None else AssetFunctions
 
         self._ErpItemMaster = None
@@ -131,7 +132,7 @@ class Asset(IdentifiedObject):
         self._ErpInventory = None
         self.ErpInventory = ErpInventory
 
-        self._ReliabilityInfos = []
+        self._ReliabilityInfos = RefList()
         self.ReliabilityInfos = [] if ReliabilityInfos is None else ReliabilityInfos
 
         self._AssetInfo = None
@@ -142,22 +143,22 @@ class Asset(IdentifiedObject):
 
         self.acceptanceTest = acceptanceTest
 
-        self._ErpOrganisationRoles = []
+        self._ErpOrganisationRoles = RefList()
         self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
 
-        self._ScheduledEvents = []
+        self._ScheduledEvents = RefList()
         self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
 
         self._AssetContainer = None
         self.AssetContainer = AssetContainer
 
-        self._AssetPropertyCurves = []
+        self._AssetPropertyCurves = RefList()
         self.AssetPropertyCurves = [] if AssetPropertyCurves is None else AssetPropertyCurves
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._ActivityRecords = []
+        self._ActivityRecords = RefList()
         self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
 
         self._Location = None
@@ -165,16 +166,16 @@ class Asset(IdentifiedObject):
 
         self.status = status
 
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         self._FinancialInfo = None
         self.FinancialInfo = FinancialInfo
 
-        self._Properties = []
+        self._Properties = RefList()
         self.Properties = [] if Properties is None else Properties
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
         super(Asset, self).__init__(*args, **kw_args)
@@ -192,20 +193,32 @@ class Asset(IdentifiedObject):
 
     def setDocumentRoles(self, value):
         for x in self._DocumentRoles:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._DocumentRoles = value
+            x._Asset = None
+        self._DocumentRoles = RefList()
+        self.addDocumentRoles(value)
 
     DocumentRoles = property(getDocumentRoles, setDocumentRoles)
 
     def addDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.Asset = self
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._DocumentRoles.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.Asset = None
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllDocumentRoles(self):
+        for obj in self._DocumentRoles:
+            obj._Asset = None
+        self._DocumentRoles = RefList()
 
     def getMediums(self):
         
@@ -213,26 +226,28 @@ class Asset(IdentifiedObject):
 
     def setMediums(self, value):
         for p in self._Mediums:
-            filtered = [q for q in p.Assets if q != self]
-            self._Mediums._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._Mediums = value
+            p._Assets.discard(self)
+        self._Mediums = RefList()
+        self.addMediums(value)
 
     Mediums = property(getMediums, setMediums)
 
     def addMediums(self, *Mediums):
-        for obj in Mediums:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._Mediums.append(obj)
+        collection = self._Mediums
+        for obj in members(Mediums):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeMediums(self, *Mediums):
-        for obj in Mediums:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._Mediums.remove(obj)
+        collection = self._Mediums
+        for obj in members(Mediums):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllMediums(self):
+        for obj in self._Mediums:
+            obj._Assets.discard(self)
+        self._Mediums = RefList()
 
     def getErpRecDeliveryItems(self):
         
@@ -240,26 +255,28 @@ class Asset(IdentifiedObject):
 
     def setErpRecDeliveryItems(self, value):
         for p in self._ErpRecDeliveryItems:
-            filtered = [q for q in p.Assets if q != self]
-            self._ErpRecDeliveryItems._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._ErpRecDeliveryItems = value
+            p._Assets.discard(self)
+        self._ErpRecDeliveryItems = RefList()
+        self.addErpRecDeliveryItems(value)
 
     ErpRecDeliveryItems = property(getErpRecDeliveryItems, setErpRecDeliveryItems)
 
     def addErpRecDeliveryItems(self, *ErpRecDeliveryItems):
-        for obj in ErpRecDeliveryItems:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ErpRecDeliveryItems.append(obj)
+        collection = self._ErpRecDeliveryItems
+        for obj in members(ErpRecDeliveryItems):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeErpRecDeliveryItems(self, *ErpRecDeliveryItems):
-        for obj in ErpRecDeliveryItems:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._ErpRecDeliveryItems.remove(obj)
+        collection = self._ErpRecDeliveryItems
+        for obj in members(ErpRecDeliveryItems):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpRecDeliveryItems(self):
+        for obj in self._ErpRecDeliveryItems:
+            obj._Assets.discard(self)
+        self._ErpRecDeliveryItems = RefList()
 
     def getRatings(self):
         """UserAttributes used to specify ratings of this asset. Ratings also can be used to set the initial value of operational measurement limits. Use 'name' to specify what kind of rating it is (e.g., voltage, current), and 'value' attribute for the actual value and unit information of the rating.
@@ -268,26 +285,28 @@ class Asset(IdentifiedObject):
 
     def setRatings(self, value):
         for p in self._Ratings:
-            filtered = [q for q in p.RatingAssets if q != self]
-            self._Ratings._RatingAssets = filtered
-        for r in value:
-            if self not in r._RatingAssets:
-                r._RatingAssets.append(self)
-        self._Ratings = value
+            p._RatingAssets.discard(self)
+        self._Ratings = RefList()
+        self.addRatings(value)
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
-        for obj in Ratings:
-            if self not in obj._RatingAssets:
-                obj._RatingAssets.append(self)
-            self._Ratings.append(obj)
+        collection = self._Ratings
+        for obj in members(Ratings):
+            obj._RatingAssets.append(self)
+            collection.append(obj)
 
     def removeRatings(self, *Ratings):
-        for obj in Ratings:
-            if self in obj._RatingAssets:
-                obj._RatingAssets.remove(self)
-            self._Ratings.remove(obj)
+        collection = self._Ratings
+        for obj in members(Ratings):
+            obj._RatingAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllRatings(self):
+        for obj in self._Ratings:
+            obj._RatingAssets.discard(self)
+        self._Ratings = RefList()
 
     def getToAssetRoles(self):
         
@@ -295,20 +314,32 @@ class Asset(IdentifiedObject):
 
     def setToAssetRoles(self, value):
         for x in self._ToAssetRoles:
-            x.FromAsset = None
-        for y in value:
-            y._FromAsset = self
-        self._ToAssetRoles = value
+            x._FromAsset = None
+        self._ToAssetRoles = RefList()
+        self.addToAssetRoles(value)
 
     ToAssetRoles = property(getToAssetRoles, setToAssetRoles)
 
     def addToAssetRoles(self, *ToAssetRoles):
-        for obj in ToAssetRoles:
-            obj.FromAsset = self
+        collection = self._ToAssetRoles
+        for obj in members(ToAssetRoles):
+            old = obj._FromAsset
+            if old is not None and old is not self:
+                old._ToAssetRoles.discard(obj)
+            obj._FromAsset = self
+            collection.append(obj)
 
     def removeToAssetRoles(self, *ToAssetRoles):
-        for obj in ToAssetRoles:
-            obj.FromAsset = None
+        collection = self._ToAssetRoles
+        for obj in members(ToAssetRoles):
+            if obj._FromAsset is self:
+                obj._FromAsset = None
+                collection.discard(obj)
+
+    def removeAllToAssetRoles(self):
+        for obj in self._ToAssetRoles:
+            obj._FromAsset = None
+        self._ToAssetRoles = RefList()
 
     # Electronic address.
     electronicAddress = None
@@ -319,20 +350,32 @@ class Asset(IdentifiedObject):
 
     def setFromAssetRoles(self, value):
         for x in self._FromAssetRoles:
-            x.ToAsset = None
-        for y in value:
-            y._ToAsset = self
-        self._FromAssetRoles = value
+            x._ToAsset = None
+        self._FromAssetRoles = RefList()
+        self.addFromAssetRoles(value)
 
     FromAssetRoles = property(getFromAssetRoles, setFromAssetRoles)
 
     def addFromAssetRoles(self, *FromAssetRoles):
-        for obj in FromAssetRoles:
-            obj.ToAsset = self
+        collection = self._FromAssetRoles
+        for obj in members(FromAssetRoles):
+            old = obj._ToAsset
+            if old is not None and old is not self:
+                old._FromAssetRoles.discard(obj)
+            obj._ToAsset = self
+            collection.append(obj)
 
     def removeFromAssetRoles(self, *FromAssetRoles):
-        for obj in FromAssetRoles:
-            obj.ToAsset = None
+        collection = self._FromAssetRoles
+        for obj in members(FromAssetRoles):
+            if obj._ToAsset is self:
+                obj._ToAsset = None
+                collection.discard(obj)
+
+    def removeAllFromAssetRoles(self):
+        for obj in self._FromAssetRoles:
+            obj._ToAsset = None
+        self._FromAssetRoles = RefList()
 
     def getAssetFunctions(self):
         
@@ -340,20 +383,32 @@ class Asset(IdentifiedObject):
 
     def setAssetFunctions(self, value):
         for x in self._AssetFunctions:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._AssetFunctions = value
+            x._Asset = None
+        self._AssetFunctions = RefList()
+        self.addAssetFunctions(value)
 
     AssetFunctions = property(getAssetFunctions, setAssetFunctions)
 
     def addAssetFunctions(self, *AssetFunctions):
-        for obj in AssetFunctions:
-            obj.Asset = self
+        collection = self._AssetFunctions
+        for obj in members(AssetFunctions):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._AssetFunctions.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeAssetFunctions(self, *AssetFunctions):
-        for obj in AssetFunctions:
-            obj.Asset = None
+        collection = self._AssetFunctions
+        for obj in members(AssetFunctions):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllAssetFunctions(self):
+        for obj in self._AssetFunctions:
+            obj._Asset = None
+        self._AssetFunctions = RefList()
 
     def getErpItemMaster(self):
         
@@ -391,26 +446,28 @@ class Asset(IdentifiedObject):
 
     def setReliabilityInfos(self, value):
         for p in self._ReliabilityInfos:
-            filtered = [q for q in p.Assets if q != self]
-            self._ReliabilityInfos._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._ReliabilityInfos = value
+            p._Assets.discard(self)
+        self._ReliabilityInfos = RefList()
+        self.addReliabilityInfos(value)
 
     ReliabilityInfos = property(getReliabilityInfos, setReliabilityInfos)
 
     def addReliabilityInfos(self, *ReliabilityInfos):
-        for obj in ReliabilityInfos:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ReliabilityInfos.append(obj)
+        collection = self._ReliabilityInfos
+        for obj in members(ReliabilityInfos):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeReliabilityInfos(self, *ReliabilityInfos):
-        for obj in ReliabilityInfos:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._ReliabilityInfos.remove(obj)
+        collection = self._ReliabilityInfos
+        for obj in members(ReliabilityInfos):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllReliabilityInfos(self):
+        for obj in self._ReliabilityInfos:
+            obj._Assets.discard(self)
+        self._ReliabilityInfos = RefList()
 
     def getAssetInfo(self):
         """Data applicable to this asset.
@@ -434,8 +491,7 @@ class Asset(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.Assets if x != self]
-            self._WorkTask._Assets = filtered
+            self._WorkTask._Assets.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -453,20 +509,32 @@ class Asset(IdentifiedObject):
 
     def setErpOrganisationRoles(self, value):
         for x in self._ErpOrganisationRoles:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._ErpOrganisationRoles = value
+            x._Asset = None
+        self._ErpOrganisationRoles = RefList()
+        self.addErpOrganisationRoles(value)
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.Asset = self
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._ErpOrganisationRoles.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.Asset = None
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllErpOrganisationRoles(self):
+        for obj in self._ErpOrganisationRoles:
+            obj._Asset = None
+        self._ErpOrganisationRoles = RefList()
 
     def getScheduledEvents(self):
         
@@ -474,26 +542,28 @@ class Asset(IdentifiedObject):
 
     def setScheduledEvents(self, value):
         for p in self._ScheduledEvents:
-            filtered = [q for q in p.Assets if q != self]
-            self._ScheduledEvents._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._ScheduledEvents = value
+            p._Assets.discard(self)
+        self._ScheduledEvents = RefList()
+        self.addScheduledEvents(value)
 
     ScheduledEvents = property(getScheduledEvents, setScheduledEvents)
 
     def addScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ScheduledEvents.append(obj)
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._ScheduledEvents.remove(obj)
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllScheduledEvents(self):
+        for obj in self._ScheduledEvents:
+            obj._Assets.discard(self)
+        self._ScheduledEvents = RefList()
 
     def getAssetContainer(self):
         
@@ -501,8 +571,7 @@ class Asset(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Assets if x != self]
-            self._AssetContainer._Assets = filtered
+            self._AssetContainer._Assets.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
@@ -517,26 +586,28 @@ class Asset(IdentifiedObject):
 
     def setAssetPropertyCurves(self, value):
         for p in self._AssetPropertyCurves:
-            filtered = [q for q in p.Assets if q != self]
-            self._AssetPropertyCurves._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._AssetPropertyCurves = value
+            p._Assets.discard(self)
+        self._AssetPropertyCurves = RefList()
+        self.addAssetPropertyCurves(value)
 
     AssetPropertyCurves = property(getAssetPropertyCurves, setAssetPropertyCurves)
 
     def addAssetPropertyCurves(self, *AssetPropertyCurves):
-        for obj in AssetPropertyCurves:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._AssetPropertyCurves.append(obj)
+        collection = self._AssetPropertyCurves
+        for obj in members(AssetPropertyCurves):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeAssetPropertyCurves(self, *AssetPropertyCurves):
-        for obj in AssetPropertyCurves:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._AssetPropertyCurves.remove(obj)
+        collection = self._AssetPropertyCurves
+        for obj in members(AssetPropertyCurves):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssetPropertyCurves(self):
+        for obj in self._AssetPropertyCurves:
+            obj._Assets.discard(self)
+        self._AssetPropertyCurves = RefList()
 
     def getChangeItems(self):
         
@@ -544,20 +615,32 @@ class Asset(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._ChangeItems = value
+            x._Asset = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Asset = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Asset = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._Asset = None
+        self._ChangeItems = RefList()
 
     def getActivityRecords(self):
         """All activity records created for this asset.
@@ -566,26 +649,28 @@ class Asset(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Assets if q != self]
-            self._ActivityRecords._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._ActivityRecords = value
+            p._Assets.discard(self)
+        self._ActivityRecords = RefList()
+        self.addActivityRecords(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ActivityRecords.append(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._ActivityRecords.remove(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllActivityRecords(self):
+        for obj in self._ActivityRecords:
+            obj._Assets.discard(self)
+        self._ActivityRecords = RefList()
 
     def getLocation(self):
         """Location of this asset.
@@ -594,8 +679,7 @@ class Asset(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Assets if x != self]
-            self._Location._Assets = filtered
+            self._Location._Assets.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -614,26 +698,28 @@ class Asset(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
-        for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
-        self._PowerSystemResources = value
+            p._Assets.discard(self)
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._Assets.append(self)
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self in obj._Assets:
-                obj._Assets.remove(self)
-            self._PowerSystemResources.remove(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._Assets.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Assets.discard(self)
+        self._PowerSystemResources = RefList()
 
     def getFinancialInfo(self):
         
@@ -657,26 +743,28 @@ class Asset(IdentifiedObject):
 
     def setProperties(self, value):
         for p in self._Properties:
-            filtered = [q for q in p.PropertyAssets if q != self]
-            self._Properties._PropertyAssets = filtered
-        for r in value:
-            if self not in r._PropertyAssets:
-                r._PropertyAssets.append(self)
-        self._Properties = value
+            p._PropertyAssets.discard(self)
+        self._Properties = RefList()
+        self.addProperties(value)
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
-        for obj in Properties:
-            if self not in obj._PropertyAssets:
-                obj._PropertyAssets.append(self)
-            self._Properties.append(obj)
+        collection = self._Properties
+        for obj in members(Properties):
+            obj._PropertyAssets.append(self)
+            collection.append(obj)
 
     def removeProperties(self, *Properties):
-        for obj in Properties:
-            if self in obj._PropertyAssets:
-                obj._PropertyAssets.remove(self)
-            self._Properties.remove(obj)
+        collection = self._Properties
+        for obj in members(Properties):
+            obj._PropertyAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllProperties(self):
+        for obj in self._Properties:
+            obj._PropertyAssets.discard(self)
+        self._Properties = RefList()
 
     def getMeasurements(self):
         
@@ -684,18 +772,30 @@ class Asset(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.Asset = None
-        for y in value:
-            y._Asset = self
-        self._Measurements = value
+            x._Asset = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Asset = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._Asset
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._Asset = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.Asset = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._Asset is self:
+                obj._Asset = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Asset = None
+        self._Measurements = RefList()
 
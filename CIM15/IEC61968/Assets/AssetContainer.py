@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from PyCIM.RefList import RefList, members
 
 class AssetContainer(Asset):
     """Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.
@@ -31,13 +32,13 @@ class AssetContainer(Asset):
         @param Assets:
         @param LandProperties:
         """
-        self._Seals = []
+        self._Seals = RefList()
         self.Seals = [] if Seals is None else Seals
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
-        self._LandProperties = []
+        self._LandProperties = RefList()
         self.LandProperties = [] if LandProperties is None else LandProperties
 
         super(AssetContainer, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class AssetContainer(Asset):
 
     def setSeals(self, value):
         for x in self._Seals:
-            x.AssetContainer = None
-        for y in value:
-            y._AssetContainer = self
-        self._Seals = value
+            x._AssetContainer = None
+        self._Seals = RefList()
+        self.addSeals(value)
 
     Seals = property(getSeals, setSeals)
 
     def addSeals(self, *Seals):
-        for obj in Seals:
-            obj.AssetContainer = self
+        collection = self._Seals
+        for obj in members(Seals):
+            old = obj._AssetContainer
+            if old is not None and old is not self:
+                old._Seals.discard(obj)
+            obj._AssetContainer = self
+            collection.append(obj)
 
     def removeSeals(self, *Seals):
-        for obj in Seals:
-            obj.AssetContainer = None
+        collection = self._Seals
+        for obj in members(Seals):
+            if obj._AssetContainer is self:
+                obj._AssetContainer = None
+                collection.discard(obj)
+
+    def removeAllSeals(self):
+        for obj in self._Seals:
+            obj._AssetContainer = None
+        self._Seals = RefList()
 
     def getAssets(self):
         
@@ -77,20 +90,32 @@ class AssetContainer(Asset):
 
     def setAssets(self, value):
         for x in self._Assets:
-            x.AssetContainer = None
-        for y in value:
-            y._AssetContainer = self
-        self._Assets = value
+            x._AssetContainer = None
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            obj.AssetContainer = self
+        collection = self._Assets
+        for obj in members(Assets):
+            old = obj._AssetContainer
+            if old is not None and old is not self:
+                old._Assets.discard(obj)
+            obj._AssetContainer = self
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            obj.AssetContainer = None
+        collection = self._Assets
+        for obj in members(Assets):
+            if obj._AssetContainer is self:
+                obj._AssetContainer = None
+                collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._AssetContainer = None
+        self._Assets = RefList()
 
     def getLandProperties(self):
         
@@ -98,24 +123,26 @@ class AssetContainer(Asset):
 
     def setLandProperties(self, value):
         for p in self._LandProperties:
-            filtered = [q for q in p.AssetContainers if q != self]
-            self._LandProperties._AssetContainers = filtered
-        for r in value:
-            if self not in r._AssetContainers:
-                r._AssetContainers.append(self)
-        self._LandProperties = value
+            p._AssetContainers.discard(self)
+        self._LandProperties = RefList()
+        self.addLandProperties(value)
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
-        for obj in LandProperties:
-            if self not in obj._AssetContainers:
-                obj._AssetContainers.append(self)
-            self._LandProperties.append(obj)
+        collection = self._LandProperties
+        for obj in members(LandProperties):
+            obj._AssetContainers.append(self)
+            collection.append(obj)
 
     def removeLandProperties(self, *LandProperties):
-        for obj in LandProperties:
-            if self in obj._AssetContainers:
-                obj._AssetContainers.remove(self)
-            self._LandProperties.remove(obj)
+        collection = self._LandProperties
+        for obj in members(LandProperties):
+            obj._AssetContainers.discard(self)
+            collection.discard(obj)
+
+    def removeAllLandProperties(self):
+        for obj in self._LandProperties:
+            obj._AssetContainers.discard(self)
+        self._LandProperties = RefList()
 
@@ -67,8 +67,7 @@ class AssetFunction(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.AssetFunctions if x != self]
-            self._Asset._AssetFunctions = filtered
+            self._Asset._AssetFunctions.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
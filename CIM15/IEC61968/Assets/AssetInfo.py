@@ -71,8 +71,7 @@ class AssetInfo(IdentifiedObject):
 
     def setDimensionsInfo(self, value):
         if self._DimensionsInfo is not None:
-            filtered = [x for x in self.DimensionsInfo.AssetInfos if x != self]
-            self._DimensionsInfo._AssetInfos = filtered
+            self._DimensionsInfo._AssetInfos.discard(self)
 
         self._DimensionsInfo = value
         if self._DimensionsInfo is not None:
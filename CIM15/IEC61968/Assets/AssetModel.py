@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class AssetModel(IdentifiedObject):
     """Model of an asset, either a product of a specific manufacturer or a generic asset model or material item. Data-sheet characteristics are available through the associated AssetInfo subclass and can be shared with asset or power system resource instances.Model of an asset, either a product of a specific manufacturer or a generic asset model or material item. Data-sheet characteristics are available through the associated AssetInfo subclass and can be shared with asset or power system resource instances.
@@ -33,7 +34,7 @@ class AssetModel(IdentifiedObject):
         self._AssetInfo = None
         self.AssetInfo = AssetInfo
 
-        self._ErpInventoryCounts = []
+        self._ErpInventoryCounts = RefList()
         self.ErpInventoryCounts = [] if ErpInventoryCounts is None else ErpInventoryCounts
 
         super(AssetModel, self).__init__(*args, **kw_args)
@@ -67,18 +68,30 @@ class AssetModel(IdentifiedObject):
 
     def setErpInventoryCounts(self, value):
         for x in self._ErpInventoryCounts:
-            x.AssetModel = None
-        for y in value:
-            y._AssetModel = self
-        self._ErpInventoryCounts = value
+            x._AssetModel = None
+        self._ErpInventoryCounts = RefList()
+        self.addErpInventoryCounts(value)
 
     ErpInventoryCounts = property(getErpInventoryCounts, setErpInventoryCounts)
 
     def addErpInventoryCounts(self, *ErpInventoryCounts):
-        for obj in ErpInventoryCounts:
-            obj.AssetModel = self
+        collection = self._ErpInventoryCounts
+        for obj in members(ErpInventoryCounts):
+            old = obj._AssetModel
+            if old is not None and old is not self:
+                old._ErpInventoryCounts.discard(obj)
+            obj._AssetModel = self
+            collection.append(obj)
 
     def removeErpInventoryCounts(self, *ErpInventoryCounts):
-        for obj in ErpInventoryCounts:
-            obj.AssetModel = None
+        collection = self._ErpInventoryCounts
+        for obj in members(ErpInventoryCounts):
+            if obj._AssetModel is self:
+                obj._AssetModel = None
+                collection.discard(obj)
+
+    def removeAllErpInventoryCounts(self):
+        for obj in self._ErpInventoryCounts:
+            obj._AssetModel = None
+        self._ErpInventoryCounts = RefList()
 
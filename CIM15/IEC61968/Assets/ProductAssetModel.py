@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetModel import AssetModel
+from PyCIM.RefList import RefList, members
 
 class ProductAssetModel(AssetModel):
     """Asset model by a specific manufacturer.Asset model by a specific manufacturer.
@@ -53,7 +54,7 @@ class ProductAssetModel(AssetModel):
         self._GenericAssetModelOrMaterial = None
         self.GenericAssetModelOrMaterial = GenericAssetModelOrMaterial
 
-        self._AssetModelCatalogueItems = []
+        self._AssetModelCatalogueItems = RefList()
         self.AssetModelCatalogueItems = [] if AssetModelCatalogueItems is None else AssetModelCatalogueItems
 
         super(ProductAssetModel, self).__init__(*args, **kw_args)
@@ -72,8 +73,7 @@ class ProductAssetModel(AssetModel):
 
     def setGenericAssetModelOrMaterial(self, value):
         if self._GenericAssetModelOrMaterial is not None:
-            filtered = [x for x in self.GenericAssetModelOrMaterial.ProductAssetModels if x != self]
-            self._GenericAssetModelOrMaterial._ProductAssetModels = filtered
+            self._GenericAssetModelOrMaterial._ProductAssetModels.discard(self)
 
         self._GenericAssetModelOrMaterial = value
         if self._GenericAssetModelOrMaterial is not None:
@@ -88,18 +88,30 @@ class ProductAssetModel(AssetModel):
 
     def setAssetModelCatalogueItems(self, value):
         for x in self._AssetModelCatalogueItems:
-            x.AssetModel = None
-        for y in value:
-            y._AssetModel = self
-        self._AssetModelCatalogueItems = value
+            x._AssetModel = None
+        self._AssetModelCatalogueItems = RefList()
+        self.addAssetModelCatalogueItems(value)
 
     AssetModelCatalogueItems = property(getAssetModelCatalogueItems, setAssetModelCatalogueItems)
 
     def addAssetModelCatalogueItems(self, *AssetModelCatalogueItems):
-        for obj in AssetModelCatalogueItems:
-            obj.AssetModel = self
+        collection = self._AssetModelCatalogueItems
+        for obj in members(AssetModelCatalogueItems):
+            old = obj._AssetModel
+            if old is not None and old is not self:
+                old._AssetModelCatalogueItems.discard(obj)
+            obj._AssetModel = self
+            collection.append(obj)
 
     def removeAssetModelCatalogueItems(self, *AssetModelCatalogueItems):
-        for obj in AssetModelCatalogueItems:
-            obj.AssetModel = None
+        collection = self._AssetModelCatalogueItems
+        for obj in members(AssetModelCatalogueItems):
+            if obj._AssetModel is self:
+                obj._AssetModel = None
+                collection.discard(obj)
+
+    def removeAllAssetModelCatalogueItems(self):
+        for obj in self._AssetModelCatalogueItems:
+            obj._AssetModel = None
+        self._AssetModelCatalogueItems = RefList()
 
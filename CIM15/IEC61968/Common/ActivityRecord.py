@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ActivityRecord(IdentifiedObject):
     """Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.
@@ -50,16 +51,16 @@ class ActivityRecord(IdentifiedObject):
         #: Category of event resulting in this activity record.
         self.category = category
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
-        self._Organisations = []
+        self._Organisations = RefList()
         self.Organisations = [] if Organisations is None else Organisations
 
-        self._Documents = []
+        self._Documents = RefList()
         self.Documents = [] if Documents is None else Documents
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         self.status = status
@@ -82,26 +83,28 @@ class ActivityRecord(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._ErpPersons._ActivityRecords = filtered
-        for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._ErpPersons = value
+            p._ActivityRecords.discard(self)
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._ErpPersons.append(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._ActivityRecords.append(self)
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self in obj._ActivityRecords:
-                obj._ActivityRecords.remove(self)
-            self._ErpPersons.remove(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._ActivityRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._ActivityRecords.discard(self)
+        self._ErpPersons = RefList()
 
     def getOrganisations(self):
         
@@ -109,26 +112,28 @@ class ActivityRecord(IdentifiedObject):
 
     def setOrganisations(self, value):
         for p in self._Organisations:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Organisations._ActivityRecords = filtered
-        for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Organisations = value
+            p._ActivityRecords.discard(self)
+        self._Organisations = RefList()
+        self.addOrganisations(value)
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
-        for obj in Organisations:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Organisations.append(obj)
+        collection = self._Organisations
+        for obj in members(Organisations):
+            obj._ActivityRecords.append(self)
+            collection.append(obj)
 
     def removeOrganisations(self, *Organisations):
-        for obj in Organisations:
-            if self in obj._ActivityRecords:
-                obj._ActivityRecords.remove(self)
-            self._Organisations.remove(obj)
+        collection = self._Organisations
+        for obj in members(Organisations):
+            obj._ActivityRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllOrganisations(self):
+        for obj in self._Organisations:
+            obj._ActivityRecords.discard(self)
+        self._Organisations = RefList()
 
     def getDocuments(self):
         """All documents for which this activity record has been created.
@@ -137,26 +142,28 @@ class ActivityRecord(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Documents._ActivityRecords = filtered
-        for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Documents = value
+            p._ActivityRecords.discard(self)
+        self._Documents = RefList()
+        self.addDocuments(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
-        for obj in Documents:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Documents.append(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ActivityRecords.append(self)
+            collection.append(obj)
 
     def removeDocuments(self, *Documents):
-        for obj in Documents:
-            if self in obj._ActivityRecords:
-                obj._ActivityRecords.remove(self)
-            self._Documents.remove(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ActivityRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllDocuments(self):
+        for obj in self._Documents:
+            obj._ActivityRecords.discard(self)
+        self._Documents = RefList()
 
     def getAssets(self):
         """All assets for which this activity record has been created.
@@ -165,26 +172,28 @@ class ActivityRecord(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Assets._ActivityRecords = filtered
-        for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Assets = value
+            p._ActivityRecords.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ActivityRecords.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._ActivityRecords:
-                obj._ActivityRecords.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ActivityRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._ActivityRecords.discard(self)
+        self._Assets = RefList()
 
     # Information on consequence of event resulting in this activity record.
     status = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CoordinateSystem(IdentifiedObject):
     """Coordinate reference system.Coordinate reference system.
@@ -35,13 +36,13 @@ class CoordinateSystem(IdentifiedObject):
         #: A Uniform Resource Name (URN) for the coordinate reference system (crs) used to define 'Location.PositionPoints'. An example would be the European Petroleum Survey Group (EPSG) code for a coordinate reference system, defined in URN under the Open Geospatial Consortium (OGC) namespace as: urn:ogc :def:uom:EPSG::XXXX, where XXXX is an EPSG code (a full list of codes can be found at the EPSG Registry website http://www.epsg-registry.org/). To define the coordinate system as being WGS84 (latitude, longitude) using an EPSG OGC, this attribute would be urn:ogc:def:uom:EPSG::4236. A profile should limit this code to a set of allowed URNs agreed to by all sending and receiving parties.
         self.crsUrn = crsUrn
 
-        self._Diagrams = []
+        self._Diagrams = RefList()
         self.Diagrams = [] if Diagrams is None else Diagrams
 
-        self._Location = []
+        self._Location = RefList()
         self.Location = [] if Location is None else Location
 
-        self._GmlDiagramObjects = []
+        self._GmlDiagramObjects = RefList()
         self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
@@ -59,20 +60,32 @@ class CoordinateSystem(IdentifiedObject):
 
     def setDiagrams(self, value):
         for x in self._Diagrams:
-            x.CoordinateSystem = None
-        for y in value:
-            y._CoordinateSystem = self
-        self._Diagrams = value
+            x._CoordinateSystem = None
+        self._Diagrams = RefList()
+        self.addDiagrams(value)
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
-        for obj in Diagrams:
-            obj.CoordinateSystem = self
+        collection = self._Diagrams
+        for obj in members(Diagrams):
+            old = obj._CoordinateSystem
+            if old is not None and old is not self:
+                old._Diagrams.discard(obj)
+            obj._CoordinateSystem = self
+            collection.append(obj)
 
     def removeDiagrams(self, *Diagrams):
-        for obj in Diagrams:
-            obj.CoordinateSystem = None
+        collection = self._Diagrams
+        for obj in members(Diagrams):
+            if obj._CoordinateSystem is self:
+                obj._CoordinateSystem = None
+                collection.discard(obj)
+
+    def removeAllDiagrams(self):
+        for obj in self._Diagrams:
+            obj._CoordinateSystem = None
+        self._Diagrams = RefList()
 
     def getLocation(self):
         """All locations described with position points in this coordinate system.
@@ -81,20 +94,32 @@ class CoordinateSystem(IdentifiedObject):
 
     def setLocation(self, value):
         for x in self._Location:
-            x.CoordinateSystem = None
-        for y in value:
-            y._CoordinateSystem = self
-        self._Location = value
+            x._CoordinateSystem = None
+        self._Location = RefList()
+        self.addLocation(value)
 
     Location = property(getLocation, setLocation)
 
     def addLocation(self, *Location):
-        for obj in Location:
-            obj.CoordinateSystem = self
+        collection = self._Location
+        for obj in members(Location):
+            old = obj._CoordinateSystem
+            if old is not None and old is not self:
+                old._Location.discard(obj)
+            obj._CoordinateSystem = self
+            collection.append(obj)
 
     def removeLocation(self, *Location):
-        for obj in Location:
-            obj.CoordinateSystem = None
+        collection = self._Location
+        for obj in members(Location):
+            if obj._CoordinateSystem is self:
+                obj._CoordinateSystem = None
+                collection.discard(obj)
+
+    def removeAllLocation(self):
+        for obj in self._Location:
+            obj._CoordinateSystem = None
+        self._Location = RefList()
 
     def getGmlDiagramObjects(self):
         
@@ -102,24 +127,26 @@ class CoordinateSystem(IdentifiedObject):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.CoordinateSystems if q != self]
-            self._GmlDiagramObjects._CoordinateSystems = filtered
-        for r in value:
-            if self not in r._CoordinateSystems:
-                r._CoordinateSystems.append(self)
-        self._GmlDiagramObjects = value
+            p._CoordinateSystems.discard(self)
+        self._GmlDiagramObjects = RefList()
+        self.addGmlDiagramObjects(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self not in obj._CoordinateSystems:
-                obj._CoordinateSystems.append(self)
-            self._GmlDiagramObjects.append(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._CoordinateSystems.append(self)
+            collection.append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self in obj._CoordinateSystems:
-                obj._CoordinateSystems.remove(self)
-            self._GmlDiagramObjects.remove(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._CoordinateSystems.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlDiagramObjects(self):
+        for obj in self._GmlDiagramObjects:
+            obj._CoordinateSystems.discard(self)
+        self._GmlDiagramObjects = RefList()
 
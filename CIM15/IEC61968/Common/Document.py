@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Document(IdentifiedObject):
     """Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.
@@ -68,49 +69,49 @@ class Document(IdentifiedObject):
         #: Utility-specific categorisation of this document, according to their corporate standards, practices, and existing IT systems (e.g., for management of assets, maintenance, work, outage, customers, etc.).
         self.category = category
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._ToDocumentRoles = []
+        self._ToDocumentRoles = RefList()
         self.ToDocumentRoles = [] if ToDocumentRoles is None else ToDocumentRoles
 
         self.electronicAddress = electronicAddress
 
-        self._NetworkDataSets = []
+        self._NetworkDataSets = RefList()
         self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
 
-        self._FromDocumentRoles = []
+        self._FromDocumentRoles = RefList()
         self.FromDocumentRoles = [] if FromDocumentRoles is None else FromDocumentRoles
 
-        self._ScheduleParameterInfos = []
+        self._ScheduleParameterInfos = RefList()
         self.ScheduleParameterInfos = [] if ScheduleParameterInfos is None else ScheduleParameterInfos
 
-        self._ErpOrganisationRoles = []
+        self._ErpOrganisationRoles = RefList()
         self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
-        self._ActivityRecords = []
+        self._ActivityRecords = RefList()
         self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
 
-        self._ChangeSets = []
+        self._ChangeSets = RefList()
         self.ChangeSets = [] if ChangeSets is None else ChangeSets
 
-        self._ErpPersonRoles = []
+        self._ErpPersonRoles = RefList()
         self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
 
-        self._ScheduledEvents = []
+        self._ScheduledEvents = RefList()
         self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
 
         self.docStatus = docStatus
 
-        self._AssetRoles = []
+        self._AssetRoles = RefList()
         self.AssetRoles = [] if AssetRoles is None else AssetRoles
 
         self.status = status
 
-        self._PowerSystemResourceRoles = []
+        self._PowerSystemResourceRoles = RefList()
         self.PowerSystemResourceRoles = [] if PowerSystemResourceRoles is None else PowerSystemResourceRoles
 
         super(Document, self).__init__(*args, **kw_args)
@@ -128,20 +129,32 @@ class Document(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.Document = None
-        for y in value:
-            y._Document = self
-        self._ChangeItems = value
+            x._Document = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Document = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._Document
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._Document = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Document = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._Document is self:
+                obj._Document = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._Document = None
+        self._ChangeItems = RefList()
 
     def getToDocumentRoles(self):
         
@@ -149,20 +162,32 @@ class Document(IdentifiedObject):
 
     def setToDocumentRoles(self, value):
         for x in self._ToDocumentRoles:
-            x.FromDocument = None
-        for y in value:
-            y._FromDocument = self
-        self._ToDocumentRoles = value
+            x._FromDocument = None
+        self._ToDocumentRoles = RefList()
+        self.addToDocumentRoles(value)
 
     ToDocumentRoles = property(getToDocumentRoles, setToDocumentRoles)
 
     def addToDocumentRoles(self, *ToDocumentRoles):
-        for obj in ToDocumentRoles:
-            obj.FromDocument = self
+        collection = self._ToDocumentRoles
+        for obj in members(ToDocumentRoles):
+            old = obj._FromDocument
+            if old is not None and old is not self:
+                old._ToDocumentRoles.discard(obj)
+            obj._FromDocument = self
+            collection.append(obj)
 
     def removeToDocumentRoles(self, *ToDocumentRoles):
-        for obj in ToDocumentRoles:
-            obj.FromDocument = None
+        collection = self._ToDocumentRoles
+        for obj in members(ToDocumentRoles):
+            if obj._FromDocument is self:
+                obj._FromDocument = None
+                collection.discard(obj)
+
+    def removeAllToDocumentRoles(self):
+        for obj in self._ToDocumentRoles:
+            obj._FromDocument = None
+        self._ToDocumentRoles = RefList()
 
     # Electronic address.
     electronicAddress = None
@@ -173,26 +198,28 @@ class Document(IdentifiedObject):
 
     def setNetworkDataSets(self, value):
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.Documents if q != self]
-            self._NetworkDataSets._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._NetworkDataSets = value
+            p._Documents.discard(self)
+        self._NetworkDataSets = RefList()
+        self.addNetworkDataSets(value)
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
-        for obj in NetworkDataSets:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._NetworkDataSets.append(obj)
+        collection = self._NetworkDataSets
+        for obj in members(NetworkDataSets):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
-        for obj in NetworkDataSets:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._NetworkDataSets.remove(obj)
+        collection = self._NetworkDataSets
+        for obj in members(NetworkDataSets):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllNetworkDataSets(self):
+        for obj in self._NetworkDataSets:
+            obj._Documents.discard(self)
+        self._NetworkDataSets = RefList()
 
     def getFromDocumentRoles(self):
         
@@ -200,20 +227,32 @@ class Document(IdentifiedObject):
 
     def setFromDocumentRoles(self, value):
         for x in self._FromDocumentRoles:
-            x.ToDocument = None
-        for y in value:
-            y._ToDocument = self
-        self._FromDocumentRoles = value
+            x._ToDocument = None
+        self._FromDocumentRoles = RefList()
+        self.addFromDocumentRoles(value)
 
     FromDocumentRoles = property(getFromDocumentRoles, setFromDocumentRoles)
 
     def addFromDocumentRoles(self, *FromDocumentRoles):
-        for obj in FromDocumentRoles:
-            obj.ToDocument = self
+        collection = self._FromDocumentRoles
+        for obj in members(FromDocumentRoles):
+            old = obj._ToDocument
+            if old is not None and old is not self:
+                old._FromDocumentRoles.discard(obj)
+            obj._ToDocument = self
+            collection.append(obj)
 
     def removeFromDocumentRoles(self, *FromDocumentRoles):
-        for obj in FromDocumentRoles:
-            obj.ToDocument = None
+        collection = self._FromDocumentRoles
+        for obj in members(FromDocumentRoles):
+            if obj._ToDocument is self:
+                obj._ToDocument = None
+                collection.discard(obj)
+
+    def removeAllFromDocumentRoles(self):
+        for obj in self._FromDocumentRoles:
+            obj._ToDocument = None
+        self._FromDocumentRoles = RefList()
 
     def getScheduleParameterInfos(self):
         
@@ -221,26 +260,28 @@ class Document(IdentifiedObject):
 
     def setScheduleParameterInfos(self, value):
         for p in self._ScheduleParameterInfos:
-            filtered = [q for q in p.Documents if q != self]
-            self._ScheduleParameterInfos._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._ScheduleParameterInfos = value
+            p._Documents.discard(self)
+        self._ScheduleParameterInfos = RefList()
+        self.addScheduleParameterInfos(value)
 
     ScheduleParameterInfos = property(getScheduleParameterInfos, setScheduleParameterInfos)
 
     def addScheduleParameterInfos(self, *ScheduleParameterInfos):
-        for obj in ScheduleParameterInfos:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ScheduleParameterInfos.append(obj)
+        collection = self._ScheduleParameterInfos
+        for obj in members(ScheduleParameterInfos):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeScheduleParameterInfos(self, *ScheduleParameterInfos):
-        for obj in ScheduleParameterInfos:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._ScheduleParameterInfos.remove(obj)
+        collection = self._ScheduleParameterInfos
+        for obj in members(ScheduleParameterInfos):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllScheduleParameterInfos(self):
+        for obj in self._ScheduleParameterInfos:
+            obj._Documents.discard(self)
+        self._ScheduleParameterInfos = RefList()
 
     def getErpOrganisationRoles(self):
         
@@ -248,20 +289,32 @@ class Document(IdentifiedObject):
 
     def setErpOrganisationRoles(self, value):
         for x in self._ErpOrganisationRoles:
-            x.Document = None
-        for y in value:
-            y._Document = self
-        self._ErpOrganisationRoles = value
+            x._Document = None
+        self._ErpOrganisationRoles = RefList()
+        self.addErpOrganisationRoles(value)
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.Document = self
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            old = obj._Document
+            if old is not None and old is not self:
+                old._ErpOrganisationRoles.discard(obj)
+            obj._Document = self
+            collection.append(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.Document = None
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            if obj._Document is self:
+                obj._Document = None
+                collection.discard(obj)
+
+    def removeAllErpOrganisationRoles(self):
+        for obj in self._ErpOrganisationRoles:
+            obj._Document = None
+        self._ErpOrganisationRoles = RefList()
 
     def getMeasurements(self):
         """Measurements are specified in types of documents, such as procedures.
@@ -270,26 +323,28 @@ class Document(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Documents if q != self]
-            self._Measurements._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._Measurements = value
+            p._Documents.discard(self)
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._Measurements.append(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._Measurements.remove(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Documents.discard(self)
+        self._Measurements = RefList()
 
     def getActivityRecords(self):
         """All activity records created for this document.
@@ -298,26 +353,28 @@ class Document(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Documents if q != self]
-            self._ActivityRecords._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._ActivityRecords = value
+            p._Documents.discard(self)
+        self._ActivityRecords = RefList()
+        self.addActivityRecords(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ActivityRecords.append(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._ActivityRecords.remove(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllActivityRecords(self):
+        for obj in self._ActivityRecords:
+            obj._Documents.discard(self)
+        self._ActivityRecords = RefList()
 
     def getChangeSets(self):
         
@@ -325,26 +382,28 @@ class Document(IdentifiedObject):
 
     def setChangeSets(self, value):
         for p in self._ChangeSets:
-            filtered = [q for q in p.Documents if q != self]
-            self._ChangeSets._Documents = filtered
-        for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
-        self._ChangeSets = value
+            p._Documents.discard(self)
+        self._ChangeSets = RefList()
+        self.addChangeSets(value)
 
     ChangeSets = property(getChangeSets, setChangeSets)
 
     def addChangeSets(self, *ChangeSets):
-        for obj in ChangeSets:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ChangeSets.append(obj)
+        collection = self._ChangeSets
+        for obj in members(ChangeSets):
+            obj._Documents.append(self)
+            collection.append(obj)
 
     def removeChangeSets(self, *ChangeSets):
-        for obj in ChangeSets:
-            if self in obj._Documents:
-                obj._Documents.remove(self)
-            self._ChangeSets.remove(obj)
+        collection = self._ChangeSets
+        for obj in members(ChangeSets):
+            obj._Documents.discard(self)
+            collection.discard(obj)
+
+    def removeAllChangeSets(self):
+        for obj in self._ChangeSets:
+            obj._Documents.discard(self)
+        self._ChangeSets = RefList()
 
     def getErpPersonRoles(self):
         
@@ -352,20 +411,32 @@ class Document(IdentifiedObject):
 
     def setErpPersonRoles(self, value):
         for x in self._ErpPersonRoles:
-            x.Document = None
-        for y in value:
-            y._Document = self
-        self._ErpPersonRoles = value
+            x._Document = None
+        self._ErpPersonRoles = RefList()
+        self.addErpPersonRoles(value)
 
     ErpPersonRoles = property(getErpPersonRoles, setErpPersonRoles)
 
     def addErpPersonRoles(self, *ErpPersonRoles):
-        for obj in ErpPersonRoles:
-            obj.Document = self
+        collection = self._ErpPersonRoles
+        for obj in members(ErpPersonRoles):
+            old = obj._Document
+            if old is not None and old is not self:
+                old._ErpPersonRoles.discard(obj)
+            obj._Document = self
+            collection.append(obj)
 
     def removeErpPersonRoles(self, *ErpPersonRoles):
-        for obj in ErpPersonRoles:
-            obj.Document = None
+        collection = self._ErpPersonRoles
+        for obj in members(ErpPersonRoles):
+            if obj._Document is self:
+                obj._Document = None
+                collection.discard(obj)
+
+    def removeAllErpPersonRoles(self):
+        for obj in self._ErpPersonRoles:
+            obj._Document = None
+        self._ErpPersonRoles = RefList()
 
     def getScheduledEvents(self):
         
@@ -373,20 +444,32 @@ class Document(IdentifiedObject):
 
     def setScheduledEvents(self, value):
         for x in self._ScheduledEvents:
-            x.Document = None
-        for y in value:
-            y._Document = self
-        self._ScheduledEvents = value
+            x._Document = None
+        self._ScheduledEvents = RefList()
+        self.addScheduledEvents(value)
 
     ScheduledEvents = property(getScheduledEvents, setScheduledEvents)
 
     def addScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            obj.Document = self
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            old = obj._Document
+            if old is not None and old is not self:
+                old._ScheduledEvents.discard(obj)
+            obj._Document = self
+            collection.append(obj)
 
     def removeScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            obj.Document = None
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            if obj._Document is self:
+                obj._Document = None
+                collection.discard(obj)
+
+    def removeAllScheduledEvents(self):
+        for obj in self._ScheduledEvents:
+            obj._Document = None
+        self._ScheduledEvents = RefList()
 
     # Status of this document. For status of subject matter this document represents (e.g., Agreement, Work), use 'status' attribute. Example values for 'docStatus.status' are draft, approved, cancelled, etc.
     docStatus = None
@@ -397,20 +480,32 @@ class Document(IdentifiedObject):
 
     def setAssetRoles(self, value):
         for x in self._AssetRoles:
-            x.Document = None
-        for y in value:
-            y._Document = self
-        self._AssetRoles = value
+            x._Document = None
+        self._AssetRoles = RefList()
+        self.addAssetRoles(value)
 
     AssetRoles = property(getAssetRoles, setAssetRoles)
 
     def addAssetRoles(self, *AssetRoles):
-        for obj in AssetRoles:
-            obj.Document = self
+        collection = self._AssetRoles
+        for obj in members(AssetRoles):
+            old = obj._Document
+            if old is not None and old is not self:
+                old._AssetRoles.discard(obj)
+            obj._Document = self
+            collection.append(obj)
 
     def removeAssetRoles(self, *AssetRoles):
-        for obj in AssetRoles:
-            obj.Document = None
+        collection = self._AssetRoles
+        for obj in members(AssetRoles):
+            if obj._Document is self:
+                obj._Document = None
+                collection.discard(obj)
+
+    def removeAllAssetRoles(self):
+        for obj in self._AssetRoles:
+            obj._Document = None
+        self._AssetRoles = RefList()
 
     # Status of subject matter (e.g., Agreement, Work) this document represents. For status of the document itself, use 'docStatus' attribute.
     status = None
@@ -421,18 +516,30 @@ class Document(IdentifiedObject):
 
     def setPowerSystemResourceRoles(self, value):
         for x in self._PowerSystemResourceRoles:
-            x.Document = None
-        for y in value:
-            y._Document = self
-        self._PowerSystemResourceRoles = value
+            x._Document = None
+        self._PowerSystemResourceRoles = RefList()
+        self.addPowerSystemResourceRoles(value)
 
     PowerSystemResourceRoles = property(getPowerSystemResourceRoles, setPowerSystemResourceRoles)
 
     def addPowerSystemResourceRoles(self, *PowerSystemResourceRoles):
-        for obj in PowerSystemResourceRoles:
-            obj.Document = self
+        collection = self._PowerSystemResourceRoles
+        for obj in members(PowerSystemResourceRoles):
+            old = obj._Document
+            if old is not None and old is not self:
+                old._PowerSystemResourceRoles.discard(obj)
+            obj._Document = self
+            collection.append(obj)
 
     def removePowerSystemResourceRoles(self, *PowerSystemResourceRoles):
-        for obj in PowerSystemResourceRoles:
-            obj.Document = None
+        collection = self._PowerSystemResourceRoles
+        for obj in members(PowerSystemResourceRoles):
+            if obj._Document is self:
+                obj._Document = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResourceRoles(self):
+        for obj in self._PowerSystemResourceRoles:
+            obj._Document = None
+        self._PowerSystemResourceRoles = RefList()
 
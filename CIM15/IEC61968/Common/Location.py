@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.
@@ -70,52 +71,52 @@ class Location(IdentifiedObject):
 
         self.phone2 = phone2
 
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         self.secondaryAddress = secondaryAddress
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._RedLines = []
+        self._RedLines = RefList()
         self.RedLines = [] if RedLines is None else RedLines
 
         self._DimensionsInfo = None
         self.DimensionsInfo = DimensionsInfo
 
-        self._LandProperties = []
+        self._LandProperties = RefList()
         self.LandProperties = [] if LandProperties is None else LandProperties
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
-        self._Hazards = []
+        self._Hazards = RefList()
         self.Hazards = [] if Hazards is None else Hazards
 
         self.status = status
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
-        self._PositionPoints = []
+        self._PositionPoints = RefList()
         self.PositionPoints = [] if PositionPoints is None else PositionPoints
 
         self.electronicAddress = electronicAddress
 
-        self._Directions = []
+        self._Directions = RefList()
         self.Directions = [] if Directions is None else Directions
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
-        self._Routes = []
+        self._Routes = RefList()
         self.Routes = [] if Routes is None else Routes
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
 
-        self._ErpOrganisations = []
+        self._ErpOrganisations = RefList()
         self.ErpOrganisations = [] if ErpOrganisations is None else ErpOrganisations
 
         super(Location, self).__init__(*args, **kw_args)
@@ -143,20 +144,32 @@ class Location(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for x in self._PowerSystemResources:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PowerSystemResources = value
+            x._Location = None
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = self
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PowerSystemResources.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            obj.Location = None
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._Location = None
+        self._PowerSystemResources = RefList()
 
     # Secondary address of the location. For example, PO Box address may have different ZIP code than that in the 'mainAddress'.
     secondaryAddress = None
@@ -167,20 +180,32 @@ class Location(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._ChangeItems = value
+            x._Location = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Location = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Location = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._Location = None
+        self._ChangeItems = RefList()
 
     def getRedLines(self):
         
@@ -188,26 +213,28 @@ class Location(IdentifiedObject):
 
     def setRedLines(self, value):
         for p in self._RedLines:
-            filtered = [q for q in p.Locations if q != self]
-            self._RedLines._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._RedLines = value
+            p._Locations.discard(self)
+        self._RedLines = RefList()
+        self.addRedLines(value)
 
     RedLines = property(getRedLines, setRedLines)
 
     def addRedLines(self, *RedLines):
-        for obj in RedLines:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._RedLines.append(obj)
+        collection = self._RedLines
+        for obj in members(RedLines):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeRedLines(self, *RedLines):
-        for obj in RedLines:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._RedLines.remove(obj)
+        collection = self._RedLines
+        for obj in members(RedLines):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllRedLines(self):
+        for obj in self._RedLines:
+            obj._Locations.discard(self)
+        self._RedLines = RefList()
 
     def getDimensionsInfo(self):
         
@@ -215,8 +242,7 @@ class Location(IdentifiedObject):
 
     def setDimensionsInfo(self, value):
         if self._DimensionsInfo is not None:
-            filtered = [x for x in self.DimensionsInfo.Locations if x != self]
-            self._DimensionsInfo._Locations = filtered
+            self._DimensionsInfo._Locations.discard(self)
 
         self._DimensionsInfo = value
         if self._DimensionsInfo is not None:
@@ -231,26 +257,28 @@ class Location(IdentifiedObject):
 
     def setLandProperties(self, value):
         for p in self._LandProperties:
-            filtered = [q for q in p.Locations if q != self]
-            self._LandProperties._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._LandProperties = value
+            p._Locations.discard(self)
+        self._LandProperties = RefList()
+        self.addLandProperties(value)
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
-        for obj in LandProperties:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._LandProperties.append(obj)
+        collection = self._LandProperties
+        for obj in members(LandProperties):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeLandProperties(self, *LandProperties):
-        for obj in LandProperties:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._LandProperties.remove(obj)
+        collection = self._LandProperties
+        for obj in members(LandProperties):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllLandProperties(self):
+        for obj in self._LandProperties:
+            obj._Locations.discard(self)
+        self._LandProperties = RefList()
 
     def getAssets(self):
         """All assets at this location.
@@ -259,20 +287,32 @@ class Location(IdentifiedObject):
 
     def setAssets(self, value):
         for x in self._Assets:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._Assets = value
+            x._Location = None
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            obj.Location = self
+        collection = self._Assets
+        for obj in members(Assets):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._Assets.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            obj.Location = None
+        collection = self._Assets
+        for obj in members(Assets):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._Location = None
+        self._Assets = RefList()
 
     def getHazards(self):
         
@@ -280,26 +320,28 @@ class Location(IdentifiedObject):
 
     def setHazards(self, value):
         for p in self._Hazards:
-            filtered = [q for q in p.Locations if q != self]
-            self._Hazards._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._Hazards = value
+            p._Locations.discard(self)
+        self._Hazards = RefList()
+        self.addHazards(value)
 
     Hazards = property(getHazards, setHazards)
 
     def addHazards(self, *Hazards):
-        for obj in Hazards:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Hazards.append(obj)
+        collection = self._Hazards
+        for obj in members(Hazards):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeHazards(self, *Hazards):
-        for obj in Hazards:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._Hazards.remove(obj)
+        collection = self._Hazards
+        for obj in members(Hazards):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllHazards(self):
+        for obj in self._Hazards:
+            obj._Locations.discard(self)
+        self._Hazards = RefList()
 
     # Status of this location.
     status = None
@@ -310,26 +352,28 @@ class Location(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.Locations if q != self]
-            self._Crews._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._Crews = value
+            p._Locations.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._Locations.discard(self)
+        self._Crews = RefList()
 
     def getPositionPoints(self):
         """Sequence of position points describing this location, expressed in coordinate system 'Location.CoordinateSystem'.
@@ -338,20 +382,32 @@ class Location(IdentifiedObject):
 
     def setPositionPoints(self, value):
         for x in self._PositionPoints:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._PositionPoints = value
+            x._Location = None
+        self._PositionPoints = RefList()
+        self.addPositionPoints(value)
 
     PositionPoints = property(getPositionPoints, setPositionPoints)
 
     def addPositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = self
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._PositionPoints.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removePositionPoints(self, *PositionPoints):
-        for obj in PositionPoints:
-            obj.Location = None
+        collection = self._PositionPoints
+        for obj in members(PositionPoints):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllPositionPoints(self):
+        for obj in self._PositionPoints:
+            obj._Location = None
+        self._PositionPoints = RefList()
 
     # Electronic address.
     electronicAddress = None
@@ -362,20 +418,32 @@ class Location(IdentifiedObject):
 
     def setDirections(self, value):
         for x in self._Directions:
-            x.Location = None
-        for y in value:
-            y._Location = self
-        self._Directions = value
+            x._Location = None
+        self._Directions = RefList()
+        self.addDirections(value)
 
     Directions = property(getDirections, setDirections)
 
     def addDirections(self, *Directions):
-        for obj in Directions:
-            obj.Location = self
+        collection = self._Directions
+        for obj in members(Directions):
+            old = obj._Location
+            if old is not None and old is not self:
+                old._Directions.discard(obj)
+            obj._Location = self
+            collection.append(obj)
 
     def removeDirections(self, *Directions):
-        for obj in Directions:
-            obj.Location = None
+        collection = self._Directions
+        for obj in members(Directions):
+            if obj._Location is self:
+                obj._Location = None
+                collection.discard(obj)
+
+    def removeAllDirections(self):
+        for obj in self._Directions:
+            obj._Location = None
+        self._Directions = RefList()
 
     def getMeasurements(self):
         
@@ -383,26 +451,28 @@ class Location(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Locations if q != self]
-            self._Measurements._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._Measurements = value
+            p._Locations.discard(self)
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Measurements.append(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._Measurements.remove(obj)
+        collection = self._Measurements
+        for obj in members(Measurements):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._Locations.discard(self)
+        self._Measurements = RefList()
 
     def getRoutes(self):
         
@@ -410,26 +480,28 @@ class Location(IdentifiedObject):
 
     def setRoutes(self, value):
         for p in self._Routes:
-            filtered = [q for q in p.Locations if q != self]
-            self._Routes._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._Routes = value
+            p._Locations.discard(self)
+        self._Routes = RefList()
+        self.addRoutes(value)
 
     Routes = property(getRoutes, setRoutes)
 
     def addRoutes(self, *Routes):
-        for obj in Routes:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Routes.append(obj)
+        collection = self._Routes
+        for obj in members(Routes):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeRoutes(self, *Routes):
-        for obj in Routes:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._Routes.remove(obj)
+        collection = self._Routes
+        for obj in members(Routes):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllRoutes(self):
+        for obj in self._Routes:
+            obj._Locations.discard(self)
+        self._Routes = RefList()
 
     def getCoordinateSystem(self):
         """Coordinate system used to describe position points of this location.
@@ -438,8 +510,7 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Location if x != self]
-            self._CoordinateSystem._Location = filtered
+            self._CoordinateSystem._Location.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
@@ -454,24 +525,26 @@ class Location(IdentifiedObject):
 
     def setErpOrganisations(self, value):
         for p in self._ErpOrganisations:
-            filtered = [q for q in p.Locations if q != self]
-            self._ErpOrganisations._Locations = filtered
-        for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
-        self._ErpOrganisations = value
+            p._Locations.discard(self)
+        self._ErpOrganisations = RefList()
+        self.addErpOrganisations(value)
 
     ErpOrganisations = property(getErpOrganisations, setErpOrganisations)
 
     def addErpOrganisations(self, *ErpOrganisations):
-        for obj in ErpOrganisations:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._ErpOrganisations.append(obj)
+        collection = self._ErpOrganisations
+        for obj in members(ErpOrganisations):
+            obj._Locations.append(self)
+            collection.append(obj)
 
     def removeErpOrganisations(self, *ErpOrganisations):
-        for obj in ErpOrganisations:
-            if self in obj._Locations:
-                obj._Locations.remove(self)
-            self._ErpOrganisations.remove(obj)
+        collection = self._ErpOrganisations
+        for obj in members(ErpOrganisations):
+            obj._Locations.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpOrganisations(self):
+        for obj in self._ErpOrganisations:
+            obj._Locations.discard(self)
+        self._ErpOrganisations = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Organisation(IdentifiedObject):
     """Organisation that might have roles as utility, contractor, supplier, manufacturer, customer, etc.Organisation that might have roles as utility, contractor, supplier, manufacturer, customer, etc.
@@ -44,7 +45,7 @@ class Organisation(IdentifiedObject):
 
         self.electronicAddress = electronicAddress
 
-        self._BusinessRoles = []
+        self._BusinessRoles = RefList()
         self.BusinessRoles = [] if BusinessRoles is None else BusinessRoles
 
         super(Organisation, self).__init__(*args, **kw_args)
@@ -77,24 +78,26 @@ class Organisation(IdentifiedObject):
 
     def setBusinessRoles(self, value):
         for p in self._BusinessRoles:
-            filtered = [q for q in p.Organisations if q != self]
-            self._BusinessRoles._Organisations = filtered
-        for r in value:
-            if self not in r._Organisations:
-                r._Organisations.append(self)
-        self._BusinessRoles = value
+            p._Organisations.discard(self)
+        self._BusinessRoles = RefList()
+        self.addBusinessRoles(value)
 
     BusinessRoles = property(getBusinessRoles, setBusinessRoles)
 
     def addBusinessRoles(self, *BusinessRoles):
-        for obj in BusinessRoles:
-            if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._BusinessRoles.append(obj)
+        collection = self._BusinessRoles
+        for obj in members(BusinessRoles):
+            obj._Organisations.append(self)
+            collection.append(obj)
 
     def removeBusinessRoles(self, *BusinessRoles):
-        for obj in BusinessRoles:
-            if self in obj._Organisations:
-                obj._Organisations.remove(self)
-            self._BusinessRoles.remove(obj)
+        collection = self._BusinessRoles
+        for obj in members(BusinessRoles):
+            obj._Organisations.discard(self)
+            collection.discard(obj)
+
+    def removeAllBusinessRoles(self):
+        for obj in self._BusinessRoles:
+            obj._Organisations.discard(self)
+        self._BusinessRoles = RefList()
 
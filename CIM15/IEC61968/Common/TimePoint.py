@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TimePoint(IdentifiedObject):
     """A point in time within a sequence of points in time relative to a TimeSchedule.A point in time within a sequence of points in time relative to a TimeSchedule.
@@ -51,7 +52,7 @@ class TimePoint(IdentifiedObject):
         self._TimeSchedule = None
         self.TimeSchedule = TimeSchedule
 
-        self._ScheduledEvents = []
+        self._ScheduledEvents = RefList()
         self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
 
         super(TimePoint, self).__init__(*args, **kw_args)
@@ -76,8 +77,7 @@ class TimePoint(IdentifiedObject):
 
     def setTimeSchedule(self, value):
         if self._TimeSchedule is not None:
-            filtered = [x for x in self.TimeSchedule.TimePoints if x != self]
-            self._TimeSchedule._TimePoints = filtered
+            self._TimeSchedule._TimePoints.discard(self)
 
         self._TimeSchedule = value
         if self._TimeSchedule is not None:
@@ -92,18 +92,30 @@ class TimePoint(IdentifiedObject):
 
     def setScheduledEvents(self, value):
         for x in self._ScheduledEvents:
-            x.TimePoint = None
-        for y in value:
-            y._TimePoint = self
-        self._ScheduledEvents = value
+            x._TimePoint = None
+        self._ScheduledEvents = RefList()
+        self.addScheduledEvents(value)
 
     ScheduledEvents = property(getScheduledEvents, setScheduledEvents)
 
     def addScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            obj.TimePoint = self
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            old = obj._TimePoint
+            if old is not None and old is not self:
+                old._ScheduledEvents.discard(obj)
+            obj._TimePoint = self
+            collection.append(obj)
 
     def removeScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            obj.TimePoint = None
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            if obj._TimePoint is self:
+                obj._TimePoint = None
+                collection.discard(obj)
+
+    def removeAllScheduledEvents(self):
+        for obj in self._ScheduledEvents:
+            obj._TimePoint = None
+        self._ScheduledEvents = RefList()
 
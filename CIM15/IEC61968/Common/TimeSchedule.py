@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class TimeSchedule(Document):
     """Description of anything that changes through time. Time schedule is used to perform a single-valued function of time. Use inherited 'category' attribute to give additional information on this schedule, such as: periodic (hourly, daily, weekly, monthly, etc.), day of the month, by date, calendar (specific times and dates).Description of anything that changes through time. Time schedule is used to perform a single-valued function of time. Use inherited 'category' attribute to give additional information on this schedule, such as: periodic (hourly, daily, weekly, monthly, etc.), day of the month, by date, calendar (specific times and dates).
@@ -46,7 +47,7 @@ class TimeSchedule(Document):
         #: Interval at which the scheduled action repeats (e.g., first Monday of every month, last day of the month, etc.).
         self.recurrencePattern = recurrencePattern
 
-        self._TimePoints = []
+        self._TimePoints = RefList()
         self.TimePoints = [] if TimePoints is None else TimePoints
 
         self.scheduleInterval = scheduleInterval
@@ -67,20 +68,32 @@ class TimeSchedule(Document):
 
     def setTimePoints(self, value):
         for x in self._TimePoints:
-            x.TimeSchedule = None
-        for y in value:
-            y._TimeSchedule = self
-        self._TimePoints = value
+            x._TimeSchedule = None
+        self._TimePoints = RefList()
+        self.addTimePoints(value)
 
     TimePoints = property(getTimePoints, setTimePoints)
 
     def addTimePoints(self, *TimePoints):
-        for obj in TimePoints:
-            obj.TimeSchedule = self
+        collection = self._TimePoints
+        for obj in members(TimePoints):
+            old = obj._TimeSchedule
+            if old is not None and old is not self:
+                old._TimePoints.discard(obj)
+            obj._TimeSchedule = self
+            collection.append(obj)
 
     def removeTimePoints(self, *TimePoints):
-        for obj in TimePoints:
-            obj.TimeSchedule = None
+        collection = self._TimePoints
+        for obj in members(TimePoints):
+            if obj._TimeSchedule is self:
+                obj._TimeSchedule = None
+                collection.discard(obj)
+
+    def removeAllTimePoints(self):
+        for obj in self._TimePoints:
+            obj._TimeSchedule = None
+        self._TimePoints = RefList()
 
     # Schedule date and time interval.
     scheduleInterval = None
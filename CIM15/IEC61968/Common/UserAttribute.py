@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class UserAttribute(Element):
     """Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.
@@ -49,10 +50,10 @@ class UserAttribute(Element):
         #: Sequence number for this attribute in a list of attributes.
         self.sequenceNumber = sequenceNumber
 
-        self._ErpLedgerEntries = []
+        self._ErpLedgerEntries = RefList()
         self.ErpLedgerEntries = [] if ErpLedgerEntries is None else ErpLedgerEntries
 
-        self._ProcedureDataSets = []
+        self._ProcedureDataSets = RefList()
         self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
 
         self._Transaction = None
@@ -64,16 +65,16 @@ class UserAttribute(Element):
         self._Procedure = None
         self.Procedure = Procedure
 
-        self._PropertyAssets = []
+        self._PropertyAssets = RefList()
         self.PropertyAssets = [] if PropertyAssets is None else PropertyAssets
 
         self._RatingSpecification = None
         self.RatingSpecification = RatingSpecification
 
-        self._ErpInvoiceLineItems = []
+        self._ErpInvoiceLineItems = RefList()
         self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
 
-        self._RatingAssets = []
+        self._RatingAssets = RefList()
         self.RatingAssets = [] if RatingAssets is None else RatingAssets
 
         super(UserAttribute, self).__init__(*args, **kw_args)
@@ -91,26 +92,28 @@ class UserAttribute(Element):
 
     def setErpLedgerEntries(self, value):
         for p in self._ErpLedgerEntries:
-            filtered = [q for q in p.UserAttributes if q != self]
-            self._ErpLedgerEntries._UserAttributes = filtered
-        for r in value:
-            if self not in r._UserAttributes:
-                r._UserAttributes.append(self)
-        self._ErpLedgerEntries = value
+            p._UserAttributes.discard(self)
+        self._ErpLedgerEntries = RefList()
+        self.addErpLedgerEntries(value)
 
     ErpLedgerEntries = property(getErpLedgerEntries, setErpLedgerEntries)
 
     def addErpLedgerEntries(self, *ErpLedgerEntries):
-        for obj in ErpLedgerEntries:
-            if self not in obj._UserAttributes:
-                obj._UserAttributes.append(self)
-            self._ErpLedgerEntries.append(obj)
+        collection = self._ErpLedgerEntries
+        for obj in members(ErpLedgerEntries):
+            obj._UserAttributes.append(self)
+            collection.append(obj)
 
     def removeErpLedgerEntries(self, *ErpLedgerEntries):
-        for obj in ErpLedgerEntries:
-            if self in obj._UserAttributes:
-                obj._UserAttributes.remove(self)
-            self._ErpLedgerEntries.remove(obj)
+        collection = self._ErpLedgerEntries
+        for obj in members(ErpLedgerEntries):
+            obj._UserAttributes.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpLedgerEntries(self):
+        for obj in self._ErpLedgerEntries:
+            obj._UserAttributes.discard(self)
+        self._ErpLedgerEntries = RefList()
 
     def getProcedureDataSets(self):
         
@@ -118,26 +121,28 @@ class UserAttribute(Element):
 
     def setProcedureDataSets(self, value):
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.Properties if q != self]
-            self._ProcedureDataSets._Properties = filtered
-        for r in value:
-            if self not in r._Properties:
-                r._Properties.append(self)
-        self._ProcedureDataSets = value
+            p._Properties.discard(self)
+        self._ProcedureDataSets = RefList()
+        self.addProcedureDataSets(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._ProcedureDataSets.append(obj)
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            obj._Properties.append(self)
+            collection.append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            if self in obj._Properties:
-                obj._Properties.remove(self)
-            self._ProcedureDataSets.remove(obj)
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            obj._Properties.discard(self)
+            collection.discard(obj)
+
+    def removeAllProcedureDataSets(self):
+        for obj in self._ProcedureDataSets:
+            obj._Properties.discard(self)
+        self._ProcedureDataSets = RefList()
 
     def getTransaction(self):
         """Transaction for which this snapshot has been recorded.
@@ -146,8 +151,7 @@ class UserAttribute(Element):
 
     def setTransaction(self, value):
         if self._Transaction is not None:
-            filtered = [x for x in self.Transaction.UserAttributes if x != self]
-            self._Transaction._UserAttributes = filtered
+            self._Transaction._UserAttributes.discard(self)
 
         self._Transaction = value
         if self._Transaction is not None:
@@ -162,8 +166,7 @@ class UserAttribute(Element):
 
     def setPropertySpecification(self, value):
         if self._PropertySpecification is not None:
-            filtered = [x for x in self.PropertySpecification.AssetProperites if x != self]
-            self._PropertySpecification._AssetProperites = filtered
+            self._PropertySpecification._AssetProperites.discard(self)
 
         self._PropertySpecification = value
         if self._PropertySpecification is not None:
@@ -178,8 +181,7 @@ class UserAttribute(Element):
 
     def setProcedure(self, value):
         if self._Procedure is not None:
-            filtered = [x for x in self.Procedure.ProcedureValues if x != self]
-            self._Procedure._ProcedureValues = filtered
+            self._Procedure._ProcedureValues.discard(self)
 
         self._Procedure = value
         if self._Procedure is not None:
@@ -194,26 +196,28 @@ class UserAttribute(Element):
 
     def setPropertyAssets(self, value):
         for p in self._PropertyAssets:
-            filtered = [q for q in p.Properties if q != self]
-            self._PropertyAssets._Properties = filtered
-        for r in value:
-            if self not in r._Properties:
-                r._Properties.append(self)
-        self._PropertyAssets = value
+            p._Properties.discard(self)
+        self._PropertyAssets = RefList()
+        self.addPropertyAssets(value)
 
     PropertyAssets = property(getPropertyAssets, setPropertyAssets)
 
     def addPropertyAssets(self, *PropertyAssets):
-        for obj in PropertyAssets:
-            if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._PropertyAssets.append(obj)
+        collection = self._PropertyAssets
+        for obj in members(PropertyAssets):
+            obj._Properties.append(self)
+            collection.append(obj)
 
     def removePropertyAssets(self, *PropertyAssets):
-        for obj in PropertyAssets:
-            if self in obj._Properties:
-                obj._Properties.remove(self)
-            self._PropertyAssets.remove(obj)
+        collection = self._PropertyAssets
+        for obj in members(PropertyAssets):
+            obj._Properties.discard(self)
+            collection.discard(obj)
+
+    def removeAllPropertyAssets(self):
+        for obj in self._PropertyAssets:
+            obj._Properties.discard(self)
+        self._PropertyAssets = RefList()
 
     def getRatingSpecification(self):
         
@@ -221,8 +225,7 @@ class UserAttribute(Element):
 
     def setRatingSpecification(self, value):
         if self._RatingSpecification is not None:
-            filtered = [x for x in self.RatingSpecification.Ratings if x != self]
-            self._RatingSpecification._Ratings = filtered
+            self._RatingSpecification._Ratings.discard(self)
 
         self._RatingSpecification = value
         if self._RatingSpecification is not None:
@@ -237,26 +240,28 @@ class UserAttribute(Element):
 
     def setErpInvoiceLineItems(self, value):
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.UserAttributes if q != self]
-            self._ErpInvoiceLineItems._UserAttributes = filtered
-        for r in value:
-            if self not in r._UserAttributes:
-                r._UserAttributes.append(self)
-        self._ErpInvoiceLineItems = value
+            p._UserAttributes.discard(self)
+        self._ErpInvoiceLineItems = RefList()
+        self.addErpInvoiceLineItems(value)
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            if self not in obj._UserAttributes:
-                obj._UserAttributes.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            obj._UserAttributes.append(self)
+            collection.append(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            if self in obj._UserAttributes:
-                obj._UserAttributes.remove(self)
-            self._ErpInvoiceLineItems.remove(obj)
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            obj._UserAttributes.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpInvoiceLineItems(self):
+        for obj in self._ErpInvoiceLineItems:
+            obj._UserAttributes.discard(self)
+        self._ErpInvoiceLineItems = RefList()
 
     def getRatingAssets(self):
         
@@ -264,24 +269,26 @@ class UserAttribute(Element):
 
     def setRatingAssets(self, value):
         for p in self._RatingAssets:
-            filtered = [q for q in p.Ratings if q != self]
-            self._RatingAssets._Ratings = filtered
-        for r in value:
-            if self not in r._Ratings:
-                r._Ratings.append(self)
-        self._RatingAssets = value
+            p._Ratings.discard(self)
+        self._RatingAssets = RefList()
+        self.addRatingAssets(value)
 
     RatingAssets = property(getRatingAssets, setRatingAssets)
 
     def addRatingAssets(self, *RatingAssets):
-        for obj in RatingAssets:
-            if self not in obj._Ratings:
-                obj._Ratings.append(self)
-            self._RatingAssets.append(obj)
+        collection = self._RatingAssets
+        for obj in members(RatingAssets):
+            obj._Ratings.append(self)
+            collection.append(obj)
 
     def removeRatingAssets(self, *RatingAssets):
-        for obj in RatingAssets:
-            if self in obj._Ratings:
-                obj._Ratings.remove(self)
-            self._RatingAssets.remove(obj)
+        collection = self._RatingAssets
+        for obj in members(RatingAssets):
+            obj._Ratings.discard(self)
+            collection.discard(obj)
+
+    def removeAllRatingAssets(self):
+        for obj in self._RatingAssets:
+            obj._Ratings.discard(self)
+        self._RatingAssets = RefList()
 
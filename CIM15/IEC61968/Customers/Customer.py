@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from PyCIM.RefList import RefList, members
 
 class Customer(Organisation):
     """Organisation receiving services from ServiceSupplier.Organisation receiving services from ServiceSupplier.
@@ -52,16 +53,16 @@ class Customer(Organisation):
         #: Kind of customer. Values are: "windMachine", "residentialAndCommercial", "internalUse", "energyServiceScheduler", "residentialAndStreetlight", "residential", "pumpingLoad", "other", "commercialIndustrial", "energyServiceSupplier", "residentialStreetlightOthers", "residentialFarmService"
         self.kind = kind
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
-        self._EndDevices = []
+        self._EndDevices = RefList()
         self.EndDevices = [] if EndDevices is None else EndDevices
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
         self.status = status
@@ -69,10 +70,10 @@ class Customer(Organisation):
         self._PlannedOutage = None
         self.PlannedOutage = PlannedOutage
 
-        self._OutageNotifications = []
+        self._OutageNotifications = RefList()
         self.OutageNotifications = [] if OutageNotifications is None else OutageNotifications
 
-        self._TroubleTickets = []
+        self._TroubleTickets = RefList()
         self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
 
         super(Customer, self).__init__(*args, **kw_args)
@@ -91,20 +92,32 @@ class Customer(Organisation):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.Customer = None
-        for y in value:
-            y._Customer = self
-        self._CustomerAgreements = value
+            x._Customer = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.Customer = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._Customer
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._Customer = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.Customer = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._Customer is self:
+                obj._Customer = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._Customer = None
+        self._CustomerAgreements = RefList()
 
     def getErpPersons(self):
         
@@ -112,20 +125,32 @@ class Customer(Organisation):
 
     def setErpPersons(self, value):
         for x in self._ErpPersons:
-            x.CustomerData = None
-        for y in value:
-            y._CustomerData = self
-        self._ErpPersons = value
+            x._CustomerData = None
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.CustomerData = self
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            old = obj._CustomerData
+            if old is not None and old is not self:
+                old._ErpPersons.discard(obj)
+            obj._CustomerData = self
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.CustomerData = None
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            if obj._CustomerData is self:
+                obj._CustomerData = None
+                collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._CustomerData = None
+        self._ErpPersons = RefList()
 
     def getEndDevices(self):
         """All end devices of this customer.
@@ -134,20 +159,32 @@ class Customer(Organisation):
 
     def setEndDevices(self, value):
         for x in self._EndDevices:
-            x.Customer = None
-        for y in value:
-            y._Customer = self
-        self._EndDevices = value
+            x._Customer = None
+        self._EndDevices = RefList()
+        self.addEndDevices(value)
 
     EndDevices = property(getEndDevices, setEndDevices)
 
     def addEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.Customer = self
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            old = obj._Customer
+            if old is not None and old is not self:
+                old._EndDevices.discard(obj)
+            obj._Customer = self
+            collection.append(obj)
 
     def removeEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.Customer = None
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            if obj._Customer is self:
+                obj._Customer = None
+                collection.discard(obj)
+
+    def removeAllEndDevices(self):
+        for obj in self._EndDevices:
+            obj._Customer = None
+        self._EndDevices = RefList()
 
     def getWorks(self):
         """All the works performed for this customer.
@@ -156,26 +193,28 @@ class Customer(Organisation):
 
     def setWorks(self, value):
         for p in self._Works:
-            filtered = [q for q in p.Customers if q != self]
-            self._Works._Customers = filtered
-        for r in value:
-            if self not in r._Customers:
-                r._Customers.append(self)
-        self._Works = value
+            p._Customers.discard(self)
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            if self not in obj._Customers:
-                obj._Customers.append(self)
-            self._Works.append(obj)
+        collection = self._Works
+        for obj in members(Works):
+            obj._Customers.append(self)
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            if self in obj._Customers:
-                obj._Customers.remove(self)
-            self._Works.remove(obj)
+        collection = self._Works
+        for obj in members(Works):
+            obj._Customers.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._Customers.discard(self)
+        self._Works = RefList()
 
     # Status of this customer.
     status = None
@@ -186,8 +225,7 @@ class Customer(Organisation):
 
     def setPlannedOutage(self, value):
         if self._PlannedOutage is not None:
-            filtered = [x for x in self.PlannedOutage.CustomerDatas if x != self]
-            self._PlannedOutage._CustomerDatas = filtered
+            self._PlannedOutage._CustomerDatas.discard(self)
 
         self._PlannedOutage = value
         if self._PlannedOutage is not None:
@@ -202,26 +240,28 @@ class Customer(Organisation):
 
     def setOutageNotifications(self, value):
         for p in self._OutageNotifications:
-            filtered = [q for q in p.CustomerDatas if q != self]
-            self._OutageNotifications._CustomerDatas = filtered
-        for r in value:
-            if self not in r._CustomerDatas:
-                r._CustomerDatas.append(self)
-        self._OutageNotifications = value
+            p._CustomerDatas.discard(self)
+        self._OutageNotifications = RefList()
+        self.addOutageNotifications(value)
 
     OutageNotifications = property(getOutageNotifications, setOutageNotifications)
 
     def addOutageNotifications(self, *OutageNotifications):
-        for obj in OutageNotifications:
-            if self not in obj._CustomerDatas:
-                obj._CustomerDatas.append(self)
-            self._OutageNotifications.append(obj)
+        collection = self._OutageNotifications
+        for obj in members(OutageNotifications):
+            obj._CustomerDatas.append(self)
+            collection.append(obj)
 
     def removeOutageNotifications(self, *OutageNotifications):
-        for obj in OutageNotifications:
-            if self in obj._CustomerDatas:
-                obj._CustomerDatas.remove(self)
-            self._OutageNotifications.remove(obj)
+        collection = self._OutageNotifications
+        for obj in members(OutageNotifications):
+            obj._CustomerDatas.discard(self)
+            collection.discard(obj)
+
+    def removeAllOutageNotifications(self):
+        for obj in self._OutageNotifications:
+            obj._CustomerDatas.discard(self)
+        self._OutageNotifications = RefList()
 
     def getTroubleTickets(self):
         
@@ -229,18 +269,30 @@ class Customer(Organisation):
 
     def setTroubleTickets(self, value):
         for x in self._TroubleTickets:
-            x.CustomerData = None
-        for y in value:
-            y._CustomerData = self
-        self._TroubleTickets = value
+            x._CustomerData = None
+        self._TroubleTickets = RefList()
+        self.addTroubleTickets(value)
 
     TroubleTickets = property(getTroubleTickets, setTroubleTickets)
 
     def addTroubleTickets(self, *TroubleTickets):
-        for obj in TroubleTickets:
-            obj.CustomerData = self
+        collection = self._TroubleTickets
+        for obj in members(TroubleTickets):
+            old = obj._CustomerData
+            if old is not None and old is not self:
+                old._TroubleTickets.discard(obj)
+            obj._CustomerData = self
+            collection.append(obj)
 
     def removeTroubleTickets(self, *TroubleTickets):
-        for obj in TroubleTickets:
-            obj.CustomerData = None
+        collection = self._TroubleTickets
+        for obj in members(TroubleTickets):
+            if obj._CustomerData is self:
+                obj._CustomerData = None
+                collection.discard(obj)
+
+    def removeAllTroubleTickets(self):
+        for obj in self._TroubleTickets:
+            obj._CustomerData = None
+        self._TroubleTickets = RefList()
 
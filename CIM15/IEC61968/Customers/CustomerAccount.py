@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class CustomerAccount(Document):
     """Assignment of a group of products and services purchased by the customer through a customer agreement, used as a mechanism for customer billing and payment. It contains common information from the various types of customer agreements to create billings (invoices) for a customer and receive payment.Assignment of a group of products and services purchased by the customer through a customer agreement, used as a mechanism for customer billing and payment. It contains common information from the various types of customer agreements to create billings (invoices) for a customer and receive payment.
@@ -33,19 +34,19 @@ class CustomerAccount(Document):
         @param PaymentTransactions: All payment transactions for this customer account.
         @param CustomerBillingInfos:
         """
-        self._WorkBillingInfos = []
+        self._WorkBillingInfos = RefList()
         self.WorkBillingInfos = [] if WorkBillingInfos is None else WorkBillingInfos
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._ErpInvoicees = []
+        self._ErpInvoicees = RefList()
         self.ErpInvoicees = [] if ErpInvoicees is None else ErpInvoicees
 
-        self._PaymentTransactions = []
+        self._PaymentTransactions = RefList()
         self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
 
-        self._CustomerBillingInfos = []
+        self._CustomerBillingInfos = RefList()
         self.CustomerBillingInfos = [] if CustomerBillingInfos is None else CustomerBillingInfos
 
         super(CustomerAccount, self).__init__(*args, **kw_args)
@@ -63,20 +64,32 @@ class CustomerAccount(Document):
 
     def setWorkBillingInfos(self, value):
         for x in self._WorkBillingInfos:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._WorkBillingInfos = value
+            x._CustomerAccount = None
+        self._WorkBillingInfos = RefList()
+        self.addWorkBillingInfos(value)
 
     WorkBillingInfos = property(getWorkBillingInfos, setWorkBillingInfos)
 
     def addWorkBillingInfos(self, *WorkBillingInfos):
-        for obj in WorkBillingInfos:
-            obj.CustomerAccount = self
+        collection = self._WorkBillingInfos
+        for obj in members(WorkBillingInfos):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._WorkBillingInfos.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removeWorkBillingInfos(self, *WorkBillingInfos):
-        for obj in WorkBillingInfos:
-            obj.CustomerAccount = None
+        collection = self._WorkBillingInfos
+        for obj in members(WorkBillingInfos):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllWorkBillingInfos(self):
+        for obj in self._WorkBillingInfos:
+            obj._CustomerAccount = None
+        self._WorkBillingInfos = RefList()
 
     def getCustomerAgreements(self):
         """All agreements for this customer account.
@@ -85,20 +98,32 @@ class CustomerAccount(Document):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._CustomerAgreements = value
+            x._CustomerAccount = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.CustomerAccount = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.CustomerAccount = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._CustomerAccount = None
+        self._CustomerAgreements = RefList()
 
     def getErpInvoicees(self):
         
@@ -106,20 +131,32 @@ class CustomerAccount(Document):
 
     def setErpInvoicees(self, value):
         for x in self._ErpInvoicees:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._ErpInvoicees = value
+            x._CustomerAccount = None
+        self._ErpInvoicees = RefList()
+        self.addErpInvoicees(value)
 
     ErpInvoicees = property(getErpInvoicees, setErpInvoicees)
 
     def addErpInvoicees(self, *ErpInvoicees):
-        for obj in ErpInvoicees:
-            obj.CustomerAccount = self
+        collection = self._ErpInvoicees
+        for obj in members(ErpInvoicees):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._ErpInvoicees.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removeErpInvoicees(self, *ErpInvoicees):
-        for obj in ErpInvoicees:
-            obj.CustomerAccount = None
+        collection = self._ErpInvoicees
+        for obj in members(ErpInvoicees):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllErpInvoicees(self):
+        for obj in self._ErpInvoicees:
+            obj._CustomerAccount = None
+        self._ErpInvoicees = RefList()
 
     def getPaymentTransactions(self):
         """All payment transactions for this customer account.
@@ -128,20 +165,32 @@ class CustomerAccount(Document):
 
     def setPaymentTransactions(self, value):
         for x in self._PaymentTransactions:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._PaymentTransactions = value
+            x._CustomerAccount = None
+        self._PaymentTransactions = RefList()
+        self.addPaymentTransactions(value)
 
     PaymentTransactions = property(getPaymentTransactions, setPaymentTransactions)
 
     def addPaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.CustomerAccount = self
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._PaymentTransactions.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removePaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.CustomerAccount = None
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllPaymentTransactions(self):
+        for obj in self._PaymentTransactions:
+            obj._CustomerAccount = None
+        self._PaymentTransactions = RefList()
 
     def getCustomerBillingInfos(self):
         
@@ -149,18 +198,30 @@ class CustomerAccount(Document):
 
     def setCustomerBillingInfos(self, value):
         for x in self._CustomerBillingInfos:
-            x.CustomerAccount = None
-        for y in value:
-            y._CustomerAccount = self
-        self._CustomerBillingInfos = value
+            x._CustomerAccount = None
+        self._CustomerBillingInfos = RefList()
+        self.addCustomerBillingInfos(value)
 
     CustomerBillingInfos = property(getCustomerBillingInfos, setCustomerBillingInfos)
 
     def addCustomerBillingInfos(self, *CustomerBillingInfos):
-        for obj in CustomerBillingInfos:
-            obj.CustomerAccount = self
+        collection = self._CustomerBillingInfos
+        for obj in members(CustomerBillingInfos):
+            old = obj._CustomerAccount
+            if old is not None and old is not self:
+                old._CustomerBillingInfos.discard(obj)
+            obj._CustomerAccount = self
+            collection.append(obj)
 
     def removeCustomerBillingInfos(self, *CustomerBillingInfos):
-        for obj in CustomerBillingInfos:
-            obj.CustomerAccount = None
+        collection = self._CustomerBillingInfos
+        for obj in members(CustomerBillingInfos):
+            if obj._CustomerAccount is self:
+                obj._CustomerAccount = None
+                collection.discard(obj)
+
+    def removeAllCustomerBillingInfos(self):
+        for obj in self._CustomerBillingInfos:
+            obj._CustomerAccount = None
+        self._CustomerBillingInfos = RefList()
 
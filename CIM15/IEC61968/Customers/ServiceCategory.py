@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ServiceCategory(IdentifiedObject):
     """Category of service provided to the customer.Category of service provided to the customer.
@@ -34,10 +35,10 @@ class ServiceCategory(IdentifiedObject):
         #: Kind of service. Values are: "other", "refuse", "sewerage", "electricity", "heat", "internet", "rates", "time", "water", "gas", "tvLicence"
         self.kind = kind
 
-        self._PricingStructures = []
+        self._PricingStructures = RefList()
         self.PricingStructures = [] if PricingStructures is None else PricingStructures
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         super(ServiceCategory, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class ServiceCategory(IdentifiedObject):
 
     def setPricingStructures(self, value):
         for x in self._PricingStructures:
-            x.ServiceCategory = None
-        for y in value:
-            y._ServiceCategory = self
-        self._PricingStructures = value
+            x._ServiceCategory = None
+        self._PricingStructures = RefList()
+        self.addPricingStructures(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            obj.ServiceCategory = self
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            old = obj._ServiceCategory
+            if old is not None and old is not self:
+                old._PricingStructures.discard(obj)
+            obj._ServiceCategory = self
+            collection.append(obj)
 
     def removePricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            obj.ServiceCategory = None
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            if obj._ServiceCategory is self:
+                obj._ServiceCategory = None
+                collection.discard(obj)
+
+    def removeAllPricingStructures(self):
+        for obj in self._PricingStructures:
+            obj._ServiceCategory = None
+        self._PricingStructures = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points that deliver this category of service.
@@ -78,18 +91,30 @@ class ServiceCategory(IdentifiedObject):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.ServiceCategory = None
-        for y in value:
-            y._ServiceCategory = self
-        self._ServiceDeliveryPoints = value
+            x._ServiceCategory = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceCategory = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._ServiceCategory
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._ServiceCategory = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceCategory = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._ServiceCategory is self:
+                obj._ServiceCategory = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._ServiceCategory = None
+        self._ServiceDeliveryPoints = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Location import Location
+from PyCIM.RefList import RefList, members
 
 class ServiceLocation(Location):
     """A customer service location has one or more service delivery points, which in turn relate to Meters. The location may be a point or a polygon, depending on the specific circumstances. For distribution, the service location is typically the location of the utility customer's premise. Because a customer's premise may have one or more meters, the service delivery point is used to define the actual conducting equipment that the end device attaches to at the utility customer's service location. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party.A customer service location has one or more service delivery points, which in turn relate to Meters. The location may be a point or a polygon, depending on the specific circumstances. For distribution, the service location is typically the location of the utility customer's premise. Because a customer's premise may have one or more meters, the service delivery point is used to define the actual conducting equipment that the end device attaches to at the utility customer's service location. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party.
@@ -44,16 +45,16 @@ class ServiceLocation(Location):
         #: True if inspection is needed of facilities at this service location. This could be requested by a customer, due to suspected tampering, environmental concerns (e.g., a fire in the vicinity), or to correct incompatible data.
         self.needsInspection = needsInspection
 
-        self._EndDevices = []
+        self._EndDevices = RefList()
         self.EndDevices = [] if EndDevices is None else EndDevices
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
         super(ServiceLocation, self).__init__(*args, **kw_args)
@@ -72,20 +73,32 @@ class ServiceLocation(Location):
 
     def setEndDevices(self, value):
         for x in self._EndDevices:
-            x.ServiceLocation = None
-        for y in value:
-            y._ServiceLocation = self
-        self._EndDevices = value
+            x._ServiceLocation = None
+        self._EndDevices = RefList()
+        self.addEndDevices(value)
 
     EndDevices = property(getEndDevices, setEndDevices)
 
     def addEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.ServiceLocation = self
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            old = obj._ServiceLocation
+            if old is not None and old is not self:
+                old._EndDevices.discard(obj)
+            obj._ServiceLocation = self
+            collection.append(obj)
 
     def removeEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.ServiceLocation = None
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            if obj._ServiceLocation is self:
+                obj._ServiceLocation = None
+                collection.discard(obj)
+
+    def removeAllEndDevices(self):
+        for obj in self._EndDevices:
+            obj._ServiceLocation = None
+        self._EndDevices = RefList()
 
     def getErpPersons(self):
         
@@ -93,20 +106,32 @@ class ServiceLocation(Location):
 
     def setErpPersons(self, value):
         for x in self._ErpPersons:
-            x.ServiceLocation = None
-        for y in value:
-            y._ServiceLocation = self
-        self._ErpPersons = value
+            x._ServiceLocation = None
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.ServiceLocation = self
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            old = obj._ServiceLocation
+            if old is not None and old is not self:
+                old._ErpPersons.discard(obj)
+            obj._ServiceLocation = self
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.ServiceLocation = None
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            if obj._ServiceLocation is self:
+                obj._ServiceLocation = None
+                collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._ServiceLocation = None
+        self._ErpPersons = RefList()
 
     def getServiceDeliveryPoints(self):
         """All service delivery points delivering service (of the same type) to this service location.
@@ -115,20 +140,32 @@ class ServiceLocation(Location):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.ServiceLocation = None
-        for y in value:
-            y._ServiceLocation = self
-        self._ServiceDeliveryPoints = value
+            x._ServiceLocation = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceLocation = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._ServiceLocation
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._ServiceLocation = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.ServiceLocation = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._ServiceLocation is self:
+                obj._ServiceLocation = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._ServiceLocation = None
+        self._ServiceDeliveryPoints = RefList()
 
     def getCustomerAgreements(self):
         """All customer agreements regulating this service location.
@@ -137,24 +174,26 @@ class ServiceLocation(Location):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.ServiceLocations if q != self]
-            self._CustomerAgreements._ServiceLocations = filtered
-        for r in value:
-            if self not in r._ServiceLocations:
-                r._ServiceLocations.append(self)
-        self._CustomerAgreements = value
+            p._ServiceLocations.discard(self)
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self not in obj._ServiceLocations:
-                obj._ServiceLocations.append(self)
-            self._CustomerAgreements.append(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._ServiceLocations.append(self)
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            if self in obj._ServiceLocations:
-                obj._ServiceLocations.remove(self)
-            self._CustomerAgreements.remove(obj)
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            obj._ServiceLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._ServiceLocations.discard(self)
+        self._CustomerAgreements = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DemandResponseProgram(IdentifiedObject):
     """Demand response program.Demand response program.
@@ -36,15 +37,15 @@ class DemandResponseProgram(IdentifiedObject):
         #: Type of demand response program; examples are CPP (critical-peak pricing), RTP (real-time pricing), DLC (direct load control), DBP (demand bidding program), BIP (base interruptible program). Note that possible types change a lot and it would be impossible to enumerate them all.
         self.type = type
 
-        self._EndDeviceControls = []
+        self._EndDeviceControls = RefList()
         self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
 
         self.validityInterval = validityInterval
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
-        self._EndDeviceGroups = []
+        self._EndDeviceGroups = RefList()
         self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
 
         super(DemandResponseProgram, self).__init__(*args, **kw_args)
@@ -63,20 +64,32 @@ class DemandResponseProgram(IdentifiedObject):
 
     def setEndDeviceControls(self, value):
         for x in self._EndDeviceControls:
-            x.DemandResponseProgram = None
-        for y in value:
-            y._DemandResponseProgram = self
-        self._EndDeviceControls = value
+            x._DemandResponseProgram = None
+        self._EndDeviceControls = RefList()
+        self.addEndDeviceControls(value)
 
     EndDeviceControls = property(getEndDeviceControls, setEndDeviceControls)
 
     def addEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.DemandResponseProgram = self
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            old = obj._DemandResponseProgram
+            if old is not None and old is not self:
+                old._EndDeviceControls.discard(obj)
+            obj._DemandResponseProgram = self
+            collection.append(obj)
 
     def removeEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.DemandResponseProgram = None
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            if obj._DemandResponseProgram is self:
+                obj._DemandResponseProgram = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceControls(self):
+        for obj in self._EndDeviceControls:
+            obj._DemandResponseProgram = None
+        self._EndDeviceControls = RefList()
 
     # Interval within which the program is valid.
     validityInterval = None
@@ -88,20 +101,32 @@ class DemandResponseProgram(IdentifiedObject):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.DemandResponseProgram = None
-        for y in value:
-            y._DemandResponseProgram = self
-        self._CustomerAgreements = value
+            x._DemandResponseProgram = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.DemandResponseProgram = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._DemandResponseProgram
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._DemandResponseProgram = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.DemandResponseProgram = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._DemandResponseProgram is self:
+                obj._DemandResponseProgram = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._DemandResponseProgram = None
+        self._CustomerAgreements = RefList()
 
     def getEndDeviceGroups(self):
         """All groups of end devices with this demand response program.
@@ -110,18 +135,30 @@ class DemandResponseProgram(IdentifiedObject):
 
     def setEndDeviceGroups(self, value):
         for x in self._EndDeviceGroups:
-            x.DemandResponseProgram = None
-        for y in value:
-            y._DemandResponseProgram = self
-        self._EndDeviceGroups = value
+            x._DemandResponseProgram = None
+        self._EndDeviceGroups = RefList()
+        self.addEndDeviceGroups(value)
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
-        for obj in EndDeviceGroups:
-            obj.DemandResponseProgram = self
+        collection = self._EndDeviceGroups
+        for obj in members(EndDeviceGroups):
+            old = obj._DemandResponseProgram
+            if old is not None and old is not self:
+                old._EndDeviceGroups.discard(obj)
+            obj._DemandResponseProgram = self
+            collection.append(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
-        for obj in EndDeviceGroups:
-            obj.DemandResponseProgram = None
+        collection = self._EndDeviceGroups
+        for obj in members(EndDeviceGroups):
+            if obj._DemandResponseProgram is self:
+                obj._DemandResponseProgram = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceGroups(self):
+        for obj in self._EndDeviceGroups:
+            obj._DemandResponseProgram = None
+        self._EndDeviceGroups = RefList()
 
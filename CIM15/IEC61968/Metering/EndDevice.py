@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from PyCIM.RefList import RefList, members
 
 class EndDevice(AssetContainer):
     """Asset container that performs one or more end device functions. One type of end device is a meter which can perform metering, load management, connect/disconnect, accounting functions, etc. Some end devices, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a meter. All end devices may have communication capability defined by the associated communication function(s). An end device may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.Asset container that performs one or more end device functions. One type of end device is a meter which can perform metering, load management, connect/disconnect, accounting functions, etc. Some end devices, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a meter. All end devices may have communication capability defined by the associated communication function(s). An end device may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.
@@ -52,16 +53,16 @@ class EndDevice(AssetContainer):
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._EndDeviceFunctions = []
+        self._EndDeviceFunctions = RefList()
         self.EndDeviceFunctions = [] if EndDeviceFunctions is None else EndDeviceFunctions
 
-        self._EndDeviceControls = []
+        self._EndDeviceControls = RefList()
         self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
 
-        self._EndDeviceGroups = []
+        self._EndDeviceGroups = RefList()
         self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
 
         super(EndDevice, self).__init__(*args, **kw_args)
@@ -80,8 +81,7 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceInfo(self, value):
         if self._EndDeviceInfo is not None:
-            filtered = [x for x in self.EndDeviceInfo.EndDevices if x != self]
-            self._EndDeviceInfo._EndDevices = filtered
+            self._EndDeviceInfo._EndDevices.discard(self)
 
         self._EndDeviceInfo = value
         if self._EndDeviceInfo is not None:
@@ -97,8 +97,7 @@ class EndDevice(AssetContainer):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.EndDevices if x != self]
-            self._ServiceDeliveryPoint._EndDevices = filtered
+            self._ServiceDeliveryPoint._EndDevices.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
@@ -114,8 +113,7 @@ class EndDevice(AssetContainer):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.EndDevices if x != self]
-            self._ServiceLocation._EndDevices = filtered
+            self._ServiceLocation._EndDevices.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
@@ -131,20 +129,32 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceFunctions(self, value):
         for x in self._EndDeviceFunctions:
-            x.EndDevice = None
-        for y in value:
-            y._EndDevice = self
-        self._EndDeviceFunctions = value
+            x._EndDevice = None
+        self._EndDeviceFunctions = RefList()
+        self.addEndDeviceFunctions(value)
 
     EndDeviceFunctions = property(getEndDeviceFunctions, setEndDeviceFunctions)
 
     def addEndDeviceFunctions(self, *EndDeviceFunctions):
-        for obj in EndDeviceFunctions:
-            obj.EndDevice = self
+        collection = self._EndDeviceFunctions
+        for obj in members(EndDeviceFunctions):
+            old = obj._EndDevice
+            if old is not None and old is not self:
+                old._EndDeviceFunctions.discard(obj)
+            obj._EndDevice = self
+            collection.append(obj)
 
     def removeEndDeviceFunctions(self, *EndDeviceFunctions):
-        for obj in EndDeviceFunctions:
-            obj.EndDevice = None
+        collection = self._EndDeviceFunctions
+        for obj in members(EndDeviceFunctions):
+            if obj._EndDevice is self:
+                obj._EndDevice = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceFunctions(self):
+        for obj in self._EndDeviceFunctions:
+            obj._EndDevice = None
+        self._EndDeviceFunctions = RefList()
 
     def getEndDeviceControls(self):
         """All end device controls sending commands to this end device.
@@ -153,20 +163,32 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceControls(self, value):
         for x in self._EndDeviceControls:
-            x.EndDevice = None
-        for y in value:
-            y._EndDevice = self
-        self._EndDeviceControls = value
+            x._EndDevice = None
+        self._EndDeviceControls = RefList()
+        self.addEndDeviceControls(value)
 
     EndDeviceControls = property(getEndDeviceControls, setEndDeviceControls)
 
     def addEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.EndDevice = self
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            old = obj._EndDevice
+            if old is not None and old is not self:
+                old._EndDeviceControls.discard(obj)
+            obj._EndDevice = self
+            collection.append(obj)
 
     def removeEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.EndDevice = None
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            if obj._EndDevice is self:
+                obj._EndDevice = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceControls(self):
+        for obj in self._EndDeviceControls:
+            obj._EndDevice = None
+        self._EndDeviceControls = RefList()
 
     def getCustomer(self):
         """Customer owning this end device.
@@ -175,8 +197,7 @@ class EndDevice(AssetContainer):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.EndDevices if x != self]
-            self._Customer._EndDevices = filtered
+            self._Customer._EndDevices.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
@@ -192,24 +213,26 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceGroups(self, value):
         for p in self._EndDeviceGroups:
-            filtered = [q for q in p.EndDevices if q != self]
-            self._EndDeviceGroups._EndDevices = filtered
-        for r in value:
-            if self not in r._EndDevices:
-                r._EndDevices.append(self)
-        self._EndDeviceGroups = value
+            p._EndDevices.discard(self)
+        self._EndDeviceGroups = RefList()
+        self.addEndDeviceGroups(value)
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
-        for obj in EndDeviceGroups:
-            if self not in obj._EndDevices:
-                obj._EndDevices.append(self)
-            self._EndDeviceGroups.append(obj)
+        collection = self._EndDeviceGroups
+        for obj in members(EndDeviceGroups):
+            obj._EndDevices.append(self)
+            collection.append(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
-        for obj in EndDeviceGroups:
-            if self in obj._EndDevices:
-                obj._EndDevices.remove(self)
-            self._EndDeviceGroups.remove(obj)
+        collection = self._EndDeviceGroups
+        for obj in members(EndDeviceGroups):
+            obj._EndDevices.discard(self)
+            collection.discard(obj)
+
+    def removeAllEndDeviceGroups(self):
+        for obj in self._EndDeviceGroups:
+            obj._EndDevices.discard(self)
+        self._EndDeviceGroups = RefList()
 
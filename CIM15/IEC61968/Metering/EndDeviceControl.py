@@ -79,8 +79,7 @@ class EndDeviceControl(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceControls if x != self]
-            self._DemandResponseProgram._EndDeviceControls = filtered
+            self._DemandResponseProgram._EndDeviceControls.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
@@ -96,8 +95,7 @@ class EndDeviceControl(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.EndDeviceControls if x != self]
-            self._CustomerAgreement._EndDeviceControls = filtered
+            self._CustomerAgreement._EndDeviceControls.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
@@ -116,8 +114,7 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceGroup(self, value):
         if self._EndDeviceGroup is not None:
-            filtered = [x for x in self.EndDeviceGroup.EndDeviceControls if x != self]
-            self._EndDeviceGroup._EndDeviceControls = filtered
+            self._EndDeviceGroup._EndDeviceControls.discard(self)
 
         self._EndDeviceGroup = value
         if self._EndDeviceGroup is not None:
@@ -133,8 +130,7 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDevice(self, value):
         if self._EndDevice is not None:
-            filtered = [x for x in self.EndDevice.EndDeviceControls if x != self]
-            self._EndDevice._EndDeviceControls = filtered
+            self._EndDevice._EndDeviceControls.discard(self)
 
         self._EndDevice = value
         if self._EndDevice is not None:
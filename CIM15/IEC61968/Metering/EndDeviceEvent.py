@@ -56,8 +56,7 @@ class EndDeviceEvent(ActivityRecord):
 
     def setEndDeviceFunction(self, value):
         if self._EndDeviceFunction is not None:
-            filtered = [x for x in self.EndDeviceFunction.EndDeviceEvents if x != self]
-            self._EndDeviceFunction._EndDeviceEvents = filtered
+            self._EndDeviceFunction._EndDeviceEvents.discard(self)
 
         self._EndDeviceFunction = value
         if self._EndDeviceFunction is not None:
@@ -73,8 +72,7 @@ class EndDeviceEvent(ActivityRecord):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.EndDeviceEvents if x != self]
-            self._MeterReading._EndDeviceEvents = filtered
+            self._MeterReading._EndDeviceEvents.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
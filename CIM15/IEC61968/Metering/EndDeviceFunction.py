@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetFunction import AssetFunction
+from PyCIM.RefList import RefList, members
 
 class EndDeviceFunction(AssetFunction):
     """Function performed by an end device such as a meter, communication equipment, controllers, etc.Function performed by an end device such as a meter, communication equipment, controllers, etc.
@@ -40,13 +41,13 @@ class EndDeviceFunction(AssetFunction):
         #: True if the function is supported (inherent property of the device).
         self.supported = supported
 
-        self._Registers = []
+        self._Registers = RefList()
         self.Registers = [] if Registers is None else Registers
 
         self._ComEquipment = None
         self.ComEquipment = ComEquipment
 
-        self._EndDeviceEvents = []
+        self._EndDeviceEvents = RefList()
         self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
 
         self._EndDevice = None
@@ -68,20 +69,32 @@ class EndDeviceFunction(AssetFunction):
 
     def setRegisters(self, value):
         for x in self._Registers:
-            x.EndDeviceFunction = None
-        for y in value:
-            y._EndDeviceFunction = self
-        self._Registers = value
+            x._EndDeviceFunction = None
+        self._Registers = RefList()
+        self.addRegisters(value)
 
     Registers = property(getRegisters, setRegisters)
 
     def addRegisters(self, *Registers):
-        for obj in Registers:
-            obj.EndDeviceFunction = self
+        collection = self._Registers
+        for obj in members(Registers):
+            old = obj._EndDeviceFunction
+            if old is not None and old is not self:
+                old._Registers.discard(obj)
+            obj._EndDeviceFunction = self
+            collection.append(obj)
 
     def removeRegisters(self, *Registers):
-        for obj in Registers:
-            obj.EndDeviceFunction = None
+        collection = self._Registers
+        for obj in members(Registers):
+            if obj._EndDeviceFunction is self:
+                obj._EndDeviceFunction = None
+                collection.discard(obj)
+
+    def removeAllRegisters(self):
+        for obj in self._Registers:
+            obj._EndDeviceFunction = None
+        self._Registers = RefList()
 
     def getComEquipment(self):
         """Communication equipment performing this device function.
@@ -90,8 +103,7 @@ class EndDeviceFunction(AssetFunction):
 
     def setComEquipment(self, value):
         if self._ComEquipment is not None:
-            filtered = [x for x in self.ComEquipment.EndDeviceFunctions if x != self]
-            self._ComEquipment._EndDeviceFunctions = filtered
+            self._ComEquipment._EndDeviceFunctions.discard(self)
 
         self._ComEquipment = value
         if self._ComEquipment is not None:
@@ -107,20 +119,32 @@ class EndDeviceFunction(AssetFunction):
 
     def setEndDeviceEvents(self, value):
         for x in self._EndDeviceEvents:
-            x.EndDeviceFunction = None
-        for y in value:
-            y._EndDeviceFunction = self
-        self._EndDeviceEvents = value
+            x._EndDeviceFunction = None
+        self._EndDeviceEvents = RefList()
+        self.addEndDeviceEvents(value)
 
     EndDeviceEvents = property(getEndDeviceEvents, setEndDeviceEvents)
 
     def addEndDeviceEvents(self, *EndDeviceEvents):
-        for obj in EndDeviceEvents:
-            obj.EndDeviceFunction = self
+        collection = self._EndDeviceEvents
+        for obj in members(EndDeviceEvents):
+            old = obj._EndDeviceFunction
+            if old is not None and old is not self:
+                old._EndDeviceEvents.discard(obj)
+            obj._EndDeviceFunction = self
+            collection.append(obj)
 
     def removeEndDeviceEvents(self, *EndDeviceEvents):
-        for obj in EndDeviceEvents:
-            obj.EndDeviceFunction = None
+        collection = self._EndDeviceEvents
+        for obj in members(EndDeviceEvents):
+            if obj._EndDeviceFunction is self:
+                obj._EndDeviceFunction = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceEvents(self):
+        for obj in self._EndDeviceEvents:
+            obj._EndDeviceFunction = None
+        self._EndDeviceEvents = RefList()
 
     def getEndDevice(self):
         """End device that performs this function.
@@ -129,8 +153,7 @@ class EndDeviceFunction(AssetFunction):
 
     def setEndDevice(self, value):
         if self._EndDevice is not None:
-            filtered = [x for x in self.EndDevice.EndDeviceFunctions if x != self]
-            self._EndDevice._EndDeviceFunctions = filtered
+            self._EndDevice._EndDeviceFunctions.discard(self)
 
         self._EndDevice = value
         if self._EndDevice is not None:
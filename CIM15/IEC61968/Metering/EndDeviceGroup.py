@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class EndDeviceGroup(IdentifiedObject):
     """Abstraction for management of group communications within a two-way AMR system or the data for a group of related meters. Commands can be issued to all of the meters that belong to a meter group using a defined group address and the underlying AMR communication infrastructure.Abstraction for management of group communications within a two-way AMR system or the data for a group of related meters. Commands can be issued to all of the meters that belong to a meter group using a defined group address and the underlying AMR communication infrastructure.
@@ -35,10 +36,10 @@ class EndDeviceGroup(IdentifiedObject):
         #: Address of this end device group.
         self.groupAddress = groupAddress
 
-        self._EndDeviceControls = []
+        self._EndDeviceControls = RefList()
         self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
 
-        self._EndDevices = []
+        self._EndDevices = RefList()
         self.EndDevices = [] if EndDevices is None else EndDevices
 
         self._DemandResponseProgram = None
@@ -60,20 +61,32 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setEndDeviceControls(self, value):
         for x in self._EndDeviceControls:
-            x.EndDeviceGroup = None
-        for y in value:
-            y._EndDeviceGroup = self
-        self._EndDeviceControls = value
+            x._EndDeviceGroup = None
+        self._EndDeviceControls = RefList()
+        self.addEndDeviceControls(value)
 
     EndDeviceControls = property(getEndDeviceControls, setEndDeviceControls)
 
     def addEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.EndDeviceGroup = self
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            old = obj._EndDeviceGroup
+            if old is not None and old is not self:
+                old._EndDeviceControls.discard(obj)
+            obj._EndDeviceGroup = self
+            collection.append(obj)
 
     def removeEndDeviceControls(self, *EndDeviceControls):
-        for obj in EndDeviceControls:
-            obj.EndDeviceGroup = None
+        collection = self._EndDeviceControls
+        for obj in members(EndDeviceControls):
+            if obj._EndDeviceGroup is self:
+                obj._EndDeviceGroup = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceControls(self):
+        for obj in self._EndDeviceControls:
+            obj._EndDeviceGroup = None
+        self._EndDeviceControls = RefList()
 
     def getEndDevices(self):
         """All end devices this end device group refers to.
@@ -82,26 +95,28 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setEndDevices(self, value):
         for p in self._EndDevices:
-            filtered = [q for q in p.EndDeviceGroups if q != self]
-            self._EndDevices._EndDeviceGroups = filtered
-        for r in value:
-            if self not in r._EndDeviceGroups:
-                r._EndDeviceGroups.append(self)
-        self._EndDevices = value
+            p._EndDeviceGroups.discard(self)
+        self._EndDevices = RefList()
+        self.addEndDevices(value)
 
     EndDevices = property(getEndDevices, setEndDevices)
 
     def addEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            if self not in obj._EndDeviceGroups:
-                obj._EndDeviceGroups.append(self)
-            self._EndDevices.append(obj)
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            obj._EndDeviceGroups.append(self)
+            collection.append(obj)
 
     def removeEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            if self in obj._EndDeviceGroups:
-                obj._EndDeviceGroups.remove(self)
-            self._EndDevices.remove(obj)
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            obj._EndDeviceGroups.discard(self)
+            collection.discard(obj)
+
+    def removeAllEndDevices(self):
+        for obj in self._EndDevices:
+            obj._EndDeviceGroups.discard(self)
+        self._EndDevices = RefList()
 
     def getDemandResponseProgram(self):
         """Demand response program for this group of end devices.
@@ -110,8 +125,7 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceGroups if x != self]
-            self._DemandResponseProgram._EndDeviceGroups = filtered
+            self._DemandResponseProgram._EndDeviceGroups.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
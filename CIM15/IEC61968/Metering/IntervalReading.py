@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from PyCIM.RefList import RefList, members
 
 class IntervalReading(MeasurementValue):
     """Data captured at regular intervals of time. Interval data could be captured as incremental data, absolute data, or relative data. The source for the data is usually a tariff quantity or an engineering quantity. Data is typically captured in time-tagged, uniform, fixed-length intervals of 5 min, 10 min, 15 min, 30 min, or 60 min. Note: Interval Data is sometimes also called 'Interval Data Readings' (IDR).Data captured at regular intervals of time. Interval data could be captured as incremental data, absolute data, or relative data. The source for the data is usually a tariff quantity or an engineering quantity. Data is typically captured in time-tagged, uniform, fixed-length intervals of 5 min, 10 min, 15 min, 30 min, or 60 min. Note: Interval Data is sometimes also called 'Interval Data Readings' (IDR).
@@ -34,10 +35,10 @@ class IntervalReading(MeasurementValue):
         #: Value of this interval reading.
         self.value = value
 
-        self._IntervalBlocks = []
+        self._IntervalBlocks = RefList()
         self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
 
-        self._ReadingQualities = []
+        self._ReadingQualities = RefList()
         self.ReadingQualities = [] if ReadingQualities is None else ReadingQualities
 
         super(IntervalReading, self).__init__(*args, **kw_args)
@@ -56,26 +57,28 @@ class IntervalReading(MeasurementValue):
 
     def setIntervalBlocks(self, value):
         for p in self._IntervalBlocks:
-            filtered = [q for q in p.IntervalReadings if q != self]
-            self._IntervalBlocks._IntervalReadings = filtered
-        for r in value:
-            if self not in r._IntervalReadings:
-                r._IntervalReadings.append(self)
-        self._IntervalBlocks = value
+            p._IntervalReadings.discard(self)
+        self._IntervalBlocks = RefList()
+        self.addIntervalBlocks(value)
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            if self not in obj._IntervalReadings:
-                obj._IntervalReadings.append(self)
-            self._IntervalBlocks.append(obj)
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            obj._IntervalReadings.append(self)
+            collection.append(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            if self in obj._IntervalReadings:
-                obj._IntervalReadings.remove(self)
-            self._IntervalBlocks.remove(obj)
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            obj._IntervalReadings.discard(self)
+            collection.discard(obj)
+
+    def removeAllIntervalBlocks(self):
+        for obj in self._IntervalBlocks:
+            obj._IntervalReadings.discard(self)
+        self._IntervalBlocks = RefList()
 
     def getReadingQualities(self):
         """Used only if quality of this interval reading value is different than 'Good'.
@@ -84,18 +87,30 @@ class IntervalReading(MeasurementValue):
 
     def setReadingQualities(self, value):
         for x in self._ReadingQualities:
-            x.IntervalReading = None
-        for y in value:
-            y._IntervalReading = self
-        self._ReadingQualities = value
+            x._IntervalReading = None
+        self._ReadingQualities = RefList()
+        self.addReadingQualities(value)
 
     ReadingQualities = property(getReadingQualities, setReadingQualities)
 
     def addReadingQualities(self, *ReadingQualities):
-        for obj in ReadingQualities:
-            obj.IntervalReading = self
+        collection = self._ReadingQualities
+        for obj in members(ReadingQualities):
+            old = obj._IntervalReading
+            if old is not None and old is not self:
+                old._ReadingQualities.discard(obj)
+            obj._IntervalReading = self
+            collection.append(obj)
 
     def removeReadingQualities(self, *ReadingQualities):
-        for obj in ReadingQualities:
-            obj.IntervalReading = None
+        collection = self._ReadingQualities
+        for obj in members(ReadingQualities):
+            if obj._IntervalReading is self:
+                obj._IntervalReading = None
+                collection.discard(obj)
+
+    def removeAllReadingQualities(self):
+        for obj in self._ReadingQualities:
+            obj._IntervalReading = None
+        self._ReadingQualities = RefList()
 
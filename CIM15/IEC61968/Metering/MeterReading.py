@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MeterReading(IdentifiedObject):
     """Set of values obtained from the meter.Set of values obtained from the meter.
@@ -40,10 +41,10 @@ class MeterReading(IdentifiedObject):
 
         self.valuesInterval = valuesInterval
 
-        self._EndDeviceEvents = []
+        self._EndDeviceEvents = RefList()
         self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
 
-        self._Readings = []
+        self._Readings = RefList()
         self.Readings = [] if Readings is None else Readings
 
         self._CustomerAgreement = None
@@ -52,7 +53,7 @@ class MeterReading(IdentifiedObject):
         self._Meter = None
         self.Meter = Meter
 
-        self._IntervalBlocks = []
+        self._IntervalBlocks = RefList()
         self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
 
         super(MeterReading, self).__init__(*args, **kw_args)
@@ -71,8 +72,7 @@ class MeterReading(IdentifiedObject):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.MeterReadings if x != self]
-            self._ServiceDeliveryPoint._MeterReadings = filtered
+            self._ServiceDeliveryPoint._MeterReadings.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
@@ -91,20 +91,32 @@ class MeterReading(IdentifiedObject):
 
     def setEndDeviceEvents(self, value):
         for x in self._EndDeviceEvents:
-            x.MeterReading = None
-        for y in value:
-            y._MeterReading = self
-        self._EndDeviceEvents = value
+            x._MeterReading = None
+        self._EndDeviceEvents = RefList()
+        self.addEndDeviceEvents(value)
 
     EndDeviceEvents = property(getEndDeviceEvents, setEndDeviceEvents)
 
     def addEndDeviceEvents(self, *EndDeviceEvents):
-        for obj in EndDeviceEvents:
-            obj.MeterReading = self
+        collection = self._EndDeviceEvents
+        for obj in members(EndDeviceEvents):
+            old = obj._MeterReading
+            if old is not None and old is not self:
+                old._EndDeviceEvents.discard(obj)
+            obj._MeterReading = self
+            collection.append(obj)
 
     def removeEndDeviceEvents(self, *EndDeviceEvents):
-        for obj in EndDeviceEvents:
-            obj.MeterReading = None
+        collection = self._EndDeviceEvents
+        for obj in members(EndDeviceEvents):
+            if obj._MeterReading is self:
+                obj._MeterReading = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceEvents(self):
+        for obj in self._EndDeviceEvents:
+            obj._MeterReading = None
+        self._EndDeviceEvents = RefList()
 
     def getReadings(self):
         """All reading values contained within this meter reading.
@@ -113,26 +125,28 @@ class MeterReading(IdentifiedObject):
 
     def setReadings(self, value):
         for p in self._Readings:
-            filtered = [q for q in p.MeterReadings if q != self]
-            self._Readings._MeterReadings = filtered
-        for r in value:
-            if self not in r._MeterReadings:
-                r._MeterReadings.append(self)
-        self._Readings = value
+            p._MeterReadings.discard(self)
+        self._Readings = RefList()
+        self.addReadings(value)
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
-        for obj in Readings:
-            if self not in obj._MeterReadings:
-                obj._MeterReadings.append(self)
-            self._Readings.append(obj)
+        collection = self._Readings
+        for obj in members(Readings):
+            obj._MeterReadings.append(self)
+            collection.append(obj)
 
     def removeReadings(self, *Readings):
-        for obj in Readings:
-            if self in obj._MeterReadings:
-                obj._MeterReadings.remove(self)
-            self._Readings.remove(obj)
+        collection = self._Readings
+        for obj in members(Readings):
+            obj._MeterReadings.discard(self)
+            collection.discard(obj)
+
+    def removeAllReadings(self):
+        for obj in self._Readings:
+            obj._MeterReadings.discard(self)
+        self._Readings = RefList()
 
     def getCustomerAgreement(self):
         """(could be deprecated in the future) Customer agreement for this meter reading.
@@ -141,8 +155,7 @@ class MeterReading(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.MeterReadings if x != self]
-            self._CustomerAgreement._MeterReadings = filtered
+            self._CustomerAgreement._MeterReadings.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
@@ -158,8 +171,7 @@ class MeterReading(IdentifiedObject):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.MeterReadings if x != self]
-            self._Meter._MeterReadings = filtered
+            self._Meter._MeterReadings.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
@@ -175,18 +187,30 @@ class MeterReading(IdentifiedObject):
 
     def setIntervalBlocks(self, value):
         for x in self._IntervalBlocks:
-            x.MeterReading = None
-        for y in value:
-            y._MeterReading = self
-        self._IntervalBlocks = value
+            x._MeterReading = None
+        self._IntervalBlocks = RefList()
+        self.addIntervalBlocks(value)
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.MeterReading = self
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            old = obj._MeterReading
+            if old is not None and old is not self:
+                old._IntervalBlocks.discard(obj)
+            obj._MeterReading = self
+            collection.append(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.MeterReading = None
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            if obj._MeterReading is self:
+                obj._MeterReading = None
+                collection.discard(obj)
+
+    def removeAllIntervalBlocks(self):
+        for obj in self._IntervalBlocks:
+            obj._MeterReading = None
+        self._IntervalBlocks = RefList()
 
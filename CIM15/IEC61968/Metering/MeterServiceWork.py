@@ -52,8 +52,7 @@ class MeterServiceWork(Work):
 
     def setOldMeter(self, value):
         if self._OldMeter is not None:
-            filtered = [x for x in self.OldMeter.MeterReplacementWorks if x != self]
-            self._OldMeter._MeterReplacementWorks = filtered
+            self._OldMeter._MeterReplacementWorks.discard(self)
 
         self._OldMeter = value
         if self._OldMeter is not None:
@@ -69,8 +68,7 @@ class MeterServiceWork(Work):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.MeterServiceWorks if x != self]
-            self._Meter._MeterServiceWorks = filtered
+            self._Meter._MeterServiceWorks.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class PendingCalculation(Element):
     """When present, a scalar conversion that needs to be applied to every IntervalReading.value contained in IntervalBlock. This conversion results in a new associated ReadingType, reflecting the true dimensions of IntervalReading values after the conversion.When present, a scalar conversion that needs to be applied to every IntervalReading.value contained in IntervalBlock. This conversion results in a new associated ReadingType, reflecting the true dimensions of IntervalReading values after the conversion.
@@ -50,7 +51,7 @@ class PendingCalculation(Element):
         #: (if applicable) Offset to be added as well as multiplication using scalars.
         self.offset = offset
 
-        self._IntervalBlocks = []
+        self._IntervalBlocks = RefList()
         self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
 
         self._ReadingType = None
@@ -72,20 +73,32 @@ class PendingCalculation(Element):
 
     def setIntervalBlocks(self, value):
         for x in self._IntervalBlocks:
-            x.PendingCalculation = None
-        for y in value:
-            y._PendingCalculation = self
-        self._IntervalBlocks = value
+            x._PendingCalculation = None
+        self._IntervalBlocks = RefList()
+        self.addIntervalBlocks(value)
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.PendingCalculation = self
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            old = obj._PendingCalculation
+            if old is not None and old is not self:
+                old._IntervalBlocks.discard(obj)
+            obj._PendingCalculation = self
+            collection.append(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.PendingCalculation = None
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            if obj._PendingCalculation is self:
+                obj._PendingCalculation = None
+                collection.discard(obj)
+
+    def removeAllIntervalBlocks(self):
+        for obj in self._IntervalBlocks:
+            obj._PendingCalculation = None
+        self._IntervalBlocks = RefList()
 
     def getReadingType(self):
         """Reading type resulting from this pending conversion.
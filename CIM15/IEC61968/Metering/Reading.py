@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from PyCIM.RefList import RefList, members
 
 class Reading(MeasurementValue):
     """Specific value measured by a meter or other asset. Each Reading is associated with a specific ReadingType.Specific value measured by a meter or other asset. Each Reading is associated with a specific ReadingType.
@@ -38,10 +39,10 @@ class Reading(MeasurementValue):
         self._ReadingType = None
         self.ReadingType = ReadingType
 
-        self._MeterReadings = []
+        self._MeterReadings = RefList()
         self.MeterReadings = [] if MeterReadings is None else MeterReadings
 
-        self._ReadingQualities = []
+        self._ReadingQualities = RefList()
         self.ReadingQualities = [] if ReadingQualities is None else ReadingQualities
 
         super(Reading, self).__init__(*args, **kw_args)
@@ -60,8 +61,7 @@ class Reading(MeasurementValue):
 
     def setReadingType(self, value):
         if self._ReadingType is not None:
-            filtered = [x for x in self.ReadingType.Readings if x != self]
-            self._ReadingType._Readings = filtered
+            self._ReadingType._Readings.discard(self)
 
         self._ReadingType = value
         if self._ReadingType is not None:
@@ -77,26 +77,28 @@ class Reading(MeasurementValue):
 
     def setMeterReadings(self, value):
         for p in self._MeterReadings:
-            filtered = [q for q in p.Readings if q != self]
-            self._MeterReadings._Readings = filtered
-        for r in value:
-            if self not in r._Readings:
-                r._Readings.append(self)
-        self._MeterReadings = value
+            p._Readings.discard(self)
+        self._MeterReadings = RefList()
+        self.addMeterReadings(value)
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            if self not in obj._Readings:
-                obj._Readings.append(self)
-            self._MeterReadings.append(obj)
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            obj._Readings.append(self)
+            collection.append(obj)
 
     def removeMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            if self in obj._Readings:
-                obj._Readings.remove(self)
-            self._MeterReadings.remove(obj)
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            obj._Readings.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeterReadings(self):
+        for obj in self._MeterReadings:
+            obj._Readings.discard(self)
+        self._MeterReadings = RefList()
 
     def getReadingQualities(self):
         """Used only if quality of this reading value is different than 'Good'.
@@ -105,18 +107,30 @@ class Reading(MeasurementValue):
 
     def setReadingQualities(self, value):
         for x in self._ReadingQualities:
-            x.Reading = None
-        for y in value:
-            y._Reading = self
-        self._ReadingQualities = value
+            x._Reading = None
+        self._ReadingQualities = RefList()
+        self.addReadingQualities(value)
 
     ReadingQualities = property(getReadingQualities, setReadingQualities)
 
     def addReadingQualities(self, *ReadingQualities):
-        for obj in ReadingQualities:
-            obj.Reading = self
+        collection = self._ReadingQualities
+        for obj in members(ReadingQualities):
+            old = obj._Reading
+            if old is not None and old is not self:
+                old._ReadingQualities.discard(obj)
+            obj._Reading = self
+            collection.append(obj)
 
     def removeReadingQualities(self, *ReadingQualities):
-        for obj in ReadingQualities:
-            obj.Reading = None
+        collection = self._ReadingQualities
+        for obj in members(ReadingQualities):
+            if obj._Reading is self:
+                obj._Reading = None
+                collection.discard(obj)
+
+    def removeAllReadingQualities(self):
+        for obj in self._ReadingQualities:
+            obj._Reading = None
+        self._ReadingQualities = RefList()
 
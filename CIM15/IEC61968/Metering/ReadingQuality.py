@@ -56,8 +56,7 @@ class ReadingQuality(Element):
 
     def setReading(self, value):
         if self._Reading is not None:
-            filtered = [x for x in self.Reading.ReadingQualities if x != self]
-            self._Reading._ReadingQualities = filtered
+            self._Reading._ReadingQualities.discard(self)
 
         self._Reading = value
         if self._Reading is not None:
@@ -73,8 +72,7 @@ class ReadingQuality(Element):
 
     def setIntervalReading(self, value):
         if self._IntervalReading is not None:
-            filtered = [x for x in self.IntervalReading.ReadingQualities if x != self]
-            self._IntervalReading._ReadingQualities = filtered
+            self._IntervalReading._ReadingQualities.discard(self)
 
         self._IntervalReading = value
         if self._IntervalReading is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ReadingType(IdentifiedObject):
     """Type of data conveyed by a specific Reading.Type of data conveyed by a specific Reading.
@@ -65,12 +66,12 @@ class ReadingType(IdentifiedObject):
         #: Numeric type to be expected for the associated IntervalBlock.value (e.g. unsignedInteger).
         self.defaultValueDataType = defaultValueDataType
 
-        self._IntervalBlocks = []
+        self._IntervalBlocks = RefList()
         self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
 
         self.dynamicConfiguration = dynamicConfiguration
 
-        self._Readings = []
+        self._Readings = RefList()
         self.Readings = [] if Readings is None else Readings
 
         self._Register = None
@@ -95,20 +96,32 @@ class ReadingType(IdentifiedObject):
 
     def setIntervalBlocks(self, value):
         for x in self._IntervalBlocks:
-            x.ReadingType = None
-        for y in value:
-            y._ReadingType = self
-        self._IntervalBlocks = value
+            x._ReadingType = None
+        self._IntervalBlocks = RefList()
+        self.addIntervalBlocks(value)
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.ReadingType = self
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            old = obj._ReadingType
+            if old is not None and old is not self:
+                old._IntervalBlocks.discard(obj)
+            obj._ReadingType = self
+            collection.append(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
-        for obj in IntervalBlocks:
-            obj.ReadingType = None
+        collection = self._IntervalBlocks
+        for obj in members(IntervalBlocks):
+            if obj._ReadingType is self:
+                obj._ReadingType = None
+                collection.discard(obj)
+
+    def removeAllIntervalBlocks(self):
+        for obj in self._IntervalBlocks:
+            obj._ReadingType = None
+        self._IntervalBlocks = RefList()
 
     # Demand configuration.
     dynamicConfiguration = None
@@ -120,20 +133,32 @@ class ReadingType(IdentifiedObject):
 
     def setReadings(self, value):
         for x in self._Readings:
-            x.ReadingType = None
-        for y in value:
-            y._ReadingType = self
-        self._Readings = value
+            x._ReadingType = None
+        self._Readings = RefList()
+        self.addReadings(value)
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
-        for obj in Readings:
-            obj.ReadingType = self
+        collection = self._Readings
+        for obj in members(Readings):
+            old = obj._ReadingType
+            if old is not None and old is not self:
+                old._Readings.discard(obj)
+            obj._ReadingType = self
+            collection.append(obj)
 
     def removeReadings(self, *Readings):
-        for obj in Readings:
-            obj.ReadingType = None
+        collection = self._Readings
+        for obj in members(Readings):
+            if obj._ReadingType is self:
+                obj._ReadingType = None
+                collection.discard(obj)
+
+    def removeAllReadings(self):
+        for obj in self._Readings:
+            obj._ReadingType = None
+        self._Readings = RefList()
 
     def getRegister(self):
         """Register displaying values with this type information.
@@ -76,8 +76,7 @@ class Register(IdentifiedObject):
 
     def setEndDeviceFunction(self, value):
         if self._EndDeviceFunction is not None:
-            filtered = [x for x in self.EndDeviceFunction.Registers if x != self]
-            self._EndDeviceFunction._Registers = filtered
+            self._EndDeviceFunction._Registers.discard(self)
 
         self._EndDeviceFunction = value
         if self._EndDeviceFunction is not None:
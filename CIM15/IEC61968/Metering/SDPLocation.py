@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Location import Location
+from PyCIM.RefList import RefList, members
 
 class SDPLocation(Location):
     """Location of an individual service delivery point. For residential or most businesses, it is typically the location of a meter on the customer's premises. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party. The point(s) of delivery is specified in the service agreement.Location of an individual service delivery point. For residential or most businesses, it is typically the location of a meter on the customer's premises. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party. The point(s) of delivery is specified in the service agreement.
@@ -45,7 +46,7 @@ class SDPLocation(Location):
         #: Date when certificate of occupancy was provided for this location, 0 if valid certificate of occupancy does not exist for (inherited) 'Location.corporateCode'.
         self.occupancyDate = occupancyDate
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         super(SDPLocation, self).__init__(*args, **kw_args)
@@ -64,24 +65,26 @@ class SDPLocation(Location):
 
     def setServiceDeliveryPoints(self, value):
         for p in self._ServiceDeliveryPoints:
-            filtered = [q for q in p.SDPLocations if q != self]
-            self._ServiceDeliveryPoints._SDPLocations = filtered
-        for r in value:
-            if self not in r._SDPLocations:
-                r._SDPLocations.append(self)
-        self._ServiceDeliveryPoints = value
+            p._SDPLocations.discard(self)
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            if self not in obj._SDPLocations:
-                obj._SDPLocations.append(self)
-            self._ServiceDeliveryPoints.append(obj)
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            obj._SDPLocations.append(self)
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            if self in obj._SDPLocations:
-                obj._SDPLocations.remove(self)
-            self._ServiceDeliveryPoints.remove(obj)
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            obj._SDPLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._SDPLocations.discard(self)
+        self._ServiceDeliveryPoints = RefList()
 
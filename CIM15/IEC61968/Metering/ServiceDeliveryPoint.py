@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ServiceDeliveryPoint(IdentifiedObject):
     """Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a service location, delivering service in accordance with a customer agreement. Used at the place where a meter may be installed.Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a service location, delivering service in accordance with a customer agreement. Used at the place where a meter may be installed.
@@ -78,22 +79,22 @@ class ServiceDeliveryPoint(IdentifiedObject):
         #: Nominal service voltage.
         self.ratedVoltage = ratedVoltage
 
-        self._SDPLocations = []
+        self._SDPLocations = RefList()
         self.SDPLocations = [] if SDPLocations is None else SDPLocations
 
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._EndDevices = []
+        self._EndDevices = RefList()
         self.EndDevices = [] if EndDevices is None else EndDevices
 
-        self._MeterReadings = []
+        self._MeterReadings = RefList()
         self.MeterReadings = [] if MeterReadings is None else MeterReadings
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._PricingStructures = []
+        self._PricingStructures = RefList()
         self.PricingStructures = [] if PricingStructures is None else PricingStructures
 
         self._EnergyConsumer = None
@@ -124,26 +125,28 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setSDPLocations(self, value):
         for p in self._SDPLocations:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._SDPLocations._ServiceDeliveryPoints = filtered
-        for r in value:
-            if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
-        self._SDPLocations = value
+            p._ServiceDeliveryPoints.discard(self)
+        self._SDPLocations = RefList()
+        self.addSDPLocations(value)
 
     SDPLocations = property(getSDPLocations, setSDPLocations)
 
     def addSDPLocations(self, *SDPLocations):
-        for obj in SDPLocations:
-            if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._SDPLocations.append(obj)
+        collection = self._SDPLocations
+        for obj in members(SDPLocations):
+            obj._ServiceDeliveryPoints.append(self)
+            collection.append(obj)
 
     def removeSDPLocations(self, *SDPLocations):
-        for obj in SDPLocations:
-            if self in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.remove(self)
-            self._SDPLocations.remove(obj)
+        collection = self._SDPLocations
+        for obj in members(SDPLocations):
+            obj._ServiceDeliveryPoints.discard(self)
+            collection.discard(obj)
+
+    def removeAllSDPLocations(self):
+        for obj in self._SDPLocations:
+            obj._ServiceDeliveryPoints.discard(self)
+        self._SDPLocations = RefList()
 
     def getServiceLocation(self):
         """Service location where the service delivered by this service delivery point is consumed.
@@ -152,8 +155,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ServiceDeliveryPoints if x != self]
-            self._ServiceLocation._ServiceDeliveryPoints = filtered
+            self._ServiceLocation._ServiceDeliveryPoints.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
@@ -169,20 +171,32 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setEndDevices(self, value):
         for x in self._EndDevices:
-            x.ServiceDeliveryPoint = None
-        for y in value:
-            y._ServiceDeliveryPoint = self
-        self._EndDevices = value
+            x._ServiceDeliveryPoint = None
+        self._EndDevices = RefList()
+        self.addEndDevices(value)
 
     EndDevices = property(getEndDevices, setEndDevices)
 
     def addEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.ServiceDeliveryPoint = self
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            old = obj._ServiceDeliveryPoint
+            if old is not None and old is not self:
+                old._EndDevices.discard(obj)
+            obj._ServiceDeliveryPoint = self
+            collection.append(obj)
 
     def removeEndDevices(self, *EndDevices):
-        for obj in EndDevices:
-            obj.ServiceDeliveryPoint = None
+        collection = self._EndDevices
+        for obj in members(EndDevices):
+            if obj._ServiceDeliveryPoint is self:
+                obj._ServiceDeliveryPoint = None
+                collection.discard(obj)
+
+    def removeAllEndDevices(self):
+        for obj in self._EndDevices:
+            obj._ServiceDeliveryPoint = None
+        self._EndDevices = RefList()
 
     def getMeterReadings(self):
         """All meter readings obtained from this service delivery point.
@@ -191,20 +205,32 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setMeterReadings(self, value):
         for x in self._MeterReadings:
-            x.ServiceDeliveryPoint = None
-        for y in value:
-            y._ServiceDeliveryPoint = self
-        self._MeterReadings = value
+            x._ServiceDeliveryPoint = None
+        self._MeterReadings = RefList()
+        self.addMeterReadings(value)
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.ServiceDeliveryPoint = self
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            old = obj._ServiceDeliveryPoint
+            if old is not None and old is not self:
+                old._MeterReadings.discard(obj)
+            obj._ServiceDeliveryPoint = self
+            collection.append(obj)
 
     def removeMeterReadings(self, *MeterReadings):
-        for obj in MeterReadings:
-            obj.ServiceDeliveryPoint = None
+        collection = self._MeterReadings
+        for obj in members(MeterReadings):
+            if obj._ServiceDeliveryPoint is self:
+                obj._ServiceDeliveryPoint = None
+                collection.discard(obj)
+
+    def removeAllMeterReadings(self):
+        for obj in self._MeterReadings:
+            obj._ServiceDeliveryPoint = None
+        self._MeterReadings = RefList()
 
     def getServiceCategory(self):
         """Service category delivered by this service delivery point.
@@ -213,8 +239,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.ServiceDeliveryPoints if x != self]
-            self._ServiceCategory._ServiceDeliveryPoints = filtered
+            self._ServiceCategory._ServiceDeliveryPoints.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
@@ -230,26 +255,28 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._PricingStructures._ServiceDeliveryPoints = filtered
-        for r in value:
-            if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
-        self._PricingStructures = value
+            p._ServiceDeliveryPoints.discard(self)
+        self._PricingStructures = RefList()
+        self.addPricingStructures(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._PricingStructures.append(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._ServiceDeliveryPoints.append(self)
+            collection.append(obj)
 
     def removePricingStructures(self, *PricingStructures):
-        for obj in PricingStructures:
-            if self in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.remove(self)
-            self._PricingStructures.remove(obj)
+        collection = self._PricingStructures
+        for obj in members(PricingStructures):
+            obj._ServiceDeliveryPoints.discard(self)
+            collection.discard(obj)
+
+    def removeAllPricingStructures(self):
+        for obj in self._PricingStructures:
+            obj._ServiceDeliveryPoints.discard(self)
+        self._PricingStructures = RefList()
 
     def getEnergyConsumer(self):
         
@@ -257,8 +284,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.ServiceDeliveryPoints if x != self]
-            self._EnergyConsumer._ServiceDeliveryPoints = filtered
+            self._EnergyConsumer._ServiceDeliveryPoints.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
@@ -274,8 +300,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.ServiceDeliveryPoints if x != self]
-            self._ServiceSupplier._ServiceDeliveryPoints = filtered
+            self._ServiceSupplier._ServiceDeliveryPoints.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
@@ -291,8 +316,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.ServiceDeliveryPoints if x != self]
-            self._CustomerAgreement._ServiceDeliveryPoints = filtered
+            self._CustomerAgreement._ServiceDeliveryPoints.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
@@ -308,8 +332,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setTransformerTanks(self, value):
         if self._TransformerTanks is not None:
-            filtered = [x for x in self.TransformerTanks.ServiceDeliveryPoints if x != self]
-            self._TransformerTanks._ServiceDeliveryPoints = filtered
+            self._TransformerTanks._ServiceDeliveryPoints.discard(self)
 
         self._TransformerTanks = value
         if self._TransformerTanks is not None:
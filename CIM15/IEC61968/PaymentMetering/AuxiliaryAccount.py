@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class AuxiliaryAccount(Document):
     """Variable and dynamic part of auxiliary agreement, generally representing the current state of the account related to the outstanding balance defined in auxiliary agreement.Variable and dynamic part of auxiliary agreement, generally representing the current state of the account related to the outstanding balance defined in auxiliary agreement.
@@ -44,10 +45,10 @@ class AuxiliaryAccount(Document):
 
         self.lastDebit = lastDebit
 
-        self._PaymentTransactions = []
+        self._PaymentTransactions = RefList()
         self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
 
-        self._Charges = []
+        self._Charges = RefList()
         self.Charges = [] if Charges is None else Charges
 
         self.lastCredit = lastCredit
@@ -76,20 +77,32 @@ class AuxiliaryAccount(Document):
 
     def setPaymentTransactions(self, value):
         for x in self._PaymentTransactions:
-            x.AuxiliaryAccount = None
-        for y in value:
-            y._AuxiliaryAccount = self
-        self._PaymentTransactions = value
+            x._AuxiliaryAccount = None
+        self._PaymentTransactions = RefList()
+        self.addPaymentTransactions(value)
 
     PaymentTransactions = property(getPaymentTransactions, setPaymentTransactions)
 
     def addPaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.AuxiliaryAccount = self
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            old = obj._AuxiliaryAccount
+            if old is not None and old is not self:
+                old._PaymentTransactions.discard(obj)
+            obj._AuxiliaryAccount = self
+            collection.append(obj)
 
     def removePaymentTransactions(self, *PaymentTransactions):
-        for obj in PaymentTransactions:
-            obj.AuxiliaryAccount = None
+        collection = self._PaymentTransactions
+        for obj in members(PaymentTransactions):
+            if obj._AuxiliaryAccount is self:
+                obj._AuxiliaryAccount = None
+                collection.discard(obj)
+
+    def removeAllPaymentTransactions(self):
+        for obj in self._PaymentTransactions:
+            obj._AuxiliaryAccount = None
+        self._PaymentTransactions = RefList()
 
     def getCharges(self):
         """All charges levied on this account.
@@ -98,26 +111,28 @@ class AuxiliaryAccount(Document):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.AuxiliaryAccounts if q != self]
-            self._Charges._AuxiliaryAccounts = filtered
-        for r in value:
-            if self not in r._AuxiliaryAccounts:
-                r._AuxiliaryAccounts.append(self)
-        self._Charges = value
+            p._AuxiliaryAccounts.discard(self)
+        self._Charges = RefList()
+        self.addCharges(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
-        for obj in Charges:
-            if self not in obj._AuxiliaryAccounts:
-                obj._AuxiliaryAccounts.append(self)
-            self._Charges.append(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._AuxiliaryAccounts.append(self)
+            collection.append(obj)
 
     def removeCharges(self, *Charges):
-        for obj in Charges:
-            if self in obj._AuxiliaryAccounts:
-                obj._AuxiliaryAccounts.remove(self)
-            self._Charges.remove(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._AuxiliaryAccounts.discard(self)
+            collection.discard(obj)
+
+    def removeAllCharges(self):
+        for obj in self._Charges:
+            obj._AuxiliaryAccounts.discard(self)
+        self._Charges = RefList()
 
     # Details of the last credit transaction performed on this account.
     lastCredit = None
@@ -129,8 +144,7 @@ class AuxiliaryAccount(Document):
 
     def setAuxiliaryAgreement(self, value):
         if self._AuxiliaryAgreement is not None:
-            filtered = [x for x in self.AuxiliaryAgreement.AuxiliaryAccounts if x != self]
-            self._AuxiliaryAgreement._AuxiliaryAccounts = filtered
+            self._AuxiliaryAgreement._AuxiliaryAccounts.discard(self)
 
         self._AuxiliaryAgreement = value
         if self._AuxiliaryAgreement is not None:
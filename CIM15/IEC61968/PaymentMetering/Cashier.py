@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Cashier(IdentifiedObject):
     """The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.
@@ -32,7 +33,7 @@ class Cashier(IdentifiedObject):
         """
         self.electronicAddress = electronicAddress
 
-        self._CashierShifts = []
+        self._CashierShifts = RefList()
         self.CashierShifts = [] if CashierShifts is None else CashierShifts
 
         super(Cashier, self).__init__(*args, **kw_args)
@@ -54,18 +55,30 @@ class Cashier(IdentifiedObject):
 
     def setCashierShifts(self, value):
         for x in self._CashierShifts:
-            x.Cashier = None
-        for y in value:
-            y._Cashier = self
-        self._CashierShifts = value
+            x._Cashier = None
+        self._CashierShifts = RefList()
+        self.addCashierShifts(value)
 
     CashierShifts = property(getCashierShifts, setCashierShifts)
 
     def addCashierShifts(self, *CashierShifts):
-        for obj in CashierShifts:
-            obj.Cashier = self
+        collection = self._CashierShifts
+        for obj in members(CashierShifts):
+            old = obj._Cashier
+            if old is not None and old is not self:
+                old._CashierShifts.discard(obj)
+            obj._Cashier = self
+            collection.append(obj)
 
     def removeCashierShifts(self, *CashierShifts):
-        for obj in CashierShifts:
-            obj.Cashier = None
+        collection = self._CashierShifts
+        for obj in members(CashierShifts):
+            if obj._Cashier is self:
+                obj._Cashier = None
+                collection.discard(obj)
+
+    def removeAllCashierShifts(self):
+        for obj in self._CashierShifts:
+            obj._Cashier = None
+        self._CashierShifts = RefList()
 
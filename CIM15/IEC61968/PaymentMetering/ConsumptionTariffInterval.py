@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class ConsumptionTariffInterval(Element):
     """One of a sequence of intervals defined in terms of consumption quantity of a service such as electricity, water, gas, etc. It is typically used in association with TariffProfile to define the steps or blocks in a step tariff structure, where startValue simultaneously defines the entry value of this step and the closing value of the previous step. Where consumption is &gt;= startValue it falls within this interval and where consumption is &lt; startValue it falls within the previous interval.One of a sequence of intervals defined in terms of consumption quantity of a service such as electricity, water, gas, etc. It is typically used in association with TariffProfile to define the steps or blocks in a step tariff structure, where startValue simultaneously defines the entry value of this step and the closing value of the previous step. Where consumption is &gt;= startValue it falls within this interval and where consumption is &lt; startValue it falls within the previous interval.
@@ -39,13 +40,13 @@ class ConsumptionTariffInterval(Element):
         #: A sequential reference that defines the identity of this interval and its relative position with respect to other intervals in a sequence of intervals.
         self.sequenceNumber = sequenceNumber
 
-        self._Charges = []
+        self._Charges = RefList()
         self.Charges = [] if Charges is None else Charges
 
-        self._TariffProfiles = []
+        self._TariffProfiles = RefList()
         self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
 
-        self._TouTariffIntervals = []
+        self._TouTariffIntervals = RefList()
         self.TouTariffIntervals = [] if TouTariffIntervals is None else TouTariffIntervals
 
         super(ConsumptionTariffInterval, self).__init__(*args, **kw_args)
@@ -64,26 +65,28 @@ class ConsumptionTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._Charges._ConsumptionTariffIntervals = filtered
-        for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._Charges = value
+            p._ConsumptionTariffIntervals.discard(self)
+        self._Charges = RefList()
+        self.addCharges(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
-        for obj in Charges:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._Charges.append(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._ConsumptionTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeCharges(self, *Charges):
-        for obj in Charges:
-            if self in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.remove(self)
-            self._Charges.remove(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._ConsumptionTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllCharges(self):
+        for obj in self._Charges:
+            obj._ConsumptionTariffIntervals.discard(self)
+        self._Charges = RefList()
 
     def getTariffProfiles(self):
         """All tariff profiles defined by this consumption tariff interval.
@@ -92,26 +95,28 @@ class ConsumptionTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._TariffProfiles._ConsumptionTariffIntervals = filtered
-        for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._TariffProfiles = value
+            p._ConsumptionTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
+        self.addTariffProfiles(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._ConsumptionTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.remove(self)
-            self._TariffProfiles.remove(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._ConsumptionTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffProfiles(self):
+        for obj in self._TariffProfiles:
+            obj._ConsumptionTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
 
     def getTouTariffIntervals(self):
         """All time of use tariff intervals influenced by this consumption tariff interval.
@@ -120,24 +125,26 @@ class ConsumptionTariffInterval(Element):
 
     def setTouTariffIntervals(self, value):
         for p in self._TouTariffIntervals:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._TouTariffIntervals._ConsumptionTariffIntervals = filtered
-        for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._TouTariffIntervals = value
+            p._ConsumptionTariffIntervals.discard(self)
+        self._TouTariffIntervals = RefList()
+        self.addTouTariffIntervals(value)
 
     TouTariffIntervals = property(getTouTariffIntervals, setTouTariffIntervals)
 
     def addTouTariffIntervals(self, *TouTariffIntervals):
-        for obj in TouTariffIntervals:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._TouTariffIntervals.append(obj)
+        collection = self._TouTariffIntervals
+        for obj in members(TouTariffIntervals):
+            obj._ConsumptionTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeTouTariffIntervals(self, *TouTariffIntervals):
-        for obj in TouTariffIntervals:
-            if self in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.remove(self)
-            self._TouTariffIntervals.remove(obj)
+        collection = self._TouTariffIntervals
+        for obj in members(TouTariffIntervals):
+            obj._ConsumptionTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllTouTariffIntervals(self):
+        for obj in self._TouTariffIntervals:
+            obj._ConsumptionTariffIntervals.discard(self)
+        self._TouTariffIntervals = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class MerchantAccount(Document):
     """The operating account controlled by merchant agreement, against which vendor may vend tokens or receipt payments. Transactions via vendor shift debit the account and bank deposits via bank statement credit the account.The operating account controlled by merchant agreement, against which vendor may vend tokens or receipt payments. Transactions via vendor shift debit the account and bank deposits via bank statement credit the account.
@@ -42,10 +43,10 @@ class MerchantAccount(Document):
         self._MerchantAgreement = None
         self.MerchantAgreement = MerchantAgreement
 
-        self._Transactors = []
+        self._Transactors = RefList()
         self.Transactors = [] if Transactors is None else Transactors
 
-        self._VendorShifts = []
+        self._VendorShifts = RefList()
         self.VendorShifts = [] if VendorShifts is None else VendorShifts
 
         super(MerchantAccount, self).__init__(*args, **kw_args)
@@ -64,8 +65,7 @@ class MerchantAccount(Document):
 
     def setMerchantAgreement(self, value):
         if self._MerchantAgreement is not None:
-            filtered = [x for x in self.MerchantAgreement.MerchantAccounts if x != self]
-            self._MerchantAgreement._MerchantAccounts = filtered
+            self._MerchantAgreement._MerchantAccounts.discard(self)
 
         self._MerchantAgreement = value
         if self._MerchantAgreement is not None:
@@ -81,26 +81,28 @@ class MerchantAccount(Document):
 
     def setTransactors(self, value):
         for p in self._Transactors:
-            filtered = [q for q in p.MerchantAccounts if q != self]
-            self._Transactors._MerchantAccounts = filtered
-        for r in value:
-            if self not in r._MerchantAccounts:
-                r._MerchantAccounts.append(self)
-        self._Transactors = value
+            p._MerchantAccounts.discard(self)
+        self._Transactors = RefList()
+        self.addTransactors(value)
 
     Transactors = property(getTransactors, setTransactors)
 
     def addTransactors(self, *Transactors):
-        for obj in Transactors:
-            if self not in obj._MerchantAccounts:
-                obj._MerchantAccounts.append(self)
-            self._Transactors.append(obj)
+        collection = self._Transactors
+        for obj in members(Transactors):
+            obj._MerchantAccounts.append(self)
+            collection.append(obj)
 
     def removeTransactors(self, *Transactors):
-        for obj in Transactors:
-            if self in obj._MerchantAccounts:
-                obj._MerchantAccounts.remove(self)
-            self._Transactors.remove(obj)
+        collection = self._Transactors
+        for obj in members(Transactors):
+            obj._MerchantAccounts.discard(self)
+            collection.discard(obj)
+
+    def removeAllTransactors(self):
+        for obj in self._Transactors:
+            obj._MerchantAccounts.discard(self)
+        self._Transactors = RefList()
 
     def getVendorShifts(self):
         """All vendor shifts that operate on this merchant account.
@@ -109,18 +111,30 @@ class MerchantAccount(Document):
 
     def setVendorShifts(self, value):
         for x in self._VendorShifts:
-            x.MerchantAccount = None
-        for y in value:
-            y._MerchantAccount = self
-        self._VendorShifts = value
+            x._MerchantAccount = None
+        self._VendorShifts = RefList()
+        self.addVendorShifts(value)
 
     VendorShifts = property(getVendorShifts, setVendorShifts)
 
     def addVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.MerchantAccount = self
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            old = obj._MerchantAccount
+            if old is not None and old is not self:
+                old._VendorShifts.discard(obj)
+            obj._MerchantAccount = self
+            collection.append(obj)
 
     def removeVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.MerchantAccount = None
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            if obj._MerchantAccount is self:
+                obj._MerchantAccount = None
+                collection.discard(obj)
+
+    def removeAllVendorShifts(self):
+        for obj in self._VendorShifts:
+            obj._MerchantAccount = None
+        self._VendorShifts = RefList()
 
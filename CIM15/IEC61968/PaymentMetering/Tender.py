@@ -84,8 +84,7 @@ class Tender(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Tenders if x != self]
-            self._Receipt._Tenders = filtered
+            self._Receipt._Tenders.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
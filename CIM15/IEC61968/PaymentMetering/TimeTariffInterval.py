@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class TimeTariffInterval(Element):
     """One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.
@@ -39,13 +40,13 @@ class TimeTariffInterval(Element):
         #: A sequential reference that defines the identity of this interval and its relative position with respect to other intervals in a sequence of intervals.
         self.sequenceNumber = sequenceNumber
 
-        self._ConsumptionTariffIntervals = []
+        self._ConsumptionTariffIntervals = RefList()
         self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
 
-        self._TariffProfiles = []
+        self._TariffProfiles = RefList()
         self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
 
-        self._Charges = []
+        self._Charges = RefList()
         self.Charges = [] if Charges is None else Charges
 
         super(TimeTariffInterval, self).__init__(*args, **kw_args)
@@ -64,26 +65,28 @@ class TimeTariffInterval(Element):
 
     def setConsumptionTariffIntervals(self, value):
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.TouTariffIntervals if q != self]
-            self._ConsumptionTariffIntervals._TouTariffIntervals = filtered
-        for r in value:
-            if self not in r._TouTariffIntervals:
-                r._TouTariffIntervals.append(self)
-        self._ConsumptionTariffIntervals = value
+            p._TouTariffIntervals.discard(self)
+        self._ConsumptionTariffIntervals = RefList()
+        self.addConsumptionTariffIntervals(value)
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
-        for obj in ConsumptionTariffIntervals:
-            if self not in obj._TouTariffIntervals:
-                obj._TouTariffIntervals.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+        collection = self._ConsumptionTariffIntervals
+        for obj in members(ConsumptionTariffIntervals):
+            obj._TouTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
-        for obj in ConsumptionTariffIntervals:
-            if self in obj._TouTariffIntervals:
-                obj._TouTariffIntervals.remove(self)
-            self._ConsumptionTariffIntervals.remove(obj)
+        collection = self._ConsumptionTariffIntervals
+        for obj in members(ConsumptionTariffIntervals):
+            obj._TouTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllConsumptionTariffIntervals(self):
+        for obj in self._ConsumptionTariffIntervals:
+            obj._TouTariffIntervals.discard(self)
+        self._ConsumptionTariffIntervals = RefList()
 
     def getTariffProfiles(self):
         """All tariff profiles defined by this time tariff interval.
@@ -92,26 +95,28 @@ class TimeTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._TariffProfiles._TimeTariffIntervals = filtered
-        for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._TariffProfiles = value
+            p._TimeTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
+        self.addTariffProfiles(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._TimeTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
-        for obj in TariffProfiles:
-            if self in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.remove(self)
-            self._TariffProfiles.remove(obj)
+        collection = self._TariffProfiles
+        for obj in members(TariffProfiles):
+            obj._TimeTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllTariffProfiles(self):
+        for obj in self._TariffProfiles:
+            obj._TimeTariffIntervals.discard(self)
+        self._TariffProfiles = RefList()
 
     def getCharges(self):
         """All charges used to define this time tariff interval.
@@ -120,24 +125,26 @@ class TimeTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._Charges._TimeTariffIntervals = filtered
-        for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._Charges = value
+            p._TimeTariffIntervals.discard(self)
+        self._Charges = RefList()
+        self.addCharges(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
-        for obj in Charges:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._Charges.append(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._TimeTariffIntervals.append(self)
+            collection.append(obj)
 
     def removeCharges(self, *Charges):
-        for obj in Charges:
-            if self in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.remove(self)
-            self._Charges.remove(obj)
+        collection = self._Charges
+        for obj in members(Charges):
+            obj._TimeTariffIntervals.discard(self)
+            collection.discard(obj)
+
+    def removeAllCharges(self):
+        for obj in self._Charges:
+            obj._TimeTariffIntervals.discard(self)
+        self._Charges = RefList()
 
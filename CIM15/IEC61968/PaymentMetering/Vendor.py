@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Vendor(IdentifiedObject):
     """The entity that owns point of sale and contracts with cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by merchant who is a type of organisation. Vendor is accountable to merchant for revenue collected, who is in turn accountable to supplier.The entity that owns point of sale and contracts with cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by merchant who is a type of organisation. Vendor is accountable to merchant for revenue collected, who is in turn accountable to supplier.
@@ -29,7 +30,7 @@ class Vendor(IdentifiedObject):
 
         @param VendorShifts: All vendor shifts opened and owned by this vendor.
         """
-        self._VendorShifts = []
+        self._VendorShifts = RefList()
         self.VendorShifts = [] if VendorShifts is None else VendorShifts
 
         super(Vendor, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class Vendor(IdentifiedObject):
 
     def setVendorShifts(self, value):
         for x in self._VendorShifts:
-            x.Vendor = None
-        for y in value:
-            y._Vendor = self
-        self._VendorShifts = value
+            x._Vendor = None
+        self._VendorShifts = RefList()
+        self.addVendorShifts(value)
 
     VendorShifts = property(getVendorShifts, setVendorShifts)
 
     def addVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.Vendor = self
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            old = obj._Vendor
+            if old is not None and old is not self:
+                old._VendorShifts.discard(obj)
+            obj._Vendor = self
+            collection.append(obj)
 
     def removeVendorShifts(self, *VendorShifts):
-        for obj in VendorShifts:
-            obj.Vendor = None
+        collection = self._VendorShifts
+        for obj in members(VendorShifts):
+            if obj._Vendor is self:
+                obj._Vendor = None
+                collection.discard(obj)
+
+    def removeAllVendorShifts(self):
+        for obj in self._VendorShifts:
+            obj._Vendor = None
+        self._VendorShifts = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Work(Document):
     """Document used to request, initiate, track and record work. This is synonymous with work breakdown structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.Document used to request, initiate, track and record work. This is synonymous with work breakdown structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.
@@ -50,10 +51,10 @@ class Work(Document):
         #: Date and time work was requested.
         self.requestDateTime = requestDateTime
 
-        self._Designs = []
+        self._Designs = RefList()
         self.Designs = [] if Designs is None else Designs
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
         self._ErpProjectAccounting = None
@@ -62,10 +63,10 @@ class Work(Document):
         self._Project = None
         self.Project = Project
 
-        self._WorkFlowSteps = []
+        self._WorkFlowSteps = RefList()
         self.WorkFlowSteps = [] if WorkFlowSteps is None else WorkFlowSteps
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
         self._BusinessCase = None
@@ -77,7 +78,7 @@ class Work(Document):
         self._Request = None
         self.Request = Request
 
-        self._Customers = []
+        self._Customers = RefList()
         self.Customers = [] if Customers is None else Customers
 
         super(Work, self).__init__(*args, **kw_args)
@@ -95,20 +96,32 @@ class Work(Document):
 
     def setDesigns(self, value):
         for x in self._Designs:
-            x.Work = None
-        for y in value:
-            y._Work = self
-        self._Designs = value
+            x._Work = None
+        self._Designs = RefList()
+        self.addDesigns(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
-        for obj in Designs:
-            obj.Work = self
+        collection = self._Designs
+        for obj in members(Designs):
+            old = obj._Work
+            if old is not None and old is not self:
+                old._Designs.discard(obj)
+            obj._Work = self
+            collection.append(obj)
 
     def removeDesigns(self, *Designs):
-        for obj in Designs:
-            obj.Work = None
+        collection = self._Designs
+        for obj in members(Designs):
+            if obj._Work is self:
+                obj._Work = None
+                collection.discard(obj)
+
+    def removeAllDesigns(self):
+        for obj in self._Designs:
+            obj._Work = None
+        self._Designs = RefList()
 
     def getWorkCostDetails(self):
         
@@ -116,26 +129,28 @@ class Work(Document):
 
     def setWorkCostDetails(self, value):
         for p in self._WorkCostDetails:
-            filtered = [q for q in p.Works if q != self]
-            self._WorkCostDetails._Works = filtered
-        for r in value:
-            if self not in r._Works:
-                r._Works.append(self)
-        self._WorkCostDetails = value
+            p._Works.discard(self)
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            if self not in obj._Works:
-                obj._Works.append(self)
-            self._WorkCostDetails.append(obj)
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            obj._Works.append(self)
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            if self in obj._Works:
-                obj._Works.remove(self)
-            self._WorkCostDetails.remove(obj)
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            obj._Works.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._Works.discard(self)
+        self._WorkCostDetails = RefList()
 
     def getErpProjectAccounting(self):
         
@@ -143,8 +158,7 @@ class Work(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.Works if x != self]
-            self._ErpProjectAccounting._Works = filtered
+            self._ErpProjectAccounting._Works.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
@@ -159,8 +173,7 @@ class Work(Document):
 
     def setProject(self, value):
         if self._Project is not None:
-            filtered = [x for x in self.Project.Works if x != self]
-            self._Project._Works = filtered
+            self._Project._Works.discard(self)
 
         self._Project = value
         if self._Project is not None:
@@ -175,20 +188,32 @@ class Work(Document):
 
     def setWorkFlowSteps(self, value):
         for x in self._WorkFlowSteps:
-            x.Work = None
-        for y in value:
-            y._Work = self
-        self._WorkFlowSteps = value
+            x._Work = None
+        self._WorkFlowSteps = RefList()
+        self.addWorkFlowSteps(value)
 
     WorkFlowSteps = property(getWorkFlowSteps, setWorkFlowSteps)
 
     def addWorkFlowSteps(self, *WorkFlowSteps):
-        for obj in WorkFlowSteps:
-            obj.Work = self
+        collection = self._WorkFlowSteps
+        for obj in members(WorkFlowSteps):
+            old = obj._Work
+            if old is not None and old is not self:
+                old._WorkFlowSteps.discard(obj)
+            obj._Work = self
+            collection.append(obj)
 
     def removeWorkFlowSteps(self, *WorkFlowSteps):
-        for obj in WorkFlowSteps:
-            obj.Work = None
+        collection = self._WorkFlowSteps
+        for obj in members(WorkFlowSteps):
+            if obj._Work is self:
+                obj._Work = None
+                collection.discard(obj)
+
+    def removeAllWorkFlowSteps(self):
+        for obj in self._WorkFlowSteps:
+            obj._Work = None
+        self._WorkFlowSteps = RefList()
 
     def getWorkTasks(self):
         
@@ -196,20 +221,32 @@ class Work(Document):
 
     def setWorkTasks(self, value):
         for x in self._WorkTasks:
-            x.Work = None
-        for y in value:
-            y._Work = self
-        self._WorkTasks = value
+            x._Work = None
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.Work = self
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            old = obj._Work
+            if old is not None and old is not self:
+                old._WorkTasks.discard(obj)
+            obj._Work = self
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.Work = None
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            if obj._Work is self:
+                obj._Work = None
+                collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._Work = None
+        self._WorkTasks = RefList()
 
     def getBusinessCase(self):
         
@@ -217,8 +254,7 @@ class Work(Document):
 
     def setBusinessCase(self, value):
         if self._BusinessCase is not None:
-            filtered = [x for x in self.BusinessCase.Works if x != self]
-            self._BusinessCase._Works = filtered
+            self._BusinessCase._Works.discard(self)
 
         self._BusinessCase = value
         if self._BusinessCase is not None:
@@ -233,8 +269,7 @@ class Work(Document):
 
     def setWorkBillingInfo(self, value):
         if self._WorkBillingInfo is not None:
-            filtered = [x for x in self.WorkBillingInfo.Works if x != self]
-            self._WorkBillingInfo._Works = filtered
+            self._WorkBillingInfo._Works.discard(self)
 
         self._WorkBillingInfo = value
         if self._WorkBillingInfo is not None:
@@ -249,8 +284,7 @@ class Work(Document):
 
     def setRequest(self, value):
         if self._Request is not None:
-            filtered = [x for x in self.Request.Works if x != self]
-            self._Request._Works = filtered
+            self._Request._Works.discard(self)
 
         self._Request = value
         if self._Request is not None:
@@ -266,24 +300,26 @@ class Work(Document):
 
     def setCustomers(self, value):
         for p in self._Customers:
-            filtered = [q for q in p.Works if q != self]
-            self._Customers._Works = filtered
-        for r in value:
-            if self not in r._Works:
-                r._Works.append(self)
-        self._Customers = value
+            p._Works.discard(self)
+        self._Customers = RefList()
+        self.addCustomers(value)
 
     Customers = property(getCustomers, setCustomers)
 
     def addCustomers(self, *Customers):
-        for obj in Customers:
-            if self not in obj._Works:
-                obj._Works.append(self)
-            self._Customers.append(obj)
+        collection = self._Customers
+        for obj in members(Customers):
+            obj._Works.append(self)
+            collection.append(obj)
 
     def removeCustomers(self, *Customers):
-        for obj in Customers:
-            if self in obj._Works:
-                obj._Works.remove(self)
-            self._Customers.remove(obj)
+        collection = self._Customers
+        for obj in members(Customers):
+            obj._Works.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomers(self):
+        for obj in self._Customers:
+            obj._Works.discard(self)
+        self._Customers = RefList()
 
@@ -48,8 +48,7 @@ class AuxiliaryEquipment(Equipment):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.AuxiliaryEquipment if x != self]
-            self._Terminal._AuxiliaryEquipment = filtered
+            self._Terminal._AuxiliaryEquipment.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
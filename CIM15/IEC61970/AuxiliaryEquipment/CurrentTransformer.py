@@ -72,8 +72,7 @@ class CurrentTransformer(Sensor):
 
     def setCTInfo(self, value):
         if self._CTInfo is not None:
-            filtered = [x for x in self.CTInfo.CTs if x != self]
-            self._CTInfo._CTs = filtered
+            self._CTInfo._CTs.discard(self)
 
         self._CTInfo = value
         if self._CTInfo is not None:
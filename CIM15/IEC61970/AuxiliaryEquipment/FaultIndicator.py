@@ -48,8 +48,7 @@ class FaultIndicator(AuxiliaryEquipment):
 
     def setFaultIndicatorInfo(self, value):
         if self._FaultIndicatorInfo is not None:
-            filtered = [x for x in self.FaultIndicatorInfo.FaultIndicators if x != self]
-            self._FaultIndicatorInfo._FaultIndicators = filtered
+            self._FaultIndicatorInfo._FaultIndicators.discard(self)
 
         self._FaultIndicatorInfo = value
         if self._FaultIndicatorInfo is not None:
@@ -60,8 +60,7 @@ class PotentialTransformer(Sensor):
 
     def setPTInfo(self, value):
         if self._PTInfo is not None:
-            filtered = [x for x in self.PTInfo.PTs if x != self]
-            self._PTInfo._PTs = filtered
+            self._PTInfo._PTs.discard(self)
 
         self._PTInfo = value
         if self._PTInfo is not None:
@@ -48,8 +48,7 @@ class SurgeProtector(AuxiliaryEquipment):
 
     def setSurgeProtectorInfo(self, value):
         if self._SurgeProtectorInfo is not None:
-            filtered = [x for x in self.SurgeProtectorInfo.SurgeProtectors if x != self]
-            self._SurgeProtectorInfo._SurgeProtectors = filtered
+            self._SurgeProtectorInfo._SurgeProtectors.discard(self)
 
         self._SurgeProtectorInfo = value
         if self._SurgeProtectorInfo is not None:
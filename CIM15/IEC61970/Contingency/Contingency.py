@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Contingency(IdentifiedObject):
     """An event threatening system reliability, consisting of one or more contingency elements.An event threatening system reliability, consisting of one or more contingency elements.
@@ -33,7 +34,7 @@ class Contingency(IdentifiedObject):
         #: Set true if must study this contingency.
         self.mustStudy = mustStudy
 
-        self._ContingencyElement = []
+        self._ContingencyElement = RefList()
         self.ContingencyElement = [] if ContingencyElement is None else ContingencyElement
 
         super(Contingency, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class Contingency(IdentifiedObject):
 
     def setContingencyElement(self, value):
         for x in self._ContingencyElement:
-            x.Contingency = None
-        for y in value:
-            y._Contingency = self
-        self._ContingencyElement = value
+            x._Contingency = None
+        self._ContingencyElement = RefList()
+        self.addContingencyElement(value)
 
     ContingencyElement = property(getContingencyElement, setContingencyElement)
 
     def addContingencyElement(self, *ContingencyElement):
-        for obj in ContingencyElement:
-            obj.Contingency = self
+        collection = self._ContingencyElement
+        for obj in members(ContingencyElement):
+            old = obj._Contingency
+            if old is not None and old is not self:
+                old._ContingencyElement.discard(obj)
+            obj._Contingency = self
+            collection.append(obj)
 
     def removeContingencyElement(self, *ContingencyElement):
-        for obj in ContingencyElement:
-            obj.Contingency = None
+        collection = self._ContingencyElement
+        for obj in members(ContingencyElement):
+            if obj._Contingency is self:
+                obj._Contingency = None
+                collection.discard(obj)
+
+    def removeAllContingencyElement(self):
+        for obj in self._ContingencyElement:
+            obj._Contingency = None
+        self._ContingencyElement = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class ControlAreaGeneratingUnit(Element):
     """A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.
@@ -31,7 +32,7 @@ class ControlAreaGeneratingUnit(Element):
         @param GeneratingUnit: The generating unit specified for this control area.  Note that a control area should include a GeneratingUnit only once.
         @param ControlArea: The parent control area for the generating unit specifications.
         """
-        self._AltGeneratingUnitMeas = []
+        self._AltGeneratingUnitMeas = RefList()
         self.AltGeneratingUnitMeas = [] if AltGeneratingUnitMeas is None else AltGeneratingUnitMeas
 
         self._GeneratingUnit = None
@@ -56,20 +57,32 @@ class ControlAreaGeneratingUnit(Element):
 
     def setAltGeneratingUnitMeas(self, value):
         for x in self._AltGeneratingUnitMeas:
-            x.ControlAreaGeneratingUnit = None
-        for y in value:
-            y._ControlAreaGeneratingUnit = self
-        self._AltGeneratingUnitMeas = value
+            x._ControlAreaGeneratingUnit = None
+        self._AltGeneratingUnitMeas = RefList()
+        self.addAltGeneratingUnitMeas(value)
 
     AltGeneratingUnitMeas = property(getAltGeneratingUnitMeas, setAltGeneratingUnitMeas)
 
     def addAltGeneratingUnitMeas(self, *AltGeneratingUnitMeas):
-        for obj in AltGeneratingUnitMeas:
-            obj.ControlAreaGeneratingUnit = self
+        collection = self._AltGeneratingUnitMeas
+        for obj in members(AltGeneratingUnitMeas):
+            old = obj._ControlAreaGeneratingUnit
+            if old is not None and old is not self:
+                old._AltGeneratingUnitMeas.discard(obj)
+            obj._ControlAreaGeneratingUnit = self
+            collection.append(obj)
 
     def removeAltGeneratingUnitMeas(self, *AltGeneratingUnitMeas):
-        for obj in AltGeneratingUnitMeas:
-            obj.ControlAreaGeneratingUnit = None
+        collection = self._AltGeneratingUnitMeas
+        for obj in members(AltGeneratingUnitMeas):
+            if obj._ControlAreaGeneratingUnit is self:
+                obj._ControlAreaGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllAltGeneratingUnitMeas(self):
+        for obj in self._AltGeneratingUnitMeas:
+            obj._ControlAreaGeneratingUnit = None
+        self._AltGeneratingUnitMeas = RefList()
 
     def getGeneratingUnit(self):
         """The generating unit specified for this control area.  Note that a control area should include a GeneratingUnit only once.
@@ -78,8 +91,7 @@ class ControlAreaGeneratingUnit(Element):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.ControlAreaGeneratingUnit if x != self]
-            self._GeneratingUnit._ControlAreaGeneratingUnit = filtered
+            self._GeneratingUnit._ControlAreaGeneratingUnit.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
@@ -95,8 +107,7 @@ class ControlAreaGeneratingUnit(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.ControlAreaGeneratingUnit if x != self]
-            self._ControlArea._ControlAreaGeneratingUnit = filtered
+            self._ControlArea._ControlAreaGeneratingUnit.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
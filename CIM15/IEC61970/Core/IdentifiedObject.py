@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributesThis is a root class to provide common identification for all classes needing identification and naming attributes
@@ -43,10 +44,10 @@ class IdentifiedObject(Element):
         #: The name is any free human readable and possibly non unique text naming the object.
         self.name = name
 
-        self._Names = []
+        self._Names = RefList()
         self.Names = [] if Names is None else Names
 
-        self._DiagramObjects = []
+        self._DiagramObjects = RefList()
         self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
 
         self._ModelingAuthoritySet = None
@@ -68,20 +69,32 @@ class IdentifiedObject(Element):
 
     def setNames(self, value):
         for x in self._Names:
-            x.IdentifiedObject = None
-        for y in value:
-            y._IdentifiedObject = self
-        self._Names = value
+            x._IdentifiedObject = None
+        self._Names = RefList()
+        self.addNames(value)
 
     Names = property(getNames, setNames)
 
     def addNames(self, *Names):
-        for obj in Names:
-            obj.IdentifiedObject = self
+        collection = self._Names
+        for obj in members(Names):
+            old = obj._IdentifiedObject
+            if old is not None and old is not self:
+                old._Names.discard(obj)
+            obj._IdentifiedObject = self
+            collection.append(obj)
 
     def removeNames(self, *Names):
-        for obj in Names:
-            obj.IdentifiedObject = None
+        collection = self._Names
+        for obj in members(Names):
+            if obj._IdentifiedObject is self:
+                obj._IdentifiedObject = None
+                collection.discard(obj)
+
+    def removeAllNames(self):
+        for obj in self._Names:
+            obj._IdentifiedObject = None
+        self._Names = RefList()
 
     def getDiagramObjects(self):
         """The diagram objects that are associated with the domain object
@@ -90,20 +103,32 @@ class IdentifiedObject(Element):
 
     def setDiagramObjects(self, value):
         for x in self._DiagramObjects:
-            x.IdentifiedObject = None
-        for y in value:
-            y._IdentifiedObject = self
-        self._DiagramObjects = value
+            x._IdentifiedObject = None
+        self._DiagramObjects = RefList()
+        self.addDiagramObjects(value)
 
     DiagramObjects = property(getDiagramObjects, setDiagramObjects)
 
     def addDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            obj.IdentifiedObject = self
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            old = obj._IdentifiedObject
+            if old is not None and old is not self:
+                old._DiagramObjects.discard(obj)
+            obj._IdentifiedObject = self
+            collection.append(obj)
 
     def removeDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            obj.IdentifiedObject = None
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            if obj._IdentifiedObject is self:
+                obj._IdentifiedObject = None
+                collection.discard(obj)
+
+    def removeAllDiagramObjects(self):
+        for obj in self._DiagramObjects:
+            obj._IdentifiedObject = None
+        self._DiagramObjects = RefList()
 
     def getModelingAuthoritySet(self):
         """An IdentifiedObject belongs to a Modeling Authority Set for purposes of defining a group of data maintained by the same Modeling Authority.
@@ -112,8 +137,7 @@ class IdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
@@ -56,8 +56,7 @@ class Name(Element):
 
     def setNameType(self, value):
         if self._NameType is not None:
-            filtered = [x for x in self.NameType.Names if x != self]
-            self._NameType._Names = filtered
+            self._NameType._Names.discard(self)
 
         self._NameType = value
         if self._NameType is not None:
@@ -73,8 +72,7 @@ class Name(Element):
 
     def setIdentifiedObject(self, value):
         if self._IdentifiedObject is not None:
-            filtered = [x for x in self.IdentifiedObject.Names if x != self]
-            self._IdentifiedObject._Names = filtered
+            self._IdentifiedObject._Names.discard(self)
 
         self._IdentifiedObject = value
         if self._IdentifiedObject is not None:
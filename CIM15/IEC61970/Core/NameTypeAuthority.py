@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class NameTypeAuthority(Element):
     """Authority responsible for creation and management of names of a given type; typically an organization or an enterprise system.Authority responsible for creation and management of names of a given type; typically an organization or an enterprise system.
@@ -37,7 +38,7 @@ class NameTypeAuthority(Element):
         #: Description of the name type authority.
         self.description = description
 
-        self._NameTypes = []
+        self._NameTypes = RefList()
         self.NameTypes = [] if NameTypes is None else NameTypes
 
         super(NameTypeAuthority, self).__init__(*args, **kw_args)
@@ -56,18 +57,30 @@ class NameTypeAuthority(Element):
 
     def setNameTypes(self, value):
         for x in self._NameTypes:
-            x.NameTypeAuthority = None
-        for y in value:
-            y._NameTypeAuthority = self
-        self._NameTypes = value
+            x._NameTypeAuthority = None
+        self._NameTypes = RefList()
+        self.addNameTypes(value)
 
     NameTypes = property(getNameTypes, setNameTypes)
 
     def addNameTypes(self, *NameTypes):
-        for obj in NameTypes:
-            obj.NameTypeAuthority = self
+        collection = self._NameTypes
+        for obj in members(NameTypes):
+            old = obj._NameTypeAuthority
+            if old is not None and old is not self:
+                old._NameTypes.discard(obj)
+            obj._NameTypeAuthority = self
+            collection.append(obj)
 
     def removeNameTypes(self, *NameTypes):
-        for obj in NameTypes:
-            obj.NameTypeAuthority = None
+        collection = self._NameTypes
+        for obj in members(NameTypes):
+            if obj._NameTypeAuthority is self:
+                obj._NameTypeAuthority = None
+                collection.discard(obj)
+
+    def removeAllNameTypes(self):
+        for obj in self._NameTypes:
+            obj._NameTypeAuthority = None
+        self._NameTypes = RefList()
 
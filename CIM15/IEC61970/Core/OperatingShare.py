@@ -56,8 +56,7 @@ class OperatingShare(Element):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.OperatingShare if x != self]
-            self._PowerSystemResource._OperatingShare = filtered
+            self._PowerSystemResource._OperatingShare.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -73,8 +72,7 @@ class OperatingShare(Element):
 
     def setOperatingParticipant(self, value):
         if self._OperatingParticipant is not None:
-            filtered = [x for x in self.OperatingParticipant.OperatingShare if x != self]
-            self._OperatingParticipant._OperatingShare = filtered
+            self._OperatingParticipant._OperatingShare.discard(self)
 
         self._OperatingParticipant = value
         if self._OperatingParticipant is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -43,46 +44,46 @@ class PowerSystemResource(IdentifiedObject):
         @param NetworkDataSets:
         @param OutageSchedule: A power system resource may have an outage schedule
         """
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._ScheduleSteps = []
+        self._ScheduleSteps = RefList()
         self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
 
-        self._SafetyDocuments = []
+        self._SafetyDocuments = RefList()
         self.SafetyDocuments = [] if SafetyDocuments is None else SafetyDocuments
 
-        self._OperatingShare = []
+        self._OperatingShare = RefList()
         self.OperatingShare = [] if OperatingShare is None else OperatingShare
 
-        self._DocumentRoles = []
+        self._DocumentRoles = RefList()
         self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
 
-        self._PsrLists = []
+        self._PsrLists = RefList()
         self.PsrLists = [] if PsrLists is None else PsrLists
 
-        self._Measurements = []
+        self._Measurements = RefList()
         self.Measurements = [] if Measurements is None else Measurements
 
-        self._ReportingGroup = []
+        self._ReportingGroup = RefList()
         self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
 
         self._PSRType = None
         self.PSRType = PSRType
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
-        self._ErpOrganisationRoles = []
+        self._ErpOrganisationRoles = RefList()
         self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
 
         self._Location = None
         self.Location = Location
 
-        self._PSREvent = []
+        self._PSREvent = RefList()
         self.PSREvent = [] if PSREvent is None else PSREvent
 
-        self._NetworkDataSets = []
+        self._NetworkDataSets = RefList()
         self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
 
         self._OutageSchedule = None
@@ -103,20 +104,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._ChangeItems = value
+            x._PowerSystemResource = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.PowerSystemResource = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.PowerSystemResource = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._PowerSystemResource = None
+        self._ChangeItems = RefList()
 
     def getScheduleSteps(self):
         
@@ -124,26 +137,28 @@ class PowerSystemResource(IdentifiedObject):
 
     def setScheduleSteps(self, value):
         for p in self._ScheduleSteps:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._ScheduleSteps._PowerSystemResources = filtered
-        for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._ScheduleSteps = value
+            p._PowerSystemResources.discard(self)
+        self._ScheduleSteps = RefList()
+        self.addScheduleSteps(value)
 
     ScheduleSteps = property(getScheduleSteps, setScheduleSteps)
 
     def addScheduleSteps(self, *ScheduleSteps):
-        for obj in ScheduleSteps:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._ScheduleSteps.append(obj)
+        collection = self._ScheduleSteps
+        for obj in members(ScheduleSteps):
+            obj._PowerSystemResources.append(self)
+            collection.append(obj)
 
     def removeScheduleSteps(self, *ScheduleSteps):
-        for obj in ScheduleSteps:
-            if self in obj._PowerSystemResources:
-                obj._PowerSystemResources.remove(self)
-            self._ScheduleSteps.remove(obj)
+        collection = self._ScheduleSteps
+        for obj in members(ScheduleSteps):
+            obj._PowerSystemResources.discard(self)
+            collection.discard(obj)
+
+    def removeAllScheduleSteps(self):
+        for obj in self._ScheduleSteps:
+            obj._PowerSystemResources.discard(self)
+        self._ScheduleSteps = RefList()
 
     def getSafetyDocuments(self):
         
@@ -151,20 +166,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setSafetyDocuments(self, value):
         for x in self._SafetyDocuments:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._SafetyDocuments = value
+            x._PowerSystemResource = None
+        self._SafetyDocuments = RefList()
+        self.addSafetyDocuments(value)
 
     SafetyDocuments = property(getSafetyDocuments, setSafetyDocuments)
 
     def addSafetyDocuments(self, *SafetyDocuments):
-        for obj in SafetyDocuments:
-            obj.PowerSystemResource = self
+        collection = self._SafetyDocuments
+        for obj in members(SafetyDocuments):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._SafetyDocuments.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeSafetyDocuments(self, *SafetyDocuments):
-        for obj in SafetyDocuments:
-            obj.PowerSystemResource = None
+        collection = self._SafetyDocuments
+        for obj in members(SafetyDocuments):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllSafetyDocuments(self):
+        for obj in self._SafetyDocuments:
+            obj._PowerSystemResource = None
+        self._SafetyDocuments = RefList()
 
     def getOperatingShare(self):
         """The linkage to any number of operating share objects.
@@ -173,20 +200,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setOperatingShare(self, value):
         for x in self._OperatingShare:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._OperatingShare = value
+            x._PowerSystemResource = None
+        self._OperatingShare = RefList()
+        self.addOperatingShare(value)
 
     OperatingShare = property(getOperatingShare, setOperatingShare)
 
     def addOperatingShare(self, *OperatingShare):
-        for obj in OperatingShare:
-            obj.PowerSystemResource = self
+        collection = self._OperatingShare
+        for obj in members(OperatingShare):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._OperatingShare.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeOperatingShare(self, *OperatingShare):
-        for obj in OperatingShare:
-            obj.PowerSystemResource = None
+        collection = self._OperatingShare
+        for obj in members(OperatingShare):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllOperatingShare(self):
+        for obj in self._OperatingShare:
+            obj._PowerSystemResource = None
+        self._OperatingShare = RefList()
 
     def getDocumentRoles(self):
         
@@ -194,20 +233,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setDocumentRoles(self, value):
         for x in self._DocumentRoles:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._DocumentRoles = value
+            x._PowerSystemResource = None
+        self._DocumentRoles = RefList()
+        self.addDocumentRoles(value)
 
     DocumentRoles = property(getDocumentRoles, setDocumentRoles)
 
     def addDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.PowerSystemResource = self
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._DocumentRoles.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.PowerSystemResource = None
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllDocumentRoles(self):
+        for obj in self._DocumentRoles:
+            obj._PowerSystemResource = None
+        self._DocumentRoles = RefList()
 
     def getPsrLists(self):
         
@@ -215,26 +266,28 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPsrLists(self, value):
         for p in self._PsrLists:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._PsrLists._PowerSystemResources = filtered
-        for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._PsrLists = value
+            p._PowerSystemResources.discard(self)
+        self._PsrLists = RefList()
+        self.addPsrLists(value)
 
     PsrLists = property(getPsrLists, setPsrLists)
 
     def addPsrLists(self, *PsrLists):
-        for obj in PsrLists:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._PsrLists.append(obj)
+        collection = self._PsrLists
+        for obj in members(PsrLists):
+            obj._PowerSystemResources.append(self)
+            collection.append(obj)
 
     def removePsrLists(self, *PsrLists):
-        for obj in PsrLists:
-            if self in obj._PowerSystemResources:
-                obj._PowerSystemResources.remove(self)
-            self._PsrLists.remove(obj)
+        collection = self._PsrLists
+        for obj in members(PsrLists):
+            obj._PowerSystemResources.discard(self)
+            collection.discard(obj)
+
+    def removeAllPsrLists(self):
+        for obj in self._PsrLists:
+            obj._PowerSystemResources.discard(self)
+        self._PsrLists = RefList()
 
     def getMeasurements(self):
         """The Measurements that are included in the naming hierarchy where the PSR is the containing object
@@ -243,20 +296,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setMeasurements(self, value):
         for x in self._Measurements:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._Measurements = value
+            x._PowerSystemResource = None
+        self._Measurements = RefList()
+        self.addMeasurements(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.PowerSystemResource = self
+        collection = self._Measurements
+        for obj in members(Measurements):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._Measurements.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeMeasurements(self, *Measurements):
-        for obj in Measurements:
-            obj.PowerSystemResource = None
+        collection = self._Measurements
+        for obj in members(Measurements):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllMeasurements(self):
+        for obj in self._Measurements:
+            obj._PowerSystemResource = None
+        self._Measurements = RefList()
 
     def getReportingGroup(self):
         """Reporting groups to which this PSR belongs.
@@ -265,26 +330,28 @@ class PowerSystemResource(IdentifiedObject):
 
     def setReportingGroup(self, value):
         for p in self._ReportingGroup:
-            filtered = [q for q in p.PowerSystemResource if q != self]
-            self._ReportingGroup._PowerSystemResource = filtered
-        for r in value:
-            if self not in r._PowerSystemResource:
-                r._PowerSystemResource.append(self)
-        self._ReportingGroup = value
+            p._PowerSystemResource.discard(self)
+        self._ReportingGroup = RefList()
+        self.addReportingGroup(value)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
-        for obj in ReportingGroup:
-            if self not in obj._PowerSystemResource:
-                obj._PowerSystemResource.append(self)
-            self._ReportingGroup.append(obj)
+        collection = self._ReportingGroup
+        for obj in members(ReportingGroup):
+            obj._PowerSystemResource.append(self)
+            collection.append(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
-        for obj in ReportingGroup:
-            if self in obj._PowerSystemResource:
-                obj._PowerSystemResource.remove(self)
-            self._ReportingGroup.remove(obj)
+        collection = self._ReportingGroup
+        for obj in members(ReportingGroup):
+            obj._PowerSystemResource.discard(self)
+            collection.discard(obj)
+
+    def removeAllReportingGroup(self):
+        for obj in self._ReportingGroup:
+            obj._PowerSystemResource.discard(self)
+        self._ReportingGroup = RefList()
 
     def getPSRType(self):
         """PSRType (custom classification) for this PowerSystemResource.
@@ -293,8 +360,7 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
@@ -310,26 +376,28 @@ class PowerSystemResource(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._Assets._PowerSystemResources = filtered
-        for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._Assets = value
+            p._PowerSystemResources.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._PowerSystemResources.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._PowerSystemResources:
-                obj._PowerSystemResources.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._PowerSystemResources.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._PowerSystemResources.discard(self)
+        self._Assets = RefList()
 
     def getErpOrganisationRoles(self):
         
@@ -337,20 +405,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setErpOrganisationRoles(self, value):
         for x in self._ErpOrganisationRoles:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._ErpOrganisationRoles = value
+            x._PowerSystemResource = None
+        self._ErpOrganisationRoles = RefList()
+        self.addErpOrganisationRoles(value)
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.PowerSystemResource = self
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._ErpOrganisationRoles.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.PowerSystemResource = None
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllErpOrganisationRoles(self):
+        for obj in self._ErpOrganisationRoles:
+            obj._PowerSystemResource = None
+        self._ErpOrganisationRoles = RefList()
 
     def getLocation(self):
         """Location of this power system resource.
@@ -359,8 +439,7 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -376,20 +455,32 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSREvent(self, value):
         for x in self._PSREvent:
-            x.PowerSystemResource = None
-        for y in value:
-            y._PowerSystemResource = self
-        self._PSREvent = value
+            x._PowerSystemResource = None
+        self._PSREvent = RefList()
+        self.addPSREvent(value)
 
     PSREvent = property(getPSREvent, setPSREvent)
 
     def addPSREvent(self, *PSREvent):
-        for obj in PSREvent:
-            obj.PowerSystemResource = self
+        collection = self._PSREvent
+        for obj in members(PSREvent):
+            old = obj._PowerSystemResource
+            if old is not None and old is not self:
+                old._PSREvent.discard(obj)
+            obj._PowerSystemResource = self
+            collection.append(obj)
 
     def removePSREvent(self, *PSREvent):
-        for obj in PSREvent:
-            obj.PowerSystemResource = None
+        collection = self._PSREvent
+        for obj in members(PSREvent):
+            if obj._PowerSystemResource is self:
+                obj._PowerSystemResource = None
+                collection.discard(obj)
+
+    def removeAllPSREvent(self):
+        for obj in self._PSREvent:
+            obj._PowerSystemResource = None
+        self._PSREvent = RefList()
 
     def getNetworkDataSets(self):
         
@@ -397,26 +488,28 @@ class PowerSystemResource(IdentifiedObject):
 
     def setNetworkDataSets(self, value):
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._NetworkDataSets._PowerSystemResources = filtered
-        for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._NetworkDataSets = value
+            p._PowerSystemResources.discard(self)
+        self._NetworkDataSets = RefList()
+        self.addNetworkDataSets(value)
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
-        for obj in NetworkDataSets:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._NetworkDataSets.append(obj)
+        collection = self._NetworkDataSets
+        for obj in members(NetworkDataSets):
+            obj._PowerSystemResources.append(self)
+            collection.append(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
-        for obj in NetworkDataSets:
-            if self in obj._PowerSystemResources:
-                obj._PowerSystemResources.remove(self)
-            self._NetworkDataSets.remove(obj)
+        collection = self._NetworkDataSets
+        for obj in members(NetworkDataSets):
+            obj._PowerSystemResources.discard(self)
+            collection.discard(obj)
+
+    def removeAllNetworkDataSets(self):
+        for obj in self._NetworkDataSets:
+            obj._PowerSystemResources.discard(self)
+        self._NetworkDataSets = RefList()
 
     def getOutageSchedule(self):
         """A power system resource may have an outage schedule
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.BasicIntervalSchedule import BasicIntervalSchedule
+from PyCIM.RefList import RefList, members
 
 class RegularIntervalSchedule(BasicIntervalSchedule):
     """The schedule has TimePoints where the time between them is constant.The schedule has TimePoints where the time between them is constant.
@@ -37,7 +38,7 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
         #: The time between each pair of subsequent RegularTimePoints.
         self.timeStep = timeStep
 
-        self._TimePoints = []
+        self._TimePoints = RefList()
         self.TimePoints = [] if TimePoints is None else TimePoints
 
         super(RegularIntervalSchedule, self).__init__(*args, **kw_args)
@@ -56,18 +57,30 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
 
     def setTimePoints(self, value):
         for x in self._TimePoints:
-            x.IntervalSchedule = None
-        for y in value:
-            y._IntervalSchedule = self
-        self._TimePoints = value
+            x._IntervalSchedule = None
+        self._TimePoints = RefList()
+        self.addTimePoints(value)
 
     TimePoints = property(getTimePoints, setTimePoints)
 
     def addTimePoints(self, *TimePoints):
-        for obj in TimePoints:
-            obj.IntervalSchedule = self
+        collection = self._TimePoints
+        for obj in members(TimePoints):
+            old = obj._IntervalSchedule
+            if old is not None and old is not self:
+                old._TimePoints.discard(obj)
+            obj._IntervalSchedule = self
+            collection.append(obj)
 
     def removeTimePoints(self, *TimePoints):
-        for obj in TimePoints:
-            obj.IntervalSchedule = None
+        collection = self._TimePoints
+        for obj in members(TimePoints):
+            if obj._IntervalSchedule is self:
+                obj._IntervalSchedule = None
+                collection.discard(obj)
+
+    def removeAllTimePoints(self):
+        for obj in self._TimePoints:
+            obj._IntervalSchedule = None
+        self._TimePoints = RefList()
 
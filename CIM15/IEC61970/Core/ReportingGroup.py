@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ReportingGroup(IdentifiedObject):
     """A reporting group is used for various ad-hoc groupings used for reporting.A reporting group is used for various ad-hoc groupings used for reporting.
@@ -32,16 +33,16 @@ class ReportingGroup(IdentifiedObject):
         @param TopologicalNode: The topological nodes that belong to the reporting group.
         @param PowerSystemResource: PSR's which belong to this reporting group.
         """
-        self._BusNameMarker = []
+        self._BusNameMarker = RefList()
         self.BusNameMarker = [] if BusNameMarker is None else BusNameMarker
 
         self._ReportingSuperGroup = None
         self.ReportingSuperGroup = ReportingSuperGroup
 
-        self._TopologicalNode = []
+        self._TopologicalNode = RefList()
         self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
 
-        self._PowerSystemResource = []
+        self._PowerSystemResource = RefList()
         self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
 
         super(ReportingGroup, self).__init__(*args, **kw_args)
@@ -60,20 +61,32 @@ class ReportingGroup(IdentifiedObject):
 
     def setBusNameMarker(self, value):
         for x in self._BusNameMarker:
-            x.ReportingGroup = None
-        for y in value:
-            y._ReportingGroup = self
-        self._BusNameMarker = value
+            x._ReportingGroup = None
+        self._BusNameMarker = RefList()
+        self.addBusNameMarker(value)
 
     BusNameMarker = property(getBusNameMarker, setBusNameMarker)
 
     def addBusNameMarker(self, *BusNameMarker):
-        for obj in BusNameMarker:
-            obj.ReportingGroup = self
+        collection = self._BusNameMarker
+        for obj in members(BusNameMarker):
+            old = obj._ReportingGroup
+            if old is not None and old is not self:
+                old._BusNameMarker.discard(obj)
+            obj._ReportingGroup = self
+            collection.append(obj)
 
     def removeBusNameMarker(self, *BusNameMarker):
-        for obj in BusNameMarker:
-            obj.ReportingGroup = None
+        collection = self._BusNameMarker
+        for obj in members(BusNameMarker):
+            if obj._ReportingGroup is self:
+                obj._ReportingGroup = None
+                collection.discard(obj)
+
+    def removeAllBusNameMarker(self):
+        for obj in self._BusNameMarker:
+            obj._ReportingGroup = None
+        self._BusNameMarker = RefList()
 
     def getReportingSuperGroup(self):
         """Reporting super group to which this reporting group belongs.
@@ -82,8 +95,7 @@ class ReportingGroup(IdentifiedObject):
 
     def setReportingSuperGroup(self, value):
         if self._ReportingSuperGroup is not None:
-            filtered = [x for x in self.ReportingSuperGroup.ReportingGroup if x != self]
-            self._ReportingSuperGroup._ReportingGroup = filtered
+            self._ReportingSuperGroup._ReportingGroup.discard(self)
 
         self._ReportingSuperGroup = value
         if self._ReportingSuperGroup is not None:
@@ -99,20 +111,32 @@ class ReportingGroup(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         for x in self._TopologicalNode:
-            x.ReportingGroup = None
-        for y in value:
-            y._ReportingGroup = self
-        self._TopologicalNode = value
+            x._ReportingGroup = None
+        self._TopologicalNode = RefList()
+        self.addTopologicalNode(value)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
     def addTopologicalNode(self, *TopologicalNode):
-        for obj in TopologicalNode:
-            obj.ReportingGroup = self
+        collection = self._TopologicalNode
+        for obj in members(TopologicalNode):
+            old = obj._ReportingGroup
+            if old is not None and old is not self:
+                old._TopologicalNode.discard(obj)
+            obj._ReportingGroup = self
+            collection.append(obj)
 
     def removeTopologicalNode(self, *TopologicalNode):
-        for obj in TopologicalNode:
-            obj.ReportingGroup = None
+        collection = self._TopologicalNode
+        for obj in members(TopologicalNode):
+            if obj._ReportingGroup is self:
+                obj._ReportingGroup = None
+                collection.discard(obj)
+
+    def removeAllTopologicalNode(self):
+        for obj in self._TopologicalNode:
+            obj._ReportingGroup = None
+        self._TopologicalNode = RefList()
 
     def getPowerSystemResource(self):
         """PSR's which belong to this reporting group.
@@ -121,24 +145,26 @@ class ReportingGroup(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
-        for r in value:
-            if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
-        self._PowerSystemResource = value
+            p._ReportingGroup.discard(self)
+        self._PowerSystemResource = RefList()
+        self.addPowerSystemResource(value)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
-        for obj in PowerSystemResource:
-            if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+        collection = self._PowerSystemResource
+        for obj in members(PowerSystemResource):
+            obj._ReportingGroup.append(self)
+            collection.append(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
-        for obj in PowerSystemResource:
-            if self in obj._ReportingGroup:
-                obj._ReportingGroup.remove(self)
-            self._PowerSystemResource.remove(obj)
+        collection = self._PowerSystemResource
+        for obj in members(PowerSystemResource):
+            obj._ReportingGroup.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResource(self):
+        for obj in self._PowerSystemResource:
+            obj._ReportingGroup.discard(self)
+        self._PowerSystemResource = RefList()
 
@@ -51,8 +51,7 @@ class Clamp(ConductingEquipment):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.Clamp if x != self]
-            self._ACLineSegment._Clamp = filtered
+            self._ACLineSegment._Clamp.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
@@ -51,8 +51,7 @@ class Cut(Switch):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.Cut if x != self]
-            self._ACLineSegment._Cut = filtered
+            self._ACLineSegment._Cut.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
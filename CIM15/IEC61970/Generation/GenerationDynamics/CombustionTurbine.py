@@ -88,8 +88,7 @@ class CombustionTurbine(PrimeMover):
 
     def setHeatRecoveryBoiler(self, value):
         if self._HeatRecoveryBoiler is not None:
-            filtered = [x for x in self.HeatRecoveryBoiler.CombustionTurbines if x != self]
-            self._HeatRecoveryBoiler._CombustionTurbines = filtered
+            self._HeatRecoveryBoiler._CombustionTurbines.discard(self)
 
         self._HeatRecoveryBoiler = value
         if self._HeatRecoveryBoiler is not None:
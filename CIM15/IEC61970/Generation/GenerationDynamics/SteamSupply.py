@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class SteamSupply(PowerSystemResource):
     """Steam supply for steam turbineSteam supply for steam turbine
@@ -33,7 +34,7 @@ class SteamSupply(PowerSystemResource):
         #: Rating of steam supply
         self.steamSupplyRating = steamSupplyRating
 
-        self._SteamTurbines = []
+        self._SteamTurbines = RefList()
         self.SteamTurbines = [] if SteamTurbines is None else SteamTurbines
 
         super(SteamSupply, self).__init__(*args, **kw_args)
@@ -52,24 +53,26 @@ class SteamSupply(PowerSystemResource):
 
     def setSteamTurbines(self, value):
         for p in self._SteamTurbines:
-            filtered = [q for q in p.SteamSupplys if q != self]
-            self._SteamTurbines._SteamSupplys = filtered
-        for r in value:
-            if self not in r._SteamSupplys:
-                r._SteamSupplys.append(self)
-        self._SteamTurbines = value
+            p._SteamSupplys.discard(self)
+        self._SteamTurbines = RefList()
+        self.addSteamTurbines(value)
 
     SteamTurbines = property(getSteamTurbines, setSteamTurbines)
 
     def addSteamTurbines(self, *SteamTurbines):
-        for obj in SteamTurbines:
-            if self not in obj._SteamSupplys:
-                obj._SteamSupplys.append(self)
-            self._SteamTurbines.append(obj)
+        collection = self._SteamTurbines
+        for obj in members(SteamTurbines):
+            obj._SteamSupplys.append(self)
+            collection.append(obj)
 
     def removeSteamTurbines(self, *SteamTurbines):
-        for obj in SteamTurbines:
-            if self in obj._SteamSupplys:
-                obj._SteamSupplys.remove(self)
-            self._SteamTurbines.remove(obj)
+        collection = self._SteamTurbines
+        for obj in members(SteamTurbines):
+            obj._SteamSupplys.discard(self)
+            collection.discard(obj)
+
+    def removeAllSteamTurbines(self):
+        for obj in self._SteamTurbines:
+            obj._SteamSupplys.discard(self)
+        self._SteamTurbines = RefList()
 
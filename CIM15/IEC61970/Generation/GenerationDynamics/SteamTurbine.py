@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.GenerationDynamics.PrimeMover import PrimeMover
+from PyCIM.RefList import RefList, members
 
 class SteamTurbine(PrimeMover):
     """Steam turbineSteam turbine
@@ -77,7 +78,7 @@ class SteamTurbine(PrimeMover):
         #: Fraction Of Power From Shaft 2 High Pressure Turbine output
         self.shaft2PowerHP = shaft2PowerHP
 
-        self._SteamSupplys = []
+        self._SteamSupplys = RefList()
         self.SteamSupplys = [] if SteamSupplys is None else SteamSupplys
 
         super(SteamTurbine, self).__init__(*args, **kw_args)
@@ -96,24 +97,26 @@ class SteamTurbine(PrimeMover):
 
     def setSteamSupplys(self, value):
         for p in self._SteamSupplys:
-            filtered = [q for q in p.SteamTurbines if q != self]
-            self._SteamSupplys._SteamTurbines = filtered
-        for r in value:
-            if self not in r._SteamTurbines:
-                r._SteamTurbines.append(self)
-        self._SteamSupplys = value
+            p._SteamTurbines.discard(self)
+        self._SteamSupplys = RefList()
+        self.addSteamSupplys(value)
 
     SteamSupplys = property(getSteamSupplys, setSteamSupplys)
 
     def addSteamSupplys(self, *SteamSupplys):
-        for obj in SteamSupplys:
-            if self not in obj._SteamTurbines:
-                obj._SteamTurbines.append(self)
-            self._SteamSupplys.append(obj)
+        collection = self._SteamSupplys
+        for obj in members(SteamSupplys):
+            obj._SteamTurbines.append(self)
+            collection.append(obj)
 
     def removeSteamSupplys(self, *SteamSupplys):
-        for obj in SteamSupplys:
-            if self in obj._SteamTurbines:
-                obj._SteamTurbines.remove(self)
-            self._SteamSupplys.remove(obj)
+        collection = self._SteamSupplys
+        for obj in members(SteamSupplys):
+            obj._SteamTurbines.discard(self)
+            collection.discard(obj)
+
+    def removeAllSteamSupplys(self):
+        for obj in self._SteamSupplys:
+            obj._SteamTurbines.discard(self)
+        self._SteamSupplys = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class CogenerationPlant(PowerSystemResource):
     """A set of thermal generating units for the production of electrical energy and process steam (usually from the output of the steam turbines). The steam sendout is typically used for industrial purposes or for municipal heating and cooling.A set of thermal generating units for the production of electrical energy and process steam (usually from the output of the steam turbines). The steam sendout is typically used for industrial purposes or for municipal heating and cooling.
@@ -53,7 +54,7 @@ class CogenerationPlant(PowerSystemResource):
         self._SteamSendoutSchedule = None
         self.SteamSendoutSchedule = SteamSendoutSchedule
 
-        self._ThermalGeneratingUnits = []
+        self._ThermalGeneratingUnits = RefList()
         self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
 
         super(CogenerationPlant, self).__init__(*args, **kw_args)
@@ -88,18 +89,30 @@ class CogenerationPlant(PowerSystemResource):
 
     def setThermalGeneratingUnits(self, value):
         for x in self._ThermalGeneratingUnits:
-            x.CogenerationPlant = None
-        for y in value:
-            y._CogenerationPlant = self
-        self._ThermalGeneratingUnits = value
+            x._CogenerationPlant = None
+        self._ThermalGeneratingUnits = RefList()
+        self.addThermalGeneratingUnits(value)
 
     ThermalGeneratingUnits = property(getThermalGeneratingUnits, setThermalGeneratingUnits)
 
     def addThermalGeneratingUnits(self, *ThermalGeneratingUnits):
-        for obj in ThermalGeneratingUnits:
-            obj.CogenerationPlant = self
+        collection = self._ThermalGeneratingUnits
+        for obj in members(ThermalGeneratingUnits):
+            old = obj._CogenerationPlant
+            if old is not None and old is not self:
+                old._ThermalGeneratingUnits.discard(obj)
+            obj._CogenerationPlant = self
+            collection.append(obj)
 
     def removeThermalGeneratingUnits(self, *ThermalGeneratingUnits):
-        for obj in ThermalGeneratingUnits:
-            obj.CogenerationPlant = None
+        collection = self._ThermalGeneratingUnits
+        for obj in members(ThermalGeneratingUnits):
+            if obj._CogenerationPlant is self:
+                obj._CogenerationPlant = None
+                collection.discard(obj)
+
+    def removeAllThermalGeneratingUnits(self):
+        for obj in self._ThermalGeneratingUnits:
+            obj._CogenerationPlant = None
+        self._ThermalGeneratingUnits = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class CombinedCyclePlant(PowerSystemResource):
     """A set of combustion turbines and steam turbines where the exhaust heat from the combustion turbines is recovered to make steam for the steam turbines, resulting in greater overall plant efficiencyA set of combustion turbines and steam turbines where the exhaust heat from the combustion turbines is recovered to make steam for the steam turbines, resulting in greater overall plant efficiency
@@ -33,7 +34,7 @@ class CombinedCyclePlant(PowerSystemResource):
         #: The combined cycle plant's active power output rating
         self.combCyclePlantRating = combCyclePlantRating
 
-        self._ThermalGeneratingUnits = []
+        self._ThermalGeneratingUnits = RefList()
         self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
 
         super(CombinedCyclePlant, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class CombinedCyclePlant(PowerSystemResource):
 
     def setThermalGeneratingUnits(self, value):
         for x in self._ThermalGeneratingUnits:
-            x.CombinedCyclePlant = None
-        for y in value:
-            y._CombinedCyclePlant = self
-        self._ThermalGeneratingUnits = value
+            x._CombinedCyclePlant = None
+        self._ThermalGeneratingUnits = RefList()
+        self.addThermalGeneratingUnits(value)
 
     ThermalGeneratingUnits = property(getThermalGeneratingUnits, setThermalGeneratingUnits)
 
     def addThermalGeneratingUnits(self, *ThermalGeneratingUnits):
-        for obj in ThermalGeneratingUnits:
-            obj.CombinedCyclePlant = self
+        collection = self._ThermalGeneratingUnits
+        for obj in members(ThermalGeneratingUnits):
+            old = obj._CombinedCyclePlant
+            if old is not None and old is not self:
+                old._ThermalGeneratingUnits.discard(obj)
+            obj._CombinedCyclePlant = self
+            collection.append(obj)
 
     def removeThermalGeneratingUnits(self, *ThermalGeneratingUnits):
-        for obj in ThermalGeneratingUnits:
-            obj.CombinedCyclePlant = None
+        collection = self._ThermalGeneratingUnits
+        for obj in members(ThermalGeneratingUnits):
+            if obj._CombinedCyclePlant is self:
+                obj._CombinedCyclePlant = None
+                collection.discard(obj)
+
+    def removeAllThermalGeneratingUnits(self):
+        for obj in self._ThermalGeneratingUnits:
+            obj._CombinedCyclePlant = None
+        self._ThermalGeneratingUnits = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class FossilFuel(IdentifiedObject):
     """The fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gasThe fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gas
@@ -73,7 +74,7 @@ class FossilFuel(IdentifiedObject):
         self._ThermalGeneratingUnit = None
         self.ThermalGeneratingUnit = ThermalGeneratingUnit
 
-        self._FuelAllocationSchedules = []
+        self._FuelAllocationSchedules = RefList()
         self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
 
         super(FossilFuel, self).__init__(*args, **kw_args)
@@ -92,8 +93,7 @@ class FossilFuel(IdentifiedObject):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FossilFuels if x != self]
-            self._ThermalGeneratingUnit._FossilFuels = filtered
+            self._ThermalGeneratingUnit._FossilFuels.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
@@ -109,18 +109,30 @@ class FossilFuel(IdentifiedObject):
 
     def setFuelAllocationSchedules(self, value):
         for x in self._FuelAllocationSchedules:
-            x.FossilFuel = None
-        for y in value:
-            y._FossilFuel = self
-        self._FuelAllocationSchedules = value
+            x._FossilFuel = None
+        self._FuelAllocationSchedules = RefList()
+        self.addFuelAllocationSchedules(value)
 
     FuelAllocationSchedules = property(getFuelAllocationSchedules, setFuelAllocationSchedules)
 
     def addFuelAllocationSchedules(self, *FuelAllocationSchedules):
-        for obj in FuelAllocationSchedules:
-            obj.FossilFuel = self
+        collection = self._FuelAllocationSchedules
+        for obj in members(FuelAllocationSchedules):
+            old = obj._FossilFuel
+            if old is not None and old is not self:
+                old._FuelAllocationSchedules.discard(obj)
+            obj._FossilFuel = self
+            collection.append(obj)
 
     def removeFuelAllocationSchedules(self, *FuelAllocationSchedules):
-        for obj in FuelAllocationSchedules:
-            obj.FossilFuel = None
+        collection = self._FuelAllocationSchedules
+        for obj in members(FuelAllocationSchedules):
+            if obj._FossilFuel is self:
+                obj._FossilFuel = None
+                collection.discard(obj)
+
+    def removeAllFuelAllocationSchedules(self):
+        for obj in self._FuelAllocationSchedules:
+            obj._FossilFuel = None
+        self._FuelAllocationSchedules = RefList()
 
@@ -52,8 +52,7 @@ class GenUnitOpCostCurve(Curve):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.GenUnitOpCostCurves if x != self]
-            self._GeneratingUnit._GenUnitOpCostCurves = filtered
+            self._GeneratingUnit._GenUnitOpCostCurves.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.
@@ -205,19 +206,19 @@ class GeneratingUnit(Equipment):
         #: Governor Speed Changer Droop.   This is the change in generator power output divided by the change in frequency normalized by the nominal power of the generator and the nominal frequency and expressed in percent and negated. A positive value of speed change droop provides additional generator output upon a drop in frequency.
         self.governorSCD = governorSCD
 
-        self._ControlAreaGeneratingUnit = []
+        self._ControlAreaGeneratingUnit = RefList()
         self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
 
-        self._SynchronousMachines = []
+        self._SynchronousMachines = RefList()
         self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
 
         self._GenUnitOpSchedule = None
         self.GenUnitOpSchedule = GenUnitOpSchedule
 
-        self._GrossToNetActivePowerCurves = []
+        self._GrossToNetActivePowerCurves = RefList()
         self.GrossToNetActivePowerCurves = [] if GrossToNetActivePowerCurves is None else GrossToNetActivePowerCurves
 
-        self._GenUnitOpCostCurves = []
+        self._GenUnitOpCostCurves = RefList()
         self.GenUnitOpCostCurves = [] if GenUnitOpCostCurves is None else GenUnitOpCostCurves
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
@@ -236,20 +237,32 @@ class GeneratingUnit(Equipment):
 
     def setControlAreaGeneratingUnit(self, value):
         for x in self._ControlAreaGeneratingUnit:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._ControlAreaGeneratingUnit = value
+            x._GeneratingUnit = None
+        self._ControlAreaGeneratingUnit = RefList()
+        self.addControlAreaGeneratingUnit(value)
 
     ControlAreaGeneratingUnit = property(getControlAreaGeneratingUnit, setControlAreaGeneratingUnit)
 
     def addControlAreaGeneratingUnit(self, *ControlAreaGeneratingUnit):
-        for obj in ControlAreaGeneratingUnit:
-            obj.GeneratingUnit = self
+        collection = self._ControlAreaGeneratingUnit
+        for obj in members(ControlAreaGeneratingUnit):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._ControlAreaGeneratingUnit.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeControlAreaGeneratingUnit(self, *ControlAreaGeneratingUnit):
-        for obj in ControlAreaGeneratingUnit:
-            obj.GeneratingUnit = None
+        collection = self._ControlAreaGeneratingUnit
+        for obj in members(ControlAreaGeneratingUnit):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllControlAreaGeneratingUnit(self):
+        for obj in self._ControlAreaGeneratingUnit:
+            obj._GeneratingUnit = None
+        self._ControlAreaGeneratingUnit = RefList()
 
     def getSynchronousMachines(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -258,20 +271,32 @@ class GeneratingUnit(Equipment):
 
     def setSynchronousMachines(self, value):
         for x in self._SynchronousMachines:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._SynchronousMachines = value
+            x._GeneratingUnit = None
+        self._SynchronousMachines = RefList()
+        self.addSynchronousMachines(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            obj.GeneratingUnit = self
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._SynchronousMachines.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
-        for obj in SynchronousMachines:
-            obj.GeneratingUnit = None
+        collection = self._SynchronousMachines
+        for obj in members(SynchronousMachines):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllSynchronousMachines(self):
+        for obj in self._SynchronousMachines:
+            obj._GeneratingUnit = None
+        self._SynchronousMachines = RefList()
 
     def getGenUnitOpSchedule(self):
         """A generating unit may have an operating schedule, indicating the planned operation of the unit
@@ -296,20 +321,32 @@ class GeneratingUnit(Equipment):
 
     def setGrossToNetActivePowerCurves(self, value):
         for x in self._GrossToNetActivePowerCurves:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._GrossToNetActivePowerCurves = value
+            x._GeneratingUnit = None
+        self._GrossToNetActivePowerCurves = RefList()
+        self.addGrossToNetActivePowerCurves(value)
 
     GrossToNetActivePowerCurves = property(getGrossToNetActivePowerCurves, setGrossToNetActivePowerCurves)
 
     def addGrossToNetActivePowerCurves(self, *GrossToNetActivePowerCurves):
-        for obj in GrossToNetActivePowerCurves:
-            obj.GeneratingUnit = self
+        collection = self._GrossToNetActivePowerCurves
+        for obj in members(GrossToNetActivePowerCurves):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._GrossToNetActivePowerCurves.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeGrossToNetActivePowerCurves(self, *GrossToNetActivePowerCurves):
-        for obj in GrossToNetActivePowerCurves:
-            obj.GeneratingUnit = None
+        collection = self._GrossToNetActivePowerCurves
+        for obj in members(GrossToNetActivePowerCurves):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllGrossToNetActivePowerCurves(self):
+        for obj in self._GrossToNetActivePowerCurves:
+            obj._GeneratingUnit = None
+        self._GrossToNetActivePowerCurves = RefList()
 
     def getGenUnitOpCostCurves(self):
         """A generating unit may have one or more cost curves, depending upon fuel mixture and fuel cost.
@@ -318,18 +355,30 @@ class GeneratingUnit(Equipment):
 
     def setGenUnitOpCostCurves(self, value):
         for x in self._GenUnitOpCostCurves:
-            x.GeneratingUnit = None
-        for y in value:
-            y._GeneratingUnit = self
-        self._GenUnitOpCostCurves = value
+            x._GeneratingUnit = None
+        self._GenUnitOpCostCurves = RefList()
+        self.addGenUnitOpCostCurves(value)
 
     GenUnitOpCostCurves = property(getGenUnitOpCostCurves, setGenUnitOpCostCurves)
 
     def addGenUnitOpCostCurves(self, *GenUnitOpCostCurves):
-        for obj in GenUnitOpCostCurves:
-            obj.GeneratingUnit = self
+        collection = self._GenUnitOpCostCurves
+        for obj in members(GenUnitOpCostCurves):
+            old = obj._GeneratingUnit
+            if old is not None and old is not self:
+                old._GenUnitOpCostCurves.discard(obj)
+            obj._GeneratingUnit = self
+            collection.append(obj)
 
     def removeGenUnitOpCostCurves(self, *GenUnitOpCostCurves):
-        for obj in GenUnitOpCostCurves:
-            obj.GeneratingUnit = None
+        collection = self._GenUnitOpCostCurves
+        for obj in members(GenUnitOpCostCurves):
+            if obj._GeneratingUnit is self:
+                obj._GeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllGenUnitOpCostCurves(self):
+        for obj in self._GenUnitOpCostCurves:
+            obj._GeneratingUnit = None
+        self._GenUnitOpCostCurves = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from PyCIM.RefList import RefList, members
 
 class HydroGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover is a hydraulic turbine (e.g., Francis, Pelton, Kaplan)A generating unit whose prime mover is a hydraulic turbine (e.g., Francis, Pelton, Kaplan)
@@ -46,10 +47,10 @@ class HydroGeneratingUnit(GeneratingUnit):
         self._HydroPowerPlant = None
         self.HydroPowerPlant = HydroPowerPlant
 
-        self._TailbayLossCurve = []
+        self._TailbayLossCurve = RefList()
         self.TailbayLossCurve = [] if TailbayLossCurve is None else TailbayLossCurve
 
-        self._HydroGeneratingEfficiencyCurves = []
+        self._HydroGeneratingEfficiencyCurves = RefList()
         self.HydroGeneratingEfficiencyCurves = [] if HydroGeneratingEfficiencyCurves is None else HydroGeneratingEfficiencyCurves
 
         super(HydroGeneratingUnit, self).__init__(*args, **kw_args)
@@ -84,8 +85,7 @@ class HydroGeneratingUnit(GeneratingUnit):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroGeneratingUnits if x != self]
-            self._HydroPowerPlant._HydroGeneratingUnits = filtered
+            self._HydroPowerPlant._HydroGeneratingUnits.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
@@ -101,20 +101,32 @@ class HydroGeneratingUnit(GeneratingUnit):
 
     def setTailbayLossCurve(self, value):
         for x in self._TailbayLossCurve:
-            x.HydroGeneratingUnit = None
-        for y in value:
-            y._HydroGeneratingUnit = self
-        self._TailbayLossCurve = value
+            x._HydroGeneratingUnit = None
+        self._TailbayLossCurve = RefList()
+        self.addTailbayLossCurve(value)
 
     TailbayLossCurve = property(getTailbayLossCurve, setTailbayLossCurve)
 
     def addTailbayLossCurve(self, *TailbayLossCurve):
-        for obj in TailbayLossCurve:
-            obj.HydroGeneratingUnit = self
+        collection = self._TailbayLossCurve
+        for obj in members(TailbayLossCurve):
+            old = obj._HydroGeneratingUnit
+            if old is not None and old is not self:
+                old._TailbayLossCurve.discard(obj)
+            obj._HydroGeneratingUnit = self
+            collection.append(obj)
 
     def removeTailbayLossCurve(self, *TailbayLossCurve):
-        for obj in TailbayLossCurve:
-            obj.HydroGeneratingUnit = None
+        collection = self._TailbayLossCurve
+        for obj in members(TailbayLossCurve):
+            if obj._HydroGeneratingUnit is self:
+                obj._HydroGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllTailbayLossCurve(self):
+        for obj in self._TailbayLossCurve:
+            obj._HydroGeneratingUnit = None
+        self._TailbayLossCurve = RefList()
 
     def getHydroGeneratingEfficiencyCurves(self):
         """A hydro generating unit has an efficiency curve
@@ -123,18 +135,30 @@ class HydroGeneratingUnit(GeneratingUnit):
 
     def setHydroGeneratingEfficiencyCurves(self, value):
         for x in self._HydroGeneratingEfficiencyCurves:
-            x.HydroGeneratingUnit = None
-        for y in value:
-            y._HydroGeneratingUnit = self
-        self._HydroGeneratingEfficiencyCurves = value
+            x._HydroGeneratingUnit = None
+        self._HydroGeneratingEfficiencyCurves = RefList()
+        self.addHydroGeneratingEfficiencyCurves(value)
 
     HydroGeneratingEfficiencyCurves = property(getHydroGeneratingEfficiencyCurves, setHydroGeneratingEfficiencyCurves)
 
     def addHydroGeneratingEfficiencyCurves(self, *HydroGeneratingEfficiencyCurves):
-        for obj in HydroGeneratingEfficiencyCurves:
-            obj.HydroGeneratingUnit = self
+        collection = self._HydroGeneratingEfficiencyCurves
+        for obj in members(HydroGeneratingEfficiencyCurves):
+            old = obj._HydroGeneratingUnit
+            if old is not None and old is not self:
+                old._HydroGeneratingEfficiencyCurves.discard(obj)
+            obj._HydroGeneratingUnit = self
+            collection.append(obj)
 
     def removeHydroGeneratingEfficiencyCurves(self, *HydroGeneratingEfficiencyCurves):
-        for obj in HydroGeneratingEfficiencyCurves:
-            obj.HydroGeneratingUnit = None
+        collection = self._HydroGeneratingEfficiencyCurves
+        for obj in members(HydroGeneratingEfficiencyCurves):
+            if obj._HydroGeneratingUnit is self:
+                obj._HydroGeneratingUnit = None
+                collection.discard(obj)
+
+    def removeAllHydroGeneratingEfficiencyCurves(self):
+        for obj in self._HydroGeneratingEfficiencyCurves:
+            obj._HydroGeneratingUnit = None
+        self._HydroGeneratingEfficiencyCurves = RefList()
 
@@ -72,8 +72,7 @@ class HydroPump(PowerSystemResource):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroPumps if x != self]
-            self._HydroPowerPlant._HydroPumps = filtered
+            self._HydroPowerPlant._HydroPumps.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
@@ -48,8 +48,7 @@ class InflowForecast(RegularIntervalSchedule):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.InflowForecasts if x != self]
-            self._Reservoir._InflowForecasts = filtered
+            self._Reservoir._InflowForecasts.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class Reservoir(PowerSystemResource):
     """A water storage facility within a hydro system, including: ponds, lakes, lagoons, and rivers. The storage is usually behind some type of dam.A water storage facility within a hydro system, including: ponds, lakes, lagoons, and rivers. The storage is usually behind some type of dam.
@@ -79,25 +80,25 @@ class Reservoir(PowerSystemResource):
         #: Full supply level, above which water will spill. This can be the spillway crest level or the top of closed gates.
         self.fullSupplyLevel = fullSupplyLevel
 
-        self._LevelVsVolumeCurves = []
+        self._LevelVsVolumeCurves = RefList()
         self.LevelVsVolumeCurves = [] if LevelVsVolumeCurves is None else LevelVsVolumeCurves
 
         self._TargetLevelSchedule = None
         self.TargetLevelSchedule = TargetLevelSchedule
 
-        self._HydroPowerPlants = []
+        self._HydroPowerPlants = RefList()
         self.HydroPowerPlants = [] if HydroPowerPlants is None else HydroPowerPlants
 
-        self._UpstreamFromHydroPowerPlants = []
+        self._UpstreamFromHydroPowerPlants = RefList()
         self.UpstreamFromHydroPowerPlants = [] if UpstreamFromHydroPowerPlants is None else UpstreamFromHydroPowerPlants
 
-        self._InflowForecasts = []
+        self._InflowForecasts = RefList()
         self.InflowForecasts = [] if InflowForecasts is None else InflowForecasts
 
         self._SpillsFromReservoir = None
         self.SpillsFromReservoir = SpillsFromReservoir
 
-        self._SpillsIntoReservoirs = []
+        self._SpillsIntoReservoirs = RefList()
         self.SpillsIntoReservoirs = [] if SpillsIntoReservoirs is None else SpillsIntoReservoirs
 
         super(Reservoir, self).__init__(*args, **kw_args)
@@ -116,20 +117,32 @@ class Reservoir(PowerSystemResource):
 
     def setLevelVsVolumeCurves(self, value):
         for x in self._LevelVsVolumeCurves:
-            x.Reservoir = None
-        for y in value:
-            y._Reservoir = self
-        self._LevelVsVolumeCurves = value
+            x._Reservoir = None
+        self._LevelVsVolumeCurves = RefList()
+        self.addLevelVsVolumeCurves(value)
 
     LevelVsVolumeCurves = property(getLevelVsVolumeCurves, setLevelVsVolumeCurves)
 
     def addLevelVsVolumeCurves(self, *LevelVsVolumeCurves):
-        for obj in LevelVsVolumeCurves:
-            obj.Reservoir = self
+        collection = self._LevelVsVolumeCurves
+        for obj in members(LevelVsVolumeCurves):
+            old = obj._Reservoir
+            if old is not None and old is not self:
+                old._LevelVsVolumeCurves.discard(obj)
+            obj._Reservoir = self
+            collection.append(obj)
 
     def removeLevelVsVolumeCurves(self, *LevelVsVolumeCurves):
-        for obj in LevelVsVolumeCurves:
-            obj.Reservoir = None
+        collection = self._LevelVsVolumeCurves
+        for obj in members(LevelVsVolumeCurves):
+            if obj._Reservoir is self:
+                obj._Reservoir = None
+                collection.discard(obj)
+
+    def removeAllLevelVsVolumeCurves(self):
+        for obj in self._LevelVsVolumeCurves:
+            obj._Reservoir = None
+        self._LevelVsVolumeCurves = RefList()
 
     def getTargetLevelSchedule(self):
         """A reservoir may have a water level target schedule.
@@ -154,20 +167,32 @@ class Reservoir(PowerSystemResource):
 
     def setHydroPowerPlants(self, value):
         for x in self._HydroPowerPlants:
-            x.Reservoir = None
-        for y in value:
-            y._Reservoir = self
-        self._HydroPowerPlants = value
+            x._Reservoir = None
+        self._HydroPowerPlants = RefList()
+        self.addHydroPowerPlants(value)
 
     HydroPowerPlants = property(getHydroPowerPlants, setHydroPowerPlants)
 
     def addHydroPowerPlants(self, *HydroPowerPlants):
-        for obj in HydroPowerPlants:
-            obj.Reservoir = self
+        collection = self._HydroPowerPlants
+        for obj in members(HydroPowerPlants):
+            old = obj._Reservoir
+            if old is not None and old is not self:
+                old._HydroPowerPlants.discard(obj)
+            obj._Reservoir = self
+            collection.append(obj)
 
     def removeHydroPowerPlants(self, *HydroPowerPlants):
-        for obj in HydroPowerPlants:
-            obj.Reservoir = None
+        collection = self._HydroPowerPlants
+        for obj in members(HydroPowerPlants):
+            if obj._Reservoir is self:
+                obj._Reservoir = None
+                collection.discard(obj)
+
+    def removeAllHydroPowerPlants(self):
+        for obj in self._HydroPowerPlants:
+            obj._Reservoir = None
+        self._HydroPowerPlants = RefList()
 
     def getUpstreamFromHydroPowerPlants(self):
         """Generators are supplied water from or pumps discharge water to an upstream reservoir
@@ -176,20 +201,32 @@ class Reservoir(PowerSystemResource):
 
     def setUpstreamFromHydroPowerPlants(self, value):
         for x in self._UpstreamFromHydroPowerPlants:
-            x.GenSourcePumpDischargeReservoir = None
-        for y in value:
-            y._GenSourcePumpDischargeReservoir = self
-        self._UpstreamFromHydroPowerPlants = value
+            x._GenSourcePumpDischargeReservoir = None
+        self._UpstreamFromHydroPowerPlants = RefList()
+        self.addUpstreamFromHydroPowerPlants(value)
 
     UpstreamFromHydroPowerPlants = property(getUpstreamFromHydroPowerPlants, setUpstreamFromHydroPowerPlants)
 
     def addUpstreamFromHydroPowerPlants(self, *UpstreamFromHydroPowerPlants):
-        for obj in UpstreamFromHydroPowerPlants:
-            obj.GenSourcePumpDischargeReservoir = self
+        collection = self._UpstreamFromHydroPowerPlants
+        for obj in members(UpstreamFromHydroPowerPlants):
+            old = obj._GenSourcePumpDischargeReservoir
+            if old is not None and old is not self:
+                old._UpstreamFromHydroPowerPlants.discard(obj)
+            obj._GenSourcePumpDischargeReservoir = self
+            collection.append(obj)
 
     def removeUpstreamFromHydroPowerPlants(self, *UpstreamFromHydroPowerPlants):
-        for obj in UpstreamFromHydroPowerPlants:
-            obj.GenSourcePumpDischargeReservoir = None
+        collection = self._UpstreamFromHydroPowerPlants
+        for obj in members(UpstreamFromHydroPowerPlants):
+            if obj._GenSourcePumpDischargeReservoir is self:
+                obj._GenSourcePumpDischargeReservoir = None
+                collection.discard(obj)
+
+    def removeAllUpstreamFromHydroPowerPlants(self):
+        for obj in self._UpstreamFromHydroPowerPlants:
+            obj._GenSourcePumpDischargeReservoir = None
+        self._UpstreamFromHydroPowerPlants = RefList()
 
     def getInflowForecasts(self):
         """A reservoir may have a 'natural' inflow forecast.
@@ -198,20 +235,32 @@ class Reservoir(PowerSystemResource):
 
     def setInflowForecasts(self, value):
         for x in self._InflowForecasts:
-            x.Reservoir = None
-        for y in value:
-            y._Reservoir = self
-        self._InflowForecasts = value
+            x._Reservoir = None
+        self._InflowForecasts = RefList()
+        self.addInflowForecasts(value)
 
     InflowForecasts = property(getInflowForecasts, setInflowForecasts)
 
     def addInflowForecasts(self, *InflowForecasts):
-        for obj in InflowForecasts:
-            obj.Reservoir = self
+        collection = self._InflowForecasts
+        for obj in members(InflowForecasts):
+            old = obj._Reservoir
+            if old is not None and old is not self:
+                old._InflowForecasts.discard(obj)
+            obj._Reservoir = self
+            collection.append(obj)
 
     def removeInflowForecasts(self, *InflowForecasts):
-        for obj in InflowForecasts:
-            obj.Reservoir = None
+        collection = self._InflowForecasts
+        for obj in members(InflowForecasts):
+            if obj._Reservoir is self:
+                obj._Reservoir = None
+                collection.discard(obj)
+
+    def removeAllInflowForecasts(self):
+        for obj in self._InflowForecasts:
+            obj._Reservoir = None
+        self._InflowForecasts = RefList()
 
     def getSpillsFromReservoir(self):
         """A reservoir may spill into a downstream reservoir
@@ -220,8 +269,7 @@ class Reservoir(PowerSystemResource):
 
     def setSpillsFromReservoir(self, value):
         if self._SpillsFromReservoir is not None:
-            filtered = [x for x in self.SpillsFromReservoir.SpillsIntoReservoirs if x != self]
-            self._SpillsFromReservoir._SpillsIntoReservoirs = filtered
+            self._SpillsFromReservoir._SpillsIntoReservoirs.discard(self)
 
         self._SpillsFromReservoir = value
         if self._SpillsFromReservoir is not None:
@@ -237,18 +285,30 @@ class Reservoir(PowerSystemResource):
 
     def setSpillsIntoReservoirs(self, value):
         for x in self._SpillsIntoReservoirs:
-            x.SpillsFromReservoir = None
-        for y in value:
-            y._SpillsFromReservoir = self
-        self._SpillsIntoReservoirs = value
+            x._SpillsFromReservoir = None
+        self._SpillsIntoReservoirs = RefList()
+        self.addSpillsIntoReservoirs(value)
 
     SpillsIntoReservoirs = property(getSpillsIntoReservoirs, setSpillsIntoReservoirs)
 
     def addSpillsIntoReservoirs(self, *SpillsIntoReservoirs):
-        for obj in SpillsIntoReservoirs:
-            obj.SpillsFromReservoir = self
+        collection = self._SpillsIntoReservoirs
+        for obj in members(SpillsIntoReservoirs):
+            old = obj._SpillsFromReservoir
+            if old is not None and old is not self:
+                old._SpillsIntoReservoirs.discard(obj)
+            obj._SpillsFromReservoir = self
+            collection.append(obj)
 
     def removeSpillsIntoReservoirs(self, *SpillsIntoReservoirs):
-        for obj in SpillsIntoReservoirs:
-            obj.SpillsFromReservoir = None
+        collection = self._SpillsIntoReservoirs
+        for obj in members(SpillsIntoReservoirs):
+            if obj._SpillsFromReservoir is self:
+                obj._SpillsFromReservoir = None
+                collection.discard(obj)
+
+    def removeAllSpillsIntoReservoirs(self):
+        for obj in self._SpillsIntoReservoirs:
+            obj._SpillsFromReservoir = None
+        self._SpillsIntoReservoirs = RefList()
 
@@ -48,8 +48,7 @@ class TailbayLossCurve(Curve):
 
     def setHydroGeneratingUnit(self, value):
         if self._HydroGeneratingUnit is not None:
-            filtered = [x for x in self.HydroGeneratingUnit.TailbayLossCurve if x != self]
-            self._HydroGeneratingUnit._TailbayLossCurve = filtered
+            self._HydroGeneratingUnit._TailbayLossCurve.discard(self)
 
         self._HydroGeneratingUnit = value
         if self._HydroGeneratingUnit is not None:
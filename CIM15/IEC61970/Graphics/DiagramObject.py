@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DiagramObject(IdentifiedObject):
     """This class defines an object that defines one or more points in a given space. This object can be associated with anything that subclasses Identified Object in IEC 61970-301This class defines an object that defines one or more points in a given space. This object can be associated with anything that subclasses Identified Object in IEC 61970-301
@@ -53,7 +54,7 @@ class DiagramObject(IdentifiedObject):
         #: The drawing order of this element. The higher the number, the later the element is drawn in sequence. This is used to ensure that elements that overlap are rendered in the correct order.
         self.drawingOrder = drawingOrder
 
-        self._VisibilityLayers = []
+        self._VisibilityLayers = RefList()
         self.VisibilityLayers = [] if VisibilityLayers is None else VisibilityLayers
 
         self._IdentifiedObject = None
@@ -62,7 +63,7 @@ class DiagramObject(IdentifiedObject):
         self._DiagramObjectStyle = None
         self.DiagramObjectStyle = DiagramObjectStyle
 
-        self._DiagramObjectPoints = []
+        self._DiagramObjectPoints = RefList()
         self.DiagramObjectPoints = [] if DiagramObjectPoints is None else DiagramObjectPoints
 
         self._Diagram = None
@@ -84,26 +85,28 @@ class DiagramObject(IdentifiedObject):
 
     def setVisibilityLayers(self, value):
         for p in self._VisibilityLayers:
-            filtered = [q for q in p.DiagramObjects if q != self]
-            self._VisibilityLayers._DiagramObjects = filtered
-        for r in value:
-            if self not in r._DiagramObjects:
-                r._DiagramObjects.append(self)
-        self._VisibilityLayers = value
+            p._DiagramObjects.discard(self)
+        self._VisibilityLayers = RefList()
+        self.addVisibilityLayers(value)
 
     VisibilityLayers = property(getVisibilityLayers, setVisibilityLayers)
 
     def addVisibilityLayers(self, *VisibilityLayers):
-        for obj in VisibilityLayers:
-            if self not in obj._DiagramObjects:
-                obj._DiagramObjects.append(self)
-            self._VisibilityLayers.append(obj)
+        collection = self._VisibilityLayers
+        for obj in members(VisibilityLayers):
+            obj._DiagramObjects.append(self)
+            collection.append(obj)
 
     def removeVisibilityLayers(self, *VisibilityLayers):
-        for obj in VisibilityLayers:
-            if self in obj._DiagramObjects:
-                obj._DiagramObjects.remove(self)
-            self._VisibilityLayers.remove(obj)
+        collection = self._VisibilityLayers
+        for obj in members(VisibilityLayers):
+            obj._DiagramObjects.discard(self)
+            collection.discard(obj)
+
+    def removeAllVisibilityLayers(self):
+        for obj in self._VisibilityLayers:
+            obj._DiagramObjects.discard(self)
+        self._VisibilityLayers = RefList()
 
     def getIdentifiedObject(self):
         """The domain object that this diagram object is associated with
@@ -112,8 +115,7 @@ class DiagramObject(IdentifiedObject):
 
     def setIdentifiedObject(self, value):
         if self._IdentifiedObject is not None:
-            filtered = [x for x in self.IdentifiedObject.DiagramObjects if x != self]
-            self._IdentifiedObject._DiagramObjects = filtered
+            self._IdentifiedObject._DiagramObjects.discard(self)
 
         self._IdentifiedObject = value
         if self._IdentifiedObject is not None:
@@ -129,8 +131,7 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagramObjectStyle(self, value):
         if self._DiagramObjectStyle is not None:
-            filtered = [x for x in self.DiagramObjectStyle.DiagramObjects if x != self]
-            self._DiagramObjectStyle._DiagramObjects = filtered
+            self._DiagramObjectStyle._DiagramObjects.discard(self)
 
         self._DiagramObjectStyle = value
         if self._DiagramObjectStyle is not None:
@@ -146,20 +147,32 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagramObjectPoints(self, value):
         for x in self._DiagramObjectPoints:
-            x.DiagramObject = None
-        for y in value:
-            y._DiagramObject = self
-        self._DiagramObjectPoints = value
+            x._DiagramObject = None
+        self._DiagramObjectPoints = RefList()
+        self.addDiagramObjectPoints(value)
 
     DiagramObjectPoints = property(getDiagramObjectPoints, setDiagramObjectPoints)
 
     def addDiagramObjectPoints(self, *DiagramObjectPoints):
-        for obj in DiagramObjectPoints:
-            obj.DiagramObject = self
+        collection = self._DiagramObjectPoints
+        for obj in members(DiagramObjectPoints):
+            old = obj._DiagramObject
+            if old is not None and old is not self:
+                old._DiagramObjectPoints.discard(obj)
+            obj._DiagramObject = self
+            collection.append(obj)
 
     def removeDiagramObjectPoints(self, *DiagramObjectPoints):
-        for obj in DiagramObjectPoints:
-            obj.DiagramObject = None
+        collection = self._DiagramObjectPoints
+        for obj in members(DiagramObjectPoints):
+            if obj._DiagramObject is self:
+                obj._DiagramObject = None
+                collection.discard(obj)
+
+    def removeAllDiagramObjectPoints(self):
+        for obj in self._DiagramObjectPoints:
+            obj._DiagramObject = None
+        self._DiagramObjectPoints = RefList()
 
     def getDiagram(self):
         """A diagram object is part of a Diagram
@@ -168,8 +181,7 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagram(self, value):
         if self._Diagram is not None:
-            filtered = [x for x in self.Diagram.DiagramObjects if x != self]
-            self._Diagram._DiagramObjects = filtered
+            self._Diagram._DiagramObjects.discard(self)
 
         self._Diagram = value
         if self._Diagram is not None:
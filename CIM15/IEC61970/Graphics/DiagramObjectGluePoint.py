@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class DiagramObjectGluePoint(Element):
     """This is used for grouping DiagramObjectPoints from different DiagramObjects that are considered to be &lsquo;glued&rsquo; together in a diagram even if they are not at the exact same coordinates.This is used for grouping DiagramObjectPoints from different DiagramObjects that are considered to be &lsquo;glued&rsquo; together in a diagram even if they are not at the exact same coordinates.
@@ -29,7 +30,7 @@ class DiagramObjectGluePoint(Element):
 
         @param DiagramObjectPoints: A diagram object glue point is associated with 2 or more object points that are considered to be 'glued' together.
         """
-        self._DiagramObjectPoints = []
+        self._DiagramObjectPoints = RefList()
         self.DiagramObjectPoints = [] if DiagramObjectPoints is None else DiagramObjectPoints
 
         super(DiagramObjectGluePoint, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class DiagramObjectGluePoint(Element):
 
     def setDiagramObjectPoints(self, value):
         for x in self._DiagramObjectPoints:
-            x.DiagramObjectGluePoint = None
-        for y in value:
-            y._DiagramObjectGluePoint = self
-        self._DiagramObjectPoints = value
+            x._DiagramObjectGluePoint = None
+        self._DiagramObjectPoints = RefList()
+        self.addDiagramObjectPoints(value)
 
     DiagramObjectPoints = property(getDiagramObjectPoints, setDiagramObjectPoints)
 
     def addDiagramObjectPoints(self, *DiagramObjectPoints):
-        for obj in DiagramObjectPoints:
-            obj.DiagramObjectGluePoint = self
+        collection = self._DiagramObjectPoints
+        for obj in members(DiagramObjectPoints):
+            old = obj._DiagramObjectGluePoint
+            if old is not None and old is not self:
+                old._DiagramObjectPoints.discard(obj)
+            obj._DiagramObjectGluePoint = self
+            collection.append(obj)
 
     def removeDiagramObjectPoints(self, *DiagramObjectPoints):
-        for obj in DiagramObjectPoints:
-            obj.DiagramObjectGluePoint = None
+        collection = self._DiagramObjectPoints
+        for obj in members(DiagramObjectPoints):
+            if obj._DiagramObjectGluePoint is self:
+                obj._DiagramObjectGluePoint = None
+                collection.discard(obj)
+
+    def removeAllDiagramObjectPoints(self):
+        for obj in self._DiagramObjectPoints:
+            obj._DiagramObjectGluePoint = None
+        self._DiagramObjectPoints = RefList()
 
@@ -68,8 +68,7 @@ class DiagramObjectPoint(Element):
 
     def setDiagramObjectGluePoint(self, value):
         if self._DiagramObjectGluePoint is not None:
-            filtered = [x for x in self.DiagramObjectGluePoint.DiagramObjectPoints if x != self]
-            self._DiagramObjectGluePoint._DiagramObjectPoints = filtered
+            self._DiagramObjectGluePoint._DiagramObjectPoints.discard(self)
 
         self._DiagramObjectGluePoint = value
         if self._DiagramObjectGluePoint is not None:
@@ -85,8 +84,7 @@ class DiagramObjectPoint(Element):
 
     def setDiagramObject(self, value):
         if self._DiagramObject is not None:
-            filtered = [x for x in self.DiagramObject.DiagramObjectPoints if x != self]
-            self._DiagramObject._DiagramObjectPoints = filtered
+            self._DiagramObject._DiagramObjectPoints.discard(self)
 
         self._DiagramObject = value
         if self._DiagramObject is not None:
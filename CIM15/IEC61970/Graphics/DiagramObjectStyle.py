@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DiagramObjectStyle(IdentifiedObject):
     """A reference to a style used by the originating system for a DiagramObject.  A DiagramObjectStyle describes information such as  &bull; line thickness &bull; shape, e.g circle, rectangle ... &bull; colorA reference to a style used by the originating system for a DiagramObject.  A DiagramObjectStyle describes information such as  &bull; line thickness &bull; shape, e.g circle, rectangle ... &bull; color
@@ -29,7 +30,7 @@ class DiagramObjectStyle(IdentifiedObject):
 
         @param DiagramObjects: A style can be assigned to multiple DiagramObjects
         """
-        self._DiagramObjects = []
+        self._DiagramObjects = RefList()
         self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
 
         super(DiagramObjectStyle, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class DiagramObjectStyle(IdentifiedObject):
 
     def setDiagramObjects(self, value):
         for x in self._DiagramObjects:
-            x.DiagramObjectStyle = None
-        for y in value:
-            y._DiagramObjectStyle = self
-        self._DiagramObjects = value
+            x._DiagramObjectStyle = None
+        self._DiagramObjects = RefList()
+        self.addDiagramObjects(value)
 
     DiagramObjects = property(getDiagramObjects, setDiagramObjects)
 
     def addDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            obj.DiagramObjectStyle = self
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            old = obj._DiagramObjectStyle
+            if old is not None and old is not self:
+                old._DiagramObjects.discard(obj)
+            obj._DiagramObjectStyle = self
+            collection.append(obj)
 
     def removeDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            obj.DiagramObjectStyle = None
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            if obj._DiagramObjectStyle is self:
+                obj._DiagramObjectStyle = None
+                collection.discard(obj)
+
+    def removeAllDiagramObjects(self):
+        for obj in self._DiagramObjects:
+            obj._DiagramObjectStyle = None
+        self._DiagramObjects = RefList()
 
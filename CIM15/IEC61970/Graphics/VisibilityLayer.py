@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class VisibilityLayer(IdentifiedObject):
     """Layers are typically used for grouping diagram objects according to themes and scales. Themes are used to display or hide certain information (e.g., lakes, borders), while scales are used for hiding or displaying information depending on the current zoom level (hide text when it is too small to be read, or when it exceeds the screen size). This is also called de-cluttering.  CIM based graphics exchange will support an m:n relationship between diagram objects and layers. It will be the task of the importing system to convert an m:n case into an appropriate 1:n representation if the importing system does not support m:n.Layers are typically used for grouping diagram objects according to themes and scales. Themes are used to display or hide certain information (e.g., lakes, borders), while scales are used for hiding or displaying information depending on the current zoom level (hide text when it is too small to be read, or when it exceeds the screen size). This is also called de-cluttering.  CIM based graphics exchange will support an m:n relationship between diagram objects and layers. It will be the task of the importing system to convert an m:n case into an appropriate 1:n representation if the importing system does not support m:n.
@@ -33,7 +34,7 @@ class VisibilityLayer(IdentifiedObject):
         #: The drawing order for this layer.  As with the drawingOrder for diagram objects, the higher the number, the later the layer and the objects within it are rendered.
         self.drawingOrder = drawingOrder
 
-        self._DiagramObjects = []
+        self._DiagramObjects = RefList()
         self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
 
         super(VisibilityLayer, self).__init__(*args, **kw_args)
@@ -52,24 +53,26 @@ class VisibilityLayer(IdentifiedObject):
 
     def setDiagramObjects(self, value):
         for p in self._DiagramObjects:
-            filtered = [q for q in p.VisibilityLayers if q != self]
-            self._DiagramObjects._VisibilityLayers = filtered
-        for r in value:
-            if self not in r._VisibilityLayers:
-                r._VisibilityLayers.append(self)
-        self._DiagramObjects = value
+            p._VisibilityLayers.discard(self)
+        self._DiagramObjects = RefList()
+        self.addDiagramObjects(value)
 
     DiagramObjects = property(getDiagramObjects, setDiagramObjects)
 
     def addDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            if self not in obj._VisibilityLayers:
-                obj._VisibilityLayers.append(self)
-            self._DiagramObjects.append(obj)
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            obj._VisibilityLayers.append(self)
+            collection.append(obj)
 
     def removeDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            if self in obj._VisibilityLayers:
-                obj._VisibilityLayers.remove(self)
-            self._DiagramObjects.remove(obj)
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            obj._VisibilityLayers.discard(self)
+            collection.discard(obj)
+
+    def removeAllDiagramObjects(self):
+        for obj in self._DiagramObjects:
+            obj._VisibilityLayers.discard(self)
+        self._DiagramObjects = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class AssetModelCatalogue(IdentifiedObject):
     """Catalogue of available types of products and materials that are used to build or install, maintain or operate an Asset. Each catalogue item is for a specific product (AssetModel) available from a specific supplier.Catalogue of available types of products and materials that are used to build or install, maintain or operate an Asset. Each catalogue item is for a specific product (AssetModel) available from a specific supplier.
@@ -30,7 +31,7 @@ class AssetModelCatalogue(IdentifiedObject):
         @param AssetModelCatalogueItems:
         @param status:
         """
-        self._AssetModelCatalogueItems = []
+        self._AssetModelCatalogueItems = RefList()
         self.AssetModelCatalogueItems = [] if AssetModelCatalogueItems is None else AssetModelCatalogueItems
 
         self.status = status
@@ -50,20 +51,32 @@ class AssetModelCatalogue(IdentifiedObject):
 
     def setAssetModelCatalogueItems(self, value):
         for x in self._AssetModelCatalogueItems:
-            x.AssetModelCatalogue = None
-        for y in value:
-            y._AssetModelCatalogue = self
-        self._AssetModelCatalogueItems = value
+            x._AssetModelCatalogue = None
+        self._AssetModelCatalogueItems = RefList()
+        self.addAssetModelCatalogueItems(value)
 
     AssetModelCatalogueItems = property(getAssetModelCatalogueItems, setAssetModelCatalogueItems)
 
     def addAssetModelCatalogueItems(self, *AssetModelCatalogueItems):
-        for obj in AssetModelCatalogueItems:
-            obj.AssetModelCatalogue = self
+        collection = self._AssetModelCatalogueItems
+        for obj in members(AssetModelCatalogueItems):
+            old = obj._AssetModelCatalogue
+            if old is not None and old is not self:
+                old._AssetModelCatalogueItems.discard(obj)
+            obj._AssetModelCatalogue = self
+            collection.append(obj)
 
     def removeAssetModelCatalogueItems(self, *AssetModelCatalogueItems):
-        for obj in AssetModelCatalogueItems:
-            obj.AssetModelCatalogue = None
+        collection = self._AssetModelCatalogueItems
+        for obj in members(AssetModelCatalogueItems):
+            if obj._AssetModelCatalogue is self:
+                obj._AssetModelCatalogue = None
+                collection.discard(obj)
+
+    def removeAllAssetModelCatalogueItems(self):
+        for obj in self._AssetModelCatalogueItems:
+            obj._AssetModelCatalogue = None
+        self._AssetModelCatalogueItems = RefList()
 
     status = None
 
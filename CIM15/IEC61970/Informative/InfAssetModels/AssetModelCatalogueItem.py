@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class AssetModelCatalogueItem(Document):
     """Provides pricing and other relevant information about a specific manufacturer's product (i.e., AssetModel), and its price from a given supplier. A single AssetModel may be availble from multiple suppliers. Note that manufacturer and supplier are both types of organisation, which the association is inherited from Document.Provides pricing and other relevant information about a specific manufacturer's product (i.e., AssetModel), and its price from a given supplier. A single AssetModel may be availble from multiple suppliers. Note that manufacturer and supplier are both types of organisation, which the association is inherited from Document.
@@ -36,7 +37,7 @@ class AssetModelCatalogueItem(Document):
         #: Unit cost for an asset model from a specific supplier, either for a unit cost or cost per unit length. Cost is for material or asset only and does not include labor to install/construct or configure it.
         self.unitCost = unitCost
 
-        self._ErpPOLineItems = []
+        self._ErpPOLineItems = RefList()
         self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
 
         self._AssetModelCatalogue = None
@@ -45,7 +46,7 @@ class AssetModelCatalogueItem(Document):
         self._AssetModel = None
         self.AssetModel = AssetModel
 
-        self._ErpQuoteLineItems = []
+        self._ErpQuoteLineItems = RefList()
         self.ErpQuoteLineItems = [] if ErpQuoteLineItems is None else ErpQuoteLineItems
 
         super(AssetModelCatalogueItem, self).__init__(*args, **kw_args)
@@ -63,20 +64,32 @@ class AssetModelCatalogueItem(Document):
 
     def setErpPOLineItems(self, value):
         for x in self._ErpPOLineItems:
-            x.AssetModelCatalogueItem = None
-        for y in value:
-            y._AssetModelCatalogueItem = self
-        self._ErpPOLineItems = value
+            x._AssetModelCatalogueItem = None
+        self._ErpPOLineItems = RefList()
+        self.addErpPOLineItems(value)
 
     ErpPOLineItems = property(getErpPOLineItems, setErpPOLineItems)
 
     def addErpPOLineItems(self, *ErpPOLineItems):
-        for obj in ErpPOLineItems:
-            obj.AssetModelCatalogueItem = self
+        collection = self._ErpPOLineItems
+        for obj in members(ErpPOLineItems):
+            old = obj._AssetModelCatalogueItem
+            if old is not None and old is not self:
+                old._ErpPOLineItems.discard(obj)
+            obj._AssetModelCatalogueItem = self
+            collection.append(obj)
 
     def removeErpPOLineItems(self, *ErpPOLineItems):
-        for obj in ErpPOLineItems:
-            obj.AssetModelCatalogueItem = None
+        collection = self._ErpPOLineItems
+        for obj in members(ErpPOLineItems):
+            if obj._AssetModelCatalogueItem is self:
+                obj._AssetModelCatalogueItem = None
+                collection.discard(obj)
+
+    def removeAllErpPOLineItems(self):
+        for obj in self._ErpPOLineItems:
+            obj._AssetModelCatalogueItem = None
+        self._ErpPOLineItems = RefList()
 
     def getAssetModelCatalogue(self):
         
@@ -84,8 +97,7 @@ class AssetModelCatalogueItem(Document):
 
     def setAssetModelCatalogue(self, value):
         if self._AssetModelCatalogue is not None:
-            filtered = [x for x in self.AssetModelCatalogue.AssetModelCatalogueItems if x != self]
-            self._AssetModelCatalogue._AssetModelCatalogueItems = filtered
+            self._AssetModelCatalogue._AssetModelCatalogueItems.discard(self)
 
         self._AssetModelCatalogue = value
         if self._AssetModelCatalogue is not None:
@@ -100,8 +112,7 @@ class AssetModelCatalogueItem(Document):
 
     def setAssetModel(self, value):
         if self._AssetModel is not None:
-            filtered = [x for x in self.AssetModel.AssetModelCatalogueItems if x != self]
-            self._AssetModel._AssetModelCatalogueItems = filtered
+            self._AssetModel._AssetModelCatalogueItems.discard(self)
 
         self._AssetModel = value
         if self._AssetModel is not None:
@@ -116,18 +127,30 @@ class AssetModelCatalogueItem(Document):
 
     def setErpQuoteLineItems(self, value):
         for x in self._ErpQuoteLineItems:
-            x.AssetModelCatalogueItem = None
-        for y in value:
-            y._AssetModelCatalogueItem = self
-        self._ErpQuoteLineItems = value
+            x._AssetModelCatalogueItem = None
+        self._ErpQuoteLineItems = RefList()
+        self.addErpQuoteLineItems(value)
 
     ErpQuoteLineItems = property(getErpQuoteLineItems, setErpQuoteLineItems)
 
     def addErpQuoteLineItems(self, *ErpQuoteLineItems):
-        for obj in ErpQuoteLineItems:
-            obj.AssetModelCatalogueItem = self
+        collection = self._ErpQuoteLineItems
+        for obj in members(ErpQuoteLineItems):
+            old = obj._AssetModelCatalogueItem
+            if old is not None and old is not self:
+                old._ErpQuoteLineItems.discard(obj)
+            obj._AssetModelCatalogueItem = self
+            collection.append(obj)
 
     def removeErpQuoteLineItems(self, *ErpQuoteLineItems):
-        for obj in ErpQuoteLineItems:
-            obj.AssetModelCatalogueItem = None
+        collection = self._ErpQuoteLineItems
+        for obj in members(ErpQuoteLineItems):
+            if obj._AssetModelCatalogueItem is self:
+                obj._AssetModelCatalogueItem = None
+                collection.discard(obj)
+
+    def removeAllErpQuoteLineItems(self):
+        for obj in self._ErpQuoteLineItems:
+            obj._AssetModelCatalogueItem = None
+        self._ErpQuoteLineItems = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.ProductAssetModel import ProductAssetModel
+from PyCIM.RefList import RefList, members
 
 class TransformerAssetModel(ProductAssetModel):
     """Documentation for a type of a transformer of a particular product model made by a manufacturer.Documentation for a type of a transformer of a particular product model made by a manufacturer.
@@ -86,7 +87,7 @@ class TransformerAssetModel(ProductAssetModel):
         #: Weight of solid insultation in transformer.
         self.solidInsulationWeight = solidInsulationWeight
 
-        self._TransformerAssets = []
+        self._TransformerAssets = RefList()
         self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
 
         self._TransformerInfo = None
@@ -107,20 +108,32 @@ class TransformerAssetModel(ProductAssetModel):
 
     def setTransformerAssets(self, value):
         for x in self._TransformerAssets:
-            x.TransformerAssetModel = None
-        for y in value:
-            y._TransformerAssetModel = self
-        self._TransformerAssets = value
+            x._TransformerAssetModel = None
+        self._TransformerAssets = RefList()
+        self.addTransformerAssets(value)
 
     TransformerAssets = property(getTransformerAssets, setTransformerAssets)
 
     def addTransformerAssets(self, *TransformerAssets):
-        for obj in TransformerAssets:
-            obj.TransformerAssetModel = self
+        collection = self._TransformerAssets
+        for obj in members(TransformerAssets):
+            old = obj._TransformerAssetModel
+            if old is not None and old is not self:
+                old._TransformerAssets.discard(obj)
+            obj._TransformerAssetModel = self
+            collection.append(obj)
 
     def removeTransformerAssets(self, *TransformerAssets):
-        for obj in TransformerAssets:
-            obj.TransformerAssetModel = None
+        collection = self._TransformerAssets
+        for obj in members(TransformerAssets):
+            if obj._TransformerAssetModel is self:
+                obj._TransformerAssetModel = None
+                collection.discard(obj)
+
+    def removeAllTransformerAssets(self):
+        for obj in self._TransformerAssets:
+            obj._TransformerAssetModel = None
+        self._TransformerAssets = RefList()
 
     def getTransformerInfo(self):
         
@@ -128,8 +141,7 @@ class TransformerAssetModel(ProductAssetModel):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.TransformerAssetModels if x != self]
-            self._TransformerInfo._TransformerAssetModels = filtered
+            self._TransformerInfo._TransformerAssetModels.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
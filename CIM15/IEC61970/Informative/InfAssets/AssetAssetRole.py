@@ -51,8 +51,7 @@ class AssetAssetRole(Role):
 
     def setToAsset(self, value):
         if self._ToAsset is not None:
-            filtered = [x for x in self.ToAsset.FromAssetRoles if x != self]
-            self._ToAsset._FromAssetRoles = filtered
+            self._ToAsset._FromAssetRoles.discard(self)
 
         self._ToAsset = value
         if self._ToAsset is not None:
@@ -67,8 +66,7 @@ class AssetAssetRole(Role):
 
     def setFromAsset(self, value):
         if self._FromAsset is not None:
-            filtered = [x for x in self.FromAsset.ToAssetRoles if x != self]
-            self._FromAsset._ToAssetRoles = filtered
+            self._FromAsset._ToAssetRoles.discard(self)
 
         self._FromAsset = value
         if self._FromAsset is not None:
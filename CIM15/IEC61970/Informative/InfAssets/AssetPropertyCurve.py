@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from PyCIM.RefList import RefList, members
 
 class AssetPropertyCurve(Curve):
     """An Asset Property that is described through curves rather than as a data point. The relationship is to be defined between an independent variable (X-axis) and one or two dependent variables (Y1-axis and Y2-axis).An Asset Property that is described through curves rather than as a data point. The relationship is to be defined between an independent variable (X-axis) and one or two dependent variables (Y1-axis and Y2-axis).
@@ -33,7 +34,7 @@ class AssetPropertyCurve(Curve):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         super(AssetPropertyCurve, self).__init__(*args, **kw_args)
@@ -51,8 +52,7 @@ class AssetPropertyCurve(Curve):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.AssetPropertyCurves if x != self]
-            self._Specification._AssetPropertyCurves = filtered
+            self._Specification._AssetPropertyCurves.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
@@ -67,24 +67,26 @@ class AssetPropertyCurve(Curve):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.AssetPropertyCurves if q != self]
-            self._Assets._AssetPropertyCurves = filtered
-        for r in value:
-            if self not in r._AssetPropertyCurves:
-                r._AssetPropertyCurves.append(self)
-        self._Assets = value
+            p._AssetPropertyCurves.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._AssetPropertyCurves:
-                obj._AssetPropertyCurves.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._AssetPropertyCurves.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._AssetPropertyCurves:
-                obj._AssetPropertyCurves.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._AssetPropertyCurves.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._AssetPropertyCurves.discard(self)
+        self._Assets = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from PyCIM.RefList import RefList, members
 
 class Bushing(Asset):
     """Bushing asset.Bushing asset.
@@ -53,7 +54,7 @@ class Bushing(Asset):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._BushingInsulationPFs = []
+        self._BushingInsulationPFs = RefList()
         self.BushingInsulationPFs = [] if BushingInsulationPFs is None else BushingInsulationPFs
 
         super(Bushing, self).__init__(*args, **kw_args)
@@ -86,18 +87,30 @@ class Bushing(Asset):
 
     def setBushingInsulationPFs(self, value):
         for x in self._BushingInsulationPFs:
-            x.BushingInfo = None
-        for y in value:
-            y._BushingInfo = self
-        self._BushingInsulationPFs = value
+            x._BushingInfo = None
+        self._BushingInsulationPFs = RefList()
+        self.addBushingInsulationPFs(value)
 
     BushingInsulationPFs = property(getBushingInsulationPFs, setBushingInsulationPFs)
 
     def addBushingInsulationPFs(self, *BushingInsulationPFs):
-        for obj in BushingInsulationPFs:
-            obj.BushingInfo = self
+        collection = self._BushingInsulationPFs
+        for obj in members(BushingInsulationPFs):
+            old = obj._BushingInfo
+            if old is not None and old is not self:
+                old._BushingInsulationPFs.discard(obj)
+            obj._BushingInfo = self
+            collection.append(obj)
 
     def removeBushingInsulationPFs(self, *BushingInsulationPFs):
-        for obj in BushingInsulationPFs:
-            obj.BushingInfo = None
+        collection = self._BushingInsulationPFs
+        for obj in members(BushingInsulationPFs):
+            if obj._BushingInfo is self:
+                obj._BushingInfo = None
+                collection.discard(obj)
+
+    def removeAllBushingInsulationPFs(self):
+        for obj in self._BushingInsulationPFs:
+            obj._BushingInfo = None
+        self._BushingInsulationPFs = RefList()
 
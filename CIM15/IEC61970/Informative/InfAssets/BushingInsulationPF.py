@@ -60,8 +60,7 @@ class BushingInsulationPF(IdentifiedObject):
 
     def setTransformerObservation(self, value):
         if self._TransformerObservation is not None:
-            filtered = [x for x in self.TransformerObservation.BushingInsultationPFs if x != self]
-            self._TransformerObservation._BushingInsultationPFs = filtered
+            self._TransformerObservation._BushingInsultationPFs.discard(self)
 
         self._TransformerObservation = value
         if self._TransformerObservation is not None:
@@ -76,8 +75,7 @@ class BushingInsulationPF(IdentifiedObject):
 
     def setBushingInfo(self, value):
         if self._BushingInfo is not None:
-            filtered = [x for x in self.BushingInfo.BushingInsulationPFs if x != self]
-            self._BushingInfo._BushingInsulationPFs = filtered
+            self._BushingInfo._BushingInsulationPFs.discard(self)
 
         self._BushingInfo = value
         if self._BushingInfo is not None:
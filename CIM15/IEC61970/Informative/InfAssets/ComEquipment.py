@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from PyCIM.RefList import RefList, members
 
 class ComEquipment(Asset):
     """Communicaiton equipment assets other than media (such as gateways, routers, controllers, etc.).Communicaiton equipment assets other than media (such as gateways, routers, controllers, etc.).
@@ -29,7 +30,7 @@ class ComEquipment(Asset):
 
         @param EndDeviceFunctions: All device functions of this communication equipment.
         """
-        self._EndDeviceFunctions = []
+        self._EndDeviceFunctions = RefList()
         self.EndDeviceFunctions = [] if EndDeviceFunctions is None else EndDeviceFunctions
 
         super(ComEquipment, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ComEquipment(Asset):
 
     def setEndDeviceFunctions(self, value):
         for x in self._EndDeviceFunctions:
-            x.ComEquipment = None
-        for y in value:
-            y._ComEquipment = self
-        self._EndDeviceFunctions = value
+            x._ComEquipment = None
+        self._EndDeviceFunctions = RefList()
+        self.addEndDeviceFunctions(value)
 
     EndDeviceFunctions = property(getEndDeviceFunctions, setEndDeviceFunctions)
 
     def addEndDeviceFunctions(self, *EndDeviceFunctions):
-        for obj in EndDeviceFunctions:
-            obj.ComEquipment = self
+        collection = self._EndDeviceFunctions
+        for obj in members(EndDeviceFunctions):
+            old = obj._ComEquipment
+            if old is not None and old is not self:
+                old._EndDeviceFunctions.discard(obj)
+            obj._ComEquipment = self
+            collection.append(obj)
 
     def removeEndDeviceFunctions(self, *EndDeviceFunctions):
-        for obj in EndDeviceFunctions:
-            obj.ComEquipment = None
+        collection = self._EndDeviceFunctions
+        for obj in members(EndDeviceFunctions):
+            if obj._ComEquipment is self:
+                obj._ComEquipment = None
+                collection.discard(obj)
+
+    def removeAllEndDeviceFunctions(self):
+        for obj in self._EndDeviceFunctions:
+            obj._ComEquipment = None
+        self._EndDeviceFunctions = RefList()
 
@@ -63,8 +63,7 @@ class ConductorAsset(Asset):
 
     def setCircuitSection(self, value):
         if self._CircuitSection is not None:
-            filtered = [x for x in self.CircuitSection.ConductorAssets if x != self]
-            self._CircuitSection._ConductorAssets = filtered
+            self._CircuitSection._ConductorAssets.discard(self)
 
         self._CircuitSection = value
         if self._CircuitSection is not None:
@@ -79,8 +78,7 @@ class ConductorAsset(Asset):
 
     def setConductorSegment(self, value):
         if self._ConductorSegment is not None:
-            filtered = [x for x in self.ConductorSegment.ConductorAssets if x != self]
-            self._ConductorSegment._ConductorAssets = filtered
+            self._ConductorSegment._ConductorAssets.discard(self)
 
         self._ConductorSegment = value
         if self._ConductorSegment is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class CurrentTransformerInfo(AssetInfo):
     """Properties of current transformer asset.Properties of current transformer asset.
@@ -82,7 +83,7 @@ class CurrentTransformerInfo(AssetInfo):
 
         self.secondaryRatio = secondaryRatio
 
-        self._CTs = []
+        self._CTs = RefList()
         self.CTs = [] if CTs is None else CTs
 
         self.tertiaryRatio = tertiaryRatio
@@ -113,20 +114,32 @@ class CurrentTransformerInfo(AssetInfo):
 
     def setCTs(self, value):
         for x in self._CTs:
-            x.CTInfo = None
-        for y in value:
-            y._CTInfo = self
-        self._CTs = value
+            x._CTInfo = None
+        self._CTs = RefList()
+        self.addCTs(value)
 
     CTs = property(getCTs, setCTs)
 
     def addCTs(self, *CTs):
-        for obj in CTs:
-            obj.CTInfo = self
+        collection = self._CTs
+        for obj in members(CTs):
+            old = obj._CTInfo
+            if old is not None and old is not self:
+                old._CTs.discard(obj)
+            obj._CTInfo = self
+            collection.append(obj)
 
     def removeCTs(self, *CTs):
-        for obj in CTs:
-            obj.CTInfo = None
+        collection = self._CTs
+        for obj in members(CTs):
+            if obj._CTInfo is self:
+                obj._CTInfo = None
+                collection.discard(obj)
+
+    def removeAllCTs(self):
+        for obj in self._CTs:
+            obj._CTInfo = None
+        self._CTs = RefList()
 
     # Ratio for the tertiary winding tap changer.
     tertiaryRatio = None
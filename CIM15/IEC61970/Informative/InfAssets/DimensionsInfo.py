@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DimensionsInfo(IdentifiedObject):
     """As applicable, the basic linear, area, or volume dimensions of an asset, asset type (AssetModel) or other type of object (such as land area). Units and multipliers are specified per dimension.As applicable, the basic linear, area, or volume dimensions of an asset, asset type (AssetModel) or other type of object (such as land area). Units and multipliers are specified per dimension.
@@ -51,13 +52,13 @@ class DimensionsInfo(IdentifiedObject):
         #: Depth measurement.
         self.sizeDepth = sizeDepth
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
-        self._AssetInfos = []
+        self._AssetInfos = RefList()
         self.AssetInfos = [] if AssetInfos is None else AssetInfos
 
-        self._Specifications = []
+        self._Specifications = RefList()
         self.Specifications = [] if Specifications is None else Specifications
 
         super(DimensionsInfo, self).__init__(*args, **kw_args)
@@ -75,20 +76,32 @@ class DimensionsInfo(IdentifiedObject):
 
     def setLocations(self, value):
         for x in self._Locations:
-            x.DimensionsInfo = None
-        for y in value:
-            y._DimensionsInfo = self
-        self._Locations = value
+            x._DimensionsInfo = None
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            obj.DimensionsInfo = self
+        collection = self._Locations
+        for obj in members(Locations):
+            old = obj._DimensionsInfo
+            if old is not None and old is not self:
+                old._Locations.discard(obj)
+            obj._DimensionsInfo = self
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            obj.DimensionsInfo = None
+        collection = self._Locations
+        for obj in members(Locations):
+            if obj._DimensionsInfo is self:
+                obj._DimensionsInfo = None
+                collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._DimensionsInfo = None
+        self._Locations = RefList()
 
     def getAssetInfos(self):
         
@@ -96,20 +109,32 @@ class DimensionsInfo(IdentifiedObject):
 
     def setAssetInfos(self, value):
         for x in self._AssetInfos:
-            x.DimensionsInfo = None
-        for y in value:
-            y._DimensionsInfo = self
-        self._AssetInfos = value
+            x._DimensionsInfo = None
+        self._AssetInfos = RefList()
+        self.addAssetInfos(value)
 
     AssetInfos = property(getAssetInfos, setAssetInfos)
 
     def addAssetInfos(self, *AssetInfos):
-        for obj in AssetInfos:
-            obj.DimensionsInfo = self
+        collection = self._AssetInfos
+        for obj in members(AssetInfos):
+            old = obj._DimensionsInfo
+            if old is not None and old is not self:
+                old._AssetInfos.discard(obj)
+            obj._DimensionsInfo = self
+            collection.append(obj)
 
     def removeAssetInfos(self, *AssetInfos):
-        for obj in AssetInfos:
-            obj.DimensionsInfo = None
+        collection = self._AssetInfos
+        for obj in members(AssetInfos):
+            if obj._DimensionsInfo is self:
+                obj._DimensionsInfo = None
+                collection.discard(obj)
+
+    def removeAllAssetInfos(self):
+        for obj in self._AssetInfos:
+            obj._DimensionsInfo = None
+        self._AssetInfos = RefList()
 
     def getSpecifications(self):
         
@@ -117,24 +142,26 @@ class DimensionsInfo(IdentifiedObject):
 
     def setSpecifications(self, value):
         for p in self._Specifications:
-            filtered = [q for q in p.DimensionsInfos if q != self]
-            self._Specifications._DimensionsInfos = filtered
-        for r in value:
-            if self not in r._DimensionsInfos:
-                r._DimensionsInfos.append(self)
-        self._Specifications = value
+            p._DimensionsInfos.discard(self)
+        self._Specifications = RefList()
+        self.addSpecifications(value)
 
     Specifications = property(getSpecifications, setSpecifications)
 
     def addSpecifications(self, *Specifications):
-        for obj in Specifications:
-            if self not in obj._DimensionsInfos:
-                obj._DimensionsInfos.append(self)
-            self._Specifications.append(obj)
+        collection = self._Specifications
+        for obj in members(Specifications):
+            obj._DimensionsInfos.append(self)
+            collection.append(obj)
 
     def removeSpecifications(self, *Specifications):
-        for obj in Specifications:
-            if self in obj._DimensionsInfos:
-                obj._DimensionsInfos.remove(self)
-            self._Specifications.remove(obj)
+        collection = self._Specifications
+        for obj in members(Specifications):
+            obj._DimensionsInfos.discard(self)
+            collection.discard(obj)
+
+    def removeAllSpecifications(self):
+        for obj in self._Specifications:
+            obj._DimensionsInfos.discard(self)
+        self._Specifications = RefList()
 
@@ -51,8 +51,7 @@ class DocAssetRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.AssetRoles if x != self]
-            self._Document._AssetRoles = filtered
+            self._Document._AssetRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
@@ -67,8 +66,7 @@ class DocAssetRole(Role):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.DocumentRoles if x != self]
-            self._Asset._DocumentRoles = filtered
+            self._Asset._DocumentRoles.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from PyCIM.RefList import RefList, members
 
 class Duct(AssetContainer):
     """A Duct contains underground cables and is contained within a duct bank. The xCoord and yCoord attributes define its positioning within the DuctBank.A Duct contains underground cables and is contained within a duct bank. The xCoord and yCoord attributes define its positioning within the DuctBank.
@@ -41,7 +42,7 @@ class Duct(AssetContainer):
         self._DuctBankInfo = None
         self.DuctBankInfo = DuctBankInfo
 
-        self._CableInfos = []
+        self._CableInfos = RefList()
         self.CableInfos = [] if CableInfos is None else CableInfos
 
         super(Duct, self).__init__(*args, **kw_args)
@@ -59,8 +60,7 @@ class Duct(AssetContainer):
 
     def setDuctBankInfo(self, value):
         if self._DuctBankInfo is not None:
-            filtered = [x for x in self.DuctBankInfo.DuctInfos if x != self]
-            self._DuctBankInfo._DuctInfos = filtered
+            self._DuctBankInfo._DuctInfos.discard(self)
 
         self._DuctBankInfo = value
         if self._DuctBankInfo is not None:
@@ -75,18 +75,30 @@ class Duct(AssetContainer):
 
     def setCableInfos(self, value):
         for x in self._CableInfos:
-            x.DuctBankInfo = None
-        for y in value:
-            y._DuctBankInfo = self
-        self._CableInfos = value
+            x._DuctBankInfo = None
+        self._CableInfos = RefList()
+        self.addCableInfos(value)
 
     CableInfos = property(getCableInfos, setCableInfos)
 
     def addCableInfos(self, *CableInfos):
-        for obj in CableInfos:
-            obj.DuctBankInfo = self
+        collection = self._CableInfos
+        for obj in members(CableInfos):
+            old = obj._DuctBankInfo
+            if old is not None and old is not self:
+                old._CableInfos.discard(obj)
+            obj._DuctBankInfo = self
+            collection.append(obj)
 
     def removeCableInfos(self, *CableInfos):
-        for obj in CableInfos:
-            obj.DuctBankInfo = None
+        collection = self._CableInfos
+        for obj in members(CableInfos):
+            if obj._DuctBankInfo is self:
+                obj._DuctBankInfo = None
+                collection.discard(obj)
+
+    def removeAllCableInfos(self):
+        for obj in self._CableInfos:
+            obj._DuctBankInfo = None
+        self._CableInfos = RefList()
 
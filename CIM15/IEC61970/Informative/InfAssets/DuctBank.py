@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from PyCIM.RefList import RefList, members
 
 class DuctBank(AssetContainer):
     """A duct bank may contain many ducts. Each duct contains individual lines that are expressed as conductor assets (thereby describing each line's physical asset characteristics), which are each associated with ACLineSegments and other classes describing their electrical characteristics.A duct bank may contain many ducts. Each duct contains individual lines that are expressed as conductor assets (thereby describing each line's physical asset characteristics), which are each associated with ACLineSegments and other classes describing their electrical characteristics.
@@ -33,7 +34,7 @@ class DuctBank(AssetContainer):
         #: Number of circuits in duct bank. Refer to associations between a duct (ConductorAsset) and an ACLineSegment to understand which circuits are in which ducts.
         self.circuitCount = circuitCount
 
-        self._DuctInfos = []
+        self._DuctInfos = RefList()
         self.DuctInfos = [] if DuctInfos is None else DuctInfos
 
         super(DuctBank, self).__init__(*args, **kw_args)
@@ -51,18 +52,30 @@ class DuctBank(AssetContainer):
 
     def setDuctInfos(self, value):
         for x in self._DuctInfos:
-            x.DuctBankInfo = None
-        for y in value:
-            y._DuctBankInfo = self
-        self._DuctInfos = value
+            x._DuctBankInfo = None
+        self._DuctInfos = RefList()
+        self.addDuctInfos(value)
 
     DuctInfos = property(getDuctInfos, setDuctInfos)
 
     def addDuctInfos(self, *DuctInfos):
-        for obj in DuctInfos:
-            obj.DuctBankInfo = self
+        collection = self._DuctInfos
+        for obj in members(DuctInfos):
+            old = obj._DuctBankInfo
+            if old is not None and old is not self:
+                old._DuctInfos.discard(obj)
+            obj._DuctBankInfo = self
+            collection.append(obj)
 
     def removeDuctInfos(self, *DuctInfos):
-        for obj in DuctInfos:
-            obj.DuctBankInfo = None
+        collection = self._DuctInfos
+        for obj in members(DuctInfos):
+            if obj._DuctBankInfo is self:
+                obj._DuctBankInfo = None
+                collection.discard(obj)
+
+    def removeAllDuctInfos(self):
+        for obj in self._DuctInfos:
+            obj._DuctBankInfo = None
+        self._DuctInfos = RefList()
 
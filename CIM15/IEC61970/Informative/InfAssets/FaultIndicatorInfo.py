@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class FaultIndicatorInfo(AssetInfo):
     """Parameters of fault indicator asset.Parameters of fault indicator asset.
@@ -33,7 +34,7 @@ class FaultIndicatorInfo(AssetInfo):
         #: Kind of reset mechanisim of this fault indicator. Values are: "automatic", "other", "remote", "manual"
         self.resetKind = resetKind
 
-        self._FaultIndicators = []
+        self._FaultIndicators = RefList()
         self.FaultIndicators = [] if FaultIndicators is None else FaultIndicators
 
         super(FaultIndicatorInfo, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class FaultIndicatorInfo(AssetInfo):
 
     def setFaultIndicators(self, value):
         for x in self._FaultIndicators:
-            x.FaultIndicatorInfo = None
-        for y in value:
-            y._FaultIndicatorInfo = self
-        self._FaultIndicators = value
+            x._FaultIndicatorInfo = None
+        self._FaultIndicators = RefList()
+        self.addFaultIndicators(value)
 
     FaultIndicators = property(getFaultIndicators, setFaultIndicators)
 
     def addFaultIndicators(self, *FaultIndicators):
-        for obj in FaultIndicators:
-            obj.FaultIndicatorInfo = self
+        collection = self._FaultIndicators
+        for obj in members(FaultIndicators):
+            old = obj._FaultIndicatorInfo
+            if old is not None and old is not self:
+                old._FaultIndicators.discard(obj)
+            obj._FaultIndicatorInfo = self
+            collection.append(obj)
 
     def removeFaultIndicators(self, *FaultIndicators):
-        for obj in FaultIndicators:
-            obj.FaultIndicatorInfo = None
+        collection = self._FaultIndicators
+        for obj in members(FaultIndicators):
+            if obj._FaultIndicatorInfo is self:
+                obj._FaultIndicatorInfo = None
+                collection.discard(obj)
+
+    def removeAllFaultIndicators(self):
+        for obj in self._FaultIndicators:
+            obj._FaultIndicatorInfo = None
+        self._FaultIndicators = RefList()
 
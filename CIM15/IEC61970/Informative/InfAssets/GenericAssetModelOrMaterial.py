@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetModel import AssetModel
+from PyCIM.RefList import RefList, members
 
 class GenericAssetModelOrMaterial(AssetModel):
     """Generic asset or material item that may be used for planning, work or design purposes.Generic asset or material item that may be used for planning, work or design purposes.
@@ -47,13 +48,13 @@ class GenericAssetModelOrMaterial(AssetModel):
         #: The value, unit of measure, and multiplier for the quantity.
         self.quantity = quantity
 
-        self._ErpReqLineItems = []
+        self._ErpReqLineItems = RefList()
         self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
 
-        self._ProductAssetModels = []
+        self._ProductAssetModels = RefList()
         self.ProductAssetModels = [] if ProductAssetModels is None else ProductAssetModels
 
-        self._ErpInventoryIssues = []
+        self._ErpInventoryIssues = RefList()
         self.ErpInventoryIssues = [] if ErpInventoryIssues is None else ErpInventoryIssues
 
         self._CUWorkEquipmentAsset = None
@@ -65,7 +66,7 @@ class GenericAssetModelOrMaterial(AssetModel):
         self._CUAsset = None
         self.CUAsset = CUAsset
 
-        self._ErpBomItemDatas = []
+        self._ErpBomItemDatas = RefList()
         self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
 
         super(GenericAssetModelOrMaterial, self).__init__(*args, **kw_args)
@@ -83,20 +84,32 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setErpReqLineItems(self, value):
         for x in self._ErpReqLineItems:
-            x.TypeAsset = None
-        for y in value:
-            y._TypeAsset = self
-        self._ErpReqLineItems = value
+            x._TypeAsset = None
+        self._ErpReqLineItems = RefList()
+        self.addErpReqLineItems(value)
 
     ErpReqLineItems = property(getErpReqLineItems, setErpReqLineItems)
 
     def addErpReqLineItems(self, *ErpReqLineItems):
-        for obj in ErpReqLineItems:
-            obj.TypeAsset = self
+        collection = self._ErpReqLineItems
+        for obj in members(ErpReqLineItems):
+            old = obj._TypeAsset
+            if old is not None and old is not self:
+                old._ErpReqLineItems.discard(obj)
+            obj._TypeAsset = self
+            collection.append(obj)
 
     def removeErpReqLineItems(self, *ErpReqLineItems):
-        for obj in ErpReqLineItems:
-            obj.TypeAsset = None
+        collection = self._ErpReqLineItems
+        for obj in members(ErpReqLineItems):
+            if obj._TypeAsset is self:
+                obj._TypeAsset = None
+                collection.discard(obj)
+
+    def removeAllErpReqLineItems(self):
+        for obj in self._ErpReqLineItems:
+            obj._TypeAsset = None
+        self._ErpReqLineItems = RefList()
 
     def getProductAssetModels(self):
         """All product asset models satisfying this generic asset model.
@@ -105,20 +118,32 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setProductAssetModels(self, value):
         for x in self._ProductAssetModels:
-            x.GenericAssetModelOrMaterial = None
-        for y in value:
-            y._GenericAssetModelOrMaterial = self
-        self._ProductAssetModels = value
+            x._GenericAssetModelOrMaterial = None
+        self._ProductAssetModels = RefList()
+        self.addProductAssetModels(value)
 
     ProductAssetModels = property(getProductAssetModels, setProductAssetModels)
 
     def addProductAssetModels(self, *ProductAssetModels):
-        for obj in ProductAssetModels:
-            obj.GenericAssetModelOrMaterial = self
+        collection = self._ProductAssetModels
+        for obj in members(ProductAssetModels):
+            old = obj._GenericAssetModelOrMaterial
+            if old is not None and old is not self:
+                old._ProductAssetModels.discard(obj)
+            obj._GenericAssetModelOrMaterial = self
+            collection.append(obj)
 
     def removeProductAssetModels(self, *ProductAssetModels):
-        for obj in ProductAssetModels:
-            obj.GenericAssetModelOrMaterial = None
+        collection = self._ProductAssetModels
+        for obj in members(ProductAssetModels):
+            if obj._GenericAssetModelOrMaterial is self:
+                obj._GenericAssetModelOrMaterial = None
+                collection.discard(obj)
+
+    def removeAllProductAssetModels(self):
+        for obj in self._ProductAssetModels:
+            obj._GenericAssetModelOrMaterial = None
+        self._ProductAssetModels = RefList()
 
     def getErpInventoryIssues(self):
         
@@ -126,20 +151,32 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setErpInventoryIssues(self, value):
         for x in self._ErpInventoryIssues:
-            x.TypeAsset = None
-        for y in value:
-            y._TypeAsset = self
-        self._ErpInventoryIssues = value
+            x._TypeAsset = None
+        self._ErpInventoryIssues = RefList()
+        self.addErpInventoryIssues(value)
 
     ErpInventoryIssues = property(getErpInventoryIssues, setErpInventoryIssues)
 
     def addErpInventoryIssues(self, *ErpInventoryIssues):
-        for obj in ErpInventoryIssues:
-            obj.TypeAsset = self
+        collection = self._ErpInventoryIssues
+        for obj in members(ErpInventoryIssues):
+            old = obj._TypeAsset
+            if old is not None and old is not self:
+                old._ErpInventoryIssues.discard(obj)
+            obj._TypeAsset = self
+            collection.append(obj)
 
     def removeErpInventoryIssues(self, *ErpInventoryIssues):
-        for obj in ErpInventoryIssues:
-            obj.TypeAsset = None
+        collection = self._ErpInventoryIssues
+        for obj in members(ErpInventoryIssues):
+            if obj._TypeAsset is self:
+                obj._TypeAsset = None
+                collection.discard(obj)
+
+    def removeAllErpInventoryIssues(self):
+        for obj in self._ErpInventoryIssues:
+            obj._TypeAsset = None
+        self._ErpInventoryIssues = RefList()
 
     def getCUWorkEquipmentAsset(self):
         
@@ -162,8 +199,7 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setTypeAssetCatalogue(self, value):
         if self._TypeAssetCatalogue is not None:
-            filtered = [x for x in self.TypeAssetCatalogue.TypeAssets if x != self]
-            self._TypeAssetCatalogue._TypeAssets = filtered
+            self._TypeAssetCatalogue._TypeAssets.discard(self)
 
         self._TypeAssetCatalogue = value
         if self._TypeAssetCatalogue is not None:
@@ -193,18 +229,30 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setErpBomItemDatas(self, value):
         for x in self._ErpBomItemDatas:
-            x.TypeAsset = None
-        for y in value:
-            y._TypeAsset = self
-        self._ErpBomItemDatas = value
+            x._TypeAsset = None
+        self._ErpBomItemDatas = RefList()
+        self.addErpBomItemDatas(value)
 
     ErpBomItemDatas = property(getErpBomItemDatas, setErpBomItemDatas)
 
     def addErpBomItemDatas(self, *ErpBomItemDatas):
-        for obj in ErpBomItemDatas:
-            obj.TypeAsset = self
+        collection = self._ErpBomItemDatas
+        for obj in members(ErpBomItemDatas):
+            old = obj._TypeAsset
+            if old is not None and old is not self:
+                old._ErpBomItemDatas.discard(obj)
+            obj._TypeAsset = self
+            collection.append(obj)
 
     def removeErpBomItemDatas(self, *ErpBomItemDatas):
-        for obj in ErpBomItemDatas:
-            obj.TypeAsset = None
+        collection = self._ErpBomItemDatas
+        for obj in members(ErpBomItemDatas):
+            if obj._TypeAsset is self:
+                obj._TypeAsset = None
+                collection.discard(obj)
+
+    def removeAllErpBomItemDatas(self):
+        for obj in self._ErpBomItemDatas:
+            obj._TypeAsset = None
+        self._ErpBomItemDatas = RefList()
 
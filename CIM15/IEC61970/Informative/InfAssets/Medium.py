@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Medium(IdentifiedObject):
     """A substance that either (1) provides the means of transmission of a force or effect, such as hydraulic fluid, or (2) is used for a surrounding or enveloping substance, such as oil in a transformer or circuit breaker.A substance that either (1) provides the means of transmission of a force or effect, such as hydraulic fluid, or (2) is used for a surrounding or enveloping substance, such as oil in a transformer or circuit breaker.
@@ -41,7 +42,7 @@ class Medium(IdentifiedObject):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         super(Medium, self).__init__(*args, **kw_args)
@@ -59,8 +60,7 @@ class Medium(IdentifiedObject):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.Mediums if x != self]
-            self._Specification._Mediums = filtered
+            self._Specification._Mediums.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
@@ -75,24 +75,26 @@ class Medium(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.Mediums if q != self]
-            self._Assets._Mediums = filtered
-        for r in value:
-            if self not in r._Mediums:
-                r._Mediums.append(self)
-        self._Assets = value
+            p._Mediums.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._Mediums:
-                obj._Mediums.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._Mediums.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._Mediums:
-                obj._Mediums.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._Mediums.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._Mediums.discard(self)
+        self._Assets = RefList()
 
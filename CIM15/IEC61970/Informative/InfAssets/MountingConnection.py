@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MountingConnection(IdentifiedObject):
     """A structure can have multiple connection points for electrical connections (e.g. line) each with multiple mounting points, one for each phase. e.g. a Tower may have three Connections, two with three mounting points, one for each phase and a third with a single mounting point for the neutral line. A pole, on the other hand, may have a single Connection with one, two or three mounting points depending on whether it is carrying 1,2 or 3 phases.A structure can have multiple connection points for electrical connections (e.g. line) each with multiple mounting points, one for each phase. e.g. a Tower may have three Connections, two with three mounting points, one for each phase and a third with a single mounting point for the neutral line. A pole, on the other hand, may have a single Connection with one, two or three mounting points depending on whether it is carrying 1,2 or 3 phases.
@@ -30,10 +31,10 @@ class MountingConnection(IdentifiedObject):
         @param StructureInfos:
         @param MountingPoints:
         """
-        self._StructureInfos = []
+        self._StructureInfos = RefList()
         self.StructureInfos = [] if StructureInfos is None else StructureInfos
 
-        self._MountingPoints = []
+        self._MountingPoints = RefList()
         self.MountingPoints = [] if MountingPoints is None else MountingPoints
 
         super(MountingConnection, self).__init__(*args, **kw_args)
@@ -51,26 +52,28 @@ class MountingConnection(IdentifiedObject):
 
     def setStructureInfos(self, value):
         for p in self._StructureInfos:
-            filtered = [q for q in p.MountingConnections if q != self]
-            self._StructureInfos._MountingConnections = filtered
-        for r in value:
-            if self not in r._MountingConnections:
-                r._MountingConnections.append(self)
-        self._StructureInfos = value
+            p._MountingConnections.discard(self)
+        self._StructureInfos = RefList()
+        self.addStructureInfos(value)
 
     StructureInfos = property(getStructureInfos, setStructureInfos)
 
     def addStructureInfos(self, *StructureInfos):
-        for obj in StructureInfos:
-            if self not in obj._MountingConnections:
-                obj._MountingConnections.append(self)
-            self._StructureInfos.append(obj)
+        collection = self._StructureInfos
+        for obj in members(StructureInfos):
+            obj._MountingConnections.append(self)
+            collection.append(obj)
 
     def removeStructureInfos(self, *StructureInfos):
-        for obj in StructureInfos:
-            if self in obj._MountingConnections:
-                obj._MountingConnections.remove(self)
-            self._StructureInfos.remove(obj)
+        collection = self._StructureInfos
+        for obj in members(StructureInfos):
+            obj._MountingConnections.discard(self)
+            collection.discard(obj)
+
+    def removeAllStructureInfos(self):
+        for obj in self._StructureInfos:
+            obj._MountingConnections.discard(self)
+        self._StructureInfos = RefList()
 
     def getMountingPoints(self):
         
@@ -78,24 +81,26 @@ class MountingConnection(IdentifiedObject):
 
     def setMountingPoints(self, value):
         for p in self._MountingPoints:
-            filtered = [q for q in p.Connections if q != self]
-            self._MountingPoints._Connections = filtered
-        for r in value:
-            if self not in r._Connections:
-                r._Connections.append(self)
-        self._MountingPoints = value
+            p._Connections.discard(self)
+        self._MountingPoints = RefList()
+        self.addMountingPoints(value)
 
     MountingPoints = property(getMountingPoints, setMountingPoints)
 
     def addMountingPoints(self, *MountingPoints):
-        for obj in MountingPoints:
-            if self not in obj._Connections:
-                obj._Connections.append(self)
-            self._MountingPoints.append(obj)
+        collection = self._MountingPoints
+        for obj in members(MountingPoints):
+            obj._Connections.append(self)
+            collection.append(obj)
 
     def removeMountingPoints(self, *MountingPoints):
-        for obj in MountingPoints:
-            if self in obj._Connections:
-                obj._Connections.remove(self)
-            self._MountingPoints.remove(obj)
+        collection = self._MountingPoints
+        for obj in members(MountingPoints):
+            obj._Connections.discard(self)
+            collection.discard(obj)
+
+    def removeAllMountingPoints(self):
+        for obj in self._MountingPoints:
+            obj._Connections.discard(self)
+        self._MountingPoints = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MountingPoint(IdentifiedObject):
     """Point on a structure that a connection may have a conductor connected to. Defined with an x and y coordinate plus a phase. A connection may have multiple mounting points, one for each phase.Point on a structure that a connection may have a conductor connected to. Defined with an x and y coordinate plus a phase. A connection may have multiple mounting points, one for each phase.
@@ -42,10 +43,10 @@ class MountingPoint(IdentifiedObject):
 
         self.yCoord = yCoord
 
-        self._Connections = []
+        self._Connections = RefList()
         self.Connections = [] if Connections is None else Connections
 
-        self._OverheadConductors = []
+        self._OverheadConductors = RefList()
         self.OverheadConductors = [] if OverheadConductors is None else OverheadConductors
 
         super(MountingPoint, self).__init__(*args, **kw_args)
@@ -63,26 +64,28 @@ class MountingPoint(IdentifiedObject):
 
     def setConnections(self, value):
         for p in self._Connections:
-            filtered = [q for q in p.MountingPoints if q != self]
-            self._Connections._MountingPoints = filtered
-        for r in value:
-            if self not in r._MountingPoints:
-                r._MountingPoints.append(self)
-        self._Connections = value
+            p._MountingPoints.discard(self)
+        self._Connections = RefList()
+        self.addConnections(value)
 
     Connections = property(getConnections, setConnections)
 
     def addConnections(self, *Connections):
-        for obj in Connections:
-            if self not in obj._MountingPoints:
-                obj._MountingPoints.append(self)
-            self._Connections.append(obj)
+        collection = self._Connections
+        for obj in members(Connections):
+            obj._MountingPoints.append(self)
+            collection.append(obj)
 
     def removeConnections(self, *Connections):
-        for obj in Connections:
-            if self in obj._MountingPoints:
-                obj._MountingPoints.remove(self)
-            self._Connections.remove(obj)
+        collection = self._Connections
+        for obj in members(Connections):
+            obj._MountingPoints.discard(self)
+            collection.discard(obj)
+
+    def removeAllConnections(self):
+        for obj in self._Connections:
+            obj._MountingPoints.discard(self)
+        self._Connections = RefList()
 
     def getOverheadConductors(self):
         
@@ -90,18 +93,30 @@ class MountingPoint(IdentifiedObject):
 
     def setOverheadConductors(self, value):
         for x in self._OverheadConductors:
-            x.MountingPoint = None
-        for y in value:
-            y._MountingPoint = self
-        self._OverheadConductors = value
+            x._MountingPoint = None
+        self._OverheadConductors = RefList()
+        self.addOverheadConductors(value)
 
     OverheadConductors = property(getOverheadConductors, setOverheadConductors)
 
     def addOverheadConductors(self, *OverheadConductors):
-        for obj in OverheadConductors:
-            obj.MountingPoint = self
+        collection = self._OverheadConductors
+        for obj in members(OverheadConductors):
+            old = obj._MountingPoint
+            if old is not None and old is not self:
+                old._OverheadConductors.discard(obj)
+            obj._MountingPoint = self
+            collection.append(obj)
 
     def removeOverheadConductors(self, *OverheadConductors):
-        for obj in OverheadConductors:
-            obj.MountingPoint = None
+        collection = self._OverheadConductors
+        for obj in members(OverheadConductors):
+            if obj._MountingPoint is self:
+                obj._MountingPoint = None
+                collection.discard(obj)
+
+    def removeAllOverheadConductors(self):
+        for obj in self._OverheadConductors:
+            obj._MountingPoint = None
+        self._OverheadConductors = RefList()
 
@@ -55,8 +55,7 @@ class OrgAssetRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.AssetRoles if x != self]
-            self._ErpOrganisation._AssetRoles = filtered
+            self._ErpOrganisation._AssetRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
@@ -71,8 +70,7 @@ class OrgAssetRole(Role):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.ErpOrganisationRoles if x != self]
-            self._Asset._ErpOrganisationRoles = filtered
+            self._Asset._ErpOrganisationRoles.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
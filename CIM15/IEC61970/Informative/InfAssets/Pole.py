@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfAssets.Structure import Structure
+from PyCIM.RefList import RefList, members
 
 class Pole(Structure):
     """Pole asset.Pole asset.
@@ -73,7 +74,7 @@ class Pole(Structure):
         #: Date and time pole was last treated with preservative.
         self.treatedDateTime = treatedDateTime
 
-        self._Streetlights = []
+        self._Streetlights = RefList()
         self.Streetlights = [] if Streetlights is None else Streetlights
 
         super(Pole, self).__init__(*args, **kw_args)
@@ -92,18 +93,30 @@ class Pole(Structure):
 
     def setStreetlights(self, value):
         for x in self._Streetlights:
-            x.Pole = None
-        for y in value:
-            y._Pole = self
-        self._Streetlights = value
+            x._Pole = None
+        self._Streetlights = RefList()
+        self.addStreetlights(value)
 
     Streetlights = property(getStreetlights, setStreetlights)
 
     def addStreetlights(self, *Streetlights):
-        for obj in Streetlights:
-            obj.Pole = self
+        collection = self._Streetlights
+        for obj in members(Streetlights):
+            old = obj._Pole
+            if old is not None and old is not self:
+                old._Streetlights.discard(obj)
+            obj._Pole = self
+            collection.append(obj)
 
     def removeStreetlights(self, *Streetlights):
-        for obj in Streetlights:
-            obj.Pole = None
+        collection = self._Streetlights
+        for obj in members(Streetlights):
+            if obj._Pole is self:
+                obj._Pole = None
+                collection.discard(obj)
+
+    def removeAllStreetlights(self):
+        for obj in self._Streetlights:
+            obj._Pole = None
+        self._Streetlights = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class PotentialTransformerInfo(AssetInfo):
     """Properties of potential transformer asset.Properties of potential transformer asset.
@@ -47,7 +48,7 @@ class PotentialTransformerInfo(AssetInfo):
 
         self.tertiaryRatio = tertiaryRatio
 
-        self._PTs = []
+        self._PTs = RefList()
         self.PTs = [] if PTs is None else PTs
 
         self.secondaryRatio = secondaryRatio
@@ -76,20 +77,32 @@ class PotentialTransformerInfo(AssetInfo):
 
     def setPTs(self, value):
         for x in self._PTs:
-            x.PTInfo = None
-        for y in value:
-            y._PTInfo = self
-        self._PTs = value
+            x._PTInfo = None
+        self._PTs = RefList()
+        self.addPTs(value)
 
     PTs = property(getPTs, setPTs)
 
     def addPTs(self, *PTs):
-        for obj in PTs:
-            obj.PTInfo = self
+        collection = self._PTs
+        for obj in members(PTs):
+            old = obj._PTInfo
+            if old is not None and old is not self:
+                old._PTs.discard(obj)
+            obj._PTInfo = self
+            collection.append(obj)
 
     def removePTs(self, *PTs):
-        for obj in PTs:
-            obj.PTInfo = None
+        collection = self._PTs
+        for obj in members(PTs):
+            if obj._PTInfo is self:
+                obj._PTInfo = None
+                collection.discard(obj)
+
+    def removeAllPTs(self):
+        for obj in self._PTs:
+            obj._PTInfo = None
+        self._PTs = RefList()
 
     # Ratio for the secondary winding tap changer.
     secondaryRatio = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Procedure(Document):
     """A documented procedure for various types of Work or Work Tasks. One or more procedures guide a compatible unit, a standard way of performing a unit of work. The type of procedure is defined in Procedure.type. For example, when type=Inspection, this procedure coupled with Schedule and other information provides the key items of an inspection plan. Another type of Procedure is a Diagnosis. Note that each specific values and settings to be used in a procedure is intended to be described in an instance of ProcedureValue. A maintenance ticket, a type of Work, is generated whenever maintenance is determined to be needed as a result of an inspection or diagnosis.A documented procedure for various types of Work or Work Tasks. One or more procedures guide a compatible unit, a standard way of performing a unit of work. The type of procedure is defined in Procedure.type. For example, when type=Inspection, this procedure coupled with Schedule and other information provides the key items of an inspection plan. Another type of Procedure is a Diagnosis. Note that each specific values and settings to be used in a procedure is intended to be described in an instance of ProcedureValue. A maintenance ticket, a type of Work, is generated whenever maintenance is determined to be needed as a result of an inspection or diagnosis.
@@ -48,16 +49,16 @@ class Procedure(Document):
         #: The textual description of the procedure, which references instances of ProcedureValue as appropriate.
         self.instruction = instruction
 
-        self._ProcedureValues = []
+        self._ProcedureValues = RefList()
         self.ProcedureValues = [] if ProcedureValues is None else ProcedureValues
 
-        self._ProcedureDataSets = []
+        self._ProcedureDataSets = RefList()
         self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
-        self._Limits = []
+        self._Limits = RefList()
         self.Limits = [] if Limits is None else Limits
 
         super(Procedure, self).__init__(*args, **kw_args)
@@ -76,20 +77,32 @@ class Procedure(Document):
 
     def setProcedureValues(self, value):
         for x in self._ProcedureValues:
-            x.Procedure = None
-        for y in value:
-            y._Procedure = self
-        self._ProcedureValues = value
+            x._Procedure = None
+        self._ProcedureValues = RefList()
+        self.addProcedureValues(value)
 
     ProcedureValues = property(getProcedureValues, setProcedureValues)
 
     def addProcedureValues(self, *ProcedureValues):
-        for obj in ProcedureValues:
-            obj.Procedure = self
+        collection = self._ProcedureValues
+        for obj in members(ProcedureValues):
+            old = obj._Procedure
+            if old is not None and old is not self:
+                old._ProcedureValues.discard(obj)
+            obj._Procedure = self
+            collection.append(obj)
 
     def removeProcedureValues(self, *ProcedureValues):
-        for obj in ProcedureValues:
-            obj.Procedure = None
+        collection = self._ProcedureValues
+        for obj in members(ProcedureValues):
+            if obj._Procedure is self:
+                obj._Procedure = None
+                collection.discard(obj)
+
+    def removeAllProcedureValues(self):
+        for obj in self._ProcedureValues:
+            obj._Procedure = None
+        self._ProcedureValues = RefList()
 
     def getProcedureDataSets(self):
         
@@ -97,20 +110,32 @@ class Procedure(Document):
 
     def setProcedureDataSets(self, value):
         for x in self._ProcedureDataSets:
-            x.Procedure = None
-        for y in value:
-            y._Procedure = self
-        self._ProcedureDataSets = value
+            x._Procedure = None
+        self._ProcedureDataSets = RefList()
+        self.addProcedureDataSets(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            obj.Procedure = self
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            old = obj._Procedure
+            if old is not None and old is not self:
+                old._ProcedureDataSets.discard(obj)
+            obj._Procedure = self
+            collection.append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            obj.Procedure = None
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            if obj._Procedure is self:
+                obj._Procedure = None
+                collection.discard(obj)
+
+    def removeAllProcedureDataSets(self):
+        for obj in self._ProcedureDataSets:
+            obj._Procedure = None
+        self._ProcedureDataSets = RefList()
 
     def getCompatibleUnits(self):
         
@@ -118,26 +143,28 @@ class Procedure(Document):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.Procedures if q != self]
-            self._CompatibleUnits._Procedures = filtered
-        for r in value:
-            if self not in r._Procedures:
-                r._Procedures.append(self)
-        self._CompatibleUnits = value
+            p._Procedures.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._Procedures:
-                obj._Procedures.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._Procedures.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._Procedures:
-                obj._Procedures.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._Procedures.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._Procedures.discard(self)
+        self._CompatibleUnits = RefList()
 
     def getLimits(self):
         
@@ -145,24 +172,26 @@ class Procedure(Document):
 
     def setLimits(self, value):
         for p in self._Limits:
-            filtered = [q for q in p.Procedures if q != self]
-            self._Limits._Procedures = filtered
-        for r in value:
-            if self not in r._Procedures:
-                r._Procedures.append(self)
-        self._Limits = value
+            p._Procedures.discard(self)
+        self._Limits = RefList()
+        self.addLimits(value)
 
     Limits = property(getLimits, setLimits)
 
     def addLimits(self, *Limits):
-        for obj in Limits:
-            if self not in obj._Procedures:
-                obj._Procedures.append(self)
-            self._Limits.append(obj)
+        collection = self._Limits
+        for obj in members(Limits):
+            obj._Procedures.append(self)
+            collection.append(obj)
 
     def removeLimits(self, *Limits):
-        for obj in Limits:
-            if self in obj._Procedures:
-                obj._Procedures.remove(self)
-            self._Limits.remove(obj)
+        collection = self._Limits
+        for obj in members(Limits):
+            obj._Procedures.discard(self)
+            collection.discard(obj)
+
+    def removeAllLimits(self):
+        for obj in self._Limits:
+            obj._Procedures.discard(self)
+        self._Limits = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ProcedureDataSet(Document):
     """A data set recorded each time a procedure is executed. Observed results are captured in associated measurement values and/or values for properties relevant to the type of procedure performed.A data set recorded each time a procedure is executed. Observed results are captured in associated measurement values and/or values for properties relevant to the type of procedure performed.
@@ -36,16 +37,16 @@ class ProcedureDataSet(Document):
         #: Date and time procedure was completed.
         self.completedDateTime = completedDateTime
 
-        self._Properties = []
+        self._Properties = RefList()
         self.Properties = [] if Properties is None else Properties
 
-        self._TransformerObservations = []
+        self._TransformerObservations = RefList()
         self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
 
         self._Procedure = None
         self.Procedure = Procedure
 
-        self._MeasurementValues = []
+        self._MeasurementValues = RefList()
         self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
 
         super(ProcedureDataSet, self).__init__(*args, **kw_args)
@@ -64,26 +65,28 @@ class ProcedureDataSet(Document):
 
     def setProperties(self, value):
         for p in self._Properties:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._Properties._ProcedureDataSets = filtered
-        for r in value:
-            if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
-        self._Properties = value
+            p._ProcedureDataSets.discard(self)
+        self._Properties = RefList()
+        self.addProperties(value)
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
-        for obj in Properties:
-            if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._Properties.append(obj)
+        collection = self._Properties
+        for obj in members(Properties):
+            obj._ProcedureDataSets.append(self)
+            collection.append(obj)
 
     def removeProperties(self, *Properties):
-        for obj in Properties:
-            if self in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.remove(self)
-            self._Properties.remove(obj)
+        collection = self._Properties
+        for obj in members(Properties):
+            obj._ProcedureDataSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllProperties(self):
+        for obj in self._Properties:
+            obj._ProcedureDataSets.discard(self)
+        self._Properties = RefList()
 
     def getTransformerObservations(self):
         
@@ -91,26 +94,28 @@ class ProcedureDataSet(Document):
 
     def setTransformerObservations(self, value):
         for p in self._TransformerObservations:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._TransformerObservations._ProcedureDataSets = filtered
-        for r in value:
-            if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
-        self._TransformerObservations = value
+            p._ProcedureDataSets.discard(self)
+        self._TransformerObservations = RefList()
+        self.addTransformerObservations(value)
 
     TransformerObservations = property(getTransformerObservations, setTransformerObservations)
 
     def addTransformerObservations(self, *TransformerObservations):
-        for obj in TransformerObservations:
-            if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._TransformerObservations.append(obj)
+        collection = self._TransformerObservations
+        for obj in members(TransformerObservations):
+            obj._ProcedureDataSets.append(self)
+            collection.append(obj)
 
     def removeTransformerObservations(self, *TransformerObservations):
-        for obj in TransformerObservations:
-            if self in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.remove(self)
-            self._TransformerObservations.remove(obj)
+        collection = self._TransformerObservations
+        for obj in members(TransformerObservations):
+            obj._ProcedureDataSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllTransformerObservations(self):
+        for obj in self._TransformerObservations:
+            obj._ProcedureDataSets.discard(self)
+        self._TransformerObservations = RefList()
 
     def getProcedure(self):
         
@@ -118,8 +123,7 @@ class ProcedureDataSet(Document):
 
     def setProcedure(self, value):
         if self._Procedure is not None:
-            filtered = [x for x in self.Procedure.ProcedureDataSets if x != self]
-            self._Procedure._ProcedureDataSets = filtered
+            self._Procedure._ProcedureDataSets.discard(self)
 
         self._Procedure = value
         if self._Procedure is not None:
@@ -134,24 +138,26 @@ class ProcedureDataSet(Document):
 
     def setMeasurementValues(self, value):
         for p in self._MeasurementValues:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._MeasurementValues._ProcedureDataSets = filtered
-        for r in value:
-            if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
-        self._MeasurementValues = value
+            p._ProcedureDataSets.discard(self)
+        self._MeasurementValues = RefList()
+        self.addMeasurementValues(value)
 
     MeasurementValues = property(getMeasurementValues, setMeasurementValues)
 
     def addMeasurementValues(self, *MeasurementValues):
-        for obj in MeasurementValues:
-            if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._MeasurementValues.append(obj)
+        collection = self._MeasurementValues
+        for obj in members(MeasurementValues):
+            obj._ProcedureDataSets.append(self)
+            collection.append(obj)
 
     def removeMeasurementValues(self, *MeasurementValues):
-        for obj in MeasurementValues:
-            if self in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.remove(self)
-            self._MeasurementValues.remove(obj)
+        collection = self._MeasurementValues
+        for obj in members(MeasurementValues):
+            obj._ProcedureDataSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllMeasurementValues(self):
+        for obj in self._MeasurementValues:
+            obj._ProcedureDataSets.discard(self)
+        self._MeasurementValues = RefList()
 
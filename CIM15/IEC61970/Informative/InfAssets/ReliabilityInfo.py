@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ReliabilityInfo(IdentifiedObject):
     """Information regarding the experienced and expected reliability of a specific asset, type of asset, or asset model.Information regarding the experienced and expected reliability of a specific asset, type of asset, or asset model.
@@ -41,7 +42,7 @@ class ReliabilityInfo(IdentifiedObject):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         super(ReliabilityInfo, self).__init__(*args, **kw_args)
@@ -59,8 +60,7 @@ class ReliabilityInfo(IdentifiedObject):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.ReliabilityInfos if x != self]
-            self._Specification._ReliabilityInfos = filtered
+            self._Specification._ReliabilityInfos.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
@@ -75,24 +75,26 @@ class ReliabilityInfo(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ReliabilityInfos if q != self]
-            self._Assets._ReliabilityInfos = filtered
-        for r in value:
-            if self not in r._ReliabilityInfos:
-                r._ReliabilityInfos.append(self)
-        self._Assets = value
+            p._ReliabilityInfos.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._ReliabilityInfos:
-                obj._ReliabilityInfos.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ReliabilityInfos.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._ReliabilityInfos:
-                obj._ReliabilityInfos.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ReliabilityInfos.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._ReliabilityInfos.discard(self)
+        self._Assets = RefList()
 
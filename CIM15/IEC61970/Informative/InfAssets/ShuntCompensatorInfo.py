@@ -51,8 +51,7 @@ class ShuntCompensatorInfo(AssetInfo):
 
     def setShuntImpedanceInfo(self, value):
         if self._ShuntImpedanceInfo is not None:
-            filtered = [x for x in self.ShuntImpedanceInfo.ShuntCompensatorInfos if x != self]
-            self._ShuntImpedanceInfo._ShuntCompensatorInfos = filtered
+            self._ShuntImpedanceInfo._ShuntCompensatorInfos.discard(self)
 
         self._ShuntImpedanceInfo = value
         if self._ShuntImpedanceInfo is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class ShuntImpedanceInfo(AssetInfo):
     """Properties of a shunt impedance.Properties of a shunt impedance.
@@ -97,7 +98,7 @@ class ShuntImpedanceInfo(AssetInfo):
         #: True if the locally controlled capacitor has voltage override capability.
         self.localOverride = localOverride
 
-        self._ShuntCompensatorInfos = []
+        self._ShuntCompensatorInfos = RefList()
         self.ShuntCompensatorInfos = [] if ShuntCompensatorInfos is None else ShuntCompensatorInfos
 
         super(ShuntImpedanceInfo, self).__init__(*args, **kw_args)
@@ -115,18 +116,30 @@ class ShuntImpedanceInfo(AssetInfo):
 
     def setShuntCompensatorInfos(self, value):
         for x in self._ShuntCompensatorInfos:
-            x.ShuntImpedanceInfo = None
-        for y in value:
-            y._ShuntImpedanceInfo = self
-        self._ShuntCompensatorInfos = value
+            x._ShuntImpedanceInfo = None
+        self._ShuntCompensatorInfos = RefList()
+        self.addShuntCompensatorInfos(value)
 
     ShuntCompensatorInfos = property(getShuntCompensatorInfos, setShuntCompensatorInfos)
 
     def addShuntCompensatorInfos(self, *ShuntCompensatorInfos):
-        for obj in ShuntCompensatorInfos:
-            obj.ShuntImpedanceInfo = self
+        collection = self._ShuntCompensatorInfos
+        for obj in members(ShuntCompensatorInfos):
+            old = obj._ShuntImpedanceInfo
+            if old is not None and old is not self:
+                old._ShuntCompensatorInfos.discard(obj)
+            obj._ShuntImpedanceInfo = self
+            collection.append(obj)
 
     def removeShuntCompensatorInfos(self, *ShuntCompensatorInfos):
-        for obj in ShuntCompensatorInfos:
-            obj.ShuntImpedanceInfo = None
+        collection = self._ShuntCompensatorInfos
+        for obj in members(ShuntCompensatorInfos):
+            if obj._ShuntImpedanceInfo is self:
+                obj._ShuntImpedanceInfo = None
+                collection.discard(obj)
+
+    def removeAllShuntCompensatorInfos(self):
+        for obj in self._ShuntCompensatorInfos:
+            obj._ShuntImpedanceInfo = None
+        self._ShuntCompensatorInfos = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Specification(Document):
     """Specification can be used for various purposes relative to an asset, a logical device (PowerSystemResource), location, etc. Examples include documents supplied by manufacturers such as asset installation instructions, asset maintenance instructions, etc.Specification can be used for various purposes relative to an asset, a logical device (PowerSystemResource), location, etc. Examples include documents supplied by manufacturers such as asset installation instructions, asset maintenance instructions, etc.
@@ -35,25 +36,25 @@ class Specification(Document):
         @param Ratings: UserAttributes used to specify ratings of the asset covered by this specification. Ratings also can be used to set the initial value of operational measurement limits. Use 'name' to specify what kind of rating it is (e.g., voltage, current), and 'value' attribute for the actual value and unit information of the rating.
         @param QualificationRequirements:
         """
-        self._AssetPropertyCurves = []
+        self._AssetPropertyCurves = RefList()
         self.AssetPropertyCurves = [] if AssetPropertyCurves is None else AssetPropertyCurves
 
-        self._Mediums = []
+        self._Mediums = RefList()
         self.Mediums = [] if Mediums is None else Mediums
 
-        self._AssetProperites = []
+        self._AssetProperites = RefList()
         self.AssetProperites = [] if AssetProperites is None else AssetProperites
 
-        self._ReliabilityInfos = []
+        self._ReliabilityInfos = RefList()
         self.ReliabilityInfos = [] if ReliabilityInfos is None else ReliabilityInfos
 
-        self._DimensionsInfos = []
+        self._DimensionsInfos = RefList()
         self.DimensionsInfos = [] if DimensionsInfos is None else DimensionsInfos
 
-        self._Ratings = []
+        self._Ratings = RefList()
         self.Ratings = [] if Ratings is None else Ratings
 
-        self._QualificationRequirements = []
+        self._QualificationRequirements = RefList()
         self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
 
         super(Specification, self).__init__(*args, **kw_args)
@@ -71,20 +72,32 @@ class Specification(Document):
 
     def setAssetPropertyCurves(self, value):
         for x in self._AssetPropertyCurves:
-            x.Specification = None
-        for y in value:
-            y._Specification = self
-        self._AssetPropertyCurves = value
+            x._Specification = None
+        self._AssetPropertyCurves = RefList()
+        self.addAssetPropertyCurves(value)
 
     AssetPropertyCurves = property(getAssetPropertyCurves, setAssetPropertyCurves)
 
     def addAssetPropertyCurves(self, *AssetPropertyCurves):
-        for obj in AssetPropertyCurves:
-            obj.Specification = self
+        collection = self._AssetPropertyCurves
+        for obj in members(AssetPropertyCurves):
+            old = obj._Specification
+            if old is not None and old is not self:
+                old._AssetPropertyCurves.discard(obj)
+            obj._Specification = self
+            collection.append(obj)
 
     def removeAssetPropertyCurves(self, *AssetPropertyCurves):
-        for obj in AssetPropertyCurves:
-            obj.Specification = None
+        collection = self._AssetPropertyCurves
+        for obj in members(AssetPropertyCurves):
+            if obj._Specification is self:
+                obj._Specification = None
+                collection.discard(obj)
+
+    def removeAllAssetPropertyCurves(self):
+        for obj in self._AssetPropertyCurves:
+            obj._Specification = None
+        self._AssetPropertyCurves = RefList()
 
     def getMediums(self):
         
@@ -92,20 +105,32 @@ class Specification(Document):
 
     def setMediums(self, value):
         for x in self._Mediums:
-            x.Specification = None
-        for y in value:
-            y._Specification = self
-        self._Mediums = value
+            x._Specification = None
+        self._Mediums = RefList()
+        self.addMediums(value)
 
     Mediums = property(getMediums, setMediums)
 
     def addMediums(self, *Mediums):
-        for obj in Mediums:
-            obj.Specification = self
+        collection = self._Mediums
+        for obj in members(Mediums):
+            old = obj._Specification
+            if old is not None and old is not self:
+                old._Mediums.discard(obj)
+            obj._Specification = self
+            collection.append(obj)
 
     def removeMediums(self, *Mediums):
-        for obj in Mediums:
-            obj.Specification = None
+        collection = self._Mediums
+        for obj in members(Mediums):
+            if obj._Specification is self:
+                obj._Specification = None
+                collection.discard(obj)
+
+    def removeAllMediums(self):
+        for obj in self._Mediums:
+            obj._Specification = None
+        self._Mediums = RefList()
 
     def getAssetProperites(self):
         """UserAttributes used to specify further properties of the asset covered with this specification. Use 'name' to specify what kind of property it is, and 'value.value' attribute for the actual value.
@@ -114,20 +139,32 @@ class Specification(Document):
 
     def setAssetProperites(self, value):
         for x in self._AssetProperites:
-            x.PropertySpecification = None
-        for y in value:
-            y._PropertySpecification = self
-        self._AssetProperites = value
+            x._PropertySpecification = None
+        self._AssetProperites = RefList()
+        self.addAssetProperites(value)
 
     AssetProperites = property(getAssetProperites, setAssetProperites)
 
     def addAssetProperites(self, *AssetProperites):
-        for obj in AssetProperites:
-            obj.PropertySpecification = self
+        collection = self._AssetProperites
+        for obj in members(AssetProperites):
+            old = obj._PropertySpecification
+            if old is not None and old is not self:
+                old._AssetProperites.discard(obj)
+            obj._PropertySpecification = self
+            collection.append(obj)
 
     def removeAssetProperites(self, *AssetProperites):
-        for obj in AssetProperites:
-            obj.PropertySpecification = None
+        collection = self._AssetProperites
+        for obj in members(AssetProperites):
+            if obj._PropertySpecification is self:
+                obj._PropertySpecification = None
+                collection.discard(obj)
+
+    def removeAllAssetProperites(self):
+        for obj in self._AssetProperites:
+            obj._PropertySpecification = None
+        self._AssetProperites = RefList()
 
     def getReliabilityInfos(self):
         
@@ -135,20 +172,32 @@ class Specification(Document):
 
     def setReliabilityInfos(self, value):
         for x in self._ReliabilityInfos:
-            x.Specification = None
-        for y in value:
-            y._Specification = self
-        self._ReliabilityInfos = value
+            x._Specification = None
+        self._ReliabilityInfos = RefList()
+        self.addReliabilityInfos(value)
 
     ReliabilityInfos = property(getReliabilityInfos, setReliabilityInfos)
 
     def addReliabilityInfos(self, *ReliabilityInfos):
-        for obj in ReliabilityInfos:
-            obj.Specification = self
+        collection = self._ReliabilityInfos
+        for obj in members(ReliabilityInfos):
+            old = obj._Specification
+            if old is not None and old is not self:
+                old._ReliabilityInfos.discard(obj)
+            obj._Specification = self
+            collection.append(obj)
 
     def removeReliabilityInfos(self, *ReliabilityInfos):
-        for obj in ReliabilityInfos:
-            obj.Specification = None
+        collection = self._ReliabilityInfos
+        for obj in members(ReliabilityInfos):
+            if obj._Specification is self:
+                obj._Specification = None
+                collection.discard(obj)
+
+    def removeAllReliabilityInfos(self):
+        for obj in self._ReliabilityInfos:
+            obj._Specification = None
+        self._ReliabilityInfos = RefList()
 
     def getDimensionsInfos(self):
         
@@ -156,26 +205,28 @@ class Specification(Document):
 
     def setDimensionsInfos(self, value):
         for p in self._DimensionsInfos:
-            filtered = [q for q in p.Specifications if q != self]
-            self._DimensionsInfos._Specifications = filtered
-        for r in value:
-            if self not in r._Specifications:
-                r._Specifications.append(self)
-        self._DimensionsInfos = value
+            p._Specifications.discard(self)
+        self._DimensionsInfos = RefList()
+        self.addDimensionsInfos(value)
 
     DimensionsInfos = property(getDimensionsInfos, setDimensionsInfos)
 
     def addDimensionsInfos(self, *DimensionsInfos):
-        for obj in DimensionsInfos:
-            if self not in obj._Specifications:
-                obj._Specifications.append(self)
-            self._DimensionsInfos.append(obj)
+        collection = self._DimensionsInfos
+        for obj in members(DimensionsInfos):
+            obj._Specifications.append(self)
+            collection.append(obj)
 
     def removeDimensionsInfos(self, *DimensionsInfos):
-        for obj in DimensionsInfos:
-            if self in obj._Specifications:
-                obj._Specifications.remove(self)
-            self._DimensionsInfos.remove(obj)
+        collection = self._DimensionsInfos
+        for obj in members(DimensionsInfos):
+            obj._Specifications.discard(self)
+            collection.discard(obj)
+
+    def removeAllDimensionsInfos(self):
+        for obj in self._DimensionsInfos:
+            obj._Specifications.discard(self)
+        self._DimensionsInfos = RefList()
 
     def getRatings(self):
         """UserAttributes used to specify ratings of the asset covered by this specification. Ratings also can be used to set the initial value of operational measurement limits. Use 'name' to specify what kind of rating it is (e.g., voltage, current), and 'value' attribute for the actual value and unit information of the rating.
@@ -184,20 +235,32 @@ class Specification(Document):
 
     def setRatings(self, value):
         for x in self._Ratings:
-            x.RatingSpecification = None
-        for y in value:
-            y._RatingSpecification = self
-        self._Ratings = value
+            x._RatingSpecification = None
+        self._Ratings = RefList()
+        self.addRatings(value)
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
-        for obj in Ratings:
-            obj.RatingSpecification = self
+        collection = self._Ratings
+        for obj in members(Ratings):
+            old = obj._RatingSpecification
+            if old is not None and old is not self:
+                old._Ratings.discard(obj)
+            obj._RatingSpecification = self
+            collection.append(obj)
 
     def removeRatings(self, *Ratings):
-        for obj in Ratings:
-            obj.RatingSpecification = None
+        collection = self._Ratings
+        for obj in members(Ratings):
+            if obj._RatingSpecification is self:
+                obj._RatingSpecification = None
+                collection.discard(obj)
+
+    def removeAllRatings(self):
+        for obj in self._Ratings:
+            obj._RatingSpecification = None
+        self._Ratings = RefList()
 
     def getQualificationRequirements(self):
         
@@ -205,24 +268,26 @@ class Specification(Document):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.Specifications if q != self]
-            self._QualificationRequirements._Specifications = filtered
-        for r in value:
-            if self not in r._Specifications:
-                r._Specifications.append(self)
-        self._QualificationRequirements = value
+            p._Specifications.discard(self)
+        self._QualificationRequirements = RefList()
+        self.addQualificationRequirements(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self not in obj._Specifications:
-                obj._Specifications.append(self)
-            self._QualificationRequirements.append(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._Specifications.append(self)
+            collection.append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self in obj._Specifications:
-                obj._Specifications.remove(self)
-            self._QualificationRequirements.remove(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._Specifications.discard(self)
+            collection.discard(obj)
+
+    def removeAllQualificationRequirements(self):
+        for obj in self._QualificationRequirements:
+            obj._Specifications.discard(self)
+        self._QualificationRequirements = RefList()
 
@@ -60,8 +60,7 @@ class Streetlight(Asset):
 
     def setPole(self, value):
         if self._Pole is not None:
-            filtered = [x for x in self.Pole.Streetlights if x != self]
-            self._Pole._Streetlights = filtered
+            self._Pole._Streetlights.discard(self)
 
         self._Pole = value
         if self._Pole is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from PyCIM.RefList import RefList, members
 
 class Structure(AssetContainer):
     """Construction holding assets such as conductors, transformers, switchgear, etc.Construction holding assets such as conductors, transformers, switchgear, etc.
@@ -58,10 +59,10 @@ class Structure(AssetContainer):
         #: Material this structure is made of. Values are: "wood", "concrete", "steel", "other"
         self.materialKind = materialKind
 
-        self._StructureSupportInfos = []
+        self._StructureSupportInfos = RefList()
         self.StructureSupportInfos = [] if StructureSupportInfos is None else StructureSupportInfos
 
-        self._MountingConnections = []
+        self._MountingConnections = RefList()
         self.MountingConnections = [] if MountingConnections is None else MountingConnections
 
         super(Structure, self).__init__(*args, **kw_args)
@@ -79,20 +80,32 @@ class Structure(AssetContainer):
 
     def setStructureSupportInfos(self, value):
         for x in self._StructureSupportInfos:
-            x.SecuredStructure = None
-        for y in value:
-            y._SecuredStructure = self
-        self._StructureSupportInfos = value
+            x._SecuredStructure = None
+        self._StructureSupportInfos = RefList()
+        self.addStructureSupportInfos(value)
 
     StructureSupportInfos = property(getStructureSupportInfos, setStructureSupportInfos)
 
     def addStructureSupportInfos(self, *StructureSupportInfos):
-        for obj in StructureSupportInfos:
-            obj.SecuredStructure = self
+        collection = self._StructureSupportInfos
+        for obj in members(StructureSupportInfos):
+            old = obj._SecuredStructure
+            if old is not None and old is not self:
+                old._StructureSupportInfos.discard(obj)
+            obj._SecuredStructure = self
+            collection.append(obj)
 
     def removeStructureSupportInfos(self, *StructureSupportInfos):
-        for obj in StructureSupportInfos:
-            obj.SecuredStructure = None
+        collection = self._StructureSupportInfos
+        for obj in members(StructureSupportInfos):
+            if obj._SecuredStructure is self:
+                obj._SecuredStructure = None
+                collection.discard(obj)
+
+    def removeAllStructureSupportInfos(self):
+        for obj in self._StructureSupportInfos:
+            obj._SecuredStructure = None
+        self._StructureSupportInfos = RefList()
 
     def getMountingConnections(self):
         
@@ -100,24 +113,26 @@ class Structure(AssetContainer):
 
     def setMountingConnections(self, value):
         for p in self._MountingConnections:
-            filtered = [q for q in p.StructureInfos if q != self]
-            self._MountingConnections._StructureInfos = filtered
-        for r in value:
-            if self not in r._StructureInfos:
-                r._StructureInfos.append(self)
-        self._MountingConnections = value
+            p._StructureInfos.discard(self)
+        self._MountingConnections = RefList()
+        self.addMountingConnections(value)
 
     MountingConnections = property(getMountingConnections, setMountingConnections)
 
     def addMountingConnections(self, *MountingConnections):
-        for obj in MountingConnections:
-            if self not in obj._StructureInfos:
-                obj._StructureInfos.append(self)
-            self._MountingConnections.append(obj)
+        collection = self._MountingConnections
+        for obj in members(MountingConnections):
+            obj._StructureInfos.append(self)
+            collection.append(obj)
 
     def removeMountingConnections(self, *MountingConnections):
-        for obj in MountingConnections:
-            if self in obj._StructureInfos:
-                obj._StructureInfos.remove(self)
-            self._MountingConnections.remove(obj)
+        collection = self._MountingConnections
+        for obj in members(MountingConnections):
+            obj._StructureInfos.discard(self)
+            collection.discard(obj)
+
+    def removeAllMountingConnections(self):
+        for obj in self._MountingConnections:
+            obj._StructureInfos.discard(self)
+        self._MountingConnections = RefList()
 
@@ -75,8 +75,7 @@ class StructureSupport(Asset):
 
     def setSecuredStructure(self, value):
         if self._SecuredStructure is not None:
-            filtered = [x for x in self.SecuredStructure.StructureSupportInfos if x != self]
-            self._SecuredStructure._StructureSupportInfos = filtered
+            self._SecuredStructure._StructureSupportInfos.discard(self)
 
         self._SecuredStructure = value
         if self._SecuredStructure is not None:
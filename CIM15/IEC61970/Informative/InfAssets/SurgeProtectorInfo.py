@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from PyCIM.RefList import RefList, members
 
 class SurgeProtectorInfo(AssetInfo):
     """Properties of surge protector asset.Properties of surge protector asset.
@@ -45,7 +46,7 @@ class SurgeProtectorInfo(AssetInfo):
 
         self.maxEnergyAbsorption = maxEnergyAbsorption
 
-        self._SurgeProtectors = []
+        self._SurgeProtectors = RefList()
         self.SurgeProtectors = [] if SurgeProtectors is None else SurgeProtectors
 
         super(SurgeProtectorInfo, self).__init__(*args, **kw_args)
@@ -64,18 +65,30 @@ class SurgeProtectorInfo(AssetInfo):
 
     def setSurgeProtectors(self, value):
         for x in self._SurgeProtectors:
-            x.SurgeProtectorInfo = None
-        for y in value:
-            y._SurgeProtectorInfo = self
-        self._SurgeProtectors = value
+            x._SurgeProtectorInfo = None
+        self._SurgeProtectors = RefList()
+        self.addSurgeProtectors(value)
 
     SurgeProtectors = property(getSurgeProtectors, setSurgeProtectors)
 
     def addSurgeProtectors(self, *SurgeProtectors):
-        for obj in SurgeProtectors:
-            obj.SurgeProtectorInfo = self
+        collection = self._SurgeProtectors
+        for obj in members(SurgeProtectors):
+            old = obj._SurgeProtectorInfo
+            if old is not None and old is not self:
+                old._SurgeProtectors.discard(obj)
+            obj._SurgeProtectorInfo = self
+            collection.append(obj)
 
     def removeSurgeProtectors(self, *SurgeProtectors):
-        for obj in SurgeProtectors:
-            obj.SurgeProtectorInfo = None
+        collection = self._SurgeProtectors
+        for obj in members(SurgeProtectors):
+            if obj._SurgeProtectorInfo is self:
+                obj._SurgeProtectorInfo = None
+                collection.discard(obj)
+
+    def removeAllSurgeProtectors(self):
+        for obj in self._SurgeProtectors:
+            obj._SurgeProtectorInfo = None
+        self._SurgeProtectors = RefList()
 
@@ -51,8 +51,7 @@ class Tool(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Tools if x != self]
-            self._Crew._Tools = filtered
+            self._Crew._Tools.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from PyCIM.RefList import RefList, members
 
 class TransformerAsset(Asset):
     """A specific physical (vs. logical) transformer.A specific physical (vs. logical) transformer.
@@ -36,10 +37,10 @@ class TransformerAsset(Asset):
         #: Date and time this asset was last reconditioned or had a major overhaul.
         self.reconditionedDateTime = reconditionedDateTime
 
-        self._PowerRatings = []
+        self._PowerRatings = RefList()
         self.PowerRatings = [] if PowerRatings is None else PowerRatings
 
-        self._TransformerObservations = []
+        self._TransformerObservations = RefList()
         self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
 
         self._TransformerInfo = None
@@ -63,26 +64,28 @@ class TransformerAsset(Asset):
 
     def setPowerRatings(self, value):
         for p in self._PowerRatings:
-            filtered = [q for q in p.TransformerAssets if q != self]
-            self._PowerRatings._TransformerAssets = filtered
-        for r in value:
-            if self not in r._TransformerAssets:
-                r._TransformerAssets.append(self)
-        self._PowerRatings = value
+            p._TransformerAssets.discard(self)
+        self._PowerRatings = RefList()
+        self.addPowerRatings(value)
 
     PowerRatings = property(getPowerRatings, setPowerRatings)
 
     def addPowerRatings(self, *PowerRatings):
-        for obj in PowerRatings:
-            if self not in obj._TransformerAssets:
-                obj._TransformerAssets.append(self)
-            self._PowerRatings.append(obj)
+        collection = self._PowerRatings
+        for obj in members(PowerRatings):
+            obj._TransformerAssets.append(self)
+            collection.append(obj)
 
     def removePowerRatings(self, *PowerRatings):
-        for obj in PowerRatings:
-            if self in obj._TransformerAssets:
-                obj._TransformerAssets.remove(self)
-            self._PowerRatings.remove(obj)
+        collection = self._PowerRatings
+        for obj in members(PowerRatings):
+            obj._TransformerAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerRatings(self):
+        for obj in self._PowerRatings:
+            obj._TransformerAssets.discard(self)
+        self._PowerRatings = RefList()
 
     def getTransformerObservations(self):
         
@@ -90,20 +93,32 @@ class TransformerAsset(Asset):
 
     def setTransformerObservations(self, value):
         for x in self._TransformerObservations:
-            x.TransformerAsset = None
-        for y in value:
-            y._TransformerAsset = self
-        self._TransformerObservations = value
+            x._TransformerAsset = None
+        self._TransformerObservations = RefList()
+        self.addTransformerObservations(value)
 
     TransformerObservations = property(getTransformerObservations, setTransformerObservations)
 
     def addTransformerObservations(self, *TransformerObservations):
-        for obj in TransformerObservations:
-            obj.TransformerAsset = self
+        collection = self._TransformerObservations
+        for obj in members(TransformerObservations):
+            old = obj._TransformerAsset
+            if old is not None and old is not self:
+                old._TransformerObservations.discard(obj)
+            obj._TransformerAsset = self
+            collection.append(obj)
 
     def removeTransformerObservations(self, *TransformerObservations):
-        for obj in TransformerObservations:
-            obj.TransformerAsset = None
+        collection = self._TransformerObservations
+        for obj in members(TransformerObservations):
+            if obj._TransformerAsset is self:
+                obj._TransformerAsset = None
+                collection.discard(obj)
+
+    def removeAllTransformerObservations(self):
+        for obj in self._TransformerObservations:
+            obj._TransformerAsset = None
+        self._TransformerObservations = RefList()
 
     def getTransformerInfo(self):
         
@@ -111,8 +126,7 @@ class TransformerAsset(Asset):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.TransformerAssets if x != self]
-            self._TransformerInfo._TransformerAssets = filtered
+            self._TransformerInfo._TransformerAssets.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
@@ -127,8 +141,7 @@ class TransformerAsset(Asset):
 
     def setTransformerAssetModel(self, value):
         if self._TransformerAssetModel is not None:
-            filtered = [x for x in self.TransformerAssetModel.TransformerAssets if x != self]
-            self._TransformerAssetModel._TransformerAssets = filtered
+            self._TransformerAssetModel._TransformerAssets.discard(self)
 
         self._TransformerAssetModel = value
         if self._TransformerAssetModel is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerObservation(IdentifiedObject):
     """Common information captured during transformer inspections and/or diagnostics. Note that some properties may be measured through other means and therefore have measurement values in addition to the observed values recorded here.Common information captured during transformer inspections and/or diagnostics. Note that some properties may be measured through other means and therefore have measurement values in addition to the observed values recorded here.
@@ -86,10 +87,10 @@ class TransformerObservation(IdentifiedObject):
         #: Pump vibration, with typical values being: nominal, high.
         self.pumpVibration = pumpVibration
 
-        self._BushingInsultationPFs = []
+        self._BushingInsultationPFs = RefList()
         self.BushingInsultationPFs = [] if BushingInsultationPFs is None else BushingInsultationPFs
 
-        self._ProcedureDataSets = []
+        self._ProcedureDataSets = RefList()
         self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
 
         self._Transformer = None
@@ -97,7 +98,7 @@ class TransformerObservation(IdentifiedObject):
 
         self.status = status
 
-        self._WindingInsulationPFs = []
+        self._WindingInsulationPFs = RefList()
         self.WindingInsulationPFs = [] if WindingInsulationPFs is None else WindingInsulationPFs
 
         self._TransformerAsset = None
@@ -118,20 +119,32 @@ class TransformerObservation(IdentifiedObject):
 
     def setBushingInsultationPFs(self, value):
         for x in self._BushingInsultationPFs:
-            x.TransformerObservation = None
-        for y in value:
-            y._TransformerObservation = self
-        self._BushingInsultationPFs = value
+            x._TransformerObservation = None
+        self._BushingInsultationPFs = RefList()
+        self.addBushingInsultationPFs(value)
 
     BushingInsultationPFs = property(getBushingInsultationPFs, setBushingInsultationPFs)
 
     def addBushingInsultationPFs(self, *BushingInsultationPFs):
-        for obj in BushingInsultationPFs:
-            obj.TransformerObservation = self
+        collection = self._BushingInsultationPFs
+        for obj in members(BushingInsultationPFs):
+            old = obj._TransformerObservation
+            if old is not None and old is not self:
+                old._BushingInsultationPFs.discard(obj)
+            obj._TransformerObservation = self
+            collection.append(obj)
 
     def removeBushingInsultationPFs(self, *BushingInsultationPFs):
-        for obj in BushingInsultationPFs:
-            obj.TransformerObservation = None
+        collection = self._BushingInsultationPFs
+        for obj in members(BushingInsultationPFs):
+            if obj._TransformerObservation is self:
+                obj._TransformerObservation = None
+                collection.discard(obj)
+
+    def removeAllBushingInsultationPFs(self):
+        for obj in self._BushingInsultationPFs:
+            obj._TransformerObservation = None
+        self._BushingInsultationPFs = RefList()
 
     def getProcedureDataSets(self):
         
@@ -139,26 +152,28 @@ class TransformerObservation(IdentifiedObject):
 
     def setProcedureDataSets(self, value):
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.TransformerObservations if q != self]
-            self._ProcedureDataSets._TransformerObservations = filtered
-        for r in value:
-            if self not in r._TransformerObservations:
-                r._TransformerObservations.append(self)
-        self._ProcedureDataSets = value
+            p._TransformerObservations.discard(self)
+        self._ProcedureDataSets = RefList()
+        self.addProcedureDataSets(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            if self not in obj._TransformerObservations:
-                obj._TransformerObservations.append(self)
-            self._ProcedureDataSets.append(obj)
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            obj._TransformerObservations.append(self)
+            collection.append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            if self in obj._TransformerObservations:
-                obj._TransformerObservations.remove(self)
-            self._ProcedureDataSets.remove(obj)
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            obj._TransformerObservations.discard(self)
+            collection.discard(obj)
+
+    def removeAllProcedureDataSets(self):
+        for obj in self._ProcedureDataSets:
+            obj._TransformerObservations.discard(self)
+        self._ProcedureDataSets = RefList()
 
     def getTransformer(self):
         
@@ -166,8 +181,7 @@ class TransformerObservation(IdentifiedObject):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.TransformerObservations if x != self]
-            self._Transformer._TransformerObservations = filtered
+            self._Transformer._TransformerObservations.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
@@ -184,20 +198,32 @@ class TransformerObservation(IdentifiedObject):
 
     def setWindingInsulationPFs(self, value):
         for x in self._WindingInsulationPFs:
-            x.TransformerObservation = None
-        for y in value:
-            y._TransformerObservation = self
-        self._WindingInsulationPFs = value
+            x._TransformerObservation = None
+        self._WindingInsulationPFs = RefList()
+        self.addWindingInsulationPFs(value)
 
     WindingInsulationPFs = property(getWindingInsulationPFs, setWindingInsulationPFs)
 
     def addWindingInsulationPFs(self, *WindingInsulationPFs):
-        for obj in WindingInsulationPFs:
-            obj.TransformerObservation = self
+        collection = self._WindingInsulationPFs
+        for obj in members(WindingInsulationPFs):
+            old = obj._TransformerObservation
+            if old is not None and old is not self:
+                old._WindingInsulationPFs.discard(obj)
+            obj._TransformerObservation = self
+            collection.append(obj)
 
     def removeWindingInsulationPFs(self, *WindingInsulationPFs):
-        for obj in WindingInsulationPFs:
-            obj.TransformerObservation = None
+        collection = self._WindingInsulationPFs
+        for obj in members(WindingInsulationPFs):
+            if obj._TransformerObservation is self:
+                obj._TransformerObservation = None
+                collection.discard(obj)
+
+    def removeAllWindingInsulationPFs(self):
+        for obj in self._WindingInsulationPFs:
+            obj._TransformerObservation = None
+        self._WindingInsulationPFs = RefList()
 
     def getTransformerAsset(self):
         
@@ -205,8 +231,7 @@ class TransformerObservation(IdentifiedObject):
 
     def setTransformerAsset(self, value):
         if self._TransformerAsset is not None:
-            filtered = [x for x in self.TransformerAsset.TransformerObservations if x != self]
-            self._TransformerAsset._TransformerObservations = filtered
+            self._TransformerAsset._TransformerObservations.discard(self)
 
         self._TransformerAsset = value
         if self._TransformerAsset is not None:
@@ -59,8 +59,7 @@ class Vehicle(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Vehicles if x != self]
-            self._Crew._Vehicles = filtered
+            self._Crew._Vehicles.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
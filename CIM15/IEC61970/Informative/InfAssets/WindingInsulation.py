@@ -74,8 +74,7 @@ class WindingInsulation(IdentifiedObject):
 
     def setGround(self, value):
         if self._Ground is not None:
-            filtered = [x for x in self.Ground.WindingInsulations if x != self]
-            self._Ground._WindingInsulations = filtered
+            self._Ground._WindingInsulations.discard(self)
 
         self._Ground = value
         if self._Ground is not None:
@@ -90,8 +89,7 @@ class WindingInsulation(IdentifiedObject):
 
     def setTransformerObservation(self, value):
         if self._TransformerObservation is not None:
-            filtered = [x for x in self.TransformerObservation.WindingInsulationPFs if x != self]
-            self._TransformerObservation._WindingInsulationPFs = filtered
+            self._TransformerObservation._WindingInsulationPFs.discard(self)
 
         self._TransformerObservation = value
         if self._TransformerObservation is not None:
@@ -106,8 +104,7 @@ class WindingInsulation(IdentifiedObject):
 
     def setToWinding(self, value):
         if self._ToWinding is not None:
-            filtered = [x for x in self.ToWinding.ToWindingInsulations if x != self]
-            self._ToWinding._ToWindingInsulations = filtered
+            self._ToWinding._ToWindingInsulations.discard(self)
 
         self._ToWinding = value
         if self._ToWinding is not None:
@@ -122,8 +119,7 @@ class WindingInsulation(IdentifiedObject):
 
     def setFromWinding(self, value):
         if self._FromWinding is not None:
-            filtered = [x for x in self.FromWinding.FromWindingInsulations if x != self]
-            self._FromWinding._FromWindingInsulations = filtered
+            self._FromWinding._FromWindingInsulations.discard(self)
 
         self._FromWinding = value
         if self._FromWinding is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from PyCIM.RefList import RefList, members
 
 class WorkEquipment(Asset):
     """Equipment used to perform units of work by crews, office staff, etc.Equipment used to perform units of work by crews, office staff, etc.
@@ -33,7 +34,7 @@ class WorkEquipment(Asset):
         self._Crew = None
         self.Crew = Crew
 
-        self._Usages = []
+        self._Usages = RefList()
         self.Usages = [] if Usages is None else Usages
 
         super(WorkEquipment, self).__init__(*args, **kw_args)
@@ -51,8 +52,7 @@ class WorkEquipment(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.WorkEquipmentAssets if x != self]
-            self._Crew._WorkEquipmentAssets = filtered
+            self._Crew._WorkEquipmentAssets.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
@@ -67,18 +67,30 @@ class WorkEquipment(Asset):
 
     def setUsages(self, value):
         for x in self._Usages:
-            x.WorkEquipmentAsset = None
-        for y in value:
-            y._WorkEquipmentAsset = self
-        self._Usages = value
+            x._WorkEquipmentAsset = None
+        self._Usages = RefList()
+        self.addUsages(value)
 
     Usages = property(getUsages, setUsages)
 
     def addUsages(self, *Usages):
-        for obj in Usages:
-            obj.WorkEquipmentAsset = self
+        collection = self._Usages
+        for obj in members(Usages):
+            old = obj._WorkEquipmentAsset
+            if old is not None and old is not self:
+                old._Usages.discard(obj)
+            obj._WorkEquipmentAsset = self
+            collection.append(obj)
 
     def removeUsages(self, *Usages):
-        for obj in Usages:
-            obj.WorkEquipmentAsset = None
+        collection = self._Usages
+        for obj in members(Usages):
+            if obj._WorkEquipmentAsset is self:
+                obj._WorkEquipmentAsset = None
+                collection.discard(obj)
+
+    def removeAllUsages(self):
+        for obj in self._Usages:
+            obj._WorkEquipmentAsset = None
+        self._Usages = RefList()
 
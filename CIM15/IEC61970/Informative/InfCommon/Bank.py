@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from PyCIM.RefList import RefList, members
 
 class Bank(Organisation):
     """Organisation that is a commercial bank, agency, or other institution that offers a similar service.Organisation that is a commercial bank, agency, or other institution that offers a similar service.
@@ -41,7 +42,7 @@ class Bank(Organisation):
         #: Codified reference to the particular branch of the bank where BankAccount is held.
         self.branchCode = branchCode
 
-        self._BankAccounts = []
+        self._BankAccounts = RefList()
         self.BankAccounts = [] if BankAccounts is None else BankAccounts
 
         super(Bank, self).__init__(*args, **kw_args)
@@ -60,18 +61,30 @@ class Bank(Organisation):
 
     def setBankAccounts(self, value):
         for x in self._BankAccounts:
-            x.Bank = None
-        for y in value:
-            y._Bank = self
-        self._BankAccounts = value
+            x._Bank = None
+        self._BankAccounts = RefList()
+        self.addBankAccounts(value)
 
     BankAccounts = property(getBankAccounts, setBankAccounts)
 
     def addBankAccounts(self, *BankAccounts):
-        for obj in BankAccounts:
-            obj.Bank = self
+        collection = self._BankAccounts
+        for obj in members(BankAccounts):
+            old = obj._Bank
+            if old is not None and old is not self:
+                old._BankAccounts.discard(obj)
+            obj._Bank = self
+            collection.append(obj)
 
     def removeBankAccounts(self, *BankAccounts):
-        for obj in BankAccounts:
-            obj.Bank = None
+        collection = self._BankAccounts
+        for obj in members(BankAccounts):
+            if obj._Bank is self:
+                obj._Bank = None
+                collection.discard(obj)
+
+    def removeAllBankAccounts(self):
+        for obj in self._BankAccounts:
+            obj._Bank = None
+        self._BankAccounts = RefList()
 
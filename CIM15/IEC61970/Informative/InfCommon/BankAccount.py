@@ -56,8 +56,7 @@ class BankAccount(Document):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.BankAccounts if x != self]
-            self._ServiceSupplier._BankAccounts = filtered
+            self._ServiceSupplier._BankAccounts.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
@@ -73,8 +72,7 @@ class BankAccount(Document):
 
     def setBank(self, value):
         if self._Bank is not None:
-            filtered = [x for x in self.Bank.BankAccounts if x != self]
-            self._Bank._BankAccounts = filtered
+            self._Bank._BankAccounts.discard(self)
 
         self._Bank = value
         if self._Bank is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BusinessRole(IdentifiedObject):
     """A business role that this organisation plays. A single organisation typically performs many functions, each one described as a role.A business role that this organisation plays. A single organisation typically performs many functions, each one described as a role.
@@ -34,7 +35,7 @@ class BusinessRole(IdentifiedObject):
         #: Category by utility's corporate standards and practices.
         self.category = category
 
-        self._Organisations = []
+        self._Organisations = RefList()
         self.Organisations = [] if Organisations is None else Organisations
 
         self.status = status
@@ -54,26 +55,28 @@ class BusinessRole(IdentifiedObject):
 
     def setOrganisations(self, value):
         for p in self._Organisations:
-            filtered = [q for q in p.BusinessRoles if q != self]
-            self._Organisations._BusinessRoles = filtered
-        for r in value:
-            if self not in r._BusinessRoles:
-                r._BusinessRoles.append(self)
-        self._Organisations = value
+            p._BusinessRoles.discard(self)
+        self._Organisations = RefList()
+        self.addOrganisations(value)
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
-        for obj in Organisations:
-            if self not in obj._BusinessRoles:
-                obj._BusinessRoles.append(self)
-            self._Organisations.append(obj)
+        collection = self._Organisations
+        for obj in members(Organisations):
+            obj._BusinessRoles.append(self)
+            collection.append(obj)
 
     def removeOrganisations(self, *Organisations):
-        for obj in Organisations:
-            if self in obj._BusinessRoles:
-                obj._BusinessRoles.remove(self)
-            self._Organisations.remove(obj)
+        collection = self._Organisations
+        for obj in members(Organisations):
+            obj._BusinessRoles.discard(self)
+            collection.discard(obj)
+
+    def removeAllOrganisations(self):
+        for obj in self._Organisations:
+            obj._BusinessRoles.discard(self)
+        self._Organisations = RefList()
 
     status = None
 
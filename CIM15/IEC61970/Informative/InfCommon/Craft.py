@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Craft(IdentifiedObject):
     """Craft of a person or a crew. Examples include overhead electric, underground electric, high pressure gas, etc. This ensures necessary knowledge and skills before being allowed to perform certain types of work.Craft of a person or a crew. Examples include overhead electric, underground electric, high pressure gas, etc. This ensures necessary knowledge and skills before being allowed to perform certain types of work.
@@ -36,15 +37,15 @@ class Craft(IdentifiedObject):
         #: Category by utility's work mangement standards and practices.
         self.category = category
 
-        self._Skills = []
+        self._Skills = RefList()
         self.Skills = [] if Skills is None else Skills
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
         self.status = status
 
-        self._Capabilities = []
+        self._Capabilities = RefList()
         self.Capabilities = [] if Capabilities is None else Capabilities
 
         super(Craft, self).__init__(*args, **kw_args)
@@ -62,26 +63,28 @@ class Craft(IdentifiedObject):
 
     def setSkills(self, value):
         for p in self._Skills:
-            filtered = [q for q in p.Crafts if q != self]
-            self._Skills._Crafts = filtered
-        for r in value:
-            if self not in r._Crafts:
-                r._Crafts.append(self)
-        self._Skills = value
+            p._Crafts.discard(self)
+        self._Skills = RefList()
+        self.addSkills(value)
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
-        for obj in Skills:
-            if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._Skills.append(obj)
+        collection = self._Skills
+        for obj in members(Skills):
+            obj._Crafts.append(self)
+            collection.append(obj)
 
     def removeSkills(self, *Skills):
-        for obj in Skills:
-            if self in obj._Crafts:
-                obj._Crafts.remove(self)
-            self._Skills.remove(obj)
+        collection = self._Skills
+        for obj in members(Skills):
+            obj._Crafts.discard(self)
+            collection.discard(obj)
+
+    def removeAllSkills(self):
+        for obj in self._Skills:
+            obj._Crafts.discard(self)
+        self._Skills = RefList()
 
     def getErpPersons(self):
         
@@ -89,26 +92,28 @@ class Craft(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.Crafts if q != self]
-            self._ErpPersons._Crafts = filtered
-        for r in value:
-            if self not in r._Crafts:
-                r._Crafts.append(self)
-        self._ErpPersons = value
+            p._Crafts.discard(self)
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._ErpPersons.append(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._Crafts.append(self)
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self in obj._Crafts:
-                obj._Crafts.remove(self)
-            self._ErpPersons.remove(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._Crafts.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._Crafts.discard(self)
+        self._ErpPersons = RefList()
 
     status = None
 
@@ -118,24 +123,26 @@ class Craft(IdentifiedObject):
 
     def setCapabilities(self, value):
         for p in self._Capabilities:
-            filtered = [q for q in p.Crafts if q != self]
-            self._Capabilities._Crafts = filtered
-        for r in value:
-            if self not in r._Crafts:
-                r._Crafts.append(self)
-        self._Capabilities = value
+            p._Crafts.discard(self)
+        self._Capabilities = RefList()
+        self.addCapabilities(value)
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
-        for obj in Capabilities:
-            if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._Capabilities.append(obj)
+        collection = self._Capabilities
+        for obj in members(Capabilities):
+            obj._Crafts.append(self)
+            collection.append(obj)
 
     def removeCapabilities(self, *Capabilities):
-        for obj in Capabilities:
-            if self in obj._Crafts:
-                obj._Crafts.remove(self)
-            self._Capabilities.remove(obj)
+        collection = self._Capabilities
+        for obj in members(Capabilities):
+            obj._Crafts.discard(self)
+            collection.discard(obj)
+
+    def removeAllCapabilities(self):
+        for obj in self._Capabilities:
+            obj._Crafts.discard(self)
+        self._Capabilities = RefList()
 
@@ -51,8 +51,7 @@ class DocDocRole(Role):
 
     def setToDocument(self, value):
         if self._ToDocument is not None:
-            filtered = [x for x in self.ToDocument.FromDocumentRoles if x != self]
-            self._ToDocument._FromDocumentRoles = filtered
+            self._ToDocument._FromDocumentRoles.discard(self)
 
         self._ToDocument = value
         if self._ToDocument is not None:
@@ -67,8 +66,7 @@ class DocDocRole(Role):
 
     def setFromDocument(self, value):
         if self._FromDocument is not None:
-            filtered = [x for x in self.FromDocument.ToDocumentRoles if x != self]
-            self._FromDocument._ToDocumentRoles = filtered
+            self._FromDocument._ToDocumentRoles.discard(self)
 
         self._FromDocument = value
         if self._FromDocument is not None:
@@ -51,8 +51,7 @@ class DocPsrRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.PowerSystemResourceRoles if x != self]
-            self._Document._PowerSystemResourceRoles = filtered
+            self._Document._PowerSystemResourceRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
@@ -67,8 +66,7 @@ class DocPsrRole(Role):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.DocumentRoles if x != self]
-            self._PowerSystemResource._DocumentRoles = filtered
+            self._PowerSystemResource._DocumentRoles.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ScheduleParameterInfo(IdentifiedObject):
     """Schedule parameters for an activity that is to occur, is occurring, or has completed.Schedule parameters for an activity that is to occur, is occurring, or has completed.
@@ -39,12 +40,12 @@ class ScheduleParameterInfo(IdentifiedObject):
 
         self.requestedWindow = requestedWindow
 
-        self._Documents = []
+        self._Documents = RefList()
         self.Documents = [] if Documents is None else Documents
 
         self.estimatedWindow = estimatedWindow
 
-        self._ScheduledEvents = []
+        self._ScheduledEvents = RefList()
         self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
 
         self.status = status
@@ -64,8 +65,7 @@ class ScheduleParameterInfo(IdentifiedObject):
 
     def setForInspectionDataSet(self, value):
         if self._ForInspectionDataSet is not None:
-            filtered = [x for x in self.ForInspectionDataSet.AccordingToSchedules if x != self]
-            self._ForInspectionDataSet._AccordingToSchedules = filtered
+            self._ForInspectionDataSet._AccordingToSchedules.discard(self)
 
         self._ForInspectionDataSet = value
         if self._ForInspectionDataSet is not None:
@@ -83,26 +83,28 @@ class ScheduleParameterInfo(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ScheduleParameterInfos if q != self]
-            self._Documents._ScheduleParameterInfos = filtered
-        for r in value:
-            if self not in r._ScheduleParameterInfos:
-                r._ScheduleParameterInfos.append(self)
-        self._Documents = value
+            p._ScheduleParameterInfos.discard(self)
+        self._Documents = RefList()
+        self.addDocuments(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
-        for obj in Documents:
-            if self not in obj._ScheduleParameterInfos:
-                obj._ScheduleParameterInfos.append(self)
-            self._Documents.append(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ScheduleParameterInfos.append(self)
+            collection.append(obj)
 
     def removeDocuments(self, *Documents):
-        for obj in Documents:
-            if self in obj._ScheduleParameterInfos:
-                obj._ScheduleParameterInfos.remove(self)
-            self._Documents.remove(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ScheduleParameterInfos.discard(self)
+            collection.discard(obj)
+
+    def removeAllDocuments(self):
+        for obj in self._Documents:
+            obj._ScheduleParameterInfos.discard(self)
+        self._Documents = RefList()
 
     # Estimated date and time for activity execution (with earliest possibility of activity initiation and latest possibility of activity completion).
     estimatedWindow = None
@@ -113,20 +115,32 @@ class ScheduleParameterInfo(IdentifiedObject):
 
     def setScheduledEvents(self, value):
         for x in self._ScheduledEvents:
-            x.ScheduleParameterInfo = None
-        for y in value:
-            y._ScheduleParameterInfo = self
-        self._ScheduledEvents = value
+            x._ScheduleParameterInfo = None
+        self._ScheduledEvents = RefList()
+        self.addScheduledEvents(value)
 
     ScheduledEvents = property(getScheduledEvents, setScheduledEvents)
 
     def addScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            obj.ScheduleParameterInfo = self
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            old = obj._ScheduleParameterInfo
+            if old is not None and old is not self:
+                old._ScheduledEvents.discard(obj)
+            obj._ScheduleParameterInfo = self
+            collection.append(obj)
 
     def removeScheduledEvents(self, *ScheduledEvents):
-        for obj in ScheduledEvents:
-            obj.ScheduleParameterInfo = None
+        collection = self._ScheduledEvents
+        for obj in members(ScheduledEvents):
+            if obj._ScheduleParameterInfo is self:
+                obj._ScheduleParameterInfo = None
+                collection.discard(obj)
+
+    def removeAllScheduledEvents(self):
+        for obj in self._ScheduledEvents:
+            obj._ScheduleParameterInfo = None
+        self._ScheduledEvents = RefList()
 
     status = None
 
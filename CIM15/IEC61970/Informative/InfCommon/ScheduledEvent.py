@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ScheduledEvent(IdentifiedObject):
     """Signifies an event to trigger one or more activities, such as reading a meter, recalculating a bill, requesting work, when generating units must be scheduled for maintenance, when a transformer is scheduled to be refurbished, etc.Signifies an event to trigger one or more activities, such as reading a meter, recalculating a bill, requesting work, when generating units must be scheduled for maintenance, when a transformer is scheduled to be refurbished, etc.
@@ -56,7 +57,7 @@ class ScheduledEvent(IdentifiedObject):
         self._ScheduleParameterInfo = None
         self.ScheduleParameterInfo = ScheduleParameterInfo
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         super(ScheduledEvent, self).__init__(*args, **kw_args)
@@ -74,8 +75,7 @@ class ScheduledEvent(IdentifiedObject):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ScheduledEvents if x != self]
-            self._Document._ScheduledEvents = filtered
+            self._Document._ScheduledEvents.discard(self)
 
         self._Document = value
         if self._Document is not None:
@@ -107,8 +107,7 @@ class ScheduledEvent(IdentifiedObject):
 
     def setTimePoint(self, value):
         if self._TimePoint is not None:
-            filtered = [x for x in self.TimePoint.ScheduledEvents if x != self]
-            self._TimePoint._ScheduledEvents = filtered
+            self._TimePoint._ScheduledEvents.discard(self)
 
         self._TimePoint = value
         if self._TimePoint is not None:
@@ -123,8 +122,7 @@ class ScheduledEvent(IdentifiedObject):
 
     def setScheduleParameterInfo(self, value):
         if self._ScheduleParameterInfo is not None:
-            filtered = [x for x in self.ScheduleParameterInfo.ScheduledEvents if x != self]
-            self._ScheduleParameterInfo._ScheduledEvents = filtered
+            self._ScheduleParameterInfo._ScheduledEvents.discard(self)
 
         self._ScheduleParameterInfo = value
         if self._ScheduleParameterInfo is not None:
@@ -139,24 +137,26 @@ class ScheduledEvent(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ScheduledEvents if q != self]
-            self._Assets._ScheduledEvents = filtered
-        for r in value:
-            if self not in r._ScheduledEvents:
-                r._ScheduledEvents.append(self)
-        self._Assets = value
+            p._ScheduledEvents.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._ScheduledEvents:
-                obj._ScheduledEvents.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ScheduledEvents.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._ScheduledEvents:
-                obj._ScheduledEvents.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ScheduledEvents.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._ScheduledEvents.discard(self)
+        self._Assets = RefList()
 
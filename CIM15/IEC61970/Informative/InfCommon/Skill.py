@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Skill(Document):
     """Proficiency level of a craft, which is required to operate or maintain a particular type of asset and/or perform certain types of work.Proficiency level of a craft, which is required to operate or maintain a particular type of asset and/or perform certain types of work.
@@ -40,13 +41,13 @@ class Skill(Document):
         #: Level of skill for a Craft. Values are: "apprentice", "other", "master", "standard"
         self.level = level
 
-        self._Crafts = []
+        self._Crafts = RefList()
         self.Crafts = [] if Crafts is None else Crafts
 
         self._ErpPerson = None
         self.ErpPerson = ErpPerson
 
-        self._QualificationRequirements = []
+        self._QualificationRequirements = RefList()
         self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
 
         self.certificationPeriod = certificationPeriod
@@ -66,26 +67,28 @@ class Skill(Document):
 
     def setCrafts(self, value):
         for p in self._Crafts:
-            filtered = [q for q in p.Skills if q != self]
-            self._Crafts._Skills = filtered
-        for r in value:
-            if self not in r._Skills:
-                r._Skills.append(self)
-        self._Crafts = value
+            p._Skills.discard(self)
+        self._Crafts = RefList()
+        self.addCrafts(value)
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
-        for obj in Crafts:
-            if self not in obj._Skills:
-                obj._Skills.append(self)
-            self._Crafts.append(obj)
+        collection = self._Crafts
+        for obj in members(Crafts):
+            obj._Skills.append(self)
+            collection.append(obj)
 
     def removeCrafts(self, *Crafts):
-        for obj in Crafts:
-            if self in obj._Skills:
-                obj._Skills.remove(self)
-            self._Crafts.remove(obj)
+        collection = self._Crafts
+        for obj in members(Crafts):
+            obj._Skills.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrafts(self):
+        for obj in self._Crafts:
+            obj._Skills.discard(self)
+        self._Crafts = RefList()
 
     def getErpPerson(self):
         
@@ -93,8 +96,7 @@ class Skill(Document):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.Skills if x != self]
-            self._ErpPerson._Skills = filtered
+            self._ErpPerson._Skills.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
@@ -109,26 +111,28 @@ class Skill(Document):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.Skills if q != self]
-            self._QualificationRequirements._Skills = filtered
-        for r in value:
-            if self not in r._Skills:
-                r._Skills.append(self)
-        self._QualificationRequirements = value
+            p._Skills.discard(self)
+        self._QualificationRequirements = RefList()
+        self.addQualificationRequirements(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self not in obj._Skills:
-                obj._Skills.append(self)
-            self._QualificationRequirements.append(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._Skills.append(self)
+            collection.append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self in obj._Skills:
-                obj._Skills.remove(self)
-            self._QualificationRequirements.remove(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._Skills.discard(self)
+            collection.discard(obj)
+
+    def removeAllQualificationRequirements(self):
+        for obj in self._QualificationRequirements:
+            obj._Skills.discard(self)
+        self._QualificationRequirements = RefList()
 
     # Interval between the certification and its expiry.
     certificationPeriod = None
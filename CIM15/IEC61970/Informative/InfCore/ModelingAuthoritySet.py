@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ModelingAuthoritySet(IdentifiedObject):
     """A Modeling Authority Set is a group of objects in a network model where the data is supplied and maintained by the same Modeling Authority. This class is typically not included in instance data exchange as this information is tracked by other mechanisms in the exchange.A Modeling Authority Set is a group of objects in a network model where the data is supplied and maintained by the same Modeling Authority. This class is typically not included in instance data exchange as this information is tracked by other mechanisms in the exchange.
@@ -30,7 +31,7 @@ class ModelingAuthoritySet(IdentifiedObject):
         @param IdentifiedObjects: An IdentifiedObject belongs to a Modeling Authority Set for purposes of defining a group of data maintained by the same Modeling Authority.
         @param ModelingAuthority: A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
         """
-        self._IdentifiedObjects = []
+        self._IdentifiedObjects = RefList()
         self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
 
         self._ModelingAuthority = None
@@ -52,20 +53,32 @@ class ModelingAuthoritySet(IdentifiedObject):
 
     def setIdentifiedObjects(self, value):
         for x in self._IdentifiedObjects:
-            x.ModelingAuthoritySet = None
-        for y in value:
-            y._ModelingAuthoritySet = self
-        self._IdentifiedObjects = value
+            x._ModelingAuthoritySet = None
+        self._IdentifiedObjects = RefList()
+        self.addIdentifiedObjects(value)
 
     IdentifiedObjects = property(getIdentifiedObjects, setIdentifiedObjects)
 
     def addIdentifiedObjects(self, *IdentifiedObjects):
-        for obj in IdentifiedObjects:
-            obj.ModelingAuthoritySet = self
+        collection = self._IdentifiedObjects
+        for obj in members(IdentifiedObjects):
+            old = obj._ModelingAuthoritySet
+            if old is not None and old is not self:
+                old._IdentifiedObjects.discard(obj)
+            obj._ModelingAuthoritySet = self
+            collection.append(obj)
 
     def removeIdentifiedObjects(self, *IdentifiedObjects):
-        for obj in IdentifiedObjects:
-            obj.ModelingAuthoritySet = None
+        collection = self._IdentifiedObjects
+        for obj in members(IdentifiedObjects):
+            if obj._ModelingAuthoritySet is self:
+                obj._ModelingAuthoritySet = None
+                collection.discard(obj)
+
+    def removeAllIdentifiedObjects(self):
+        for obj in self._IdentifiedObjects:
+            obj._ModelingAuthoritySet = None
+        self._IdentifiedObjects = RefList()
 
     def getModelingAuthority(self):
         """A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
@@ -74,8 +87,7 @@ class ModelingAuthoritySet(IdentifiedObject):
 
     def setModelingAuthority(self, value):
         if self._ModelingAuthority is not None:
-            filtered = [x for x in self.ModelingAuthority.ModelingAuthoritySets if x != self]
-            self._ModelingAuthority._ModelingAuthoritySets = filtered
+            self._ModelingAuthority._ModelingAuthoritySets.discard(self)
 
         self._ModelingAuthority = value
         if self._ModelingAuthority is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class CustomerBillingInfo(Document):
     """The creation of the monthly customer billing statements is the method employed to notify Customers of charges, adjustments and credits applied to their account for Services and Products. The actuall billing occurs through an ErpInvoice. The CustomerBillingInfo includes information from the payment, collection, meter reading, installed meter, service, site, customer, customer account, customer agreement, services and pricing subject areas. Each component price shows up as a separate line item on the ErpInvoice. The Customer Billing Statement may include collection and account messages, marketing/civic event messages and bill inserts. One Customer Billing Statement is produced for all Agreements under a CustomerAccount per billing cycle date defined in 'CustomerAccount.billingCycle'. The history of CustomerBillingInfo, Invoices and Payments is to be maintained in associated ActivityRecords.The creation of the monthly customer billing statements is the method employed to notify Customers of charges, adjustments and credits applied to their account for Services and Products. The actuall billing occurs through an ErpInvoice. The CustomerBillingInfo includes information from the payment, collection, meter reading, installed meter, service, site, customer, customer account, customer agreement, services and pricing subject areas. Each component price shows up as a separate line item on the ErpInvoice. The Customer Billing Statement may include collection and account messages, marketing/civic event messages and bill inserts. One Customer Billing Statement is produced for all Agreements under a CustomerAccount per billing cycle date defined in 'CustomerAccount.billingCycle'. The history of CustomerBillingInfo, Invoices and Payments is to be maintained in associated ActivityRecords.
@@ -62,7 +63,7 @@ class CustomerBillingInfo(Document):
         #: Business date designated for the billing run which produced this CustomerBillingInfo.
         self.billingDate = billingDate
 
-        self._ErpInvoiceLineItems = []
+        self._ErpInvoiceLineItems = RefList()
         self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
 
         self._CustomerAccount = None
@@ -83,26 +84,28 @@ class CustomerBillingInfo(Document):
 
     def setErpInvoiceLineItems(self, value):
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.CustomerBillingInfos if q != self]
-            self._ErpInvoiceLineItems._CustomerBillingInfos = filtered
-        for r in value:
-            if self not in r._CustomerBillingInfos:
-                r._CustomerBillingInfos.append(self)
-        self._ErpInvoiceLineItems = value
+            p._CustomerBillingInfos.discard(self)
+        self._ErpInvoiceLineItems = RefList()
+        self.addErpInvoiceLineItems(value)
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            if self not in obj._CustomerBillingInfos:
-                obj._CustomerBillingInfos.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            obj._CustomerBillingInfos.append(self)
+            collection.append(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            if self in obj._CustomerBillingInfos:
-                obj._CustomerBillingInfos.remove(self)
-            self._ErpInvoiceLineItems.remove(obj)
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            obj._CustomerBillingInfos.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpInvoiceLineItems(self):
+        for obj in self._ErpInvoiceLineItems:
+            obj._CustomerBillingInfos.discard(self)
+        self._ErpInvoiceLineItems = RefList()
 
     def getCustomerAccount(self):
         
@@ -110,8 +113,7 @@ class CustomerBillingInfo(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.CustomerBillingInfos if x != self]
-            self._CustomerAccount._CustomerBillingInfos = filtered
+            self._CustomerAccount._CustomerBillingInfos.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
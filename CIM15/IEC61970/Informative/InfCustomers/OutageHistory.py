@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class OutageHistory(Document):
     """A document collecting OutageReports, that allows utilities to examine the number of outages suffered by a customer. Also provides data to calculate the total supply interruption to any customer over a given period.A document collecting OutageReports, that allows utilities to examine the number of outages suffered by a customer. Also provides data to calculate the total supply interruption to any customer over a given period.
@@ -29,7 +30,7 @@ class OutageHistory(Document):
 
         @param OutageReports: OutageReports per customer for which this OutageHistory is created.
         """
-        self._OutageReports = []
+        self._OutageReports = RefList()
         self.OutageReports = [] if OutageReports is None else OutageReports
 
         super(OutageHistory, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class OutageHistory(Document):
 
     def setOutageReports(self, value):
         for x in self._OutageReports:
-            x.OutageHistory = None
-        for y in value:
-            y._OutageHistory = self
-        self._OutageReports = value
+            x._OutageHistory = None
+        self._OutageReports = RefList()
+        self.addOutageReports(value)
 
     OutageReports = property(getOutageReports, setOutageReports)
 
     def addOutageReports(self, *OutageReports):
-        for obj in OutageReports:
-            obj.OutageHistory = self
+        collection = self._OutageReports
+        for obj in members(OutageReports):
+            old = obj._OutageHistory
+            if old is not None and old is not self:
+                old._OutageReports.discard(obj)
+            obj._OutageHistory = self
+            collection.append(obj)
 
     def removeOutageReports(self, *OutageReports):
-        for obj in OutageReports:
-            obj.OutageHistory = None
+        collection = self._OutageReports
+        for obj in members(OutageReports):
+            if obj._OutageHistory is self:
+                obj._OutageHistory = None
+                collection.discard(obj)
+
+    def removeAllOutageReports(self):
+        for obj in self._OutageReports:
+            obj._OutageHistory = None
+        self._OutageReports = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class StandardIndustryCode(Document):
     """The Standard Industrial Classification (SIC) are the codes that identify the type of products/service an industry is involved in, and used for statutory reporting purposes. For example, in the USA these codes are located by the federal government, and then published in a book entitled 'The Standard Industrial Classification Manual'. The codes are arranged in a hierarchical structure. Note that Residential Service Agreements are not classified according to the SIC codes.The Standard Industrial Classification (SIC) are the codes that identify the type of products/service an industry is involved in, and used for statutory reporting purposes. For example, in the USA these codes are located by the federal government, and then published in a book entitled 'The Standard Industrial Classification Manual'. The codes are arranged in a hierarchical structure. Note that Residential Service Agreements are not classified according to the SIC codes.
@@ -33,7 +34,7 @@ class StandardIndustryCode(Document):
         #: Standard alphanumeric code assigned to a particular product/service within an industry.
         self.code = code
 
-        self._CustomerAgreements = []
+        self._CustomerAgreements = RefList()
         self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
 
         super(StandardIndustryCode, self).__init__(*args, **kw_args)
@@ -51,18 +52,30 @@ class StandardIndustryCode(Document):
 
     def setCustomerAgreements(self, value):
         for x in self._CustomerAgreements:
-            x.StandardIndustryCode = None
-        for y in value:
-            y._StandardIndustryCode = self
-        self._CustomerAgreements = value
+            x._StandardIndustryCode = None
+        self._CustomerAgreements = RefList()
+        self.addCustomerAgreements(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.StandardIndustryCode = self
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            old = obj._StandardIndustryCode
+            if old is not None and old is not self:
+                old._CustomerAgreements.discard(obj)
+            obj._StandardIndustryCode = self
+            collection.append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
-        for obj in CustomerAgreements:
-            obj.StandardIndustryCode = None
+        collection = self._CustomerAgreements
+        for obj in members(CustomerAgreements):
+            if obj._StandardIndustryCode is self:
+                obj._StandardIndustryCode = None
+                collection.discard(obj)
+
+    def removeAllCustomerAgreements(self):
+        for obj in self._CustomerAgreements:
+            obj._StandardIndustryCode = None
+        self._CustomerAgreements = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class WorkBillingInfo(Document):
     """Billing information for work performed for the customer. The history of Work Billing Info, Invoices, and Payments is to be maintained in associated ActivityRecords.Billing information for work performed for the customer. The history of Work Billing Info, Invoices, and Payments is to be maintained in associated ActivityRecords.
@@ -59,13 +60,13 @@ class WorkBillingInfo(Document):
         #: Amount of bill.
         self.workPrice = workPrice
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
 
-        self._ErpLineItems = []
+        self._ErpLineItems = RefList()
         self.ErpLineItems = [] if ErpLineItems is None else ErpLineItems
 
         super(WorkBillingInfo, self).__init__(*args, **kw_args)
@@ -83,20 +84,32 @@ class WorkBillingInfo(Document):
 
     def setWorks(self, value):
         for x in self._Works:
-            x.WorkBillingInfo = None
-        for y in value:
-            y._WorkBillingInfo = self
-        self._Works = value
+            x._WorkBillingInfo = None
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            obj.WorkBillingInfo = self
+        collection = self._Works
+        for obj in members(Works):
+            old = obj._WorkBillingInfo
+            if old is not None and old is not self:
+                old._Works.discard(obj)
+            obj._WorkBillingInfo = self
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            obj.WorkBillingInfo = None
+        collection = self._Works
+        for obj in members(Works):
+            if obj._WorkBillingInfo is self:
+                obj._WorkBillingInfo = None
+                collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._WorkBillingInfo = None
+        self._Works = RefList()
 
     def getCustomerAccount(self):
         
@@ -104,8 +117,7 @@ class WorkBillingInfo(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.WorkBillingInfos if x != self]
-            self._CustomerAccount._WorkBillingInfos = filtered
+            self._CustomerAccount._WorkBillingInfos.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
@@ -120,24 +132,26 @@ class WorkBillingInfo(Document):
 
     def setErpLineItems(self, value):
         for p in self._ErpLineItems:
-            filtered = [q for q in p.WorkBillingInfos if q != self]
-            self._ErpLineItems._WorkBillingInfos = filtered
-        for r in value:
-            if self not in r._WorkBillingInfos:
-                r._WorkBillingInfos.append(self)
-        self._ErpLineItems = value
+            p._WorkBillingInfos.discard(self)
+        self._ErpLineItems = RefList()
+        self.addErpLineItems(value)
 
     ErpLineItems = property(getErpLineItems, setErpLineItems)
 
     def addErpLineItems(self, *ErpLineItems):
-        for obj in ErpLineItems:
-            if self not in obj._WorkBillingInfos:
-                obj._WorkBillingInfos.append(self)
-            self._ErpLineItems.append(obj)
+        collection = self._ErpLineItems
+        for obj in members(ErpLineItems):
+            obj._WorkBillingInfos.append(self)
+            collection.append(obj)
 
     def removeErpLineItems(self, *ErpLineItems):
-        for obj in ErpLineItems:
-            if self in obj._WorkBillingInfos:
-                obj._WorkBillingInfos.remove(self)
-            self._ErpLineItems.remove(obj)
+        collection = self._ErpLineItems
+        for obj in members(ErpLineItems):
+            obj._WorkBillingInfos.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpLineItems(self):
+        for obj in self._ErpLineItems:
+            obj._WorkBillingInfos.discard(self)
+        self._ErpLineItems = RefList()
 
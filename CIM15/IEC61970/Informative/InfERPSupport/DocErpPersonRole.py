@@ -51,8 +51,7 @@ class DocErpPersonRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ErpPersonRoles if x != self]
-            self._Document._ErpPersonRoles = filtered
+            self._Document._ErpPersonRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
@@ -67,8 +66,7 @@ class DocErpPersonRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.DocumentRoles if x != self]
-            self._ErpPerson._DocumentRoles = filtered
+            self._ErpPerson._DocumentRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
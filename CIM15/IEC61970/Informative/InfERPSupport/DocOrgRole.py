@@ -51,8 +51,7 @@ class DocOrgRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ErpOrganisationRoles if x != self]
-            self._Document._ErpOrganisationRoles = filtered
+            self._Document._ErpOrganisationRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
@@ -67,8 +66,7 @@ class DocOrgRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.DocumentRoles if x != self]
-            self._ErpOrganisation._DocumentRoles = filtered
+            self._ErpOrganisation._DocumentRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpBOM(Document):
     """Information that generally describes the Bill of Material Structure and its contents for a utility.  This is used by ERP systems to transfer Bill of Material information between two business applications.Information that generally describes the Bill of Material Structure and its contents for a utility.  This is used by ERP systems to transfer Bill of Material information between two business applications.
@@ -33,7 +34,7 @@ class ErpBOM(Document):
         self._Design = None
         self.Design = Design
 
-        self._ErpBomItemDatas = []
+        self._ErpBomItemDatas = RefList()
         self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
 
         super(ErpBOM, self).__init__(*args, **kw_args)
@@ -51,8 +52,7 @@ class ErpBOM(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.ErpBOMs if x != self]
-            self._Design._ErpBOMs = filtered
+            self._Design._ErpBOMs.discard(self)
 
         self._Design = value
         if self._Design is not None:
@@ -67,18 +67,30 @@ class ErpBOM(Document):
 
     def setErpBomItemDatas(self, value):
         for x in self._ErpBomItemDatas:
-            x.ErpBOM = None
-        for y in value:
-            y._ErpBOM = self
-        self._ErpBomItemDatas = value
+            x._ErpBOM = None
+        self._ErpBomItemDatas = RefList()
+        self.addErpBomItemDatas(value)
 
     ErpBomItemDatas = property(getErpBomItemDatas, setErpBomItemDatas)
 
     def addErpBomItemDatas(self, *ErpBomItemDatas):
-        for obj in ErpBomItemDatas:
-            obj.ErpBOM = self
+        collection = self._ErpBomItemDatas
+        for obj in members(ErpBomItemDatas):
+            old = obj._ErpBOM
+            if old is not None and old is not self:
+                old._ErpBomItemDatas.discard(obj)
+            obj._ErpBOM = self
+            collection.append(obj)
 
     def removeErpBomItemDatas(self, *ErpBomItemDatas):
-        for obj in ErpBomItemDatas:
-            obj.ErpBOM = None
+        collection = self._ErpBomItemDatas
+        for obj in members(ErpBomItemDatas):
+            if obj._ErpBOM is self:
+                obj._ErpBOM = None
+                collection.discard(obj)
+
+    def removeAllErpBomItemDatas(self):
+        for obj in self._ErpBomItemDatas:
+            obj._ErpBOM = None
+        self._ErpBomItemDatas = RefList()
 
@@ -55,8 +55,7 @@ class ErpBomItemData(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpBomItemDatas if x != self]
-            self._TypeAsset._ErpBomItemDatas = filtered
+            self._TypeAsset._ErpBomItemDatas.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
@@ -71,8 +70,7 @@ class ErpBomItemData(IdentifiedObject):
 
     def setErpBOM(self, value):
         if self._ErpBOM is not None:
-            filtered = [x for x in self.ErpBOM.ErpBomItemDatas if x != self]
-            self._ErpBOM._ErpBomItemDatas = filtered
+            self._ErpBOM._ErpBomItemDatas.discard(self)
 
         self._ErpBOM = value
         if self._ErpBOM is not None:
@@ -87,8 +85,7 @@ class ErpBomItemData(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.ErpBomItemDatas if x != self]
-            self._DesignLocation._ErpBomItemDatas = filtered
+            self._DesignLocation._ErpBomItemDatas.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
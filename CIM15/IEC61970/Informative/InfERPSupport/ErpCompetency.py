@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpCompetency(IdentifiedObject):
     """Information that describes aptitudes of a utility employee. Unlike Skills that an ErpPerson must be certified to perform before undertaking certain type of assignments (to be able to perfrom a Craft), ErpCompetency has more to do with typical Human Resource (HR) matters such as schooling, training, etc.Information that describes aptitudes of a utility employee. Unlike Skills that an ErpPerson must be certified to perform before undertaking certain type of assignments (to be able to perfrom a Craft), ErpCompetency has more to do with typical Human Resource (HR) matters such as schooling, training, etc.
@@ -29,7 +30,7 @@ class ErpCompetency(IdentifiedObject):
 
         @param ErpPersons:
         """
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
         super(ErpCompetency, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpCompetency(IdentifiedObject):
 
     def setErpPersons(self, value):
         for x in self._ErpPersons:
-            x.ErpCompetency = None
-        for y in value:
-            y._ErpCompetency = self
-        self._ErpPersons = value
+            x._ErpCompetency = None
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.ErpCompetency = self
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            old = obj._ErpCompetency
+            if old is not None and old is not self:
+                old._ErpPersons.discard(obj)
+            obj._ErpCompetency = self
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.ErpCompetency = None
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            if obj._ErpCompetency is self:
+                obj._ErpCompetency = None
+                collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._ErpCompetency = None
+        self._ErpPersons = RefList()
 
@@ -56,8 +56,7 @@ class ErpInventoryCount(IdentifiedObject):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.ErpInventoryCounts if x != self]
-            self._MaterialItem._ErpInventoryCounts = filtered
+            self._MaterialItem._ErpInventoryCounts.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
@@ -72,8 +71,7 @@ class ErpInventoryCount(IdentifiedObject):
 
     def setAssetModel(self, value):
         if self._AssetModel is not None:
-            filtered = [x for x in self.AssetModel.ErpInventoryCounts if x != self]
-            self._AssetModel._ErpInventoryCounts = filtered
+            self._AssetModel._ErpInventoryCounts.discard(self)
 
         self._AssetModel = value
         if self._AssetModel is not None:
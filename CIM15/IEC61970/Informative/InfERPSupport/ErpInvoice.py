@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpInvoice(Document):
     """A roll up of invoice line items. The whole invoice has a due date and amount to be paid, with information such as customer, banks etc. being obtained through associations. The invoice roll up is based on individual line items that each contain amounts and descriptions for specific services or products.A roll up of invoice line items. The whole invoice has a due date and amount to be paid, with information such as customer, banks etc. being obtained through associations. The invoice roll up is based on individual line items that each contain amounts and descriptions for specific services or products.
@@ -66,7 +67,7 @@ class ErpInvoice(Document):
         #: True if payment is to be paid by a Customer to accept a particular ErpQuote (with associated Design) and have work initiated, at which time an associated ErpInvoice should automatically be generated. EprPayment.subjectStatus satisfies terms specificed in the ErpQuote.
         self.proForma = proForma
 
-        self._ErpInvoiceLineItems = []
+        self._ErpInvoiceLineItems = RefList()
         self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
 
         self._CustomerAccount = None
@@ -87,20 +88,32 @@ class ErpInvoice(Document):
 
     def setErpInvoiceLineItems(self, value):
         for x in self._ErpInvoiceLineItems:
-            x.ErpInvoice = None
-        for y in value:
-            y._ErpInvoice = self
-        self._ErpInvoiceLineItems = value
+            x._ErpInvoice = None
+        self._ErpInvoiceLineItems = RefList()
+        self.addErpInvoiceLineItems(value)
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            obj.ErpInvoice = self
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            old = obj._ErpInvoice
+            if old is not None and old is not self:
+                old._ErpInvoiceLineItems.discard(obj)
+            obj._ErpInvoice = self
+            collection.append(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            obj.ErpInvoice = None
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            if obj._ErpInvoice is self:
+                obj._ErpInvoice = None
+                collection.discard(obj)
+
+    def removeAllErpInvoiceLineItems(self):
+        for obj in self._ErpInvoiceLineItems:
+            obj._ErpInvoice = None
+        self._ErpInvoiceLineItems = RefList()
 
     def getCustomerAccount(self):
         
@@ -108,8 +121,7 @@ class ErpInvoice(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.ErpInvoicees if x != self]
-            self._CustomerAccount._ErpInvoicees = filtered
+            self._CustomerAccount._ErpInvoicees.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpInvoiceLineItem(Document):
     """An individual line item on an invoice.An individual line item on an invoice.
@@ -73,19 +74,19 @@ class ErpInvoiceLineItem(Document):
         #: Previous line item charge amount.
         self.previousAmount = previousAmount
 
-        self._ErpPayments = []
+        self._ErpPayments = RefList()
         self.ErpPayments = [] if ErpPayments is None else ErpPayments
 
         self._ContainerErpInvoiceLineItem = None
         self.ContainerErpInvoiceLineItem = ContainerErpInvoiceLineItem
 
-        self._WorkBillingInfos = []
+        self._WorkBillingInfos = RefList()
         self.WorkBillingInfos = [] if WorkBillingInfos is None else WorkBillingInfos
 
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
 
-        self._UserAttributes = []
+        self._UserAttributes = RefList()
         self.UserAttributes = [] if UserAttributes is None else UserAttributes
 
         self._ErpRecDelvLineItem = None
@@ -94,7 +95,7 @@ class ErpInvoiceLineItem(Document):
         self._ErpPayableLineItem = None
         self.ErpPayableLineItem = ErpPayableLineItem
 
-        self._ComponentErpInvoiceLineItems = []
+        self._ComponentErpInvoiceLineItems = RefList()
         self.ComponentErpInvoiceLineItems = [] if ComponentErpInvoiceLineItems is None else ComponentErpInvoiceLineItems
 
         self.billPeriod = billPeriod
@@ -102,13 +103,13 @@ class ErpInvoiceLineItem(Document):
         self._ErpInvoice = None
         self.ErpInvoice = ErpInvoice
 
-        self._CustomerBillingInfos = []
+        self._CustomerBillingInfos = RefList()
         self.CustomerBillingInfos = [] if CustomerBillingInfos is None else CustomerBillingInfos
 
         self._ErpRecLineItem = None
         self.ErpRecLineItem = ErpRecLineItem
 
-        self._ErpJournalEntries = []
+        self._ErpJournalEntries = RefList()
         self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
 
         super(ErpInvoiceLineItem, self).__init__(*args, **kw_args)
@@ -126,26 +127,28 @@ class ErpInvoiceLineItem(Document):
 
     def setErpPayments(self, value):
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._ErpPayments._ErpInvoiceLineItems = filtered
-        for r in value:
-            if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
-        self._ErpPayments = value
+            p._ErpInvoiceLineItems.discard(self)
+        self._ErpPayments = RefList()
+        self.addErpPayments(value)
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
-        for obj in ErpPayments:
-            if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._ErpPayments.append(obj)
+        collection = self._ErpPayments
+        for obj in members(ErpPayments):
+            obj._ErpInvoiceLineItems.append(self)
+            collection.append(obj)
 
     def removeErpPayments(self, *ErpPayments):
-        for obj in ErpPayments:
-            if self in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.remove(self)
-            self._ErpPayments.remove(obj)
+        collection = self._ErpPayments
+        for obj in members(ErpPayments):
+            obj._ErpInvoiceLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPayments(self):
+        for obj in self._ErpPayments:
+            obj._ErpInvoiceLineItems.discard(self)
+        self._ErpPayments = RefList()
 
     def getContainerErpInvoiceLineItem(self):
         
@@ -153,8 +156,7 @@ class ErpInvoiceLineItem(Document):
 
     def setContainerErpInvoiceLineItem(self, value):
         if self._ContainerErpInvoiceLineItem is not None:
-            filtered = [x for x in self.ContainerErpInvoiceLineItem.ComponentErpInvoiceLineItems if x != self]
-            self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems = filtered
+            self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems.discard(self)
 
         self._ContainerErpInvoiceLineItem = value
         if self._ContainerErpInvoiceLineItem is not None:
@@ -169,26 +171,28 @@ class ErpInvoiceLineItem(Document):
 
     def setWorkBillingInfos(self, value):
         for p in self._WorkBillingInfos:
-            filtered = [q for q in p.ErpLineItems if q != self]
-            self._WorkBillingInfos._ErpLineItems = filtered
-        for r in value:
-            if self not in r._ErpLineItems:
-                r._ErpLineItems.append(self)
-        self._WorkBillingInfos = value
+            p._ErpLineItems.discard(self)
+        self._WorkBillingInfos = RefList()
+        self.addWorkBillingInfos(value)
 
     WorkBillingInfos = property(getWorkBillingInfos, setWorkBillingInfos)
 
     def addWorkBillingInfos(self, *WorkBillingInfos):
-        for obj in WorkBillingInfos:
-            if self not in obj._ErpLineItems:
-                obj._ErpLineItems.append(self)
-            self._WorkBillingInfos.append(obj)
+        collection = self._WorkBillingInfos
+        for obj in members(WorkBillingInfos):
+            obj._ErpLineItems.append(self)
+            collection.append(obj)
 
     def removeWorkBillingInfos(self, *WorkBillingInfos):
-        for obj in WorkBillingInfos:
-            if self in obj._ErpLineItems:
-                obj._ErpLineItems.remove(self)
-            self._WorkBillingInfos.remove(obj)
+        collection = self._WorkBillingInfos
+        for obj in members(WorkBillingInfos):
+            obj._ErpLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkBillingInfos(self):
+        for obj in self._WorkBillingInfos:
+            obj._ErpLineItems.discard(self)
+        self._WorkBillingInfos = RefList()
 
     def getErpQuoteLineItem(self):
         
@@ -211,26 +215,28 @@ class ErpInvoiceLineItem(Document):
 
     def setUserAttributes(self, value):
         for p in self._UserAttributes:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._UserAttributes._ErpInvoiceLineItems = filtered
-        for r in value:
-            if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
-        self._UserAttributes = value
+            p._ErpInvoiceLineItems.discard(self)
+        self._UserAttributes = RefList()
+        self.addUserAttributes(value)
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
-        for obj in UserAttributes:
-            if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._UserAttributes.append(obj)
+        collection = self._UserAttributes
+        for obj in members(UserAttributes):
+            obj._ErpInvoiceLineItems.append(self)
+            collection.append(obj)
 
     def removeUserAttributes(self, *UserAttributes):
-        for obj in UserAttributes:
-            if self in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.remove(self)
-            self._UserAttributes.remove(obj)
+        collection = self._UserAttributes
+        for obj in members(UserAttributes):
+            obj._ErpInvoiceLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllUserAttributes(self):
+        for obj in self._UserAttributes:
+            obj._ErpInvoiceLineItems.discard(self)
+        self._UserAttributes = RefList()
 
     def getErpRecDelvLineItem(self):
         
@@ -268,20 +274,32 @@ class ErpInvoiceLineItem(Document):
 
     def setComponentErpInvoiceLineItems(self, value):
         for x in self._ComponentErpInvoiceLineItems:
-            x.ContainerErpInvoiceLineItem = None
-        for y in value:
-            y._ContainerErpInvoiceLineItem = self
-        self._ComponentErpInvoiceLineItems = value
+            x._ContainerErpInvoiceLineItem = None
+        self._ComponentErpInvoiceLineItems = RefList()
+        self.addComponentErpInvoiceLineItems(value)
 
     ComponentErpInvoiceLineItems = property(getComponentErpInvoiceLineItems, setComponentErpInvoiceLineItems)
 
     def addComponentErpInvoiceLineItems(self, *ComponentErpInvoiceLineItems):
-        for obj in ComponentErpInvoiceLineItems:
-            obj.ContainerErpInvoiceLineItem = self
+        collection = self._ComponentErpInvoiceLineItems
+        for obj in members(ComponentErpInvoiceLineItems):
+            old = obj._ContainerErpInvoiceLineItem
+            if old is not None and old is not self:
+                old._ComponentErpInvoiceLineItems.discard(obj)
+            obj._ContainerErpInvoiceLineItem = self
+            collection.append(obj)
 
     def removeComponentErpInvoiceLineItems(self, *ComponentErpInvoiceLineItems):
-        for obj in ComponentErpInvoiceLineItems:
-            obj.ContainerErpInvoiceLineItem = None
+        collection = self._ComponentErpInvoiceLineItems
+        for obj in members(ComponentErpInvoiceLineItems):
+            if obj._ContainerErpInvoiceLineItem is self:
+                obj._ContainerErpInvoiceLineItem = None
+                collection.discard(obj)
+
+    def removeAllComponentErpInvoiceLineItems(self):
+        for obj in self._ComponentErpInvoiceLineItems:
+            obj._ContainerErpInvoiceLineItem = None
+        self._ComponentErpInvoiceLineItems = RefList()
 
     # Bill period for the line item.
     billPeriod = None
@@ -292,8 +310,7 @@ class ErpInvoiceLineItem(Document):
 
     def setErpInvoice(self, value):
         if self._ErpInvoice is not None:
-            filtered = [x for x in self.ErpInvoice.ErpInvoiceLineItems if x != self]
-            self._ErpInvoice._ErpInvoiceLineItems = filtered
+            self._ErpInvoice._ErpInvoiceLineItems.discard(self)
 
         self._ErpInvoice = value
         if self._ErpInvoice is not None:
@@ -309,26 +326,28 @@ class ErpInvoiceLineItem(Document):
 
     def setCustomerBillingInfos(self, value):
         for p in self._CustomerBillingInfos:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._CustomerBillingInfos._ErpInvoiceLineItems = filtered
-        for r in value:
-            if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
-        self._CustomerBillingInfos = value
+            p._ErpInvoiceLineItems.discard(self)
+        self._CustomerBillingInfos = RefList()
+        self.addCustomerBillingInfos(value)
 
     CustomerBillingInfos = property(getCustomerBillingInfos, setCustomerBillingInfos)
 
     def addCustomerBillingInfos(self, *CustomerBillingInfos):
-        for obj in CustomerBillingInfos:
-            if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._CustomerBillingInfos.append(obj)
+        collection = self._CustomerBillingInfos
+        for obj in members(CustomerBillingInfos):
+            obj._ErpInvoiceLineItems.append(self)
+            collection.append(obj)
 
     def removeCustomerBillingInfos(self, *CustomerBillingInfos):
-        for obj in CustomerBillingInfos:
-            if self in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.remove(self)
-            self._CustomerBillingInfos.remove(obj)
+        collection = self._CustomerBillingInfos
+        for obj in members(CustomerBillingInfos):
+            obj._ErpInvoiceLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomerBillingInfos(self):
+        for obj in self._CustomerBillingInfos:
+            obj._ErpInvoiceLineItems.discard(self)
+        self._CustomerBillingInfos = RefList()
 
     def getErpRecLineItem(self):
         
@@ -351,18 +370,30 @@ class ErpInvoiceLineItem(Document):
 
     def setErpJournalEntries(self, value):
         for x in self._ErpJournalEntries:
-            x.ErpInvoiceLineItem = None
-        for y in value:
-            y._ErpInvoiceLineItem = self
-        self._ErpJournalEntries = value
+            x._ErpInvoiceLineItem = None
+        self._ErpJournalEntries = RefList()
+        self.addErpJournalEntries(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            obj.ErpInvoiceLineItem = self
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            old = obj._ErpInvoiceLineItem
+            if old is not None and old is not self:
+                old._ErpJournalEntries.discard(obj)
+            obj._ErpInvoiceLineItem = self
+            collection.append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            obj.ErpInvoiceLineItem = None
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            if obj._ErpInvoiceLineItem is self:
+                obj._ErpInvoiceLineItem = None
+                collection.discard(obj)
+
+    def removeAllErpJournalEntries(self):
+        for obj in self._ErpJournalEntries:
+            obj._ErpInvoiceLineItem = None
+        self._ErpJournalEntries = RefList()
 
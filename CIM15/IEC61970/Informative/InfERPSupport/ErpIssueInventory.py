@@ -54,8 +54,7 @@ class ErpIssueInventory(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpInventoryIssues if x != self]
-            self._TypeAsset._ErpInventoryIssues = filtered
+            self._TypeAsset._ErpInventoryIssues.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
@@ -72,8 +71,7 @@ class ErpIssueInventory(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.ErpIssueInventories if x != self]
-            self._TypeMaterial._ErpIssueInventories = filtered
+            self._TypeMaterial._ErpIssueInventories.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
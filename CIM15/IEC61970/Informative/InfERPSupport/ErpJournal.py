@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpJournal(Document):
     """Book for recording accounting transactions as they occur. Transactions and adjustments are first recorded in a journal, which is like a diary of instructions, advising which account to be charged and by how much. A journal represents a change in the balances of a business's financial accounts. Many tasks or transactions throughout an enterprise will result in the creation of a journal. Some examples are creating a customer invoice, paying a vendor, transferring inventory, or paying employees.Book for recording accounting transactions as they occur. Transactions and adjustments are first recorded in a journal, which is like a diary of instructions, advising which account to be charged and by how much. A journal represents a change in the balances of a business's financial accounts. Many tasks or transactions throughout an enterprise will result in the creation of a journal. Some examples are creating a customer invoice, paying a vendor, transferring inventory, or paying employees.
@@ -29,7 +30,7 @@ class ErpJournal(Document):
 
         @param ErpJournalEntries:
         """
-        self._ErpJournalEntries = []
+        self._ErpJournalEntries = RefList()
         self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
 
         super(ErpJournal, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpJournal(Document):
 
     def setErpJournalEntries(self, value):
         for x in self._ErpJournalEntries:
-            x.ErpJournal = None
-        for y in value:
-            y._ErpJournal = self
-        self._ErpJournalEntries = value
+            x._ErpJournal = None
+        self._ErpJournalEntries = RefList()
+        self.addErpJournalEntries(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            obj.ErpJournal = self
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            old = obj._ErpJournal
+            if old is not None and old is not self:
+                old._ErpJournalEntries.discard(obj)
+            obj._ErpJournal = self
+            collection.append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            obj.ErpJournal = None
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            if obj._ErpJournal is self:
+                obj._ErpJournal = None
+                collection.discard(obj)
+
+    def removeAllErpJournalEntries(self):
+        for obj in self._ErpJournalEntries:
+            obj._ErpJournal = None
+        self._ErpJournalEntries = RefList()
 
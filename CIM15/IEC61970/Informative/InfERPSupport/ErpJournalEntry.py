@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpJournalEntry(IdentifiedObject):
     """Details of an individual entry in a journal, which is to be posted to a ledger on the posting date.Details of an individual entry in a journal, which is to be posted to a ledger on the posting date.
@@ -57,19 +58,19 @@ class ErpJournalEntry(IdentifiedObject):
 
         self.status = status
 
-        self._ErpPayableLineItems = []
+        self._ErpPayableLineItems = RefList()
         self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
 
-        self._ErpRecLineItems = []
+        self._ErpRecLineItems = RefList()
         self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
 
         self._ErpLedgerEntry = None
         self.ErpLedgerEntry = ErpLedgerEntry
 
-        self._CostTypes = []
+        self._CostTypes = RefList()
         self.CostTypes = [] if CostTypes is None else CostTypes
 
         self._ErpJournal = None
@@ -92,26 +93,28 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpPayableLineItems(self, value):
         for p in self._ErpPayableLineItems:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._ErpPayableLineItems._ErpJournalEntries = filtered
-        for r in value:
-            if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
-        self._ErpPayableLineItems = value
+            p._ErpJournalEntries.discard(self)
+        self._ErpPayableLineItems = RefList()
+        self.addErpPayableLineItems(value)
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
-        for obj in ErpPayableLineItems:
-            if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._ErpPayableLineItems.append(obj)
+        collection = self._ErpPayableLineItems
+        for obj in members(ErpPayableLineItems):
+            obj._ErpJournalEntries.append(self)
+            collection.append(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
-        for obj in ErpPayableLineItems:
-            if self in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.remove(self)
-            self._ErpPayableLineItems.remove(obj)
+        collection = self._ErpPayableLineItems
+        for obj in members(ErpPayableLineItems):
+            obj._ErpJournalEntries.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPayableLineItems(self):
+        for obj in self._ErpPayableLineItems:
+            obj._ErpJournalEntries.discard(self)
+        self._ErpPayableLineItems = RefList()
 
     def getErpInvoiceLineItem(self):
         
@@ -119,8 +122,7 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpInvoiceLineItem(self, value):
         if self._ErpInvoiceLineItem is not None:
-            filtered = [x for x in self.ErpInvoiceLineItem.ErpJournalEntries if x != self]
-            self._ErpInvoiceLineItem._ErpJournalEntries = filtered
+            self._ErpInvoiceLineItem._ErpJournalEntries.discard(self)
 
         self._ErpInvoiceLineItem = value
         if self._ErpInvoiceLineItem is not None:
@@ -135,26 +137,28 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpRecLineItems(self, value):
         for p in self._ErpRecLineItems:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._ErpRecLineItems._ErpJournalEntries = filtered
-        for r in value:
-            if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
-        self._ErpRecLineItems = value
+            p._ErpJournalEntries.discard(self)
+        self._ErpRecLineItems = RefList()
+        self.addErpRecLineItems(value)
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
-        for obj in ErpRecLineItems:
-            if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._ErpRecLineItems.append(obj)
+        collection = self._ErpRecLineItems
+        for obj in members(ErpRecLineItems):
+            obj._ErpJournalEntries.append(self)
+            collection.append(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
-        for obj in ErpRecLineItems:
-            if self in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.remove(self)
-            self._ErpRecLineItems.remove(obj)
+        collection = self._ErpRecLineItems
+        for obj in members(ErpRecLineItems):
+            obj._ErpJournalEntries.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpRecLineItems(self):
+        for obj in self._ErpRecLineItems:
+            obj._ErpJournalEntries.discard(self)
+        self._ErpRecLineItems = RefList()
 
     def getErpLedgerEntry(self):
         
@@ -177,26 +181,28 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setCostTypes(self, value):
         for p in self._CostTypes:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._CostTypes._ErpJournalEntries = filtered
-        for r in value:
-            if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
-        self._CostTypes = value
+            p._ErpJournalEntries.discard(self)
+        self._CostTypes = RefList()
+        self.addCostTypes(value)
 
     CostTypes = property(getCostTypes, setCostTypes)
 
     def addCostTypes(self, *CostTypes):
-        for obj in CostTypes:
-            if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._CostTypes.append(obj)
+        collection = self._CostTypes
+        for obj in members(CostTypes):
+            obj._ErpJournalEntries.append(self)
+            collection.append(obj)
 
     def removeCostTypes(self, *CostTypes):
-        for obj in CostTypes:
-            if self in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.remove(self)
-            self._CostTypes.remove(obj)
+        collection = self._CostTypes
+        for obj in members(CostTypes):
+            obj._ErpJournalEntries.discard(self)
+            collection.discard(obj)
+
+    def removeAllCostTypes(self):
+        for obj in self._CostTypes:
+            obj._ErpJournalEntries.discard(self)
+        self._CostTypes = RefList()
 
     def getErpJournal(self):
         
@@ -204,8 +210,7 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpJournal(self, value):
         if self._ErpJournal is not None:
-            filtered = [x for x in self.ErpJournal.ErpJournalEntries if x != self]
-            self._ErpJournal._ErpJournalEntries = filtered
+            self._ErpJournal._ErpJournalEntries.discard(self)
 
         self._ErpJournal = value
         if self._ErpJournal is not None:
@@ -69,8 +69,7 @@ class ErpLedBudLineItem(IdentifiedObject):
 
     def setErpLedgerBudget(self, value):
         if self._ErpLedgerBudget is not None:
-            filtered = [x for x in self.ErpLedgerBudget.ErpLedBudLineItems if x != self]
-            self._ErpLedgerBudget._ErpLedBudLineItems = filtered
+            self._ErpLedgerBudget._ErpLedBudLineItems.discard(self)
 
         self._ErpLedgerBudget = value
         if self._ErpLedgerBudget is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpLedger(Document):
     """In accounting transactions, a ledger is a book containing accounts to which debits and credits are posted from journals, where transactions are initially recorded. Journal entries are periodically posted to the ledger. Ledger Actual represents actual amounts by account within ledger within company or business area. Actual amounts may be generated in a source application and then loaded to a specific ledger within the enterprise general ledger or budget application.In accounting transactions, a ledger is a book containing accounts to which debits and credits are posted from journals, where transactions are initially recorded. Journal entries are periodically posted to the ledger. Ledger Actual represents actual amounts by account within ledger within company or business area. Actual amounts may be generated in a source application and then loaded to a specific ledger within the enterprise general ledger or budget application.
@@ -29,7 +30,7 @@ class ErpLedger(Document):
 
         @param ErpLedgerEntries:
         """
-        self._ErpLedgerEntries = []
+        self._ErpLedgerEntries = RefList()
         self.ErpLedgerEntries = [] if ErpLedgerEntries is None else ErpLedgerEntries
 
         super(ErpLedger, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpLedger(Document):
 
     def setErpLedgerEntries(self, value):
         for x in self._ErpLedgerEntries:
-            x.ErpLedger = None
-        for y in value:
-            y._ErpLedger = self
-        self._ErpLedgerEntries = value
+            x._ErpLedger = None
+        self._ErpLedgerEntries = RefList()
+        self.addErpLedgerEntries(value)
 
     ErpLedgerEntries = property(getErpLedgerEntries, setErpLedgerEntries)
 
     def addErpLedgerEntries(self, *ErpLedgerEntries):
-        for obj in ErpLedgerEntries:
-            obj.ErpLedger = self
+        collection = self._ErpLedgerEntries
+        for obj in members(ErpLedgerEntries):
+            old = obj._ErpLedger
+            if old is not None and old is not self:
+                old._ErpLedgerEntries.discard(obj)
+            obj._ErpLedger = self
+            collection.append(obj)
 
     def removeErpLedgerEntries(self, *ErpLedgerEntries):
-        for obj in ErpLedgerEntries:
-            obj.ErpLedger = None
+        collection = self._ErpLedgerEntries
+        for obj in members(ErpLedgerEntries):
+            if obj._ErpLedger is self:
+                obj._ErpLedger = None
+                collection.discard(obj)
+
+    def removeAllErpLedgerEntries(self):
+        for obj in self._ErpLedgerEntries:
+            obj._ErpLedger = None
+        self._ErpLedgerEntries = RefList()
 
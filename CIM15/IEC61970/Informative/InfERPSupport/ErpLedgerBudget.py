@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpLedgerBudget(Document):
     """Information for utility Ledger Budgets. They support the transfer budget amounts between all possible source applications throughout an enterprise and a general ledger or budget application.Information for utility Ledger Budgets. They support the transfer budget amounts between all possible source applications throughout an enterprise and a general ledger or budget application.
@@ -29,7 +30,7 @@ class ErpLedgerBudget(Document):
 
         @param ErpLedBudLineItems:
         """
-        self._ErpLedBudLineItems = []
+        self._ErpLedBudLineItems = RefList()
         self.ErpLedBudLineItems = [] if ErpLedBudLineItems is None else ErpLedBudLineItems
 
         super(ErpLedgerBudget, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpLedgerBudget(Document):
 
     def setErpLedBudLineItems(self, value):
         for x in self._ErpLedBudLineItems:
-            x.ErpLedgerBudget = None
-        for y in value:
-            y._ErpLedgerBudget = self
-        self._ErpLedBudLineItems = value
+            x._ErpLedgerBudget = None
+        self._ErpLedBudLineItems = RefList()
+        self.addErpLedBudLineItems(value)
 
     ErpLedBudLineItems = property(getErpLedBudLineItems, setErpLedBudLineItems)
 
     def addErpLedBudLineItems(self, *ErpLedBudLineItems):
-        for obj in ErpLedBudLineItems:
-            obj.ErpLedgerBudget = self
+        collection = self._ErpLedBudLineItems
+        for obj in members(ErpLedBudLineItems):
+            old = obj._ErpLedgerBudget
+            if old is not None and old is not self:
+                old._ErpLedBudLineItems.discard(obj)
+            obj._ErpLedgerBudget = self
+            collection.append(obj)
 
     def removeErpLedBudLineItems(self, *ErpLedBudLineItems):
-        for obj in ErpLedBudLineItems:
-            obj.ErpLedgerBudget = None
+        collection = self._ErpLedBudLineItems
+        for obj in members(ErpLedBudLineItems):
+            if obj._ErpLedgerBudget is self:
+                obj._ErpLedgerBudget = None
+                collection.discard(obj)
+
+    def removeAllErpLedBudLineItems(self):
+        for obj in self._ErpLedBudLineItems:
+            obj._ErpLedgerBudget = None
+        self._ErpLedBudLineItems = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpLedgerEntry(IdentifiedObject):
     """Details of an individual entry in a ledger, which was posted from a journal on the posted date.Details of an individual entry in a ledger, which was posted from a journal on the posted date.
@@ -61,7 +62,7 @@ class ErpLedgerEntry(IdentifiedObject):
         self._ErpLedgerEntry = None
         self.ErpLedgerEntry = ErpLedgerEntry
 
-        self._UserAttributes = []
+        self._UserAttributes = RefList()
         self.UserAttributes = [] if UserAttributes is None else UserAttributes
 
         self._ErpJounalEntry = None
@@ -82,8 +83,7 @@ class ErpLedgerEntry(IdentifiedObject):
 
     def setErpLedger(self, value):
         if self._ErpLedger is not None:
-            filtered = [x for x in self.ErpLedger.ErpLedgerEntries if x != self]
-            self._ErpLedger._ErpLedgerEntries = filtered
+            self._ErpLedger._ErpLedgerEntries.discard(self)
 
         self._ErpLedger = value
         if self._ErpLedger is not None:
@@ -115,26 +115,28 @@ class ErpLedgerEntry(IdentifiedObject):
 
     def setUserAttributes(self, value):
         for p in self._UserAttributes:
-            filtered = [q for q in p.ErpLedgerEntries if q != self]
-            self._UserAttributes._ErpLedgerEntries = filtered
-        for r in value:
-            if self not in r._ErpLedgerEntries:
-                r._ErpLedgerEntries.append(self)
-        self._UserAttributes = value
+            p._ErpLedgerEntries.discard(self)
+        self._UserAttributes = RefList()
+        self.addUserAttributes(value)
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
-        for obj in UserAttributes:
-            if self not in obj._ErpLedgerEntries:
-                obj._ErpLedgerEntries.append(self)
-            self._UserAttributes.append(obj)
+        collection = self._UserAttributes
+        for obj in members(UserAttributes):
+            obj._ErpLedgerEntries.append(self)
+            collection.append(obj)
 
     def removeUserAttributes(self, *UserAttributes):
-        for obj in UserAttributes:
-            if self in obj._ErpLedgerEntries:
-                obj._ErpLedgerEntries.remove(self)
-            self._UserAttributes.remove(obj)
+        collection = self._UserAttributes
+        for obj in members(UserAttributes):
+            obj._ErpLedgerEntries.discard(self)
+            collection.discard(obj)
+
+    def removeAllUserAttributes(self):
+        for obj in self._UserAttributes:
+            obj._ErpLedgerEntries.discard(self)
+        self._UserAttributes = RefList()
 
     def getErpJounalEntry(self):
         
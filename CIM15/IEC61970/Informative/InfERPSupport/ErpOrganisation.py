@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from PyCIM.RefList import RefList, members
 
 class ErpOrganisation(Organisation):
     """Identifies organisations that might have roles as utilities, contractors, suppliers, manufacturers, customers, etc. Organisations may also have parent-child relationships to identify departments within an organisation, or parent company relationships. The organization may be internal (e.g., departments) or external to the utility. There may be multiple organizations of a given 'category', each with a unique 'code'.Identifies organisations that might have roles as utilities, contractors, suppliers, manufacturers, customers, etc. Organisations may also have parent-child relationships to identify departments within an organisation, or parent company relationships. The organization may be internal (e.g., departments) or external to the utility. There may be multiple organizations of a given 'category', each with a unique 'code'.
@@ -72,40 +73,40 @@ class ErpOrganisation(Organisation):
         #: Operational mode of the organisation, often required for outage reporting purposes. Some utilities use text to describe various modes (like nominal, emergency, storm, other), while others use severity ratings (for example, 0 is a nominal condition and 5 is the most severe condition).
         self.mode = mode
 
-        self._AssetRoles = []
+        self._AssetRoles = RefList()
         self.AssetRoles = [] if AssetRoles is None else AssetRoles
 
-        self._Requests = []
+        self._Requests = RefList()
         self.Requests = [] if Requests is None else Requests
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._ErpPersonRoles = []
+        self._ErpPersonRoles = RefList()
         self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
 
-        self._ActivityRecords = []
+        self._ActivityRecords = RefList()
         self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
 
-        self._ParentOrganisationRoles = []
+        self._ParentOrganisationRoles = RefList()
         self.ParentOrganisationRoles = [] if ParentOrganisationRoles is None else ParentOrganisationRoles
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
-        self._ChildOrganisationRoles = []
+        self._ChildOrganisationRoles = RefList()
         self.ChildOrganisationRoles = [] if ChildOrganisationRoles is None else ChildOrganisationRoles
 
-        self._PowerSystemResourceRoles = []
+        self._PowerSystemResourceRoles = RefList()
         self.PowerSystemResourceRoles = [] if PowerSystemResourceRoles is None else PowerSystemResourceRoles
 
-        self._LandPropertyRoles = []
+        self._LandPropertyRoles = RefList()
         self.LandPropertyRoles = [] if LandPropertyRoles is None else LandPropertyRoles
 
-        self._DocumentRoles = []
+        self._DocumentRoles = RefList()
         self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
 
         super(ErpOrganisation, self).__init__(*args, **kw_args)
@@ -123,20 +124,32 @@ class ErpOrganisation(Organisation):
 
     def setAssetRoles(self, value):
         for x in self._AssetRoles:
-            x.ErpOrganisation = None
-        for y in value:
-            y._ErpOrganisation = self
-        self._AssetRoles = value
+            x._ErpOrganisation = None
+        self._AssetRoles = RefList()
+        self.addAssetRoles(value)
 
     AssetRoles = property(getAssetRoles, setAssetRoles)
 
     def addAssetRoles(self, *AssetRoles):
-        for obj in AssetRoles:
-            obj.ErpOrganisation = self
+        collection = self._AssetRoles
+        for obj in members(AssetRoles):
+            old = obj._ErpOrganisation
+            if old is not None and old is not self:
+                old._AssetRoles.discard(obj)
+            obj._ErpOrganisation = self
+            collection.append(obj)
 
     def removeAssetRoles(self, *AssetRoles):
-        for obj in AssetRoles:
-            obj.ErpOrganisation = None
+        collection = self._AssetRoles
+        for obj in members(AssetRoles):
+            if obj._ErpOrganisation is self:
+                obj._ErpOrganisation = None
+                collection.discard(obj)
+
+    def removeAllAssetRoles(self):
+        for obj in self._AssetRoles:
+            obj._ErpOrganisation = None
+        self._AssetRoles = RefList()
 
     def getRequests(self):
         
@@ -144,20 +157,32 @@ class ErpOrganisation(Organisation):
 
     def setRequests(self, value):
         for x in self._Requests:
-            x.Organisation = None
-        for y in value:
-            y._Organisation = self
-        self._Requests = value
+            x._Organisation = None
+        self._Requests = RefList()
+        self.addRequests(value)
 
     Requests = property(getRequests, setRequests)
 
     def addRequests(self, *Requests):
-        for obj in Requests:
-            obj.Organisation = self
+        collection = self._Requests
+        for obj in members(Requests):
+            old = obj._Organisation
+            if old is not None and old is not self:
+                old._Requests.discard(obj)
+            obj._Organisation = self
+            collection.append(obj)
 
     def removeRequests(self, *Requests):
-        for obj in Requests:
-            obj.Organisation = None
+        collection = self._Requests
+        for obj in members(Requests):
+            if obj._Organisation is self:
+                obj._Organisation = None
+                collection.discard(obj)
+
+    def removeAllRequests(self):
+        for obj in self._Requests:
+            obj._Organisation = None
+        self._Requests = RefList()
 
     def getCrews(self):
         
@@ -165,26 +190,28 @@ class ErpOrganisation(Organisation):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.Organisations if q != self]
-            self._Crews._Organisations = filtered
-        for r in value:
-            if self not in r._Organisations:
-                r._Organisations.append(self)
-        self._Crews = value
+            p._Organisations.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._Organisations.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._Organisations:
-                obj._Organisations.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._Organisations.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._Organisations.discard(self)
+        self._Crews = RefList()
 
     def getChangeItems(self):
         
@@ -192,20 +219,32 @@ class ErpOrganisation(Organisation):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.Organisation = None
-        for y in value:
-            y._Organisation = self
-        self._ChangeItems = value
+            x._Organisation = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Organisation = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._Organisation
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._Organisation = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.Organisation = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._Organisation is self:
+                obj._Organisation = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._Organisation = None
+        self._ChangeItems = RefList()
 
     def getErpPersonRoles(self):
         
@@ -213,20 +252,32 @@ class ErpOrganisation(Organisation):
 
     def setErpPersonRoles(self, value):
         for x in self._ErpPersonRoles:
-            x.ErpOrganisation = None
-        for y in value:
-            y._ErpOrganisation = self
-        self._ErpPersonRoles = value
+            x._ErpOrganisation = None
+        self._ErpPersonRoles = RefList()
+        self.addErpPersonRoles(value)
 
     ErpPersonRoles = property(getErpPersonRoles, setErpPersonRoles)
 
     def addErpPersonRoles(self, *ErpPersonRoles):
-        for obj in ErpPersonRoles:
-            obj.ErpOrganisation = self
+        collection = self._ErpPersonRoles
+        for obj in members(ErpPersonRoles):
+            old = obj._ErpOrganisation
+            if old is not None and old is not self:
+                old._ErpPersonRoles.discard(obj)
+            obj._ErpOrganisation = self
+            collection.append(obj)
 
     def removeErpPersonRoles(self, *ErpPersonRoles):
-        for obj in ErpPersonRoles:
-            obj.ErpOrganisation = None
+        collection = self._ErpPersonRoles
+        for obj in members(ErpPersonRoles):
+            if obj._ErpOrganisation is self:
+                obj._ErpOrganisation = None
+                collection.discard(obj)
+
+    def removeAllErpPersonRoles(self):
+        for obj in self._ErpPersonRoles:
+            obj._ErpOrganisation = None
+        self._ErpPersonRoles = RefList()
 
     def getActivityRecords(self):
         
@@ -234,26 +285,28 @@ class ErpOrganisation(Organisation):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Organisations if q != self]
-            self._ActivityRecords._Organisations = filtered
-        for r in value:
-            if self not in r._Organisations:
-                r._Organisations.append(self)
-        self._ActivityRecords = value
+            p._Organisations.discard(self)
+        self._ActivityRecords = RefList()
+        self.addActivityRecords(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._ActivityRecords.append(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Organisations.append(self)
+            collection.append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self in obj._Organisations:
-                obj._Organisations.remove(self)
-            self._ActivityRecords.remove(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._Organisations.discard(self)
+            collection.discard(obj)
+
+    def removeAllActivityRecords(self):
+        for obj in self._ActivityRecords:
+            obj._Organisations.discard(self)
+        self._ActivityRecords = RefList()
 
     def getParentOrganisationRoles(self):
         
@@ -261,20 +314,32 @@ class ErpOrganisation(Organisation):
 
     def setParentOrganisationRoles(self, value):
         for x in self._ParentOrganisationRoles:
-            x.ChildOrganisation = None
-        for y in value:
-            y._ChildOrganisation = self
-        self._ParentOrganisationRoles = value
+            x._ChildOrganisation = None
+        self._ParentOrganisationRoles = RefList()
+        self.addParentOrganisationRoles(value)
 
     ParentOrganisationRoles = property(getParentOrganisationRoles, setParentOrganisationRoles)
 
     def addParentOrganisationRoles(self, *ParentOrganisationRoles):
-        for obj in ParentOrganisationRoles:
-            obj.ChildOrganisation = self
+        collection = self._ParentOrganisationRoles
+        for obj in members(ParentOrganisationRoles):
+            old = obj._ChildOrganisation
+            if old is not None and old is not self:
+                old._ParentOrganisationRoles.discard(obj)
+            obj._ChildOrganisation = self
+            collection.append(obj)
 
     def removeParentOrganisationRoles(self, *ParentOrganisationRoles):
-        for obj in ParentOrganisationRoles:
-            obj.ChildOrganisation = None
+        collection = self._ParentOrganisationRoles
+        for obj in members(ParentOrganisationRoles):
+            if obj._ChildOrganisation is self:
+                obj._ChildOrganisation = None
+                collection.discard(obj)
+
+    def removeAllParentOrganisationRoles(self):
+        for obj in self._ParentOrganisationRoles:
+            obj._ChildOrganisation = None
+        self._ParentOrganisationRoles = RefList()
 
     def getLocations(self):
         
@@ -282,26 +347,28 @@ class ErpOrganisation(Organisation):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.ErpOrganisations if q != self]
-            self._Locations._ErpOrganisations = filtered
-        for r in value:
-            if self not in r._ErpOrganisations:
-                r._ErpOrganisations.append(self)
-        self._Locations = value
+            p._ErpOrganisations.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._ErpOrganisations:
-                obj._ErpOrganisations.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._ErpOrganisations.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._ErpOrganisations:
-                obj._ErpOrganisations.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._ErpOrganisations.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._ErpOrganisations.discard(self)
+        self._Locations = RefList()
 
     def getChildOrganisationRoles(self):
         
@@ -309,20 +376,32 @@ class ErpOrganisation(Organisation):
 
     def setChildOrganisationRoles(self, value):
         for x in self._ChildOrganisationRoles:
-            x.ParentOrganisation = None
-        for y in value:
-            y._ParentOrganisation = self
-        self._ChildOrganisationRoles = value
+            x._ParentOrganisation = None
+        self._ChildOrganisationRoles = RefList()
+        self.addChildOrganisationRoles(value)
 
     ChildOrganisationRoles = property(getChildOrganisationRoles, setChildOrganisationRoles)
 
     def addChildOrganisationRoles(self, *ChildOrganisationRoles):
-        for obj in ChildOrganisationRoles:
-            obj.ParentOrganisation = self
+        collection = self._ChildOrganisationRoles
+        for obj in members(ChildOrganisationRoles):
+            old = obj._ParentOrganisation
+            if old is not None and old is not self:
+                old._ChildOrganisationRoles.discard(obj)
+            obj._ParentOrganisation = self
+            collection.append(obj)
 
     def removeChildOrganisationRoles(self, *ChildOrganisationRoles):
-        for obj in ChildOrganisationRoles:
-            obj.ParentOrganisation = None
+        collection = self._ChildOrganisationRoles
+        for obj in members(ChildOrganisationRoles):
+            if obj._ParentOrganisation is self:
+                obj._ParentOrganisation = None
+                collection.discard(obj)
+
+    def removeAllChildOrganisationRoles(self):
+        for obj in self._ChildOrganisationRoles:
+            obj._ParentOrganisation = None
+        self._ChildOrganisationRoles = RefList()
 
     def getPowerSystemResourceRoles(self):
         
@@ -330,20 +409,32 @@ class ErpOrganisation(Organisation):
 
     def setPowerSystemResourceRoles(self, value):
         for x in self._PowerSystemResourceRoles:
-            x.ErpOrganisation = None
-        for y in value:
-            y._ErpOrganisation = self
-        self._PowerSystemResourceRoles = value
+            x._ErpOrganisation = None
+        self._PowerSystemResourceRoles = RefList()
+        self.addPowerSystemResourceRoles(value)
 
     PowerSystemResourceRoles = property(getPowerSystemResourceRoles, setPowerSystemResourceRoles)
 
     def addPowerSystemResourceRoles(self, *PowerSystemResourceRoles):
-        for obj in PowerSystemResourceRoles:
-            obj.ErpOrganisation = self
+        collection = self._PowerSystemResourceRoles
+        for obj in members(PowerSystemResourceRoles):
+            old = obj._ErpOrganisation
+            if old is not None and old is not self:
+                old._PowerSystemResourceRoles.discard(obj)
+            obj._ErpOrganisation = self
+            collection.append(obj)
 
     def removePowerSystemResourceRoles(self, *PowerSystemResourceRoles):
-        for obj in PowerSystemResourceRoles:
-            obj.ErpOrganisation = None
+        collection = self._PowerSystemResourceRoles
+        for obj in members(PowerSystemResourceRoles):
+            if obj._ErpOrganisation is self:
+                obj._ErpOrganisation = None
+                collection.discard(obj)
+
+    def removeAllPowerSystemResourceRoles(self):
+        for obj in self._PowerSystemResourceRoles:
+            obj._ErpOrganisation = None
+        self._PowerSystemResourceRoles = RefList()
 
     def getLandPropertyRoles(self):
         
@@ -351,20 +442,32 @@ class ErpOrganisation(Organisation):
 
     def setLandPropertyRoles(self, value):
         for x in self._LandPropertyRoles:
-            x.ErpOrganisation = None
-        for y in value:
-            y._ErpOrganisation = self
-        self._LandPropertyRoles = value
+            x._ErpOrganisation = None
+        self._LandPropertyRoles = RefList()
+        self.addLandPropertyRoles(value)
 
     LandPropertyRoles = property(getLandPropertyRoles, setLandPropertyRoles)
 
     def addLandPropertyRoles(self, *LandPropertyRoles):
-        for obj in LandPropertyRoles:
-            obj.ErpOrganisation = self
+        collection = self._LandPropertyRoles
+        for obj in members(LandPropertyRoles):
+            old = obj._ErpOrganisation
+            if old is not None and old is not self:
+                old._LandPropertyRoles.discard(obj)
+            obj._ErpOrganisation = self
+            collection.append(obj)
 
     def removeLandPropertyRoles(self, *LandPropertyRoles):
-        for obj in LandPropertyRoles:
-            obj.ErpOrganisation = None
+        collection = self._LandPropertyRoles
+        for obj in members(LandPropertyRoles):
+            if obj._ErpOrganisation is self:
+                obj._ErpOrganisation = None
+                collection.discard(obj)
+
+    def removeAllLandPropertyRoles(self):
+        for obj in self._LandPropertyRoles:
+            obj._ErpOrganisation = None
+        self._LandPropertyRoles = RefList()
 
     def getDocumentRoles(self):
         
@@ -372,18 +475,30 @@ class ErpOrganisation(Organisation):
 
     def setDocumentRoles(self, value):
         for x in self._DocumentRoles:
-            x.ErpOrganisation = None
-        for y in value:
-            y._ErpOrganisation = self
-        self._DocumentRoles = value
+            x._ErpOrganisation = None
+        self._DocumentRoles = RefList()
+        self.addDocumentRoles(value)
 
     DocumentRoles = property(getDocumentRoles, setDocumentRoles)
 
     def addDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.ErpOrganisation = self
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            old = obj._ErpOrganisation
+            if old is not None and old is not self:
+                old._DocumentRoles.discard(obj)
+            obj._ErpOrganisation = self
+            collection.append(obj)
 
     def removeDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.ErpOrganisation = None
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            if obj._ErpOrganisation is self:
+                obj._ErpOrganisation = None
+                collection.discard(obj)
+
+    def removeAllDocumentRoles(self):
+        for obj in self._DocumentRoles:
+            obj._ErpOrganisation = None
+        self._DocumentRoles = RefList()
 
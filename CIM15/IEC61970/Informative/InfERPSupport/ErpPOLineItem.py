@@ -63,8 +63,7 @@ class ErpPOLineItem(Document):
 
     def setErpPurchaseOrder(self, value):
         if self._ErpPurchaseOrder is not None:
-            filtered = [x for x in self.ErpPurchaseOrder.ErpPOLineItems if x != self]
-            self._ErpPurchaseOrder._ErpPOLineItems = filtered
+            self._ErpPurchaseOrder._ErpPOLineItems.discard(self)
 
         self._ErpPurchaseOrder = value
         if self._ErpPurchaseOrder is not None:
@@ -94,8 +93,7 @@ class ErpPOLineItem(Document):
 
     def setAssetModelCatalogueItem(self, value):
         if self._AssetModelCatalogueItem is not None:
-            filtered = [x for x in self.AssetModelCatalogueItem.ErpPOLineItems if x != self]
-            self._AssetModelCatalogueItem._ErpPOLineItems = filtered
+            self._AssetModelCatalogueItem._ErpPOLineItems.discard(self)
 
         self._AssetModelCatalogueItem = value
         if self._AssetModelCatalogueItem is not None:
@@ -110,8 +108,7 @@ class ErpPOLineItem(Document):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.ErpPOLineItems if x != self]
-            self._MaterialItem._ErpPOLineItems = filtered
+            self._MaterialItem._ErpPOLineItems.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
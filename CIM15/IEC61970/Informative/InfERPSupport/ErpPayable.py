@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpPayable(Document):
     """A transaction that represents an invoice from a supplier. A payable (or voucher) is an open item, approved and ready for payment, in the Accounts Payable ledger.A transaction that represents an invoice from a supplier. A payable (or voucher) is an open item, approved and ready for payment, in the Accounts Payable ledger.
@@ -30,10 +31,10 @@ class ErpPayable(Document):
         @param ContractorItems:
         @param ErpPayableLineItems:
         """
-        self._ContractorItems = []
+        self._ContractorItems = RefList()
         self.ContractorItems = [] if ContractorItems is None else ContractorItems
 
-        self._ErpPayableLineItems = []
+        self._ErpPayableLineItems = RefList()
         self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
 
         super(ErpPayable, self).__init__(*args, **kw_args)
@@ -51,26 +52,28 @@ class ErpPayable(Document):
 
     def setContractorItems(self, value):
         for p in self._ContractorItems:
-            filtered = [q for q in p.ErpPayables if q != self]
-            self._ContractorItems._ErpPayables = filtered
-        for r in value:
-            if self not in r._ErpPayables:
-                r._ErpPayables.append(self)
-        self._ContractorItems = value
+            p._ErpPayables.discard(self)
+        self._ContractorItems = RefList()
+        self.addContractorItems(value)
 
     ContractorItems = property(getContractorItems, setContractorItems)
 
     def addContractorItems(self, *ContractorItems):
-        for obj in ContractorItems:
-            if self not in obj._ErpPayables:
-                obj._ErpPayables.append(self)
-            self._ContractorItems.append(obj)
+        collection = self._ContractorItems
+        for obj in members(ContractorItems):
+            obj._ErpPayables.append(self)
+            collection.append(obj)
 
     def removeContractorItems(self, *ContractorItems):
-        for obj in ContractorItems:
-            if self in obj._ErpPayables:
-                obj._ErpPayables.remove(self)
-            self._ContractorItems.remove(obj)
+        collection = self._ContractorItems
+        for obj in members(ContractorItems):
+            obj._ErpPayables.discard(self)
+            collection.discard(obj)
+
+    def removeAllContractorItems(self):
+        for obj in self._ContractorItems:
+            obj._ErpPayables.discard(self)
+        self._ContractorItems = RefList()
 
     def getErpPayableLineItems(self):
         
@@ -78,18 +81,30 @@ class ErpPayable(Document):
 
     def setErpPayableLineItems(self, value):
         for x in self._ErpPayableLineItems:
-            x.ErpPayable = None
-        for y in value:
-            y._ErpPayable = self
-        self._ErpPayableLineItems = value
+            x._ErpPayable = None
+        self._ErpPayableLineItems = RefList()
+        self.addErpPayableLineItems(value)
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
-        for obj in ErpPayableLineItems:
-            obj.ErpPayable = self
+        collection = self._ErpPayableLineItems
+        for obj in members(ErpPayableLineItems):
+            old = obj._ErpPayable
+            if old is not None and old is not self:
+                old._ErpPayableLineItems.discard(obj)
+            obj._ErpPayable = self
+            collection.append(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
-        for obj in ErpPayableLineItems:
-            obj.ErpPayable = None
+        collection = self._ErpPayableLineItems
+        for obj in members(ErpPayableLineItems):
+            if obj._ErpPayable is self:
+                obj._ErpPayable = None
+                collection.discard(obj)
+
+    def removeAllErpPayableLineItems(self):
+        for obj in self._ErpPayableLineItems:
+            obj._ErpPayable = None
+        self._ErpPayableLineItems = RefList()
 
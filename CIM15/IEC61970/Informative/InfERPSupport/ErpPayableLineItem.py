@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpPayableLineItem(IdentifiedObject):
     """Of an ErpPayable, a line item references an ErpInvoiceLineitem or other source such as credit memos.Of an ErpPayable, a line item references an ErpInvoiceLineitem or other source such as credit memos.
@@ -33,10 +34,10 @@ class ErpPayableLineItem(IdentifiedObject):
         @param ErpPayable:
         @param status:
         """
-        self._ErpPayments = []
+        self._ErpPayments = RefList()
         self.ErpPayments = [] if ErpPayments is None else ErpPayments
 
-        self._ErpJournalEntries = []
+        self._ErpJournalEntries = RefList()
         self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
 
         self._ErpInvoiceLineItem = None
@@ -62,26 +63,28 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpPayments(self, value):
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpPayableLineItems if q != self]
-            self._ErpPayments._ErpPayableLineItems = filtered
-        for r in value:
-            if self not in r._ErpPayableLineItems:
-                r._ErpPayableLineItems.append(self)
-        self._ErpPayments = value
+            p._ErpPayableLineItems.discard(self)
+        self._ErpPayments = RefList()
+        self.addErpPayments(value)
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
-        for obj in ErpPayments:
-            if self not in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.append(self)
-            self._ErpPayments.append(obj)
+        collection = self._ErpPayments
+        for obj in members(ErpPayments):
+            obj._ErpPayableLineItems.append(self)
+            collection.append(obj)
 
     def removeErpPayments(self, *ErpPayments):
-        for obj in ErpPayments:
-            if self in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.remove(self)
-            self._ErpPayments.remove(obj)
+        collection = self._ErpPayments
+        for obj in members(ErpPayments):
+            obj._ErpPayableLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPayments(self):
+        for obj in self._ErpPayments:
+            obj._ErpPayableLineItems.discard(self)
+        self._ErpPayments = RefList()
 
     def getErpJournalEntries(self):
         
@@ -89,26 +92,28 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpJournalEntries(self, value):
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.ErpPayableLineItems if q != self]
-            self._ErpJournalEntries._ErpPayableLineItems = filtered
-        for r in value:
-            if self not in r._ErpPayableLineItems:
-                r._ErpPayableLineItems.append(self)
-        self._ErpJournalEntries = value
+            p._ErpPayableLineItems.discard(self)
+        self._ErpJournalEntries = RefList()
+        self.addErpJournalEntries(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            if self not in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.append(self)
-            self._ErpJournalEntries.append(obj)
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            obj._ErpPayableLineItems.append(self)
+            collection.append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            if self in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.remove(self)
-            self._ErpJournalEntries.remove(obj)
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            obj._ErpPayableLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpJournalEntries(self):
+        for obj in self._ErpJournalEntries:
+            obj._ErpPayableLineItems.discard(self)
+        self._ErpJournalEntries = RefList()
 
     def getErpInvoiceLineItem(self):
         
@@ -131,8 +136,7 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpPayable(self, value):
         if self._ErpPayable is not None:
-            filtered = [x for x in self.ErpPayable.ErpPayableLineItems if x != self]
-            self._ErpPayable._ErpPayableLineItems = filtered
+            self._ErpPayable._ErpPayableLineItems.discard(self)
 
         self._ErpPayable = value
         if self._ErpPayable is not None:
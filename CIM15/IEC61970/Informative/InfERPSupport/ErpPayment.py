@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpPayment(Document):
     """Payment infromation and status for any individual line item of an ErpInvoice (e.g., when payment is from a customer). ErpPayable is also updated when payment is to a supplier and ErpReceivable is updated when payment is from a customer. Multiple payments can be made against a single line item and an individual payment can apply to more that one line item.Payment infromation and status for any individual line item of an ErpInvoice (e.g., when payment is from a customer). ErpPayable is also updated when payment is to a supplier and ErpReceivable is updated when payment is from a customer. Multiple payments can be made against a single line item and an individual payment can apply to more that one line item.
@@ -35,13 +36,13 @@ class ErpPayment(Document):
         #: Payment terms (e.g., net 30).
         self.termsPayment = termsPayment
 
-        self._ErpRecLineItems = []
+        self._ErpRecLineItems = RefList()
         self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
 
-        self._ErpPayableLineItems = []
+        self._ErpPayableLineItems = RefList()
         self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
 
-        self._ErpInvoiceLineItems = []
+        self._ErpInvoiceLineItems = RefList()
         self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
 
         super(ErpPayment, self).__init__(*args, **kw_args)
@@ -59,26 +60,28 @@ class ErpPayment(Document):
 
     def setErpRecLineItems(self, value):
         for p in self._ErpRecLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpRecLineItems._ErpPayments = filtered
-        for r in value:
-            if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
-        self._ErpRecLineItems = value
+            p._ErpPayments.discard(self)
+        self._ErpRecLineItems = RefList()
+        self.addErpRecLineItems(value)
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
-        for obj in ErpRecLineItems:
-            if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpRecLineItems.append(obj)
+        collection = self._ErpRecLineItems
+        for obj in members(ErpRecLineItems):
+            obj._ErpPayments.append(self)
+            collection.append(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
-        for obj in ErpRecLineItems:
-            if self in obj._ErpPayments:
-                obj._ErpPayments.remove(self)
-            self._ErpRecLineItems.remove(obj)
+        collection = self._ErpRecLineItems
+        for obj in members(ErpRecLineItems):
+            obj._ErpPayments.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpRecLineItems(self):
+        for obj in self._ErpRecLineItems:
+            obj._ErpPayments.discard(self)
+        self._ErpRecLineItems = RefList()
 
     def getErpPayableLineItems(self):
         
@@ -86,26 +89,28 @@ class ErpPayment(Document):
 
     def setErpPayableLineItems(self, value):
         for p in self._ErpPayableLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpPayableLineItems._ErpPayments = filtered
-        for r in value:
-            if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
-        self._ErpPayableLineItems = value
+            p._ErpPayments.discard(self)
+        self._ErpPayableLineItems = RefList()
+        self.addErpPayableLineItems(value)
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
-        for obj in ErpPayableLineItems:
-            if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpPayableLineItems.append(obj)
+        collection = self._ErpPayableLineItems
+        for obj in members(ErpPayableLineItems):
+            obj._ErpPayments.append(self)
+            collection.append(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
-        for obj in ErpPayableLineItems:
-            if self in obj._ErpPayments:
-                obj._ErpPayments.remove(self)
-            self._ErpPayableLineItems.remove(obj)
+        collection = self._ErpPayableLineItems
+        for obj in members(ErpPayableLineItems):
+            obj._ErpPayments.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPayableLineItems(self):
+        for obj in self._ErpPayableLineItems:
+            obj._ErpPayments.discard(self)
+        self._ErpPayableLineItems = RefList()
 
     def getErpInvoiceLineItems(self):
         
@@ -113,24 +118,26 @@ class ErpPayment(Document):
 
     def setErpInvoiceLineItems(self, value):
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpInvoiceLineItems._ErpPayments = filtered
-        for r in value:
-            if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
-        self._ErpInvoiceLineItems = value
+            p._ErpPayments.discard(self)
+        self._ErpInvoiceLineItems = RefList()
+        self.addErpInvoiceLineItems(value)
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            obj._ErpPayments.append(self)
+            collection.append(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
-        for obj in ErpInvoiceLineItems:
-            if self in obj._ErpPayments:
-                obj._ErpPayments.remove(self)
-            self._ErpInvoiceLineItems.remove(obj)
+        collection = self._ErpInvoiceLineItems
+        for obj in members(ErpInvoiceLineItems):
+            obj._ErpPayments.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpInvoiceLineItems(self):
+        for obj in self._ErpInvoiceLineItems:
+            obj._ErpPayments.discard(self)
+        self._ErpInvoiceLineItems = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpPerson(IdentifiedObject):
     """General purpose information for name and other information to contact people.General purpose information for name and other information to contact people.
@@ -84,55 +85,55 @@ class ErpPerson(IdentifiedObject):
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._ErpOrganisationRoles = []
+        self._ErpOrganisationRoles = RefList()
         self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
 
-        self._Appointments = []
+        self._Appointments = RefList()
         self.Appointments = [] if Appointments is None else Appointments
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
-        self._LaborItems = []
+        self._LaborItems = RefList()
         self.LaborItems = [] if LaborItems is None else LaborItems
 
-        self._LandPropertyRoles = []
+        self._LandPropertyRoles = RefList()
         self.LandPropertyRoles = [] if LandPropertyRoles is None else LandPropertyRoles
 
-        self._ActivityRecords = []
+        self._ActivityRecords = RefList()
         self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
 
-        self._MeasurementValues = []
+        self._MeasurementValues = RefList()
         self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
 
-        self._Skills = []
+        self._Skills = RefList()
         self.Skills = [] if Skills is None else Skills
 
         self.landlinePhone = landlinePhone
 
         self.mobilePhone = mobilePhone
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
         self.status = status
 
-        self._DocumentRoles = []
+        self._DocumentRoles = RefList()
         self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
 
         self._ErpPersonnel = None
         self.ErpPersonnel = ErpPersonnel
 
-        self._Crafts = []
+        self._Crafts = RefList()
         self.Crafts = [] if Crafts is None else Crafts
 
         self._CustomerData = None
         self.CustomerData = CustomerData
 
-        self._CallBacks = []
+        self._CallBacks = RefList()
         self.CallBacks = [] if CallBacks is None else CallBacks
 
-        self._SwitchingStepRoles = []
+        self._SwitchingStepRoles = RefList()
         self.SwitchingStepRoles = [] if SwitchingStepRoles is None else SwitchingStepRoles
 
         self.electronicAddress = electronicAddress
@@ -155,8 +156,7 @@ class ErpPerson(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ErpPersons if x != self]
-            self._ServiceLocation._ErpPersons = filtered
+            self._ServiceLocation._ErpPersons.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
@@ -171,20 +171,32 @@ class ErpPerson(IdentifiedObject):
 
     def setErpOrganisationRoles(self, value):
         for x in self._ErpOrganisationRoles:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._ErpOrganisationRoles = value
+            x._ErpPerson = None
+        self._ErpOrganisationRoles = RefList()
+        self.addErpOrganisationRoles(value)
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.ErpPerson = self
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._ErpOrganisationRoles.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            obj.ErpPerson = None
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllErpOrganisationRoles(self):
+        for obj in self._ErpOrganisationRoles:
+            obj._ErpPerson = None
+        self._ErpOrganisationRoles = RefList()
 
     def getAppointments(self):
         
@@ -192,26 +204,28 @@ class ErpPerson(IdentifiedObject):
 
     def setAppointments(self, value):
         for p in self._Appointments:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._Appointments._ErpPersons = filtered
-        for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._Appointments = value
+            p._ErpPersons.discard(self)
+        self._Appointments = RefList()
+        self.addAppointments(value)
 
     Appointments = property(getAppointments, setAppointments)
 
     def addAppointments(self, *Appointments):
-        for obj in Appointments:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._Appointments.append(obj)
+        collection = self._Appointments
+        for obj in members(Appointments):
+            obj._ErpPersons.append(self)
+            collection.append(obj)
 
     def removeAppointments(self, *Appointments):
-        for obj in Appointments:
-            if self in obj._ErpPersons:
-                obj._ErpPersons.remove(self)
-            self._Appointments.remove(obj)
+        collection = self._Appointments
+        for obj in members(Appointments):
+            obj._ErpPersons.discard(self)
+            collection.discard(obj)
+
+    def removeAllAppointments(self):
+        for obj in self._Appointments:
+            obj._ErpPersons.discard(self)
+        self._Appointments = RefList()
 
     def getCrews(self):
         """All Crews to which this ErpPerson belongs.
@@ -220,26 +234,28 @@ class ErpPerson(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.CrewMembers if q != self]
-            self._Crews._CrewMembers = filtered
-        for r in value:
-            if self not in r._CrewMembers:
-                r._CrewMembers.append(self)
-        self._Crews = value
+            p._CrewMembers.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._CrewMembers:
-                obj._CrewMembers.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._CrewMembers.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._CrewMembers:
-                obj._CrewMembers.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._CrewMembers.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._CrewMembers.discard(self)
+        self._Crews = RefList()
 
     def getLaborItems(self):
         
@@ -247,26 +263,28 @@ class ErpPerson(IdentifiedObject):
 
     def setLaborItems(self, value):
         for p in self._LaborItems:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._LaborItems._ErpPersons = filtered
-        for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._LaborItems = value
+            p._ErpPersons.discard(self)
+        self._LaborItems = RefList()
+        self.addLaborItems(value)
 
     LaborItems = property(getLaborItems, setLaborItems)
 
     def addLaborItems(self, *LaborItems):
-        for obj in LaborItems:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._LaborItems.append(obj)
+        collection = self._LaborItems
+        for obj in members(LaborItems):
+            obj._ErpPersons.append(self)
+            collection.append(obj)
 
     def removeLaborItems(self, *LaborItems):
-        for obj in LaborItems:
-            if self in obj._ErpPersons:
-                obj._ErpPersons.remove(self)
-            self._LaborItems.remove(obj)
+        collection = self._LaborItems
+        for obj in members(LaborItems):
+            obj._ErpPersons.discard(self)
+            collection.discard(obj)
+
+    def removeAllLaborItems(self):
+        for obj in self._LaborItems:
+            obj._ErpPersons.discard(self)
+        self._LaborItems = RefList()
 
     def getLandPropertyRoles(self):
         
@@ -274,20 +292,32 @@ class ErpPerson(IdentifiedObject):
 
     def setLandPropertyRoles(self, value):
         for x in self._LandPropertyRoles:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._LandPropertyRoles = value
+            x._ErpPerson = None
+        self._LandPropertyRoles = RefList()
+        self.addLandPropertyRoles(value)
 
     LandPropertyRoles = property(getLandPropertyRoles, setLandPropertyRoles)
 
     def addLandPropertyRoles(self, *LandPropertyRoles):
-        for obj in LandPropertyRoles:
-            obj.ErpPerson = self
+        collection = self._LandPropertyRoles
+        for obj in members(LandPropertyRoles):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._LandPropertyRoles.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeLandPropertyRoles(self, *LandPropertyRoles):
-        for obj in LandPropertyRoles:
-            obj.ErpPerson = None
+        collection = self._LandPropertyRoles
+        for obj in members(LandPropertyRoles):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllLandPropertyRoles(self):
+        for obj in self._LandPropertyRoles:
+            obj._ErpPerson = None
+        self._LandPropertyRoles = RefList()
 
     def getActivityRecords(self):
         
@@ -295,26 +325,28 @@ class ErpPerson(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._ActivityRecords._ErpPersons = filtered
-        for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._ActivityRecords = value
+            p._ErpPersons.discard(self)
+        self._ActivityRecords = RefList()
+        self.addActivityRecords(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._ActivityRecords.append(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._ErpPersons.append(self)
+            collection.append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
-        for obj in ActivityRecords:
-            if self in obj._ErpPersons:
-                obj._ErpPersons.remove(self)
-            self._ActivityRecords.remove(obj)
+        collection = self._ActivityRecords
+        for obj in members(ActivityRecords):
+            obj._ErpPersons.discard(self)
+            collection.discard(obj)
+
+    def removeAllActivityRecords(self):
+        for obj in self._ActivityRecords:
+            obj._ErpPersons.discard(self)
+        self._ActivityRecords = RefList()
 
     def getMeasurementValues(self):
         
@@ -322,20 +354,32 @@ class ErpPerson(IdentifiedObject):
 
     def setMeasurementValues(self, value):
         for x in self._MeasurementValues:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._MeasurementValues = value
+            x._ErpPerson = None
+        self._MeasurementValues = RefList()
+        self.addMeasurementValues(value)
 
     MeasurementValues = property(getMeasurementValues, setMeasurementValues)
 
     def addMeasurementValues(self, *MeasurementValues):
-        for obj in MeasurementValues:
-            obj.ErpPerson = self
+        collection = self._MeasurementValues
+        for obj in members(MeasurementValues):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._MeasurementValues.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeMeasurementValues(self, *MeasurementValues):
-        for obj in MeasurementValues:
-            obj.ErpPerson = None
+        collection = self._MeasurementValues
+        for obj in members(MeasurementValues):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllMeasurementValues(self):
+        for obj in self._MeasurementValues:
+            obj._ErpPerson = None
+        self._MeasurementValues = RefList()
 
     def getSkills(self):
         
@@ -343,20 +387,32 @@ class ErpPerson(IdentifiedObject):
 
     def setSkills(self, value):
         for x in self._Skills:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._Skills = value
+            x._ErpPerson = None
+        self._Skills = RefList()
+        self.addSkills(value)
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
-        for obj in Skills:
-            obj.ErpPerson = self
+        collection = self._Skills
+        for obj in members(Skills):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._Skills.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeSkills(self, *Skills):
-        for obj in Skills:
-            obj.ErpPerson = None
+        collection = self._Skills
+        for obj in members(Skills):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllSkills(self):
+        for obj in self._Skills:
+            obj._ErpPerson = None
+        self._Skills = RefList()
 
     # Landline phone number.
     landlinePhone = None
@@ -370,20 +426,32 @@ class ErpPerson(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._ChangeItems = value
+            x._ErpPerson = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.ErpPerson = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.ErpPerson = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._ErpPerson = None
+        self._ChangeItems = RefList()
 
     status = None
 
@@ -393,20 +461,32 @@ class ErpPerson(IdentifiedObject):
 
     def setDocumentRoles(self, value):
         for x in self._DocumentRoles:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._DocumentRoles = value
+            x._ErpPerson = None
+        self._DocumentRoles = RefList()
+        self.addDocumentRoles(value)
 
     DocumentRoles = property(getDocumentRoles, setDocumentRoles)
 
     def addDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.ErpPerson = self
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._DocumentRoles.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeDocumentRoles(self, *DocumentRoles):
-        for obj in DocumentRoles:
-            obj.ErpPerson = None
+        collection = self._DocumentRoles
+        for obj in members(DocumentRoles):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllDocumentRoles(self):
+        for obj in self._DocumentRoles:
+            obj._ErpPerson = None
+        self._DocumentRoles = RefList()
 
     def getErpPersonnel(self):
         
@@ -414,8 +494,7 @@ class ErpPerson(IdentifiedObject):
 
     def setErpPersonnel(self, value):
         if self._ErpPersonnel is not None:
-            filtered = [x for x in self.ErpPersonnel.ErpPersons if x != self]
-            self._ErpPersonnel._ErpPersons = filtered
+            self._ErpPersonnel._ErpPersons.discard(self)
 
         self._ErpPersonnel = value
         if self._ErpPersonnel is not None:
@@ -430,26 +509,28 @@ class ErpPerson(IdentifiedObject):
 
     def setCrafts(self, value):
         for p in self._Crafts:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._Crafts._ErpPersons = filtered
-        for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._Crafts = value
+            p._ErpPersons.discard(self)
+        self._Crafts = RefList()
+        self.addCrafts(value)
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
-        for obj in Crafts:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._Crafts.append(obj)
+        collection = self._Crafts
+        for obj in members(Crafts):
+            obj._ErpPersons.append(self)
+            collection.append(obj)
 
     def removeCrafts(self, *Crafts):
-        for obj in Crafts:
-            if self in obj._ErpPersons:
-                obj._ErpPersons.remove(self)
-            self._Crafts.remove(obj)
+        collection = self._Crafts
+        for obj in members(Crafts):
+            obj._ErpPersons.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrafts(self):
+        for obj in self._Crafts:
+            obj._ErpPersons.discard(self)
+        self._Crafts = RefList()
 
     def getCustomerData(self):
         
@@ -457,8 +538,7 @@ class ErpPerson(IdentifiedObject):
 
     def setCustomerData(self, value):
         if self._CustomerData is not None:
-            filtered = [x for x in self.CustomerData.ErpPersons if x != self]
-            self._CustomerData._ErpPersons = filtered
+            self._CustomerData._ErpPersons.discard(self)
 
         self._CustomerData = value
         if self._CustomerData is not None:
@@ -473,26 +553,28 @@ class ErpPerson(IdentifiedObject):
 
     def setCallBacks(self, value):
         for p in self._CallBacks:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._CallBacks._ErpPersons = filtered
-        for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._CallBacks = value
+            p._ErpPersons.discard(self)
+        self._CallBacks = RefList()
+        self.addCallBacks(value)
 
     CallBacks = property(getCallBacks, setCallBacks)
 
     def addCallBacks(self, *CallBacks):
-        for obj in CallBacks:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._CallBacks.append(obj)
+        collection = self._CallBacks
+        for obj in members(CallBacks):
+            obj._ErpPersons.append(self)
+            collection.append(obj)
 
     def removeCallBacks(self, *CallBacks):
-        for obj in CallBacks:
-            if self in obj._ErpPersons:
-                obj._ErpPersons.remove(self)
-            self._CallBacks.remove(obj)
+        collection = self._CallBacks
+        for obj in members(CallBacks):
+            obj._ErpPersons.discard(self)
+            collection.discard(obj)
+
+    def removeAllCallBacks(self):
+        for obj in self._CallBacks:
+            obj._ErpPersons.discard(self)
+        self._CallBacks = RefList()
 
     def getSwitchingStepRoles(self):
         
@@ -500,20 +582,32 @@ class ErpPerson(IdentifiedObject):
 
     def setSwitchingStepRoles(self, value):
         for x in self._SwitchingStepRoles:
-            x.ErpPerson = None
-        for y in value:
-            y._ErpPerson = self
-        self._SwitchingStepRoles = value
+            x._ErpPerson = None
+        self._SwitchingStepRoles = RefList()
+        self.addSwitchingStepRoles(value)
 
     SwitchingStepRoles = property(getSwitchingStepRoles, setSwitchingStepRoles)
 
     def addSwitchingStepRoles(self, *SwitchingStepRoles):
-        for obj in SwitchingStepRoles:
-            obj.ErpPerson = self
+        collection = self._SwitchingStepRoles
+        for obj in members(SwitchingStepRoles):
+            old = obj._ErpPerson
+            if old is not None and old is not self:
+                old._SwitchingStepRoles.discard(obj)
+            obj._ErpPerson = self
+            collection.append(obj)
 
     def removeSwitchingStepRoles(self, *SwitchingStepRoles):
-        for obj in SwitchingStepRoles:
-            obj.ErpPerson = None
+        collection = self._SwitchingStepRoles
+        for obj in members(SwitchingStepRoles):
+            if obj._ErpPerson is self:
+                obj._ErpPerson = None
+                collection.discard(obj)
+
+    def removeAllSwitchingStepRoles(self):
+        for obj in self._SwitchingStepRoles:
+            obj._ErpPerson = None
+        self._SwitchingStepRoles = RefList()
 
     # Electronic address.
     electronicAddress = None
@@ -524,8 +618,7 @@ class ErpPerson(IdentifiedObject):
 
     def setErpCompetency(self, value):
         if self._ErpCompetency is not None:
-            filtered = [x for x in self.ErpCompetency.ErpPersons if x != self]
-            self._ErpCompetency._ErpPersons = filtered
+            self._ErpCompetency._ErpPersons.discard(self)
 
         self._ErpCompetency = value
         if self._ErpCompetency is not None:
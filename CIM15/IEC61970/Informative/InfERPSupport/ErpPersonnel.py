@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpPersonnel(IdentifiedObject):
     """Information that applies to the basic data about a utility person, used by ERP applications to transfer Personnel data for a worker.Information that applies to the basic data about a utility person, used by ERP applications to transfer Personnel data for a worker.
@@ -32,7 +33,7 @@ class ErpPersonnel(IdentifiedObject):
         """
         self.status = status
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
         super(ErpPersonnel, self).__init__(*args, **kw_args)
@@ -52,18 +53,30 @@ class ErpPersonnel(IdentifiedObject):
 
     def setErpPersons(self, value):
         for x in self._ErpPersons:
-            x.ErpPersonnel = None
-        for y in value:
-            y._ErpPersonnel = self
-        self._ErpPersons = value
+            x._ErpPersonnel = None
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.ErpPersonnel = self
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            old = obj._ErpPersonnel
+            if old is not None and old is not self:
+                old._ErpPersons.discard(obj)
+            obj._ErpPersonnel = self
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            obj.ErpPersonnel = None
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            if obj._ErpPersonnel is self:
+                obj._ErpPersonnel = None
+                collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._ErpPersonnel = None
+        self._ErpPersons = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpProjectAccounting(Document):
     """Utility Project Accounting information, used by ERP applications to enable all relevant sub-systems that submit single sided transactions to transfer information with a Project Accounting Application. This would include, but not necessarily be limited to: Accounts Payable, Accounts Receivable, Budget, Order Management, Purchasing, Time and Labor, Travel and Expense.Utility Project Accounting information, used by ERP applications to enable all relevant sub-systems that submit single sided transactions to transfer information with a Project Accounting Application. This would include, but not necessarily be limited to: Accounts Payable, Accounts Receivable, Budget, Order Management, Purchasing, Time and Labor, Travel and Expense.
@@ -32,16 +33,16 @@ class ErpProjectAccounting(Document):
         @param ErpTimeEntries:
         @param WorkCostDetails:
         """
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
-        self._Projects = []
+        self._Projects = RefList()
         self.Projects = [] if Projects is None else Projects
 
-        self._ErpTimeEntries = []
+        self._ErpTimeEntries = RefList()
         self.ErpTimeEntries = [] if ErpTimeEntries is None else ErpTimeEntries
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
         super(ErpProjectAccounting, self).__init__(*args, **kw_args)
@@ -59,20 +60,32 @@ class ErpProjectAccounting(Document):
 
     def setWorks(self, value):
         for x in self._Works:
-            x.ErpProjectAccounting = None
-        for y in value:
-            y._ErpProjectAccounting = self
-        self._Works = value
+            x._ErpProjectAccounting = None
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            obj.ErpProjectAccounting = self
+        collection = self._Works
+        for obj in members(Works):
+            old = obj._ErpProjectAccounting
+            if old is not None and old is not self:
+                old._Works.discard(obj)
+            obj._ErpProjectAccounting = self
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            obj.ErpProjectAccounting = None
+        collection = self._Works
+        for obj in members(Works):
+            if obj._ErpProjectAccounting is self:
+                obj._ErpProjectAccounting = None
+                collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._ErpProjectAccounting = None
+        self._Works = RefList()
 
     def getProjects(self):
         
@@ -80,20 +93,32 @@ class ErpProjectAccounting(Document):
 
     def setProjects(self, value):
         for x in self._Projects:
-            x.ErpProjectAccounting = None
-        for y in value:
-            y._ErpProjectAccounting = self
-        self._Projects = value
+            x._ErpProjectAccounting = None
+        self._Projects = RefList()
+        self.addProjects(value)
 
     Projects = property(getProjects, setProjects)
 
     def addProjects(self, *Projects):
-        for obj in Projects:
-            obj.ErpProjectAccounting = self
+        collection = self._Projects
+        for obj in members(Projects):
+            old = obj._ErpProjectAccounting
+            if old is not None and old is not self:
+                old._Projects.discard(obj)
+            obj._ErpProjectAccounting = self
+            collection.append(obj)
 
     def removeProjects(self, *Projects):
-        for obj in Projects:
-            obj.ErpProjectAccounting = None
+        collection = self._Projects
+        for obj in members(Projects):
+            if obj._ErpProjectAccounting is self:
+                obj._ErpProjectAccounting = None
+                collection.discard(obj)
+
+    def removeAllProjects(self):
+        for obj in self._Projects:
+            obj._ErpProjectAccounting = None
+        self._Projects = RefList()
 
     def getErpTimeEntries(self):
         
@@ -101,20 +126,32 @@ class ErpProjectAccounting(Document):
 
     def setErpTimeEntries(self, value):
         for x in self._ErpTimeEntries:
-            x.ErpProjectAccounting = None
-        for y in value:
-            y._ErpProjectAccounting = self
-        self._ErpTimeEntries = value
+            x._ErpProjectAccounting = None
+        self._ErpTimeEntries = RefList()
+        self.addErpTimeEntries(value)
 
     ErpTimeEntries = property(getErpTimeEntries, setErpTimeEntries)
 
     def addErpTimeEntries(self, *ErpTimeEntries):
-        for obj in ErpTimeEntries:
-            obj.ErpProjectAccounting = self
+        collection = self._ErpTimeEntries
+        for obj in members(ErpTimeEntries):
+            old = obj._ErpProjectAccounting
+            if old is not None and old is not self:
+                old._ErpTimeEntries.discard(obj)
+            obj._ErpProjectAccounting = self
+            collection.append(obj)
 
     def removeErpTimeEntries(self, *ErpTimeEntries):
-        for obj in ErpTimeEntries:
-            obj.ErpProjectAccounting = None
+        collection = self._ErpTimeEntries
+        for obj in members(ErpTimeEntries):
+            if obj._ErpProjectAccounting is self:
+                obj._ErpProjectAccounting = None
+                collection.discard(obj)
+
+    def removeAllErpTimeEntries(self):
+        for obj in self._ErpTimeEntries:
+            obj._ErpProjectAccounting = None
+        self._ErpTimeEntries = RefList()
 
     def getWorkCostDetails(self):
         
@@ -122,18 +159,30 @@ class ErpProjectAccounting(Document):
 
     def setWorkCostDetails(self, value):
         for x in self._WorkCostDetails:
-            x.ErpProjectAccounting = None
-        for y in value:
-            y._ErpProjectAccounting = self
-        self._WorkCostDetails = value
+            x._ErpProjectAccounting = None
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.ErpProjectAccounting = self
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            old = obj._ErpProjectAccounting
+            if old is not None and old is not self:
+                old._WorkCostDetails.discard(obj)
+            obj._ErpProjectAccounting = self
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.ErpProjectAccounting = None
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            if obj._ErpProjectAccounting is self:
+                obj._ErpProjectAccounting = None
+                collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._ErpProjectAccounting = None
+        self._WorkCostDetails = RefList()
 
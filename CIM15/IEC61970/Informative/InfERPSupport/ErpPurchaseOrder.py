@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpPurchaseOrder(Document):
     """A document that communicates an order to purchase goods from a buyer to a supplier. The PurchaseOrder carries information to and from the buyer and supplier. It is a legally binding document once both Parties agree to the contents and the specified terms and conditions of the order.A document that communicates an order to purchase goods from a buyer to a supplier. The PurchaseOrder carries information to and from the buyer and supplier. It is a legally binding document once both Parties agree to the contents and the specified terms and conditions of the order.
@@ -29,7 +30,7 @@ class ErpPurchaseOrder(Document):
 
         @param ErpPOLineItems:
         """
-        self._ErpPOLineItems = []
+        self._ErpPOLineItems = RefList()
         self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
 
         super(ErpPurchaseOrder, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpPurchaseOrder(Document):
 
     def setErpPOLineItems(self, value):
         for x in self._ErpPOLineItems:
-            x.ErpPurchaseOrder = None
-        for y in value:
-            y._ErpPurchaseOrder = self
-        self._ErpPOLineItems = value
+            x._ErpPurchaseOrder = None
+        self._ErpPOLineItems = RefList()
+        self.addErpPOLineItems(value)
 
     ErpPOLineItems = property(getErpPOLineItems, setErpPOLineItems)
 
     def addErpPOLineItems(self, *ErpPOLineItems):
-        for obj in ErpPOLineItems:
-            obj.ErpPurchaseOrder = self
+        collection = self._ErpPOLineItems
+        for obj in members(ErpPOLineItems):
+            old = obj._ErpPurchaseOrder
+            if old is not None and old is not self:
+                old._ErpPOLineItems.discard(obj)
+            obj._ErpPurchaseOrder = self
+            collection.append(obj)
 
     def removeErpPOLineItems(self, *ErpPOLineItems):
-        for obj in ErpPOLineItems:
-            obj.ErpPurchaseOrder = None
+        collection = self._ErpPOLineItems
+        for obj in members(ErpPOLineItems):
+            if obj._ErpPurchaseOrder is self:
+                obj._ErpPurchaseOrder = None
+                collection.discard(obj)
+
+    def removeAllErpPOLineItems(self):
+        for obj in self._ErpPOLineItems:
+            obj._ErpPurchaseOrder = None
+        self._ErpPOLineItems = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpQuote(Document):
     """Document describing the prices of goods or services provided by a supplier. It includes the terms of the purchase, delivery proposals, identification of goods or services ordered, as well as their quantities.Document describing the prices of goods or services provided by a supplier. It includes the terms of the purchase, delivery proposals, identification of goods or services ordered, as well as their quantities.
@@ -29,7 +30,7 @@ class ErpQuote(Document):
 
         @param ErpQuoteLineItems:
         """
-        self._ErpQuoteLineItems = []
+        self._ErpQuoteLineItems = RefList()
         self.ErpQuoteLineItems = [] if ErpQuoteLineItems is None else ErpQuoteLineItems
 
         super(ErpQuote, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpQuote(Document):
 
     def setErpQuoteLineItems(self, value):
         for x in self._ErpQuoteLineItems:
-            x.ErpQuote = None
-        for y in value:
-            y._ErpQuote = self
-        self._ErpQuoteLineItems = value
+            x._ErpQuote = None
+        self._ErpQuoteLineItems = RefList()
+        self.addErpQuoteLineItems(value)
 
     ErpQuoteLineItems = property(getErpQuoteLineItems, setErpQuoteLineItems)
 
     def addErpQuoteLineItems(self, *ErpQuoteLineItems):
-        for obj in ErpQuoteLineItems:
-            obj.ErpQuote = self
+        collection = self._ErpQuoteLineItems
+        for obj in members(ErpQuoteLineItems):
+            old = obj._ErpQuote
+            if old is not None and old is not self:
+                old._ErpQuoteLineItems.discard(obj)
+            obj._ErpQuote = self
+            collection.append(obj)
 
     def removeErpQuoteLineItems(self, *ErpQuoteLineItems):
-        for obj in ErpQuoteLineItems:
-            obj.ErpQuote = None
+        collection = self._ErpQuoteLineItems
+        for obj in members(ErpQuoteLineItems):
+            if obj._ErpQuote is self:
+                obj._ErpQuote = None
+                collection.discard(obj)
+
+    def removeAllErpQuoteLineItems(self):
+        for obj in self._ErpQuoteLineItems:
+            obj._ErpQuote = None
+        self._ErpQuoteLineItems = RefList()
 
@@ -70,8 +70,7 @@ class ErpQuoteLineItem(IdentifiedObject):
 
     def setErpQuote(self, value):
         if self._ErpQuote is not None:
-            filtered = [x for x in self.ErpQuote.ErpQuoteLineItems if x != self]
-            self._ErpQuote._ErpQuoteLineItems = filtered
+            self._ErpQuote._ErpQuoteLineItems.discard(self)
 
         self._ErpQuote = value
         if self._ErpQuote is not None:
@@ -86,8 +85,7 @@ class ErpQuoteLineItem(IdentifiedObject):
 
     def setAssetModelCatalogueItem(self, value):
         if self._AssetModelCatalogueItem is not None:
-            filtered = [x for x in self.AssetModelCatalogueItem.ErpQuoteLineItems if x != self]
-            self._AssetModelCatalogueItem._ErpQuoteLineItems = filtered
+            self._AssetModelCatalogueItem._ErpQuoteLineItems.discard(self)
 
         self._AssetModelCatalogueItem = value
         if self._AssetModelCatalogueItem is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpRecDelvLineItem(IdentifiedObject):
     """Of an ErpReceiveDelivery, this is an individually received good or service by the Organisation receiving goods or services. It may be used to indicate receipt of goods in conjunction with a purchase order line item.Of an ErpReceiveDelivery, this is an individually received good or service by the Organisation receiving goods or services. It may be used to indicate receipt of goods in conjunction with a purchase order line item.
@@ -34,7 +35,7 @@ class ErpRecDelvLineItem(IdentifiedObject):
         @param MaterialItems:
         @param ErpPOLineItem:
         """
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
         self._ErpInvoiceLineItem = None
@@ -45,7 +46,7 @@ class ErpRecDelvLineItem(IdentifiedObject):
         self._ErpReceiveDelivery = None
         self.ErpReceiveDelivery = ErpReceiveDelivery
 
-        self._MaterialItems = []
+        self._MaterialItems = RefList()
         self.MaterialItems = [] if MaterialItems is None else MaterialItems
 
         self._ErpPOLineItem = None
@@ -66,26 +67,28 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ErpRecDeliveryItems if q != self]
-            self._Assets._ErpRecDeliveryItems = filtered
-        for r in value:
-            if self not in r._ErpRecDeliveryItems:
-                r._ErpRecDeliveryItems.append(self)
-        self._Assets = value
+            p._ErpRecDeliveryItems.discard(self)
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            if self not in obj._ErpRecDeliveryItems:
-                obj._ErpRecDeliveryItems.append(self)
-            self._Assets.append(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ErpRecDeliveryItems.append(self)
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            if self in obj._ErpRecDeliveryItems:
-                obj._ErpRecDeliveryItems.remove(self)
-            self._Assets.remove(obj)
+        collection = self._Assets
+        for obj in members(Assets):
+            obj._ErpRecDeliveryItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._ErpRecDeliveryItems.discard(self)
+        self._Assets = RefList()
 
     def getErpInvoiceLineItem(self):
         
@@ -110,8 +113,7 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setErpReceiveDelivery(self, value):
         if self._ErpReceiveDelivery is not None:
-            filtered = [x for x in self.ErpReceiveDelivery.ErpRecDelvLineItems if x != self]
-            self._ErpReceiveDelivery._ErpRecDelvLineItems = filtered
+            self._ErpReceiveDelivery._ErpRecDelvLineItems.discard(self)
 
         self._ErpReceiveDelivery = value
         if self._ErpReceiveDelivery is not None:
@@ -126,26 +128,28 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setMaterialItems(self, value):
         for p in self._MaterialItems:
-            filtered = [q for q in p.ErpRecDelvLineItems if q != self]
-            self._MaterialItems._ErpRecDelvLineItems = filtered
-        for r in value:
-            if self not in r._ErpRecDelvLineItems:
-                r._ErpRecDelvLineItems.append(self)
-        self._MaterialItems = value
+            p._ErpRecDelvLineItems.discard(self)
+        self._MaterialItems = RefList()
+        self.addMaterialItems(value)
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            if self not in obj._ErpRecDelvLineItems:
-                obj._ErpRecDelvLineItems.append(self)
-            self._MaterialItems.append(obj)
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            obj._ErpRecDelvLineItems.append(self)
+            collection.append(obj)
 
     def removeMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            if self in obj._ErpRecDelvLineItems:
-                obj._ErpRecDelvLineItems.remove(self)
-            self._MaterialItems.remove(obj)
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            obj._ErpRecDelvLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllMaterialItems(self):
+        for obj in self._MaterialItems:
+            obj._ErpRecDelvLineItems.discard(self)
+        self._MaterialItems = RefList()
 
     def getErpPOLineItem(self):
         
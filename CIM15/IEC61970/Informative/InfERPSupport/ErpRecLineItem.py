@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ErpRecLineItem(IdentifiedObject):
     """Individual entry of an ErpReceivable, it is a particular transaction representing an invoice, credit memo or debit memo to a customer.Individual entry of an ErpReceivable, it is a particular transaction representing an invoice, credit memo or debit memo to a customer.
@@ -41,10 +42,10 @@ class ErpRecLineItem(IdentifiedObject):
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
 
-        self._ErpPayments = []
+        self._ErpPayments = RefList()
         self.ErpPayments = [] if ErpPayments is None else ErpPayments
 
-        self._ErpJournalEntries = []
+        self._ErpJournalEntries = RefList()
         self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
 
         super(ErpRecLineItem, self).__init__(*args, **kw_args)
@@ -62,8 +63,7 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpReceivable(self, value):
         if self._ErpReceivable is not None:
-            filtered = [x for x in self.ErpReceivable.ErpRecLineItems if x != self]
-            self._ErpReceivable._ErpRecLineItems = filtered
+            self._ErpReceivable._ErpRecLineItems.discard(self)
 
         self._ErpReceivable = value
         if self._ErpReceivable is not None:
@@ -95,26 +95,28 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpPayments(self, value):
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpRecLineItems if q != self]
-            self._ErpPayments._ErpRecLineItems = filtered
-        for r in value:
-            if self not in r._ErpRecLineItems:
-                r._ErpRecLineItems.append(self)
-        self._ErpPayments = value
+            p._ErpRecLineItems.discard(self)
+        self._ErpPayments = RefList()
+        self.addErpPayments(value)
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
-        for obj in ErpPayments:
-            if self not in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.append(self)
-            self._ErpPayments.append(obj)
+        collection = self._ErpPayments
+        for obj in members(ErpPayments):
+            obj._ErpRecLineItems.append(self)
+            collection.append(obj)
 
     def removeErpPayments(self, *ErpPayments):
-        for obj in ErpPayments:
-            if self in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.remove(self)
-            self._ErpPayments.remove(obj)
+        collection = self._ErpPayments
+        for obj in members(ErpPayments):
+            obj._ErpRecLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPayments(self):
+        for obj in self._ErpPayments:
+            obj._ErpRecLineItems.discard(self)
+        self._ErpPayments = RefList()
 
     def getErpJournalEntries(self):
         
@@ -122,24 +124,26 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpJournalEntries(self, value):
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.ErpRecLineItems if q != self]
-            self._ErpJournalEntries._ErpRecLineItems = filtered
-        for r in value:
-            if self not in r._ErpRecLineItems:
-                r._ErpRecLineItems.append(self)
-        self._ErpJournalEntries = value
+            p._ErpRecLineItems.discard(self)
+        self._ErpJournalEntries = RefList()
+        self.addErpJournalEntries(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            if self not in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.append(self)
-            self._ErpJournalEntries.append(obj)
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            obj._ErpRecLineItems.append(self)
+            collection.append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            if self in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.remove(self)
-            self._ErpJournalEntries.remove(obj)
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            obj._ErpRecLineItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpJournalEntries(self):
+        for obj in self._ErpJournalEntries:
+            obj._ErpRecLineItems.discard(self)
+        self._ErpJournalEntries = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpReceivable(Document):
     """Transaction representing an invoice, credit memo or debit memo to a customer. It is an open (unpaid) item in the Accounts Receivable ledger.Transaction representing an invoice, credit memo or debit memo to a customer. It is an open (unpaid) item in the Accounts Receivable ledger.
@@ -29,7 +30,7 @@ class ErpReceivable(Document):
 
         @param ErpRecLineItems:
         """
-        self._ErpRecLineItems = []
+        self._ErpRecLineItems = RefList()
         self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
 
         super(ErpReceivable, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpReceivable(Document):
 
     def setErpRecLineItems(self, value):
         for x in self._ErpRecLineItems:
-            x.ErpReceivable = None
-        for y in value:
-            y._ErpReceivable = self
-        self._ErpRecLineItems = value
+            x._ErpReceivable = None
+        self._ErpRecLineItems = RefList()
+        self.addErpRecLineItems(value)
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
-        for obj in ErpRecLineItems:
-            obj.ErpReceivable = self
+        collection = self._ErpRecLineItems
+        for obj in members(ErpRecLineItems):
+            old = obj._ErpReceivable
+            if old is not None and old is not self:
+                old._ErpRecLineItems.discard(obj)
+            obj._ErpReceivable = self
+            collection.append(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
-        for obj in ErpRecLineItems:
-            obj.ErpReceivable = None
+        collection = self._ErpRecLineItems
+        for obj in members(ErpRecLineItems):
+            if obj._ErpReceivable is self:
+                obj._ErpReceivable = None
+                collection.discard(obj)
+
+    def removeAllErpRecLineItems(self):
+        for obj in self._ErpRecLineItems:
+            obj._ErpReceivable = None
+        self._ErpRecLineItems = RefList()
 
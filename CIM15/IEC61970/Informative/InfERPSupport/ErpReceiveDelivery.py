@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpReceiveDelivery(Document):
     """Transaction for an Organisation receiving goods or services that may be used to indicate receipt of goods in conjunction with a purchase order. A receivable is an open (unpaid) item in the Accounts Receivable ledger.Transaction for an Organisation receiving goods or services that may be used to indicate receipt of goods in conjunction with a purchase order. A receivable is an open (unpaid) item in the Accounts Receivable ledger.
@@ -29,7 +30,7 @@ class ErpReceiveDelivery(Document):
 
         @param ErpRecDelvLineItems:
         """
-        self._ErpRecDelvLineItems = []
+        self._ErpRecDelvLineItems = RefList()
         self.ErpRecDelvLineItems = [] if ErpRecDelvLineItems is None else ErpRecDelvLineItems
 
         super(ErpReceiveDelivery, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpReceiveDelivery(Document):
 
     def setErpRecDelvLineItems(self, value):
         for x in self._ErpRecDelvLineItems:
-            x.ErpReceiveDelivery = None
-        for y in value:
-            y._ErpReceiveDelivery = self
-        self._ErpRecDelvLineItems = value
+            x._ErpReceiveDelivery = None
+        self._ErpRecDelvLineItems = RefList()
+        self.addErpRecDelvLineItems(value)
 
     ErpRecDelvLineItems = property(getErpRecDelvLineItems, setErpRecDelvLineItems)
 
     def addErpRecDelvLineItems(self, *ErpRecDelvLineItems):
-        for obj in ErpRecDelvLineItems:
-            obj.ErpReceiveDelivery = self
+        collection = self._ErpRecDelvLineItems
+        for obj in members(ErpRecDelvLineItems):
+            old = obj._ErpReceiveDelivery
+            if old is not None and old is not self:
+                old._ErpRecDelvLineItems.discard(obj)
+            obj._ErpReceiveDelivery = self
+            collection.append(obj)
 
     def removeErpRecDelvLineItems(self, *ErpRecDelvLineItems):
-        for obj in ErpRecDelvLineItems:
-            obj.ErpReceiveDelivery = None
+        collection = self._ErpRecDelvLineItems
+        for obj in members(ErpRecDelvLineItems):
+            if obj._ErpReceiveDelivery is self:
+                obj._ErpReceiveDelivery = None
+                collection.discard(obj)
+
+    def removeAllErpRecDelvLineItems(self):
+        for obj in self._ErpRecDelvLineItems:
+            obj._ErpReceiveDelivery = None
+        self._ErpRecDelvLineItems = RefList()
 
@@ -99,8 +99,7 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setErpRequisition(self, value):
         if self._ErpRequisition is not None:
-            filtered = [x for x in self.ErpRequisition.ErpReqLineItems if x != self]
-            self._ErpRequisition._ErpReqLineItems = filtered
+            self._ErpRequisition._ErpReqLineItems.discard(self)
 
         self._ErpRequisition = value
         if self._ErpRequisition is not None:
@@ -115,8 +114,7 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.ErpReqLineItems if x != self]
-            self._TypeMaterial._ErpReqLineItems = filtered
+            self._TypeMaterial._ErpReqLineItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
@@ -146,8 +144,7 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpReqLineItems if x != self]
-            self._TypeAsset._ErpReqLineItems = filtered
+            self._TypeAsset._ErpReqLineItems.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
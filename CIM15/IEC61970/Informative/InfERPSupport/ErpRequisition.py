@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpRequisition(Document):
     """General information that applies to a utility requisition that is a request for the purchase of goods or services. Typically, a requisition leads to the creation of a purchase order to a specific supplier.General information that applies to a utility requisition that is a request for the purchase of goods or services. Typically, a requisition leads to the creation of a purchase order to a specific supplier.
@@ -29,7 +30,7 @@ class ErpRequisition(Document):
 
         @param ErpReqLineItems:
         """
-        self._ErpReqLineItems = []
+        self._ErpReqLineItems = RefList()
         self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
 
         super(ErpRequisition, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpRequisition(Document):
 
     def setErpReqLineItems(self, value):
         for x in self._ErpReqLineItems:
-            x.ErpRequisition = None
-        for y in value:
-            y._ErpRequisition = self
-        self._ErpReqLineItems = value
+            x._ErpRequisition = None
+        self._ErpReqLineItems = RefList()
+        self.addErpReqLineItems(value)
 
     ErpReqLineItems = property(getErpReqLineItems, setErpReqLineItems)
 
     def addErpReqLineItems(self, *ErpReqLineItems):
-        for obj in ErpReqLineItems:
-            obj.ErpRequisition = self
+        collection = self._ErpReqLineItems
+        for obj in members(ErpReqLineItems):
+            old = obj._ErpRequisition
+            if old is not None and old is not self:
+                old._ErpReqLineItems.discard(obj)
+            obj._ErpRequisition = self
+            collection.append(obj)
 
     def removeErpReqLineItems(self, *ErpReqLineItems):
-        for obj in ErpReqLineItems:
-            obj.ErpRequisition = None
+        collection = self._ErpReqLineItems
+        for obj in members(ErpReqLineItems):
+            if obj._ErpRequisition is self:
+                obj._ErpRequisition = None
+                collection.discard(obj)
+
+    def removeAllErpReqLineItems(self):
+        for obj in self._ErpReqLineItems:
+            obj._ErpRequisition = None
+        self._ErpReqLineItems = RefList()
 
@@ -52,8 +52,7 @@ class ErpSiteLevelData(IdentifiedObject):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.ErpSiteLevelDatas if x != self]
-            self._LandProperty._ErpSiteLevelDatas = filtered
+            self._LandProperty._ErpSiteLevelDatas.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
@@ -54,8 +54,7 @@ class ErpTimeEntry(IdentifiedObject):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.ErpTimeEntries if x != self]
-            self._ErpProjectAccounting._ErpTimeEntries = filtered
+            self._ErpProjectAccounting._ErpTimeEntries.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
@@ -72,8 +71,7 @@ class ErpTimeEntry(IdentifiedObject):
 
     def setErpTimeSheet(self, value):
         if self._ErpTimeSheet is not None:
-            filtered = [x for x in self.ErpTimeSheet.ErpTimeEntries if x != self]
-            self._ErpTimeSheet._ErpTimeEntries = filtered
+            self._ErpTimeSheet._ErpTimeEntries.discard(self)
 
         self._ErpTimeSheet = value
         if self._ErpTimeSheet is not None:
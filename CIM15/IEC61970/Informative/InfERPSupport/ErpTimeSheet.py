@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class ErpTimeSheet(Document):
     """Time sheet for employees and contractors. Note that ErpTimeSheet inherits the relationship to ErpPerson from Document.Time sheet for employees and contractors. Note that ErpTimeSheet inherits the relationship to ErpPerson from Document.
@@ -29,7 +30,7 @@ class ErpTimeSheet(Document):
 
         @param ErpTimeEntries:
         """
-        self._ErpTimeEntries = []
+        self._ErpTimeEntries = RefList()
         self.ErpTimeEntries = [] if ErpTimeEntries is None else ErpTimeEntries
 
         super(ErpTimeSheet, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class ErpTimeSheet(Document):
 
     def setErpTimeEntries(self, value):
         for x in self._ErpTimeEntries:
-            x.ErpTimeSheet = None
-        for y in value:
-            y._ErpTimeSheet = self
-        self._ErpTimeEntries = value
+            x._ErpTimeSheet = None
+        self._ErpTimeEntries = RefList()
+        self.addErpTimeEntries(value)
 
     ErpTimeEntries = property(getErpTimeEntries, setErpTimeEntries)
 
     def addErpTimeEntries(self, *ErpTimeEntries):
-        for obj in ErpTimeEntries:
-            obj.ErpTimeSheet = self
+        collection = self._ErpTimeEntries
+        for obj in members(ErpTimeEntries):
+            old = obj._ErpTimeSheet
+            if old is not None and old is not self:
+                old._ErpTimeEntries.discard(obj)
+            obj._ErpTimeSheet = self
+            collection.append(obj)
 
     def removeErpTimeEntries(self, *ErpTimeEntries):
-        for obj in ErpTimeEntries:
-            obj.ErpTimeSheet = None
+        collection = self._ErpTimeEntries
+        for obj in members(ErpTimeEntries):
+            if obj._ErpTimeSheet is self:
+                obj._ErpTimeSheet = None
+                collection.discard(obj)
+
+    def removeAllErpTimeEntries(self):
+        for obj in self._ErpTimeEntries:
+            obj._ErpTimeSheet = None
+        self._ErpTimeEntries = RefList()
 
@@ -55,8 +55,7 @@ class OrgErpPersonRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.ErpOrganisationRoles if x != self]
-            self._ErpPerson._ErpOrganisationRoles = filtered
+            self._ErpPerson._ErpOrganisationRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
@@ -71,8 +70,7 @@ class OrgErpPersonRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.ErpPersonRoles if x != self]
-            self._ErpOrganisation._ErpPersonRoles = filtered
+            self._ErpOrganisation._ErpPersonRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
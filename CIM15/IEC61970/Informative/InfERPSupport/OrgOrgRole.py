@@ -55,8 +55,7 @@ class OrgOrgRole(Role):
 
     def setParentOrganisation(self, value):
         if self._ParentOrganisation is not None:
-            filtered = [x for x in self.ParentOrganisation.ChildOrganisationRoles if x != self]
-            self._ParentOrganisation._ChildOrganisationRoles = filtered
+            self._ParentOrganisation._ChildOrganisationRoles.discard(self)
 
         self._ParentOrganisation = value
         if self._ParentOrganisation is not None:
@@ -71,8 +70,7 @@ class OrgOrgRole(Role):
 
     def setChildOrganisation(self, value):
         if self._ChildOrganisation is not None:
-            filtered = [x for x in self.ChildOrganisation.ParentOrganisationRoles if x != self]
-            self._ChildOrganisation._ParentOrganisationRoles = filtered
+            self._ChildOrganisation._ParentOrganisationRoles.discard(self)
 
         self._ChildOrganisation = value
         if self._ChildOrganisation is not None:
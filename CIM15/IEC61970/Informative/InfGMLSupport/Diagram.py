@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Diagram(Document):
     """The Diagram represents the diagram being exchanged. The initialView attributes can be used to specify an initial view with the x,y coordinates of the diagonal points. The coordinate system is a standard Cartesian coordinate system and the orientation attribute defines a positive or negative orientation.  A positive orientation gives standard &lsquo;right-hand&rsquo; orientation, with negative orientation indicating a &lsquo;left-hand&rsquo; orientation.  For 2D diagrams, a positive orientation will result in X values increasing from left to right and Y values increasing from bottom to top.  A negative orientation gives the &lsquo;left-hand&rsquo; orientation (favoured by computer graphics displays) with X values increasing from left to right and Y values increasing from top to bottom.The Diagram represents the diagram being exchanged. The initialView attributes can be used to specify an initial view with the x,y coordinates of the diagonal points. The coordinate system is a standard Cartesian coordinate system and the orientation attribute defines a positive or negative orientation.  A positive orientation gives standard &lsquo;right-hand&rsquo; orientation, with negative orientation indicating a &lsquo;left-hand&rsquo; orientation.  For 2D diagrams, a positive orientation will result in X values increasing from left to right and Y values increasing from bottom to top.  A negative orientation gives the &lsquo;left-hand&rsquo; orientation (favoured by computer graphics displays) with X values increasing from left to right and Y values increasing from top to bottom.
@@ -56,16 +57,16 @@ class Diagram(Document):
         #: Y coordinate of the second corner of the initial view
         self.y2InitialView = y2InitialView
 
-        self._DiagramObjects = []
+        self._DiagramObjects = RefList()
         self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
 
-        self._GmlDiagramObjects = []
+        self._GmlDiagramObjects = RefList()
         self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
 
-        self._DesignLocations = []
+        self._DesignLocations = RefList()
         self.DesignLocations = [] if DesignLocations is None else DesignLocations
 
         super(Diagram, self).__init__(*args, **kw_args)
@@ -84,20 +85,32 @@ class Diagram(Document):
 
     def setDiagramObjects(self, value):
         for x in self._DiagramObjects:
-            x.Diagram = None
-        for y in value:
-            y._Diagram = self
-        self._DiagramObjects = value
+            x._Diagram = None
+        self._DiagramObjects = RefList()
+        self.addDiagramObjects(value)
 
     DiagramObjects = property(getDiagramObjects, setDiagramObjects)
 
     def addDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            obj.Diagram = self
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            old = obj._Diagram
+            if old is not None and old is not self:
+                old._DiagramObjects.discard(obj)
+            obj._Diagram = self
+            collection.append(obj)
 
     def removeDiagramObjects(self, *DiagramObjects):
-        for obj in DiagramObjects:
-            obj.Diagram = None
+        collection = self._DiagramObjects
+        for obj in members(DiagramObjects):
+            if obj._Diagram is self:
+                obj._Diagram = None
+                collection.discard(obj)
+
+    def removeAllDiagramObjects(self):
+        for obj in self._DiagramObjects:
+            obj._Diagram = None
+        self._DiagramObjects = RefList()
 
     def getCoordinateSystem(self):
         
@@ -105,8 +118,7 @@ class Diagram(Document):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Diagrams if x != self]
-            self._CoordinateSystem._Diagrams = filtered
+            self._CoordinateSystem._Diagrams.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
@@ -121,26 +133,28 @@ class Diagram(Document):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.Diagrams if q != self]
-            self._GmlDiagramObjects._Diagrams = filtered
-        for r in value:
-            if self not in r._Diagrams:
-                r._Diagrams.append(self)
-        self._GmlDiagramObjects = value
+            p._Diagrams.discard(self)
+        self._GmlDiagramObjects = RefList()
+        self.addGmlDiagramObjects(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self not in obj._Diagrams:
-                obj._Diagrams.append(self)
-            self._GmlDiagramObjects.append(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._Diagrams.append(self)
+            collection.append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self in obj._Diagrams:
-                obj._Diagrams.remove(self)
-            self._GmlDiagramObjects.remove(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._Diagrams.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlDiagramObjects(self):
+        for obj in self._GmlDiagramObjects:
+            obj._Diagrams.discard(self)
+        self._GmlDiagramObjects = RefList()
 
     def getDesignLocations(self):
         
@@ -148,24 +162,26 @@ class Diagram(Document):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.Diagrams if q != self]
-            self._DesignLocations._Diagrams = filtered
-        for r in value:
-            if self not in r._Diagrams:
-                r._Diagrams.append(self)
-        self._DesignLocations = value
+            p._Diagrams.discard(self)
+        self._DesignLocations = RefList()
+        self.addDesignLocations(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self not in obj._Diagrams:
-                obj._Diagrams.append(self)
-            self._DesignLocations.append(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._Diagrams.append(self)
+            collection.append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self in obj._Diagrams:
-                obj._Diagrams.remove(self)
-            self._DesignLocations.remove(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._Diagrams.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocations(self):
+        for obj in self._DesignLocations:
+            obj._Diagrams.discard(self)
+        self._DesignLocations = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlBaseSymbol(IdentifiedObject):
     """Allows referencing and extension of external symbols, which may be stored in a symbol repository. The graphical properties from a referenced external symbol override the ones read in from the base symbol.Allows referencing and extension of external symbols, which may be stored in a symbol repository. The graphical properties from a referenced external symbol override the ones read in from the base symbol.
@@ -29,7 +30,7 @@ class GmlBaseSymbol(IdentifiedObject):
 
         @param GmlSymbols:
         """
-        self._GmlSymbols = []
+        self._GmlSymbols = RefList()
         self.GmlSymbols = [] if GmlSymbols is None else GmlSymbols
 
         super(GmlBaseSymbol, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class GmlBaseSymbol(IdentifiedObject):
 
     def setGmlSymbols(self, value):
         for x in self._GmlSymbols:
-            x.GmlBaseSymbol = None
-        for y in value:
-            y._GmlBaseSymbol = self
-        self._GmlSymbols = value
+            x._GmlBaseSymbol = None
+        self._GmlSymbols = RefList()
+        self.addGmlSymbols(value)
 
     GmlSymbols = property(getGmlSymbols, setGmlSymbols)
 
     def addGmlSymbols(self, *GmlSymbols):
-        for obj in GmlSymbols:
-            obj.GmlBaseSymbol = self
+        collection = self._GmlSymbols
+        for obj in members(GmlSymbols):
+            old = obj._GmlBaseSymbol
+            if old is not None and old is not self:
+                old._GmlSymbols.discard(obj)
+            obj._GmlBaseSymbol = self
+            collection.append(obj)
 
     def removeGmlSymbols(self, *GmlSymbols):
-        for obj in GmlSymbols:
-            obj.GmlBaseSymbol = None
+        collection = self._GmlSymbols
+        for obj in members(GmlSymbols):
+            if obj._GmlBaseSymbol is self:
+                obj._GmlBaseSymbol = None
+                collection.discard(obj)
+
+    def removeAllGmlSymbols(self):
+        for obj in self._GmlSymbols:
+            obj._GmlBaseSymbol = None
+        self._GmlSymbols = RefList()
 
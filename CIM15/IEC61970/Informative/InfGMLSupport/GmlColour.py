@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlColour(IdentifiedObject):
     """The solid color that will be used. The color value is RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign. The hexadecimal digits between A and F may be in either uppercase or lowercase. For example, full red is encoded as '#ff0000' (with no quotation marks). If the Stroke cssParameter element is absent, the default color is defined to be black ('#000000').The solid color that will be used. The color value is RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign. The hexadecimal digits between A and F may be in either uppercase or lowercase. For example, full red is encoded as '#ff0000' (with no quotation marks). If the Stroke cssParameter element is absent, the default color is defined to be black ('#000000').
@@ -43,13 +44,13 @@ class GmlColour(IdentifiedObject):
         #: The color value for BLUE (RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign.).
         self.blue = blue
 
-        self._GmlFills = []
+        self._GmlFills = RefList()
         self.GmlFills = [] if GmlFills is None else GmlFills
 
-        self._GmlFonts = []
+        self._GmlFonts = RefList()
         self.GmlFonts = [] if GmlFonts is None else GmlFonts
 
-        self._GmlStrokes = []
+        self._GmlStrokes = RefList()
         self.GmlStrokes = [] if GmlStrokes is None else GmlStrokes
 
         super(GmlColour, self).__init__(*args, **kw_args)
@@ -67,20 +68,32 @@ class GmlColour(IdentifiedObject):
 
     def setGmlFills(self, value):
         for x in self._GmlFills:
-            x.GmlColour = None
-        for y in value:
-            y._GmlColour = self
-        self._GmlFills = value
+            x._GmlColour = None
+        self._GmlFills = RefList()
+        self.addGmlFills(value)
 
     GmlFills = property(getGmlFills, setGmlFills)
 
     def addGmlFills(self, *GmlFills):
-        for obj in GmlFills:
-            obj.GmlColour = self
+        collection = self._GmlFills
+        for obj in members(GmlFills):
+            old = obj._GmlColour
+            if old is not None and old is not self:
+                old._GmlFills.discard(obj)
+            obj._GmlColour = self
+            collection.append(obj)
 
     def removeGmlFills(self, *GmlFills):
-        for obj in GmlFills:
-            obj.GmlColour = None
+        collection = self._GmlFills
+        for obj in members(GmlFills):
+            if obj._GmlColour is self:
+                obj._GmlColour = None
+                collection.discard(obj)
+
+    def removeAllGmlFills(self):
+        for obj in self._GmlFills:
+            obj._GmlColour = None
+        self._GmlFills = RefList()
 
     def getGmlFonts(self):
         
@@ -88,20 +101,32 @@ class GmlColour(IdentifiedObject):
 
     def setGmlFonts(self, value):
         for x in self._GmlFonts:
-            x.GmlColour = None
-        for y in value:
-            y._GmlColour = self
-        self._GmlFonts = value
+            x._GmlColour = None
+        self._GmlFonts = RefList()
+        self.addGmlFonts(value)
 
     GmlFonts = property(getGmlFonts, setGmlFonts)
 
     def addGmlFonts(self, *GmlFonts):
-        for obj in GmlFonts:
-            obj.GmlColour = self
+        collection = self._GmlFonts
+        for obj in members(GmlFonts):
+            old = obj._GmlColour
+            if old is not None and old is not self:
+                old._GmlFonts.discard(obj)
+            obj._GmlColour = self
+            collection.append(obj)
 
     def removeGmlFonts(self, *GmlFonts):
-        for obj in GmlFonts:
-            obj.GmlColour = None
+        collection = self._GmlFonts
+        for obj in members(GmlFonts):
+            if obj._GmlColour is self:
+                obj._GmlColour = None
+                collection.discard(obj)
+
+    def removeAllGmlFonts(self):
+        for obj in self._GmlFonts:
+            obj._GmlColour = None
+        self._GmlFonts = RefList()
 
     def getGmlStrokes(self):
         
@@ -109,18 +134,30 @@ class GmlColour(IdentifiedObject):
 
     def setGmlStrokes(self, value):
         for x in self._GmlStrokes:
-            x.GmlColour = None
-        for y in value:
-            y._GmlColour = self
-        self._GmlStrokes = value
+            x._GmlColour = None
+        self._GmlStrokes = RefList()
+        self.addGmlStrokes(value)
 
     GmlStrokes = property(getGmlStrokes, setGmlStrokes)
 
     def addGmlStrokes(self, *GmlStrokes):
-        for obj in GmlStrokes:
-            obj.GmlColour = self
+        collection = self._GmlStrokes
+        for obj in members(GmlStrokes):
+            old = obj._GmlColour
+            if old is not None and old is not self:
+                old._GmlStrokes.discard(obj)
+            obj._GmlColour = self
+            collection.append(obj)
 
     def removeGmlStrokes(self, *GmlStrokes):
-        for obj in GmlStrokes:
-            obj.GmlColour = None
+        collection = self._GmlStrokes
+        for obj in members(GmlStrokes):
+            if obj._GmlColour is self:
+                obj._GmlColour = None
+                collection.discard(obj)
+
+    def removeAllGmlStrokes(self):
+        for obj in self._GmlStrokes:
+            obj._GmlColour = None
+        self._GmlStrokes = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlDiagramObject(IdentifiedObject):
     """Any of the magnitudes that serve to define the position of a point by reference to a fixed figure, system of lines, etc.Any of the magnitudes that serve to define the position of a point by reference to a fixed figure, system of lines, etc.
@@ -37,31 +38,31 @@ class GmlDiagramObject(IdentifiedObject):
         @param GmlTextSymbols:
         @param GmlPolygonSymbols:
         """
-        self._GmlSelectors = []
+        self._GmlSelectors = RefList()
         self.GmlSelectors = [] if GmlSelectors is None else GmlSelectors
 
-        self._Diagrams = []
+        self._Diagrams = RefList()
         self.Diagrams = [] if Diagrams is None else Diagrams
 
-        self._CoordinateSystems = []
+        self._CoordinateSystems = RefList()
         self.CoordinateSystems = [] if CoordinateSystems is None else CoordinateSystems
 
-        self._GmlPointSymbols = []
+        self._GmlPointSymbols = RefList()
         self.GmlPointSymbols = [] if GmlPointSymbols is None else GmlPointSymbols
 
-        self._GmlLineSymbols = []
+        self._GmlLineSymbols = RefList()
         self.GmlLineSymbols = [] if GmlLineSymbols is None else GmlLineSymbols
 
-        self._GmlRasterSymbols = []
+        self._GmlRasterSymbols = RefList()
         self.GmlRasterSymbols = [] if GmlRasterSymbols is None else GmlRasterSymbols
 
-        self._GmlObservatins = []
+        self._GmlObservatins = RefList()
         self.GmlObservatins = [] if GmlObservatins is None else GmlObservatins
 
-        self._GmlTextSymbols = []
+        self._GmlTextSymbols = RefList()
         self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
 
-        self._GmlPolygonSymbols = []
+        self._GmlPolygonSymbols = RefList()
         self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
 
         super(GmlDiagramObject, self).__init__(*args, **kw_args)
@@ -79,26 +80,28 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlSelectors(self, value):
         for p in self._GmlSelectors:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._GmlSelectors._GmlDiagramObjects = filtered
-        for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._GmlSelectors = value
+            p._GmlDiagramObjects.discard(self)
+        self._GmlSelectors = RefList()
+        self.addGmlSelectors(value)
 
     GmlSelectors = property(getGmlSelectors, setGmlSelectors)
 
     def addGmlSelectors(self, *GmlSelectors):
-        for obj in GmlSelectors:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._GmlSelectors.append(obj)
+        collection = self._GmlSelectors
+        for obj in members(GmlSelectors):
+            obj._GmlDiagramObjects.append(self)
+            collection.append(obj)
 
     def removeGmlSelectors(self, *GmlSelectors):
-        for obj in GmlSelectors:
-            if self in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.remove(self)
-            self._GmlSelectors.remove(obj)
+        collection = self._GmlSelectors
+        for obj in members(GmlSelectors):
+            obj._GmlDiagramObjects.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlSelectors(self):
+        for obj in self._GmlSelectors:
+            obj._GmlDiagramObjects.discard(self)
+        self._GmlSelectors = RefList()
 
     def getDiagrams(self):
         
@@ -106,26 +109,28 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setDiagrams(self, value):
         for p in self._Diagrams:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._Diagrams._GmlDiagramObjects = filtered
-        for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._Diagrams = value
+            p._GmlDiagramObjects.discard(self)
+        self._Diagrams = RefList()
+        self.addDiagrams(value)
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
-        for obj in Diagrams:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._Diagrams.append(obj)
+        collection = self._Diagrams
+        for obj in members(Diagrams):
+            obj._GmlDiagramObjects.append(self)
+            collection.append(obj)
 
     def removeDiagrams(self, *Diagrams):
-        for obj in Diagrams:
-            if self in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.remove(self)
-            self._Diagrams.remove(obj)
+        collection = self._Diagrams
+        for obj in members(Diagrams):
+            obj._GmlDiagramObjects.discard(self)
+            collection.discard(obj)
+
+    def removeAllDiagrams(self):
+        for obj in self._Diagrams:
+            obj._GmlDiagramObjects.discard(self)
+        self._Diagrams = RefList()
 
     def getCoordinateSystems(self):
         
@@ -133,26 +138,28 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setCoordinateSystems(self, value):
         for p in self._CoordinateSystems:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._CoordinateSystems._GmlDiagramObjects = filtered
-        for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._CoordinateSystems = value
+            p._GmlDiagramObjects.discard(self)
+        self._CoordinateSystems = RefList()
+        self.addCoordinateSystems(value)
 
     CoordinateSystems = property(getCoordinateSystems, setCoordinateSystems)
 
     def addCoordinateSystems(self, *CoordinateSystems):
-        for obj in CoordinateSystems:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._CoordinateSystems.append(obj)
+        collection = self._CoordinateSystems
+        for obj in members(CoordinateSystems):
+            obj._GmlDiagramObjects.append(self)
+            collection.append(obj)
 
     def removeCoordinateSystems(self, *CoordinateSystems):
-        for obj in CoordinateSystems:
-            if self in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.remove(self)
-            self._CoordinateSystems.remove(obj)
+        collection = self._CoordinateSystems
+        for obj in members(CoordinateSystems):
+            obj._GmlDiagramObjects.discard(self)
+            collection.discard(obj)
+
+    def removeAllCoordinateSystems(self):
+        for obj in self._CoordinateSystems:
+            obj._GmlDiagramObjects.discard(self)
+        self._CoordinateSystems = RefList()
 
     def getGmlPointSymbols(self):
         
@@ -160,20 +167,32 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlPointSymbols(self, value):
         for x in self._GmlPointSymbols:
-            x.GmlDiagramObject = None
-        for y in value:
-            y._GmlDiagramObject = self
-        self._GmlPointSymbols = value
+            x._GmlDiagramObject = None
+        self._GmlPointSymbols = RefList()
+        self.addGmlPointSymbols(value)
 
     GmlPointSymbols = property(getGmlPointSymbols, setGmlPointSymbols)
 
     def addGmlPointSymbols(self, *GmlPointSymbols):
-        for obj in GmlPointSymbols:
-            obj.GmlDiagramObject = self
+        collection = self._GmlPointSymbols
+        for obj in members(GmlPointSymbols):
+            old = obj._GmlDiagramObject
+            if old is not None and old is not self:
+                old._GmlPointSymbols.discard(obj)
+            obj._GmlDiagramObject = self
+            collection.append(obj)
 
     def removeGmlPointSymbols(self, *GmlPointSymbols):
-        for obj in GmlPointSymbols:
-            obj.GmlDiagramObject = None
+        collection = self._GmlPointSymbols
+        for obj in members(GmlPointSymbols):
+            if obj._GmlDiagramObject is self:
+                obj._GmlDiagramObject = None
+                collection.discard(obj)
+
+    def removeAllGmlPointSymbols(self):
+        for obj in self._GmlPointSymbols:
+            obj._GmlDiagramObject = None
+        self._GmlPointSymbols = RefList()
 
     def getGmlLineSymbols(self):
         
@@ -181,20 +200,32 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlLineSymbols(self, value):
         for x in self._GmlLineSymbols:
-            x.GmlDiagramObject = None
-        for y in value:
-            y._GmlDiagramObject = self
-        self._GmlLineSymbols = value
+            x._GmlDiagramObject = None
+        self._GmlLineSymbols = RefList()
+        self.addGmlLineSymbols(value)
 
     GmlLineSymbols = property(getGmlLineSymbols, setGmlLineSymbols)
 
     def addGmlLineSymbols(self, *GmlLineSymbols):
-        for obj in GmlLineSymbols:
-            obj.GmlDiagramObject = self
+        collection = self._GmlLineSymbols
+        for obj in members(GmlLineSymbols):
+            old = obj._GmlDiagramObject
+            if old is not None and old is not self:
+                old._GmlLineSymbols.discard(obj)
+            obj._GmlDiagramObject = self
+            collection.append(obj)
 
     def removeGmlLineSymbols(self, *GmlLineSymbols):
-        for obj in GmlLineSymbols:
-            obj.GmlDiagramObject = None
+        collection = self._GmlLineSymbols
+        for obj in members(GmlLineSymbols):
+            if obj._GmlDiagramObject is self:
+                obj._GmlDiagramObject = None
+                collection.discard(obj)
+
+    def removeAllGmlLineSymbols(self):
+        for obj in self._GmlLineSymbols:
+            obj._GmlDiagramObject = None
+        self._GmlLineSymbols = RefList()
 
     def getGmlRasterSymbols(self):
         
@@ -202,20 +233,32 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlRasterSymbols(self, value):
         for x in self._GmlRasterSymbols:
-            x.GmlDiagramObject = None
-        for y in value:
-            y._GmlDiagramObject = self
-        self._GmlRasterSymbols = value
+            x._GmlDiagramObject = None
+        self._GmlRasterSymbols = RefList()
+        self.addGmlRasterSymbols(value)
 
     GmlRasterSymbols = property(getGmlRasterSymbols, setGmlRasterSymbols)
 
     def addGmlRasterSymbols(self, *GmlRasterSymbols):
-        for obj in GmlRasterSymbols:
-            obj.GmlDiagramObject = self
+        collection = self._GmlRasterSymbols
+        for obj in members(GmlRasterSymbols):
+            old = obj._GmlDiagramObject
+            if old is not None and old is not self:
+                old._GmlRasterSymbols.discard(obj)
+            obj._GmlDiagramObject = self
+            collection.append(obj)
 
     def removeGmlRasterSymbols(self, *GmlRasterSymbols):
-        for obj in GmlRasterSymbols:
-            obj.GmlDiagramObject = None
+        collection = self._GmlRasterSymbols
+        for obj in members(GmlRasterSymbols):
+            if obj._GmlDiagramObject is self:
+                obj._GmlDiagramObject = None
+                collection.discard(obj)
+
+    def removeAllGmlRasterSymbols(self):
+        for obj in self._GmlRasterSymbols:
+            obj._GmlDiagramObject = None
+        self._GmlRasterSymbols = RefList()
 
     def getGmlObservatins(self):
         
@@ -223,26 +266,28 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlObservatins(self, value):
         for p in self._GmlObservatins:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._GmlObservatins._GmlDiagramObjects = filtered
-        for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._GmlObservatins = value
+            p._GmlDiagramObjects.discard(self)
+        self._GmlObservatins = RefList()
+        self.addGmlObservatins(value)
 
     GmlObservatins = property(getGmlObservatins, setGmlObservatins)
 
     def addGmlObservatins(self, *GmlObservatins):
-        for obj in GmlObservatins:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._GmlObservatins.append(obj)
+        collection = self._GmlObservatins
+        for obj in members(GmlObservatins):
+            obj._GmlDiagramObjects.append(self)
+            collection.append(obj)
 
     def removeGmlObservatins(self, *GmlObservatins):
-        for obj in GmlObservatins:
-            if self in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.remove(self)
-            self._GmlObservatins.remove(obj)
+        collection = self._GmlObservatins
+        for obj in members(GmlObservatins):
+            obj._GmlDiagramObjects.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlObservatins(self):
+        for obj in self._GmlObservatins:
+            obj._GmlDiagramObjects.discard(self)
+        self._GmlObservatins = RefList()
 
     def getGmlTextSymbols(self):
         
@@ -250,20 +295,32 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlTextSymbols(self, value):
         for x in self._GmlTextSymbols:
-            x.GmlDiagramObject = None
-        for y in value:
-            y._GmlDiagramObject = self
-        self._GmlTextSymbols = value
+            x._GmlDiagramObject = None
+        self._GmlTextSymbols = RefList()
+        self.addGmlTextSymbols(value)
 
     GmlTextSymbols = property(getGmlTextSymbols, setGmlTextSymbols)
 
     def addGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlDiagramObject = self
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            old = obj._GmlDiagramObject
+            if old is not None and old is not self:
+                old._GmlTextSymbols.discard(obj)
+            obj._GmlDiagramObject = self
+            collection.append(obj)
 
     def removeGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlDiagramObject = None
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            if obj._GmlDiagramObject is self:
+                obj._GmlDiagramObject = None
+                collection.discard(obj)
+
+    def removeAllGmlTextSymbols(self):
+        for obj in self._GmlTextSymbols:
+            obj._GmlDiagramObject = None
+        self._GmlTextSymbols = RefList()
 
     def getGmlPolygonSymbols(self):
         
@@ -271,18 +328,30 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlPolygonSymbols(self, value):
         for x in self._GmlPolygonSymbols:
-            x.GmlDiagramObject = None
-        for y in value:
-            y._GmlDiagramObject = self
-        self._GmlPolygonSymbols = value
+            x._GmlDiagramObject = None
+        self._GmlPolygonSymbols = RefList()
+        self.addGmlPolygonSymbols(value)
 
     GmlPolygonSymbols = property(getGmlPolygonSymbols, setGmlPolygonSymbols)
 
     def addGmlPolygonSymbols(self, *GmlPolygonSymbols):
-        for obj in GmlPolygonSymbols:
-            obj.GmlDiagramObject = self
+        collection = self._GmlPolygonSymbols
+        for obj in members(GmlPolygonSymbols):
+            old = obj._GmlDiagramObject
+            if old is not None and old is not self:
+                old._GmlPolygonSymbols.discard(obj)
+            obj._GmlDiagramObject = self
+            collection.append(obj)
 
     def removeGmlPolygonSymbols(self, *GmlPolygonSymbols):
-        for obj in GmlPolygonSymbols:
-            obj.GmlDiagramObject = None
+        collection = self._GmlPolygonSymbols
+        for obj in members(GmlPolygonSymbols):
+            if obj._GmlDiagramObject is self:
+                obj._GmlDiagramObject = None
+                collection.discard(obj)
+
+    def removeAllGmlPolygonSymbols(self):
+        for obj in self._GmlPolygonSymbols:
+            obj._GmlDiagramObject = None
+        self._GmlPolygonSymbols = RefList()
 
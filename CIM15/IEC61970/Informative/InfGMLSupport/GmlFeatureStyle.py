@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlFeatureStyle(IdentifiedObject):
     """Used for styling a particular aspect or aspects of a feature, such as geometry, topology or arbitrary text string.Used for styling a particular aspect or aspects of a feature, such as geometry, topology or arbitrary text string.
@@ -61,19 +62,19 @@ class GmlFeatureStyle(IdentifiedObject):
         #: Grammar used in the content of the gml:featureConstraint element. Values are: "other", "xpath", "xquery"
         self.queryGrammar = queryGrammar
 
-        self._GmlGeometryStyles = []
+        self._GmlGeometryStyles = RefList()
         self.GmlGeometryStyles = [] if GmlGeometryStyles is None else GmlGeometryStyles
 
-        self._GmlSymbols = []
+        self._GmlSymbols = RefList()
         self.GmlSymbols = [] if GmlSymbols is None else GmlSymbols
 
-        self._GmlTobologyStyles = []
+        self._GmlTobologyStyles = RefList()
         self.GmlTobologyStyles = [] if GmlTobologyStyles is None else GmlTobologyStyles
 
-        self._GmlLabelStyles = []
+        self._GmlLabelStyles = RefList()
         self.GmlLabelStyles = [] if GmlLabelStyles is None else GmlLabelStyles
 
-        self._GmlFeatureTypes = []
+        self._GmlFeatureTypes = RefList()
         self.GmlFeatureTypes = [] if GmlFeatureTypes is None else GmlFeatureTypes
 
         super(GmlFeatureStyle, self).__init__(*args, **kw_args)
@@ -91,20 +92,32 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlGeometryStyles(self, value):
         for x in self._GmlGeometryStyles:
-            x.GmlFeatureStyle = None
-        for y in value:
-            y._GmlFeatureStyle = self
-        self._GmlGeometryStyles = value
+            x._GmlFeatureStyle = None
+        self._GmlGeometryStyles = RefList()
+        self.addGmlGeometryStyles(value)
 
     GmlGeometryStyles = property(getGmlGeometryStyles, setGmlGeometryStyles)
 
     def addGmlGeometryStyles(self, *GmlGeometryStyles):
-        for obj in GmlGeometryStyles:
-            obj.GmlFeatureStyle = self
+        collection = self._GmlGeometryStyles
+        for obj in members(GmlGeometryStyles):
+            old = obj._GmlFeatureStyle
+            if old is not None and old is not self:
+                old._GmlGeometryStyles.discard(obj)
+            obj._GmlFeatureStyle = self
+            collection.append(obj)
 
     def removeGmlGeometryStyles(self, *GmlGeometryStyles):
-        for obj in GmlGeometryStyles:
-            obj.GmlFeatureStyle = None
+        collection = self._GmlGeometryStyles
+        for obj in members(GmlGeometryStyles):
+            if obj._GmlFeatureStyle is self:
+                obj._GmlFeatureStyle = None
+                collection.discard(obj)
+
+    def removeAllGmlGeometryStyles(self):
+        for obj in self._GmlGeometryStyles:
+            obj._GmlFeatureStyle = None
+        self._GmlGeometryStyles = RefList()
 
     def getGmlSymbols(self):
         
@@ -112,26 +125,28 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlSymbols(self, value):
         for p in self._GmlSymbols:
-            filtered = [q for q in p.GmlFeatureStyles if q != self]
-            self._GmlSymbols._GmlFeatureStyles = filtered
-        for r in value:
-            if self not in r._GmlFeatureStyles:
-                r._GmlFeatureStyles.append(self)
-        self._GmlSymbols = value
+            p._GmlFeatureStyles.discard(self)
+        self._GmlSymbols = RefList()
+        self.addGmlSymbols(value)
 
     GmlSymbols = property(getGmlSymbols, setGmlSymbols)
 
     def addGmlSymbols(self, *GmlSymbols):
-        for obj in GmlSymbols:
-            if self not in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.append(self)
-            self._GmlSymbols.append(obj)
+        collection = self._GmlSymbols
+        for obj in members(GmlSymbols):
+            obj._GmlFeatureStyles.append(self)
+            collection.append(obj)
 
     def removeGmlSymbols(self, *GmlSymbols):
-        for obj in GmlSymbols:
-            if self in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.remove(self)
-            self._GmlSymbols.remove(obj)
+        collection = self._GmlSymbols
+        for obj in members(GmlSymbols):
+            obj._GmlFeatureStyles.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlSymbols(self):
+        for obj in self._GmlSymbols:
+            obj._GmlFeatureStyles.discard(self)
+        self._GmlSymbols = RefList()
 
     def getGmlTobologyStyles(self):
         
@@ -139,20 +154,32 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlTobologyStyles(self, value):
         for x in self._GmlTobologyStyles:
-            x.GmlFeatureStyle = None
-        for y in value:
-            y._GmlFeatureStyle = self
-        self._GmlTobologyStyles = value
+            x._GmlFeatureStyle = None
+        self._GmlTobologyStyles = RefList()
+        self.addGmlTobologyStyles(value)
 
     GmlTobologyStyles = property(getGmlTobologyStyles, setGmlTobologyStyles)
 
     def addGmlTobologyStyles(self, *GmlTobologyStyles):
-        for obj in GmlTobologyStyles:
-            obj.GmlFeatureStyle = self
+        collection = self._GmlTobologyStyles
+        for obj in members(GmlTobologyStyles):
+            old = obj._GmlFeatureStyle
+            if old is not None and old is not self:
+                old._GmlTobologyStyles.discard(obj)
+            obj._GmlFeatureStyle = self
+            collection.append(obj)
 
     def removeGmlTobologyStyles(self, *GmlTobologyStyles):
-        for obj in GmlTobologyStyles:
-            obj.GmlFeatureStyle = None
+        collection = self._GmlTobologyStyles
+        for obj in members(GmlTobologyStyles):
+            if obj._GmlFeatureStyle is self:
+                obj._GmlFeatureStyle = None
+                collection.discard(obj)
+
+    def removeAllGmlTobologyStyles(self):
+        for obj in self._GmlTobologyStyles:
+            obj._GmlFeatureStyle = None
+        self._GmlTobologyStyles = RefList()
 
     def getGmlLabelStyles(self):
         
@@ -160,20 +187,32 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlLabelStyles(self, value):
         for x in self._GmlLabelStyles:
-            x.GmlFeatureStyle = None
-        for y in value:
-            y._GmlFeatureStyle = self
-        self._GmlLabelStyles = value
+            x._GmlFeatureStyle = None
+        self._GmlLabelStyles = RefList()
+        self.addGmlLabelStyles(value)
 
     GmlLabelStyles = property(getGmlLabelStyles, setGmlLabelStyles)
 
     def addGmlLabelStyles(self, *GmlLabelStyles):
-        for obj in GmlLabelStyles:
-            obj.GmlFeatureStyle = self
+        collection = self._GmlLabelStyles
+        for obj in members(GmlLabelStyles):
+            old = obj._GmlFeatureStyle
+            if old is not None and old is not self:
+                old._GmlLabelStyles.discard(obj)
+            obj._GmlFeatureStyle = self
+            collection.append(obj)
 
     def removeGmlLabelStyles(self, *GmlLabelStyles):
-        for obj in GmlLabelStyles:
-            obj.GmlFeatureStyle = None
+        collection = self._GmlLabelStyles
+        for obj in members(GmlLabelStyles):
+            if obj._GmlFeatureStyle is self:
+                obj._GmlFeatureStyle = None
+                collection.discard(obj)
+
+    def removeAllGmlLabelStyles(self):
+        for obj in self._GmlLabelStyles:
+            obj._GmlFeatureStyle = None
+        self._GmlLabelStyles = RefList()
 
     def getGmlFeatureTypes(self):
         
@@ -181,24 +220,26 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlFeatureTypes(self, value):
         for p in self._GmlFeatureTypes:
-            filtered = [q for q in p.GmlFeatureStyles if q != self]
-            self._GmlFeatureTypes._GmlFeatureStyles = filtered
-        for r in value:
-            if self not in r._GmlFeatureStyles:
-                r._GmlFeatureStyles.append(self)
-        self._GmlFeatureTypes = value
+            p._GmlFeatureStyles.discard(self)
+        self._GmlFeatureTypes = RefList()
+        self.addGmlFeatureTypes(value)
 
     GmlFeatureTypes = property(getGmlFeatureTypes, setGmlFeatureTypes)
 
     def addGmlFeatureTypes(self, *GmlFeatureTypes):
-        for obj in GmlFeatureTypes:
-            if self not in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.append(self)
-            self._GmlFeatureTypes.append(obj)
+        collection = self._GmlFeatureTypes
+        for obj in members(GmlFeatureTypes):
+            obj._GmlFeatureStyles.append(self)
+            collection.append(obj)
 
     def removeGmlFeatureTypes(self, *GmlFeatureTypes):
-        for obj in GmlFeatureTypes:
-            if self in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.remove(self)
-            self._GmlFeatureTypes.remove(obj)
+        collection = self._GmlFeatureTypes
+        for obj in members(GmlFeatureTypes):
+            obj._GmlFeatureStyles.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlFeatureTypes(self):
+        for obj in self._GmlFeatureTypes:
+            obj._GmlFeatureStyles.discard(self)
+        self._GmlFeatureTypes = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlFeatureType(IdentifiedObject):
     """Type classification of feature.Type classification of feature.
@@ -29,7 +30,7 @@ class GmlFeatureType(IdentifiedObject):
 
         @param GmlFeatureStyles:
         """
-        self._GmlFeatureStyles = []
+        self._GmlFeatureStyles = RefList()
         self.GmlFeatureStyles = [] if GmlFeatureStyles is None else GmlFeatureStyles
 
         super(GmlFeatureType, self).__init__(*args, **kw_args)
@@ -47,24 +48,26 @@ class GmlFeatureType(IdentifiedObject):
 
     def setGmlFeatureStyles(self, value):
         for p in self._GmlFeatureStyles:
-            filtered = [q for q in p.GmlFeatureTypes if q != self]
-            self._GmlFeatureStyles._GmlFeatureTypes = filtered
-        for r in value:
-            if self not in r._GmlFeatureTypes:
-                r._GmlFeatureTypes.append(self)
-        self._GmlFeatureStyles = value
+            p._GmlFeatureTypes.discard(self)
+        self._GmlFeatureStyles = RefList()
+        self.addGmlFeatureStyles(value)
 
     GmlFeatureStyles = property(getGmlFeatureStyles, setGmlFeatureStyles)
 
     def addGmlFeatureStyles(self, *GmlFeatureStyles):
-        for obj in GmlFeatureStyles:
-            if self not in obj._GmlFeatureTypes:
-                obj._GmlFeatureTypes.append(self)
-            self._GmlFeatureStyles.append(obj)
+        collection = self._GmlFeatureStyles
+        for obj in members(GmlFeatureStyles):
+            obj._GmlFeatureTypes.append(self)
+            collection.append(obj)
 
     def removeGmlFeatureStyles(self, *GmlFeatureStyles):
-        for obj in GmlFeatureStyles:
-            if self in obj._GmlFeatureTypes:
-                obj._GmlFeatureTypes.remove(self)
-            self._GmlFeatureStyles.remove(obj)
+        collection = self._GmlFeatureStyles
+        for obj in members(GmlFeatureStyles):
+            obj._GmlFeatureTypes.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlFeatureStyles(self):
+        for obj in self._GmlFeatureStyles:
+            obj._GmlFeatureTypes.discard(self)
+        self._GmlFeatureStyles = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlFill(IdentifiedObject):
     """Specifies how the area of the geometry will be filled.Specifies how the area of the geometry will be filled.
@@ -40,16 +41,16 @@ class GmlFill(IdentifiedObject):
         self._GmlColour = None
         self.GmlColour = GmlColour
 
-        self._GmlMarks = []
+        self._GmlMarks = RefList()
         self.GmlMarks = [] if GmlMarks is None else GmlMarks
 
-        self._GmlTextSymbols = []
+        self._GmlTextSymbols = RefList()
         self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
 
-        self._GmlSvgParameters = []
+        self._GmlSvgParameters = RefList()
         self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
 
-        self._GmlPolygonSymbols = []
+        self._GmlPolygonSymbols = RefList()
         self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
 
         super(GmlFill, self).__init__(*args, **kw_args)
@@ -67,8 +68,7 @@ class GmlFill(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlFills if x != self]
-            self._GmlColour._GmlFills = filtered
+            self._GmlColour._GmlFills.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
@@ -83,26 +83,28 @@ class GmlFill(IdentifiedObject):
 
     def setGmlMarks(self, value):
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlFIlls if q != self]
-            self._GmlMarks._GmlFIlls = filtered
-        for r in value:
-            if self not in r._GmlFIlls:
-                r._GmlFIlls.append(self)
-        self._GmlMarks = value
+            p._GmlFIlls.discard(self)
+        self._GmlMarks = RefList()
+        self.addGmlMarks(value)
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
-        for obj in GmlMarks:
-            if self not in obj._GmlFIlls:
-                obj._GmlFIlls.append(self)
-            self._GmlMarks.append(obj)
+        collection = self._GmlMarks
+        for obj in members(GmlMarks):
+            obj._GmlFIlls.append(self)
+            collection.append(obj)
 
     def removeGmlMarks(self, *GmlMarks):
-        for obj in GmlMarks:
-            if self in obj._GmlFIlls:
-                obj._GmlFIlls.remove(self)
-            self._GmlMarks.remove(obj)
+        collection = self._GmlMarks
+        for obj in members(GmlMarks):
+            obj._GmlFIlls.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlMarks(self):
+        for obj in self._GmlMarks:
+            obj._GmlFIlls.discard(self)
+        self._GmlMarks = RefList()
 
     def getGmlTextSymbols(self):
         
@@ -110,20 +112,32 @@ class GmlFill(IdentifiedObject):
 
     def setGmlTextSymbols(self, value):
         for x in self._GmlTextSymbols:
-            x.GmlFill = None
-        for y in value:
-            y._GmlFill = self
-        self._GmlTextSymbols = value
+            x._GmlFill = None
+        self._GmlTextSymbols = RefList()
+        self.addGmlTextSymbols(value)
 
     GmlTextSymbols = property(getGmlTextSymbols, setGmlTextSymbols)
 
     def addGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlFill = self
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            old = obj._GmlFill
+            if old is not None and old is not self:
+                old._GmlTextSymbols.discard(obj)
+            obj._GmlFill = self
+            collection.append(obj)
 
     def removeGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlFill = None
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            if obj._GmlFill is self:
+                obj._GmlFill = None
+                collection.discard(obj)
+
+    def removeAllGmlTextSymbols(self):
+        for obj in self._GmlTextSymbols:
+            obj._GmlFill = None
+        self._GmlTextSymbols = RefList()
 
     def getGmlSvgParameters(self):
         
@@ -131,26 +145,28 @@ class GmlFill(IdentifiedObject):
 
     def setGmlSvgParameters(self, value):
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlFills if q != self]
-            self._GmlSvgParameters._GmlFills = filtered
-        for r in value:
-            if self not in r._GmlFills:
-                r._GmlFills.append(self)
-        self._GmlSvgParameters = value
+            p._GmlFills.discard(self)
+        self._GmlSvgParameters = RefList()
+        self.addGmlSvgParameters(value)
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
-        for obj in GmlSvgParameters:
-            if self not in obj._GmlFills:
-                obj._GmlFills.append(self)
-            self._GmlSvgParameters.append(obj)
+        collection = self._GmlSvgParameters
+        for obj in members(GmlSvgParameters):
+            obj._GmlFills.append(self)
+            collection.append(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
-        for obj in GmlSvgParameters:
-            if self in obj._GmlFills:
-                obj._GmlFills.remove(self)
-            self._GmlSvgParameters.remove(obj)
+        collection = self._GmlSvgParameters
+        for obj in members(GmlSvgParameters):
+            obj._GmlFills.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlSvgParameters(self):
+        for obj in self._GmlSvgParameters:
+            obj._GmlFills.discard(self)
+        self._GmlSvgParameters = RefList()
 
     def getGmlPolygonSymbols(self):
         
@@ -158,18 +174,30 @@ class GmlFill(IdentifiedObject):
 
     def setGmlPolygonSymbols(self, value):
         for x in self._GmlPolygonSymbols:
-            x.GmlFill = None
-        for y in value:
-            y._GmlFill = self
-        self._GmlPolygonSymbols = value
+            x._GmlFill = None
+        self._GmlPolygonSymbols = RefList()
+        self.addGmlPolygonSymbols(value)
 
     GmlPolygonSymbols = property(getGmlPolygonSymbols, setGmlPolygonSymbols)
 
     def addGmlPolygonSymbols(self, *GmlPolygonSymbols):
-        for obj in GmlPolygonSymbols:
-            obj.GmlFill = self
+        collection = self._GmlPolygonSymbols
+        for obj in members(GmlPolygonSymbols):
+            old = obj._GmlFill
+            if old is not None and old is not self:
+                old._GmlPolygonSymbols.discard(obj)
+            obj._GmlFill = self
+            collection.append(obj)
 
     def removeGmlPolygonSymbols(self, *GmlPolygonSymbols):
-        for obj in GmlPolygonSymbols:
-            obj.GmlFill = None
+        collection = self._GmlPolygonSymbols
+        for obj in members(GmlPolygonSymbols):
+            if obj._GmlFill is self:
+                obj._GmlFill = None
+                collection.discard(obj)
+
+    def removeAllGmlPolygonSymbols(self):
+        for obj in self._GmlPolygonSymbols:
+            obj._GmlFill = None
+        self._GmlPolygonSymbols = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlFont(IdentifiedObject):
     """Identifies a font of a certain family, style, and size.Identifies a font of a certain family, style, and size.
@@ -51,10 +52,10 @@ class GmlFont(IdentifiedObject):
         #: The amount of weight or boldness to use for a font. Allowed values are 'normal' and 'bold'.
         self.weight = weight
 
-        self._GmlTextSymbols = []
+        self._GmlTextSymbols = RefList()
         self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
 
-        self._GmlSvgParameters = []
+        self._GmlSvgParameters = RefList()
         self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
 
         self._GmlColour = None
@@ -75,20 +76,32 @@ class GmlFont(IdentifiedObject):
 
     def setGmlTextSymbols(self, value):
         for x in self._GmlTextSymbols:
-            x.GmlFont = None
-        for y in value:
-            y._GmlFont = self
-        self._GmlTextSymbols = value
+            x._GmlFont = None
+        self._GmlTextSymbols = RefList()
+        self.addGmlTextSymbols(value)
 
     GmlTextSymbols = property(getGmlTextSymbols, setGmlTextSymbols)
 
     def addGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlFont = self
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            old = obj._GmlFont
+            if old is not None and old is not self:
+                old._GmlTextSymbols.discard(obj)
+            obj._GmlFont = self
+            collection.append(obj)
 
     def removeGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlFont = None
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            if obj._GmlFont is self:
+                obj._GmlFont = None
+                collection.discard(obj)
+
+    def removeAllGmlTextSymbols(self):
+        for obj in self._GmlTextSymbols:
+            obj._GmlFont = None
+        self._GmlTextSymbols = RefList()
 
     def getGmlSvgParameters(self):
         
@@ -96,26 +109,28 @@ class GmlFont(IdentifiedObject):
 
     def setGmlSvgParameters(self, value):
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlFonts if q != self]
-            self._GmlSvgParameters._GmlFonts = filtered
-        for r in value:
-            if self not in r._GmlFonts:
-                r._GmlFonts.append(self)
-        self._GmlSvgParameters = value
+            p._GmlFonts.discard(self)
+        self._GmlSvgParameters = RefList()
+        self.addGmlSvgParameters(value)
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
-        for obj in GmlSvgParameters:
-            if self not in obj._GmlFonts:
-                obj._GmlFonts.append(self)
-            self._GmlSvgParameters.append(obj)
+        collection = self._GmlSvgParameters
+        for obj in members(GmlSvgParameters):
+            obj._GmlFonts.append(self)
+            collection.append(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
-        for obj in GmlSvgParameters:
-            if self in obj._GmlFonts:
-                obj._GmlFonts.remove(self)
-            self._GmlSvgParameters.remove(obj)
+        collection = self._GmlSvgParameters
+        for obj in members(GmlSvgParameters):
+            obj._GmlFonts.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlSvgParameters(self):
+        for obj in self._GmlSvgParameters:
+            obj._GmlFonts.discard(self)
+        self._GmlSvgParameters = RefList()
 
     def getGmlColour(self):
         
@@ -123,8 +138,7 @@ class GmlFont(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlFonts if x != self]
-            self._GmlColour._GmlFonts = filtered
+            self._GmlColour._GmlFonts.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
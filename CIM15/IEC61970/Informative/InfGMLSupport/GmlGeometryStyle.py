@@ -63,8 +63,7 @@ class GmlGeometryStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlGeometryStyles if x != self]
-            self._GmlFeatureStyle._GmlGeometryStyles = filtered
+            self._GmlFeatureStyle._GmlGeometryStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
@@ -79,8 +78,7 @@ class GmlGeometryStyle(IdentifiedObject):
 
     def setGmlLabelStyle(self, value):
         if self._GmlLabelStyle is not None:
-            filtered = [x for x in self.GmlLabelStyle.GmlGeometryStyles if x != self]
-            self._GmlLabelStyle._GmlGeometryStyles = filtered
+            self._GmlLabelStyle._GmlGeometryStyles.discard(self)
 
         self._GmlLabelStyle = value
         if self._GmlLabelStyle is not None:
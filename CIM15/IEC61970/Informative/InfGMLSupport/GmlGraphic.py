@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlGraphic(IdentifiedObject):
     """A 'graphic symbol' with an inherent shape, color(s), and possibly size. A 'graphic' can be very informally defined as 'a little picture' and can be of either a raster or vector-graphic source type.A 'graphic symbol' with an inherent shape, color(s), and possibly size. A 'graphic' can be very informally defined as 'a little picture' and can be of either a raster or vector-graphic source type.
@@ -58,10 +59,10 @@ class GmlGraphic(IdentifiedObject):
         #: Vertical scaling factor of normal symbol - particularly applicable to busbars if not described through a sequence of gmlPositions (e.g., Busbars).
         self.yScale = yScale
 
-        self._GmlMarks = []
+        self._GmlMarks = RefList()
         self.GmlMarks = [] if GmlMarks is None else GmlMarks
 
-        self._GmlPointSymbols = []
+        self._GmlPointSymbols = RefList()
         self.GmlPointSymbols = [] if GmlPointSymbols is None else GmlPointSymbols
 
         super(GmlGraphic, self).__init__(*args, **kw_args)
@@ -79,26 +80,28 @@ class GmlGraphic(IdentifiedObject):
 
     def setGmlMarks(self, value):
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlGraphics if q != self]
-            self._GmlMarks._GmlGraphics = filtered
-        for r in value:
-            if self not in r._GmlGraphics:
-                r._GmlGraphics.append(self)
-        self._GmlMarks = value
+            p._GmlGraphics.discard(self)
+        self._GmlMarks = RefList()
+        self.addGmlMarks(value)
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
-        for obj in GmlMarks:
-            if self not in obj._GmlGraphics:
-                obj._GmlGraphics.append(self)
-            self._GmlMarks.append(obj)
+        collection = self._GmlMarks
+        for obj in members(GmlMarks):
+            obj._GmlGraphics.append(self)
+            collection.append(obj)
 
     def removeGmlMarks(self, *GmlMarks):
-        for obj in GmlMarks:
-            if self in obj._GmlGraphics:
-                obj._GmlGraphics.remove(self)
-            self._GmlMarks.remove(obj)
+        collection = self._GmlMarks
+        for obj in members(GmlMarks):
+            obj._GmlGraphics.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlMarks(self):
+        for obj in self._GmlMarks:
+            obj._GmlGraphics.discard(self)
+        self._GmlMarks = RefList()
 
     def getGmlPointSymbols(self):
         
@@ -106,18 +109,30 @@ class GmlGraphic(IdentifiedObject):
 
     def setGmlPointSymbols(self, value):
         for x in self._GmlPointSymbols:
-            x.GmlGraphic = None
-        for y in value:
-            y._GmlGraphic = self
-        self._GmlPointSymbols = value
+            x._GmlGraphic = None
+        self._GmlPointSymbols = RefList()
+        self.addGmlPointSymbols(value)
 
     GmlPointSymbols = property(getGmlPointSymbols, setGmlPointSymbols)
 
     def addGmlPointSymbols(self, *GmlPointSymbols):
-        for obj in GmlPointSymbols:
-            obj.GmlGraphic = self
+        collection = self._GmlPointSymbols
+        for obj in members(GmlPointSymbols):
+            old = obj._GmlGraphic
+            if old is not None and old is not self:
+                old._GmlPointSymbols.discard(obj)
+            obj._GmlGraphic = self
+            collection.append(obj)
 
     def removeGmlPointSymbols(self, *GmlPointSymbols):
-        for obj in GmlPointSymbols:
-            obj.GmlGraphic = None
+        collection = self._GmlPointSymbols
+        for obj in members(GmlPointSymbols):
+            if obj._GmlGraphic is self:
+                obj._GmlGraphic = None
+                collection.discard(obj)
+
+    def removeAllGmlPointSymbols(self):
+        for obj in self._GmlPointSymbols:
+            obj._GmlGraphic = None
+        self._GmlPointSymbols = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlHalo(IdentifiedObject):
     """A type of Fill that is applied to the backgrounds of font glyphs. The use of halos greatly improves the readability of text labels.A type of Fill that is applied to the backgrounds of font glyphs. The use of halos greatly improves the readability of text labels.
@@ -37,7 +38,7 @@ class GmlHalo(IdentifiedObject):
         #: Specifies the level of translucency to use when rendering the Fill. The value is encoded as a floating-point value between 0.0 and 1.0 with 0.0 representing completely transparent and 1.0 representing completely opaque, with a linear scale of translucency for intermediate values. The default value is 1.0
         self.opacity = opacity
 
-        self._GmlTextSymbols = []
+        self._GmlTextSymbols = RefList()
         self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
 
         super(GmlHalo, self).__init__(*args, **kw_args)
@@ -55,18 +56,30 @@ class GmlHalo(IdentifiedObject):
 
     def setGmlTextSymbols(self, value):
         for x in self._GmlTextSymbols:
-            x.GmlHalo = None
-        for y in value:
-            y._GmlHalo = self
-        self._GmlTextSymbols = value
+            x._GmlHalo = None
+        self._GmlTextSymbols = RefList()
+        self.addGmlTextSymbols(value)
 
     GmlTextSymbols = property(getGmlTextSymbols, setGmlTextSymbols)
 
     def addGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlHalo = self
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            old = obj._GmlHalo
+            if old is not None and old is not self:
+                old._GmlTextSymbols.discard(obj)
+            obj._GmlHalo = self
+            collection.append(obj)
 
     def removeGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlHalo = None
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            if obj._GmlHalo is self:
+                obj._GmlHalo = None
+                collection.discard(obj)
+
+    def removeAllGmlTextSymbols(self):
+        for obj in self._GmlTextSymbols:
+            obj._GmlHalo = None
+        self._GmlTextSymbols = RefList()
 
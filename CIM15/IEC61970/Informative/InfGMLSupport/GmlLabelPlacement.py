@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlLabelPlacement(IdentifiedObject):
     """Used to position a label relative to a point or a line.Used to position a label relative to a point or a line.
@@ -57,7 +58,7 @@ class GmlLabelPlacement(IdentifiedObject):
         #: Perpendicular distance away from a line to draw a label. The distance is in pixels and is positive to the left-hand side of the line string. Negative numbers mean right. The default offset is 0.
         self.offset = offset
 
-        self._GmlTextSymbols = []
+        self._GmlTextSymbols = RefList()
         self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
 
         super(GmlLabelPlacement, self).__init__(*args, **kw_args)
@@ -75,18 +76,30 @@ class GmlLabelPlacement(IdentifiedObject):
 
     def setGmlTextSymbols(self, value):
         for x in self._GmlTextSymbols:
-            x.GmlLabelPlacement = None
-        for y in value:
-            y._GmlLabelPlacement = self
-        self._GmlTextSymbols = value
+            x._GmlLabelPlacement = None
+        self._GmlTextSymbols = RefList()
+        self.addGmlTextSymbols(value)
 
     GmlTextSymbols = property(getGmlTextSymbols, setGmlTextSymbols)
 
     def addGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlLabelPlacement = self
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            old = obj._GmlLabelPlacement
+            if old is not None and old is not self:
+                old._GmlTextSymbols.discard(obj)
+            obj._GmlLabelPlacement = self
+            collection.append(obj)
 
     def removeGmlTextSymbols(self, *GmlTextSymbols):
-        for obj in GmlTextSymbols:
-            obj.GmlLabelPlacement = None
+        collection = self._GmlTextSymbols
+        for obj in members(GmlTextSymbols):
+            if obj._GmlLabelPlacement is self:
+                obj._GmlLabelPlacement = None
+                collection.discard(obj)
+
+    def removeAllGmlTextSymbols(self):
+        for obj in self._GmlTextSymbols:
+            obj._GmlLabelPlacement = None
+        self._GmlTextSymbols = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlLabelStyle(IdentifiedObject):
     """The style for the text that is to be displayed along with the graphical representation of a feature. The content of the label is not necessarily defined in the GML data set. More precisely, the content can be static text specified in the style itself and the text from the GML data set. Label style has two elements: gml:style that specifies the style and gml:label that is used to compose the label content.The style for the text that is to be displayed along with the graphical representation of a feature. The content of the label is not necessarily defined in the GML data set. More precisely, the content can be static text specified in the style itself and the text from the GML data set. Label style has two elements: gml:style that specifies the style and gml:label that is used to compose the label content.
@@ -43,10 +44,10 @@ class GmlLabelStyle(IdentifiedObject):
         #: Used to specify the style of the rendered text. The CSS2 styling expressions grammar should be used to express graphic properties.
         self.style = style
 
-        self._GmlTopologyStyles = []
+        self._GmlTopologyStyles = RefList()
         self.GmlTopologyStyles = [] if GmlTopologyStyles is None else GmlTopologyStyles
 
-        self._GmlGeometryStyles = []
+        self._GmlGeometryStyles = RefList()
         self.GmlGeometryStyles = [] if GmlGeometryStyles is None else GmlGeometryStyles
 
         self._GmlFeatureStyle = None
@@ -67,20 +68,32 @@ class GmlLabelStyle(IdentifiedObject):
 
     def setGmlTopologyStyles(self, value):
         for x in self._GmlTopologyStyles:
-            x.GmlLableStyle = None
-        for y in value:
-            y._GmlLableStyle = self
-        self._GmlTopologyStyles = value
+            x._GmlLableStyle = None
+        self._GmlTopologyStyles = RefList()
+        self.addGmlTopologyStyles(value)
 
     GmlTopologyStyles = property(getGmlTopologyStyles, setGmlTopologyStyles)
 
     def addGmlTopologyStyles(self, *GmlTopologyStyles):
-        for obj in GmlTopologyStyles:
-            obj.GmlLableStyle = self
+        collection = self._GmlTopologyStyles
+        for obj in members(GmlTopologyStyles):
+            old = obj._GmlLableStyle
+            if old is not None and old is not self:
+                old._GmlTopologyStyles.discard(obj)
+            obj._GmlLableStyle = self
+            collection.append(obj)
 
     def removeGmlTopologyStyles(self, *GmlTopologyStyles):
-        for obj in GmlTopologyStyles:
-            obj.GmlLableStyle = None
+        collection = self._GmlTopologyStyles
+        for obj in members(GmlTopologyStyles):
+            if obj._GmlLableStyle is self:
+                obj._GmlLableStyle = None
+                collection.discard(obj)
+
+    def removeAllGmlTopologyStyles(self):
+        for obj in self._GmlTopologyStyles:
+            obj._GmlLableStyle = None
+        self._GmlTopologyStyles = RefList()
 
     def getGmlGeometryStyles(self):
         
@@ -88,20 +101,32 @@ class GmlLabelStyle(IdentifiedObject):
 
     def setGmlGeometryStyles(self, value):
         for x in self._GmlGeometryStyles:
-            x.GmlLabelStyle = None
-        for y in value:
-            y._GmlLabelStyle = self
-        self._GmlGeometryStyles = value
+            x._GmlLabelStyle = None
+        self._GmlGeometryStyles = RefList()
+        self.addGmlGeometryStyles(value)
 
     GmlGeometryStyles = property(getGmlGeometryStyles, setGmlGeometryStyles)
 
     def addGmlGeometryStyles(self, *GmlGeometryStyles):
-        for obj in GmlGeometryStyles:
-            obj.GmlLabelStyle = self
+        collection = self._GmlGeometryStyles
+        for obj in members(GmlGeometryStyles):
+            old = obj._GmlLabelStyle
+            if old is not None and old is not self:
+                old._GmlGeometryStyles.discard(obj)
+            obj._GmlLabelStyle = self
+            collection.append(obj)
 
     def removeGmlGeometryStyles(self, *GmlGeometryStyles):
-        for obj in GmlGeometryStyles:
-            obj.GmlLabelStyle = None
+        collection = self._GmlGeometryStyles
+        for obj in members(GmlGeometryStyles):
+            if obj._GmlLabelStyle is self:
+                obj._GmlLabelStyle = None
+                collection.discard(obj)
+
+    def removeAllGmlGeometryStyles(self):
+        for obj in self._GmlGeometryStyles:
+            obj._GmlLabelStyle = None
+        self._GmlGeometryStyles = RefList()
 
     def getGmlFeatureStyle(self):
         
@@ -109,8 +134,7 @@ class GmlLabelStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlLabelStyles if x != self]
-            self._GmlFeatureStyle._GmlLabelStyles = filtered
+            self._GmlFeatureStyle._GmlLabelStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
@@ -55,8 +55,7 @@ class GmlLineSymbol(GmlSymbol):
 
     def setGmlStroke(self, value):
         if self._GmlStroke is not None:
-            filtered = [x for x in self.GmlStroke.GmlLineSymbols if x != self]
-            self._GmlStroke._GmlLineSymbols = filtered
+            self._GmlStroke._GmlLineSymbols.discard(self)
 
         self._GmlStroke = value
         if self._GmlStroke is not None:
@@ -71,8 +70,7 @@ class GmlLineSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlLineSymbols if x != self]
-            self._GmlDiagramObject._GmlLineSymbols = filtered
+            self._GmlDiagramObject._GmlLineSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
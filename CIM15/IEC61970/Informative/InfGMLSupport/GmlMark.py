@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlMark(IdentifiedObject):
     """Defines a 'shape' which has coloring applied to it (i.e. square, circle, triangle, star, ...).Defines a 'shape' which has coloring applied to it (i.e. square, circle, triangle, star, ...).
@@ -35,13 +36,13 @@ class GmlMark(IdentifiedObject):
         #: Gives the well-known name of the shape of the mark. Allowed values include at least square, circle, triangle, star, cross, and x.
         self.wellKnownName = wellKnownName
 
-        self._GmlGraphics = []
+        self._GmlGraphics = RefList()
         self.GmlGraphics = [] if GmlGraphics is None else GmlGraphics
 
-        self._GmlStrokes = []
+        self._GmlStrokes = RefList()
         self.GmlStrokes = [] if GmlStrokes is None else GmlStrokes
 
-        self._GmlFIlls = []
+        self._GmlFIlls = RefList()
         self.GmlFIlls = [] if GmlFIlls is None else GmlFIlls
 
         super(GmlMark, self).__init__(*args, **kw_args)
@@ -59,26 +60,28 @@ class GmlMark(IdentifiedObject):
 
     def setGmlGraphics(self, value):
         for p in self._GmlGraphics:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlGraphics._GmlMarks = filtered
-        for r in value:
-            if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
-        self._GmlGraphics = value
+            p._GmlMarks.discard(self)
+        self._GmlGraphics = RefList()
+        self.addGmlGraphics(value)
 
     GmlGraphics = property(getGmlGraphics, setGmlGraphics)
 
     def addGmlGraphics(self, *GmlGraphics):
-        for obj in GmlGraphics:
-            if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlGraphics.append(obj)
+        collection = self._GmlGraphics
+        for obj in members(GmlGraphics):
+            obj._GmlMarks.append(self)
+            collection.append(obj)
 
     def removeGmlGraphics(self, *GmlGraphics):
-        for obj in GmlGraphics:
-            if self in obj._GmlMarks:
-                obj._GmlMarks.remove(self)
-            self._GmlGraphics.remove(obj)
+        collection = self._GmlGraphics
+        for obj in members(GmlGraphics):
+            obj._GmlMarks.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlGraphics(self):
+        for obj in self._GmlGraphics:
+            obj._GmlMarks.discard(self)
+        self._GmlGraphics = RefList()
 
     def getGmlStrokes(self):
         
@@ -86,26 +89,28 @@ class GmlMark(IdentifiedObject):
 
     def setGmlStrokes(self, value):
         for p in self._GmlStrokes:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlStrokes._GmlMarks = filtered
-        for r in value:
-            if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
-        self._GmlStrokes = value
+            p._GmlMarks.discard(self)
+        self._GmlStrokes = RefList()
+        self.addGmlStrokes(value)
 
     GmlStrokes = property(getGmlStrokes, setGmlStrokes)
 
     def addGmlStrokes(self, *GmlStrokes):
-        for obj in GmlStrokes:
-            if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlStrokes.append(obj)
+        collection = self._GmlStrokes
+        for obj in members(GmlStrokes):
+            obj._GmlMarks.append(self)
+            collection.append(obj)
 
     def removeGmlStrokes(self, *GmlStrokes):
-        for obj in GmlStrokes:
-            if self in obj._GmlMarks:
-                obj._GmlMarks.remove(self)
-            self._GmlStrokes.remove(obj)
+        collection = self._GmlStrokes
+        for obj in members(GmlStrokes):
+            obj._GmlMarks.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlStrokes(self):
+        for obj in self._GmlStrokes:
+            obj._GmlMarks.discard(self)
+        self._GmlStrokes = RefList()
 
     def getGmlFIlls(self):
         
@@ -113,24 +118,26 @@ class GmlMark(IdentifiedObject):
 
     def setGmlFIlls(self, value):
         for p in self._GmlFIlls:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlFIlls._GmlMarks = filtered
-        for r in value:
-            if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
-        self._GmlFIlls = value
+            p._GmlMarks.discard(self)
+        self._GmlFIlls = RefList()
+        self.addGmlFIlls(value)
 
     GmlFIlls = property(getGmlFIlls, setGmlFIlls)
 
     def addGmlFIlls(self, *GmlFIlls):
-        for obj in GmlFIlls:
-            if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlFIlls.append(obj)
+        collection = self._GmlFIlls
+        for obj in members(GmlFIlls):
+            obj._GmlMarks.append(self)
+            collection.append(obj)
 
     def removeGmlFIlls(self, *GmlFIlls):
-        for obj in GmlFIlls:
-            if self in obj._GmlMarks:
-                obj._GmlMarks.remove(self)
-            self._GmlFIlls.remove(obj)
+        collection = self._GmlFIlls
+        for obj in members(GmlFIlls):
+            obj._GmlMarks.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlFIlls(self):
+        for obj in self._GmlFIlls:
+            obj._GmlMarks.discard(self)
+        self._GmlFIlls = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class GmlObservation(Element):
     """A GML observation models the act of observing, often with a camera, a person or some form of instrument. An observation feature describes the 'metadata' associated with an information capture event, together with a value for the result of the observation. The basic structures introduced in this class are intended to serve as the foundation for more comprehensive schemas for scientific, technical and engineering measurement schemas.A GML observation models the act of observing, often with a camera, a person or some form of instrument. An observation feature describes the 'metadata' associated with an information capture event, together with a value for the result of the observation. The basic structures introduced in this class are intended to serve as the foundation for more comprehensive schemas for scientific, technical and engineering measurement schemas.
@@ -47,13 +48,13 @@ class GmlObservation(Element):
 
         self.dateTime = dateTime
 
-        self._GmlDiagramObjects = []
+        self._GmlDiagramObjects = RefList()
         self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._GmlValues = []
+        self._GmlValues = RefList()
         self.GmlValues = [] if GmlValues is None else GmlValues
 
         super(GmlObservation, self).__init__(*args, **kw_args)
@@ -71,26 +72,28 @@ class GmlObservation(Element):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.GmlObservatins if q != self]
-            self._GmlDiagramObjects._GmlObservatins = filtered
-        for r in value:
-            if self not in r._GmlObservatins:
-                r._GmlObservatins.append(self)
-        self._GmlDiagramObjects = value
+            p._GmlObservatins.discard(self)
+        self._GmlDiagramObjects = RefList()
+        self.addGmlDiagramObjects(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self not in obj._GmlObservatins:
-                obj._GmlObservatins.append(self)
-            self._GmlDiagramObjects.append(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._GmlObservatins.append(self)
+            collection.append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self in obj._GmlObservatins:
-                obj._GmlObservatins.remove(self)
-            self._GmlDiagramObjects.remove(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._GmlObservatins.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlDiagramObjects(self):
+        for obj in self._GmlDiagramObjects:
+            obj._GmlObservatins.discard(self)
+        self._GmlDiagramObjects = RefList()
 
     def getChangeItems(self):
         
@@ -98,20 +101,32 @@ class GmlObservation(Element):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.GmlObservation = None
-        for y in value:
-            y._GmlObservation = self
-        self._ChangeItems = value
+            x._GmlObservation = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.GmlObservation = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._GmlObservation
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._GmlObservation = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.GmlObservation = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._GmlObservation is self:
+                obj._GmlObservation = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._GmlObservation = None
+        self._ChangeItems = RefList()
 
     def getGmlValues(self):
         
@@ -119,18 +134,30 @@ class GmlObservation(Element):
 
     def setGmlValues(self, value):
         for x in self._GmlValues:
-            x.GmlObservation = None
-        for y in value:
-            y._GmlObservation = self
-        self._GmlValues = value
+            x._GmlObservation = None
+        self._GmlValues = RefList()
+        self.addGmlValues(value)
 
     GmlValues = property(getGmlValues, setGmlValues)
 
     def addGmlValues(self, *GmlValues):
-        for obj in GmlValues:
-            obj.GmlObservation = self
+        collection = self._GmlValues
+        for obj in members(GmlValues):
+            old = obj._GmlObservation
+            if old is not None and old is not self:
+                old._GmlValues.discard(obj)
+            obj._GmlObservation = self
+            collection.append(obj)
 
     def removeGmlValues(self, *GmlValues):
-        for obj in GmlValues:
-            obj.GmlObservation = None
+        collection = self._GmlValues
+        for obj in members(GmlValues):
+            if obj._GmlObservation is self:
+                obj._GmlObservation = None
+                collection.discard(obj)
+
+    def removeAllGmlValues(self):
+        for obj in self._GmlValues:
+            obj._GmlObservation = None
+        self._GmlValues = RefList()
 
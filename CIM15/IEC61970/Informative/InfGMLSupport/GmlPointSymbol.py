@@ -51,8 +51,7 @@ class GmlPointSymbol(GmlSymbol):
 
     def setGmlGraphic(self, value):
         if self._GmlGraphic is not None:
-            filtered = [x for x in self.GmlGraphic.GmlPointSymbols if x != self]
-            self._GmlGraphic._GmlPointSymbols = filtered
+            self._GmlGraphic._GmlPointSymbols.discard(self)
 
         self._GmlGraphic = value
         if self._GmlGraphic is not None:
@@ -67,8 +66,7 @@ class GmlPointSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlPointSymbols if x != self]
-            self._GmlDiagramObject._GmlPointSymbols = filtered
+            self._GmlDiagramObject._GmlPointSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
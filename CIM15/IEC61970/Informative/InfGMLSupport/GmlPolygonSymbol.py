@@ -55,8 +55,7 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlPolygonSymbols if x != self]
-            self._GmlDiagramObject._GmlPolygonSymbols = filtered
+            self._GmlDiagramObject._GmlPolygonSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
@@ -71,8 +70,7 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlFill(self, value):
         if self._GmlFill is not None:
-            filtered = [x for x in self.GmlFill.GmlPolygonSymbols if x != self]
-            self._GmlFill._GmlPolygonSymbols = filtered
+            self._GmlFill._GmlPolygonSymbols.discard(self)
 
         self._GmlFill = value
         if self._GmlFill is not None:
@@ -87,8 +85,7 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlStroke(self, value):
         if self._GmlStroke is not None:
-            filtered = [x for x in self.GmlStroke.GmlPolygonSymbols if x != self]
-            self._GmlStroke._GmlPolygonSymbols = filtered
+            self._GmlStroke._GmlPolygonSymbols.discard(self)
 
         self._GmlStroke = value
         if self._GmlStroke is not None:
@@ -79,8 +79,7 @@ class GmlRasterSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlRasterSymbols if x != self]
-            self._GmlDiagramObject._GmlRasterSymbols = filtered
+            self._GmlDiagramObject._GmlRasterSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
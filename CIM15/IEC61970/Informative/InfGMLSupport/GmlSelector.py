@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlSelector(IdentifiedObject):
     """A diagram element that allows selection by a user, i.e. as 'hyperNode' for navigating between diagrams, or as composite object representing multiple grouped objects.A diagram element that allows selection by a user, i.e. as 'hyperNode' for navigating between diagrams, or as composite object representing multiple grouped objects.
@@ -30,10 +31,10 @@ class GmlSelector(IdentifiedObject):
         @param ChangeItems:
         @param GmlDiagramObjects:
         """
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._GmlDiagramObjects = []
+        self._GmlDiagramObjects = RefList()
         self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
 
         super(GmlSelector, self).__init__(*args, **kw_args)
@@ -51,20 +52,32 @@ class GmlSelector(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.GmlSelector = None
-        for y in value:
-            y._GmlSelector = self
-        self._ChangeItems = value
+            x._GmlSelector = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.GmlSelector = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._GmlSelector
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._GmlSelector = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.GmlSelector = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._GmlSelector is self:
+                obj._GmlSelector = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._GmlSelector = None
+        self._ChangeItems = RefList()
 
     def getGmlDiagramObjects(self):
         
@@ -72,24 +85,26 @@ class GmlSelector(IdentifiedObject):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.GmlSelectors if q != self]
-            self._GmlDiagramObjects._GmlSelectors = filtered
-        for r in value:
-            if self not in r._GmlSelectors:
-                r._GmlSelectors.append(self)
-        self._GmlDiagramObjects = value
+            p._GmlSelectors.discard(self)
+        self._GmlDiagramObjects = RefList()
+        self.addGmlDiagramObjects(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self not in obj._GmlSelectors:
-                obj._GmlSelectors.append(self)
-            self._GmlDiagramObjects.append(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._GmlSelectors.append(self)
+            collection.append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
-        for obj in GmlDiagramObjects:
-            if self in obj._GmlSelectors:
-                obj._GmlSelectors.remove(self)
-            self._GmlDiagramObjects.remove(obj)
+        collection = self._GmlDiagramObjects
+        for obj in members(GmlDiagramObjects):
+            obj._GmlSelectors.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlDiagramObjects(self):
+        for obj in self._GmlDiagramObjects:
+            obj._GmlSelectors.discard(self)
+        self._GmlDiagramObjects = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlStroke(IdentifiedObject):
     """The element encapsulating the graphical symbolization parameters for linear geometries.The element encapsulating the graphical symbolization parameters for linear geometries.
@@ -64,16 +65,16 @@ class GmlStroke(IdentifiedObject):
         self._GmlColour = None
         self.GmlColour = GmlColour
 
-        self._GmlPolygonSymbols = []
+        self._GmlPolygonSymbols = RefList()
         self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
 
-        self._GmlMarks = []
+        self._GmlMarks = RefList()
         self.GmlMarks = [] if GmlMarks is None else GmlMarks
 
-        self._GmlSvgParameters = []
+        self._GmlSvgParameters = RefList()
         self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
 
-        self._GmlLineSymbols = []
+        self._GmlLineSymbols = RefList()
         self.GmlLineSymbols = [] if GmlLineSymbols is None else GmlLineSymbols
 
         super(GmlStroke, self).__init__(*args, **kw_args)
@@ -91,8 +92,7 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlStrokes if x != self]
-            self._GmlColour._GmlStrokes = filtered
+            self._GmlColour._GmlStrokes.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
@@ -107,20 +107,32 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlPolygonSymbols(self, value):
         for x in self._GmlPolygonSymbols:
-            x.GmlStroke = None
-        for y in value:
-            y._GmlStroke = self
-        self._GmlPolygonSymbols = value
+            x._GmlStroke = None
+        self._GmlPolygonSymbols = RefList()
+        self.addGmlPolygonSymbols(value)
 
     GmlPolygonSymbols = property(getGmlPolygonSymbols, setGmlPolygonSymbols)
 
     def addGmlPolygonSymbols(self, *GmlPolygonSymbols):
-        for obj in GmlPolygonSymbols:
-            obj.GmlStroke = self
+        collection = self._GmlPolygonSymbols
+        for obj in members(GmlPolygonSymbols):
+            old = obj._GmlStroke
+            if old is not None and old is not self:
+                old._GmlPolygonSymbols.discard(obj)
+            obj._GmlStroke = self
+            collection.append(obj)
 
     def removeGmlPolygonSymbols(self, *GmlPolygonSymbols):
-        for obj in GmlPolygonSymbols:
-            obj.GmlStroke = None
+        collection = self._GmlPolygonSymbols
+        for obj in members(GmlPolygonSymbols):
+            if obj._GmlStroke is self:
+                obj._GmlStroke = None
+                collection.discard(obj)
+
+    def removeAllGmlPolygonSymbols(self):
+        for obj in self._GmlPolygonSymbols:
+            obj._GmlStroke = None
+        self._GmlPolygonSymbols = RefList()
 
     def getGmlMarks(self):
         
@@ -128,26 +140,28 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlMarks(self, value):
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlStrokes if q != self]
-            self._GmlMarks._GmlStrokes = filtered
-        for r in value:
-            if self not in r._GmlStrokes:
-                r._GmlStrokes.append(self)
-        self._GmlMarks = value
+            p._GmlStrokes.discard(self)
+        self._GmlMarks = RefList()
+        self.addGmlMarks(value)
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
-        for obj in GmlMarks:
-            if self not in obj._GmlStrokes:
-                obj._GmlStrokes.append(self)
-            self._GmlMarks.append(obj)
+        collection = self._GmlMarks
+        for obj in members(GmlMarks):
+            obj._GmlStrokes.append(self)
+            collection.append(obj)
 
     def removeGmlMarks(self, *GmlMarks):
-        for obj in GmlMarks:
-            if self in obj._GmlStrokes:
-                obj._GmlStrokes.remove(self)
-            self._GmlMarks.remove(obj)
+        collection = self._GmlMarks
+        for obj in members(GmlMarks):
+            obj._GmlStrokes.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlMarks(self):
+        for obj in self._GmlMarks:
+            obj._GmlStrokes.discard(self)
+        self._GmlMarks = RefList()
 
     def getGmlSvgParameters(self):
         
@@ -155,26 +169,28 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlSvgParameters(self, value):
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlStokes if q != self]
-            self._GmlSvgParameters._GmlStokes = filtered
-        for r in value:
-            if self not in r._GmlStokes:
-                r._GmlStokes.append(self)
-        self._GmlSvgParameters = value
+            p._GmlStokes.discard(self)
+        self._GmlSvgParameters = RefList()
+        self.addGmlSvgParameters(value)
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
-        for obj in GmlSvgParameters:
-            if self not in obj._GmlStokes:
-                obj._GmlStokes.append(self)
-            self._GmlSvgParameters.append(obj)
+        collection = self._GmlSvgParameters
+        for obj in members(GmlSvgParameters):
+            obj._GmlStokes.append(self)
+            collection.append(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
-        for obj in GmlSvgParameters:
-            if self in obj._GmlStokes:
-                obj._GmlStokes.remove(self)
-            self._GmlSvgParameters.remove(obj)
+        collection = self._GmlSvgParameters
+        for obj in members(GmlSvgParameters):
+            obj._GmlStokes.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlSvgParameters(self):
+        for obj in self._GmlSvgParameters:
+            obj._GmlStokes.discard(self)
+        self._GmlSvgParameters = RefList()
 
     def getGmlLineSymbols(self):
         
@@ -182,18 +198,30 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlLineSymbols(self, value):
         for x in self._GmlLineSymbols:
-            x.GmlStroke = None
-        for y in value:
-            y._GmlStroke = self
-        self._GmlLineSymbols = value
+            x._GmlStroke = None
+        self._GmlLineSymbols = RefList()
+        self.addGmlLineSymbols(value)
 
     GmlLineSymbols = property(getGmlLineSymbols, setGmlLineSymbols)
 
     def addGmlLineSymbols(self, *GmlLineSymbols):
-        for obj in GmlLineSymbols:
-            obj.GmlStroke = self
+        collection = self._GmlLineSymbols
+        for obj in members(GmlLineSymbols):
+            old = obj._GmlStroke
+            if old is not None and old is not self:
+                old._GmlLineSymbols.discard(obj)
+            obj._GmlStroke = self
+            collection.append(obj)
 
     def removeGmlLineSymbols(self, *GmlLineSymbols):
-        for obj in GmlLineSymbols:
-            obj.GmlStroke = None
+        collection = self._GmlLineSymbols
+        for obj in members(GmlLineSymbols):
+            if obj._GmlStroke is self:
+                obj._GmlStroke = None
+                collection.discard(obj)
+
+    def removeAllGmlLineSymbols(self):
+        for obj in self._GmlLineSymbols:
+            obj._GmlStroke = None
+        self._GmlLineSymbols = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlSvgParameter(IdentifiedObject):
     """Refers to an SVG/CSS graphical-formatting parameter. The parameter is identified using the 'name' attribute and the content of the element gives the SVG/CSS-coded value.Refers to an SVG/CSS graphical-formatting parameter. The parameter is identified using the 'name' attribute and the content of the element gives the SVG/CSS-coded value.
@@ -39,13 +40,13 @@ class GmlSvgParameter(IdentifiedObject):
         #: The SVG/CSS-coded value of the associated SvgAttribute.
         self.value = value
 
-        self._GmlStokes = []
+        self._GmlStokes = RefList()
         self.GmlStokes = [] if GmlStokes is None else GmlStokes
 
-        self._GmlFonts = []
+        self._GmlFonts = RefList()
         self.GmlFonts = [] if GmlFonts is None else GmlFonts
 
-        self._GmlFills = []
+        self._GmlFills = RefList()
         self.GmlFills = [] if GmlFills is None else GmlFills
 
         super(GmlSvgParameter, self).__init__(*args, **kw_args)
@@ -63,26 +64,28 @@ class GmlSvgParameter(IdentifiedObject):
 
     def setGmlStokes(self, value):
         for p in self._GmlStokes:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlStokes._GmlSvgParameters = filtered
-        for r in value:
-            if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
-        self._GmlStokes = value
+            p._GmlSvgParameters.discard(self)
+        self._GmlStokes = RefList()
+        self.addGmlStokes(value)
 
     GmlStokes = property(getGmlStokes, setGmlStokes)
 
     def addGmlStokes(self, *GmlStokes):
-        for obj in GmlStokes:
-            if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlStokes.append(obj)
+        collection = self._GmlStokes
+        for obj in members(GmlStokes):
+            obj._GmlSvgParameters.append(self)
+            collection.append(obj)
 
     def removeGmlStokes(self, *GmlStokes):
-        for obj in GmlStokes:
-            if self in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.remove(self)
-            self._GmlStokes.remove(obj)
+        collection = self._GmlStokes
+        for obj in members(GmlStokes):
+            obj._GmlSvgParameters.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlStokes(self):
+        for obj in self._GmlStokes:
+            obj._GmlSvgParameters.discard(self)
+        self._GmlStokes = RefList()
 
     def getGmlFonts(self):
         
@@ -90,26 +93,28 @@ class GmlSvgParameter(IdentifiedObject):
 
     def setGmlFonts(self, value):
         for p in self._GmlFonts:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlFonts._GmlSvgParameters = filtered
-        for r in value:
-            if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
-        self._GmlFonts = value
+            p._GmlSvgParameters.discard(self)
+        self._GmlFonts = RefList()
+        self.addGmlFonts(value)
 
     GmlFonts = property(getGmlFonts, setGmlFonts)
 
     def addGmlFonts(self, *GmlFonts):
-        for obj in GmlFonts:
-            if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlFonts.append(obj)
+        collection = self._GmlFonts
+        for obj in members(GmlFonts):
+            obj._GmlSvgParameters.append(self)
+            collection.append(obj)
 
     def removeGmlFonts(self, *GmlFonts):
-        for obj in GmlFonts:
-            if self in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.remove(self)
-            self._GmlFonts.remove(obj)
+        collection = self._GmlFonts
+        for obj in members(GmlFonts):
+            obj._GmlSvgParameters.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlFonts(self):
+        for obj in self._GmlFonts:
+            obj._GmlSvgParameters.discard(self)
+        self._GmlFonts = RefList()
 
     def getGmlFills(self):
         
@@ -117,24 +122,26 @@ class GmlSvgParameter(IdentifiedObject):
 
     def setGmlFills(self, value):
         for p in self._GmlFills:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlFills._GmlSvgParameters = filtered
-        for r in value:
-            if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
-        self._GmlFills = value
+            p._GmlSvgParameters.discard(self)
+        self._GmlFills = RefList()
+        self.addGmlFills(value)
 
     GmlFills = property(getGmlFills, setGmlFills)
 
     def addGmlFills(self, *GmlFills):
-        for obj in GmlFills:
-            if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlFills.append(obj)
+        collection = self._GmlFills
+        for obj in members(GmlFills):
+            obj._GmlSvgParameters.append(self)
+            collection.append(obj)
 
     def removeGmlFills(self, *GmlFills):
-        for obj in GmlFills:
-            if self in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.remove(self)
-            self._GmlFills.remove(obj)
+        collection = self._GmlFills
+        for obj in members(GmlFills):
+            obj._GmlSvgParameters.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlFills(self):
+        for obj in self._GmlFills:
+            obj._GmlSvgParameters.discard(self)
+        self._GmlFills = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class GmlSymbol(IdentifiedObject):
     """Describes how a feature is to appear on a map or display. The symbol describes not just the shape that should appear but also such graphical properties as color and opacity.Describes how a feature is to appear on a map or display. The symbol describes not just the shape that should appear but also such graphical properties as color and opacity.
@@ -42,7 +43,7 @@ class GmlSymbol(IdentifiedObject):
         #: The Symbol type.
         self.type = type
 
-        self._GmlFeatureStyles = []
+        self._GmlFeatureStyles = RefList()
         self.GmlFeatureStyles = [] if GmlFeatureStyles is None else GmlFeatureStyles
 
         self._GmlBaseSymbol = None
@@ -63,26 +64,28 @@ class GmlSymbol(IdentifiedObject):
 
     def setGmlFeatureStyles(self, value):
         for p in self._GmlFeatureStyles:
-            filtered = [q for q in p.GmlSymbols if q != self]
-            self._GmlFeatureStyles._GmlSymbols = filtered
-        for r in value:
-            if self not in r._GmlSymbols:
-                r._GmlSymbols.append(self)
-        self._GmlFeatureStyles = value
+            p._GmlSymbols.discard(self)
+        self._GmlFeatureStyles = RefList()
+        self.addGmlFeatureStyles(value)
 
     GmlFeatureStyles = property(getGmlFeatureStyles, setGmlFeatureStyles)
 
     def addGmlFeatureStyles(self, *GmlFeatureStyles):
-        for obj in GmlFeatureStyles:
-            if self not in obj._GmlSymbols:
-                obj._GmlSymbols.append(self)
-            self._GmlFeatureStyles.append(obj)
+        collection = self._GmlFeatureStyles
+        for obj in members(GmlFeatureStyles):
+            obj._GmlSymbols.append(self)
+            collection.append(obj)
 
     def removeGmlFeatureStyles(self, *GmlFeatureStyles):
-        for obj in GmlFeatureStyles:
-            if self in obj._GmlSymbols:
-                obj._GmlSymbols.remove(self)
-            self._GmlFeatureStyles.remove(obj)
+        collection = self._GmlFeatureStyles
+        for obj in members(GmlFeatureStyles):
+            obj._GmlSymbols.discard(self)
+            collection.discard(obj)
+
+    def removeAllGmlFeatureStyles(self):
+        for obj in self._GmlFeatureStyles:
+            obj._GmlSymbols.discard(self)
+        self._GmlFeatureStyles = RefList()
 
     def getGmlBaseSymbol(self):
         
@@ -90,8 +93,7 @@ class GmlSymbol(IdentifiedObject):
 
     def setGmlBaseSymbol(self, value):
         if self._GmlBaseSymbol is not None:
-            filtered = [x for x in self.GmlBaseSymbol.GmlSymbols if x != self]
-            self._GmlBaseSymbol._GmlSymbols = filtered
+            self._GmlBaseSymbol._GmlSymbols.discard(self)
 
         self._GmlBaseSymbol = value
         if self._GmlBaseSymbol is not None:
@@ -83,8 +83,7 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlFill(self, value):
         if self._GmlFill is not None:
-            filtered = [x for x in self.GmlFill.GmlTextSymbols if x != self]
-            self._GmlFill._GmlTextSymbols = filtered
+            self._GmlFill._GmlTextSymbols.discard(self)
 
         self._GmlFill = value
         if self._GmlFill is not None:
@@ -99,8 +98,7 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlLabelPlacement(self, value):
         if self._GmlLabelPlacement is not None:
-            filtered = [x for x in self.GmlLabelPlacement.GmlTextSymbols if x != self]
-            self._GmlLabelPlacement._GmlTextSymbols = filtered
+            self._GmlLabelPlacement._GmlTextSymbols.discard(self)
 
         self._GmlLabelPlacement = value
         if self._GmlLabelPlacement is not None:
@@ -115,8 +113,7 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlHalo(self, value):
         if self._GmlHalo is not None:
-            filtered = [x for x in self.GmlHalo.GmlTextSymbols if x != self]
-            self._GmlHalo._GmlTextSymbols = filtered
+            self._GmlHalo._GmlTextSymbols.discard(self)
 
         self._GmlHalo = value
         if self._GmlHalo is not None:
@@ -131,8 +128,7 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlFont(self, value):
         if self._GmlFont is not None:
-            filtered = [x for x in self.GmlFont.GmlTextSymbols if x != self]
-            self._GmlFont._GmlTextSymbols = filtered
+            self._GmlFont._GmlTextSymbols.discard(self)
 
         self._GmlFont = value
         if self._GmlFont is not None:
@@ -147,8 +143,7 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlTextSymbols if x != self]
-            self._GmlDiagramObject._GmlTextSymbols = filtered
+            self._GmlDiagramObject._GmlTextSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
@@ -51,8 +51,7 @@ class GmlTopologyStyle(IdentifiedObject):
 
     def setGmlLableStyle(self, value):
         if self._GmlLableStyle is not None:
-            filtered = [x for x in self.GmlLableStyle.GmlTopologyStyles if x != self]
-            self._GmlLableStyle._GmlTopologyStyles = filtered
+            self._GmlLableStyle._GmlTopologyStyles.discard(self)
 
         self._GmlLableStyle = value
         if self._GmlLableStyle is not None:
@@ -67,8 +66,7 @@ class GmlTopologyStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlTobologyStyles if x != self]
-            self._GmlFeatureStyle._GmlTobologyStyles = filtered
+            self._GmlFeatureStyle._GmlTobologyStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
@@ -63,8 +63,7 @@ class GmlValue(IdentifiedObject):
 
     def setGmlObservation(self, value):
         if self._GmlObservation is not None:
-            filtered = [x for x in self.GmlObservation.GmlValues if x != self]
-            self._GmlObservation._GmlValues = filtered
+            self._GmlObservation._GmlValues.discard(self)
 
         self._GmlObservation = value
         if self._GmlObservation is not None:
@@ -79,8 +78,7 @@ class GmlValue(IdentifiedObject):
 
     def setMeasurementValue(self, value):
         if self._MeasurementValue is not None:
-            filtered = [x for x in self.MeasurementValue.GmlValues if x != self]
-            self._MeasurementValue._GmlValues = filtered
+            self._MeasurementValue._GmlValues.discard(self)
 
         self._MeasurementValue = value
         if self._MeasurementValue is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Metering.EndDeviceFunction import EndDeviceFunction
+from PyCIM.RefList import RefList, members
 
 class LoadMgmtFunction(EndDeviceFunction):
     """A collective function at an end device that manages the customer load.A collective function at an end device that manages the customer load.
@@ -54,10 +55,10 @@ class LoadMgmtFunction(EndDeviceFunction):
         #: After a command had been received to activate the mannualOverRide state or remoteOverRideState, the normal (halted) schedule will resume after this specified time duration had elapsed.
         self.overRideTimeOut = overRideTimeOut
 
-        self._Switches = []
+        self._Switches = RefList()
         self.Switches = [] if Switches is None else Switches
 
-        self._LoadMgmtRecords = []
+        self._LoadMgmtRecords = RefList()
         self.LoadMgmtRecords = [] if LoadMgmtRecords is None else LoadMgmtRecords
 
         super(LoadMgmtFunction, self).__init__(*args, **kw_args)
@@ -75,26 +76,28 @@ class LoadMgmtFunction(EndDeviceFunction):
 
     def setSwitches(self, value):
         for p in self._Switches:
-            filtered = [q for q in p.LoadMgmtFunctions if q != self]
-            self._Switches._LoadMgmtFunctions = filtered
-        for r in value:
-            if self not in r._LoadMgmtFunctions:
-                r._LoadMgmtFunctions.append(self)
-        self._Switches = value
+            p._LoadMgmtFunctions.discard(self)
+        self._Switches = RefList()
+        self.addSwitches(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
-        for obj in Switches:
-            if self not in obj._LoadMgmtFunctions:
-                obj._LoadMgmtFunctions.append(self)
-            self._Switches.append(obj)
+        collection = self._Switches
+        for obj in members(Switches):
+            obj._LoadMgmtFunctions.append(self)
+            collection.append(obj)
 
     def removeSwitches(self, *Switches):
-        for obj in Switches:
-            if self in obj._LoadMgmtFunctions:
-                obj._LoadMgmtFunctions.remove(self)
-            self._Switches.remove(obj)
+        collection = self._Switches
+        for obj in members(Switches):
+            obj._LoadMgmtFunctions.discard(self)
+            collection.discard(obj)
+
+    def removeAllSwitches(self):
+        for obj in self._Switches:
+            obj._LoadMgmtFunctions.discard(self)
+        self._Switches = RefList()
 
     def getLoadMgmtRecords(self):
         
@@ -102,18 +105,30 @@ class LoadMgmtFunction(EndDeviceFunction):
 
     def setLoadMgmtRecords(self, value):
         for x in self._LoadMgmtRecords:
-            x.LoadMgmtFunction = None
-        for y in value:
-            y._LoadMgmtFunction = self
-        self._LoadMgmtRecords = value
+            x._LoadMgmtFunction = None
+        self._LoadMgmtRecords = RefList()
+        self.addLoadMgmtRecords(value)
 
     LoadMgmtRecords = property(getLoadMgmtRecords, setLoadMgmtRecords)
 
     def addLoadMgmtRecords(self, *LoadMgmtRecords):
-        for obj in LoadMgmtRecords:
-            obj.LoadMgmtFunction = self
+        collection = self._LoadMgmtRecords
+        for obj in members(LoadMgmtRecords):
+            old = obj._LoadMgmtFunction
+            if old is not None and old is not self:
+                old._LoadMgmtRecords.discard(obj)
+            obj._LoadMgmtFunction = self
+            collection.append(obj)
 
     def removeLoadMgmtRecords(self, *LoadMgmtRecords):
-        for obj in LoadMgmtRecords:
-            obj.LoadMgmtFunction = None
+        collection = self._LoadMgmtRecords
+        for obj in members(LoadMgmtRecords):
+            if obj._LoadMgmtFunction is self:
+                obj._LoadMgmtFunction = None
+                collection.discard(obj)
+
+    def removeAllLoadMgmtRecords(self):
+        for obj in self._LoadMgmtRecords:
+            obj._LoadMgmtFunction = None
+        self._LoadMgmtRecords = RefList()
 
@@ -51,8 +51,7 @@ class LoadMgmtRecord(ActivityRecord):
 
     def setLoadMgmtFunction(self, value):
         if self._LoadMgmtFunction is not None:
-            filtered = [x for x in self.LoadMgmtFunction.LoadMgmtRecords if x != self]
-            self._LoadMgmtFunction._LoadMgmtRecords = filtered
+            self._LoadMgmtFunction._LoadMgmtRecords.discard(self)
 
         self._LoadMgmtFunction = value
         if self._LoadMgmtFunction is not None:
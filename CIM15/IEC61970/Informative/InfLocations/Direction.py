@@ -51,8 +51,7 @@ class Direction(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Directions if x != self]
-            self._Location._Directions = filtered
+            self._Location._Directions.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Hazard(IdentifiedObject):
     """A hazard is any object or condition that is a danger for causing loss or perils to an asset and/or people. Examples of hazards are trees growing under overhead power lines, a park being located by a substation (i.e., children climb fence to recover a ball), a lake near an overhead distribution line (fishing pole/line contacting power lines), etc.A hazard is any object or condition that is a danger for causing loss or perils to an asset and/or people. Examples of hazards are trees growing under overhead power lines, a park being located by a substation (i.e., children climb fence to recover a ball), a lake near an overhead distribution line (fishing pole/line contacting power lines), etc.
@@ -34,7 +35,7 @@ class Hazard(IdentifiedObject):
         #: Category by utility's corporate standards and practices.
         self.category = category
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
         self.status = status
@@ -55,26 +56,28 @@ class Hazard(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Hazards if q != self]
-            self._Locations._Hazards = filtered
-        for r in value:
-            if self not in r._Hazards:
-                r._Hazards.append(self)
-        self._Locations = value
+            p._Hazards.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._Hazards:
-                obj._Hazards.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Hazards.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._Hazards:
-                obj._Hazards.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Hazards.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._Hazards.discard(self)
+        self._Locations = RefList()
 
     status = None
 
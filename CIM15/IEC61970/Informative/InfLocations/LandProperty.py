@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class LandProperty(IdentifiedObject):
     """Information about a particular piece of (land) property such as its use. Ownership of the property may be determined through associations to Organisations and/or ErpPersons.Information about a particular piece of (land) property such as its use. Ownership of the property may be determined through associations to Organisations and/or ErpPersons.
@@ -50,25 +51,25 @@ class LandProperty(IdentifiedObject):
 
         self.status = status
 
-        self._LocationGrants = []
+        self._LocationGrants = RefList()
         self.LocationGrants = [] if LocationGrants is None else LocationGrants
 
-        self._ErpSiteLevelDatas = []
+        self._ErpSiteLevelDatas = RefList()
         self.ErpSiteLevelDatas = [] if ErpSiteLevelDatas is None else ErpSiteLevelDatas
 
-        self._ErpPersonRoles = []
+        self._ErpPersonRoles = RefList()
         self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
 
-        self._ErpOrganisationRoles = []
+        self._ErpOrganisationRoles = RefList()
         self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
 
-        self._AssetContainers = []
+        self._AssetContainers = RefList()
         self.AssetContainers = [] if AssetContainers is None else AssetContainers
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
-        self._RightOfWays = []
+        self._RightOfWays = RefList()
         self.RightOfWays = [] if RightOfWays is None else RightOfWays
 
         super(LandProperty, self).__init__(*args, **kw_args)
@@ -89,20 +90,32 @@ class LandProperty(IdentifiedObject):
 
     def setLocationGrants(self, value):
         for x in self._LocationGrants:
-            x.LandProperty = None
-        for y in value:
-            y._LandProperty = self
-        self._LocationGrants = value
+            x._LandProperty = None
+        self._LocationGrants = RefList()
+        self.addLocationGrants(value)
 
     LocationGrants = property(getLocationGrants, setLocationGrants)
 
     def addLocationGrants(self, *LocationGrants):
-        for obj in LocationGrants:
-            obj.LandProperty = self
+        collection = self._LocationGrants
+        for obj in members(LocationGrants):
+            old = obj._LandProperty
+            if old is not None and old is not self:
+                old._LocationGrants.discard(obj)
+            obj._LandProperty = self
+            collection.append(obj)
 
     def removeLocationGrants(self, *LocationGrants):
-        for obj in LocationGrants:
-            obj.LandProperty = None
+        collection = self._LocationGrants
+        for obj in members(LocationGrants):
+            if obj._LandProperty is self:
+                obj._LandProperty = None
+                collection.discard(obj)
+
+    def removeAllLocationGrants(self):
+        for obj in self._LocationGrants:
+            obj._LandProperty = None
+        self._LocationGrants = RefList()
 
     def getErpSiteLevelDatas(self):
         
@@ -110,20 +123,32 @@ class LandProperty(IdentifiedObject):
 
     def setErpSiteLevelDatas(self, value):
         for x in self._ErpSiteLevelDatas:
-            x.LandProperty = None
-        for y in value:
-            y._LandProperty = self
-        self._ErpSiteLevelDatas = value
+            x._LandProperty = None
+        self._ErpSiteLevelDatas = RefList()
+        self.addErpSiteLevelDatas(value)
 
     ErpSiteLevelDatas = property(getErpSiteLevelDatas, setErpSiteLevelDatas)
 
     def addErpSiteLevelDatas(self, *ErpSiteLevelDatas):
-        for obj in ErpSiteLevelDatas:
-            obj.LandProperty = self
+        collection = self._ErpSiteLevelDatas
+        for obj in members(ErpSiteLevelDatas):
+            old = obj._LandProperty
+            if old is not None and old is not self:
+                old._ErpSiteLevelDatas.discard(obj)
+            obj._LandProperty = self
+            collection.append(obj)
 
     def removeErpSiteLevelDatas(self, *ErpSiteLevelDatas):
-        for obj in ErpSiteLevelDatas:
-            obj.LandProperty = None
+        collection = self._ErpSiteLevelDatas
+        for obj in members(ErpSiteLevelDatas):
+            if obj._LandProperty is self:
+                obj._LandProperty = None
+                collection.discard(obj)
+
+    def removeAllErpSiteLevelDatas(self):
+        for obj in self._ErpSiteLevelDatas:
+            obj._LandProperty = None
+        self._ErpSiteLevelDatas = RefList()
 
     def getErpPersonRoles(self):
         
@@ -131,20 +156,32 @@ class LandProperty(IdentifiedObject):
 
     def setErpPersonRoles(self, value):
         for x in self._ErpPersonRoles:
-            x.LandProperty = None
-        for y in value:
-            y._LandProperty = self
-        self._ErpPersonRoles = value
+            x._LandProperty = None
+        self._ErpPersonRoles = RefList()
+        self.addErpPersonRoles(value)
 
     ErpPersonRoles = property(getErpPersonRoles, setErpPersonRoles)
 
     def addErpPersonRoles(self, *ErpPersonRoles):
-        for obj in ErpPersonRoles:
-            obj.LandProperty = self
+        collection = self._ErpPersonRoles
+        for obj in members(ErpPersonRoles):
+            old = obj._LandProperty
+            if old is not None and old is not self:
+                old._ErpPersonRoles.discard(obj)
+            obj._LandProperty = self
+            collection.append(obj)
 
     def removeErpPersonRoles(self, *ErpPersonRoles):
-        for obj in ErpPersonRoles:
-            obj.LandProperty = None
+        collection = self._ErpPersonRoles
+        for obj in members(ErpPersonRoles):
+            if obj._LandProperty is self:
+                obj._LandProperty = None
+                collection.discard(obj)
+
+    def removeAllErpPersonRoles(self):
+        for obj in self._ErpPersonRoles:
+            obj._LandProperty = None
+        self._ErpPersonRoles = RefList()
 
     def getErpOrganisationRoles(self):
         
@@ -152,26 +189,28 @@ class LandProperty(IdentifiedObject):
 
     def setErpOrganisationRoles(self, value):
         for p in self._ErpOrganisationRoles:
-            filtered = [q for q in p.LandProperty if q != self]
-            self._ErpOrganisationRoles._LandProperty = filtered
-        for r in value:
-            if self not in r._LandProperty:
-                r._LandProperty.append(self)
-        self._ErpOrganisationRoles = value
+            p._LandProperty.discard(self)
+        self._ErpOrganisationRoles = RefList()
+        self.addErpOrganisationRoles(value)
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            if self not in obj._LandProperty:
-                obj._LandProperty.append(self)
-            self._ErpOrganisationRoles.append(obj)
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            obj._LandProperty.append(self)
+            collection.append(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
-        for obj in ErpOrganisationRoles:
-            if self in obj._LandProperty:
-                obj._LandProperty.remove(self)
-            self._ErpOrganisationRoles.remove(obj)
+        collection = self._ErpOrganisationRoles
+        for obj in members(ErpOrganisationRoles):
+            obj._LandProperty.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpOrganisationRoles(self):
+        for obj in self._ErpOrganisationRoles:
+            obj._LandProperty.discard(self)
+        self._ErpOrganisationRoles = RefList()
 
     def getAssetContainers(self):
         
@@ -179,26 +218,28 @@ class LandProperty(IdentifiedObject):
 
     def setAssetContainers(self, value):
         for p in self._AssetContainers:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._AssetContainers._LandProperties = filtered
-        for r in value:
-            if self not in r._LandProperties:
-                r._LandProperties.append(self)
-        self._AssetContainers = value
+            p._LandProperties.discard(self)
+        self._AssetContainers = RefList()
+        self.addAssetContainers(value)
 
     AssetContainers = property(getAssetContainers, setAssetContainers)
 
     def addAssetContainers(self, *AssetContainers):
-        for obj in AssetContainers:
-            if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._AssetContainers.append(obj)
+        collection = self._AssetContainers
+        for obj in members(AssetContainers):
+            obj._LandProperties.append(self)
+            collection.append(obj)
 
     def removeAssetContainers(self, *AssetContainers):
-        for obj in AssetContainers:
-            if self in obj._LandProperties:
-                obj._LandProperties.remove(self)
-            self._AssetContainers.remove(obj)
+        collection = self._AssetContainers
+        for obj in members(AssetContainers):
+            obj._LandProperties.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssetContainers(self):
+        for obj in self._AssetContainers:
+            obj._LandProperties.discard(self)
+        self._AssetContainers = RefList()
 
     def getLocations(self):
         """The spatail description of a piece of property.
@@ -207,26 +248,28 @@ class LandProperty(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._Locations._LandProperties = filtered
-        for r in value:
-            if self not in r._LandProperties:
-                r._LandProperties.append(self)
-        self._Locations = value
+            p._LandProperties.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._LandProperties.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._LandProperties:
-                obj._LandProperties.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._LandProperties.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._LandProperties.discard(self)
+        self._Locations = RefList()
 
     def getRightOfWays(self):
         """All rights of way this land property has.
@@ -235,24 +278,26 @@ class LandProperty(IdentifiedObject):
 
     def setRightOfWays(self, value):
         for p in self._RightOfWays:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._RightOfWays._LandProperties = filtered
-        for r in value:
-            if self not in r._LandProperties:
-                r._LandProperties.append(self)
-        self._RightOfWays = value
+            p._LandProperties.discard(self)
+        self._RightOfWays = RefList()
+        self.addRightOfWays(value)
 
     RightOfWays = property(getRightOfWays, setRightOfWays)
 
     def addRightOfWays(self, *RightOfWays):
-        for obj in RightOfWays:
-            if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._RightOfWays.append(obj)
+        collection = self._RightOfWays
+        for obj in members(RightOfWays):
+            obj._LandProperties.append(self)
+            collection.append(obj)
 
     def removeRightOfWays(self, *RightOfWays):
-        for obj in RightOfWays:
-            if self in obj._LandProperties:
-                obj._LandProperties.remove(self)
-            self._RightOfWays.remove(obj)
+        collection = self._RightOfWays
+        for obj in members(RightOfWays):
+            obj._LandProperties.discard(self)
+            collection.discard(obj)
+
+    def removeAllRightOfWays(self):
+        for obj in self._RightOfWays:
+            obj._LandProperties.discard(self)
+        self._RightOfWays = RefList()
 
@@ -52,8 +52,7 @@ class LocationGrant(Agreement):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.LocationGrants if x != self]
-            self._LandProperty._LocationGrants = filtered
+            self._LandProperty._LocationGrants.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from PyCIM.RefList import RefList, members
 
 class OrgPropertyRole(Role):
     """Roles played between Organisations and a given piece of property. For example, the Organisation may be the owner, renter, occupier, taxiing authority, etc.Roles played between Organisations and a given piece of property. For example, the Organisation may be the owner, renter, occupier, taxiing authority, etc.
@@ -30,7 +31,7 @@ class OrgPropertyRole(Role):
         @param LandProperty:
         @param ErpOrganisation:
         """
-        self._LandProperty = []
+        self._LandProperty = RefList()
         self.LandProperty = [] if LandProperty is None else LandProperty
 
         self._ErpOrganisation = None
@@ -51,26 +52,28 @@ class OrgPropertyRole(Role):
 
     def setLandProperty(self, value):
         for p in self._LandProperty:
-            filtered = [q for q in p.ErpOrganisationRoles if q != self]
-            self._LandProperty._ErpOrganisationRoles = filtered
-        for r in value:
-            if self not in r._ErpOrganisationRoles:
-                r._ErpOrganisationRoles.append(self)
-        self._LandProperty = value
+            p._ErpOrganisationRoles.discard(self)
+        self._LandProperty = RefList()
+        self.addLandProperty(value)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
     def addLandProperty(self, *LandProperty):
-        for obj in LandProperty:
-            if self not in obj._ErpOrganisationRoles:
-                obj._ErpOrganisationRoles.append(self)
-            self._LandProperty.append(obj)
+        collection = self._LandProperty
+        for obj in members(LandProperty):
+            obj._ErpOrganisationRoles.append(self)
+            collection.append(obj)
 
     def removeLandProperty(self, *LandProperty):
-        for obj in LandProperty:
-            if self in obj._ErpOrganisationRoles:
-                obj._ErpOrganisationRoles.remove(self)
-            self._LandProperty.remove(obj)
+        collection = self._LandProperty
+        for obj in members(LandProperty):
+            obj._ErpOrganisationRoles.discard(self)
+            collection.discard(obj)
+
+    def removeAllLandProperty(self):
+        for obj in self._LandProperty:
+            obj._ErpOrganisationRoles.discard(self)
+        self._LandProperty = RefList()
 
     def getErpOrganisation(self):
         
@@ -78,8 +81,7 @@ class OrgPropertyRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.LandPropertyRoles if x != self]
-            self._ErpOrganisation._LandPropertyRoles = filtered
+            self._ErpOrganisation._LandPropertyRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
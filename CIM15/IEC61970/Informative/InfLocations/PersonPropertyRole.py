@@ -51,8 +51,7 @@ class PersonPropertyRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.LandPropertyRoles if x != self]
-            self._ErpPerson._LandPropertyRoles = filtered
+            self._ErpPerson._LandPropertyRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
@@ -67,8 +66,7 @@ class PersonPropertyRole(Role):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.ErpPersonRoles if x != self]
-            self._LandProperty._ErpPersonRoles = filtered
+            self._LandProperty._ErpPersonRoles.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class RedLine(IdentifiedObject):
     """This class is used for handling the accompanying annotations, time stamp, author, etc. of designs, drawings and maps. A red line can be associated with any Location object.This class is used for handling the accompanying annotations, time stamp, author, etc. of designs, drawings and maps. A red line can be associated with any Location object.
@@ -30,7 +31,7 @@ class RedLine(IdentifiedObject):
         @param Locations:
         @param status:
         """
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
         self.status = status
@@ -50,26 +51,28 @@ class RedLine(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.RedLines if q != self]
-            self._Locations._RedLines = filtered
-        for r in value:
-            if self not in r._RedLines:
-                r._RedLines.append(self)
-        self._Locations = value
+            p._RedLines.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._RedLines:
-                obj._RedLines.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._RedLines.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._RedLines:
-                obj._RedLines.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._RedLines.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._RedLines.discard(self)
+        self._Locations = RefList()
 
     status = None
 
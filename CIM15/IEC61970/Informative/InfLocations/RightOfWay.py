@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from PyCIM.RefList import RefList, members
 
 class RightOfWay(Agreement):
     """A right-of-way (ROW) is for land where it is lawful to use for a public road, an electric power line, etc. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.A right-of-way (ROW) is for land where it is lawful to use for a public road, an electric power line, etc. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.
@@ -33,7 +34,7 @@ class RightOfWay(Agreement):
         #: Property related information that describes the ROW's land parcel. For example, it may be a deed book number, deed book page number, and parcel number.
         self.propertyData = propertyData
 
-        self._LandProperties = []
+        self._LandProperties = RefList()
         self.LandProperties = [] if LandProperties is None else LandProperties
 
         super(RightOfWay, self).__init__(*args, **kw_args)
@@ -52,24 +53,26 @@ class RightOfWay(Agreement):
 
     def setLandProperties(self, value):
         for p in self._LandProperties:
-            filtered = [q for q in p.RightOfWays if q != self]
-            self._LandProperties._RightOfWays = filtered
-        for r in value:
-            if self not in r._RightOfWays:
-                r._RightOfWays.append(self)
-        self._LandProperties = value
+            p._RightOfWays.discard(self)
+        self._LandProperties = RefList()
+        self.addLandProperties(value)
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
-        for obj in LandProperties:
-            if self not in obj._RightOfWays:
-                obj._RightOfWays.append(self)
-            self._LandProperties.append(obj)
+        collection = self._LandProperties
+        for obj in members(LandProperties):
+            obj._RightOfWays.append(self)
+            collection.append(obj)
 
     def removeLandProperties(self, *LandProperties):
-        for obj in LandProperties:
-            if self in obj._RightOfWays:
-                obj._RightOfWays.remove(self)
-            self._LandProperties.remove(obj)
+        collection = self._LandProperties
+        for obj in members(LandProperties):
+            obj._RightOfWays.discard(self)
+            collection.discard(obj)
+
+    def removeAllLandProperties(self):
+        for obj in self._LandProperties:
+            obj._RightOfWays.discard(self)
+        self._LandProperties = RefList()
 
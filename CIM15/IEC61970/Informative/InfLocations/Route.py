@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Route(IdentifiedObject):
     """Route that is followed, for example by service crews.Route that is followed, for example by service crews.
@@ -35,12 +36,12 @@ class Route(IdentifiedObject):
         #: Category by utility's work management standards and practices.
         self.category = category
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
         self.status = status
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
         super(Route, self).__init__(*args, **kw_args)
@@ -58,20 +59,32 @@ class Route(IdentifiedObject):
 
     def setCrews(self, value):
         for x in self._Crews:
-            x.Route = None
-        for y in value:
-            y._Route = self
-        self._Crews = value
+            x._Route = None
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            obj.Route = self
+        collection = self._Crews
+        for obj in members(Crews):
+            old = obj._Route
+            if old is not None and old is not self:
+                old._Crews.discard(obj)
+            obj._Route = self
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            obj.Route = None
+        collection = self._Crews
+        for obj in members(Crews):
+            if obj._Route is self:
+                obj._Route = None
+                collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._Route = None
+        self._Crews = RefList()
 
     status = None
 
@@ -81,24 +94,26 @@ class Route(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Routes if q != self]
-            self._Locations._Routes = filtered
-        for r in value:
-            if self not in r._Routes:
-                r._Routes.append(self)
-        self._Locations = value
+            p._Routes.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._Routes:
-                obj._Routes.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Routes.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._Routes:
-                obj._Routes.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Routes.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._Routes.discard(self)
+        self._Locations = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CallBack(IdentifiedObject):
     """Information about a planned CallBack or a CallBack that has occurred, from the utility to a customer regarding the status and plans about resolving trouble, performing work, etc.Information about a planned CallBack or a CallBack that has occurred, from the utility to a customer regarding the status and plans about resolving trouble, performing work, etc.
@@ -52,13 +53,13 @@ class CallBack(IdentifiedObject):
         #: Descriptiion of the problem reported during this call back.
         self.problemInfo = problemInfo
 
-        self._Appointments = []
+        self._Appointments = RefList()
         self.Appointments = [] if Appointments is None else Appointments
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
-        self._TroubleTickets = []
+        self._TroubleTickets = RefList()
         self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
 
         self.status = status
@@ -78,20 +79,32 @@ class CallBack(IdentifiedObject):
 
     def setAppointments(self, value):
         for x in self._Appointments:
-            x.CallBack = None
-        for y in value:
-            y._CallBack = self
-        self._Appointments = value
+            x._CallBack = None
+        self._Appointments = RefList()
+        self.addAppointments(value)
 
     Appointments = property(getAppointments, setAppointments)
 
     def addAppointments(self, *Appointments):
-        for obj in Appointments:
-            obj.CallBack = self
+        collection = self._Appointments
+        for obj in members(Appointments):
+            old = obj._CallBack
+            if old is not None and old is not self:
+                old._Appointments.discard(obj)
+            obj._CallBack = self
+            collection.append(obj)
 
     def removeAppointments(self, *Appointments):
-        for obj in Appointments:
-            obj.CallBack = None
+        collection = self._Appointments
+        for obj in members(Appointments):
+            if obj._CallBack is self:
+                obj._CallBack = None
+                collection.discard(obj)
+
+    def removeAllAppointments(self):
+        for obj in self._Appointments:
+            obj._CallBack = None
+        self._Appointments = RefList()
 
     def getErpPersons(self):
         
@@ -99,26 +112,28 @@ class CallBack(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.CallBacks if q != self]
-            self._ErpPersons._CallBacks = filtered
-        for r in value:
-            if self not in r._CallBacks:
-                r._CallBacks.append(self)
-        self._ErpPersons = value
+            p._CallBacks.discard(self)
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self not in obj._CallBacks:
-                obj._CallBacks.append(self)
-            self._ErpPersons.append(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._CallBacks.append(self)
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self in obj._CallBacks:
-                obj._CallBacks.remove(self)
-            self._ErpPersons.remove(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._CallBacks.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._CallBacks.discard(self)
+        self._ErpPersons = RefList()
 
     def getTroubleTickets(self):
         
@@ -126,26 +141,28 @@ class CallBack(IdentifiedObject):
 
     def setTroubleTickets(self, value):
         for p in self._TroubleTickets:
-            filtered = [q for q in p.CallBacks if q != self]
-            self._TroubleTickets._CallBacks = filtered
-        for r in value:
-            if self not in r._CallBacks:
-                r._CallBacks.append(self)
-        self._TroubleTickets = value
+            p._CallBacks.discard(self)
+        self._TroubleTickets = RefList()
+        self.addTroubleTickets(value)
 
     TroubleTickets = property(getTroubleTickets, setTroubleTickets)
 
     def addTroubleTickets(self, *TroubleTickets):
-        for obj in TroubleTickets:
-            if self not in obj._CallBacks:
-                obj._CallBacks.append(self)
-            self._TroubleTickets.append(obj)
+        collection = self._TroubleTickets
+        for obj in members(TroubleTickets):
+            obj._CallBacks.append(self)
+            collection.append(obj)
 
     def removeTroubleTickets(self, *TroubleTickets):
-        for obj in TroubleTickets:
-            if self in obj._CallBacks:
-                obj._CallBacks.remove(self)
-            self._TroubleTickets.remove(obj)
+        collection = self._TroubleTickets
+        for obj in members(TroubleTickets):
+            obj._CallBacks.discard(self)
+            collection.discard(obj)
+
+    def removeAllTroubleTickets(self):
+        for obj in self._TroubleTickets:
+            obj._CallBacks.discard(self)
+        self._TroubleTickets = RefList()
 
     status = None
 
@@ -94,8 +94,7 @@ class ChangeItem(IdentifiedObject):
 
     def setGmlSelector(self, value):
         if self._GmlSelector is not None:
-            filtered = [x for x in self.GmlSelector.ChangeItems if x != self]
-            self._GmlSelector._ChangeItems = filtered
+            self._GmlSelector._ChangeItems.discard(self)
 
         self._GmlSelector = value
         if self._GmlSelector is not None:
@@ -110,8 +109,7 @@ class ChangeItem(IdentifiedObject):
 
     def setOrganisation(self, value):
         if self._Organisation is not None:
-            filtered = [x for x in self.Organisation.ChangeItems if x != self]
-            self._Organisation._ChangeItems = filtered
+            self._Organisation._ChangeItems.discard(self)
 
         self._Organisation = value
         if self._Organisation is not None:
@@ -126,8 +124,7 @@ class ChangeItem(IdentifiedObject):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ChangeItems if x != self]
-            self._Document._ChangeItems = filtered
+            self._Document._ChangeItems.discard(self)
 
         self._Document = value
         if self._Document is not None:
@@ -142,8 +139,7 @@ class ChangeItem(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.ChangeItems if x != self]
-            self._Asset._ChangeItems = filtered
+            self._Asset._ChangeItems.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
@@ -160,8 +156,7 @@ class ChangeItem(IdentifiedObject):
 
     def setGmlObservation(self, value):
         if self._GmlObservation is not None:
-            filtered = [x for x in self.GmlObservation.ChangeItems if x != self]
-            self._GmlObservation._ChangeItems = filtered
+            self._GmlObservation._ChangeItems.discard(self)
 
         self._GmlObservation = value
         if self._GmlObservation is not None:
@@ -176,8 +171,7 @@ class ChangeItem(IdentifiedObject):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.ChangeItems if x != self]
-            self._ErpPerson._ChangeItems = filtered
+            self._ErpPerson._ChangeItems.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
@@ -192,8 +186,7 @@ class ChangeItem(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.ChangeItems if x != self]
-            self._PowerSystemResource._ChangeItems = filtered
+            self._PowerSystemResource._ChangeItems.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -208,8 +201,7 @@ class ChangeItem(IdentifiedObject):
 
     def setChangeSet(self, value):
         if self._ChangeSet is not None:
-            filtered = [x for x in self.ChangeSet.ChangeItems if x != self]
-            self._ChangeSet._ChangeItems = filtered
+            self._ChangeSet._ChangeItems.discard(self)
 
         self._ChangeSet = value
         if self._ChangeSet is not None:
@@ -224,8 +216,7 @@ class ChangeItem(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.ChangeItems if x != self]
-            self._Location._ChangeItems = filtered
+            self._Location._ChangeItems.discard(self)
 
         self._Location = value
         if self._Location is not None:
@@ -240,8 +231,7 @@ class ChangeItem(IdentifiedObject):
 
     def setNetworkDataSet(self, value):
         if self._NetworkDataSet is not None:
-            filtered = [x for x in self.NetworkDataSet.ChangeItems if x != self]
-            self._NetworkDataSet._ChangeItems = filtered
+            self._NetworkDataSet._ChangeItems.discard(self)
 
         self._NetworkDataSet = value
         if self._NetworkDataSet is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ChangeSet(IdentifiedObject):
     """The updates required in a transaction for an existing data set are grouped into a single ChangeSet. In data sets (e.g., NetworkDataSet), each major step in the ChangeSet is described through a separate ChangeItem associated with the data set. Within each data set, each inidividual object change is described with a seperate ChangeItem associated with the object.The updates required in a transaction for an existing data set are grouped into a single ChangeSet. In data sets (e.g., NetworkDataSet), each major step in the ChangeSet is described through a separate ChangeItem associated with the data set. Within each data set, each inidividual object change is described with a seperate ChangeItem associated with the object.
@@ -32,15 +33,15 @@ class ChangeSet(IdentifiedObject):
         @param status:
         @param Documents:
         """
-        self._NetworkDataSets = []
+        self._NetworkDataSets = RefList()
         self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
         self.status = status
 
-        self._Documents = []
+        self._Documents = RefList()
         self.Documents = [] if Documents is None else Documents
 
         super(ChangeSet, self).__init__(*args, **kw_args)
@@ -58,26 +59,28 @@ class ChangeSet(IdentifiedObject):
 
     def setNetworkDataSets(self, value):
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.ChangeSets if q != self]
-            self._NetworkDataSets._ChangeSets = filtered
-        for r in value:
-            if self not in r._ChangeSets:
-                r._ChangeSets.append(self)
-        self._NetworkDataSets = value
+            p._ChangeSets.discard(self)
+        self._NetworkDataSets = RefList()
+        self.addNetworkDataSets(value)
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
-        for obj in NetworkDataSets:
-            if self not in obj._ChangeSets:
-                obj._ChangeSets.append(self)
-            self._NetworkDataSets.append(obj)
+        collection = self._NetworkDataSets
+        for obj in members(NetworkDataSets):
+            obj._ChangeSets.append(self)
+            collection.append(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
-        for obj in NetworkDataSets:
-            if self in obj._ChangeSets:
-                obj._ChangeSets.remove(self)
-            self._NetworkDataSets.remove(obj)
+        collection = self._NetworkDataSets
+        for obj in members(NetworkDataSets):
+            obj._ChangeSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllNetworkDataSets(self):
+        for obj in self._NetworkDataSets:
+            obj._ChangeSets.discard(self)
+        self._NetworkDataSets = RefList()
 
     def getChangeItems(self):
         
@@ -85,20 +88,32 @@ class ChangeSet(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.ChangeSet = None
-        for y in value:
-            y._ChangeSet = self
-        self._ChangeItems = value
+            x._ChangeSet = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.ChangeSet = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._ChangeSet
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._ChangeSet = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.ChangeSet = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._ChangeSet is self:
+                obj._ChangeSet = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._ChangeSet = None
+        self._ChangeItems = RefList()
 
     status = None
 
@@ -108,24 +123,26 @@ class ChangeSet(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ChangeSets if q != self]
-            self._Documents._ChangeSets = filtered
-        for r in value:
-            if self not in r._ChangeSets:
-                r._ChangeSets.append(self)
-        self._Documents = value
+            p._ChangeSets.discard(self)
+        self._Documents = RefList()
+        self.addDocuments(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
-        for obj in Documents:
-            if self not in obj._ChangeSets:
-                obj._ChangeSets.append(self)
-            self._Documents.append(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ChangeSets.append(self)
+            collection.append(obj)
 
     def removeDocuments(self, *Documents):
-        for obj in Documents:
-            if self in obj._ChangeSets:
-                obj._ChangeSets.remove(self)
-            self._Documents.remove(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._ChangeSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllDocuments(self):
+        for obj in self._Documents:
+            obj._ChangeSets.discard(self)
+        self._Documents = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from PyCIM.RefList import RefList, members
 
 class Circuit(EquipmentContainer):
     """EquipmentContainer that will typically include conductors, energy consumers, transformers and transformer windings, switches, shunt compensators, etc., likely at different voltages. Circuit extends from a substation to a set of open points (radial circuit), or to a second substation (looped circuit). It generally starts with a switching device, located in a substation. Membership in a Circuit is based on the nominal or design system configuration, but the electrical connectivity will change during switching operations.EquipmentContainer that will typically include conductors, energy consumers, transformers and transformer windings, switches, shunt compensators, etc., likely at different voltages. Circuit extends from a substation to a set of open points (radial circuit), or to a second substation (looped circuit). It generally starts with a switching device, located in a substation. Membership in a Circuit is based on the nominal or design system configuration, but the electrical connectivity will change during switching operations.
@@ -29,7 +30,7 @@ class Circuit(EquipmentContainer):
 
         @param CircuitSections:
         """
-        self._CircuitSections = []
+        self._CircuitSections = RefList()
         self.CircuitSections = [] if CircuitSections is None else CircuitSections
 
         super(Circuit, self).__init__(*args, **kw_args)
@@ -47,24 +48,26 @@ class Circuit(EquipmentContainer):
 
     def setCircuitSections(self, value):
         for p in self._CircuitSections:
-            filtered = [q for q in p.Circuits if q != self]
-            self._CircuitSections._Circuits = filtered
-        for r in value:
-            if self not in r._Circuits:
-                r._Circuits.append(self)
-        self._CircuitSections = value
+            p._Circuits.discard(self)
+        self._CircuitSections = RefList()
+        self.addCircuitSections(value)
 
     CircuitSections = property(getCircuitSections, setCircuitSections)
 
     def addCircuitSections(self, *CircuitSections):
-        for obj in CircuitSections:
-            if self not in obj._Circuits:
-                obj._Circuits.append(self)
-            self._CircuitSections.append(obj)
+        collection = self._CircuitSections
+        for obj in members(CircuitSections):
+            obj._Circuits.append(self)
+            collection.append(obj)
 
     def removeCircuitSections(self, *CircuitSections):
-        for obj in CircuitSections:
-            if self in obj._Circuits:
-                obj._Circuits.remove(self)
-            self._CircuitSections.remove(obj)
+        collection = self._CircuitSections
+        for obj in members(CircuitSections):
+            obj._Circuits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCircuitSections(self):
+        for obj in self._CircuitSections:
+            obj._Circuits.discard(self)
+        self._CircuitSections = RefList()
 
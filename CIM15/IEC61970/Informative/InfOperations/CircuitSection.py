@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CircuitSection(IdentifiedObject):
     """Section of circuit located between two sectionalizing devices. It may contain other circuit sections, for example, a lateral tapped off a primary.Section of circuit located between two sectionalizing devices. It may contain other circuit sections, for example, a lateral tapped off a primary.
@@ -34,10 +35,10 @@ class CircuitSection(IdentifiedObject):
         #: Kind of this circuit section. Values are: "electricallyConnected", "nominallyConnected", "asBuilt", "other"
         self.connectionKind = connectionKind
 
-        self._ConductorAssets = []
+        self._ConductorAssets = RefList()
         self.ConductorAssets = [] if ConductorAssets is None else ConductorAssets
 
-        self._Circuits = []
+        self._Circuits = RefList()
         self.Circuits = [] if Circuits is None else Circuits
 
         super(CircuitSection, self).__init__(*args, **kw_args)
@@ -55,20 +56,32 @@ class CircuitSection(IdentifiedObject):
 
     def setConductorAssets(self, value):
         for x in self._ConductorAssets:
-            x.CircuitSection = None
-        for y in value:
-            y._CircuitSection = self
-        self._ConductorAssets = value
+            x._CircuitSection = None
+        self._ConductorAssets = RefList()
+        self.addConductorAssets(value)
 
     ConductorAssets = property(getConductorAssets, setConductorAssets)
 
     def addConductorAssets(self, *ConductorAssets):
-        for obj in ConductorAssets:
-            obj.CircuitSection = self
+        collection = self._ConductorAssets
+        for obj in members(ConductorAssets):
+            old = obj._CircuitSection
+            if old is not None and old is not self:
+                old._ConductorAssets.discard(obj)
+            obj._CircuitSection = self
+            collection.append(obj)
 
     def removeConductorAssets(self, *ConductorAssets):
-        for obj in ConductorAssets:
-            obj.CircuitSection = None
+        collection = self._ConductorAssets
+        for obj in members(ConductorAssets):
+            if obj._CircuitSection is self:
+                obj._CircuitSection = None
+                collection.discard(obj)
+
+    def removeAllConductorAssets(self):
+        for obj in self._ConductorAssets:
+            obj._CircuitSection = None
+        self._ConductorAssets = RefList()
 
     def getCircuits(self):
         
@@ -76,24 +89,26 @@ class CircuitSection(IdentifiedObject):
 
     def setCircuits(self, value):
         for p in self._Circuits:
-            filtered = [q for q in p.CircuitSections if q != self]
-            self._Circuits._CircuitSections = filtered
-        for r in value:
-            if self not in r._CircuitSections:
-                r._CircuitSections.append(self)
-        self._Circuits = value
+            p._CircuitSections.discard(self)
+        self._Circuits = RefList()
+        self.addCircuits(value)
 
     Circuits = property(getCircuits, setCircuits)
 
     def addCircuits(self, *Circuits):
-        for obj in Circuits:
-            if self not in obj._CircuitSections:
-                obj._CircuitSections.append(self)
-            self._Circuits.append(obj)
+        collection = self._Circuits
+        for obj in members(Circuits):
+            obj._CircuitSections.append(self)
+            collection.append(obj)
 
     def removeCircuits(self, *Circuits):
-        for obj in Circuits:
-            if self in obj._CircuitSections:
-                obj._CircuitSections.remove(self)
-            self._Circuits.remove(obj)
+        collection = self._Circuits
+        for obj in members(Circuits):
+            obj._CircuitSections.discard(self)
+            collection.discard(obj)
+
+    def removeAllCircuits(self):
+        for obj in self._Circuits:
+            obj._CircuitSections.discard(self)
+        self._Circuits = RefList()
 
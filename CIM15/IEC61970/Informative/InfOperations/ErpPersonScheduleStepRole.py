@@ -51,8 +51,7 @@ class ErpPersonScheduleStepRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.SwitchingStepRoles if x != self]
-            self._ErpPerson._SwitchingStepRoles = filtered
+            self._ErpPerson._SwitchingStepRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
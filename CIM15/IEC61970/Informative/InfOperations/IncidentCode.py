@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class IncidentCode(IdentifiedObject):
     """Classification of incident types. Multiple incident codes may apply to a given incident. The primary overall incident cause is recorded in 'IncidentRecord.category', and the main code in association end 'Names'.Classification of incident types. Multiple incident codes may apply to a given incident. The primary overall incident cause is recorded in 'IncidentRecord.category', and the main code in association end 'Names'.
@@ -33,7 +34,7 @@ class IncidentCode(IdentifiedObject):
         #: Additional level of classification detail (as extension to the main code found in association to Name).
         self.subCode = subCode
 
-        self._IncidentRecords = []
+        self._IncidentRecords = RefList()
         self.IncidentRecords = [] if IncidentRecords is None else IncidentRecords
 
         super(IncidentCode, self).__init__(*args, **kw_args)
@@ -51,24 +52,26 @@ class IncidentCode(IdentifiedObject):
 
     def setIncidentRecords(self, value):
         for p in self._IncidentRecords:
-            filtered = [q for q in p.IncidentCodes if q != self]
-            self._IncidentRecords._IncidentCodes = filtered
-        for r in value:
-            if self not in r._IncidentCodes:
-                r._IncidentCodes.append(self)
-        self._IncidentRecords = value
+            p._IncidentCodes.discard(self)
+        self._IncidentRecords = RefList()
+        self.addIncidentRecords(value)
 
     IncidentRecords = property(getIncidentRecords, setIncidentRecords)
 
     def addIncidentRecords(self, *IncidentRecords):
-        for obj in IncidentRecords:
-            if self not in obj._IncidentCodes:
-                obj._IncidentCodes.append(self)
-            self._IncidentRecords.append(obj)
+        collection = self._IncidentRecords
+        for obj in members(IncidentRecords):
+            obj._IncidentCodes.append(self)
+            collection.append(obj)
 
     def removeIncidentRecords(self, *IncidentRecords):
-        for obj in IncidentRecords:
-            if self in obj._IncidentCodes:
-                obj._IncidentCodes.remove(self)
-            self._IncidentRecords.remove(obj)
+        collection = self._IncidentRecords
+        for obj in members(IncidentRecords):
+            obj._IncidentCodes.discard(self)
+            collection.discard(obj)
+
+    def removeAllIncidentRecords(self):
+        for obj in self._IncidentRecords:
+            obj._IncidentCodes.discard(self)
+        self._IncidentRecords = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class IncidentRecord(Document):
     """Document describing the incident reported in a TroubleTicket. If the incident has to do with an outage, this will be associated with an OutageRecord. Primary cause of the incident is captured in 'category'.Document describing the incident reported in a TroubleTicket. If the incident has to do with an outage, this will be associated with an OutageRecord. Primary cause of the incident is captured in 'category'.
@@ -31,12 +32,12 @@ class IncidentRecord(Document):
         @param period: Period between the first customer impacted by the incident and the incident resolution for all customers impacted.
         @param IncidentCodes:
         """
-        self._TroubleTickets = []
+        self._TroubleTickets = RefList()
         self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
 
         self.period = period
 
-        self._IncidentCodes = []
+        self._IncidentCodes = RefList()
         self.IncidentCodes = [] if IncidentCodes is None else IncidentCodes
 
         super(IncidentRecord, self).__init__(*args, **kw_args)
@@ -54,20 +55,32 @@ class IncidentRecord(Document):
 
     def setTroubleTickets(self, value):
         for x in self._TroubleTickets:
-            x.IncidentRecord = None
-        for y in value:
-            y._IncidentRecord = self
-        self._TroubleTickets = value
+            x._IncidentRecord = None
+        self._TroubleTickets = RefList()
+        self.addTroubleTickets(value)
 
     TroubleTickets = property(getTroubleTickets, setTroubleTickets)
 
     def addTroubleTickets(self, *TroubleTickets):
-        for obj in TroubleTickets:
-            obj.IncidentRecord = self
+        collection = self._TroubleTickets
+        for obj in members(TroubleTickets):
+            old = obj._IncidentRecord
+            if old is not None and old is not self:
+                old._TroubleTickets.discard(obj)
+            obj._IncidentRecord = self
+            collection.append(obj)
 
     def removeTroubleTickets(self, *TroubleTickets):
-        for obj in TroubleTickets:
-            obj.IncidentRecord = None
+        collection = self._TroubleTickets
+        for obj in members(TroubleTickets):
+            if obj._IncidentRecord is self:
+                obj._IncidentRecord = None
+                collection.discard(obj)
+
+    def removeAllTroubleTickets(self):
+        for obj in self._TroubleTickets:
+            obj._IncidentRecord = None
+        self._TroubleTickets = RefList()
 
     # Period between the first customer impacted by the incident and the incident resolution for all customers impacted.
     period = None
@@ -78,24 +91,26 @@ class IncidentRecord(Document):
 
     def setIncidentCodes(self, value):
         for p in self._IncidentCodes:
-            filtered = [q for q in p.IncidentRecords if q != self]
-            self._IncidentCodes._IncidentRecords = filtered
-        for r in value:
-            if self not in r._IncidentRecords:
-                r._IncidentRecords.append(self)
-        self._IncidentCodes = value
+            p._IncidentRecords.discard(self)
+        self._IncidentCodes = RefList()
+        self.addIncidentCodes(value)
 
     IncidentCodes = property(getIncidentCodes, setIncidentCodes)
 
     def addIncidentCodes(self, *IncidentCodes):
-        for obj in IncidentCodes:
-            if self not in obj._IncidentRecords:
-                obj._IncidentRecords.append(self)
-            self._IncidentCodes.append(obj)
+        collection = self._IncidentCodes
+        for obj in members(IncidentCodes):
+            obj._IncidentRecords.append(self)
+            collection.append(obj)
 
     def removeIncidentCodes(self, *IncidentCodes):
-        for obj in IncidentCodes:
-            if self in obj._IncidentRecords:
-                obj._IncidentRecords.remove(self)
-            self._IncidentCodes.remove(obj)
+        collection = self._IncidentCodes
+        for obj in members(IncidentCodes):
+            obj._IncidentRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllIncidentCodes(self):
+        for obj in self._IncidentCodes:
+            obj._IncidentRecords.discard(self)
+        self._IncidentCodes = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class NetworkDataSet(IdentifiedObject):
     """Categorized as a type of document, model of a portion of the electrical network that includes a list of the equipment, along with relevant connectivity, electrical characteristics, geographical location, and various parameters associated with the equipment.Categorized as a type of document, model of a portion of the electrical network that includes a list of the equipment, along with relevant connectivity, electrical characteristics, geographical location, and various parameters associated with the equipment.
@@ -39,16 +40,16 @@ class NetworkDataSet(IdentifiedObject):
 
         self.status = status
 
-        self._Documents = []
+        self._Documents = RefList()
         self.Documents = [] if Documents is None else Documents
 
-        self._ChangeItems = []
+        self._ChangeItems = RefList()
         self.ChangeItems = [] if ChangeItems is None else ChangeItems
 
-        self._ChangeSets = []
+        self._ChangeSets = RefList()
         self.ChangeSets = [] if ChangeSets is None else ChangeSets
 
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         super(NetworkDataSet, self).__init__(*args, **kw_args)
@@ -68,26 +69,28 @@ class NetworkDataSet(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._Documents._NetworkDataSets = filtered
-        for r in value:
-            if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
-        self._Documents = value
+            p._NetworkDataSets.discard(self)
+        self._Documents = RefList()
+        self.addDocuments(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
-        for obj in Documents:
-            if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._Documents.append(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._NetworkDataSets.append(self)
+            collection.append(obj)
 
     def removeDocuments(self, *Documents):
-        for obj in Documents:
-            if self in obj._NetworkDataSets:
-                obj._NetworkDataSets.remove(self)
-            self._Documents.remove(obj)
+        collection = self._Documents
+        for obj in members(Documents):
+            obj._NetworkDataSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllDocuments(self):
+        for obj in self._Documents:
+            obj._NetworkDataSets.discard(self)
+        self._Documents = RefList()
 
     def getChangeItems(self):
         
@@ -95,20 +98,32 @@ class NetworkDataSet(IdentifiedObject):
 
     def setChangeItems(self, value):
         for x in self._ChangeItems:
-            x.NetworkDataSet = None
-        for y in value:
-            y._NetworkDataSet = self
-        self._ChangeItems = value
+            x._NetworkDataSet = None
+        self._ChangeItems = RefList()
+        self.addChangeItems(value)
 
     ChangeItems = property(getChangeItems, setChangeItems)
 
     def addChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.NetworkDataSet = self
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            old = obj._NetworkDataSet
+            if old is not None and old is not self:
+                old._ChangeItems.discard(obj)
+            obj._NetworkDataSet = self
+            collection.append(obj)
 
     def removeChangeItems(self, *ChangeItems):
-        for obj in ChangeItems:
-            obj.NetworkDataSet = None
+        collection = self._ChangeItems
+        for obj in members(ChangeItems):
+            if obj._NetworkDataSet is self:
+                obj._NetworkDataSet = None
+                collection.discard(obj)
+
+    def removeAllChangeItems(self):
+        for obj in self._ChangeItems:
+            obj._NetworkDataSet = None
+        self._ChangeItems = RefList()
 
     def getChangeSets(self):
         
@@ -116,26 +131,28 @@ class NetworkDataSet(IdentifiedObject):
 
     def setChangeSets(self, value):
         for p in self._ChangeSets:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._ChangeSets._NetworkDataSets = filtered
-        for r in value:
-            if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
-        self._ChangeSets = value
+            p._NetworkDataSets.discard(self)
+        self._ChangeSets = RefList()
+        self.addChangeSets(value)
 
     ChangeSets = property(getChangeSets, setChangeSets)
 
     def addChangeSets(self, *ChangeSets):
-        for obj in ChangeSets:
-            if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._ChangeSets.append(obj)
+        collection = self._ChangeSets
+        for obj in members(ChangeSets):
+            obj._NetworkDataSets.append(self)
+            collection.append(obj)
 
     def removeChangeSets(self, *ChangeSets):
-        for obj in ChangeSets:
-            if self in obj._NetworkDataSets:
-                obj._NetworkDataSets.remove(self)
-            self._ChangeSets.remove(obj)
+        collection = self._ChangeSets
+        for obj in members(ChangeSets):
+            obj._NetworkDataSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllChangeSets(self):
+        for obj in self._ChangeSets:
+            obj._NetworkDataSets.discard(self)
+        self._ChangeSets = RefList()
 
     def getPowerSystemResources(self):
         
@@ -143,24 +160,26 @@ class NetworkDataSet(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._PowerSystemResources._NetworkDataSets = filtered
-        for r in value:
-            if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
-        self._PowerSystemResources = value
+            p._NetworkDataSets.discard(self)
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._PowerSystemResources.append(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._NetworkDataSets.append(self)
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self in obj._NetworkDataSets:
-                obj._NetworkDataSets.remove(self)
-            self._PowerSystemResources.remove(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._NetworkDataSets.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._NetworkDataSets.discard(self)
+        self._PowerSystemResources = RefList()
 
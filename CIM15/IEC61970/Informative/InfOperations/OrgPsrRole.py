@@ -51,8 +51,7 @@ class OrgPsrRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.PowerSystemResourceRoles if x != self]
-            self._ErpOrganisation._PowerSystemResourceRoles = filtered
+            self._ErpOrganisation._PowerSystemResourceRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
@@ -67,8 +66,7 @@ class OrgPsrRole(Role):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.ErpOrganisationRoles if x != self]
-            self._PowerSystemResource._ErpOrganisationRoles = filtered
+            self._PowerSystemResource._ErpOrganisationRoles.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class OutageCode(IdentifiedObject):
     """Classification of outage types. Multiple outage codes may apply to a given outage or outage step.The primary overall outage type is recorded in 'OutageRecord.outageType'. There may be more than one classification per outage step and/or per outage record. Example codes/subcodes include: weather/ice, weather/lightning, wildlife/squirrel, wildlife/bird, burned/overload, burned/weather, wire down/accident, wire down/tree, wire down/vandalism, etc. The typical outage code is in the inherited association to Name. The code is described in the inherited 'description' attribute.Classification of outage types. Multiple outage codes may apply to a given outage or outage step.The primary overall outage type is recorded in 'OutageRecord.outageType'. There may be more than one classification per outage step and/or per outage record. Example codes/subcodes include: weather/ice, weather/lightning, wildlife/squirrel, wildlife/bird, burned/overload, burned/weather, wire down/accident, wire down/tree, wire down/vandalism, etc. The typical outage code is in the inherited association to Name. The code is described in the inherited 'description' attribute.
@@ -34,10 +35,10 @@ class OutageCode(IdentifiedObject):
         #: The main code is stored in the inherited association to Name. This sub-code provides an additional level of classification detail.
         self.subCode = subCode
 
-        self._OutageRecords = []
+        self._OutageRecords = RefList()
         self.OutageRecords = [] if OutageRecords is None else OutageRecords
 
-        self._OutageSteps = []
+        self._OutageSteps = RefList()
         self.OutageSteps = [] if OutageSteps is None else OutageSteps
 
         super(OutageCode, self).__init__(*args, **kw_args)
@@ -55,26 +56,28 @@ class OutageCode(IdentifiedObject):
 
     def setOutageRecords(self, value):
         for p in self._OutageRecords:
-            filtered = [q for q in p.OutageCodes if q != self]
-            self._OutageRecords._OutageCodes = filtered
-        for r in value:
-            if self not in r._OutageCodes:
-                r._OutageCodes.append(self)
-        self._OutageRecords = value
+            p._OutageCodes.discard(self)
+        self._OutageRecords = RefList()
+        self.addOutageRecords(value)
 
     OutageRecords = property(getOutageRecords, setOutageRecords)
 
     def addOutageRecords(self, *OutageRecords):
-        for obj in OutageRecords:
-            if self not in obj._OutageCodes:
-                obj._OutageCodes.append(self)
-            self._OutageRecords.append(obj)
+        collection = self._OutageRecords
+        for obj in members(OutageRecords):
+            obj._OutageCodes.append(self)
+            collection.append(obj)
 
     def removeOutageRecords(self, *OutageRecords):
-        for obj in OutageRecords:
-            if self in obj._OutageCodes:
-                obj._OutageCodes.remove(self)
-            self._OutageRecords.remove(obj)
+        collection = self._OutageRecords
+        for obj in members(OutageRecords):
+            obj._OutageCodes.discard(self)
+            collection.discard(obj)
+
+    def removeAllOutageRecords(self):
+        for obj in self._OutageRecords:
+            obj._OutageCodes.discard(self)
+        self._OutageRecords = RefList()
 
     def getOutageSteps(self):
         
@@ -82,24 +85,26 @@ class OutageCode(IdentifiedObject):
 
     def setOutageSteps(self, value):
         for p in self._OutageSteps:
-            filtered = [q for q in p.OutageCodes if q != self]
-            self._OutageSteps._OutageCodes = filtered
-        for r in value:
-            if self not in r._OutageCodes:
-                r._OutageCodes.append(self)
-        self._OutageSteps = value
+            p._OutageCodes.discard(self)
+        self._OutageSteps = RefList()
+        self.addOutageSteps(value)
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
-        for obj in OutageSteps:
-            if self not in obj._OutageCodes:
-                obj._OutageCodes.append(self)
-            self._OutageSteps.append(obj)
+        collection = self._OutageSteps
+        for obj in members(OutageSteps):
+            obj._OutageCodes.append(self)
+            collection.append(obj)
 
     def removeOutageSteps(self, *OutageSteps):
-        for obj in OutageSteps:
-            if self in obj._OutageCodes:
-                obj._OutageCodes.remove(self)
-            self._OutageSteps.remove(obj)
+        collection = self._OutageSteps
+        for obj in members(OutageSteps):
+            obj._OutageCodes.discard(self)
+            collection.discard(obj)
+
+    def removeAllOutageSteps(self):
+        for obj in self._OutageSteps:
+            obj._OutageCodes.discard(self)
+        self._OutageSteps = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class OutageNotification(Document):
     """A document containing information to be sent to customers notifying that an outage will take place. This is used to generate mailing lists for customers.A document containing information to be sent to customers notifying that an outage will take place. This is used to generate mailing lists for customers.
@@ -41,7 +42,7 @@ class OutageNotification(Document):
         #: Details of the outage 'reason'.
         self.reason = reason
 
-        self._CustomerDatas = []
+        self._CustomerDatas = RefList()
         self.CustomerDatas = [] if CustomerDatas is None else CustomerDatas
 
         super(OutageNotification, self).__init__(*args, **kw_args)
@@ -59,24 +60,26 @@ class OutageNotification(Document):
 
     def setCustomerDatas(self, value):
         for p in self._CustomerDatas:
-            filtered = [q for q in p.OutageNotifications if q != self]
-            self._CustomerDatas._OutageNotifications = filtered
-        for r in value:
-            if self not in r._OutageNotifications:
-                r._OutageNotifications.append(self)
-        self._CustomerDatas = value
+            p._OutageNotifications.discard(self)
+        self._CustomerDatas = RefList()
+        self.addCustomerDatas(value)
 
     CustomerDatas = property(getCustomerDatas, setCustomerDatas)
 
     def addCustomerDatas(self, *CustomerDatas):
-        for obj in CustomerDatas:
-            if self not in obj._OutageNotifications:
-                obj._OutageNotifications.append(self)
-            self._CustomerDatas.append(obj)
+        collection = self._CustomerDatas
+        for obj in members(CustomerDatas):
+            obj._OutageNotifications.append(self)
+            collection.append(obj)
 
     def removeCustomerDatas(self, *CustomerDatas):
-        for obj in CustomerDatas:
-            if self in obj._OutageNotifications:
-                obj._OutageNotifications.remove(self)
-            self._CustomerDatas.remove(obj)
+        collection = self._CustomerDatas
+        for obj in members(CustomerDatas):
+            obj._OutageNotifications.discard(self)
+            collection.discard(obj)
+
+    def removeAllCustomerDatas(self):
+        for obj in self._CustomerDatas:
+            obj._OutageNotifications.discard(self)
+        self._CustomerDatas = RefList()
 
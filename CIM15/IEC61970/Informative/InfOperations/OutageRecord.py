@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class OutageRecord(Document):
     """A document describing details of an outage in part of the electrical network, typically produced by a SCADA system following a breaker trip, or within a trouble call system by grouping customer calls. This has an associated outage step for each supply point. Primary cause of the outage is captured in 'category'. In some countries all outage restoration is performed using a switching schedule which complements the outage record and records the crew and any planned work. In other systems, it may be acceptable to manage outages including new work tasks without switching schedules. Note: The relationship between OutageRecord and ErpPerson and Crew is inherited as each is a type of Document.A document describing details of an outage in part of the electrical network, typically produced by a SCADA system following a breaker trip, or within a trouble call system by grouping customer calls. This has an associated outage step for each supply point. Primary cause of the outage is captured in 'category'. In some countries all outage restoration is performed using a switching schedule which complements the outage record and records the crew and any planned work. In other systems, it may be acceptable to manage outages including new work tasks without switching schedules. Note: The relationship between OutageRecord and ErpPerson and Crew is inherited as each is a type of Document.
@@ -51,13 +52,13 @@ class OutageRecord(Document):
         #: Value of ErpOrganisation.mode at the time of OutageRecord.startDateTime.
         self.mode = mode
 
-        self._OutageCodes = []
+        self._OutageCodes = RefList()
         self.OutageCodes = [] if OutageCodes is None else OutageCodes
 
         self._OutageReport = None
         self.OutageReport = OutageReport
 
-        self._OutageSteps = []
+        self._OutageSteps = RefList()
         self.OutageSteps = [] if OutageSteps is None else OutageSteps
 
         super(OutageRecord, self).__init__(*args, **kw_args)
@@ -76,26 +77,28 @@ class OutageRecord(Document):
 
     def setOutageCodes(self, value):
         for p in self._OutageCodes:
-            filtered = [q for q in p.OutageRecords if q != self]
-            self._OutageCodes._OutageRecords = filtered
-        for r in value:
-            if self not in r._OutageRecords:
-                r._OutageRecords.append(self)
-        self._OutageCodes = value
+            p._OutageRecords.discard(self)
+        self._OutageCodes = RefList()
+        self.addOutageCodes(value)
 
     OutageCodes = property(getOutageCodes, setOutageCodes)
 
     def addOutageCodes(self, *OutageCodes):
-        for obj in OutageCodes:
-            if self not in obj._OutageRecords:
-                obj._OutageRecords.append(self)
-            self._OutageCodes.append(obj)
+        collection = self._OutageCodes
+        for obj in members(OutageCodes):
+            obj._OutageRecords.append(self)
+            collection.append(obj)
 
     def removeOutageCodes(self, *OutageCodes):
-        for obj in OutageCodes:
-            if self in obj._OutageRecords:
-                obj._OutageRecords.remove(self)
-            self._OutageCodes.remove(obj)
+        collection = self._OutageCodes
+        for obj in members(OutageCodes):
+            obj._OutageRecords.discard(self)
+            collection.discard(obj)
+
+    def removeAllOutageCodes(self):
+        for obj in self._OutageCodes:
+            obj._OutageRecords.discard(self)
+        self._OutageCodes = RefList()
 
     def getOutageReport(self):
         
@@ -118,18 +121,30 @@ class OutageRecord(Document):
 
     def setOutageSteps(self, value):
         for x in self._OutageSteps:
-            x.OutageRecord = None
-        for y in value:
-            y._OutageRecord = self
-        self._OutageSteps = value
+            x._OutageRecord = None
+        self._OutageSteps = RefList()
+        self.addOutageSteps(value)
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
-        for obj in OutageSteps:
-            obj.OutageRecord = self
+        collection = self._OutageSteps
+        for obj in members(OutageSteps):
+            old = obj._OutageRecord
+            if old is not None and old is not self:
+                old._OutageSteps.discard(obj)
+            obj._OutageRecord = self
+            collection.append(obj)
 
     def removeOutageSteps(self, *OutageSteps):
-        for obj in OutageSteps:
-            obj.OutageRecord = None
+        collection = self._OutageSteps
+        for obj in members(OutageSteps):
+            if obj._OutageRecord is self:
+                obj._OutageRecord = None
+                collection.discard(obj)
+
+    def removeAllOutageSteps(self):
+        for obj in self._OutageSteps:
+            obj._OutageRecord = None
+        self._OutageSteps = RefList()
 
@@ -84,8 +84,7 @@ class OutageReport(Document):
 
     def setOutageHistory(self, value):
         if self._OutageHistory is not None:
-            filtered = [x for x in self.OutageHistory.OutageReports if x != self]
-            self._OutageHistory._OutageReports = filtered
+            self._OutageHistory._OutageReports.discard(self)
 
         self._OutageHistory = value
         if self._OutageHistory is not None:
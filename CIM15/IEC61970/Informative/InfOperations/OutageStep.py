@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class OutageStep(IdentifiedObject):
     """Holds an outage start and end time for each supply point of an outage record. The supply point for a given step is the associated PowerSystemResource instance.Holds an outage start and end time for each supply point of an outage record. The supply point for a given step is the associated PowerSystemResource instance.
@@ -82,12 +83,12 @@ class OutageStep(IdentifiedObject):
         #: Total Customer Minutes Lost (CML) for this supply point for this outage.
         self.totalCml = totalCml
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
         self.noPowerInterval = noPowerInterval
 
-        self._ConductingEquipmentRoles = []
+        self._ConductingEquipmentRoles = RefList()
         self.ConductingEquipmentRoles = [] if ConductingEquipmentRoles is None else ConductingEquipmentRoles
 
         self.status = status
@@ -95,7 +96,7 @@ class OutageStep(IdentifiedObject):
         self._OutageRecord = None
         self.OutageRecord = OutageRecord
 
-        self._OutageCodes = []
+        self._OutageCodes = RefList()
         self.OutageCodes = [] if OutageCodes is None else OutageCodes
 
         super(OutageStep, self).__init__(*args, **kw_args)
@@ -113,26 +114,28 @@ class OutageStep(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.OutageSteps if q != self]
-            self._Crews._OutageSteps = filtered
-        for r in value:
-            if self not in r._OutageSteps:
-                r._OutageSteps.append(self)
-        self._Crews = value
+            p._OutageSteps.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._OutageSteps:
-                obj._OutageSteps.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._OutageSteps.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._OutageSteps:
-                obj._OutageSteps.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._OutageSteps.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._OutageSteps.discard(self)
+        self._Crews = RefList()
 
     # Date and time interval between loss and restoration of power.
     noPowerInterval = None
@@ -143,20 +146,32 @@ class OutageStep(IdentifiedObject):
 
     def setConductingEquipmentRoles(self, value):
         for x in self._ConductingEquipmentRoles:
-            x.OutageStep = None
-        for y in value:
-            y._OutageStep = self
-        self._ConductingEquipmentRoles = value
+            x._OutageStep = None
+        self._ConductingEquipmentRoles = RefList()
+        self.addConductingEquipmentRoles(value)
 
     ConductingEquipmentRoles = property(getConductingEquipmentRoles, setConductingEquipmentRoles)
 
     def addConductingEquipmentRoles(self, *ConductingEquipmentRoles):
-        for obj in ConductingEquipmentRoles:
-            obj.OutageStep = self
+        collection = self._ConductingEquipmentRoles
+        for obj in members(ConductingEquipmentRoles):
+            old = obj._OutageStep
+            if old is not None and old is not self:
+                old._ConductingEquipmentRoles.discard(obj)
+            obj._OutageStep = self
+            collection.append(obj)
 
     def removeConductingEquipmentRoles(self, *ConductingEquipmentRoles):
-        for obj in ConductingEquipmentRoles:
-            obj.OutageStep = None
+        collection = self._ConductingEquipmentRoles
+        for obj in members(ConductingEquipmentRoles):
+            if obj._OutageStep is self:
+                obj._OutageStep = None
+                collection.discard(obj)
+
+    def removeAllConductingEquipmentRoles(self):
+        for obj in self._ConductingEquipmentRoles:
+            obj._OutageStep = None
+        self._ConductingEquipmentRoles = RefList()
 
     status = None
 
@@ -166,8 +181,7 @@ class OutageStep(IdentifiedObject):
 
     def setOutageRecord(self, value):
         if self._OutageRecord is not None:
-            filtered = [x for x in self.OutageRecord.OutageSteps if x != self]
-            self._OutageRecord._OutageSteps = filtered
+            self._OutageRecord._OutageSteps.discard(self)
 
         self._OutageRecord = value
         if self._OutageRecord is not None:
@@ -183,24 +197,26 @@ class OutageStep(IdentifiedObject):
 
     def setOutageCodes(self, value):
         for p in self._OutageCodes:
-            filtered = [q for q in p.OutageSteps if q != self]
-            self._OutageCodes._OutageSteps = filtered
-        for r in value:
-            if self not in r._OutageSteps:
-                r._OutageSteps.append(self)
-        self._OutageCodes = value
+            p._OutageSteps.discard(self)
+        self._OutageCodes = RefList()
+        self.addOutageCodes(value)
 
     OutageCodes = property(getOutageCodes, setOutageCodes)
 
     def addOutageCodes(self, *OutageCodes):
-        for obj in OutageCodes:
-            if self not in obj._OutageSteps:
-                obj._OutageSteps.append(self)
-            self._OutageCodes.append(obj)
+        collection = self._OutageCodes
+        for obj in members(OutageCodes):
+            obj._OutageSteps.append(self)
+            collection.append(obj)
 
     def removeOutageCodes(self, *OutageCodes):
-        for obj in OutageCodes:
-            if self in obj._OutageSteps:
-                obj._OutageSteps.remove(self)
-            self._OutageCodes.remove(obj)
+        collection = self._OutageCodes
+        for obj in members(OutageCodes):
+            obj._OutageSteps.discard(self)
+            collection.discard(obj)
+
+    def removeAllOutageCodes(self):
+        for obj in self._OutageCodes:
+            obj._OutageSteps.discard(self)
+        self._OutageCodes = RefList()
 
@@ -51,8 +51,7 @@ class OutageStepPsrRole(Role):
 
     def setOutageStep(self, value):
         if self._OutageStep is not None:
-            filtered = [x for x in self.OutageStep.ConductingEquipmentRoles if x != self]
-            self._OutageStep._ConductingEquipmentRoles = filtered
+            self._OutageStep._ConductingEquipmentRoles.discard(self)
 
         self._OutageStep = value
         if self._OutageStep is not None:
@@ -67,8 +66,7 @@ class OutageStepPsrRole(Role):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.OutageStepRoles if x != self]
-            self._ConductingEquipment._OutageStepRoles = filtered
+            self._ConductingEquipment._OutageStepRoles.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
@@ -52,8 +52,7 @@ class PSREvent(ActivityRecord):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.PSREvent if x != self]
-            self._PowerSystemResource._PSREvent = filtered
+            self._PowerSystemResource._PSREvent.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class PlannedOutage(Document):
     """Planned outage involves network operations which will affect the supply of power to customers. Note that the list of Power System Resources for the PlannedOutage may be the same or a superset of the ones per OutageStep.Planned outage involves network operations which will affect the supply of power to customers. Note that the list of Power System Resources for the PlannedOutage may be the same or a superset of the ones per OutageStep.
@@ -34,10 +35,10 @@ class PlannedOutage(Document):
         #: Kind of outage. Values are: "fixed", "flexible", "forced"
         self.kind = kind
 
-        self._CustomerDatas = []
+        self._CustomerDatas = RefList()
         self.CustomerDatas = [] if CustomerDatas is None else CustomerDatas
 
-        self._OutageSchedules = []
+        self._OutageSchedules = RefList()
         self.OutageSchedules = [] if OutageSchedules is None else OutageSchedules
 
         super(PlannedOutage, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class PlannedOutage(Document):
 
     def setCustomerDatas(self, value):
         for x in self._CustomerDatas:
-            x.PlannedOutage = None
-        for y in value:
-            y._PlannedOutage = self
-        self._CustomerDatas = value
+            x._PlannedOutage = None
+        self._CustomerDatas = RefList()
+        self.addCustomerDatas(value)
 
     CustomerDatas = property(getCustomerDatas, setCustomerDatas)
 
     def addCustomerDatas(self, *CustomerDatas):
-        for obj in CustomerDatas:
-            obj.PlannedOutage = self
+        collection = self._CustomerDatas
+        for obj in members(CustomerDatas):
+            old = obj._PlannedOutage
+            if old is not None and old is not self:
+                old._CustomerDatas.discard(obj)
+            obj._PlannedOutage = self
+            collection.append(obj)
 
     def removeCustomerDatas(self, *CustomerDatas):
-        for obj in CustomerDatas:
-            obj.PlannedOutage = None
+        collection = self._CustomerDatas
+        for obj in members(CustomerDatas):
+            if obj._PlannedOutage is self:
+                obj._PlannedOutage = None
+                collection.discard(obj)
+
+    def removeAllCustomerDatas(self):
+        for obj in self._CustomerDatas:
+            obj._PlannedOutage = None
+        self._CustomerDatas = RefList()
 
     def getOutageSchedules(self):
         
@@ -77,18 +90,30 @@ class PlannedOutage(Document):
 
     def setOutageSchedules(self, value):
         for x in self._OutageSchedules:
-            x.PlannedOutage = None
-        for y in value:
-            y._PlannedOutage = self
-        self._OutageSchedules = value
+            x._PlannedOutage = None
+        self._OutageSchedules = RefList()
+        self.addOutageSchedules(value)
 
     OutageSchedules = property(getOutageSchedules, setOutageSchedules)
 
     def addOutageSchedules(self, *OutageSchedules):
-        for obj in OutageSchedules:
-            obj.PlannedOutage = self
+        collection = self._OutageSchedules
+        for obj in members(OutageSchedules):
+            old = obj._PlannedOutage
+            if old is not None and old is not self:
+                old._OutageSchedules.discard(obj)
+            obj._PlannedOutage = self
+            collection.append(obj)
 
     def removeOutageSchedules(self, *OutageSchedules):
-        for obj in OutageSchedules:
-            obj.PlannedOutage = None
+        collection = self._OutageSchedules
+        for obj in members(OutageSchedules):
+            if obj._PlannedOutage is self:
+                obj._PlannedOutage = None
+                collection.discard(obj)
+
+    def removeAllOutageSchedules(self):
+        for obj in self._OutageSchedules:
+            obj._PlannedOutage = None
+        self._OutageSchedules = RefList()
 
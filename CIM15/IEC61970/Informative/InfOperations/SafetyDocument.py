@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class SafetyDocument(Document):
     """A document restricting or authorising works on electrical equipment (for example a permit to work, sanction for test, limitation of access, or certificate of isolation), defined based upon organisational practices. Note: SafetyDocument may refer to ClearanceTag-s associated with ConductingEquipment for which the SafetyDocument is issued.A document restricting or authorising works on electrical equipment (for example a permit to work, sanction for test, limitation of access, or certificate of isolation), defined based upon organisational practices. Note: SafetyDocument may refer to ClearanceTag-s associated with ConductingEquipment for which the SafetyDocument is issued.
@@ -31,10 +32,10 @@ class SafetyDocument(Document):
         @param ScheduleSteps:
         @param PowerSystemResource:
         """
-        self._ClearanceTags = []
+        self._ClearanceTags = RefList()
         self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
 
-        self._ScheduleSteps = []
+        self._ScheduleSteps = RefList()
         self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
 
         self._PowerSystemResource = None
@@ -55,20 +56,32 @@ class SafetyDocument(Document):
 
     def setClearanceTags(self, value):
         for x in self._ClearanceTags:
-            x.SafetyDocument = None
-        for y in value:
-            y._SafetyDocument = self
-        self._ClearanceTags = value
+            x._SafetyDocument = None
+        self._ClearanceTags = RefList()
+        self.addClearanceTags(value)
 
     ClearanceTags = property(getClearanceTags, setClearanceTags)
 
     def addClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.SafetyDocument = self
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            old = obj._SafetyDocument
+            if old is not None and old is not self:
+                old._ClearanceTags.discard(obj)
+            obj._SafetyDocument = self
+            collection.append(obj)
 
     def removeClearanceTags(self, *ClearanceTags):
-        for obj in ClearanceTags:
-            obj.SafetyDocument = None
+        collection = self._ClearanceTags
+        for obj in members(ClearanceTags):
+            if obj._SafetyDocument is self:
+                obj._SafetyDocument = None
+                collection.discard(obj)
+
+    def removeAllClearanceTags(self):
+        for obj in self._ClearanceTags:
+            obj._SafetyDocument = None
+        self._ClearanceTags = RefList()
 
     def getScheduleSteps(self):
         
@@ -76,20 +89,32 @@ class SafetyDocument(Document):
 
     def setScheduleSteps(self, value):
         for x in self._ScheduleSteps:
-            x.SafetyDocument = None
-        for y in value:
-            y._SafetyDocument = self
-        self._ScheduleSteps = value
+            x._SafetyDocument = None
+        self._ScheduleSteps = RefList()
+        self.addScheduleSteps(value)
 
     ScheduleSteps = property(getScheduleSteps, setScheduleSteps)
 
     def addScheduleSteps(self, *ScheduleSteps):
-        for obj in ScheduleSteps:
-            obj.SafetyDocument = self
+        collection = self._ScheduleSteps
+        for obj in members(ScheduleSteps):
+            old = obj._SafetyDocument
+            if old is not None and old is not self:
+                old._ScheduleSteps.discard(obj)
+            obj._SafetyDocument = self
+            collection.append(obj)
 
     def removeScheduleSteps(self, *ScheduleSteps):
-        for obj in ScheduleSteps:
-            obj.SafetyDocument = None
+        collection = self._ScheduleSteps
+        for obj in members(ScheduleSteps):
+            if obj._SafetyDocument is self:
+                obj._SafetyDocument = None
+                collection.discard(obj)
+
+    def removeAllScheduleSteps(self):
+        for obj in self._ScheduleSteps:
+            obj._SafetyDocument = None
+        self._ScheduleSteps = RefList()
 
     def getPowerSystemResource(self):
         
@@ -97,8 +122,7 @@ class SafetyDocument(Document):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.SafetyDocuments if x != self]
-            self._PowerSystemResource._SafetyDocuments = filtered
+            self._PowerSystemResource._SafetyDocuments.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
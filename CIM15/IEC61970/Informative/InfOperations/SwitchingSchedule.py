@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class SwitchingSchedule(Document):
     """Document describing a sequence of steps to perform an item of work, for example to isolate some plant with regard to safety, equipment ratings, and standards of customer service. Note 1: SwitchingSchedule is intended to describe the full operational details for switching for real time operation which includes other operations such as grounding, applying safety documents etc.  Note 2: The association to ErpPerson suits the UK practice of quoting specific names (e.g the crew foreman). The association to Crew is for US practice.Document describing a sequence of steps to perform an item of work, for example to isolate some plant with regard to safety, equipment ratings, and standards of customer service. Note 1: SwitchingSchedule is intended to describe the full operational details for switching for real time operation which includes other operations such as grounding, applying safety documents etc.  Note 2: The association to ErpPerson suits the UK practice of quoting specific names (e.g the crew foreman). The association to Crew is for US practice.
@@ -36,13 +37,13 @@ class SwitchingSchedule(Document):
         #: Reason for switching.
         self.reason = reason
 
-        self._ScheduleSteps = []
+        self._ScheduleSteps = RefList()
         self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
 
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
         self.interval = interval
@@ -62,20 +63,32 @@ class SwitchingSchedule(Document):
 
     def setScheduleSteps(self, value):
         for x in self._ScheduleSteps:
-            x.SwitchingSchedule = None
-        for y in value:
-            y._SwitchingSchedule = self
-        self._ScheduleSteps = value
+            x._SwitchingSchedule = None
+        self._ScheduleSteps = RefList()
+        self.addScheduleSteps(value)
 
     ScheduleSteps = property(getScheduleSteps, setScheduleSteps)
 
     def addScheduleSteps(self, *ScheduleSteps):
-        for obj in ScheduleSteps:
-            obj.SwitchingSchedule = self
+        collection = self._ScheduleSteps
+        for obj in members(ScheduleSteps):
+            old = obj._SwitchingSchedule
+            if old is not None and old is not self:
+                old._ScheduleSteps.discard(obj)
+            obj._SwitchingSchedule = self
+            collection.append(obj)
 
     def removeScheduleSteps(self, *ScheduleSteps):
-        for obj in ScheduleSteps:
-            obj.SwitchingSchedule = None
+        collection = self._ScheduleSteps
+        for obj in members(ScheduleSteps):
+            if obj._SwitchingSchedule is self:
+                obj._SwitchingSchedule = None
+                collection.discard(obj)
+
+    def removeAllScheduleSteps(self):
+        for obj in self._ScheduleSteps:
+            obj._SwitchingSchedule = None
+        self._ScheduleSteps = RefList()
 
     def getWorkTask(self):
         
@@ -83,8 +96,7 @@ class SwitchingSchedule(Document):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.SwitchingSchedules if x != self]
-            self._WorkTask._SwitchingSchedules = filtered
+            self._WorkTask._SwitchingSchedules.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -100,26 +112,28 @@ class SwitchingSchedule(Document):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.SwitchingSchedules if q != self]
-            self._Crews._SwitchingSchedules = filtered
-        for r in value:
-            if self not in r._SwitchingSchedules:
-                r._SwitchingSchedules.append(self)
-        self._Crews = value
+            p._SwitchingSchedules.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._SwitchingSchedules:
-                obj._SwitchingSchedules.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._SwitchingSchedules.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._SwitchingSchedules:
-                obj._SwitchingSchedules.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._SwitchingSchedules.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._SwitchingSchedules.discard(self)
+        self._Crews = RefList()
 
     # Interval between starting and completion of the switching.
     interval = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class SwitchingStep(IdentifiedObject):
     """A single step within a SwitchingSchedule. Could be a switching operation (applying a network alteration), or issuing a safety document. Note: Inherited attribute IdentifiedObject.name is used to hold the sequence number.A single step within a SwitchingSchedule. Could be a switching operation (applying a network alteration), or issuing a safety document. Note: Inherited attribute IdentifiedObject.name is used to hold the sequence number.
@@ -57,7 +58,7 @@ class SwitchingStep(IdentifiedObject):
         self._SwitchingSchedule = None
         self.SwitchingSchedule = SwitchingSchedule
 
-        self._PowerSystemResources = []
+        self._PowerSystemResources = RefList()
         self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
 
         self._ErpPersonRole = None
@@ -78,8 +79,7 @@ class SwitchingStep(IdentifiedObject):
 
     def setSafetyDocument(self, value):
         if self._SafetyDocument is not None:
-            filtered = [x for x in self.SafetyDocument.ScheduleSteps if x != self]
-            self._SafetyDocument._ScheduleSteps = filtered
+            self._SafetyDocument._ScheduleSteps.discard(self)
 
         self._SafetyDocument = value
         if self._SafetyDocument is not None:
@@ -97,8 +97,7 @@ class SwitchingStep(IdentifiedObject):
 
     def setSwitchingSchedule(self, value):
         if self._SwitchingSchedule is not None:
-            filtered = [x for x in self.SwitchingSchedule.ScheduleSteps if x != self]
-            self._SwitchingSchedule._ScheduleSteps = filtered
+            self._SwitchingSchedule._ScheduleSteps.discard(self)
 
         self._SwitchingSchedule = value
         if self._SwitchingSchedule is not None:
@@ -113,26 +112,28 @@ class SwitchingStep(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.ScheduleSteps if q != self]
-            self._PowerSystemResources._ScheduleSteps = filtered
-        for r in value:
-            if self not in r._ScheduleSteps:
-                r._ScheduleSteps.append(self)
-        self._PowerSystemResources = value
+            p._ScheduleSteps.discard(self)
+        self._PowerSystemResources = RefList()
+        self.addPowerSystemResources(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self not in obj._ScheduleSteps:
-                obj._ScheduleSteps.append(self)
-            self._PowerSystemResources.append(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._ScheduleSteps.append(self)
+            collection.append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
-        for obj in PowerSystemResources:
-            if self in obj._ScheduleSteps:
-                obj._ScheduleSteps.remove(self)
-            self._PowerSystemResources.remove(obj)
+        collection = self._PowerSystemResources
+        for obj in members(PowerSystemResources):
+            obj._ScheduleSteps.discard(self)
+            collection.discard(obj)
+
+    def removeAllPowerSystemResources(self):
+        for obj in self._PowerSystemResources:
+            obj._ScheduleSteps.discard(self)
+        self._PowerSystemResources = RefList()
 
     def getErpPersonRole(self):
         
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class TroubleTicket(Document):
     """A document used to report electrical trouble. The trouble may either be an outage or non-outage problem, such as power quality. It must always be associated with an incident record. Note that a separate activity record is created for each call associated with an instance of trouble ticket. The time of a call is stored in 'ActivityRecord.createdOn' and comments are recorded in 'ActivityRecord.remarks'.A document used to report electrical trouble. The trouble may either be an outage or non-outage problem, such as power quality. It must always be associated with an incident record. Note that a separate activity record is created for each call associated with an instance of trouble ticket. The time of a call is stored in 'ActivityRecord.createdOn' and comments are recorded in 'ActivityRecord.remarks'.
@@ -68,7 +69,7 @@ class TroubleTicket(Document):
         #: True if requested to customer when someone is about to arrive at their premises.
         self.callBack = callBack
 
-        self._CallBacks = []
+        self._CallBacks = RefList()
         self.CallBacks = [] if CallBacks is None else CallBacks
 
         self.troublePeriod = troublePeriod
@@ -94,26 +95,28 @@ class TroubleTicket(Document):
 
     def setCallBacks(self, value):
         for p in self._CallBacks:
-            filtered = [q for q in p.TroubleTickets if q != self]
-            self._CallBacks._TroubleTickets = filtered
-        for r in value:
-            if self not in r._TroubleTickets:
-                r._TroubleTickets.append(self)
-        self._CallBacks = value
+            p._TroubleTickets.discard(self)
+        self._CallBacks = RefList()
+        self.addCallBacks(value)
 
     CallBacks = property(getCallBacks, setCallBacks)
 
     def addCallBacks(self, *CallBacks):
-        for obj in CallBacks:
-            if self not in obj._TroubleTickets:
-                obj._TroubleTickets.append(self)
-            self._CallBacks.append(obj)
+        collection = self._CallBacks
+        for obj in members(CallBacks):
+            obj._TroubleTickets.append(self)
+            collection.append(obj)
 
     def removeCallBacks(self, *CallBacks):
-        for obj in CallBacks:
-            if self in obj._TroubleTickets:
-                obj._TroubleTickets.remove(self)
-            self._CallBacks.remove(obj)
+        collection = self._CallBacks
+        for obj in members(CallBacks):
+            obj._TroubleTickets.discard(self)
+            collection.discard(obj)
+
+    def removeAllCallBacks(self):
+        for obj in self._CallBacks:
+            obj._TroubleTickets.discard(self)
+        self._CallBacks = RefList()
 
     # Period between this source of trouble started and was resolved.
     troublePeriod = None
@@ -124,8 +127,7 @@ class TroubleTicket(Document):
 
     def setCustomerData(self, value):
         if self._CustomerData is not None:
-            filtered = [x for x in self.CustomerData.TroubleTickets if x != self]
-            self._CustomerData._TroubleTickets = filtered
+            self._CustomerData._TroubleTickets.discard(self)
 
         self._CustomerData = value
         if self._CustomerData is not None:
@@ -140,8 +142,7 @@ class TroubleTicket(Document):
 
     def setIncidentRecord(self, value):
         if self._IncidentRecord is not None:
-            filtered = [x for x in self.IncidentRecord.TroubleTickets if x != self]
-            self._IncidentRecord._TroubleTickets = filtered
+            self._IncidentRecord._TroubleTickets.discard(self)
 
         self._IncidentRecord = value
         if self._IncidentRecord is not None:
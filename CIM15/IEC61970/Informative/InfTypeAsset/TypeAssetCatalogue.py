@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TypeAssetCatalogue(IdentifiedObject):
     """Catalogue of generic types of assets (TypeAsset) that may be used for design purposes. It is not associated with a particular manufacturer.Catalogue of generic types of assets (TypeAsset) that may be used for design purposes. It is not associated with a particular manufacturer.
@@ -30,7 +31,7 @@ class TypeAssetCatalogue(IdentifiedObject):
         @param TypeAssets:
         @param status:
         """
-        self._TypeAssets = []
+        self._TypeAssets = RefList()
         self.TypeAssets = [] if TypeAssets is None else TypeAssets
 
         self.status = status
@@ -50,20 +51,32 @@ class TypeAssetCatalogue(IdentifiedObject):
 
     def setTypeAssets(self, value):
         for x in self._TypeAssets:
-            x.TypeAssetCatalogue = None
-        for y in value:
-            y._TypeAssetCatalogue = self
-        self._TypeAssets = value
+            x._TypeAssetCatalogue = None
+        self._TypeAssets = RefList()
+        self.addTypeAssets(value)
 
     TypeAssets = property(getTypeAssets, setTypeAssets)
 
     def addTypeAssets(self, *TypeAssets):
-        for obj in TypeAssets:
-            obj.TypeAssetCatalogue = self
+        collection = self._TypeAssets
+        for obj in members(TypeAssets):
+            old = obj._TypeAssetCatalogue
+            if old is not None and old is not self:
+                old._TypeAssets.discard(obj)
+            obj._TypeAssetCatalogue = self
+            collection.append(obj)
 
     def removeTypeAssets(self, *TypeAssets):
-        for obj in TypeAssets:
-            obj.TypeAssetCatalogue = None
+        collection = self._TypeAssets
+        for obj in members(TypeAssets):
+            if obj._TypeAssetCatalogue is self:
+                obj._TypeAssetCatalogue = None
+                collection.discard(obj)
+
+    def removeAllTypeAssets(self):
+        for obj in self._TypeAssets:
+            obj._TypeAssetCatalogue = None
+        self._TypeAssets = RefList()
 
     status = None
 
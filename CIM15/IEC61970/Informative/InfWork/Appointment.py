@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.ScheduledEvent import ScheduledEvent
+from PyCIM.RefList import RefList, members
 
 class Appointment(ScheduledEvent):
     """Meeting time and location.Meeting time and location.
@@ -42,7 +43,7 @@ class Appointment(ScheduledEvent):
 
         self.address = address
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
         self.meetingInterval = meetingInterval
@@ -68,26 +69,28 @@ class Appointment(ScheduledEvent):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.Appointments if q != self]
-            self._ErpPersons._Appointments = filtered
-        for r in value:
-            if self not in r._Appointments:
-                r._Appointments.append(self)
-        self._ErpPersons = value
+            p._Appointments.discard(self)
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self not in obj._Appointments:
-                obj._Appointments.append(self)
-            self._ErpPersons.append(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._Appointments.append(self)
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self in obj._Appointments:
-                obj._Appointments.remove(self)
-            self._ErpPersons.remove(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._Appointments.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._Appointments.discard(self)
+        self._ErpPersons = RefList()
 
     # Date and time reserved for appointment.
     meetingInterval = None
@@ -98,8 +101,7 @@ class Appointment(ScheduledEvent):
 
     def setCallBack(self, value):
         if self._CallBack is not None:
-            filtered = [x for x in self.CallBack.Appointments if x != self]
-            self._CallBack._Appointments = filtered
+            self._CallBack._Appointments.discard(self)
 
         self._CallBack = value
         if self._CallBack is not None:
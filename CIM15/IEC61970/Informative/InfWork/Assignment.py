@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Assignment(Document):
     """An assignment is given to an ErpPerson, Crew, Organisation, Equipment Item, Tool, etc. and may be used to perform Work, WorkTasks, Procedures, etc. TimeSchedules may be set up directly for Assignments or indirectly via the associated WorkTask. Note that these associations are all inherited through the recursive relationship on Document.An assignment is given to an ErpPerson, Crew, Organisation, Equipment Item, Tool, etc. and may be used to perform Work, WorkTasks, Procedures, etc. TimeSchedules may be set up directly for Assignments or indirectly via the associated WorkTask. Note that these associations are all inherited through the recursive relationship on Document.
@@ -30,7 +31,7 @@ class Assignment(Document):
         @param Crews: All Crews having this Assignment.
         @param effectivePeriod: Period between the assignment becoming effective and its expiration.
         """
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
         self.effectivePeriod = effectivePeriod
@@ -51,26 +52,28 @@ class Assignment(Document):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.Assignments if q != self]
-            self._Crews._Assignments = filtered
-        for r in value:
-            if self not in r._Assignments:
-                r._Assignments.append(self)
-        self._Crews = value
+            p._Assignments.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._Assignments:
-                obj._Assignments.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._Assignments.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._Assignments:
-                obj._Assignments.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._Assignments.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._Assignments.discard(self)
+        self._Crews = RefList()
 
     # Period between the assignment becoming effective and its expiration.
     effectivePeriod = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class BusinessCase(Document):
     """Business justification for capital expenditures, usually addressing operations and maintenance costs as well.Business justification for capital expenditures, usually addressing operations and maintenance costs as well.
@@ -34,10 +35,10 @@ class BusinessCase(Document):
         #: A codified representation of the business case (i.e., codes for highway relocation, replace substation transformers, etc.).
         self.corporateCode = corporateCode
 
-        self._Projects = []
+        self._Projects = RefList()
         self.Projects = [] if Projects is None else Projects
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
         super(BusinessCase, self).__init__(*args, **kw_args)
@@ -55,20 +56,32 @@ class BusinessCase(Document):
 
     def setProjects(self, value):
         for x in self._Projects:
-            x.BusinessCase = None
-        for y in value:
-            y._BusinessCase = self
-        self._Projects = value
+            x._BusinessCase = None
+        self._Projects = RefList()
+        self.addProjects(value)
 
     Projects = property(getProjects, setProjects)
 
     def addProjects(self, *Projects):
-        for obj in Projects:
-            obj.BusinessCase = self
+        collection = self._Projects
+        for obj in members(Projects):
+            old = obj._BusinessCase
+            if old is not None and old is not self:
+                old._Projects.discard(obj)
+            obj._BusinessCase = self
+            collection.append(obj)
 
     def removeProjects(self, *Projects):
-        for obj in Projects:
-            obj.BusinessCase = None
+        collection = self._Projects
+        for obj in members(Projects):
+            if obj._BusinessCase is self:
+                obj._BusinessCase = None
+                collection.discard(obj)
+
+    def removeAllProjects(self):
+        for obj in self._Projects:
+            obj._BusinessCase = None
+        self._Projects = RefList()
 
     def getWorks(self):
         
@@ -76,18 +89,30 @@ class BusinessCase(Document):
 
     def setWorks(self, value):
         for x in self._Works:
-            x.BusinessCase = None
-        for y in value:
-            y._BusinessCase = self
-        self._Works = value
+            x._BusinessCase = None
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            obj.BusinessCase = self
+        collection = self._Works
+        for obj in members(Works):
+            old = obj._BusinessCase
+            if old is not None and old is not self:
+                old._Works.discard(obj)
+            obj._BusinessCase = self
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            obj.BusinessCase = None
+        collection = self._Works
+        for obj in members(Works):
+            if obj._BusinessCase is self:
+                obj._BusinessCase = None
+                collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._BusinessCase = None
+        self._Works = RefList()
 
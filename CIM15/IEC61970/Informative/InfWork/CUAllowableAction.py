@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CUAllowableAction(IdentifiedObject):
     """Allowed actions: Install, Remove, Transfer, Abandon, etc.Allowed actions: Install, Remove, Transfer, Abandon, etc.
@@ -30,7 +31,7 @@ class CUAllowableAction(IdentifiedObject):
         @param CompatibleUnits:
         @param status:
         """
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         self.status = status
@@ -50,20 +51,32 @@ class CUAllowableAction(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for x in self._CompatibleUnits:
-            x.CUAllowableAction = None
-        for y in value:
-            y._CUAllowableAction = self
-        self._CompatibleUnits = value
+            x._CUAllowableAction = None
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.CUAllowableAction = self
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            old = obj._CUAllowableAction
+            if old is not None and old is not self:
+                old._CompatibleUnits.discard(obj)
+            obj._CUAllowableAction = self
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.CUAllowableAction = None
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            if obj._CUAllowableAction is self:
+                obj._CUAllowableAction = None
+                collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CUAllowableAction = None
+        self._CompatibleUnits = RefList()
 
     status = None
 
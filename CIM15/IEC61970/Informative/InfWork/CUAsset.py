@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CUAsset(IdentifiedObject):
     """Compatible unit for various types of assets such as transformers switches, substation fences, poles, etc..Compatible unit for various types of assets such as transformers switches, substation fences, poles, etc..
@@ -39,7 +40,7 @@ class CUAsset(IdentifiedObject):
         #: The code for this type of asset.
         self.typeAssetCode = typeAssetCode
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         self._TypeAsset = None
@@ -62,26 +63,28 @@ class CUAsset(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUAssets if q != self]
-            self._CompatibleUnits._CUAssets = filtered
-        for r in value:
-            if self not in r._CUAssets:
-                r._CUAssets.append(self)
-        self._CompatibleUnits = value
+            p._CUAssets.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._CUAssets:
-                obj._CUAssets.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUAssets.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._CUAssets:
-                obj._CUAssets.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUAssets.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CUAssets.discard(self)
+        self._CompatibleUnits = RefList()
 
     def getTypeAsset(self):
         
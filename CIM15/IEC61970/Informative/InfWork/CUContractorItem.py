@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CUContractorItem(IdentifiedObject):
     """Compatible unit contractor item.Compatible unit contractor item.
@@ -38,7 +39,7 @@ class CUContractorItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         self.status = status
@@ -58,26 +59,28 @@ class CUContractorItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUContractorItems if q != self]
-            self._CompatibleUnits._CUContractorItems = filtered
-        for r in value:
-            if self not in r._CUContractorItems:
-                r._CUContractorItems.append(self)
-        self._CompatibleUnits = value
+            p._CUContractorItems.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._CUContractorItems:
-                obj._CUContractorItems.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUContractorItems.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._CUContractorItems:
-                obj._CUContractorItems.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUContractorItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CUContractorItems.discard(self)
+        self._CompatibleUnits = RefList()
 
     status = None
 
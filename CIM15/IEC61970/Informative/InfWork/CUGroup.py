@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CUGroup(IdentifiedObject):
     """A Compatible Unit Group identifies a set of compatible units which may be jointly utilized for estimating and designating jobs.A Compatible Unit Group identifies a set of compatible units which may be jointly utilized for estimating and designating jobs.
@@ -33,18 +34,18 @@ class CUGroup(IdentifiedObject):
         @param status:
         @param DesignLocationCUs:
         """
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
-        self._ParentCUGroups = []
+        self._ParentCUGroups = RefList()
         self.ParentCUGroups = [] if ParentCUGroups is None else ParentCUGroups
 
-        self._ChildCUGroups = []
+        self._ChildCUGroups = RefList()
         self.ChildCUGroups = [] if ChildCUGroups is None else ChildCUGroups
 
         self.status = status
 
-        self._DesignLocationCUs = []
+        self._DesignLocationCUs = RefList()
         self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
 
         super(CUGroup, self).__init__(*args, **kw_args)
@@ -62,20 +63,32 @@ class CUGroup(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for x in self._CompatibleUnits:
-            x.CUGroup = None
-        for y in value:
-            y._CUGroup = self
-        self._CompatibleUnits = value
+            x._CUGroup = None
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.CUGroup = self
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            old = obj._CUGroup
+            if old is not None and old is not self:
+                old._CompatibleUnits.discard(obj)
+            obj._CUGroup = self
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.CUGroup = None
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            if obj._CUGroup is self:
+                obj._CUGroup = None
+                collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CUGroup = None
+        self._CompatibleUnits = RefList()
 
     def getParentCUGroups(self):
         
@@ -83,26 +96,28 @@ class CUGroup(IdentifiedObject):
 
     def setParentCUGroups(self, value):
         for p in self._ParentCUGroups:
-            filtered = [q for q in p.ChildCUGroups if q != self]
-            self._ParentCUGroups._ChildCUGroups = filtered
-        for r in value:
-            if self not in r._ChildCUGroups:
-                r._ChildCUGroups.append(self)
-        self._ParentCUGroups = value
+            p._ChildCUGroups.discard(self)
+        self._ParentCUGroups = RefList()
+        self.addParentCUGroups(value)
 
     ParentCUGroups = property(getParentCUGroups, setParentCUGroups)
 
     def addParentCUGroups(self, *ParentCUGroups):
-        for obj in ParentCUGroups:
-            if self not in obj._ChildCUGroups:
-                obj._ChildCUGroups.append(self)
-            self._ParentCUGroups.append(obj)
+        collection = self._ParentCUGroups
+        for obj in members(ParentCUGroups):
+            obj._ChildCUGroups.append(self)
+            collection.append(obj)
 
     def removeParentCUGroups(self, *ParentCUGroups):
-        for obj in ParentCUGroups:
-            if self in obj._ChildCUGroups:
-                obj._ChildCUGroups.remove(self)
-            self._ParentCUGroups.remove(obj)
+        collection = self._ParentCUGroups
+        for obj in members(ParentCUGroups):
+            obj._ChildCUGroups.discard(self)
+            collection.discard(obj)
+
+    def removeAllParentCUGroups(self):
+        for obj in self._ParentCUGroups:
+            obj._ChildCUGroups.discard(self)
+        self._ParentCUGroups = RefList()
 
     def getChildCUGroups(self):
         
@@ -110,26 +125,28 @@ class CUGroup(IdentifiedObject):
 
     def setChildCUGroups(self, value):
         for p in self._ChildCUGroups:
-            filtered = [q for q in p.ParentCUGroups if q != self]
-            self._ChildCUGroups._ParentCUGroups = filtered
-        for r in value:
-            if self not in r._ParentCUGroups:
-                r._ParentCUGroups.append(self)
-        self._ChildCUGroups = value
+            p._ParentCUGroups.discard(self)
+        self._ChildCUGroups = RefList()
+        self.addChildCUGroups(value)
 
     ChildCUGroups = property(getChildCUGroups, setChildCUGroups)
 
     def addChildCUGroups(self, *ChildCUGroups):
-        for obj in ChildCUGroups:
-            if self not in obj._ParentCUGroups:
-                obj._ParentCUGroups.append(self)
-            self._ChildCUGroups.append(obj)
+        collection = self._ChildCUGroups
+        for obj in members(ChildCUGroups):
+            obj._ParentCUGroups.append(self)
+            collection.append(obj)
 
     def removeChildCUGroups(self, *ChildCUGroups):
-        for obj in ChildCUGroups:
-            if self in obj._ParentCUGroups:
-                obj._ParentCUGroups.remove(self)
-            self._ChildCUGroups.remove(obj)
+        collection = self._ChildCUGroups
+        for obj in members(ChildCUGroups):
+            obj._ParentCUGroups.discard(self)
+            collection.discard(obj)
+
+    def removeAllChildCUGroups(self):
+        for obj in self._ChildCUGroups:
+            obj._ParentCUGroups.discard(self)
+        self._ChildCUGroups = RefList()
 
     status = None
 
@@ -139,24 +156,26 @@ class CUGroup(IdentifiedObject):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.CUGroups if q != self]
-            self._DesignLocationCUs._CUGroups = filtered
-        for r in value:
-            if self not in r._CUGroups:
-                r._CUGroups.append(self)
-        self._DesignLocationCUs = value
+            p._CUGroups.discard(self)
+        self._DesignLocationCUs = RefList()
+        self.addDesignLocationCUs(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self not in obj._CUGroups:
-                obj._CUGroups.append(self)
-            self._DesignLocationCUs.append(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._CUGroups.append(self)
+            collection.append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self in obj._CUGroups:
-                obj._CUGroups.remove(self)
-            self._DesignLocationCUs.remove(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._CUGroups.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocationCUs(self):
+        for obj in self._DesignLocationCUs:
+            obj._CUGroups.discard(self)
+        self._DesignLocationCUs = RefList()
 
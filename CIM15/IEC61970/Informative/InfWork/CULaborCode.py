@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CULaborCode(IdentifiedObject):
     """Labor code associated with various compatible unit labor items.Labor code associated with various compatible unit labor items.
@@ -34,7 +35,7 @@ class CULaborCode(IdentifiedObject):
         #: Labor code.
         self.code = code
 
-        self._CULaborItems = []
+        self._CULaborItems = RefList()
         self.CULaborItems = [] if CULaborItems is None else CULaborItems
 
         self.status = status
@@ -54,20 +55,32 @@ class CULaborCode(IdentifiedObject):
 
     def setCULaborItems(self, value):
         for x in self._CULaborItems:
-            x.CULaborCode = None
-        for y in value:
-            y._CULaborCode = self
-        self._CULaborItems = value
+            x._CULaborCode = None
+        self._CULaborItems = RefList()
+        self.addCULaborItems(value)
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
-        for obj in CULaborItems:
-            obj.CULaborCode = self
+        collection = self._CULaborItems
+        for obj in members(CULaborItems):
+            old = obj._CULaborCode
+            if old is not None and old is not self:
+                old._CULaborItems.discard(obj)
+            obj._CULaborCode = self
+            collection.append(obj)
 
     def removeCULaborItems(self, *CULaborItems):
-        for obj in CULaborItems:
-            obj.CULaborCode = None
+        collection = self._CULaborItems
+        for obj in members(CULaborItems):
+            if obj._CULaborCode is self:
+                obj._CULaborCode = None
+                collection.discard(obj)
+
+    def removeAllCULaborItems(self):
+        for obj in self._CULaborItems:
+            obj._CULaborCode = None
+        self._CULaborItems = RefList()
 
     status = None
 
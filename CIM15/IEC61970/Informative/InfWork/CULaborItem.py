@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CULaborItem(IdentifiedObject):
     """Compatible unit labor item.Compatible unit labor item.
@@ -44,7 +45,7 @@ class CULaborItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         self._CULaborCode = None
@@ -52,7 +53,7 @@ class CULaborItem(IdentifiedObject):
 
         self.status = status
 
-        self._QualificationRequirements = []
+        self._QualificationRequirements = RefList()
         self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
 
         super(CULaborItem, self).__init__(*args, **kw_args)
@@ -70,26 +71,28 @@ class CULaborItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CULaborItems if q != self]
-            self._CompatibleUnits._CULaborItems = filtered
-        for r in value:
-            if self not in r._CULaborItems:
-                r._CULaborItems.append(self)
-        self._CompatibleUnits = value
+            p._CULaborItems.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._CULaborItems:
-                obj._CULaborItems.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CULaborItems.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._CULaborItems:
-                obj._CULaborItems.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CULaborItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CULaborItems.discard(self)
+        self._CompatibleUnits = RefList()
 
     def getCULaborCode(self):
         
@@ -97,8 +100,7 @@ class CULaborItem(IdentifiedObject):
 
     def setCULaborCode(self, value):
         if self._CULaborCode is not None:
-            filtered = [x for x in self.CULaborCode.CULaborItems if x != self]
-            self._CULaborCode._CULaborItems = filtered
+            self._CULaborCode._CULaborItems.discard(self)
 
         self._CULaborCode = value
         if self._CULaborCode is not None:
@@ -115,24 +117,26 @@ class CULaborItem(IdentifiedObject):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.CULaborItems if q != self]
-            self._QualificationRequirements._CULaborItems = filtered
-        for r in value:
-            if self not in r._CULaborItems:
-                r._CULaborItems.append(self)
-        self._QualificationRequirements = value
+            p._CULaborItems.discard(self)
+        self._QualificationRequirements = RefList()
+        self.addQualificationRequirements(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self not in obj._CULaborItems:
-                obj._CULaborItems.append(self)
-            self._QualificationRequirements.append(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._CULaborItems.append(self)
+            collection.append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self in obj._CULaborItems:
-                obj._CULaborItems.remove(self)
-            self._QualificationRequirements.remove(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._CULaborItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllQualificationRequirements(self):
+        for obj in self._QualificationRequirements:
+            obj._CULaborItems.discard(self)
+        self._QualificationRequirements = RefList()
 
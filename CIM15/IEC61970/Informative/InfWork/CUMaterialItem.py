@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CUMaterialItem(IdentifiedObject):
     """Compatible unit of a consumable supply item. For example, nuts, bolts, brackets, glue, etc.Compatible unit of a consumable supply item. For example, nuts, bolts, brackets, glue, etc.
@@ -42,10 +43,10 @@ class CUMaterialItem(IdentifiedObject):
 
         self.status = status
 
-        self._PropertyUnits = []
+        self._PropertyUnits = RefList()
         self.PropertyUnits = [] if PropertyUnits is None else PropertyUnits
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         self._TypeMaterial = None
@@ -68,26 +69,28 @@ class CUMaterialItem(IdentifiedObject):
 
     def setPropertyUnits(self, value):
         for p in self._PropertyUnits:
-            filtered = [q for q in p.CUMaterialItems if q != self]
-            self._PropertyUnits._CUMaterialItems = filtered
-        for r in value:
-            if self not in r._CUMaterialItems:
-                r._CUMaterialItems.append(self)
-        self._PropertyUnits = value
+            p._CUMaterialItems.discard(self)
+        self._PropertyUnits = RefList()
+        self.addPropertyUnits(value)
 
     PropertyUnits = property(getPropertyUnits, setPropertyUnits)
 
     def addPropertyUnits(self, *PropertyUnits):
-        for obj in PropertyUnits:
-            if self not in obj._CUMaterialItems:
-                obj._CUMaterialItems.append(self)
-            self._PropertyUnits.append(obj)
+        collection = self._PropertyUnits
+        for obj in members(PropertyUnits):
+            obj._CUMaterialItems.append(self)
+            collection.append(obj)
 
     def removePropertyUnits(self, *PropertyUnits):
-        for obj in PropertyUnits:
-            if self in obj._CUMaterialItems:
-                obj._CUMaterialItems.remove(self)
-            self._PropertyUnits.remove(obj)
+        collection = self._PropertyUnits
+        for obj in members(PropertyUnits):
+            obj._CUMaterialItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllPropertyUnits(self):
+        for obj in self._PropertyUnits:
+            obj._CUMaterialItems.discard(self)
+        self._PropertyUnits = RefList()
 
     def getCompatibleUnits(self):
         
@@ -95,26 +98,28 @@ class CUMaterialItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUMaterialItems if q != self]
-            self._CompatibleUnits._CUMaterialItems = filtered
-        for r in value:
-            if self not in r._CUMaterialItems:
-                r._CUMaterialItems.append(self)
-        self._CompatibleUnits = value
+            p._CUMaterialItems.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._CUMaterialItems:
-                obj._CUMaterialItems.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUMaterialItems.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._CUMaterialItems:
-                obj._CUMaterialItems.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUMaterialItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CUMaterialItems.discard(self)
+        self._CompatibleUnits = RefList()
 
     def getTypeMaterial(self):
         
@@ -122,8 +127,7 @@ class CUMaterialItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.CUMaterialItems if x != self]
-            self._TypeMaterial._CUMaterialItems = filtered
+            self._TypeMaterial._CUMaterialItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CUWorkEquipmentItem(IdentifiedObject):
     """Compatible unit for various types of WorkEquipmentAssets, including vehicles.Compatible unit for various types of WorkEquipmentAssets, including vehicles.
@@ -44,7 +45,7 @@ class CUWorkEquipmentItem(IdentifiedObject):
 
         self.status = status
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         super(CUWorkEquipmentItem, self).__init__(*args, **kw_args)
@@ -79,24 +80,26 @@ class CUWorkEquipmentItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUWorkEquipmentItems if q != self]
-            self._CompatibleUnits._CUWorkEquipmentItems = filtered
-        for r in value:
-            if self not in r._CUWorkEquipmentItems:
-                r._CUWorkEquipmentItems.append(self)
-        self._CompatibleUnits = value
+            p._CUWorkEquipmentItems.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._CUWorkEquipmentItems:
-                obj._CUWorkEquipmentItems.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUWorkEquipmentItems.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._CUWorkEquipmentItems:
-                obj._CUWorkEquipmentItems.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._CUWorkEquipmentItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CUWorkEquipmentItems.discard(self)
+        self._CompatibleUnits = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Capability(IdentifiedObject):
     """Capabilities of a crew.Capabilities of a crew.
@@ -44,12 +45,12 @@ class Capability(IdentifiedObject):
         self._Crew = None
         self.Crew = Crew
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
         self.status = status
 
-        self._Crafts = []
+        self._Crafts = RefList()
         self.Crafts = [] if Crafts is None else Crafts
 
         self.validityInterval = validityInterval
@@ -69,8 +70,7 @@ class Capability(IdentifiedObject):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Capabilities if x != self]
-            self._Crew._Capabilities = filtered
+            self._Crew._Capabilities.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
@@ -85,26 +85,28 @@ class Capability(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.Capabilities if q != self]
-            self._WorkTasks._Capabilities = filtered
-        for r in value:
-            if self not in r._Capabilities:
-                r._Capabilities.append(self)
-        self._WorkTasks = value
+            p._Capabilities.discard(self)
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self not in obj._Capabilities:
-                obj._Capabilities.append(self)
-            self._WorkTasks.append(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._Capabilities.append(self)
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self in obj._Capabilities:
-                obj._Capabilities.remove(self)
-            self._WorkTasks.remove(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._Capabilities.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._Capabilities.discard(self)
+        self._WorkTasks = RefList()
 
     status = None
 
@@ -114,26 +116,28 @@ class Capability(IdentifiedObject):
 
     def setCrafts(self, value):
         for p in self._Crafts:
-            filtered = [q for q in p.Capabilities if q != self]
-            self._Crafts._Capabilities = filtered
-        for r in value:
-            if self not in r._Capabilities:
-                r._Capabilities.append(self)
-        self._Crafts = value
+            p._Capabilities.discard(self)
+        self._Crafts = RefList()
+        self.addCrafts(value)
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
-        for obj in Crafts:
-            if self not in obj._Capabilities:
-                obj._Capabilities.append(self)
-            self._Crafts.append(obj)
+        collection = self._Crafts
+        for obj in members(Crafts):
+            obj._Capabilities.append(self)
+            collection.append(obj)
 
     def removeCrafts(self, *Crafts):
-        for obj in Crafts:
-            if self in obj._Capabilities:
-                obj._Capabilities.remove(self)
-            self._Crafts.remove(obj)
+        collection = self._Crafts
+        for obj in members(Crafts):
+            obj._Capabilities.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrafts(self):
+        for obj in self._Crafts:
+            obj._Capabilities.discard(self)
+        self._Crafts = RefList()
 
     # Date and time interval for which this capability is valid (when it became effective and when it expires).
     validityInterval = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class CompatibleUnit(Document):
     """A pre-planned job model containing labor, material, and accounting requirements for standardized job planning.A pre-planned job model containing labor, material, and accounting requirements for standardized job planning.
@@ -47,16 +48,16 @@ class CompatibleUnit(Document):
         #: Estimated total cost for perfoming CU.
         self.estCost = estCost
 
-        self._CUWorkEquipmentItems = []
+        self._CUWorkEquipmentItems = RefList()
         self.CUWorkEquipmentItems = [] if CUWorkEquipmentItems is None else CUWorkEquipmentItems
 
-        self._DesignLocationCUs = []
+        self._DesignLocationCUs = RefList()
         self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
 
         self._CUGroup = None
         self.CUGroup = CUGroup
 
-        self._CUAssets = []
+        self._CUAssets = RefList()
         self.CUAssets = [] if CUAssets is None else CUAssets
 
         self._PropertyUnit = None
@@ -68,16 +69,16 @@ class CompatibleUnit(Document):
         self._CUAllowableAction = None
         self.CUAllowableAction = CUAllowableAction
 
-        self._Procedures = []
+        self._Procedures = RefList()
         self.Procedures = [] if Procedures is None else Procedures
 
-        self._CUContractorItems = []
+        self._CUContractorItems = RefList()
         self.CUContractorItems = [] if CUContractorItems is None else CUContractorItems
 
-        self._CUMaterialItems = []
+        self._CUMaterialItems = RefList()
         self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
 
-        self._CULaborItems = []
+        self._CULaborItems = RefList()
         self.CULaborItems = [] if CULaborItems is None else CULaborItems
 
         super(CompatibleUnit, self).__init__(*args, **kw_args)
@@ -95,26 +96,28 @@ class CompatibleUnit(Document):
 
     def setCUWorkEquipmentItems(self, value):
         for p in self._CUWorkEquipmentItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUWorkEquipmentItems._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUWorkEquipmentItems = value
+            p._CompatibleUnits.discard(self)
+        self._CUWorkEquipmentItems = RefList()
+        self.addCUWorkEquipmentItems(value)
 
     CUWorkEquipmentItems = property(getCUWorkEquipmentItems, setCUWorkEquipmentItems)
 
     def addCUWorkEquipmentItems(self, *CUWorkEquipmentItems):
-        for obj in CUWorkEquipmentItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUWorkEquipmentItems.append(obj)
+        collection = self._CUWorkEquipmentItems
+        for obj in members(CUWorkEquipmentItems):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeCUWorkEquipmentItems(self, *CUWorkEquipmentItems):
-        for obj in CUWorkEquipmentItems:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._CUWorkEquipmentItems.remove(obj)
+        collection = self._CUWorkEquipmentItems
+        for obj in members(CUWorkEquipmentItems):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCUWorkEquipmentItems(self):
+        for obj in self._CUWorkEquipmentItems:
+            obj._CompatibleUnits.discard(self)
+        self._CUWorkEquipmentItems = RefList()
 
     def getDesignLocationCUs(self):
         
@@ -122,26 +125,28 @@ class CompatibleUnit(Document):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._DesignLocationCUs._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._DesignLocationCUs = value
+            p._CompatibleUnits.discard(self)
+        self._DesignLocationCUs = RefList()
+        self.addDesignLocationCUs(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._DesignLocationCUs.append(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._DesignLocationCUs.remove(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocationCUs(self):
+        for obj in self._DesignLocationCUs:
+            obj._CompatibleUnits.discard(self)
+        self._DesignLocationCUs = RefList()
 
     def getCUGroup(self):
         
@@ -149,8 +154,7 @@ class CompatibleUnit(Document):
 
     def setCUGroup(self, value):
         if self._CUGroup is not None:
-            filtered = [x for x in self.CUGroup.CompatibleUnits if x != self]
-            self._CUGroup._CompatibleUnits = filtered
+            self._CUGroup._CompatibleUnits.discard(self)
 
         self._CUGroup = value
         if self._CUGroup is not None:
@@ -165,26 +169,28 @@ class CompatibleUnit(Document):
 
     def setCUAssets(self, value):
         for p in self._CUAssets:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUAssets._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUAssets = value
+            p._CompatibleUnits.discard(self)
+        self._CUAssets = RefList()
+        self.addCUAssets(value)
 
     CUAssets = property(getCUAssets, setCUAssets)
 
     def addCUAssets(self, *CUAssets):
-        for obj in CUAssets:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUAssets.append(obj)
+        collection = self._CUAssets
+        for obj in members(CUAssets):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeCUAssets(self, *CUAssets):
-        for obj in CUAssets:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._CUAssets.remove(obj)
+        collection = self._CUAssets
+        for obj in members(CUAssets):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCUAssets(self):
+        for obj in self._CUAssets:
+            obj._CompatibleUnits.discard(self)
+        self._CUAssets = RefList()
 
     def getPropertyUnit(self):
         
@@ -192,8 +198,7 @@ class CompatibleUnit(Document):
 
     def setPropertyUnit(self, value):
         if self._PropertyUnit is not None:
-            filtered = [x for x in self.PropertyUnit.CompatibleUnits if x != self]
-            self._PropertyUnit._CompatibleUnits = filtered
+            self._PropertyUnit._CompatibleUnits.discard(self)
 
         self._PropertyUnit = value
         if self._PropertyUnit is not None:
@@ -208,8 +213,7 @@ class CompatibleUnit(Document):
 
     def setCostType(self, value):
         if self._CostType is not None:
-            filtered = [x for x in self.CostType.CompatibleUnits if x != self]
-            self._CostType._CompatibleUnits = filtered
+            self._CostType._CompatibleUnits.discard(self)
 
         self._CostType = value
         if self._CostType is not None:
@@ -224,8 +228,7 @@ class CompatibleUnit(Document):
 
     def setCUAllowableAction(self, value):
         if self._CUAllowableAction is not None:
-            filtered = [x for x in self.CUAllowableAction.CompatibleUnits if x != self]
-            self._CUAllowableAction._CompatibleUnits = filtered
+            self._CUAllowableAction._CompatibleUnits.discard(self)
 
         self._CUAllowableAction = value
         if self._CUAllowableAction is not None:
@@ -240,26 +243,28 @@ class CompatibleUnit(Document):
 
     def setProcedures(self, value):
         for p in self._Procedures:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._Procedures._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._Procedures = value
+            p._CompatibleUnits.discard(self)
+        self._Procedures = RefList()
+        self.addProcedures(value)
 
     Procedures = property(getProcedures, setProcedures)
 
     def addProcedures(self, *Procedures):
-        for obj in Procedures:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._Procedures.append(obj)
+        collection = self._Procedures
+        for obj in members(Procedures):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeProcedures(self, *Procedures):
-        for obj in Procedures:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._Procedures.remove(obj)
+        collection = self._Procedures
+        for obj in members(Procedures):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllProcedures(self):
+        for obj in self._Procedures:
+            obj._CompatibleUnits.discard(self)
+        self._Procedures = RefList()
 
     def getCUContractorItems(self):
         
@@ -267,26 +272,28 @@ class CompatibleUnit(Document):
 
     def setCUContractorItems(self, value):
         for p in self._CUContractorItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUContractorItems._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUContractorItems = value
+            p._CompatibleUnits.discard(self)
+        self._CUContractorItems = RefList()
+        self.addCUContractorItems(value)
 
     CUContractorItems = property(getCUContractorItems, setCUContractorItems)
 
     def addCUContractorItems(self, *CUContractorItems):
-        for obj in CUContractorItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUContractorItems.append(obj)
+        collection = self._CUContractorItems
+        for obj in members(CUContractorItems):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeCUContractorItems(self, *CUContractorItems):
-        for obj in CUContractorItems:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._CUContractorItems.remove(obj)
+        collection = self._CUContractorItems
+        for obj in members(CUContractorItems):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCUContractorItems(self):
+        for obj in self._CUContractorItems:
+            obj._CompatibleUnits.discard(self)
+        self._CUContractorItems = RefList()
 
     def getCUMaterialItems(self):
         
@@ -294,26 +301,28 @@ class CompatibleUnit(Document):
 
     def setCUMaterialItems(self, value):
         for p in self._CUMaterialItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUMaterialItems._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUMaterialItems = value
+            p._CompatibleUnits.discard(self)
+        self._CUMaterialItems = RefList()
+        self.addCUMaterialItems(value)
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
-        for obj in CUMaterialItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUMaterialItems.append(obj)
+        collection = self._CUMaterialItems
+        for obj in members(CUMaterialItems):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
-        for obj in CUMaterialItems:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._CUMaterialItems.remove(obj)
+        collection = self._CUMaterialItems
+        for obj in members(CUMaterialItems):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCUMaterialItems(self):
+        for obj in self._CUMaterialItems:
+            obj._CompatibleUnits.discard(self)
+        self._CUMaterialItems = RefList()
 
     def getCULaborItems(self):
         
@@ -321,24 +330,26 @@ class CompatibleUnit(Document):
 
     def setCULaborItems(self, value):
         for p in self._CULaborItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CULaborItems._CompatibleUnits = filtered
-        for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CULaborItems = value
+            p._CompatibleUnits.discard(self)
+        self._CULaborItems = RefList()
+        self.addCULaborItems(value)
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
-        for obj in CULaborItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CULaborItems.append(obj)
+        collection = self._CULaborItems
+        for obj in members(CULaborItems):
+            obj._CompatibleUnits.append(self)
+            collection.append(obj)
 
     def removeCULaborItems(self, *CULaborItems):
-        for obj in CULaborItems:
-            if self in obj._CompatibleUnits:
-                obj._CompatibleUnits.remove(self)
-            self._CULaborItems.remove(obj)
+        collection = self._CULaborItems
+        for obj in members(CULaborItems):
+            obj._CompatibleUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCULaborItems(self):
+        for obj in self._CULaborItems:
+            obj._CompatibleUnits.discard(self)
+        self._CULaborItems = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ConditionFactor(IdentifiedObject):
     """This is to specify the various condition factors for a design that may alter the cost estimate or the allocation.This is to specify the various condition factors for a design that may alter the cost estimate or the allocation.
@@ -40,15 +41,15 @@ class ConditionFactor(IdentifiedObject):
         #: The actual value of the condition factor, such as labor flat fee or percentage.
         self.cfValue = cfValue
 
-        self._Designs = []
+        self._Designs = RefList()
         self.Designs = [] if Designs is None else Designs
 
-        self._DesignLocations = []
+        self._DesignLocations = RefList()
         self.DesignLocations = [] if DesignLocations is None else DesignLocations
 
         self.status = status
 
-        self._DesignLocationCUs = []
+        self._DesignLocationCUs = RefList()
         self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
 
         super(ConditionFactor, self).__init__(*args, **kw_args)
@@ -66,26 +67,28 @@ class ConditionFactor(IdentifiedObject):
 
     def setDesigns(self, value):
         for p in self._Designs:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._Designs._ConditionFactors = filtered
-        for r in value:
-            if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
-        self._Designs = value
+            p._ConditionFactors.discard(self)
+        self._Designs = RefList()
+        self.addDesigns(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
-        for obj in Designs:
-            if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._Designs.append(obj)
+        collection = self._Designs
+        for obj in members(Designs):
+            obj._ConditionFactors.append(self)
+            collection.append(obj)
 
     def removeDesigns(self, *Designs):
-        for obj in Designs:
-            if self in obj._ConditionFactors:
-                obj._ConditionFactors.remove(self)
-            self._Designs.remove(obj)
+        collection = self._Designs
+        for obj in members(Designs):
+            obj._ConditionFactors.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesigns(self):
+        for obj in self._Designs:
+            obj._ConditionFactors.discard(self)
+        self._Designs = RefList()
 
     def getDesignLocations(self):
         
@@ -93,26 +96,28 @@ class ConditionFactor(IdentifiedObject):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._DesignLocations._ConditionFactors = filtered
-        for r in value:
-            if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
-        self._DesignLocations = value
+            p._ConditionFactors.discard(self)
+        self._DesignLocations = RefList()
+        self.addDesignLocations(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._DesignLocations.append(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._ConditionFactors.append(self)
+            collection.append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self in obj._ConditionFactors:
-                obj._ConditionFactors.remove(self)
-            self._DesignLocations.remove(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._ConditionFactors.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocations(self):
+        for obj in self._DesignLocations:
+            obj._ConditionFactors.discard(self)
+        self._DesignLocations = RefList()
 
     status = None
 
@@ -122,24 +127,26 @@ class ConditionFactor(IdentifiedObject):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._DesignLocationCUs._ConditionFactors = filtered
-        for r in value:
-            if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
-        self._DesignLocationCUs = value
+            p._ConditionFactors.discard(self)
+        self._DesignLocationCUs = RefList()
+        self.addDesignLocationCUs(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._DesignLocationCUs.append(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._ConditionFactors.append(self)
+            collection.append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self in obj._ConditionFactors:
-                obj._ConditionFactors.remove(self)
-            self._DesignLocationCUs.remove(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._ConditionFactors.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocationCUs(self):
+        for obj in self._DesignLocationCUs:
+            obj._ConditionFactors.discard(self)
+        self._DesignLocationCUs = RefList()
 
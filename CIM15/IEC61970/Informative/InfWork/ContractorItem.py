@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ContractorItem(IdentifiedObject):
     """Contractor information for work task.Contractor information for work task.
@@ -47,7 +48,7 @@ class ContractorItem(IdentifiedObject):
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._ErpPayables = []
+        self._ErpPayables = RefList()
         self.ErpPayables = [] if ErpPayables is None else ErpPayables
 
         self.status = status
@@ -70,8 +71,7 @@ class ContractorItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.ContractorItems if x != self]
-            self._WorkTask._ContractorItems = filtered
+            self._WorkTask._ContractorItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -86,26 +86,28 @@ class ContractorItem(IdentifiedObject):
 
     def setErpPayables(self, value):
         for p in self._ErpPayables:
-            filtered = [q for q in p.ContractorItems if q != self]
-            self._ErpPayables._ContractorItems = filtered
-        for r in value:
-            if self not in r._ContractorItems:
-                r._ContractorItems.append(self)
-        self._ErpPayables = value
+            p._ContractorItems.discard(self)
+        self._ErpPayables = RefList()
+        self.addErpPayables(value)
 
     ErpPayables = property(getErpPayables, setErpPayables)
 
     def addErpPayables(self, *ErpPayables):
-        for obj in ErpPayables:
-            if self not in obj._ContractorItems:
-                obj._ContractorItems.append(self)
-            self._ErpPayables.append(obj)
+        collection = self._ErpPayables
+        for obj in members(ErpPayables):
+            obj._ContractorItems.append(self)
+            collection.append(obj)
 
     def removeErpPayables(self, *ErpPayables):
-        for obj in ErpPayables:
-            if self in obj._ContractorItems:
-                obj._ContractorItems.remove(self)
-            self._ErpPayables.remove(obj)
+        collection = self._ErpPayables
+        for obj in members(ErpPayables):
+            obj._ContractorItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPayables(self):
+        for obj in self._ErpPayables:
+            obj._ContractorItems.discard(self)
+        self._ErpPayables = RefList()
 
     status = None
 
@@ -115,8 +117,7 @@ class ContractorItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.ContractorItems if x != self]
-            self._WorkCostDetail._ContractorItems = filtered
+            self._WorkCostDetail._ContractorItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class CostType(IdentifiedObject):
     """A categorization for resources, often costs, in accounting transactions. Examples include: material components, building in service, coal sales, overhead, etc.A categorization for resources, often costs, in accounting transactions. Examples include: material components, building in service, coal sales, overhead, etc.
@@ -50,19 +51,19 @@ class CostType(IdentifiedObject):
         #: True if an amount can be assigned to the resource element (e.g., building in service, transmission plant, software development capital); false otherwise (e.g., internal labor, material components).
         self.amountAssignable = amountAssignable
 
-        self._ErpJournalEntries = []
+        self._ErpJournalEntries = RefList()
         self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
 
         self._ParentCostType = None
         self.ParentCostType = ParentCostType
 
-        self._ChildCostTypes = []
+        self._ChildCostTypes = RefList()
         self.ChildCostTypes = [] if ChildCostTypes is None else ChildCostTypes
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
         self.status = status
@@ -82,26 +83,28 @@ class CostType(IdentifiedObject):
 
     def setErpJournalEntries(self, value):
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.CostTypes if q != self]
-            self._ErpJournalEntries._CostTypes = filtered
-        for r in value:
-            if self not in r._CostTypes:
-                r._CostTypes.append(self)
-        self._ErpJournalEntries = value
+            p._CostTypes.discard(self)
+        self._ErpJournalEntries = RefList()
+        self.addErpJournalEntries(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            if self not in obj._CostTypes:
-                obj._CostTypes.append(self)
-            self._ErpJournalEntries.append(obj)
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            obj._CostTypes.append(self)
+            collection.append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
-        for obj in ErpJournalEntries:
-            if self in obj._CostTypes:
-                obj._CostTypes.remove(self)
-            self._ErpJournalEntries.remove(obj)
+        collection = self._ErpJournalEntries
+        for obj in members(ErpJournalEntries):
+            obj._CostTypes.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpJournalEntries(self):
+        for obj in self._ErpJournalEntries:
+            obj._CostTypes.discard(self)
+        self._ErpJournalEntries = RefList()
 
     def getParentCostType(self):
         
@@ -109,8 +112,7 @@ class CostType(IdentifiedObject):
 
     def setParentCostType(self, value):
         if self._ParentCostType is not None:
-            filtered = [x for x in self.ParentCostType.ChildCostTypes if x != self]
-            self._ParentCostType._ChildCostTypes = filtered
+            self._ParentCostType._ChildCostTypes.discard(self)
 
         self._ParentCostType = value
         if self._ParentCostType is not None:
@@ -125,20 +127,32 @@ class CostType(IdentifiedObject):
 
     def setChildCostTypes(self, value):
         for x in self._ChildCostTypes:
-            x.ParentCostType = None
-        for y in value:
-            y._ParentCostType = self
-        self._ChildCostTypes = value
+            x._ParentCostType = None
+        self._ChildCostTypes = RefList()
+        self.addChildCostTypes(value)
 
     ChildCostTypes = property(getChildCostTypes, setChildCostTypes)
 
     def addChildCostTypes(self, *ChildCostTypes):
-        for obj in ChildCostTypes:
-            obj.ParentCostType = self
+        collection = self._ChildCostTypes
+        for obj in members(ChildCostTypes):
+            old = obj._ParentCostType
+            if old is not None and old is not self:
+                old._ChildCostTypes.discard(obj)
+            obj._ParentCostType = self
+            collection.append(obj)
 
     def removeChildCostTypes(self, *ChildCostTypes):
-        for obj in ChildCostTypes:
-            obj.ParentCostType = None
+        collection = self._ChildCostTypes
+        for obj in members(ChildCostTypes):
+            if obj._ParentCostType is self:
+                obj._ParentCostType = None
+                collection.discard(obj)
+
+    def removeAllChildCostTypes(self):
+        for obj in self._ChildCostTypes:
+            obj._ParentCostType = None
+        self._ChildCostTypes = RefList()
 
     def getWorkCostDetails(self):
         
@@ -146,20 +160,32 @@ class CostType(IdentifiedObject):
 
     def setWorkCostDetails(self, value):
         for x in self._WorkCostDetails:
-            x.CostType = None
-        for y in value:
-            y._CostType = self
-        self._WorkCostDetails = value
+            x._CostType = None
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.CostType = self
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            old = obj._CostType
+            if old is not None and old is not self:
+                old._WorkCostDetails.discard(obj)
+            obj._CostType = self
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.CostType = None
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            if obj._CostType is self:
+                obj._CostType = None
+                collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._CostType = None
+        self._WorkCostDetails = RefList()
 
     def getCompatibleUnits(self):
         
@@ -167,20 +193,32 @@ class CostType(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for x in self._CompatibleUnits:
-            x.CostType = None
-        for y in value:
-            y._CostType = self
-        self._CompatibleUnits = value
+            x._CostType = None
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.CostType = self
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            old = obj._CostType
+            if old is not None and old is not self:
+                old._CompatibleUnits.discard(obj)
+            obj._CostType = self
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.CostType = None
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            if obj._CostType is self:
+                obj._CostType = None
+                collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._CostType = None
+        self._CompatibleUnits = RefList()
 
     status = None
 
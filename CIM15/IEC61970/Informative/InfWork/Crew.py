@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Crew(IdentifiedObject):
     """A crew is a group of people with specific skills, tools, and vehicles.A crew is a group of people with specific skills, tools, and vehicles.
@@ -45,43 +46,43 @@ class Crew(IdentifiedObject):
         #: Category by utility's work management standards and practices.
         self.category = category
 
-        self._Tools = []
+        self._Tools = RefList()
         self.Tools = [] if Tools is None else Tools
 
-        self._SwitchingSchedules = []
+        self._SwitchingSchedules = RefList()
         self.SwitchingSchedules = [] if SwitchingSchedules is None else SwitchingSchedules
 
         self._Route = None
         self.Route = Route
 
-        self._Capabilities = []
+        self._Capabilities = RefList()
         self.Capabilities = [] if Capabilities is None else Capabilities
 
-        self._CrewMembers = []
+        self._CrewMembers = RefList()
         self.CrewMembers = [] if CrewMembers is None else CrewMembers
 
-        self._OutageSteps = []
+        self._OutageSteps = RefList()
         self.OutageSteps = [] if OutageSteps is None else OutageSteps
 
-        self._WorkEquipmentAssets = []
+        self._WorkEquipmentAssets = RefList()
         self.WorkEquipmentAssets = [] if WorkEquipmentAssets is None else WorkEquipmentAssets
 
-        self._Assignments = []
+        self._Assignments = RefList()
         self.Assignments = [] if Assignments is None else Assignments
 
-        self._Locations = []
+        self._Locations = RefList()
         self.Locations = [] if Locations is None else Locations
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
-        self._Organisations = []
+        self._Organisations = RefList()
         self.Organisations = [] if Organisations is None else Organisations
 
-        self._ShiftPatterns = []
+        self._ShiftPatterns = RefList()
         self.ShiftPatterns = [] if ShiftPatterns is None else ShiftPatterns
 
-        self._Vehicles = []
+        self._Vehicles = RefList()
         self.Vehicles = [] if Vehicles is None else Vehicles
 
         super(Crew, self).__init__(*args, **kw_args)
@@ -99,20 +100,32 @@ class Crew(IdentifiedObject):
 
     def setTools(self, value):
         for x in self._Tools:
-            x.Crew = None
-        for y in value:
-            y._Crew = self
-        self._Tools = value
+            x._Crew = None
+        self._Tools = RefList()
+        self.addTools(value)
 
     Tools = property(getTools, setTools)
 
     def addTools(self, *Tools):
-        for obj in Tools:
-            obj.Crew = self
+        collection = self._Tools
+        for obj in members(Tools):
+            old = obj._Crew
+            if old is not None and old is not self:
+                old._Tools.discard(obj)
+            obj._Crew = self
+            collection.append(obj)
 
     def removeTools(self, *Tools):
-        for obj in Tools:
-            obj.Crew = None
+        collection = self._Tools
+        for obj in members(Tools):
+            if obj._Crew is self:
+                obj._Crew = None
+                collection.discard(obj)
+
+    def removeAllTools(self):
+        for obj in self._Tools:
+            obj._Crew = None
+        self._Tools = RefList()
 
     def getSwitchingSchedules(self):
         """All SwitchingSchedules executed by this Crew.
@@ -121,26 +134,28 @@ class Crew(IdentifiedObject):
 
     def setSwitchingSchedules(self, value):
         for p in self._SwitchingSchedules:
-            filtered = [q for q in p.Crews if q != self]
-            self._SwitchingSchedules._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._SwitchingSchedules = value
+            p._Crews.discard(self)
+        self._SwitchingSchedules = RefList()
+        self.addSwitchingSchedules(value)
 
     SwitchingSchedules = property(getSwitchingSchedules, setSwitchingSchedules)
 
     def addSwitchingSchedules(self, *SwitchingSchedules):
-        for obj in SwitchingSchedules:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._SwitchingSchedules.append(obj)
+        collection = self._SwitchingSchedules
+        for obj in members(SwitchingSchedules):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeSwitchingSchedules(self, *SwitchingSchedules):
-        for obj in SwitchingSchedules:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._SwitchingSchedules.remove(obj)
+        collection = self._SwitchingSchedules
+        for obj in members(SwitchingSchedules):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllSwitchingSchedules(self):
+        for obj in self._SwitchingSchedules:
+            obj._Crews.discard(self)
+        self._SwitchingSchedules = RefList()
 
     def getRoute(self):
         
@@ -148,8 +163,7 @@ class Crew(IdentifiedObject):
 
     def setRoute(self, value):
         if self._Route is not None:
-            filtered = [x for x in self.Route.Crews if x != self]
-            self._Route._Crews = filtered
+            self._Route._Crews.discard(self)
 
         self._Route = value
         if self._Route is not None:
@@ -164,20 +178,32 @@ class Crew(IdentifiedObject):
 
     def setCapabilities(self, value):
         for x in self._Capabilities:
-            x.Crew = None
-        for y in value:
-            y._Crew = self
-        self._Capabilities = value
+            x._Crew = None
+        self._Capabilities = RefList()
+        self.addCapabilities(value)
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
-        for obj in Capabilities:
-            obj.Crew = self
+        collection = self._Capabilities
+        for obj in members(Capabilities):
+            old = obj._Crew
+            if old is not None and old is not self:
+                old._Capabilities.discard(obj)
+            obj._Crew = self
+            collection.append(obj)
 
     def removeCapabilities(self, *Capabilities):
-        for obj in Capabilities:
-            obj.Crew = None
+        collection = self._Capabilities
+        for obj in members(Capabilities):
+            if obj._Crew is self:
+                obj._Crew = None
+                collection.discard(obj)
+
+    def removeAllCapabilities(self):
+        for obj in self._Capabilities:
+            obj._Crew = None
+        self._Capabilities = RefList()
 
     def getCrewMembers(self):
         """All ErpPersons that are members of this Crew.
@@ -186,26 +212,28 @@ class Crew(IdentifiedObject):
 
     def setCrewMembers(self, value):
         for p in self._CrewMembers:
-            filtered = [q for q in p.Crews if q != self]
-            self._CrewMembers._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._CrewMembers = value
+            p._Crews.discard(self)
+        self._CrewMembers = RefList()
+        self.addCrewMembers(value)
 
     CrewMembers = property(getCrewMembers, setCrewMembers)
 
     def addCrewMembers(self, *CrewMembers):
-        for obj in CrewMembers:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._CrewMembers.append(obj)
+        collection = self._CrewMembers
+        for obj in members(CrewMembers):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeCrewMembers(self, *CrewMembers):
-        for obj in CrewMembers:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._CrewMembers.remove(obj)
+        collection = self._CrewMembers
+        for obj in members(CrewMembers):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrewMembers(self):
+        for obj in self._CrewMembers:
+            obj._Crews.discard(self)
+        self._CrewMembers = RefList()
 
     def getOutageSteps(self):
         
@@ -213,26 +241,28 @@ class Crew(IdentifiedObject):
 
     def setOutageSteps(self, value):
         for p in self._OutageSteps:
-            filtered = [q for q in p.Crews if q != self]
-            self._OutageSteps._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._OutageSteps = value
+            p._Crews.discard(self)
+        self._OutageSteps = RefList()
+        self.addOutageSteps(value)
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
-        for obj in OutageSteps:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._OutageSteps.append(obj)
+        collection = self._OutageSteps
+        for obj in members(OutageSteps):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeOutageSteps(self, *OutageSteps):
-        for obj in OutageSteps:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._OutageSteps.remove(obj)
+        collection = self._OutageSteps
+        for obj in members(OutageSteps):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllOutageSteps(self):
+        for obj in self._OutageSteps:
+            obj._Crews.discard(self)
+        self._OutageSteps = RefList()
 
     def getWorkEquipmentAssets(self):
         
@@ -240,20 +270,32 @@ class Crew(IdentifiedObject):
 
     def setWorkEquipmentAssets(self, value):
         for x in self._WorkEquipmentAssets:
-            x.Crew = None
-        for y in value:
-            y._Crew = self
-        self._WorkEquipmentAssets = value
+            x._Crew = None
+        self._WorkEquipmentAssets = RefList()
+        self.addWorkEquipmentAssets(value)
 
     WorkEquipmentAssets = property(getWorkEquipmentAssets, setWorkEquipmentAssets)
 
     def addWorkEquipmentAssets(self, *WorkEquipmentAssets):
-        for obj in WorkEquipmentAssets:
-            obj.Crew = self
+        collection = self._WorkEquipmentAssets
+        for obj in members(WorkEquipmentAssets):
+            old = obj._Crew
+            if old is not None and old is not self:
+                old._WorkEquipmentAssets.discard(obj)
+            obj._Crew = self
+            collection.append(obj)
 
     def removeWorkEquipmentAssets(self, *WorkEquipmentAssets):
-        for obj in WorkEquipmentAssets:
-            obj.Crew = None
+        collection = self._WorkEquipmentAssets
+        for obj in members(WorkEquipmentAssets):
+            if obj._Crew is self:
+                obj._Crew = None
+                collection.discard(obj)
+
+    def removeAllWorkEquipmentAssets(self):
+        for obj in self._WorkEquipmentAssets:
+            obj._Crew = None
+        self._WorkEquipmentAssets = RefList()
 
     def getAssignments(self):
         """All Assignments for this Crew.
@@ -262,26 +304,28 @@ class Crew(IdentifiedObject):
 
     def setAssignments(self, value):
         for p in self._Assignments:
-            filtered = [q for q in p.Crews if q != self]
-            self._Assignments._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._Assignments = value
+            p._Crews.discard(self)
+        self._Assignments = RefList()
+        self.addAssignments(value)
 
     Assignments = property(getAssignments, setAssignments)
 
     def addAssignments(self, *Assignments):
-        for obj in Assignments:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Assignments.append(obj)
+        collection = self._Assignments
+        for obj in members(Assignments):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeAssignments(self, *Assignments):
-        for obj in Assignments:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._Assignments.remove(obj)
+        collection = self._Assignments
+        for obj in members(Assignments):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllAssignments(self):
+        for obj in self._Assignments:
+            obj._Crews.discard(self)
+        self._Assignments = RefList()
 
     def getLocations(self):
         
@@ -289,26 +333,28 @@ class Crew(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Crews if q != self]
-            self._Locations._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._Locations = value
+            p._Crews.discard(self)
+        self._Locations = RefList()
+        self.addLocations(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
-        for obj in Locations:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Locations.append(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeLocations(self, *Locations):
-        for obj in Locations:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._Locations.remove(obj)
+        collection = self._Locations
+        for obj in members(Locations):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllLocations(self):
+        for obj in self._Locations:
+            obj._Crews.discard(self)
+        self._Locations = RefList()
 
     def getWorkTasks(self):
         """All WorkTasks this Crew participates in.
@@ -317,26 +363,28 @@ class Crew(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.Crews if q != self]
-            self._WorkTasks._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._WorkTasks = value
+            p._Crews.discard(self)
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._WorkTasks.append(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._WorkTasks.remove(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._Crews.discard(self)
+        self._WorkTasks = RefList()
 
     def getOrganisations(self):
         
@@ -344,26 +392,28 @@ class Crew(IdentifiedObject):
 
     def setOrganisations(self, value):
         for p in self._Organisations:
-            filtered = [q for q in p.Crews if q != self]
-            self._Organisations._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._Organisations = value
+            p._Crews.discard(self)
+        self._Organisations = RefList()
+        self.addOrganisations(value)
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
-        for obj in Organisations:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Organisations.append(obj)
+        collection = self._Organisations
+        for obj in members(Organisations):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeOrganisations(self, *Organisations):
-        for obj in Organisations:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._Organisations.remove(obj)
+        collection = self._Organisations
+        for obj in members(Organisations):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllOrganisations(self):
+        for obj in self._Organisations:
+            obj._Crews.discard(self)
+        self._Organisations = RefList()
 
     def getShiftPatterns(self):
         
@@ -371,26 +421,28 @@ class Crew(IdentifiedObject):
 
     def setShiftPatterns(self, value):
         for p in self._ShiftPatterns:
-            filtered = [q for q in p.Crews if q != self]
-            self._ShiftPatterns._Crews = filtered
-        for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
-        self._ShiftPatterns = value
+            p._Crews.discard(self)
+        self._ShiftPatterns = RefList()
+        self.addShiftPatterns(value)
 
     ShiftPatterns = property(getShiftPatterns, setShiftPatterns)
 
     def addShiftPatterns(self, *ShiftPatterns):
-        for obj in ShiftPatterns:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._ShiftPatterns.append(obj)
+        collection = self._ShiftPatterns
+        for obj in members(ShiftPatterns):
+            obj._Crews.append(self)
+            collection.append(obj)
 
     def removeShiftPatterns(self, *ShiftPatterns):
-        for obj in ShiftPatterns:
-            if self in obj._Crews:
-                obj._Crews.remove(self)
-            self._ShiftPatterns.remove(obj)
+        collection = self._ShiftPatterns
+        for obj in members(ShiftPatterns):
+            obj._Crews.discard(self)
+            collection.discard(obj)
+
+    def removeAllShiftPatterns(self):
+        for obj in self._ShiftPatterns:
+            obj._Crews.discard(self)
+        self._ShiftPatterns = RefList()
 
     def getVehicles(self):
         
@@ -398,18 +450,30 @@ class Crew(IdentifiedObject):
 
     def setVehicles(self, value):
         for x in self._Vehicles:
-            x.Crew = None
-        for y in value:
-            y._Crew = self
-        self._Vehicles = value
+            x._Crew = None
+        self._Vehicles = RefList()
+        self.addVehicles(value)
 
     Vehicles = property(getVehicles, setVehicles)
 
     def addVehicles(self, *Vehicles):
-        for obj in Vehicles:
-            obj.Crew = self
+        collection = self._Vehicles
+        for obj in members(Vehicles):
+            old = obj._Crew
+            if old is not None and old is not self:
+                old._Vehicles.discard(obj)
+            obj._Crew = self
+            collection.append(obj)
 
     def removeVehicles(self, *Vehicles):
-        for obj in Vehicles:
-            obj.Crew = None
+        collection = self._Vehicles
+        for obj in members(Vehicles):
+            if obj._Crew is self:
+                obj._Crew = None
+                collection.discard(obj)
+
+    def removeAllVehicles(self):
+        for obj in self._Vehicles:
+            obj._Crew = None
+        self._Vehicles = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Design(Document):
     """A design for consideration by customers, potential customers, or internal work. Note that the Version of design is the revision attribute that is inherited from Document.A design for consideration by customers, potential customers, or internal work. Note that the Version of design is the revision attribute that is inherited from Document.
@@ -48,25 +49,25 @@ class Design(Document):
         #: Price to customer for implementing design.
         self.price = price
 
-        self._DesignLocations = []
+        self._DesignLocations = RefList()
         self.DesignLocations = [] if DesignLocations is None else DesignLocations
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
-        self._ConditionFactors = []
+        self._ConditionFactors = RefList()
         self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
-        self._ErpBOMs = []
+        self._ErpBOMs = RefList()
         self.ErpBOMs = [] if ErpBOMs is None else ErpBOMs
 
         self._Work = None
         self.Work = Work
 
-        self._DesignLocationsCUs = []
+        self._DesignLocationsCUs = RefList()
         self.DesignLocationsCUs = [] if DesignLocationsCUs is None else DesignLocationsCUs
 
         self._ErpQuoteLineItem = None
@@ -87,26 +88,28 @@ class Design(Document):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.Designs if q != self]
-            self._DesignLocations._Designs = filtered
-        for r in value:
-            if self not in r._Designs:
-                r._Designs.append(self)
-        self._DesignLocations = value
+            p._Designs.discard(self)
+        self._DesignLocations = RefList()
+        self.addDesignLocations(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._DesignLocations.append(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._Designs.append(self)
+            collection.append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self in obj._Designs:
-                obj._Designs.remove(self)
-            self._DesignLocations.remove(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._Designs.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocations(self):
+        for obj in self._DesignLocations:
+            obj._Designs.discard(self)
+        self._DesignLocations = RefList()
 
     def getWorkCostDetails(self):
         
@@ -114,20 +117,32 @@ class Design(Document):
 
     def setWorkCostDetails(self, value):
         for x in self._WorkCostDetails:
-            x.Design = None
-        for y in value:
-            y._Design = self
-        self._WorkCostDetails = value
+            x._Design = None
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.Design = self
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            old = obj._Design
+            if old is not None and old is not self:
+                old._WorkCostDetails.discard(obj)
+            obj._Design = self
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.Design = None
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            if obj._Design is self:
+                obj._Design = None
+                collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._Design = None
+        self._WorkCostDetails = RefList()
 
     def getConditionFactors(self):
         
@@ -135,26 +150,28 @@ class Design(Document):
 
     def setConditionFactors(self, value):
         for p in self._ConditionFactors:
-            filtered = [q for q in p.Designs if q != self]
-            self._ConditionFactors._Designs = filtered
-        for r in value:
-            if self not in r._Designs:
-                r._Designs.append(self)
-        self._ConditionFactors = value
+            p._Designs.discard(self)
+        self._ConditionFactors = RefList()
+        self.addConditionFactors(value)
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
-        for obj in ConditionFactors:
-            if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._ConditionFactors.append(obj)
+        collection = self._ConditionFactors
+        for obj in members(ConditionFactors):
+            obj._Designs.append(self)
+            collection.append(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
-        for obj in ConditionFactors:
-            if self in obj._Designs:
-                obj._Designs.remove(self)
-            self._ConditionFactors.remove(obj)
+        collection = self._ConditionFactors
+        for obj in members(ConditionFactors):
+            obj._Designs.discard(self)
+            collection.discard(obj)
+
+    def removeAllConditionFactors(self):
+        for obj in self._ConditionFactors:
+            obj._Designs.discard(self)
+        self._ConditionFactors = RefList()
 
     def getWorkTasks(self):
         
@@ -162,20 +179,32 @@ class Design(Document):
 
     def setWorkTasks(self, value):
         for x in self._WorkTasks:
-            x.Design = None
-        for y in value:
-            y._Design = self
-        self._WorkTasks = value
+            x._Design = None
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.Design = self
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            old = obj._Design
+            if old is not None and old is not self:
+                old._WorkTasks.discard(obj)
+            obj._Design = self
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.Design = None
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            if obj._Design is self:
+                obj._Design = None
+                collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._Design = None
+        self._WorkTasks = RefList()
 
     def getErpBOMs(self):
         
@@ -183,20 +212,32 @@ class Design(Document):
 
     def setErpBOMs(self, value):
         for x in self._ErpBOMs:
-            x.Design = None
-        for y in value:
-            y._Design = self
-        self._ErpBOMs = value
+            x._Design = None
+        self._ErpBOMs = RefList()
+        self.addErpBOMs(value)
 
     ErpBOMs = property(getErpBOMs, setErpBOMs)
 
     def addErpBOMs(self, *ErpBOMs):
-        for obj in ErpBOMs:
-            obj.Design = self
+        collection = self._ErpBOMs
+        for obj in members(ErpBOMs):
+            old = obj._Design
+            if old is not None and old is not self:
+                old._ErpBOMs.discard(obj)
+            obj._Design = self
+            collection.append(obj)
 
     def removeErpBOMs(self, *ErpBOMs):
-        for obj in ErpBOMs:
-            obj.Design = None
+        collection = self._ErpBOMs
+        for obj in members(ErpBOMs):
+            if obj._Design is self:
+                obj._Design = None
+                collection.discard(obj)
+
+    def removeAllErpBOMs(self):
+        for obj in self._ErpBOMs:
+            obj._Design = None
+        self._ErpBOMs = RefList()
 
     def getWork(self):
         
@@ -204,8 +245,7 @@ class Design(Document):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.Designs if x != self]
-            self._Work._Designs = filtered
+            self._Work._Designs.discard(self)
 
         self._Work = value
         if self._Work is not None:
@@ -220,26 +260,28 @@ class Design(Document):
 
     def setDesignLocationsCUs(self, value):
         for p in self._DesignLocationsCUs:
-            filtered = [q for q in p.Designs if q != self]
-            self._DesignLocationsCUs._Designs = filtered
-        for r in value:
-            if self not in r._Designs:
-                r._Designs.append(self)
-        self._DesignLocationsCUs = value
+            p._Designs.discard(self)
+        self._DesignLocationsCUs = RefList()
+        self.addDesignLocationsCUs(value)
 
     DesignLocationsCUs = property(getDesignLocationsCUs, setDesignLocationsCUs)
 
     def addDesignLocationsCUs(self, *DesignLocationsCUs):
-        for obj in DesignLocationsCUs:
-            if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._DesignLocationsCUs.append(obj)
+        collection = self._DesignLocationsCUs
+        for obj in members(DesignLocationsCUs):
+            obj._Designs.append(self)
+            collection.append(obj)
 
     def removeDesignLocationsCUs(self, *DesignLocationsCUs):
-        for obj in DesignLocationsCUs:
-            if self in obj._Designs:
-                obj._Designs.remove(self)
-            self._DesignLocationsCUs.remove(obj)
+        collection = self._DesignLocationsCUs
+        for obj in members(DesignLocationsCUs):
+            obj._Designs.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocationsCUs(self):
+        for obj in self._DesignLocationsCUs:
+            obj._Designs.discard(self)
+        self._DesignLocationsCUs = RefList()
 
     def getErpQuoteLineItem(self):
         
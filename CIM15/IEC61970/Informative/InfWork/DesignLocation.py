@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DesignLocation(IdentifiedObject):
     """A logical part of the design (e.g., pole and all equipment on a pole). This includes points and spans.A logical part of the design (e.g., pole and all equipment on a pole). This includes points and spans.
@@ -43,28 +44,28 @@ class DesignLocation(IdentifiedObject):
 
         self.status = status
 
-        self._MaterialItems = []
+        self._MaterialItems = RefList()
         self.MaterialItems = [] if MaterialItems is None else MaterialItems
 
-        self._Designs = []
+        self._Designs = RefList()
         self.Designs = [] if Designs is None else Designs
 
-        self._DesignLocationCUs = []
+        self._DesignLocationCUs = RefList()
         self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
 
-        self._WorkLocations = []
+        self._WorkLocations = RefList()
         self.WorkLocations = [] if WorkLocations is None else WorkLocations
 
-        self._Diagrams = []
+        self._Diagrams = RefList()
         self.Diagrams = [] if Diagrams is None else Diagrams
 
-        self._MiscCostItems = []
+        self._MiscCostItems = RefList()
         self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
 
-        self._ErpBomItemDatas = []
+        self._ErpBomItemDatas = RefList()
         self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
 
-        self._ConditionFactors = []
+        self._ConditionFactors = RefList()
         self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
 
         super(DesignLocation, self).__init__(*args, **kw_args)
@@ -84,20 +85,32 @@ class DesignLocation(IdentifiedObject):
 
     def setMaterialItems(self, value):
         for x in self._MaterialItems:
-            x.DesignLocation = None
-        for y in value:
-            y._DesignLocation = self
-        self._MaterialItems = value
+            x._DesignLocation = None
+        self._MaterialItems = RefList()
+        self.addMaterialItems(value)
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.DesignLocation = self
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            old = obj._DesignLocation
+            if old is not None and old is not self:
+                old._MaterialItems.discard(obj)
+            obj._DesignLocation = self
+            collection.append(obj)
 
     def removeMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.DesignLocation = None
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            if obj._DesignLocation is self:
+                obj._DesignLocation = None
+                collection.discard(obj)
+
+    def removeAllMaterialItems(self):
+        for obj in self._MaterialItems:
+            obj._DesignLocation = None
+        self._MaterialItems = RefList()
 
     def getDesigns(self):
         
@@ -105,26 +118,28 @@ class DesignLocation(IdentifiedObject):
 
     def setDesigns(self, value):
         for p in self._Designs:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._Designs._DesignLocations = filtered
-        for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._Designs = value
+            p._DesignLocations.discard(self)
+        self._Designs = RefList()
+        self.addDesigns(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
-        for obj in Designs:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._Designs.append(obj)
+        collection = self._Designs
+        for obj in members(Designs):
+            obj._DesignLocations.append(self)
+            collection.append(obj)
 
     def removeDesigns(self, *Designs):
-        for obj in Designs:
-            if self in obj._DesignLocations:
-                obj._DesignLocations.remove(self)
-            self._Designs.remove(obj)
+        collection = self._Designs
+        for obj in members(Designs):
+            obj._DesignLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesigns(self):
+        for obj in self._Designs:
+            obj._DesignLocations.discard(self)
+        self._Designs = RefList()
 
     def getDesignLocationCUs(self):
         
@@ -132,20 +147,32 @@ class DesignLocation(IdentifiedObject):
 
     def setDesignLocationCUs(self, value):
         for x in self._DesignLocationCUs:
-            x.DesignLocation = None
-        for y in value:
-            y._DesignLocation = self
-        self._DesignLocationCUs = value
+            x._DesignLocation = None
+        self._DesignLocationCUs = RefList()
+        self.addDesignLocationCUs(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            obj.DesignLocation = self
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            old = obj._DesignLocation
+            if old is not None and old is not self:
+                old._DesignLocationCUs.discard(obj)
+            obj._DesignLocation = self
+            collection.append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            obj.DesignLocation = None
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            if obj._DesignLocation is self:
+                obj._DesignLocation = None
+                collection.discard(obj)
+
+    def removeAllDesignLocationCUs(self):
+        for obj in self._DesignLocationCUs:
+            obj._DesignLocation = None
+        self._DesignLocationCUs = RefList()
 
     def getWorkLocations(self):
         
@@ -153,26 +180,28 @@ class DesignLocation(IdentifiedObject):
 
     def setWorkLocations(self, value):
         for p in self._WorkLocations:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._WorkLocations._DesignLocations = filtered
-        for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._WorkLocations = value
+            p._DesignLocations.discard(self)
+        self._WorkLocations = RefList()
+        self.addWorkLocations(value)
 
     WorkLocations = property(getWorkLocations, setWorkLocations)
 
     def addWorkLocations(self, *WorkLocations):
-        for obj in WorkLocations:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._WorkLocations.append(obj)
+        collection = self._WorkLocations
+        for obj in members(WorkLocations):
+            obj._DesignLocations.append(self)
+            collection.append(obj)
 
     def removeWorkLocations(self, *WorkLocations):
-        for obj in WorkLocations:
-            if self in obj._DesignLocations:
-                obj._DesignLocations.remove(self)
-            self._WorkLocations.remove(obj)
+        collection = self._WorkLocations
+        for obj in members(WorkLocations):
+            obj._DesignLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkLocations(self):
+        for obj in self._WorkLocations:
+            obj._DesignLocations.discard(self)
+        self._WorkLocations = RefList()
 
     def getDiagrams(self):
         
@@ -180,26 +209,28 @@ class DesignLocation(IdentifiedObject):
 
     def setDiagrams(self, value):
         for p in self._Diagrams:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._Diagrams._DesignLocations = filtered
-        for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._Diagrams = value
+            p._DesignLocations.discard(self)
+        self._Diagrams = RefList()
+        self.addDiagrams(value)
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
-        for obj in Diagrams:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._Diagrams.append(obj)
+        collection = self._Diagrams
+        for obj in members(Diagrams):
+            obj._DesignLocations.append(self)
+            collection.append(obj)
 
     def removeDiagrams(self, *Diagrams):
-        for obj in Diagrams:
-            if self in obj._DesignLocations:
-                obj._DesignLocations.remove(self)
-            self._Diagrams.remove(obj)
+        collection = self._Diagrams
+        for obj in members(Diagrams):
+            obj._DesignLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllDiagrams(self):
+        for obj in self._Diagrams:
+            obj._DesignLocations.discard(self)
+        self._Diagrams = RefList()
 
     def getMiscCostItems(self):
         
@@ -207,20 +238,32 @@ class DesignLocation(IdentifiedObject):
 
     def setMiscCostItems(self, value):
         for x in self._MiscCostItems:
-            x.DesignLocation = None
-        for y in value:
-            y._DesignLocation = self
-        self._MiscCostItems = value
+            x._DesignLocation = None
+        self._MiscCostItems = RefList()
+        self.addMiscCostItems(value)
 
     MiscCostItems = property(getMiscCostItems, setMiscCostItems)
 
     def addMiscCostItems(self, *MiscCostItems):
-        for obj in MiscCostItems:
-            obj.DesignLocation = self
+        collection = self._MiscCostItems
+        for obj in members(MiscCostItems):
+            old = obj._DesignLocation
+            if old is not None and old is not self:
+                old._MiscCostItems.discard(obj)
+            obj._DesignLocation = self
+            collection.append(obj)
 
     def removeMiscCostItems(self, *MiscCostItems):
-        for obj in MiscCostItems:
-            obj.DesignLocation = None
+        collection = self._MiscCostItems
+        for obj in members(MiscCostItems):
+            if obj._DesignLocation is self:
+                obj._DesignLocation = None
+                collection.discard(obj)
+
+    def removeAllMiscCostItems(self):
+        for obj in self._MiscCostItems:
+            obj._DesignLocation = None
+        self._MiscCostItems = RefList()
 
     def getErpBomItemDatas(self):
         
@@ -228,20 +271,32 @@ class DesignLocation(IdentifiedObject):
 
     def setErpBomItemDatas(self, value):
         for x in self._ErpBomItemDatas:
-            x.DesignLocation = None
-        for y in value:
-            y._DesignLocation = self
-        self._ErpBomItemDatas = value
+            x._DesignLocation = None
+        self._ErpBomItemDatas = RefList()
+        self.addErpBomItemDatas(value)
 
     ErpBomItemDatas = property(getErpBomItemDatas, setErpBomItemDatas)
 
     def addErpBomItemDatas(self, *ErpBomItemDatas):
-        for obj in ErpBomItemDatas:
-            obj.DesignLocation = self
+        collection = self._ErpBomItemDatas
+        for obj in members(ErpBomItemDatas):
+            old = obj._DesignLocation
+            if old is not None and old is not self:
+                old._ErpBomItemDatas.discard(obj)
+            obj._DesignLocation = self
+            collection.append(obj)
 
     def removeErpBomItemDatas(self, *ErpBomItemDatas):
-        for obj in ErpBomItemDatas:
-            obj.DesignLocation = None
+        collection = self._ErpBomItemDatas
+        for obj in members(ErpBomItemDatas):
+            if obj._DesignLocation is self:
+                obj._DesignLocation = None
+                collection.discard(obj)
+
+    def removeAllErpBomItemDatas(self):
+        for obj in self._ErpBomItemDatas:
+            obj._DesignLocation = None
+        self._ErpBomItemDatas = RefList()
 
     def getConditionFactors(self):
         
@@ -249,24 +304,26 @@ class DesignLocation(IdentifiedObject):
 
     def setConditionFactors(self, value):
         for p in self._ConditionFactors:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._ConditionFactors._DesignLocations = filtered
-        for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._ConditionFactors = value
+            p._DesignLocations.discard(self)
+        self._ConditionFactors = RefList()
+        self.addConditionFactors(value)
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
-        for obj in ConditionFactors:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._ConditionFactors.append(obj)
+        collection = self._ConditionFactors
+        for obj in members(ConditionFactors):
+            obj._DesignLocations.append(self)
+            collection.append(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
-        for obj in ConditionFactors:
-            if self in obj._DesignLocations:
-                obj._DesignLocations.remove(self)
-            self._ConditionFactors.remove(obj)
+        collection = self._ConditionFactors
+        for obj in members(ConditionFactors):
+            obj._DesignLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllConditionFactors(self):
+        for obj in self._ConditionFactors:
+            obj._DesignLocations.discard(self)
+        self._ConditionFactors = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class DesignLocationCU(IdentifiedObject):
     """Compatible unit at a given design location.Compatible unit at a given design location.
@@ -59,19 +60,19 @@ class DesignLocationCU(IdentifiedObject):
         #: The quantity of the CU being assigned to this location.
         self.cuQuantity = cuQuantity
 
-        self._ConditionFactors = []
+        self._ConditionFactors = RefList()
         self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
-        self._Designs = []
+        self._Designs = RefList()
         self.Designs = [] if Designs is None else Designs
 
-        self._CUGroups = []
+        self._CUGroups = RefList()
         self.CUGroups = [] if CUGroups is None else CUGroups
 
         self._DesignLocation = None
@@ -94,26 +95,28 @@ class DesignLocationCU(IdentifiedObject):
 
     def setConditionFactors(self, value):
         for p in self._ConditionFactors:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._ConditionFactors._DesignLocationCUs = filtered
-        for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._ConditionFactors = value
+            p._DesignLocationCUs.discard(self)
+        self._ConditionFactors = RefList()
+        self.addConditionFactors(value)
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
-        for obj in ConditionFactors:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._ConditionFactors.append(obj)
+        collection = self._ConditionFactors
+        for obj in members(ConditionFactors):
+            obj._DesignLocationCUs.append(self)
+            collection.append(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
-        for obj in ConditionFactors:
-            if self in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.remove(self)
-            self._ConditionFactors.remove(obj)
+        collection = self._ConditionFactors
+        for obj in members(ConditionFactors):
+            obj._DesignLocationCUs.discard(self)
+            collection.discard(obj)
+
+    def removeAllConditionFactors(self):
+        for obj in self._ConditionFactors:
+            obj._DesignLocationCUs.discard(self)
+        self._ConditionFactors = RefList()
 
     def getCompatibleUnits(self):
         
@@ -121,26 +124,28 @@ class DesignLocationCU(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._CompatibleUnits._DesignLocationCUs = filtered
-        for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._CompatibleUnits = value
+            p._DesignLocationCUs.discard(self)
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._CompatibleUnits.append(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._DesignLocationCUs.append(self)
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            if self in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.remove(self)
-            self._CompatibleUnits.remove(obj)
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            obj._DesignLocationCUs.discard(self)
+            collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._DesignLocationCUs.discard(self)
+        self._CompatibleUnits = RefList()
 
     def getWorkTasks(self):
         
@@ -148,26 +153,28 @@ class DesignLocationCU(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._WorkTasks._DesignLocationCUs = filtered
-        for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._WorkTasks = value
+            p._DesignLocationCUs.discard(self)
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._WorkTasks.append(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._DesignLocationCUs.append(self)
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.remove(self)
-            self._WorkTasks.remove(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._DesignLocationCUs.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._DesignLocationCUs.discard(self)
+        self._WorkTasks = RefList()
 
     def getDesigns(self):
         
@@ -175,26 +182,28 @@ class DesignLocationCU(IdentifiedObject):
 
     def setDesigns(self, value):
         for p in self._Designs:
-            filtered = [q for q in p.DesignLocationsCUs if q != self]
-            self._Designs._DesignLocationsCUs = filtered
-        for r in value:
-            if self not in r._DesignLocationsCUs:
-                r._DesignLocationsCUs.append(self)
-        self._Designs = value
+            p._DesignLocationsCUs.discard(self)
+        self._Designs = RefList()
+        self.addDesigns(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
-        for obj in Designs:
-            if self not in obj._DesignLocationsCUs:
-                obj._DesignLocationsCUs.append(self)
-            self._Designs.append(obj)
+        collection = self._Designs
+        for obj in members(Designs):
+            obj._DesignLocationsCUs.append(self)
+            collection.append(obj)
 
     def removeDesigns(self, *Designs):
-        for obj in Designs:
-            if self in obj._DesignLocationsCUs:
-                obj._DesignLocationsCUs.remove(self)
-            self._Designs.remove(obj)
+        collection = self._Designs
+        for obj in members(Designs):
+            obj._DesignLocationsCUs.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesigns(self):
+        for obj in self._Designs:
+            obj._DesignLocationsCUs.discard(self)
+        self._Designs = RefList()
 
     def getCUGroups(self):
         
@@ -202,26 +211,28 @@ class DesignLocationCU(IdentifiedObject):
 
     def setCUGroups(self, value):
         for p in self._CUGroups:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._CUGroups._DesignLocationCUs = filtered
-        for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._CUGroups = value
+            p._DesignLocationCUs.discard(self)
+        self._CUGroups = RefList()
+        self.addCUGroups(value)
 
     CUGroups = property(getCUGroups, setCUGroups)
 
     def addCUGroups(self, *CUGroups):
-        for obj in CUGroups:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._CUGroups.append(obj)
+        collection = self._CUGroups
+        for obj in members(CUGroups):
+            obj._DesignLocationCUs.append(self)
+            collection.append(obj)
 
     def removeCUGroups(self, *CUGroups):
-        for obj in CUGroups:
-            if self in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.remove(self)
-            self._CUGroups.remove(obj)
+        collection = self._CUGroups
+        for obj in members(CUGroups):
+            obj._DesignLocationCUs.discard(self)
+            collection.discard(obj)
+
+    def removeAllCUGroups(self):
+        for obj in self._CUGroups:
+            obj._DesignLocationCUs.discard(self)
+        self._CUGroups = RefList()
 
     def getDesignLocation(self):
         
@@ -229,8 +240,7 @@ class DesignLocationCU(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.DesignLocationCUs if x != self]
-            self._DesignLocation._DesignLocationCUs = filtered
+            self._DesignLocation._DesignLocationCUs.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
@@ -62,8 +62,7 @@ class EquipmentItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.EquipmentItems if x != self]
-            self._WorkTask._EquipmentItems = filtered
+            self._WorkTask._EquipmentItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -78,8 +77,7 @@ class EquipmentItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.EquipmentItems if x != self]
-            self._WorkCostDetail._EquipmentItems = filtered
+            self._WorkCostDetail._EquipmentItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfAssets.ProcedureDataSet import ProcedureDataSet
+from PyCIM.RefList import RefList, members
 
 class InspectionDataSet(ProcedureDataSet):
     """Documents the result of one inspection, a type of Procedure, for a given attribute of an asset.Documents the result of one inspection, a type of Procedure, for a given attribute of an asset.
@@ -33,7 +34,7 @@ class InspectionDataSet(ProcedureDataSet):
         #: Description of the conditions of the location where the asset resides.
         self.locationCondition = locationCondition
 
-        self._AccordingToSchedules = []
+        self._AccordingToSchedules = RefList()
         self.AccordingToSchedules = [] if AccordingToSchedules is None else AccordingToSchedules
 
         super(InspectionDataSet, self).__init__(*args, **kw_args)
@@ -51,18 +52,30 @@ class InspectionDataSet(ProcedureDataSet):
 
     def setAccordingToSchedules(self, value):
         for x in self._AccordingToSchedules:
-            x.ForInspectionDataSet = None
-        for y in value:
-            y._ForInspectionDataSet = self
-        self._AccordingToSchedules = value
+            x._ForInspectionDataSet = None
+        self._AccordingToSchedules = RefList()
+        self.addAccordingToSchedules(value)
 
     AccordingToSchedules = property(getAccordingToSchedules, setAccordingToSchedules)
 
     def addAccordingToSchedules(self, *AccordingToSchedules):
-        for obj in AccordingToSchedules:
-            obj.ForInspectionDataSet = self
+        collection = self._AccordingToSchedules
+        for obj in members(AccordingToSchedules):
+            old = obj._ForInspectionDataSet
+            if old is not None and old is not self:
+                old._AccordingToSchedules.discard(obj)
+            obj._ForInspectionDataSet = self
+            collection.append(obj)
 
     def removeAccordingToSchedules(self, *AccordingToSchedules):
-        for obj in AccordingToSchedules:
-            obj.ForInspectionDataSet = None
+        collection = self._AccordingToSchedules
+        for obj in members(AccordingToSchedules):
+            if obj._ForInspectionDataSet is self:
+                obj._ForInspectionDataSet = None
+                collection.discard(obj)
+
+    def removeAllAccordingToSchedules(self):
+        for obj in self._AccordingToSchedules:
+            obj._ForInspectionDataSet = None
+        self._AccordingToSchedules = RefList()
 
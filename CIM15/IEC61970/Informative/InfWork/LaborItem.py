@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class LaborItem(IdentifiedObject):
     """Labor used for work order.Labor used for work order.
@@ -48,7 +49,7 @@ class LaborItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._ErpPersons = []
+        self._ErpPersons = RefList()
         self.ErpPersons = [] if ErpPersons is None else ErpPersons
 
         self._WorkTask = None
@@ -74,26 +75,28 @@ class LaborItem(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.LaborItems if q != self]
-            self._ErpPersons._LaborItems = filtered
-        for r in value:
-            if self not in r._LaborItems:
-                r._LaborItems.append(self)
-        self._ErpPersons = value
+            p._LaborItems.discard(self)
+        self._ErpPersons = RefList()
+        self.addErpPersons(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self not in obj._LaborItems:
-                obj._LaborItems.append(self)
-            self._ErpPersons.append(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._LaborItems.append(self)
+            collection.append(obj)
 
     def removeErpPersons(self, *ErpPersons):
-        for obj in ErpPersons:
-            if self in obj._LaborItems:
-                obj._LaborItems.remove(self)
-            self._ErpPersons.remove(obj)
+        collection = self._ErpPersons
+        for obj in members(ErpPersons):
+            obj._LaborItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpPersons(self):
+        for obj in self._ErpPersons:
+            obj._LaborItems.discard(self)
+        self._ErpPersons = RefList()
 
     def getWorkTask(self):
         
@@ -101,8 +104,7 @@ class LaborItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.LaborItems if x != self]
-            self._WorkTask._LaborItems = filtered
+            self._WorkTask._LaborItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -119,8 +121,7 @@ class LaborItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.LaborItems if x != self]
-            self._WorkCostDetail._LaborItems = filtered
+            self._WorkCostDetail._LaborItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MaterialItem(IdentifiedObject):
     """The physical consumable supply used for work and other purposes. It includes items such as nuts, bolts, brackets, glue, etc.The physical consumable supply used for work and other purposes. It includes items such as nuts, bolts, brackets, glue, etc.
@@ -65,16 +66,16 @@ class MaterialItem(IdentifiedObject):
         #: The actual cost of this particular material in this particular quantity.
         self.actualCost = actualCost
 
-        self._ErpInventoryCounts = []
+        self._ErpInventoryCounts = RefList()
         self.ErpInventoryCounts = [] if ErpInventoryCounts is None else ErpInventoryCounts
 
-        self._Usages = []
+        self._Usages = RefList()
         self.Usages = [] if Usages is None else Usages
 
-        self._ErpPOLineItems = []
+        self._ErpPOLineItems = RefList()
         self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
 
-        self._ErpRecDelvLineItems = []
+        self._ErpRecDelvLineItems = RefList()
         self.ErpRecDelvLineItems = [] if ErpRecDelvLineItems is None else ErpRecDelvLineItems
 
         self._DesignLocation = None
@@ -106,20 +107,32 @@ class MaterialItem(IdentifiedObject):
 
     def setErpInventoryCounts(self, value):
         for x in self._ErpInventoryCounts:
-            x.MaterialItem = None
-        for y in value:
-            y._MaterialItem = self
-        self._ErpInventoryCounts = value
+            x._MaterialItem = None
+        self._ErpInventoryCounts = RefList()
+        self.addErpInventoryCounts(value)
 
     ErpInventoryCounts = property(getErpInventoryCounts, setErpInventoryCounts)
 
     def addErpInventoryCounts(self, *ErpInventoryCounts):
-        for obj in ErpInventoryCounts:
-            obj.MaterialItem = self
+        collection = self._ErpInventoryCounts
+        for obj in members(ErpInventoryCounts):
+            old = obj._MaterialItem
+            if old is not None and old is not self:
+                old._ErpInventoryCounts.discard(obj)
+            obj._MaterialItem = self
+            collection.append(obj)
 
     def removeErpInventoryCounts(self, *ErpInventoryCounts):
-        for obj in ErpInventoryCounts:
-            obj.MaterialItem = None
+        collection = self._ErpInventoryCounts
+        for obj in members(ErpInventoryCounts):
+            if obj._MaterialItem is self:
+                obj._MaterialItem = None
+                collection.discard(obj)
+
+    def removeAllErpInventoryCounts(self):
+        for obj in self._ErpInventoryCounts:
+            obj._MaterialItem = None
+        self._ErpInventoryCounts = RefList()
 
     def getUsages(self):
         
@@ -127,20 +140,32 @@ class MaterialItem(IdentifiedObject):
 
     def setUsages(self, value):
         for x in self._Usages:
-            x.MaterialItem = None
-        for y in value:
-            y._MaterialItem = self
-        self._Usages = value
+            x._MaterialItem = None
+        self._Usages = RefList()
+        self.addUsages(value)
 
     Usages = property(getUsages, setUsages)
 
     def addUsages(self, *Usages):
-        for obj in Usages:
-            obj.MaterialItem = self
+        collection = self._Usages
+        for obj in members(Usages):
+            old = obj._MaterialItem
+            if old is not None and old is not self:
+                old._Usages.discard(obj)
+            obj._MaterialItem = self
+            collection.append(obj)
 
     def removeUsages(self, *Usages):
-        for obj in Usages:
-            obj.MaterialItem = None
+        collection = self._Usages
+        for obj in members(Usages):
+            if obj._MaterialItem is self:
+                obj._MaterialItem = None
+                collection.discard(obj)
+
+    def removeAllUsages(self):
+        for obj in self._Usages:
+            obj._MaterialItem = None
+        self._Usages = RefList()
 
     def getErpPOLineItems(self):
         
@@ -148,20 +173,32 @@ class MaterialItem(IdentifiedObject):
 
     def setErpPOLineItems(self, value):
         for x in self._ErpPOLineItems:
-            x.MaterialItem = None
-        for y in value:
-            y._MaterialItem = self
-        self._ErpPOLineItems = value
+            x._MaterialItem = None
+        self._ErpPOLineItems = RefList()
+        self.addErpPOLineItems(value)
 
     ErpPOLineItems = property(getErpPOLineItems, setErpPOLineItems)
 
     def addErpPOLineItems(self, *ErpPOLineItems):
-        for obj in ErpPOLineItems:
-            obj.MaterialItem = self
+        collection = self._ErpPOLineItems
+        for obj in members(ErpPOLineItems):
+            old = obj._MaterialItem
+            if old is not None and old is not self:
+                old._ErpPOLineItems.discard(obj)
+            obj._MaterialItem = self
+            collection.append(obj)
 
     def removeErpPOLineItems(self, *ErpPOLineItems):
-        for obj in ErpPOLineItems:
-            obj.MaterialItem = None
+        collection = self._ErpPOLineItems
+        for obj in members(ErpPOLineItems):
+            if obj._MaterialItem is self:
+                obj._MaterialItem = None
+                collection.discard(obj)
+
+    def removeAllErpPOLineItems(self):
+        for obj in self._ErpPOLineItems:
+            obj._MaterialItem = None
+        self._ErpPOLineItems = RefList()
 
     def getErpRecDelvLineItems(self):
         
@@ -169,26 +206,28 @@ class MaterialItem(IdentifiedObject):
 
     def setErpRecDelvLineItems(self, value):
         for p in self._ErpRecDelvLineItems:
-            filtered = [q for q in p.MaterialItems if q != self]
-            self._ErpRecDelvLineItems._MaterialItems = filtered
-        for r in value:
-            if self not in r._MaterialItems:
-                r._MaterialItems.append(self)
-        self._ErpRecDelvLineItems = value
+            p._MaterialItems.discard(self)
+        self._ErpRecDelvLineItems = RefList()
+        self.addErpRecDelvLineItems(value)
 
     ErpRecDelvLineItems = property(getErpRecDelvLineItems, setErpRecDelvLineItems)
 
     def addErpRecDelvLineItems(self, *ErpRecDelvLineItems):
-        for obj in ErpRecDelvLineItems:
-            if self not in obj._MaterialItems:
-                obj._MaterialItems.append(self)
-            self._ErpRecDelvLineItems.append(obj)
+        collection = self._ErpRecDelvLineItems
+        for obj in members(ErpRecDelvLineItems):
+            obj._MaterialItems.append(self)
+            collection.append(obj)
 
     def removeErpRecDelvLineItems(self, *ErpRecDelvLineItems):
-        for obj in ErpRecDelvLineItems:
-            if self in obj._MaterialItems:
-                obj._MaterialItems.remove(self)
-            self._ErpRecDelvLineItems.remove(obj)
+        collection = self._ErpRecDelvLineItems
+        for obj in members(ErpRecDelvLineItems):
+            obj._MaterialItems.discard(self)
+            collection.discard(obj)
+
+    def removeAllErpRecDelvLineItems(self):
+        for obj in self._ErpRecDelvLineItems:
+            obj._MaterialItems.discard(self)
+        self._ErpRecDelvLineItems = RefList()
 
     def getDesignLocation(self):
         
@@ -196,8 +235,7 @@ class MaterialItem(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.MaterialItems if x != self]
-            self._DesignLocation._MaterialItems = filtered
+            self._DesignLocation._MaterialItems.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
@@ -214,8 +252,7 @@ class MaterialItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.MaterialItems if x != self]
-            self._TypeMaterial._MaterialItems = filtered
+            self._TypeMaterial._MaterialItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
@@ -230,8 +267,7 @@ class MaterialItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.MaterialItems if x != self]
-            self._WorkCostDetail._MaterialItems = filtered
+            self._WorkCostDetail._MaterialItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
@@ -246,8 +282,7 @@ class MaterialItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.MaterialItems if x != self]
-            self._WorkTask._MaterialItems = filtered
+            self._WorkTask._MaterialItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
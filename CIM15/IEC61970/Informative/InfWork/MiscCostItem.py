@@ -78,8 +78,7 @@ class MiscCostItem(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.MiscCostItems if x != self]
-            self._DesignLocation._MiscCostItems = filtered
+            self._DesignLocation._MiscCostItems.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
@@ -96,8 +95,7 @@ class MiscCostItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.MiscCostItems if x != self]
-            self._WorkTask._MiscCostItems = filtered
+            self._WorkTask._MiscCostItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -112,8 +110,7 @@ class MiscCostItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.MiscCostItems if x != self]
-            self._WorkCostDetail._MiscCostItems = filtered
+            self._WorkCostDetail._MiscCostItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class OneCallRequest(Document):
     """A request for other utilities to mark their underground facilities prior to commencement of construction and/or maintenance.A request for other utilities to mark their underground facilities prior to commencement of construction and/or maintenance.
@@ -41,7 +42,7 @@ class OneCallRequest(Document):
         #: Instructions for marking a dig area, if applicable.
         self.markingInstruction = markingInstruction
 
-        self._WorkLocations = []
+        self._WorkLocations = RefList()
         self.WorkLocations = [] if WorkLocations is None else WorkLocations
 
         super(OneCallRequest, self).__init__(*args, **kw_args)
@@ -59,18 +60,30 @@ class OneCallRequest(Document):
 
     def setWorkLocations(self, value):
         for x in self._WorkLocations:
-            x.OneCallRequest = None
-        for y in value:
-            y._OneCallRequest = self
-        self._WorkLocations = value
+            x._OneCallRequest = None
+        self._WorkLocations = RefList()
+        self.addWorkLocations(value)
 
     WorkLocations = property(getWorkLocations, setWorkLocations)
 
     def addWorkLocations(self, *WorkLocations):
-        for obj in WorkLocations:
-            obj.OneCallRequest = self
+        collection = self._WorkLocations
+        for obj in members(WorkLocations):
+            old = obj._OneCallRequest
+            if old is not None and old is not self:
+                old._WorkLocations.discard(obj)
+            obj._OneCallRequest = self
+            collection.append(obj)
 
     def removeWorkLocations(self, *WorkLocations):
-        for obj in WorkLocations:
-            obj.OneCallRequest = None
+        collection = self._WorkLocations
+        for obj in members(WorkLocations):
+            if obj._OneCallRequest is self:
+                obj._OneCallRequest = None
+                collection.discard(obj)
+
+    def removeAllWorkLocations(self):
+        for obj in self._WorkLocations:
+            obj._OneCallRequest = None
+        self._WorkLocations = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class OverheadCost(IdentifiedObject):
     """Overhead cost applied to work order.Overhead cost applied to work order.
@@ -41,10 +42,10 @@ class OverheadCost(IdentifiedObject):
 
         self.status = status
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
         super(OverheadCost, self).__init__(*args, **kw_args)
@@ -64,20 +65,32 @@ class OverheadCost(IdentifiedObject):
 
     def setWorkCostDetails(self, value):
         for x in self._WorkCostDetails:
-            x.OverheadCost = None
-        for y in value:
-            y._OverheadCost = self
-        self._WorkCostDetails = value
+            x._OverheadCost = None
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.OverheadCost = self
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            old = obj._OverheadCost
+            if old is not None and old is not self:
+                old._WorkCostDetails.discard(obj)
+            obj._OverheadCost = self
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.OverheadCost = None
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            if obj._OverheadCost is self:
+                obj._OverheadCost = None
+                collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._OverheadCost = None
+        self._WorkCostDetails = RefList()
 
     def getWorkTasks(self):
         
@@ -85,18 +98,30 @@ class OverheadCost(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for x in self._WorkTasks:
-            x.OverheadCost = None
-        for y in value:
-            y._OverheadCost = self
-        self._WorkTasks = value
+            x._OverheadCost = None
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.OverheadCost = self
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            old = obj._OverheadCost
+            if old is not None and old is not self:
+                old._WorkTasks.discard(obj)
+            obj._OverheadCost = self
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.OverheadCost = None
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            if obj._OverheadCost is self:
+                obj._OverheadCost = None
+                collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._OverheadCost = None
+        self._WorkTasks = RefList()
 
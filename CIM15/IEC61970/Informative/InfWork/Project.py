@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Project(Document):
     """A collection of related work. For construction projects and maintenance projects, multiple phases may be performed.A collection of related work. For construction projects and maintenance projects, multiple phases may be performed.
@@ -41,16 +42,16 @@ class Project(Document):
         self._BusinessCase = None
         self.BusinessCase = BusinessCase
 
-        self._SubProjects = []
+        self._SubProjects = RefList()
         self.SubProjects = [] if SubProjects is None else SubProjects
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
 
-        self._Requests = []
+        self._Requests = RefList()
         self.Requests = [] if Requests is None else Requests
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
         self._ParentProject = None
@@ -71,8 +72,7 @@ class Project(Document):
 
     def setBusinessCase(self, value):
         if self._BusinessCase is not None:
-            filtered = [x for x in self.BusinessCase.Projects if x != self]
-            self._BusinessCase._Projects = filtered
+            self._BusinessCase._Projects.discard(self)
 
         self._BusinessCase = value
         if self._BusinessCase is not None:
@@ -87,20 +87,32 @@ class Project(Document):
 
     def setSubProjects(self, value):
         for x in self._SubProjects:
-            x.ParentProject = None
-        for y in value:
-            y._ParentProject = self
-        self._SubProjects = value
+            x._ParentProject = None
+        self._SubProjects = RefList()
+        self.addSubProjects(value)
 
     SubProjects = property(getSubProjects, setSubProjects)
 
     def addSubProjects(self, *SubProjects):
-        for obj in SubProjects:
-            obj.ParentProject = self
+        collection = self._SubProjects
+        for obj in members(SubProjects):
+            old = obj._ParentProject
+            if old is not None and old is not self:
+                old._SubProjects.discard(obj)
+            obj._ParentProject = self
+            collection.append(obj)
 
     def removeSubProjects(self, *SubProjects):
-        for obj in SubProjects:
-            obj.ParentProject = None
+        collection = self._SubProjects
+        for obj in members(SubProjects):
+            if obj._ParentProject is self:
+                obj._ParentProject = None
+                collection.discard(obj)
+
+    def removeAllSubProjects(self):
+        for obj in self._SubProjects:
+            obj._ParentProject = None
+        self._SubProjects = RefList()
 
     def getErpProjectAccounting(self):
         
@@ -108,8 +120,7 @@ class Project(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.Projects if x != self]
-            self._ErpProjectAccounting._Projects = filtered
+            self._ErpProjectAccounting._Projects.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
@@ -124,26 +135,28 @@ class Project(Document):
 
     def setRequests(self, value):
         for p in self._Requests:
-            filtered = [q for q in p.Projects if q != self]
-            self._Requests._Projects = filtered
-        for r in value:
-            if self not in r._Projects:
-                r._Projects.append(self)
-        self._Requests = value
+            p._Projects.discard(self)
+        self._Requests = RefList()
+        self.addRequests(value)
 
     Requests = property(getRequests, setRequests)
 
     def addRequests(self, *Requests):
-        for obj in Requests:
-            if self not in obj._Projects:
-                obj._Projects.append(self)
-            self._Requests.append(obj)
+        collection = self._Requests
+        for obj in members(Requests):
+            obj._Projects.append(self)
+            collection.append(obj)
 
     def removeRequests(self, *Requests):
-        for obj in Requests:
-            if self in obj._Projects:
-                obj._Projects.remove(self)
-            self._Requests.remove(obj)
+        collection = self._Requests
+        for obj in members(Requests):
+            obj._Projects.discard(self)
+            collection.discard(obj)
+
+    def removeAllRequests(self):
+        for obj in self._Requests:
+            obj._Projects.discard(self)
+        self._Requests = RefList()
 
     def getWorks(self):
         
@@ -151,20 +164,32 @@ class Project(Document):
 
     def setWorks(self, value):
         for x in self._Works:
-            x.Project = None
-        for y in value:
-            y._Project = self
-        self._Works = value
+            x._Project = None
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            obj.Project = self
+        collection = self._Works
+        for obj in members(Works):
+            old = obj._Project
+            if old is not None and old is not self:
+                old._Works.discard(obj)
+            obj._Project = self
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            obj.Project = None
+        collection = self._Works
+        for obj in members(Works):
+            if obj._Project is self:
+                obj._Project = None
+                collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._Project = None
+        self._Works = RefList()
 
     def getParentProject(self):
         
@@ -172,8 +197,7 @@ class Project(Document):
 
     def setParentProject(self, value):
         if self._ParentProject is not None:
-            filtered = [x for x in self.ParentProject.SubProjects if x != self]
-            self._ParentProject._SubProjects = filtered
+            self._ParentProject._SubProjects.discard(self)
 
         self._ParentProject = value
         if self._ParentProject is not None:
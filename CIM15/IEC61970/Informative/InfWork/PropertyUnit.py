@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PropertyUnit(IdentifiedObject):
     """Unit of property for reporting purposes.Unit of property for reporting purposes.
@@ -46,13 +47,13 @@ class PropertyUnit(IdentifiedObject):
 
         self.status = status
 
-        self._CompatibleUnits = []
+        self._CompatibleUnits = RefList()
         self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
 
-        self._CUMaterialItems = []
+        self._CUMaterialItems = RefList()
         self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
         super(PropertyUnit, self).__init__(*args, **kw_args)
@@ -72,20 +73,32 @@ class PropertyUnit(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for x in self._CompatibleUnits:
-            x.PropertyUnit = None
-        for y in value:
-            y._PropertyUnit = self
-        self._CompatibleUnits = value
+            x._PropertyUnit = None
+        self._CompatibleUnits = RefList()
+        self.addCompatibleUnits(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.PropertyUnit = self
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            old = obj._PropertyUnit
+            if old is not None and old is not self:
+                old._CompatibleUnits.discard(obj)
+            obj._PropertyUnit = self
+            collection.append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
-        for obj in CompatibleUnits:
-            obj.PropertyUnit = None
+        collection = self._CompatibleUnits
+        for obj in members(CompatibleUnits):
+            if obj._PropertyUnit is self:
+                obj._PropertyUnit = None
+                collection.discard(obj)
+
+    def removeAllCompatibleUnits(self):
+        for obj in self._CompatibleUnits:
+            obj._PropertyUnit = None
+        self._CompatibleUnits = RefList()
 
     def getCUMaterialItems(self):
         
@@ -93,26 +106,28 @@ class PropertyUnit(IdentifiedObject):
 
     def setCUMaterialItems(self, value):
         for p in self._CUMaterialItems:
-            filtered = [q for q in p.PropertyUnits if q != self]
-            self._CUMaterialItems._PropertyUnits = filtered
-        for r in value:
-            if self not in r._PropertyUnits:
-                r._PropertyUnits.append(self)
-        self._CUMaterialItems = value
+            p._PropertyUnits.discard(self)
+        self._CUMaterialItems = RefList()
+        self.addCUMaterialItems(value)
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
-        for obj in CUMaterialItems:
-            if self not in obj._PropertyUnits:
-                obj._PropertyUnits.append(self)
-            self._CUMaterialItems.append(obj)
+        collection = self._CUMaterialItems
+        for obj in members(CUMaterialItems):
+            obj._PropertyUnits.append(self)
+            collection.append(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
-        for obj in CUMaterialItems:
-            if self in obj._PropertyUnits:
-                obj._PropertyUnits.remove(self)
-            self._CUMaterialItems.remove(obj)
+        collection = self._CUMaterialItems
+        for obj in members(CUMaterialItems):
+            obj._PropertyUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllCUMaterialItems(self):
+        for obj in self._CUMaterialItems:
+            obj._PropertyUnits.discard(self)
+        self._CUMaterialItems = RefList()
 
     def getWorkCostDetails(self):
         
@@ -120,24 +135,26 @@ class PropertyUnit(IdentifiedObject):
 
     def setWorkCostDetails(self, value):
         for p in self._WorkCostDetails:
-            filtered = [q for q in p.PropertyUnits if q != self]
-            self._WorkCostDetails._PropertyUnits = filtered
-        for r in value:
-            if self not in r._PropertyUnits:
-                r._PropertyUnits.append(self)
-        self._WorkCostDetails = value
+            p._PropertyUnits.discard(self)
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            if self not in obj._PropertyUnits:
-                obj._PropertyUnits.append(self)
-            self._WorkCostDetails.append(obj)
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            obj._PropertyUnits.append(self)
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            if self in obj._PropertyUnits:
-                obj._PropertyUnits.remove(self)
-            self._WorkCostDetails.remove(obj)
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            obj._PropertyUnits.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._PropertyUnits.discard(self)
+        self._WorkCostDetails = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class QualificationRequirement(IdentifiedObject):
     """Certain skills are required and must be certified in order for a person (typically a member of a crew) to be qualified to work on types of equipment.Certain skills are required and must be certified in order for a person (typically a member of a crew) to be qualified to work on types of equipment.
@@ -36,16 +37,16 @@ class QualificationRequirement(IdentifiedObject):
         #: Qualification identifier.
         self.qualificationID = qualificationID
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
-        self._Skills = []
+        self._Skills = RefList()
         self.Skills = [] if Skills is None else Skills
 
-        self._CULaborItems = []
+        self._CULaborItems = RefList()
         self.CULaborItems = [] if CULaborItems is None else CULaborItems
 
-        self._Specifications = []
+        self._Specifications = RefList()
         self.Specifications = [] if Specifications is None else Specifications
 
         super(QualificationRequirement, self).__init__(*args, **kw_args)
@@ -63,26 +64,28 @@ class QualificationRequirement(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._WorkTasks._QualificationRequirements = filtered
-        for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._WorkTasks = value
+            p._QualificationRequirements.discard(self)
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._WorkTasks.append(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._QualificationRequirements.append(self)
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            if self in obj._QualificationRequirements:
-                obj._QualificationRequirements.remove(self)
-            self._WorkTasks.remove(obj)
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            obj._QualificationRequirements.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._QualificationRequirements.discard(self)
+        self._WorkTasks = RefList()
 
     def getSkills(self):
         
@@ -90,26 +93,28 @@ class QualificationRequirement(IdentifiedObject):
 
     def setSkills(self, value):
         for p in self._Skills:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._Skills._QualificationRequirements = filtered
-        for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._Skills = value
+            p._QualificationRequirements.discard(self)
+        self._Skills = RefList()
+        self.addSkills(value)
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
-        for obj in Skills:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._Skills.append(obj)
+        collection = self._Skills
+        for obj in members(Skills):
+            obj._QualificationRequirements.append(self)
+            collection.append(obj)
 
     def removeSkills(self, *Skills):
-        for obj in Skills:
-            if self in obj._QualificationRequirements:
-                obj._QualificationRequirements.remove(self)
-            self._Skills.remove(obj)
+        collection = self._Skills
+        for obj in members(Skills):
+            obj._QualificationRequirements.discard(self)
+            collection.discard(obj)
+
+    def removeAllSkills(self):
+        for obj in self._Skills:
+            obj._QualificationRequirements.discard(self)
+        self._Skills = RefList()
 
     def getCULaborItems(self):
         
@@ -117,26 +122,28 @@ class QualificationRequirement(IdentifiedObject):
 
     def setCULaborItems(self, value):
         for p in self._CULaborItems:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._CULaborItems._QualificationRequirements = filtered
-        for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._CULaborItems = value
+            p._QualificationRequirements.discard(self)
+        self._CULaborItems = RefList()
+        self.addCULaborItems(value)
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
-        for obj in CULaborItems:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._CULaborItems.append(obj)
+        collection = self._CULaborItems
+        for obj in members(CULaborItems):
+            obj._QualificationRequirements.append(self)
+            collection.append(obj)
 
     def removeCULaborItems(self, *CULaborItems):
-        for obj in CULaborItems:
-            if self in obj._QualificationRequirements:
-                obj._QualificationRequirements.remove(self)
-            self._CULaborItems.remove(obj)
+        collection = self._CULaborItems
+        for obj in members(CULaborItems):
+            obj._QualificationRequirements.discard(self)
+            collection.discard(obj)
+
+    def removeAllCULaborItems(self):
+        for obj in self._CULaborItems:
+            obj._QualificationRequirements.discard(self)
+        self._CULaborItems = RefList()
 
     def getSpecifications(self):
         
@@ -144,24 +151,26 @@ class QualificationRequirement(IdentifiedObject):
 
     def setSpecifications(self, value):
         for p in self._Specifications:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._Specifications._QualificationRequirements = filtered
-        for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._Specifications = value
+            p._QualificationRequirements.discard(self)
+        self._Specifications = RefList()
+        self.addSpecifications(value)
 
     Specifications = property(getSpecifications, setSpecifications)
 
     def addSpecifications(self, *Specifications):
-        for obj in Specifications:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._Specifications.append(obj)
+        collection = self._Specifications
+        for obj in members(Specifications):
+            obj._QualificationRequirements.append(self)
+            collection.append(obj)
 
     def removeSpecifications(self, *Specifications):
-        for obj in Specifications:
-            if self in obj._QualificationRequirements:
-                obj._QualificationRequirements.remove(self)
-            self._Specifications.remove(obj)
+        collection = self._Specifications
+        for obj in members(Specifications):
+            obj._QualificationRequirements.discard(self)
+            collection.discard(obj)
+
+    def removeAllSpecifications(self):
+        for obj in self._Specifications:
+            obj._QualificationRequirements.discard(self)
+        self._Specifications = RefList()
 
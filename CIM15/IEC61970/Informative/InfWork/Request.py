@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class Request(Document):
     """A request for work, service or project.A request for work, service or project.
@@ -47,13 +48,13 @@ class Request(Document):
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
 
-        self._Projects = []
+        self._Projects = RefList()
         self.Projects = [] if Projects is None else Projects
 
         self._Organisation = None
         self.Organisation = Organisation
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
         super(Request, self).__init__(*args, **kw_args)
@@ -86,26 +87,28 @@ class Request(Document):
 
     def setProjects(self, value):
         for p in self._Projects:
-            filtered = [q for q in p.Requests if q != self]
-            self._Projects._Requests = filtered
-        for r in value:
-            if self not in r._Requests:
-                r._Requests.append(self)
-        self._Projects = value
+            p._Requests.discard(self)
+        self._Projects = RefList()
+        self.addProjects(value)
 
     Projects = property(getProjects, setProjects)
 
     def addProjects(self, *Projects):
-        for obj in Projects:
-            if self not in obj._Requests:
-                obj._Requests.append(self)
-            self._Projects.append(obj)
+        collection = self._Projects
+        for obj in members(Projects):
+            obj._Requests.append(self)
+            collection.append(obj)
 
     def removeProjects(self, *Projects):
-        for obj in Projects:
-            if self in obj._Requests:
-                obj._Requests.remove(self)
-            self._Projects.remove(obj)
+        collection = self._Projects
+        for obj in members(Projects):
+            obj._Requests.discard(self)
+            collection.discard(obj)
+
+    def removeAllProjects(self):
+        for obj in self._Projects:
+            obj._Requests.discard(self)
+        self._Projects = RefList()
 
     def getOrganisation(self):
         
@@ -113,8 +116,7 @@ class Request(Document):
 
     def setOrganisation(self, value):
         if self._Organisation is not None:
-            filtered = [x for x in self.Organisation.Requests if x != self]
-            self._Organisation._Requests = filtered
+            self._Organisation._Requests.discard(self)
 
         self._Organisation = value
         if self._Organisation is not None:
@@ -129,18 +131,30 @@ class Request(Document):
 
     def setWorks(self, value):
         for x in self._Works:
-            x.Request = None
-        for y in value:
-            y._Request = self
-        self._Works = value
+            x._Request = None
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            obj.Request = self
+        collection = self._Works
+        for obj in members(Works):
+            old = obj._Request
+            if old is not None and old is not self:
+                old._Works.discard(obj)
+            obj._Request = self
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            obj.Request = None
+        collection = self._Works
+        for obj in members(Works):
+            if obj._Request is self:
+                obj._Request = None
+                collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._Request = None
+        self._Works = RefList()
 
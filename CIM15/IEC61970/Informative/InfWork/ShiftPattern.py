@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ShiftPattern(IdentifiedObject):
     """The patterns of shifts worked by people or crews.The patterns of shifts worked by people or crews.
@@ -39,7 +40,7 @@ class ShiftPattern(IdentifiedObject):
         #: Type of assignement intended to be worked on this shift, for example, temporary, standard, etc.
         self.assignmentType = assignmentType
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
         self.status = status
@@ -61,26 +62,28 @@ class ShiftPattern(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.ShiftPatterns if q != self]
-            self._Crews._ShiftPatterns = filtered
-        for r in value:
-            if self not in r._ShiftPatterns:
-                r._ShiftPatterns.append(self)
-        self._Crews = value
+            p._ShiftPatterns.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._ShiftPatterns:
-                obj._ShiftPatterns.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._ShiftPatterns.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._ShiftPatterns:
-                obj._ShiftPatterns.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._ShiftPatterns.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._ShiftPatterns.discard(self)
+        self._Crews = RefList()
 
     status = None
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class TypeMaterial(Document):
     """Documentation for a generic material item that may be used for design, work and other purposes. Any number of MaterialItems manufactured by various vendors may be used to perform this TypeMaterial. Note that class analagous to 'AssetModel' is not used for material items. This is because in some cases, for example, a utility sets up a Master material record for a 3 inch long half inch diameter steel bolt and they do not necessarily care what specific supplier is providing the material item. As different vendors are used to supply the part, the Stock Code of the material item can stay the same. In other cases, each time the vendor changes, a new stock code is set up so they can track material used by vendor. Therefore a Material Item 'Model' is not typically needed.Documentation for a generic material item that may be used for design, work and other purposes. Any number of MaterialItems manufactured by various vendors may be used to perform this TypeMaterial. Note that class analagous to 'AssetModel' is not used for material items. This is because in some cases, for example, a utility sets up a Master material record for a 3 inch long half inch diameter steel bolt and they do not necessarily care what specific supplier is providing the material item. As different vendors are used to supply the part, the Stock Code of the material item can stay the same. In other cases, each time the vendor changes, a new stock code is set up so they can track material used by vendor. Therefore a Material Item 'Model' is not typically needed.
@@ -48,16 +49,16 @@ class TypeMaterial(Document):
         #: The estimated unit cost of this type of material, either for a unit cost or cost per unit length. Cost is for material or asset only and does not include labor to install/construct or configure it.
         self.estUnitCost = estUnitCost
 
-        self._ErpIssueInventories = []
+        self._ErpIssueInventories = RefList()
         self.ErpIssueInventories = [] if ErpIssueInventories is None else ErpIssueInventories
 
-        self._MaterialItems = []
+        self._MaterialItems = RefList()
         self.MaterialItems = [] if MaterialItems is None else MaterialItems
 
-        self._CUMaterialItems = []
+        self._CUMaterialItems = RefList()
         self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
 
-        self._ErpReqLineItems = []
+        self._ErpReqLineItems = RefList()
         self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
 
         super(TypeMaterial, self).__init__(*args, **kw_args)
@@ -75,20 +76,32 @@ class TypeMaterial(Document):
 
     def setErpIssueInventories(self, value):
         for x in self._ErpIssueInventories:
-            x.TypeMaterial = None
-        for y in value:
-            y._TypeMaterial = self
-        self._ErpIssueInventories = value
+            x._TypeMaterial = None
+        self._ErpIssueInventories = RefList()
+        self.addErpIssueInventories(value)
 
     ErpIssueInventories = property(getErpIssueInventories, setErpIssueInventories)
 
     def addErpIssueInventories(self, *ErpIssueInventories):
-        for obj in ErpIssueInventories:
-            obj.TypeMaterial = self
+        collection = self._ErpIssueInventories
+        for obj in members(ErpIssueInventories):
+            old = obj._TypeMaterial
+            if old is not None and old is not self:
+                old._ErpIssueInventories.discard(obj)
+            obj._TypeMaterial = self
+            collection.append(obj)
 
     def removeErpIssueInventories(self, *ErpIssueInventories):
-        for obj in ErpIssueInventories:
-            obj.TypeMaterial = None
+        collection = self._ErpIssueInventories
+        for obj in members(ErpIssueInventories):
+            if obj._TypeMaterial is self:
+                obj._TypeMaterial = None
+                collection.discard(obj)
+
+    def removeAllErpIssueInventories(self):
+        for obj in self._ErpIssueInventories:
+            obj._TypeMaterial = None
+        self._ErpIssueInventories = RefList()
 
     def getMaterialItems(self):
         
@@ -96,20 +109,32 @@ class TypeMaterial(Document):
 
     def setMaterialItems(self, value):
         for x in self._MaterialItems:
-            x.TypeMaterial = None
-        for y in value:
-            y._TypeMaterial = self
-        self._MaterialItems = value
+            x._TypeMaterial = None
+        self._MaterialItems = RefList()
+        self.addMaterialItems(value)
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.TypeMaterial = self
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            old = obj._TypeMaterial
+            if old is not None and old is not self:
+                old._MaterialItems.discard(obj)
+            obj._TypeMaterial = self
+            collection.append(obj)
 
     def removeMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.TypeMaterial = None
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            if obj._TypeMaterial is self:
+                obj._TypeMaterial = None
+                collection.discard(obj)
+
+    def removeAllMaterialItems(self):
+        for obj in self._MaterialItems:
+            obj._TypeMaterial = None
+        self._MaterialItems = RefList()
 
     def getCUMaterialItems(self):
         
@@ -117,20 +142,32 @@ class TypeMaterial(Document):
 
     def setCUMaterialItems(self, value):
         for x in self._CUMaterialItems:
-            x.TypeMaterial = None
-        for y in value:
-            y._TypeMaterial = self
-        self._CUMaterialItems = value
+            x._TypeMaterial = None
+        self._CUMaterialItems = RefList()
+        self.addCUMaterialItems(value)
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
-        for obj in CUMaterialItems:
-            obj.TypeMaterial = self
+        collection = self._CUMaterialItems
+        for obj in members(CUMaterialItems):
+            old = obj._TypeMaterial
+            if old is not None and old is not self:
+                old._CUMaterialItems.discard(obj)
+            obj._TypeMaterial = self
+            collection.append(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
-        for obj in CUMaterialItems:
-            obj.TypeMaterial = None
+        collection = self._CUMaterialItems
+        for obj in members(CUMaterialItems):
+            if obj._TypeMaterial is self:
+                obj._TypeMaterial = None
+                collection.discard(obj)
+
+    def removeAllCUMaterialItems(self):
+        for obj in self._CUMaterialItems:
+            obj._TypeMaterial = None
+        self._CUMaterialItems = RefList()
 
     def getErpReqLineItems(self):
         
@@ -138,18 +175,30 @@ class TypeMaterial(Document):
 
     def setErpReqLineItems(self, value):
         for x in self._ErpReqLineItems:
-            x.TypeMaterial = None
-        for y in value:
-            y._TypeMaterial = self
-        self._ErpReqLineItems = value
+            x._TypeMaterial = None
+        self._ErpReqLineItems = RefList()
+        self.addErpReqLineItems(value)
 
     ErpReqLineItems = property(getErpReqLineItems, setErpReqLineItems)
 
     def addErpReqLineItems(self, *ErpReqLineItems):
-        for obj in ErpReqLineItems:
-            obj.TypeMaterial = self
+        collection = self._ErpReqLineItems
+        for obj in members(ErpReqLineItems):
+            old = obj._TypeMaterial
+            if old is not None and old is not self:
+                old._ErpReqLineItems.discard(obj)
+            obj._TypeMaterial = self
+            collection.append(obj)
 
     def removeErpReqLineItems(self, *ErpReqLineItems):
-        for obj in ErpReqLineItems:
-            obj.TypeMaterial = None
+        collection = self._ErpReqLineItems
+        for obj in members(ErpReqLineItems):
+            if obj._TypeMaterial is self:
+                obj._TypeMaterial = None
+                collection.discard(obj)
+
+    def removeAllErpReqLineItems(self):
+        for obj in self._ErpReqLineItems:
+            obj._TypeMaterial = None
+        self._ErpReqLineItems = RefList()
 
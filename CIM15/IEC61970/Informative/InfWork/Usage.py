@@ -58,8 +58,7 @@ class Usage(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.Usages if x != self]
-            self._WorkTask._Usages = filtered
+            self._WorkTask._Usages.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -74,8 +73,7 @@ class Usage(IdentifiedObject):
 
     def setWorkEquipmentAsset(self, value):
         if self._WorkEquipmentAsset is not None:
-            filtered = [x for x in self.WorkEquipmentAsset.Usages if x != self]
-            self._WorkEquipmentAsset._Usages = filtered
+            self._WorkEquipmentAsset._Usages.discard(self)
 
         self._WorkEquipmentAsset = value
         if self._WorkEquipmentAsset is not None:
@@ -92,8 +90,7 @@ class Usage(IdentifiedObject):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.Usages if x != self]
-            self._MaterialItem._Usages = filtered
+            self._MaterialItem._Usages.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class WorkCostDetail(Document):
     """A collection of all of the individual cost items collected from multiple sources.A collection of all of the individual cost items collected from multiple sources.
@@ -60,34 +61,34 @@ class WorkCostDetail(Document):
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._Works = []
+        self._Works = RefList()
         self.Works = [] if Works is None else Works
 
         self._Design = None
         self.Design = Design
 
-        self._MiscCostItems = []
+        self._MiscCostItems = RefList()
         self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
 
         self._WorkCostSummary = None
         self.WorkCostSummary = WorkCostSummary
 
-        self._PropertyUnits = []
+        self._PropertyUnits = RefList()
         self.PropertyUnits = [] if PropertyUnits is None else PropertyUnits
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
 
-        self._LaborItems = []
+        self._LaborItems = RefList()
         self.LaborItems = [] if LaborItems is None else LaborItems
 
-        self._MaterialItems = []
+        self._MaterialItems = RefList()
         self.MaterialItems = [] if MaterialItems is None else MaterialItems
 
-        self._EquipmentItems = []
+        self._EquipmentItems = RefList()
         self.EquipmentItems = [] if EquipmentItems is None else EquipmentItems
 
-        self._ContractorItems = []
+        self._ContractorItems = RefList()
         self.ContractorItems = [] if ContractorItems is None else ContractorItems
 
         self._OverheadCost = None
@@ -111,8 +112,7 @@ class WorkCostDetail(Document):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.WorkCostDetails if x != self]
-            self._WorkTask._WorkCostDetails = filtered
+            self._WorkTask._WorkCostDetails.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
@@ -127,26 +127,28 @@ class WorkCostDetail(Document):
 
     def setWorks(self, value):
         for p in self._Works:
-            filtered = [q for q in p.WorkCostDetails if q != self]
-            self._Works._WorkCostDetails = filtered
-        for r in value:
-            if self not in r._WorkCostDetails:
-                r._WorkCostDetails.append(self)
-        self._Works = value
+            p._WorkCostDetails.discard(self)
+        self._Works = RefList()
+        self.addWorks(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
-        for obj in Works:
-            if self not in obj._WorkCostDetails:
-                obj._WorkCostDetails.append(self)
-            self._Works.append(obj)
+        collection = self._Works
+        for obj in members(Works):
+            obj._WorkCostDetails.append(self)
+            collection.append(obj)
 
     def removeWorks(self, *Works):
-        for obj in Works:
-            if self in obj._WorkCostDetails:
-                obj._WorkCostDetails.remove(self)
-            self._Works.remove(obj)
+        collection = self._Works
+        for obj in members(Works):
+            obj._WorkCostDetails.discard(self)
+            collection.discard(obj)
+
+    def removeAllWorks(self):
+        for obj in self._Works:
+            obj._WorkCostDetails.discard(self)
+        self._Works = RefList()
 
     def getDesign(self):
         
@@ -154,8 +156,7 @@ class WorkCostDetail(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.WorkCostDetails if x != self]
-            self._Design._WorkCostDetails = filtered
+            self._Design._WorkCostDetails.discard(self)
 
         self._Design = value
         if self._Design is not None:
@@ -170,20 +171,32 @@ class WorkCostDetail(Document):
 
     def setMiscCostItems(self, value):
         for x in self._MiscCostItems:
-            x.WorkCostDetail = None
-        for y in value:
-            y._WorkCostDetail = self
-        self._MiscCostItems = value
+            x._WorkCostDetail = None
+        self._MiscCostItems = RefList()
+        self.addMiscCostItems(value)
 
     MiscCostItems = property(getMiscCostItems, setMiscCostItems)
 
     def addMiscCostItems(self, *MiscCostItems):
-        for obj in MiscCostItems:
-            obj.WorkCostDetail = self
+        collection = self._MiscCostItems
+        for obj in members(MiscCostItems):
+            old = obj._WorkCostDetail
+            if old is not None and old is not self:
+                old._MiscCostItems.discard(obj)
+            obj._WorkCostDetail = self
+            collection.append(obj)
 
     def removeMiscCostItems(self, *MiscCostItems):
-        for obj in MiscCostItems:
-            obj.WorkCostDetail = None
+        collection = self._MiscCostItems
+        for obj in members(MiscCostItems):
+            if obj._WorkCostDetail is self:
+                obj._WorkCostDetail = None
+                collection.discard(obj)
+
+    def removeAllMiscCostItems(self):
+        for obj in self._MiscCostItems:
+            obj._WorkCostDetail = None
+        self._MiscCostItems = RefList()
 
     def getWorkCostSummary(self):
         
@@ -206,26 +219,28 @@ class WorkCostDetail(Document):
 
     def setPropertyUnits(self, value):
         for p in self._PropertyUnits:
-            filtered = [q for q in p.WorkCostDetails if q != self]
-            self._PropertyUnits._WorkCostDetails = filtered
-        for r in value:
-            if self not in r._WorkCostDetails:
-                r._WorkCostDetails.append(self)
-        self._PropertyUnits = value
+            p._WorkCostDetails.discard(self)
+        self._PropertyUnits = RefList()
+        self.addPropertyUnits(value)
 
     PropertyUnits = property(getPropertyUnits, setPropertyUnits)
 
     def addPropertyUnits(self, *PropertyUnits):
-        for obj in PropertyUnits:
-            if self not in obj._WorkCostDetails:
-                obj._WorkCostDetails.append(self)
-            self._PropertyUnits.append(obj)
+        collection = self._PropertyUnits
+        for obj in members(PropertyUnits):
+            obj._WorkCostDetails.append(self)
+            collection.append(obj)
 
     def removePropertyUnits(self, *PropertyUnits):
-        for obj in PropertyUnits:
-            if self in obj._WorkCostDetails:
-                obj._WorkCostDetails.remove(self)
-            self._PropertyUnits.remove(obj)
+        collection = self._PropertyUnits
+        for obj in members(PropertyUnits):
+            obj._WorkCostDetails.discard(self)
+            collection.discard(obj)
+
+    def removeAllPropertyUnits(self):
+        for obj in self._PropertyUnits:
+            obj._WorkCostDetails.discard(self)
+        self._PropertyUnits = RefList()
 
     def getErpProjectAccounting(self):
         
@@ -233,8 +248,7 @@ class WorkCostDetail(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.WorkCostDetails if x != self]
-            self._ErpProjectAccounting._WorkCostDetails = filtered
+            self._ErpProjectAccounting._WorkCostDetails.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
@@ -249,20 +263,32 @@ class WorkCostDetail(Document):
 
     def setLaborItems(self, value):
         for x in self._LaborItems:
-            x.WorkCostDetail = None
-        for y in value:
-            y._WorkCostDetail = self
-        self._LaborItems = value
+            x._WorkCostDetail = None
+        self._LaborItems = RefList()
+        self.addLaborItems(value)
 
     LaborItems = property(getLaborItems, setLaborItems)
 
     def addLaborItems(self, *LaborItems):
-        for obj in LaborItems:
-            obj.WorkCostDetail = self
+        collection = self._LaborItems
+        for obj in members(LaborItems):
+            old = obj._WorkCostDetail
+            if old is not None and old is not self:
+                old._LaborItems.discard(obj)
+            obj._WorkCostDetail = self
+            collection.append(obj)
 
     def removeLaborItems(self, *LaborItems):
-        for obj in LaborItems:
-            obj.WorkCostDetail = None
+        collection = self._LaborItems
+        for obj in members(LaborItems):
+            if obj._WorkCostDetail is self:
+                obj._WorkCostDetail = None
+                collection.discard(obj)
+
+    def removeAllLaborItems(self):
+        for obj in self._LaborItems:
+            obj._WorkCostDetail = None
+        self._LaborItems = RefList()
 
     def getMaterialItems(self):
         
@@ -270,20 +296,32 @@ class WorkCostDetail(Document):
 
     def setMaterialItems(self, value):
         for x in self._MaterialItems:
-            x.WorkCostDetail = None
-        for y in value:
-            y._WorkCostDetail = self
-        self._MaterialItems = value
+            x._WorkCostDetail = None
+        self._MaterialItems = RefList()
+        self.addMaterialItems(value)
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.WorkCostDetail = self
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            old = obj._WorkCostDetail
+            if old is not None and old is not self:
+                old._MaterialItems.discard(obj)
+            obj._WorkCostDetail = self
+            collection.append(obj)
 
     def removeMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.WorkCostDetail = None
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            if obj._WorkCostDetail is self:
+                obj._WorkCostDetail = None
+                collection.discard(obj)
+
+    def removeAllMaterialItems(self):
+        for obj in self._MaterialItems:
+            obj._WorkCostDetail = None
+        self._MaterialItems = RefList()
 
     def getEquipmentItems(self):
         
@@ -291,20 +329,32 @@ class WorkCostDetail(Document):
 
     def setEquipmentItems(self, value):
         for x in self._EquipmentItems:
-            x.WorkCostDetail = None
-        for y in value:
-            y._WorkCostDetail = self
-        self._EquipmentItems = value
+            x._WorkCostDetail = None
+        self._EquipmentItems = RefList()
+        self.addEquipmentItems(value)
 
     EquipmentItems = property(getEquipmentItems, setEquipmentItems)
 
     def addEquipmentItems(self, *EquipmentItems):
-        for obj in EquipmentItems:
-            obj.WorkCostDetail = self
+        collection = self._EquipmentItems
+        for obj in members(EquipmentItems):
+            old = obj._WorkCostDetail
+            if old is not None and old is not self:
+                old._EquipmentItems.discard(obj)
+            obj._WorkCostDetail = self
+            collection.append(obj)
 
     def removeEquipmentItems(self, *EquipmentItems):
-        for obj in EquipmentItems:
-            obj.WorkCostDetail = None
+        collection = self._EquipmentItems
+        for obj in members(EquipmentItems):
+            if obj._WorkCostDetail is self:
+                obj._WorkCostDetail = None
+                collection.discard(obj)
+
+    def removeAllEquipmentItems(self):
+        for obj in self._EquipmentItems:
+            obj._WorkCostDetail = None
+        self._EquipmentItems = RefList()
 
     def getContractorItems(self):
         
@@ -312,20 +362,32 @@ class WorkCostDetail(Document):
 
     def setContractorItems(self, value):
         for x in self._ContractorItems:
-            x.WorkCostDetail = None
-        for y in value:
-            y._WorkCostDetail = self
-        self._ContractorItems = value
+            x._WorkCostDetail = None
+        self._ContractorItems = RefList()
+        self.addContractorItems(value)
 
     ContractorItems = property(getContractorItems, setContractorItems)
 
     def addContractorItems(self, *ContractorItems):
-        for obj in ContractorItems:
-            obj.WorkCostDetail = self
+        collection = self._ContractorItems
+        for obj in members(ContractorItems):
+            old = obj._WorkCostDetail
+            if old is not None and old is not self:
+                old._ContractorItems.discard(obj)
+            obj._WorkCostDetail = self
+            collection.append(obj)
 
     def removeContractorItems(self, *ContractorItems):
-        for obj in ContractorItems:
-            obj.WorkCostDetail = None
+        collection = self._ContractorItems
+        for obj in members(ContractorItems):
+            if obj._WorkCostDetail is self:
+                obj._WorkCostDetail = None
+                collection.discard(obj)
+
+    def removeAllContractorItems(self):
+        for obj in self._ContractorItems:
+            obj._WorkCostDetail = None
+        self._ContractorItems = RefList()
 
     def getOverheadCost(self):
         
@@ -333,8 +395,7 @@ class WorkCostDetail(Document):
 
     def setOverheadCost(self, value):
         if self._OverheadCost is not None:
-            filtered = [x for x in self.OverheadCost.WorkCostDetails if x != self]
-            self._OverheadCost._WorkCostDetails = filtered
+            self._OverheadCost._WorkCostDetails.discard(self)
 
         self._OverheadCost = value
         if self._OverheadCost is not None:
@@ -349,8 +410,7 @@ class WorkCostDetail(Document):
 
     def setCostType(self, value):
         if self._CostType is not None:
-            filtered = [x for x in self.CostType.WorkCostDetails if x != self]
-            self._CostType._WorkCostDetails = filtered
+            self._CostType._WorkCostDetails.discard(self)
 
         self._CostType = value
         if self._CostType is not None:
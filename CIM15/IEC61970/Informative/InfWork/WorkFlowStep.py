@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class WorkFlowStep(IdentifiedObject):
     """A pre-defined set of work steps for a given type of work.A pre-defined set of work steps for a given type of work.
@@ -35,7 +36,7 @@ class WorkFlowStep(IdentifiedObject):
         #: Used to define dependencies of each work flow step, which is for the instance of WorkTask associated with a given instance of WorkFlow.
         self.sequenceNumber = sequenceNumber
 
-        self._WorkTasks = []
+        self._WorkTasks = RefList()
         self.WorkTasks = [] if WorkTasks is None else WorkTasks
 
         self.status = status
@@ -58,20 +59,32 @@ class WorkFlowStep(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for x in self._WorkTasks:
-            x.WorkFlowStep = None
-        for y in value:
-            y._WorkFlowStep = self
-        self._WorkTasks = value
+            x._WorkFlowStep = None
+        self._WorkTasks = RefList()
+        self.addWorkTasks(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.WorkFlowStep = self
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            old = obj._WorkFlowStep
+            if old is not None and old is not self:
+                old._WorkTasks.discard(obj)
+            obj._WorkFlowStep = self
+            collection.append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
-        for obj in WorkTasks:
-            obj.WorkFlowStep = None
+        collection = self._WorkTasks
+        for obj in members(WorkTasks):
+            if obj._WorkFlowStep is self:
+                obj._WorkFlowStep = None
+                collection.discard(obj)
+
+    def removeAllWorkTasks(self):
+        for obj in self._WorkTasks:
+            obj._WorkFlowStep = None
+        self._WorkTasks = RefList()
 
     status = None
 
@@ -81,8 +94,7 @@ class WorkFlowStep(IdentifiedObject):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.WorkFlowSteps if x != self]
-            self._Work._WorkFlowSteps = filtered
+            self._Work._WorkFlowSteps.discard(self)
 
         self._Work = value
         if self._Work is not None:
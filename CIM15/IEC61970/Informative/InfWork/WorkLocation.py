@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Location import Location
+from PyCIM.RefList import RefList, members
 
 class WorkLocation(Location):
     """Information about a particular location for various forms of work such as a one call request.Information about a particular location for various forms of work such as a one call request.
@@ -49,7 +50,7 @@ class WorkLocation(Location):
         self._OneCallRequest = None
         self.OneCallRequest = OneCallRequest
 
-        self._DesignLocations = []
+        self._DesignLocations = RefList()
         self.DesignLocations = [] if DesignLocations is None else DesignLocations
 
         super(WorkLocation, self).__init__(*args, **kw_args)
@@ -67,8 +68,7 @@ class WorkLocation(Location):
 
     def setOneCallRequest(self, value):
         if self._OneCallRequest is not None:
-            filtered = [x for x in self.OneCallRequest.WorkLocations if x != self]
-            self._OneCallRequest._WorkLocations = filtered
+            self._OneCallRequest._WorkLocations.discard(self)
 
         self._OneCallRequest = value
         if self._OneCallRequest is not None:
@@ -83,24 +83,26 @@ class WorkLocation(Location):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.WorkLocations if q != self]
-            self._DesignLocations._WorkLocations = filtered
-        for r in value:
-            if self not in r._WorkLocations:
-                r._WorkLocations.append(self)
-        self._DesignLocations = value
+            p._WorkLocations.discard(self)
+        self._DesignLocations = RefList()
+        self.addDesignLocations(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self not in obj._WorkLocations:
-                obj._WorkLocations.append(self)
-            self._DesignLocations.append(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._WorkLocations.append(self)
+            collection.append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
-        for obj in DesignLocations:
-            if self in obj._WorkLocations:
-                obj._WorkLocations.remove(self)
-            self._DesignLocations.remove(obj)
+        collection = self._DesignLocations
+        for obj in members(DesignLocations):
+            obj._WorkLocations.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocations(self):
+        for obj in self._DesignLocations:
+            obj._WorkLocations.discard(self)
+        self._DesignLocations = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from PyCIM.RefList import RefList, members
 
 class WorkTask(Document):
     """A set of tasks is required to implement a design.A set of tasks is required to implement a design.
@@ -53,16 +54,16 @@ class WorkTask(Document):
         #: If specified, override schedule and perform this task in accordance with instructions specified here.
         self.schedOverride = schedOverride
 
-        self._EquipmentItems = []
+        self._EquipmentItems = RefList()
         self.EquipmentItems = [] if EquipmentItems is None else EquipmentItems
 
-        self._Usages = []
+        self._Usages = RefList()
         self.Usages = [] if Usages is None else Usages
 
-        self._MiscCostItems = []
+        self._MiscCostItems = RefList()
         self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
 
-        self._Crews = []
+        self._Crews = RefList()
         self.Crews = [] if Crews is None else Crews
 
         self._Work = None
@@ -71,13 +72,13 @@ class WorkTask(Document):
         self._OverheadCost = None
         self.OverheadCost = OverheadCost
 
-        self._DesignLocationCUs = []
+        self._DesignLocationCUs = RefList()
         self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
 
-        self._ContractorItems = []
+        self._ContractorItems = RefList()
         self.ContractorItems = [] if ContractorItems is None else ContractorItems
 
-        self._SwitchingSchedules = []
+        self._SwitchingSchedules = RefList()
         self.SwitchingSchedules = [] if SwitchingSchedules is None else SwitchingSchedules
 
         self._WorkFlowStep = None
@@ -86,22 +87,22 @@ class WorkTask(Document):
         self._Design = None
         self.Design = Design
 
-        self._QualificationRequirements = []
+        self._QualificationRequirements = RefList()
         self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
 
-        self._Capabilities = []
+        self._Capabilities = RefList()
         self.Capabilities = [] if Capabilities is None else Capabilities
 
-        self._WorkCostDetails = []
+        self._WorkCostDetails = RefList()
         self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
 
-        self._Assets = []
+        self._Assets = RefList()
         self.Assets = [] if Assets is None else Assets
 
-        self._LaborItems = []
+        self._LaborItems = RefList()
         self.LaborItems = [] if LaborItems is None else LaborItems
 
-        self._MaterialItems = []
+        self._MaterialItems = RefList()
         self.MaterialItems = [] if MaterialItems is None else MaterialItems
 
         super(WorkTask, self).__init__(*args, **kw_args)
@@ -119,20 +120,32 @@ class WorkTask(Document):
 
     def setEquipmentItems(self, value):
         for x in self._EquipmentItems:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._EquipmentItems = value
+            x._WorkTask = None
+        self._EquipmentItems = RefList()
+        self.addEquipmentItems(value)
 
     EquipmentItems = property(getEquipmentItems, setEquipmentItems)
 
     def addEquipmentItems(self, *EquipmentItems):
-        for obj in EquipmentItems:
-            obj.WorkTask = self
+        collection = self._EquipmentItems
+        for obj in members(EquipmentItems):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._EquipmentItems.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeEquipmentItems(self, *EquipmentItems):
-        for obj in EquipmentItems:
-            obj.WorkTask = None
+        collection = self._EquipmentItems
+        for obj in members(EquipmentItems):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllEquipmentItems(self):
+        for obj in self._EquipmentItems:
+            obj._WorkTask = None
+        self._EquipmentItems = RefList()
 
     def getUsages(self):
         
@@ -140,20 +153,32 @@ class WorkTask(Document):
 
     def setUsages(self, value):
         for x in self._Usages:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._Usages = value
+            x._WorkTask = None
+        self._Usages = RefList()
+        self.addUsages(value)
 
     Usages = property(getUsages, setUsages)
 
     def addUsages(self, *Usages):
-        for obj in Usages:
-            obj.WorkTask = self
+        collection = self._Usages
+        for obj in members(Usages):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._Usages.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeUsages(self, *Usages):
-        for obj in Usages:
-            obj.WorkTask = None
+        collection = self._Usages
+        for obj in members(Usages):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllUsages(self):
+        for obj in self._Usages:
+            obj._WorkTask = None
+        self._Usages = RefList()
 
     def getMiscCostItems(self):
         
@@ -161,20 +186,32 @@ class WorkTask(Document):
 
     def setMiscCostItems(self, value):
         for x in self._MiscCostItems:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._MiscCostItems = value
+            x._WorkTask = None
+        self._MiscCostItems = RefList()
+        self.addMiscCostItems(value)
 
     MiscCostItems = property(getMiscCostItems, setMiscCostItems)
 
     def addMiscCostItems(self, *MiscCostItems):
-        for obj in MiscCostItems:
-            obj.WorkTask = self
+        collection = self._MiscCostItems
+        for obj in members(MiscCostItems):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._MiscCostItems.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeMiscCostItems(self, *MiscCostItems):
-        for obj in MiscCostItems:
-            obj.WorkTask = None
+        collection = self._MiscCostItems
+        for obj in members(MiscCostItems):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllMiscCostItems(self):
+        for obj in self._MiscCostItems:
+            obj._WorkTask = None
+        self._MiscCostItems = RefList()
 
     def getCrews(self):
         """All Crews participating in this WorkTask.
@@ -183,26 +220,28 @@ class WorkTask(Document):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._Crews._WorkTasks = filtered
-        for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._Crews = value
+            p._WorkTasks.discard(self)
+        self._Crews = RefList()
+        self.addCrews(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
-        for obj in Crews:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._Crews.append(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._WorkTasks.append(self)
+            collection.append(obj)
 
     def removeCrews(self, *Crews):
-        for obj in Crews:
-            if self in obj._WorkTasks:
-                obj._WorkTasks.remove(self)
-            self._Crews.remove(obj)
+        collection = self._Crews
+        for obj in members(Crews):
+            obj._WorkTasks.discard(self)
+            collection.discard(obj)
+
+    def removeAllCrews(self):
+        for obj in self._Crews:
+            obj._WorkTasks.discard(self)
+        self._Crews = RefList()
 
     def getWork(self):
         
@@ -210,8 +249,7 @@ class WorkTask(Document):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.WorkTasks if x != self]
-            self._Work._WorkTasks = filtered
+            self._Work._WorkTasks.discard(self)
 
         self._Work = value
         if self._Work is not None:
@@ -226,8 +264,7 @@ class WorkTask(Document):
 
     def setOverheadCost(self, value):
         if self._OverheadCost is not None:
-            filtered = [x for x in self.OverheadCost.WorkTasks if x != self]
-            self._OverheadCost._WorkTasks = filtered
+            self._OverheadCost._WorkTasks.discard(self)
 
         self._OverheadCost = value
         if self._OverheadCost is not None:
@@ -242,26 +279,28 @@ class WorkTask(Document):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._DesignLocationCUs._WorkTasks = filtered
-        for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._DesignLocationCUs = value
+            p._WorkTasks.discard(self)
+        self._DesignLocationCUs = RefList()
+        self.addDesignLocationCUs(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._DesignLocationCUs.append(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._WorkTasks.append(self)
+            collection.append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
-        for obj in DesignLocationCUs:
-            if self in obj._WorkTasks:
-                obj._WorkTasks.remove(self)
-            self._DesignLocationCUs.remove(obj)
+        collection = self._DesignLocationCUs
+        for obj in members(DesignLocationCUs):
+            obj._WorkTasks.discard(self)
+            collection.discard(obj)
+
+    def removeAllDesignLocationCUs(self):
+        for obj in self._DesignLocationCUs:
+            obj._WorkTasks.discard(self)
+        self._DesignLocationCUs = RefList()
 
     def getContractorItems(self):
         
@@ -269,20 +308,32 @@ class WorkTask(Document):
 
     def setContractorItems(self, value):
         for x in self._ContractorItems:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._ContractorItems = value
+            x._WorkTask = None
+        self._ContractorItems = RefList()
+        self.addContractorItems(value)
 
     ContractorItems = property(getContractorItems, setContractorItems)
 
     def addContractorItems(self, *ContractorItems):
-        for obj in ContractorItems:
-            obj.WorkTask = self
+        collection = self._ContractorItems
+        for obj in members(ContractorItems):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._ContractorItems.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeContractorItems(self, *ContractorItems):
-        for obj in ContractorItems:
-            obj.WorkTask = None
+        collection = self._ContractorItems
+        for obj in members(ContractorItems):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllContractorItems(self):
+        for obj in self._ContractorItems:
+            obj._WorkTask = None
+        self._ContractorItems = RefList()
 
     def getSwitchingSchedules(self):
         
@@ -290,20 +341,32 @@ class WorkTask(Document):
 
     def setSwitchingSchedules(self, value):
         for x in self._SwitchingSchedules:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._SwitchingSchedules = value
+            x._WorkTask = None
+        self._SwitchingSchedules = RefList()
+        self.addSwitchingSchedules(value)
 
     SwitchingSchedules = property(getSwitchingSchedules, setSwitchingSchedules)
 
     def addSwitchingSchedules(self, *SwitchingSchedules):
-        for obj in SwitchingSchedules:
-            obj.WorkTask = self
+        collection = self._SwitchingSchedules
+        for obj in members(SwitchingSchedules):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._SwitchingSchedules.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeSwitchingSchedules(self, *SwitchingSchedules):
-        for obj in SwitchingSchedules:
-            obj.WorkTask = None
+        collection = self._SwitchingSchedules
+        for obj in members(SwitchingSchedules):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllSwitchingSchedules(self):
+        for obj in self._SwitchingSchedules:
+            obj._WorkTask = None
+        self._SwitchingSchedules = RefList()
 
     def getWorkFlowStep(self):
         
@@ -311,8 +374,7 @@ class WorkTask(Document):
 
     def setWorkFlowStep(self, value):
         if self._WorkFlowStep is not None:
-            filtered = [x for x in self.WorkFlowStep.WorkTasks if x != self]
-            self._WorkFlowStep._WorkTasks = filtered
+            self._WorkFlowStep._WorkTasks.discard(self)
 
         self._WorkFlowStep = value
         if self._WorkFlowStep is not None:
@@ -327,8 +389,7 @@ class WorkTask(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.WorkTasks if x != self]
-            self._Design._WorkTasks = filtered
+            self._Design._WorkTasks.discard(self)
 
         self._Design = value
         if self._Design is not None:
@@ -343,26 +404,28 @@ class WorkTask(Document):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._QualificationRequirements._WorkTasks = filtered
-        for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._QualificationRequirements = value
+            p._WorkTasks.discard(self)
+        self._QualificationRequirements = RefList()
+        self.addQualificationRequirements(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._QualificationRequirements.append(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._WorkTasks.append(self)
+            collection.append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
-        for obj in QualificationRequirements:
-            if self in obj._WorkTasks:
-                obj._WorkTasks.remove(self)
-            self._QualificationRequirements.remove(obj)
+        collection = self._QualificationRequirements
+        for obj in members(QualificationRequirements):
+            obj._WorkTasks.discard(self)
+            collection.discard(obj)
+
+    def removeAllQualificationRequirements(self):
+        for obj in self._QualificationRequirements:
+            obj._WorkTasks.discard(self)
+        self._QualificationRequirements = RefList()
 
     def getCapabilities(self):
         
@@ -370,26 +433,28 @@ class WorkTask(Document):
 
     def setCapabilities(self, value):
         for p in self._Capabilities:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._Capabilities._WorkTasks = filtered
-        for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._Capabilities = value
+            p._WorkTasks.discard(self)
+        self._Capabilities = RefList()
+        self.addCapabilities(value)
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
-        for obj in Capabilities:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._Capabilities.append(obj)
+        collection = self._Capabilities
+        for obj in members(Capabilities):
+            obj._WorkTasks.append(self)
+            collection.append(obj)
 
     def removeCapabilities(self, *Capabilities):
-        for obj in Capabilities:
-            if self in obj._WorkTasks:
-                obj._WorkTasks.remove(self)
-            self._Capabilities.remove(obj)
+        collection = self._Capabilities
+        for obj in members(Capabilities):
+            obj._WorkTasks.discard(self)
+            collection.discard(obj)
+
+    def removeAllCapabilities(self):
+        for obj in self._Capabilities:
+            obj._WorkTasks.discard(self)
+        self._Capabilities = RefList()
 
     def getWorkCostDetails(self):
         
@@ -397,20 +462,32 @@ class WorkTask(Document):
 
     def setWorkCostDetails(self, value):
         for x in self._WorkCostDetails:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._WorkCostDetails = value
+            x._WorkTask = None
+        self._WorkCostDetails = RefList()
+        self.addWorkCostDetails(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.WorkTask = self
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._WorkCostDetails.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
-        for obj in WorkCostDetails:
-            obj.WorkTask = None
+        collection = self._WorkCostDetails
+        for obj in members(WorkCostDetails):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllWorkCostDetails(self):
+        for obj in self._WorkCostDetails:
+            obj._WorkTask = None
+        self._WorkCostDetails = RefList()
 
     def getAssets(self):
         
@@ -418,20 +495,32 @@ class WorkTask(Document):
 
     def setAssets(self, value):
         for x in self._Assets:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._Assets = value
+            x._WorkTask = None
+        self._Assets = RefList()
+        self.addAssets(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
-        for obj in Assets:
-            obj.WorkTask = self
+        collection = self._Assets
+        for obj in members(Assets):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._Assets.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeAssets(self, *Assets):
-        for obj in Assets:
-            obj.WorkTask = None
+        collection = self._Assets
+        for obj in members(Assets):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllAssets(self):
+        for obj in self._Assets:
+            obj._WorkTask = None
+        self._Assets = RefList()
 
     def getLaborItems(self):
         
@@ -439,20 +528,32 @@ class WorkTask(Document):
 
     def setLaborItems(self, value):
         for x in self._LaborItems:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._LaborItems = value
+            x._WorkTask = None
+        self._LaborItems = RefList()
+        self.addLaborItems(value)
 
     LaborItems = property(getLaborItems, setLaborItems)
 
     def addLaborItems(self, *LaborItems):
-        for obj in LaborItems:
-            obj.WorkTask = self
+        collection = self._LaborItems
+        for obj in members(LaborItems):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._LaborItems.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeLaborItems(self, *LaborItems):
-        for obj in LaborItems:
-            obj.WorkTask = None
+        collection = self._LaborItems
+        for obj in members(LaborItems):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllLaborItems(self):
+        for obj in self._LaborItems:
+            obj._WorkTask = None
+        self._LaborItems = RefList()
 
     def getMaterialItems(self):
         
@@ -460,18 +561,30 @@ class WorkTask(Document):
 
     def setMaterialItems(self, value):
         for x in self._MaterialItems:
-            x.WorkTask = None
-        for y in value:
-            y._WorkTask = self
-        self._MaterialItems = value
+            x._WorkTask = None
+        self._MaterialItems = RefList()
+        self.addMaterialItems(value)
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.WorkTask = self
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            old = obj._WorkTask
+            if old is not None and old is not self:
+                old._MaterialItems.discard(obj)
+            obj._WorkTask = self
+            collection.append(obj)
 
     def removeMaterialItems(self, *MaterialItems):
-        for obj in MaterialItems:
-            obj.WorkTask = None
+        collection = self._MaterialItems
+        for obj in members(MaterialItems):
+            if obj._WorkTask is self:
+                obj._WorkTask = None
+                collection.discard(obj)
+
+    def removeAllMaterialItems(self):
+        for obj in self._MaterialItems:
+            obj._WorkTask = None
+        self._MaterialItems = RefList()
 
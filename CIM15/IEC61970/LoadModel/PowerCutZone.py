@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class PowerCutZone(PowerSystemResource):
     """An area or zone of the power system which is used for load shedding purposes.An area or zone of the power system which is used for load shedding purposes.
@@ -37,7 +38,7 @@ class PowerCutZone(PowerSystemResource):
         #: First level (amount) of load to cut as a percentage of total zone load
         self.cutLevel1 = cutLevel1
 
-        self._EnergyConsumers = []
+        self._EnergyConsumers = RefList()
         self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
 
         super(PowerCutZone, self).__init__(*args, **kw_args)
@@ -56,18 +57,30 @@ class PowerCutZone(PowerSystemResource):
 
     def setEnergyConsumers(self, value):
         for x in self._EnergyConsumers:
-            x.PowerCutZone = None
-        for y in value:
-            y._PowerCutZone = self
-        self._EnergyConsumers = value
+            x._PowerCutZone = None
+        self._EnergyConsumers = RefList()
+        self.addEnergyConsumers(value)
 
     EnergyConsumers = property(getEnergyConsumers, setEnergyConsumers)
 
     def addEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.PowerCutZone = self
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            old = obj._PowerCutZone
+            if old is not None and old is not self:
+                old._EnergyConsumers.discard(obj)
+            obj._PowerCutZone = self
+            collection.append(obj)
 
     def removeEnergyConsumers(self, *EnergyConsumers):
-        for obj in EnergyConsumers:
-            obj.PowerCutZone = None
+        collection = self._EnergyConsumers
+        for obj in members(EnergyConsumers):
+            if obj._PowerCutZone is self:
+                obj._PowerCutZone = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumers(self):
+        for obj in self._EnergyConsumers:
+            obj._PowerCutZone = None
+        self._EnergyConsumers = RefList()
 
@@ -52,8 +52,7 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
 
     def setSeason(self, value):
         if self._Season is not None:
-            filtered = [x for x in self.Season.SeasonDayTypeSchedules if x != self]
-            self._Season._SeasonDayTypeSchedules = filtered
+            self._Season._SeasonDayTypeSchedules.discard(self)
 
         self._Season = value
         if self._Season is not None:
@@ -69,8 +68,7 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
 
     def setDayType(self, value):
         if self._DayType is not None:
-            filtered = [x for x in self.DayType.SeasonDayTypeSchedules if x != self]
-            self._DayType._SeasonDayTypeSchedules = filtered
+            self._DayType._SeasonDayTypeSchedules.discard(self)
 
         self._DayType = value
         if self._DayType is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class Accumulator(Measurement):
     """Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.
@@ -34,10 +35,10 @@ class Accumulator(Measurement):
         #: Normal value range maximum for any of the MeasurementValue.values. Used for scaling, e.g. in bar graphs or of telemetered raw values.
         self.maxValue = maxValue
 
-        self._LimitSets = []
+        self._LimitSets = RefList()
         self.LimitSets = [] if LimitSets is None else LimitSets
 
-        self._AccumulatorValues = []
+        self._AccumulatorValues = RefList()
         self.AccumulatorValues = [] if AccumulatorValues is None else AccumulatorValues
 
         super(Accumulator, self).__init__(*args, **kw_args)
@@ -56,26 +57,28 @@ class Accumulator(Measurement):
 
     def setLimitSets(self, value):
         for p in self._LimitSets:
-            filtered = [q for q in p.Measurements if q != self]
-            self._LimitSets._Measurements = filtered
-        for r in value:
-            if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._LimitSets = value
+            p._Measurements.discard(self)
+        self._LimitSets = RefList()
+        self.addLimitSets(value)
 
     LimitSets = property(getLimitSets, setLimitSets)
 
     def addLimitSets(self, *LimitSets):
-        for obj in LimitSets:
-            if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._LimitSets.append(obj)
+        collection = self._LimitSets
+        for obj in members(LimitSets):
+            obj._Measurements.append(self)
+            collection.append(obj)
 
     def removeLimitSets(self, *LimitSets):
-        for obj in LimitSets:
-            if self in obj._Measurements:
-                obj._Measurements.remove(self)
-            self._LimitSets.remove(obj)
+        collection = self._LimitSets
+        for obj in members(LimitSets):
+            obj._Measurements.discard(self)
+            collection.discard(obj)
+
+    def removeAllLimitSets(self):
+        for obj in self._LimitSets:
+            obj._Measurements.discard(self)
+        self._LimitSets = RefList()
 
     def getAccumulatorValues(self):
         """The values connected to this measurement.
@@ -84,18 +87,30 @@ class Accumulator(Measurement):
 
     def setAccumulatorValues(self, value):
         for x in self._AccumulatorValues:
-            x.Accumulator = None
-        for y in value:
-            y._Accumulator = self
-        self._AccumulatorValues = value
+            x._Accumulator = None
+        self._AccumulatorValues = RefList()
+        self.addAccumulatorValues(value)
 
     AccumulatorValues = property(getAccumulatorValues, setAccumulatorValues)
 
     def addAccumulatorValues(self, *AccumulatorValues):
-        for obj in AccumulatorValues:
-            obj.Accumulator = self
+        collection = self._AccumulatorValues
+        for obj in members(AccumulatorValues):
+            old = obj._Accumulator
+            if old is not None and old is not self:
+                old._AccumulatorValues.discard(obj)
+            obj._Accumulator = self
+            collection.append(obj)
 
     def removeAccumulatorValues(self, *AccumulatorValues):
-        for obj in AccumulatorValues:
-            obj.Accumulator = None
+        collection = self._AccumulatorValues
+        for obj in members(AccumulatorValues):
+            if obj._Accumulator is self:
+                obj._Accumulator = None
+                collection.discard(obj)
+
+    def removeAllAccumulatorValues(self):
+        for obj in self._AccumulatorValues:
+            obj._Accumulator = None
+        self._AccumulatorValues = RefList()
 
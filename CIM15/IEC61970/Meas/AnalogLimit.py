@@ -52,8 +52,7 @@ class AnalogLimit(Limit):
 
     def setLimitSet(self, value):
         if self._LimitSet is not None:
-            filtered = [x for x in self.LimitSet.Limits if x != self]
-            self._LimitSet._Limits = filtered
+            self._LimitSet._Limits.discard(self)
 
         self._LimitSet = value
         if self._LimitSet is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from PyCIM.RefList import RefList, members
 
 class AnalogValue(MeasurementValue):
     """AnalogValue represents an analog MeasurementValue.AnalogValue represents an analog MeasurementValue.
@@ -35,13 +36,13 @@ class AnalogValue(MeasurementValue):
         #: The value to supervise.
         self.value = value
 
-        self._AltTieMeas = []
+        self._AltTieMeas = RefList()
         self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
 
         self._Analog = None
         self.Analog = Analog
 
-        self._AltGeneratingUnit = []
+        self._AltGeneratingUnit = RefList()
         self.AltGeneratingUnit = [] if AltGeneratingUnit is None else AltGeneratingUnit
 
         super(AnalogValue, self).__init__(*args, **kw_args)
@@ -60,20 +61,32 @@ class AnalogValue(MeasurementValue):
 
     def setAltTieMeas(self, value):
         for x in self._AltTieMeas:
-            x.AnalogValue = None
-        for y in value:
-            y._AnalogValue = self
-        self._AltTieMeas = value
+            x._AnalogValue = None
+        self._AltTieMeas = RefList()
+        self.addAltTieMeas(value)
 
     AltTieMeas = property(getAltTieMeas, setAltTieMeas)
 
     def addAltTieMeas(self, *AltTieMeas):
-        for obj in AltTieMeas:
-            obj.AnalogValue = self
+        collection = self._AltTieMeas
+        for obj in members(AltTieMeas):
+            old = obj._AnalogValue
+            if old is not None and old is not self:
+                old._AltTieMeas.discard(obj)
+            obj._AnalogValue = self
+            collection.append(obj)
 
     def removeAltTieMeas(self, *AltTieMeas):
-        for obj in AltTieMeas:
-            obj.AnalogValue = None
+        collection = self._AltTieMeas
+        for obj in members(AltTieMeas):
+            if obj._AnalogValue is self:
+                obj._AnalogValue = None
+                collection.discard(obj)
+
+    def removeAllAltTieMeas(self):
+        for obj in self._AltTieMeas:
+            obj._AnalogValue = None
+        self._AltTieMeas = RefList()
 
     def getAnalog(self):
         """Measurement to which this value is connected.
@@ -82,8 +95,7 @@ class AnalogValue(MeasurementValue):
 
     def setAnalog(self, value):
         if self._Analog is not None:
-            filtered = [x for x in self.Analog.AnalogValues if x != self]
-            self._Analog._AnalogValues = filtered
+            self._Analog._AnalogValues.discard(self)
 
         self._Analog = value
         if self._Analog is not None:
@@ -99,18 +111,30 @@ class AnalogValue(MeasurementValue):
 
     def setAltGeneratingUnit(self, value):
         for x in self._AltGeneratingUnit:
-            x.AnalogValue = None
-        for y in value:
-            y._AnalogValue = self
-        self._AltGeneratingUnit = value
+            x._AnalogValue = None
+        self._AltGeneratingUnit = RefList()
+        self.addAltGeneratingUnit(value)
 
     AltGeneratingUnit = property(getAltGeneratingUnit, setAltGeneratingUnit)
 
     def addAltGeneratingUnit(self, *AltGeneratingUnit):
-        for obj in AltGeneratingUnit:
-            obj.AnalogValue = self
+        collection = self._AltGeneratingUnit
+        for obj in members(AltGeneratingUnit):
+            old = obj._AnalogValue
+            if old is not None and old is not self:
+                old._AltGeneratingUnit.discard(obj)
+            obj._AnalogValue = self
+            collection.append(obj)
 
     def removeAltGeneratingUnit(self, *AltGeneratingUnit):
-        for obj in AltGeneratingUnit:
-            obj.AnalogValue = None
+        collection = self._AltGeneratingUnit
+        for obj in members(AltGeneratingUnit):
+            if obj._AnalogValue is self:
+                obj._AnalogValue = None
+                collection.discard(obj)
+
+    def removeAllAltGeneratingUnit(self):
+        for obj in self._AltGeneratingUnit:
+            obj._AnalogValue = None
+        self._AltGeneratingUnit = RefList()
 
@@ -76,8 +76,7 @@ class Command(Control):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Commands if x != self]
-            self._ValueAliasSet._Commands = filtered
+            self._ValueAliasSet._Commands.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
@@ -88,8 +88,7 @@ class Control(IdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
@@ -105,8 +104,7 @@ class Control(IdentifiedObject):
 
     def setControlType(self, value):
         if self._ControlType is not None:
-            filtered = [x for x in self.ControlType.Controls if x != self]
-            self._ControlType._Controls = filtered
+            self._ControlType._Controls.discard(self)
 
         self._ControlType = value
         if self._ControlType is not None:
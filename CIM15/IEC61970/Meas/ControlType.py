@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ControlType(IdentifiedObject):
     """Specifies the type of Control, e.g. BreakerOn/Off, GeneratorVoltageSetPoint, TieLineFlow etc. The ControlType.name shall be unique among all specified types and describe the type. The ControlType.aliasName is meant to be used for localization.Specifies the type of Control, e.g. BreakerOn/Off, GeneratorVoltageSetPoint, TieLineFlow etc. The ControlType.name shall be unique among all specified types and describe the type. The ControlType.aliasName is meant to be used for localization.
@@ -29,7 +30,7 @@ class ControlType(IdentifiedObject):
 
         @param Controls: The Controls having the ControlType
         """
-        self._Controls = []
+        self._Controls = RefList()
         self.Controls = [] if Controls is None else Controls
 
         super(ControlType, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class ControlType(IdentifiedObject):
 
     def setControls(self, value):
         for x in self._Controls:
-            x.ControlType = None
-        for y in value:
-            y._ControlType = self
-        self._Controls = value
+            x._ControlType = None
+        self._Controls = RefList()
+        self.addControls(value)
 
     Controls = property(getControls, setControls)
 
     def addControls(self, *Controls):
-        for obj in Controls:
-            obj.ControlType = self
+        collection = self._Controls
+        for obj in members(Controls):
+            old = obj._ControlType
+            if old is not None and old is not self:
+                old._Controls.discard(obj)
+            obj._ControlType = self
+            collection.append(obj)
 
     def removeControls(self, *Controls):
-        for obj in Controls:
-            obj.ControlType = None
+        collection = self._Controls
+        for obj in members(Controls):
+            if obj._ControlType is self:
+                obj._ControlType = None
+                collection.discard(obj)
+
+    def removeAllControls(self):
+        for obj in self._Controls:
+            obj._ControlType = None
+        self._Controls = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class Limit(IdentifiedObject):
     """Specifies one limit value for a Measurement. A Measurement typically has several limits that are kept together by the LimitSet class. The actual meaning and use of a Limit instance (i.e., if it is an alarm or warning limit or if it is a high or low limit) is not captured in the Limit class. However the name of a Limit instance may indicate both meaning and use.Specifies one limit value for a Measurement. A Measurement typically has several limits that are kept together by the LimitSet class. The actual meaning and use of a Limit instance (i.e., if it is an alarm or warning limit or if it is a high or low limit) is not captured in the Limit class. However the name of a Limit instance may indicate both meaning and use.
@@ -29,7 +30,7 @@ class Limit(IdentifiedObject):
 
         @param Procedures:
         """
-        self._Procedures = []
+        self._Procedures = RefList()
         self.Procedures = [] if Procedures is None else Procedures
 
         super(Limit, self).__init__(*args, **kw_args)
@@ -47,24 +48,26 @@ class Limit(IdentifiedObject):
 
     def setProcedures(self, value):
         for p in self._Procedures:
-            filtered = [q for q in p.Limits if q != self]
-            self._Procedures._Limits = filtered
-        for r in value:
-            if self not in r._Limits:
-                r._Limits.append(self)
-        self._Procedures = value
+            p._Limits.discard(self)
+        self._Procedures = RefList()
+        self.addProcedures(value)
 
     Procedures = property(getProcedures, setProcedures)
 
     def addProcedures(self, *Procedures):
-        for obj in Procedures:
-            if self not in obj._Limits:
-                obj._Limits.append(self)
-            self._Procedures.append(obj)
+        collection = self._Procedures
+        for obj in members(Procedures):
+            obj._Limits.append(self)
+            collection.append(obj)
 
     def removeProcedures(self, *Procedures):
-        for obj in Procedures:
-            if self in obj._Limits:
-                obj._Limits.remove(self)
-            self._Procedures.remove(obj)
+        collection = self._Procedures
+        for obj in members(Procedures):
+            obj._Limits.discard(self)
+            collection.discard(obj)
+
+    def removeAllProcedures(self):
+        for obj in self._Procedures:
+            obj._Limits.discard(self)
+        self._Procedures = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MeasurementValue(IdentifiedObject):
     """The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.
@@ -42,13 +43,13 @@ class MeasurementValue(IdentifiedObject):
         #: The time when the value was last updated
         self.timeStamp = timeStamp
 
-        self._GmlValues = []
+        self._GmlValues = RefList()
         self.GmlValues = [] if GmlValues is None else GmlValues
 
         self._MeasurementValueQuality = None
         self.MeasurementValueQuality = MeasurementValueQuality
 
-        self._ProcedureDataSets = []
+        self._ProcedureDataSets = RefList()
         self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
 
         self._MeasurementValueSource = None
@@ -75,20 +76,32 @@ class MeasurementValue(IdentifiedObject):
 
     def setGmlValues(self, value):
         for x in self._GmlValues:
-            x.MeasurementValue = None
-        for y in value:
-            y._MeasurementValue = self
-        self._GmlValues = value
+            x._MeasurementValue = None
+        self._GmlValues = RefList()
+        self.addGmlValues(value)
 
     GmlValues = property(getGmlValues, setGmlValues)
 
     def addGmlValues(self, *GmlValues):
-        for obj in GmlValues:
-            obj.MeasurementValue = self
+        collection = self._GmlValues
+        for obj in members(GmlValues):
+            old = obj._MeasurementValue
+            if old is not None and old is not self:
+                old._GmlValues.discard(obj)
+            obj._MeasurementValue = self
+            collection.append(obj)
 
     def removeGmlValues(self, *GmlValues):
-        for obj in GmlValues:
-            obj.MeasurementValue = None
+        collection = self._GmlValues
+        for obj in members(GmlValues):
+            if obj._MeasurementValue is self:
+                obj._MeasurementValue = None
+                collection.discard(obj)
+
+    def removeAllGmlValues(self):
+        for obj in self._GmlValues:
+            obj._MeasurementValue = None
+        self._GmlValues = RefList()
 
     def getMeasurementValueQuality(self):
         """A MeasurementValue has a MeasurementValueQuality associated with it.
@@ -112,26 +125,28 @@ class MeasurementValue(IdentifiedObject):
 
     def setProcedureDataSets(self, value):
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.MeasurementValues if q != self]
-            self._ProcedureDataSets._MeasurementValues = filtered
-        for r in value:
-            if self not in r._MeasurementValues:
-                r._MeasurementValues.append(self)
-        self._ProcedureDataSets = value
+            p._MeasurementValues.discard(self)
+        self._ProcedureDataSets = RefList()
+        self.addProcedureDataSets(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            if self not in obj._MeasurementValues:
-                obj._MeasurementValues.append(self)
-            self._ProcedureDataSets.append(obj)
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            obj._MeasurementValues.append(self)
+            collection.append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
-        for obj in ProcedureDataSets:
-            if self in obj._MeasurementValues:
-                obj._MeasurementValues.remove(self)
-            self._ProcedureDataSets.remove(obj)
+        collection = self._ProcedureDataSets
+        for obj in members(ProcedureDataSets):
+            obj._MeasurementValues.discard(self)
+            collection.discard(obj)
+
+    def removeAllProcedureDataSets(self):
+        for obj in self._ProcedureDataSets:
+            obj._MeasurementValues.discard(self)
+        self._ProcedureDataSets = RefList()
 
     def getMeasurementValueSource(self):
         """A reference to the type of source that updates the MeasurementValue, e.g. SCADA, CCLink, manual, etc. User conventions for the names of sources are contained in the introduction to IEC 61970-301.
@@ -140,8 +155,7 @@ class MeasurementValue(IdentifiedObject):
 
     def setMeasurementValueSource(self, value):
         if self._MeasurementValueSource is not None:
-            filtered = [x for x in self.MeasurementValueSource.MeasurementValues if x != self]
-            self._MeasurementValueSource._MeasurementValues = filtered
+            self._MeasurementValueSource._MeasurementValues.discard(self)
 
         self._MeasurementValueSource = value
         if self._MeasurementValueSource is not None:
@@ -156,8 +170,7 @@ class MeasurementValue(IdentifiedObject):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.MeasurementValues if x != self]
-            self._ErpPerson._MeasurementValues = filtered
+            self._ErpPerson._MeasurementValues.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Measurement import Measurement
+from PyCIM.RefList import RefList, members
 
 class StringMeasurement(Measurement):
     """StringMeasurement represents a measurement with values of type string.StringMeasurement represents a measurement with values of type string.
@@ -29,7 +30,7 @@ class StringMeasurement(Measurement):
 
         @param StringMeasurementValues: The values connected to this measurement.
         """
-        self._StringMeasurementValues = []
+        self._StringMeasurementValues = RefList()
         self.StringMeasurementValues = [] if StringMeasurementValues is None else StringMeasurementValues
 
         super(StringMeasurement, self).__init__(*args, **kw_args)
@@ -48,18 +49,30 @@ class StringMeasurement(Measurement):
 
     def setStringMeasurementValues(self, value):
         for x in self._StringMeasurementValues:
-            x.StringMeasurement = None
-        for y in value:
-            y._StringMeasurement = self
-        self._StringMeasurementValues = value
+            x._StringMeasurement = None
+        self._StringMeasurementValues = RefList()
+        self.addStringMeasurementValues(value)
 
     StringMeasurementValues = property(getStringMeasurementValues, setStringMeasurementValues)
 
     def addStringMeasurementValues(self, *StringMeasurementValues):
-        for obj in StringMeasurementValues:
-            obj.StringMeasurement = self
+        collection = self._StringMeasurementValues
+        for obj in members(StringMeasurementValues):
+            old = obj._StringMeasurement
+            if old is not None and old is not self:
+                old._StringMeasurementValues.discard(obj)
+            obj._StringMeasurement = self
+            collection.append(obj)
 
     def removeStringMeasurementValues(self, *StringMeasurementValues):
-        for obj in StringMeasurementValues:
-            obj.StringMeasurement = None
+        collection = self._StringMeasurementValues
+        for obj in members(StringMeasurementValues):
+            if obj._StringMeasurement is self:
+                obj._StringMeasurement = None
+                collection.discard(obj)
+
+    def removeAllStringMeasurementValues(self):
+        for obj in self._StringMeasurementValues:
+            obj._StringMeasurement = None
+        self._StringMeasurementValues = RefList()
 
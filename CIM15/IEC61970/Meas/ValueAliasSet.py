@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class ValueAliasSet(IdentifiedObject):
     """Describes the translation of a set of values into a name and is intendend to facilitate cusom translations. Each ValueAliasSet has a name, description etc. A specific Measurement may represent a discrete state like Open, Closed, Intermediate etc. This requires a translation from the MeasurementValue.value number to a string, e.g. 0->'Invalid', 1->'Open', 2->'Closed', 3->'Intermediate'. Each ValueToAlias member in ValueAliasSet.Value describe a mapping for one particular value to a name.Describes the translation of a set of values into a name and is intendend to facilitate cusom translations. Each ValueAliasSet has a name, description etc. A specific Measurement may represent a discrete state like Open, Closed, Intermediate etc. This requires a translation from the MeasurementValue.value number to a string, e.g. 0->'Invalid', 1->'Open', 2->'Closed', 3->'Intermediate'. Each ValueToAlias member in ValueAliasSet.Value describe a mapping for one particular value to a name.
@@ -31,13 +32,13 @@ class ValueAliasSet(IdentifiedObject):
         @param Commands: The ValueAliasSet used for translation of a Control value to a name.
         @param Values: The ValueToAlias mappings included in the set
         """
-        self._Discretes = []
+        self._Discretes = RefList()
         self.Discretes = [] if Discretes is None else Discretes
 
-        self._Commands = []
+        self._Commands = RefList()
         self.Commands = [] if Commands is None else Commands
 
-        self._Values = []
+        self._Values = RefList()
         self.Values = [] if Values is None else Values
 
         super(ValueAliasSet, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class ValueAliasSet(IdentifiedObject):
 
     def setDiscretes(self, value):
         for x in self._Discretes:
-            x.ValueAliasSet = None
-        for y in value:
-            y._ValueAliasSet = self
-        self._Discretes = value
+            x._ValueAliasSet = None
+        self._Discretes = RefList()
+        self.addDiscretes(value)
 
     Discretes = property(getDiscretes, setDiscretes)
 
     def addDiscretes(self, *Discretes):
-        for obj in Discretes:
-            obj.ValueAliasSet = self
+        collection = self._Discretes
+        for obj in members(Discretes):
+            old = obj._ValueAliasSet
+            if old is not None and old is not self:
+                old._Discretes.discard(obj)
+            obj._ValueAliasSet = self
+            collection.append(obj)
 
     def removeDiscretes(self, *Discretes):
-        for obj in Discretes:
-            obj.ValueAliasSet = None
+        collection = self._Discretes
+        for obj in members(Discretes):
+            if obj._ValueAliasSet is self:
+                obj._ValueAliasSet = None
+                collection.discard(obj)
+
+    def removeAllDiscretes(self):
+        for obj in self._Discretes:
+            obj._ValueAliasSet = None
+        self._Discretes = RefList()
 
     def getCommands(self):
         """The ValueAliasSet used for translation of a Control value to a name.
@@ -78,20 +91,32 @@ class ValueAliasSet(IdentifiedObject):
 
     def setCommands(self, value):
         for x in self._Commands:
-            x.ValueAliasSet = None
-        for y in value:
-            y._ValueAliasSet = self
-        self._Commands = value
+            x._ValueAliasSet = None
+        self._Commands = RefList()
+        self.addCommands(value)
 
     Commands = property(getCommands, setCommands)
 
     def addCommands(self, *Commands):
-        for obj in Commands:
-            obj.ValueAliasSet = self
+        collection = self._Commands
+        for obj in members(Commands):
+            old = obj._ValueAliasSet
+            if old is not None and old is not self:
+                old._Commands.discard(obj)
+            obj._ValueAliasSet = self
+            collection.append(obj)
 
     def removeCommands(self, *Commands):
-        for obj in Commands:
-            obj.ValueAliasSet = None
+        collection = self._Commands
+        for obj in members(Commands):
+            if obj._ValueAliasSet is self:
+                obj._ValueAliasSet = None
+                collection.discard(obj)
+
+    def removeAllCommands(self):
+        for obj in self._Commands:
+            obj._ValueAliasSet = None
+        self._Commands = RefList()
 
     def getValues(self):
         """The ValueToAlias mappings included in the set
@@ -100,18 +125,30 @@ class ValueAliasSet(IdentifiedObject):
 
     def setValues(self, value):
         for x in self._Values:
-            x.ValueAliasSet = None
-        for y in value:
-            y._ValueAliasSet = self
-        self._Values = value
+            x._ValueAliasSet = None
+        self._Values = RefList()
+        self.addValues(value)
 
     Values = property(getValues, setValues)
 
     def addValues(self, *Values):
-        for obj in Values:
-            obj.ValueAliasSet = self
+        collection = self._Values
+        for obj in members(Values):
+            old = obj._ValueAliasSet
+            if old is not None and old is not self:
+                old._Values.discard(obj)
+            obj._ValueAliasSet = self
+            collection.append(obj)
 
     def removeValues(self, *Values):
-        for obj in Values:
-            obj.ValueAliasSet = None
+        collection = self._Values
+        for obj in members(Values):
+            if obj._ValueAliasSet is self:
+                obj._ValueAliasSet = None
+                collection.discard(obj)
+
+    def removeAllValues(self):
+        for obj in self._Values:
+            obj._ValueAliasSet = None
+        self._Values = RefList()
 
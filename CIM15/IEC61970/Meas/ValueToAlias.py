@@ -52,8 +52,7 @@ class ValueToAlias(IdentifiedObject):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Values if x != self]
-            self._ValueAliasSet._Values = filtered
+            self._ValueAliasSet._Values.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
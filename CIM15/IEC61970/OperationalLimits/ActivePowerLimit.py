@@ -51,8 +51,7 @@ class ActivePowerLimit(OperationalLimit):
 
     def setActivePowerLimitSet(self, value):
         if self._ActivePowerLimitSet is not None:
-            filtered = [x for x in self.ActivePowerLimitSet.ActivePowerLimits if x != self]
-            self._ActivePowerLimitSet._ActivePowerLimits = filtered
+            self._ActivePowerLimitSet._ActivePowerLimits.discard(self)
 
         self._ActivePowerLimitSet = value
         if self._ActivePowerLimitSet is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from PyCIM.RefList import RefList, members
 
 class ActivePowerLimitSet(OperationalLimitSet):
 
@@ -27,7 +28,7 @@ class ActivePowerLimitSet(OperationalLimitSet):
 
         @param ActivePowerLimits:
         """
-        self._ActivePowerLimits = []
+        self._ActivePowerLimits = RefList()
         self.ActivePowerLimits = [] if ActivePowerLimits is None else ActivePowerLimits
 
         super(ActivePowerLimitSet, self).__init__(*args, **kw_args)
@@ -45,18 +46,30 @@ class ActivePowerLimitSet(OperationalLimitSet):
 
     def setActivePowerLimits(self, value):
         for x in self._ActivePowerLimits:
-            x.ActivePowerLimitSet = None
-        for y in value:
-            y._ActivePowerLimitSet = self
-        self._ActivePowerLimits = value
+            x._ActivePowerLimitSet = None
+        self._ActivePowerLimits = RefList()
+        self.addActivePowerLimits(value)
 
     ActivePowerLimits = property(getActivePowerLimits, setActivePowerLimits)
 
     def addActivePowerLimits(self, *ActivePowerLimits):
-        for obj in ActivePowerLimits:
-            obj.ActivePowerLimitSet = self
+        collection = self._ActivePowerLimits
+        for obj in members(ActivePowerLimits):
+            old = obj._ActivePowerLimitSet
+            if old is not None and old is not self:
+                old._ActivePowerLimits.discard(obj)
+            obj._ActivePowerLimitSet = self
+            collection.append(obj)
 
     def removeActivePowerLimits(self, *ActivePowerLimits):
-        for obj in ActivePowerLimits:
-            obj.ActivePowerLimitSet = None
+        collection = self._ActivePowerLimits
+        for obj in members(ActivePowerLimits):
+            if obj._ActivePowerLimitSet is self:
+                obj._ActivePowerLimitSet = None
+                collection.discard(obj)
+
+    def removeAllActivePowerLimits(self):
+        for obj in self._ActivePowerLimits:
+            obj._ActivePowerLimitSet = None
+        self._ActivePowerLimits = RefList()
 
@@ -51,8 +51,7 @@ class ApparentPowerLimit(OperationalLimit):
 
     def setApparentPowerLimitSet(self, value):
         if self._ApparentPowerLimitSet is not None:
-            filtered = [x for x in self.ApparentPowerLimitSet.ApparentPowerLimits if x != self]
-            self._ApparentPowerLimitSet._ApparentPowerLimits = filtered
+            self._ApparentPowerLimitSet._ApparentPowerLimits.discard(self)
 
         self._ApparentPowerLimitSet = value
         if self._ApparentPowerLimitSet is not None:
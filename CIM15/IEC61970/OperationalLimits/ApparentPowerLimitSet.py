@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from PyCIM.RefList import RefList, members
 
 class ApparentPowerLimitSet(OperationalLimitSet):
 
@@ -27,7 +28,7 @@ class ApparentPowerLimitSet(OperationalLimitSet):
 
         @param ApparentPowerLimits:
         """
-        self._ApparentPowerLimits = []
+        self._ApparentPowerLimits = RefList()
         self.ApparentPowerLimits = [] if ApparentPowerLimits is None else ApparentPowerLimits
 
         super(ApparentPowerLimitSet, self).__init__(*args, **kw_args)
@@ -45,18 +46,30 @@ class ApparentPowerLimitSet(OperationalLimitSet):
 
     def setApparentPowerLimits(self, value):
         for x in self._ApparentPowerLimits:
-            x.ApparentPowerLimitSet = None
-        for y in value:
-            y._ApparentPowerLimitSet = self
-        self._ApparentPowerLimits = value
+            x._ApparentPowerLimitSet = None
+        self._ApparentPowerLimits = RefList()
+        self.addApparentPowerLimits(value)
 
     ApparentPowerLimits = property(getApparentPowerLimits, setApparentPowerLimits)
 
     def addApparentPowerLimits(self, *ApparentPowerLimits):
-        for obj in ApparentPowerLimits:
-            obj.ApparentPowerLimitSet = self
+        collection = self._ApparentPowerLimits
+        for obj in members(ApparentPowerLimits):
+            old = obj._ApparentPowerLimitSet
+            if old is not None and old is not self:
+                old._ApparentPowerLimits.discard(obj)
+            obj._ApparentPowerLimitSet = self
+            collection.append(obj)
 
     def removeApparentPowerLimits(self, *ApparentPowerLimits):
-        for obj in ApparentPowerLimits:
-            obj.ApparentPowerLimitSet = None
+        collection = self._ApparentPowerLimits
+        for obj in members(ApparentPowerLimits):
+            if obj._ApparentPowerLimitSet is self:
+                obj._ApparentPowerLimitSet = None
+                collection.discard(obj)
+
+    def removeAllApparentPowerLimits(self):
+        for obj in self._ApparentPowerLimits:
+            obj._ApparentPowerLimitSet = None
+        self._ApparentPowerLimits = RefList()
 
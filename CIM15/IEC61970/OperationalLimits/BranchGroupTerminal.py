@@ -56,8 +56,7 @@ class BranchGroupTerminal(Element):
 
     def setBranchGroup(self, value):
         if self._BranchGroup is not None:
-            filtered = [x for x in self.BranchGroup.BranchGroupTerminal if x != self]
-            self._BranchGroup._BranchGroupTerminal = filtered
+            self._BranchGroup._BranchGroupTerminal.discard(self)
 
         self._BranchGroup = value
         if self._BranchGroup is not None:
@@ -73,8 +72,7 @@ class BranchGroupTerminal(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.BranchGroupTerminal if x != self]
-            self._Terminal._BranchGroupTerminal = filtered
+            self._Terminal._BranchGroupTerminal.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -51,8 +51,7 @@ class CurrentLimit(OperationalLimit):
 
     def setCurrentLimitSet(self, value):
         if self._CurrentLimitSet is not None:
-            filtered = [x for x in self.CurrentLimitSet.CurrentLimits if x != self]
-            self._CurrentLimitSet._CurrentLimits = filtered
+            self._CurrentLimitSet._CurrentLimits.discard(self)
 
         self._CurrentLimitSet = value
         if self._CurrentLimitSet is not None:
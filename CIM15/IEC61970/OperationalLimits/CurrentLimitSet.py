@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from PyCIM.RefList import RefList, members
 
 class CurrentLimitSet(OperationalLimitSet):
 
@@ -27,7 +28,7 @@ class CurrentLimitSet(OperationalLimitSet):
 
         @param CurrentLimits:
         """
-        self._CurrentLimits = []
+        self._CurrentLimits = RefList()
         self.CurrentLimits = [] if CurrentLimits is None else CurrentLimits
 
         super(CurrentLimitSet, self).__init__(*args, **kw_args)
@@ -45,18 +46,30 @@ class CurrentLimitSet(OperationalLimitSet):
 
     def setCurrentLimits(self, value):
         for x in self._CurrentLimits:
-            x.CurrentLimitSet = None
-        for y in value:
-            y._CurrentLimitSet = self
-        self._CurrentLimits = value
+            x._CurrentLimitSet = None
+        self._CurrentLimits = RefList()
+        self.addCurrentLimits(value)
 
     CurrentLimits = property(getCurrentLimits, setCurrentLimits)
 
     def addCurrentLimits(self, *CurrentLimits):
-        for obj in CurrentLimits:
-            obj.CurrentLimitSet = self
+        collection = self._CurrentLimits
+        for obj in members(CurrentLimits):
+            old = obj._CurrentLimitSet
+            if old is not None and old is not self:
+                old._CurrentLimits.discard(obj)
+            obj._CurrentLimitSet = self
+            collection.append(obj)
 
     def removeCurrentLimits(self, *CurrentLimits):
-        for obj in CurrentLimits:
-            obj.CurrentLimitSet = None
+        collection = self._CurrentLimits
+        for obj in members(CurrentLimits):
+            if obj._CurrentLimitSet is self:
+                obj._CurrentLimitSet = None
+                collection.discard(obj)
+
+    def removeAllCurrentLimits(self):
+        for obj in self._CurrentLimits:
+            obj._CurrentLimitSet = None
+        self._CurrentLimits = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class OperationalLimitSet(IdentifiedObject):
     """A set of limits associated with equipmnet.  Sets of limits might apply to a specific temperature, or season for example. A set of limits may contain may different severities of limit levels that would apply to the same equipment.   The set may contain limits of different types such as apparent power and current limits or high and low voltage limits  that are logically applied together as a set.A set of limits associated with equipmnet.  Sets of limits might apply to a specific temperature, or season for example. A set of limits may contain may different severities of limit levels that would apply to the same equipment.   The set may contain limits of different types such as apparent power and current limits or high and low voltage limits  that are logically applied together as a set.
@@ -33,7 +34,7 @@ class OperationalLimitSet(IdentifiedObject):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._OperationalLimitValue = []
+        self._OperationalLimitValue = RefList()
         self.OperationalLimitValue = [] if OperationalLimitValue is None else OperationalLimitValue
 
         super(OperationalLimitSet, self).__init__(*args, **kw_args)
@@ -52,8 +53,7 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.OperationalLimitSet if x != self]
-            self._Terminal._OperationalLimitSet = filtered
+            self._Terminal._OperationalLimitSet.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -69,18 +69,30 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setOperationalLimitValue(self, value):
         for x in self._OperationalLimitValue:
-            x.OperationalLimitSet = None
-        for y in value:
-            y._OperationalLimitSet = self
-        self._OperationalLimitValue = value
+            x._OperationalLimitSet = None
+        self._OperationalLimitValue = RefList()
+        self.addOperationalLimitValue(value)
 
     OperationalLimitValue = property(getOperationalLimitValue, setOperationalLimitValue)
 
     def addOperationalLimitValue(self, *OperationalLimitValue):
-        for obj in OperationalLimitValue:
-            obj.OperationalLimitSet = self
+        collection = self._OperationalLimitValue
+        for obj in members(OperationalLimitValue):
+            old = obj._OperationalLimitSet
+            if old is not None and old is not self:
+                old._OperationalLimitValue.discard(obj)
+            obj._OperationalLimitSet = self
+            collection.append(obj)
 
     def removeOperationalLimitValue(self, *OperationalLimitValue):
-        for obj in OperationalLimitValue:
-            obj.OperationalLimitSet = None
+        collection = self._OperationalLimitValue
+        for obj in members(OperationalLimitValue):
+            if obj._OperationalLimitSet is self:
+                obj._OperationalLimitSet = None
+                collection.discard(obj)
+
+    def removeAllOperationalLimitValue(self):
+        for obj in self._OperationalLimitValue:
+            obj._OperationalLimitSet = None
+        self._OperationalLimitValue = RefList()
 
@@ -51,8 +51,7 @@ class VoltageLimit(OperationalLimit):
 
     def setVoltageLimitSet(self, value):
         if self._VoltageLimitSet is not None:
-            filtered = [x for x in self.VoltageLimitSet.VoltageLimits if x != self]
-            self._VoltageLimitSet._VoltageLimits = filtered
+            self._VoltageLimitSet._VoltageLimits.discard(self)
 
         self._VoltageLimitSet = value
         if self._VoltageLimitSet is not None:
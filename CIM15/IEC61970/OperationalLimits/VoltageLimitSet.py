@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from PyCIM.RefList import RefList, members
 
 class VoltageLimitSet(OperationalLimitSet):
 
@@ -27,7 +28,7 @@ class VoltageLimitSet(OperationalLimitSet):
 
         @param VoltageLimits:
         """
-        self._VoltageLimits = []
+        self._VoltageLimits = RefList()
         self.VoltageLimits = [] if VoltageLimits is None else VoltageLimits
 
         super(VoltageLimitSet, self).__init__(*args, **kw_args)
@@ -45,18 +46,30 @@ class VoltageLimitSet(OperationalLimitSet):
 
     def setVoltageLimits(self, value):
         for x in self._VoltageLimits:
-            x.VoltageLimitSet = None
-        for y in value:
-            y._VoltageLimitSet = self
-        self._VoltageLimits = value
+            x._VoltageLimitSet = None
+        self._VoltageLimits = RefList()
+        self.addVoltageLimits(value)
 
     VoltageLimits = property(getVoltageLimits, setVoltageLimits)
 
     def addVoltageLimits(self, *VoltageLimits):
-        for obj in VoltageLimits:
-            obj.VoltageLimitSet = self
+        collection = self._VoltageLimits
+        for obj in members(VoltageLimits):
+            old = obj._VoltageLimitSet
+            if old is not None and old is not self:
+                old._VoltageLimits.discard(obj)
+            obj._VoltageLimitSet = self
+            collection.append(obj)
 
     def removeVoltageLimits(self, *VoltageLimits):
-        for obj in VoltageLimits:
-            obj.VoltageLimitSet = None
+        collection = self._VoltageLimits
+        for obj in members(VoltageLimits):
+            if obj._VoltageLimitSet is self:
+                obj._VoltageLimitSet = None
+                collection.discard(obj)
+
+    def removeAllVoltageLimits(self):
+        for obj in self._VoltageLimits:
+            obj._VoltageLimitSet = None
+        self._VoltageLimits = RefList()
 
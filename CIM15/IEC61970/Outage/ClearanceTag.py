@@ -88,8 +88,7 @@ class ClearanceTag(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
@@ -104,8 +103,7 @@ class ClearanceTag(IdentifiedObject):
 
     def setSafetyDocument(self, value):
         if self._SafetyDocument is not None:
-            filtered = [x for x in self.SafetyDocument.ClearanceTags if x != self]
-            self._SafetyDocument._ClearanceTags = filtered
+            self._SafetyDocument._ClearanceTags.discard(self)
 
         self._SafetyDocument = value
         if self._SafetyDocument is not None:
@@ -121,8 +119,7 @@ class ClearanceTag(IdentifiedObject):
 
     def setClearanceTagType(self, value):
         if self._ClearanceTagType is not None:
-            filtered = [x for x in self.ClearanceTagType.ClearanceTags if x != self]
-            self._ClearanceTagType._ClearanceTags = filtered
+            self._ClearanceTagType._ClearanceTags.discard(self)
 
         self._ClearanceTagType = value
         if self._ClearanceTagType is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class ProtectionEquipment(Equipment):
     """An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.
@@ -54,10 +55,10 @@ class ProtectionEquipment(Equipment):
         #: The unit multiplier of the value. Values are: "M", "G", "d", "micro", "c", "p", "n", "T", "k", "m", "none"
         self.unitMultiplier = unitMultiplier
 
-        self._ConductingEquipments = []
+        self._ConductingEquipments = RefList()
         self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
 
-        self._ProtectedSwitches = []
+        self._ProtectedSwitches = RefList()
         self.ProtectedSwitches = [] if ProtectedSwitches is None else ProtectedSwitches
 
         super(ProtectionEquipment, self).__init__(*args, **kw_args)
@@ -76,26 +77,28 @@ class ProtectionEquipment(Equipment):
 
     def setConductingEquipments(self, value):
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
-        for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ConductingEquipments = value
+            p._ProtectionEquipments.discard(self)
+        self._ConductingEquipments = RefList()
+        self.addConductingEquipments(value)
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
-        for obj in ConductingEquipments:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+        collection = self._ConductingEquipments
+        for obj in members(ConductingEquipments):
+            obj._ProtectionEquipments.append(self)
+            collection.append(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
-        for obj in ConductingEquipments:
-            if self in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.remove(self)
-            self._ConductingEquipments.remove(obj)
+        collection = self._ConductingEquipments
+        for obj in members(ConductingEquipments):
+            obj._ProtectionEquipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllConductingEquipments(self):
+        for obj in self._ConductingEquipments:
+            obj._ProtectionEquipments.discard(self)
+        self._ConductingEquipments = RefList()
 
     def getProtectedSwitches(self):
         """Protected switches operated by this ProtectionEquipment.
@@ -104,24 +107,26 @@ class ProtectionEquipment(Equipment):
 
     def setProtectedSwitches(self, value):
         for p in self._ProtectedSwitches:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ProtectedSwitches._ProtectionEquipments = filtered
-        for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ProtectedSwitches = value
+            p._ProtectionEquipments.discard(self)
+        self._ProtectedSwitches = RefList()
+        self.addProtectedSwitches(value)
 
     ProtectedSwitches = property(getProtectedSwitches, setProtectedSwitches)
 
     def addProtectedSwitches(self, *ProtectedSwitches):
-        for obj in ProtectedSwitches:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ProtectedSwitches.append(obj)
+        collection = self._ProtectedSwitches
+        for obj in members(ProtectedSwitches):
+            obj._ProtectionEquipments.append(self)
+            collection.append(obj)
 
     def removeProtectedSwitches(self, *ProtectedSwitches):
-        for obj in ProtectedSwitches:
-            if self in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.remove(self)
-            self._ProtectedSwitches.remove(obj)
+        collection = self._ProtectedSwitches
+        for obj in members(ProtectedSwitches):
+            obj._ProtectionEquipments.discard(self)
+            collection.discard(obj)
+
+    def removeAllProtectedSwitches(self):
+        for obj in self._ProtectedSwitches:
+            obj._ProtectionEquipments.discard(self)
+        self._ProtectedSwitches = RefList()
 
@@ -56,8 +56,7 @@ class RecloseSequence(IdentifiedObject):
 
     def setProtectedSwitch(self, value):
         if self._ProtectedSwitch is not None:
-            filtered = [x for x in self.ProtectedSwitch.RecloseSequences if x != self]
-            self._ProtectedSwitch._RecloseSequences = filtered
+            self._ProtectedSwitch._RecloseSequences.discard(self)
 
         self._ProtectedSwitch = value
         if self._ProtectedSwitch is not None:
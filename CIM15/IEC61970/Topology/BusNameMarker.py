@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class BusNameMarker(IdentifiedObject):
     """Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.
@@ -30,7 +31,7 @@ class BusNameMarker(IdentifiedObject):
         @param Terminal: A list of Terminals from the set of Terminals which are connected at the same bus (TopologicalNode) in the normal topology. At least one Terminal from the set of normally connected Terminals shall be in the list.
         @param ReportingGroup: The reporting group to which this BusNameMarker belongs.
         """
-        self._Terminal = []
+        self._Terminal = RefList()
         self.Terminal = [] if Terminal is None else Terminal
 
         self._ReportingGroup = None
@@ -52,20 +53,32 @@ class BusNameMarker(IdentifiedObject):
 
     def setTerminal(self, value):
         for x in self._Terminal:
-            x.BusNameMarker = None
-        for y in value:
-            y._BusNameMarker = self
-        self._Terminal = value
+            x._BusNameMarker = None
+        self._Terminal = RefList()
+        self.addTerminal(value)
 
     Terminal = property(getTerminal, setTerminal)
 
     def addTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.BusNameMarker = self
+        collection = self._Terminal
+        for obj in members(Terminal):
+            old = obj._BusNameMarker
+            if old is not None and old is not self:
+                old._Terminal.discard(obj)
+            obj._BusNameMarker = self
+            collection.append(obj)
 
     def removeTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.BusNameMarker = None
+        collection = self._Terminal
+        for obj in members(Terminal):
+            if obj._BusNameMarker is self:
+                obj._BusNameMarker = None
+                collection.discard(obj)
+
+    def removeAllTerminal(self):
+        for obj in self._Terminal:
+            obj._BusNameMarker = None
+        self._Terminal = RefList()
 
     def getReportingGroup(self):
         """The reporting group to which this BusNameMarker belongs.
@@ -74,8 +87,7 @@ class BusNameMarker(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.BusNameMarker if x != self]
-            self._ReportingGroup._BusNameMarker = filtered
+            self._ReportingGroup._BusNameMarker.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
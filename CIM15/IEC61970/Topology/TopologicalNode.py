@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -47,7 +48,7 @@ class TopologicalNode(IdentifiedObject):
         self._SvInjection = None
         self.SvInjection = SvInjection
 
-        self._ConnectivityNodes = []
+        self._ConnectivityNodes = RefList()
         self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
 
         self._SvVoltage = None
@@ -62,7 +63,7 @@ class TopologicalNode(IdentifiedObject):
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
 
-        self._Terminal = []
+        self._Terminal = RefList()
         self.Terminal = [] if Terminal is None else Terminal
 
         self._AngleRef_TopologicalIsland = None
@@ -100,8 +101,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.TopologicalNode if x != self]
-            self._ConnectivityNodeContainer._TopologicalNode = filtered
+            self._ConnectivityNodeContainer._TopologicalNode.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
@@ -133,20 +133,32 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodes(self, value):
         for x in self._ConnectivityNodes:
-            x.TopologicalNode = None
-        for y in value:
-            y._TopologicalNode = self
-        self._ConnectivityNodes = value
+            x._TopologicalNode = None
+        self._ConnectivityNodes = RefList()
+        self.addConnectivityNodes(value)
 
     ConnectivityNodes = property(getConnectivityNodes, setConnectivityNodes)
 
     def addConnectivityNodes(self, *ConnectivityNodes):
-        for obj in ConnectivityNodes:
-            obj.TopologicalNode = self
+        collection = self._ConnectivityNodes
+        for obj in members(ConnectivityNodes):
+            old = obj._TopologicalNode
+            if old is not None and old is not self:
+                old._ConnectivityNodes.discard(obj)
+            obj._TopologicalNode = self
+            collection.append(obj)
 
     def removeConnectivityNodes(self, *ConnectivityNodes):
-        for obj in ConnectivityNodes:
-            obj.TopologicalNode = None
+        collection = self._ConnectivityNodes
+        for obj in members(ConnectivityNodes):
+            if obj._TopologicalNode is self:
+                obj._TopologicalNode = None
+                collection.discard(obj)
+
+    def removeAllConnectivityNodes(self):
+        for obj in self._ConnectivityNodes:
+            obj._TopologicalNode = None
+        self._ConnectivityNodes = RefList()
 
     def getSvVoltage(self):
         """The state voltage associated with the topological node.
@@ -171,8 +183,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -188,8 +199,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setTopologicalIsland(self, value):
         if self._TopologicalIsland is not None:
-            filtered = [x for x in self.TopologicalIsland.TopologicalNodes if x != self]
-            self._TopologicalIsland._TopologicalNodes = filtered
+            self._TopologicalIsland._TopologicalNodes.discard(self)
 
         self._TopologicalIsland = value
         if self._TopologicalIsland is not None:
@@ -205,8 +215,7 @@ class TopologicalNode(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.TopologicalNode if x != self]
-            self._ReportingGroup._TopologicalNode = filtered
+            self._ReportingGroup._TopologicalNode.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
@@ -222,20 +231,32 @@ class TopologicalNode(IdentifiedObject):
 
     def setTerminal(self, value):
         for x in self._Terminal:
-            x.TopologicalNode = None
-        for y in value:
-            y._TopologicalNode = self
-        self._Terminal = value
+            x._TopologicalNode = None
+        self._Terminal = RefList()
+        self.addTerminal(value)
 
     Terminal = property(getTerminal, setTerminal)
 
     def addTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.TopologicalNode = self
+        collection = self._Terminal
+        for obj in members(Terminal):
+            old = obj._TopologicalNode
+            if old is not None and old is not self:
+                old._Terminal.discard(obj)
+            obj._TopologicalNode = self
+            collection.append(obj)
 
     def removeTerminal(self, *Terminal):
-        for obj in Terminal:
-            obj.TopologicalNode = None
+        collection = self._Terminal
+        for obj in members(Terminal):
+            if obj._TopologicalNode is self:
+                obj._TopologicalNode = None
+                collection.discard(obj)
+
+    def removeAllTerminal(self):
+        for obj in self._Terminal:
+            obj._TopologicalNode = None
+        self._Terminal = RefList()
 
     def getAngleRef_TopologicalIsland(self):
         """The island for which the node is an angle reference.   Normally there is one angle reference node for each island.
@@ -21,6 +21,7 @@
 from CIM15.IEC61970.Wires.Conductor import Conductor
 from CIM15.IEC61970.Wires.PerLengthPhaseImpedance import PerLengthPhaseImpedance
 from CIM15.IEC61970.Wires.PerLengthSequenceImpedance import PerLengthSequenceImpedance
+from PyCIM.RefList import RefList, members
 
 class ACLineSegment(Conductor):
     """A wire or combination of wires, with consistent electrical characteristics, building a single electrical system, used to carry alternating current between points in the power system. For symmetrical, transposed 3ph lines, it is sufficient to use ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment. If per lenght impedance data is available from a library of standard types, impedances and admittances can be calculated in one of the following ways: - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model. - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model. - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model.A wire or combination of wires, with consistent electrical characteristics, building a single electrical system, used to carry alternating current between points in the power system. For symmetrical, transposed 3ph lines, it is sufficient to use ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment. If per lenght impedance data is available from a library of standard types, impedances and admittances can be calculated in one of the following ways: - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model. - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model. - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model.
@@ -85,19 +86,19 @@ class ACLineSegment(Conductor):
         elif PerLengthImpedance is not None:
             self.PerLengthImpedance = PerLengthImpedance
 
-        self._ConductorAssets = []
+        self._ConductorAssets = RefList()
         self.ConductorAssets = [] if ConductorAssets is None else ConductorAssets
 
         self._ConductorInfo = None
         self.ConductorInfo = ConductorInfo
 
-        self._Cut = []
+        self._Cut = RefList()
         self.Cut = [] if Cut is None else Cut
 
-        self._Clamp = []
+        self._Clamp = RefList()
         self.Clamp = [] if Clamp is None else Clamp
 
-        self._ACLineSegmentPhases = []
+        self._ACLineSegmentPhases = RefList()
         self.ACLineSegmentPhases = [] if ACLineSegmentPhases is None else ACLineSegmentPhases
 
         super(ACLineSegment, self).__init__(*args, **kw_args)
@@ -127,8 +128,7 @@ class ACLineSegment(Conductor):
 
     def setPerLengthImpedance(self, value):
         if self._PerLengthImpedance is not None:
-            filtered = [x for x in self.PerLengthImpedance.LineSegments if x != self]
-            self._PerLengthImpedance._LineSegments = filtered
+            self._PerLengthImpedance._LineSegments.discard(self)
 
         self._PerLengthImpedance = value
         if self._PerLengthImpedance is not None:
@@ -142,20 +142,32 @@ class ACLineSegment(Conductor):
 
     def setConductorAssets(self, value):
         for x in self._ConductorAssets:
-            x.ConductorSegment = None
-        for y in value:
-            y._ConductorSegment = self
-        self._ConductorAssets = value
+            x._ConductorSegment = None
+        self._ConductorAssets = RefList()
+        self.addConductorAssets(value)
 
     ConductorAssets = property(getConductorAssets, setConductorAssets)
 
     def addConductorAssets(self, *ConductorAssets):
-        for obj in ConductorAssets:
-            obj.ConductorSegment = self
+        collection = self._ConductorAssets
+        for obj in members(ConductorAssets):
+            old = obj._ConductorSegment
+            if old is not None and old is not self:
+                old._ConductorAssets.discard(obj)
+            obj._ConductorSegment = self
+            collection.append(obj)
 
     def removeConductorAssets(self, *ConductorAssets):
-        for obj in ConductorAssets:
-            obj.ConductorSegment = None
+        collection = self._ConductorAssets
+        for obj in members(ConductorAssets):
+            if obj._ConductorSegment is self:
+                obj._ConductorSegment = None
+                collection.discard(obj)
+
+    def removeAllConductorAssets(self):
+        for obj in self._ConductorAssets:
+            obj._ConductorSegment = None
+        self._ConductorAssets = RefList()
 
     def getConductorInfo(self):
         """Conductor data for this line segment.
@@ -164,8 +176,7 @@ class ACLineSegment(Conductor):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.LineSegments if x != self]
-            self._ConductorInfo._LineSegments = filtered
+            self._ConductorInfo._LineSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
@@ -180,20 +191,32 @@ class ACLineSegment(Conductor):
 
     def setCut(self, value):
         for x in self._Cut:
-            x.ACLineSegment = None
-        for y in value:
-            y._ACLineSegment = self
-        self._Cut = value
+            x._ACLineSegment = None
+        self._Cut = RefList()
+        self.addCut(value)
 
     Cut = property(getCut, setCut)
 
     def addCut(self, *Cut):
-        for obj in Cut:
-            obj.ACLineSegment = self
+        collection = self._Cut
+        for obj in members(Cut):
+            old = obj._ACLineSegment
+            if old is not None and old is not self:
+                old._Cut.discard(obj)
+            obj._ACLineSegment = self
+            collection.append(obj)
 
     def removeCut(self, *Cut):
-        for obj in Cut:
-            obj.ACLineSegment = None
+        collection = self._Cut
+        for obj in members(Cut):
+            if obj._ACLineSegment is self:
+                obj._ACLineSegment = None
+                collection.discard(obj)
+
+    def removeAllCut(self):
+        for obj in self._Cut:
+            obj._ACLineSegment = None
+        self._Cut = RefList()
 
     def getPhaseImpedance(self):
         """Phase impedance of this line segment; used for unbalanced model.
@@ -214,38 +237,62 @@ class ACLineSegment(Conductor):
 
     def setClamp(self, value):
         for x in self._Clamp:
-            x.ACLineSegment = None
-        for y in value:
-            y._ACLineSegment = self
-        self._Clamp = value
+            x._ACLineSegment = None
+        self._Clamp = RefList()
+        self.addClamp(value)
 
     Clamp = property(getClamp, setClamp)
 
     def addClamp(self, *Clamp):
-        for obj in Clamp:
-            obj.ACLineSegment = self
+        collection = self._Clamp
+        for obj in members(Clamp):
+            old = obj._ACLineSegment
+            if old is not None and old is not self:
+                old._Clamp.discard(obj)
+            obj._ACLineSegment = self
+            collection.append(obj)
 
     def removeClamp(self, *Clamp):
-        for obj in Clamp:
-            obj.ACLineSegment = None
+        collection = self._Clamp
+        for obj in members(Clamp):
+            if obj._ACLineSegment is self:
+                obj._ACLineSegment = None
+                collection.discard(obj)
+
+    def removeAllClamp(self):
+        for obj in self._Clamp:
+            obj._ACLineSegment = None
+        self._Clamp = RefList()
 
     def getACLineSegmentPhases(self):
         return self._ACLineSegmentPhases
 
     def setACLineSegmentPhases(self, value):
         for x in self._ACLineSegmentPhases:
-            x.ACLineSegment = None
-        for y in value:
-            y._ACLineSegment = self
-        self._ACLineSegmentPhases = value
+            x._ACLineSegment = None
+        self._ACLineSegmentPhases = RefList()
+        self.addACLineSegmentPhases(value)
 
     ACLineSegmentPhases = property(getACLineSegmentPhases, setACLineSegmentPhases)
 
     def addACLineSegmentPhases(self, *ACLineSegmentPhases):
-        for obj in ACLineSegmentPhases:
-            obj.ACLineSegment = self
+        collection = self._ACLineSegmentPhases
+        for obj in members(ACLineSegmentPhases):
+            old = obj._ACLineSegment
+            if old is not None and old is not self:
+                old._ACLineSegmentPhases.discard(obj)
+            obj._ACLineSegment = self
+            collection.append(obj)
 
     def removeACLineSegmentPhases(self, *ACLineSegmentPhases):
-        for obj in ACLineSegmentPhases:
-            obj.ACLineSegment = None
+        collection = self._ACLineSegmentPhases
+        for obj in members(ACLineSegmentPhases):
+            if obj._ACLineSegment is self:
+                obj._ACLineSegment = None
+                collection.discard(obj)
+
+    def removeAllACLineSegmentPhases(self):
+        for obj in self._ACLineSegmentPhases:
+            obj._ACLineSegment = None
+        self._ACLineSegmentPhases = RefList()
 
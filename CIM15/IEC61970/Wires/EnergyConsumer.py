@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system modelGeneric user of energy - a  point of consumption on the power system model
@@ -52,7 +53,7 @@ class EnergyConsumer(ConductingEquipment):
         #: Reactive power of the load that is a fixed quantity. Load sign convention is used, i.e. positive sign means flow out from a node.
         self.qfixed = qfixed
 
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
         self._LoadResponse = None
@@ -61,7 +62,7 @@ class EnergyConsumer(ConductingEquipment):
         self._PowerCutZone = None
         self.PowerCutZone = PowerCutZone
 
-        self._EnergyConsumerPhases = []
+        self._EnergyConsumerPhases = RefList()
         self.EnergyConsumerPhases = [] if EnergyConsumerPhases is None else EnergyConsumerPhases
 
         super(EnergyConsumer, self).__init__(*args, **kw_args)
@@ -79,20 +80,32 @@ class EnergyConsumer(ConductingEquipment):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.EnergyConsumer = None
-        for y in value:
-            y._EnergyConsumer = self
-        self._ServiceDeliveryPoints = value
+            x._EnergyConsumer = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.EnergyConsumer = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._EnergyConsumer
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._EnergyConsumer = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.EnergyConsumer = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._EnergyConsumer is self:
+                obj._EnergyConsumer = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._EnergyConsumer = None
+        self._ServiceDeliveryPoints = RefList()
 
     def getLoadResponse(self):
         """The load response characteristic of this load.
@@ -101,8 +114,7 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
@@ -118,8 +130,7 @@ class EnergyConsumer(ConductingEquipment):
 
     def setPowerCutZone(self, value):
         if self._PowerCutZone is not None:
-            filtered = [x for x in self.PowerCutZone.EnergyConsumers if x != self]
-            self._PowerCutZone._EnergyConsumers = filtered
+            self._PowerCutZone._EnergyConsumers.discard(self)
 
         self._PowerCutZone = value
         if self._PowerCutZone is not None:
@@ -134,18 +145,30 @@ class EnergyConsumer(ConductingEquipment):
 
     def setEnergyConsumerPhases(self, value):
         for x in self._EnergyConsumerPhases:
-            x.EnergyConsumer = None
-        for y in value:
-            y._EnergyConsumer = self
-        self._EnergyConsumerPhases = value
+            x._EnergyConsumer = None
+        self._EnergyConsumerPhases = RefList()
+        self.addEnergyConsumerPhases(value)
 
     EnergyConsumerPhases = property(getEnergyConsumerPhases, setEnergyConsumerPhases)
 
     def addEnergyConsumerPhases(self, *EnergyConsumerPhases):
-        for obj in EnergyConsumerPhases:
-            obj.EnergyConsumer = self
+        collection = self._EnergyConsumerPhases
+        for obj in members(EnergyConsumerPhases):
+            old = obj._EnergyConsumer
+            if old is not None and old is not self:
+                old._EnergyConsumerPhases.discard(obj)
+            obj._EnergyConsumer = self
+            collection.append(obj)
 
     def removeEnergyConsumerPhases(self, *EnergyConsumerPhases):
-        for obj in EnergyConsumerPhases:
-            obj.EnergyConsumer = None
+        collection = self._EnergyConsumerPhases
+        for obj in members(EnergyConsumerPhases):
+            if obj._EnergyConsumer is self:
+                obj._EnergyConsumer = None
+                collection.discard(obj)
+
+    def removeAllEnergyConsumerPhases(self):
+        for obj in self._EnergyConsumerPhases:
+            obj._EnergyConsumer = None
+        self._EnergyConsumerPhases = RefList()
 
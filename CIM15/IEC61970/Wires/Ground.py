@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class Ground(ConductingEquipment):
     """A common point for connecting grounded conducting equipment such as shunt capacitors. The power system model can have more than one ground.A common point for connecting grounded conducting equipment such as shunt capacitors. The power system model can have more than one ground.
@@ -29,7 +30,7 @@ class Ground(ConductingEquipment):
 
         @param WindingInsulations:
         """
-        self._WindingInsulations = []
+        self._WindingInsulations = RefList()
         self.WindingInsulations = [] if WindingInsulations is None else WindingInsulations
 
         super(Ground, self).__init__(*args, **kw_args)
@@ -47,18 +48,30 @@ class Ground(ConductingEquipment):
 
     def setWindingInsulations(self, value):
         for x in self._WindingInsulations:
-            x.Ground = None
-        for y in value:
-            y._Ground = self
-        self._WindingInsulations = value
+            x._Ground = None
+        self._WindingInsulations = RefList()
+        self.addWindingInsulations(value)
 
     WindingInsulations = property(getWindingInsulations, setWindingInsulations)
 
     def addWindingInsulations(self, *WindingInsulations):
-        for obj in WindingInsulations:
-            obj.Ground = self
+        collection = self._WindingInsulations
+        for obj in members(WindingInsulations):
+            old = obj._Ground
+            if old is not None and old is not self:
+                old._WindingInsulations.discard(obj)
+            obj._Ground = self
+            collection.append(obj)
 
     def removeWindingInsulations(self, *WindingInsulations):
-        for obj in WindingInsulations:
-            obj.Ground = None
+        collection = self._WindingInsulations
+        for obj in members(WindingInsulations):
+            if obj._Ground is self:
+                obj._Ground = None
+                collection.discard(obj)
+
+    def removeAllWindingInsulations(self):
+        for obj in self._WindingInsulations:
+            obj._Ground = None
+        self._WindingInsulations = RefList()
 
@@ -84,8 +84,7 @@ class MutualCoupling(IdentifiedObject):
 
     def setFirst_Terminal(self, value):
         if self._First_Terminal is not None:
-            filtered = [x for x in self.First_Terminal.HasFirst_MutualCoupling if x != self]
-            self._First_Terminal._HasFirst_MutualCoupling = filtered
+            self._First_Terminal._HasFirst_MutualCoupling.discard(self)
 
         self._First_Terminal = value
         if self._First_Terminal is not None:
@@ -101,8 +100,7 @@ class MutualCoupling(IdentifiedObject):
 
     def setSecond_Terminal(self, value):
         if self._Second_Terminal is not None:
-            filtered = [x for x in self.Second_Terminal.HasSecond_MutualCoupling if x != self]
-            self._Second_Terminal._HasSecond_MutualCoupling = filtered
+            self._Second_Terminal._HasSecond_MutualCoupling.discard(self)
 
         self._Second_Terminal = value
         if self._Second_Terminal is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -34,10 +35,10 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         #: Number of phase, neutral, and other wires retained. Constrains the number of matrix elements and the phase codes that can be used with this matrix.
         self.conductorCount = conductorCount
 
-        self._LineSegments = []
+        self._LineSegments = RefList()
         self.LineSegments = [] if LineSegments is None else LineSegments
 
-        self._PhaseImpedanceData = []
+        self._PhaseImpedanceData = RefList()
         self.PhaseImpedanceData = [] if PhaseImpedanceData is None else PhaseImpedanceData
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
@@ -56,20 +57,32 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
     def setLineSegments(self, value):
         for x in self._LineSegments:
-            x.PhaseImpedance = None
-        for y in value:
-            y._PhaseImpedance = self
-        self._LineSegments = value
+            x._PhaseImpedance = None
+        self._LineSegments = RefList()
+        self.addLineSegments(value)
 
     LineSegments = property(getLineSegments, setLineSegments)
 
     def addLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.PhaseImpedance = self
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            old = obj._PhaseImpedance
+            if old is not None and old is not self:
+                old._LineSegments.discard(obj)
+            obj._PhaseImpedance = self
+            collection.append(obj)
 
     def removeLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.PhaseImpedance = None
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            if obj._PhaseImpedance is self:
+                obj._PhaseImpedance = None
+                collection.discard(obj)
+
+    def removeAllLineSegments(self):
+        for obj in self._LineSegments:
+            obj._PhaseImpedance = None
+        self._LineSegments = RefList()
 
     def getPhaseImpedanceData(self):
         """All data that belong to this conductor phase impedance.
@@ -78,18 +91,30 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
     def setPhaseImpedanceData(self, value):
         for x in self._PhaseImpedanceData:
-            x.PhaseImpedance = None
-        for y in value:
-            y._PhaseImpedance = self
-        self._PhaseImpedanceData = value
+            x._PhaseImpedance = None
+        self._PhaseImpedanceData = RefList()
+        self.addPhaseImpedanceData(value)
 
     PhaseImpedanceData = property(getPhaseImpedanceData, setPhaseImpedanceData)
 
     def addPhaseImpedanceData(self, *PhaseImpedanceData):
-        for obj in PhaseImpedanceData:
-            obj.PhaseImpedance = self
+        collection = self._PhaseImpedanceData
+        for obj in members(PhaseImpedanceData):
+            old = obj._PhaseImpedance
+            if old is not None and old is not self:
+                old._PhaseImpedanceData.discard(obj)
+            obj._PhaseImpedance = self
+            collection.append(obj)
 
     def removePhaseImpedanceData(self, *PhaseImpedanceData):
-        for obj in PhaseImpedanceData:
-            obj.PhaseImpedance = None
+        collection = self._PhaseImpedanceData
+        for obj in members(PhaseImpedanceData):
+            if obj._PhaseImpedance is self:
+                obj._PhaseImpedance = None
+                collection.discard(obj)
+
+    def removeAllPhaseImpedanceData(self):
+        for obj in self._PhaseImpedanceData:
+            obj._PhaseImpedance = None
+        self._PhaseImpedanceData = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class PerLengthSequenceImpedance(IdentifiedObject):
     """Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.
@@ -61,7 +62,7 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         #: Zero sequence series reactance, per unit of length.
         self.x0 = x0
 
-        self._LineSegments = []
+        self._LineSegments = RefList()
         self.LineSegments = [] if LineSegments is None else LineSegments
 
         super(PerLengthSequenceImpedance, self).__init__(*args, **kw_args)
@@ -80,18 +81,30 @@ class PerLengthSequenceImpedance(IdentifiedObject):
 
     def setLineSegments(self, value):
         for x in self._LineSegments:
-            x.SequenceImpedance = None
-        for y in value:
-            y._SequenceImpedance = self
-        self._LineSegments = value
+            x._SequenceImpedance = None
+        self._LineSegments = RefList()
+        self.addLineSegments(value)
 
     LineSegments = property(getLineSegments, setLineSegments)
 
     def addLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.SequenceImpedance = self
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            old = obj._SequenceImpedance
+            if old is not None and old is not self:
+                old._LineSegments.discard(obj)
+            obj._SequenceImpedance = self
+            collection.append(obj)
 
     def removeLineSegments(self, *LineSegments):
-        for obj in LineSegments:
-            obj.SequenceImpedance = None
+        collection = self._LineSegments
+        for obj in members(LineSegments):
+            if obj._SequenceImpedance is self:
+                obj._SequenceImpedance = None
+                collection.discard(obj)
+
+    def removeAllLineSegments(self):
+        for obj in self._LineSegments:
+            obj._SequenceImpedance = None
+        self._LineSegments = RefList()
 
@@ -51,8 +51,7 @@ class PhaseTapChanger(TapChanger):
 
     def setPhaseTapChangerTabular(self, value):
         if self._PhaseTapChangerTabular is not None:
-            filtered = [x for x in self.PhaseTapChangerTabular.PhaseTapChanger if x != self]
-            self._PhaseTapChangerTabular._PhaseTapChanger = filtered
+            self._PhaseTapChangerTabular._PhaseTapChanger.discard(self)
 
         self._PhaseTapChangerTabular = value
         if self._PhaseTapChangerTabular is not None:
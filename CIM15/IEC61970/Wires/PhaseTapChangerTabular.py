@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class PhaseTapChangerTabular(Element):
     """With PhaseTapChangerTabular it is possible to describe curve how the the phase angle difference and reactance varies with the tap step.With PhaseTapChangerTabular it is possible to describe curve how the the phase angle difference and reactance varies with the tap step.
@@ -30,10 +31,10 @@ class PhaseTapChangerTabular(Element):
         @param PhaseTapChangerTabularPoint:
         @param PhaseTapChanger:
         """
-        self._PhaseTapChangerTabularPoint = []
+        self._PhaseTapChangerTabularPoint = RefList()
         self.PhaseTapChangerTabularPoint = [] if PhaseTapChangerTabularPoint is None else PhaseTapChangerTabularPoint
 
-        self._PhaseTapChanger = []
+        self._PhaseTapChanger = RefList()
         self.PhaseTapChanger = [] if PhaseTapChanger is None else PhaseTapChanger
 
         super(PhaseTapChangerTabular, self).__init__(*args, **kw_args)
@@ -51,20 +52,32 @@ class PhaseTapChangerTabular(Element):
 
     def setPhaseTapChangerTabularPoint(self, value):
         for x in self._PhaseTapChangerTabularPoint:
-            x.PhaseTapChangerTabular = None
-        for y in value:
-            y._PhaseTapChangerTabular = self
-        self._PhaseTapChangerTabularPoint = value
+            x._PhaseTapChangerTabular = None
+        self._PhaseTapChangerTabularPoint = RefList()
+        self.addPhaseTapChangerTabularPoint(value)
 
     PhaseTapChangerTabularPoint = property(getPhaseTapChangerTabularPoint, setPhaseTapChangerTabularPoint)
 
     def addPhaseTapChangerTabularPoint(self, *PhaseTapChangerTabularPoint):
-        for obj in PhaseTapChangerTabularPoint:
-            obj.PhaseTapChangerTabular = self
+        collection = self._PhaseTapChangerTabularPoint
+        for obj in members(PhaseTapChangerTabularPoint):
+            old = obj._PhaseTapChangerTabular
+            if old is not None and old is not self:
+                old._PhaseTapChangerTabularPoint.discard(obj)
+            obj._PhaseTapChangerTabular = self
+            collection.append(obj)
 
     def removePhaseTapChangerTabularPoint(self, *PhaseTapChangerTabularPoint):
-        for obj in PhaseTapChangerTabularPoint:
-            obj.PhaseTapChangerTabular = None
+        collection = self._PhaseTapChangerTabularPoint
+        for obj in members(PhaseTapChangerTabularPoint):
+            if obj._PhaseTapChangerTabular is self:
+                obj._PhaseTapChangerTabular = None
+                collection.discard(obj)
+
+    def removeAllPhaseTapChangerTabularPoint(self):
+        for obj in self._PhaseTapChangerTabularPoint:
+            obj._PhaseTapChangerTabular = None
+        self._PhaseTapChangerTabularPoint = RefList()
 
     def getPhaseTapChanger(self):
         
@@ -72,18 +85,30 @@ class PhaseTapChangerTabular(Element):
 
     def setPhaseTapChanger(self, value):
         for x in self._PhaseTapChanger:
-            x.PhaseTapChangerTabular = None
-        for y in value:
-            y._PhaseTapChangerTabular = self
-        self._PhaseTapChanger = value
+            x._PhaseTapChangerTabular = None
+        self._PhaseTapChanger = RefList()
+        self.addPhaseTapChanger(value)
 
     PhaseTapChanger = property(getPhaseTapChanger, setPhaseTapChanger)
 
     def addPhaseTapChanger(self, *PhaseTapChanger):
-        for obj in PhaseTapChanger:
-            obj.PhaseTapChangerTabular = self
+        collection = self._PhaseTapChanger
+        for obj in members(PhaseTapChanger):
+            old = obj._PhaseTapChangerTabular
+            if old is not None and old is not self:
+                old._PhaseTapChanger.discard(obj)
+            obj._PhaseTapChangerTabular = self
+            collection.append(obj)
 
     def removePhaseTapChanger(self, *PhaseTapChanger):
-        for obj in PhaseTapChanger:
-            obj.PhaseTapChangerTabular = None
+        collection = self._PhaseTapChanger
+        for obj in members(PhaseTapChanger):
+            if obj._PhaseTapChangerTabular is self:
+                obj._PhaseTapChangerTabular = None
+                collection.discard(obj)
+
+    def removeAllPhaseTapChanger(self):
+        for obj in self._PhaseTapChanger:
+            obj._PhaseTapChangerTabular = None
+        self._PhaseTapChanger = RefList()
 
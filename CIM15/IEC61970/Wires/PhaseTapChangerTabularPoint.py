@@ -59,8 +59,7 @@ class PhaseTapChangerTabularPoint(Element):
 
     def setPhaseTapChangerTabular(self, value):
         if self._PhaseTapChangerTabular is not None:
-            filtered = [x for x in self.PhaseTapChangerTabular.PhaseTapChangerTabularPoint if x != self]
-            self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint = filtered
+            self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint.discard(self)
 
         self._PhaseTapChangerTabular = value
         if self._PhaseTapChangerTabular is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class PowerTransformer(ConductingEquipment):
     """An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow). A power transformer may be composed of separate transformer tanks that need not be identical. The same power transformer can be modelled in two ways, namely with and without tanks: <ol> 	<li>The power transformer that uses power transformer ends directly (without tanks) is suitable for balanced three-phase models. This is typical for transmission and sub-transmission network modelling. Such a transformer will require one power transformer end for each physical winding. There must be a one-to-one association between PowerTransformerEnd and Core::Terminal.</li> 	<li>The power transformer that uses transformer tanks is suitable for an unbalanced transformer, a balanced transformer within a single tank, or a balanced transformer made up of three tanks. This is typical for distribution network modelling and the only choice when modelling an unbalanced transformer, or a transformer that has more than three windings. Power transformer modelled with tanks will require for each tank, one transformer tank end per physical winding in the tank. There may be one, two, or three phases in the transformer tank end.  Examples: 3 phases for 3-phase delta or wye connected windings, 2 for one phase-to-phase winding, and 1 for a phase-to-neutral or phase-to-ground winding.  With 1 or 2 phases, more than one transformer tank end may be associated to the same 3-phase Core::Terminal instance, while with 3 phases there should be a one-to-one association.</li> </ol> This power transformer model is flexible in order to support different kinds of data exchange requirements. There are 5 possible ways to combine available classes and their attributes: <ol> 	<li>Instance parameters - Use the r, x, r0, x0, b, b0, g, and g0 attributes on PowerTransformerEnd and ignore related TransformerStarImpedance, TransformerMeshImpedance, or TransformerCoreAdmittance. This option assumes a star connection of the series impedances. It is suitable for typical transmission, balanced three-phase transformer models, for transformers with 2 or three windings.</li> 	<li>Star instance parameters by association - Instead of the r, x, r0, x0, b, b0, g, and g0 attributes, use associations to TransformerStarImpedance and TransformerCoreAdmitance. This option is suitable in same scenarios as option 1, but when catalogue data is available for transformers.</li> 	<li>Mesh instance parameters by association: Instead of the r, x, r0, x0, b, b0, g, and g0 attributes, use associations to TransformerMeshImpedance and TransformerCoreAdmittance. This option supports transformers with more than three windings.</li> 	<li>Catalog mesh parameters by association - Instead of attributes r, x, r0, x0, b, b0, g, and g0 and associations to TransformerStarImpedance, TransformerMeshImpedance, or TransformerCoreAdmittance, use the association to TransformerEndInfo. The TransformerEnd.endNumber should match the corresponding TransformerEndInfo.endNumber, following the IEC standard convention of numbering from the highest voltage ends to the lowest, starting at 1. This matching supports higher-level use of a catalog, through just one association between TransformerTank and TransformerTankInfo, with simpler exchanges and incremental updates. The associated TransformerEndInfo will have associations to TransformerMeshImpedance and TransformerCoreAdmittance. This option supports unbalanced transformer, with more than three windings and is suitable whenever the transformer test data has been converted to an electrical model.</li> 	<li>Catalog test data by association - This is the same as option 4, except TransformerEndInfo will have associations to AssetModels::TransformerTest decendents, instead of to TransformerMeshImpedance and TransformerCoreAdmittance.  This option is suitable when the test data is available, and the receiving application is able to interpret the test data.</li> </ol> Every profile should specify which one or more of these options are supported.An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow). A power transformer may be composed of separate transformer tanks that need not be identical. The same power transformer can be modelled in two ways, namely with and without tanks: <ol> 	<li>The power transformer that uses power transformer ends directly (without tanks) is suitable for balanced three-phase models. This is typical for transmission and sub-transmission network modelling. Such a transformer will require one power transformer end for each physical winding. There must be a one-to-one association between PowerTransformerEnd and Core::Terminal.</li> 	<li>The power transformer that uses transformer tanks is suitable for an unbalanced transformer, a balanced transformer within a single tank, or a balanced transformer made up of three tanks. This is typical for distribution network modelling and the only choice when modelling an unbalanced transformer, or a transformer that has more than three windings. Power transformer modelled with tanks will require for each tank, one transformer tank end per physical winding in the tank. There may be one, two, or three phases in the transformer tank end.  Examples: 3 phases for 3-phase delta or wye connected windings, 2 for one phase-to-phase winding, and 1 for a phase-to-neutral or phase-to-ground winding.  With 1 or 2 phases, more than one transformer tank end may be associated to the same 3-phase Core::Terminal instance, while with 3 phases there should be a one-to-one association.</li> </ol> This power transformer model is flexible in order to support different kinds of data exchange requirements. There are 5 possible ways to combine available classes and their attributes: <ol> 	<li>Instance parameters - Use the r, x, r0, x0, b, b0, g, and g0 attributes on PowerTransformerEnd and ignore related TransformerStarImpedance, TransformerMeshImpedance, or TransformerCoreAdmittance. This option assumes a star connection of the series impedances. It is suitable for typical transmission, balanced three-phase transformer models, for transformers with 2 or three windings.</li> 	<li>Star instance parameters by association - Instead of the r, x, r0, x0, b, b0, g, and g0 attributes, use associations to TransformerStarImpedance and TransformerCoreAdmitance. This option is suitable in same scenarios as option 1, but when catalogue data is available for transformers.</li> 	<li>Mesh instance parameters by association: Instead of the r, x, r0, x0, b, b0, g, and g0 attributes, use associations to TransformerMeshImpedance and TransformerCoreAdmittance. This option supports transformers with more than three windings.</li> 	<li>Catalog mesh parameters by association - Instead of attributes r, x, r0, x0, b, b0, g, and g0 and associations to TransformerStarImpedance, TransformerMeshImpedance, or TransformerCoreAdmittance, use the association to TransformerEndInfo. The TransformerEnd.endNumber should match the corresponding TransformerEndInfo.endNumber, following the IEC standard convention of numbering from the highest voltage ends to the lowest, starting at 1. This matching supports higher-level use of a catalog, through just one association between TransformerTank and TransformerTankInfo, with simpler exchanges and incremental updates. The associated TransformerEndInfo will have associations to TransformerMeshImpedance and TransformerCoreAdmittance. This option supports unbalanced transformer, with more than three windings and is suitable whenever the transformer test data has been converted to an electrical model.</li> 	<li>Catalog test data by association - This is the same as option 4, except TransformerEndInfo will have associations to AssetModels::TransformerTest decendents, instead of to TransformerMeshImpedance and TransformerCoreAdmittance.  This option is suitable when the test data is available, and the receiving application is able to interpret the test data.</li> </ol> Every profile should specify which one or more of these options are supported.
@@ -35,13 +36,13 @@ class PowerTransformer(ConductingEquipment):
         #: Vector group of the transformer for protective relaying, e.g., Dyn1. For unbalanced transformers, this may not be simply determined from the constituent winding connections.
         self.vectorGroup = vectorGroup
 
-        self._TransformerTanks = []
+        self._TransformerTanks = RefList()
         self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
 
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._PowerTransformerEnd = []
+        self._PowerTransformerEnd = RefList()
         self.PowerTransformerEnd = [] if PowerTransformerEnd is None else PowerTransformerEnd
 
         super(PowerTransformer, self).__init__(*args, **kw_args)
@@ -60,20 +61,32 @@ class PowerTransformer(ConductingEquipment):
 
     def setTransformerTanks(self, value):
         for x in self._TransformerTanks:
-            x.PowerTransformer = None
-        for y in value:
-            y._PowerTransformer = self
-        self._TransformerTanks = value
+            x._PowerTransformer = None
+        self._TransformerTanks = RefList()
+        self.addTransformerTanks(value)
 
     TransformerTanks = property(getTransformerTanks, setTransformerTanks)
 
     def addTransformerTanks(self, *TransformerTanks):
-        for obj in TransformerTanks:
-            obj.PowerTransformer = self
+        collection = self._TransformerTanks
+        for obj in members(TransformerTanks):
+            old = obj._PowerTransformer
+            if old is not None and old is not self:
+                old._TransformerTanks.discard(obj)
+            obj._PowerTransformer = self
+            collection.append(obj)
 
     def removeTransformerTanks(self, *TransformerTanks):
-        for obj in TransformerTanks:
-            obj.PowerTransformer = None
+        collection = self._TransformerTanks
+        for obj in members(TransformerTanks):
+            if obj._PowerTransformer is self:
+                obj._PowerTransformer = None
+                collection.discard(obj)
+
+    def removeAllTransformerTanks(self):
+        for obj in self._TransformerTanks:
+            obj._PowerTransformer = None
+        self._TransformerTanks = RefList()
 
     def getPowerTransformerInfo(self):
         """Power transformer data.
@@ -82,8 +95,7 @@ class PowerTransformer(ConductingEquipment):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.PowerTransformers if x != self]
-            self._PowerTransformerInfo._PowerTransformers = filtered
+            self._PowerTransformerInfo._PowerTransformers.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
@@ -98,18 +110,30 @@ class PowerTransformer(ConductingEquipment):
 
     def setPowerTransformerEnd(self, value):
         for x in self._PowerTransformerEnd:
-            x.PowerTransformer = None
-        for y in value:
-            y._PowerTransformer = self
-        self._PowerTransformerEnd = value
+            x._PowerTransformer = None
+        self._PowerTransformerEnd = RefList()
+        self.addPowerTransformerEnd(value)
 
     PowerTransformerEnd = property(getPowerTransformerEnd, setPowerTransformerEnd)
 
     def addPowerTransformerEnd(self, *PowerTransformerEnd):
-        for obj in PowerTransformerEnd:
-            obj.PowerTransformer = self
+        collection = self._PowerTransformerEnd
+        for obj in members(PowerTransformerEnd):
+            old = obj._PowerTransformer
+            if old is not None and old is not self:
+                old._PowerTransformerEnd.discard(obj)
+            obj._PowerTransformer = self
+            collection.append(obj)
 
     def removePowerTransformerEnd(self, *PowerTransformerEnd):
-        for obj in PowerTransformerEnd:
-            obj.PowerTransformer = None
+        collection = self._PowerTransformerEnd
+        for obj in members(PowerTransformerEnd):
+            if obj._PowerTransformer is self:
+                obj._PowerTransformer = None
+                collection.discard(obj)
+
+    def removeAllPowerTransformerEnd(self):
+        for obj in self._PowerTransformerEnd:
+            obj._PowerTransformer = None
+        self._PowerTransformerEnd = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.Switch import Switch
+from PyCIM.RefList import RefList, members
 
 class ProtectedSwitch(Switch):
     """A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.
@@ -34,10 +35,10 @@ class ProtectedSwitch(Switch):
         #: The maximum fault current a breaking device can break safely under prescribed conditions of use.
         self.breakingCapacity = breakingCapacity
 
-        self._ProtectionEquipments = []
+        self._ProtectionEquipments = RefList()
         self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
 
-        self._RecloseSequences = []
+        self._RecloseSequences = RefList()
         self.RecloseSequences = [] if RecloseSequences is None else RecloseSequences
 
         super(ProtectedSwitch, self).__init__(*args, **kw_args)
@@ -56,26 +57,28 @@ class ProtectedSwitch(Switch):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ProtectedSwitches if q != self]
-            self._ProtectionEquipments._ProtectedSwitches = filtered
-        for r in value:
-            if self not in r._ProtectedSwitches:
-                r._ProtectedSwitches.append(self)
-        self._ProtectionEquipments = value
+            p._ProtectedSwitches.discard(self)
+        self._ProtectionEquipments = RefList()
+        self.addProtectionEquipments(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            if self not in obj._ProtectedSwitches:
-                obj._ProtectedSwitches.append(self)
-            self._ProtectionEquipments.append(obj)
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            obj._ProtectedSwitches.append(self)
+            collection.append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
-        for obj in ProtectionEquipments:
-            if self in obj._ProtectedSwitches:
-                obj._ProtectedSwitches.remove(self)
-            self._ProtectionEquipments.remove(obj)
+        collection = self._ProtectionEquipments
+        for obj in members(ProtectionEquipments):
+            obj._ProtectedSwitches.discard(self)
+            collection.discard(obj)
+
+    def removeAllProtectionEquipments(self):
+        for obj in self._ProtectionEquipments:
+            obj._ProtectedSwitches.discard(self)
+        self._ProtectionEquipments = RefList()
 
     def getRecloseSequences(self):
         """A breaker may have zero or more automatic reclosures after a trip occurs.
@@ -84,18 +87,30 @@ class ProtectedSwitch(Switch):
 
     def setRecloseSequences(self, value):
         for x in self._RecloseSequences:
-            x.ProtectedSwitch = None
-        for y in value:
-            y._ProtectedSwitch = self
-        self._RecloseSequences = value
+            x._ProtectedSwitch = None
+        self._RecloseSequences = RefList()
+        self.addRecloseSequences(value)
 
     RecloseSequences = property(getRecloseSequences, setRecloseSequences)
 
     def addRecloseSequences(self, *RecloseSequences):
-        for obj in RecloseSequences:
-            obj.ProtectedSwitch = self
+        collection = self._RecloseSequences
+        for obj in members(RecloseSequences):
+            old = obj._ProtectedSwitch
+            if old is not None and old is not self:
+                old._RecloseSequences.discard(obj)
+            obj._ProtectedSwitch = self
+            collection.append(obj)
 
     def removeRecloseSequences(self, *RecloseSequences):
-        for obj in RecloseSequences:
-            obj.ProtectedSwitch = None
+        collection = self._RecloseSequences
+        for obj in members(RecloseSequences):
+            if obj._ProtectedSwitch is self:
+                obj._ProtectedSwitch = None
+                collection.discard(obj)
+
+    def removeAllRecloseSequences(self):
+        for obj in self._RecloseSequences:
+            obj._ProtectedSwitch = None
+        self._RecloseSequences = RefList()
 
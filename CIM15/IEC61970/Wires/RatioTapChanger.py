@@ -59,8 +59,7 @@ class RatioTapChanger(TapChanger):
 
     def setRatioTapChangerTabular(self, value):
         if self._RatioTapChangerTabular is not None:
-            filtered = [x for x in self.RatioTapChangerTabular.RatioTapChanger if x != self]
-            self._RatioTapChangerTabular._RatioTapChanger = filtered
+            self._RatioTapChangerTabular._RatioTapChanger.discard(self)
 
         self._RatioTapChangerTabular = value
         if self._RatioTapChangerTabular is not None:
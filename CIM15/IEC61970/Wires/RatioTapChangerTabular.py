@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.Element import Element
+from PyCIM.RefList import RefList, members
 
 class RatioTapChangerTabular(Element):
     """With RatioTapChangerTabular it is possible to describe curve how the voltage magnitude and reactance varies with the tap step.With RatioTapChangerTabular it is possible to describe curve how the voltage magnitude and reactance varies with the tap step.
@@ -30,10 +31,10 @@ class RatioTapChangerTabular(Element):
         @param RatioTapChangerTabularPoint:
         @param RatioTapChanger:
         """
-        self._RatioTapChangerTabularPoint = []
+        self._RatioTapChangerTabularPoint = RefList()
         self.RatioTapChangerTabularPoint = [] if RatioTapChangerTabularPoint is None else RatioTapChangerTabularPoint
 
-        self._RatioTapChanger = []
+        self._RatioTapChanger = RefList()
         self.RatioTapChanger = [] if RatioTapChanger is None else RatioTapChanger
 
         super(RatioTapChangerTabular, self).__init__(*args, **kw_args)
@@ -51,20 +52,32 @@ class RatioTapChangerTabular(Element):
 
     def setRatioTapChangerTabularPoint(self, value):
         for x in self._RatioTapChangerTabularPoint:
-            x.RatioTapChangerTabular = None
-        for y in value:
-            y._RatioTapChangerTabular = self
-        self._RatioTapChangerTabularPoint = value
+            x._RatioTapChangerTabular = None
+        self._RatioTapChangerTabularPoint = RefList()
+        self.addRatioTapChangerTabularPoint(value)
 
     RatioTapChangerTabularPoint = property(getRatioTapChangerTabularPoint, setRatioTapChangerTabularPoint)
 
     def addRatioTapChangerTabularPoint(self, *RatioTapChangerTabularPoint):
-        for obj in RatioTapChangerTabularPoint:
-            obj.RatioTapChangerTabular = self
+        collection = self._RatioTapChangerTabularPoint
+        for obj in members(RatioTapChangerTabularPoint):
+            old = obj._RatioTapChangerTabular
+            if old is not None and old is not self:
+                old._RatioTapChangerTabularPoint.discard(obj)
+            obj._RatioTapChangerTabular = self
+            collection.append(obj)
 
     def removeRatioTapChangerTabularPoint(self, *RatioTapChangerTabularPoint):
-        for obj in RatioTapChangerTabularPoint:
-            obj.RatioTapChangerTabular = None
+        collection = self._RatioTapChangerTabularPoint
+        for obj in members(RatioTapChangerTabularPoint):
+            if obj._RatioTapChangerTabular is self:
+                obj._RatioTapChangerTabular = None
+                collection.discard(obj)
+
+    def removeAllRatioTapChangerTabularPoint(self):
+        for obj in self._RatioTapChangerTabularPoint:
+            obj._RatioTapChangerTabular = None
+        self._RatioTapChangerTabularPoint = RefList()
 
     def getRatioTapChanger(self):
         
@@ -72,18 +85,30 @@ class RatioTapChangerTabular(Element):
 
     def setRatioTapChanger(self, value):
         for x in self._RatioTapChanger:
-            x.RatioTapChangerTabular = None
-        for y in value:
-            y._RatioTapChangerTabular = self
-        self._RatioTapChanger = value
+            x._RatioTapChangerTabular = None
+        self._RatioTapChanger = RefList()
+        self.addRatioTapChanger(value)
 
     RatioTapChanger = property(getRatioTapChanger, setRatioTapChanger)
 
     def addRatioTapChanger(self, *RatioTapChanger):
-        for obj in RatioTapChanger:
-            obj.RatioTapChangerTabular = self
+        collection = self._RatioTapChanger
+        for obj in members(RatioTapChanger):
+            old = obj._RatioTapChangerTabular
+            if old is not None and old is not self:
+                old._RatioTapChanger.discard(obj)
+            obj._RatioTapChangerTabular = self
+            collection.append(obj)
 
     def removeRatioTapChanger(self, *RatioTapChanger):
-        for obj in RatioTapChanger:
-            obj.RatioTapChangerTabular = None
+        collection = self._RatioTapChanger
+        for obj in members(RatioTapChanger):
+            if obj._RatioTapChangerTabular is self:
+                obj._RatioTapChangerTabular = None
+                collection.discard(obj)
+
+    def removeAllRatioTapChanger(self):
+        for obj in self._RatioTapChanger:
+            obj._RatioTapChangerTabular = None
+        self._RatioTapChanger = RefList()
 
@@ -59,8 +59,7 @@ class RatioTapChangerTabularPoint(Element):
 
     def setRatioTapChangerTabular(self, value):
         if self._RatioTapChangerTabular is not None:
-            filtered = [x for x in self.RatioTapChangerTabular.RatioTapChangerTabularPoint if x != self]
-            self._RatioTapChangerTabular._RatioTapChangerTabularPoint = filtered
+            self._RatioTapChangerTabular._RatioTapChangerTabularPoint.discard(self)
 
         self._RatioTapChangerTabular = value
         if self._RatioTapChangerTabular is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class RegulatingCondEq(ConductingEquipment):
     """A type of conducting equipment that can regulate a quanity (i.e. voltage or flow) at a specific point in the network.A type of conducting equipment that can regulate a quanity (i.e. voltage or flow) at a specific point in the network.
@@ -30,7 +31,7 @@ class RegulatingCondEq(ConductingEquipment):
         @param Controls: The controller outputs used to actually govern a regulating device, e.g. the magnetization of a synchronous machine or capacitor bank breaker actuator.
         @param RegulatingControl: The regulating control scheme in which this equipment participates.
         """
-        self._Controls = []
+        self._Controls = RefList()
         self.Controls = [] if Controls is None else Controls
 
         self._RegulatingControl = None
@@ -52,20 +53,32 @@ class RegulatingCondEq(ConductingEquipment):
 
     def setControls(self, value):
         for x in self._Controls:
-            x.RegulatingCondEq = None
-        for y in value:
-            y._RegulatingCondEq = self
-        self._Controls = value
+            x._RegulatingCondEq = None
+        self._Controls = RefList()
+        self.addControls(value)
 
     Controls = property(getControls, setControls)
 
     def addControls(self, *Controls):
-        for obj in Controls:
-            obj.RegulatingCondEq = self
+        collection = self._Controls
+        for obj in members(Controls):
+            old = obj._RegulatingCondEq
+            if old is not None and old is not self:
+                old._Controls.discard(obj)
+            obj._RegulatingCondEq = self
+            collection.append(obj)
 
     def removeControls(self, *Controls):
-        for obj in Controls:
-            obj.RegulatingCondEq = None
+        collection = self._Controls
+        for obj in members(Controls):
+            if obj._RegulatingCondEq is self:
+                obj._RegulatingCondEq = None
+                collection.discard(obj)
+
+    def removeAllControls(self):
+        for obj in self._Controls:
+            obj._RegulatingCondEq = None
+        self._Controls = RefList()
 
     def getRegulatingControl(self):
         """The regulating control scheme in which this equipment participates.
@@ -74,8 +87,7 @@ class RegulatingCondEq(ConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -51,13 +52,13 @@ class RegulatingControl(PowerSystemResource):
         #: Phase voltage controlling this regulator, measured at regulator location. Values are: "s12N", "BN", "BC", "ABN", "s2N", "N", "ACN", "BCN", "ABCN", "AC", "s1N", "AN", "B", "AB", "C", "A", "CN", "ABC"
         self.monitoredPhase = monitoredPhase
 
-        self._RegulatingCondEq = []
+        self._RegulatingCondEq = RefList()
         self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
 
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._RegulationSchedule = []
+        self._RegulationSchedule = RefList()
         self.RegulationSchedule = [] if RegulationSchedule is None else RegulationSchedule
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
@@ -76,20 +77,32 @@ class RegulatingControl(PowerSystemResource):
 
     def setRegulatingCondEq(self, value):
         for x in self._RegulatingCondEq:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._RegulatingCondEq = value
+            x._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
+        self.addRegulatingCondEq(value)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
     def addRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = self
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._RegulatingCondEq.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeRegulatingCondEq(self, *RegulatingCondEq):
-        for obj in RegulatingCondEq:
-            obj.RegulatingControl = None
+        collection = self._RegulatingCondEq
+        for obj in members(RegulatingCondEq):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllRegulatingCondEq(self):
+        for obj in self._RegulatingCondEq:
+            obj._RegulatingControl = None
+        self._RegulatingCondEq = RefList()
 
     def getTerminal(self):
         """The terminal associated with this regulating control.
@@ -98,8 +111,7 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -115,18 +127,30 @@ class RegulatingControl(PowerSystemResource):
 
     def setRegulationSchedule(self, value):
         for x in self._RegulationSchedule:
-            x.RegulatingControl = None
-        for y in value:
-            y._RegulatingControl = self
-        self._RegulationSchedule = value
+            x._RegulatingControl = None
+        self._RegulationSchedule = RefList()
+        self.addRegulationSchedule(value)
 
     RegulationSchedule = property(getRegulationSchedule, setRegulationSchedule)
 
     def addRegulationSchedule(self, *RegulationSchedule):
-        for obj in RegulationSchedule:
-            obj.RegulatingControl = self
+        collection = self._RegulationSchedule
+        for obj in members(RegulationSchedule):
+            old = obj._RegulatingControl
+            if old is not None and old is not self:
+                old._RegulationSchedule.discard(obj)
+            obj._RegulatingControl = self
+            collection.append(obj)
 
     def removeRegulationSchedule(self, *RegulationSchedule):
-        for obj in RegulationSchedule:
-            obj.RegulatingControl = None
+        collection = self._RegulationSchedule
+        for obj in members(RegulationSchedule):
+            if obj._RegulatingControl is self:
+                obj._RegulatingControl = None
+                collection.discard(obj)
+
+    def removeAllRegulationSchedule(self):
+        for obj in self._RegulationSchedule:
+            obj._RegulatingControl = None
+        self._RegulationSchedule = RefList()
 
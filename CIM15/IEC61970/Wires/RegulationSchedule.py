@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from PyCIM.RefList import RefList, members
 
 class RegulationSchedule(SeasonDayTypeSchedule):
     """A pre-established pattern over time for a controlled variable, e.g., busbar voltage.A pre-established pattern over time for a controlled variable, e.g., busbar voltage.
@@ -33,7 +34,7 @@ class RegulationSchedule(SeasonDayTypeSchedule):
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
 
-        self._VoltageControlZones = []
+        self._VoltageControlZones = RefList()
         self.VoltageControlZones = [] if VoltageControlZones is None else VoltageControlZones
 
         super(RegulationSchedule, self).__init__(*args, **kw_args)
@@ -52,8 +53,7 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulationSchedule if x != self]
-            self._RegulatingControl._RegulationSchedule = filtered
+            self._RegulatingControl._RegulationSchedule.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
@@ -69,18 +69,30 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setVoltageControlZones(self, value):
         for x in self._VoltageControlZones:
-            x.RegulationSchedule = None
-        for y in value:
-            y._RegulationSchedule = self
-        self._VoltageControlZones = value
+            x._RegulationSchedule = None
+        self._VoltageControlZones = RefList()
+        self.addVoltageControlZones(value)
 
     VoltageControlZones = property(getVoltageControlZones, setVoltageControlZones)
 
     def addVoltageControlZones(self, *VoltageControlZones):
-        for obj in VoltageControlZones:
-            obj.RegulationSchedule = self
+        collection = self._VoltageControlZones
+        for obj in members(VoltageControlZones):
+            old = obj._RegulationSchedule
+            if old is not None and old is not self:
+                old._VoltageControlZones.discard(obj)
+            obj._RegulationSchedule = self
+            collection.append(obj)
 
     def removeVoltageControlZones(self, *VoltageControlZones):
-        for obj in VoltageControlZones:
-            obj.RegulationSchedule = None
+        collection = self._VoltageControlZones
+        for obj in members(VoltageControlZones):
+            if obj._RegulationSchedule is self:
+                obj._RegulationSchedule = None
+                collection.discard(obj)
+
+    def removeAllVoltageControlZones(self):
+        for obj in self._VoltageControlZones:
+            obj._RegulationSchedule = None
+        self._VoltageControlZones = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from PyCIM.RefList import RefList, members
 
 class ShuntCompensator(RegulatingCondEq):
     """A shunt capacitor or reactor or switchable bank of shunt capacitors or reactors. A section of a shunt compensator is an individual capacitor or reactor.  A negative value for reactivePerSection indicates that the compensator is a reactor. ShuntCompensator is a single terminal device.  Ground is implied.A shunt capacitor or reactor or switchable bank of shunt capacitors or reactors. A section of a shunt compensator is an individual capacitor or reactor.  A negative value for reactivePerSection indicates that the compensator is a reactor. ShuntCompensator is a single terminal device.  Ground is implied.
@@ -93,7 +94,7 @@ class ShuntCompensator(RegulatingCondEq):
         self._SvShuntCompensatorSections = None
         self.SvShuntCompensatorSections = SvShuntCompensatorSections
 
-        self._ShuntCompensatorPhases = []
+        self._ShuntCompensatorPhases = RefList()
         self.ShuntCompensatorPhases = [] if ShuntCompensatorPhases is None else ShuntCompensatorPhases
 
         super(ShuntCompensator, self).__init__(*args, **kw_args)
@@ -127,18 +128,30 @@ class ShuntCompensator(RegulatingCondEq):
 
     def setShuntCompensatorPhases(self, value):
         for x in self._ShuntCompensatorPhases:
-            x.ShuntCompensator = None
-        for y in value:
-            y._ShuntCompensator = self
-        self._ShuntCompensatorPhases = value
+            x._ShuntCompensator = None
+        self._ShuntCompensatorPhases = RefList()
+        self.addShuntCompensatorPhases(value)
 
     ShuntCompensatorPhases = property(getShuntCompensatorPhases, setShuntCompensatorPhases)
 
     def addShuntCompensatorPhases(self, *ShuntCompensatorPhases):
-        for obj in ShuntCompensatorPhases:
-            obj.ShuntCompensator = self
+        collection = self._ShuntCompensatorPhases
+        for obj in members(ShuntCompensatorPhases):
+            old = obj._ShuntCompensator
+            if old is not None and old is not self:
+                old._ShuntCompensatorPhases.discard(obj)
+            obj._ShuntCompensator = self
+            collection.append(obj)
 
     def removeShuntCompensatorPhases(self, *ShuntCompensatorPhases):
-        for obj in ShuntCompensatorPhases:
-            obj.ShuntCompensator = None
+        collection = self._ShuntCompensatorPhases
+        for obj in members(ShuntCompensatorPhases):
+            if obj._ShuntCompensator is self:
+                obj._ShuntCompensator = None
+                collection.discard(obj)
+
+    def removeAllShuntCompensatorPhases(self):
+        for obj in self._ShuntCompensatorPhases:
+            obj._ShuntCompensator = None
+        self._ShuntCompensatorPhases = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from PyCIM.RefList import RefList, members
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.A generic device designed to close, or open, or both, one or more electric circuits.
@@ -54,19 +55,19 @@ class Switch(ConductingEquipment):
         #: The switch on count since the switch was last reset or initialized.
         self.switchOnCount = switchOnCount
 
-        self._SwitchingOperations = []
+        self._SwitchingOperations = RefList()
         self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
 
-        self._LoadMgmtFunctions = []
+        self._LoadMgmtFunctions = RefList()
         self.LoadMgmtFunctions = [] if LoadMgmtFunctions is None else LoadMgmtFunctions
 
-        self._ConnectDisconnectFunctions = []
+        self._ConnectDisconnectFunctions = RefList()
         self.ConnectDisconnectFunctions = [] if ConnectDisconnectFunctions is None else ConnectDisconnectFunctions
 
-        self._SwitchSchedules = []
+        self._SwitchSchedules = RefList()
         self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
 
-        self._SwitchPhases = []
+        self._SwitchPhases = RefList()
         self.SwitchPhases = [] if SwitchPhases is None else SwitchPhases
 
         self._CompositeSwitch = None
@@ -88,26 +89,28 @@ class Switch(ConductingEquipment):
 
     def setSwitchingOperations(self, value):
         for p in self._SwitchingOperations:
-            filtered = [q for q in p.Switches if q != self]
-            self._SwitchingOperations._Switches = filtered
-        for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
-        self._SwitchingOperations = value
+            p._Switches.discard(self)
+        self._SwitchingOperations = RefList()
+        self.addSwitchingOperations(value)
 
     SwitchingOperations = property(getSwitchingOperations, setSwitchingOperations)
 
     def addSwitchingOperations(self, *SwitchingOperations):
-        for obj in SwitchingOperations:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._SwitchingOperations.append(obj)
+        collection = self._SwitchingOperations
+        for obj in members(SwitchingOperations):
+            obj._Switches.append(self)
+            collection.append(obj)
 
     def removeSwitchingOperations(self, *SwitchingOperations):
-        for obj in SwitchingOperations:
-            if self in obj._Switches:
-                obj._Switches.remove(self)
-            self._SwitchingOperations.remove(obj)
+        collection = self._SwitchingOperations
+        for obj in members(SwitchingOperations):
+            obj._Switches.discard(self)
+            collection.discard(obj)
+
+    def removeAllSwitchingOperations(self):
+        for obj in self._SwitchingOperations:
+            obj._Switches.discard(self)
+        self._SwitchingOperations = RefList()
 
     def getLoadMgmtFunctions(self):
         
@@ -115,26 +118,28 @@ class Switch(ConductingEquipment):
 
     def setLoadMgmtFunctions(self, value):
         for p in self._LoadMgmtFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._LoadMgmtFunctions._Switches = filtered
-        for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
-        self._LoadMgmtFunctions = value
+            p._Switches.discard(self)
+        self._LoadMgmtFunctions = RefList()
+        self.addLoadMgmtFunctions(value)
 
     LoadMgmtFunctions = property(getLoadMgmtFunctions, setLoadMgmtFunctions)
 
     def addLoadMgmtFunctions(self, *LoadMgmtFunctions):
-        for obj in LoadMgmtFunctions:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._LoadMgmtFunctions.append(obj)
+        collection = self._LoadMgmtFunctions
+        for obj in members(LoadMgmtFunctions):
+            obj._Switches.append(self)
+            collection.append(obj)
 
     def removeLoadMgmtFunctions(self, *LoadMgmtFunctions):
-        for obj in LoadMgmtFunctions:
-            if self in obj._Switches:
-                obj._Switches.remove(self)
-            self._LoadMgmtFunctions.remove(obj)
+        collection = self._LoadMgmtFunctions
+        for obj in members(LoadMgmtFunctions):
+            obj._Switches.discard(self)
+            collection.discard(obj)
+
+    def removeAllLoadMgmtFunctions(self):
+        for obj in self._LoadMgmtFunctions:
+            obj._Switches.discard(self)
+        self._LoadMgmtFunctions = RefList()
 
     def getConnectDisconnectFunctions(self):
         
@@ -142,26 +147,28 @@ class Switch(ConductingEquipment):
 
     def setConnectDisconnectFunctions(self, value):
         for p in self._ConnectDisconnectFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._ConnectDisconnectFunctions._Switches = filtered
-        for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
-        self._ConnectDisconnectFunctions = value
+            p._Switches.discard(self)
+        self._ConnectDisconnectFunctions = RefList()
+        self.addConnectDisconnectFunctions(value)
 
     ConnectDisconnectFunctions = property(getConnectDisconnectFunctions, setConnectDisconnectFunctions)
 
     def addConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
-        for obj in ConnectDisconnectFunctions:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._ConnectDisconnectFunctions.append(obj)
+        collection = self._ConnectDisconnectFunctions
+        for obj in members(ConnectDisconnectFunctions):
+            obj._Switches.append(self)
+            collection.append(obj)
 
     def removeConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
-        for obj in ConnectDisconnectFunctions:
-            if self in obj._Switches:
-                obj._Switches.remove(self)
-            self._ConnectDisconnectFunctions.remove(obj)
+        collection = self._ConnectDisconnectFunctions
+        for obj in members(ConnectDisconnectFunctions):
+            obj._Switches.discard(self)
+            collection.discard(obj)
+
+    def removeAllConnectDisconnectFunctions(self):
+        for obj in self._ConnectDisconnectFunctions:
+            obj._Switches.discard(self)
+        self._ConnectDisconnectFunctions = RefList()
 
     def getSwitchSchedules(self):
         """A Switch can be associated with SwitchSchedules.
@@ -170,20 +177,32 @@ class Switch(ConductingEquipment):
 
     def setSwitchSchedules(self, value):
         for x in self._SwitchSchedules:
-            x.Switch = None
-        for y in value:
-            y._Switch = self
-        self._SwitchSchedules = value
+            x._Switch = None
+        self._SwitchSchedules = RefList()
+        self.addSwitchSchedules(value)
 
     SwitchSchedules = property(getSwitchSchedules, setSwitchSchedules)
 
     def addSwitchSchedules(self, *SwitchSchedules):
-        for obj in SwitchSchedules:
-            obj.Switch = self
+        collection = self._SwitchSchedules
+        for obj in members(SwitchSchedules):
+            old = obj._Switch
+            if old is not None and old is not self:
+                old._SwitchSchedules.discard(obj)
+            obj._Switch = self
+            collection.append(obj)
 
     def removeSwitchSchedules(self, *SwitchSchedules):
-        for obj in SwitchSchedules:
-            obj.Switch = None
+        collection = self._SwitchSchedules
+        for obj in members(SwitchSchedules):
+            if obj._Switch is self:
+                obj._Switch = None
+                collection.discard(obj)
+
+    def removeAllSwitchSchedules(self):
+        for obj in self._SwitchSchedules:
+            obj._Switch = None
+        self._SwitchSchedules = RefList()
 
     def getSwitchPhases(self):
         
@@ -191,20 +210,32 @@ class Switch(ConductingEquipment):
 
     def setSwitchPhases(self, value):
         for x in self._SwitchPhases:
-            x.Switch = None
-        for y in value:
-            y._Switch = self
-        self._SwitchPhases = value
+            x._Switch = None
+        self._SwitchPhases = RefList()
+        self.addSwitchPhases(value)
 
     SwitchPhases = property(getSwitchPhases, setSwitchPhases)
 
     def addSwitchPhases(self, *SwitchPhases):
-        for obj in SwitchPhases:
-            obj.Switch = self
+        collection = self._SwitchPhases
+        for obj in members(SwitchPhases):
+            old = obj._Switch
+            if old is not None and old is not self:
+                old._SwitchPhases.discard(obj)
+            obj._Switch = self
+            collection.append(obj)
 
     def removeSwitchPhases(self, *SwitchPhases):
-        for obj in SwitchPhases:
-            obj.Switch = None
+        collection = self._SwitchPhases
+        for obj in members(SwitchPhases):
+            if obj._Switch is self:
+                obj._Switch = None
+                collection.discard(obj)
+
+    def removeAllSwitchPhases(self):
+        for obj in self._SwitchPhases:
+            obj._Switch = None
+        self._SwitchPhases = RefList()
 
     def getCompositeSwitch(self):
         """Composite switch this Switch belongs to
@@ -213,8 +244,7 @@ class Switch(ConductingEquipment):
 
     def setCompositeSwitch(self, value):
         if self._CompositeSwitch is not None:
-            filtered = [x for x in self.CompositeSwitch.Switches if x != self]
-            self._CompositeSwitch._Switches = filtered
+            self._CompositeSwitch._Switches.discard(self)
 
         self._CompositeSwitch = value
         if self._CompositeSwitch is not None:
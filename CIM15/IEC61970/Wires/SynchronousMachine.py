@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from PyCIM.RefList import RefList, members
 
 class SynchronousMachine(RegulatingCondEq):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -153,13 +154,13 @@ class SynchronousMachine(RegulatingCondEq):
         #: Positive sequence reactance of the synchronous machine.
         self.x = x
 
-        self._PrimeMovers = []
+        self._PrimeMovers = RefList()
         self.PrimeMovers = [] if PrimeMovers is None else PrimeMovers
 
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
 
-        self._ReactiveCapabilityCurves = []
+        self._ReactiveCapabilityCurves = RefList()
         self.ReactiveCapabilityCurves = [] if ReactiveCapabilityCurves is None else ReactiveCapabilityCurves
 
         self._HydroPump = None
@@ -184,26 +185,28 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setPrimeMovers(self, value):
         for p in self._PrimeMovers:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._PrimeMovers._SynchronousMachines = filtered
-        for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._PrimeMovers = value
+            p._SynchronousMachines.discard(self)
+        self._PrimeMovers = RefList()
+        self.addPrimeMovers(value)
 
     PrimeMovers = property(getPrimeMovers, setPrimeMovers)
 
     def addPrimeMovers(self, *PrimeMovers):
-        for obj in PrimeMovers:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._PrimeMovers.append(obj)
+        collection = self._PrimeMovers
+        for obj in members(PrimeMovers):
+            obj._SynchronousMachines.append(self)
+            collection.append(obj)
 
     def removePrimeMovers(self, *PrimeMovers):
-        for obj in PrimeMovers:
-            if self in obj._SynchronousMachines:
-                obj._SynchronousMachines.remove(self)
-            self._PrimeMovers.remove(obj)
+        collection = self._PrimeMovers
+        for obj in members(PrimeMovers):
+            obj._SynchronousMachines.discard(self)
+            collection.discard(obj)
+
+    def removeAllPrimeMovers(self):
+        for obj in self._PrimeMovers:
+            obj._SynchronousMachines.discard(self)
+        self._PrimeMovers = RefList()
 
     def getGeneratingUnit(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -212,8 +215,7 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
@@ -229,26 +231,28 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setReactiveCapabilityCurves(self, value):
         for p in self._ReactiveCapabilityCurves:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._ReactiveCapabilityCurves._SynchronousMachines = filtered
-        for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._ReactiveCapabilityCurves = value
+            p._SynchronousMachines.discard(self)
+        self._ReactiveCapabilityCurves = RefList()
+        self.addReactiveCapabilityCurves(value)
 
     ReactiveCapabilityCurves = property(getReactiveCapabilityCurves, setReactiveCapabilityCurves)
 
     def addReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
-        for obj in ReactiveCapabilityCurves:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._ReactiveCapabilityCurves.append(obj)
+        collection = self._ReactiveCapabilityCurves
+        for obj in members(ReactiveCapabilityCurves):
+            obj._SynchronousMachines.append(self)
+            collection.append(obj)
 
     def removeReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
-        for obj in ReactiveCapabilityCurves:
-            if self in obj._SynchronousMachines:
-                obj._SynchronousMachines.remove(self)
-            self._ReactiveCapabilityCurves.remove(obj)
+        collection = self._ReactiveCapabilityCurves
+        for obj in members(ReactiveCapabilityCurves):
+            obj._SynchronousMachines.discard(self)
+            collection.discard(obj)
+
+    def removeAllReactiveCapabilityCurves(self):
+        for obj in self._ReactiveCapabilityCurves:
+            obj._SynchronousMachines.discard(self)
+        self._ReactiveCapabilityCurves = RefList()
 
     def getHydroPump(self):
         """The synchronous machine drives the turbine which moves the water from a low elevation to a higher elevation. The direction of machine rotation for pumping may or may not be the same as for generating.
@@ -273,8 +277,7 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
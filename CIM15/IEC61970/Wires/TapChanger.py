@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from PyCIM.RefList import RefList, members
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.Mechanism for changing transformer winding tap positions.
@@ -71,7 +72,7 @@ class TapChanger(PowerSystemResource):
         self._TapChangerInfo = None
         self.TapChangerInfo = TapChangerInfo
 
-        self._TapSchedules = []
+        self._TapSchedules = RefList()
         self.TapSchedules = [] if TapSchedules is None else TapSchedules
 
         self._TapChangerControl = None
@@ -96,8 +97,7 @@ class TapChanger(PowerSystemResource):
 
     def setTapChangerInfo(self, value):
         if self._TapChangerInfo is not None:
-            filtered = [x for x in self.TapChangerInfo.TapChangers if x != self]
-            self._TapChangerInfo._TapChangers = filtered
+            self._TapChangerInfo._TapChangers.discard(self)
 
         self._TapChangerInfo = value
         if self._TapChangerInfo is not None:
@@ -113,20 +113,32 @@ class TapChanger(PowerSystemResource):
 
     def setTapSchedules(self, value):
         for x in self._TapSchedules:
-            x.TapChanger = None
-        for y in value:
-            y._TapChanger = self
-        self._TapSchedules = value
+            x._TapChanger = None
+        self._TapSchedules = RefList()
+        self.addTapSchedules(value)
 
     TapSchedules = property(getTapSchedules, setTapSchedules)
 
     def addTapSchedules(self, *TapSchedules):
-        for obj in TapSchedules:
-            obj.TapChanger = self
+        collection = self._TapSchedules
+        for obj in members(TapSchedules):
+            old = obj._TapChanger
+            if old is not None and old is not self:
+                old._TapSchedules.discard(obj)
+            obj._TapChanger = self
+            collection.append(obj)
 
     def removeTapSchedules(self, *TapSchedules):
-        for obj in TapSchedules:
-            obj.TapChanger = None
+        collection = self._TapSchedules
+        for obj in members(TapSchedules):
+            if obj._TapChanger is self:
+                obj._TapChanger = None
+                collection.discard(obj)
+
+    def removeAllTapSchedules(self):
+        for obj in self._TapSchedules:
+            obj._TapChanger = None
+        self._TapSchedules = RefList()
 
     def getTapChangerControl(self):
         
@@ -134,8 +146,7 @@ class TapChanger(PowerSystemResource):
 
     def setTapChangerControl(self, value):
         if self._TapChangerControl is not None:
-            filtered = [x for x in self.TapChangerControl.TapChanger if x != self]
-            self._TapChangerControl._TapChanger = filtered
+            self._TapChangerControl._TapChanger.discard(self)
 
         self._TapChangerControl = value
         if self._TapChangerControl is not None:
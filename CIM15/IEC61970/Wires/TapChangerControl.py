@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingControl import RegulatingControl
+from PyCIM.RefList import RefList, members
 
 class TapChangerControl(RegulatingControl):
     """TapChangerControl discribe behaviour specific to tap changers, e.g. how the voltage at the end of a line varies with the load level and compensation of the voltage drop by tap adjustment.TapChangerControl discribe behaviour specific to tap changers, e.g. how the voltage at the end of a line varies with the load level and compensation of the voltage drop by tap adjustment.
@@ -53,7 +54,7 @@ class TapChangerControl(RegulatingControl):
         #: Maximum allowed regulated voltage on the PT secondary base, regardless of line drop compensation. Sometimes referred to as first-house protection.
         self.limitVoltage = limitVoltage
 
-        self._TapChanger = []
+        self._TapChanger = RefList()
         self.TapChanger = [] if TapChanger is None else TapChanger
 
         super(TapChangerControl, self).__init__(*args, **kw_args)
@@ -72,18 +73,30 @@ class TapChangerControl(RegulatingControl):
 
     def setTapChanger(self, value):
         for x in self._TapChanger:
-            x.TapChangerControl = None
-        for y in value:
-            y._TapChangerControl = self
-        self._TapChanger = value
+            x._TapChangerControl = None
+        self._TapChanger = RefList()
+        self.addTapChanger(value)
 
     TapChanger = property(getTapChanger, setTapChanger)
 
     def addTapChanger(self, *TapChanger):
-        for obj in TapChanger:
-            obj.TapChangerControl = self
+        collection = self._TapChanger
+        for obj in members(TapChanger):
+            old = obj._TapChangerControl
+            if old is not None and old is not self:
+                old._TapChanger.discard(obj)
+            obj._TapChangerControl = self
+            collection.append(obj)
 
     def removeTapChanger(self, *TapChanger):
-        for obj in TapChanger:
-            obj.TapChangerControl = None
+        collection = self._TapChanger
+        for obj in members(TapChanger):
+            if obj._TapChangerControl is self:
+                obj._TapChangerControl = None
+                collection.discard(obj)
+
+    def removeAllTapChanger(self):
+        for obj in self._TapChanger:
+            obj._TapChangerControl = None
+        self._TapChanger = RefList()
 
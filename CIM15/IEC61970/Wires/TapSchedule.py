@@ -48,8 +48,7 @@ class TapSchedule(SeasonDayTypeSchedule):
 
     def setTapChanger(self, value):
         if self._TapChanger is not None:
-            filtered = [x for x in self.TapChanger.TapSchedules if x != self]
-            self._TapChanger._TapSchedules = filtered
+            self._TapChanger._TapSchedules.discard(self)
 
         self._TapChanger = value
         if self._TapChanger is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerCoreAdmittance(IdentifiedObject):
 
@@ -47,7 +48,7 @@ class TransformerCoreAdmittance(IdentifiedObject):
         self._TransformerEndInfo = None
         self.TransformerEndInfo = TransformerEndInfo
 
-        self._TransformerEnd = []
+        self._TransformerEnd = RefList()
         self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
 
         super(TransformerCoreAdmittance, self).__init__(*args, **kw_args)
@@ -82,18 +83,30 @@ class TransformerCoreAdmittance(IdentifiedObject):
 
     def setTransformerEnd(self, value):
         for x in self._TransformerEnd:
-            x.CoreAdmittance = None
-        for y in value:
-            y._CoreAdmittance = self
-        self._TransformerEnd = value
+            x._CoreAdmittance = None
+        self._TransformerEnd = RefList()
+        self.addTransformerEnd(value)
 
     TransformerEnd = property(getTransformerEnd, setTransformerEnd)
 
     def addTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.CoreAdmittance = self
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            old = obj._CoreAdmittance
+            if old is not None and old is not self:
+                old._TransformerEnd.discard(obj)
+            obj._CoreAdmittance = self
+            collection.append(obj)
 
     def removeTransformerEnd(self, *TransformerEnd):
-        for obj in TransformerEnd:
-            obj.CoreAdmittance = None
+        collection = self._TransformerEnd
+        for obj in members(TransformerEnd):
+            if obj._CoreAdmittance is self:
+                obj._CoreAdmittance = None
+                collection.discard(obj)
+
+    def removeAllTransformerEnd(self):
+        for obj in self._TransformerEnd:
+            obj._CoreAdmittance = None
+        self._TransformerEnd = RefList()
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -69,7 +70,7 @@ class TransformerEnd(IdentifiedObject):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._FromWindingInsulations = []
+        self._FromWindingInsulations = RefList()
         self.FromWindingInsulations = [] if FromWindingInsulations is None else FromWindingInsulations
 
         self._CoreAdmittance = None
@@ -84,13 +85,13 @@ class TransformerEnd(IdentifiedObject):
         self._RatioTapChanger = None
         self.RatioTapChanger = RatioTapChanger
 
-        self._FromMeshImpedance = []
+        self._FromMeshImpedance = RefList()
         self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
 
-        self._ToWindingInsulations = []
+        self._ToWindingInsulations = RefList()
         self.ToWindingInsulations = [] if ToWindingInsulations is None else ToWindingInsulations
 
-        self._ToMeshImpedance = []
+        self._ToMeshImpedance = RefList()
         self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
 
         self._StarImpedance = None
@@ -113,8 +114,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TransformerEnd if x != self]
-            self._BaseVoltage._TransformerEnd = filtered
+            self._BaseVoltage._TransformerEnd.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
@@ -130,8 +130,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TransformerEnd if x != self]
-            self._Terminal._TransformerEnd = filtered
+            self._Terminal._TransformerEnd.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
@@ -146,20 +145,32 @@ class TransformerEnd(IdentifiedObject):
 
     def setFromWindingInsulations(self, value):
         for x in self._FromWindingInsulations:
-            x.FromWinding = None
-        for y in value:
-            y._FromWinding = self
-        self._FromWindingInsulations = value
+            x._FromWinding = None
+        self._FromWindingInsulations = RefList()
+        self.addFromWindingInsulations(value)
 
     FromWindingInsulations = property(getFromWindingInsulations, setFromWindingInsulations)
 
     def addFromWindingInsulations(self, *FromWindingInsulations):
-        for obj in FromWindingInsulations:
-            obj.FromWinding = self
+        collection = self._FromWindingInsulations
+        for obj in members(FromWindingInsulations):
+            old = obj._FromWinding
+            if old is not None and old is not self:
+                old._FromWindingInsulations.discard(obj)
+            obj._FromWinding = self
+            collection.append(obj)
 
     def removeFromWindingInsulations(self, *FromWindingInsulations):
-        for obj in FromWindingInsulations:
-            obj.FromWinding = None
+        collection = self._FromWindingInsulations
+        for obj in members(FromWindingInsulations):
+            if obj._FromWinding is self:
+                obj._FromWinding = None
+                collection.discard(obj)
+
+    def removeAllFromWindingInsulations(self):
+        for obj in self._FromWindingInsulations:
+            obj._FromWinding = None
+        self._FromWindingInsulations = RefList()
 
     def getCoreAdmittance(self):
         """Core admittance of this transformer end, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end only.
@@ -168,8 +179,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
@@ -185,8 +195,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setTransformerEndInfo(self, value):
         if self._TransformerEndInfo is not None:
-            filtered = [x for x in self.TransformerEndInfo.TransformerEnd if x != self]
-            self._TransformerEndInfo._TransformerEnd = filtered
+            self._TransformerEndInfo._TransformerEnd.discard(self)
 
         self._TransformerEndInfo = value
         if self._TransformerEndInfo is not None:
@@ -234,20 +243,32 @@ class TransformerEnd(IdentifiedObject):
 
     def setFromMeshImpedance(self, value):
         for x in self._FromMeshImpedance:
-            x.FromTransformerEnd = None
-        for y in value:
-            y._FromTransformerEnd = self
-        self._FromMeshImpedance = value
+            x._FromTransformerEnd = None
+        self._FromMeshImpedance = RefList()
+        self.addFromMeshImpedance(value)
 
     FromMeshImpedance = property(getFromMeshImpedance, setFromMeshImpedance)
 
     def addFromMeshImpedance(self, *FromMeshImpedance):
-        for obj in FromMeshImpedance:
-            obj.FromTransformerEnd = self
+        collection = self._FromMeshImpedance
+        for obj in members(FromMeshImpedance):
+            old = obj._FromTransformerEnd
+            if old is not None and old is not self:
+                old._FromMeshImpedance.discard(obj)
+            obj._FromTransformerEnd = self
+            collection.append(obj)
 
     def removeFromMeshImpedance(self, *FromMeshImpedance):
-        for obj in FromMeshImpedance:
-            obj.FromTransformerEnd = None
+        collection = self._FromMeshImpedance
+        for obj in members(FromMeshImpedance):
+            if obj._FromTransformerEnd is self:
+                obj._FromTransformerEnd = None
+                collection.discard(obj)
+
+    def removeAllFromMeshImpedance(self):
+        for obj in self._FromMeshImpedance:
+            obj._FromTransformerEnd = None
+        self._FromMeshImpedance = RefList()
 
     def getToWindingInsulations(self):
         
@@ -255,20 +276,32 @@ class TransformerEnd(IdentifiedObject):
 
     def setToWindingInsulations(self, value):
         for x in self._ToWindingInsulations:
-            x.ToWinding = None
-        for y in value:
-            y._ToWinding = self
-        self._ToWindingInsulations = value
+            x._ToWinding = None
+        self._ToWindingInsulations = RefList()
+        self.addToWindingInsulations(value)
 
     ToWindingInsulations = property(getToWindingInsulations, setToWindingInsulations)
 
     def addToWindingInsulations(self, *ToWindingInsulations):
-        for obj in ToWindingInsulations:
-            obj.ToWinding = self
+        collection = self._ToWindingInsulations
+        for obj in members(ToWindingInsulations):
+            old = obj._ToWinding
+            if old is not None and old is not self:
+                old._ToWindingInsulations.discard(obj)
+            obj._ToWinding = self
+            collection.append(obj)
 
     def removeToWindingInsulations(self, *ToWindingInsulations):
-        for obj in ToWindingInsulations:
-            obj.ToWinding = None
+        collection = self._ToWindingInsulations
+        for obj in members(ToWindingInsulations):
+            if obj._ToWinding is self:
+                obj._ToWinding = None
+                collection.discard(obj)
+
+    def removeAllToWindingInsulations(self):
+        for obj in self._ToWindingInsulations:
+            obj._ToWinding = None
+        self._ToWindingInsulations = RefList()
 
     def getToMeshImpedance(self):
         """All mesh impedances between this 'from' and other 'to' transformer ends.
@@ -277,26 +310,28 @@ class TransformerEnd(IdentifiedObject):
 
     def setToMeshImpedance(self, value):
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEnd if q != self]
-            self._ToMeshImpedance._ToTransformerEnd = filtered
-        for r in value:
-            if self not in r._ToTransformerEnd:
-                r._ToTransformerEnd.append(self)
-        self._ToMeshImpedance = value
+            p._ToTransformerEnd.discard(self)
+        self._ToMeshImpedance = RefList()
+        self.addToMeshImpedance(value)
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
-        for obj in ToMeshImpedance:
-            if self not in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.append(self)
-            self._ToMeshImpedance.append(obj)
+        collection = self._ToMeshImpedance
+        for obj in members(ToMeshImpedance):
+            obj._ToTransformerEnd.append(self)
+            collection.append(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
-        for obj in ToMeshImpedance:
-            if self in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.remove(self)
-            self._ToMeshImpedance.remove(obj)
+        collection = self._ToMeshImpedance
+        for obj in members(ToMeshImpedance):
+            obj._ToTransformerEnd.discard(self)
+            collection.discard(obj)
+
+    def removeAllToMeshImpedance(self):
+        for obj in self._ToMeshImpedance:
+            obj._ToTransformerEnd.discard(self)
+        self._ToMeshImpedance = RefList()
 
     def getStarImpedance(self):
         """(accurate for 2- or 3-winding transformers only) Pi-model impedances of this transformer end. By convention, for a two winding transformer, the full values of the transformer should be entered on the high voltage end (endNumber=1).
@@ -305,8 +340,7 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class TransformerMeshImpedance(IdentifiedObject):
     """Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.
@@ -51,10 +52,10 @@ class TransformerMeshImpedance(IdentifiedObject):
         self._FromTransformerEndInfo = None
         self.FromTransformerEndInfo = FromTransformerEndInfo
 
-        self._ToTransformerEnd = []
+        self._ToTransformerEnd = RefList()
         self.ToTransformerEnd = [] if ToTransformerEnd is None else ToTransformerEnd
 
-        self._ToTransformerEndInfo = []
+        self._ToTransformerEndInfo = RefList()
         self.ToTransformerEndInfo = [] if ToTransformerEndInfo is None else ToTransformerEndInfo
 
         self._FromTransformerEnd = None
@@ -76,8 +77,7 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEndInfo(self, value):
         if self._FromTransformerEndInfo is not None:
-            filtered = [x for x in self.FromTransformerEndInfo.FromMeshImpedance if x != self]
-            self._FromTransformerEndInfo._FromMeshImpedance = filtered
+            self._FromTransformerEndInfo._FromMeshImpedance.discard(self)
 
         self._FromTransformerEndInfo = value
         if self._FromTransformerEndInfo is not None:
@@ -93,26 +93,28 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setToTransformerEnd(self, value):
         for p in self._ToTransformerEnd:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEnd._ToMeshImpedance = filtered
-        for r in value:
-            if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
-        self._ToTransformerEnd = value
+            p._ToMeshImpedance.discard(self)
+        self._ToTransformerEnd = RefList()
+        self.addToTransformerEnd(value)
 
     ToTransformerEnd = property(getToTransformerEnd, setToTransformerEnd)
 
     def addToTransformerEnd(self, *ToTransformerEnd):
-        for obj in ToTransformerEnd:
-            if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEnd.append(obj)
+        collection = self._ToTransformerEnd
+        for obj in members(ToTransformerEnd):
+            obj._ToMeshImpedance.append(self)
+            collection.append(obj)
 
     def removeToTransformerEnd(self, *ToTransformerEnd):
-        for obj in ToTransformerEnd:
-            if self in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.remove(self)
-            self._ToTransformerEnd.remove(obj)
+        collection = self._ToTransformerEnd
+        for obj in members(ToTransformerEnd):
+            obj._ToMeshImpedance.discard(self)
+            collection.discard(obj)
+
+    def removeAllToTransformerEnd(self):
+        for obj in self._ToTransformerEnd:
+            obj._ToMeshImpedance.discard(self)
+        self._ToTransformerEnd = RefList()
 
     def getToTransformerEndInfo(self):
         """All transformer end infos this mesh impedance is connected to.
@@ -121,26 +123,28 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setToTransformerEndInfo(self, value):
         for p in self._ToTransformerEndInfo:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEndInfo._ToMeshImpedance = filtered
-        for r in value:
-            if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
-        self._ToTransformerEndInfo = value
+            p._ToMeshImpedance.discard(self)
+        self._ToTransformerEndInfo = RefList()
+        self.addToTransformerEndInfo(value)
 
     ToTransformerEndInfo = property(getToTransformerEndInfo, setToTransformerEndInfo)
 
     def addToTransformerEndInfo(self, *ToTransformerEndInfo):
-        for obj in ToTransformerEndInfo:
-            if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEndInfo.append(obj)
+        collection = self._ToTransformerEndInfo
+        for obj in members(ToTransformerEndInfo):
+            obj._ToMeshImpedance.append(self)
+            collection.append(obj)
 
     def removeToTransformerEndInfo(self, *ToTransformerEndInfo):
-        for obj in ToTransformerEndInfo:
-            if self in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.remove(self)
-            self._ToTransformerEndInfo.remove(obj)
+        collection = self._ToTransformerEndInfo
+        for obj in members(ToTransformerEndInfo):
+            obj._ToMeshImpedance.discard(self)
+            collection.discard(obj)
+
+    def removeAllToTransformerEndInfo(self):
+        for obj in self._ToTransformerEndInfo:
+            obj._ToMeshImpedance.discard(self)
+        self._ToTransformerEndInfo = RefList()
 
     def getFromTransformerEnd(self):
         """From end this mesh impedance is connected to. It determines the voltage reference.
@@ -149,8 +153,7 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEnd(self, value):
         if self._FromTransformerEnd is not None:
-            filtered = [x for x in self.FromTransformerEnd.FromMeshImpedance if x != self]
-            self._FromTransformerEnd._FromMeshImpedance = filtered
+            self._FromTransformerEnd._FromMeshImpedance.discard(self)
 
         self._FromTransformerEnd = value
         if self._FromTransformerEnd is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from PyCIM.RefList import RefList, members
 
 class TransformerTank(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -33,10 +34,10 @@ class TransformerTank(Equipment):
         @param TransformerTankInfo: Transformer tank data.
         @param TransformerObservations:
         """
-        self._ServiceDeliveryPoints = []
+        self._ServiceDeliveryPoints = RefList()
         self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
 
-        self._TransformerTankEnds = []
+        self._TransformerTankEnds = RefList()
         self.TransformerTankEnds = [] if TransformerTankEnds is None else TransformerTankEnds
 
         self._PowerTransformer = None
@@ -45,7 +46,7 @@ class TransformerTank(Equipment):
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._TransformerObservations = []
+        self._TransformerObservations = RefList()
         self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
 
         super(TransformerTank, self).__init__(*args, **kw_args)
@@ -64,20 +65,32 @@ class TransformerTank(Equipment):
 
     def setServiceDeliveryPoints(self, value):
         for x in self._ServiceDeliveryPoints:
-            x.TransformerTanks = None
-        for y in value:
-            y._TransformerTanks = self
-        self._ServiceDeliveryPoints = value
+            x._TransformerTanks = None
+        self._ServiceDeliveryPoints = RefList()
+        self.addServiceDeliveryPoints(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.TransformerTanks = self
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            old = obj._TransformerTanks
+            if old is not None and old is not self:
+                old._ServiceDeliveryPoints.discard(obj)
+            obj._TransformerTanks = self
+            collection.append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
-        for obj in ServiceDeliveryPoints:
-            obj.TransformerTanks = None
+        collection = self._ServiceDeliveryPoints
+        for obj in members(ServiceDeliveryPoints):
+            if obj._TransformerTanks is self:
+                obj._TransformerTanks = None
+                collection.discard(obj)
+
+    def removeAllServiceDeliveryPoints(self):
+        for obj in self._ServiceDeliveryPoints:
+            obj._TransformerTanks = None
+        self._ServiceDeliveryPoints = RefList()
 
     def getTransformerTankEnds(self):
         """All windings of this transformer.
@@ -86,20 +99,32 @@ class TransformerTank(Equipment):
 
     def setTransformerTankEnds(self, value):
         for x in self._TransformerTankEnds:
-            x.TransformerTank = None
-        for y in value:
-            y._TransformerTank = self
-        self._TransformerTankEnds = value
+            x._TransformerTank = None
+        self._TransformerTankEnds = RefList()
+        self.addTransformerTankEnds(value)
 
     TransformerTankEnds = property(getTransformerTankEnds, setTransformerTankEnds)
 
     def addTransformerTankEnds(self, *TransformerTankEnds):
-        for obj in TransformerTankEnds:
-            obj.TransformerTank = self
+        collection = self._TransformerTankEnds
+        for obj in members(TransformerTankEnds):
+            old = obj._TransformerTank
+            if old is not None and old is not self:
+                old._TransformerTankEnds.discard(obj)
+            obj._TransformerTank = self
+            collection.append(obj)
 
     def removeTransformerTankEnds(self, *TransformerTankEnds):
-        for obj in TransformerTankEnds:
-            obj.TransformerTank = None
+        collection = self._TransformerTankEnds
+        for obj in members(TransformerTankEnds):
+            if obj._TransformerTank is self:
+                obj._TransformerTank = None
+                collection.discard(obj)
+
+    def removeAllTransformerTankEnds(self):
+        for obj in self._TransformerTankEnds:
+            obj._TransformerTank = None
+        self._TransformerTankEnds = RefList()
 
     def getPowerTransformer(self):
         """Bank this transformer belongs to.
@@ -108,8 +133,7 @@ class TransformerTank(Equipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerTanks if x != self]
-            self._PowerTransformer._TransformerTanks = filtered
+            self._PowerTransformer._TransformerTanks.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
@@ -125,8 +149,7 @@ class TransformerTank(Equipment):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerTanks if x != self]
-            self._TransformerTankInfo._TransformerTanks = filtered
+            self._TransformerTankInfo._TransformerTanks.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
@@ -141,18 +164,30 @@ class TransformerTank(Equipment):
 
     def setTransformerObservations(self, value):
         for x in self._TransformerObservations:
-            x.Transformer = None
-        for y in value:
-            y._Transformer = self
-        self._TransformerObservations = value
+            x._Transformer = None
+        self._TransformerObservations = RefList()
+        self.addTransformerObservations(value)
 
     TransformerObservations = property(getTransformerObservations, setTransformerObservations)
 
     def addTransformerObservations(self, *TransformerObservations):
-        for obj in TransformerObservations:
-            obj.Transformer = self
+        collection = self._TransformerObservations
+        for obj in members(TransformerObservations):
+            old = obj._Transformer
+            if old is not None and old is not self:
+                old._TransformerObservations.discard(obj)
+            obj._Transformer = self
+            collection.append(obj)
 
     def removeTransformerObservations(self, *TransformerObservations):
-        for obj in TransformerObservations:
-            obj.Transformer = None
+        collection = self._TransformerObservations
+        for obj in members(TransformerObservations):
+            if obj._Transformer is self:
+                obj._Transformer = None
+                collection.discard(obj)
+
+    def removeAllTransformerObservations(self):
+        for obj in self._TransformerObservations:
+            obj._Transformer = None
+        self._TransformerObservations = RefList()
 
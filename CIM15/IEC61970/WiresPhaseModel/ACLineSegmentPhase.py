@@ -48,8 +48,7 @@ class ACLineSegmentPhase(PowerSystemResource):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.ACLineSegmentPhases if x != self]
-            self._ACLineSegment._ACLineSegmentPhases = filtered
+            self._ACLineSegment._ACLineSegmentPhases.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
@@ -50,8 +50,7 @@ class EnergyConsumerPhase(PowerSystemResource):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.EnergyConsumerPhases if x != self]
-            self._EnergyConsumer._EnergyConsumerPhases = filtered
+            self._EnergyConsumer._EnergyConsumerPhases.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
@@ -47,8 +47,7 @@ class ShuntCompensatorPhase(PowerSystemResource):
 
     def setShuntCompensator(self, value):
         if self._ShuntCompensator is not None:
-            filtered = [x for x in self.ShuntCompensator.ShuntCompensatorPhases if x != self]
-            self._ShuntCompensator._ShuntCompensatorPhases = filtered
+            self._ShuntCompensator._ShuntCompensatorPhases.discard(self)
 
         self._ShuntCompensator = value
         if self._ShuntCompensator is not None:
@@ -59,8 +59,7 @@ class SwitchPhase(PowerSystemResource):
 
     def setSwitch(self, value):
         if self._Switch is not None:
-            filtered = [x for x in self.Switch.SwitchPhases if x != self]
-            self._Switch._SwitchPhases = filtered
+            self._Switch._SwitchPhases.discard(self)
 
         self._Switch = value
         if self._Switch is not None:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from PyCIM.RefList import RefList, members
 
 class MarketParticipant(Organisation):
 
@@ -27,7 +28,7 @@ class MarketParticipant(Organisation):
 
         @param MarketRoles: All roles of this market participant.
         """
-        self._MarketRoles = []
+        self._MarketRoles = RefList()
         self.MarketRoles = [] if MarketRoles is None else MarketRoles
 
         super(MarketParticipant, self).__init__(*args, **kw_args)
@@ -46,24 +47,26 @@ class MarketParticipant(Organisation):
 
     def setMarketRoles(self, value):
         for p in self._MarketRoles:
-            filtered = [q for q in p.MarketParticipants if q != self]
-            self._MarketRoles._MarketParticipants = filtered
-        for r in value:
-            if self not in r._MarketParticipants:
-                r._MarketParticipants.append(self)
-        self._MarketRoles = value
+            p._MarketParticipants.discard(self)
+        self._MarketRoles = RefList()
+        self.addMarketRoles(value)
 
     MarketRoles = property(getMarketRoles, setMarketRoles)
 
     def addMarketRoles(self, *MarketRoles):
-        for obj in MarketRoles:
-            if self not in obj._MarketParticipants:
-                obj._MarketParticipants.append(self)
-            self._MarketRoles.append(obj)
+        collection = self._MarketRoles
+        for obj in members(MarketRoles):
+            obj._MarketParticipants.append(self)
+            collection.append(obj)
 
     def removeMarketRoles(self, *MarketRoles):
-        for obj in MarketRoles:
-            if self in obj._MarketParticipants:
-                obj._MarketParticipants.remove(self)
-            self._MarketRoles.remove(obj)
+        collection = self._MarketRoles
+        for obj in members(MarketRoles):
+            obj._MarketParticipants.discard(self)
+            collection.discard(obj)
+
+    def removeAllMarketRoles(self):
+        for obj in self._MarketRoles:
+            obj._MarketParticipants.discard(self)
+        self._MarketRoles = RefList()
 
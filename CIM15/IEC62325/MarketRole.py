@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from PyCIM.RefList import RefList, members
 
 class MarketRole(IdentifiedObject):
     """Role of a market player.Role of a market player.
@@ -36,7 +37,7 @@ class MarketRole(IdentifiedObject):
 
         self.status = status
 
-        self._MarketParticipants = []
+        self._MarketParticipants = RefList()
         self.MarketParticipants = [] if MarketParticipants is None else MarketParticipants
 
         super(MarketRole, self).__init__(*args, **kw_args)
@@ -57,24 +58,26 @@ class MarketRole(IdentifiedObject):
 
     def setMarketParticipants(self, value):
         for p in self._MarketParticipants:
-            filtered = [q for q in p.MarketRoles if q != self]
-            self._MarketParticipants._MarketRoles = filtered
-        for r in value:
-            if self not in r._MarketRoles:
-                r._MarketRoles.append(self)
-        self._MarketParticipants = value
+            p._MarketRoles.discard(self)
+        self._MarketParticipants = RefList()
+        self.addMarketParticipants(value)
 
     MarketParticipants = property(getMarketParticipants, setMarketParticipants)
 
     def addMarketParticipants(self, *MarketParticipants):
-        for obj in MarketParticipants:
-            if self not in obj._MarketRoles:
-                obj._MarketRoles.append(self)
-            self._MarketParticipants.append(obj)
+        collection = self._MarketParticipants
+        for obj in members(MarketParticipants):
+            obj._MarketRoles.append(self)
+            collection.append(obj)
 
     def removeMarketParticipants(self, *MarketParticipants):
-        for obj in MarketParticipants:
-            if self in obj._MarketRoles:
-                obj._MarketRoles.remove(self)
-            self._MarketParticipants.remove(obj)
+        collection = self._MarketParticipants
+        for obj in members(MarketParticipants):
+            obj._MarketRoles.discard(self)
+            collection.discard(obj)
+
+    def removeAllMarketParticipants(self):
+        for obj in self._MarketParticipants:
+            obj._MarketRoles.discard(self)
+        self._MarketParticipants = RefList()
 
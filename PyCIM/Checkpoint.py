@@ -0,0 +1,216 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Checkpoints of single-pass reads of large CIM RDF/XML files.
+
+While a file is read, the state of the read is saved to a checkpoint file
+at most once per interval: the byte offset of the next child of the root
+element, the header of the file, the objects created so far (as a
+snapshot, see L{PyCIM.ParseCache}) and the references and C{rdf:about}
+records waiting for objects that have not been read yet. A read of the
+same file with the same arguments that finds the checkpoint restores the
+state and parses the file from the offset, with the header, instead of
+from the start. The checkpoint is removed once the read is complete.
+"""
+
+import os
+import tempfile
+
+from time import time
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from PyCIM.ParseCache import class_fingerprint, snapshot, restore
+from PyCIM.RDFXMLBackends import ExpatRecordParser, BLOCK_SIZE
+from PyCIM.RDFXMLChunker import read_range
+from PyCIM.SetterPlan import get_plan
+
+import logging
+logger = logging.getLogger(__name__)
+
+#: Version of the checkpoint format.
+CHECKPOINT_FORMAT = 3
+
+#: Default minimum number of seconds between checkpoints.
+INTERVAL = 60.0
+
+
+class Checkpoint(object):
+    """ Checkpoint file of a read.
+    """
+
+    def __init__(self, path, interval=INTERVAL):
+        """
+        @type path: string
+        @param path: Path to the checkpoint file.
+        @type interval: float
+        @param interval: Minimum number of seconds between checkpoints.
+        The time spent saving a checkpoint grows with the number of objects
+        read, so the interval bounds the share of the read spent on it.
+        """
+        self.path = path
+        self.interval = interval
+        #: L{PyCIM.RDFXMLReader._ModelBuilder} of the read. Set before the
+        #: records are read.
+        self.builder = None
+        #: Number of checkpoints saved and the seconds spent saving them.
+        self.saves = 0
+        self.seconds = 0.0
+        #: Byte offset the read resumed from, or None.
+        self.resumed = None
+
+    def records(self, source, ns, accept=None, args=()):
+        """ Yields the records of the file at the given path, from the
+        checkpoint if there is one for the file and arguments, and saves
+        checkpoints as the records are consumed.
+
+        @param ns: L{PyCIM.RDFXMLReader._Namespaces} of the read, with
+        the namespaces of the file detected.
+        @param args: Arguments of the read that shape the model.
+        """
+        st = os.stat(source)
+        key = (os.path.abspath(source), st.st_size, st.st_mtime, ns.nsURI,
+               class_fingerprint(ns.packageMap)) + tuple(args)
+
+        parser = ExpatRecordParser(ns.base, ns.ns_rdf, accept,
+                                   boundaries=True)
+        offset, header = 0, None
+        state = self.load(key)
+        if state is not None:
+            offset, header = self.restore(state)
+            self.resumed = offset
+            logger.info('Resuming "%s" at byte %d of %d.', source, offset,
+                        st.st_size)
+            parser.feed(header)
+        # Offset in the file of the offsets in the data fed to the parser.
+        shift = offset - len(header or b"")
+
+        last = time()
+        f = open(source, "rb")
+        try:
+            f.seek(offset)
+            while True:
+                block = f.read(BLOCK_SIZE)
+                for item in parser.feed(block, not block):
+                    if not isinstance(item, int):
+                        yield item
+                        continue
+                    # Start of the next child of the root element: every
+                    # record before it has been consumed.
+                    position = item + shift
+                    if header is None:
+                        header = read_range(source, 0, position)
+                    if time() - last >= self.interval:
+                        self.save(key, position, header)
+                        last = time()
+                if not block:
+                    break
+        finally:
+            f.close()
+
+        self.remove()
+
+    def load(self, key):
+        """ Returns the saved state of the read with the given key, or None.
+        """
+        try:
+            f = open(self.path, "rb")
+        except IOError:
+            return None
+        try:
+            try:
+                header, state = pickle.load(f)
+            except Exception as e:
+                logger.warn('Ignoring unreadable checkpoint "%s" (%s).',
+                            self.path, e)
+                return None
+        finally:
+            f.close()
+
+        if header != (CHECKPOINT_FORMAT, key):
+            logger.info('Checkpoint "%s" is of another read.', self.path)
+            return None
+        return state
+
+    def save(self, key, offset, header):
+        """ Saves the state of the builder at the given byte offset.
+        """
+        t0 = time()
+        builder = self.builder
+        d = builder.d
+        snap = snapshot(d)
+        if snap is None:
+            logger.warn('Model refers to objects that are not in it. No '
+                        'checkpoint saved.')
+            return
+        index = dict((id(obj), i) for i, obj in enumerate(d.values()))
+
+        pending = [(uuid, [(index[id(obj)], setter.name)
+                           for obj, setter in links])
+                   for uuid, links in builder.pending.items()]
+        links = [(index[id(obj)], name, index[id(value)])
+                 for obj, name, value in builder.links]
+        state = (offset, header, snap, pending, builder.deferred, links,
+                 builder.dropped)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        f = os.fdopen(fd, "wb")
+        try:
+            pickle.dump(((CHECKPOINT_FORMAT, key), state), f,
+                        pickle.HIGHEST_PROTOCOL)
+        finally:
+            f.close()
+        getattr(os, "replace", os.rename)(tmp, self.path)
+
+        self.saves += 1
+        self.seconds += time() - t0
+        logger.info('Checkpoint of %d objects at byte %d saved in %.2fs.',
+                    len(d), offset, time() - t0)
+
+    def restore(self, state):
+        """ Restores the given state into the builder and returns the byte
+        offset and header to read from.
+        """
+        builder = self.builder
+        offset, header, snap, pending, deferred, links, dropped = state
+
+        restored = restore(snap)
+        builder.d.update(restored)
+        objs = list(restored.values())
+
+        for uuid, refs in pending:
+            builder.pending[uuid] = [(objs[i],
+                    get_plan(objs[i].__class__, builder.batch)[name])
+                    for i, name in refs]
+        builder.deferred.update(deferred)
+        builder.links.extend((objs[i], name, objs[j])
+                             for i, name, j in links)
+        builder.dropped += dropped
+        return offset, header
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,140 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Resolution of CIM class names to classes.
+
+Each package map (C{CIM15.packageMap}, C{CIM14.packageMap} or the map of a
+profile such as C{CIM15.CDPSM.Asset.packageMap}) has one shared resolver
+that imports the module of a class the first time it is asked for and
+remembers the class thereafter. Only the modules of the classes resolved
+are imported. A package map also has a resolver of the slotted variants of
+its classes (see L{PyCIM.Slots}).
+"""
+
+from PyCIM.Slots import slotted
+
+# Resolvers by package map id and slots flag. The package map is kept
+# alongside so that its id can not be reused while the resolver exists.
+_resolvers = {}
+
+
+class ClassResolver(dict):
+    """Map of class name to CIM class for a package map.
+
+    Classes are imported on first lookup. Looking up a name that is not in
+    the package map raises C{KeyError}.
+    """
+
+    def __init__(self, packageMap, slots=False):
+        super(ClassResolver, self).__init__()
+
+        #: Map of class name to PyCIM package name.
+        self.packageMap = packageMap
+        #: Resolve the slotted variants of the classes.
+        self.slots = slots
+
+    def __missing__(self, tag):
+        mname = self.packageMap[tag]
+        # Import the module for the CIM class.
+        module = __import__(mname, globals(), locals(), [tag], 0)
+        # Get the CIM class from the module.
+        klass = getattr(module, tag)
+        if self.slots:
+            klass = slotted(klass)
+        self[tag] = klass
+        return klass
+
+    def __contains__(self, tag):
+        return tag in self.packageMap
+
+    def resolve(self, tag):
+        """Returns the CIM class with the given name.
+        """
+        return self[tag]
+
+
+class ClassFilter(dict):
+    """Map of class name to whether objects of the class are read.
+
+    A class is accepted if it is named in C{include} (or C{include} is
+    None) and not named in C{exclude}. With C{subclasses}, a class is also
+    matched by the names of its base classes, so that excluding
+    C{PowerSystemResource} excludes C{ACLineSegment}. Decisions are made
+    once per class name.
+    """
+
+    def __init__(self, include=None, exclude=None, subclasses=False,
+                 packageMap=None):
+        super(ClassFilter, self).__init__()
+
+        self.include = None if include is None else frozenset(include)
+        self.exclude = frozenset(exclude or ())
+        self.subclasses = subclasses
+        self.packageMap = packageMap
+
+    def __missing__(self, tag):
+        names = [tag]
+        if self.subclasses and self.packageMap is not None:
+            resolver = get_resolver(self.packageMap)
+            if tag in resolver:
+                names = [k.__name__ for k in resolver[tag].mro()]
+
+        if self.include is None:
+            accepted = True
+        else:
+            accepted = not self.include.isdisjoint(names)
+        if accepted:
+            accepted = self.exclude.isdisjoint(names)
+
+        self[tag] = accepted
+        return accepted
+
+
+def get_resolver(packageMap, slots=False):
+    """Returns the shared resolver for the given package map, of the
+    slotted variants of the classes if C{slots} is True.
+    """
+    key = (id(packageMap), slots)
+    try:
+        pm, resolver = _resolvers[key]
+        if pm is packageMap:
+            return resolver
+    except KeyError:
+        pass
+
+    resolver = ClassResolver(packageMap, slots)
+    _resolvers[key] = (packageMap, resolver)
+    return resolver
+
+
+def resolve_class(tag, packageMap=None):
+    """Returns the CIM class with the given name.
+
+    @type tag: string
+    @param tag: Class name (e.g. ACLineSegment).
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name. Defaults to
+    the map of the latest CIM version.
+    @rtype: class
+    @return: CIM class.
+    """
+    if packageMap is None:
+        from CIM15 import packageMap
+    return get_resolver(packageMap)[tag]
@@ -0,0 +1,147 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Compressed CIM RDF/XML files.
+
+The compression of a file is given by the extension of its path: C{.gz},
+C{.bz2}, C{.xz} (if the lzma module is available) or C{.zip}. Files are
+decompressed and compressed as they are read and written, without
+temporary files. A zip archive may hold several files, such as the
+profiles of a CGMES model.
+"""
+
+import bz2
+import gzip
+import io
+import os
+import zipfile
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+GZIP = ".gz"
+BZIP2 = ".bz2"
+XZ = ".xz"
+ZIP = ".zip"
+
+COMPRESSIONS = (GZIP, BZIP2, XZ, ZIP)
+
+# Extensions of the files read from a zip archive.
+ZIP_EXTENSIONS = (".xml", ".rdf")
+
+
+def compression(path):
+    """Returns the compression of the file at the given path (e.g. C{.gz})
+    or None if it is not compressed.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in COMPRESSIONS:
+        return ext
+    return None
+
+
+def zip_members(path):
+    """Returns the names of the RDF/XML files in the zip archive at the
+    given path.
+    """
+    z = zipfile.ZipFile(path)
+    try:
+        return [name for name in z.namelist()
+                if name.lower().endswith(ZIP_EXTENSIONS)]
+    finally:
+        z.close()
+
+
+def open_compressed(path, mode="rb", member=None):
+    """Opens a compressed file in binary mode.
+
+    @type path: string
+    @param path: Path to a C{.gz}, C{.bz2}, C{.xz} or C{.zip} file.
+    @type mode: string
+    @param mode: "rb" or "wb".
+    @type member: string
+    @param member: Name of the file in a zip archive. Defaults to the only
+    RDF/XML file of the archive when reading, and to the name of the
+    archive without the C{.zip} extension when writing.
+    @rtype: file-like object
+    @return: Stream of the uncompressed data.
+    """
+    ext = compression(path)
+    if ext == GZIP:
+        return gzip.open(path, mode)
+    elif ext == BZIP2:
+        return bz2.BZ2File(path, mode)
+    elif ext == XZ:
+        if lzma is None:
+            raise ValueError('Reading "%s" requires the lzma module.' % path)
+        return lzma.open(path, mode)
+    elif ext == ZIP:
+        return _open_zip(path, mode, member)
+    else:
+        raise ValueError('"%s" is not a compressed file.' % path)
+
+
+def _open_zip(path, mode, member):
+    if mode.startswith("r"):
+        if member is None:
+            members = zip_members(path)
+            if len(members) != 1:
+                raise ValueError('"%s" holds %d RDF/XML files.' %
+                                 (path, len(members)))
+            member = members[0]
+        z = zipfile.ZipFile(path)
+        # The member keeps the archive file open until it is closed.
+        try:
+            return z.open(member)
+        finally:
+            z.close()
+
+    if member is None:
+        member = os.path.basename(path)[:-len(ZIP)]
+        if not member.lower().endswith(ZIP_EXTENSIONS):
+            member += ".xml"
+    z = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+    return _ZipWriter(z, z.open(member, "w"))
+
+
+class _ZipWriter(io.RawIOBase):
+    """Stream of a file written to a zip archive that closes the archive
+    when it is closed.
+    """
+
+    def __init__(self, archive, f):
+        super(_ZipWriter, self).__init__()
+        self.archive = archive
+        self.f = f
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.f.write(data)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self.f.close()
+            self.archive.close()
+        super(_ZipWriter, self).close()
@@ -0,0 +1,125 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Memory-mapped input for the CIM RDF/XML reader.
+
+A L{MappedFile} maps a file into memory and reads it as slices of the
+mapping rather than by copying it into Python strings block by block.
+A byte range of the file may be read between a prefix and a suffix, so
+that a chunk of whole object elements is read as a document of its own
+(see L{PyCIM.RDFXMLChunker}) without being copied. Processes that map the
+same file share its pages in the page cache.
+"""
+
+import mmap
+import os
+
+
+class MappedFile(object):
+    """Read-only file-like object over a memory-mapped file.
+    """
+
+    def __init__(self, path, start=0, end=None, prefix=b"", suffix=b""):
+        """
+        @type path: string
+        @param path: Path to the file.
+        @type start: int
+        @param start: Offset of the first byte read.
+        @type end: int
+        @param end: Offset after the last byte read. Defaults to the end of
+        the file.
+        @type prefix: bytes
+        @param prefix: Bytes read before the range (e.g. the header of the
+        file).
+        @type suffix: bytes
+        @param suffix: Bytes read after the range (e.g. the closing tag of
+        the root element).
+        """
+        self.name = path
+        size = os.path.getsize(path)
+        if end is None:
+            end = size
+
+        f = open(path, "rb")
+        try:
+            # Empty files can not be mapped.
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) \
+                if size else None
+        finally:
+            f.close()
+
+        if self.map is None:
+            view = b""
+        else:
+            try:
+                view = memoryview(self.map)[start:end]
+            except TypeError:
+                view = self.map[start:end] # no buffer interface: copy
+
+        #: The prefix, mapped range and suffix.
+        self.segments = [prefix, view, suffix]
+        self.size = len(prefix) + len(view) + len(suffix)
+        self.pos = 0
+
+    def read(self, size=-1):
+        """Returns up to C{size} bytes, as a slice of the mapping where
+        possible, or all the remaining bytes if C{size} is negative.
+        """
+        if size is None or size < 0:
+            size = self.size - self.pos
+
+        offset = self.pos
+        for segment in self.segments:
+            n = len(segment)
+            if offset < n:
+                data = segment[offset:offset + size]
+                self.pos += len(data)
+                return data
+            offset -= n
+        return b""
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.pos
+        elif whence == 2:
+            offset += self.size
+        self.pos = max(0, min(offset, self.size))
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def close(self):
+        """Releases the mapping. It is unmapped when the last slice read
+        from it is released.
+        """
+        self.segments = [b"", b"", b""]
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                pass # slices still in use
+            self.map = None
@@ -0,0 +1,310 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""On-disk cache of the models read from CIM RDF/XML files.
+
+A model is stored as a snapshot: a flat list with, for each object, the
+index of its class and its instance state, in which references to other
+objects are replaced by their index in the list. Loading a snapshot
+creates the objects without calling their constructors or property
+setters, so it is much faster than parsing the file.
+
+Entries are keyed by the content of the file (or, if allowed, by its
+path, size and modification time) and by the arguments that shape the
+model. Each snapshot records the cache format and a fingerprint of the
+modules of the CIM classes, so that snapshots made with other class
+definitions are treated as misses. The least recently used entries are
+removed when the cache grows beyond its maximum size.
+"""
+
+import os
+import tempfile
+
+from hashlib import sha1
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import PyCIM
+
+from PyCIM.RefList import RefList
+from PyCIM.Slots import slotted, is_slotted, get_state, set_state
+
+import logging
+logger = logging.getLogger(__name__)
+
+#: Version of the snapshot format.
+CACHE_FORMAT = 3
+
+#: Default maximum total size of the cache in bytes.
+MAX_SIZE = 1 << 30
+
+# Size of the blocks read when hashing a file.
+BLOCK_SIZE = 1 << 20
+
+# Fingerprints of the class definitions by package map id.
+_fingerprints = {}
+
+
+def class_fingerprint(packageMap):
+    """Returns a digest of the package map and of the size and modification
+    time of every module of the packages it refers to.
+    """
+    try:
+        pm, digest = _fingerprints[id(packageMap)]
+        if pm is packageMap:
+            return digest
+    except KeyError:
+        pass
+
+    h = sha1()
+    h.update(repr((PyCIM.__version__, CACHE_FORMAT)).encode())
+    h.update(repr(sorted(packageMap.items())).encode())
+
+    roots = sorted(set(mname.split(".")[0] for mname in packageMap.values()))
+    for root in roots:
+        package = __import__(root)
+        for dirpath, dirnames, filenames in os.walk(
+                os.path.dirname(package.__file__)):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    st = os.stat(os.path.join(dirpath, filename))
+                    h.update(("%s %d %r;" % (filename, st.st_size,
+                                             st.st_mtime)).encode())
+
+    digest = h.hexdigest()
+    _fingerprints[id(packageMap)] = (packageMap, digest)
+    return digest
+
+
+def snapshot(d):
+    """Returns the snapshot of the given map of UUID to CIM object, or None
+    if an object refers to an object that is not in the map.
+    """
+    objs = list(d.values())
+    index = dict((id(obj), i) for i, obj in enumerate(objs))
+    classes = []
+    class_index = {}
+
+    entries = []
+    for obj in objs:
+        klass = obj.__class__
+        try:
+            k = class_index[klass]
+        except KeyError:
+            k = class_index[klass] = len(classes)
+            classes.append((klass.__module__, klass.__name__,
+                            is_slotted(klass)))
+
+        values = {}
+        refs = {}
+        many = {}
+        for name, val in get_state(obj).items():
+            if isinstance(val, (list, RefList)) and val:
+                # Empty lists are pickled with the other values.
+                try:
+                    many[name] = (isinstance(val, RefList),
+                                  [index[id(x)] for x in val])
+                except KeyError:
+                    return None
+            elif hasattr(val.__class__, "_attrs"):
+                try:
+                    refs[name] = index[id(val)]
+                except KeyError:
+                    return None
+            else:
+                values[name] = val
+        entries.append((k, values, refs, many))
+
+    return classes, entries
+
+
+def restore(snap):
+    """Returns a new map of UUID to CIM object from the given snapshot.
+    """
+    classes, entries = snap
+
+    klasses = []
+    for mname, cname, slots in classes:
+        module = __import__(mname, globals(), locals(), [cname], 0)
+        klass = getattr(module, cname)
+        klasses.append(slotted(klass) if slots else klass)
+
+    objs = [klasses[k].__new__(klasses[k]) for k, _, _, _ in entries]
+    for obj, (_, values, refs, many) in zip(objs, entries):
+        state = dict(values)
+        for name, i in refs.items():
+            state[name] = objs[i]
+        for name, (reflist, indices) in many.items():
+            val = [objs[i] for i in indices]
+            state[name] = RefList.fromkeys(val) if reflist else val
+        set_state(obj, state)
+
+    return dict((obj.UUID, obj) for obj in objs)
+
+
+class ParseCache(object):
+    """Directory of model snapshots.
+    """
+
+    def __init__(self, directory, max_size=MAX_SIZE, use_stat=False):
+        """
+        @type directory: string
+        @param directory: Cache directory. Created if it does not exist.
+        @type max_size: int
+        @param max_size: Maximum total size of the snapshots in bytes.
+        @type use_stat: bool
+        @param use_stat: Key files by path, size and modification time
+        instead of by a hash of their content. Faster, but a file changed
+        without changing its size or modification time is not noticed.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.use_stat = use_stat
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def key(self, path, *args):
+        """Returns the cache key of the file at the given path read with
+        the given arguments.
+        """
+        h = sha1()
+        if self.use_stat:
+            st = os.stat(path)
+            h.update(("%s %d %r" % (os.path.abspath(path), st.st_size,
+                                    st.st_mtime)).encode())
+        else:
+            f = open(path, "rb")
+            try:
+                while True:
+                    block = f.read(BLOCK_SIZE)
+                    if not block:
+                        break
+                    h.update(block)
+            finally:
+                f.close()
+        h.update(repr(args).encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def get(self, key, packageMap):
+        """Returns the model stored under the given key, or None if there is
+        no snapshot made with the current class definitions.
+        """
+        path = self._path(key)
+        try:
+            f = open(path, "rb")
+        except IOError:
+            return None
+        try:
+            try:
+                header, snap = pickle.load(f)
+            except Exception as e:
+                logger.warn('Removing unreadable cache entry "%s" (%s).',
+                            path, e)
+                f.close()
+                self._remove(path)
+                return None
+        finally:
+            f.close()
+
+        if header != (CACHE_FORMAT, class_fingerprint(packageMap)):
+            logger.info('Cache entry "%s" was made with other class '
+                        'definitions.', path)
+            self._remove(path)
+            return None
+
+        try:
+            d = restore(snap)
+        except (ImportError, AttributeError) as e:
+            logger.warn('Unable to restore cache entry "%s" (%s).', path, e)
+            self._remove(path)
+            return None
+
+        # Mark the entry as recently used.
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return d
+
+    def put(self, key, packageMap, d):
+        """Stores the given model under the given key and evicts the least
+        recently used entries if the cache is too big.
+        """
+        snap = snapshot(d)
+        if snap is None:
+            logger.info('Model refers to objects that were not read. '
+                        'Not cached.')
+            return
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        f = os.fdopen(fd, "wb")
+        try:
+            pickle.dump(((CACHE_FORMAT, class_fingerprint(packageMap)), snap),
+                        f, pickle.HIGHEST_PROTOCOL)
+        finally:
+            f.close()
+        getattr(os, "replace", os.rename)(tmp, self._path(key))
+
+        self.evict()
+
+    def evict(self):
+        """Removes the least recently used entries until the total size is
+        within the maximum.
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pickle"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Removes every entry.
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(".pickle"):
+                self._remove(os.path.join(self.directory, name))
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -18,12 +18,155 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from xml.etree.cElementTree import parse, tostring
+"""Indentation of XML documents.
+
+L{xmlpp} re-indents a document as it is parsed, writing the output as it
+goes, so neither the element tree nor the output is held in memory and
+the depth of the document is not limited by the recursion limit.
+Whitespace-only text between elements is replaced by a new line and the
+indentation of the following tag. Other text, namespace prefixes and the
+order of attributes are kept. Comments and processing instructions are
+dropped.
+"""
+
+import io
+
+from xml.parsers import expat
+
+from PyCIM.SimpleXMLWriter import escape_cdata, escape_attrib
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+#: Bytes read from the source per parse.
+BLOCK_SIZE = 1 << 16
+
+#: Number of pieces of output joined per write.
+BUFFER_SIZE = 1 << 12
+
+
+def xmlpp(source, out=None, indent="  "):
+    """ Re-indents an XML document.
+
+    @type source: File-like object or a path to a file.
+    @param source: XML document.
+    @type out: File-like object or a path to a file.
+    @param out: Destination of the indented document. Binary streams and
+    files are written in UTF-8.
+    @type indent: string
+    @param indent: Indentation of each level.
+    @rtype: string
+    @return: The indented document if C{out} is None, else None.
+    """
+    if out is None:
+        out = io.StringIO()
+        xmlpp(source, out, indent)
+        return out.getvalue()
+    if isinstance(out, basestring):
+        f = io.open(out, "wb")
+        try:
+            xmlpp(source, f, indent)
+        finally:
+            f.close()
+        return
+    if isinstance(source, basestring):
+        f = open(source, "rb")
+        try:
+            xmlpp(f, out, indent)
+        finally:
+            f.close()
+        return
+
+    write = out.write
+    if isinstance(out, (io.BufferedIOBase, io.RawIOBase)) or bytes is str:
+        def write(text, write=out.write):
+            write(text.encode("utf-8"))
+
+    indenter = _Indenter(write, indent)
+    parser = expat.ParserCreate()
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = indenter.start
+    parser.EndElementHandler = indenter.end
+    parser.CharacterDataHandler = indenter.data
+
+    indenter.output.append(u"<?xml version='1.0' encoding='utf-8'?>\n")
+    while True:
+        block = source.read(BLOCK_SIZE)
+        if isinstance(block, type(u"")):
+            block = block.encode("utf-8")
+        parser.Parse(block, not block)
+        if not block:
+            break
+    indenter.flush()
+
+
+class _Indenter(object):
+    """ Expat handlers that write indented markup.
+    """
+
+    def __init__(self, write, indent):
+        self.write = write
+        self.indent = indent
+        self.output = []
+        self.depth = 0
+        # Start tag of the current element, until a child or the end tag
+        # shows whether it is empty.
+        self.tag = None
+        # Text since the last tag.
+        self.text = []
+
+    def start(self, name, attrs):
+        output = self.output
+        if self.tag is not None:
+            output.append(self.tag + u">")
+        self._text(self.depth > 0)
+        pieces = [u"<", name]
+        for i in range(0, len(attrs), 2):
+            pieces.append(u' %s="%s"' % (attrs[i],
+                                         escape_attrib(attrs[i + 1])))
+        self.tag = u"".join(pieces)
+        self.depth += 1
+        if len(output) >= BUFFER_SIZE:
+            self.flush()
+
+    def end(self, name):
+        output = self.output
+        self.depth -= 1
+        if self.tag is None:
+            self._text(True)
+            output.append(u"</%s>" % name)
+            return
+        # The element has no children: its text is kept as is.
+        text = u"".join(self.text)
+        self.text = []
+        if text:
+            output.append(u"%s>%s</%s>" % (self.tag, escape_cdata(text),
+                                           name))
+        else:
+            output.append(self.tag + u" />")
+        self.tag = None
+
+    def data(self, text):
+        self.text.append(text)
+
+    def _text(self, newline):
+        # Writes the text before a tag, or replaces it with a new line and
+        # the indentation of the tag if it is whitespace.
+        text = u"".join(self.text)
+        self.text = []
+        if text.strip():
+            self.output.append(escape_cdata(text))
+        elif newline:
+            self.output.append(u"\n" + self.indent * self.depth)
+
+    def flush(self):
+        if self.output:
+            self.write(u"".join(self.output))
+            self.output = []
 
-def xmlpp(source):
-    root = parse(source).getroot()
-    indent(root)
-    return tostring(root)
 
 def indent(elem, level=0):
     i = "\n" + level*"  "
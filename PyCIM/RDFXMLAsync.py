@@ -0,0 +1,66 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Reading CIM RDF/XML with asyncio.
+
+Requires Python 3.6 or later, so it is not imported by the PyCIM package.
+"""
+
+import asyncio
+
+from PyCIM.RDFXMLFeedParser import CIMFeedParser
+
+#: Largest block parsed before control is yielded to the event loop.
+BLOCK_SIZE = 1 << 16
+
+
+async def async_cimread(chunks, **kwargs):
+    """ Reads a model from an async iterator over the bytes of a CIM
+    RDF/XML document (e.g. an C{aiohttp} response's C{content} or a
+    message stream), yielding to the event loop after each block.
+
+    @param chunks: Async iterable of C{bytes}.
+    @param kwargs: Arguments of L{CIMFeedParser}.
+    @rtype: dict
+    @return: Map of UUID to CIM object.
+    """
+    parser = CIMFeedParser(**kwargs)
+    async for chunk in chunks:
+        for i in range(0, len(chunk), BLOCK_SIZE):
+            parser.feed(chunk[i:i + BLOCK_SIZE])
+            await asyncio.sleep(0)
+    return parser.close()
+
+
+async def aiter_cimread(chunks, **kwargs):
+    """ Yields the objects of a CIM RDF/XML document as they are created,
+    from an async iterator over its bytes. References to objects that have
+    not been read yet are set when those objects are read.
+    """
+    parser = CIMFeedParser(**kwargs)
+    async for chunk in chunks:
+        for i in range(0, len(chunk), BLOCK_SIZE):
+            parser.feed(chunk[i:i + BLOCK_SIZE])
+            for obj in parser.read_objects():
+                yield obj
+            await asyncio.sleep(0)
+    parser.close()
+    for obj in parser.read_objects():
+        yield obj
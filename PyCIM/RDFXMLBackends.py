@@ -0,0 +1,392 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Parser backends for the CIM RDF/XML reader.
+
+A backend is a function C{records(source, base, ns_rdf, accept=None,
+detect=None)} that yields a L{CIMRecord} for each element in the CIM
+namespace with an C{rdf:ID} or C{rdf:about} attribute, where C{base} is
+the CIM element tag base (e.g.
+C{{http://iec.ch/TC57/2010/CIM-schema-cim15#}}) and C{ns_rdf} the RDF
+namespace. If given, C{accept} maps class names to whether their elements
+are read; the properties of other elements are skipped. If C{base} is
+None, the map of prefix to namespace declared by the root element is
+passed to C{detect}, which returns the C{base} and C{ns_rdf} to use, so
+that the source is read once from start to end. The available backends
+are:
+
+  - C{iterparse}: C{xml.etree.cElementTree.iterparse} (the default),
+  - C{expat}: an C{xml.parsers.expat} handler that builds records from
+    the parser events without creating elements,
+  - C{lxml}: C{lxml.etree.iterparse}, if lxml is installed.
+"""
+
+from collections import namedtuple
+from xml.etree.cElementTree import iterparse, ParseError
+from xml.parsers.expat import ParserCreate, ExpatError
+
+try:
+    from lxml.etree import iterparse as lxml_iterparse, XMLSyntaxError
+except ImportError:
+    lxml_iterparse = XMLSyntaxError = None
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+#: A CIM object read from RDF/XML. The C{attributes} map each property tag
+#: qualified by class (e.g. C{ACLineSegment.r}) to its text, or to the
+#: literal of an enumeration (e.g. C{offAGC}). The C{references} are a
+#: list of (property tag, UUID) tuples in document order. C{about} is True
+#: if the element updates an object (C{rdf:about}) rather than defining
+#: one (C{rdf:ID}).
+CIMRecord = namedtuple("CIMRecord",
+        ["uuid", "class_name", "attributes", "references", "about"])
+
+DEFAULT_BACKEND = "iterparse"
+
+# Size of the blocks read by the expat backend.
+BLOCK_SIZE = 1 << 16
+
+
+def iterparse_records(source, base, ns_rdf, accept=None, detect=None,
+                      iterparse=iterparse):
+    """ Yields a L{CIMRecord} for each element in the CIM namespace with
+    an C{rdf:ID} or C{rdf:about} attribute, using an ElementTree
+    compatible C{iterparse} function.
+    """
+    if base is None:
+        context = iter( iterparse(source, ("start-ns", "start", "end")) )
+        namespaces = {}
+        for event, elem in context:
+            if event == "start-ns":
+                prefix, ns = elem
+                namespaces[prefix] = ns
+            else:
+                root = elem
+                break
+        base, ns_rdf = detect(namespaces)
+    else:
+        context = iter( iterparse(source, ("start", "end")) )
+        # Get the root element
+        # ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
+        _, root = next(context)
+
+    # Length of element tag base.
+    m = len(base)
+
+    rdf_ID = "{%s}ID" % ns_rdf
+    rdf_about = "{%s}about" % ns_rdf
+    rdf_resource = "{%s}resource" % ns_rdf
+
+    for event, elem in context:
+        # Process 'end' elements in the CIM namespace.
+        if event == "end" and elem.tag[:m] == base:
+            # Unique resource identifier for the CIM object.
+            uuid, about = element_id(elem, rdf_ID, rdf_about)
+            if uuid is None:
+                continue # attribute/reference of the enclosing object
+
+            if accept is not None and not accept[elem.tag[m:]]:
+                elem.clear()
+                root.clear()
+                continue
+
+            attributes, references = element_properties(elem, base,
+                                                        rdf_resource)
+            yield CIMRecord(uuid, elem.tag[m:], attributes, references, about)
+
+            # Clear children of the root element to minimise memory usage.
+            elem.clear()
+            root.clear()
+
+
+def element_id(elem, rdf_ID, rdf_about):
+    """ Returns the UUID of the object of the given element and whether
+    the element updates the object (C{rdf:about}) rather than defines it
+    (C{rdf:ID}). The UUID is None if the element has neither attribute.
+
+    @param rdf_ID: Qualified name of the C{rdf:ID} attribute.
+    @param rdf_about: Qualified name of the C{rdf:about} attribute.
+    """
+    uuid = elem.get(rdf_ID)
+    if uuid is not None:
+        return uuid, False
+    uuid = elem.get(rdf_about)
+    if uuid is not None:
+        uuid = uuid[1:]
+    return uuid, True
+
+
+def element_properties(elem, base, rdf_resource):
+    """ Returns the attributes and references of the record of the given
+    element, from its children in the CIM namespace.
+
+    @param base: CIM element tag base, e.g. C{{http://iec.ch/...#}}.
+    @param rdf_resource: Qualified name of the C{rdf:resource} attribute.
+    """
+    m = len(base)
+    attributes = {}
+    references = []
+    for child in elem:
+        tag = child.tag
+        if tag[:m] != base:
+            continue
+        # Use the rdf:resource attribute to distinguish
+        # between attributes and references/enums.
+        uuid = child.get(rdf_resource)
+        if uuid is None: # attribute
+            attributes[tag[m:]] = child.text
+        # Use the '#' prefix to distinguish between
+        # references and enumerations.
+        elif uuid[0] == "#": # reference
+            references.append((tag[m:], uuid[1:]))
+        else: # enum
+            attributes[tag[m:]] = uuid.rsplit(".", 1)[1]
+    return attributes, references
+
+
+def lxml_records(source, base, ns_rdf, accept=None, detect=None):
+    """ Yields the records of the given source using lxml. Syntax errors
+    are raised as C{ParseError}, as by the other backends.
+    """
+    def iterparse(source, events):
+        return lxml_iterparse(source, events, remove_comments=True,
+                              remove_pis=True)
+    if not isinstance(source, basestring):
+        source = _ByteReader(source)
+    try:
+        for record in iterparse_records(source, base, ns_rdf, accept, detect,
+                                        iterparse):
+            yield record
+    except XMLSyntaxError as e:
+        err = ParseError(str(e))
+        err.code = e.code
+        err.position = e.position
+        raise err
+
+
+class _ByteReader(object):
+    """ File object that reads a text stream as UTF-8 encoded bytes, as
+    lxml only parses file objects that return bytes.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def read(self, size=-1):
+        block = self.source.read(size)
+        if isinstance(block, type(u"")):
+            block = block.encode("utf-8")
+        return block
+
+
+class _ExpatHandler(object):
+    """ Builds records from expat events.
+    """
+
+    def __init__(self, base, ns_rdf, accept=None, detect=None):
+        self.accept = accept
+        self.detect = detect
+        #: Namespaces declared before the root element starts.
+        self.namespaces = {}
+        if base is not None:
+            self.set_namespaces(base, ns_rdf)
+
+        #: Records completed since the last call to the parser.
+        self.records = []
+
+        # Element depth and the depth of the current object element.
+        self.depth = 0
+        self.obj_depth = None
+        # Fields of the current record.
+        self.uuid = self.class_name = self.about = None
+        self.attributes = self.references = None
+        # Tag and text of the current attribute.
+        self.tag = None
+        self.text = []
+
+    def set_namespaces(self, base, ns_rdf):
+        # Expat names are "uri}local" with "}" as the namespace separator.
+        self.base = base[1:]
+        self.m = len(self.base)
+        self.rdf_ID = ns_rdf + "}ID"
+        self.rdf_about = ns_rdf + "}about"
+        self.rdf_resource = ns_rdf + "}resource"
+
+    def start_ns(self, prefix, uri):
+        self.namespaces[prefix or ""] = uri
+
+    def start(self, name, attrs):
+        self.depth += 1
+        if self.depth == 1:
+            if self.detect is not None:
+                self.set_namespaces(*self.detect(self.namespaces))
+                self.detect = None
+            return
+        m = self.m
+        if self.obj_depth is None:
+            if name[:m] == self.base:
+                uuid = attrs.get(self.rdf_ID)
+                about = uuid is None
+                if about:
+                    uuid = attrs.get(self.rdf_about)
+                    if uuid is None:
+                        return
+                    uuid = uuid[1:]
+                self.obj_depth = self.depth
+                if self.accept is not None and not self.accept[name[m:]]:
+                    # Skip the properties of the element.
+                    self.uuid = None
+                    return
+                self.uuid = uuid
+                self.class_name = name[m:]
+                self.about = about
+                self.attributes = {}
+                self.references = []
+        elif self.uuid is None:
+            pass
+        elif self.depth == self.obj_depth + 1 and name[:m] == self.base:
+            # Use the rdf:resource attribute to distinguish
+            # between attributes and references/enums.
+            uuid2 = attrs.get(self.rdf_resource)
+            if uuid2 is None: # attribute
+                self.tag = name[m:]
+            # Use the '#' prefix to distinguish between
+            # references and enumerations.
+            elif uuid2[0] == "#": # reference
+                self.references.append((name[m:], uuid2[1:]))
+            else: # enum
+                self.attributes[name[m:]] = uuid2.rsplit(".", 1)[1]
+        else:
+            # Only the text preceding a nested element is kept.
+            self.end_attribute()
+
+    def end(self, name):
+        if self.depth == self.obj_depth:
+            if self.uuid is not None:
+                self.records.append(CIMRecord(self.uuid, self.class_name,
+                        self.attributes, self.references, self.about))
+            self.obj_depth = self.uuid = None
+            self.attributes = self.references = None
+        elif self.tag is not None and self.depth == self.obj_depth + 1:
+            self.end_attribute()
+        self.depth -= 1
+
+    def end_attribute(self):
+        if self.tag is not None:
+            text = self.text
+            self.attributes[self.tag] = "".join(text) if text else None
+            self.tag = None
+            self.text = []
+
+    def data(self, data):
+        if self.tag is not None:
+            self.text.append(data)
+
+
+class ExpatRecordParser(object):
+    """ Incremental parser that returns the records completed by each
+    block of data fed to it.
+    """
+
+    def __init__(self, base, ns_rdf, accept=None, detect=None,
+                 boundaries=False):
+        """ If C{boundaries} is True, the byte offset of the start tag of
+        each child of the root element is returned in the list of records
+        before the records of the child, so that a document may be read
+        from there on with the header of the file.
+        """
+        self.handler = handler = _ExpatHandler(base, ns_rdf, accept, detect)
+        self.parser = parser = ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        if base is None:
+            parser.StartNamespaceDeclHandler = handler.start_ns
+        if boundaries:
+            start = handler.start
+            def start_boundary(name, attrs):
+                if handler.depth == 1:
+                    handler.records.append(parser.CurrentByteIndex)
+                start(name, attrs)
+            parser.StartElementHandler = start_boundary
+        else:
+            parser.StartElementHandler = handler.start
+        parser.EndElementHandler = handler.end
+        parser.CharacterDataHandler = handler.data
+
+    def feed(self, data, final=False):
+        """ Parses the given data and returns the list of records completed.
+        C{final} is True for the last block of the document.
+        """
+        try:
+            self.parser.Parse(data, final)
+        except ExpatError as e:
+            err = ParseError(str(e))
+            err.code = e.code
+            err.position = (e.lineno, e.offset)
+            raise err
+        records = self.handler.records
+        self.handler.records = []
+        return records
+
+
+def expat_records(source, base, ns_rdf, accept=None, detect=None):
+    """ Yields the records of the given source using an expat handler that
+    does not create elements.
+    """
+    parser = ExpatRecordParser(base, ns_rdf, accept, detect)
+
+    if isinstance(source, basestring):
+        f = open(source, "rb")
+    else:
+        f = source
+
+    try:
+        while True:
+            block = f.read(BLOCK_SIZE)
+            for record in parser.feed(block, not block):
+                yield record
+            if not block:
+                break
+    finally:
+        if f is not source:
+            f.close()
+
+
+BACKENDS = {
+    "iterparse": iterparse_records,
+    "expat": expat_records,
+}
+
+if lxml_iterparse is not None:
+    BACKENDS["lxml"] = lxml_records
+
+
+def get_backend(name=None):
+    """ Returns the record function of the named backend.
+    """
+    if name is None:
+        name = DEFAULT_BACKEND
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError('Unknown parser backend "%s". Available: %s' %
+                         (name, ", ".join(sorted(BACKENDS))))
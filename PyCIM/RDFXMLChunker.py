@@ -0,0 +1,126 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Splitting of CIM RDF/XML files into chunks of whole object elements.
+
+The file is not parsed. Boundaries are found by searching the bytes for
+the start tag of an object element (e.g. C{<cim:Terminal rdf:ID=}), so
+each chunk, wrapped in the header and footer of the file, is a document
+of its own. A boundary found inside a comment or a nested container makes
+a chunk that is not well-formed, so readers must be prepared to fall back
+to parsing the whole file.
+"""
+
+import os
+import re
+
+# Size of the blocks read when searching for a boundary.
+BLOCK_SIZE = 1 << 16
+
+
+def object_pattern(prefix="cim", rdf_prefix="rdf"):
+    """Returns a compiled pattern matching the start of an object element.
+    """
+    return re.compile(("<%s:[A-Za-z_][\\w.-]*\\s+%s:(?:ID|about)\\s*=" %
+                       (re.escape(prefix), re.escape(rdf_prefix))).encode())
+
+
+def next_boundary(f, offset, pattern):
+    """Returns the offset of the first object element start tag at or after
+    the given offset of the binary file C{f}, or None.
+    """
+    f.seek(offset)
+    tail = b""
+    while True:
+        block = f.read(BLOCK_SIZE)
+        if not block:
+            return None
+        data = tail + block
+        match = pattern.search(data)
+        if match is not None:
+            return offset - len(tail) + match.start()
+        # Keep the end of the block in case a tag spans two blocks.
+        tail = data[-256:]
+        offset += len(block)
+
+
+def split(path, chunks, prefix="cim", rdf_prefix="rdf"):
+    """Splits a CIM RDF/XML file into byte ranges of whole object elements.
+
+    @type path: string
+    @param path: Path to a CIM RDF/XML file.
+    @type chunks: int
+    @param chunks: Number of ranges wanted. Fewer are returned for files
+    with few objects.
+    @param prefix: Namespace prefix of the CIM elements.
+    @param rdf_prefix: Namespace prefix of the RDF attributes.
+    @rtype: tuple
+    @return: The header (everything up to the first object element), the
+    footer (the closing tag of the root element) and a list of (start, end)
+    byte offsets, or None if no object element is found.
+    """
+    pattern = object_pattern(prefix, rdf_prefix)
+    size = os.path.getsize(path)
+
+    f = open(path, "rb")
+    try:
+        first = next_boundary(f, 0, pattern)
+        if first is None:
+            return None
+
+        f.seek(0)
+        header = f.read(first)
+        root = re.search(b"<((?:[\\w.-]+:)?RDF)\\b", header)
+        if root is None:
+            return None
+        footer = b"</" + root.group(1) + b">"
+
+        # The last chunk ends at the closing tag of the root element.
+        f.seek(max(first, size - BLOCK_SIZE))
+        end = f.tell()
+        last = f.read().rfind(b"</" + root.group(1))
+        if last < 0:
+            return None
+        last += end
+
+        boundaries = [first]
+        step = (last - first) // chunks
+        for i in range(1, chunks):
+            boundary = next_boundary(f, first + i * step, pattern)
+            if boundary is None or boundary >= last:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+        boundaries.append(last)
+    finally:
+        f.close()
+
+    return header, footer, list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def read_range(path, start, end):
+    """Returns the bytes of the given range of a file.
+    """
+    f = open(path, "rb")
+    try:
+        f.seek(start)
+        return f.read(end - start)
+    finally:
+        f.close()
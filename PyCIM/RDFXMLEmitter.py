@@ -0,0 +1,146 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Buffered RDF/XML emitter for CIM objects.
+
+The markup of each object is assembled from the fragments of its
+L{PyCIM.WriterPlan} into a list that is joined and written once it holds
+L{BUFFER_SIZE} pieces, instead of writing every tag, attribute and value
+separately. Values are only escaped if they contain a markup character.
+The output is that of L{PyCIM.SimpleXMLWriter.XMLWriter}.
+"""
+
+from PyCIM.SetterPlan import ATTRIBUTE, ENUMERATION, MANY_REFERENCE
+from PyCIM.SimpleXMLWriter import escape_cdata, escape_attrib
+from PyCIM.WriterPlan import get_plan
+
+#: Number of pieces of markup joined per write.
+BUFFER_SIZE = 1 << 14
+
+
+def header(xmlns, encoding="utf-8", empty=False):
+    """Returns the XML declaration and the start tag of the root
+    C{rdf:RDF} element.
+
+    @type xmlns: dict
+    @param xmlns: Map of namespace prefix to namespace URI.
+    @param empty: Whether the root element is empty and is closed by its
+    start tag.
+    """
+    if encoding == "us-ascii" or encoding == "utf-8":
+        declaration = u"<?xml version='1.0'?>\n"
+    else:
+        declaration = u"<?xml version='1.0' encoding='%s'?>\n" % encoding
+    attrib = u"".join(u' xmlns:%s="%s"' % (prefix, escape_attrib(uri))
+                      for prefix, uri in sorted(xmlns.items()))
+    end = u" />" if empty else u">"
+    return u"%s<rdf:RDF%s%s" % (declaration, attrib, end)
+
+
+def footer():
+    """Returns the end tag of the root element.
+    """
+    return u"</rdf:RDF>"
+
+
+def emit(objects, write, nsPrefix, nsCIM, owner=False,
+         buffer_size=BUFFER_SIZE):
+    """Writes the elements of the given objects.
+
+    @param objects: Iterable of CIM objects.
+    @param write: Function that writes a string.
+    @param nsPrefix: Prefix of the CIM namespace.
+    @param nsCIM: CIM namespace URI, ending in '#'.
+    @param owner: Whether to write each association once, from its owning
+    end (see L{PyCIM.WriterPlan}).
+    @rtype: int
+    @return: Number of objects written.
+    """
+    # Plans by class.
+    plans = {}
+    out = []
+    append = out.append
+    n = 0
+    for obj in objects:
+        klass = obj.__class__
+        try:
+            plan = plans[klass]
+        except KeyError:
+            plan = plans[klass] = get_plan(klass, nsPrefix, nsCIM, owner)
+        n += 1
+
+        uuid = obj.UUID
+        if u"&" in uuid or u"<" in uuid or u">" in uuid or u'"' in uuid \
+                or u"'" in uuid:
+            uuid = escape_attrib(uuid)
+        append(plan.start)
+        append(uuid)
+        mark = len(out)
+        append(u'">')
+
+        for _, get, default, kind, start, end in plan.fields:
+            val = get(obj)
+            if kind == ATTRIBUTE:
+                if val == default:
+                    continue
+                val = str(val)
+                if not val:
+                    append(start[:-1] + u" />")
+                    continue
+                if u"&" in val or u"<" in val or u">" in val:
+                    val = escape_cdata(val)
+            elif kind == ENUMERATION:
+                val = str(val)
+                if u"&" in val or u"<" in val or u">" in val or \
+                        u'"' in val or u"'" in val:
+                    val = escape_attrib(val)
+            elif val is None:
+                continue
+            elif kind == MANY_REFERENCE:
+                for other in val:
+                    uuid2 = other.UUID
+                    if u"&" in uuid2 or u"<" in uuid2 or u">" in uuid2 or \
+                            u'"' in uuid2 or u"'" in uuid2:
+                        uuid2 = escape_attrib(uuid2)
+                    append(start)
+                    append(uuid2)
+                    append(end)
+                continue
+            else:
+                val = val.UUID
+                if u"&" in val or u"<" in val or u">" in val or \
+                        u'"' in val or u"'" in val:
+                    val = escape_attrib(val)
+            append(start)
+            append(val)
+            append(end)
+
+        if len(out) == mark + 1:
+            out[mark] = u'" />'
+        else:
+            append(plan.end)
+
+        if len(out) >= buffer_size:
+            write(u"".join(out))
+            del out[:]
+
+    if out:
+        write(u"".join(out))
+    return n
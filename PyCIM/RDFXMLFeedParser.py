@@ -0,0 +1,111 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Incremental parser for CIM RDF/XML data that arrives in pieces.
+
+A L{CIMFeedParser} is fed blocks of bytes as they are received, for
+example from a socket or a message stream, and builds the model objects
+of each block before returning, in the manner of
+C{xml.etree.ElementTree.XMLPullParser}. The caller never blocks waiting
+for data, so parsing can be interleaved with other work. See
+L{PyCIM.RDFXMLAsync} for use with asyncio.
+"""
+
+from PyCIM.RDFXMLBackends import ExpatRecordParser
+from PyCIM.RDFXMLReader import _check_namespace_args, _class_filter, \
+    _log_errors, _ModelBuilder, _Namespaces
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class CIMFeedParser(object):
+    """ Builds a map of UUID to CIM object from the blocks of a CIM
+    RDF/XML document, in one pass.
+    """
+
+    def __init__(self, packageMap=None, nsURI=None, start_dict=None,
+                 include_classes=None, exclude_classes=None,
+                 subclasses=False, batch_link=False):
+        """ The arguments are those of L{PyCIM.cimread}.
+        """
+        _check_namespace_args(packageMap, nsURI)
+        self.accept = _class_filter(include_classes, exclude_classes,
+                                    subclasses, packageMap)
+        self.ns = _Namespaces(packageMap, nsURI, self.accept)
+        self.parser = ExpatRecordParser(None, None, self.accept, self.ns)
+        self.batch_link = batch_link
+
+        #: Map of UUID to CIM object.
+        self.d = start_dict if start_dict is not None else {}
+        self.errors = {}
+        # Created once the namespaces are known.
+        self.builder = None
+        # Objects created since the last call to read_objects.
+        self.objects = []
+        self.closed = False
+
+    def feed(self, data):
+        """ Parses the given bytes and builds the objects they complete.
+        """
+        if self.closed:
+            raise ValueError("feed() called after close()")
+        self._build(self.parser.feed(data))
+
+    def read_objects(self):
+        """ Returns an iterator over the objects created since the last
+        call. References to objects that have not been read yet are set
+        when those objects are read.
+        """
+        objects, self.objects = self.objects, []
+        return iter(objects)
+
+    def close(self):
+        """ Completes the document and returns the map of UUID to CIM
+        object.
+        """
+        if not self.closed:
+            self._build(self.parser.feed(b"", True))
+            self.closed = True
+            if self.builder is not None:
+                self.builder.close()
+                if self.batch_link:
+                    self.builder.link()
+                if self.builder.dropped:
+                    logger.info('Dropped %d references to objects not '
+                                'read.', self.builder.dropped)
+            _log_errors(self.errors)
+        return self.d
+
+    def _build(self, records):
+        if not records:
+            return
+        builder = self.builder
+        if builder is None:
+            builder = self.builder = _ModelBuilder(self.d,
+                    self.ns.packageMap, self.errors,
+                    drop_missing=self.accept is not None,
+                    batch=self.batch_link)
+        add = builder.add
+        objects = self.objects
+        for record in records:
+            obj = add(record)
+            if obj is not None and not record.about:
+                objects.append(obj)
@@ -21,18 +21,47 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from xml.etree.cElementTree import iterparse
+from io import BytesIO
+from itertools import chain
+from multiprocessing import Pool, cpu_count
+from xml.etree.cElementTree import iterparse, ParseError
 from time import time
 
+from PyCIM.ClassResolver import ClassFilter, get_resolver
+from PyCIM.MappedFile import MappedFile
+from PyCIM.Compression import ZIP, compression, open_compressed, zip_members
+from PyCIM.ParseCache import ParseCache, class_fingerprint
+from PyCIM.Checkpoint import Checkpoint, INTERVAL
+from PyCIM.ReadStats import ReadStats
+# CIMRecord is imported for backward compatibility, as it was defined in this
+# module before the parser backends.
+from PyCIM.RDFXMLBackends import CIMRecord, get_backend
+from PyCIM.RDFXMLChunker import split, read_range
+from PyCIM.SetterPlan import get_plan, link_inverses
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
 import logging
 logger = logging.getLogger(__name__)
 
 
-def cimread(source, packageMap=None, nsURI=None, start_dict=None):
+def cimread(source, packageMap=None, nsURI=None, start_dict=None,
+            single_pass=False, processes=None, backend=None,
+            include_classes=None, exclude_classes=None, subclasses=False,
+            cache=None, memory_map=False, stats=None, batch_link=False,
+            checkpoint=None, checkpoint_interval=INTERVAL, slots=False):
     """ CIM RDF/XML parser.
 
     @type source: File-like object or a path to a file.
-    @param source: CIM RDF/XML file.
+    @param source: CIM RDF/XML file. Streams that can not seek (e.g. pipes,
+    sockets or C{zipfile} members) are read once and the records are kept
+    in memory for the second pass. Paths ending in C{.gz}, C{.bz2}, C{.xz}
+    or C{.zip} are decompressed as they are read. A zip archive holding
+    several RDF/XML files (e.g. the profiles of a model) is read as one
+    model with L{cimread_many}.
     @type profile: dict
     @param packageMap: Map of class name to PyCIM package name. All CIM
     classes are under the one namespace, but are arranged into sub-packages
@@ -42,6 +71,73 @@ def cimread(source, packageMap=None, nsURI=None, start_dict=None):
     @type profile: string
     @param nsURI: CIM namespace URI used in the RDF/XML file. For example:
     http://iec.ch/TC57/2010/CIM-schema-cim15
+    @type start_dict: dict
+    @param start_dict: Map of UUID to CIM object to which the objects read
+    are added. Elements using C{rdf:about} may update objects in it.
+    @type single_pass: bool
+    @param single_pass: Instantiate objects and set their attributes in one
+    pass over the file. References to objects that have not been read yet
+    are recorded in a pending table and set when the object is read.
+    @type processes: int
+    @param processes: Number of worker processes. If greater than one, the
+    file at the given path is split into chunks of whole object elements
+    that are parsed in parallel. The model is the same as that of the
+    two-pass reader.
+    @type backend: string
+    @param backend: Name of the parser backend: "iterparse" (default),
+    "expat" or, if lxml is installed, "lxml". See L{PyCIM.RDFXMLBackends}.
+    @type include_classes: list
+    @param include_classes: Names of the classes to read (e.g.
+    ["ACLineSegment", "Terminal"]). Defaults to all classes.
+    @type exclude_classes: list
+    @param exclude_classes: Names of the classes not to read (e.g.
+    ["PositionPoint"]). The elements of classes that are not read are
+    skipped by the parser and references to their objects are dropped
+    without logging an error.
+    @type subclasses: bool
+    @param subclasses: Match the classes in C{include_classes} and
+    C{exclude_classes} with their subclasses, so that excluding
+    "PowerSystemResource" excludes "ACLineSegment".
+    @type cache: L{PyCIM.ParseCache.ParseCache} or string
+    @param cache: Cache (or cache directory) of the models read. If the
+    file at the given path has been read before with the same arguments
+    and class definitions, its model is loaded from the cache instead of
+    being parsed. Not used for file-like objects or with C{start_dict}.
+    @type memory_map: bool
+    @param memory_map: Map the file at the given path into memory and parse
+    slices of the mapping instead of reading it. Also used by the chunk
+    workers when C{processes} is greater than one. Not used for compressed
+    files.
+    @type stats: L{PyCIM.ReadStats.ReadStats} or callable
+    @param stats: Statistics to fill in with the phase timings, the number
+    and size of the objects of each class and the errors of the read, or
+    a function called with the statistics once the file has been read or
+    loaded from the cache.
+    @type batch_link: bool
+    @param batch_link: Set references without calling the property
+    setters and set the inverse end of every association in one pass once
+    the file has been read. Loading is then linear in the number of
+    references to an object, rather than quadratic, which is much faster
+    for models with objects referred to by many others (e.g. connectivity
+    nodes or base voltages). Objects in C{start_dict} are left as they are
+    if an inverse end is already set.
+    @type checkpoint: L{PyCIM.Checkpoint.Checkpoint} or string
+    @param checkpoint: Checkpoint (or path to a checkpoint file) of the
+    read. The file at the given path is read in a single pass with the
+    expat parser and the state of the read is saved to the checkpoint file
+    at most once every C{checkpoint_interval} seconds. If the read is
+    interrupted, reading the file again with the same arguments resumes
+    from the checkpoint. The checkpoint is removed once the file has been
+    read. Not used for file-like objects, compressed files or with
+    C{start_dict}. See
+    L{PyCIM.Checkpoint}.
+    @type checkpoint_interval: float
+    @param checkpoint_interval: Minimum number of seconds between
+    checkpoints, if C{checkpoint} is a path.
+    @type slots: bool
+    @param slots: Instantiate the slotted variants of the classes, whose
+    instances have no C{__dict__} and use much less memory. See
+    L{PyCIM.Slots}.
     @rtype: dict
     @return: Map of UUID to CIM object.
 
@@ -50,6 +146,21 @@ def cimread(source, packageMap=None, nsURI=None, start_dict=None):
     # Start the clock.
     t0 = time()
 
+    callback = None
+    if stats is not None and not isinstance(stats, ReadStats):
+        callback, stats = stats, ReadStats()
+    if stats is not None:
+        stats.start()
+
+    if isinstance(source, basestring) and compression(source) is not None:
+        d = _read_compressed(source, packageMap, nsURI, start_dict,
+                single_pass, processes, backend, include_classes,
+                exclude_classes, subclasses, cache, memory_map, stats,
+                batch_link, checkpoint, slots)
+        if callback is not None:
+            callback(stats)
+        return d
+
     #logger.info('##########################################################################')
     logger.info('START of parsing file \"%s\"', source)
     logger_errors_grouped = {}
@@ -57,170 +168,774 @@ def cimread(source, packageMap=None, nsURI=None, start_dict=None):
     # A map of uuids to CIM objects to be returned.
     d = start_dict if start_dict is not None else {}
 
-    # Obtain the namespaces from the input file
-    namespaces = xmlns(source)
-    ns_rdf = get_rdf_ns(namespaces)
+    _check_namespace_args(packageMap, nsURI)
+    accept = _class_filter(include_classes, exclude_classes, subclasses,
+                           packageMap)
+    ns = _Namespaces(packageMap, nsURI, accept)
+
+    key = None
+    if cache is not None and isinstance(source, basestring) and \
+            start_dict is None:
+        # The key depends on the package map.
+        ns(xmlns(source))
+        cache, key, cached = _cached(cache, source, ns, (include_classes,
+                exclude_classes, subclasses, slots))
+        if cached is not None:
+            logger.info('Loaded %d CIM objects from the cache in %.2fs.',
+                        len(cached), time() - t0)
+            _loaded(stats, cached)
+            if callback is not None:
+                callback(stats)
+            return cached
+
+    records_of = get_backend(backend)
+
+    records = None
+    if checkpoint is not None:
+        if isinstance(source, basestring) and start_dict is None:
+            if ns.base is None:
+                ns(xmlns(source))
+            if isinstance(checkpoint, basestring):
+                checkpoint = Checkpoint(checkpoint, checkpoint_interval)
+            records = checkpoint.records(source, ns, accept,
+                    (include_classes, exclude_classes, subclasses,
+                     batch_link, slots))
+            ignored = [name for name, used in (("processes",
+                    processes is not None and processes > 1),
+                    ("memory_map", memory_map), ("backend",
+                    backend not in (None, "expat"))) if used]
+            if ignored:
+                logger.warn('Checkpointed reads use the expat parser in a '
+                            'single pass. Ignoring: %s.', ", ".join(ignored))
+        else:
+            logger.warn('Only files given by path, without a start_dict, '
+                        'are checkpointed.')
+            checkpoint = None
+    elif processes is not None and processes > 1 and \
+            isinstance(source, basestring):
+        if ns.base is None:
+            ns(xmlns(source))
+        records = _read_chunks(source, ns.nsURI, ns.ns_rdf, processes,
+                backend, (include_classes, exclude_classes, subclasses,
+                          ns.packageMap), memory_map)
+    elif processes is not None and processes > 1:
+        logger.warn('Only files given by path are parsed in parallel.')
+
+    path = None
+    if records is None and memory_map and isinstance(source, basestring):
+        path, source = source, MappedFile(source)
+
+    # Remember the position of a seekable stream for the second pass.
+    start = None
+    if records is None and not single_pass and \
+            not isinstance(source, basestring):
+        start = _tell(source)
+        if start is None:
+            # Parse once and keep the records for the second pass.
+            records = list(_records(records_of, source, ns, accept))
+
+    if records is None:
+        records = _records(records_of, source, ns, accept)
+    if stats is not None:
+        stats.timings["namespaces"] = time() - t0
+        if isinstance(records, list):
+            stats.timings["parse"] = stats.timings.pop("namespaces")
+            stats.timings["namespaces"] = 0.0
+        else:
+            records = _timed(records, stats.timings)
+
+    builder = _ModelBuilder(d, ns.packageMap, logger_errors_grouped,
+                            drop_missing=accept is not None, stats=stats,
+                            batch=batch_link, slots=slots)
+    if checkpoint is not None:
+        checkpoint.builder = builder
+    if isinstance(records, list):
+        _phase(stats, "instantiate", builder.create_all, records)
+        _phase(stats, "bind", builder.update_all, records)
+    elif single_pass or checkpoint is not None:
+        _phase(stats, "instantiate", builder.add_all, records)
+    else:
+        # First pass instantiates the classes.
+        _phase(stats, "instantiate", builder.create_all, records)
+
+        # Reset stream
+        if start is not None:
+            source.seek(start)
+
+        ## Second pass sets attributes and references.
+        records = _records(records_of, source, ns, accept)
+        if stats is not None:
+            records = _timed(records, stats.timings)
+        _phase(stats, "bind", builder.update_all, records)
+
+    if batch_link:
+        _phase(stats, "bind", builder.link)
+
+    if path is not None:
+        source.close()
+        source = path
+
+    _log_errors(logger_errors_grouped)
+    if builder.dropped:
+        logger.info('Dropped %d references to objects not read.',
+                    builder.dropped)
+
+    if key is not None:
+        cache.put(key, ns.packageMap, d)
+
+    if stats is not None:
+        stats.stop(d)
+        if callback is not None:
+            callback(stats)
+
+    # logging_message = 'Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0)
+    logger.info('Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0))
+    # logging_message = 'END of parsing file \"%s\"\n' % source
+    logger.info('END of parsing file \"%s\"\n' % source)
+
+    return d
+
+
+def cimread_many(paths, packageMaps=None, start_dict=None, processes=None,
+                 backend=None, include_classes=None, exclude_classes=None,
+                 subclasses=False, stats=None, batch_link=False, slots=False):
+    """ Parallel CIM RDF/XML parser for a model split over several files
+    (e.g. the ASSET, CONN, EQUIP and GEO files of a CDPSM model).
+
+    The files are parsed in a pool of processes. Objects that share an
+    C{rdf:ID}/C{rdf:about} UUID are merged into one instance and references
+    between the files are set once all the files have been read.
+
+    @type paths: list
+    @param paths: Paths to the CIM RDF/XML files. Compressed files are
+    decompressed and each RDF/XML file of a zip archive is read as a file
+    of its own.
+    @type packageMaps: list
+    @param packageMaps: Package map for each file. The class of an object
+    is taken from the map of the first file that defines it with
+    C{rdf:ID}. Defaults to the map of the CIM version of each file, so
+    that the merged objects have the properties of every profile.
+    @type start_dict: dict
+    @param start_dict: Map of UUID to CIM object to which the objects read
+    are added.
+    @type processes: int
+    @param processes: Number of worker processes. Defaults to the number of
+    files or of CPUs, whichever is fewer.
+    @type backend: string
+    @param backend: Name of the parser backend.
+    @param include_classes: See L{cimread}.
+    @param exclude_classes: See L{cimread}.
+    @param subclasses: See L{cimread}.
+    @param stats: See L{cimread}. The parse time is that of the pool.
+    @param batch_link: See L{cimread}.
+    @param slots: See L{cimread}.
+    @rtype: dict
+    @return: Map of UUID to CIM object.
+    """
+    t0 = time()
+
+    callback = None
+    if stats is not None and not isinstance(stats, ReadStats):
+        callback, stats = stats, ReadStats()
+    if stats is not None:
+        stats.start()
+
+    files = []
+    for path in paths:
+        if compression(path) == ZIP:
+            files.extend((path, member) for member in zip_members(path))
+        else:
+            files.append((path, None))
+
+    if packageMaps is not None and len(packageMaps) != len(files):
+        raise ValueError('Pass one package map for each path.')
+
+    args = []
+    for i, (path, member) in enumerate(files):
+        packageMap = packageMaps[i] if packageMaps is not None else None
+        args.append((path, member, backend, (include_classes,
+                     exclude_classes, subclasses, packageMap)))
+    results = _map(_read_records, args, processes)
+
+    logger.info('Parsed %d files in %.2fs.', len(files), time() - t0)
+    if stats is not None:
+        stats.timings["parse"] = time() - t0
+
+    d = start_dict if start_dict is not None else {}
+    errors = {}
+    filtered = include_classes is not None or bool(exclude_classes)
+
+    builders = []
+    for i, (namespaces, records) in enumerate(results):
+        if packageMaps is not None:
+            packageMap = packageMaps[i]
+        else:
+            _, packageMap = get_cim_ns(namespaces)
+        builders.append(_ModelBuilder(d, packageMap, errors,
+                drop_missing=filtered, stats=stats, batch=batch_link,
+                slots=slots))
+
+    # Instantiate one object per UUID.
+    for builder, (_, records) in zip(builders, results):
+        _phase(stats, "instantiate", builder.create_all, records, True)
+
+    # Set attributes and references once every object exists.
+    for builder, (_, records) in zip(builders, results):
+        _phase(stats, "bind", builder.update_all, records)
+
+    if batch_link:
+        for builder in builders:
+            _phase(stats, "bind", builder.link)
+
+    _log_errors(errors)
+    dropped = sum(builder.dropped for builder in builders)
+    if dropped:
+        logger.info('Dropped %d references to objects not read.', dropped)
+
+    if stats is not None:
+        stats.stop(d)
+        if callback is not None:
+            callback(stats)
+
+    logger.info('Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0))
+
+    return d
+
+
+def _read_records(args):
+    """ Returns the namespaces and the list of records of the given file.
+    C{classes} are the include, exclude, subclasses and package map
+    arguments of the class filter.
+    """
+    path, member, backend, classes = args
+    accept = _class_filter(*classes)
+    ns = _Namespaces(accept=accept)
+    if compression(path) is None:
+        records = list(_records(get_backend(backend), path, ns, accept))
+    else:
+        f = open_compressed(path, member=member)
+        try:
+            records = list(_records(get_backend(backend), f, ns, accept))
+        finally:
+            f.close()
+    return ns.namespaces, records
+
+
+def _read_compressed(path, packageMap, nsURI, start_dict, single_pass,
+                     processes, backend, include_classes, exclude_classes,
+                     subclasses, cache, memory_map, stats, batch_link,
+                     checkpoint, slots):
+    """ Reads the compressed file at the given path as a stream, or a zip
+    archive of several files with L{cimread_many}. The cache key is that
+    of the compressed file.
+    """
+    members = zip_members(path) if compression(path) == ZIP else [None]
+    many = len(members) != 1
+    if many:
+        ignored = (("memory_map", memory_map),
+                   ("checkpoint", checkpoint is not None),
+                   ("single_pass", single_pass))
+        message = 'Zip archives of several files are read with cimread_many.'
+    else:
+        ignored = (("memory_map", memory_map),
+                   ("checkpoint", checkpoint is not None),
+                   ("processes", processes is not None and processes > 1))
+        message = 'Compressed files are read as a stream.'
+    ignored = [name for name, used in ignored if used]
+    if ignored:
+        logger.warn('%s Ignoring: %s.', message, ", ".join(ignored))
+
+    key = None
+    if cache is not None and start_dict is None and members:
+        _check_namespace_args(packageMap, nsURI)
+        ns = _Namespaces(packageMap, nsURI)
+        f = open_compressed(path, member=members[0])
+        try:
+            ns(xmlns(f))
+        finally:
+            f.close()
+        cache, key, cached = _cached(cache, path, ns, (include_classes,
+                exclude_classes, subclasses, slots))
+        if cached is not None:
+            logger.info('Loaded %d CIM objects from the cache.', len(cached))
+            _loaded(stats, cached)
+            return cached
+
+    if many:
+        packageMaps = None
+        if packageMap is not None:
+            packageMaps = [packageMap] * len(members)
+        d = cimread_many([path], packageMaps, start_dict, processes,
+                         backend, include_classes, exclude_classes,
+                         subclasses, stats, batch_link, slots)
+    else:
+        f = open_compressed(path)
+        try:
+            d = cimread(f, packageMap, nsURI, start_dict, single_pass,
+                        backend=backend, include_classes=include_classes,
+                        exclude_classes=exclude_classes,
+                        subclasses=subclasses, stats=stats,
+                        batch_link=batch_link, slots=slots)
+        finally:
+            f.close()
+
+    if key is not None:
+        cache.put(key, ns.packageMap, d)
+    return d
+
+
+def _loaded(stats, d):
+    """ Fills in the statistics, if any, of a model loaded from the cache.
+    """
+    if stats is not None:
+        stats.cached = True
+        stats.count_model(d)
+        stats.stop(d)
+
+
+def _cached(cache, path, ns, args):
+    """ Returns the cache, the key of the file at the given path read with
+    the given arguments and the model cached under the key, or None.
+
+    @type cache: L{PyCIM.ParseCache.ParseCache} or string
+    @param ns: L{_Namespaces} with the namespaces of the file detected.
+    """
+    if isinstance(cache, basestring):
+        cache = ParseCache(cache)
+    key = cache.key(path, ns.nsURI, class_fingerprint(ns.packageMap), *args)
+    return cache, key, cache.get(key, ns.packageMap)
+
+
+def _read_chunks(source, nsURI, ns_rdf, processes, backend=None,
+                 classes=(None, None, False, None), memory_map=False):
+    """ Returns the list of records of the file at the given path, parsed
+    in chunks by a pool of processes, or None if the file can not be split.
+    C{classes} are the include, exclude, subclasses and package map
+    arguments of the class filter.
+    """
+    prefixes = dict((ns, prefix) for prefix, ns in xmlns(source).items())
+    try:
+        prefix = prefixes[nsURI + "#"]
+    except KeyError:
+        prefix = prefixes.get(nsURI, "cim")
+    chunks = split(source, processes, prefix, prefixes.get(ns_rdf, "rdf"))
+    if chunks is None:
+        return None
+    header, footer, ranges = chunks
+
+    args = [(source, start, end, header, footer, nsURI, backend, classes,
+             memory_map) for start, end in ranges]
+    try:
+        results = _map(_read_chunk, args, processes)
+    except ParseError as e:
+        logger.warn('Unable to parse "%s" in chunks (%s). Parsing the '
+                    'whole file.', source, e)
+        return None
+
+    records = []
+    for chunk in results:
+        records.extend(chunk)
+    return records
+
+
+def _read_chunk(args):
+    """ Returns the list of records of a byte range of a file.
+    """
+    path, start, end, header, footer, nsURI, backend, classes, \
+            memory_map = args
+    include, exclude, subclasses, packageMap = classes
+    if memory_map:
+        f = MappedFile(path, start, end, header, footer)
+    else:
+        f = BytesIO(header + read_range(path, start, end) + footer)
+    try:
+        return list(iter_cimread(f, packageMap, nsURI, backend=backend,
+                                 include_classes=include,
+                                 exclude_classes=exclude,
+                                 subclasses=subclasses))
+    finally:
+        f.close()
+
+
+def _map(func, args, processes):
+    """ Applies the function to each argument in a pool of processes.
+    """
+    if processes is None:
+        processes = cpu_count()
+    processes = min(processes, len(args))
+    if processes < 2:
+        return [func(arg) for arg in args]
+
+    pool = Pool(processes)
+    try:
+        return pool.map(func, args)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def iter_cimread(source, packageMap=None, nsURI=None, resolve=False,
+                 backend=None, include_classes=None, exclude_classes=None,
+                 subclasses=False):
+    """ Streaming CIM RDF/XML parser.
+
+    Yields a L{CIMRecord} for each CIM object element as the element
+    closes. Only the element being read is held in memory, so models
+    larger than memory may be filtered or passed on to other systems.
+
+    @type source: File-like object or a path to a file.
+    @param source: CIM RDF/XML file.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name. Only
+    required when C{resolve} or C{subclasses} is True.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type resolve: bool
+    @param resolve: Yield a CIM object for each C{rdf:ID} element instead
+    of a record. References to objects read earlier are set immediately
+    and references to objects further down the file are set when the
+    object is read, so all objects read are kept in memory.
+    @type backend: string
+    @param backend: Name of the parser backend.
+    @param include_classes: Names of the classes to read.
+    @param exclude_classes: Names of the classes not to read.
+    @param subclasses: Match the named classes with their subclasses.
+    @rtype: generator
+    @return: L{CIMRecord}s or, if C{resolve} is True, CIM objects.
+    """
+    if resolve:
+        _check_namespace_args(packageMap, nsURI)
+    accept = _class_filter(include_classes, exclude_classes, subclasses,
+                           packageMap)
+    ns = _Namespaces(packageMap, nsURI, accept)
+    records = _records(get_backend(backend), source, ns, accept)
+
+    if not resolve:
+        for record in records:
+            yield record
+        return
+
+    errors = {}
+    builder = _ModelBuilder({}, ns.packageMap, errors,
+                            drop_missing=accept is not None)
+    for record in records:
+        obj = builder.add(record)
+        if obj is not None and not record.about:
+            yield obj
+    builder.close()
+
+    _log_errors(errors)
+
+
+def _check_namespace_args(packageMap, nsURI):
     if bool(nsURI) != bool(packageMap):
         raise ValueError(
                 'Either pass "packageMap" AND "nsURI" or none of them.')
-    elif (nsURI is None) and (packageMap is None):
-        nsURI, packageMap = get_cim_ns(namespaces)
 
-    # CIM element tag base (e.g. {http://iec.ch/TC57/2009/CIM-schema-cim14#}).
-    base = "{%s#}" % nsURI
-    # Length of element tag base.
-    m = len(base)
 
-    # First pass instantiates the classes.
-    context = iterparse(source, ("start", "end"))
+class _Namespaces(object):
+    """ Detects the CIM namespace URI, package map and RDF namespace from
+    the namespaces declared by the root element of a file. Passed to the
+    parser backends as C{detect}.
+    """
 
-    # Turn it into an iterator (required for cElementTree).
-    context = iter(context)
+    def __init__(self, packageMap=None, nsURI=None, accept=None):
+        #: Map of prefix to namespace.
+        self.namespaces = None
+        self.packageMap = packageMap
+        self.nsURI = nsURI
+        self.ns_rdf = None
+        #: CIM element tag base (e.g.
+        #: {http://iec.ch/TC57/2009/CIM-schema-cim14#}).
+        self.base = None
+        #: Class filter that needs the package map.
+        self.accept = accept
+
+    def __call__(self, namespaces):
+        self.namespaces = namespaces
+        self.ns_rdf = get_rdf_ns(namespaces)
+        if self.nsURI is None:
+            self.nsURI, cimMap = get_cim_ns(namespaces)
+            if self.packageMap is None:
+                self.packageMap = cimMap
+        if self.accept is not None and self.accept.packageMap is None:
+            self.accept.packageMap = self.packageMap
+        self.base = "{%s#}" % self.nsURI
+        return self.base, self.ns_rdf
+
+
+def _records(records_of, source, ns, accept=None):
+    """ Returns an iterator over the records of the given source read by
+    the backend function C{records_of}. If the namespaces are not known,
+    they are detected before the first record is returned.
+    """
+    if ns.base is not None:
+        return iter(records_of(source, ns.base, ns.ns_rdf, accept))
 
-    # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-    _, root = next(context)
+    records = iter(records_of(source, None, None, accept, ns))
+    for record in records:
+        return chain([record], records)
+    return iter(())
 
-    for event, elem in context:
-        # Process 'end' elements in the CIM namespace.
-        if event == "end" and elem.tag[:m] == base:
 
-            # Unique resource identifier for the CIM object.
-            uuid = elem.get("{%s}ID" % ns_rdf)
-            if uuid is not None: # class
-                # Element tag without namespace (e.g. VoltageLevel).
-                tag = elem.tag[m:]
-                try:
-                    mname = packageMap[tag]
-                except KeyError:
-                    logger.error("Unable to locate module for: %s (%s)",
-                                 tag, uuid)
-                    root.clear()
-                    continue
-                # Import the module for the CIM object.
-                module = __import__(mname, globals(), locals(), [tag], 0)
-                # Get the CIM class from the module.
-                klass = getattr(module, tag)
+def _timed(records, timings):
+    """ Yields the given records, adding the time spent reading them to the
+    "parse" timing.
+    """
+    records = iter(records)
+    while True:
+        t = time()
+        try:
+            record = next(records)
+        except StopIteration:
+            timings["parse"] += time() - t
+            return
+        timings["parse"] += time() - t
+        yield record
+
+
+def _phase(stats, name, func, *args):
+    """ Calls the given function and adds the time spent, less any parse
+    time, to the named timing.
+    """
+    if stats is None:
+        return func(*args)
+    timings = stats.timings
+    t, parse = time(), timings["parse"]
+    result = func(*args)
+    timings[name] += time() - t - (timings["parse"] - parse)
+    return result
 
-                # Instantiate the class and map it to the uuid.
-                d[uuid] = klass(UUID=uuid)
 
-        # Clear children of the root element to minimise memory usage.
-        root.clear()
+def _tell(source):
+    """ Returns the position of a seekable stream, or None.
+    """
+    try:
+        if hasattr(source, "seekable") and not source.seekable():
+            return None
+        return source.tell()
+    except (AttributeError, IOError, OSError):
+        return None
 
-    # Reset stream
-    if hasattr(source, "seek"):
-        source.seek(0)
 
-    ## Second pass sets attributes and references.
-    context = iter( iterparse(source, ("start", "end")) )
-
-    # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-    _, root = next(context)
-
-    for event, elem in context:
-        # Process 'start' elements in the CIM namespace.
-        if event == "start" and elem.tag[:m] == base:
-            uuid = elem.get("{%s}ID" % ns_rdf)
-            if uuid is None:
-                uuid = elem.get("{%s}about" % ns_rdf)
-                if uuid is not None:
-                    uuid = uuid[1:]
-            if uuid is not None:
-                # Locate the CIM object using the uuid.
-                try:
-                    obj = d[uuid]
-                except KeyError:
-                    logger.error("Missing '%s' object with uuid: %s",
-                                 elem.tag[m:], uuid)
-                    root.clear()
-                    continue
+def _class_filter(include, exclude, subclasses, packageMap):
+    """ Returns the map of class name to whether the class is read, or None
+    if all classes are read.
+    """
+    if include is None and not exclude:
+        return None
+    return ClassFilter(include, exclude, subclasses, packageMap)
 
-                # Iterate over attributes/references.
-                for event, elem in context:
-                    # Process end events with elements in the CIM namespace.
-                    if event == "end" and elem.tag[:m] == base:
-                        # Break if class closing element (e.g. </cim:Terminal>).
-                        if elem.get("{%s}ID" % ns_rdf) is None and \
-                                elem.get("{%s}about" % ns_rdf) is None:
-                            # Get the attribute/reference name.
-                            attr = elem.tag[m:].rsplit(".")[-1]
-
-                            if not hasattr(obj, attr):
-                                error_msg = "'%s' has not attribute '%s'" %(obj.__class__.__name__, attr)
-                                try:
-                                    logger_errors_grouped[error_msg] += 1
-                                except KeyError:
-                                    logger_errors_grouped[error_msg] = 1
-                                # logger.error("'%s' has not attribute '%s'",
-                                #              obj.__class__.__name__, attr)
-                                continue
-
-                            # Use the rdf:resource attribute to distinguish
-                            # between attributes and references/enums.
-                            uuid2 = elem.get("{%s}resource" % ns_rdf)
-
-                            if uuid2 is None: # attribute
-                                # Convert value type using the default value.
-                                try:
-                                    typ = type( getattr(obj, attr) )
-                                    if typ == type(True): # KKG: Test if it is boolean value
-                                        # KKG: NB: The function bool("false") returns True, because it is called upon non-empty string!
-                                        # This means that it wrongly reads "false" value as boolean True and this is why this special case testing is necessary
-                                        if str.title(elem.text) == 'True':
-                                            setattr(obj, attr, True)
-                                        else:
-                                            setattr(obj, attr, False)
-                                    else:
-                                        setattr(obj, attr, typ(elem.text))
-                                except TypeError:
-                                    pass
-                            else:  # reference or enum
-                                # Use the '#' prefix to distinguish between
-                                # references and enumerations.
-                                if uuid2[0] == "#": # reference
-                                    try:
-                                        val = d[uuid2[1:]] # remove '#' prefix
-                                    except KeyError:
-                                        logger.error("Referenced '%s' [%s] "
-                                                     "object missing.",
-                                                     obj.__class__.__name__,
-                                                     uuid2[1:])
-                                        continue
-
-                                    default = getattr(obj, attr)
-                                    if default == None: # 1..1 or 1..n
-                                        # Rely on properties to set any
-                                        # bi-directional references.
-                                        setattr(obj, attr, val)
-                                    elif isinstance(default, list): # many
-                                        # Use 'add*' method to set reference.
-                                        getattr(obj, ("add%s" % attr))(val)
-#                                    else:
-#                                        logger.error("Reference error [%s].",
-#                                                     default)
-
-                                else: # enum
-                                    val = uuid2.rsplit(".", 1)[1]
-                                    setattr(obj, attr, val)
-
-                        else:
-                            # Finished setting object attributes.
-                            break
-
-        # Clear children of the root element to minimise memory usage.
-        root.clear()
-
-    if logger_errors_grouped:
-        for error, count in logger_errors_grouped.items():
-            logging_message = '%s : %d times' %(error, count)
-            logger.warn(logging_message)
 
-    # logging_message = 'Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0)
-    logger.info('Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0))
-    # logging_message = 'END of parsing file \"%s\"\n' % source
-    logger.info('END of parsing file \"%s\"\n' % source)
+class _ModelBuilder(object):
+    """ Builds CIM objects from records into a map of UUID to object.
+    """
 
-    return d
+    def __init__(self, d, packageMap, errors, drop_missing=False,
+                 stats=None, batch=False, slots=False):
+        #: Map of UUID to CIM object.
+        self.d = d
+        #: Map of class name to CIM class, or to its slotted variant.
+        self.classes = get_resolver(packageMap, slots)
+        #: Map of 'has not attribute' message to count.
+        self.errors = errors
+        #: Map of missing UUID to the (object, setter) tuples referencing it.
+        self.pending = {}
+        #: Map of missing UUID to the 'rdf:about' records updating it.
+        self.deferred = {}
+        #: Drop references to missing objects without logging an error,
+        #: as when classes are filtered out.
+        self.drop_missing = drop_missing
+        #: Number of references and records dropped.
+        self.dropped = 0
+        #: L{ReadStats} to count objects and errors in, or None.
+        self.stats = stats
+        #: Link references by slot. See L{link}.
+        self.batch = batch
+        #: (object, reference name, value) tuples linked by slot.
+        self.links = []
+
+    def instantiate(self, record):
+        """ Adds a new instance of the class of the given record to the
+        model and returns it, or None if the class can not be located.
+        """
+        try:
+            klass = self.classes[record.class_name]
+        except KeyError:
+            logger.error("Unable to locate module for: %s (%s)",
+                         record.class_name, record.uuid)
+            if self.stats is not None:
+                self.stats.count(self.stats.unknown_classes,
+                                 record.class_name)
+            return None
+
+        # Instantiate the class and map it to the uuid.
+        obj = self.d[record.uuid] = klass(UUID=record.uuid)
+        if self.stats is not None:
+            self.stats.count(self.stats.classes, record.class_name)
+        return obj
+
+    def create_all(self, records, merge=False):
+        """ Instantiates the class of each C{rdf:ID} record. If C{merge} is
+        True, objects already in the model are kept.
+        """
+        d = self.d
+        for record in records:
+            if not record.about and not (merge and record.uuid in d):
+                self.instantiate(record)
+
+    def update_all(self, records):
+        """ Updates the object of each record. Objects and referenced
+        objects that are not in the model are logged as missing.
+        """
+        d = self.d
+        for record in records:
+            # Locate the CIM object using the uuid.
+            try:
+                obj = d[record.uuid]
+            except KeyError:
+                if self.drop_missing:
+                    self.dropped += 1
+                else:
+                    logger.error("Missing '%s' object with uuid: %s",
+                                 record.class_name, record.uuid)
+                if self.stats is not None:
+                    self.stats.missing_objects += 1
+                continue
+            self.update(obj, record)
+
+    def update(self, obj, record, pending=None):
+        """ Sets the attributes and references of the given object from the
+        given record. References to objects that are not in the model are
+        added to C{pending} or, if it is None, logged as missing.
+        """
+        d = self.d
+        plan = get_plan(obj.__class__, self.batch)
+
+        for tag, text in record.attributes.items():
+            setter = self._setter(obj, plan, tag)
+            if setter is not None and setter.link is None:
+                try:
+                    setattr(obj, setter.name, setter.convert(text))
+                except TypeError:
+                    pass
+
+        for tag, uuid2 in record.references:
+            setter = self._setter(obj, plan, tag)
+            if setter is None or setter.link is None:
+                continue
+            try:
+                val = d[uuid2]
+            except KeyError:
+                if pending is not None:
+                    pending.setdefault(uuid2, []).append((obj, setter))
+                    continue
+                elif self.drop_missing:
+                    self.dropped += 1
+                else:
+                    logger.error("Referenced '%s' [%s] object missing.",
+                                 obj.__class__.__name__, uuid2)
+                if self.stats is not None:
+                    self.stats.unresolved_references += 1
+                continue
+            self._link(obj, setter, val)
+
+    def add(self, record):
+        """ Instantiates or updates the object of the given record in a
+        single pass. References to objects that have not been read yet are
+        set when they are added. Returns the object or None.
+        """
+        uuid = record.uuid
+        if record.about:
+            obj = self.d.get(uuid)
+            if obj is None:
+                # The object may be defined later in the file.
+                self.deferred.setdefault(uuid, []).append(record)
+                return None
+            self.update(obj, record, self.pending)
+            return obj
+
+        obj = self.instantiate(record)
+        if obj is None:
+            return None
+        self.update(obj, record, self.pending)
+
+        for r in self.deferred.pop(uuid, ()):
+            self.update(obj, r, self.pending)
+        for other, setter in self.pending.pop(uuid, ()):
+            self._link(other, setter, obj)
+
+        return obj
+
+    def add_all(self, records):
+        """ Adds each record in a single pass.
+        """
+        add = self.add
+        for record in records:
+            add(record)
+        self.close()
+
+    def _link(self, obj, setter, value):
+        setter.link(obj, value)
+        if self.batch:
+            self.links.append((obj, setter.name, value))
+
+    def link(self):
+        """ Sets the inverse ends of the references linked in batch mode.
+        """
+        link_inverses(self.links)
+        self.links = []
+
+    def close(self):
+        """ Logs the records and references that were never resolved.
+        """
+        if self.stats is not None:
+            self.stats.missing_objects += sum(map(len,
+                                                  self.deferred.values()))
+            self.stats.unresolved_references += sum(map(len,
+                                                  self.pending.values()))
+        if self.drop_missing:
+            self.dropped += sum(map(len, self.deferred.values()))
+            self.dropped += sum(map(len, self.pending.values()))
+            self.deferred = {}
+            self.pending = {}
+        for uuid, records in self.deferred.items():
+            for record in records:
+                logger.error("Missing '%s' object with uuid: %s",
+                             record.class_name, uuid)
+        for uuid, links in self.pending.items():
+            for obj, _ in links:
+                logger.error("Referenced '%s' [%s] object missing.",
+                             obj.__class__.__name__, uuid)
+        self.deferred = {}
+        self.pending = {}
+
+    def _setter(self, obj, plan, tag):
+        try:
+            return plan[tag]
+        except KeyError:
+            # Get the attribute/reference name.
+            attr = tag.rsplit(".")[-1]
+            try:
+                return plan[attr]
+            except KeyError:
+                error_msg = "'%s' has not attribute '%s'" %(obj.__class__.__name__, attr)
+                try:
+                    self.errors[error_msg] += 1
+                except KeyError:
+                    self.errors[error_msg] = 1
+                if self.stats is not None:
+                    self.stats.count(self.stats.unknown_attributes,
+                            "%s.%s" % (obj.__class__.__name__, attr))
+                # logger.error("'%s' has not attribute '%s'",
+                #              obj.__class__.__name__, attr)
+                return None
+
+
+def _log_errors(errors):
+    for error, count in errors.items():
+        logging_message = '%s : %d times' %(error, count)
+        logger.warn(logging_message)
 
 
 def xmlns(source):
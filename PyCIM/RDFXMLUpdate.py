@@ -0,0 +1,313 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Incremental updates of a model from CIM RDF/XML files.
+
+An update file is applied to a model in place. Only the objects it names
+are changed, so the references held to the other objects stay valid. An
+update file is either:
+
+  - a partial model, in which C{rdf:ID} elements define new objects (or
+    update the object with that UUID) and C{rdf:about} elements update
+    existing objects, or
+  - a difference model (IEC 61970-552), in which the statements of the
+    C{dm:reverseDifferences} are removed and then those of the
+    C{dm:forwardDifferences} are added. An object whose element is in the
+    reverse differences but not in the forward differences is deleted.
+    Property changes may also be given by C{rdf:Description} elements.
+"""
+
+from collections import namedtuple
+from xml.etree.cElementTree import iterparse
+
+from PyCIM.RDFXMLBackends import CIMRecord, element_id, element_properties
+from PyCIM.RDFXMLReader import _check_namespace_args, _Namespaces, \
+    _ModelBuilder, _log_errors
+from PyCIM.SetterPlan import get_plan, REFERENCE, MANY_REFERENCE
+
+from time import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+FORWARD = "forwardDifferences"
+REVERSE = "reverseDifferences"
+
+#: UUIDs of the objects created, updated and deleted by an update, in the
+#: order they were first changed.
+ModelChanges = namedtuple("ModelChanges", ["created", "updated", "deleted"])
+
+
+def cimupdate(source, d, packageMap=None, nsURI=None, slots=False):
+    """ Applies a CIM RDF/XML update file to a model in place.
+
+    @type source: File-like object or a path to a file.
+    @param source: CIM RDF/XML partial or difference model file.
+    @type d: dict
+    @param d: Map of UUID to CIM object to update.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name of the new
+    objects. Defaults to the map of the CIM version of the file.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type slots: bool
+    @param slots: Create the new objects as instances of the slotted
+    variants of their classes, as for a model read with C{slots}.
+    @rtype: L{ModelChanges}
+    @return: UUIDs of the objects created, updated and deleted.
+    """
+    t0 = time()
+
+    _check_namespace_args(packageMap, nsURI)
+    ns = _Namespaces(packageMap, nsURI)
+
+    sections = {None: [], FORWARD: [], REVERSE: []}
+    for section, record in update_records(source, ns):
+        sections[section].append(record)
+
+    errors = {}
+    update = _ModelUpdate(d, ns.packageMap, errors, slots)
+
+    # Statements that are removed and then added again are changes.
+    added = set(record.uuid for record in sections[FORWARD]
+                if record.class_name is not None)
+    update.remove_all(sections[REVERSE], added)
+    update.add_all(sections[FORWARD])
+    update.add_all(sections[None])
+
+    _log_errors(errors)
+
+    changes = update.changes()
+    logger.info('Created %d, updated %d and deleted %d CIM objects in '
+                '%.2fs.', len(changes.created), len(changes.updated),
+                len(changes.deleted), time() - t0)
+    return changes
+
+
+def update_records(source, detect):
+    """ Yields a (section, L{CIMRecord}) tuple for each element of the
+    given update file with an C{rdf:ID} or C{rdf:about} attribute in the
+    CIM namespace, and for each C{rdf:Description} element. The section is
+    L{FORWARD}, L{REVERSE} or None outside difference sections, and the
+    class name of an C{rdf:Description} record is None. C{detect} returns
+    the CIM element tag base and RDF namespace from the map of prefix to
+    namespace of the file.
+    """
+    context = iter( iterparse(source, ("start-ns", "start", "end")) )
+    namespaces = {}
+    for event, elem in context:
+        if event == "start-ns":
+            prefix, ns = elem
+            namespaces[prefix] = ns
+        else:
+            root = elem
+            break
+    base, ns_rdf = detect(namespaces)
+
+    m = len(base)
+    rdf_ID = "{%s}ID" % ns_rdf
+    rdf_about = "{%s}about" % ns_rdf
+    rdf_resource = "{%s}resource" % ns_rdf
+    rdf_Description = "{%s}Description" % ns_rdf
+
+    section = None
+    for event, elem in context:
+        tag = elem.tag
+        name = tag.rsplit("}", 1)[-1]
+        if name in (FORWARD, REVERSE) and tag[:m] != base:
+            section = name if event == "start" else None
+            continue
+        if event != "end":
+            continue
+
+        if tag[:m] == base:
+            class_name = tag[m:]
+        elif tag == rdf_Description:
+            class_name = None
+        else:
+            continue
+
+        uuid, about = element_id(elem, rdf_ID, rdf_about)
+        if uuid is None:
+            continue # attribute/reference of the enclosing object
+
+        attributes, references = element_properties(elem, base,
+                                                    rdf_resource)
+        yield section, CIMRecord(uuid, class_name, attributes, references,
+                                 about)
+
+        elem.clear()
+        root.clear()
+
+
+class _ModelUpdate(_ModelBuilder):
+    """ Applies update records to a map of UUID to object.
+    """
+
+    def __init__(self, d, packageMap, errors, slots=False):
+        super(_ModelUpdate, self).__init__(d, packageMap, errors,
+                                           slots=slots)
+        #: Map of UUID to "created", "updated" or "deleted".
+        self.changed = {}
+        #: UUIDs in the order they were first changed.
+        self.order = []
+
+    def mark(self, uuid, change):
+        if uuid not in self.changed:
+            self.order.append(uuid)
+            self.changed[uuid] = change
+        elif change == "deleted" or self.changed[uuid] == "deleted":
+            self.changed[uuid] = change
+
+    def changes(self):
+        groups = {"created": [], "updated": [], "deleted": []}
+        for uuid in self.order:
+            groups[self.changed[uuid]].append(uuid)
+        return ModelChanges(groups["created"], groups["updated"],
+                            groups["deleted"])
+
+    def add_all(self, records):
+        """ Creates the objects of the records that are not in the model,
+        then sets the properties of each record.
+        """
+        d = self.d
+        for record in records:
+            if record.uuid not in d and record.class_name is not None:
+                if self.instantiate(record) is not None:
+                    self.mark(record.uuid, "created")
+
+        for record in records:
+            try:
+                obj = d[record.uuid]
+            except KeyError:
+                if record.class_name is not None:
+                    continue # class not found
+                logger.error("Missing object with uuid: %s", record.uuid)
+                continue
+            if record.class_name is not None and \
+                    obj.__class__.__name__ != record.class_name:
+                logger.warn("Updating '%s' [%s] as a '%s'.",
+                            record.class_name, record.uuid,
+                            obj.__class__.__name__)
+            self.set_all(obj, record)
+            self.mark(record.uuid, "updated")
+
+    def set_all(self, obj, record):
+        """ Sets the attributes of the given object and replaces or adds
+        its references.
+        """
+        plan = get_plan(obj.__class__)
+
+        for tag, text in record.attributes.items():
+            setter = self._setter(obj, plan, tag)
+            if setter is not None and setter.link is None:
+                try:
+                    setattr(obj, setter.name, setter.convert(text))
+                except (TypeError, ValueError):
+                    logger.error("Invalid value for '%s.%s' [%s]: %r",
+                                 obj.__class__.__name__, setter.name,
+                                 record.uuid, text)
+
+        for tag, uuid2 in record.references:
+            setter = self._setter(obj, plan, tag)
+            if setter is None or setter.link is None:
+                continue
+            try:
+                val = self.d[uuid2]
+            except KeyError:
+                logger.error("Referenced '%s' [%s] object missing.",
+                             obj.__class__.__name__, uuid2)
+                continue
+            if setter.kind == MANY_REFERENCE:
+                if val not in getattr(obj, setter.name):
+                    setter.link(obj, val)
+            elif getattr(obj, setter.name) is not val:
+                setattr(obj, setter.name, val)
+            self.mark(uuid2, "updated")
+
+    def remove_all(self, records, added):
+        """ Removes the statements of the given records. The objects of
+        class elements whose UUID is not in C{added} are deleted.
+        """
+        d = self.d
+        for record in records:
+            obj = d.get(record.uuid)
+            if obj is None:
+                logger.error("Missing object with uuid: %s", record.uuid)
+                continue
+            if record.class_name is not None and record.uuid not in added:
+                self.delete(obj)
+            else:
+                self.unset_all(obj, record)
+                self.mark(record.uuid, "updated")
+
+    def unset_all(self, obj, record):
+        """ Resets the given attributes of the given object to their
+        defaults and removes the given references.
+        """
+        plan = get_plan(obj.__class__)
+
+        for tag in record.attributes:
+            setter = self._setter(obj, plan, tag)
+            if setter is not None and setter.link is None:
+                setattr(obj, setter.name, _default(obj, setter.name))
+
+        for tag, uuid2 in record.references:
+            setter = self._setter(obj, plan, tag)
+            if setter is None or setter.link is None:
+                continue
+            val = self.d.get(uuid2)
+            if setter.kind == MANY_REFERENCE:
+                if val is not None and val in getattr(obj, setter.name):
+                    getattr(obj, "remove%s" % setter.name)(val)
+                    self.mark(uuid2, "updated")
+            elif val is not None and getattr(obj, setter.name) is val:
+                setattr(obj, setter.name, None)
+                self.mark(uuid2, "updated")
+
+    def delete(self, obj):
+        """ Removes the given object from the model and from the inverse
+        ends of its references.
+        """
+        for setter in set(get_plan(obj.__class__).values()):
+            if setter.kind == REFERENCE:
+                val = getattr(obj, setter.name)
+                if val is not None:
+                    setattr(obj, setter.name, None)
+                    if getattr(val, "UUID", None) in self.d:
+                        self.mark(val.UUID, "updated")
+            elif setter.kind == MANY_REFERENCE:
+                vals = list(getattr(obj, setter.name))
+                if vals:
+                    getattr(obj, "remove%s" % setter.name)(*vals)
+                    for val in vals:
+                        self.mark(val.UUID, "updated")
+        del self.d[obj.UUID]
+        self.mark(obj.UUID, "deleted")
+
+
+def _default(obj, attr):
+    """ Returns the default value of the given attribute.
+    """
+    for klass in obj.__class__.mro():
+        defaults = klass.__dict__.get("_defaults")
+        if defaults is not None and attr in defaults:
+            return defaults[attr]
+    return None
@@ -18,97 +18,166 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import io
 import logging
+import sys
+
+from multiprocessing import Pool
 
 from time import time
 
 from CIM15 import nsURI, nsPrefix
 
-from PyCIM.SimpleXMLWriter import XMLWriter
+from PyCIM.Compression import compression, open_compressed
+from PyCIM.RDFXMLEmitter import header, emit, footer
+
+try:
+    basestring
+except NameError:
+    basestring = str
 
 nsPrefixRDF = "rdf"
 nsRDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 
 logger = logging.getLogger(__name__)
 
-def cimwrite(d, source, encoding="utf-8"):
+#: Number of shards per worker when writing in a pool of processes. More
+#: shards than workers balance the load and bound the markup held at once.
+SHARDS_PER_WORKER = 4
+
+
+def cimwrite(d, source, encoding="utf-8", workers=None, owner_links=False):
     """CIM RDF/XML serializer.
 
     @type d: dict
     @param d: Map of URIs to CIM objects.
     @type source: File or file-like object.
     @param source: This object must implement a C{write} method
-    that takes an 8-bit string.
+    that takes an 8-bit string. Paths ending in C{.gz}, C{.bz2}, C{.xz} or
+    C{.zip} are written compressed.
     @type encoding: string
     @param encoding: Character encoding defaults to "utf-8", but can also
     be set to "us-ascii".
+    @type workers: int
+    @param workers: Number of worker processes. If greater than one, the
+    objects are split into shards that are serialised in a pool of forked
+    processes and written in order. The output is the same.
+    @type owner_links: bool
+    @param owner_links: Whether to write each association once, from its
+    owning end, including associations held only by many-valued
+    references. By default every single-valued reference is written and
+    many-valued references are not.
     @rtype: bool
     @return: Write success.
     """
+    if isinstance(source, basestring):
+        if compression(source) is not None:
+            f = open_compressed(source, "wb")
+        else:
+            f = io.open(source, "wb")
+        try:
+            cimwrite(d, f, encoding, workers, owner_links)
+        finally:
+            f.close()
+        return
+
     # Start the clock
     t0 = time()
 
-    w = XMLWriter(source, encoding)
-
-    # Write the XML declaration.
-    w.declaration()
+    write = source.write
+    binary = isinstance(source, (io.BufferedIOBase, io.RawIOBase)) or \
+            bytes is str
+    if binary:
+        # Encode each block of markup.
+        def write(text, write=source.write):
+            write(text.encode(encoding, "xmlcharrefreplace"))
 
     # Add a '#' suffix to the CIM namespace URI if not present.
     nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
 
-    # Start the root RDF element and declare namespaces.
-    xmlns = {u"xmlns:%s" % nsPrefixRDF: nsRDF, u"xmlns:%s" % nsPrefix: nsCIM}
-    rdf = w.start(u"%s:RDF" % nsPrefixRDF, xmlns)
-
-    # Iterate over all UUID, CIM object pairs in the given dictionary.
-    for uuid, obj in d.items():
-        w.start(u"%s:%s" % (nsPrefix, obj.__class__.__name__),
-                {u"%s:ID" % nsPrefixRDF: obj.UUID})
-
-        mro = obj.__class__.mro()
-        mro.reverse()
-
-        # Serialise attributes.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            attrs = [a for a in klass._attrs if a not in klass._enums]
-            for attr in attrs:
-                val = getattr(obj, attr)
-                if val != klass._defaults[attr]:
-                    w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, attr),
-                              str(val))
-
-        # Serialise enumeration data-types.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            enums = [a for a in klass._attrs if a in klass._enums]
-            for enum in enums:
-                val = getattr(obj, enum)
-                dt = klass._enums[enum]
-                w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, enum),
-                          attrib={u"%s:resource" % nsPrefixRDF:
-                                  u"%s%s.%s" % (nsCIM, dt, val)})
-
-        # Serialise references.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            # FIXME: serialise 'many' references.
-            refs = [r for r in klass._refs if r not in klass._many_refs]
-            for ref in refs:
-                val = getattr(obj, ref)
-                if val is not None:
-                    w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, ref),
-                          attrib={u"%s:resource" % nsPrefixRDF:
-                                  u"#%s" % val.UUID})
-
-        w.end()
-
-    # Close the root RDF element.
-    w.close(rdf)
+    # Write the XML declaration and start the root RDF element.
+    xmlns = {nsPrefixRDF: nsRDF, nsPrefix: nsCIM}
+    if not d:
+        write(header(xmlns, encoding, empty=True))
+    else:
+        write(header(xmlns, encoding))
+        if workers is not None and workers > 1:
+            _write_shards(list(d.values()), source.write if binary else write,
+                          nsPrefix, nsCIM, owner_links,
+                          encoding if binary else None, workers)
+        else:
+            emit(d.values(), write, nsPrefix, nsCIM, owner_links)
+        write(footer())
 
     # Flush the output stream.
-    w.flush()
+    if hasattr(source, "flush"):
+        source.flush()
 
     logger.info("%d CIM objects serialised in %.2fs.", len(d), time() - t0)
 
 
+# Objects being written by a pool of workers. Set before the pool is
+# forked, so that the workers do not receive them pickled.
+_shared = None
+
+
+def _write_shards(objects, write, nsPrefix, nsCIM, owner, encoding, workers):
+    """ Serialises shards of the given objects in a pool of processes and
+    writes them in order. The shards are encoded by the workers if an
+    encoding is given.
+    """
+    global _shared
+    size = max(1, -(-len(objects) // (workers * SHARDS_PER_WORKER)))
+    args = [(start, min(start + size, len(objects)), nsPrefix, nsCIM, owner,
+             encoding) for start in range(0, len(objects), size)]
+
+    _shared = objects
+    pool = _fork_pool(min(workers, len(args)))
+    if pool is None:
+        _shared = None
+        logger.warn("Processes can not be forked. Writing in one process.")
+        emit(objects, write if encoding is None else lambda text:
+             write(text.encode(encoding, "xmlcharrefreplace")),
+             nsPrefix, nsCIM, owner)
+        return
+
+    try:
+        for shard in pool.imap(_write_shard, args):
+            write(shard)
+    finally:
+        _shared = None
+        pool.close()
+        pool.join()
+
+
+def _write_shard(args):
+    """ Returns the markup of a range of the shared objects.
+    """
+    start, end, nsPrefix, nsCIM, owner, encoding = args
+    parts = []
+    emit(_shared[start:end], parts.append, nsPrefix, nsCIM, owner)
+    text = u"".join(parts)
+    if encoding is not None:
+        return text.encode(encoding, "xmlcharrefreplace")
+    return text
+
+
+def _fork_pool(processes):
+    """ Returns a pool of forked processes, or None if processes can not be
+    forked.
+    """
+    try:
+        from multiprocessing import get_context
+    except ImportError: # Python < 3.4 forks on POSIX
+        if sys.platform == "win32":
+            return None
+        return Pool(processes)
+    try:
+        return get_context("fork").Pool(processes)
+    except ValueError:
+        return None
+
+
 if __name__ == "__main__":
     from RDFXMLReader import cimread
     from PrettyPrintXML import xmlpp
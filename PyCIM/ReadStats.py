@@ -0,0 +1,172 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Statistics of a read of a CIM RDF/XML file.
+"""
+
+import sys
+
+from time import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from PyCIM.RefList import RefList
+from PyCIM.Slots import get_state
+
+#: Phases of a read, in order.
+PHASES = ["namespaces", "parse", "instantiate", "bind", "total"]
+
+
+class ReadStats(object):
+    """Timings and counts of a read of a CIM RDF/XML file.
+
+    Pass an instance as the C{stats} argument of L{PyCIM.cimread} to have
+    it filled in.
+    """
+
+    def __init__(self):
+        #: Seconds spent in each phase: detecting the namespaces, parsing
+        #: the file, instantiating classes and binding attributes and
+        #: references. Parse time is not counted in the other phases.
+        self.timings = dict((phase, 0.0) for phase in PHASES)
+        #: Map of class name to the number of objects instantiated.
+        self.classes = {}
+        #: Map of class name to the bytes used by its objects (the
+        #: objects, their attribute dicts and reference lists).
+        self.class_bytes = {}
+        #: Number of references to objects that are not in the model.
+        self.unresolved_references = 0
+        #: Number of 'rdf:about' elements for objects not in the model.
+        self.missing_objects = 0
+        #: Map of 'Class.attribute' to the number of times it was read but
+        #: is not a property of the class.
+        self.unknown_attributes = {}
+        #: Map of class name to the number of elements of the class that
+        #: could not be instantiated.
+        self.unknown_classes = {}
+        #: Whether the model was loaded from the cache, in which case only
+        #: the total time, the objects and their bytes are filled in.
+        self.cached = False
+        #: Peak memory of the process in bytes, or None if not available.
+        #: If tracemalloc is tracing, the peak traced memory of the read.
+        self.peak_memory = None
+
+        self._t0 = None
+
+    def start(self):
+        self._t0 = time()
+        if tracemalloc is not None and tracemalloc.is_tracing() and \
+                hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    def stop(self, d):
+        """Records the total time, the memory used by the objects of the
+        given map of UUID to CIM object and the peak memory.
+        """
+        if self._t0 is not None:
+            self.timings["total"] = time() - self._t0
+
+        for obj in d.values():
+            name = obj.__class__.__name__
+            if name not in self.classes:
+                continue
+            size = sys.getsizeof(obj)
+            state = getattr(obj, "__dict__", None)
+            if state is not None:
+                size += sys.getsizeof(state)
+            else:
+                state = get_state(obj) # slotted
+            for val in state.values():
+                if isinstance(val, (list, RefList)):
+                    size += sys.getsizeof(val)
+            self.class_bytes[name] = self.class_bytes.get(name, 0) + size
+
+        if tracemalloc is not None and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+        elif resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Kilobytes on Linux, bytes on Mac OS X.
+            self.peak_memory = peak if sys.platform == "darwin" \
+                else peak * 1024
+
+    def count_model(self, d):
+        """Counts the objects of the given map of UUID to CIM object by
+        class, for a model that was not built by the read (e.g. loaded from
+        the cache).
+        """
+        for obj in d.values():
+            self.count(self.classes, obj.__class__.__name__)
+
+    @property
+    def objects(self):
+        """Total number of objects instantiated.
+        """
+        return sum(self.classes.values())
+
+    def count(self, counts, key, n=1):
+        counts[key] = counts.get(key, 0) + n
+
+    def as_dict(self):
+        """Returns the statistics as a dict of built-in types, e.g. for
+        monitoring.
+        """
+        return {
+            "timings": dict(self.timings),
+            "objects": self.objects,
+            "classes": dict(self.classes),
+            "class_bytes": dict(self.class_bytes),
+            "unresolved_references": self.unresolved_references,
+            "missing_objects": self.missing_objects,
+            "unknown_attributes": dict(self.unknown_attributes),
+            "unknown_classes": dict(self.unknown_classes),
+            "cached": self.cached,
+            "peak_memory": self.peak_memory,
+        }
+
+    def report(self, top=10):
+        """Returns a text summary with the C{top} classes by bytes.
+        """
+        if self.cached:
+            phases = "from the cache"
+        else:
+            phases = ", ".join("%s %.2fs" % (phase, self.timings[phase])
+                               for phase in PHASES[:-1])
+        lines = ["%d objects in %.2fs (%s)" % (self.objects,
+                 self.timings["total"], phases)]
+        by_bytes = sorted(self.class_bytes.items(), key=lambda x: -x[1])
+        for name, size in by_bytes[:top]:
+            lines.append("  %-32s %8d objects %10d bytes" %
+                         (name, self.classes[name], size))
+        lines.append("%d unresolved references, %d missing objects, "
+                     "%d unknown attributes, %d unknown classes" %
+                     (self.unresolved_references, self.missing_objects,
+                      sum(self.unknown_attributes.values()),
+                      sum(self.unknown_classes.values())))
+        if self.peak_memory is not None:
+            lines.append("peak memory %.1f MB" % (self.peak_memory / 1e6))
+        return "\n".join(lines)
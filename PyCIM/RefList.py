@@ -0,0 +1,150 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Collections of the many-valued ends of associations.
+
+The generated CIM classes keep the objects at the many-valued end of an
+association in a L{RefList}: an insertion-ordered collection that holds
+each object once and is read like a list (iteration, C{len}, indexing,
+slicing and comparison with lists), but in which appending, removing and
+testing membership take constant time. Unlinking a terminal from a node
+with thousands of terminals no longer scans and rebuilds the list of
+terminals of the node.
+
+The C{addX} and C{removeX} methods of a many-valued reference C{X} take
+the objects to add or remove as arguments or as an iterable (see
+L{members}), and update both ends of the association in one pass.
+C{setX} replaces the collection and C{removeAllX} empties it.
+
+Objects are members by identity, as the CIM classes do not define
+equality. As with a dict, a collection must not be changed while it is
+iterated, so iterate over a copy to unlink its members, e.g.::
+
+    for terminal in list(node.Terminals):
+        terminal.ConnectivityNode = None
+"""
+
+from itertools import islice
+
+
+class RefList(dict):
+    """ Insertion-ordered collection of the objects at the many-valued end
+    of an association.
+
+    The objects are the keys of a dict, in the order they were added (dicts
+    keep insertion order from Python 3.7, and in CPython 3.6), so
+    iteration, length and membership test are those of a dict. Use
+    C{RefList.fromkeys(objects)} to make a collection of the given
+    objects. Indexing is by position, as for a list, but the other methods
+    of a dict that take a key, such as C{get}, are those of the dict.
+    """
+
+    __slots__ = ()
+
+    #: Adds the given object at the end, unless it is a member.
+    append = dict.setdefault
+
+    def extend(self, objects):
+        """Appends the given objects.
+        """
+        setdefault = self.setdefault
+        for obj in objects:
+            setdefault(obj)
+
+    def remove(self, obj):
+        """Removes the given object.
+
+        @raise ValueError: If the object is not a member.
+        """
+        try:
+            del self[obj]
+        except KeyError:
+            raise ValueError("RefList.remove(x): x not in list")
+
+    def discard(self, obj):
+        """Removes the given object if it is a member.
+        """
+        self.pop(obj, None)
+
+    def index(self, obj):
+        if obj in self:
+            for i, other in enumerate(self):
+                if other is obj:
+                    return i
+        raise ValueError("RefList.index(x): x not in list")
+
+    def count(self, obj):
+        return 1 if obj in self else 0
+
+    def copy(self):
+        return RefList.fromkeys(self)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice) or i < 0:
+            return list(self)[i]
+        for obj in islice(self, i, None):
+            return obj
+        raise IndexError("RefList index out of range")
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, RefList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # Members are restored after the collection is memoized, as lists
+        # are, because they refer back to it.
+        return (self.__class__, (), None, iter(self))
+
+
+def members(args):
+    """Returns the objects given to the C{add} or C{remove} method of a
+    many-valued reference: its arguments, or the objects of its only
+    argument if it is iterable, e.g. C{node.addTerminals(t1, t2)} or
+    C{node.addTerminals(terminals)}. A L{RefList} is copied, as it may be
+    the collection the objects are moved from.
+
+    @type args: tuple
+    """
+    if len(args) == 1 and hasattr(args[0], "__iter__"):
+        if isinstance(args[0], RefList):
+            return list(args[0])
+        return args[0]
+    return args
@@ -0,0 +1,240 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Setter plans for reading CIM objects.
+
+A plan maps each property tag of a CIM class, both qualified (e.g.
+C{ACLineSegment.r}) and unqualified (e.g. C{r}), to a L{Setter} compiled
+from the C{_attrs}, C{_attr_types}, C{_enums}, C{_refs} and C{_many_refs}
+declarations of the class and its bases.
+
+A batch plan links references by writing the private C{_X} slot of the
+object instead of calling the property setter, which would also update
+the inverse end of the association. The inverse ends are then set for
+every object at once by L{link_inverses}, without a property or method
+call per reference.
+"""
+
+from collections import namedtuple
+from operator import attrgetter
+
+try:
+    from dis import get_instructions
+except ImportError: # Python < 3.4
+    get_instructions = None
+
+ATTRIBUTE = "attribute"
+ENUMERATION = "enumeration"
+REFERENCE = "reference"
+MANY_REFERENCE = "many"
+
+#: How to set a property: the attribute name, its kind, the function that
+#: converts text to the attribute type (attributes and enumerations) and
+#: the function C{link(obj, value)} that sets a reference.
+Setter = namedtuple("Setter", ["name", "kind", "convert", "link"])
+
+# Plans by class and batch flag.
+_plans = {}
+
+# Inverse ends by class and reference.
+_inverses = {}
+
+# Declared names by class and list name.
+_declarations = {}
+
+# Default of getattr for slots that do not exist.
+_MISSING = object()
+
+
+def parse_bool(text):
+    """Converts RDF/XML boolean text to a bool.
+    """
+    # NB: bool("false") is True, because "false" is a non-empty string.
+    return str.title(text) == 'True'
+
+
+def _reference_link(klass, ref):
+    prop = getattr(klass, ref)
+    if not isinstance(prop, property):
+        # Compound attribute (e.g. Location.mainAddress).
+        def link(obj, value):
+            if getattr(obj, ref) is None:
+                setattr(obj, ref, value)
+        return link
+
+    fget, fset = prop.fget, prop.fset
+
+    def link(obj, value):
+        # Rely on properties to set any bi-directional references. A
+        # reference that is already set is left alone.
+        if fget(obj) is None:
+            fset(obj, value)
+
+    return link
+
+
+def inverse(klass, ref):
+    """Returns the private slot of the inverse end of the given reference
+    and whether it is many-valued, or None if there is no inverse end or
+    it can not be found.
+
+    The inverse end is found from the code of the generated setter (or
+    C{add} method) of the reference: the private slot it uses other than
+    that of the reference is the inverse end, which is single-valued if
+    it is assigned and many-valued if it is appended to.
+    """
+    try:
+        return _inverses[(klass, ref)]
+    except KeyError:
+        pass
+
+    result = None
+    many = ref in _declared(klass, "_many_refs")
+    prop = getattr(klass, ref, None)
+    if get_instructions is not None and isinstance(prop, property) and \
+            prop.fset is not None:
+        func = getattr(klass, "add%s" % ref) if many else prop.fset
+        code = getattr(func, "__code__", None)
+        names = code.co_names if code is not None else ()
+        private = [name for name in names
+                   if name.startswith("_") and name != "_" + ref]
+        if len(private) == 1:
+            stored = [i.argval for i in get_instructions(code)
+                      if i.opname == "STORE_ATTR"]
+            result = (private[0], private[0] not in stored)
+
+    _inverses[(klass, ref)] = result
+    return result
+
+
+def _declared(klass, name):
+    """Returns the set of names declared in the given list (e.g.
+    C{_many_refs}) by the class and its bases.
+    """
+    try:
+        return _declarations[(klass, name)]
+    except KeyError:
+        names = set()
+        for k in klass.mro():
+            names.update(k.__dict__.get(name, ()))
+        _declarations[(klass, name)] = names
+        return names
+
+
+def _slot_link(slot):
+    get = attrgetter(slot)
+
+    def link(obj, value):
+        if get(obj) is None:
+            setattr(obj, slot, value)
+    return link
+
+
+def _append_link(slot):
+    get = attrgetter(slot)
+
+    def link(obj, value):
+        get(obj).append(value)
+    return link
+
+
+def link_inverses(links):
+    """Sets the inverse ends of the given references, linked with a batch
+    plan, in one pass.
+
+    @type links: iterable
+    @param links: (object, reference name, value) tuples in the order the
+    references were linked. Inverse collections are extended in this order
+    and hold each object once. A single-valued inverse end that is already
+    set is left alone, unless it is the inverse of a many-valued reference:
+    then, as the C{add} method of the reference does, the object is moved
+    from the collection of its former owner.
+    """
+    for obj, name, value in links:
+        klass = obj.__class__
+        end = inverse(klass, name)
+        if end is None:
+            continue # linked by the property setter
+        many = name in _declared(klass, "_many_refs")
+        if not many and getattr(obj, "_" + name) is not value:
+            continue # the reference was already set
+
+        inverse_slot, inverse_many = end
+        current = getattr(value, inverse_slot, _MISSING)
+        if current is _MISSING:
+            continue # not the class of the inverse end
+        if not inverse_many:
+            if current is None:
+                setattr(value, inverse_slot, obj)
+            elif many and current is not obj:
+                others = getattr(current, "_" + name, None)
+                if others is not None:
+                    others.discard(value)
+                setattr(value, inverse_slot, obj)
+            continue
+        current.append(obj) # a RefList, which holds each object once
+
+
+def compile_plan(klass, batch=False):
+    """Returns a new map of property tag to L{Setter} for the given class.
+    If C{batch} is True, references with an inverse end are linked by slot
+    and L{link_inverses} must be called once they are all set.
+    """
+    plan = {}
+    mro = klass.mro()
+    mro.reverse()
+    for k in mro:
+        if "_attrs" not in k.__dict__:
+            continue # 'object' or a class without CIM properties
+
+        for attr in k._attrs:
+            if attr in k._enums:
+                setter = Setter(attr, ENUMERATION, str, None)
+            else:
+                typ = k._attr_types.get(attr, str)
+                convert = parse_bool if typ is bool else typ
+                setter = Setter(attr, ATTRIBUTE, convert, None)
+            plan["%s.%s" % (k.__name__, attr)] = plan[attr] = setter
+
+        for ref in k._refs:
+            end = inverse(klass, ref) if batch else None
+            if ref in k._many_refs:
+                # Use 'add*' method to set reference.
+                link = getattr(klass, "add%s" % ref) if end is None \
+                    else _append_link("_" + ref)
+                setter = Setter(ref, MANY_REFERENCE, None, link)
+            else:
+                link = _reference_link(klass, ref) if end is None \
+                    else _slot_link("_" + ref)
+                setter = Setter(ref, REFERENCE, None, link)
+            plan["%s.%s" % (k.__name__, ref)] = plan[ref] = setter
+
+    return plan
+
+
+def get_plan(klass, batch=False):
+    """Returns the cached map of property tag to L{Setter} for the given
+    class.
+    """
+    try:
+        return _plans[(klass, batch)]
+    except KeyError:
+        plan = _plans[(klass, batch)] = compile_plan(klass, batch)
+        return plan
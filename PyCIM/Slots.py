@@ -0,0 +1,178 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Slotted variants of the CIM classes.
+
+The instances of the generated CIM classes keep their state in a
+per-instance C{__dict__}. The slotted variant of a class is built from it
+with the same name, methods and properties, and with C{__slots__} for the
+attributes in its C{_attrs}, the private C{_X} field of each reference
+property and each compound attribute in its C{_refs}. Its bases are the
+slotted variants of the bases of the class, so its instances have no
+C{__dict__} and take a fraction of the memory.
+
+The methods are copies of those of the class whose globals name the
+slotted variant instead of the class, so that C{super(Class, self)} in the
+generated constructors refers to the variant. The slotted variant of a
+class is C{isinstance} of the slotted variants of its bases, but not of
+the generated classes.
+
+Use L{get_state} and L{set_state} to access the instance state of an
+object of either kind.
+"""
+
+import types
+
+try:
+    from dis import get_instructions
+except ImportError: # Python < 3.4
+    get_instructions = None
+
+# Slotted variants by class.
+_slotted = {}
+
+# Names of the slots of a class and its bases, by class.
+_slot_names = {}
+
+
+def slotted(klass):
+    """Returns the slotted variant of the given CIM class.
+    """
+    try:
+        return _slotted[klass]
+    except KeyError:
+        pass
+    if is_slotted(klass):
+        return klass
+
+    bases = tuple(base if base is object else slotted(base)
+                  for base in klass.__bases__)
+
+    slots = list(klass.__dict__.get("_attrs", ()))
+    for ref in klass.__dict__.get("_refs", ()):
+        if isinstance(klass.__dict__.get(ref), property):
+            slots.append("_" + ref)
+        else:
+            slots.append(ref) # compound attribute
+    for name in _stored(klass.__dict__.get("__init__")):
+        # Attributes the constructor sets but the class does not declare.
+        if name not in slots and not hasattr(klass, name):
+            slots.append(name)
+
+    namespace = {}
+    for name, val in klass.__dict__.items():
+        if name in ("__dict__", "__weakref__") or name in slots:
+            continue
+        namespace[name] = val
+    namespace["__slots__"] = tuple(slots)
+    namespace["__slotted__"] = True
+
+    variant = type(klass)(klass.__name__, bases, namespace)
+
+    # Copy the methods with globals in which the class name is the variant.
+    module_globals = {}
+    for name, val in namespace.items():
+        if isinstance(val, types.FunctionType):
+            setattr(variant, name, _rebind(val, variant, module_globals))
+        elif isinstance(val, property):
+            setattr(variant, name, property(
+                    _rebind(val.fget, variant, module_globals),
+                    _rebind(val.fset, variant, module_globals),
+                    _rebind(val.fdel, variant, module_globals),
+                    val.__doc__))
+
+    _slotted[klass] = variant
+    return variant
+
+
+def _rebind(func, variant, module_globals):
+    """Returns a copy of the given function whose globals name the given
+    variant instead of its class. C{module_globals} maps the id of the
+    globals of a module to their copy.
+    """
+    if func is None:
+        return None
+    key = id(func.__globals__)
+    try:
+        namespace = module_globals[key]
+    except KeyError:
+        namespace = module_globals[key] = dict(func.__globals__)
+        namespace[variant.__name__] = variant
+    copy = types.FunctionType(func.__code__, namespace, func.__name__,
+                              func.__defaults__, func.__closure__)
+    copy.__doc__ = func.__doc__
+    copy.__dict__.update(func.__dict__)
+    return copy
+
+
+def _stored(func):
+    """Returns the names of the attributes stored by the given function.
+    """
+    if get_instructions is None or func is None:
+        return []
+    return [i.argval for i in get_instructions(func)
+            if i.opname == "STORE_ATTR"]
+
+
+def is_slotted(klass):
+    """Returns whether the given class is a slotted variant.
+    """
+    return klass.__dict__.get("__slotted__", False)
+
+
+def slot_names(klass):
+    """Returns the names of the slots of the given class and its bases.
+    """
+    try:
+        return _slot_names[klass]
+    except KeyError:
+        names = []
+        for k in reversed(klass.mro()):
+            names.extend(k.__dict__.get("__slots__", ()))
+        names = _slot_names[klass] = tuple(name for name in names
+                if name not in ("__dict__", "__weakref__"))
+        return names
+
+
+def get_state(obj):
+    """Returns the instance state of the given object as a map of name to
+    value. The C{__dict__} of an object that has one is returned as is.
+    """
+    try:
+        return obj.__dict__
+    except AttributeError:
+        state = {}
+        for name in slot_names(obj.__class__):
+            try:
+                state[name] = getattr(obj, name)
+            except AttributeError:
+                pass # unset
+        return state
+
+
+def set_state(obj, state):
+    """Updates the instance state of the given object from a map of name
+    to value.
+    """
+    try:
+        obj.__dict__.update(state)
+    except AttributeError:
+        for name, val in state.items():
+            setattr(obj, name, val)
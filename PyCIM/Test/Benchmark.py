@@ -0,0 +1,632 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Timings of the RDF/XML reader and writer on the test data.
+
+Run with C{python -m PyCIM.Test.Benchmark [name ...]}.
+"""
+
+import sys
+
+from os.path import dirname, join
+from time import time
+
+from PyCIM import cimread, cimread_many, iter_cimread
+from PyCIM.RDFXMLBackends import BACKENDS
+
+
+DATA_DIR = join(dirname(__file__), "Data")
+
+EDF_FILES = [join(DATA_DIR, "EDF_AIGUE_v9.xml"),
+             join(DATA_DIR, "EDF_AIGUE_v9_COMBINED.xml")]
+
+CDPSM_FILES = [join(DATA_DIR, "EDF_AIGUE_v9_%s.xml" % profile)
+               for profile in ("ASSET", "CONN", "EQUIP", "GEO")]
+
+
+def synthetic_file(path, copies):
+    """Writes a model of C{copies} copies of the combined EDF model, with
+    the UUIDs of each copy suffixed by its number, to the given path.
+    """
+    import re
+    f = open(EDF_FILES[1], "rb")
+    data = f.read()
+    f.close()
+
+    start = re.search(b"<cim:", data).start()
+    end = data.rindex(b"</rdf:RDF>")
+    uuids = re.compile(b'((?:rdf:ID|rdf:about|rdf:resource)="#?)([^"]+)"')
+
+    out = open(path, "wb")
+    try:
+        out.write(data[:start])
+        for i in range(copies):
+            suffix = ("_%d" % i).encode()
+            out.write(uuids.sub(lambda m: m.group(1) + m.group(2) + suffix +
+                                b'"', data[start:end]))
+        out.write(data[end:])
+    finally:
+        out.close()
+
+
+def fan_in_file(path, n):
+    """Writes a model of C{n} line segments at one base voltage, with one
+    terminal each at one connectivity node, to the given path.
+    """
+    out = open(path, "w")
+    try:
+        out.write('<?xml version="1.0" encoding="UTF-8" ?>\n'
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"'
+            ' xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#">\n'
+            ' <cim:BaseVoltage rdf:ID="BV"/>\n'
+            ' <cim:ConnectivityNode rdf:ID="CN"/>\n')
+        for i in range(n):
+            out.write(' <cim:ACLineSegment rdf:ID="L%d">\n'
+                '  <cim:ConductingEquipment.BaseVoltage rdf:resource="#BV"/>\n'
+                ' </cim:ACLineSegment>\n'
+                ' <cim:Terminal rdf:ID="T%d">\n'
+                '  <cim:Terminal.ConductingEquipment rdf:resource="#L%d"/>\n'
+                '  <cim:Terminal.ConnectivityNode rdf:resource="#CN"/>\n'
+                ' </cim:Terminal>\n' % (i, i, i))
+        out.write('</rdf:RDF>\n')
+    finally:
+        out.close()
+
+
+def best_of(func, repeat=3):
+    """Returns the shortest wall-clock time of C{repeat} calls to C{func}.
+    """
+    times = []
+    for _ in range(repeat):
+        t0 = time()
+        func()
+        times.append(time() - t0)
+    return min(times)
+
+
+def report(name, seconds, baseline=None):
+    if baseline:
+        print("  %-32s %8.3fs  %5.2fx" % (name, seconds, baseline / seconds))
+    else:
+        print("  %-32s %8.3fs" % (name, seconds))
+
+
+def bench_single_pass():
+    """Two-pass against single-pass reading.
+    """
+    for path in EDF_FILES:
+        print(path)
+        t2 = best_of(lambda: cimread(path))
+        report("two-pass", t2)
+        report("single-pass", best_of(lambda: cimread(path, single_pass=True)),
+               t2)
+
+
+def bench_many():
+    """Sequential against parallel reading of the CDPSM profile files.
+    """
+    from CIM15 import nsURI
+    from CIM15.CDPSM import Asset, Connectivity, Balanced, Geographical
+    maps = [Asset.packageMap, Connectivity.packageMap,
+            Balanced.packageMap, Geographical.packageMap]
+
+    def sequential():
+        d = {}
+        for path, packageMap in zip(CDPSM_FILES, maps):
+            d.update(cimread(path, packageMap, nsURI))
+
+    t = best_of(sequential)
+    report("cimread x4", t)
+    report("largest file (CONN)",
+           best_of(lambda: cimread(CDPSM_FILES[1], maps[1], nsURI)), t)
+    for processes in (1, 2, 4):
+        report("cimread_many processes=%d" % processes,
+               best_of(lambda: cimread_many(CDPSM_FILES,
+                                            processes=processes)), t)
+
+
+def bench_chunked():
+    """Serial against chunked parallel reading of one file.
+    """
+    path = EDF_FILES[1]
+    t = best_of(lambda: cimread(path))
+    report("two-pass", t)
+    for processes in (1, 2, 4, 8):
+        report("processes=%d" % processes,
+               best_of(lambda: cimread(path, processes=processes)), t)
+
+
+def bench_backends():
+    """Parser backends: records only and full model.
+    """
+    path = EDF_FILES[1]
+    t_records = t_model = None
+    for backend in sorted(BACKENDS, key=lambda b: b != "iterparse"):
+        t = best_of(lambda: list(iter_cimread(path, backend=backend)))
+        report("%s records" % backend, t, t_records)
+        t_records = t_records or t
+        t = best_of(lambda: cimread(path, backend=backend))
+        report("%s cimread" % backend, t, t_model)
+        t_model = t_model or t
+
+
+def bench_classes():
+    """Reading all classes against reading some classes.
+    """
+    path = EDF_FILES[1]
+    t = best_of(lambda: cimread(path))
+    report("all classes", t)
+    report("exclude PositionPoint",
+           best_of(lambda: cimread(path, exclude_classes=["PositionPoint"])),
+           t)
+    report("include ConductingEquipment+",
+           best_of(lambda: cimread(path,
+                                   include_classes=["ConductingEquipment"],
+                                   subclasses=True)), t)
+
+
+def bench_cache():
+    """Parsing against loading from the parse cache.
+    """
+    import shutil
+    import tempfile
+    from PyCIM.ParseCache import ParseCache
+
+    path = EDF_FILES[1]
+    directory = tempfile.mkdtemp()
+    try:
+        t = best_of(lambda: cimread(path))
+        report("parse", t)
+        cache = ParseCache(directory)
+        report("miss (parse and store)",
+               best_of(lambda: (cache.clear(), cimread(path, cache=cache))),
+               t)
+        report("hit (content hash)",
+               best_of(lambda: cimread(path, cache=cache)), t)
+        cache = ParseCache(directory, use_stat=True)
+        cimread(path, cache=cache)
+        report("hit (size and mtime)",
+               best_of(lambda: cimread(path, cache=cache)), t)
+    finally:
+        shutil.rmtree(directory)
+
+
+def bench_compressed():
+    """Reading and writing uncompressed against compressed files.
+    """
+    import os
+    import shutil
+    import tempfile
+    from PyCIM import cimwrite
+
+    d = cimread(EDF_FILES[1])
+    directory = tempfile.mkdtemp()
+    try:
+        t_read = t_write = None
+        for ext in (".xml", ".xml.gz", ".xml.bz2", ".xml.xz", ".zip"):
+            path = os.path.join(directory, "model" + ext)
+            try:
+                t = best_of(lambda: cimwrite(d, path))
+            except ValueError:
+                continue # no lzma module
+            report("cimwrite %s (%d kB)" % (ext, os.path.getsize(path) // 1024),
+                   t, t_write)
+            t_write = t_write or t
+            t = best_of(lambda: cimread(path))
+            report("cimread %s" % ext, t, t_read)
+            t_read = t_read or t
+    finally:
+        shutil.rmtree(directory)
+
+
+def bench_mmap():
+    """Reading against memory-mapping a large synthetic file.
+    """
+    import os
+    import tempfile
+    from PyCIM.MappedFile import MappedFile
+
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        synthetic_file(path, 20)
+        print("%s (%d MB)" % (path, os.path.getsize(path) >> 20))
+        for backend in sorted(BACKENDS, key=lambda b: b != "iterparse"):
+            t = best_of(lambda: list(iter_cimread(path, backend=backend)))
+            report("%s records" % backend, t)
+
+            def mapped():
+                f = MappedFile(path)
+                list(iter_cimread(f, backend=backend))
+                f.close()
+            report("%s records, mmap" % backend, best_of(mapped), t)
+
+        t = best_of(lambda: cimread(path, single_pass=True), 1)
+        report("cimread", t)
+        report("cimread, mmap",
+               best_of(lambda: cimread(path, single_pass=True,
+                                       memory_map=True), 1), t)
+    finally:
+        os.remove(path)
+
+
+def bench_batch_link():
+    """Property setters against batch linking of high fan-in models.
+    """
+    import os
+    import tempfile
+
+    print(EDF_FILES[1])
+    t = best_of(lambda: cimread(EDF_FILES[1]))
+    report("property setters", t)
+    report("batch link", best_of(lambda: cimread(EDF_FILES[1],
+                                                 batch_link=True)), t)
+
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        for n in (2000, 8000, 32000):
+            fan_in_file(path, n)
+            print("%d terminals at one node and base voltage" % n)
+            t = best_of(lambda: cimread(path), 1)
+            report("property setters", t)
+            report("batch link",
+                   best_of(lambda: cimread(path, batch_link=True), 1), t)
+    finally:
+        os.remove(path)
+
+
+def bench_update():
+    """Reloading a model against applying an update file to it.
+    """
+    import io
+    import os
+    import tempfile
+    from PyCIM import cimupdate
+
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        synthetic_file(path, 10)
+        d = cimread(path, single_pass=True)
+        terminals = [uuid for uuid, obj in d.items()
+                     if obj.__class__.__name__ == "Terminal"][:100]
+        update = ('<?xml version="1.0" encoding="UTF-8" ?>\n'
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"'
+            ' xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#">\n' +
+            "".join('<cim:Terminal rdf:about="#%s"><cim:Terminal.connected>'
+                    'true</cim:Terminal.connected></cim:Terminal>\n' % uuid
+                    for uuid in terminals) + '</rdf:RDF>\n').encode()
+
+        print("%d objects, %d updated" % (len(d), len(terminals)))
+        t = best_of(lambda: cimread(path, single_pass=True), 1)
+        report("reload", t)
+        report("cimupdate",
+               best_of(lambda: cimupdate(io.BytesIO(update), d)), t)
+    finally:
+        os.remove(path)
+
+
+def bench_checkpoint():
+    """Reading without checkpoints against checkpointed reading. A
+    checkpoint is saved at every element with an interval of 0s.
+    """
+    import os
+    import tempfile
+    from PyCIM.Checkpoint import Checkpoint
+
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    directory = tempfile.mkdtemp()
+    try:
+        synthetic_file(path, 10)
+        runs = [(CDPSM_FILES[0], (60.0, 0.0)), (path, (60.0, 5.0, 1.0))]
+        for source, intervals in runs:
+            print("%s (%d kB)" % (source, os.path.getsize(source) >> 10))
+            t = best_of(lambda: cimread(source, single_pass=True,
+                                        backend="expat"), 1)
+            report("no checkpoint", t)
+            for interval in intervals:
+                checkpoint = Checkpoint(os.path.join(directory,
+                                                     "checkpoint"), interval)
+                seconds = best_of(lambda: cimread(source,
+                                                  checkpoint=checkpoint), 1)
+                report("interval=%gs (%d saves, %.2fs)" % (interval,
+                       checkpoint.saves, checkpoint.seconds), seconds, t)
+    finally:
+        os.remove(path)
+        os.rmdir(directory)
+
+
+def bench_write():
+    """The original serializer against cimwrite.
+    """
+    import io
+    from PyCIM import cimwrite
+    from PyCIM.Test.RDFXMLWriterTest import reference_cimwrite
+
+    for path in EDF_FILES:
+        d = cimread(path)
+        out = io.StringIO()
+        cimwrite(d, out)
+        size = len(out.getvalue()) / float(1 << 20)
+        print("%s (%d objects, %.1f MB)" % (path, len(d), size))
+        t = best_of(lambda: reference_cimwrite(d, io.StringIO()))
+        report("reference (%.1f MB/s)" % (size / t), t)
+        t2 = best_of(lambda: cimwrite(d, io.StringIO()))
+        report("cimwrite (%.1f MB/s)" % (size / t2), t2, t)
+
+
+def bench_write_workers():
+    """Writing a large synthetic model with pools of workers.
+    """
+    import io
+    import os
+    import tempfile
+    from multiprocessing import cpu_count
+    from PyCIM import cimwrite
+
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        synthetic_file(path, 10)
+        d = cimread(path)
+    finally:
+        os.remove(path)
+    print("%d objects, %d CPUs" % (len(d), cpu_count()))
+    t = best_of(lambda: cimwrite(d, io.BytesIO()))
+    report("one process", t)
+    for workers in (2, 4, 8):
+        report("workers=%d" % workers, best_of(lambda: cimwrite(d,
+               io.BytesIO(), workers=workers)), t)
+
+
+def bench_round_trip():
+    """Reading, writing and reading again, writing single-valued references
+    against writing each association once from its owning end.
+    """
+    import io
+    from PyCIM import cimwrite
+    from PyCIM.RefList import RefList
+    from PyCIM.SetterPlan import _declared
+    from CIM15.IEC61970.Meas import Analog, AnalogLimitSet
+
+    def links(d):
+        result = set()
+        for obj in d.values():
+            for ref in _declared(obj.__class__, "_refs"):
+                val = getattr(obj, ref)
+                if not isinstance(val, (list, RefList)):
+                    val = [val]
+                for other in val:
+                    if other is not None:
+                        result.add((obj.UUID, ref, other.UUID))
+        return result
+
+    # Many-to-many: each of 20 limit sets applies to 1000 measurements.
+    limit_sets = [AnalogLimitSet(UUID="_L%d" % i) for i in range(20)]
+    analogs = [Analog(UUID="_A%d" % i, LimitSets=limit_sets)
+               for i in range(1000)]
+    synthetic = dict((obj.UUID, obj) for obj in limit_sets + analogs)
+
+    for name, d in ((EDF_FILES[1], cimread(EDF_FILES[1])),
+                    ("many-to-many", synthetic)):
+        print(name)
+        expected = links(d)
+        for owner in (False, True):
+            out = io.StringIO()
+            t = best_of(lambda: cimwrite(d, io.StringIO(), owner_links=owner))
+            cimwrite(d, out, owner_links=owner)
+            data = out.getvalue()
+            report("write owner_links=%s" % owner, t)
+            print("    %d kB, %d references" % (len(data.encode()) // 1024,
+                                                data.count('resource="#')))
+            out.seek(0)
+            t0 = time()
+            dd = cimread(out)
+            report("read (%d of %d links)" % (len(links(dd) & expected),
+                   len(expected)), time() - t0)
+
+
+def bench_pretty_print():
+    """Indenting a parsed tree against streaming re-indentation, in time
+    and peak memory allocated.
+    """
+    import os
+    import tempfile
+    import tracemalloc
+    from xml.etree.cElementTree import parse, tostring
+    from PyCIM.PrettyPrintXML import xmlpp, indent
+
+    def tree(path, out):
+        root = parse(path).getroot()
+        indent(root)
+        f = open(out, "wb")
+        f.write(tostring(root))
+        f.close()
+
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    out = path + ".out"
+    try:
+        synthetic_file(path, 5)
+        print("%s (%d MB)" % (path, os.path.getsize(path) >> 20))
+        for name, func in (("tree", tree), ("xmlpp", xmlpp)):
+            t = best_of(lambda: func(path, out), 1)
+            tracemalloc.start()
+            func(path, out)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            report("%s (peak %.1f MB)" % (name, peak / float(1 << 20)), t)
+    finally:
+        os.remove(path)
+        if os.path.exists(out):
+            os.remove(out)
+
+
+def bench_slots():
+    """Bytes per object of the CIM classes against their slotted variants,
+    and reading the combined EDF model with each.
+    """
+    import gc
+    import tracemalloc
+    from PyCIM.Slots import slotted
+    from CIM15.IEC61970.Core import Terminal
+    from CIM15.IEC61970.Wires import ACLineSegment
+    from CIM15.IEC61968.Common import PositionPoint
+
+    n = 10000
+    for klass in (Terminal, ACLineSegment, PositionPoint):
+        sizes = []
+        for k in (klass, slotted(klass)):
+            gc.collect()
+            tracemalloc.start()
+            objs = [k(UUID="_%d" % i) for i in range(n)]
+            sizes.append(tracemalloc.get_traced_memory()[0] / float(n))
+            tracemalloc.stop()
+            del objs
+        print("  %-32s %5d -> %5d bytes  %5.2fx" % (klass.__name__,
+              sizes[0], sizes[1], sizes[0] / sizes[1]))
+
+    for slots in (False, True):
+        gc.collect()
+        tracemalloc.start()
+        d = cimread(EDF_FILES[1], slots=slots)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print("  %-32s %5.1f MB" % ("model, slots=%s" % slots,
+                                     size / float(1 << 20)))
+        del d
+
+
+def bench_reassign():
+    """Moving terminals between two nodes with many terminals, against the
+    list scans and rebuilds of the former generated setters.
+    """
+    from CIM15.IEC61970.Core import Terminal, ConnectivityNode
+
+    def list_reassign(terminal, node):
+        # The former 'Terminal.setConnectivityNode', with lists.
+        old = terminal.__dict__["_ConnectivityNode"]
+        if old is not None:
+            state = old.__dict__
+            state["_Terminals"] = [x for x in state["_Terminals"]
+                                   if x != terminal]
+        terminal.__dict__["_ConnectivityNode"] = node
+        if terminal not in node.__dict__["_Terminals"]:
+            node.__dict__["_Terminals"].append(terminal)
+
+    moves = 1000
+    for n in (1000, 10000, 100000):
+        times = []
+        for reassign in (list_reassign, None):
+            node1 = ConnectivityNode(UUID="_CN1")
+            node2 = ConnectivityNode(UUID="_CN2")
+            terminals = [Terminal(UUID="_T%d" % i, ConnectivityNode=node1)
+                         for i in range(n)]
+            if reassign is list_reassign:
+                node1.__dict__["_Terminals"] = list(node1.Terminals)
+                node2.__dict__["_Terminals"] = []
+            moved = terminals[::n // moves]
+            t0 = time()
+            for node in (node2, node1):
+                for terminal in moved:
+                    if reassign is None:
+                        terminal.ConnectivityNode = node
+                    else:
+                        reassign(terminal, node)
+            times.append((time() - t0) / (2 * len(moved)))
+        print("  %6d terminals  %9.2fus -> %6.2fus per move  %7.1fx" % (n,
+              times[0] * 1e6, times[1] * 1e6, times[0] / times[1]))
+
+
+def bench_bulk():
+    """Attaching and detaching the terminals of a node one at a time, with
+    the property setter, against the bulk methods of the node.
+    """
+    from CIM15.IEC61970.Core import Terminal, ConnectivityNode
+
+    n = 200000
+    terminals = [Terminal(UUID="_T%d" % i) for i in range(n)]
+
+    def scalar_add(node):
+        for terminal in terminals:
+            terminal.ConnectivityNode = node
+
+    def scalar_remove(node):
+        for terminal in terminals:
+            terminal.ConnectivityNode = None
+
+    def bulk_add(node):
+        node.addTerminals(terminals)
+
+    def bulk_set(node):
+        node.Terminals = terminals
+
+    def bulk_remove(node):
+        node.removeAllTerminals()
+
+    for name, attach, detach in (("property setter", scalar_add,
+                                  scalar_remove),
+                                 ("addTerminals/removeAllTerminals",
+                                  bulk_add, bulk_remove),
+                                 ("setTerminals/removeAllTerminals",
+                                  bulk_set, bulk_remove)):
+        node = ConnectivityNode(UUID="_CN1")
+        t0 = time()
+        attach(node)
+        t1 = time()
+        detach(node)
+        t2 = time()
+        print("  %-32s attach %.3fs  detach %.3fs  (%d terminals)" % (name,
+              t1 - t0, t2 - t1, n))
+
+
+BENCHMARKS = [
+    ("single_pass", bench_single_pass),
+    ("many", bench_many),
+    ("chunked", bench_chunked),
+    ("backends", bench_backends),
+    ("classes", bench_classes),
+    ("cache", bench_cache),
+    ("compressed", bench_compressed),
+    ("mmap", bench_mmap),
+    ("batch_link", bench_batch_link),
+    ("update", bench_update),
+    ("checkpoint", bench_checkpoint),
+    ("write", bench_write),
+    ("write_workers", bench_write_workers),
+    ("round_trip", bench_round_trip),
+    ("pretty_print", bench_pretty_print),
+    ("slots", bench_slots),
+    ("reassign", bench_reassign),
+    ("bulk", bench_bulk),
+]
+
+
+if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.CRITICAL)
+
+    names = sys.argv[1:]
+    for name, func in BENCHMARKS:
+        if not names or name in names:
+            print("== %s: %s" % (name, func.__doc__.strip()))
+            func()
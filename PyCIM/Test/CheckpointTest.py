@@ -0,0 +1,90 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from os.path import dirname, join
+
+from PyCIM import cimread
+from PyCIM.Checkpoint import Checkpoint
+from PyCIM.RDFXMLReader import _Namespaces, _ModelBuilder, xmlns
+
+from PyCIM.Test.RDFXMLReaderTest import model_state
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class CheckpointTestCase(unittest.TestCase):
+    """Test checkpointed reading of CIM RDF/XML files.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = join(self.directory, "read.checkpoint")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def interrupt(self, n, batch_link=False):
+        """Reads the first C{n} records with a checkpoint at every object.
+        """
+        ns = _Namespaces()
+        ns(xmlns(RDFXML_FILE))
+        checkpoint = Checkpoint(self.path, 0.0)
+        builder = checkpoint.builder = _ModelBuilder({}, ns.packageMap, {},
+                                                     batch=batch_link)
+        records = checkpoint.records(RDFXML_FILE, ns, None,
+                                     (None, None, False, batch_link, False))
+        for _, record in zip(range(n), records):
+            builder.add(record)
+        records.close()
+        return checkpoint
+
+    def testResume(self):
+        expected = model_state(cimread(RDFXML_FILE))
+
+        for batch_link in (False, True):
+            self.assertTrue(self.interrupt(500, batch_link).saves > 0)
+            self.assertTrue(os.path.exists(self.path))
+
+            checkpoint = Checkpoint(self.path)
+            d = cimread(RDFXML_FILE, checkpoint=checkpoint,
+                        batch_link=batch_link)
+            self.assertTrue(checkpoint.resumed > 0)
+            self.assertEqual(model_state(d), expected)
+            self.assertFalse(os.path.exists(self.path))
+
+    def testOtherRead(self):
+        self.interrupt(500)
+
+        checkpoint = Checkpoint(self.path)
+        d = cimread(RDFXML_FILE, checkpoint=checkpoint,
+                    exclude_classes=["PositionPoint"])
+        self.assertTrue(checkpoint.resumed is None)
+        self.assertEqual(model_state(d), model_state(
+                cimread(RDFXML_FILE, exclude_classes=["PositionPoint"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
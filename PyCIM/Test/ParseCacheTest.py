@@ -0,0 +1,122 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import unittest
+
+from os.path import dirname, join
+
+from PyCIM import cimread
+from PyCIM.ParseCache import ParseCache
+
+from CIM15 import nsURI as nsURICIM15
+from CIM15.CDPSM.Asset import packageMap as assetMap
+
+from PyCIM.Test.RDFXMLReaderTest import model_state
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+ASSET_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_ASSET.xml")
+GEO_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_GEO.xml")
+
+
+class ParseCacheTestCase(unittest.TestCase):
+    """Test the cache of models read from CIM RDF/XML files.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def entries(self):
+        return [name for name in os.listdir(self.directory)
+                if name.endswith(".pickle")]
+
+    def testHit(self):
+        expected = cimread(RDFXML_FILE)
+
+        d = cimread(RDFXML_FILE, cache=self.directory)
+        self.assertEqual(len(self.entries()), 1)
+        self.assertEqual(model_state(d), model_state(expected))
+
+        d = cimread(RDFXML_FILE, cache=self.directory)
+        self.assertEqual(list(d), list(expected))
+        self.assertEqual(model_state(d), model_state(expected))
+        cn = [obj for obj in d.values()
+              if obj.__class__.__name__ == "ConnectivityNode"][0]
+        for t in cn.Terminals:
+            self.assertTrue(t.ConnectivityNode is cn)
+
+    def testArguments(self):
+        cache = ParseCache(self.directory, use_stat=True)
+        cimread(ASSET_FILE, cache=cache)
+        cimread(ASSET_FILE, assetMap, nsURICIM15, cache=cache)
+        cimread(ASSET_FILE, exclude_classes=["Location"], cache=cache)
+        self.assertEqual(len(self.entries()), 3)
+
+        d = cimread(ASSET_FILE, assetMap, nsURICIM15, cache=cache)
+        self.assertEqual(model_state(d),
+                model_state(cimread(ASSET_FILE, assetMap, nsURICIM15)))
+
+    def testMismatch(self):
+        cache = ParseCache(self.directory)
+        cimread(ASSET_FILE, cache=cache)
+        path = join(self.directory, self.entries()[0])
+        f = open(path, "rb")
+        header, snap = pickle.load(f)
+        f.close()
+        f = open(path, "wb")
+        pickle.dump(((header[0], "other classes"), snap), f)
+        f.close()
+
+        d = cimread(ASSET_FILE, cache=cache)
+        self.assertEqual(model_state(d), model_state(cimread(ASSET_FILE)))
+
+        f = open(path, "rb")
+        header, _ = pickle.load(f)
+        f.close()
+        self.assertNotEqual(header[1], "other classes")
+
+    def testEviction(self):
+        cache = ParseCache(self.directory)
+        cimread(ASSET_FILE, cache=cache)
+        old = join(self.directory, self.entries()[0])
+        os.utime(old, (time.time() - 60, time.time() - 60))
+
+        cimread(GEO_FILE, cache=cache)
+        self.assertEqual(len(self.entries()), 2)
+        new = [join(self.directory, name) for name in self.entries()
+               if join(self.directory, name) != old][0]
+
+        cache.max_size = os.path.getsize(new)
+        cache.evict()
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+
+
+if __name__ == "__main__":
+    unittest.main()
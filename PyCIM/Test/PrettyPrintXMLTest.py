@@ -0,0 +1,79 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import unittest
+
+from io import BytesIO, StringIO
+
+from PyCIM import cimread, cimwrite
+from PyCIM.PrettyPrintXML import xmlpp
+from PyCIM.Test.RDFXMLReaderTest import model_state
+
+from os.path import dirname, join
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class PrettyPrintXMLTestCase(unittest.TestCase):
+    """Test re-indenting XML.
+    """
+
+    def testIndent(self):
+        """Test indentation of elements, text and attributes.
+        """
+        source = BytesIO(b'<?xml version="1.0"?>\n<r:a xmlns:r="urn:r" '
+                         b'z="1" b="&amp;"><b>x &lt; y</b><c/>\n <d>x<e/> y '
+                         b'</d><f> </f></r:a>')
+        self.assertEqual(xmlpp(source), u"<?xml version='1.0' "
+            u"encoding='utf-8'?>\n"
+            u'<r:a xmlns:r="urn:r" z="1" b="&amp;">\n'
+            u"  <b>x &lt; y</b>\n"
+            u"  <c />\n"
+            u"  <d>x<e /> y </d>\n"
+            u"  <f> </f>\n"
+            u"</r:a>")
+
+    def testDepth(self):
+        """Test that deep documents do not reach the recursion limit.
+        """
+        n = 5000
+        source = BytesIO(b"<a>" * n + b"</a>" * n)
+        output = BytesIO()
+        xmlpp(source, output, indent=" ")
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2 * n)
+        self.assertEqual(lines[n], b" " * (n - 1) + b"<a />")
+
+    def testModel(self):
+        """Test that an indented model reads the same.
+        """
+        d = cimread(RDFXML_FILE)
+        written = StringIO()
+        cimwrite(d, written)
+        written.seek(0)
+        output = BytesIO()
+        xmlpp(written, output)
+        output.seek(0)
+        self.assertEqual(model_state(cimread(output)), model_state(d))
+
+
+if __name__ == "__main__":
+    unittest.main()
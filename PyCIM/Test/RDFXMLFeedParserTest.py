@@ -0,0 +1,122 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import sys
+import unittest
+
+from os.path import dirname, join
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+from PyCIM import cimread
+from PyCIM.RDFXMLFeedParser import CIMFeedParser
+
+from PyCIM.Test.RDFXMLReaderTest import model_state, FORWARD_CIM
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+def read_data(path):
+    f = open(path, "rb")
+    try:
+        return f.read()
+    finally:
+        f.close()
+
+
+class Chunks(object):
+    """Async iterator over the blocks of some data.
+    """
+
+    def __init__(self, data, size):
+        self.blocks = [data[i:i + size] for i in range(0, len(data), size)]
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        future = asyncio.Future()
+        if self.blocks:
+            future.set_result(self.blocks.pop(0))
+        else:
+            future.set_exception(StopAsyncIteration())
+        return future
+
+
+class CIMFeedParserTestCase(unittest.TestCase):
+    """Test incremental parsing of CIM RDF/XML.
+    """
+
+    def testFeed(self):
+        expected = model_state(cimread(RDFXML_FILE))
+        data = read_data(RDFXML_FILE)
+        for size in (997, 1 << 20):
+            parser = CIMFeedParser()
+            n = 0
+            for i in range(0, len(data), size):
+                parser.feed(data[i:i + size])
+                n += len(list(parser.read_objects()))
+            d = parser.close()
+            n += len(list(parser.read_objects()))
+            self.assertEqual(n, len(d))
+            self.assertEqual(model_state(d), expected)
+
+    def testForwardReferences(self):
+        parser = CIMFeedParser(batch_link=True)
+        data = FORWARD_CIM.encode("utf-8")
+        for i in range(len(data)):
+            parser.feed(data[i:i + 1])
+        d = parser.close()
+        self.assertEqual(d["_T1"].name, "T1")
+        self.assertEqual(d["_CN1"].Terminals, [d["_T1"]])
+        self.assertRaises(ValueError, parser.feed, b"")
+
+    # RDFXMLAsync uses asynchronous generators.
+    @unittest.skipIf(sys.version_info < (3, 6), "requires Python 3.6")
+    def testAsync(self):
+        from PyCIM.RDFXMLAsync import async_cimread, aiter_cimread
+
+        data = read_data(RDFXML_FILE)
+        expected = model_state(cimread(RDFXML_FILE))
+
+        loop = asyncio.new_event_loop()
+        try:
+            d = loop.run_until_complete(async_cimread(Chunks(data, 4096)))
+            self.assertEqual(model_state(d), expected)
+
+            objects = aiter_cimread(Chunks(data, 4096))
+            n = 0
+            while True:
+                try:
+                    loop.run_until_complete(objects.__anext__())
+                except StopAsyncIteration:
+                    break
+                n += 1
+            self.assertEqual(n, len(expected))
+        finally:
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,11 +20,23 @@
 # IN THE SOFTWARE.
 
 import io
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from os.path import dirname, join
+from xml.etree.ElementTree import ParseError
 
-from PyCIM import cimread, RDFXMLReader
+from PyCIM import cimread, cimread_many, iter_cimread, resolve_class, \
+    RDFXMLReader
+from PyCIM.ClassResolver import get_resolver
+from PyCIM import SetterPlan
+from PyCIM.RDFXMLBackends import BACKENDS
+from PyCIM.MappedFile import MappedFile
+from PyCIM.ReadStats import ReadStats
+from PyCIM.RefList import RefList
 
 from CIM15 import nsURI as nsURICIM15, packageMap as packageMapCIM15
 from CIM15.CDPSM.Asset import packageMap as assetMap
@@ -44,6 +56,88 @@ EMPTY_CIM = u'''<?xml version=\'1.0\'?>
 <rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
 xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" />'''
 
+FORWARD_CIM = u'''<?xml version=\'1.0\'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+ <cim:Terminal rdf:about="#_T1">
+  <cim:IdentifiedObject.name>T1</cim:IdentifiedObject.name>
+ </cim:Terminal>
+ <cim:Terminal rdf:ID="_T1">
+  <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+  <cim:Terminal.connected>false</cim:Terminal.connected>
+  <cim:Terminal.sequenceNumber>2</cim:Terminal.sequenceNumber>
+ </cim:Terminal>
+ <cim:ConnectivityNode rdf:ID="_CN1"/>
+</rdf:RDF>'''
+
+CONFLICT_CIM = u'''<?xml version=\'1.0\'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+ <cim:Terminal rdf:ID="_T1">
+  <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+ </cim:Terminal>
+ <cim:ConnectivityNode rdf:ID="_CN1"/>
+ <cim:ConnectivityNode rdf:ID="_CN2">
+  <cim:ConnectivityNode.Terminals rdf:resource="#_T1"/>
+ </cim:ConnectivityNode>
+</rdf:RDF>'''
+
+NESTED_CIM = u'''<?xml version=\'1.0\'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+xmlns:dm="http://iec.ch/2002/schema/CIM_difference_model#">
+ <dm:DifferenceModel rdf:about="#_DM1">
+  <dm:forwardDifferences rdf:parseType="Statements">
+   <cim:ConnectivityNode rdf:ID="_CN1"/>
+   <cim:Terminal rdf:ID="_T1">
+    <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+   </cim:Terminal>
+  </dm:forwardDifferences>
+ </dm:DifferenceModel>
+</rdf:RDF>'''
+
+
+def write_temp(text):
+    """Writes the given text to a temporary file and returns its path.
+    """
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.write(fd, text.encode("utf-8"))
+    os.close(fd)
+    return path
+
+
+class Stream(io.RawIOBase):
+    """A readable stream that can not seek, like a pipe.
+    """
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.data.readinto(b)
+
+
+def model_state(d):
+    """Returns the attribute values and reference UUIDs of each object.
+    """
+    state = {}
+    for uuid, obj in d.items():
+        values = {}
+        for klass in obj.__class__.mro()[:-2]: # skip 'Element' and 'object'
+            for attr in klass._attrs:
+                values[attr] = getattr(obj, attr)
+            for ref in klass._refs:
+                val = getattr(obj, ref)
+                if isinstance(val, (list, RefList)):
+                    values[ref] = sorted(x.UUID for x in val)
+                elif val is not None:
+                    values[ref] = val.UUID
+        state[uuid] = (obj.__class__.__name__, values)
+    return state
+
 
 class RDFXMLReaderTestCase(unittest.TestCase):
     """Test CIM RDF/XML parsing.
@@ -56,6 +150,175 @@ class RDFXMLReaderTestCase(unittest.TestCase):
 
         self.assertEqual(len(d), 5894)
 
+    def testSinglePass(self):
+        """Test single-pass parsing gives the same model as two passes.
+        """
+        d = cimread(RDFXML_FILE, single_pass=True)
+
+        self.assertEqual(model_state(d), model_state(cimread(RDFXML_FILE)))
+
+    def testSinglePassForwardReferences(self):
+        d = cimread(io.StringIO(FORWARD_CIM), single_pass=True)
+
+        self.assertEqual(len(d), 2)
+        t, cn = d["_T1"], d["_CN1"]
+        self.assertEqual(t.name, "T1")
+        self.assertEqual(t.connected, False)
+        self.assertEqual(t.sequenceNumber, 2)
+        self.assertEqual(t.ConnectivityNode, cn)
+        self.assertEqual(cn.Terminals, [t])
+
+    def testChunked(self):
+        """Test parallel parsing of a file in chunks.
+        """
+        d = cimread(RDFXML_FILE, processes=3)
+
+        self.assertEqual(model_state(d), model_state(cimread(RDFXML_FILE)))
+
+    def testChunkedFallback(self):
+        path = write_temp(NESTED_CIM)
+        try:
+            for backend in BACKENDS:
+                d = cimread(path, processes=2, backend=backend)
+                self.assertEqual(len(d), 2, backend)
+                self.assertEqual(d["_T1"].ConnectivityNode, d["_CN1"],
+                                 backend)
+        finally:
+            os.remove(path)
+
+    def testIterRecords(self):
+        records = list(iter_cimread(io.StringIO(FORWARD_CIM)))
+
+        self.assertEqual([(r.uuid, r.class_name, r.about) for r in records],
+                [("_T1", "Terminal", True), ("_T1", "Terminal", False),
+                 ("_CN1", "ConnectivityNode", False)])
+        self.assertEqual(records[0].attributes,
+                         {"IdentifiedObject.name": "T1"})
+        self.assertEqual(records[1].attributes,
+                         {"Terminal.connected": "false",
+                          "Terminal.sequenceNumber": "2"})
+        self.assertEqual(records[1].references,
+                         [("Terminal.ConnectivityNode", "_CN1")])
+
+    def testBackends(self):
+        """Test every parser backend yields the same records.
+        """
+        expected = list(iter_cimread(RDFXML_FILE))
+        for backend in BACKENDS:
+            self.assertEqual(list(iter_cimread(RDFXML_FILE, backend=backend)),
+                             expected, backend)
+            records = list(iter_cimread(io.StringIO(FORWARD_CIM),
+                                        backend=backend))
+            self.assertEqual(len(records), 3, backend)
+            self.assertRaises(ParseError, list, iter_cimread(
+                    io.StringIO(FORWARD_CIM[:-20]), backend=backend))
+
+        d = cimread(RDFXML_FILE, backend="expat")
+        self.assertEqual(model_state(d), model_state(cimread(RDFXML_FILE)))
+
+        self.assertRaises(ValueError, cimread, RDFXML_FILE, backend="sax")
+
+    def testIterResolved(self):
+        objs = list(iter_cimread(RDFXML_FILE, resolve=True))
+        d = dict((obj.UUID, obj) for obj in objs)
+
+        self.assertEqual(len(objs), 5894)
+        self.assertEqual(model_state(d), model_state(cimread(RDFXML_FILE)))
+
+    def testStream(self):
+        """Test reading from a stream that can not seek.
+        """
+        f = open(RDFXML_FILE, "rb")
+        data = f.read()
+        f.close()
+        expected = model_state(cimread(RDFXML_FILE))
+
+        for backend in BACKENDS:
+            d = cimread(Stream(data), backend=backend)
+            self.assertEqual(model_state(d), expected, backend)
+            d = cimread(Stream(data), single_pass=True, backend=backend)
+            self.assertEqual(model_state(d), expected, backend)
+            self.assertEqual(len(list(iter_cimread(Stream(data)))), 5894)
+
+        d = cimread(Stream(data), packageMapCIM15, nsURICIM15)
+        self.assertEqual(model_state(d), expected)
+
+    def testMemoryMap(self):
+        """Test parsing a memory-mapped file.
+        """
+        expected = model_state(cimread(RDFXML_FILE))
+        d = cimread(RDFXML_FILE, memory_map=True)
+        self.assertEqual(model_state(d), expected)
+        d = cimread(RDFXML_FILE, memory_map=True, processes=2)
+        self.assertEqual(model_state(d), expected)
+
+        f = open(RDFXML_FILE, "rb")
+        data = f.read()
+        f.close()
+        m = MappedFile(RDFXML_FILE, 100, 200, b"<", b">")
+        self.assertEqual(bytes(m.read(1)), b"<")
+        self.assertEqual(bytes(m.read(1000)), data[100:200])
+        self.assertEqual(bytes(m.read()), b">")
+        self.assertEqual(m.read(), b"")
+        m.seek(0)
+        self.assertEqual(m.tell(), 0)
+        m.close()
+
+    def testStats(self):
+        """Test the statistics of a read.
+        """
+        for single_pass in (False, True):
+            stats = ReadStats()
+            cimread(RDFXML_FILE, single_pass=single_pass, stats=stats)
+            self.assertEqual(stats.objects, 5894)
+            self.assertEqual(stats.classes["PositionPoint"], 1302)
+            self.assertTrue(stats.class_bytes["PositionPoint"] > 0)
+            self.assertEqual(stats.unresolved_references, 0)
+            self.assertTrue(stats.timings["total"] >= stats.timings["parse"])
+
+        result = []
+        cimread(ASSET_FILE, stats=result.append)
+        stats = result[0]
+        self.assertTrue(stats.missing_objects > 0)
+        self.assertEqual(stats.as_dict()["objects"], stats.objects)
+        self.assertTrue(stats.report())
+
+        stats = ReadStats()
+        cimread(io.StringIO(FORWARD_CIM.replace("_CN1\"/>\n</", "_CN2\"/>"
+                                                "\n</")), stats=stats)
+        self.assertEqual(stats.unresolved_references, 1)
+
+    def testClassFilter(self):
+        """Test reading only some classes.
+        """
+        full = cimread(RDFXML_FILE)
+        for backend in BACKENDS:
+            d = cimread(RDFXML_FILE, exclude_classes=["PositionPoint"],
+                        backend=backend)
+            self.assertEqual(len(d), 5894 - 1302, backend)
+            for obj in d.values():
+                self.assertNotEqual(obj.__class__.__name__, "PositionPoint")
+                if obj.__class__.__name__ == "Location":
+                    self.assertEqual(obj.PositionPoints, [])
+
+            d = cimread(RDFXML_FILE, include_classes=["Terminal"],
+                        single_pass=True, backend=backend)
+            self.assertEqual(len(d), 975, backend)
+            for t in d.values():
+                self.assertEqual(t.ConductingEquipment, None)
+                self.assertEqual(t.name, full[t.UUID].name)
+
+        d = cimread(RDFXML_FILE, include_classes=["ConductingEquipment"],
+                    subclasses=True)
+        klass = resolve_class("ConductingEquipment")
+        expected = [uuid for uuid, obj in full.items()
+                    if isinstance(obj, klass)]
+        self.assertEqual(sorted(d), sorted(expected))
+
+        d = cimread(RDFXML_FILE, exclude_classes=["PositionPoint"],
+                    processes=2)
+        self.assertEqual(len(d), 5894 - 1302)
+
     def test_cim_reads_are_independent(self):
         cimread(ASSET_FILE, assetMap, nsURICIM15)
         sio = io.StringIO(EMPTY_CIM)
@@ -72,6 +335,172 @@ class RDFXMLReaderTestCase(unittest.TestCase):
 
         self.assertEqual(len(d), 5893)
 
+    def testResolveClass(self):
+        from CIM15.IEC61970.Core import Terminal
+        from CIM15.CDPSM.Asset.IEC61970.Wires import ACLineSegment
+
+        self.assertTrue(resolve_class("Terminal") is Terminal)
+        self.assertTrue(resolve_class("ACLineSegment", assetMap)
+                        is ACLineSegment)
+        self.assertTrue(get_resolver(assetMap) is get_resolver(assetMap))
+        self.assertTrue("ACLineSegment" in get_resolver(assetMap))
+        self.assertFalse("Terminal" in get_resolver(assetMap))
+        self.assertRaises(KeyError, resolve_class, "Terminal", assetMap)
+
+    def testSetterPlan(self):
+        from CIM15.IEC61970.Core import Terminal
+        from CIM15.IEC61970.Wires import ACLineSegment
+
+        plan = SetterPlan.get_plan(ACLineSegment)
+        self.assertTrue(SetterPlan.get_plan(ACLineSegment) is plan)
+        self.assertEqual(plan["ACLineSegment.r"].kind, SetterPlan.ATTRIBUTE)
+        self.assertEqual(plan["ACLineSegment.r"].convert, float)
+        self.assertEqual(plan["IdentifiedObject.name"], plan["name"])
+
+        plan = SetterPlan.get_plan(Terminal)
+        self.assertEqual(plan["Terminal.phases"].kind,
+                         SetterPlan.ENUMERATION)
+        self.assertEqual(plan["Terminal.connected"].convert("false"), False)
+        self.assertEqual(plan["Terminal.ConnectivityNode"].kind,
+                         SetterPlan.REFERENCE)
+        self.assertEqual(plan["Terminal.Measurements"].kind,
+                         SetterPlan.MANY_REFERENCE)
+
+    def testBatchLink(self):
+        """Test batch linking gives the same model as the property setters.
+        """
+        expected = cimread(RDFXML_FILE)
+        for single_pass in (False, True):
+            d = cimread(RDFXML_FILE, single_pass=single_pass, batch_link=True)
+            self.assertEqual(model_state(d), model_state(expected))
+            for uuid, obj in d.items():
+                if obj.__class__.__name__ == "ConnectivityNode":
+                    self.assertEqual([t.UUID for t in obj.Terminals],
+                            [t.UUID for t in expected[uuid].Terminals])
+
+        d = cimread(io.StringIO(FORWARD_CIM), single_pass=True,
+                    batch_link=True)
+        self.assertEqual(d["_CN1"].Terminals, [d["_T1"]])
+
+        # The node that lists the terminal wins, as with the add method.
+        expected = cimread(io.StringIO(CONFLICT_CIM))
+        self.assertTrue(expected["_T1"].ConnectivityNode is expected["_CN2"])
+        self.assertEqual(expected["_CN1"].Terminals, [])
+        for single_pass in (False, True):
+            d = cimread(io.StringIO(CONFLICT_CIM), single_pass=single_pass,
+                        batch_link=True)
+            self.assertEqual(model_state(d), model_state(expected))
+            self.assertEqual(d["_CN2"].Terminals, [d["_T1"]])
+
+    def testInverse(self):
+        from CIM15.IEC61970.Core import ConnectivityNode, Terminal, \
+            PowerSystemResource
+        from CIM15.IEC61970.Wires import Switch
+
+        self.assertEqual(SetterPlan.inverse(Terminal, "ConnectivityNode"),
+                         ("_Terminals", True))
+        self.assertEqual(SetterPlan.inverse(ConnectivityNode, "Terminals"),
+                         ("_ConnectivityNode", False))
+        self.assertEqual(SetterPlan.inverse(PowerSystemResource,
+                         "OutageSchedule"), ("_PowerSystemResource", False))
+        self.assertEqual(SetterPlan.inverse(Switch,
+                         "ConnectDisconnectFunctions"), ("_Switches", True))
+
+    def testProfileMany(self):
+        """Test parallel parsing of a model split over several files.
+        """
+        paths = [ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE]
+        d = cimread_many(paths)
+
+        self.assertEqual(len(d), 5893)
+        # Defined in CONN and updated from EQUIP and ASSET.
+        line = d["_3a29d73641ca4a2fa1e8be754c2b4959"]
+        self.assertEqual(line.r, 0.23389684)
+        self.assertTrue(line.ConductorInfo is
+                        d["_87fb8af535e74fbd9acb4df8506f4cb8"])
+        self.assertEqual(len(line.Terminals), 2)
+
+        self.assertEqual(model_state(d),
+                         model_state(cimread_many(paths, processes=1)))
+
+    def testProfileManyPackageMaps(self):
+        d = cimread_many([ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE],
+                         [assetMap, connMap, equipMap, geoMap], processes=1)
+
+        self.assertEqual(len(d), 5893)
+        line = d["_3a29d73641ca4a2fa1e8be754c2b4959"]
+        self.assertEqual(line.__class__.__module__,
+                         "CIM15.CDPSM.Connectivity.IEC61970.Wires.ACLineSegment")
+
+    def testZip(self):
+        """Test reading a zip archive of profile files as one model.
+        """
+        fd, path = tempfile.mkstemp(suffix=".zip")
+        os.close(fd)
+        try:
+            z = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+            for name in (ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE):
+                z.write(name, os.path.basename(name))
+            z.close()
+
+            d = cimread(path)
+            expected = cimread_many([ASSET_FILE, CONN_FILE, EQUIP_FILE,
+                                     GEO_FILE])
+            self.assertEqual(model_state(d), model_state(expected))
+
+            # The options of cimread apply to every file.
+            stats = ReadStats()
+            d = cimread(path, exclude_classes=["PositionPoint"],
+                        stats=stats, batch_link=True, slots=True)
+            self.assertEqual(len(d), 5893 - 1302)
+            self.assertFalse([obj for obj in d.values()
+                              if obj.__class__.__name__ == "PositionPoint"])
+            self.assertEqual(stats.objects, len(d))
+            self.assertFalse(hasattr(d["_3a29d73641ca4a2fa1e8be754c2b4959"],
+                                     "__dict__"))
+            expected = cimread_many([ASSET_FILE, CONN_FILE, EQUIP_FILE,
+                                     GEO_FILE],
+                                    exclude_classes=["PositionPoint"])
+            self.assertEqual(model_state(d), model_state(expected))
+        finally:
+            os.remove(path)
+
+    def testCompressedCache(self):
+        """Test caching the models of compressed files.
+        """
+        import gzip
+        directory = tempfile.mkdtemp()
+        try:
+            path = join(directory, "model.xml.gz")
+            f = gzip.open(path, "wb")
+            with open(RDFXML_FILE, "rb") as source:
+                f.write(source.read())
+            f.close()
+
+            expected = model_state(cimread(RDFXML_FILE))
+            cache = join(directory, "cache")
+            self.assertEqual(model_state(cimread(path, cache=cache)),
+                             expected)
+            self.assertEqual(len(os.listdir(cache)), 1)
+            result = []
+            self.assertEqual(model_state(cimread(path, cache=cache,
+                             stats=result.append)), expected)
+            self.assertTrue(result[0].cached)
+            self.assertEqual(result[0].objects, 5894)
+
+            # Read statistics are filled in from the cached model.
+            for source in (RDFXML_FILE, path):
+                cimread(source, cache=cache)
+                stats = ReadStats()
+                cimread(source, cache=cache, stats=stats)
+                self.assertTrue(stats.cached)
+                self.assertEqual(stats.objects, 5894)
+                self.assertEqual(stats.classes["PositionPoint"], 1302)
+                self.assertTrue(stats.class_bytes["PositionPoint"] > 0)
+                self.assertTrue("from the cache" in stats.report())
+        finally:
+            shutil.rmtree(directory)
+
     def testGetNamespaces(self):
         ns = RDFXMLReader.xmlns(RDFXML_FILE)
         self.assertEqual(ns, {
@@ -0,0 +1,148 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import io
+import unittest
+
+from os.path import dirname, join
+
+from PyCIM import cimread, cimupdate
+
+from PyCIM.Test.RDFXMLReaderTest import model_state
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+HEADER = u'''<?xml version=\'1.0\'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+xmlns:dm="http://iec.ch/2002/schema/CIM_difference_model#">
+'''
+
+MODEL_CIM = HEADER + u''' <cim:ConnectivityNode rdf:ID="_CN1"/>
+ <cim:ConnectivityNode rdf:ID="_CN2"/>
+ <cim:ACLineSegment rdf:ID="_L1">
+  <cim:IdentifiedObject.name>L1</cim:IdentifiedObject.name>
+  <cim:ACLineSegment.r>0.1</cim:ACLineSegment.r>
+ </cim:ACLineSegment>
+ <cim:Terminal rdf:ID="_T1">
+  <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+  <cim:Terminal.ConductingEquipment rdf:resource="#_L1"/>
+ </cim:Terminal>
+ <cim:Terminal rdf:ID="_T2">
+  <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+  <cim:Terminal.ConductingEquipment rdf:resource="#_L1"/>
+ </cim:Terminal>
+</rdf:RDF>'''
+
+PARTIAL_CIM = HEADER + u''' <cim:Terminal rdf:about="#_T1">
+  <cim:IdentifiedObject.name>T1</cim:IdentifiedObject.name>
+  <cim:Terminal.ConnectivityNode rdf:resource="#_CN2"/>
+ </cim:Terminal>
+ <cim:Terminal rdf:ID="_T3">
+  <cim:Terminal.ConnectivityNode rdf:resource="#_CN2"/>
+ </cim:Terminal>
+</rdf:RDF>'''
+
+DIFFERENCE_CIM = HEADER + u''' <dm:DifferenceModel rdf:about="#_DM1">
+  <dm:reverseDifferences rdf:parseType="Statements">
+   <cim:Terminal rdf:about="#_T2">
+    <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+    <cim:Terminal.ConductingEquipment rdf:resource="#_L1"/>
+   </cim:Terminal>
+   <rdf:Description rdf:about="#_L1">
+    <cim:IdentifiedObject.name>L1</cim:IdentifiedObject.name>
+    <cim:ACLineSegment.r>0.1</cim:ACLineSegment.r>
+   </rdf:Description>
+  </dm:reverseDifferences>
+  <dm:forwardDifferences rdf:parseType="Statements">
+   <rdf:Description rdf:about="#_L1">
+    <cim:IdentifiedObject.name>L1b</cim:IdentifiedObject.name>
+   </rdf:Description>
+   <cim:Terminal rdf:about="#_T4">
+    <cim:Terminal.ConnectivityNode rdf:resource="#_CN1"/>
+    <cim:Terminal.ConductingEquipment rdf:resource="#_L1"/>
+   </cim:Terminal>
+  </dm:forwardDifferences>
+ </dm:DifferenceModel>
+</rdf:RDF>'''
+
+
+class RDFXMLUpdateTestCase(unittest.TestCase):
+    """Test incremental updates from CIM RDF/XML files.
+    """
+
+    def setUp(self):
+        self.d = cimread(io.StringIO(MODEL_CIM))
+
+    def testPartial(self):
+        d = self.d
+        t1, cn1, cn2 = d["_T1"], d["_CN1"], d["_CN2"]
+
+        changes = cimupdate(io.StringIO(PARTIAL_CIM), d)
+
+        self.assertEqual(changes.created, ["_T3"])
+        self.assertEqual(sorted(changes.updated), ["_CN2", "_T1"])
+        self.assertEqual(changes.deleted, [])
+        self.assertTrue(d["_T1"] is t1)
+        self.assertEqual(t1.name, "T1")
+        self.assertTrue(t1.ConnectivityNode is cn2)
+        self.assertEqual(cn1.Terminals, [d["_T2"]])
+        self.assertEqual(cn2.Terminals, [t1, d["_T3"]])
+
+    def testDifference(self):
+        d = self.d
+        l1, t2 = d["_L1"], d["_T2"]
+
+        changes = cimupdate(io.StringIO(DIFFERENCE_CIM), d)
+
+        self.assertEqual(changes.created, ["_T4"])
+        self.assertEqual(changes.deleted, ["_T2"])
+        self.assertTrue("_T2" not in d)
+        self.assertTrue(t2.ConnectivityNode is None)
+        self.assertEqual(d["_CN1"].Terminals, [d["_T1"], d["_T4"]])
+        self.assertEqual(l1.Terminals, [d["_T1"], d["_T4"]])
+        self.assertEqual(l1.name, "L1b")
+        self.assertEqual(l1.r, 0.0)
+
+    def testLargeModel(self):
+        """Test only the objects of an update are changed.
+        """
+        d = cimread(RDFXML_FILE)
+        expected = model_state(d)
+        uuid, t = [(uuid, obj) for uuid, obj in d.items()
+                   if obj.__class__.__name__ == "Terminal"][0]
+        cn = t.ConnectivityNode
+
+        changes = cimupdate(io.StringIO(HEADER +
+            u'<cim:Terminal rdf:about="#%s">'
+            u'<cim:Terminal.sequenceNumber>7</cim:Terminal.sequenceNumber>'
+            u'</cim:Terminal></rdf:RDF>' % uuid), d)
+
+        self.assertEqual(changes.updated, [uuid])
+        state = model_state(d)
+        self.assertEqual(state[uuid][1].pop("sequenceNumber"), 7)
+        expected[uuid][1].pop("sequenceNumber")
+        self.assertEqual(state, expected)
+        self.assertTrue(t.ConnectivityNode is cn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,13 +18,18 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import os
+import shutil
+import tempfile
 import unittest
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
+from io import BytesIO
 
 from PyCIM import cimread, cimwrite
+from PyCIM.SimpleXMLWriter import XMLWriter
 
 from os.path import dirname, join
 
@@ -32,6 +37,53 @@ from os.path import dirname, join
 RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
 
 
+def reference_cimwrite(d, source, encoding="utf-8"):
+    """The original, unplanned serializer. Output of L{cimwrite} is
+    compared with it.
+    """
+    from CIM15 import nsURI, nsPrefix
+    from PyCIM.RDFXMLWriter import nsPrefixRDF, nsRDF
+
+    w = XMLWriter(source, encoding)
+    w.declaration()
+    nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+    xmlns = {u"xmlns:%s" % nsPrefixRDF: nsRDF, u"xmlns:%s" % nsPrefix: nsCIM}
+    rdf = w.start(u"%s:RDF" % nsPrefixRDF, xmlns)
+
+    for uuid, obj in d.items():
+        w.start(u"%s:%s" % (nsPrefix, obj.__class__.__name__),
+                {u"%s:ID" % nsPrefixRDF: obj.UUID})
+        mro = obj.__class__.mro()
+        mro.reverse()
+        for klass in mro[2:]:
+            attrs = [a for a in klass._attrs if a not in klass._enums]
+            for attr in attrs:
+                val = getattr(obj, attr)
+                if val != klass._defaults[attr]:
+                    w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, attr),
+                              str(val))
+        for klass in mro[2:]:
+            enums = [a for a in klass._attrs if a in klass._enums]
+            for enum in enums:
+                val = getattr(obj, enum)
+                dt = klass._enums[enum]
+                w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, enum),
+                          attrib={u"%s:resource" % nsPrefixRDF:
+                                  u"%s%s.%s" % (nsCIM, dt, val)})
+        for klass in mro[2:]:
+            refs = [r for r in klass._refs if r not in klass._many_refs]
+            for ref in refs:
+                val = getattr(obj, ref)
+                if val is not None:
+                    w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, ref),
+                          attrib={u"%s:resource" % nsPrefixRDF:
+                                  u"#%s" % val.UUID})
+        w.end()
+
+    w.close(rdf)
+    w.flush()
+
+
 class RDFXMLWriterTestCase(unittest.TestCase):
     """Test CIM RDF/XML serialisation.
     """
@@ -51,6 +103,89 @@ class RDFXMLWriterTestCase(unittest.TestCase):
 
         self.assertEqual(len(dd), 5894)
 
+    def testReference(self):
+        """Test that output is identical to that of the original serializer.
+        """
+        d = cimread(RDFXML_FILE)
+        expected = StringIO()
+        reference_cimwrite(d, expected)
+        output = StringIO()
+        cimwrite(d, output)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def testEscaping(self):
+        """Test that markup characters in values are escaped as by the
+        original serializer.
+        """
+        from CIM15.IEC61970.Core import ConnectivityNode, Terminal
+        node = ConnectivityNode(UUID="_N&\"<1>'", name=u"a<b & \"c\" \xe9")
+        terminal = Terminal(UUID="_T1", ConnectivityNode=node, name="x>y",
+                            phases="AB")
+        d = {"_N": node, "_T1": terminal, "_N2": ConnectivityNode(UUID="_N2")}
+        for model in (d, {}):
+            expected = StringIO()
+            reference_cimwrite(model, expected)
+            output = StringIO()
+            cimwrite(model, output)
+            self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def testWorkers(self):
+        """Test that output written by a pool of workers is the same.
+        """
+        d = cimread(RDFXML_FILE)
+        expected = StringIO()
+        cimwrite(d, expected)
+        output = StringIO()
+        cimwrite(d, output, workers=3)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+        output = BytesIO()
+        cimwrite(d, output, workers=2)
+        self.assertEqual(output.getvalue(), expected.getvalue().encode())
+
+    def testOwnerLinks(self):
+        """Test writing each association once, from its owning end.
+        """
+        from CIM15.IEC61970.Meas import Analog, AnalogLimitSet, SetPoint
+        limits = AnalogLimitSet(UUID="_L1")
+        analog1 = Analog(UUID="_A1", LimitSets=[limits])
+        analog2 = Analog(UUID="_A2", LimitSets=[limits])
+        point = SetPoint(UUID="_P1", Analog=analog1)
+        d = dict((obj.UUID, obj) for obj in (limits, analog1, analog2, point))
+
+        output = StringIO()
+        cimwrite(d, output)
+        self.assertNotIn("LimitSets", output.getvalue()) # many-to-many
+        self.assertEqual(output.getvalue().count('rdf:resource="#'), 2)
+
+        output = StringIO()
+        cimwrite(d, output, owner_links=True)
+        self.assertEqual(output.getvalue().count('rdf:resource="#'), 3)
+        self.assertIn('<cim:SetPoint.Analog rdf:resource="#_A1" />',
+                      output.getvalue())
+
+        output.seek(0)
+        dd = cimread(output)
+        self.assertEqual([a.UUID for a in dd["_L1"].Measurements],
+                         ["_A1", "_A2"])
+        self.assertTrue(dd["_A1"].SetPoint is dd["_P1"])
+
+    def testCompressed(self):
+        """Test writing and reading compressed CIM RDF/XML.
+        """
+        d = cimread(RDFXML_FILE)
+        directory = tempfile.mkdtemp()
+        try:
+            for ext in (".xml.gz", ".xml.bz2", ".zip"):
+                path = os.path.join(directory, "model" + ext)
+                cimwrite(d, path)
+                self.assertTrue(os.path.getsize(path) <
+                                os.path.getsize(RDFXML_FILE) // 4, ext)
+                dd = cimread(path)
+                self.assertEqual(sorted(dd), sorted(d), ext)
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == "__main__":
     import logging
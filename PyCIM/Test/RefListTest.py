@@ -0,0 +1,196 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import pickle
+import unittest
+
+from PyCIM.RefList import RefList
+from PyCIM.Slots import slotted
+
+from CIM15.IEC61970.Core import Terminal, ConnectivityNode, BaseVoltage
+from CIM15.IEC61970.Wires import ACLineSegment
+from CIM15.IEC61970.Meas import Analog, AnalogLimitSet
+
+
+class RefListTestCase(unittest.TestCase):
+    """Test the collections of the many-valued ends of associations and
+    the methods that change them.
+    """
+
+    def testRead(self):
+        """Test that a collection is read like a list.
+        """
+        a, b, c = Terminal(UUID="_A"), Terminal(UUID="_B"), Terminal(UUID="_C")
+        refs = RefList.fromkeys([a, b, a, c])
+        self.assertEqual(refs, [a, b, c])
+        self.assertEqual([a, b, c], refs)
+        self.assertNotEqual(refs, [c, b, a])
+        self.assertEqual(refs, RefList.fromkeys([a, b, c]))
+        self.assertEqual(len(refs), 3)
+        self.assertEqual(list(refs), [a, b, c])
+        self.assertTrue(refs[0] is a)
+        self.assertTrue(refs[-1] is c)
+        self.assertEqual(refs[1:], [b, c])
+        self.assertRaises(IndexError, refs.__getitem__, 3)
+        self.assertEqual(refs.index(b), 1)
+        self.assertEqual(list(reversed(refs)), [c, b, a])
+        self.assertEqual(refs + [a], [a, b, c, a])
+        self.assertEqual(repr(RefList.fromkeys([1, 2])), "[1, 2]")
+        self.assertTrue(b in refs)
+        self.assertFalse(RefList())
+
+    def testChange(self):
+        """Test appending and removing objects.
+        """
+        a, b, c = Terminal(UUID="_A"), Terminal(UUID="_B"), Terminal(UUID="_C")
+        refs = RefList()
+        refs.append(a)
+        refs.extend([b, c, a])
+        self.assertEqual(refs, [a, b, c])
+        refs.remove(b)
+        self.assertEqual(refs, [a, c])
+        self.assertRaises(ValueError, refs.remove, b)
+        refs.discard(b)
+        refs.discard(a)
+        self.assertEqual(refs, [c])
+        refs.append(a)
+        self.assertEqual(refs, [c, a])
+
+    def testReassign(self):
+        """Test moving a terminal between nodes.
+        """
+        node1 = ConnectivityNode(UUID="_CN1")
+        node2 = ConnectivityNode(UUID="_CN2")
+        terminals = [Terminal(UUID="_T%d" % i, ConnectivityNode=node1)
+                     for i in range(5)]
+        self.assertTrue(isinstance(node1.Terminals, RefList))
+        self.assertEqual(node1.Terminals, terminals)
+
+        terminals[2].ConnectivityNode = node2
+        self.assertEqual(node1.Terminals,
+                         terminals[:2] + terminals[3:])
+        self.assertEqual(node2.Terminals, [terminals[2]])
+        terminals[2].ConnectivityNode = node1
+        self.assertEqual(node1.Terminals[-1], terminals[2])
+        terminals[2].ConnectivityNode = None
+        self.assertEqual(len(node1.Terminals), 4)
+
+        node2.Terminals = terminals[:2]
+        self.assertTrue(isinstance(node2.Terminals, RefList))
+        self.assertTrue(terminals[0].ConnectivityNode is node2)
+        node2.Terminals = []
+        self.assertTrue(terminals[0].ConnectivityNode is None)
+        node2.removeTerminals(*node2.Terminals)
+
+    def testManyToMany(self):
+        """Test both ends of a many-to-many association.
+        """
+        m1, m2, m3 = Analog(UUID="_M1"), Analog(UUID="_M2"), Analog(UUID="_M3")
+        limits = AnalogLimitSet(UUID="_LS1")
+        limits.addMeasurements(m1, m2, m1)
+        self.assertEqual(limits.Measurements, [m1, m2])
+        self.assertEqual(m1.LimitSets, [limits])
+
+        limits.Measurements = [m2, m3]
+        self.assertEqual(limits.Measurements, [m2, m3])
+        self.assertEqual(m1.LimitSets, [])
+        self.assertEqual(m3.LimitSets, [limits])
+
+        limits.removeMeasurements(m2)
+        self.assertEqual(limits.Measurements, [m3])
+        self.assertEqual(m2.LimitSets, [])
+
+    def testBulk(self):
+        """Test adding, setting and removing many objects at once.
+        """
+        node1 = ConnectivityNode(UUID="_CN1")
+        node2 = ConnectivityNode(UUID="_CN2")
+        terminals = [Terminal(UUID="_T%d" % i) for i in range(6)]
+        node1.addTerminals(terminals[0], terminals[1]) # arguments
+        node1.addTerminals(t for t in terminals[2:4]) # iterable
+        node2.addTerminals(terminals[4:])
+        self.assertEqual(node1.Terminals, terminals[:4])
+        self.assertTrue(terminals[3].ConnectivityNode is node1)
+
+        # Objects are moved from their former owner.
+        node2.addTerminals(terminals[2:4])
+        self.assertEqual(node1.Terminals, terminals[:2])
+        self.assertEqual(node2.Terminals, terminals[4:] + terminals[2:4])
+        self.assertTrue(terminals[3].ConnectivityNode is node2)
+
+        # Only the objects of the owner are removed.
+        node1.removeTerminals(terminals[1:])
+        self.assertEqual(node1.Terminals, [terminals[0]])
+        self.assertTrue(terminals[2].ConnectivityNode is node2)
+
+        # From another collection.
+        node1.addTerminals(node2.Terminals)
+        self.assertEqual(node2.Terminals, [])
+        self.assertEqual(len(node1.Terminals), 5)
+        node1.removeTerminals(node1.Terminals)
+        self.assertEqual(node1.Terminals, [])
+        node2.Terminals = terminals
+
+        node2.removeAllTerminals()
+        self.assertEqual(node2.Terminals, [])
+        self.assertTrue(terminals[2].ConnectivityNode is None)
+
+        base1 = BaseVoltage(UUID="_BV1")
+        base2 = BaseVoltage(UUID="_BV2")
+        lines = [ACLineSegment(UUID="_L%d" % i, BaseVoltage=base1)
+                 for i in range(4)]
+        base2.setConductingEquipment(lines[1:3])
+        self.assertEqual(base1.ConductingEquipment, [lines[0], lines[3]])
+        self.assertEqual(base2.ConductingEquipment, lines[1:3])
+        base1.ConductingEquipment = lines[2:]
+        self.assertTrue(lines[0].BaseVoltage is None)
+        self.assertEqual(base2.ConductingEquipment, [lines[1]])
+        self.assertEqual([line.BaseVoltage for line in lines],
+                         [None, base2, base1, base1])
+
+        limits = AnalogLimitSet(UUID="_LS1")
+        measurements = [Analog(UUID="_M%d" % i) for i in range(3)]
+        limits.addMeasurements(measurements)
+        self.assertEqual(measurements[2].LimitSets, [limits])
+        limits.removeAllMeasurements()
+        self.assertEqual(limits.Measurements, [])
+        self.assertEqual(measurements[2].LimitSets, [])
+
+        node = slotted(ConnectivityNode)(UUID="_CN3")
+        node.addTerminals(slotted(Terminal)(UUID="_T%d" % i)
+                          for i in range(3))
+        self.assertEqual(len(node.Terminals), 3)
+        self.assertTrue(node.Terminals[2].ConnectivityNode is node)
+
+    def testPickle(self):
+        """Test that collections are pickled with the objects they hold.
+        """
+        node = ConnectivityNode(UUID="_CN1")
+        for i in range(3):
+            Terminal(UUID="_T%d" % i, ConnectivityNode=node)
+        copy = pickle.loads(pickle.dumps(node, pickle.HIGHEST_PROTOCOL))
+        self.assertTrue(isinstance(copy.Terminals, RefList))
+        self.assertEqual([t.UUID for t in copy.Terminals],
+                         ["_T0", "_T1", "_T2"])
+        self.assertTrue(copy.Terminals[1].ConnectivityNode is copy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import io
+import shutil
+import tempfile
+import unittest
+
+from os.path import dirname, join
+
+from PyCIM import cimread, cimwrite, cimupdate
+from PyCIM.ParseCache import ParseCache
+from PyCIM.ReadStats import ReadStats
+from PyCIM.Slots import slotted, is_slotted
+
+from PyCIM.Test.RDFXMLReaderTest import model_state
+from PyCIM.Test.RDFXMLUpdateTest import MODEL_CIM, PARTIAL_CIM
+
+from CIM15.IEC61970.Core import Terminal, ConnectivityNode, \
+    IdentifiedObject
+from CIM14.IEC61968.Common import Location
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class SlotsTestCase(unittest.TestCase):
+    """Test the slotted variants of the CIM classes.
+    """
+
+    def testVariant(self):
+        """Test that a slotted variant keeps the API of its class.
+        """
+        SlottedTerminal = slotted(Terminal)
+        SlottedNode = slotted(ConnectivityNode)
+        self.assertTrue(slotted(Terminal) is SlottedTerminal)
+        self.assertEqual(SlottedTerminal.__name__, "Terminal")
+        self.assertTrue(issubclass(SlottedTerminal, slotted(IdentifiedObject)))
+        self.assertTrue(is_slotted(SlottedTerminal))
+        self.assertFalse(is_slotted(Terminal))
+
+        node = SlottedNode(UUID="_CN1")
+        t1 = SlottedTerminal(UUID="_T1", name="T1", ConnectivityNode=node)
+        t2 = SlottedTerminal(UUID="_T2")
+        node.addTerminals(t2)
+        self.assertFalse(hasattr(t1, "__dict__"))
+        self.assertEqual(t1.name, "T1")
+        self.assertEqual(node.Terminals, [t1, t2])
+        self.assertTrue(t2.ConnectivityNode is node)
+        t1.ConnectivityNode = None
+        self.assertEqual(node.Terminals, [t2])
+        self.assertRaises(AttributeError, setattr, t1, "nmae", "T1")
+
+        # Compound attribute.
+        location = slotted(Location)(mainAddress="address")
+        self.assertEqual(location.mainAddress, "address")
+
+    def testRead(self):
+        """Test reading slotted models.
+        """
+        expected = model_state(cimread(RDFXML_FILE))
+        for kwargs in ({}, {"single_pass": True}, {"batch_link": True},
+                       {"batch_link": True, "single_pass": True}):
+            d = cimread(RDFXML_FILE, slots=True, **kwargs)
+            self.assertTrue(all(is_slotted(obj.__class__)
+                                for obj in d.values()), kwargs)
+            self.assertEqual(model_state(d), expected, kwargs)
+
+    def testCache(self):
+        """Test caching slotted models.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            cache = ParseCache(directory)
+            expected = model_state(cimread(RDFXML_FILE, slots=True,
+                                           cache=cache))
+            d = cimread(RDFXML_FILE, slots=True, cache=cache)
+            self.assertTrue(all(is_slotted(obj.__class__)
+                                for obj in d.values()))
+            self.assertEqual(model_state(d), expected)
+            d = cimread(RDFXML_FILE, cache=cache)
+            self.assertFalse(any(is_slotted(obj.__class__)
+                                 for obj in d.values()))
+        finally:
+            shutil.rmtree(directory)
+
+    def testStats(self):
+        """Test that the sizes of slotted objects are counted.
+        """
+        sizes = []
+        for slots in (False, True):
+            stats = ReadStats()
+            cimread(RDFXML_FILE, stats=stats, slots=slots)
+            sizes.append(stats.class_bytes["Terminal"])
+        self.assertTrue(0 < sizes[1] < sizes[0])
+
+    def testUpdate(self):
+        """Test updating a slotted model.
+        """
+        d = cimread(io.StringIO(MODEL_CIM), slots=True)
+        t1, cn2 = d["_T1"], d["_CN2"]
+        cimupdate(io.StringIO(PARTIAL_CIM), d, slots=True)
+        self.assertTrue(is_slotted(d["_T3"].__class__))
+        self.assertEqual(t1.name, "T1")
+        self.assertEqual(cn2.Terminals, [t1, d["_T3"]])
+
+    def testWrite(self):
+        """Test that slotted models are written the same.
+        """
+        expected = io.StringIO()
+        cimwrite(cimread(RDFXML_FILE), expected)
+        output = io.StringIO()
+        cimwrite(cimread(RDFXML_FILE, slots=True), output)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
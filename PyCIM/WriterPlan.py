@@ -0,0 +1,134 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Serialization plans for writing CIM objects.
+
+A plan lists, for one concrete CIM class, the qualified tag of each
+property that is written, the function that gets its value, its default
+and its kind, in the order the properties are written: the attributes,
+then the enumerations, then the references, each from the most general
+class to the most specific. Plans are compiled from the C{_attrs},
+C{_defaults}, C{_enums} and C{_refs} declarations once per class instead
+of once per object, together with the markup written before and after
+each value.
+
+By default, the single-valued references are written, so associations
+that are only held by many-valued ends (e.g. many-to-many associations)
+are lost and one-to-one associations are written from both ends. An
+owner plan writes each association once, from its owning end:
+
+  - the single-valued end of a one-to-many association,
+  - the end of a one-to-one or many-to-many association whose name sorts
+    first, and
+  - any end whose inverse end is not found.
+
+Both ends of an association are found by L{PyCIM.SetterPlan.inverse}, so
+the decision is made per class and reference when the plan is compiled.
+"""
+
+from collections import namedtuple
+from operator import attrgetter
+
+from PyCIM.SetterPlan import ATTRIBUTE, ENUMERATION, REFERENCE, \
+    MANY_REFERENCE, inverse
+
+#: How to write a property: its qualified tag (e.g. C{cim:ACLineSegment.r}),
+#: the function that gets its value from an object, the value that is not
+#: written (attributes only), its kind and the markup written before and
+#: after the value. The default of an enumeration is the prefix of its
+#: C{rdf:resource} value.
+Field = namedtuple("Field", ["tag", "get", "default", "kind", "start",
+                             "end"])
+
+#: The qualified tag of a class, the L{Field}s of its properties and the
+#: markup written before the C{rdf:ID} of an object and after its
+#: properties.
+WriterPlan = namedtuple("WriterPlan", ["tag", "fields", "start", "end"])
+
+# Plans by class, namespace prefix, namespace URI and owner flag.
+_plans = {}
+
+
+def owns(klass, ref, many):
+    """Returns whether the given reference is written by an owner plan.
+
+    @param many: Whether the reference is many-valued.
+    """
+    end = inverse(klass, ref)
+    if end is None:
+        return True
+    other, other_many = end
+    if many and not other_many:
+        return False # written by the single-valued end
+    if not many and other_many:
+        return True
+    return ref <= other[1:]
+
+
+def compile_plan(klass, nsPrefix, nsCIM, owner=False):
+    """Returns a new L{WriterPlan} for the given class.
+
+    @param nsPrefix: Prefix of the CIM namespace.
+    @param nsCIM: CIM namespace URI, ending in '#'.
+    @param owner: Whether to write each association once, from its owning
+    end, instead of every single-valued reference.
+    """
+    mro = klass.mro()
+    mro.reverse()
+    mro = mro[2:] # skip 'object' and 'Element'
+
+    attrs, enums, refs = [], [], []
+    for k in mro:
+        for attr in k._attrs:
+            tag = u"%s:%s.%s" % (nsPrefix, k.__name__, attr)
+            if attr in k._enums:
+                prefix = u"%s%s." % (nsCIM, k._enums[attr])
+                enums.append(Field(tag, attrgetter(attr), prefix,
+                        ENUMERATION, u'<%s rdf:resource="%s' % (tag, prefix),
+                        u'" />'))
+            else:
+                attrs.append(Field(tag, attrgetter(attr), k._defaults[attr],
+                        ATTRIBUTE, u"<%s>" % tag, u"</%s>" % tag))
+        for ref in k._refs:
+            many = ref in k._many_refs
+            if owner:
+                if not owns(klass, ref, many):
+                    continue
+            elif many:
+                continue
+            tag = u"%s:%s.%s" % (nsPrefix, k.__name__, ref)
+            refs.append(Field(tag, attrgetter(ref), None,
+                    MANY_REFERENCE if many else REFERENCE,
+                    u'<%s rdf:resource="#' % tag, u'" />'))
+
+    tag = u"%s:%s" % (nsPrefix, klass.__name__)
+    return WriterPlan(tag, tuple(attrs + enums + refs),
+                      u'<%s rdf:ID="' % tag, u"</%s>" % tag)
+
+
+def get_plan(klass, nsPrefix, nsCIM, owner=False):
+    """Returns the cached L{WriterPlan} for the given class.
+    """
+    key = (klass, nsPrefix, nsCIM, owner)
+    try:
+        return _plans[key]
+    except KeyError:
+        plan = _plans[key] = compile_plan(klass, nsPrefix, nsCIM, owner)
+        return plan
@@ -18,7 +18,9 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from PyCIM.RDFXMLReader import cimread
+from PyCIM.RDFXMLReader import cimread, cimread_many, iter_cimread
 from PyCIM.RDFXMLWriter import cimwrite
+from PyCIM.RDFXMLUpdate import cimupdate
+from PyCIM.ClassResolver import resolve_class
 
 __version__ = "15.15.0"